@@ -20,7 +20,7 @@
 ###########################################################################
 
 import os
-from inspect import getframeinfo, stack
+import sys
 from modules import SourceVersion
 
 
@@ -44,6 +44,12 @@ class Analyser(object):
     def timestamp(self):
         return None
 
+    def prefetch(self):
+        """
+        Downloads, as downloader.prefetch() queries, to run in parallel before the analysers.
+        """
+        return []
+
     @classmethod
     def def_class_(cls, config, back_in_stack = 2, **kwargs):
         # Check keys
@@ -52,8 +58,8 @@ class Analyser(object):
             raise Exception('Unknown key ' + ', '.join(diff_keys))
 
         if 'source' not in kwargs:
-            caller = getframeinfo(stack()[back_in_stack][0])
-            kwargs['source'] = '{0}/analysers/{1}#L{2}'.format(config and hasattr(config, 'source_url') and config.source_url or None, os.path.basename(caller.filename), caller.lineno)
+            caller = sys._getframe(back_in_stack)
+            kwargs['source'] = '{0}/analysers/{1}#L{2}'.format(config and hasattr(config, 'source_url') and config.source_url or None, os.path.basename(caller.f_code.co_filename), caller.f_lineno)
 
         return kwargs
 
@@ -136,6 +142,8 @@ class TestAnalyser(unittest.TestCase):
 
         class options:
             plugin = None
+            sax_workers = 1
+            osmosis_workers = 1
             verbose = False
             change = False
         analyser_conf = osmose_run.analyser_config(conf, options(), None)
@@ -22,6 +22,7 @@
 
 import io
 import bz2
+import contextlib
 import datetime
 import gzip
 import csv
@@ -76,7 +77,7 @@ CREATE TEMP TABLE {official}_temp (
     tags jsonb,
     tags1 jsonb,
     fields jsonb,
-    geom geometry(geometry, {proj})
+    geom text
 )
 """
 
@@ -106,17 +107,7 @@ WHERE
 """
 
 sql02 = """
-INSERT INTO
-    {official}_temp
-VALUES (
-    %(ref)s,
-    %(tags)s::jsonb,
-    %(tags1)s::jsonb,
-    %(fields)s::jsonb,
-    CASE WHEN {geom} IS NOT NULL THEN
-        ST_Transform(ST_Force2D({geom}), {proj})
-    ELSE NULL END
-)
+COPY {official}_temp (ref, tags, tags1, fields, geom) FROM STDIN
 """
 
 sql02b = """
@@ -128,8 +119,18 @@ SELECT
   tags1,
   fields,
   geom
-FROM
-  {official}_temp
+FROM (
+  SELECT
+    ref,
+    tags,
+    tags1,
+    fields,
+    CASE WHEN {geom} IS NOT NULL THEN
+      ST_Transform(ST_Force2D({geom}), {proj})
+    ELSE NULL END AS geom
+  FROM
+    {official}_temp
+) AS t
 GROUP BY
   ref,
   tags,
@@ -327,6 +328,105 @@ WHERE
         != '{{}}'::jsonb
 """
 
+class ArchiveEntryReader(io.RawIOBase):
+    def __init__(self, path, pattern):
+        """
+        Read the first entry of an archive matching pattern, extracted on the fly.
+        @param path: archive file, in any format supported by libarchive
+        @param pattern: path pattern of the entry to read
+        """
+        self.blocks = self._blocks(path, pattern)
+        self.pending = b''
+
+    @staticmethod
+    def _blocks(path, pattern):
+        import libarchive.public # type: ignore
+        with libarchive.public.file_reader(path) as archive:
+            for entry in archive:
+                if pathlib.Path(entry.pathname).match(pattern):
+                    yield from entry.get_blocks()
+                    return
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self.pending:
+            self.pending = next(self.blocks, None)
+            if self.pending is None:
+                self.pending = b''
+                return 0
+        n = min(len(b), len(self.pending))
+        b[:n] = self.pending[:n]
+        self.pending = self.pending[n:]
+        return n
+
+    def close(self):
+        self.blocks.close()
+        super().close()
+
+class StreamStack(io.RawIOBase):
+    def __init__(self, f, stack):
+        """
+        Binary stream reading f, closing the streams it is built on with it.
+        @param f: binary stream
+        @param stack: contextlib.ExitStack of f and the streams under it
+        """
+        self.f = f
+        self.stack = stack
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self.f.readinto(b)
+
+    def close(self):
+        if not self.closed:
+            self.stack.close()
+        super().close()
+
+class LineFilter(io.TextIOBase):
+    def __init__(self, f, filter):
+        """
+        Text stream applying a filter on each line of f while read.
+        @param f: text stream
+        @param filter: lambda expression applied on each line
+        """
+        self.f = f
+        self.filter = filter
+        self.pending = ''
+
+    def readable(self):
+        return True
+
+    def _fill(self, done):
+        while not done():
+            line = self.f.readline()
+            if not line:
+                return
+            self.pending += self.filter(line)
+
+    def read(self, size = -1):
+        if size is None or size < 0:
+            data, self.pending = self.pending + ''.join(map(self.filter, self.f)), ''
+            return data
+        self._fill(lambda: size <= len(self.pending))
+        data, self.pending = self.pending[:size], self.pending[size:]
+        return data
+
+    def readline(self, size = -1):
+        self._fill(lambda: '\n' in self.pending)
+        end = self.pending.find('\n') + 1 or len(self.pending)
+        if size is not None and size >= 0:
+            end = min(end, size)
+        data, self.pending = self.pending[:end], self.pending[end:]
+        return data
+
+    def close(self):
+        self.f.close()
+        super().close()
+
 class Source:
     def __init__(self, attribution = None, millesime = None, encoding = "utf-8", file = None, fileUrl = None, post: Optional[Dict[str, str]] = None, fileUrlCache = 30, zip = None, extract = None, bz2 = False, gzip = False, filter = None):
         """
@@ -342,7 +442,7 @@ class Source:
         @param extract: extract file from any archive format
         @param gzip: uncompress from bz2
         @param gzip: uncompress from gzip
-        @param filter: lambda expression applied on text file before loading
+        @param filter: lambda expression applied on each line of the text file before loading
         """
         self.attribution = attribution
         self.millesime = millesime
@@ -356,6 +456,7 @@ class Source:
         self.bz2 = bz2
         self.gzip = gzip
         self.filter = filter
+        self._zipinfo = None
 
         if self.file and self.fileUrl:
             raise ValueError("file and fileUrl should not be both set")
@@ -370,15 +471,12 @@ class Source:
     def zipFile(self):
         if not self.zip:
             return None
-        if self.file:
-            f = open(self.file, 'rb')
-        elif self.fileUrl:
-            f = downloader.urlopen(self.fileUrl, self.fileUrlCache, mode='rb', post=self.post)
-
-        z = zipfile.ZipFile(f, 'r')
-        print(z.namelist())
-        filename = next(filter(lambda zipinfo: fnmatch.fnmatch(zipinfo.filename, self.zip), z.infolist()))
-        return filename
+        if not self._zipinfo or self._zipinfo[0] != self.zip:
+            with self._open() as f:
+                z = zipfile.ZipFile(f, 'r')
+                print(z.namelist())
+                self._zipinfo = (self.zip, next(filter(lambda zipinfo: fnmatch.fnmatch(zipinfo.filename, self.zip), z.infolist())))
+        return self._zipinfo[1]
 
     def time(self):
         if self.file:
@@ -390,6 +488,13 @@ class Source:
             else:
                 return int(downloader.urlmtime(self.fileUrl, self.fileUrlCache, self.post)+.5)
 
+    def prefetch(self):
+        """
+        Download to do before the source is used, as a downloader.prefetch() query, or None.
+        """
+        if self.fileUrl:
+            return (self.fileUrl, self.fileUrlCache, self.post)
+
     def path(self):
         if self.file:
             return self.file
@@ -397,38 +502,37 @@ class Source:
             # Do nothing about ZIP
             return downloader.path(self.fileUrl, self.fileUrlCache, post=self.post)
 
-    def open(self, binary = False):
+    def _open(self):
         if self.file:
-            f = open(self.file, 'rb')
+            return open(self.file, 'rb')
         elif self.fileUrl:
-            f = downloader.urlopen(self.fileUrl, self.fileUrlCache, mode='rb', post=self.post)
-
-        if self.zipFile():
-            z = zipfile.ZipFile(f, 'r').open(self.zipFile().filename)
-            f = io.BytesIO(z.read())
-            f.seek(0)
-        elif self.extract:
-            import libarchive.public # type: ignore
-            with libarchive.public.memory_reader(f.read()) as archive:
-                f = io.BytesIO()
-                for entry in archive:
-                    if pathlib.Path(entry.pathname).match(self.extract):
-                        for block in entry.get_blocks():
-                            f.write(block)
-                        break
-            f.seek(0)
-        elif self.bz2:
-            f = io.BytesIO(bz2.decompress(f.read()))
-            f.seek(0)
-        elif self.gzip:
-            f = gzip.GzipFile(fileobj=f)
+            return downloader.urlopen(self.fileUrl, self.fileUrlCache, mode='rb', post=self.post)
+
+    def open(self, binary = False):
+        """
+        Open the source file as a stream, uncompressed or extracted on the fly while read.
+        @param binary: return a binary stream, else a text stream decoded from encoding
+        """
+        if self.extract and not self.zipFile():
+            f = io.BufferedReader(ArchiveEntryReader(self.path(), self.extract))
+        elif self.zipFile() or self.bz2 or self.gzip:
+            # The wrappers do not close the file they read
+            with contextlib.ExitStack() as stack:
+                f = stack.enter_context(self._open())
+                if self.zipFile():
+                    f = stack.enter_context(stack.enter_context(zipfile.ZipFile(f, 'r')).open(self.zipFile()))
+                elif self.bz2:
+                    f = stack.enter_context(bz2.open(f))
+                else:
+                    f = stack.enter_context(gzip.GzipFile(fileobj=f))
+                f = io.BufferedReader(StreamStack(f, stack.pop_all()))
+        else:
+            f = self._open()
 
         if not binary:
-            f = io.StringIO(f.read().decode(self.encoding, 'ignore'))
-            f.seek(0)
+            f = io.TextIOWrapper(f, encoding=self.encoding, errors='ignore', newline='')
             if self.filter:
-                f = io.StringIO(self.filter(f.read()))
-                f.seek(0)
+                f = LineFilter(f, self.filter)
         return f
 
     def _get_millesime(self) -> Optional[str]:
@@ -553,6 +657,56 @@ class SourceIGN(Source):
         })
         super().__init__(**kwargs)
 
+def copy_format(value):
+    """
+    Format a value for the text format of COPY
+    """
+    if value is None:
+        return '\\N'
+    elif value is True or value is False:
+        return 'true' if value else 'false'
+    else:
+        return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+class CopyBuffer:
+    def __init__(self, cursor, copy, chunk_size = 10000):
+        """
+        Buffer rows and load them by chunks with COPY FROM STDIN.
+        @param cursor: database cursor
+        @param copy: the COPY ... FROM STDIN statement
+        @param chunk_size: number of rows sent at once
+        """
+        self.cursor = cursor
+        self.copy = copy
+        self.chunk_size = chunk_size
+        self.buffer = io.StringIO()
+        self.rows = 0
+
+    def write(self, values):
+        self.buffer.write('\t'.join(map(copy_format, values)) + '\n')
+        self.rows += 1
+        if self.rows >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.rows > 0:
+            self.buffer.seek(0)
+            self.cursor.copy_expert(self.copy, self.buffer)
+            self.buffer = io.StringIO()
+            self.rows = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+
+    @staticmethod
+    def table_columns(cursor, table):
+        cursor.execute("SELECT * FROM \"{0}\" LIMIT 0".format(table))
+        return list(map(lambda column: column[0], cursor.description))
+
 class Parser:
     def __init__(self, srid: Optional[int] = None, source = None):
         """
@@ -674,83 +828,212 @@ def removequotesjson(s):
     except AttributeError:
         return s
 
+class JSONStream:
+    def __init__(self, f, chunk_size = 1 << 16):
+        """
+        Incremental reader of a JSON document, decoding the entries of an array one at a time.
+        @param f: text stream
+        @param chunk_size: size of the reads from f
+        """
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+
+    def _read(self, size):
+        chunk = self.f.read(size)
+        if not chunk:
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _peek(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\n\r':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read(self.chunk_size):
+                raise ValueError("Unexpected end of JSON document")
+
+    def _expect(self, char):
+        c = self._peek()
+        if c != char:
+            raise ValueError("Expecting '{0}' in JSON document, got '{1}'".format(char, c))
+        self.pos += 1
+
+    def _value(self):
+        self._peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # A number ending the buffer may continue in the next chunk
+                if end < len(self.buffer) or not self._read(size):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if not self._read(size):
+                    raise
+            # Grow the reads, for values spanning several chunks
+            size *= 2
+
+    def items(self, path = (), members = None):
+        """
+        Iterate over the entries of an array.
+        @param path: keys of the objects leading to the array, from the document root
+        @param members: dict filled with the other members of the objects on the path, once iterated
+        """
+        for key in path:
+            self._expect('{')
+            while True:
+                if self._peek() == '}':
+                    raise KeyError(key)
+                k = self._value()
+                self._expect(':')
+                if k == key:
+                    break
+                v = self._value()
+                if members is not None:
+                    members[k] = v
+                if self._peek() != '}':
+                    self._expect(',')
+
+        self._expect('[')
+        if self._peek() == ']':
+            self.pos += 1
+        else:
+            while True:
+                yield self._value()
+                if self._peek() == ']':
+                    self.pos += 1
+                    break
+                self._expect(',')
+
+        for _ in path:
+            while self._peek() == ',':
+                self.pos += 1
+                k = self._value()
+                self._expect(':')
+                v = self._value()
+                if members is not None:
+                    members[k] = v
+            self._expect('}')
+
 class JSON(Parser):
-    def __init__(self, source, extractor = lambda json: json, srid: Optional[int] = None):
+    def __init__(self, source, extractor = None, path = (), srid: Optional[int] = None):
         """
         Load JSON file data.
         @param source: source file reader
-        @param extractor: lambda returning an interable
+        @param extractor: lambda returning an interable from the whole loaded JSON, prefer path for big files
+        @param path: keys of the objects leading to the array of entries, read as a stream
         """
         super().__init__(srid = srid, source = source)
         self.extractor = extractor
+        self.path = path
 
-        self.json = None
+    def entries(self, f):
+        if self.extractor:
+            return iter(self.extractor(json.load(f)))
+        else:
+            return JSONStream(f).items(self.path)
 
     def header(self):
-        self.json = list(map(flattenjson, self.extractor(json.loads(self.source.open().read()))))
         columns = set()
         # Read all entries because structure can vary
-        for feature in self.json:
-            columns = columns.union(list(flattenjson(feature).keys()))
+        with self.source.open() as f:
+            for row in self.entries(f):
+                columns = columns.union(list(flattenjson(row).keys()))
         columns = list(columns)
         return columns
 
     def import_(self, table, osmosis):
-        self.json = self.json or map(flattenjson, self.extractor(json.loads(self.source.open().read())))
-        for row in self.json:
-            osmosis.giscurs.execute("insert into \"{0}\" (\"{1}\") values ({2})".format(
-                table, '", "'.join(row.keys()), (u'%s, ' * len(row.keys()))[:-2]),
-                list(map(removequotesjson, row.values())))
+        columns = CopyBuffer.table_columns(osmosis.giscurs, table)
+        copy = "COPY \"{0}\" (\"{1}\") FROM STDIN".format(table, '", "'.join(columns))
+        with CopyBuffer(osmosis.giscurs, copy) as buffer, self.source.open() as f:
+            for row in map(flattenjson, self.entries(f)):
+                unknown = set(row.keys()) - set(columns)
+                if unknown:
+                    raise Exception("Unknown columns {0} in table {1}".format(', '.join(unknown), table))
+                buffer.write(map(lambda column: removequotesjson(row.get(column)), columns))
 
 class GeoJSON(Parser):
-    def __init__(self, source, extractor = lambda json: json):
+    def __init__(self, source, extractor = None):
         """
         Load GeoJSON file data.
         @param source: source file reader
-        @param extractor: lambda returning an interable
+        @param extractor: lambda returning the GeoJSON from the whole loaded JSON, else features are read as a stream
         """
         super().__init__(srid = 4326, source = source)
         self.extractor = extractor
+        self.crs_read = False
 
-        self.json = self.extractor(json.loads(self.source.open().read()))
+    def features(self, f, members):
+        if self.extractor:
+            geojson = self.extractor(json.load(f))
+            members.update(geojson)
+            return iter(geojson['features'])
+        else:
+            return JSONStream(f).items(['features'], members)
+
+    def read_crs(self, members):
+        self.crs_read = True
         try:
-            self._srid = int(self.json['crs']['properties']['name'].split(':')[1])
+            self._srid = int(members['crs']['properties']['name'].split(':')[1])
         except:
             pass
 
+    def source_srid(self):
+        if not self.crs_read:
+            # The crs member can be after the features
+            members = {}
+            with self.source.open() as f:
+                for _ in self.features(f, members):
+                    pass
+            self.read_crs(members)
+        return super().source_srid()
+
     def header(self):
         columns = set()
+        members = {}
         # Read all entries because structure can vary
-        for feature in self.json['features']:
-            columns = columns.union(list(flattenjson(feature['properties']).keys()))
+        with self.source.open() as f:
+            for feature in self.features(f, members):
+                columns = columns.union(list(flattenjson(feature['properties']).keys()))
+        self.read_crs(members)
         columns = list(columns)
         columns.append(u"geom_x")
         columns.append(u"geom_y")
         return columns
 
     def import_(self, table, osmosis):
-        for row in self.json['features']:
-            if row['geometry'] and row['geometry']['coordinates'] and len(row['geometry']['coordinates']) > 0:
-                row['properties'] = flattenjson(row['properties'])
-                columns = list(row['properties'].keys())
-                values = list(map(removequotesjson, map(lambda column: row['properties'][column], columns)))
-                columns.append(u"geom_x")
-                columns.append(u"geom_y")
-                if row['geometry']['type'] in ('Point', 'MultiPoint', 'LineString', 'MultiLineString'):
-                    if row['geometry']['type'] == 'Point':
-                        values.append(row['geometry']['coordinates'][0])
-                        values.append(row['geometry']['coordinates'][1])
-                    elif row['geometry']['type'] in ('MultiPoint', 'LineString'):
-                        npt = len(row['geometry']['coordinates'])//2
-                        values.append(row['geometry']['coordinates'][npt][0])
-                        values.append(row['geometry']['coordinates'][npt][1])
-                    else:
-                        npt = len(row['geometry']['coordinates'][0])//2
-                        values.append(row['geometry']['coordinates'][0][npt][0])
-                        values.append(row['geometry']['coordinates'][0][npt][1])
-                    osmosis.giscurs.execute(u"insert into \"{0}\" (\"{1}\") values ({2})".format(
-                        table, u'", "'.join(columns), (u'%s, ' * len(columns))[:-2]),
-                        values)
+        columns = CopyBuffer.table_columns(osmosis.giscurs, table)
+        copy = "COPY \"{0}\" (\"{1}\") FROM STDIN".format(table, '", "'.join(columns))
+        members = {}
+        with CopyBuffer(osmosis.giscurs, copy) as buffer, self.source.open() as f:
+            for row in self.features(f, members):
+                if row['geometry'] and row['geometry']['coordinates'] and len(row['geometry']['coordinates']) > 0:
+                    row['properties'] = flattenjson(row['properties'])
+                    values = dict(map(lambda kv: [kv[0], removequotesjson(kv[1])], row['properties'].items()))
+                    if row['geometry']['type'] in ('Point', 'MultiPoint', 'LineString', 'MultiLineString'):
+                        if row['geometry']['type'] == 'Point':
+                            values[u"geom_x"] = row['geometry']['coordinates'][0]
+                            values[u"geom_y"] = row['geometry']['coordinates'][1]
+                        elif row['geometry']['type'] in ('MultiPoint', 'LineString'):
+                            npt = len(row['geometry']['coordinates'])//2
+                            values[u"geom_x"] = row['geometry']['coordinates'][npt][0]
+                            values[u"geom_y"] = row['geometry']['coordinates'][npt][1]
+                        else:
+                            npt = len(row['geometry']['coordinates'][0])//2
+                            values[u"geom_x"] = row['geometry']['coordinates'][0][npt][0]
+                            values[u"geom_y"] = row['geometry']['coordinates'][0][npt][1]
+                        unknown = set(values.keys()) - set(columns)
+                        if unknown:
+                            raise Exception("Unknown columns {0} in table {1}".format(', '.join(unknown), table))
+                        buffer.write(map(lambda column: values.get(column), columns))
+        self.read_crs(members)
 
 class GDAL(Parser):
     def __init__(self, source, zip = None, layer = None, fields = None, srid: Optional[int] = None):
@@ -855,11 +1138,17 @@ class Load(object):
         self.geomFunction = geomFunction
         self.validationGeomSQL = validationGeomSQL
 
-    def spatialGeom(self, geom):
+    def copyGeom(self, geom):
+        """
+        Geometry as text loaded with the other official data
+        """
+        return geom
+
+    def spatialGeom(self, column):
         """
-        SQL to get the geometry
+        SQL to get the geometry from the loaded text column
         """
-        return f"ST_GeomFromEWKT('{geom}')"
+        return f"ST_GeomFromEWKT({column})"
 
     def run(self, osmosis, conflate, db_schema, default_table_base_name, version):
         """
@@ -912,6 +1201,7 @@ class Load(object):
             osmosis.run(sql_schema.format(schema = db_schema))
             osmosis.run(sql00.format(official = tableOfficial, proj = self.proj))
             giscurs = osmosis.gisconn.cursor(cursor_factory=psycopg2.extras.DictCursor)
+            buffer = CopyBuffer(giscurs, sql02.format(official = tableOfficial))
             mult_space = re.compile(r'\s+')
             def insertOfficial(res):
                 if not self.where(res):
@@ -927,12 +1217,13 @@ class Load(object):
                             pass
                     tags = conflate.mapping.tagFactory(res)
                     tags[1].update(tags[0])
-                    giscurs.execute(sql02.format(official = tableOfficial, proj = self.proj, geom = self.spatialGeom(geom)), {
-                        "ref": tags[1].get(conflate.osmRef) if conflate.osmRef != "NULL" else None,
-                        "tags": tags[1],
-                        "tags1": tags[0],
-                        "fields": dict(zip(dict(res).keys(), map(lambda s: (s is None and None) or u'{0}'.format(s), dict(res).values()))),
-                    })
+                    buffer.write([
+                        tags[1].get(conflate.osmRef) if conflate.osmRef != "NULL" else None,
+                        json.dumps(tags[1]),
+                        json.dumps(tags[0]),
+                        json.dumps(dict(zip(dict(res).keys(), map(lambda s: (s is None and None) or u'{0}'.format(s), dict(res).values())))),
+                        self.copyGeom(geom),
+                    ])
             if isinstance(self.geom, tuple):
                 self.geom = self.geom[0]
             else:
@@ -944,7 +1235,8 @@ class Load(object):
             else:
                 distinct = order_by = ""
             osmosis.run0((sql01_ref if conflate.osmRef != "NULL" else sql01_geo).format(table = table, geom = self.geom, validationGeomSQL = self.validationGeomSQL, where = Select.where_attributes(self.select), distinct = distinct, order_by = order_by), insertOfficial)
-            osmosis.run(sql02b.format(official = tableOfficial))
+            buffer.flush()
+            osmosis.run(sql02b.format(official = tableOfficial, proj = self.proj, geom = self.spatialGeom('geom')))
             if self.parser.imported_srid():
                 giscurs.execute("SELECT ST_AsText(ST_Transform(ST_Envelope(ST_SetSRID(ST_Extent(ST_Transform(ST_Expand(geom, {distance}), 4326)), 4326)), {proj})) FROM {table}".format(
                     table = tableOfficial,
@@ -1024,8 +1316,11 @@ class Load_XY(Load):
 """
         super().__init__((f'ARRAY[{x}, {y}]',), table_name, create, select, unique, where, map, self.geomFunctionPoint, validationGeomSQL)
 
-    def spatialGeom(self, geom):
-        return f"ST_Transform(ST_GeomFromEWKT('SRID={self.parser.imported_srid()};POINT({geom[0]} {geom[1]})'), {self.proj})" if self.parser.imported_srid() else "NULL::geometry"
+    def copyGeom(self, geom):
+        return f"POINT({geom[0]} {geom[1]})"
+
+    def spatialGeom(self, column):
+        return f"ST_Transform(ST_GeomFromEWKT('SRID={self.parser.imported_srid()};' || {column}), {self.proj})" if self.parser.imported_srid() else "NULL::geometry"
 
     def run(self, osmosis, conflate, db_schema, default_table_base_name, version):
         """
@@ -1215,6 +1510,9 @@ class Conflate:
 
 class Analyser_Merge(Analyser_Osmosis):
 
+    # Official data and mapping callbacks read the rows by column name
+    dict_rows = True
+
     def __init__(self, config, logger):
         Analyser_Osmosis.__init__(self, config, logger)
 
@@ -1270,6 +1568,12 @@ verification of this data.'''))
     def source(self):
         return self.parser.source.as_tag_value()
 
+    def prefetch(self):
+        if not hasattr(self, 'parser'):
+            # Not initialized, analyser not available on this country
+            return []
+        return list(filter(None, [self.parser.source.prefetch()]))
+
     def analyser_version(self):
         return SourceVersion.version(self.parser.source.time(), self.__class__)
 
@@ -1645,6 +1949,105 @@ class Test(TestAnalyserOsmosis):
         self.assertEqual(Mapping.date_format('04/27/1990', '%m/%d/%Y'), '1990-04-27')
         self.assertEqual(Mapping.date_format('31/04/1990'), None)
 
+    def test_copy_format(self):
+        self.assertEqual(copy_format(None), '\\N')
+        self.assertEqual(copy_format(True), 'true')
+        self.assertEqual(copy_format(1.5), '1.5')
+        self.assertEqual(copy_format('a\tb\nc\\d'), 'a\\tb\\nc\\\\d')
+
+    def test_json_stream(self):
+        document = '{"type": "FeatureCollection", "features": [{"a": 1}, {"b": [1, 2.5, "]"]}, {}], "crs": {"name": "x"}}'
+        members = {}
+        self.assertEqual(list(JSONStream(io.StringIO(document), chunk_size = 3).items(['features'], members)), [{"a": 1}, {"b": [1, 2.5, "]"]}, {}])
+        self.assertEqual(members, {"type": "FeatureCollection", "crs": {"name": "x"}})
+        self.assertEqual(list(JSONStream(io.StringIO(' [ 12345 , "a" ] '), chunk_size = 2).items()), [12345, "a"])
+        self.assertEqual(list(JSONStream(io.StringIO('{"d": []}')).items(['d'])), [])
+        with self.assertRaises(KeyError):
+            list(JSONStream(io.StringIO('{"e": []}')).items(['d']))
+
+    def test_source_filter(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv') as f:
+            f.write("a,b\r\nEcole,1\n")
+            f.flush()
+            source = Source(file = f.name, filter = lambda t: t.replace("Ecole", "École"))
+            with source.open() as s:
+                self.assertEqual(list(s), ["a,b\r\n", "École,1\n"])
+            with source.open() as s:
+                self.assertEqual(s.read(5), "a,b\r\n")
+
+    def test_source_close(self):
+        opened = []
+        class RecordSource(Source):
+            def _open(self):
+                opened.append(super()._open())
+                return opened[-1]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with bz2.open(os.path.join(tmp, "a.csv.bz2"), "wt") as f:
+                f.write("a,b\n1,2\n")
+            with gzip.open(os.path.join(tmp, "a.csv.gz"), "wt") as f:
+                f.write("a,b\n1,2\n")
+            with zipfile.ZipFile(os.path.join(tmp, "a.zip"), "w") as z:
+                z.writestr("a.csv", "a,b\n1,2\n")
+
+            for source in (RecordSource(file = os.path.join(tmp, "a.csv.bz2"), bz2 = True), RecordSource(file = os.path.join(tmp, "a.csv.gz"), gzip = True), RecordSource(file = os.path.join(tmp, "a.zip"), zip = "*.csv")):
+                for binary in (False, True):
+                    del opened[:]
+                    with source.open(binary) as f:
+                        self.assertEqual(f.read(), b"a,b\n1,2\n" if binary else "a,b\n1,2\n")
+                    self.assertTrue(opened)
+                    self.assertTrue(all(map(lambda f: f.closed, opened)))
+
+    def test_source_memory(self):
+        # Parsers stream the source, peak memory should not depend on the file size
+        import tracemalloc
+        class Cursor:
+            def copy_expert(self, sql, f):
+                self.size = 0
+                while True:
+                    chunk = f.read(8192)
+                    if not chunk:
+                        break
+                    self.size += len(chunk)
+        class Osmosis:
+            giscurs = Cursor()
+
+        def csv_lines():
+            yield "id,name,lat,lon\n"
+            for i in range(100000):
+                yield "{0},Lorem ipsum dolor sit amet,43.6,1.44\n".format(i)
+        def json_lines():
+            yield '{"type": "FeatureCollection", "features": [\n'
+            for i in range(100000):
+                yield '{"id": ' + str(i) + ', "name": "Lorem ipsum dolor sit amet"},\n'
+            yield '{}]}\n'
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for (name, lines) in (("a.csv", csv_lines), ("a.json", json_lines)):
+                with open(os.path.join(tmp, name), "w") as f:
+                    f.writelines(lines())
+                with bz2.open(os.path.join(tmp, name + ".bz2"), "wt") as f:
+                    f.writelines(lines())
+            size = os.path.getsize(os.path.join(tmp, "a.csv"))
+            self.assertGreater(size, 3 * 1000 * 1000)
+
+            for bz2_ in (False, True):
+                tracemalloc.start()
+                try:
+                    parser = CSV(Source(file = os.path.join(tmp, "a.csv" + (".bz2" if bz2_ else "")), bz2 = bz2_))
+                    self.assertEqual(parser.header(), ["id", "name", "lat", "lon"])
+                    parser.import_("t", Osmosis())
+                    parser.close()
+                    self.assertGreater(Osmosis.giscurs.size, size * 0.9)
+
+                    parser = JSON(Source(file = os.path.join(tmp, "a.json" + (".bz2" if bz2_ else "")), bz2 = bz2_), path = ['features'])
+                    self.assertEqual(sorted(parser.header()), ["id", "name"])
+                    peak = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+                # Fixed ceiling, whatever the size of the source
+                self.assertLess(peak, 1024 * 1024)
+
     def test_where_formatter(self):
         self.assertEqual(Select.where_attributes({}), """((1=1))""")
         self.assertEqual(Select.where_attributes({'a': None}), """((NOT "a" IS NULL))""")
@@ -46,6 +46,9 @@ class Analyser_Merge_Dynamic(Analyser):
                 # else:
                 #     analyser_obj.analyser_change()
 
+    def prefetch(self):
+        return sum(map(lambda obj: obj(self.config, self.error_file, self.logger).prefetch(), self.analysers), [])
+
     def timestamp(self):
         if self.analysers:
             with self.analysers[0](self.config, self.error_file,  self.logger) as analyser_obj:
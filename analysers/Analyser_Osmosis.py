@@ -21,19 +21,27 @@
 
 from .Analyser import Analyser
 
+import decimal
+import hashlib
+import math
 import os
 import psycopg2
 import psycopg2.extensions
 import re
+import shapely.wkb
+import struct
+import sys
+import threading
+import time
 from modules import DictCursorUnicode
 from collections import defaultdict
-from inspect import getframeinfo, stack
 
 
 class Analyser_Osmosis(Analyser):
 
-    sql_create_highways = """
-CREATE UNLOGGED TABLE {0}.highways AS
+    # Derived tables are persistent. The {ways}, {relations} and derived table
+    # sources are replaced by their touched_ views to refresh only the changed rows.
+    sql_select_highways = """
 SELECT
     id,
     nodes,
@@ -73,13 +81,16 @@ SELECT
         ELSE NULL
     END AS level
 FROM
-    ways
+    {ways}
 WHERE
     tags != ''::hstore AND
     tags?'highway' AND
     tags->'highway' NOT IN ('services', 'rest_area', 'razed', 'no') AND
     ST_NPoints(linestring) >= 2
-;
+"""
+
+    sql_create_highways = """
+CREATE TABLE {0}.highways AS""" + sql_select_highways + """;
 
 CREATE INDEX idx_highways_linestring ON {0}.highways USING gist(linestring);
 CREATE INDEX idx_highways_linestring_proj ON {0}.highways USING gist(linestring_proj);
@@ -88,8 +99,7 @@ CREATE INDEX idx_highways_highway ON {0}.highways(highway);
 ANALYZE {0}.highways;
 """
 
-    sql_create_highway_ends = """
-CREATE UNLOGGED TABLE {0}.highway_ends AS
+    sql_select_highway_ends = """
 SELECT
     id,
     nodes,
@@ -101,38 +111,33 @@ SELECT
     (ends_geom(nodes, linestring)).geom AS geom,
     level
 FROM
-    highways
+    {highways}
 WHERE
     NOT is_area AND
     NOT is_construction
-;
+"""
+
+    sql_create_highway_ends = """
+CREATE TABLE {0}.highway_ends AS""" + sql_select_highway_ends + """;
 
+CREATE INDEX idx_highway_ends_id ON {0}.highway_ends(id);
 ANALYZE {0}.highway_ends;
 """
 
     # Multipolygons table is not complete. It does not contain multipolygons across extract border,
     # (some) invalid ones, and some where ST_BuildArea fails to build the full polygon with all inners
-    sql_create_multipolygons = """
+    sql_insert_multipolygons = """
 DO $$
 DECLARE
     mp RECORD;
 BEGIN
-    DROP TABLE IF EXISTS {0}.multipolygons;
-    CREATE UNLOGGED TABLE {0}.multipolygons (
-        id bigint,
-        tags hstore,
-        poly geometry(Geometry, 4326) NOT NULL,
-        poly_proj geometry(Geometry, {1}) NOT NULL,
-        is_valid boolean NOT NULL
-    );
-
     FOR mp in (
         SELECT
             relations.id,
             relations.tags,
             ST_LineMerge(ST_Collect(ways.linestring)) AS linestrings
         FROM
-            relations
+            {relations} AS relations
             JOIN relation_members ON
                 relation_members.relation_id = relations.id AND
                 relation_members.member_type = 'W' AND
@@ -199,15 +204,25 @@ BEGIN
     END LOOP;
 END;
 $$ LANGUAGE 'plpgsql';
+"""
 
+    sql_create_multipolygons = """
+CREATE TABLE {0}.multipolygons (
+    id bigint,
+    tags hstore,
+    poly geometry(Geometry, 4326) NOT NULL,
+    poly_proj geometry(Geometry, {1}) NOT NULL,
+    is_valid boolean NOT NULL
+);
+""" + sql_insert_multipolygons + """
+CREATE INDEX idx_multipolygons_id ON {0}.multipolygons(id);
 CREATE INDEX idx_multipolygons_poly ON {0}.multipolygons USING GIST(poly);
 CREATE INDEX idx_multipolygons_poly_proj ON {0}.multipolygons USING gist(poly_proj);
 CREATE INDEX idx_multipolygons_tags ON {0}.multipolygons USING gist (tags);
 ANALYZE {0}.multipolygons;
 """
 
-    sql_create_polygons = """
-CREATE UNLOGGED TABLE {0}.polygons AS
+    sql_select_polygons = """
 SELECT
     'R' AS type,
     id,
@@ -215,7 +230,7 @@ SELECT
     poly,
     poly_proj
 FROM
-    {0}.multipolygons
+    {multipolygons}
 WHERE
     is_valid
 UNION ALL
@@ -226,21 +241,24 @@ SELECT
     ST_MakePolygon(linestring) AS poly,
     ST_MakePolygon(ST_Transform(linestring, {1})) AS poly_proj
 FROM
-    ways
+    {ways}
 WHERE
     tags != ''::hstore AND
     is_polygon AND
     ST_IsValid(ST_MakePolygon(ST_Transform(linestring, {1})))
-;
+"""
+
+    sql_create_polygons = """
+CREATE TABLE {0}.polygons AS""" + sql_select_polygons + """;
 
+CREATE INDEX idx_polygons_id ON {0}.polygons(id);
 CREATE INDEX idx_polygons ON {0}.polygons USING gist(poly);
 CREATE INDEX idx_polygons_proj ON {0}.polygons USING gist(poly_proj);
 CREATE INDEX idx_polygons_tags ON {0}.polygons USING gist(tags);
 ANALYZE {0}.polygons;
 """
 
-    sql_create_buildings = """
-CREATE UNLOGGED TABLE {0}.buildings AS
+    sql_select_buildings = """
 SELECT
     id,
     type || id AS type_id,
@@ -252,18 +270,48 @@ SELECT
     ST_NPoints(poly) AS npoints,
     ST_Area(poly_proj) AS area
 FROM
-    polygons
+    {polygons}
 WHERE
     tags?'building' AND
     tags->'building' != 'no'
-;
+"""
+
+    sql_create_buildings = """
+CREATE TABLE {0}.buildings AS""" + sql_select_buildings + """;
 
+CREATE INDEX idx_buildings_type_id ON {0}.buildings(type_id);
 CREATE INDEX idx_buildings_poly ON {0}.buildings USING GIST(poly);
 CREATE INDEX idx_buildings_poly_wall ON {0}.buildings USING GIST(poly) WHERE wall;
 CREATE INDEX idx_buildings_poly_proj ON {0}.buildings USING gist(poly_proj);
 ANALYZE {0}.buildings;
 """
 
+    # name: (required derived tables, object types, (key, matching key from transitive_touched), SQL to create, SQL to insert)
+    derived_tables = {
+        'highways': ([], ['W'], ('id', 'id'), sql_create_highways, "INSERT INTO {0}.highways" + sql_select_highways),
+        'highway_ends': (['highways'], ['W'], ('id', 'id'), sql_create_highway_ends, "INSERT INTO {0}.highway_ends" + sql_select_highway_ends),
+        'multipolygons': ([], ['R'], ('id', 'id'), sql_create_multipolygons, sql_insert_multipolygons),
+        'polygons': (['multipolygons'], ['W', 'R'], ('(type, id)', 'data_type, id'), sql_create_polygons, "INSERT INTO {0}.polygons" + sql_select_polygons),
+        'buildings': (['polygons'], ['W', 'R'], ('type_id', 'data_type || id'), sql_create_buildings, "INSERT INTO {0}.buildings" + sql_select_buildings),
+    }
+
+    # Spatial tiling of run_tiled(), in EPSG:4326. sql_tile is the envelope of
+    # the tile, with its halo, to select the objects. sql_tile_owner.format(point)
+    # keeps the results located in the cell of the tile, each one on one tile.
+    sql_tile = "ST_MakeEnvelope(%(halo_xmin)s, %(halo_ymin)s, %(halo_xmax)s, %(halo_ymax)s, 4326)"
+    sql_tile_owner = "(ST_X({0}) >= %(xmin)s AND ST_X({0}) < %(xmax)s AND ST_Y({0}) >= %(ymin)s AND ST_Y({0}) < %(ymax)s)"
+
+    # Results with callback are streamed from a server side cursor, by
+    # itersize rows. Rows are lists, or dicts by column name with dict_rows.
+    itersize = 2000
+    dict_rows = False
+    cursor_count = 0
+    re_streamable = re.compile(r"^\s*(?:--[^\n]*\n\s*)*(?:SELECT|WITH|VALUES|\()", re.IGNORECASE)
+
+    # Number of tiles by worker, smaller tiles balance the load
+    tiles_by_worker = 4
+    tile_retries = 1
+
     def __init__(self, config, logger = None):
         Analyser.__init__(self, config, logger)
         self.classs = {}
@@ -369,41 +417,36 @@ ANALYZE {0}.buildings;
 
 
     def requires_tables_build(self, tables):
+        # Analysers may run concurrently (osmose_run --jobs), build the shared tables one at a time.
+        # Session level lock, kept across COMMIT, released with the connection on error.
+        self.giscurs.execute("SELECT pg_advisory_lock(hashtext('osmose_requires_tables_build'))")
         for table in tables:
+            if table in self.derived_tables:
+                self.requires_tables_build(self.derived_tables[table][0])
+                self.derived_table_build(table)
+                continue
+
             self.giscurs.execute("SELECT 1 FROM pg_tables WHERE schemaname = '{0}' AND tablename = '{1}'".format(self.config.db_schema.split(',')[0], table))
             if not self.giscurs.fetchone():
                 self.logger.log(u"requires table {0}".format(table))
-                if table == 'highways':
-                    self.giscurs.execute(self.sql_create_highways.format(self.config.db_schema.split(',')[0], self.config.options.get("proj")))
-                elif table == 'touched_highways':
+                if table == 'touched_highways':
                     self.requires_tables_build(["highways"])
                     self.create_view_touched('highways', 'W')
                 elif table == 'not_touched_highways':
                     self.requires_tables_build(["highways"])
                     self.create_view_not_touched('highways', 'W')
-                elif table == 'highway_ends':
-                    self.requires_tables_build(["highways"])
-                    self.giscurs.execute(self.sql_create_highway_ends.format(self.config.db_schema.split(',')[0]))
                 elif table == 'touched_highway_ends':
                     self.requires_tables_build(["highway_ends"])
                     self.create_view_touched('highway_ends', 'W')
-                elif table == 'multipolygons':
-                    self.giscurs.execute(self.sql_create_multipolygons.format(self.config.db_schema.split(',')[0], self.config.options.get("proj")))
                 elif table == 'touched_multipolygons':
                     self.requires_tables_build(['multipolygons'])
                     self.create_view_touched('multipolygons', 'R')
-                elif table == 'polygons':
-                    self.requires_tables_build(["multipolygons"])
-                    self.giscurs.execute(self.sql_create_polygons.format(self.config.db_schema.split(',')[0], self.config.options.get("proj")))
                 elif table == 'touched_polygons':
                     self.requires_tables_build(["polygons"])
                     self.create_view_touched('polygons', ['W', 'R'])
                 elif table == 'not_touched_polygons':
                     self.requires_tables_build(["polygons"])
                     self.create_view_not_touched('polygons', ['W', 'R'])
-                elif table == 'buildings':
-                    self.requires_tables_build(["polygons"])
-                    self.giscurs.execute(self.sql_create_buildings.format(self.config.db_schema.split(',')[0], self.config.options.get("proj")))
                 elif table == 'touched_buildings':
                     self.requires_tables_build(["buildings"])
                     self.create_view_touched('buildings', ['W', 'R'])
@@ -416,14 +459,105 @@ ANALYZE {0}.buildings;
                 self.giscurs.execute('BEGIN')
 
 
+    def derived_table_hash(self, table):
+        (requires, types, key, sql_create, sql_insert) = self.derived_tables[table]
+        h = hashlib.md5()
+        for sql in (sql_create, sql_insert, str(self.config.options.get("proj"))):
+            h.update(sql.encode('utf-8'))
+        for require in requires:
+            h.update(self.derived_table_hash(require).encode('utf-8'))
+        return h.hexdigest()
+
+
+    def derived_tables_init(self):
+        self.giscurs.execute("""
+CREATE TABLE IF NOT EXISTS {0}.derived_tables (
+    name varchar PRIMARY KEY,
+    sql_hash varchar NOT NULL,
+    tstamp timestamp without time zone
+)""".format(self.config.db_schema.split(',')[0]))
+
+
+    def derived_table_build(self, table):
+        """
+        Keep a derived table up to date with the OSM data timestamp of metainfo.
+        Refresh only the rows of transitive_touched after a diff update from the table timestamp,
+        otherwise, or when the SQL definition changed, rebuild the full table.
+        """
+        schema = self.config.db_schema.split(',')[0]
+        (requires, types, (key, touched_key), sql_create, sql_insert) = self.derived_tables[table]
+        sql_hash = self.derived_table_hash(table)
+
+        self.derived_tables_init()
+        self.giscurs.execute("""
+SELECT
+    derived_tables.sql_hash,
+    derived_tables.tstamp,
+    metainfo.tstamp,
+    metainfo.tstamp_action,
+    to_regclass('transitive_touched') IS NOT NULL
+FROM
+    {0}.derived_tables
+    JOIN pg_tables ON
+        pg_tables.schemaname = %s AND
+        pg_tables.tablename = derived_tables.name,
+    metainfo
+WHERE
+    derived_tables.name = %s
+""".format(schema), (schema, table))
+        row = self.giscurs.fetchone()
+        if row:
+            (table_hash, table_tstamp, tstamp, tstamp_action, has_touched) = row
+            if table_hash == sql_hash and table_tstamp is not None and table_tstamp == tstamp:
+                return
+
+        sources = {'ways': 'ways', 'relations': 'relations'}
+        sources.update(map(lambda require: (require, schema + '.' + require), requires))
+
+        if row and table_hash == sql_hash and table_tstamp is not None and table_tstamp == tstamp_action and has_touched:
+            self.logger.log(u"refresh table {0}".format(table))
+            for require in requires:
+                self.create_view_touched(require, self.derived_tables[require][1])
+            sources = dict(map(lambda source: (source, 'touched_' + source), sources.keys()))
+            self.giscurs.execute("""
+DELETE FROM {0}.{1} WHERE {2} IN (
+    SELECT {3} FROM transitive_touched WHERE data_type = ANY(%s)
+    UNION
+    SELECT {3} FROM actions WHERE data_type = ANY(%s) AND action = 'D'
+)""".format(schema, table, key, touched_key), (types, types))
+            self.giscurs.execute(sql_insert.format(schema, self.config.options.get("proj"), **sources))
+            self.giscurs.execute("ANALYZE {0}.{1}".format(schema, table))
+        else:
+            self.logger.log(u"requires table {0}".format(table))
+            self.giscurs.execute("DROP TABLE IF EXISTS {0}.{1} CASCADE".format(schema, table))
+            self.giscurs.execute(sql_create.format(schema, self.config.options.get("proj"), **sources))
+
+        self.giscurs.execute("""
+INSERT INTO {0}.derived_tables
+SELECT %s, %s, tstamp FROM metainfo
+ON CONFLICT (name) DO UPDATE SET
+    sql_hash = EXCLUDED.sql_hash,
+    tstamp = EXCLUDED.tstamp
+""".format(schema), (table, sql_hash))
+        self.giscurs.execute('COMMIT')
+        self.giscurs.execute('BEGIN')
+
+
     def requires_tables_clean(self, tables):
         for table in tables:
+            if table in self.derived_tables:
+                # Persistent, refreshed on the next run
+                continue
             self.logger.log(u"requires table clean {0}".format(table))
             self.giscurs.execute('DROP TABLE IF EXISTS {0}.{1} CASCADE'.format(self.config.db_schema.split(',')[0], table))
             self.giscurs.execute('COMMIT')
             self.giscurs.execute('BEGIN')
 
     def db_setup_resume_from_timestamp(self, timestamp):
+        # Analysers may run concurrently (osmose_run --jobs), the first one refreshes the shared touched tables,
+        # the next ones wait for it and find tstamp_action up to date.
+        # Session level lock, as requires_tables_build(), released with the connection on error.
+        self.giscurs.execute("SELECT pg_advisory_lock(hashtext('osmose_requires_tables_build'))")
         self.giscurs.execute("SELECT tstamp_action FROM metainfo")
         tstamp_action = self.giscurs.fetchone()[0]
         if tstamp_action != timestamp:
@@ -434,8 +568,12 @@ ANALYZE {0}.buildings;
             ]
             for script in osmosis_resume_post_scripts: # self.config.analyser_conf.osmosis_resume_post_scripts:
                 self.giscurs.execute(open('./' + script, 'r').read().replace(':timestamp', str(timestamp)))
+            # Actions from timestamp do not include deletions, derived tables cannot be refreshed from them
+            self.derived_tables_init()
+            self.giscurs.execute("UPDATE {0}.derived_tables SET tstamp = NULL WHERE tstamp IS DISTINCT FROM (SELECT tstamp FROM metainfo)".format(self.config.db_schema.split(',')[0]))
             self.giscurs.execute('COMMIT')
             self.giscurs.execute('BEGIN')
+        self.giscurs.execute("SELECT pg_advisory_unlock(hashtext('osmose_requires_tables_build'))")
 
     def init_analyser(self):
         if len(set(self.classs.keys()) & set(self.classs_change.keys())) > 0:
@@ -443,6 +581,8 @@ ANALYZE {0}.buildings;
 
         self.giscurs.execute("SET LOCAL statement_timeout = '12h';")
         self.giscurs.execute("SET search_path TO {0},public;".format(self.config.db_schema_path or self.config.db_schema))
+        # The run00 named cursors are read to the end, plan them for all the rows, not the first 10%
+        self.giscurs.execute("SET cursor_tuple_fraction = 1.0;")
 
 
     def dump_class(self, classs):
@@ -556,47 +696,96 @@ WHERE
         type = type if isinstance(type, (list, tuple)) else [type]
         self.giscurs.execute(sql.format(table, id), (type, ))
 
-    def run00(self, sql, callback = None):
+    def run00(self, sql, callback = None, prefetch = None, params = None):
         if self.explain_sql:
             self.logger.log(sql.strip())
         if self.explain_sql and (sql.strip().startswith("SELECT") or sql.strip().startswith("CREATE UNLOGGED TABLE")) and not ';' in sql[:-1] and " AS " in sql:
             sql_explain = "EXPLAIN " + sql.split(";")[0]
-            self.giscurs.execute(sql_explain)
+            self.giscurs.execute(sql_explain, params)
             for res in self.giscurs.fetchall():
                 self.logger.log(res[0])
 
-        try:
-            self.giscurs.execute(sql)
-        except:
-            self.logger.err("sql={0}".format(sql))
-            raise
+        if callback and self.re_streamable.match(sql) and ';' not in sql.strip()[:-1]:
+            # Named cursor, the server produces the rows while the callbacks run
+            Analyser_Osmosis.cursor_count += 1
+            curs = self.gisconn.cursor("run00_{0}".format(Analyser_Osmosis.cursor_count), cursor_factory=DictCursorUnicode.DictCursorUnicode63 if self.dict_rows else DictCursorUnicode.ListCursor)
+            curs.itersize = self.itersize
+        else:
+            curs = self.giscurs
 
-        if callback:
-            while True:
-                many = self.giscurs.fetchmany(1000)
-                if not many:
-                    break
-                for res in many:
-                    ret = None
-                    try:
-                        ret = callback(res)
-                    except:
-                        self.logger.err("res={0}".format(res))
-                        self.logger.err("ret={0}".format(ret))
-                        raise
+        try:
+            try:
+                curs.execute(sql, params)
+            except:
+                self.logger.err("sql={0}".format(sql))
+                raise
+
+            if callback:
+                while True:
+                    many = curs.fetchmany(self.itersize)
+                    if not many:
+                        break
+                    self.dispatch(many, callback, prefetch)
+        finally:
+            if curs is not self.giscurs and not curs.closed and not self.gisconn.closed and self.gisconn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_INERROR:
+                curs.close()
+
+    def dispatch(self, many, callback, prefetch = None):
+        if prefetch:
+            prefetch(many)
+        for res in many:
+            ret = None
+            try:
+                ret = callback(res)
+            except:
+                self.logger.err("res={0}".format(res))
+                self.logger.err("ret={0}".format(ret))
+                raise
 
     def run0(self, sql, callback = None):
-        caller = getframeinfo(stack()[1][0])
-        self.logger.log("{0}:{1} sql".format(os.path.basename(caller.filename), caller.lineno))
+        caller = sys._getframe(1)
+        self.logger.log("{0}:{1} sql".format(os.path.basename(caller.f_code.co_filename), caller.f_lineno))
         self.run00(sql, callback)
 
-    def run(self, sql, callback = None):
+    def run(self, sql, callback = None, params = None):
+        caller = sys._getframe(1)
+        if callback:
+            self.logger.log("{0}:{1} xml generation".format(os.path.basename(caller.f_code.co_filename), caller.f_lineno))
+            (callback_package, callback_prefetch) = self.callbacks(callback)
+            self.run00(sql, callback_package, callback_prefetch, params=params)
+        else:
+            self.logger.log("{0}:{1} sql".format(os.path.basename(caller.f_code.co_filename), caller.f_lineno))
+            self.run00(sql, params=params)
+
+    def callbacks(self, callback):
+        """
+        Callbacks for run00(), building and writing the issues row by row from the analyser callback.
+        """
+        # Objects referred by the data of the last issue, the next ones likely have the same
+        last_data = [None]
+
+        def callback_prefetch(many):
+            # Load at once the objects of the batch, as referred by the last issue
+            if not last_data[0]:
+                return
+            objects = {'N': [], 'W': [], 'R': []}
+            for res in many:
+                for (i, d) in enumerate(last_data[0]):
+                    if d is not None and i < len(res) and res[i] is not None:
+                        try:
+                            self._prefetchFromCallback(objects, d, res[i])
+                        except (TypeError, ValueError, KeyError, IndexError):
+                            # Not of the type of the last issue, loaded on use
+                            pass
+            self.apiconn.Prefetch(nodes=objects['N'], ways=objects['W'], relations=objects['R'])
+
         def callback_package(res):
             ret = callback(res)
             if ret and ret.__class__ == dict:
                 if "self" in ret:
                     res = ret["self"](res)
                 if "data" in ret:
+                    last_data[0] = ret["data"] if "self" not in ret else None
                     self.geom = defaultdict(list)
                     ret["fixType"] = []
                     for (i, d) in enumerate(ret["data"]):
@@ -614,13 +803,179 @@ WHERE
                     ret.get("fix"),
                     self.geom)
 
-        caller = getframeinfo(stack()[1][0])
-        if callback:
-            self.logger.log("{0}:{1} xml generation".format(os.path.basename(caller.filename), caller.lineno))
-            self.run00(sql, callback_package)
+        return (callback_package, callback_prefetch)
+
+    def tiles_extent(self):
+        # Estimated from the statistics, exact when missing
+        self.giscurs.execute("SAVEPOINT tiles_extent")
+        try:
+            self.giscurs.execute("SELECT ST_EstimatedExtent(%s, 'nodes', 'geom')::geometry", [self.config.db_schema.split(',')[0]])
+            extent = self.giscurs.fetchone()[0]
+        except psycopg2.Error:
+            self.giscurs.execute("ROLLBACK TO SAVEPOINT tiles_extent")
+            extent = None
+        if extent is None:
+            self.giscurs.execute("SELECT ST_Extent(geom)::geometry FROM nodes")
+            extent = self.giscurs.fetchone()[0]
+        if extent is None:
+            return None
+        self.giscurs.execute("SELECT ST_XMin(%(e)s::geometry), ST_YMin(%(e)s::geometry), ST_XMax(%(e)s::geometry), ST_YMax(%(e)s::geometry)", {'e': extent})
+        return tuple(self.giscurs.fetchone())
+
+    @staticmethod
+    def tiles(extent, count, halo = 0.0):
+        """
+        Grid of about count tiles over extent (xmin, ymin, xmax, ymax), as query parameters.
+        Cells on the border extend to the whole world, to own the objects out of an estimated extent.
+        """
+        if extent is None or count <= 1:
+            (nx, ny) = (1, 1)
+            extent = extent or (-180, -90, 180, 90)
         else:
-            self.logger.log("{0}:{1} sql".format(os.path.basename(caller.filename), caller.lineno))
-            self.run00(sql)
+            (width, height) = (max(extent[2] - extent[0], 1e-6), max(extent[3] - extent[1], 1e-6))
+            nx = max(1, min(count, int(round(math.sqrt(count * width / height)))))
+            ny = max(1, int(math.ceil(count / nx)))
+
+        def bounds(vmin, vmax, n, world):
+            step = (vmax - vmin) / n
+            b = [vmin + i * step for i in range(n + 1)]
+            (b[0], b[-1]) = (-world, world)
+            return b
+
+        xs = bounds(extent[0], extent[2], nx, 1000)
+        ys = bounds(extent[1], extent[3], ny, 1000)
+        tiles = []
+        for j in range(ny):
+            for i in range(nx):
+                tiles.append({
+                    'xmin': xs[i], 'ymin': ys[j], 'xmax': xs[i + 1], 'ymax': ys[j + 1],
+                    'halo_xmin': xs[i] - halo, 'halo_ymin': ys[j] - halo, 'halo_xmax': xs[i + 1] + halo, 'halo_ymax': ys[j + 1] + halo,
+                })
+        return tiles
+
+    def run_tiled(self, sqls, callback = None, halo = 0.0):
+        """
+        Run the sqls on each tile of a grid over the extract, the last one with
+        the callback. Queries get the tile as parameters, to be used with
+        sql_tile, with a halo in degrees, and sql_tile_owner.
+        With osmosis_workers, the tiles run concurrently, each on a connection
+        of a worker thread, in its own transaction: temporary tables are the
+        ones of the tile. A failed tile is run again, alone. Results are
+        processed here, in tiles order. Workers run ahead of the processed
+        tile by at most osmosis_workers tiles, to bound the results waiting in
+        memory.
+        """
+        caller = sys._getframe(1)
+        where = "{0}:{1}".format(os.path.basename(caller.f_code.co_filename), caller.f_lineno)
+        workers = getattr(self.config, 'osmosis_workers', None) or 1
+        if workers <= 1:
+            self.logger.log("{0} tiled sql, single tile".format(where))
+            params = self.tiles(None, 1)[0]
+            for sql in sqls[:-1]:
+                self.run00(sql, params=params)
+            if callback:
+                (callback_package, callback_prefetch) = self.callbacks(callback)
+                self.run00(sqls[-1], callback_package, callback_prefetch, params=params)
+            else:
+                self.run00(sqls[-1], params=params)
+            return
+
+        tiles = self.tiles(self.tiles_extent(), workers * self.tiles_by_worker, halo)
+        self.logger.log("{0} tiled sql, {1} tiles on {2} workers".format(where, len(tiles), workers))
+        # Derived tables built in this transaction must be visible to the workers
+        self.giscurs.execute('COMMIT')
+        self.giscurs.execute('BEGIN')
+        self.giscurs.execute("SET LOCAL statement_timeout = '12h';")
+        self.giscurs.execute("SET search_path TO {0},public;".format(self.config.db_schema_path or self.config.db_schema))
+
+        search_path = self.config.db_schema_path or self.config.db_schema
+        osmosis_manager = self.config.osmosis_manager
+        condition = threading.Condition()
+        state = {'next': 0, 'processed': 0, 'results': {}, 'error': None}
+
+        def run_tile(params):
+            conn = osmosis_manager.osmosis().conn()
+            curs = conn.cursor(cursor_factory=DictCursorUnicode.DictCursorUnicode63 if self.dict_rows else DictCursorUnicode.ListCursor)
+            try:
+                curs.execute("SET LOCAL statement_timeout = '12h';")
+                curs.execute("SET search_path TO {0},public;".format(search_path))
+                for sql in sqls[:-1]:
+                    curs.execute(sql, params)
+                curs.execute(sqls[-1], params)
+                return curs.fetchall() if callback else []
+            finally:
+                curs.close()
+                conn.rollback()
+
+        def worker():
+            try:
+                while True:
+                    with condition:
+                        while not state['error'] and state['next'] < len(tiles) and state['next'] >= state['processed'] + workers:
+                            condition.wait()
+                        if state['error'] or state['next'] >= len(tiles):
+                            return
+                        i = state['next']
+                        state['next'] += 1
+                    start = time.time()
+                    for retry in range(self.tile_retries + 1):
+                        try:
+                            rows = run_tile(tiles[i])
+                            break
+                        except Exception as e:
+                            self.logger.err("tile {0}/{1}: {2}".format(i + 1, len(tiles), str(e).strip()))
+                            osmosis_manager.osmosis_close()
+                            if retry == self.tile_retries:
+                                with condition:
+                                    state['error'] = e
+                                    condition.notify_all()
+                                return
+                    self.logger.log("tile {0}/{1}: {2} rows, {3:.1f}s".format(i + 1, len(tiles), len(rows), time.time() - start))
+                    with condition:
+                        state['results'][i] = rows
+                        condition.notify_all()
+            finally:
+                osmosis_manager.osmosis_close()
+
+        threads = [threading.Thread(target=worker, name='tile-{0}'.format(i)) for i in range(min(workers, len(tiles)))]
+        for t in threads:
+            t.start()
+        try:
+            if callback:
+                (callback_package, callback_prefetch) = self.callbacks(callback)
+            for i in range(len(tiles)):
+                with condition:
+                    while i not in state['results'] and not state['error']:
+                        condition.wait()
+                    if state['error']:
+                        raise state['error']
+                    rows = state['results'].pop(i)
+                    state['processed'] = i + 1
+                    condition.notify_all()
+                if callback:
+                    for j in range(0, len(rows), 1000):
+                        self.dispatch(rows[j:j + 1000], callback_package, callback_prefetch)
+        finally:
+            with condition:
+                if not state['error'] and state['next'] < len(tiles):
+                    state['error'] = RuntimeError("tiled run interrupted")
+                state['next'] = len(tiles)
+                condition.notify_all()
+            for t in threads:
+                t.join()
+
+    def _prefetchFromCallback(self, objects, fn, input):
+        if fn in (self.node_full, self.node_position):
+            objects['N'].append(input)
+        elif fn == self.way_full:
+            objects['W'].append(input)
+        elif fn == self.relation_full:
+            objects['R'].append(input)
+        elif fn == self.any_full:
+            objects[input[0]].append(int(input[1:]))
+        elif fn == self.array_full:
+            for type, id in map(lambda r: (r[0], r[1:]), input):
+                objects[type].append(int(id))
 
     def _typeFromCallback(self, fn, input=None):
         if fn in (self.node, self.node_full, self.node_new, self.node_position):
@@ -683,11 +1038,50 @@ WHERE
             pts.append({"lat":lat, "lon":lon})
         return pts
 
+    def get_wkb_points(self, data):
+        data = bytes(data)
+        if len(data) == 21:
+            # Point, the common case
+            (type, x, y) = struct.unpack_from('<Idd' if data[0] else '>Idd', data, 1)
+            if type == 1:
+                return [{"lat":self.coordinate_text(y), "lon":self.coordinate_text(x)}]
+        return list(map(lambda c: {"lat":self.coordinate_text(c[1]), "lon":self.coordinate_text(c[0])}, self.coordinates(shapely.wkb.loads(data))))
+
+    @staticmethod
+    def coordinates(geom):
+        if hasattr(geom, 'geoms'):
+            for g in geom.geoms:
+                yield from Analyser_Osmosis.coordinates(g)
+        elif hasattr(geom, 'exterior'):
+            if not geom.is_empty:
+                yield from geom.exterior.coords
+                for interior in geom.interiors:
+                    yield from interior.coords
+        else:
+            yield from geom.coords
+
+    @staticmethod
+    def coordinate_text(d):
+        # As written in WKT by PostGIS: at most 15 decimals, without exponent
+        if abs(d) <= 1e-12:
+            return '0'
+        n = decimal.Decimal(repr(d))
+        if n.as_tuple().exponent < -15:
+            n = n.quantize(decimal.Decimal(1).scaleb(-15), rounding=decimal.ROUND_HALF_EVEN)
+        s = format(n, 'f')
+        if '.' in s:
+            s = s.rstrip('0').rstrip('.')
+        return s
+
     def positionAsText(self, res):
         if res is None:
             self.logger.warn("NULL location provided")
             return []
-        points = self.get_points(res)
+        if isinstance(res, str):
+            points = self.get_points(res)
+        else:
+            # WKB, from ST_AsBinary()
+            points = self.get_wkb_points(res)
         if points == []:
             self.logger.err("Invalid location provided")
             return []
@@ -800,6 +1194,36 @@ class Test(TestAnalyserOsmosis):
                     self.root_err = self.load_errors()
                     self.check_num_err(min=0, max=5)
 
+    def test_tags_index(self):
+        # the planned tags indexes must be usable by the analysers queries
+        gisconn = self.conf.osmosis_manager.osmosis().conn()
+        giscurs = gisconn.cursor()
+        giscurs.execute("SET enable_seqscan = off")
+        for (sql, index) in [
+            ("SELECT id FROM relations WHERE tags != ''::hstore AND tags?'type' AND tags->'type' = 'multipolygon'", "idx_relations_type_value"),
+            ("SELECT id FROM ways WHERE tags != ''::hstore AND tags?'railway' AND tags->'railway' IN ('rail', 'tram')", "idx_ways_railway_value"),
+        ]:
+            giscurs.execute("EXPLAIN " + sql)
+            plan = "\n".join(map(lambda r: r[0], giscurs.fetchall()))
+            self.assertIn(index, plan, sql)
+        giscurs.execute("RESET enable_seqscan")
+        giscurs.close()
+
+    def test_run00_cursor(self):
+        # run00 named cursors, full result plan and mutable rows
+        with Analyser_Osmosis(self.analyser_conf, self.logger) as analyser_obj:
+            analyser_obj.init_analyser()
+            analyser_obj.giscurs.execute("SHOW cursor_tuple_fraction")
+            self.assertEqual(float(analyser_obj.giscurs.fetchone()[0]), 1.0)
+
+            rows = []
+            analyser_obj.run00("SELECT id, tags FROM nodes ORDER BY id LIMIT 3", rows.append)
+            self.assertEqual(len(rows), 3)
+            for row in rows:
+                self.assertIsInstance(row, DictCursorUnicode.ListRow)
+                row[1] = None
+                self.assertIsNone(row[1])
+
     def test_change_empty(self):
         # run all available osmosis analysers, for basic SQL check
         import importlib
@@ -891,3 +1315,186 @@ class Test(TestAnalyserOsmosis):
 
                     print(normal_xml, change_xml)
                     self.compare_results(normal_xml, change_xml, convert_checked_to_normal=True)
+
+
+import unittest
+
+class TestQueries(unittest.TestCase):
+
+    def test_tiles(self):
+        tiles = Analyser_Osmosis.tiles((0, 0, 4, 1), 4, halo=0.1)
+        self.assertEqual(len(tiles), 4)
+        # Cells share their borders, the outer ones extend to the whole world
+        self.assertEqual(list(map(lambda t: (t['xmin'], t['xmax']), tiles)), [(-1000, 1), (1, 2), (2, 3), (3, 1000)])
+        self.assertEqual(tiles[0]['ymin'], -1000)
+        self.assertEqual(tiles[0]['ymax'], 1000)
+        self.assertAlmostEqual(tiles[1]['halo_xmin'], 0.9)
+        self.assertAlmostEqual(tiles[1]['halo_xmax'], 2.1)
+
+        tiles = Analyser_Osmosis.tiles((0, 0, 2, 2), 4)
+        self.assertEqual(len(tiles), 4)
+        self.assertEqual(len(set(map(lambda t: (t['xmin'], t['ymin']), tiles))), 4)
+
+        self.assertEqual(len(Analyser_Osmosis.tiles(None, 8)), 1)
+        self.assertEqual(len(Analyser_Osmosis.tiles((0, 0, 1, 1), 1)), 1)
+
+    def test_run_tiled_window(self):
+        # Tiles results fetched, but not yet processed, stay bounded
+        lock = threading.Lock()
+        counts = {'fetched': 0, 'processed': 0, 'ahead': 0}
+        processed = []
+
+        class Cursor:
+            def execute(self, sql, params=None):
+                self.params = params
+            def fetchall(self):
+                with lock:
+                    counts['fetched'] += 1
+                    counts['ahead'] = max(counts['ahead'], counts['fetched'] - counts['processed'])
+                return [[self.params['xmin'], self.params['ymin']]]
+            def close(self):
+                pass
+        class Conn:
+            def cursor(self, cursor_factory=None):
+                return Cursor()
+            def rollback(self):
+                pass
+        class Osmosis:
+            def conn(self):
+                return Conn()
+        class OsmosisManager:
+            def osmosis(self):
+                return Osmosis()
+            def osmosis_close(self):
+                pass
+        class Logger:
+            def log(self, msg):
+                pass
+        class Config:
+            osmosis_workers = 3
+            osmosis_manager = OsmosisManager()
+            db_schema = 'test'
+            db_schema_path = None
+
+        analyser = Analyser_Osmosis.__new__(Analyser_Osmosis)
+        analyser.config = Config()
+        analyser.logger = Logger()
+        analyser.giscurs = Cursor()
+        analyser.dict_rows = False
+        analyser.tiles_extent = lambda: (0, 0, 12, 1)
+
+        def callback(res):
+            time.sleep(0.01)
+            processed.append(tuple(res))
+            with lock:
+                counts['processed'] += 1
+        analyser.run_tiled(["SELECT 1"], callback)
+
+        tiles = Analyser_Osmosis.tiles((0, 0, 12, 1), 3 * Analyser_Osmosis.tiles_by_worker)
+        self.assertEqual(processed, list(map(lambda t: (t['xmin'], t['ymin']), tiles)))
+        self.assertLessEqual(counts['ahead'], Config.osmosis_workers + 1)
+
+    def test_streamable(self):
+        self.assertTrue(Analyser_Osmosis.re_streamable.match("\n-- comment\nSELECT 1"))
+        self.assertTrue(Analyser_Osmosis.re_streamable.match("WITH t AS (SELECT 1) SELECT * FROM t"))
+        self.assertFalse(Analyser_Osmosis.re_streamable.match("CREATE TEMP TABLE t AS SELECT 1"))
+
+    def test_callback_error(self):
+        class Logger:
+            errors = []
+            def err(self, msg):
+                self.errors.append(msg)
+        analyser = Analyser_Osmosis.__new__(Analyser_Osmosis)
+        analyser.logger = Logger()
+        (callback_package, callback_prefetch) = analyser.callbacks(lambda res: {"class": 1, "subclass": res[2]})
+        with self.assertRaises(IndexError):
+            analyser.dispatch([[1, 2]], callback_package, callback_prefetch)
+        self.assertEqual(analyser.logger.errors, ["res=[1, 2]", "ret=None"])
+
+    def test_callback_order(self):
+        # Each issue is written before the callback of the next row runs
+        written = []
+        class ErrorFile:
+            def error(self, classs, subclass, text, res, fixType, fix, geom):
+                written.append(("error", res[0]))
+        class Osmosis:
+            def Prefetch(self, nodes, ways, relations):
+                written.append(("prefetch", sorted(nodes)))
+        analyser = Analyser_Osmosis.__new__(Analyser_Osmosis)
+        analyser.error_file = ErrorFile()
+        analyser.apiconn = Osmosis()
+        def callback(res):
+            written.append(("callback", res[0]))
+            return {"class": 1, "data": [analyser.node_position]}
+        analyser.node_position = lambda res: None
+        (callback_package, callback_prefetch) = analyser.callbacks(callback)
+        analyser.dispatch([[1], [2]], callback_package, callback_prefetch)
+        analyser.dispatch([[3], [4]], callback_package, callback_prefetch)
+        self.assertEqual(written, [
+            ("callback", 1), ("error", 1), ("callback", 2), ("error", 2),
+            ("prefetch", [3, 4]),
+            ("callback", 3), ("error", 3), ("callback", 4), ("error", 4),
+        ])
+
+    def test_positions(self):
+        import shapely.geometry
+        # WKT as written by PostGIS, and the same points as WKB
+        texts = ["POINT(-62.8363074 17.9)", "POINT(1 2)", "POINT(-180 -90)", "POINT(0.00001 -0.0000001)", "POINT(179.9999999 0)", "POINT(12.3456789 -0.5)"]
+        positions = {}
+        for binary in (False, True):
+            analyser = Analyser_Osmosis.__new__(Analyser_Osmosis)
+            analyser.geom = defaultdict(list)
+            for t in texts:
+                if binary:
+                    (lon, lat) = map(float, t[len("POINT("):-1].split(" "))
+                    analyser.positionAsText(memoryview(shapely.geometry.Point(lon, lat).wkb))
+                else:
+                    analyser.positionAsText(t)
+            positions[binary] = analyser.geom["position"]
+        self.assertEqual(positions[True], positions[False])
+        self.assertEqual(positions[True][3], {"lat": "-0.0000001", "lon": "0.00001"})
+
+    def test_wkb_points(self):
+        import shapely.geometry
+        analyser = Analyser_Osmosis.__new__(Analyser_Osmosis)
+        self.assertEqual(analyser.get_wkb_points(shapely.wkb.dumps(shapely.geometry.Point(1, 2), big_endian=True)), [{"lat": "2", "lon": "1"}])
+        self.assertEqual(analyser.get_wkb_points(shapely.geometry.LineString([(0, 1), (2, 3), (4, 5)]).wkb), [{"lat": "1", "lon": "0"}, {"lat": "3", "lon": "2"}, {"lat": "5", "lon": "4"}])
+        self.assertEqual(len(analyser.get_wkb_points(shapely.geometry.Polygon([(0, 0), (0, 1), (1, 1), (0, 0)]).wkb)), 4)
+        self.assertEqual(len(analyser.get_wkb_points(shapely.geometry.MultiPoint([(0, 1), (2, 3)]).wkb)), 2)
+
+        self.assertEqual(Analyser_Osmosis.coordinate_text(-180.0), '-180')
+        self.assertEqual(Analyser_Osmosis.coordinate_text(-1.5e-07), '-0.00000015')
+        self.assertEqual(Analyser_Osmosis.coordinate_text(-0.0), '0')
+        self.assertEqual(Analyser_Osmosis.coordinate_text(1e-13), '0')
+        self.assertEqual(Analyser_Osmosis.coordinate_text(0.1234567890123456789), '0.123456789012346')
+
+    # Queries where the position text is also hashed into the issue subclass
+    positions_as_text = set([
+        ('analyser_osmosis_boundary_administrative', 'sql40'),
+        ('analyser_osmosis_boundary_hole', 'sql10'),
+        ('analyser_osmosis_building_overlaps', 'sql60'),
+        ('analyser_osmosis_orphan_nodes_cluster', 'sql10'),
+        ('analyser_osmosis_powerline', 'sql52'),
+    ])
+
+    def test_positions_binary(self):
+        import glob
+        import importlib
+        analysers = sorted(map(lambda f: os.path.basename(f)[:-3], glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'analyser_osmosis_*.py'))))
+        self.assertGreater(len(analysers), 50)
+        as_text = set()
+        for name in analysers:
+            module = importlib.import_module('analysers.' + name)
+            for (var, sql) in vars(module).items():
+                if var.startswith('sql') and isinstance(sql, str) and re.search(r'ST_AsText\(', sql, re.IGNORECASE):
+                    as_text.add((name, var))
+        # Positions are selected with ST_AsBinary()
+        self.assertEqual(as_text, self.positions_as_text)
+
+    def test_list_row(self):
+        class cursor:
+            description = ((), (), ())
+        row = DictCursorUnicode.ListRow(cursor)
+        self.assertEqual(row, [None, None, None])
+        row[1] = 2
+        self.assertEqual(row[1], 2)
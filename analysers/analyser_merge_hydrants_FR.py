@@ -67,8 +67,7 @@ class _Analyser_Merge_Afigeo_Hydrants(Analyser_Merge_Point):
         self.init(
             source_url,
             dataset_name,
-            GeoJSON(source,
-                extractor = lambda geojson: geojson),
+            GeoJSON(source),
             Load_XY("geom_x", "geom_y"),
             Conflate(
                 select = Select(
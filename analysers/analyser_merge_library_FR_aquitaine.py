@@ -35,7 +35,7 @@ class Analyser_Merge_Library_FR_aquitaine(Analyser_Merge_Point):
             u"Liste des bibliothèques et médiathèques en Aquitaine",
             JSON(Source(attribution = u"Réseau SIRTAQUI - Comité Régional de Tourisme d'Aquitaine - www.sirtaqui-aquitaine.com", millesime = "06/2016",
                     fileUrl = u"http://wcf.tourinsoft.com/Syndication/aquitaine/057734af-e3fa-448f-8180-0df67d1ad141/Objects?$format=json"),
-                extractor = lambda json: json['d']),
+                path = ['d']),
             Load_XY("LON", "LAT",
                 where = lambda row: u"Bibliothèque" in row["NOMOFFRE"] or u"Médiathèque" in row["NOMOFFRE"],
                 xFunction = Load_XY.degree,
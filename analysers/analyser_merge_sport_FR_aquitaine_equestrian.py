@@ -35,7 +35,7 @@ class Analyser_Merge_Sport_FR_Aquitaine_Equestrian(Analyser_Merge_Point):
             u"Liste des activités de pratique équestre en aquitaine",
             JSON(Source(attribution = u"Réseau SIRTAQUI - Comité Régional de Tourisme d'Aquitaine - www.sirtaqui-aquitaine.com", millesime = "08/2018",
                     fileUrl = u"http://wcf.tourinsoft.com/Syndication/aquitaine/3db03dc1-a2aa-415f-b219-53f70d387b53/Objects?$format=json"),
-                extractor = lambda json: json['d']),
+                path = ['d']),
             Load_XY("LON", "LAT",
                 xFunction = Load_XY.degree,
                 yFunction = Load_XY.degree),
@@ -35,7 +35,7 @@ class Analyser_Merge_Tourism_FR_Aquitaine_Caravan(Analyser_Merge_Point):
             u"Liste des aires de camping-cars en Aquitaine",
             JSON(Source(attribution = u"Réseau SIRTAQUI - Comité Régional de Tourisme d'Aquitaine - www.sirtaqui-aquitaine.com", millesime = "08/2018",
                     fileUrl = u"http://wcf.tourinsoft.com/Syndication/aquitaine/eda0e9ba-cec4-48f5-bd24-985d1d614c23/Objects?$format=json"),
-                extractor = lambda json: json['d']),
+                path = ['d']),
             Load_XY("LON", "LAT",
                 xFunction = Load_XY.degree,
                 yFunction = Load_XY.degree),
@@ -64,7 +64,7 @@ class Analyser_Merge_Tourism_FR_Aquitaine_Camp(Analyser_Merge_Point):
             u"Liste des campings en Aquitaine",
             JSON(Source(attribution = u"Réseau SIRTAQUI - Comité Régional de Tourisme d'Aquitaine - www.sirtaqui-aquitaine.com", millesime = "08/2018",
                     fileUrl = u"http://wcf.tourinsoft.com/Syndication/aquitaine/13d7f8ab-bd69-4815-b02c-d8134663b849/Objects?$format=json"),
-                extractor = lambda json: json['d']),
+                path = ['d']),
             Load_XY("LON", "LAT",
                 xFunction = Load_XY.degree,
                 yFunction = Load_XY.degree),
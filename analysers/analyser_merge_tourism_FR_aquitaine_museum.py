@@ -37,7 +37,7 @@ class Analyser_Merge_Tourism_FR_Aquitaine_Museum(Analyser_Merge_Point):
             u"Liste des musées et centres d'interprétation de Gironde",
             JSON(Source(attribution = u"Réseau SIRTAQUI - Comité Régional de Tourisme d'Aquitaine - www.sirtaqui-aquitaine.com", millesime = "08/2018",
                     fileUrl = u"http://wcf.tourinsoft.com/Syndication/aquitaine/094df128-7ac5-43e5-a7e9-a5d752317674/Objects?$format=json"),
-                extractor = lambda json: json['d']),
+                path = ['d']),
             Load_XY("LON", "LAT",
                 xFunction = Load_XY.degree,
                 yFunction = Load_XY.degree),
@@ -35,7 +35,7 @@ class Analyser_Merge_Winery_FR_aquitaine(Analyser_Merge_Point):
             u"Liste des sites viticoles en Aquitaine",
             JSON(Source(attribution = u"Réseau SIRTAQUI - Comité Régional de Tourisme d'Aquitaine - www.sirtaqui-aquitaine.com", millesime = "06/2016",
                     fileUrl = u"http://wcf.tourinsoft.com/Syndication/aquitaine/7da797c5-e2d9-4bc6-aff5-11f4059b7fc7//Objects?$format=json"),
-                extractor = lambda json: json['d']),
+                path = ['d']),
             Load_XY("LON", "LAT",
                 select = {"TYPEPRODUITS": {"like": "%Vins%"}},
                 xFunction = Load_XY.degree,
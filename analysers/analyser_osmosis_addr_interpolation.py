@@ -69,7 +69,7 @@ CREATE INDEX idx_interpolation_nodes_geom ON interpolation_nodes USING gist(geom
 sql10 = """
 SELECT
     id,
-    St_AsText(geom)
+    ST_AsBinary(geom)
 FROM
     interpolation_nodes
 WHERE
@@ -79,7 +79,7 @@ WHERE
 sql20 = """
 SELECT
     id,
-    St_AsText(geom)
+    ST_AsBinary(geom)
 FROM
     interpolation_nodes
 WHERE
@@ -91,7 +91,7 @@ sql30 = """
 SELECT
     w1.id,
     w2.id,
-    ST_AsText(ST_Centroid(ST_Intersection(w1.linestring, w2.linestring)))
+    ST_AsBinary(ST_Centroid(ST_Intersection(w1.linestring, w2.linestring)))
 FROM
     interpolations AS w1
     JOIN interpolations AS w2 ON
@@ -102,7 +102,7 @@ FROM
 sql40 = """
 SELECT DISTINCT ON (ways.id)
     ways.id,
-    St_AsText(coalesce(nodes.geom, way_locate(ways.linestring)))
+    ST_AsBinary(coalesce(nodes.geom, way_locate(ways.linestring)))
 FROM
     interpolations AS ways
     LEFT JOIN interpolation_nodes AS nodes ON
@@ -124,7 +124,7 @@ CREATE TEMP TABLE interpolations_ends AS
 SELECT
   ways.id,
   nodes.tags->'addr:housenumber' AS housenumber,
-   ST_AsText(nodes.geom) AS geom
+  nodes.geom
 FROM
   interpolations AS ways
   JOIN interpolation_nodes AS nodes ON
@@ -137,7 +137,7 @@ FROM
 sql51 = """
 SELECT
   id,
-  ST_AsText(ST_GeometryN(ST_Collect(geom), 1))
+  ST_AsBinary(ST_GeometryN(ST_Collect(geom), 1))
 FROM
   interpolations_ends
 GROUP BY
@@ -150,7 +150,7 @@ HAVING
 sql60 = """
 SELECT
     w_id,
-    ST_AsText(min(geom)),
+    ST_AsBinary(min(geom)),
     string_agg(DISTINCT tags->'addr:street', ', ')
 FROM
     (SELECT *, unnest(w_ids) AS w_id FROM interpolation_nodes) AS nodes
@@ -166,7 +166,7 @@ HAVING
 sql70 = """
 SELECT
     nodes.id,
-    ST_AsText(nodes.geom),
+    ST_AsBinary(nodes.geom),
     string_agg(DISTINCT relations.tags->'name', ', ')
 FROM
     interpolation_nodes AS nodes
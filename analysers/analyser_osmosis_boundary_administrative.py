@@ -101,7 +101,7 @@ WHERE
 sql51 = """
 SELECT
     ways.id,
-    ST_AsText(way_locate(ways.linestring))
+    ST_AsBinary(way_locate(ways.linestring))
 FROM
     boundary AS ways
     LEFT JOIN relation_members ON
@@ -114,7 +114,7 @@ WHERE
 sql52 = """
 SELECT
     ways.id,
-    ST_AsText(way_locate(ways.linestring))
+    ST_AsBinary(way_locate(ways.linestring))
 FROM
     boundary AS ways
     JOIN relation_members ON
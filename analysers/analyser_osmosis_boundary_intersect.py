@@ -75,7 +75,7 @@ sql20 = """
 SELECT
     b1.id,
     b2.id,
-    ST_ASText(ST_GeometryN(ST_Multi(ST_Intersection(b1.linestring, b2.linestring)), 1))
+    ST_AsBinary(ST_GeometryN(ST_Multi(ST_Intersection(b1.linestring, b2.linestring)), 1))
 FROM
     boundary AS b1
     JOIN boundary AS b2 ON
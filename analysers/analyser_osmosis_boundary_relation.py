@@ -56,7 +56,7 @@ ORDER BY
 sql10 = """
 SELECT
     id,
-    ST_AsText(relation_locate(id))
+    ST_AsBinary(relation_locate(id))
 FROM
     {0}_{1}_admin
 WHERE
@@ -67,7 +67,7 @@ WHERE
 sql20 = """
 SELECT
     id,
-    ST_AsText(relation_locate(id)),
+    ST_AsBinary(relation_locate(id)),
     {2}
 FROM
     {0}_{1}_admin
@@ -79,7 +79,7 @@ WHERE
 sql50 = """
 SELECT
     id,
-    ST_AsText(relation_locate(id)),
+    ST_AsBinary(relation_locate(id)),
     coalesce(ntags->'population', wtags->'population'),
     rtags->'population' AS population
 FROM
@@ -93,7 +93,7 @@ WHERE
 sql60 = """
 SELECT
     relations.id,
-    ST_AsText(relation_locate(relations.id)),
+    ST_AsBinary(relation_locate(relations.id)),
     string_agg(relation_members.member_role, ', ')
 FROM
     {0}relations AS relations
@@ -84,7 +84,7 @@ FROM
 sql13 = """
 SELECT
     id,
-    ST_AsText(geom),
+    ST_AsBinary(geom),
     survery_building.desc
 FROM
     survery_building
@@ -41,7 +41,7 @@ SELECT DISTINCT ON (poly_landuse.type_id)
   poly_landuse.type_id,
   buildings.type_id,
   -- Use the building location to point out the error, even though the landuse should be changed
-  ST_AsText(polygon_locate(buildings.poly)),
+  ST_AsBinary(polygon_locate(buildings.poly)),
   buildings.tags->'building',
   poly_landuse.landuse
 FROM
@@ -47,7 +47,7 @@ CREATE TEMP TABLE intersection_{0}_{1} AS
 SELECT
     b1.type_id AS id1,
     b2.type_id AS id2,
-    ST_AsText(ST_Transform(ST_Centroid(ST_Intersection(b1.poly_proj, b2.poly_proj)), 4326)),
+    ST_AsBinary(ST_Transform(ST_Centroid(ST_Intersection(b1.poly_proj, b2.poly_proj)), 4326)),
     ST_Area(ST_Intersection(b1.poly_proj, b2.poly_proj)) AS intersectionArea,
     least(b1.area, b2.area) * 0.10 AS threshold,
     b1.poly_proj
@@ -75,7 +75,7 @@ FROM
 sql40 = """
 SELECT
     type_id,
-    ST_AsText(ST_Transform(ST_Centroid(poly_proj), 4326))
+    ST_AsBinary(ST_Transform(ST_Centroid(poly_proj), 4326))
 FROM
     {0}buildings
 WHERE
@@ -89,7 +89,7 @@ SELECT
     DISTINCT ON (bnodes.type_id)
     buildings.type_id,
     bnodes.type_id,
-    ST_AsText(ST_Transform(bnodes.point_proj, 4326))
+    ST_AsBinary(ST_Transform(bnodes.point_proj, 4326))
 FROM
     {0}buildings AS buildings
     JOIN {1}bnodes AS bnodes ON
@@ -129,7 +129,7 @@ SELECT
    DISTINCT ON (b2.type_id)
    b2.type_id,
    b1.type_id,
-   ST_AsText(polygon_locate(b2.poly))
+   ST_AsBinary(polygon_locate(b2.poly))
 FROM
    {0}buildings AS b1
    JOIN {1}buildings AS b2 ON
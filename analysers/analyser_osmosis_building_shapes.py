@@ -27,7 +27,7 @@ from .Analyser_Osmosis import Analyser_Osmosis
 sql10 = """
 SELECT
     type_id,
-    ST_AsText(polygon_locate(poly))
+    ST_AsBinary(polygon_locate(poly))
 FROM
     {0}buildings
 WHERE
@@ -43,7 +43,7 @@ WHERE
 sql20 = """
 SELECT
     type_id,
-    ST_AsText(polygon_locate(poly))
+    ST_AsBinary(polygon_locate(poly))
 FROM
     {0}buildings
 WHERE
@@ -53,7 +53,7 @@ CREATE INDEX idx_camp_sites_poly ON camp_sites USING GIST(poly);
 sql10 = """
 SELECT
   pitch.id,
-  ST_AsText(way_locate(pitch.linestring))
+  ST_AsBinary(way_locate(pitch.linestring))
 FROM
   ways AS pitch
   LEFT JOIN camp_sites ON
@@ -68,7 +68,7 @@ WHERE
 sql11 = """
 SELECT
   pitch.id,
-  ST_AsText(pitch.geom)
+  ST_AsBinary(pitch.geom)
 FROM
   nodes AS pitch
   LEFT JOIN camp_sites ON
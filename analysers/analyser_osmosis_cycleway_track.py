@@ -27,7 +27,7 @@ sql10 = """
 SELECT
     cycle_track.id,
     cycleway.id,
-    ST_AsText(way_locate(cycle_track.linestring))
+    ST_AsBinary(way_locate(cycle_track.linestring))
 FROM
     (
         SELECT
@@ -96,7 +96,7 @@ sql20 = """
 SELECT
     {2}.id,
     {3}.id,
-    ST_AsText(ST_Centroid({3}.geom))
+    ST_AsBinary(ST_Centroid({3}.geom))
 FROM
     {0}{2} AS {2}
     JOIN {1}{3} AS {3} ON
@@ -86,7 +86,7 @@ sql12 = """
 SELECT
     b1.id AS id1,
     b2.id AS id2,
-    ST_AsText(ST_Centroid(b1.linestring))
+    ST_AsBinary(ST_Centroid(b1.linestring))
 FROM
     c1 AS b1
     JOIN c1 AS b2 ON
@@ -161,7 +161,7 @@ sql22 = """
 SELECT
     b1.id AS id1,
     b2.id AS id2,
-    ST_AsText(ST_Centroid(b1.linestring)),
+    ST_AsBinary(ST_Centroid(b1.linestring)),
 --    ((b1.tags @> b2.tags ) AND (b2.tags @> b1.tags ))
     b1.tags = b2.tags
 FROM
@@ -235,7 +235,7 @@ sql32 = """
 SELECT
     b1.id AS id1,
     b2.id AS id2,
-    ST_AsText(b1.geom),
+    ST_AsBinary(b1.geom),
     b1.tags = b2.tags
 FROM
     c3 AS b1
@@ -269,7 +269,7 @@ c AS (
 )
 SELECT
     array_agg('N' || id::text) AS ids,
-    ST_AsText(min(geom))
+    ST_AsBinary(min(geom))
 FROM
     c
 WHERE
@@ -26,7 +26,7 @@ from .Analyser_Osmosis import Analyser_Osmosis
 sql10 = """
 SELECT
     array_agg(ids) AS ids,
-    ST_AsText(array_locate(array_agg(ids))) AS geom,
+    ST_AsBinary(array_locate(array_agg(ids))) AS geom,
     fantoir,
     names
 FROM
@@ -48,7 +48,8 @@ FROM (
       highway NOT IN ('service', 'footway', 'path', 'platform', 'steps') AND
       NOT is_construction AND
       NOT is_polygon AND
-      ST_Length(linestring_proj) > 10
+      ST_Length(linestring_proj) > 10 AND
+      linestring && """ + Analyser_Osmosis.sql_tile + """
     ) AS t
     LEFT JOIN highways ON
       highways.id != t.id AND
@@ -59,6 +60,7 @@ FROM (
   ) as t
   JOIN nodes ON
     nodes.id = t.nid AND
+    """ + Analyser_Osmosis.sql_tile_owner.format("nodes.geom") + """ AND
     NOT (
       nodes.tags?'noexit' OR
       (nodes.tags?'highway' AND nodes.tags->'highway' IN ('turning_circle', 'bus_stop')) OR
@@ -74,7 +76,7 @@ sql13 = """
 SELECT DISTINCT
   way_ends.id,
   way_ends.nid,
-  ST_AsText(way_ends.ogeom)
+  ST_AsBinary(way_ends.ogeom)
 FROM
   way_ends
   JOIN highways ON
@@ -103,8 +105,7 @@ class Analyser_Osmosis_Highway_Almost_Junction(Analyser_Osmosis):
             title = T_('Almost junction, join or use noexit tag'))
 
     def analyser_osmosis_common(self):
-        self.run(sql12.format(self.config.options.get("proj")))
-        self.run(sql13, lambda res: {"class":1, "data":[self.way_full, self.node, self.positionAsText]})
+        self.run_tiled([sql12.format(self.config.options.get("proj")), sql13], lambda res: {"class":1, "data":[self.way_full, self.node, self.positionAsText]})
 
 
 ###########################################################################
@@ -130,3 +131,18 @@ class Test(TestAnalyserOsmosis):
         self.check_err(cl="1", elems=[("node", "23"), ("way", "1010")])
 
         self.check_num_err(3)
+
+    def test_tiled(self):
+        self.analyser_conf.osmosis_workers = 3
+        try:
+            with Analyser_Osmosis_Highway_Almost_Junction(self.analyser_conf, self.logger) as a:
+                a.analyser()
+        finally:
+            self.analyser_conf.osmosis_workers = 1
+
+        self.root_err = self.load_errors()
+        self.check_err(cl="1", elems=[("node", "17"), ("way", "1008")])
+        self.check_err(cl="1", elems=[("node", "18"), ("way", "1007")])
+        self.check_err(cl="1", elems=[("node", "23"), ("way", "1010")])
+
+        self.check_num_err(3)
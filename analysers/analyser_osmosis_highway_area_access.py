@@ -28,7 +28,7 @@ sql10 = """
 SELECT
   nodes.id,
   ways.id,
-  ST_AsText(nodes.geom),
+  ST_AsBinary(nodes.geom),
   nodes.tags->'motor_vehicle' AS node_motor_vehicle,
   ways.tags->'motor_vehicle' AS way_motor_vehicle
 FROM
@@ -82,7 +82,7 @@ sql21 = """
 SELECT
     barrier.wid,
     barrier.id,
-    ST_AsText(barrier.geom),
+    ST_AsBinary(barrier.geom),
     barrier.waytags->'{vehicle}'
 FROM
     {barriertype} AS barrier
@@ -96,7 +96,7 @@ sql31 = """
 SELECT
   highways.id,
   barrier.id,
-  ST_AsText(barrier.geom)
+  ST_AsBinary(barrier.geom)
 FROM
   {0}highways as highways
   JOIN {1}nodes AS barrier ON
@@ -120,7 +120,7 @@ sql41 = """
 SELECT
   DISTINCT ON(barrier.id)
   barrier.id,
-  ST_AsText(barrier.geom)
+  ST_AsBinary(barrier.geom)
 FROM
   highways AS ways
   JOIN nodes AS barrier ON
@@ -142,7 +142,7 @@ WHERE
 UNION
 SELECT
   barrier.id,
-  ST_AsText(barrier.geom)
+  ST_AsBinary(barrier.geom)
 FROM
   nodes AS barrier
   JOIN highway_ends AS way_ends ON
@@ -27,7 +27,7 @@ sql10 = """
 SELECT
   w1_id,
   w2_id,
-  ST_AsText(geom)
+  ST_AsBinary(geom)
 FROM
   (
   SELECT
@@ -54,7 +54,7 @@ sql20 = """
 SELECT
   w1_id,
   w2_id,
-  ST_AsText(geom)
+  ST_AsBinary(geom)
 FROM
   (
   SELECT
@@ -84,7 +84,7 @@ sql18 = """
 SELECT
     o1.id,
     o1.nid,
-    ST_AsText(o1.geom),
+    ST_AsBinary(o1.geom),
     o1.level
 FROM
     orphan AS o1,
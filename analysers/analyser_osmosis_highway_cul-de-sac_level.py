@@ -27,7 +27,7 @@ sql40 = """
 SELECT
     way_ends.id,
     way_ends.nid,
-    ST_AsText(way_ends.geom),
+    ST_AsBinary(way_ends.geom),
     way_ends.level
 FROM
     highway_ends AS way_ends
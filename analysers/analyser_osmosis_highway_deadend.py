@@ -83,7 +83,7 @@ sql24 = """
 SELECT
     wid,
     nid,
-    ST_AsText(geom)
+    ST_AsBinary(geom)
 FROM
     unconnected_highways
     LEFT JOIN bicycle_parking ON
@@ -98,7 +98,7 @@ sql25 = """
 SELECT
     wid,
     nid,
-    ST_AsText(geom),
+    ST_AsBinary(geom),
     highway
 FROM
     unconnected_highways
@@ -351,7 +351,7 @@ sql43 = """
 SELECT DISTINCT ON(nid)
   wid,
   nid,
-  ST_AsText(geom),
+  ST_AsBinary(geom),
   highways.highway
 FROM (
   SELECT
@@ -381,7 +381,7 @@ sql50 = """
 SELECT
   drivethroughs.id,
   nid,
-  ST_AsText(nodes.geom)
+  ST_AsBinary(nodes.geom)
 FROM
   highways AS drivethroughs
   JOIN highway_ends ON
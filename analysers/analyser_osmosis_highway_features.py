@@ -26,7 +26,7 @@ from .Analyser_Osmosis import Analyser_Osmosis
 sql10 = """
 SELECT
     nodes.id,
-    ST_AsText(nodes.geom),
+    ST_AsBinary(nodes.geom),
     MIN(ways.id)
 FROM
     nodes AS nodes
@@ -50,7 +50,7 @@ HAVING
 sql30 = """
 SELECT
     nodes.id,
-    ST_AsText(nodes.geom)
+    ST_AsBinary(nodes.geom)
 FROM
     nodes
     JOIN way_nodes ON
@@ -105,7 +105,7 @@ FROM
 sqlb18 = """
 SELECT
   highways.id,
-  ST_AsText(way_locate(highways.linestring))
+  ST_AsBinary(way_locate(highways.linestring))
 FROM
   highways
   LEFT JOIN islands ON
@@ -63,7 +63,7 @@ CREATE INDEX links_conn_idx ON links_conn(id)
 sql30 = """
 SELECT
     bad.id,
-    ST_AsText(way_locate(bad.linestring))
+    ST_AsBinary(way_locate(bad.linestring))
 FROM
     links_conn AS bad
     LEFT JOIN links_conn AS good ON
@@ -83,7 +83,7 @@ HAVING
 sql40 = """
 SELECT
     id,
-    ST_AsText(way_locate(linestring))
+    ST_AsBinary(way_locate(linestring))
 FROM
     {0}highways AS ways
 WHERE
@@ -96,7 +96,7 @@ WHERE
 sql50 = """
 SELECT
     lc1.id,
-    ST_AsText(way_locate(lc1.linestring)),
+    ST_AsBinary(way_locate(lc1.linestring)),
     CASE
         WHEN lc1.highway_conn IN ('motorway', 'trunk', 'primary', 'secondary', 'tertiary') THEN lc1.highway_conn || '_link'
         ELSE lc1.highway_conn
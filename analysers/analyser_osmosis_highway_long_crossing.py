@@ -26,7 +26,7 @@ from .Analyser_Osmosis import Analyser_Osmosis
 sql10 = """
 SELECT
     id,
-    ST_AsText(way_locate(linestring)),
+    ST_AsBinary(way_locate(linestring)),
     ST_Length(linestring_proj)
 FROM
     {0}highways
@@ -41,7 +41,7 @@ WHERE
 UNION ALL
 SELECT
     id,
-    ST_AsText(way_locate(linestring)),
+    ST_AsBinary(way_locate(linestring)),
     ST_Length(linestring_proj)
 FROM
     {0}highways
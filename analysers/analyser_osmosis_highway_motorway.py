@@ -26,7 +26,7 @@ from .Analyser_Osmosis import Analyser_Osmosis
 sql10 = """
 SELECT DISTINCT ON (highways.id)
   highways.id,
-  ST_AsText(nodes.geom)
+  ST_AsBinary(nodes.geom)
 FROM
   {0}highways AS motorways
   JOIN {1}highways AS highways ON
@@ -58,7 +58,7 @@ sql12 = """
 SELECT
   h1.id,
   h2.id,
-  ST_AsText(way_locate(h1.linestring)),
+  ST_AsBinary(way_locate(h1.linestring)),
   h1.name,
   h2.name
 FROM
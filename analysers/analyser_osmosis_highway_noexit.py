@@ -26,7 +26,7 @@ from .Analyser_Osmosis import Analyser_Osmosis
 sql10 = """
 SELECT
     nodes.id,
-    ST_AsText(nodes.geom),
+    ST_AsBinary(nodes.geom),
     COUNT(*) > 1
 FROM
     highways AS ways
@@ -51,7 +51,7 @@ HAVING
 sql20 = """
 SELECT
     id,
-    ST_AsText(way_locate(linestring))
+    ST_AsBinary(way_locate(linestring))
 FROM
     (
     SELECT
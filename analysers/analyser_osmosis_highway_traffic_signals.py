@@ -66,7 +66,7 @@ SELECT
     DISTINCT ON(crossing.id)
     crossing.id,
     traffic_signals.id,
-    ST_AsText(crossing.geom)
+    ST_AsBinary(crossing.geom)
 FROM
     {0}traffic_signals AS traffic_signals
     JOIN {1}crossing AS crossing ON
@@ -81,7 +81,7 @@ ORDER BY
 sql20 = """
 SELECT
     crossing.id,
-    ST_AsText(crossing.geom)
+    ST_AsBinary(crossing.geom)
 FROM
     {0}crossing AS crossing
     LEFT JOIN traffic_signals AS traffic_signals ON
@@ -95,7 +95,7 @@ sql30 = """
 SELECT
   nodes.id,
   max(ways.id),
-  ST_AsText(nodes.geom)
+  ST_AsBinary(nodes.geom)
 FROM
   traffic_signals AS nodes
   JOIN way_nodes ON
@@ -137,7 +137,7 @@ sql41 = """
 SELECT
   nodes.id,
   max(ways.id),
-  ST_AsText(nodes.geom)
+  ST_AsBinary(nodes.geom)
 FROM
   stops AS nodes
   JOIN highways AS ways ON
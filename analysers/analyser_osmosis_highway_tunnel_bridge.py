@@ -26,7 +26,7 @@ from .Analyser_Osmosis import Analyser_Osmosis
 sql10 = """
 SELECT
     ways.id,
-    ST_AsText(way_locate(ways.linestring))
+    ST_AsBinary(way_locate(ways.linestring))
 FROM
     ways
     LEFT JOIN polygons AS contours ON
@@ -77,7 +77,7 @@ sql21 = """
 SELECT
     id,
     bid,
-    ST_AsText(ST_Centroid(ST_Intersection(blinestring, linestring)))
+    ST_AsBinary(ST_Centroid(ST_Intersection(blinestring, linestring)))
 FROM
     bridge_cross
 WHERE
@@ -88,7 +88,7 @@ WHERE
 sql30 = """
 SELECT
     bid,
-    ST_AsText(way_locate(blinestring))
+    ST_AsBinary(way_locate(blinestring))
 FROM
     (
         SELECT
@@ -112,7 +112,7 @@ SELECT
     nodes.id,
     bt_ways.id,
     bt_connections.id,
-    ST_AsText(nodes.geom),
+    ST_AsBinary(nodes.geom),
     CASE
         WHEN bt_ways.tags?'bridge' AND bt_ways.tags->'bridge'!='no' THEN 'bridge'
         ELSE 'tunnel'
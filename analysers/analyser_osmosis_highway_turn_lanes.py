@@ -87,7 +87,7 @@ HAVING
 sql14 = """
 SELECT
   nid,
-  ST_AsText(nodes.geom),
+  ST_AsBinary(nodes.geom),
   lin_lanes,
   lin_lanes_merge_to,
   lin_lanes_slight,
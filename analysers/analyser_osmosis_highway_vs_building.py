@@ -203,7 +203,7 @@ sql10 = """
 SELECT DISTINCT ON (highway.id, building.type_id)
     building.type_id,
     highway.id,
-    ST_AsText(polygon_locate(building.poly))
+    ST_AsBinary(polygon_locate(building.poly))
 FROM
     {0}buildings AS building
     JOIN {1}highway AS highway ON
@@ -225,7 +225,7 @@ sql20 = """
 SELECT
     tree.id,
     building.type_id,
-    ST_AsText(tree.geom)
+    ST_AsBinary(tree.geom)
 FROM
     {0}tree AS tree
     JOIN {1}buildings AS building ON
@@ -239,7 +239,7 @@ sql21 = """
 SELECT
     power.id,
     building.type_id,
-    ST_AsText(power.geom)
+    ST_AsBinary(power.geom)
 FROM
     {0}power AS power
     JOIN {1}buildings AS building ON
@@ -253,7 +253,7 @@ sql30 = """
 SELECT DISTINCT ON (tree.id)
     tree.id,
     highway.id,
-    ST_AsText(tree.geom)
+    ST_AsBinary(tree.geom)
 FROM
     {0}tree AS tree
     JOIN {1}highway AS highway ON
@@ -270,7 +270,7 @@ sql31 = """
 SELECT DISTINCT ON (power.id)
     power.id,
     highway.id,
-    ST_AsText(power.geom)
+    ST_AsBinary(power.geom)
 FROM
     {0}power AS power
     JOIN {1}highway AS highway ON
@@ -286,7 +286,7 @@ sql32 = """
 SELECT DISTINCT ON (commercial.id)
     commercial.id,
     highway.id,
-    ST_AsText(commercial.geom)
+    ST_AsBinary(commercial.geom)
 FROM
     {0}commercial AS commercial
     JOIN {1}highway AS highway ON
@@ -310,7 +310,7 @@ sql40 = """
 SELECT DISTINCT ON (highway.id, water.id)
     highway.id,
     water.id,
-    ST_AsText(ST_Centroid(ST_Intersection(highway.linestring, water.linestring))),
+    ST_AsBinary(ST_Centroid(ST_Intersection(highway.linestring, water.linestring))),
     CASE WHEN water.waterway IN ('river', 'canal') THEN 5 ELSE 4 END
 FROM
     {0}highway AS highway
@@ -359,8 +359,8 @@ SELECT
   id1,
   id2,
   CASE ST_Dimension(geom)
-    WHEN 0 THEN ST_AsText(geom)
-    WHEN 1 THEN ST_ASText(way_locate(geom))
+    WHEN 0 THEN ST_AsBinary(geom)
+    WHEN 1 THEN ST_AsBinary(way_locate(geom))
   END,
   CASE
     WHEN corsses THEN 8
@@ -415,8 +415,8 @@ SELECT
   id1,
   id2,
   CASE ST_Dimension(geom)
-    WHEN 0 THEN ST_AsText(geom)
-    WHEN 1 THEN ST_ASText(way_locate(geom))
+    WHEN 0 THEN ST_AsBinary(geom)
+    WHEN 1 THEN ST_AsBinary(way_locate(geom))
   END,
   CASE
     WHEN corsses THEN 10
@@ -26,7 +26,7 @@ from .Analyser_Osmosis import Analyser_Osmosis
 sql10 = """
 SELECT DISTINCT
   ways.id,
-  ST_AsText(way_locate(linestring))
+  ST_AsBinary(way_locate(linestring))
 FROM
   highways AS ways
   LEFT JOIN relation_members ON
@@ -84,7 +84,7 @@ FROM
 sql14 = """
 SELECT DISTINCT ON (highways.id)
   highways.id,
-  ST_AsText(way_locate(linestring))
+  ST_AsBinary(way_locate(linestring))
 FROM
   a3_{0} AS a3
   JOIN highways ON
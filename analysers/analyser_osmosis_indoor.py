@@ -78,7 +78,7 @@ CREATE INDEX indoor_surfaces_idx_geom on indoor_surfaces USING gist(geom)
 sql10 = """
 SELECT
     public_indoor_rooms.id,
-    ST_AsText(way_locate(public_indoor_rooms.geom))
+    ST_AsBinary(way_locate(public_indoor_rooms.geom))
 FROM
     indoor_surfaces AS public_indoor_rooms
     LEFT JOIN nodes ON
@@ -163,7 +163,7 @@ WHERE
 sql22 = """
 SELECT
     indoor_surfaces.id,
-    ST_AsText(way_locate(indoor_surfaces.geom))
+    ST_AsBinary(way_locate(indoor_surfaces.geom))
 FROM
     indoor_surfaces
     LEFT JOIN indoor_surfaces AS indoor_surfaces_other ON
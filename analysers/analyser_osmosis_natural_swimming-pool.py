@@ -27,7 +27,7 @@ sql10 = """
 SELECT
     DISTINCT ON (w.id)
     w.id,
-    ST_AsText(way_locate(w.linestring))
+    ST_AsBinary(way_locate(w.linestring))
 FROM
     (
     SELECT
@@ -40,7 +40,7 @@ SELECT DISTINCT ON (nodes.id)
     intersection(akeys(ways.tags), akeys(nodes.tags)),
     ways.id,
     nodes.id,
-    ST_AsText(nodes.geom)
+    ST_AsBinary(nodes.geom)
 FROM
     (
     SELECT
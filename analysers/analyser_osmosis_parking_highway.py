@@ -57,7 +57,7 @@ WHERE
 sql13 = """
 SELECT
   pr.type_id,
-  ST_AsText(ST_PointOnSurface(pr.poly)),
+  ST_AsBinary(ST_PointOnSurface(pr.poly)),
   pr.tags->'park_ride' != 'no'
 FROM
   parkings AS pr
@@ -76,7 +76,7 @@ sql20 = """
 SELECT
   parking.type_id,
   array_agg('W' || parking_way.id),
-  ST_AsText(ST_PointOnSurface(parking.poly)),
+  ST_AsBinary(ST_PointOnSurface(parking.poly)),
   array_agg(parking_way.access),
   parking.tags->'access'
 FROM
@@ -26,7 +26,7 @@ from .Analyser_Osmosis import Analyser_Osmosis
 sql10 = """
 SELECT
     id,
-    ST_AsText((ST_IsValidDetail(ST_MakePolygon(linestring))).location),
+    ST_AsBinary((ST_IsValidDetail(ST_MakePolygon(linestring))).location),
     (ST_IsValidDetail(ST_MakePolygon(linestring))).reason
 FROM
     {0}ways
@@ -64,7 +64,7 @@ GROUP BY
 sql21 = """
 SELECT
     id,
-    ST_AsText((ST_IsValidDetail(ST_MakePolygon(linestring))).location),
+    ST_AsBinary((ST_IsValidDetail(ST_MakePolygon(linestring))).location),
     (ST_IsValidDetail(ST_MakePolygon(linestring))).reason
 FROM
     {0}_{1}_relation_linestrings
@@ -79,7 +79,7 @@ WHERE
 sql30 = """
 SELECT
     id,
-    ST_AsText((ST_IsValidDetail(poly)).location),
+    ST_AsBinary((ST_IsValidDetail(poly)).location),
     (ST_IsValidDetail(poly)).reason
 FROM
     {0}multipolygons
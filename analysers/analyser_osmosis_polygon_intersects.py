@@ -153,7 +153,7 @@ SELECT
   DISTINCT ON (mobility_way_id, landusage_tid)
   mobility_way_id,
   landusage_tid,
-  ST_AsText(ST_PointOnSurface(ST_Intersection(landusage_poly, mobility_way_linestring))),
+  ST_AsBinary(ST_PointOnSurface(ST_Intersection(landusage_poly, mobility_way_linestring))),
   mobility_way_type,
   tag_way,
   tag_polygon
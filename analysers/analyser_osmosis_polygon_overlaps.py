@@ -49,7 +49,7 @@ sql10 = """
 SELECT
     w1.id,
     w2.id,
-    ST_ASText(ST_GeometryN(ST_Multi(ST_Intersection(w1.linestring, w2.linestring)), 1)),
+    ST_AsBinary(ST_GeometryN(ST_Multi(ST_Intersection(w1.linestring, w2.linestring)), 1)),
     {1}
 FROM
     surface AS w1,
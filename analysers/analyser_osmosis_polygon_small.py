@@ -26,7 +26,7 @@ from .Analyser_Osmosis import Analyser_Osmosis
 sql10 = """
 SELECT
   'W' || id,
-  ST_AsText(way_locate(linestring)),
+  ST_AsBinary(way_locate(linestring)),
   ST_Area(ST_MakePolygon(ST_Transform(linestring, {proj})))
 FROM
   {touched}ways
@@ -41,7 +41,7 @@ UNION ALL
 
 SELECT
   'R' || id,
-  ST_AsText(polygon_locate(poly)),
+  ST_AsBinary(polygon_locate(poly)),
   ST_Area(poly_proj)
 FROM
   {touched}multipolygons
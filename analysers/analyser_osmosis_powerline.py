@@ -190,7 +190,7 @@ HAVING
 sql10 = """
 SELECT
     nodes.id,
-    ST_AsText(nodes.geom)
+    ST_AsBinary(nodes.geom)
 FROM
     nodes
     LEFT JOIN way_nodes ON
@@ -315,7 +315,7 @@ sql26 = """
 SELECT
     t.nid,
     t.wid,
-    ST_AsText(t.geom),
+    ST_AsBinary(t.geom),
     t.power
 FROM (
 SELECT
@@ -441,7 +441,7 @@ voltage_groups AS (
 
 SELECT
     DISTINCT(v.nid),
-    ST_AsText(nodes.geom)
+    ST_AsBinary(nodes.geom)
 FROM
     voltage_groups AS v
     JOIN nodes ON
@@ -470,7 +470,7 @@ sql40 = """
 SELECT DISTINCT ON (nodes.id)
     nodes.id AS nid,
     ways.id AS wid,
-    ST_AsText(nodes.geom)
+    ST_AsBinary(nodes.geom)
 FROM
     ways
     JOIN nodes ON
@@ -556,7 +556,7 @@ sql60 = """
 SELECT DISTINCT ON (u.wid)
     u.wid,
     t.type_id,
-    ST_AsText(u.geom)
+    ST_AsBinary(u.geom)
 FROM
     power_lines_unfinished u
     JOIN power_lines_terminators t ON
@@ -638,7 +638,7 @@ FROM
 
 sql71 = """
 SELECT m.nid,
-    ST_AsText(nodes.geom),
+    ST_AsBinary(nodes.geom),
     m.line_management,
     m.location_transition,
     nodes.tags->'line_management' as current_line_management,
@@ -85,7 +85,7 @@ WHERE
 sql10 = """
 SELECT
     id,
-    ST_AsText(ST_Transform(way_locate(linestring_proj), 4326))
+    ST_AsBinary(ST_Transform(way_locate(linestring_proj), 4326))
 FROM
     ways_addr
 WHERE
@@ -101,7 +101,7 @@ HAVING
 sql11 = """
 SELECT
     id,
-    ST_AsText(ST_Transform(geom_proj, 4326))
+    ST_AsBinary(ST_Transform(geom_proj, 4326))
 FROM
     nodes_addr
 WHERE
@@ -117,7 +117,7 @@ HAVING
 sql20 = """
 SELECT
     relations.id,
-    ST_AsText(relation_locate(relations.id)) AS geom
+    ST_AsBinary(relation_locate(relations.id)) AS geom
 FROM
     {0}relations AS relations
     LEFT JOIN relation_members ON
@@ -135,7 +135,7 @@ sql30 = """
 SELECT DISTINCT ON (ways.id)
     ways.id,
     relations.id,
-    ST_ASText(way_locate(linestring))
+    ST_AsBinary(way_locate(linestring))
 FROM
     {0}relations AS relations
     JOIN relation_members ON
@@ -157,7 +157,7 @@ sql40 = """
 SELECT DISTINCT ON (nodes.id)
     nodes.id,
     relations.id,
-    ST_AsText(geom)
+    ST_AsBinary(geom)
 FROM
     {0}relations AS relations
     JOIN relation_members ON
@@ -178,7 +178,7 @@ sql41 = """
 SELECT DISTINCT ON (ways.id)
     ways.id,
     relations.id,
-    ST_AsText(way_locate(linestring))
+    ST_AsBinary(way_locate(linestring))
 FROM
     {0}relations AS relations
     JOIN relation_members ON
@@ -199,7 +199,7 @@ sql50 = """
 SELECT DISTINCT ON (nodes.id)
     nodes.id,
     relations.id,
-    ST_AsText(geom)
+    ST_AsBinary(geom)
 FROM
     {0}relations AS relations
     JOIN relation_members ON
@@ -220,7 +220,7 @@ sql51 = """
 SELECT DISTINCT ON (ways.id)
     ways.id,
     relations.id,
-    ST_AsText(way_locate(linestring))
+    ST_AsBinary(way_locate(linestring))
 FROM
     {0}relations AS relations
     JOIN relation_members ON
@@ -286,7 +286,7 @@ sql63 = """
 SELECT
     CAST(substr(LEAST(hn1.type || hn1.id, hn2.type || hn2.id), 2) AS BIGINT) AS id,
     substr(LEAST(hn1.type || hn1.id, hn2.type || hn2.id), 1, 1) AS type,
-    ST_AsText(ST_Transform(hn1.geom_proj, 4326)),
+    ST_AsBinary(ST_Transform(hn1.geom_proj, 4326)),
     hn1.r_name,
     hn1.number,
     hn1.door,
@@ -350,7 +350,7 @@ WHERE
 sql80 = """
 SELECT
     id,
-    ST_AsText((SELECT ST_Centroid(ST_Union(linestring)) FROM street_name WHERE t.id = street_name.id)) AS geom,
+    ST_AsBinary((SELECT ST_Centroid(ST_Union(linestring)) FROM street_name WHERE t.id = street_name.id)) AS geom,
     string_agg(name, ', ') AS names
 FROM
     (SELECT id, name FROM street_name GROUP BY id, name) AS t
@@ -383,7 +383,7 @@ sqlA0 = """
 SELECT
     sa1.id,
     sa2.id,
-    ST_AsText(ST_Centroid(ST_Collect(sa1.geom, sa2.geom)))
+    ST_AsBinary(ST_Centroid(ST_Collect(sa1.geom, sa2.geom)))
 FROM
     street_area AS sa1
     JOIN street_area AS sa2 ON
@@ -401,7 +401,7 @@ sqlB0 = """
 SELECT
     house.id,
     house.type,
-    ST_AsText(ST_Centroid(house.geom)),
+    ST_AsBinary(ST_Centroid(house.geom)),
     house.rid
 FROM
 ((
@@ -515,7 +515,7 @@ sqlC2 = """
 SELECT
     id,
     type,
-    ST_AsText(any_locate(type, id))
+    ST_AsBinary(any_locate(type, id))
 FROM
     (
     SELECT
@@ -563,7 +563,7 @@ SELECT
     id,
     type,
     addr_street,
-    ST_AsText(ST_Transform(geom, 4326))
+    ST_AsBinary(ST_Transform(geom, 4326))
 FROM (
 SELECT
     addr_street.id,
@@ -593,7 +593,7 @@ sqlF0 = """
 SELECT
     highways.id,
     street_area.id AS rid,
-    ST_AsText(way_locate(highways.linestring))
+    ST_AsBinary(way_locate(highways.linestring))
 FROM
     street_area
     JOIN highways on
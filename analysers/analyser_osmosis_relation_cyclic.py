@@ -55,7 +55,7 @@ WITH RECURSIVE rcte AS (
 )
 SELECT DISTINCT ON (start_id)
   start_id,
-  ST_AsText(relation_locate(start_id)),
+  ST_AsBinary(relation_locate(start_id)),
   path
 FROM
   rcte
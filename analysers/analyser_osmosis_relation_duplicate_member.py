@@ -26,7 +26,7 @@ from .Analyser_Osmosis import Analyser_Osmosis
 sql10 = """
 SELECT
   id,
-  ST_AsText(relation_locate(id)),
+  ST_AsBinary(relation_locate(id)),
   array_agg(duplicate_typeid ORDER BY duplicate_typeid), -- sequence doesn't matter as long as it's constant until relation changes
   array_agg(duplicate_string ORDER BY duplicate_string) -- keep same sequence as line above
 FROM (
@@ -26,7 +26,7 @@ from .Analyser_Osmosis import Analyser_Osmosis
 sql00 = """
 SELECT DISTINCT ON (nodes.id)
   nodes.id,
-  ST_AsText(nodes.geom)
+  ST_AsBinary(nodes.geom)
 FROM
   nodes
   LEFT JOIN highways ON
@@ -26,7 +26,7 @@ from .Analyser_Osmosis import Analyser_Osmosis
 sql10 = """
 SELECT
     id,
-    ST_AsText(ST_Centroid(ST_LongestLine(bbox, bbox))),
+    ST_AsBinary(ST_Centroid(ST_LongestLine(bbox, bbox))),
     type
 FROM
     (
@@ -47,7 +47,7 @@ SELECT DISTINCT
     relations.id,
     w1.id,
     w2.id,
-    ST_AsText(ST_Centroid(ST_Envelope(w1.linestring)))
+    ST_AsBinary(ST_Centroid(ST_Envelope(w1.linestring)))
 FROM
     {0}relations AS relations
     JOIN relation_members ON
@@ -71,7 +71,7 @@ sql20 = """
 SELECT DISTINCT
     relations.id,
     ways.id,
-    ST_AsText(way_locate(ways.linestring)),
+    ST_AsBinary(way_locate(ways.linestring)),
     relations.tags->'landuse' rl,
     ways.tags->'landuse' wl,
     relations.tags->'natural' rn,
@@ -121,7 +121,7 @@ WHERE
 sql30 = """
 SELECT
     id,
-    ST_AsText(relation_locate(id)),
+    ST_AsBinary(relation_locate(id)),
     string_agg(landuse, ',') AS landuse,
     string_agg("natural", ',') AS "natural",
     string_agg(waterway, ',') AS waterway,
@@ -164,7 +164,7 @@ HAVING
 sql40 = """
 SELECT
     ways.id,
-    ST_AsText(way_locate(ways.linestring)),
+    ST_AsBinary(way_locate(ways.linestring)),
     ways.tags->'area',
     ways.tags->'landuse',
     ways.tags->'natural',
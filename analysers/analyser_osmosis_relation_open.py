@@ -28,7 +28,7 @@ sql10 = """
 SELECT
     t.id,
     nodes.id AS nid,
-    ST_AsText(nodes.geom),
+    ST_AsBinary(nodes.geom),
     CASE
         WHEN admin_level IN ('0', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12', '13', '14')
             THEN 100 + admin_level::int
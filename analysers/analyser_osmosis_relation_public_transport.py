@@ -54,7 +54,7 @@ CREATE INDEX route_geom_idx ON route USING gist(geom)
 sql10 = """
 SELECT
   t.id,
-  ST_AsText(relation_locate(t.id))
+  ST_AsBinary(relation_locate(t.id))
 FROM (
   SELECT
     id,
@@ -183,7 +183,7 @@ sql22 = """
 SELECT
   stop_platform.id,
   stop_platform.member_type || stop_platform.mid,
-  ST_AsText(any_locate(stop_platform.member_type, stop_platform.mid))
+  ST_AsBinary(any_locate(stop_platform.member_type, stop_platform.mid))
 FROM
   stop_platform
   JOIN route_geom ON
@@ -196,7 +196,7 @@ sql30 = """
 SELECT DISTINCT ON(relations.id, relation_members.member_type || relation_members.member_id)
   relations.id,
   relation_members.member_type || relation_members.member_id,
-  ST_AsText(coalesce(
+  ST_AsBinary(coalesce(
     any_locate(relation_members.member_type, relation_members.member_id),
     relation_locate(relations.id)
   ))
@@ -219,7 +219,7 @@ WHERE
 sql40 = """
 SELECT
     relations.id,
-    ST_AsText(relation_locate(relations.id))
+    ST_AsBinary(relation_locate(relations.id))
 FROM
     relations
     LEFT JOIN relation_members ON
@@ -243,7 +243,7 @@ sql50 = """
 SELECT DISTINCT ON (parent.id, relation_members.member_id)
     parent.id,
     relation_members.member_id,
-    ST_AsText(relation_locate(relations.id)),
+    ST_AsBinary(relation_locate(relations.id)),
     parent.tags->'network' != (relations.tags->'network'),
     parent.tags->'operator' != (relations.tags->'operator'),
     parent.tags->'ref' != (relations.tags->'ref'),
@@ -270,7 +270,7 @@ WHERE
 sql60 = """
 SELECT
     nodes.id,
-    ST_AsText(nodes.geom) AS geom
+    ST_AsBinary(nodes.geom) AS geom
 FROM
     nodes
     JOIN way_nodes ON
@@ -290,7 +290,7 @@ GROUP BY
 sql70 = """
 SELECT
     nodes.id,
-    ST_AsText(nodes.geom) AS geom
+    ST_AsBinary(nodes.geom) AS geom
 FROM
     nodes
     LEFT JOIN way_nodes ON
@@ -305,7 +305,7 @@ sql80 = """
 SELECT
     relations.id,
     'N' || nodes.id,
-    ST_AsText(nodes.geom) AS geom
+    ST_AsBinary(nodes.geom) AS geom
 FROM
     way_nodes
     JOIN relation_members ON
@@ -332,7 +332,7 @@ sql90 = """
 SELECT
     stop_platform.id,
     stop_platform.member_type || stop_platform.mid,
-    ST_AsText(stop_platform.geom) AS geom
+    ST_AsBinary(stop_platform.geom) AS geom
 FROM
   stop_platform
   JOIN relations ON
@@ -389,7 +389,7 @@ CREATE INDEX w_bs_idx_geom ON w_bs USING gist(linestring)
 sqlA4 = """
 SELECT
     sp.id,
-    ST_AsText(sp.geom) AS geom
+    ST_AsBinary(sp.geom) AS geom
 FROM
     nodes AS sp
     LEFT JOIN n_bs ON
@@ -547,7 +547,7 @@ CREATE INDEX platform_that_can_project_idx ON platform_that_can_project USING gi
 sql103 = """
 SELECT DISTINCT ON (route_id)
     platform_that_can_project.route_id,
-    ST_AsText(ST_Transform(platform_that_can_project.stop,4326)) AS geom
+    ST_AsBinary(ST_Transform(platform_that_can_project.stop,4326)) AS geom
 FROM
     platform_that_can_project
 WHERE
@@ -558,7 +558,7 @@ sql110 = """
 SELECT
   platform_that_can_project.route_id,
   platform_that_can_project.stop_id,
-  ST_AsText(ST_Transform(platform_that_can_project.stop, 4326))
+  ST_AsBinary(ST_Transform(platform_that_can_project.stop, 4326))
 FROM
     platform_that_can_project
     JOIN route_linestring ON
@@ -55,7 +55,7 @@ sql10 = """
 (
 SELECT
     id,
-    ST_AsText(relation_locate(id))
+    ST_AsBinary(relation_locate(id))
 FROM
     restrictions
 WHERE
@@ -71,7 +71,7 @@ WHERE
 ) UNION ALL (
 SELECT
     id,
-    ST_AsText(relation_locate(id))
+    ST_AsBinary(relation_locate(id))
 FROM
     restrictions
 WHERE
@@ -87,7 +87,7 @@ WHERE
 ) UNION ALL (
 SELECT
     id,
-    ST_AsText(relation_locate(id))
+    ST_AsBinary(relation_locate(id))
 FROM
     restrictions
 WHERE
@@ -145,7 +145,7 @@ sql22 = """
 SELECT
     rid,
     wid,
-    ST_AsText(way_locate(linestring))
+    ST_AsBinary(way_locate(linestring))
 FROM
     bad_member
 """
@@ -193,7 +193,7 @@ WHERE
 sql32 = """
 SELECT
     rid,
-    ST_AsText(relation_locate(rid))
+    ST_AsBinary(relation_locate(rid))
 FROM
     bad_continuity
 """
@@ -202,7 +202,7 @@ sql40 = """
 SELECT
     restrictions.id,
     ways.id,
-    ST_AsText(way_locate(ways.linestring))
+    ST_AsBinary(way_locate(ways.linestring))
 FROM
     restrictions
     JOIN relation_members AS rmfrom ON
@@ -238,7 +238,7 @@ sql41 = """
 SELECT
     restrictions.id,
     ways.id,
-    ST_AsText(way_locate(ways.linestring))
+    ST_AsBinary(way_locate(ways.linestring))
 FROM
     restrictions
     JOIN relation_members AS rmfrom ON
@@ -343,7 +343,7 @@ WHERE
 sql52 = """
 SELECT
     rid,
-    ST_AsText(relation_locate(rid))
+    ST_AsBinary(relation_locate(rid))
 FROM
     direction
 WHERE
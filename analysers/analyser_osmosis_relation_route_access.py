@@ -27,7 +27,7 @@ sql10 = """
 SELECT
   ways.id,
   relations.id,
-  ST_AsText(way_locate(linestring))
+  ST_AsBinary(way_locate(linestring))
 FROM
   {0}relations AS relations
   JOIN relation_members ON
@@ -27,7 +27,7 @@ from .Analyser_Osmosis import Analyser_Osmosis
 sql10 = u"""
 SELECT
     ways.id,
-    ST_AsText(way_locate(ways.linestring)) AS geom
+    ST_AsBinary(way_locate(ways.linestring)) AS geom
 FROM
     highways AS ways
     JOIN highways AS conns ON
@@ -63,7 +63,7 @@ sql20 = """
 SELECT
   roundabouts.id,
   nodes.id,
-  ST_AsText(nodes.geom)
+  ST_AsBinary(nodes.geom)
 FROM
   {0}highways AS roundabouts
   JOIN {1}nodes AS nodes ON
@@ -141,7 +141,7 @@ CREATE INDEX idx_roundabout_ways_wlevel2_rid ON roundabout_ways_wlevel2(rid)
 sql17 = """
 SELECT
     roundabout.id,
-    ST_AsText(way_locate(roundabout.linestring)),
+    ST_AsBinary(way_locate(roundabout.linestring)),
     roundabout.level
 FROM
     roundabout
@@ -185,7 +185,7 @@ CREATE INDEX roundabout_access_idx ON roundabout_access(ra_id)
 sql22 = """
 SELECT DISTINCT ON (ra1.a_id)
     ra1.a_id,
-    ST_AsText(ST_PointOnSurface(ST_Intersection(ra1.connection_sublinestring, ra2.connection_sublinestring))) -- see #2230: intersection can be multipoint or (with illegal overlap) even (multi)linestring
+    ST_AsBinary(ST_PointOnSurface(ST_Intersection(ra1.connection_sublinestring, ra2.connection_sublinestring))) -- see #2230: intersection can be multipoint or (with illegal overlap) even (multi)linestring
 FROM
     roundabout_access AS ra1
     JOIN roundabout_access AS ra2 ON
@@ -218,7 +218,7 @@ FROM
 sql31 = """
 SELECT
     roundabout.id,
-    ST_AsText(way_locate(roundabout.linestring))
+    ST_AsBinary(way_locate(roundabout.linestring))
 FROM (
     SELECT DISTINCT ON (id)
         id
@@ -241,7 +241,7 @@ sql40 = """
 SELECT
     roundabout.id,
     ways.id,
-    ST_AsText(way_locate(ways.linestring))
+    ST_AsBinary(way_locate(ways.linestring))
 FROM
     roundabout
     JOIN highways AS ways ON
@@ -204,7 +204,7 @@ CREATE INDEX phonic_usage_phonic_2oo_80 ON phonic_usage(phonic_2oo) WHERE percen
 sql06 = """
 SELECT
     way_tags_name_phonic.way_id,
-    ST_AsText(way_locate(ways.linestring)),
+    ST_AsBinary(way_locate(ways.linestring)),
     ways.tags->'name',
     way_tags_name_phonic.name_1 || ' ' || phonic_faible.name_2oo AS faible,
     way_tags_name_phonic.name_1 || ' ' || phonic_fort.name_2oo AS fort
@@ -104,7 +104,7 @@ SELECT
     value,
     low_key,
     hight_key,
-    ST_AsText({as_text})
+    ST_AsBinary({as_text})
 FROM
     (
     SELECT
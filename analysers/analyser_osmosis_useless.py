@@ -27,7 +27,7 @@ sql10 = """
 SELECT DISTINCT ON (nodes.id)
     nodes.id,
     relation_members.relation_id,
-    ST_ASText(geom)
+    ST_AsBinary(geom)
 FROM
     {0}nodes AS nodes
     JOIN relation_members ON
@@ -42,7 +42,7 @@ sql11 = """
 SELECT DISTINCT ON (nodes.id)
     nodes.id,
     relation_members.relation_id,
-    ST_ASText(geom)
+    ST_AsBinary(geom)
 FROM
     touched_relations AS relations
     JOIN relation_members ON
@@ -58,7 +58,7 @@ sql20 = """
 SELECT DISTINCT ON (ways.id)
     ways.id,
     relation_members.relation_id,
-    ST_ASText(way_locate(linestring))
+    ST_AsBinary(way_locate(linestring))
 FROM
     {0}ways AS ways
     LEFT JOIN relation_members ON
@@ -73,7 +73,7 @@ sql21 = """
 SELECT DISTINCT ON (ways.id)
     ways.id,
     relation_members.relation_id,
-    ST_ASText(way_locate(linestring))
+    ST_AsBinary(way_locate(linestring))
 FROM
     touched_relations AS relations
     JOIN relation_members ON
@@ -89,7 +89,7 @@ sql30 = """
 SELECT DISTINCT
     relations.id,
     relation_members.relation_id,
-    ST_AsText(relation_locate(relations.id))
+    ST_AsBinary(relation_locate(relations.id))
 FROM
     {0}relations AS relations
     LEFT JOIN relation_members ON
@@ -105,7 +105,7 @@ sql31 = """
 SELECT
     r.id,
     relation_members.relation_id,
-    ST_AsText(relation_locate(r.id))
+    ST_AsBinary(relation_locate(r.id))
 FROM
     touched_relations AS relations
     JOIN relation_members ON
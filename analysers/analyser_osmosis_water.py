@@ -136,7 +136,7 @@ WHERE
 sql11 = """
 SELECT
   objects.type || objects.id,
-  ST_AsText(any_locate(objects.type, objects.id))
+  ST_AsBinary(any_locate(objects.type, objects.id))
 FROM
   {0}objects AS objects
   LEFT JOIN water ON
@@ -26,7 +26,7 @@ from .Analyser_Osmosis import Analyser_Osmosis
 sql10 = """
 SELECT
     rb.id,
-    ST_AsText(way_locate(rb.linestring))
+    ST_AsBinary(way_locate(rb.linestring))
 FROM
     ways AS rb
     LEFT JOIN (
@@ -123,7 +123,7 @@ FROM
 sql24 = """
 SELECT
     t.id,
-    ST_AsText(nodes.geom),
+    ST_AsBinary(nodes.geom),
     waterway
 FROM
     (
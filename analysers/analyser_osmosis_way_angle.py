@@ -69,7 +69,7 @@ WITH
 
     SELECT
         id,
-        ST_AsText(geom4326),
+        ST_AsBinary(geom4326),
         angle,
         type,
         index
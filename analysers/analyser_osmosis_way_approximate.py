@@ -122,7 +122,7 @@ WITH
     )
 SELECT
     id,
-    ST_AsText(ST_Transform(geom, 4326)),
+    ST_AsBinary(ST_Transform(geom, 4326)),
     round(GREATEST(
         -- Using Pythagoras we compute the last side of the right-angled triangle.
         -- The difference between this side length and the circle radius.
@@ -73,7 +73,7 @@ b AS (
 )
 SELECT
   (array_agg(type || id))[1:10],
-  ST_AsText(
+  ST_AsBinary(
     any_locate(
       substring(tid, 1, 1),
       substring(tid, 2)::bigint
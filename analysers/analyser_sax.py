@@ -25,16 +25,24 @@ from .Analyser import Analyser
 import sys
 import os
 import importlib
+import multiprocessing
+import multiprocessing.connection
+import traceback
 import modules.config
 from modules import OsmoseLog
 from modules import OsmReader
 from modules import SourceVersion
+from modules.KeyIndex import KeyIndex
 
 
 class Analyser_Sax(Analyser):
 
+    # Read the .pbf files by whole blocks, always when running on shards with sax_workers
+    pbf_block_reader = False
+
     def __init__(self, config, logger = OsmoseLog.logger()):
         Analyser.__init__(self, config, logger)
+        self.workers = getattr(config, 'sax_workers', None) or 1
         if self.config.plugins:
             plugins = map(lambda plugin: self._load_plugin(plugin) if isinstance(plugin, str) else plugin, self.config.plugins)
         else:
@@ -45,7 +53,7 @@ class Analyser_Sax(Analyser):
         Analyser.__enter__(self)
         # open database connections
         self._load_reader()
-        self.parser = OsmReader.open(self.config.src, self.logger.sub(), getattr(self.config, 'src_state', None))
+        self.parser = OsmReader.open(self.config.src, self.logger.sub(), getattr(self.config, 'src_state', None), block_reader=self.pbf_block_reader or self.workers > 1)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
@@ -66,7 +74,10 @@ class Analyser_Sax(Analyser):
 
         self._load_output(change=self.parser.is_change())
         try:
-            self._run_analyse()
+            if self.workers > 1 and hasattr(self.parser, 'shards'):
+                self._run_analyse_sharded()
+            else:
+                self._run_analyse()
         finally:
             self._close_output()
 
@@ -147,6 +158,11 @@ class Analyser_Sax(Analyser):
     def UserGet(self, UserId):
         return self._reader.UserGet(UserId)
 
+    def HasMetadata(self, data):
+        # Readers carry version and user when the source has metadata,
+        # otherwise the object is fetched again to write the issue
+        return "version" in data and ("uid" in data or "user" in data)
+
     def ExtendData(self, data):
         if "uid" in data and not "user" in data:
             user = self.UserGet(data["uid"])
@@ -170,6 +186,11 @@ class Analyser_Sax(Analyser):
     #### Node parsing
 
     def NodeCreate(self, data):
+        err = self.NodeErrors(data)
+        if err:
+            self.NodeIssues(data, err)
+
+    def NodeErrors(self, data):
         # Initialisation
         err  = []
         tags = data[u"tag"]
@@ -178,7 +199,7 @@ class Analyser_Sax(Analyser):
             return
 
         # Running jobs
-        for meth in self.pluginsNodeMethodes:
+        for meth in self.pluginsNodeMethodes.select(tags):
             try:
                 res = meth(data, tags)
             except:
@@ -189,10 +210,12 @@ class Analyser_Sax(Analyser):
                     err.append(res)
                 else:
                     err += res
+        return err
 
+    def NodeIssues(self, data, err):
         # Write the issues
         if err:
-            if not "uid" in data and not "user" in data:
+            if not self.HasMetadata(data):
                 data = self.NodeGet(data["id"]) or data
             data = self.ExtendData(data)
             for e in err:
@@ -227,13 +250,18 @@ class Analyser_Sax(Analyser):
     #### Way parsing
 
     def WayCreate(self, data):
+        err = self.WayErrors(data)
+        if err:
+            self.WayIssues(data, err)
+
+    def WayErrors(self, data):
         # Initialisation
         err  = []
         tags = data[u"tag"]
         nds  = data[u"nd"]
 
         # Run jobs
-        for meth in self.pluginsWayMethodes:
+        for meth in self.pluginsWayMethodes.select(tags):
             try:
                 res = meth(data, tags, nds)
             except:
@@ -245,15 +273,21 @@ class Analyser_Sax(Analyser):
                     err.append(res)
                 else:
                     err += res
+        return err
+
+    def WayIssues(self, data, err):
+        nds = data[u"nd"]
 
         # Write the issues
         if err:
-            if not "uid" in data and not "user" in data:
+            node = data.get("position")
+            if not self.HasMetadata(data):
                 tmp_data = self.WayGet(data["id"]) or data
                 if tmp_data:
                     # way from reader can be None if there is only one node on it
                     data = tmp_data
-            node = self.NodeGet(nds[len(nds)//2])
+            if not node:
+                node = self.NodeGet(nds[len(nds)//2])
             if not node:
                 node = {u"lat":0, u"lon":0}
             data = self.ExtendData(data)
@@ -314,13 +348,18 @@ class Analyser_Sax(Analyser):
         return node
 
     def RelationCreate(self, data):
+        err = self.RelationErrors(data)
+        if err:
+            self.RelationIssues(data, err)
+
+    def RelationErrors(self, data):
         # Initialisation
         err  = []
         tags = data[u"tag"]
         members = data[u"member"]
 
         # Run jobs
-        for meth in self.pluginsRelationMethodes:
+        for meth in self.pluginsRelationMethodes.select(tags):
             try:
                 res = meth(data, tags, members)
             except:
@@ -331,10 +370,12 @@ class Analyser_Sax(Analyser):
                     err.append(res)
                 else:
                     err += res
+        return err
 
+    def RelationIssues(self, data, err):
         # Write the issues
         if err and data[u"member"]:
-            if not "uid" in data and not "user" in data:
+            if not self.HasMetadata(data):
                 data = self.RelationGet(data["id"]) or data
             node = self.locateRelation(data)
             if not node:
@@ -417,9 +458,9 @@ class Analyser_Sax(Analyser):
     def _init_plugins(self, available_plugin_classes):
         self._Err = {}
         self.plugins = {}
-        self.pluginsNodeMethodes = []
-        self.pluginsWayMethodes = []
-        self.pluginsRelationMethodes = []
+        self.pluginsNodeMethodes = KeyIndex()
+        self.pluginsWayMethodes = KeyIndex()
+        self.pluginsRelationMethodes = KeyIndex()
 
         conf_limit = set()
         for i in ("country", "language"):
@@ -447,15 +488,17 @@ class Analyser_Sax(Analyser):
                 self._sublog(u"init "+pluginClazz.__name__+" ("+", ".join(pluginInstance.availableMethodes())+")")
 
                 pluginAvailableMethodes = pluginInstance.availableMethodes()
+                pluginInterestingKeys = pluginInstance.interestingKeys()
                 self.plugins[pluginClazz.__name__] = pluginInstance
 
                 # Fetch functions to call
+                (keys, prefixes) = pluginInterestingKeys or (None, ())
                 if "node" in pluginAvailableMethodes:
-                    self.pluginsNodeMethodes.append(pluginInstance.node)
+                    self.pluginsNodeMethodes.append(pluginInstance.node, keys, prefixes)
                 if "way" in pluginAvailableMethodes:
-                    self.pluginsWayMethodes.append(pluginInstance.way)
+                    self.pluginsWayMethodes.append(pluginInstance.way, keys, prefixes)
                 if "relation" in pluginAvailableMethodes:
-                    self.pluginsRelationMethodes.append(pluginInstance.relation)
+                    self.pluginsRelationMethodes.append(pluginInstance.relation, keys, prefixes)
 
                 # Liste generated issues
                 for (cl, v) in self.plugins[pluginClazz.__name__].errors.items():
@@ -489,6 +532,130 @@ class Analyser_Sax(Analyser):
     def _run_analyse(self):
         self._log(u"Analysing file "+self.config.src)
         self.parser.CopyTo(self)
+        self._end_plugins()
+        self._log(u"Analyse finished")
+
+    def _end_plugins(self):
+        for plugin in self.plugins.values():
+            plugin.end(self.logger.sub().sub())
+
+    ################################################################################
+    #### Sharded analyse, on several processes
+
+    class ShardCollector:
+        """
+        Output of the reader in worker processes. Run the plugins and send the
+        objects with issues to the main process, by chunks.
+        """
+
+        chunk_size = 1000
+
+        def __init__(self, analyser, conn):
+            self.analyser = analyser
+            self.conn = conn
+            self.buffer = []
+
+        def send(self, type, data, err):
+            self.buffer.append((type, data, err))
+            if len(self.buffer) >= self.chunk_size:
+                self.flush()
+
+        def flush(self):
+            if self.buffer:
+                self.conn.send(('issues', self.buffer))
+                self.buffer = []
+
+        def NodeCreate(self, data):
+            err = self.analyser.NodeErrors(data)
+            if err:
+                self.send('node', data, err)
+
+        def WayCreate(self, data):
+            err = self.analyser.WayErrors(data)
+            if err:
+                self.send('way', data, err)
+
+        def RelationCreate(self, data):
+            err = self.analyser.RelationErrors(data)
+            if err:
+                self.send('relation', data, err)
+
+    def _run_shard(self, plugin_classes, start, end, conn):
+        # In the forked worker process
+        try:
+            self._init_plugins(plugin_classes)
+            collector = self.ShardCollector(self, conn)
+            self.parser.set_blob_range(start, end)
+            self.parser.CopyTo(collector)
+            collector.flush()
+            conn.send(('end', dict(map(lambda p: (p[0], p[1].shard_state()), self.plugins.items()))))
+        except:
+            conn.send(('error', traceback.format_exc()))
+        finally:
+            conn.close()
+
+    def _run_analyse_sharded(self):
+        not_shardable = list(filter(lambda p: not p.shardable(), self.plugins.values()))
+        if not_shardable:
+            self._log(u"Plugins without shard merge, run on one process: " + ", ".join(map(lambda p: p.__class__.__name__, not_shardable)))
+            return self._run_analyse()
+
+        shards = self.parser.shards(self.workers)
+        self._log(u"Analysing file {0} with {1} workers".format(self.config.src, len(shards)))
+
+        issues_writer = {'node': self.NodeIssues, 'way': self.WayIssues, 'relation': self.RelationIssues}
+        plugin_classes = list(map(lambda p: p.__class__, self.plugins.values()))
+        context = multiprocessing.get_context('fork')
+        processes = []
+        conns = {}
+        try:
+            for (i, (start, end)) in enumerate(shards):
+                (recv_conn, send_conn) = context.Pipe(duplex=False)
+                p = context.Process(target=self._run_shard, args=(plugin_classes, start, end, send_conn))
+                p.start()
+                send_conn.close()
+                processes.append(p)
+                conns[recv_conn] = i
+
+            # Issues are written in shard order, the same as a run on one process.
+            # Later shards are buffered until previous ones are done.
+            pending = [[] for _ in shards]
+            states = [None] * len(shards)
+            next_shard = 0
+            while conns:
+                for conn in multiprocessing.connection.wait(list(conns.keys())):
+                    i = conns[conn]
+                    try:
+                        message = conn.recv()
+                    except EOFError:
+                        raise RuntimeError("Sax worker {0} exited unexpectedly".format(i))
+                    if message[0] == 'issues':
+                        pending[i] += message[1]
+                    elif message[0] == 'end':
+                        states[i] = message[1]
+                        del conns[conn]
+                        conn.close()
+                    else:
+                        raise RuntimeError("Sax worker {0} failed:\n{1}".format(i, message[1]))
+
+                while next_shard < len(shards):
+                    for (type, data, err) in pending[next_shard]:
+                        issues_writer[type](data, err)
+                    pending[next_shard] = []
+                    if states[next_shard] is None:
+                        break
+                    next_shard += 1
+
+            for p in processes:
+                p.join()
+        finally:
+            for p in processes:
+                if p.is_alive():
+                    p.terminate()
+
+        for (name, plugin) in self.plugins.items():
+            plugin.merge_shard_states(list(map(lambda state: state[name], states)))
+        self._end_plugins()
         self._log(u"Analyse finished")
 
     ################################################################################
@@ -557,6 +724,38 @@ class TestAnalyserOsmosis(TestAnalyser):
         self.root_err = self.load_errors()
         self.check_num_err(min=33)
 
+    def test_issues_from_metadata(self):
+        from plugins.Plugin import Plugin
+
+        class NoGetReader(TestAnalyserOsmosis.MockupReader):
+            def NodeGet(self, id):
+                raise AssertionError("Unexpected NodeGet")
+
+            def WayGet(self, id, dump_sub_elements=False):
+                raise AssertionError("Unexpected WayGet")
+
+        class Issues:
+            def __init__(self):
+                self.issues = []
+
+            def error(self, classs, subclass, text, ids, types, fix, geom, allow_override=False):
+                self.issues.append((types, geom))
+
+        self.config.plugins = [Plugin]
+        self.config.error_file = Issues()
+        analyser_obj = Analyser_Sax(self.config)
+        analyser_obj.error_file = self.config.error_file
+        analyser_obj._reader = NoGetReader()
+
+        node = {"id": 1, "lat": 1, "lon": 2, "version": 3, "uid": 4, "user": "u", "tag": {}}
+        analyser_obj.NodeIssues(node, [{"class": 1}])
+        way = {"id": 2, "version": 3, "uid": 4, "user": "u", "tag": {}, "nd": [1, 2], "position": {"lat": 1, "lon": 2}}
+        analyser_obj.WayIssues(way, [{"class": 1}])
+        self.assertEqual(self.config.error_file.issues, [
+            (["node"], {"position": [node], "node": [node]}),
+            (["way"], {"position": [way["position"]], "way": [way]}),
+        ])
+
     def test_resume_full(self):
         # Test with an older timestamp than older object in extract
         self.xml_res_file = os.path.join(self.dirname, "sax.test_resume_full.xml")
@@ -607,6 +806,23 @@ class TestAnalyserOsmosis(TestAnalyser):
         self.root_err = self.load_errors()
         self.check_num_err(min=47)
 
+    def test_workers(self):
+        self.xml_res_file = os.path.join(self.dirname, "sax.test.workers.xml")
+        self.config.src = "tests/gibraltar.osm.pbf"
+        self.config.src_state = None
+        self.config.error_file = IssuesFileOsmose.IssuesFileOsmose(self.xml_res_file)
+        self.config.options = {"project": "openstreetmap"}
+        with Analyser_Sax(self.config) as analyser_obj:
+            analyser_obj.analyser()
+
+        xml_res_file_workers = os.path.join(self.dirname, "sax.test.workers.3.xml")
+        self.config.error_file = IssuesFileOsmose.IssuesFileOsmose(xml_res_file_workers)
+        self.config.sax_workers = 3
+        with Analyser_Sax(self.config) as analyser_obj:
+            analyser_obj.analyser()
+
+        self.compare_results(self.xml_res_file, xml_res_file_workers)
+
     def test_fr(self):
         self.xml_res_file = os.path.join(self.dirname, "sax.test.Lang_fr.xml")
         self.config.error_file = IssuesFileOsmose.IssuesFileOsmose(self.xml_res_file)
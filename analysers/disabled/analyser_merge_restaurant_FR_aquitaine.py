@@ -35,7 +35,7 @@ class Analyser_Merge_Restaurant_FR_aquitaine(Analyser_Merge):
             u"Liste des restaurants en Aquitaine",
             JSON(Source(attribution = u"Réseau SIRTAQUI - Comité Régional de Tourisme d'Aquitaine - www.sirtaqui-aquitaine.com", millesime = "06/2016",
                     fileUrl = u"http://wcf.tourinsoft.com/Syndication/aquitaine/e150e425-fbb6-4e32-916b-5bfc47171c3c/Objects?$format=json"),
-                extractor = lambda json: json['d']),
+                path = ['d']),
             Load("LON", "LAT",
                 select = {
                     'TYPRES': [u"Restaurant", u"Hôtel restaurant", u"Ferme auberge"],
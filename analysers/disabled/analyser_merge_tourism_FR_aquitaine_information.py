@@ -37,7 +37,7 @@ class Analyser_Merge_Tourism_FR_Aquitaine_information(Analyser_Merge):
             u"Liste des points infos tourisme en Aquitaine ",
             JSON(Source(attribution = u"Réseau SIRTAQUI - Comité Régional de Tourisme d'Aquitaine - www.sirtaqui-aquitaine.com", millesime = "08/2018",
                     fileUrl = u"http://wcf.tourinsoft.com/Syndication/aquitaine/0c7230f7-94ec-473b-9dce-e4cf38fedb44/Objects?$format=json"),
-                extractor = lambda json: json['d']),
+                path = ['d']),
             Load("LON", "LAT",
                 xFunction = Load.degree,
                 yFunction = Load.degree),
@@ -683,8 +683,12 @@ def to_p(t):
             declarations_text = list(filter(lambda a: a, map(to_p, t['declarations'])))
             fix = dict(map(lambda kv: [{'fixAdd': '+', 'fixChangeKey': '~', 'fixRemove': '-'}[kv[0]], kv[1]], filter(lambda kv: len(kv[1]) > 0, fix.items())))
             fix = len(fix) > 0 and map(lambda om: "'" + om[0] + "': " + ("dict" if om[0] != '-' else "") + "([\n            " + ",\n            ".join(om[1]) + "])", sorted(fix.items()))
+            # Dispatch on one key of each selector, the quick fail test checks the others
+            t['_dispatch'] = None if main_tags_None else sorted(set(map(lambda s: sorted(s)[0], main_tags)))
             return (
                 selectors_text + "\n" +
+                "def " + t['_method'] + "(self, " + rule_params[t['_type']] + "):\n" +
+                indent(
                 (("if (" + ") or (".join(sorted(map(lambda s: " and ".join(map(lambda z: "'" + z.replace("'", "\\'") + "' in keys", sorted(s))), main_tags))) + ")") if not main_tags_None else "if True") + ":\n" + # Quick fail
                 "    match = False\n" +
                 "".join(map(to_p, t['selectors'])) +
@@ -697,7 +701,7 @@ def to_p(t):
                     "'text': " + (text if text.startswith('mapcss.tr') else "{'en': " + text + "}") +
                     (", 'allow_fix_override': True" if fix else "") +
                     (", 'fix': {\n            " + ",\n            ".join(fix) + "\n        }" if fix else "") + "})\n")
-                if text else "")
+                if text else ""))
             )
         elif is_meta_rule:
             list(map(to_p, t['declarations']))
@@ -724,7 +728,7 @@ def to_p(t):
         sp = list(map(to_p, t['class_selectors'])) + list(map(to_p, t['predicates'])) + list(map(to_p, t['pseudo_class']))
         return "((" + ") and (".join(sp) + "))"
     elif t['type'] == 'class_selector':
-        return ("not " if t['not'] else "") + "set_" + t['class']
+        return "'" + t['class'] + "'" + (" not" if t['not'] else "") + " in sets"
     elif t['type'] == 'predicate_simple':
         return (
             ("not " if t['not'] else "") + to_p(t['predicate']) +
@@ -739,7 +743,7 @@ def to_p(t):
         if t['set']:
             s = t['set'] if t['set'][0] != '.' else t['set'][1:]
             set_store.add(s)
-            return "set_" + s + " = True"
+            return "sets.add('" + s + "')"
         # Meta info properties
         elif t['property'] == '-osmoseTags':
             if is_meta_rule:
@@ -873,6 +877,35 @@ def to_p(t):
         return "<UNKNOWN TYPE {0}>".format(t['type'])
 
 
+rule_params = {
+    'node': 'data, tags, keys, err, sets',
+    'way': 'data, tags, nds, keys, err, sets',
+    'relation': 'data, tags, members, keys, err, sets',
+}
+
+def indent(text):
+    return "".join(map(lambda l: "    " + l if l.strip() else l, text.splitlines(True)))
+
+def build_rules(type_selector, rules):
+    """
+    Build one method per rule and the index dispatching them from the tag keys
+    """
+    methods = []
+    dispatch = []
+    for rule in rules:
+        rule['_type'] = type_selector
+        rule['_method'] = '_' + type_selector + '_rule_' + str(len(dispatch))
+        methods.append(to_p(rule))
+        if '_dispatch' in rule:
+            dispatch.append("(" + rule['_method'] + ", " + (("[" + ", ".join(map(lambda z: "'" + z.replace("'", "\\'") + "'", rule['_dispatch'])) + "]") if rule['_dispatch'] is not None else "None") + "),")
+
+    return (
+        "\n".join(filter(lambda s: s != "", methods)) + "\n" +
+        "_" + type_selector + "_rules = mapcss.KeyIndex([\n" +
+        "".join(map(lambda d: "    " + d + "\n", dispatch)) +
+        "])\n"
+    )
+
 def build_items(class_):
     out = []
     for _, c in sorted(class_.items(), key = lambda a: a[0]):
@@ -948,7 +981,7 @@ def compile(inputfile, class_name, mapcss_url = None, only_for = [], not_for = [
     tree = filter_support_rules(tree)
     selectors_type = segregate_selectors_type(tree)
 
-    rules = dict(map(lambda t: [t, to_p({'type': 'stylesheet', 'rules': selectors_type[t]})], sorted(selectors_type.keys(), key = lambda a: {'node': 0, 'way': 1, 'relation':2}[a])))
+    rules = dict(map(lambda t: [t, build_rules(t, selectors_type[t])], sorted(selectors_type.keys(), key = lambda a: {'node': 0, 'way': 1, 'relation':2}[a])))
     items = build_items(class_)
 
     asserts = ""
@@ -995,13 +1028,13 @@ class """ + prefix + class_name + """(PluginMapCSS):
         self.""" + r[1] + " = re.compile(r'" + r[0].replace('(?U)', '').replace("'", "\\'") + "'" + (', ' + {'i': "re.I", 'm': "re.M", 's': "re.I"}[r[2]] if r[2] else '') + ")", map(lambda a: [a[0][0], a[1], a[0][1]], sorted(regex_store.items(), key = lambda s: s[1])))) + """
 
 """ + "".join(map(lambda t: """
+""" + indent(rules[t]) + """
     def """ + t + """(self, data, tags""" + {'node': "", 'way': ", nds", 'relation': ", members"}[t] + """):
-        capture_tags = {}
         keys = tags.keys()
         err = []
-        """ + ((" = ".join(list(map(lambda s: "set_" + s, sorted(set_store)))) + " = False") if len(set_store) > 0 else "") + """
-
-        """ + rules[t].replace("\n", "\n        ") + """
+        sets = set()
+        for rule in self._""" + t + """_rules.select(keys):
+            rule(self, data, tags""" + {'node': "", 'way': ", nds", 'relation': ", members"}[t] + """, keys, err, sets)
         return err
 """, sorted(rules.keys(), key = lambda a: {'node': 0, 'way': 1, 'relation':2}[a])))
     + asserts).replace("        \n", "\n")
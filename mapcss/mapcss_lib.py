@@ -2,29 +2,59 @@
 from urllib.parse import unquote
 import re
 from modules.OsmoseTranslation import T_
+from modules.KeyIndex import KeyIndex # noqa
 from plugins.modules.units import convertToUnit
 
 # Utils
 
-def memoize(f):
+def memoize(f, maxsize = 1 << 16):
+    """
+    Cache f results, on at most twice maxsize entries. When full, only the entries used since
+    the previous purge are kept, an approximation of LRU that keeps the hits as cheap as a dict.
+    """
     class memodict(dict):
-        __slots__ = ()
+        __slots__ = ('old', )
         def __missing__(self, key):
-            self[key] = ret = f(key)
+            try:
+                ret = self.old.pop(key)
+            except KeyError:
+                ret = f(key)
+            if len(self) >= maxsize:
+                self.old = dict(self)
+                self.clear()
+            self[key] = ret
             return ret
-    return memodict().__getitem__
+    memo = memodict()
+    memo.old = {}
+    return memo.__getitem__
 
-def memoizeN(f):
-    memo = {}
+def memoizeN(f, maxsize = 1 << 16):
+    memo = memoize(lambda args: f(*args), maxsize)
     def wrapper(*args):
-        try:
-            return memo[args]
-        except KeyError:
-            rv = f(*args)
-            memo[args] = rv
-            return rv
+        return memo(args)
     return wrapper
 
+class Evaluation:
+    """
+    Cache for the evaluation of the rules on one object. All the rules, of all the plugins, get the
+    same tags dict for an object, a new tags dict starts a new evaluation.
+    Only pure functions of their arguments are cached, so it is safe to evaluate other objects meanwhile.
+    """
+    __slots__ = ('tags', 'translations')
+
+    def __init__(self):
+        self.start(None)
+
+    def start(self, tags):
+        self.tags = tags
+        self.translations = {}
+
+_evaluation = Evaluation()
+
+def _object(tags):
+    if tags is not _evaluation.tags:
+        _evaluation.start(tags)
+
 @memoize
 def str_value(string):
     return str_value_(string)
@@ -301,6 +331,7 @@ def _re_search(r, s):
 
 def tag(tags, key_name):
     if tags is not None and key_name is not None:
+        _object(tags)
         if key_name.__class__ in (str, str_value_):
             return str_value(tags.get(key_name))
         else: # regex
@@ -311,6 +342,7 @@ def tag(tags, key_name):
 
 def _tag_capture(stock, index, tags, key_name):
     if tags is not None and key_name is not None:
+        _object(tags)
         if not index in stock:
             stock_index = stock[index] = [None, None]
         else:
@@ -351,6 +383,7 @@ def _value_const_capture(stock, index, value, const):
 
 def _match_regex(tags, key_regex):
     if key_regex is not None:
+        _object(tags)
         for k in tags.keys():
             if _re_search(key_regex, k):
                 return str_value(tags[k])
@@ -447,12 +480,27 @@ def JOSM_search(string):
 
 #tr(str, arg0, arg1, ...)
 #    translate from English to the current language (only for strings in the JOSM user interface) [since 6506]
+def _translate(string, *args):
+    # Treat '' as ' so JOSM translations work in Osmose too.
+    # A ' is a special character in JOSM, see https://josm.openstreetmap.de/wiki/Translations
+    t = T_(string, *args)
+    return {k: t[k].replace("''", "'") for k in t.keys()}
+
+_translate_const = memoize(_translate)
+
 def tr(string, *args):
     if string is not None:
-        # Treat '' as ' so JOSM translations work in Osmose too.
-        # A ' is a special character in JOSM, see https://josm.openstreetmap.de/wiki/Translations
-        t = T_(string, *args)
-        return {k: t[k].replace("''", "'") for k in t.keys()}
+        if not args:
+            t = _translate_const(string)
+        else:
+            translations = _evaluation.translations
+            try:
+                t = translations[(string, args)]
+            except KeyError:
+                t = translations[(string, args)] = _translate(string, *args)
+            except TypeError: # Translated arguments, not hashable
+                t = _translate(string, *args)
+        return dict(t)
 
 #regexp_test(regexp, string)
 #    test if string matches pattern regexp [since 5699]
@@ -19,6 +19,7 @@
 ##                                                                       ##
 ###########################################################################
 
+import psycopg2.extensions
 import psycopg2.extras
 from .Stablehash import hexastablehash
 
@@ -42,3 +43,15 @@ class DictCursorUnicode63(psycopg2.extras.DictCursor):
         kwargs['row_factory'] = DictRowUnicode63
         psycopg2.extras.DictCursorBase.__init__(self, *args, **kwargs)
         self._prefetch = 1
+
+class ListRow(list):
+    # Rows filled by index by psycopg2, mutable as the callbacks update them
+    __slots__ = ()
+
+    def __init__(self, cursor):
+        list.__init__(self, [None] * len(cursor.description))
+
+class ListCursor(psycopg2.extensions.cursor):
+    def __init__(self, *args, **kwargs):
+        psycopg2.extensions.cursor.__init__(self, *args, **kwargs)
+        self.row_factory = ListRow
@@ -20,15 +20,99 @@
 ###########################################################################
 
 import bz2
-from .IssuesFile_PolygonFilter import PolygonFilter
+import collections
+import concurrent.futures
+import gzip
+import io
+import lzma
+import os
+try:
+    import zstandard # type: ignore
+except ImportError:
+    zstandard = None
+from .IssuesFile_PolygonFilter import PolygonFilter, IssuesFilter
+
+
+def zstd_compress(data, level):
+    if not zstandard:
+        raise RuntimeError("zstandard module is required for zstd compression")
+    return zstandard.ZstdCompressor(level=3 if level is None else level).compress(data)
+
+# Compression name: (file extension, function compressing a block of data at a level, None for default)
+compressions = {
+    'bz2': ('.bz2', lambda data, level: bz2.compress(data, 9 if level is None else level)),
+    'gzip': ('.gz', lambda data, level: gzip.compress(data, 9 if level is None else level, mtime=0)),
+    'xz': ('.xz', lambda data, level: lzma.compress(data, preset=level)),
+    'zstd': ('.zst', zstd_compress),
+    'none': ('', None),
+}
+
+def compression_from_filename(filename):
+    for (extension, compress) in compressions.values():
+        if extension and filename.endswith(extension):
+            return compress
+
+
+class ParallelCompressWriter(io.RawIOBase):
+    """
+    Binary file compressing blocks of data independently, on several threads.
+    The output is a concatenation of compressed streams, read as a single
+    stream by the bzip2, gzip, xz and zstd tools and Python modules.
+    """
+    block_size = 1024 * 1024
+
+    def __init__(self, fileobj, compress, level = None, threads = None):
+        self._fileobj = fileobj
+        self._compress = compress
+        self._level = level
+        self._buffer = bytearray()
+        self._threads = threads or min(4, os.cpu_count() or 1)
+        self._executor = concurrent.futures.ThreadPoolExecutor(self._threads)
+        # Blocks being compressed, written in order
+        self._pending = collections.deque()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self._buffer += b
+        while len(self._buffer) >= self.block_size:
+            self._submit(bytes(self._buffer[:self.block_size]))
+            del self._buffer[:self.block_size]
+        return len(b)
+
+    def _submit(self, data):
+        self._pending.append(self._executor.submit(self._compress, data, self._level))
+        while len(self._pending) > 2 * self._threads:
+            self._fileobj.write(self._pending.popleft().result())
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer = bytearray()
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown()
+            self._fileobj.close()
+            super().close()
 
 
 class IssuesFile:
+    # Issues waiting for the filter, tested by batches
+    filter_buffer_size = 1000
+    # Buffer of the binary output stream
+    buffer_size = 1024 * 1024
 
-    def __init__(self, dst, version = None, polygon_id = None):
+    def __init__(self, dst, version = None, polygon_id = None, compression_level = None):
         self.dst = dst
         self.version = version
+        self.compression_level = compression_level
         self.filter = None
+        self.filter_buffer = []
         if polygon_id:
             try:
                 self.filter = PolygonFilter(polygon_id)
@@ -38,15 +122,19 @@ class IssuesFile:
 
     def begin(self):
         if isinstance(self.dst, str):
-            if self.dst.endswith(".bz2"):
-                self.output = bz2.open(self.dst, "wt")
+            # Compression from the file extension
+            compress = compression_from_filename(self.dst)
+            if compress:
+                raw = ParallelCompressWriter(open(self.dst, "wb"), compress, self.compression_level)
             else:
-                self.output = open(self.dst, "w")
+                raw = open(self.dst, "wb", buffering=0)
+            self.output = io.TextIOWrapper(io.BufferedWriter(raw, self.buffer_size), encoding="utf-8")
         else:
             self.output = self.dst
         return self.output
 
     def end(self):
+        self.flush()
         if isinstance(self.dst, str):
             self.output.close()
 
@@ -54,18 +142,37 @@ class IssuesFile:
         pass
 
     def analyser_end(self):
-        pass
+        self.flush()
 
     def classs(self, id, item, level, tags, title, detail = None, fix = None, trap = None, example = None, source = None, resource = None):
         pass
 
     def error(self, classs, subclass, text, ids, types, fix, geom, allow_override=False):
-        if self.filter and not self.filter.apply(classs, subclass, geom):
-            return
+        if self.filter:
+            self.filter_buffer.append((classs, subclass, text, ids, types, fix, geom, allow_override))
+            if len(self.filter_buffer) >= self.filter_buffer_size:
+                self.flush()
+        else:
+            self.write_error(classs, subclass, text, ids, types, fix, geom, allow_override)
 
-    def delete(self, t, id):
+    def flush(self):
+        """
+        Filter and write the buffered issues. To be called before writing anything else to keep the output order.
+        """
+        if self.filter_buffer:
+            buffer = self.filter_buffer
+            self.filter_buffer = []
+            keep = self.filter.apply_many(list(map(lambda e: (e[0], e[1], e[6]), buffer)))
+            for e, k in zip(buffer, keep):
+                if k:
+                    self.write_error(*e)
+
+    def write_error(self, classs, subclass, text, ids, types, fix, geom, allow_override=False):
         pass
 
+    def delete(self, t, id):
+        self.flush()
+
     FixTable = {'~':'modify', '+':'create', '-':'delete'}
 
     def fixdiff(self, fixes):
@@ -126,3 +233,48 @@ class Test(unittest.TestCase):
         self.check([{"~": {"t": "v"}}, {"+": {"t": "v"}}], [[{"~": {"t": "v"}}], [{"+": {"t": "v"}}]] )
         self.check([[{"t": "v"}], [{"t": "v"}]], [[{"~": {"t": "v"}}], [{"~": {"t": "v"}}]] )
         self.check([[None, {"t": "v"}]], [[None, {"~": {"t": "v"}}]] )
+
+    def test_compressions(self):
+        import tempfile
+        content = "".join(map(lambda i: "<error id=\"{0}\" />\n".format(i), range(200000)))
+        with tempfile.TemporaryDirectory() as directory:
+            for (name, (extension, compress)) in compressions.items():
+                if name == 'zstd' and not zstandard:
+                    continue
+                a = IssuesFile(os.path.join(directory, "issues.xml" + extension), compression_level = 1)
+                a.begin().write(content)
+                a.end()
+                with open(a.dst, "rb") as f:
+                    data = f.read()
+                if name == 'zstd':
+                    data = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data), read_across_frames=True).read()
+                elif name != 'none':
+                    # Several blocks, as several compressed streams
+                    self.assertGreater(len(content), ParallelCompressWriter.block_size)
+                    data = {'bz2': bz2, 'gzip': gzip, 'xz': lzma}[name].decompress(data)
+                self.assertEqual(data.decode("utf-8"), content, name)
+
+    def test_filter_buffer(self):
+        class OddFilter(IssuesFilter):
+            def apply(self, classs, subclass, geom):
+                return subclass % 2 == 1
+
+        class Collect(IssuesFile):
+            def write_error(self, classs, subclass, text, ids, types, fix, geom, allow_override=False):
+                self.written.append(subclass)
+
+            def delete(self, t, id):
+                super().delete(t, id)
+                self.written.append(t)
+
+        a = Collect(None)
+        a.filter = OddFilter()
+        a.filter_buffer_size = 3
+        a.written = []
+        for subclass in range(5):
+            a.error(1, subclass, None, None, None, None, {})
+        self.assertEqual(a.written, [1])
+        a.delete("node", 1)
+        a.error(1, 7, None, None, None, None, {})
+        a.analyser_end()
+        self.assertEqual(a.written, [1, 3, "node", 7])
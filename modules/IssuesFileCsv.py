@@ -30,12 +30,11 @@ class IssuesFileCsv(IssuesFile):
         self.csv.writerow(['classs', 'subclass', 'ids', 'types', 'text', 'lon', 'lat', 'fix'])
 
     def end(self):
+        self.flush()
         del self.csv
+        super().end()
 
-    def error(self, classs, subclass, text, ids, types, fix, geom, allow_override=False):
-        if self.filter and not self.filter.apply(classs, subclass, geom):
-            return
-
+    def write_error(self, classs, subclass, text, ids, types, fix, geom, allow_override=False):
         try:
             lat = geom['position'][0]['lat']
             lon = geom['position'][0]['lon']
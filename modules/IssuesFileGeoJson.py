@@ -31,13 +31,11 @@ class IssuesFileGeoJson(IssuesFile):
         self.first = True
 
     def end(self):
+        self.flush()
         self.output.write(']}')
         super().end()
 
-    def error(self, classs, subclass, text, ids, types, fix, geom, allow_override=False):
-        if self.filter and not self.filter.apply(classs, subclass, geom):
-            return
-
+    def write_error(self, classs, subclass, text, ids, types, fix, geom, allow_override=False):
         try:
             lat = float(geom['position'][0]['lat'])
             lon = float(geom['position'][0]['lon'])
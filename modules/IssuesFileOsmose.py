@@ -33,6 +33,7 @@ class IssuesFileOsmose(IssuesFile):
         self.geom_type_renderer = {"node": self.outxml.NodeCreate, "way": self.outxml.WayCreate, "relation": self.outxml.RelationCreate, "position": self.position}
 
     def end(self):
+        self.flush()
         self.outxml.endElement("analysers")
         self.outxml.endDocument()
         del self.outxml
@@ -48,9 +49,11 @@ class IssuesFileOsmose(IssuesFile):
         self.outxml.startElement(self.mode, attrs)
 
     def analyser_end(self):
+        self.flush()
         self.outxml.endElement(self.mode)
 
     def classs(self, id, item, level, tags, title, detail = None, fix = None, trap = None, example = None, source = None, resource = None):
+        self.flush()
         options = {
             'id': str(id),
             'item': str(item),
@@ -79,10 +82,7 @@ class IssuesFileOsmose(IssuesFile):
                     })
         self.outxml.endElement('class')
 
-    def error(self, classs, subclass, text, ids, types, fix, geom, allow_override=False):
-        if self.filter and not self.filter.apply(classs, subclass, geom):
-            return
-
+    def write_error(self, classs, subclass, text, ids, types, fix, geom, allow_override=False):
         if subclass is not None:
             self.outxml.startElement("error", {"class":str(classs), "subclass":str(subclass)})
         else:
@@ -104,6 +104,7 @@ class IssuesFileOsmose(IssuesFile):
         self.outxml.Element("location", {"lat":str(args["lat"]), "lon":str(args["lon"])})
 
     def delete(self, t, id):
+        self.flush()
         self.outxml.Element("delete", {"type": t, "id": str(id)})
 
     def dumpxmlfix(self, ids, types, fixes):
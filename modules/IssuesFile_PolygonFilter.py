@@ -26,6 +26,12 @@ class IssuesFilter:
     def apply(self, classs, subclass, geom):
         return True
 
+    def apply_many(self, issues):
+        """
+        Filter a batch of issues, as (classs, subclass, geom) tuples. Return a list of booleans.
+        """
+        return list(map(lambda issue: self.apply(*issue), issues))
+
 
 class PolygonFilter(IssuesFilter):
 
@@ -33,12 +39,20 @@ class PolygonFilter(IssuesFilter):
         self.pip = PointInPolygon(polygon_id, cache_delay)
 
     def apply(self, classs, subclass, geom):
-        if "position" not in geom:
-            return False
-        else:
-            inside = False
-            for position in geom["position"]:
-                lat = float(position["lat"])
-                lon = float(position["lon"])
-                inside |= self.pip.point_inside_polygon(lon, lat)
-            return inside
+        return self.apply_many([(classs, subclass, geom)])[0]
+
+    def apply_many(self, issues):
+        # Test all the positions at once, an issue is kept if any of its positions is inside
+        lats = []
+        lons = []
+        owners = []
+        for k, (classs, subclass, geom) in enumerate(issues):
+            for position in geom.get("position", []):
+                lats.append(float(position["lat"]))
+                lons.append(float(position["lon"]))
+                owners.append(k)
+        keep = [False] * len(issues)
+        for k, inside in zip(owners, self.pip.contains_many(lats, lons)):
+            if inside:
+                keep[k] = True
+        return keep
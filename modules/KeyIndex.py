@@ -0,0 +1,124 @@
+#-*- coding: utf-8 -*-
+
+###########################################################################
+##                                                                       ##
+## Copyrights Osmose project 2026                                        ##
+##                                                                       ##
+## This program is free software: you can redistribute it and/or modify  ##
+## it under the terms of the GNU General Public License as published by  ##
+## the Free Software Foundation, either version 3 of the License, or     ##
+## (at your option) any later version.                                   ##
+##                                                                       ##
+## This program is distributed in the hope that it will be useful,       ##
+## but WITHOUT ANY WARRANTY; without even the implied warranty of        ##
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         ##
+## GNU General Public License for more details.                          ##
+##                                                                       ##
+## You should have received a copy of the GNU General Public License     ##
+## along with this program.  If not, see <http://www.gnu.org/licenses/>. ##
+##                                                                       ##
+###########################################################################
+
+
+# Select the functions to call on an OSM object from its tag keys, shared by
+# the SAX analyser plugins dispatch and the generated MapCSS rules.
+
+
+class KeyIndex:
+    """
+    Items indexed on the tag keys required to select them, in their order.
+    """
+    cache_size = 4096
+
+    def __init__(self, items=()):
+        self.items = []
+        self.always = []
+        self.index = {}
+        self.prefixes = []
+        self.cache = {}
+        for (item, keys) in items:
+            self.append(item, keys)
+
+    def append(self, item, keys, prefixes=()):
+        """
+        @param keys: tag keys of which one is required, or None to always select the item.
+        @param prefixes: tag key prefixes, of which one is also enough.
+        """
+        i = len(self.items)
+        self.items.append(item)
+        if keys is None:
+            self.always.append(i)
+        else:
+            for key in keys:
+                self.index.setdefault(key, []).append(i)
+            for prefix in prefixes:
+                self.prefixes.append((prefix, i))
+        self.cache.clear()
+
+    def select(self, keys):
+        """
+        Items to use on an object with these tag keys, in order.
+        """
+        if len(self.always) == len(self.items):
+            return self.items
+
+        keys = frozenset(keys)
+        try:
+            return self.cache[keys]
+        except KeyError:
+            pass
+
+        selected = set(self.always)
+        index = self.index
+        for key in keys:
+            if key in index:
+                selected.update(index[key])
+            for (prefix, i) in self.prefixes:
+                if key.startswith(prefix):
+                    selected.add(i)
+        items = self.items
+        selected = [items[i] for i in sorted(selected)]
+
+        if len(self.cache) >= self.cache_size:
+            self.cache.clear()
+        self.cache[keys] = selected
+        return selected
+
+    def interesting_keys(self):
+        """
+        Tag keys of which one is required to select an item, None when some items are always selected.
+        """
+        if self.always or self.prefixes:
+            return None
+        return set(self.index.keys())
+
+
+###########################################################################
+import unittest
+
+class Test(unittest.TestCase):
+
+    def test_select(self):
+        index = KeyIndex()
+        index.append('always', None)
+        index.append('name', {'name'})
+        index.append('name:', set(), ('name:', ))
+        index.append('highway', {'highway', 'railway'})
+
+        self.assertEqual(index.select({}), ['always'])
+        self.assertEqual(index.select({'building': 'yes'}), ['always'])
+        self.assertEqual(index.select({'name': 'a', 'railway': 'rail'}), ['always', 'name', 'highway'])
+        self.assertEqual(index.select({'name:fr': 'a', 'highway': 'path'}), ['always', 'name:', 'highway'])
+        self.assertIsNone(index.interesting_keys())
+
+    def test_rules(self):
+        index = KeyIndex([('a', ['highway']), ('b', ['name', 'highway']), ('c', ['name'])])
+        self.assertEqual(index.select(['name']), ['b', 'c'])
+        self.assertEqual(index.select(['highway', 'name']), ['a', 'b', 'c'])
+        self.assertEqual(index.select([]), [])
+        self.assertEqual(index.interesting_keys(), {'highway', 'name'})
+
+        index.cache_size = 1
+        index.select(['highway'])
+        self.assertEqual(len(index.cache), 1)
+        self.assertIs(index.select(['highway']), index.select(['highway']))
@@ -37,6 +37,13 @@
 #   bzcat /data/updates/$i | ./OsmBin.py --update /data/osmbin -
 # done
 
+###########################################################################
+## RELATION FORMAT MIGRATION                                             ##
+###########################################################################
+# Relations used to be stored one per file in /data/osmbin/relation/.
+# They are moved into relation.data on the first open for writing, or with:
+# ./OsmBin.py --migrate /data/osmbin
+
 ###########################################################################
 ## PYTHON                                                                ##
 ###########################################################################
@@ -49,8 +56,11 @@
 
 from modules.lockfile import lockfile
 from . import OsmReader
-import sys
+import ast
+import mmap
 import os
+import struct
+import sys
 
 
 class MissingDataError(Exception):
@@ -138,6 +148,149 @@ def _Bytes4ToCoord(num):
 def _CoordToBytes4(coord):
     return _IntToBytes4(int((coord*10000000)+1800000000))
 
+_StructCoords  = struct.Struct(">II")
+_StructBytes5  = struct.Struct(">BI")
+_StructBytes2  = struct.Struct(">H")
+_StructLength  = struct.Struct(">I")
+_StructId      = struct.Struct(">q")
+_StructFloat   = struct.Struct(">d")
+
+def _StructToCoords(lat, lon):
+    return float(lat-1800000000)/10000000, float(lon-1800000000)/10000000
+
+###########################################################################
+## Relation binary format
+
+_MemberTypes = ["node", "way", "relation"]
+
+def _PackString(s):
+    s = s.encode("utf-8")
+    return _StructLength.pack(len(s)) + s
+
+def _PackValue(value):
+    if value is None:
+        return b"N"
+    elif value is True or value is False:
+        return b"T" if value else b"F"
+    elif isinstance(value, int):
+        return b"I" + _StructId.pack(value)
+    elif isinstance(value, float):
+        return b"D" + _StructFloat.pack(value)
+    else:
+        return b"S" + _PackString(str(value))
+
+def _PackRelation(data):
+    # id, other attributes, tags, members
+    attributes = dict(filter(lambda kv: kv[0] not in ("id", "tag", "member"), data.items()))
+    c = [_StructId.pack(data["id"]), _StructLength.pack(len(attributes))]
+    for k, v in attributes.items():
+        c.append(_PackString(k))
+        c.append(_PackValue(v))
+    c.append(_StructLength.pack(len(data["tag"])))
+    for k, v in data["tag"].items():
+        c.append(_PackString(k))
+        c.append(_PackString(v))
+    c.append(_StructLength.pack(len(data["member"])))
+    for m in data["member"]:
+        c.append(bytes([_MemberTypes.index(m["type"])]))
+        c.append(_StructId.pack(m["ref"]))
+        c.append(_PackString(m["role"]))
+    c = b"".join(c)
+    return _StructLength.pack(len(c)) + c
+
+class _RelationUnpacker:
+    def __init__(self, buf, offset):
+        self.buf = buf
+        self.offset = offset
+
+    def unpack(self, s):
+        v = s.unpack_from(self.buf, self.offset)
+        self.offset += s.size
+        return v[0]
+
+    def string(self):
+        n = self.unpack(_StructLength)
+        s = str(self.buf[self.offset:self.offset+n], "utf-8")
+        self.offset += n
+        return s
+
+    def value(self):
+        t = self.buf[self.offset:self.offset+1]
+        self.offset += 1
+        if t == b"N":
+            return None
+        elif t == b"T":
+            return True
+        elif t == b"F":
+            return False
+        elif t == b"I":
+            return self.unpack(_StructId)
+        elif t == b"D":
+            return self.unpack(_StructFloat)
+        else:
+            return self.string()
+
+def _UnpackRelation(buf, offset):
+    u = _RelationUnpacker(buf, offset + _StructLength.size)
+    data = {"id": u.unpack(_StructId)}
+    for _ in range(u.unpack(_StructLength)):
+        k = u.string()
+        data[k] = u.value()
+    data["tag"] = {}
+    for _ in range(u.unpack(_StructLength)):
+        k = u.string()
+        data["tag"][k] = u.string()
+    data["member"] = []
+    for _ in range(u.unpack(_StructLength)):
+        t = _MemberTypes[u.buf[u.offset]]
+        u.offset += 1
+        ref = u.unpack(_StructId)
+        data["member"].append({"type": t, "ref": ref, "role": u.string()})
+    return data
+
+###########################################################################
+## Memory mapped files
+
+class _MappedFile:
+
+    def __init__(self, path, writable):
+        self._f = open(path, "rb+" if writable else "rb")
+        self._writable = writable
+        self.size = os.fstat(self._f.fileno()).st_size
+        self.mm = b""
+        self._Map()
+
+    def _Map(self):
+        if isinstance(self.mm, mmap.mmap):
+            self.mm.close()
+        if os.fstat(self._f.fileno()).st_size == 0:
+            self.mm = b""
+        else:
+            self.mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_WRITE if self._writable else mmap.ACCESS_READ)
+
+    def Available(self, end):
+        # Data appended by an other process is mapped on demand
+        if end > len(self.mm) and not self._writable and os.fstat(self._f.fileno()).st_size > len(self.mm):
+            self.size = os.fstat(self._f.fileno()).st_size
+            self._Map()
+        return end <= self.size
+
+    def Write(self, offset, data):
+        end = offset + len(data)
+        if end > len(self.mm):
+            # Grow by doubling, the extra space is sparse and trimmed on close
+            self._f.truncate(max(end, 2*len(self.mm)))
+            self._Map()
+        self.mm[offset:end] = data
+        self.size = max(self.size, end)
+
+    def Close(self):
+        if isinstance(self.mm, mmap.mmap):
+            self.mm.close()
+        if self._writable:
+            self._f.truncate(self.size)
+        self._f.close()
+
 ###########################################################################
 ## InitFolder
 
@@ -177,6 +330,49 @@ def InitFolder(folder):
     print("Creating way.free")
     open(os.path.join(folder, "way.free"), "wb")
 
+    InitRelation(folder)
+
+def InitRelation(folder, suffix=""):
+    # create relation.idx
+    open(os.path.join(folder, "relation.idx" + suffix), "wb")
+
+    # reset relation.data
+    open(os.path.join(folder, "relation.data" + suffix), "wb").write(b"--") # for no data at location 0
+
+def MigrateRelation(folder):
+    """
+    Convert the relations stored one per file in the relation/ folder into relation.data.
+    The relations are written to temporary files, moved into place once complete.
+    The relation/ folder is only removed after, so an interrupted migration is
+    done again from the start. The caller must hold the lock of the folder.
+    """
+    import shutil
+    reldir = os.path.join(folder, "relation")
+    InitRelation(folder, ".migrate")
+    fIdx = _MappedFile(os.path.join(folder, "relation.idx.migrate"), True)
+    fData = _MappedFile(os.path.join(folder, "relation.data.migrate"), True)
+    try:
+        for i in sorted(os.listdir(reldir)):
+            for j in sorted(os.listdir(os.path.join(reldir, i))):
+                for k in sorted(os.listdir(os.path.join(reldir, i, j))):
+                    with open(os.path.join(reldir, i, j, k)) as f:
+                        _AppendRelation(fIdx, fData, ast.literal_eval(f.read()))
+    finally:
+        fIdx.Close()
+        fData.Close()
+    os.replace(os.path.join(folder, "relation.idx.migrate"), os.path.join(folder, "relation.idx"))
+    os.replace(os.path.join(folder, "relation.data.migrate"), os.path.join(folder, "relation.data"))
+
+    # The migration is done once relation/ is gone
+    os.rename(reldir, reldir + ".migrated")
+    shutil.rmtree(reldir + ".migrated")
+
+def _AppendRelation(fIdx, fData, data):
+    # Append only, the previous version is left unreferenced in relation.data
+    AdrRelation = fData.size
+    fData.Write(AdrRelation, _PackRelation(data))
+    fIdx.Write(5*data[u"id"], _IntToBytes5(AdrRelation))
+
 ###########################################################################
 ## OsmBinWriter
 
@@ -185,28 +381,39 @@ class OsmBin:
     def __init__(self, folder, mode = "r"):
         self._mode           = mode
         self._folder         = folder
-        self._reldir         = os.path.join(folder, "relation")
-        self._fNode_crd      = open(os.path.join(folder, "node.crd"), {"w":"rb+", "r":"rb"}[mode])
-        self._fWay_idx       = open(os.path.join(folder, "way.idx"),  {"w":"rb+", "r":"rb"}[mode])
-        self._fWay_data      = open(os.path.join(folder, "way.data"), {"w":"rb+", "r":"rb"}[mode])
-        self._fWay_data_size = os.stat(os.path.join(folder, "way.data")).st_size
         if self._mode == "w":
             lock_file = os.path.join(folder, "lock")
             self._lock = lockfile(lock_file)
+            if os.path.isdir(os.path.join(folder, "relation.migrated")):
+                import shutil
+                shutil.rmtree(os.path.join(folder, "relation.migrated"))
+            if os.path.isdir(os.path.join(folder, "relation")):
+                MigrateRelation(folder)
+        self._fNode_crd      = _MappedFile(os.path.join(folder, "node.crd"), mode == "w")
+        self._fWay_idx       = _MappedFile(os.path.join(folder, "way.idx"), mode == "w")
+        self._fWay_data      = _MappedFile(os.path.join(folder, "way.data"), mode == "w")
+        self._fRelation_idx  = _MappedFile(os.path.join(folder, "relation.idx"), mode == "w")
+        self._fRelation_data = _MappedFile(os.path.join(folder, "relation.data"), mode == "w")
+        if self._mode == "w":
             self._ReadFree()
 
         self.node_id_size = 5
 
     def __del__(self):
         try:
-            self._fNode_crd.close()
-            self._fWay_idx.close()
-            self._fWay_data.close()
+            self._fNode_crd.Close()
+            self._fWay_idx.Close()
+            self._fWay_data.Close()
+            self._fRelation_idx.Close()
+            self._fRelation_data.Close()
         except AttributeError:
             pass
         if self._mode == "w":
             self._WriteFree()
-            del self._lock
+            try:
+                del self._lock
+            except AttributeError:
+                pass
 
     def _ReadFree(self):
         self._free = {}
@@ -231,6 +438,12 @@ class OsmBin:
                 f.write("%d;%d\n" % (ptr, nbn))
         f.close()
 
+    def _Bytes5Get(self, fIdx, Id):
+        if not fIdx.Available(5*(Id+1)):
+            return None
+        hi, lo = _StructBytes5.unpack_from(fIdx.mm, 5*Id)
+        return hi << 32 | lo
+
     def begin(self):
         pass
 
@@ -241,47 +454,66 @@ class OsmBin:
     ## node functions
 
     def NodeGet(self, NodeId):
-        data = {}
-        data["id"] = NodeId
-        self._fNode_crd.seek(8*data[u"id"])
-        read = self._fNode_crd.read(8)
-        if len(read) != 8:
+        if not self._fNode_crd.Available(8*(NodeId+1)):
             return None
-        data["lat"] = _Bytes4ToCoord(read[:4])
-        data["lon"] = _Bytes4ToCoord(read[4:])
-        data["tag"] = {}
-        return data
+        lat, lon = _StructToCoords(*_StructCoords.unpack_from(self._fNode_crd.mm, 8*NodeId))
+        return {"id": NodeId, "lat": lat, "lon": lon, "tag": {}}
+
+    def NodesGet(self, NodeIds):
+        """
+        Nodes by id, as a dict. Ids out of the store are not in the dict.
+        """
+        nodes = {}
+        for NodeId in NodeIds:
+            node = self.NodeGet(NodeId)
+            if node:
+                nodes[NodeId] = node
+        return nodes
 
     def NodeCreate(self, data):
-        LatBytes4 = _CoordToBytes4(data[u"lat"])
-        LonBytes4 = _CoordToBytes4(data[u"lon"])
-        self._fNode_crd.seek(8*data[u"id"])
-        self._fNode_crd.write(LatBytes4+LonBytes4)
+        self._fNode_crd.Write(8*data[u"id"], _StructCoords.pack(int((data[u"lat"]*10000000)+1800000000), int((data[u"lon"]*10000000)+1800000000)))
 
     NodeUpdate = NodeCreate
 
     def NodeDelete(self, data):
         LatBytes4 = _IntToBytes4(0)
         LonBytes4 = _IntToBytes4(0)
-        self._fNode_crd.seek(8*data[u"id"])
-        self._fNode_crd.write(LatBytes4+LonBytes4)
+        self._fNode_crd.Write(8*data[u"id"], LatBytes4+LonBytes4)
 
     #######################################################################
     ## way functions
 
+    def _WayNodes(self, WayId):
+        AdrWay = self._Bytes5Get(self._fWay_idx, WayId)
+        if not AdrWay or not self._fWay_data.Available(AdrWay+2):
+            return None
+        nbn = _StructBytes2.unpack_from(self._fWay_data.mm, AdrWay)[0]
+        data = self._fWay_data.mm[AdrWay+2:AdrWay+2+self.node_id_size*nbn]
+        return [hi << 32 | lo for hi, lo in _StructBytes5.iter_unpack(data)]
+
     def WayGet(self, WayId, dump_sub_elements=False):
-        self._fWay_idx.seek(5*WayId)
-        AdrWay = _Bytes5ToInt(self._fWay_idx.read(5))
-        if not AdrWay:
+        nds = self._WayNodes(WayId)
+        if nds is None:
             return None
-        self._fWay_data.seek(AdrWay)
-        nbn  = _Bytes2ToInt(self._fWay_data.read(2))
-        data = self._fWay_data.read(self.node_id_size*nbn)
-        nds = []
-        for i in range(nbn):
-            nds.append(_Bytes5ToInt(data[self.node_id_size*i:self.node_id_size*(i+1)]))
         return {"id": WayId, "nd": nds, "tag":{}}
 
+    def WayNodesCoords(self, WayIds):
+        """
+        Coordinates (lat, lon) of the nodes of ways, as a dict by way id. Unknown ways are not in the dict,
+        nodes out of the store are None.
+        """
+        crd = self._fNode_crd
+        ways = {}
+        for WayId in WayIds:
+            nds = self._WayNodes(WayId)
+            if nds is None:
+                continue
+            if not nds or crd.Available(8*(max(nds)+1)):
+                ways[WayId] = [_StructToCoords(*_StructCoords.unpack_from(crd.mm, 8*NodeId)) for NodeId in nds]
+            else:
+                ways[WayId] = [_StructToCoords(*_StructCoords.unpack_from(crd.mm, 8*NodeId)) if crd.Available(8*(NodeId+1)) else None for NodeId in nds]
+        return ways
+
     def WayCreate(self, data):
         self.WayDelete(data)
         # Search space big enough to store node list
@@ -289,68 +521,47 @@ class OsmBin:
         if self._free[nbn]:
             AdrWay = self._free[nbn].pop()
         else:
-            AdrWay = self._fWay_data_size
-            self._fWay_data_size += 2 + self.node_id_size*nbn
+            AdrWay = self._fWay_data.size
         # File way.idx
-        self._fWay_idx.seek(5*data[u"id"])
-        self._fWay_idx.write(_IntToBytes5(AdrWay))
+        self._fWay_idx.Write(5*data[u"id"], _IntToBytes5(AdrWay))
         # File way.dat
-        self._fWay_data.seek(AdrWay)
-        c = _IntToBytes2(len(data[u"nd"]))
-        for NodeId in data[u"nd"]:
-            c += _IntToBytes5(NodeId)
-        self._fWay_data.write(c)
+        c = _StructBytes2.pack(nbn) + b"".join(map(lambda NodeId: _StructBytes5.pack(NodeId >> 32, NodeId & _CstMax4), data[u"nd"]))
+        self._fWay_data.Write(AdrWay, c)
 
     WayUpdate = WayCreate
 
     def WayDelete(self, data):
         # Seek to position in file containing address to node list
-        self._fWay_idx.seek(5*data[u"id"])
-        AdrWay = _Bytes5ToInt(self._fWay_idx.read(5))
+        AdrWay = self._Bytes5Get(self._fWay_idx, data[u"id"])
         if not AdrWay:
             return
         # Free space
-        self._fWay_data.seek(AdrWay)
-        nbn = _Bytes2ToInt(self._fWay_data.read(2))
+        nbn = _StructBytes2.unpack_from(self._fWay_data.mm, AdrWay)[0]
         try:
             self._free[nbn].append(AdrWay)
         except KeyError:
             print("Cannot access free[%d] for way id=%d, idx=%d" % (nbn, data[u"id"], AdrWay))
             raise
         # Save deletion
-        self._fWay_idx.seek(5*data[u"id"])
-        self._fWay_idx.write(_IntToBytes5(0))
+        self._fWay_idx.Write(5*data[u"id"], _IntToBytes5(0))
 
     #######################################################################
     ## relation functions
 
     def RelationGet(self, RelationId, dump_sub_elements=False):
-        RelationId = "%09d" % RelationId
-        RelFolder  = self._reldir + "/" + RelationId[0:3] + "/" + RelationId[3:6] + "/"
-        RelFile    = RelationId[6:9]
-        if os.path.exists(RelFolder + RelFile):
-            return eval(open(RelFolder + RelFile).read())
-        else:
+        AdrRelation = self._Bytes5Get(self._fRelation_idx, RelationId)
+        if not AdrRelation or not self._fRelation_data.Available(AdrRelation+_StructLength.size):
             return None
+        return _UnpackRelation(self._fRelation_data.mm, AdrRelation)
 
     def RelationCreate(self, data):
-        RelationId = "%09d" % data["id"]
-        RelFolder  = self._reldir + "/" + RelationId[0:3] + "/" + RelationId[3:6] + "/"
-        RelFile    = RelationId[6:9]
-        if not os.path.exists(RelFolder):
-            os.makedirs(RelFolder)
-        open(RelFolder + RelFile, "w").write(repr(data))
+        _AppendRelation(self._fRelation_idx, self._fRelation_data, data)
 
     RelationUpdate = RelationCreate
 
     def RelationDelete(self, data):
-        RelationId = "%09d" % data["id"]
-        RelFolder  = self._reldir + "/" + RelationId[0:3] + "/" + RelationId[3:6] + "/"
-        RelFile    = RelationId[6:9]
-        try:
-            os.remove(RelFolder + RelFile)
-        except:
-            pass
+        if self._Bytes5Get(self._fRelation_idx, data[u"id"]):
+            self._fRelation_idx.Write(5*data[u"id"], _IntToBytes5(0))
 
     def RelationFullRecur(self, RelationId, WayNodes = True, RaiseOnLoop = True, RemoveSubarea = False, RecurControl = []):
         rel = self.RelationGet(RelationId)
@@ -388,19 +599,30 @@ class OsmBin:
 
     #######################################################################
 
+    def _IdxIds(self, fIdx):
+        # Ids with a non null address, skipping blocks of null addresses at once
+        block = 5*4096
+        empty = bytes(block)
+        size = fIdx.size - fIdx.size % 5
+        for start in range(0, size, block):
+            data = fIdx.mm[start:min(start+block, size)]
+            if data == empty[:len(data)]:
+                continue
+            for i, (hi, lo) in enumerate(_StructBytes5.iter_unpack(data)):
+                if hi or lo:
+                    yield start//5 + i
+
     def CopyWayTo(self, output):
-        self._fWay_idx.seek(0,2)
-        way_idx_size = self._fWay_idx.tell()
-        for i in range(way_idx_size // 5):
+        for i in self._IdxIds(self._fWay_idx):
             way = self.WayGet(i)
             if way:
                 output.WayCreate(way)
 
     def CopyRelationTo(self, output):
-        for i in os.listdir(self._reldir):
-            for j in os.listdir(self._reldir+"/"+i):
-                for k in os.listdir(self._reldir+"/"+i+"/"+j):
-                    output.RelationCreate(eval(open(self._reldir+"/"+i+"/"+j+"/"+k).read()))
+        for i in self._IdxIds(self._fRelation_idx):
+            relation = self.RelationGet(i)
+            if relation:
+                output.RelationCreate(relation)
 
     def Import(self, f):
         i = OsmReader.open(f)
@@ -425,6 +647,11 @@ if __name__ == "__main__":
         o = OsmBin(sys.argv[2], "w")
         o.Import(sys.argv[3])
 
+    if sys.argv[1] == "--migrate":
+        # Migrated on open for writing, with the lock held
+        o = OsmBin(sys.argv[2], "w")
+        del o
+
     if sys.argv[1] == "--update":
         o = OsmBin(sys.argv[2], "w")
         o.Update(sys.argv[3])
@@ -472,6 +699,13 @@ class MockCountObjects:
     def RelationCreate(self, data):
         self.num_rels += 1
 
+class MockCollectRelations:
+    def __init__(self):
+        self.relations = {}
+
+    def RelationCreate(self, data):
+        self.relations[data["id"]] = data
+
 class Test(unittest.TestCase):
     def setUp(self):
         import shutil
@@ -589,6 +823,70 @@ class Test(unittest.TestCase):
         self.check_relation(self.a.RelationGet, 47795, False)
         self.check_relation(self.a.RelationGet, 2707694, False)
 
+    def test_bulk(self):
+        nodes = self.a.NodesGet([266053077, 2619283352, 1 << 40])
+        self.assertEqual(sorted(nodes.keys()), [266053077, 2619283352])
+        self.assertEqual(nodes[266053077], self.a.NodeGet(266053077))
+
+        ways = self.a.WayNodesCoords([255316725, 1])
+        self.assertEqual(list(ways.keys()), [255316725])
+        self.assertEqual(ways[255316725], list(map(lambda n: (self.a.NodeGet(n)["lat"], self.a.NodeGet(n)["lon"]), self.a.WayGet(255316725)["nd"])))
+
+    def test_relation_migrate(self):
+        o1 = MockCollectRelations()
+        self.a.CopyRelationTo(o1)
+        relations = o1.relations
+        del self.a
+        os.remove(self.test_dir + "relation.idx")
+        os.remove(self.test_dir + "relation.data")
+        for data in relations.values():
+            RelationId = "%09d" % data["id"]
+            os.makedirs(self.test_dir + "relation/" + RelationId[0:3] + "/" + RelationId[3:6], exist_ok=True)
+            open(self.test_dir + "relation/" + RelationId[0:3] + "/" + RelationId[3:6] + "/" + RelationId[6:9], "w").write(repr(data))
+
+        self.a = OsmBin(self.test_dir, "w")
+        assert not os.path.exists(self.test_dir + "relation")
+        assert not os.path.exists(self.test_dir + "relation.migrated")
+        for id, data in relations.items():
+            self.assertEqual(self.a.RelationGet(id), data)
+
+    def test_relation_migrate_interrupted(self):
+        o1 = MockCollectRelations()
+        self.a.CopyRelationTo(o1)
+        relations = o1.relations
+        del self.a
+        os.remove(self.test_dir + "relation.idx")
+        os.remove(self.test_dir + "relation.data")
+        paths = []
+        for data in relations.values():
+            RelationId = "%09d" % data["id"]
+            os.makedirs(self.test_dir + "relation/" + RelationId[0:3] + "/" + RelationId[3:6], exist_ok=True)
+            paths.append(self.test_dir + "relation/" + RelationId[0:3] + "/" + RelationId[3:6] + "/" + RelationId[6:9])
+            open(paths[-1], "w").write(repr(data))
+        paths.sort()
+
+        # Migration not allowed without the lock
+        lock = lockfile(self.test_dir + "lock")
+        with self.assertRaises(BlockingIOError):
+            OsmBin(self.test_dir, "w")
+        del lock
+        assert not os.path.exists(self.test_dir + "relation.data")
+
+        # Interrupted after some relations
+        last = open(paths[-1]).read()
+        open(paths[-1], "w").write("{")
+        with self.assertRaises(SyntaxError):
+            OsmBin(self.test_dir, "w")
+        assert os.path.isdir(self.test_dir + "relation")
+        assert not os.path.exists(self.test_dir + "relation.data")
+
+        open(paths[-1], "w").write(last)
+        self.a = OsmBin(self.test_dir, "w")
+        assert not os.path.exists(self.test_dir + "relation")
+        assert not os.path.exists(self.test_dir + "relation.data.migrate")
+        for id, data in relations.items():
+            self.assertEqual(self.a.RelationGet(id), data)
+
     def test_relation_full(self):
         res = self.a.RelationFullRecur(529891)
         assert res
@@ -19,17 +19,53 @@
 ##                                                                       ##
 ###########################################################################
 
+import copy
 import psycopg2
 import psycopg2.extensions
 import psycopg2.extras
 import time
+from collections import OrderedDict
+
+
+class LRUCache(OrderedDict):
+    """
+    Dict keeping only the last size used entries.
+    """
+
+    def __init__(self, size):
+        super().__init__()
+        self.size = size
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.size:
+            self.popitem(last=False)
+
 
 ###########################################################################
 ## Reader / Writer
 
 class OsmOsis:
 
+    cache_size = 100000
+
+    _statements = {
+        'nodes': "SELECT id, st_y(geom), st_x(geom), version, user_id, tags FROM nodes WHERE id = ANY($1)",
+        'ways': "SELECT id, version, user_id, tags, nodes FROM ways WHERE id = ANY($1)",
+        'relations': "SELECT id, version, user_id, tags FROM relations WHERE id = ANY($1)",
+        'relation_members': "SELECT relation_id, member_id, member_type, member_role FROM relation_members WHERE relation_id = ANY($1) ORDER BY relation_id, sequence_id",
+        'users': "SELECT id, name FROM users WHERE id = ANY($1)",
+    }
+
     def __init__(self, dbstring, schema_path=None):
+        self._prepared = set()
+        self._cache = LRUCache(self.cache_size)
         psycopg2.extensions.register_type(psycopg2.extensions.UNICODE)
         psycopg2.extensions.register_type(psycopg2.extensions.UNICODEARRAY)
         retry = 10 * 60
@@ -74,55 +110,204 @@ class OsmOsis:
         return timestamp
 
 
+    def _execute(self, name, ids):
+        # Statements are prepared on the server on first use, for this connection
+        if name not in self._prepared:
+            self._PgCurs.execute("PREPARE osmose_{0}(bigint[]) AS {1};".format(name, self._statements[name]))
+            self._prepared.add(name)
+        self._PgCurs.execute("EXECUTE osmose_{0}(%s);".format(name), (list(ids), ))
+        return self._PgCurs.fetchall()
+
+
+    def _cached(self, type, ids, fetch):
+        ret = {}
+        missing = []
+        for id in set(ids):
+            if (type, id) in self._cache:
+                data = self._cache[(type, id)]
+                if data is not None:
+                    ret[id] = data
+            else:
+                missing.append(id)
+
+        if missing:
+            found = fetch(missing)
+            for id in missing:
+                # Also cache missing objects
+                self._cache[(type, id)] = found.get(id)
+            ret.update(found)
+
+        return ret
+
+
+    def _users(self, rows, column):
+        users = self.UsersGet(filter(lambda user_id: user_id is not None, map(lambda r: r[column], rows)))
+        return lambda user_id: users.get(user_id) or ""
+
+
+    def _nodes_fetch(self, NodeIds):
+        rows = self._execute('nodes', NodeIds)
+        user = self._users(rows, 4)
+        return dict(map(lambda r: (r[0], {
+            u"id": r[0],
+            u"lat": float(r[1]),
+            u"lon": float(r[2]),
+            u"version": r[3],
+            u"user": user(r[4]),
+            u"tag": r[5],
+        }), rows))
+
+
+    def _ways_fetch(self, WayIds):
+        rows = self._execute('ways', WayIds)
+        user = self._users(rows, 2)
+        return dict(map(lambda r: (r[0], {
+            u"id": r[0],
+            u"version": r[1],
+            u"user": user(r[2]),
+            u"tag": r[3],
+            u"nd": r[4],
+        }), rows))
+
+
+    def _relations_fetch(self, RelationIds):
+        rows = self._execute('relations', RelationIds)
+        user = self._users(rows, 2)
+        return dict(map(lambda r: (r[0], {
+            u"id": r[0],
+            u"version": r[1],
+            u"user": user(r[2]),
+            u"tag": r[3],
+            u"member": None, # Loaded on demand
+        }), rows))
+
+
+    def _relations_members(self, relations):
+        if not relations:
+            return
+        members = dict(map(lambda r: (r['id'], []), relations))
+        for r1 in self._execute('relation_members', members.keys()):
+            members[r1[0]].append({u"ref":r1[1], u"type":{"N":"node","W":"way","R":"relation"}[r1[2]], u"role":r1[3]})
+        for relation in relations:
+            relation[u"member"] = members[relation['id']]
+
+
+    def _users_fetch(self, UserIds):
+        return dict(self._execute('users', UserIds))
+
+
+    # Objects are returned as deep copies of the cached ones, callers can update them
+
+    def NodesGet(self, NodeIds):
+        """
+        Nodes by id, as a dict. Unknown ids are not in the dict.
+        """
+        return dict(map(lambda kv: (kv[0], copy.deepcopy(kv[1])), self._cached('N', NodeIds, self._nodes_fetch).items()))
+
+
+    def WaysGet(self, WayIds, dump_sub_elements=False):
+        """
+        Ways by id, as a dict. Unknown ids are not in the dict.
+        """
+        ways = {}
+        for id, way in self._cached('W', WayIds, self._ways_fetch).items():
+            ways[id] = copy.deepcopy(way if dump_sub_elements else dict(way, nd=[]))
+        return ways
+
+
+    def RelationsGet(self, RelationIds, dump_sub_elements=False):
+        """
+        Relations by id, as a dict. Unknown ids are not in the dict.
+        """
+        relations = self._cached('R', RelationIds, self._relations_fetch)
+        if dump_sub_elements:
+            self._relations_members(list(filter(lambda relation: relation[u"member"] is None, relations.values())))
+
+        ret = {}
+        for id, relation in relations.items():
+            ret[id] = copy.deepcopy(relation if dump_sub_elements else dict(relation, member=[]))
+        return ret
+
+
+    def UsersGet(self, UserIds):
+        """
+        User names by id, as a dict. Unknown ids are not in the dict.
+        """
+        return self._cached('U', UserIds, self._users_fetch)
+
+
+    def Prefetch(self, nodes=[], ways=[], relations=[]):
+        """
+        Load a batch of objects in the cache, before getting them one by one.
+        """
+        if nodes:
+            self._cached('N', nodes, self._nodes_fetch)
+        if ways:
+            self._cached('W', ways, self._ways_fetch)
+        if relations:
+            self._cached('R', relations, self._relations_fetch)
+
+
     def NodeGet(self, NodeId):
-        self._PgCurs.execute("SELECT nodes.id, st_y(nodes.geom), st_x(nodes.geom), nodes.version, users.name, nodes.tags FROM nodes LEFT JOIN users ON nodes.user_id = users.id WHERE nodes.id = %d;" % NodeId)
-        r1 = self._PgCurs.fetchone()
-        if not r1: return None
-        return {
-            u"id": r1[0],
-            u"lat": float(r1[1]),
-            u"lon": float(r1[2]),
-            u"version": r1[3],
-            u"user": r1[4] or "",
-            u"tag": r1[5],
-        }
+        return self.NodesGet([NodeId]).get(NodeId)
 
 
     def WayGet(self, WayId, dump_sub_elements=False):
-        self._PgCurs.execute("SELECT ways.id, ways.version, users.name, ways.tags, ways.nodes FROM ways LEFT JOIN users ON ways.user_id = users.id WHERE ways.id = %d;" % WayId)
-        r1 = self._PgCurs.fetchone()
-        if not r1: return None
-        return {
-            u"id": r1[0],
-            u"version": r1[1],
-            u"user": r1[2] or "",
-            u"tag": r1[3],
-            u"nd": r1[4] if dump_sub_elements else [],
-        }
+        return self.WaysGet([WayId], dump_sub_elements).get(WayId)
 
 
     def RelationGet(self, RelationId, dump_sub_elements=False):
-        self._PgCurs.execute("SELECT relations.id, relations.version, users.name, relations.tags FROM relations LEFT JOIN users ON relations.user_id = users.id WHERE relations.id = %d;" % RelationId)
-        r1 = self._PgCurs.fetchone()
-        if not r1: return None
-        data = {
-            u"id": r1[0],
-            u"version": r1[1],
-            u"user": r1[2] or "",
-            u"tag": r1[3],
-            u"member": [],
-        }
+        return self.RelationsGet([RelationId], dump_sub_elements).get(RelationId)
 
-        if dump_sub_elements:
-            self._PgCurs.execute("SELECT member_id, member_type, member_role FROM relation_members WHERE relation_id = %d ORDER BY sequence_id;" % RelationId)
-            for r1 in self._PgCurs.fetchall():
-                data[u"member"].append({u"ref":r1[0], u"type":{"N":"node","W":"way","R":"relation"}[r1[1]], u"role":r1[2]})
 
-        return data
+    def UserGet(self, UserId):
+        return self.UsersGet([UserId]).get(UserId)
 
 
-    def UserGet(self, UserId):
-        self._PgCurs.execute("SELECT name FROM users WHERE id = %d;" % UserId)
-        r1 = self._PgCurs.fetchone()
-        if not r1: return None
-        return r1[0]
+###########################################################################
+import unittest
+
+class Test(unittest.TestCase):
+
+    def test_lru_cache(self):
+        c = LRUCache(2)
+        c[1] = 'a'
+        c[2] = 'b'
+        self.assertEqual(c[1], 'a')
+        c[3] = 'c'
+        self.assertEqual(list(c.keys()), [1, 3])
+        self.assertNotIn(2, c)
+        c[1] = 'd'
+        c[4] = 'e'
+        self.assertEqual(dict(c), {1: 'd', 4: 'e'})
+
+    def test_cache_copy(self):
+        class OsmOsisRows(OsmOsis):
+            def __init__(self):
+                self._cache = LRUCache(self.cache_size)
+
+            def _execute(self, name, ids):
+                return {
+                    'nodes': [(1, 43.7, 7.4, 1, 10, {'amenity': 'bench'})],
+                    'ways': [(2, 1, 10, {'highway': 'path'}, [1, 3])],
+                    'relations': [(4, 1, 10, {'type': 'route'})],
+                    'relation_members': [(4, 2, 'W', 'outer')],
+                    'users': [(10, 'u')],
+                }[name]
+
+        osmosis = OsmOsisRows()
+        node = osmosis.NodeGet(1)
+        way = osmosis.WayGet(2, dump_sub_elements=True)
+        relation = osmosis.RelationGet(4, dump_sub_elements=True)
+        node['tag']['amenity'] = 'x'
+        way['tag']['highway'] = 'x'
+        way['nd'].append(5)
+        relation['member'][0]['role'] = 'x'
+
+        # The cached objects are unchanged
+        self.assertEqual(osmosis.NodeGet(1)['tag'], {'amenity': 'bench'})
+        self.assertEqual(osmosis.WayGet(2, dump_sub_elements=True)['nd'], [1, 3])
+        self.assertEqual(osmosis.WayGet(2)['tag'], {'highway': 'path'})
+        self.assertEqual(osmosis.WayGet(2)['nd'], [])
+        self.assertEqual(osmosis.RelationGet(4, dump_sub_elements=True)['member'], [{'ref': 2, 'type': 'way', 'role': 'outer'}])
+        self.assertEqual(osmosis.RelationGet(4)['member'], [])
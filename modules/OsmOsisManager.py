@@ -23,6 +23,11 @@ from modules import download
 from modules.lockfile import lockfile
 from modules.OsmOsis import OsmOsis
 from modules.OsmState import OsmState
+from modules.OsmSax import OscMerger
+from modules import OsmPgsqlDump
+from modules import TagsIndex
+from modules import SqlScheduler
+from modules import config
 import sys
 import os
 import psycopg2
@@ -31,6 +36,7 @@ import shutil
 import datetime
 import time
 import subprocess
+import threading
 try: # osmium still optional for now
     import osmium # type: ignore
 except:
@@ -51,6 +57,12 @@ class OsmOsisManager:
     self.db_persistent = db_persistent
     self.logger = logger
 
+    # One database connection by thread, analysers can run concurrently.
+    # Connections of all threads stay referenced from _connections: a forked
+    # process must not release, and so close, the ones of its parent.
+    self._thread_local = threading.local()
+    self._connections = []
+
     self.db_string = ""
     if self.db_host:
       self.db_string += "host=%s " % self.db_host
@@ -73,24 +85,37 @@ class OsmOsisManager:
 
 
   def __del__(self):
-    if hasattr(self, '_osmosis') and self._osmosis:
-      self._osmosis.close()
+    for (pid, osmosis) in self.__dict__.get('_connections', []):
+      if pid == os.getpid():
+        osmosis.close()
+
+
+  def _local(self):
+    local = self._thread_local
+    if getattr(local, 'pid', None) != os.getpid():
+      local.pid = os.getpid()
+      local.osmosis = None
+    return local
 
 
   def osmosis(self, schema_path=True):
-    if not hasattr(self, '_osmosis'):
+    local = self._local()
+    if not local.osmosis:
       if schema_path:
-        self._osmosis = OsmOsis(self.db_string, self.conf.db_schema_path or self.db_schema)
+        local.osmosis = OsmOsis(self.db_string, self.conf.db_schema_path or self.db_schema)
       else:
-        self._osmosis = OsmOsis(self.db_string)
+        local.osmosis = OsmOsis(self.db_string)
+      self._connections.append((local.pid, local.osmosis))
 
-    return self._osmosis
+    return local.osmosis
 
 
   def osmosis_close(self):
-    if hasattr(self, '_osmosis'):
-      self._osmosis.close()
-      del self._osmosis
+    local = self._local()
+    if local.osmosis:
+      local.osmosis.close()
+      self._connections.remove((local.pid, local.osmosis))
+      local.osmosis = None
 
 
   def psql_c(self, sql):
@@ -152,6 +177,9 @@ class OsmOsisManager:
 
 
   def init_database(self, conf, options):
+    if options.import_tool == "pyosmium":
+      OsmPgsqlDump.check_osmium()
+
     # import osmosis
 
     # drop schema if present - might be remaining from a previous failing import
@@ -170,12 +198,13 @@ class OsmOsisManager:
       self.psql_f(script)
 
     # data
-    if options.import_tool == "osmosis-parallel":
-      # Run osmosis and psql import in parallel, thanks to named fifos to send
-      # generated tables directly to COPY functions.
+    if options.import_tool in ("osmosis-parallel", "pyosmium"):
+      # Run osmosis, or pyosmium, and psql import in parallel, thanks to named
+      # fifos to send generated tables directly to COPY functions.
       parallel = True
     else:
       parallel = False
+    pyosmium = options.import_tool == "pyosmium"
 
     self.logger.log(self.logger.log_av_r+"import osmosis data"+self.logger.log_ap)
     cmd  = [conf.bin_osmosis]
@@ -200,11 +229,12 @@ class OsmOsisManager:
     try:
       bg_proc = []
 
-      bg_proc.append((self.logger.execute_err(cmd, background=parallel), "osmosis"))
-      if parallel:
-        # Reading stdout/stderr must not block
-        os.set_blocking(bg_proc[-1][0].stdout.fileno(), False)
-        os.set_blocking(bg_proc[-1][0].stderr.fileno(), False)
+      if not pyosmium:
+        bg_proc.append((self.logger.execute_err(cmd, background=parallel), "osmosis"))
+        if parallel:
+          # Reading stdout/stderr must not block
+          os.set_blocking(bg_proc[-1][0].stdout.fileno(), False)
+          os.set_blocking(bg_proc[-1][0].stderr.fileno(), False)
 
       for script in conf.osmosis_import_prepare_scripts:
         self.psql_f(script, cwd=dir_country_tmp)
@@ -215,6 +245,13 @@ class OsmOsisManager:
           os.set_blocking(bg_proc[-1][0].stdout.fileno(), False)
           os.set_blocking(bg_proc[-1][0].stderr.fileno(), False)
 
+      if pyosmium:
+        # Each table file is closed once written, so indexes are built by
+        # psql while the next tables are still read
+        self.logger.log("  pyosmium: start")
+        OsmPgsqlDump.dump(conf.download["dst"], dir_country_tmp)
+        self.logger.log("  pyosmium: end")
+
       if parallel:
         # Wait for all background processes, and get their stdout/stderr messages
         while bg_proc:
@@ -248,14 +285,54 @@ class OsmOsisManager:
       # clean even in case of an exception
       shutil.rmtree(dir_country_tmp, ignore_errors=True)
 
-    # post import scripts
+    # post import scripts, and tags indexes
     self.logger.log(self.logger.log_av_r+"import osmosis post scripts"+self.logger.log_ap)
-    for script in conf.osmosis_post_scripts:
-      self.psql_f(script)
+    units = SqlScheduler.script_units(conf.osmosis_post_scripts)
+    for (i, sql) in enumerate(self.tags_index(conf, options)):
+      units.append(SqlScheduler.Unit("tags index %d" % i, sql=sql))
+    self.run_units(units, getattr(options, 'post_import_workers', 1))
 
     self.osmosis_close()
 
 
+  def tags_index(self, conf, options):
+    # Partial indexes on the tags keys used by the osmosis and merge analysers
+    # to run. Only the most used ones on full runs, all the needed ones when
+    # the analysers are given on the command line. Always the floor ones.
+    analysers = getattr(options, 'analyser', None)
+    if analysers:
+      (min_weight, max_indexes) = (1, None)
+    else:
+      analysers = list(getattr(conf, 'analyser', {}).keys()) or None
+      (min_weight, max_indexes) = (TagsIndex.MIN_WEIGHT, TagsIndex.MAX_INDEXES)
+
+    weights = TagsIndex.collect(TagsIndex.analyser_files(TagsIndex.ANALYSERS_DIR, analysers))
+    sqls = TagsIndex.plan(weights, min_weight=min_weight, max_indexes=max_indexes, floor=TagsIndex.FLOOR)
+    self.logger.sub().log("%d tags indexes" % len(sqls))
+    return sqls
+
+
+  def run_units(self, units, workers):
+    # Units of SQL on concurrent sessions, each thread has its own connection
+    def execute(unit):
+      start = time.time()
+      if unit.script:
+        self.psql_f(unit.script)
+      else:
+        gisconn = self.osmosis().conn()
+        giscurs = gisconn.cursor()
+        if config.db_maintenance_work_mem is not None:
+          giscurs.execute("SET maintenance_work_mem = %s", [config.db_maintenance_work_mem])
+        if config.db_max_parallel_maintenance_workers is not None:
+          giscurs.execute("SET max_parallel_maintenance_workers = %s", [config.db_max_parallel_maintenance_workers])
+        giscurs.execute(unit.sql)
+        gisconn.commit()
+        giscurs.close()
+      self.logger.sub().log("%s: %.1fs" % (unit.name, time.time() - start))
+
+    SqlScheduler.run(units, execute, workers, close=self.osmosis_close)
+
+
   def update_metainfo(self, conf):
     # Fill metainfo table
     gisconn = self.osmosis().conn()
@@ -372,19 +449,27 @@ class OsmOsisManager:
     diff_path = conf.download["diff_path"]
     xml_change = os.path.join(diff_path, "change.osc.gz")
     tmp_pbf_file = conf.download["dst"] + ".tmp"
-
-    shutil.copyfile(os.path.join(diff_path, "state.txt"),
-                    os.path.join(diff_path, "state.txt.old"))
+    state_file = os.path.join(diff_path, "state.txt")
 
     dir_country_tmp = os.path.join(self.conf.dir_tmp, self.db_schema)
     shutil.rmtree(dir_country_tmp, ignore_errors=True)
     os.makedirs(dir_country_tmp)
 
+    # osmosis advances the state of its working directory, run it on a copy.
+    # The state is installed only once the extract is rewritten.
+    work_path = os.path.join(dir_country_tmp, "replication")
+    os.makedirs(work_path)
+    for fn in os.listdir(diff_path):
+      if fn.endswith(".txt"):
+        shutil.copyfile(os.path.join(diff_path, fn), os.path.join(work_path, fn))
+    work_state_file = os.path.join(work_path, "state.txt")
+
     try:
       is_uptodate = False
       nb_iter = 0
+      change_files = []
 
-      osm_state = OsmState(os.path.join(diff_path, "state.txt"))
+      osm_state = OsmState(work_state_file)
       prev_state_ts = osm_state.timestamp()
       cur_ts = datetime.datetime.today()
       print("state: ", osm_state.timestamp(), end=' ')
@@ -393,14 +478,16 @@ class OsmOsisManager:
         self.logger.log(self.logger.log_av_r + "stop updates, to download full extract" + self.logger.log_ap)
         return (False, None)
 
+      # Download all pending diffs, each run of osmosis reads up to maxInterval
       while not is_uptodate and nb_iter < 10:
         nb_iter += 1
         self.logger.log("iteration=%d" % nb_iter)
+        change_file = os.path.join(dir_country_tmp, "change-%d.osc.gz" % nb_iter)
 
         try:
           cmd  = [conf.bin_osmosis]
-          cmd += ["--read-replication-interval", "workingDirectory=%s" % diff_path]
-          cmd += ["--simplify-change", "--write-xml-change", "file=%s" % xml_change]
+          cmd += ["--read-replication-interval", "workingDirectory=%s" % work_path]
+          cmd += ["--simplify-change", "--write-xml-change", "file=%s" % change_file]
           cmd += ["-quiet"]
           self.logger.execute_err(cmd)
         except:
@@ -408,18 +495,10 @@ class OsmOsisManager:
           time.sleep(2*60)
           continue
 
-        cmd  = [conf.bin_osmosis]
-        cmd += ["--read-xml-change", "file=%s" % xml_change]
-        cmd += ["--read-pbf", "file=%s" % conf.download["dst"] ]
-        cmd += ["--apply-change", "--buffer"]
-        cmd += ["--write-pbf", "file=%s" % tmp_pbf_file]
-        cmd += ["-quiet"]
-        self.logger.execute_err(cmd)
-
-        shutil.move(tmp_pbf_file, conf.download["dst"])
+        change_files.append(change_file)
 
         # find if state.txt is more recent than one day
-        osm_state = OsmState(os.path.join(diff_path, "state.txt"))
+        osm_state = OsmState(work_state_file)
         cur_ts = datetime.datetime.today()
         print("state: ", nb_iter, " - ", osm_state.timestamp(), end=' ')
         if prev_state_ts is not None:
@@ -431,21 +510,39 @@ class OsmOsisManager:
         else:
           prev_state_ts = osm_state.timestamp()
 
+      if change_files:
+        if len(change_files) == 1:
+          shutil.move(change_files[0], xml_change)
+        else:
+          self.logger.log("merge %d change files" % len(change_files))
+          merger = OscMerger()
+          for change_file in change_files:
+            merger.add(change_file)
+          merger.write(xml_change)
+          del merger
+
+        cmd  = [conf.bin_osmosis]
+        cmd += ["--read-xml-change", "file=%s" % xml_change]
+        cmd += ["--read-pbf", "file=%s" % conf.download["dst"] ]
+        cmd += ["--apply-change", "--buffer"]
+        cmd += ["--write-pbf", "file=%s" % tmp_pbf_file]
+        cmd += ["-quiet"]
+        self.logger.execute_err(cmd)
+
+        shutil.move(tmp_pbf_file, conf.download["dst"])
+        shutil.copyfile(work_state_file, state_file + ".tmp")
+        os.replace(state_file + ".tmp", state_file)
+
       if not is_uptodate:
         # we didn't get the latest version of the pbf file
         self.logger.log(self.logger.log_av_r + "didn't get latest version of osm file" + self.logger.log_ap)
         return (False, None)
-      elif nb_iter == 1:
-        return (True, xml_change)
       else:
-        # TODO: we should return a merge of all xml change files
-        return (True, None)
+        return (True, xml_change)
 
     except:
       shutil.rmtree(dir_country_tmp, ignore_errors=True)
       self.logger.err("got error, aborting")
-      shutil.copyfile(os.path.join(diff_path, "state.txt.old"),
-                      os.path.join(diff_path, "state.txt"))
 
       raise
 
@@ -632,3 +729,74 @@ class OsmOsisManager:
     gisconn.close()
 
     return version
+
+
+###########################################################################
+import unittest
+
+class Test(unittest.TestCase):
+
+  def setUp(self):
+    import tempfile
+    self.dir = tempfile.TemporaryDirectory()
+    self.diff_path = os.path.join(self.dir.name, "diff")
+    os.makedirs(self.diff_path)
+    self.state = "timestamp=" + (datetime.datetime.utcnow() - datetime.timedelta(days=2)).strftime("%Y-%m-%dT%H\\:%M\\:%SZ") + "\n"
+    with open(os.path.join(self.diff_path, "state.txt"), "w") as f:
+      f.write(self.state)
+    with open(os.path.join(self.diff_path, "configuration.txt"), "w") as f:
+      f.write("baseUrl=http://localhost/\n")
+    self.dst = os.path.join(self.dir.name, "extract.osm.pbf")
+    with open(self.dst, "wb") as f:
+      f.write(b"old")
+
+  def tearDown(self):
+    self.dir.cleanup()
+
+  def osmosis_diff(self, rewrite_status):
+    # Fake osmosis, the replication writes a new state, the extract rewrite exits with rewrite_status
+    bin_osmosis = os.path.join(self.dir.name, "osmosis")
+    with open(bin_osmosis, "w") as f:
+      f.write("""#!{0}
+import datetime, os, sys
+args = dict(map(lambda a: a.split('=', 1), filter(lambda a: '=' in a, sys.argv[1:])))
+if '--read-replication-interval' in sys.argv:
+  with open(os.path.join(args['workingDirectory'], 'state.txt'), 'w') as f:
+    f.write('timestamp=' + datetime.datetime.utcnow().strftime('%Y-%m-%dT%H\\\\:%M\\\\:%SZ') + '\\n')
+  open(args['file'], 'wb').close()
+else:
+  open(args['file'], 'wb').write(b'new')
+  sys.exit({1})
+""".format(sys.executable, rewrite_status))
+    os.chmod(bin_osmosis, 0o755)
+
+    class conf:
+      dir_tmp = self.dir.name
+      download = {"diff_path": self.diff_path, "dst": self.dst}
+    conf.bin_osmosis = bin_osmosis
+
+    import io
+    from modules import OsmoseLog
+    manager = OsmOsisManager.__new__(OsmOsisManager)
+    manager.conf = conf
+    manager.db_schema = "test"
+    manager.logger = OsmoseLog.logger(io.StringIO())
+    return manager.run_osmosis_diff(conf)
+
+  def test_diff_rewrite_fails(self):
+    with self.assertRaises(RuntimeError):
+      self.osmosis_diff(1)
+
+    # Neither the state nor the extract moved
+    with open(os.path.join(self.diff_path, "state.txt")) as f:
+      self.assertEqual(f.read(), self.state)
+    with open(self.dst, "rb") as f:
+      self.assertEqual(f.read(), b"old")
+
+  def test_diff(self):
+    self.assertEqual(self.osmosis_diff(0), (True, os.path.join(self.diff_path, "change.osc.gz")))
+
+    with open(os.path.join(self.diff_path, "state.txt")) as f:
+      self.assertGreater(OsmState(f.name).timestamp(), datetime.datetime.utcnow() - datetime.timedelta(days=1))
+    with open(self.dst, "rb") as f:
+      self.assertEqual(f.read(), b"new")
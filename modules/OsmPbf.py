@@ -21,6 +21,7 @@
 
 from . import OsmPbf_libosmbf
 OsmPbfReader = OsmPbf_libosmbf.OsmPbfReader
+OsmPbfBlockReader = OsmPbf_libosmbf.OsmPbfBlockReader
 MockCountObjects = OsmPbf_libosmbf.MockCountObjects
 
 ###########################################################################
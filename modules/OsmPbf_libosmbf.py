@@ -20,6 +20,7 @@
 ###########################################################################
 
 import dateutil.parser
+import struct
 from . import config
 from .osm_pbf_parser import osm_pbf_parser
 from .OsmState import OsmState
@@ -32,13 +33,12 @@ except:
     have_osmium = False
 
 
-class OsmPbfReader(OsmReader, osm_pbf_parser.Visitor):
+class OsmPbfReaderBase(OsmReader):
 
     def log(self, txt):
         self._logger.log(txt)
 
     def __init__(self, pbf_file, logger = dummylog(), state_file = None):
-        osm_pbf_parser.Visitor.__init__(self)
         self._pbf_file = pbf_file
         self._state_file = state_file
         self._logger = logger
@@ -47,6 +47,18 @@ class OsmPbfReader(OsmReader, osm_pbf_parser.Visitor):
     def set_filter_since_timestamp(self, since_timestamp):
         self.set_since_timestamp(int(since_timestamp.timestamp()) if since_timestamp else 0)
 
+    @staticmethod
+    def _metadata(data, version, uid, user):
+        # Files can be written without metadata, the parser then gives -1
+        # version and uid, and an empty user
+        if version > 0:
+            data['version'] = version
+        if uid >= 0:
+            data['uid'] = uid
+        if user:
+            data['user'] = user
+        return data
+
     def timestamp(self):
         if have_osmium:
             try:
@@ -80,44 +92,207 @@ class OsmPbfReader(OsmReader, osm_pbf_parser.Visitor):
                 return
 
 
+class OsmPbfReader(OsmPbfReaderBase, osm_pbf_parser.Visitor):
+
+    def __init__(self, pbf_file, logger = dummylog(), state_file = None):
+        osm_pbf_parser.Visitor.__init__(self)
+        OsmPbfReaderBase.__init__(self, pbf_file, logger, state_file)
+
     def CopyTo(self, output):
         self._output = output
         osm_pbf_parser.read_osm_pbf(self._pbf_file, self)
 
 
-    def node(self, osmid, lon, lat, tags, timestamp):
+    def node(self, osmid, lon, lat, tags, timestamp, version, uid, user):
         data = {
             'id': osmid,
             'lon': lon,
             'lat': lat,
             'tag': tags,
-            #'version'
             'timestamp': timestamp,
-            #'uid'
         }
-        self._output.NodeCreate(data)
+        self._output.NodeCreate(self._metadata(data, version, uid, user))
 
-    def way(self, osmid, tags, refs, timestamp):
+    def way(self, osmid, tags, refs, timestamp, version, uid, user):
         data = {
             'id': osmid,
             'tag': tags,
             'nd': refs,
-            #'version'
             'timestamp': timestamp,
-            #'uid'
         }
-        self._output.WayCreate(data)
+        self._output.WayCreate(self._metadata(data, version, uid, user))
 
-    def relation(self, osmid, tags, ref, timestamp):
+    def relation(self, osmid, tags, ref, timestamp, version, uid, user):
         data = {
             'id': osmid,
             'tag': tags,
-            #'version'
             'timestamp': timestamp,
-            #'uid'
             'member': ref,
         }
-        self._output.RelationCreate(data)
+        self._output.RelationCreate(self._metadata(data, version, uid, user))
+
+
+class OsmPbfBlockReader(OsmPbfReaderBase, osm_pbf_parser.BlockVisitor):
+    """
+    Reader receiving one PrimitiveBlock at a time from the parser, as columns
+    sharing the block string table. Blocks without any of the keys given to
+    set_key_filter() are skipped without being converted to Python objects. Their
+    objects are not reported by filtered_nodes(), filtered_ways() and
+    filtered_relations(), they have none of the keys and so no issue to keep.
+    """
+
+    member_types = ('node', 'way', 'relation')
+
+    def __init__(self, pbf_file, logger = dummylog(), state_file = None):
+        osm_pbf_parser.BlockVisitor.__init__(self)
+        OsmPbfReaderBase.__init__(self, pbf_file, logger, state_file)
+        self._blob_range = None
+
+    def CopyTo(self, output):
+        self._output = output
+        if self._blob_range:
+            osm_pbf_parser.read_osm_pbf_blocks(self._pbf_file, self, *self._blob_range)
+        else:
+            osm_pbf_parser.read_osm_pbf_blocks(self._pbf_file, self)
+
+    def set_blob_range(self, start, end):
+        """
+        Limit CopyTo() to the blobs between start and end byte offsets, as
+        returned by shards().
+        """
+        self._blob_range = (start, end)
+
+    @staticmethod
+    def _varint(buf, pos):
+        result = 0
+        shift = 0
+        while True:
+            b = buf[pos]
+            pos += 1
+            result |= (b & 0x7f) << shift
+            if not b & 0x80:
+                return (result, pos)
+            shift += 7
+
+    @classmethod
+    def _blob_header(cls, buf):
+        # Minimal protobuf decoding of BlobHeader: type (1) and datasize (3)
+        blob_type = None
+        datasize = 0
+        pos = 0
+        while pos < len(buf):
+            (key, pos) = cls._varint(buf, pos)
+            if key & 7 == 0:
+                (value, pos) = cls._varint(buf, pos)
+                if key >> 3 == 3:
+                    datasize = value
+            elif key & 7 == 2:
+                (length, pos) = cls._varint(buf, pos)
+                if key >> 3 == 1:
+                    blob_type = bytes(buf[pos:pos + length])
+                pos += length
+            else:
+                raise ValueError("Unexpected wire type in blob header")
+        return (blob_type, datasize)
+
+    def blob_offsets(self):
+        """
+        Start and end byte offsets of each OSMData blob of the file.
+        """
+        offsets = []
+        with open(self._pbf_file, 'rb') as f:
+            while True:
+                start = f.tell()
+                header_size = f.read(4)
+                if len(header_size) < 4:
+                    break
+                (blob_type, datasize) = self._blob_header(f.read(struct.unpack('!i', header_size)[0]))
+                f.seek(datasize, 1)
+                if blob_type == b'OSMData':
+                    offsets.append((start, f.tell()))
+        return offsets
+
+    def shards(self, n):
+        """
+        Split the file in at most n contiguous ranges of blobs of about the
+        same size, in file order.
+        """
+        offsets = self.blob_offsets()
+        if not offsets:
+            return []
+        total = offsets[-1][1] - offsets[0][0]
+        ranges = []
+        start = offsets[0][0]
+        for (blob_start, blob_end) in offsets:
+            if blob_end - offsets[0][0] >= total * (len(ranges) + 1) / n:
+                ranges.append((start, blob_end))
+                start = blob_end
+        if start < offsets[-1][1]:
+            ranges.append((start, offsets[-1][1]))
+        return ranges
+
+    @staticmethod
+    def _tags(strings, tags, start, end):
+        return {strings[tags[j]]: strings[tags[j + 1]] for j in range(start, end, 2)}
+
+    def block(self, strings, nodes, ways, relations):
+        tags = memoryview(nodes['tags']).cast('i')
+        tags_offset = memoryview(nodes['tags_offset']).cast('q')
+        ids = memoryview(nodes['id']).cast('q')
+        version = memoryview(nodes['version']).cast('i')
+        timestamp = memoryview(nodes['timestamp']).cast('q')
+        uid = memoryview(nodes['uid']).cast('q')
+        user_sid = memoryview(nodes['user_sid']).cast('i')
+        lon = memoryview(nodes['lon']).cast('d')
+        lat = memoryview(nodes['lat']).cast('d')
+        for i in range(len(ids)):
+            self._output.NodeCreate(self._metadata({
+                'id': ids[i],
+                'lon': lon[i],
+                'lat': lat[i],
+                'tag': self._tags(strings, tags, tags_offset[i], tags_offset[i + 1]),
+                'timestamp': timestamp[i],
+            }, version[i], uid[i], strings[user_sid[i]] if user_sid[i] >= 0 else None))
+
+        tags = memoryview(ways['tags']).cast('i')
+        tags_offset = memoryview(ways['tags_offset']).cast('q')
+        refs = memoryview(ways['refs']).cast('q')
+        refs_offset = memoryview(ways['refs_offset']).cast('q')
+        ids = memoryview(ways['id']).cast('q')
+        version = memoryview(ways['version']).cast('i')
+        timestamp = memoryview(ways['timestamp']).cast('q')
+        uid = memoryview(ways['uid']).cast('q')
+        user_sid = memoryview(ways['user_sid']).cast('i')
+        for i in range(len(ids)):
+            self._output.WayCreate(self._metadata({
+                'id': ids[i],
+                'tag': self._tags(strings, tags, tags_offset[i], tags_offset[i + 1]),
+                'nd': refs[refs_offset[i]:refs_offset[i + 1]].tolist(),
+                'timestamp': timestamp[i],
+            }, version[i], uid[i], strings[user_sid[i]] if user_sid[i] >= 0 else None))
+
+        tags = memoryview(relations['tags']).cast('i')
+        tags_offset = memoryview(relations['tags_offset']).cast('q')
+        member_ids = memoryview(relations['member_ids']).cast('q')
+        member_types = relations['member_types']
+        member_roles = memoryview(relations['member_roles']).cast('i')
+        members_offset = memoryview(relations['members_offset']).cast('q')
+        ids = memoryview(relations['id']).cast('q')
+        version = memoryview(relations['version']).cast('i')
+        timestamp = memoryview(relations['timestamp']).cast('q')
+        uid = memoryview(relations['uid']).cast('q')
+        user_sid = memoryview(relations['user_sid']).cast('i')
+        for i in range(len(ids)):
+            self._output.RelationCreate(self._metadata({
+                'id': ids[i],
+                'tag': self._tags(strings, tags, tags_offset[i], tags_offset[i + 1]),
+                'timestamp': timestamp[i],
+                'member': [{
+                    'ref': member_ids[j],
+                    'role': strings[member_roles[j]],
+                    'type': self.member_types[member_types[j]],
+                } for j in range(members_offset[i], members_offset[i + 1])],
+            }, version[i], uid[i], strings[user_sid[i]] if user_sid[i] >= 0 else None))
 
 
 ###########################################################################
@@ -165,3 +340,122 @@ class Test(unittest.TestCase):
         self.assertEqual(o1.num_ways, 3833)
         self.assertEqual(o1.num_rels, 55)
         self.assertEqual(i1.timestamp(), dateutil.parser.parse("2017-09-03T23:40:03Z").replace(tzinfo=None))
+
+    def test_block_copy_all(self):
+        i1 = OsmPbfBlockReader("tests/saint_barthelemy.osm.pbf", state_file = "tests/saint_barthelemy.state.txt")
+        o1 = MockCountObjects()
+        i1.CopyTo(o1)
+        self.assertEqual(o1.num_nodes, 83)  # only nodes with tags are reported
+        self.assertEqual(o1.num_ways, 625)
+        self.assertEqual(o1.num_rels, 16)
+        self.assertEqual(i1.timestamp(), dateutil.parser.parse("2015-03-25T19:05:08Z").replace(tzinfo=None))
+
+    def test_block_same_as_object(self):
+        class MockStoreObjects:
+            def __init__(self):
+                self.objects = []
+
+            def NodeCreate(self, data):
+                self.objects.append(('node', data['id'], data['tag'], round(data['lon'], 7), round(data['lat'], 7)))
+
+            def WayCreate(self, data):
+                self.objects.append(('way', data['id'], data['tag'], data['nd']))
+
+            def RelationCreate(self, data):
+                self.objects.append(('relation', data['id'], data['tag'], data['member']))
+
+        i1 = OsmPbfReader("tests/gibraltar.osm.pbf")
+        o1 = MockStoreObjects()
+        i1.CopyTo(o1)
+        i2 = OsmPbfBlockReader("tests/gibraltar.osm.pbf")
+        o2 = MockStoreObjects()
+        i2.CopyTo(o2)
+        self.assertEqual(o1.objects, o2.objects)
+
+    def test_metadata(self):
+        class MockStoreObjects:
+            def __init__(self):
+                self.objects = {}
+
+            def NodeCreate(self, data):
+                self.objects[('node', data['id'])] = data
+
+            def WayCreate(self, data):
+                self.objects[('way', data['id'])] = data
+
+            def RelationCreate(self, data):
+                self.objects[('relation', data['id'])] = data
+
+        i1 = OsmPbfReader("tests/saint_barthelemy.osm.pbf")
+        o1 = MockStoreObjects()
+        i1.CopyTo(o1)
+        i2 = OsmPbfBlockReader("tests/saint_barthelemy.osm.pbf")
+        o2 = MockStoreObjects()
+        i2.CopyTo(o2)
+
+        node = o1.objects[('node', 266967419)]
+        self.assertEqual((node['version'], node['uid'], node['user']), (4, 10610, 'RedFox'))
+        way = o1.objects[('way', 24552859)]
+        self.assertEqual((way['version'], way['uid'], way['user']), (3, 464034, 'apexer'))
+        for key in o1.objects.keys():
+            self.assertEqual(
+                [o1.objects[key].get(k) for k in ('version', 'uid', 'user', 'timestamp')],
+                [o2.objects[key].get(k) for k in ('version', 'uid', 'user', 'timestamp')])
+
+    def test_block_key_filter(self):
+        i1 = OsmPbfBlockReader("tests/saint_barthelemy.osm.pbf")
+        i1.set_key_filter(["not-a-key"])
+        o1 = MockCountObjects()
+        i1.CopyTo(o1)
+        self.assertEqual(o1.num_nodes + o1.num_ways + o1.num_rels, 0)
+        # Objects of the skipped blocks are not filtered, only the nodes without tags
+        i2 = OsmPbfReader("tests/saint_barthelemy.osm.pbf")
+        i2.CopyTo(MockCountObjects())
+        self.assertEqual(len(i1.filtered_nodes()), len(i2.filtered_nodes()))
+        self.assertEqual(len(i1.filtered_ways()), 0)
+        self.assertEqual(len(i1.filtered_relations()), 0)
+        # Unless older than the since timestamp
+        i1 = OsmPbfBlockReader("tests/saint_barthelemy.osm.pbf")
+        i1.set_key_filter(["not-a-key"])
+        i1.set_filter_since_timestamp(dateutil.parser.parse("2100-01-01"))
+        i1.CopyTo(MockCountObjects())
+        self.assertEqual(len(i1.filtered_ways()), 625)
+        self.assertEqual(len(i1.filtered_relations()), 16)
+
+        i1 = OsmPbfBlockReader("tests/saint_barthelemy.osm.pbf")
+        i1.set_key_filter(["highway"])
+        o1 = MockCountObjects()
+        i1.CopyTo(o1)
+        self.assertGreater(o1.num_ways, 0)
+
+    def test_block_shards(self):
+        i1 = OsmPbfBlockReader("tests/gibraltar.osm.pbf")
+        offsets = i1.blob_offsets()
+        self.assertGreater(len(offsets), 1)
+        shards = i1.shards(3)
+        self.assertLessEqual(len(shards), 3)
+        self.assertEqual(shards[0][0], offsets[0][0])
+        self.assertEqual(shards[-1][1], offsets[-1][1])
+
+        o1 = MockCountObjects()
+        for (start, end) in shards:
+            i1.set_blob_range(start, end)
+            i1.CopyTo(o1)
+        self.assertEqual(o1.num_nodes, 850)
+        self.assertEqual(o1.num_ways, 3833)
+        self.assertEqual(o1.num_rels, 55)
+
+    def test_block_since_timestamp(self):
+        import datetime
+        i1 = OsmPbfReader("tests/saint_barthelemy.osm.pbf")
+        i1.set_filter_since_timestamp(datetime.datetime(2012, 7, 18, 11, 4, 56))
+        o1 = MockCountObjects()
+        i1.CopyTo(o1)
+        i2 = OsmPbfBlockReader("tests/saint_barthelemy.osm.pbf")
+        i2.set_filter_since_timestamp(datetime.datetime(2012, 7, 18, 11, 4, 56))
+        o2 = MockCountObjects()
+        i2.CopyTo(o2)
+        self.assertEqual((o1.num_nodes, o1.num_ways, o1.num_rels), (o2.num_nodes, o2.num_ways, o2.num_rels))
+        self.assertEqual(sorted(i1.filtered_nodes()), sorted(i2.filtered_nodes()))
+        self.assertEqual(sorted(i1.filtered_ways()), sorted(i2.filtered_ways()))
+        self.assertEqual(sorted(i1.filtered_relations()), sorted(i2.filtered_relations()))
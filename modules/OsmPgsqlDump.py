@@ -0,0 +1,165 @@
+#-*- coding: utf-8 -*-
+
+###########################################################################
+##                                                                       ##
+## Copyrights Osmose project 2026                                        ##
+##                                                                       ##
+## This program is free software: you can redistribute it and/or modify  ##
+## it under the terms of the GNU General Public License as published by  ##
+## the Free Software Foundation, either version 3 of the License, or     ##
+## (at your option) any later version.                                   ##
+##                                                                       ##
+## This program is distributed in the hope that it will be useful,       ##
+## but WITHOUT ANY WARRANTY; without even the implied warranty of        ##
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         ##
+## GNU General Public License for more details.                          ##
+##                                                                       ##
+## You should have received a copy of the GNU General Public License     ##
+## along with this program.  If not, see <http://www.gnu.org/licenses/>. ##
+##                                                                       ##
+###########################################################################
+
+# Replacement for osmosis --write-pgsql-dump, with linestring builder and
+# partial linestrings enabled. The table files are in the COPY text format
+# read by osmosis/ImportDatabase_*.sql. They can be named fifos, to send the
+# data straight to concurrent psql COPY.
+
+import os
+try: # osmium still optional for now
+    import osmium # type: ignore
+    SimpleHandler = osmium.SimpleHandler
+except ImportError:
+    osmium = None
+    SimpleHandler = object
+
+
+def copy_escape(s):
+    return s.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+def hstore(tags):
+    return ', '.join(map(lambda kv: '"' + kv[0].replace('\\', '\\\\').replace('"', '\\"') + '"=>"' + kv[1].replace('\\', '\\\\').replace('"', '\\"') + '"', tags))
+
+
+class PgsqlDumpWriter(SimpleHandler):
+
+    tables = ('nodes', 'ways', 'way_nodes', 'relations', 'relation_members', 'users')
+
+    def __init__(self, directory, buffer_size = 1024*1024):
+        SimpleHandler.__init__(self)
+        self._directory = directory
+        self._buffer_size = buffer_size
+        self._files = {}
+        self._closed = set()
+        self._users = {}
+
+    def _file(self, table):
+        # Opened on first use, as opening a fifo waits for its reader
+        f = self._files.get(table)
+        if not f:
+            f = self._files[table] = open(os.path.join(self._directory, table + '.txt'), 'w', encoding='utf-8', buffering=self._buffer_size)
+        return f
+
+    def _close(self, *tables):
+        # Closing ends the COPY, psql then builds the indexes of the table
+        for table in tables:
+            if table not in self._closed:
+                self._file(table).close()
+                self._closed.add(table)
+
+    def _meta(self, o):
+        if o.uid or o.user:
+            user_id = o.uid
+            self._users[user_id] = o.user
+        else:
+            user_id = -1
+        return '\t'.join((
+            str(o.id),
+            str(o.version),
+            str(user_id),
+            o.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+            str(o.changeset),
+            copy_escape(hstore(map(lambda t: (t.k, t.v), o.tags))),
+        ))
+
+    def node(self, n):
+        location = n.location
+        geom = 'SRID=4326;POINT({0} {1})'.format(location.lon, location.lat) if location.valid() else '\\N'
+        self._file('nodes').write(self._meta(n) + '\t' + geom + '\n')
+
+    def way(self, w):
+        self._close('nodes')
+        refs = []
+        points = []
+        for node in w.nodes:
+            refs.append(node.ref)
+            location = node.location
+            if location.valid():
+                points.append('{0} {1}'.format(location.lon, location.lat))
+        linestring = 'SRID=4326;LINESTRING(' + ','.join(points) + ')' if len(points) >= 2 else '\\N'
+        self._file('ways').write(self._meta(w) + '\t{' + ','.join(map(str, refs)) + '}\t' + linestring + '\n')
+        way_nodes = self._file('way_nodes')
+        for (sequence_id, ref) in enumerate(refs):
+            way_nodes.write('{0}\t{1}\t{2}\n'.format(w.id, ref, sequence_id))
+
+    def relation(self, r):
+        self._close('nodes', 'ways', 'way_nodes')
+        self._file('relations').write(self._meta(r) + '\n')
+        relation_members = self._file('relation_members')
+        for (sequence_id, member) in enumerate(r.members):
+            relation_members.write('{0}\t{1}\t{2}\t{3}\t{4}\n'.format(r.id, member.ref, member.type.upper(), copy_escape(member.role), sequence_id))
+
+    def close(self):
+        users = self._file('users')
+        for (user_id, name) in sorted(self._users.items()):
+            users.write('{0}\t{1}\n'.format(user_id, copy_escape(name)))
+        self._close(*self.tables)
+
+
+def check_osmium():
+    if not osmium:
+        raise Exception("The pyosmium import tool needs the osmium Python module")
+
+
+def dump(src, directory, locations_index = 'flex_mem'):
+    """
+    Write the pgsql dump tables of src, an OSM file, to directory.
+    """
+    check_osmium()
+    writer = PgsqlDumpWriter(directory)
+    try:
+        writer.apply_file(src, locations=True, idx=locations_index)
+    finally:
+        writer.close()
+
+
+###########################################################################
+import unittest
+
+class Test(unittest.TestCase):
+
+    def test_escape(self):
+        self.assertEqual(copy_escape('a\\b\tc\nd'), 'a\\\\b\\tc\\nd')
+        self.assertEqual(hstore([('name', 'a "b" c\\')]), '"name"=>"a \\"b\\" c\\\\"')
+        self.assertEqual(copy_escape(hstore([('a', '\\')])), '"a"=>"\\\\\\\\"')
+
+    @unittest.skipIf(not osmium, "osmium not installed")
+    def test_dump(self):
+        import tempfile
+        with tempfile.TemporaryDirectory() as directory:
+            dump('tests/saint_barthelemy.osm.pbf', directory)
+            lines = {}
+            for table in PgsqlDumpWriter.tables:
+                with open(os.path.join(directory, table + '.txt'), encoding='utf-8') as f:
+                    lines[table] = f.read().splitlines()
+
+        self.assertEqual(len(lines['nodes']), 8076)
+        self.assertEqual(len(lines['ways']), 625)
+        self.assertEqual(len(lines['relations']), 16)
+        self.assertEqual(len(lines['way_nodes']), sum(map(lambda l: len(l.split('\t')[6].split(',')), lines['ways'])))
+        self.assertEqual(len(set(map(lambda l: l.split('\t')[0], lines['users']))), len(lines['users']))
+
+        way = list(filter(lambda l: l.startswith('24473155\t'), lines['ways']))[0].split('\t')
+        self.assertEqual(way[0:6], ['24473155', '14', '10610', '2014-01-04 21:56:56', '19813735', '"natural"=>"coastline"'])
+        self.assertTrue(way[7].startswith('SRID=4326;LINESTRING(-62.8363074 '))
+        for l in lines['relation_members']:
+            self.assertIn(l.split('\t')[2], ('N', 'W', 'R'))
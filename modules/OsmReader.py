@@ -51,8 +51,11 @@ class dummylog:
         return
 
 
-def open(osm: str, logger = dummylog(), state_file: Optional[OsmState] = None) -> OsmReader:
-    if osm.endswith(".pbf"):
+def open(osm: str, logger = dummylog(), state_file: Optional[OsmState] = None, block_reader: bool = False) -> OsmReader:
+    if osm.endswith(".pbf") and block_reader:
+        from .OsmPbf import OsmPbfBlockReader
+        return OsmPbfBlockReader(osm, logger, state_file)
+    elif osm.endswith(".pbf"):
         from .OsmPbf import OsmPbfReader
         return OsmPbfReader(osm, logger, state_file)
     elif (osm.endswith(".osc") or
@@ -20,6 +20,7 @@
 ###########################################################################
 
 import bz2
+import datetime
 import gzip
 from xml.sax import make_parser, handler
 from xml.sax.saxutils import XMLGenerator, quoteattr
@@ -130,8 +131,8 @@ class OsmSaxReader(OsmReader, handler.ContentHandler):
             attrs[u"lon"] = float(attrs[u"lon"])
             if u"version" in attrs:
                 attrs[u"version"] = int(attrs[u"version"])
-            if u"user" in attrs:
-                attrs[u"user"] = attrs[u"user"]
+            if u"uid" in attrs:
+                attrs[u"uid"] = int(attrs[u"uid"])
             self._data = attrs
             self._tags = {}
         elif name == u"way":
@@ -141,11 +142,12 @@ class OsmSaxReader(OsmReader, handler.ContentHandler):
             attrs["id"] = int(attrs["id"])
             if u"version" in attrs:
                 attrs[u"version"] = int(attrs[u"version"])
-            if u"user" in attrs:
-                attrs[u"user"] = attrs[u"user"]
+            if u"uid" in attrs:
+                attrs[u"uid"] = int(attrs[u"uid"])
             self._data = attrs
             self._tags = {}
             self._nodes = []
+            self._nodes_location = []
         elif name == u"relation":
             if not self._debug_in_relation:
                 self._debug_in_relation = True
@@ -153,13 +155,16 @@ class OsmSaxReader(OsmReader, handler.ContentHandler):
             attrs["id"] = int(attrs["id"])
             if u"version" in attrs:
                 attrs[u"version"] = int(attrs[u"version"])
-            if u"user" in attrs:
-                attrs[u"user"] = attrs[u"user"]
+            if u"uid" in attrs:
+                attrs[u"uid"] = int(attrs[u"uid"])
             self._data = attrs
             self._members = []
             self._tags = {}
         elif name == u"nd":
             self._nodes.append(int(attrs["ref"]))
+            if u"lat" in attrs:
+                # Node locations on ways, as written by osmium add-locations-to-ways
+                self._nodes_location.append((float(attrs[u"lat"]), float(attrs[u"lon"])))
         elif name == u"tag":
             self._tags[attrs["k"]] = attrs["v"]
         elif name == u"member":
@@ -182,6 +187,9 @@ class OsmSaxReader(OsmReader, handler.ContentHandler):
         elif name == u"way":
             self._data[u"tag"] = self._tags
             self._data[u"nd"]  = self._nodes
+            if self._nodes and len(self._nodes_location) == len(self._nodes):
+                (lat, lon) = self._nodes_location[len(self._nodes) // 2]
+                self._data[u"position"] = {u"lat": lat, u"lon": lon}
             try:
                 if self.since_timestamp is None or self._data['timestamp'] is None or self._data['timestamp'] > self.since_timestamp:
                     self._output.WayCreate(self._data)
@@ -254,6 +262,7 @@ class OscSaxReader(OsmReader, handler.ContentHandler):
             self._data = attrs
             self._tags = {}
             self._nodes = []
+            self._nodes_location = []
         elif name == u"relation":
             attrs["id"] = int(attrs["id"])
             attrs[u"version"] = int(attrs[u"version"])
@@ -262,6 +271,9 @@ class OscSaxReader(OsmReader, handler.ContentHandler):
             self._tags = {}
         elif name == u"nd":
             self._nodes.append(int(attrs["ref"]))
+            if u"lat" in attrs:
+                # Node locations on ways, as written by osmium add-locations-to-ways
+                self._nodes_location.append((float(attrs[u"lat"]), float(attrs[u"lon"])))
         elif name == u"tag":
             self._tags[attrs["k"]] = attrs["v"]
         elif name == u"member":
@@ -280,6 +292,9 @@ class OscSaxReader(OsmReader, handler.ContentHandler):
         elif name == u"way":
             self._data[u"tag"] = self._tags
             self._data[u"nd"]  = self._nodes
+            if self._nodes and len(self._nodes_location) == len(self._nodes):
+                (lat, lon) = self._nodes_location[len(self._nodes) // 2]
+                self._data[u"position"] = {u"lat": lat, u"lon": lon}
             if self._action == u"create":
                 self._output.WayCreate(self._data)
             elif self._action == u"modify":
@@ -309,6 +324,8 @@ def _formatData(data):
         data.pop(u"nd")
     if u"member" in data:
         data.pop(u"member")
+    if u"position" in data:
+        data.pop(u"position")
     if u"visible" in data:
         data[u"visible"] = str(data[u"visible"]).lower()
     if u"id" in data:
@@ -323,6 +340,12 @@ def _formatData(data):
         data[u"version"] = str(data[u"version"])
     if u"uid" in data:
         data[u"uid"] = str(data[u"uid"])
+    if isinstance(data.get(u"timestamp"), int):
+        # Seconds since epoch from the PBF readers, 0 when unknown
+        if data[u"timestamp"]:
+            data[u"timestamp"] = datetime.datetime.fromtimestamp(data[u"timestamp"], datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        else:
+            data.pop(u"timestamp")
     return data
 
 class OsmSaxWriter(XMLGenerator):
@@ -416,6 +439,91 @@ def RelationToXml(data, full = False):
         w.endElement("osm")
     return o.getvalue()
 
+###########################################################################
+
+class OscMerger:
+    """
+    Merge osmChange files, read from the oldest to the newest, into one
+    simplified change with the last version of each object. As osmosis
+    --simplify-change, an object created then deleted is dropped, and an
+    object created then modified stays a creation.
+    """
+
+    types = (u"node", u"way", u"relation")
+
+    def __init__(self):
+        self._objects = {}
+
+    def add(self, filename):
+        OscSaxReader(filename).CopyTo(self)
+
+    def _change(self, type, action, data):
+        key = (self.types.index(type), data[u"id"])
+        first_action = self._objects[key][0] if key in self._objects else action
+        if first_action == u"create" and action == u"delete":
+            del self._objects[key]
+            return
+        elif first_action == u"create":
+            action = u"create"
+        elif action == u"create":
+            # Deleted or modified before, then recreated
+            action = u"modify"
+        self._objects[key] = (action, data)
+
+    def NodeCreate(self, data):
+        self._change(u"node", u"create", data)
+
+    def NodeUpdate(self, data):
+        self._change(u"node", u"modify", data)
+
+    def NodeDelete(self, data):
+        self._change(u"node", u"delete", data)
+
+    def WayCreate(self, data):
+        self._change(u"way", u"create", data)
+
+    def WayUpdate(self, data):
+        self._change(u"way", u"modify", data)
+
+    def WayDelete(self, data):
+        self._change(u"way", u"delete", data)
+
+    def RelationCreate(self, data):
+        self._change(u"relation", u"create", data)
+
+    def RelationUpdate(self, data):
+        self._change(u"relation", u"modify", data)
+
+    def RelationDelete(self, data):
+        self._change(u"relation", u"delete", data)
+
+    def write(self, filename):
+        """
+        Write the merged change, sorted by type then id as expected by
+        osmosis --apply-change.
+        """
+        if filename.endswith(".gz"):
+            f = gzip.open(filename, "wt", encoding="utf-8")
+        else:
+            f = open(filename, "w", encoding="utf-8")
+        with f:
+            w = OsmSaxWriter(f, "UTF-8")
+            w.startDocument()
+            w.startElement("osmChange", {"version": "0.6", "generator": "osmose"})
+            writers = (w.NodeCreate, w.WayCreate, w.RelationCreate)
+            current_action = None
+            for key in sorted(self._objects.keys()):
+                (action, data) = self._objects[key]
+                if action != current_action:
+                    if current_action:
+                        w.endElement(current_action)
+                    w.startElement(action, {})
+                    current_action = action
+                writers[key[0]](data)
+            if current_action:
+                w.endElement(current_action)
+            w.endElement("osmChange")
+
 
 ###########################################################################
 import unittest
@@ -462,6 +570,58 @@ class Test(unittest.TestCase):
         self.assertEqual(o1.num_rels, 16)
         self.assertEqual(i1.timestamp(), dateutil.parser.parse("2014-01-15T19:05:08Z").replace(tzinfo=None))
 
+    def test_nd_location(self):
+        import io
+        f = io.BytesIO(b'''<?xml version='1.0' encoding='UTF-8'?>
+<osm version="0.6">
+ <way id="1" version="2" timestamp="2020-01-01T00:00:00Z" uid="3" user="u">
+  <nd ref="1" lat="1.0" lon="2.0"/>
+  <nd ref="2" lat="3.0" lon="4.0"/>
+  <tag k="highway" v="path"/>
+ </way>
+</osm>''')
+        ways = []
+        o1 = MockCountObjects()
+        o1.WayCreate = ways.append
+        OsmSaxReader(f).CopyTo(o1)
+        self.assertEqual(ways[0]["position"], {"lat": 3.0, "lon": 4.0})
+        self.assertEqual((ways[0]["version"], ways[0]["uid"], ways[0]["user"]), (2, 3, "u"))
+        self.assertNotIn("position", WayToXml(ways[0]))
+
+    def test_format_int_timestamp(self):
+        self.assertEqual(_formatData({"id": 1, "timestamp": 1388872624})["timestamp"], "2014-01-04T21:57:04Z")
+        self.assertNotIn("timestamp", _formatData({"id": 1, "timestamp": 0}))
+
+    def test_osc_merger(self):
+        import io
+        import os
+        from modules import config
+        def osc(actions):
+            return io.BytesIO(('''<?xml version='1.0' encoding='UTF-8'?>
+<osmChange version="0.6">''' + actions + '''</osmChange>''').encode('utf-8'))
+
+        m = OscMerger()
+        OscSaxReader(osc('''
+<create><node id="1" version="1" lat="1" lon="1"/><node id="2" version="1" lat="2" lon="2"/></create>
+<modify><node id="3" version="2" lat="3" lon="3"/><way id="1" version="2"><nd ref="3"/></way></modify>
+''')).CopyTo(m)
+        OscSaxReader(osc('''
+<modify><node id="1" version="2" lat="1" lon="1"><tag k="a" v="b"/></node></modify>
+<delete><node id="2" version="2" lat="2" lon="2"/><way id="1" version="3"><nd ref="3"/></way></delete>
+<modify><node id="3" version="3" lat="3.5" lon="3"/></modify>
+''')).CopyTo(m)
+
+        dirname = config.dir_tmp + "/tests/"
+        os.makedirs(dirname, exist_ok=True)
+        m.write(dirname + "merge.osc.gz")
+
+        actions = []
+        class Actions:
+            def __getattr__(self, name):
+                return lambda data: actions.append((name, data["id"], data["version"]))
+        OscSaxReader(dirname + "merge.osc.gz").CopyTo(Actions())
+        self.assertEqual(actions, [("NodeCreate", 1, 2), ("NodeUpdate", 3, 3), ("WayDelete", 1, 3)])
+
     def test_file(self):
         f = gzip.open("tests/saint_barthelemy.osm.gz")
         i1 = OsmSaxReader(f, state_file = "tests/saint_barthelemy.state.txt")
@@ -20,14 +20,26 @@
 ###########################################################################
 
 import time
+import os
 import sys
 import subprocess
+import threading
+
+_out_lock = threading.Lock()
+
+def _reset_out_lock():
+    # The lock may be held by another thread of the parent when a job is forked
+    global _out_lock
+    _out_lock = threading.Lock()
+
+os.register_at_fork(after_in_child=_reset_out_lock)
 
 class logger:
 
-    def __init__(self, out = sys.stdout, showall = True):
+    def __init__(self, out = sys.stdout, showall = True, prefix = u""):
         self._out     = out
         self._showall = showall
+        self._prefix  = prefix
 
         self.log_av_r     = u'\033[0;31m'  # red
         self.log_av_b     = u'\033[0;34m'  # blue
@@ -38,10 +50,12 @@ class logger:
     def _log(self, txt, level):
         pre  = u""
         pre += time.strftime("%Y-%m-%d %H:%M:%S ")
+        pre += self._prefix
         pre += u"  "*level
         suf  = u""
-        print(u'{0}{1}{2}'.format(pre, txt, suf), file=self._out)
-        self._out.flush()
+        with _out_lock:
+            print(u'{0}{1}{2}'.format(pre, txt, suf), file=self._out)
+            self._out.flush()
 
     def log(self, txt):
         self._log(txt, 0)
@@ -63,6 +77,10 @@ class logger:
     def sub(self):
         return sublog(self, 1)
 
+    def job(self, name):
+        # Logger of a job running concurrently with others, on the same output
+        return logger(self._out, self._showall, u"[{0}] ".format(name))
+
     def execute_err(self, cmd, valid_return_code=(0,), background=False):
         proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         if background:
@@ -75,8 +93,9 @@ class logger:
             if cerr == '':
                 continue
             if self._showall:
-                self._out.write(u'{0}   {1}\n'.format(time.strftime("%Y-%m-%d %H:%M:%S"), cerr))
-                self._out.flush()
+                with _out_lock:
+                    self._out.write(u'{0} {1}  {2}\n'.format(time.strftime("%Y-%m-%d %H:%M:%S"), self._prefix, cerr))
+                    self._out.flush()
         proc.wait()
         if proc.returncode not in valid_return_code:
             raise RuntimeError("'%s' exited with status %s" % (' '.join(cmd), repr(proc.returncode)))
@@ -94,8 +113,9 @@ class logger:
             if cerr == '':
                 continue
             if self._showall:
-                self._out.write(u'{0}   {1}\n'.format(time.strftime("%Y-%m-%d %H:%M:%S "), cerr))
-                self._out.flush()
+                with _out_lock:
+                    self._out.write(u'{0}{1}  {2}\n'.format(time.strftime("%Y-%m-%d %H:%M:%S "), self._prefix, cerr))
+                    self._out.flush()
         proc.wait()
         if proc.returncode not in valid_return_code:
             raise RuntimeError("'%s' exited with status %s :\n%s" % (' '.join(cmd), repr(proc.returncode), proc.stderr.read()))
@@ -19,11 +19,25 @@
 ##                                                                       ##
 ###########################################################################
 
+from shapely.geometry import Point
+from shapely.prepared import prep
 from .Polygon import Polygon
-from .interval_tree import IntervalTree
+
+try:
+    from shapely import intersects_xy, prepare # Shapely >= 2.0
+except ImportError:
+    intersects_xy = None
 
 
 class PointInPolygon:
+    # Grid over the polygon bbox. Cells crossed by the polygon rings are on the
+    # boundary, and need an exact test. Other cells are fully inside or fully
+    # outside, and are classified on first use from their center.
+    grid_size = 1024
+
+    OUTSIDE = 0
+    INSIDE = 1
+    BOUNDARY = 2
 
     def __init__(self, polygon_id, cache_delay=60):
         self.polygon = Polygon(polygon_id, cache_delay)
@@ -32,66 +46,79 @@ class PointInPolygon:
     def bboxes(self):
         return self.polygon.bboxes()
 
-    def sameVDir(self, x1, y1, x2, y2, x3, y3):
-        # Check if next segment have same direction again vertical.
-        if y1 < y2:
-            return y2 < y3
-        else:
-            return y2 > y3
-
-    class Interval:
-        def __init__(self, x1, y1, x2, y2, sameDir):
-            # Need for IntervalTree
-            self.start = min(y1,y2)
-            self.stop = max(y1,y2)
-            # Segment
-            self.x1 = x1
-            self.x2 = x2
-            self.y1 = y1
-            self.y2 = y2
-            self.sameDir = sameDir
-
-        def __repr__(self):
-            return "(%s,%s)-(%s, %s)" % (self.x1, self.y1, self.x2, self.y2)
-
-    def build_polygon(self, coords):
-        (x,y) = coords.xy
-        n = len(x)
-        ivals = []
-        for i in range(n):
-            ivals.append(self.Interval(x[i], y[i], x[(i+1) % n], y[(i+1) % n], self.sameVDir(x[i], y[i], x[(i+1) % n], y[(i+1) % n], x[(i+2) % n], y[(i+2) % n])))
-        return ivals
-
     def build(self):
-        ivals = []
+        self.prepared = prep(self.polygon.polygon)
+        if intersects_xy:
+            prepare(self.polygon.polygon)
+        (self.minx, self.miny, self.maxx, self.maxy) = self.polygon.polygon.bounds
+        self.dx = (self.maxx - self.minx) / self.grid_size or 1
+        self.dy = (self.maxy - self.miny) / self.grid_size or 1
+        self.cells = {}
         if hasattr(self.polygon.polygon, "geoms"):
             polygons = self.polygon.polygon.geoms
         else:
             polygons = [self.polygon.polygon]
         for p in polygons:
-            ivals += self.build_polygon(p.exterior.coords)
+            self.build_ring(p.exterior.coords)
             for i in p.interiors:
-                ivals += self.build_polygon(i.coords)
-        self.tree = IntervalTree(ivals)
+                self.build_ring(i.coords)
+
+    def cell_index(self, x, y):
+        return (min(int((x - self.minx) / self.dx), self.grid_size - 1), min(int((y - self.miny) / self.dy), self.grid_size - 1))
+
+    def build_ring(self, coords):
+        coords = list(coords)
+        for (x0, y0), (x1, y1) in zip(coords, coords[1:]):
+            (i0, j0) = self.cell_index(x0, y0)
+            (i1, j1) = self.cell_index(x1, y1)
+            self.cells[(i0, j0)] = self.BOUNDARY
+            # Walk the segment by steps shorter than a cell, on a diagonal step
+            # the segment also crosses one of the two side cells
+            n = 2 * max(abs(i1 - i0), abs(j1 - j0))
+            for k in range(1, n + 1):
+                (i, j) = self.cell_index(x0 + (x1 - x0) * k / n, y0 + (y1 - y0) * k / n)
+                if i != i0 and j != j0:
+                    self.cells[(i0, j)] = self.cells[(i, j0)] = self.BOUNDARY
+                self.cells[(i, j)] = self.BOUNDARY
+                (i0, j0) = (i, j)
+
+    def cell(self, x, y):
+        if not (self.minx <= x <= self.maxx and self.miny <= y <= self.maxy):
+            return self.OUTSIDE
+        (i, j) = self.cell_index(x, y)
+        c = self.cells.get((i, j))
+        if c is None:
+            c = self.INSIDE if self.prepared.intersects(Point(self.minx + (i + 0.5) * self.dx, self.miny + (j + 0.5) * self.dy)) else self.OUTSIDE
+            self.cells[(i, j)] = c
+        return c
 
     def point_inside_polygon(self, x, y):
-        poly = self.tree.find(y, y)
-        inside = False
-
-        for p in poly:
-            if p.y1 != p.y2:
-                if p.y2 != y or p.sameDir: # This is a true cross and not a tangent
-                    xinters = (y-p.y1)*(p.x2-p.x1)/(p.y2-p.y1)+p.x1
-                    if x < xinters:
-                        inside = not inside
-            elif x <= max(p.x1, p.x2):
-                inside = not inside
-
+        c = self.cell(x, y)
+        if c == self.BOUNDARY:
+            return self.prepared.intersects(Point(x, y))
+        return c == self.INSIDE
+
+    def contains_many(self, lats, lons):
+        """
+        Test many points at once, as a list of booleans.
+        """
+        cells = list(map(self.cell, lons, lats))
+        inside = list(map(lambda c: c == self.INSIDE, cells))
+        boundary = [k for k, c in enumerate(cells) if c == self.BOUNDARY]
+        if boundary:
+            if intersects_xy:
+                exact = intersects_xy(self.polygon.polygon, [lons[k] for k in boundary], [lats[k] for k in boundary])
+            else:
+                exact = map(lambda k: self.prepared.intersects(Point(lons[k], lats[k])), boundary)
+            for k, e in zip(boundary, exact):
+                inside[k] = bool(e)
         return inside
 
 
 ###########################################################################
+import sys
 import unittest
+import unittest.mock
 
 class Test(unittest.TestCase):
 
@@ -113,3 +140,64 @@ class Test(unittest.TestCase):
         f = PointInPolygon(87565)
         assert f.point_inside_polygon(28.190278, -25.745) # Pretoria
         assert not f.point_inside_polygon(27.50195, -29.31559) # Maseru, Lesotho
+
+    def test_contains_many(self):
+        # South Africa (polygon with a hole)
+        f = PointInPolygon(87565)
+        self.assertEqual(f.contains_many([-25.745, -29.31559, 0], [28.190278, 27.50195, 0]), [True, False, False])
+
+        # Same answers than the point by point test, over the bbox
+        (minx, miny, maxx, maxy) = f.polygon.polygon.bounds
+        lats = [miny + (maxy - miny) * k / 97 for k in range(98)] * 10
+        lons = [minx + (maxx - minx) * k / 9 for k in range(10) for _ in range(98)]
+        self.assertEqual(f.contains_many(lats, lons), list(map(f.point_inside_polygon, lons, lats)))
+
+    def local(self, polygon, grid_size):
+        # Without download of the polygon
+        class polygon_local:
+            pass
+        f = PointInPolygon.__new__(PointInPolygon)
+        f.polygon = polygon_local()
+        f.polygon.polygon = polygon
+        f.grid_size = grid_size
+        f.build()
+        return f
+
+    def test_contains_many_local(self):
+        import shapely.geometry
+        # Square with a square hole, and a separate triangle
+        polygon = shapely.geometry.MultiPolygon([
+            shapely.geometry.Polygon([(0, 0), (10, 0), (10, 10), (0, 10)], [[(4, 4), (6, 4), (6, 6), (4, 6)]]),
+            shapely.geometry.Polygon([(20, 0), (30, 0), (20, 10)]),
+        ])
+        points = [
+            ((1, 1), True),
+            ((5, 5), False), # In the hole
+            ((4.001, 5), False),
+            ((3.999, 5), True),
+            ((5, 6.001), True),
+            ((4, 5), True), # On the hole boundary
+            ((6, 6), True), # Hole vertex
+            ((0, 5), True), # On the outer boundary
+            ((10, 10), True), # Outer vertex
+            ((-0.001, 5), False),
+            ((11, 5), False), # Between the two parts
+            ((15, 5), False),
+            ((21, 1), True),
+            ((25, 5), True), # On the triangle hypotenuse
+            ((26, 5), False),
+            ((30, 10), False), # Bbox corner
+            ((40, 5), False), # Out of the bbox
+        ]
+        lats = [-1 + 12 * k / 96 for k in range(97)] * 65
+        lons = [-1 + 32 * k / 64 for k in range(65) for _ in range(97)]
+        expected = list(map(lambda x, y: polygon.intersects(shapely.geometry.Point(x, y)), lons, lats))
+        # With and without the vectorized test of Shapely 2
+        for xy in set([intersects_xy, None]):
+            with unittest.mock.patch.object(sys.modules[PointInPolygon.__module__], 'intersects_xy', xy):
+                for grid_size in (1, 4, 1024):
+                    f = self.local(polygon, grid_size)
+                    self.assertEqual(f.contains_many(list(map(lambda p: p[0][1], points)), list(map(lambda p: p[0][0], points))), list(map(lambda p: p[1], points)), grid_size)
+
+                    # Same answers than shapely, over the bbox, edges included
+                    self.assertEqual(f.contains_many(lats, lons), expected, grid_size)
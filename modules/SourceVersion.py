@@ -24,27 +24,61 @@ import os
 import hashlib
 
 
+# Versions already computed, by the sources and the files mtime
+_versions = {}
+
+# Source files of the classes MRO
+_class_files = {}
+
+
+def _files(c):
+    files = _class_files.get(c)
+    if files is None:
+        files = []
+        for cc in inspect.getmro(c):
+            try:
+                files.append(inspect.getsourcefile(cc))
+            except TypeError: # Built-in
+                pass
+        files = _class_files[c] = list(filter(None, files))
+    return files
+
+
+def _stat(path):
+    s = os.stat(path)
+    return (path, s.st_mtime_ns, s.st_size)
+
+
 def version(*sources):
-    h = hashlib.md5()
+    """
+    Hash of the sources: file paths, ints, or classes for the source files of their MRO.
+    Computed once per process for the same files content, unless the files change.
+    """
+    key = []
     for source in sources:
         if isinstance(source, str) and os.path.exists(source):
-            h.update(open(source, 'rb').read())
+            key.append((_stat(source), ))
         elif isinstance(source, int):
-            h.update(str(source).encode('utf-8'))
+            key.append(source)
         elif inspect.isclass(source):
-            cc = inspect.getmro(source)
-            for c in cc:
-                try:
-                    h.update(open(inspect.getsourcefile(c), 'rb').read())
-                except TypeError: # No python source file
-                    try:
-                        h.update(inspect.getsource(c))
-                    except TypeError: # Built-in
-                        pass
+            key.append(tuple(map(_stat, _files(source))))
         else:
             raise NotImplementedError(source.__class__)
+    key = tuple(key)
+
+    v = _versions.get(key)
+    if v is None:
+        h = hashlib.md5()
+        for source in key:
+            if isinstance(source, int):
+                h.update(str(source).encode('utf-8'))
+            else:
+                for (path, _, _) in source:
+                    with open(path, 'rb') as f:
+                        h.update(f.read())
+        v = _versions[key] = int(h.hexdigest(), 16) % 2147483647
 
-    return int(h.hexdigest(), 16) % 2147483647
+    return v
 
 
 ###########################################################################
@@ -56,7 +90,10 @@ class Test(unittest.TestCase):
 
     def test(self):
         self.assertEqual(version(1), 876922281)
-        self.assertEqual(version(PointInPolygon), 1846769484)
+        self.assertEqual(version(PointInPolygon), 50710400)
+        self.assertEqual(version(PointInPolygon), 50710400)
+        self.assertEqual(version(__file__, 1), version(__file__, 1))
+        self.assertNotEqual(version(__file__, 1), version(__file__, 2))
 
         try:
             version("1")
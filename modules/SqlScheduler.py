@@ -0,0 +1,252 @@
+#-*- coding: utf-8 -*-
+
+###########################################################################
+##                                                                       ##
+## Copyrights Osmose project 2026                                        ##
+##                                                                       ##
+## This program is free software: you can redistribute it and/or modify  ##
+## it under the terms of the GNU General Public License as published by  ##
+## the Free Software Foundation, either version 3 of the License, or     ##
+## (at your option) any later version.                                   ##
+##                                                                       ##
+## This program is distributed in the hope that it will be useful,       ##
+## but WITHOUT ANY WARRANTY; without even the implied warranty of        ##
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         ##
+## GNU General Public License for more details.                          ##
+##                                                                       ##
+## You should have received a copy of the GNU General Public License     ##
+## along with this program.  If not, see <http://www.gnu.org/licenses/>. ##
+##                                                                       ##
+###########################################################################
+
+# Split SQL scripts into units, and run them on concurrent database
+# sessions in dependency order.
+#
+# Each CREATE INDEX of a script is an unit on its own. The other statements
+# following each other are grouped in a sequential unit, run after the
+# previous sequential unit and the indexes of the same script before it.
+# Indexes only wait for the previous sequential unit, so they are built
+# concurrently, even across scripts. Scripts with psql meta-commands are
+# kept whole, to be run by psql.
+
+import os
+import re
+import threading
+
+
+re_index = re.compile(r"^\s*CREATE\s+(?:UNIQUE\s+)?INDEX\b", re.IGNORECASE)
+re_dollar = re.compile(r"\$([a-zA-Z_][a-zA-Z0-9_]*)?\$")
+
+
+class Unit:
+    def __init__(self, name, sql=None, script=None, after=()):
+        self.name = name
+        self.sql = sql
+        self.script = script
+        self.after = set(after)
+
+    def __repr__(self):
+        return 'Unit({0})'.format(self.name)
+
+
+def split(sql):
+    """
+    Split SQL into statements, on semicolons out of quotes, dollar quotes and comments.
+    """
+    statements = []
+    start = 0
+    i = 0
+    n = len(sql)
+    while i < n:
+        c = sql[i]
+        if c == '-' and sql.startswith('--', i):
+            i = sql.find('\n', i)
+            i = n if i == -1 else i + 1
+        elif c == '/' and sql.startswith('/*', i):
+            i = sql.find('*/', i + 2)
+            i = n if i == -1 else i + 2
+        elif c == "'" or c == '"':
+            i = sql.find(c, i + 1)
+            i = n if i == -1 else i + 1
+        elif c == '$' and re_dollar.match(sql, i):
+            tag = re_dollar.match(sql, i).group(0)
+            i = sql.find(tag, i + len(tag))
+            i = n if i == -1 else i + len(tag)
+        elif c == ';':
+            statements.append(sql[start:i].strip())
+            i += 1
+            start = i
+        else:
+            i += 1
+    statements.append(sql[start:].strip())
+    return list(filter(None, map(strip_comments, statements)))
+
+
+def strip_comments(statement):
+    # Leading comment lines only
+    lines = statement.splitlines()
+    while lines and (not lines[0].strip() or lines[0].strip().startswith('--')):
+        lines.pop(0)
+    return '\n'.join(lines).strip()
+
+
+def script_units(scripts):
+    """
+    Units of the scripts, in order, with their dependencies.
+    """
+    units = []
+    barrier = None
+    for script in scripts:
+        name = os.path.basename(script)
+        with open(script, encoding='utf-8') as f:
+            sql = f.read()
+
+        if re.search(r"^\s*\\", sql, re.MULTILINE):
+            unit = Unit(name, script=script, after=filter(None, [barrier]))
+            units.append(unit)
+            barrier = unit.name
+            continue
+
+        indexes = []
+        sequential = None
+        for (i, statement) in enumerate(split(sql)):
+            if re_index.match(statement):
+                unit = Unit('{0}:{1}'.format(name, i), sql=statement, after=filter(None, [barrier]))
+                units.append(unit)
+                indexes.append(unit.name)
+            elif sequential is not None and units[-1] is sequential:
+                sequential.sql += ';\n' + statement
+            else:
+                sequential = Unit('{0}:{1}'.format(name, i), sql=statement, after=list(filter(None, [barrier])) + indexes)
+                units.append(sequential)
+                barrier = sequential.name
+                indexes = []
+    return units
+
+
+def run(units, execute, workers=1, close=None):
+    """
+    Run the units with execute(unit), on workers threads, each unit once all
+    its dependencies are done. close() is called by each thread when done.
+    On failure no more unit is started, and the first error is raised once
+    the running ones are done.
+    """
+    names = set(map(lambda u: u.name, units))
+    pending = list(units)
+    done = set()
+    errors = []
+    running = [0]
+    condition = threading.Condition()
+
+    def next_unit():
+        for unit in pending:
+            if unit.after & names <= done:
+                pending.remove(unit)
+                return unit
+
+    def worker():
+        try:
+            while True:
+                with condition:
+                    while True:
+                        if errors or not pending:
+                            return
+                        unit = next_unit()
+                        if unit:
+                            running[0] += 1
+                            break
+                        if not running[0]:
+                            # Nothing can make progress
+                            return
+                        condition.wait()
+                try:
+                    execute(unit)
+                except BaseException as e:
+                    with condition:
+                        running[0] -= 1
+                        errors.append(e)
+                        condition.notify_all()
+                    return
+                with condition:
+                    running[0] -= 1
+                    done.add(unit.name)
+                    condition.notify_all()
+        finally:
+            if close:
+                close()
+
+    threads = [threading.Thread(target=worker, name='sql-{0}'.format(i)) for i in range(max(1, min(workers, len(units))))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    if errors:
+        raise errors[0]
+    if pending:
+        raise RuntimeError("Units with unresolved dependencies: " + ', '.join(map(lambda u: u.name, pending)))
+
+
+###########################################################################
+import unittest
+
+class Test(unittest.TestCase):
+
+    def test_split(self):
+        self.assertEqual(split("""
+-- comment;
+CREATE INDEX a ON t (x); SELECT ';', "a;b";
+CREATE FUNCTION f() RETURNS int AS $$ SELECT 1; $$ LANGUAGE sql;
+/* ; */ SELECT $a$ ; $$ $a$
+"""), ["CREATE INDEX a ON t (x)", "SELECT ';', \"a;b\"", "CREATE FUNCTION f() RETURNS int AS $$ SELECT 1; $$ LANGUAGE sql", "/* ; */ SELECT $a$ ; $$ $a$"])
+
+    def test_script_units(self):
+        units = script_units([os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'osmosis', s) for s in ('ImportDatabase_Ways.sql', 'CreateTagsIndex.sql', 'CreateFunctions.sql')])
+        self.assertIsNotNone(units[0].script)
+        indexes = list(filter(lambda u: u.name.startswith('CreateTagsIndex.sql:'), units))
+        self.assertEqual(len(indexes), 7)
+        for unit in indexes:
+            self.assertEqual(unit.after, set(['ImportDatabase_Ways.sql']))
+        functions = list(filter(lambda u: u.name.startswith('CreateFunctions.sql:'), units))
+        self.assertEqual(len(functions), 1)
+        self.assertEqual(functions[0].after, set(['ImportDatabase_Ways.sql']))
+        self.assertIn('$$', functions[0].sql)
+
+    def test_run(self):
+        import tempfile
+        import time
+        with tempfile.NamedTemporaryFile('w', suffix='.sql') as f:
+            f.write("CREATE TABLE a (); CREATE INDEX a1 ON a (x); CREATE INDEX a2 ON a (y); ANALYZE a; CREATE INDEX a3 ON a (z);")
+            f.flush()
+            units = script_units([f.name])
+        self.assertEqual(list(map(lambda u: len(u.after), units)), [0, 1, 1, 3, 1])
+
+        log = []
+        lock = threading.Lock()
+        def execute(unit):
+            with lock:
+                log.append(('start', unit.sql))
+            time.sleep(0.01)
+            with lock:
+                log.append(('end', unit.sql))
+        run(units, execute, workers=3)
+        self.assertEqual(len(log), 10)
+        self.assertEqual(log[0:2], [('start', 'CREATE TABLE a ()'), ('end', 'CREATE TABLE a ()')])
+        # Both indexes run concurrently, before ANALYZE
+        self.assertEqual(set(log[2:4]), set([('start', 'CREATE INDEX a1 ON a (x)'), ('start', 'CREATE INDEX a2 ON a (y)')]))
+        self.assertEqual(log[6], ('start', 'ANALYZE a'))
+
+    def test_run_error(self):
+        executed = []
+        def execute(unit):
+            executed.append(unit.name)
+            if unit.name == 'a':
+                raise ValueError(unit.name)
+        closed = []
+        with self.assertRaises(ValueError):
+            run([Unit('a'), Unit('b', after=['a'])], execute, workers=2, close=lambda: closed.append(1))
+        self.assertEqual(executed, ['a'])
+        self.assertEqual(len(closed), 2)
+
+        with self.assertRaises(RuntimeError):
+            run([Unit('a', after=['b']), Unit('b', after=['a'])], execute, workers=2)
@@ -0,0 +1,273 @@
+#-*- coding: utf-8 -*-
+
+###########################################################################
+##                                                                       ##
+## Copyrights Osmose project 2026                                        ##
+##                                                                       ##
+## This program is free software: you can redistribute it and/or modify  ##
+## it under the terms of the GNU General Public License as published by  ##
+## the Free Software Foundation, either version 3 of the License, or     ##
+## (at your option) any later version.                                   ##
+##                                                                       ##
+## This program is distributed in the hope that it will be useful,       ##
+## but WITHOUT ANY WARRANTY; without even the implied warranty of        ##
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         ##
+## GNU General Public License for more details.                          ##
+##                                                                       ##
+## You should have received a copy of the GNU General Public License     ##
+## along with this program.  If not, see <http://www.gnu.org/licenses/>. ##
+##                                                                       ##
+###########################################################################
+
+# Plan the partial indexes on the tags of the osmosis tables, from the
+# tags?'key' and tags->'key' predicates of the sql* strings of the osmosis
+# analysers and of the derived tables of Analyser_Osmosis, and from the
+# Select() tags of the merge analysers. A key only tested for presence gets
+# a B-tree index on id, a key compared to values gets a B-tree index on its
+# value. Both are partial, restricted to the objects with the key.
+
+import ast
+import collections
+import hashlib
+import os
+import re
+
+
+TABLES = ('nodes', 'ways', 'relations')
+
+ANALYSERS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'analysers')
+
+# Defaults for full runs, a key used by a single query is not worth the index
+MIN_WEIGHT = 2
+MAX_INDEXES = 60
+
+# Always planned, used by queries out of reach of the static collect, as the
+# derived tables built from other derived tables
+FLOOR = (
+    ('ways', 'highway', False),
+    ('ways', 'waterway', False),
+    ('ways', 'natural', False),
+    ('ways', 'name', False),
+    ('ways', 'building', False),
+    ('ways', 'power', False),
+    ('ways', 'boundary', False),
+    ('ways', 'landuse', False),
+)
+
+SQL_KEYWORDS = set(('on', 'where', 'join', 'left', 'right', 'inner', 'outer', 'full', 'cross', 'natural', 'lateral', 'using', 'group', 'order', 'limit', 'union', 'except', 'intersect', 'window', 'having', 'and', 'or', 'not', 'as'))
+
+# Also the {0}ways and {ways} placeholders of the touched and not touched views
+re_table = re.compile(r"\b(?:FROM|JOIN)\s+(?:\{[0-9]*\}|(?:not_)?touched_)?\{?(nodes|ways|relations)\b\}?(?:\s+(?:AS\s+)?([a-z_][a-z0-9_]*))?", re.IGNORECASE)
+# NOT before the predicate make it useless for an index
+re_has_key = re.compile(r"(\bNOT\s+)?\(?\s*(?:\b([a-z_][a-z0-9_]*)\.)?\btags\s*\?(?![|&])\s*'([^']+)'", re.IGNORECASE)
+re_value = re.compile(r"(?:\b([a-z_][a-z0-9_]*)\.)?\btags\s*->\s*'([^']+)'\s*\)?\s*(=|IN\b)", re.IGNORECASE)
+
+
+def literal(node):
+    # Literal parts of a string concatenation, the others are left out
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left, right = literal(node.left), literal(node.right)
+        if left is not None or right is not None:
+            return (left or '') + ' ' + (right or '')
+
+
+def sql_strings(filename):
+    """
+    Literal strings assigned to module or class level sql* names.
+    """
+    with open(filename, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename)
+    body = list(tree.body)
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            body += node.body
+    for node in body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name) and node.targets[0].id.startswith('sql'):
+            sql = literal(node.value)
+            if sql is not None:
+                yield sql
+
+
+def select_predicates(filename):
+    """
+    Set of (table, key, False) predicates of the literal Select(types=..., tags=...) of a merge analyser,
+    one set by Select.
+    """
+    with open(filename, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == 'Select':
+            args = dict(map(lambda k: (k.arg, k.value), node.keywords))
+            types = args.get('types')
+            tags = args.get('tags')
+            if not isinstance(types, ast.List) or tags is None:
+                continue
+            tables = set(filter(lambda t: t in TABLES, map(lambda t: isinstance(t, ast.Constant) and t.value, types.elts)))
+            found = set()
+            for d in (tags.elts if isinstance(tags, ast.List) else [tags]):
+                if isinstance(d, ast.Dict):
+                    for (k, v) in zip(d.keys, d.values):
+                        # False is for the missing key
+                        if isinstance(k, ast.Constant) and isinstance(k.value, str) and not (isinstance(v, ast.Constant) and v.value is False):
+                            found.update(map(lambda table: (table, k.value, False), tables))
+            yield found
+
+
+def predicates(sql):
+    """
+    Set of (table, key, value) predicates of a query, value is True when the key is compared to values.
+    """
+    aliases = {}
+    for (table, alias) in re_table.findall(sql):
+        table = table.lower()
+        aliases[table] = table
+        if alias and alias.lower() not in SQL_KEYWORDS:
+            aliases[alias] = table
+    tables = set(aliases.values())
+
+    def resolve(alias):
+        if alias:
+            return aliases.get(alias)
+        elif len(tables) == 1:
+            return next(iter(tables))
+
+    found = set()
+    for (negated, alias, key) in re_has_key.findall(sql):
+        table = resolve(alias)
+        if table and not negated:
+            found.add((table, key, False))
+    for (alias, key, _) in re_value.findall(sql):
+        table = resolve(alias)
+        if table:
+            found.add((table, key, True))
+    return found
+
+
+def collect(filenames):
+    """
+    Count the predicates of the analysers, by the number of queries using them.
+    Return a Counter of (table, key, value).
+    """
+    weights = collections.Counter()
+    for filename in filenames:
+        if os.path.basename(filename).startswith('analyser_merge_'):
+            for found in select_predicates(filename):
+                weights.update(found)
+        else:
+            for sql in sql_strings(filename):
+                weights.update(predicates(sql))
+    return weights
+
+
+def analyser_files(analysers_dir, analysers=None):
+    """
+    Files of the osmosis and merge analysers, only the ones of the analysers names list when given,
+    and Analyser_Osmosis for the derived tables.
+    """
+    yield os.path.join(analysers_dir, 'Analyser_Osmosis.py')
+    for fn in sorted(os.listdir(analysers_dir)):
+        if (fn.startswith('analyser_osmosis_') or fn.startswith('analyser_merge_')) and fn.endswith('.py') and (analysers is None or fn[len('analyser_'):-3] in analysers):
+            yield os.path.join(analysers_dir, fn)
+
+
+def index_name(table, key, value):
+    name = re.sub('[^a-z0-9]+', '_', key.lower()).strip('_')
+    if name != key or len(name) > 40:
+        # Keep names unique
+        name = name[0:40] + '_' + hashlib.md5(key.encode('utf-8')).hexdigest()[0:6]
+    return 'idx_{0}_{1}{2}'.format(table, name, '_value' if value else '')
+
+
+def plan(weights, min_weight=1, max_indexes=None, floor=()):
+    """
+    CREATE INDEX statements for the predicates used at least min_weight times, the most used first,
+    then the ones of floor not already covered.
+    A key compared to values also covers its presence tests.
+    """
+    weights = dict(weights)
+    for (table, key, value), weight in list(weights.items()):
+        if value and (table, key, False) in weights:
+            weights[(table, key, True)] += weights.pop((table, key, False))
+
+    selected = sorted(filter(lambda w: w[1] >= min_weight, weights.items()), key=lambda w: (-w[1], w[0]))
+    if max_indexes is not None:
+        selected = selected[0:max_indexes]
+    covered = set(map(lambda w: w[0][0:2], selected))
+    selected += list(map(lambda f: (f, 0), filter(lambda f: f[0:2] not in covered, floor)))
+
+    sqls = []
+    for ((table, key, value), weight) in selected:
+        quoted = key.replace("'", "''")
+        if value:
+            sqls.append("CREATE INDEX IF NOT EXISTS {0} ON {1} ((tags->'{2}')) WHERE tags?'{2}'".format(index_name(table, key, value), table, quoted))
+        else:
+            sqls.append("CREATE INDEX IF NOT EXISTS {0} ON {1} (id) WHERE tags?'{2}'".format(index_name(table, key, value), table, quoted))
+    return sqls
+
+
+###########################################################################
+import unittest
+
+class Test(unittest.TestCase):
+
+    def test_predicates(self):
+        self.assertEqual(predicates("""
+SELECT w.id FROM ways AS w JOIN nodes n ON n.id = w.nodes[1]
+WHERE w.tags != ''::hstore AND w.tags?'power' AND w.tags->'power' IN ('line') AND NOT w.tags?'circuits' AND
+  n.tags ? 'power' AND (n.tags->'power') = 'tower' AND tags?'ambiguous'
+"""), set([('ways', 'power', False), ('ways', 'power', True), ('nodes', 'power', False), ('nodes', 'power', True)]))
+
+        self.assertEqual(predicates("""
+SELECT id FROM relations WHERE tags?'type' AND tags->'type' != 'route' AND tags ?| ARRAY['a', 'b']
+"""), set([('relations', 'type', False)]))
+
+        self.assertEqual(predicates("SELECT id FROM ways WHERE ways.tags?'railway' LIMIT 1"), set([('ways', 'railway', False)]))
+
+        self.assertEqual(predicates("SELECT id FROM {0}ways AS w JOIN {ways} ON true WHERE w.tags?'a' AND {ways}.tags?'b'"), set([('ways', 'a', False), ('ways', 'b', False)]))
+        self.assertEqual(predicates("SELECT id FROM not_touched_nodes WHERE tags?'a'"), set([('nodes', 'a', False)]))
+
+    def test_plan(self):
+        weights = collections.Counter({('ways', 'railway', False): 3, ('ways', 'highway', False): 2, ('ways', 'highway', True): 4, ('nodes', 'addr:street', False): 1})
+        self.assertEqual(plan(weights, min_weight=2), [
+            "CREATE INDEX IF NOT EXISTS idx_ways_highway_value ON ways ((tags->'highway')) WHERE tags?'highway'",
+            "CREATE INDEX IF NOT EXISTS idx_ways_railway ON ways (id) WHERE tags?'railway'",
+        ])
+        self.assertEqual(len(plan(weights, max_indexes=1)), 1)
+        self.assertIn("idx_nodes_addr_street_", plan(weights)[2])
+
+        self.assertEqual(plan(weights, max_indexes=1, floor=[('ways', 'highway', False), ('ways', 'building', False)]), [
+            "CREATE INDEX IF NOT EXISTS idx_ways_highway_value ON ways ((tags->'highway')) WHERE tags?'highway'",
+            "CREATE INDEX IF NOT EXISTS idx_ways_building ON ways (id) WHERE tags?'building'",
+        ])
+
+    def test_collect(self):
+        weights = collect(analyser_files(ANALYSERS_DIR))
+        self.assertGreater(weights[('ways', 'railway', False)], 2)
+        self.assertGreater(weights[('relations', 'type', True)], 10)
+
+        weights = collect(analyser_files(ANALYSERS_DIR, ['osmosis_highway_almost_junction']))
+        self.assertIn(('nodes', 'highway', True), weights)
+
+        weights = collect(analyser_files(ANALYSERS_DIR, ['osmosis_relation_public_transport']))
+        self.assertGreater(weights[('relations', 'route', True)], 2)
+        self.assertNotIn(('ways', 'railway', False), weights)
+
+        # Derived tables of Analyser_Osmosis
+        self.assertIn(('ways', 'highway', False), weights)
+        self.assertIn(('relations', 'type', True), weights)
+
+        weights = collect(analyser_files(ANALYSERS_DIR, ['merge_bicycle_parking_FR_brest']))
+        self.assertEqual(weights[('nodes', 'amenity', False)], 1)
+        self.assertEqual(weights[('ways', 'amenity', False)], 1)
+
+    def test_full_plan(self):
+        # As planned by OsmOsisManager for full runs
+        sqls = plan(collect(analyser_files(ANALYSERS_DIR)), min_weight=MIN_WEIGHT, max_indexes=MAX_INDEXES, floor=FLOOR)
+        covered = set(map(lambda sql: tuple(re.match(r"CREATE INDEX IF NOT EXISTS \S+ ON (\S+) .* WHERE tags\?'(.+)'$", sql).groups()), sqls))
+        # Derived tables, merge analysers, and the floor
+        for key in ('highway', 'building', 'landuse', 'boundary'):
+            self.assertIn(('ways', key), covered)
+        self.assertIn(('relations', 'type'), covered)
+        self.assertIn(('nodes', 'amenity'), covered)
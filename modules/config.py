@@ -44,6 +44,14 @@ bin_pyosmium_up_to_date = "pyosmium-up-to-date"
 # where osmconvert is located
 bin_osmconvert = "./osmconvert/osmconvert"
 
+# maximum size of the download cache in bytes, least recently used files are evicted above, None for no limit
+cache_max_size = None
+
+# settings of each database session building indexes after the import, times the number of post import workers
+# (osmose_run.py --post-import-workers), None keeps the server settings. To opt in on a large server, e.g. "512MB" and 2
+db_maintenance_work_mem = None
+db_max_parallel_maintenance_workers = None
+
 ### no need to modify following variables ###
 
 dir_tmp = os.path.join(dir_work, "tmp")
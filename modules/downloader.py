@@ -19,8 +19,11 @@
 ##                                                                       ##
 ###########################################################################
 
+import concurrent.futures
 import hashlib
 import os
+import tempfile
+import threading
 import time
 import requests
 from requests.adapters import HTTPAdapter
@@ -37,6 +40,17 @@ HTTP_DATE_FMT = "%a, %d %b %Y %H:%M:%S GMT"
 
 DEFAULT_RETRY_ON = (500, 502, 503, 504)
 
+CHUNK_SIZE = 1024 * 1024
+
+
+# Cache statistics of the process
+stats = {"hits": 0, "not_modified": 0, "downloads": 0, "fallbacks": 0, "bytes": 0, "evicted_bytes": 0}
+_stats_lock = threading.Lock()
+
+def _count(key, value=1):
+    with _stats_lock:
+        stats[key] += value
+
 
 def requests_retry_session(retries=3, backoff_factor=1, status_forcelist=DEFAULT_RETRY_ON):
     session = requests.Session()
@@ -80,8 +94,9 @@ def http_query(query=request_get):
             answer.raise_for_status()
 
         with open(tmp_file, "wb") as outfile:
-            for data in answer.iter_content(chunk_size=512):
+            for data in answer.iter_content(chunk_size=CHUNK_SIZE):
                 outfile.write(data)
+                _count("bytes", len(data))
         return True
     return http_q
 
@@ -89,9 +104,21 @@ def get_cache_path(url, extra_cache_key: str = ''):
     file_name = hashlib.sha1((url+extra_cache_key).encode('utf-8')).hexdigest()
     return os.path.join(config.dir_cache, file_name)
 
+def _replace_file(path, content):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".", suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp, path)
+
+def _touch(cache):
+    # Last use of the entry, for the eviction. The mtime of the content is its freshness.
+    try:
+        os.utime(cache + ".url")
+    except OSError:
+        pass
+
 def update_cache(url, delay, extra_cache_key: str = '', fetch = http_query()):
     cache = get_cache_path(url, extra_cache_key)
-    tmp_file = cache + ".tmp"
 
     cur_time = time.time()
     date_string = None
@@ -100,31 +127,107 @@ def update_cache(url, delay, extra_cache_key: str = '', fetch = http_query()):
         statbuf = os.stat(cache)
         if (cur_time - delay*24*60*60) < statbuf.st_mtime:
             # force cache by local delay
+            _count("hits")
+            _touch(cache)
             return cache
         date_string = datetime.strftime(datetime.fromtimestamp(statbuf.st_mtime), HTTP_DATE_FMT)
 
+    # Unique temporary file, the same url may be downloaded by concurrent processes
+    fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(cache), prefix=os.path.basename(cache) + ".", suffix=".tmp")
+    os.close(fd)
     try:
-        if not fetch(url, tmp_file, date_string):
-            # not newer
-            os.utime(cache, (cur_time,cur_time))
-            return cache
-    except:
-        if os.path.exists(cache):
-            print("Error: Fails to download, fall back to obsolete cache: {}".format(url+extra_cache_key))
-            return cache
-        else:
-            raise
-
-    outfile = open(cache+".url", "w", encoding="utf-8")
-    outfile.write(url+extra_cache_key)
-    outfile.close()
-    os.rename(tmp_file, cache)
+        try:
+            if not fetch(url, tmp_file, date_string):
+                # not newer
+                _count("not_modified")
+                os.utime(cache, (cur_time,cur_time))
+                _touch(cache)
+                return cache
+        except:
+            if os.path.exists(cache):
+                print("Error: Fails to download, fall back to obsolete cache: {}".format(url+extra_cache_key))
+                _count("fallbacks")
+                _touch(cache)
+                return cache
+            else:
+                raise
+
+        _count("downloads")
+        _replace_file(cache + ".url", url+extra_cache_key)
+        os.replace(tmp_file, cache)
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
 
     # set timestamp
     os.utime(cache, (cur_time, cur_time))
 
     return cache
 
+def prefetch(queries, workers=8, logger=None):
+    """
+    Update in parallel the cache of the queries, as (url, delay, post) tuples, before they are used.
+    Failures are only logged, they show up again when the url is actually used.
+    Return the number of failures.
+    """
+    queries = list(dict.fromkeys(map(lambda q: (q[0], q[1], str(q[2] or '')), queries)))
+    posts = dict(map(lambda q: (str(q[2] or ''), q[2]), queries))
+    failures = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = dict(map(lambda q: (executor.submit(path, q[0], q[1], posts[q[2]]), q[0]), queries))
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                failures += 1
+                if logger:
+                    logger.err("prefetch of {0} fails: {1}".format(futures[future], e))
+    return failures
+
+def evict(max_size=None, dir_cache=None):
+    """
+    Remove the least recently used entries of the cache, until it fits in max_size bytes.
+    Return the number of bytes removed.
+    """
+    max_size = config.cache_max_size if max_size is None else max_size
+    dir_cache = dir_cache or config.dir_cache
+    if max_size is None or not os.path.isdir(dir_cache):
+        return 0
+
+    cur_time = time.time()
+    entries: Dict[str, Dict[str, os.stat_result]] = {}
+    for fn in os.listdir(dir_cache):
+        p = os.path.join(dir_cache, fn)
+        try:
+            statbuf = os.stat(p)
+        except OSError:
+            continue
+        if fn.endswith(".tmp"):
+            # Left over by an interrupted download
+            if statbuf.st_mtime < cur_time - 24*60*60:
+                os.remove(p)
+            continue
+        key = fn.split(".")[0]
+        if len(key) == 40:
+            entries.setdefault(key, {})[p] = statbuf
+
+    def last_use(item):
+        (key, files) = item
+        url = os.path.join(dir_cache, key + ".url")
+        return files[url].st_mtime if url in files else max(map(lambda f: f.st_mtime, files.values()))
+
+    size = sum(map(lambda files: sum(map(lambda f: f.st_size, files.values())), entries.values()))
+    removed = 0
+    for (key, files) in sorted(entries.items(), key=last_use):
+        if size - removed <= max_size:
+            break
+        for (p, statbuf) in files.items():
+            os.remove(p)
+            removed += statbuf.st_size
+
+    _count("evicted_bytes", removed)
+    return removed
+
 def urlmtime(url, delay, post: Optional[Dict[str, str]] = None):
     if post:
         return os.stat(update_cache(url, delay, extra_cache_key=str(post or ''), fetch = http_query(request_post(post)))).st_mtime
@@ -270,3 +373,114 @@ class Test(unittest.TestCase):
         self.check_content(dst)
         exp_content = open(update_cache(self.url_fr, 100), "r", encoding="utf-8").read()
         self.assertEqual(dst, exp_content, "urlread doesn't give expected result")
+
+
+class TestLocal(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import http.server
+        import email.utils
+
+        cls.files = {
+            '/a': b'a' * 10,
+            '/b': b'b' * 20,
+            '/big': os.urandom(3 * CHUNK_SIZE + 42),
+        }
+        cls.last_modified = email.utils.formatdate(time.time() - 3600, usegmt=True)
+        cls.hits = []
+        test = cls
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                test.hits.append(self.path)
+                if self.path not in test.files:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                elif self.headers.get('If-Modified-Since'):
+                    self.send_response(304)
+                    self.end_headers()
+                else:
+                    content = test.files[self.path]
+                    self.send_response(200)
+                    self.send_header('Content-Length', str(len(content)))
+                    self.send_header('Last-Modified', test.last_modified)
+                    self.end_headers()
+                    self.wfile.write(content)
+
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        cls.url = 'http://127.0.0.1:{0}'.format(cls.server.server_address[1])
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.dir_cache = config.dir_cache
+        config.dir_cache = self.dir.name
+        self.hits.clear()
+        for k in stats.keys():
+            stats[k] = 0
+
+    def tearDown(self):
+        config.dir_cache = self.dir_cache
+        self.dir.cleanup()
+
+    def test_update_cache(self):
+        with open(update_cache(self.url + '/big', 0), 'rb') as f:
+            self.assertEqual(f.read(), self.files['/big'])
+        self.assertEqual(stats['bytes'], len(self.files['/big']))
+
+        update_cache(self.url + '/big', 1)
+        update_cache(self.url + '/big', 0)
+        self.assertEqual(stats['downloads'], 1)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['not_modified'], 1)
+        # No temporary file left
+        self.assertEqual(len(os.listdir(self.dir.name)), 2)
+
+        with self.assertRaises(requests.HTTPError):
+            update_cache(self.url + '/404', 0)
+        self.assertEqual(len(os.listdir(self.dir.name)), 2)
+
+    def test_prefetch(self):
+        queries = [(self.url + '/a', 1, None), (self.url + '/b', 1, None), (self.url + '/a', 1, None), (self.url + '/404', 1, None)]
+        self.assertEqual(prefetch(queries, workers=4), 1)
+        self.assertEqual(sorted(self.hits), ['/404', '/a', '/b'])
+        self.assertEqual(stats['downloads'], 2)
+
+        self.hits.clear()
+        self.assertEqual(urlread(self.url + '/a', 1), 'a' * 10)
+        self.assertEqual(self.hits, [])
+        self.assertEqual(stats['hits'], 1)
+
+    def test_evict(self):
+        for u in ('/a', '/b', '/big'):
+            update_cache(self.url + u, 1)
+        set_millesime(self.url + '/a', None)
+        old = time.time() - 1000
+        os.utime(get_cache_path(self.url + '/big') + '.url', (old, old))
+        os.utime(get_cache_path(self.url + '/a') + '.url', (old + 1, old + 1))
+        update_cache(self.url + '/a', 1) # Use again
+
+        self.assertEqual(evict(None), 0)
+        self.assertEqual(len(os.listdir(self.dir.name)), 7)
+
+        # The least recently used entry is removed first
+        evict(1000)
+        self.assertFalse(os.path.exists(get_cache_path(self.url + '/big')))
+        self.assertFalse(os.path.exists(get_cache_path(self.url + '/big') + '.url'))
+        self.assertTrue(os.path.exists(get_cache_path(self.url + '/a')))
+        self.assertTrue(os.path.exists(get_cache_path(self.url + '/b')))
+
+        evict(40 + len(self.url + '/a'))
+        self.assertEqual(sorted(os.listdir(self.dir.name)), sorted(map(lambda e: os.path.basename(get_cache_path(self.url + '/a')) + e, ('', '.url', '.millesime'))))
+        evict(0)
+        self.assertEqual(os.listdir(self.dir.name), [])
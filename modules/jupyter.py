@@ -49,6 +49,8 @@ def run(conf, analyser, plugin = None, format = 'osmose'):
     options = Values({
         'verbose': False,
         'plugin': plugin and [plugin] or [],
+        'sax_workers': 1,
+        'osmosis_workers': 1,
         'change': False,
     })
 
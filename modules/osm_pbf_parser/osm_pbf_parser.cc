@@ -18,6 +18,7 @@
 #########################################################################*/
 
 #include <vector>
+#include <unordered_set>
 #include <boost/python.hpp>
 using namespace boost::python;
 
@@ -64,6 +65,20 @@ boost::python::list referencesToDict(const References & refs) {
     return list;
 }
 
+template<typename T>
+inline boost::python::object vectorToBytes(const std::vector<T> & v) {
+    return boost::python::object(boost::python::handle<>(PyBytes_FromStringAndSize((const char*)v.data(), v.size() * sizeof(T))));
+}
+
+template<typename T>
+void appendTags(const T & object, std::vector<int32_t> & tags, std::vector<int64_t> & tags_offset) {
+    for (int i = 0; i < object.keys_size(); ++i) {
+        tags.push_back(object.keys(i));
+        tags.push_back(object.vals(i));
+    }
+    tags_offset.push_back(tags.size());
+}
+
 struct Visitor
 {
   Visitor() {}
@@ -78,9 +93,9 @@ struct Visitor
       since_timestamp = timestamp;
   }
 
-  void node_callback(uint64_t osmid, double lon, double lat, const Tags & tags, const uint64_t timestamp) {
-      if (!tags.empty() && (since_timestamp == 0 || timestamp == 0 || timestamp >= since_timestamp)) {
-          call_method<void>(self, "node", osmid, lon, lat, tagsToDict(tags), timestamp);
+  void node_callback(uint64_t osmid, double lon, double lat, const Tags & tags, const Metadata & meta) {
+      if (!tags.empty() && keep(meta.timestamp)) {
+          call_method<void>(self, "node", osmid, lon, lat, tagsToDict(tags), meta.timestamp, meta.version, meta.uid, stringToUnicode(meta.user));
       } else {
           filtered_nodes_osmid.push_back(osmid);
       }
@@ -90,9 +105,9 @@ struct Visitor
       return nodeIdToList(filtered_nodes_osmid);
   }
 
-  void way_callback(uint64_t osmid, const Tags & tags, const std::vector<uint64_t> & refs, const uint64_t timestamp) {
-      if (since_timestamp == 0 || timestamp == 0 || timestamp >= since_timestamp) {
-          call_method<void>(self, "way", osmid, tagsToDict(tags), nodeIdToList(refs), timestamp);
+  void way_callback(uint64_t osmid, const Tags & tags, const std::vector<uint64_t> & refs, const Metadata & meta) {
+      if (keep(meta.timestamp)) {
+          call_method<void>(self, "way", osmid, tagsToDict(tags), nodeIdToList(refs), meta.timestamp, meta.version, meta.uid, stringToUnicode(meta.user));
       } else {
           filtered_ways_osmid.push_back(osmid);
       }
@@ -102,9 +117,9 @@ struct Visitor
       return nodeIdToList(filtered_ways_osmid);
   }
 
-  void relation_callback(uint64_t osmid, const Tags & tags, const References & refs, const uint64_t timestamp) {
-      if (since_timestamp == 0 || timestamp == 0 || timestamp >= since_timestamp) {
-          call_method<void>(self, "relation", osmid, tagsToDict(tags), referencesToDict(refs), timestamp);
+  void relation_callback(uint64_t osmid, const Tags & tags, const References & refs, const Metadata & meta) {
+      if (keep(meta.timestamp)) {
+          call_method<void>(self, "relation", osmid, tagsToDict(tags), referencesToDict(refs), meta.timestamp, meta.version, meta.uid, stringToUnicode(meta.user));
       } else {
           filtered_relations_osmid.push_back(osmid);
       }
@@ -115,14 +130,279 @@ struct Visitor
   }
 
  private:
+    bool keep(const uint64_t timestamp) const {
+        return since_timestamp == 0 || timestamp == 0 || timestamp >= since_timestamp;
+    }
+
+    PyObject* self;
+    uint64_t since_timestamp = 0;
+    std::vector<uint64_t> filtered_nodes_osmid;
+    std::vector<uint64_t> filtered_ways_osmid;
+    std::vector<uint64_t> filtered_relations_osmid;
+};
+
+
+// Columns of one kind of object from a PrimitiveBlock.
+// Tags are pairs of indexes in the block string table, object i owns
+// tags[tags_offset[i]:tags_offset[i+1]]. Same for refs or members.
+// Missing uid or user_sid are -1.
+struct Columns
+{
+  Columns() {
+      tags_offset.push_back(0);
+      refs_offset.push_back(0);
+  }
+
+  template<typename T>
+  void push_info(const T & object) {
+      const OSMPBF::Info & info = object.info();
+      version.push_back(info.version());
+      uid.push_back(info.has_uid() ? info.uid() : -1);
+      user_sid.push_back(info.has_user_sid() ? (int32_t)info.user_sid() : -1);
+  }
+
+  std::vector<int64_t> id;
+  std::vector<int32_t> version;
+  std::vector<int64_t> timestamp;
+  std::vector<int64_t> uid;
+  std::vector<int32_t> user_sid;
+  std::vector<double> lon;
+  std::vector<double> lat;
+  std::vector<int32_t> tags;
+  std::vector<int64_t> tags_offset;
+  std::vector<int64_t> refs;
+  std::vector<int64_t> refs_offset;
+  std::vector<uint8_t> member_types;
+  std::vector<int32_t> member_roles;
+
+  boost::python::dict nodes() const {
+      boost::python::dict dictionary;
+      dictionary["id"] = vectorToBytes(id);
+      dictionary["version"] = vectorToBytes(version);
+      dictionary["timestamp"] = vectorToBytes(timestamp);
+      dictionary["uid"] = vectorToBytes(uid);
+      dictionary["user_sid"] = vectorToBytes(user_sid);
+      dictionary["lon"] = vectorToBytes(lon);
+      dictionary["lat"] = vectorToBytes(lat);
+      dictionary["tags"] = vectorToBytes(tags);
+      dictionary["tags_offset"] = vectorToBytes(tags_offset);
+      return dictionary;
+  }
+
+  boost::python::dict ways() const {
+      boost::python::dict dictionary;
+      dictionary["id"] = vectorToBytes(id);
+      dictionary["version"] = vectorToBytes(version);
+      dictionary["timestamp"] = vectorToBytes(timestamp);
+      dictionary["uid"] = vectorToBytes(uid);
+      dictionary["user_sid"] = vectorToBytes(user_sid);
+      dictionary["tags"] = vectorToBytes(tags);
+      dictionary["tags_offset"] = vectorToBytes(tags_offset);
+      dictionary["refs"] = vectorToBytes(refs);
+      dictionary["refs_offset"] = vectorToBytes(refs_offset);
+      return dictionary;
+  }
+
+  boost::python::dict relations() const {
+      boost::python::dict dictionary;
+      dictionary["id"] = vectorToBytes(id);
+      dictionary["version"] = vectorToBytes(version);
+      dictionary["timestamp"] = vectorToBytes(timestamp);
+      dictionary["uid"] = vectorToBytes(uid);
+      dictionary["user_sid"] = vectorToBytes(user_sid);
+      dictionary["tags"] = vectorToBytes(tags);
+      dictionary["tags_offset"] = vectorToBytes(tags_offset);
+      dictionary["member_ids"] = vectorToBytes(refs);
+      dictionary["member_types"] = vectorToBytes(member_types);
+      dictionary["member_roles"] = vectorToBytes(member_roles);
+      dictionary["members_offset"] = vectorToBytes(refs_offset);
+      return dictionary;
+  }
+};
+
+// Visitor receiving whole PrimitiveBlocks as columns, one Python call per block.
+struct BlockVisitor
+{
+  BlockVisitor() {}
+
+  BlockVisitor(PyObject *p) : self(p) {}
+
+  BlockVisitor(PyObject *p, const BlockVisitor & x) : self(p) {
+    (void)x;
+  }
+
+  void set_since_timestamp(const uint64_t timestamp) {
+      since_timestamp = timestamp;
+  }
+
+  // Only materialise blocks where at least one of the keys is present in the
+  // string table. An empty list disables the filter. Objects of the skipped
+  // blocks are not recorded as filtered: a resume must clean their issues.
+  void set_key_filter(const boost::python::list & keys) {
+      key_filter.clear();
+      for (int i = 0, l = boost::python::len(keys); i < l; ++i) {
+          key_filter.insert(boost::python::extract<std::string>(keys[i]));
+      }
+  }
+
+  void block_callback(const OSMPBF::PrimitiveBlock & primblock) {
+      const OSMPBF::StringTable & stringtable = primblock.stringtable();
+      bool materialise = key_filter.empty();
+      for (int i = 0; !materialise && i < stringtable.s_size(); ++i) {
+          materialise = key_filter.count(stringtable.s(i)) > 0;
+      }
+
+      Columns nodes, ways, relations;
+
+      for (int g = 0, gl = primblock.primitivegroup_size(); g < gl; ++g) {
+          const OSMPBF::PrimitiveGroup & pg = primblock.primitivegroup(g);
+
+          // Simple Nodes
+          for (int i = 0; i < pg.nodes_size(); ++i) {
+              const OSMPBF::Node & n = pg.nodes(i);
+              uint64_t timestamp = n.info().has_timestamp() ? n.info().timestamp() : 0;
+              if (n.keys_size() == 0 || !keep(timestamp)) {
+                  filtered_nodes_osmid.push_back(n.id());
+              } else if (materialise) {
+                  nodes.id.push_back(n.id());
+                  nodes.push_info(n);
+                  nodes.timestamp.push_back(timestamp);
+                  nodes.lon.push_back(0.000000001 * (primblock.lon_offset() + (primblock.granularity() * n.lon())));
+                  nodes.lat.push_back(0.000000001 * (primblock.lat_offset() + (primblock.granularity() * n.lat())));
+                  appendTags(n, nodes.tags, nodes.tags_offset);
+              }
+          }
+
+          // Dense Nodes
+          if (pg.has_dense()) {
+              const OSMPBF::DenseNodes & dn = pg.dense();
+              bool has_denseinfo = dn.has_denseinfo();
+              int64_t id = 0;
+              int64_t lon = 0;
+              int64_t lat = 0;
+              int64_t timestamp = 0;
+              int64_t uid = 0;
+              int32_t user_sid = 0;
+              int current_kv = 0;
+
+              for (int i = 0; i < dn.id_size(); ++i) {
+                  id += dn.id(i);
+                  lon += dn.lon(i);
+                  lat += dn.lat(i);
+                  timestamp += has_denseinfo ? dn.denseinfo().timestamp(i) : 0;
+                  uid += has_denseinfo && i < dn.denseinfo().uid_size() ? dn.denseinfo().uid(i) : 0;
+                  user_sid += has_denseinfo && i < dn.denseinfo().user_sid_size() ? dn.denseinfo().user_sid(i) : 0;
+
+                  int first_kv = current_kv;
+                  while (current_kv < dn.keys_vals_size() && dn.keys_vals(current_kv) != 0) {
+                      current_kv += 2;
+                  }
+                  int last_kv = current_kv;
+                  ++current_kv;
+
+                  if (first_kv == last_kv || !keep(timestamp)) {
+                      filtered_nodes_osmid.push_back(id);
+                  } else if (materialise) {
+                      nodes.id.push_back(id);
+                      nodes.version.push_back(has_denseinfo && i < dn.denseinfo().version_size() ? dn.denseinfo().version(i) : -1);
+                      nodes.uid.push_back(has_denseinfo && i < dn.denseinfo().uid_size() ? uid : -1);
+                      nodes.user_sid.push_back(has_denseinfo && i < dn.denseinfo().user_sid_size() ? user_sid : -1);
+                      nodes.timestamp.push_back(timestamp);
+                      nodes.lon.push_back(0.000000001 * (primblock.lon_offset() + (primblock.granularity() * lon)));
+                      nodes.lat.push_back(0.000000001 * (primblock.lat_offset() + (primblock.granularity() * lat)));
+                      for (int kv = first_kv; kv < last_kv; ++kv) {
+                          nodes.tags.push_back(dn.keys_vals(kv));
+                      }
+                      nodes.tags_offset.push_back(nodes.tags.size());
+                  }
+              }
+          }
+
+          for (int i = 0; i < pg.ways_size(); ++i) {
+              const OSMPBF::Way & w = pg.ways(i);
+              uint64_t timestamp = w.info().has_timestamp() ? w.info().timestamp() : 0;
+              if (!keep(timestamp)) {
+                  filtered_ways_osmid.push_back(w.id());
+              } else if (materialise) {
+                  ways.id.push_back(w.id());
+                  ways.push_info(w);
+                  ways.timestamp.push_back(timestamp);
+                  appendTags(w, ways.tags, ways.tags_offset);
+                  int64_t ref = 0;
+                  for (int j = 0; j < w.refs_size(); ++j) {
+                      ref += w.refs(j);
+                      ways.refs.push_back(ref);
+                  }
+                  ways.refs_offset.push_back(ways.refs.size());
+              }
+          }
+
+          for (int i = 0; i < pg.relations_size(); ++i) {
+              const OSMPBF::Relation & rel = pg.relations(i);
+              uint64_t timestamp = rel.info().has_timestamp() ? rel.info().timestamp() : 0;
+              if (!keep(timestamp)) {
+                  filtered_relations_osmid.push_back(rel.id());
+              } else if (materialise) {
+                  relations.id.push_back(rel.id());
+                  relations.push_info(rel);
+                  relations.timestamp.push_back(timestamp);
+                  appendTags(rel, relations.tags, relations.tags_offset);
+                  int64_t memid = 0;
+                  for (int j = 0; j < rel.memids_size(); ++j) {
+                      memid += rel.memids(j);
+                      relations.refs.push_back(memid);
+                      relations.member_types.push_back(rel.types(j));
+                      relations.member_roles.push_back(rel.roles_sid(j));
+                  }
+                  relations.refs_offset.push_back(relations.refs.size());
+              }
+          }
+      }
+
+      if (materialise && (!nodes.id.empty() || !ways.id.empty() || !relations.id.empty())) {
+          boost::python::list strings;
+          for (int i = 0; i < stringtable.s_size(); ++i) {
+              strings.append(stringToUnicode(stringtable.s(i)));
+          }
+          call_method<void>(self, "block", strings, nodes.nodes(), ways.ways(), relations.relations());
+      }
+  }
+
+  boost::python::list filtered_nodes() const {
+      return nodeIdToList(filtered_nodes_osmid);
+  }
+
+  boost::python::list filtered_ways() const {
+      return nodeIdToList(filtered_ways_osmid);
+  }
+
+  boost::python::list filtered_relations() const {
+      return nodeIdToList(filtered_relations_osmid);
+  }
+
+ private:
+    bool keep(const uint64_t timestamp) const {
+        return since_timestamp == 0 || timestamp == 0 || timestamp >= since_timestamp;
+    }
+
     PyObject* self;
     uint64_t since_timestamp = 0;
+    std::unordered_set<std::string> key_filter;
     std::vector<uint64_t> filtered_nodes_osmid;
     std::vector<uint64_t> filtered_ways_osmid;
     std::vector<uint64_t> filtered_relations_osmid;
 };
 
 
+void read_osm_pbf_blocks_all(const std::string & filename, BlockVisitor & visitor) {
+    read_osm_pbf_blocks<BlockVisitor>(filename, visitor);
+}
+
+void read_osm_pbf_blocks_range(const std::string & filename, BlockVisitor & visitor, uint64_t start, uint64_t end) {
+    read_osm_pbf_blocks<BlockVisitor>(filename, visitor, start, end);
+}
+
+
 BOOST_PYTHON_MODULE(osm_pbf_parser)
 {
     class_<Visitor, Visitor>("Visitor")
@@ -135,5 +415,15 @@ BOOST_PYTHON_MODULE(osm_pbf_parser)
         .def("filtered_relations", &Visitor::filtered_relations)
     ;
 
+    class_<BlockVisitor, BlockVisitor>("BlockVisitor")
+        .def("set_since_timestamp", &BlockVisitor::set_since_timestamp)
+        .def("set_key_filter", &BlockVisitor::set_key_filter)
+        .def("filtered_nodes", &BlockVisitor::filtered_nodes)
+        .def("filtered_ways", &BlockVisitor::filtered_ways)
+        .def("filtered_relations", &BlockVisitor::filtered_relations)
+    ;
+
     def("read_osm_pbf", read_osm_pbf<Visitor>);
+    def("read_osm_pbf_blocks", read_osm_pbf_blocks_all);
+    def("read_osm_pbf_blocks", read_osm_pbf_blocks_range);
 }
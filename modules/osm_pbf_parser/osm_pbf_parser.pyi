@@ -4,16 +4,32 @@ class Visitor():
 
     def set_since_timestamp(self, timestamp: int) -> None: ...
 
-    def node(self, osmid: int, lon: int, lat: int, tags: Dict[str, str]) -> None: ...
+    def node(self, osmid: int, lon: float, lat: float, tags: Dict[str, str], timestamp: int, version: int, uid: int, user: str) -> None: ...
 
     def filtered_nodes(self) -> List[int]: ...
 
-    def way(self, osmid: int, tags: Dict, refs: List[int]) -> None: ...
+    def way(self, osmid: int, tags: Dict, refs: List[int], timestamp: int, version: int, uid: int, user: str) -> None: ...
 
     def filtered_ways(self) -> List[int]: ...
 
-    def relation(self, osmid: int, tags: Dict, ref: List[Dict[str, Union[str, int]]]) -> None: ...
+    def relation(self, osmid: int, tags: Dict, ref: List[Dict[str, Union[str, int]]], timestamp: int, version: int, uid: int, user: str) -> None: ...
+
+    def filtered_relations(self) -> List[int]: ...
+
+class BlockVisitor():
+
+    def set_since_timestamp(self, timestamp: int) -> None: ...
+
+    def set_key_filter(self, keys: List[str]) -> None: ...
+
+    def block(self, strings: List[str], nodes: Dict[str, bytes], ways: Dict[str, bytes], relations: Dict[str, bytes]) -> None: ...
+
+    def filtered_nodes(self) -> List[int]: ...
+
+    def filtered_ways(self) -> List[int]: ...
 
     def filtered_relations(self) -> List[int]: ...
 
 def read_osm_pbf(pbf: str, visitor: Visitor) -> None: ...
+
+def read_osm_pbf_blocks(pbf: str, visitor: BlockVisitor, start: int = 0, end: int = 0) -> None: ...
@@ -23,13 +23,13 @@ import sys
 from . import osm_pbf_parser
 
 class V(osm_pbf_parser.Visitor):
-    def node(self, osmid, lon, lat, tags):
+    def node(self, osmid, lon, lat, tags, timestamp, version, uid, user):
         print('node', osmid, tags)
 
-    def way(self, osmid, tags, refs):
+    def way(self, osmid, tags, refs, timestamp, version, uid, user):
         print('way', osmid, tags, refs)
 
-    def relation(self, osmid, tags, ref):
+    def relation(self, osmid, tags, ref, timestamp, version, uid, user):
         print('relation', osmid, tags, ref)
 
 v = V()
@@ -31,6 +31,7 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #include <zlib.h>
 #include <string>
 #include <fstream>
+#include <type_traits>
 #include <iostream>
 
 // this describes the low-level blob storage
@@ -64,10 +65,24 @@ struct Reference {
 
 typedef std::vector<Reference> References;
 
+// Metadata of an object, version and uid are -1 and user is empty when
+// missing from the file
+struct Metadata {
+    uint64_t timestamp = 0;
+    int32_t version = -1;
+    int64_t uid = -1;
+    std::string user;
+};
+
 // Main function
 template<typename Visitor>
 void read_osm_pbf(const std::string & filename, Visitor & visitor);
 
+// Alternative main function, handing whole PrimitiveBlocks to the visitor.
+// Reading can be limited to the blobs between the start and end byte offsets.
+template<typename Visitor>
+void read_osm_pbf_blocks(const std::string & filename, Visitor & visitor, uint64_t start = 0, uint64_t end = 0);
+
 struct warn {
     warn() {std::cout << "\033[33m[WARN] ";}
     template<typename T>warn & operator<<(const T & t){ std::cout << t; return *this;}
@@ -101,16 +116,31 @@ Tags get_tags(const T& object, const OSMPBF::PrimitiveBlock &primblock){
     return result;
 }
 
-template<typename Visitor>
+template<typename T>
+Metadata get_metadata(const T& object, const OSMPBF::PrimitiveBlock &primblock){
+    Metadata result;
+    if(object.has_info()){
+        const OSMPBF::Info& info = object.info();
+        result.timestamp = info.has_timestamp() ? info.timestamp() : 0;
+        result.version = info.version();
+        if(info.has_uid())
+            result.uid = info.uid();
+        if(info.has_user_sid())
+            result.user = primblock.stringtable().s(info.user_sid());
+    }
+    return result;
+}
+
+template<typename Visitor, bool ByBlock = false>
 struct Parser {
 
     void parse(){
-        while(!this->file.eof() && !finished) {
+        while(!this->file.eof() && !finished && (this->end == 0 || (uint64_t)this->file.tellg() < this->end)) {
             OSMPBF::BlobHeader header = this->read_header();
             if(!this->finished){
                 int32_t sz = this->read_blob(header);
                 if(header.type() == "OSMData") {
-                    this->parse_primitiveblock(sz);
+                    this->parse_primitiveblock(sz, std::integral_constant<bool, ByBlock>());
                 }
                 else if(header.type() == "OSMHeader"){
                 }
@@ -121,11 +151,13 @@ struct Parser {
         }
     }
 
-    Parser(const std::string & filename, Visitor & visitor)
-        : visitor(visitor), file(filename.c_str(), std::ios::binary ), finished(false)
+    Parser(const std::string & filename, Visitor & visitor, uint64_t start = 0, uint64_t end = 0)
+        : visitor(visitor), file(filename.c_str(), std::ios::binary ), finished(false), end(end)
     {
         if(!file.is_open())
             fatal() << "Unable to open the file " << filename;
+        if(start > 0)
+            file.seekg(start);
         buffer = new char[max_uncompressed_blob_size];
         unpack_buffer = new char[max_uncompressed_blob_size];
         info() << "Reading the file" << filename;
@@ -142,6 +174,7 @@ private:
     char* buffer;
     char* unpack_buffer;
     bool finished;
+    uint64_t end;
 
     OSMPBF::BlobHeader read_header(){
         int32_t sz;
@@ -226,7 +259,16 @@ private:
         return 0;
     }
 
-    void parse_primitiveblock(int32_t sz) {
+    // Block mode: the visitor decodes the PrimitiveBlock by itself
+    void parse_primitiveblock(int32_t sz, std::true_type) {
+        OSMPBF::PrimitiveBlock primblock;
+        if(!primblock.ParseFromArray(this->unpack_buffer, sz))
+            fatal() << "unable to parse primitive block";
+
+        visitor.block_callback(primblock);
+    }
+
+    void parse_primitiveblock(int32_t sz, std::false_type) {
         OSMPBF::PrimitiveBlock primblock;
         if(!primblock.ParseFromArray(this->unpack_buffer, sz))
             fatal() << "unable to parse primitive block";
@@ -240,8 +282,7 @@ private:
 
                 double lon = 0.000000001 * (primblock.lon_offset() + (primblock.granularity() * n.lon())) ;
                 double lat = 0.000000001 * (primblock.lat_offset() + (primblock.granularity() * n.lat())) ;
-                uint64_t timestamp = n.info().has_timestamp() ? n.info().timestamp() : 0;
-                visitor.node_callback(n.id(), lon, lat, get_tags(n, primblock), timestamp);
+                visitor.node_callback(n.id(), lon, lat, get_tags(n, primblock), get_metadata(n, primblock));
             }
 
             // Dense Nodes
@@ -250,7 +291,9 @@ private:
                 uint64_t id = 0;
                 double lon = 0;
                 double lat = 0;
-                long int timestamp = 0;
+                Metadata meta;
+                int64_t uid = 0;
+                int32_t user_sid = 0;
 
                 int current_kv = 0;
 
@@ -269,8 +312,20 @@ private:
                         tags[key_string] = val_string;
                     }
                     ++current_kv;
-                    timestamp += dn.has_denseinfo() ? dn.denseinfo().timestamp(i) : 0;
-                    visitor.node_callback(id, lon, lat, tags, timestamp);
+                    if(dn.has_denseinfo()){
+                        const OSMPBF::DenseInfo& di = dn.denseinfo();
+                        meta.timestamp += di.timestamp(i);
+                        meta.version = i < di.version_size() ? di.version(i) : -1;
+                        if(i < di.uid_size()){
+                            uid += di.uid(i);
+                            meta.uid = uid;
+                        }
+                        if(i < di.user_sid_size()){
+                            user_sid += di.user_sid(i);
+                            meta.user = primblock.stringtable().s(user_sid);
+                        }
+                    }
+                    visitor.node_callback(id, lon, lat, tags, meta);
                 }
             }
 
@@ -284,8 +339,7 @@ private:
                     refs.push_back(ref);
                 }
                 uint64_t id = w.id();
-                uint64_t timestamp = w.info().has_timestamp() ? w.info().timestamp() : 0;
-                visitor.way_callback(id, get_tags(w, primblock), refs, timestamp);
+                visitor.way_callback(id, get_tags(w, primblock), refs, get_metadata(w, primblock));
             }
 
 
@@ -299,8 +353,7 @@ private:
                     refs.push_back(Reference(rel.types(l), id, primblock.stringtable().s(rel.roles_sid(l))));
                 }
 
-                uint64_t timestamp = rel.info().has_timestamp() ? rel.info().timestamp() : 0;
-                visitor.relation_callback(rel.id(), get_tags(rel, primblock), refs, timestamp);
+                visitor.relation_callback(rel.id(), get_tags(rel, primblock), refs, get_metadata(rel, primblock));
             }
         }
     }
@@ -312,4 +365,10 @@ void read_osm_pbf(const std::string & filename, Visitor & visitor){
     p.parse();
 }
 
+template<typename Visitor>
+void read_osm_pbf_blocks(const std::string & filename, Visitor & visitor, uint64_t start, uint64_t end){
+    Parser<Visitor, true> p(filename, visitor, start, end);
+    p.parse();
+}
+
 }
@@ -0,0 +1,371 @@
+#-*- coding: utf-8 -*-
+
+###########################################################################
+##                                                                       ##
+## Copyrights Osmose project 2026                                        ##
+##                                                                       ##
+## This program is free software: you can redistribute it and/or modify  ##
+## it under the terms of the GNU General Public License as published by  ##
+## the Free Software Foundation, either version 3 of the License, or     ##
+## (at your option) any later version.                                   ##
+##                                                                       ##
+## This program is distributed in the hope that it will be useful,       ##
+## but WITHOUT ANY WARRANTY; without even the implied warranty of        ##
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         ##
+## GNU General Public License for more details.                          ##
+##                                                                       ##
+## You should have received a copy of the GNU General Public License     ##
+## along with this program.  If not, see <http://www.gnu.org/licenses/>. ##
+##                                                                       ##
+###########################################################################
+
+# Resumable upload of the analyser results, and spool of the failed uploads.
+#
+# Chunked upload protocol:
+# - POST url, with the form fields of the legacy upload plus "sha256" and
+#   "size" of the whole file. The frontend answers {"id": ..., "offset": ...}.
+#   Announcing again the same content returns the same id and the offset
+#   already received.
+# - PUT url/id, a chunk with "Content-Range: bytes start-end/size". The
+#   frontend answers {"offset": ...}, the acknowledged offset. The client
+#   always goes on from that offset, even on a 409 answer, but an answer
+#   without progress counts as a failed try.
+# - Once the offset reaches the size, the frontend checks the sha256 and
+#   imports the result. The last answer may carry a "message" to log.
+
+import hashlib
+import json
+import os
+import random
+import shutil
+import time
+import requests
+
+
+USER_AGENT = 'python-requests - https://osmose.openstreetmap.fr/'
+
+RETRY_ON = (408, 429, 500, 502, 503, 504)
+
+# Spooled uploads older than this, in seconds, are dropped
+SPOOL_MAX_AGE = 7 * 24 * 3600
+
+
+class UploadError(Exception):
+    """
+    Upload refused by the frontend, retrying will not help.
+    """
+    def __init__(self, message, status_code=None):
+        Exception.__init__(self, message)
+        self.status_code = status_code
+
+
+class UploadStalled(Exception):
+    """
+    The frontend does not acknowledge the sent chunk.
+    """
+    pass
+
+
+def backoff(attempt, base=15, cap=600):
+    """
+    Delay in seconds before the retry number attempt, starting at 1. Exponential, with full jitter.
+    """
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+def file_sha256(filename):
+    h = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(1024*1024), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _check(r):
+    if r.status_code in RETRY_ON:
+        r.raise_for_status()
+    elif r.status_code >= 400 and r.status_code != 409:
+        raise UploadError(r.text.strip(), r.status_code)
+
+
+def chunked_upload(url, filename, data, chunk_size=8*1024*1024, retries=6, timeout=(30, 600), session=None, sleep=time.sleep, logger=None):
+    """
+    Upload filename to url by chunks. data are the form fields sent with the announce.
+    Retry, with backoff, up to retries consecutive failures. An answer to a chunk without progress is a
+    failure, progress beyond the furthest acknowledged offset resets the count.
+    Return the last message of the frontend. Raise UploadError when the frontend refuses the upload,
+    or the last requests exception or UploadStalled.
+    """
+    if not session:
+        session = requests.Session()
+        session.headers['User-Agent'] = USER_AGENT
+
+    size = os.path.getsize(filename)
+    announce = dict(data, sha256=file_sha256(filename), size=str(size))
+
+    upload_id = None
+    offset = None
+    furthest = None
+    failures = 0
+    with open(filename, 'rb') as f:
+        while True:
+            try:
+                sent = None
+                if upload_id is None:
+                    r = session.post(url, data=announce, timeout=timeout)
+                    _check(r)
+                    r.raise_for_status()
+                    answer = r.json()
+                    upload_id = answer['id']
+                else:
+                    sent = offset
+                    f.seek(offset)
+                    chunk = f.read(chunk_size)
+                    headers = {
+                        'Content-Range': 'bytes {0}-{1}/{2}'.format(offset, offset + len(chunk) - 1, size),
+                        'Content-Type': 'application/octet-stream',
+                    }
+                    r = session.put(url + '/' + str(upload_id), data=chunk, headers=headers, timeout=timeout)
+                    _check(r)
+                    answer = r.json()
+
+                offset = int(answer['offset'])
+                if offset >= size:
+                    return answer.get('message', '')
+                if furthest is None or offset > furthest:
+                    failures = 0
+                    furthest = offset
+                if sent is not None and offset <= sent:
+                    # 409, or chunk not taken
+                    raise UploadStalled('no progress, HTTP {0}'.format(r.status_code))
+
+            except UploadError:
+                raise
+            except (requests.exceptions.RequestException, ValueError, KeyError, UploadStalled) as e:
+                failures += 1
+                if failures > retries:
+                    raise
+                delay = backoff(failures)
+                if logger:
+                    logger.err('upload failed at offset {0}, retry in {1:.0f}s: {2}'.format(offset or 0, delay, e))
+                sleep(delay)
+                # Ask again the acknowledged offset
+                upload_id = None
+
+
+###########################################################################
+# Spool of the failed uploads, retried on the next run.
+# One entry by frontend url, country and analyser, a newer result replaces the older one.
+
+def _spool_key(url, country, analyser_name):
+    return hashlib.sha1('\0'.join([url, country, analyser_name]).encode('utf-8')).hexdigest()[0:16]
+
+
+def spool(spool_dir, filename, url, country, analyser, analyser_name):
+    """
+    Keep a copy of a failed upload in spool_dir.
+    """
+    os.makedirs(spool_dir, exist_ok=True)
+    base = os.path.join(spool_dir, _spool_key(url, country, analyser_name))
+    content = base + '-' + os.path.basename(filename)
+    shutil.copyfile(filename, content + '.tmp')
+    os.replace(content + '.tmp', content)
+    meta = {
+        'url': url,
+        'country': country,
+        'analyser': analyser,
+        'analyser_name': analyser_name,
+        'filename': os.path.basename(filename),
+        'file': os.path.basename(content),
+        'time': time.time(),
+    }
+    with open(base + '.json.tmp', 'w') as f:
+        json.dump(meta, f)
+    os.replace(base + '.json.tmp', base + '.json')
+
+
+def spooled(spool_dir, country=None):
+    """
+    List the spooled uploads, as dicts with the absolute path of the content on "file".
+    """
+    if not os.path.isdir(spool_dir):
+        return []
+    entries = []
+    for fn in sorted(os.listdir(spool_dir)):
+        if not fn.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(spool_dir, fn)) as f:
+                meta = json.load(f)
+        except ValueError:
+            continue
+        meta['file'] = os.path.join(spool_dir, meta['file'])
+        if (country is None or meta['country'] == country) and os.path.exists(meta['file']):
+            entries.append(meta)
+    return entries
+
+
+def unspool(spool_dir, url, country, analyser_name):
+    """
+    Remove a spooled upload, sent, or outdated by a newer result.
+    """
+    if not os.path.isdir(spool_dir):
+        return
+    key = _spool_key(url, country, analyser_name)
+    for fn in os.listdir(spool_dir):
+        if fn.startswith(key):
+            os.remove(os.path.join(spool_dir, fn))
+
+
+###########################################################################
+import unittest
+
+class Test(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import http.server
+        import threading
+
+        cls.uploads = {}
+        cls.fail = []
+        cls.stall = [None]
+        cls.received = [0]
+        test = cls
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def answer(self, status, content):
+                body = json.dumps(content).encode('utf-8') if isinstance(content, dict) else content.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                import urllib.parse
+                length = int(self.headers['Content-Length'])
+                form = dict(urllib.parse.parse_qsl(self.rfile.read(length).decode('utf-8')))
+                if form.get('code') != 'secret':
+                    return self.answer(403, 'FAIL: Wrong password')
+                upload_id = form['sha256'][0:8]
+                u = test.uploads.setdefault(upload_id, {'sha256': form['sha256'], 'size': int(form['size']), 'content': b''})
+                self.answer(200, {'id': upload_id, 'offset': len(u['content'])})
+
+            def do_PUT(self):
+                u = test.uploads[self.path.split('/')[-1]]
+                length = int(self.headers['Content-Length'])
+                chunk = self.rfile.read(length)
+                test.received[0] += length
+                (start, end) = map(int, self.headers['Content-Range'].split(' ')[1].split('/')[0].split('-'))
+                if test.fail and test.fail[0] == start:
+                    test.fail.pop(0)
+                    # Lost chunk
+                    return self.answer(503, 'Service Unavailable')
+                if test.stall[0] is not None and start >= 128*1024:
+                    # Chunk not taken
+                    return self.answer(test.stall[0], {'offset': len(u['content'])})
+                if start != len(u['content']):
+                    return self.answer(409, {'offset': len(u['content'])})
+                u['content'] += chunk
+                if len(u['content']) == u['size']:
+                    if hashlib.sha256(u['content']).hexdigest() != u['sha256']:
+                        return self.answer(422, 'FAIL: Bad checksum')
+                    return self.answer(200, {'offset': len(u['content']), 'message': 'OK'})
+                self.answer(200, {'offset': len(u['content'])})
+
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        cls.url = 'http://127.0.0.1:{0}/control/send-update'.format(cls.server.server_address[1])
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        import tempfile
+        self.uploads.clear()
+        self.stall[0] = None
+        self.received[0] = 0
+        self.dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.dir.name, 'Analyser_Test-monaco.xml.bz2')
+        self.content = os.urandom(1000 * 1000)
+        with open(self.filename, 'wb') as f:
+            f.write(self.content)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_backoff(self):
+        for attempt in range(1, 10):
+            for _ in range(10):
+                self.assertTrue(0 <= backoff(attempt, base=2, cap=60) <= min(60, 2 ** attempt))
+
+    def test_upload(self):
+        message = chunked_upload(self.url, self.filename, {'code': 'secret'}, chunk_size=64*1024, sleep=lambda d: None)
+        self.assertEqual(message, 'OK')
+        self.assertEqual(list(self.uploads.values())[0]['content'], self.content)
+        self.assertEqual(self.received[0], len(self.content))
+
+    def test_resume(self):
+        delays = []
+        self.fail[:] = [128*1024, 128*1024, 512*1024]
+        message = chunked_upload(self.url, self.filename, {'code': 'secret'}, chunk_size=64*1024, sleep=delays.append)
+        self.assertEqual(message, 'OK')
+        self.assertEqual(list(self.uploads.values())[0]['content'], self.content)
+        # Only the lost chunks are sent again
+        self.assertEqual(self.received[0], len(self.content) + 3*64*1024)
+        self.assertEqual(len(delays), 3)
+
+        # Already received, nothing more to send
+        self.received[0] = 0
+        chunked_upload(self.url, self.filename, {'code': 'secret'}, chunk_size=64*1024, sleep=delays.append)
+        self.assertEqual(self.received[0], 0)
+
+    def test_give_up(self):
+        self.fail[:] = [0] * 3
+        with self.assertRaises(requests.exceptions.HTTPError):
+            chunked_upload(self.url, self.filename, {'code': 'secret'}, chunk_size=64*1024, retries=2, sleep=lambda d: None)
+        self.fail[:] = []
+
+        with self.assertRaises(UploadError) as cm:
+            chunked_upload(self.url, self.filename, {'code': 'wrong'}, sleep=lambda d: None)
+        self.assertEqual(cm.exception.status_code, 403)
+
+    def test_stalled(self):
+        for status in (200, 409):
+            self.uploads.clear()
+            delays = []
+            self.stall[0] = status
+            with self.assertRaises(UploadStalled):
+                chunked_upload(self.url, self.filename, {'code': 'secret'}, chunk_size=64*1024, retries=3, sleep=delays.append)
+            self.assertEqual(len(delays), 3)
+            self.assertEqual(len(list(self.uploads.values())[0]['content']), 128*1024)
+
+        # Resumed on the next try
+        self.stall[0] = None
+        self.assertEqual(chunked_upload(self.url, self.filename, {'code': 'secret'}, chunk_size=64*1024, sleep=lambda d: None), 'OK')
+        self.assertEqual(list(self.uploads.values())[0]['content'], self.content)
+
+    def test_spool(self):
+        spool_dir = os.path.join(self.dir.name, 'spool')
+        self.assertEqual(spooled(spool_dir), [])
+        spool(spool_dir, self.filename, self.url, 'monaco', 'test', 'Test')
+        spool(spool_dir, self.filename, self.url, 'monaco', 'test', 'Test')
+        spool(spool_dir, self.filename, self.url + '2', 'monaco', 'test', 'Test')
+        spool(spool_dir, self.filename, self.url, 'andorra', 'test', 'Test')
+
+        entries = spooled(spool_dir, 'monaco')
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(set(map(lambda e: e['url'], entries)), {self.url, self.url + '2'})
+        with open(entries[0]['file'], 'rb') as f:
+            self.assertEqual(f.read(), self.content)
+        self.assertEqual(entries[0]['filename'], 'Analyser_Test-monaco.xml.bz2')
+
+        unspool(spool_dir, self.url, 'monaco', 'Test')
+        self.assertEqual(list(map(lambda e: e['url'], spooled(spool_dir, 'monaco'))), [self.url + '2'])
+        self.assertEqual(len(spooled(spool_dir)), 2)
+        self.assertEqual(len(os.listdir(spool_dir)), 4)
@@ -23,6 +23,7 @@
 from modules import OsmoseLog, download
 from modules.lockfile import lockfile
 from modules import downloader
+from modules import IssuesFile
 from modules import IssuesFileOsmose
 from modules import IssuesFileCsv
 from modules import IssuesFileGeoJson
@@ -31,10 +32,15 @@ import os
 import traceback
 import modules.OsmOsisManager
 import modules.config
+import modules.uploader
 import osmose_config as config
 
 import importlib
 import inspect
+import multiprocessing
+import queue
+import threading
+import concurrent.futures
 import subprocess
 import time
 import dateutil.parser
@@ -106,6 +112,8 @@ class analyser_config:
         self.source_url = conf.source_url
 
         self.plugins = options.plugin
+        self.sax_workers = options.sax_workers
+        self.osmosis_workers = options.osmosis_workers
 
         self.verbose = options.verbose
 
@@ -117,7 +125,7 @@ class analyser_config:
                 self.src_state = os.path.join(conf.download["diff_path"], "state.txt")
 
 
-def issues_file_from_fromat(dst, format, bz2 = False, version = None, polygon_id = None):
+def issues_file_from_fromat(dst, format, compression = 'none', version = None, polygon_id = None, compression_level = None):
     if format == 'csv':
         if isinstance(dst, str):
             dst += '.csv'
@@ -130,10 +138,10 @@ def issues_file_from_fromat(dst, format, bz2 = False, version = None, polygon_id
         if isinstance(dst, str):
             dst += '.xml'
         c = IssuesFileOsmose.IssuesFileOsmose
-    if bz2 and isinstance(dst, str):
-        dst += '.bz2'
+    if isinstance(dst, str):
+        dst += IssuesFile.compressions[compression][0]
 
-    return c(dst, version, polygon_id)
+    return c(dst, version, polygon_id, compression_level)
 
 
 def execc(conf, logger, analysers, options, osmosis_manager):
@@ -213,133 +221,26 @@ def execc(conf, logger, analysers, options, osmosis_manager):
     lunched_analyser_change = []
     lunched_analyser_resume = []
 
-    for analyser in analysers:
-        if os.getenv('SENTRY_DSN'):
-            sentry_sdk.set_tag('analyser', analyser)
-
-        if not options.analyser and analyser not in conf.analyser:
-            continue
-
-        logger.log(logger.log_av_r + conf.country + " : " + analyser + logger.log_ap)
-
-        password = conf.analyser.get(analyser)
+    selected = list(filter(lambda analyser: options.analyser or analyser in conf.analyser, analysers))
 
-        if not options.skip_upload and (not password or password == "xxx"):
-            logger.sub().err("No password to upload result to %s" % conf.updt_url)
-
-        try:
-            analyser_conf = analyser_config(conf, options, osmosis_manager, xml_change)
-
-            for name, obj in inspect.getmembers(analysers[analyser]):
-                if (inspect.isclass(obj) and obj.__module__ == "analysers.analyser_" + analyser and
-                    (name.startswith("Analyser") or name.startswith("analyser"))):
-                    analyser_name = name[len("Analyser_"):]
-                    resume = options.resume or (options.resume_analyser and analyser in options.resume_analyser)
-
-                    dst = os.path.join(conf.dir_results, name + "-" + conf.country)
-                    analyser_conf.error_file = issues_file_from_fromat(dst, options.result_format, bz2 = True, version = version, polygon_id = analyser_conf.polygon_id)
-
-                    # analyse
-                    if not options.skip_analyser:
-                        with obj(analyser_conf, logger.sub()) as analyser_obj:
-                            remote_timestamp = None
-                            if not options.skip_frontend_check:
-                                url = modules.config.url_frontend_update + "/../../control/status/%s/%s?%s" % (conf.country, analyser_name, 'objects=true' if resume else '')
-                                resp = downloader.request_get(url)
-                                if not resp.ok:
-                                    logger.sub().err("Fails to get status from frontend: {0}".format(resp.status_code))
-                                else:
-                                    try:
-                                        status = resp.json()
-                                        remote_timestamp = dateutil.parser.parse(status['timestamp']) if status else None
-                                        remote_analyser_version = int(status['analyser_version'])
-                                    except Exception as e:
-                                        logger.sub().err(e)
-
-                            if analyser_obj.timestamp() and remote_timestamp and analyser_obj.timestamp() <= remote_timestamp and analyser_obj.analyser_version() == remote_analyser_version:
-                                logger.sub().warn("Skip, frontend is already up to date")
-                                continue
-
-                            if resume and remote_timestamp and analyser_obj.analyser_version() == remote_analyser_version:
-                                already_issued_objects = {'N': status['nodes'] or [], 'W': status['ways'] or [], 'R': status['relations'] or []}
-                                analyser_obj.analyser_resume(remote_timestamp, already_issued_objects)
-                                lunched_analyser_resume.append([obj, analyser_conf])
-                            else:
-                                if resume:
-                                    if not remote_timestamp:
-                                        logger.sub().err("No remote timestamp to resume from, start a full run")
-                                    elif analyser_obj.analyser_version() == remote_analyser_version:
-                                        logger.sub().err("Analyser version changed, start a full run")
-
-                                if not options.change or not xml_change:
-                                    analyser_obj.analyser()
-                                    lunched_analyser.append([obj, analyser_conf])
-                                else:
-                                    analyser_obj.analyser_change()
-                                    lunched_analyser_change.append([obj, analyser_conf])
-
-                    # update
-                    if not options.skip_upload and password != "xxx":
-                        logger.sub().log("update")
-
-                        if analyser in conf.analyser_updt_url:
-                            list_urls = conf.analyser_updt_url[analyser]
-                        else:
-                            list_urls = [conf.updt_url]
-
-                        for url in list_urls:
-                            update_finished = False
-                            nb_iter = 0
-                            was_on_timeout = False
-                            while not update_finished and nb_iter < 3:
-                                time.sleep(nb_iter * 15)
-                                nb_iter += 1
-                                logger.sub().sub().log("iteration=%d" % nb_iter)
-                                try:
-                                    u = url + '?analyser=' + analyser_name + '&country=' + conf.country
-                                    r = requests.post(u, timeout=1800, data={
-                                        'analyser': analyser_name,
-                                        'country': conf.country,
-                                        'code': password
-                                    }, files={
-                                        'content': open(analyser_conf.error_file.dst, 'rb')
-                                    })
-                                    r.raise_for_status()
-                                    logger.sub().sub().log(r.text.strip())
-                                    update_finished = True
-                                except requests.exceptions.HTTPError as e:
-                                    if e.response.status_code == 504:
-                                        was_on_timeout = True
-                                        logger.sub().sub().sub().err('got an HTTP timeout status')
-                                    else:
-                                        dt = r.text.strip()
-                                        logger.sub().sub().sub().err(u"UPDATE ERROR %s/%s : %s\n" % (conf.country, analyser_name, dt))
-                                        if dt == "FAIL: Already up to date":
-                                            update_finished = True
-                                        if nb_iter >= 3 and not was_on_timeout:
-                                            err_code |= 4
-                                except Exception as e:
-                                    if isinstance(e, requests.exceptions.ConnectTimeout):
-                                        was_on_timeout = True
-                                        logger.sub().sub().sub().err('got a connection timeout')
-                                    else:
-                                        tb = traceback.format_exc()
-                                        logger.sub().err('error on update...')
-                                        for l in tb.splitlines():
-                                            logger.sub().sub().log(l)
-
-                        if not update_finished:
-                            err_code |= 1
+    if not options.skip_analyser and options.prefetch_workers > 0:
+        prefetch_sources(conf, logger, analysers, options, selected, osmosis_manager, xml_change)
 
-        except Exception as e:
-            tb = traceback.format_exc()
-            logger.sub().err("error on analyse {0}...".format(analyser))
-            for l in tb.splitlines():
-                logger.sub().sub().log(l)
-            err_code |= 2
-            if os.getenv('SENTRY_DSN'):
-                sentry_sdk.capture_exception(e)
-            continue
+    if options.jobs > 1:
+        (err, launched) = execc_parallel(conf, logger, analysers, options, selected, osmosis_manager, xml_change, version)
+        err_code |= err
+    else:
+        launched = []
+        for analyser in selected:
+            password = conf.analyser.get(analyser)
+            upload = lambda analyser_name, dst: analyser_upload(conf, logger, options, analyser, analyser_name, password, dst)
+            (err, analyser_launched) = analyser_run(conf, logger, analyser, analysers[analyser], options, osmosis_manager, xml_change, version, upload)
+            err_code |= err
+            launched += list(map(lambda l: (analyser, ) + l, analyser_launched))
+
+    for (analyser, launch, name) in launched:
+        lunched = {'full': lunched_analyser, 'change': lunched_analyser_change, 'resume': lunched_analyser_resume}[launch]
+        lunched.append([getattr(analysers[analyser], name), analyser_config(conf, options, osmosis_manager, xml_change)])
 
     if os.getenv('SENTRY_DSN'):
         sentry_sdk.set_tag('analyser', None)
@@ -361,6 +262,369 @@ def execc(conf, logger, analysers, options, osmosis_manager):
     return err_code
 
 
+def prefetch_sources(conf, logger, analysers, options, selected, osmosis_manager, xml_change):
+    """
+    Download in parallel the data sources declared by the merge analysers, before they run.
+    """
+    from analysers.Analyser_Merge import Analyser_Merge
+    from analysers.Analyser_Merge_Dynamic import Analyser_Merge_Dynamic
+
+    queries = []
+    for analyser in selected:
+        for name, obj in inspect.getmembers(analysers[analyser]):
+            if (inspect.isclass(obj) and obj.__module__ == "analysers.analyser_" + analyser and
+                (name.startswith("Analyser") or name.startswith("analyser")) and
+                issubclass(obj, (Analyser_Merge, Analyser_Merge_Dynamic))):
+                try:
+                    analyser_conf = analyser_config(conf, options, osmosis_manager, xml_change)
+                    analyser_conf.error_file = None
+                    queries += obj(analyser_conf, logger.sub()).prefetch()
+                except Exception as e:
+                    logger.sub().err("fails to list the sources of {0}: {1}".format(name, e))
+
+    if queries:
+        logger.log(logger.log_av_r + "prefetch {0} sources".format(len(queries)) + logger.log_ap)
+        downloader.prefetch(queries, workers=options.prefetch_workers, logger=logger.sub())
+
+
+def analyser_in_process(module):
+    """
+    SAX and merge analysers are mostly Python bound, run them on their own process.
+    """
+    from analysers.analyser_sax import Analyser_Sax
+    from analysers.Analyser_Merge import Analyser_Merge
+    from analysers.Analyser_Merge_Dynamic import Analyser_Merge_Dynamic
+
+    return any(map(lambda obj: inspect.isclass(obj) and obj.__module__ == module.__name__ and issubclass(obj, (Analyser_Sax, Analyser_Merge, Analyser_Merge_Dynamic)),
+        map(lambda member: member[1], inspect.getmembers(module))))
+
+
+def execc_parallel(conf, logger, analysers, options, selected, osmosis_manager, xml_change, version):
+    """
+    Run the analysers on a pool of options.jobs workers. Osmosis analysers run on threads, each one on its
+    own database connection. SAX and merge analysers run on a forked process. Results are uploaded from a
+    background thread, while the next analysers are running.
+    Return the error code, and the launched analysers as (analyser, launch mode, class name), in the analysers order.
+    """
+    uploads = queue.Queue()
+    upload_err_code = [0]
+
+    def uploader():
+        while True:
+            u = uploads.get()
+            try:
+                if u is None:
+                    return
+                upload_err_code[0] |= analyser_upload(conf, logger, options, *u)
+            except Exception:
+                tb = traceback.format_exc()
+                logger.err('error on update...')
+                for l in tb.splitlines():
+                    logger.sub().log(l)
+                upload_err_code[0] |= 1
+            finally:
+                uploads.task_done()
+
+    def job_logger(analyser):
+        return logger.job(analyser) if options.jobs > 1 else logger
+
+    def run_thread(analyser):
+        password = conf.analyser.get(analyser)
+        def upload(analyser_name, dst):
+            uploads.put((analyser, analyser_name, password, dst))
+            return 0
+        return analyser_run(conf, job_logger(analyser), analyser, analysers[analyser], options, osmosis_manager, xml_change, version, upload)
+
+    def run_process(analyser):
+        password = conf.analyser.get(analyser)
+        ctx = multiprocessing.get_context('fork')
+        (parent_conn, child_conn) = ctx.Pipe(False)
+
+        def child():
+            def upload(analyser_name, dst):
+                child_conn.send(('upload', (analyser, analyser_name, password, dst)))
+                return 0
+            try:
+                (err_code, launched) = analyser_run(conf, job_logger(analyser), analyser, analysers[analyser], options, osmosis_manager, xml_change, version, upload)
+                child_conn.send(('end', err_code, launched))
+            except Exception:
+                child_conn.send(('error', traceback.format_exc()))
+
+        process = ctx.Process(target=child)
+        process.start()
+        child_conn.close()
+
+        ret = None
+        try:
+            while ret is None:
+                message = parent_conn.recv()
+                if message[0] == 'upload':
+                    uploads.put(message[1])
+                elif message[0] == 'end':
+                    ret = (message[1], message[2])
+                else:
+                    logger.err("error on analyse {0}...".format(analyser))
+                    for l in message[1].splitlines():
+                        logger.sub().log(l)
+                    ret = (2, [])
+        except EOFError:
+            logger.err("analyse {0} process died".format(analyser))
+            ret = (2, [])
+        finally:
+            parent_conn.close()
+            process.join()
+
+        return ret
+
+    upload_thread = threading.Thread(target=uploader, daemon=True)
+    upload_thread.start()
+
+    err_code = 0
+    launched = []
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=options.jobs) as executor:
+            futures = list(map(lambda analyser: (analyser, executor.submit(run_process if analyser_in_process(analysers[analyser]) else run_thread, analyser)), selected))
+            for (analyser, future) in futures:
+                try:
+                    (err, analyser_launched) = future.result()
+                except Exception:
+                    tb = traceback.format_exc()
+                    logger.err("error on analyse {0}...".format(analyser))
+                    for l in tb.splitlines():
+                        logger.sub().log(l)
+                    (err, analyser_launched) = (2, [])
+                err_code |= err
+                launched += list(map(lambda l: (analyser, ) + tuple(l), analyser_launched))
+    finally:
+        uploads.put(None)
+        upload_thread.join()
+
+    return (err_code | upload_err_code[0], launched)
+
+
+def analyser_run(conf, logger, analyser, module, options, osmosis_manager, xml_change, version, upload):
+    """
+    Run the analyser classes of an analyser module, and upload their results with upload(analyser_name, dst).
+    Return the error code, and the launched analysers as (launch mode, class name) for the deferred clean.
+    """
+    if os.getenv('SENTRY_DSN'):
+        # Analysers run concurrently on threads, tag the events of this one only
+        with sentry_sdk.isolation_scope() as scope:
+            scope.set_tag('analyser', analyser)
+            return analyser_run_scoped(conf, logger, analyser, module, options, osmosis_manager, xml_change, version, upload)
+    else:
+        return analyser_run_scoped(conf, logger, analyser, module, options, osmosis_manager, xml_change, version, upload)
+
+
+def analyser_run_scoped(conf, logger, analyser, module, options, osmosis_manager, xml_change, version, upload):
+    err_code = 0
+    launched = []
+
+    logger.log(logger.log_av_r + conf.country + " : " + analyser + logger.log_ap)
+
+    password = conf.analyser.get(analyser)
+
+    if not options.skip_upload and (not password or password == "xxx"):
+        logger.sub().err("No password to upload result to %s" % conf.updt_url)
+
+    try:
+        analyser_conf = analyser_config(conf, options, osmosis_manager, xml_change)
+
+        for name, obj in inspect.getmembers(module):
+            if (inspect.isclass(obj) and obj.__module__ == "analysers.analyser_" + analyser and
+                (name.startswith("Analyser") or name.startswith("analyser"))):
+                analyser_name = name[len("Analyser_"):]
+                resume = options.resume or (options.resume_analyser and analyser in options.resume_analyser)
+
+                dst = os.path.join(conf.dir_results, name + "-" + conf.country)
+                analyser_conf.error_file = issues_file_from_fromat(dst, options.result_format, compression = options.result_compression, version = version, polygon_id = analyser_conf.polygon_id, compression_level = options.result_compression_level)
+
+                # analyse
+                if not options.skip_analyser:
+                    with obj(analyser_conf, logger.sub()) as analyser_obj:
+                        remote_timestamp = None
+                        if not options.skip_frontend_check:
+                            url = modules.config.url_frontend_update + "/../../control/status/%s/%s?%s" % (conf.country, analyser_name, 'objects=true' if resume else '')
+                            resp = downloader.request_get(url)
+                            if not resp.ok:
+                                logger.sub().err("Fails to get status from frontend: {0}".format(resp.status_code))
+                            else:
+                                try:
+                                    status = resp.json()
+                                    remote_timestamp = dateutil.parser.parse(status['timestamp']) if status else None
+                                    remote_analyser_version = int(status['analyser_version'])
+                                except Exception as e:
+                                    logger.sub().err(e)
+
+                        if analyser_obj.timestamp() and remote_timestamp and analyser_obj.timestamp() <= remote_timestamp and analyser_obj.analyser_version() == remote_analyser_version:
+                            logger.sub().warn("Skip, frontend is already up to date")
+                            continue
+
+                        if resume and remote_timestamp and analyser_obj.analyser_version() == remote_analyser_version:
+                            already_issued_objects = {'N': status['nodes'] or [], 'W': status['ways'] or [], 'R': status['relations'] or []}
+                            analyser_obj.analyser_resume(remote_timestamp, already_issued_objects)
+                            launched.append(('resume', name))
+                        else:
+                            if resume:
+                                if not remote_timestamp:
+                                    logger.sub().err("No remote timestamp to resume from, start a full run")
+                                elif analyser_obj.analyser_version() == remote_analyser_version:
+                                    logger.sub().err("Analyser version changed, start a full run")
+
+                            if not options.change or not xml_change:
+                                analyser_obj.analyser()
+                                launched.append(('full', name))
+                            else:
+                                analyser_obj.analyser_change()
+                                launched.append(('change', name))
+
+                # update
+                if not options.skip_upload and password != "xxx":
+                    err_code |= upload(analyser_name, analyser_conf.error_file.dst)
+
+    except Exception as e:
+        tb = traceback.format_exc()
+        logger.sub().err("error on analyse {0}...".format(analyser))
+        for l in tb.splitlines():
+            logger.sub().sub().log(l)
+        err_code |= 2
+        if os.getenv('SENTRY_DSN'):
+            sentry_sdk.capture_exception(e)
+
+    return (err_code, launched)
+
+
+def analyser_upload(conf, logger, options, analyser, analyser_name, password, dst):
+    """
+    Upload an analyser result to the frontends, with retries. Failed uploads are kept on the spool
+    directory, to be sent again on the next run. Return the error code.
+    """
+    err_code = 0
+    logger.sub().log("update")
+
+    if analyser in conf.analyser_updt_url:
+        list_urls = conf.analyser_updt_url[analyser]
+    else:
+        list_urls = [conf.updt_url]
+
+    spool_dir = os.path.join(conf.dir_results, "spool")
+    for url in list_urls:
+        err = analyser_upload_url(conf, logger, options, url, analyser_name, password, dst)
+        err_code |= err
+        if options.upload_spool:
+            if err == 1:
+                logger.sub().sub().log("spool for next run")
+                modules.uploader.spool(spool_dir, dst, url, conf.country, analyser, analyser_name)
+            else:
+                # Outdated by this result
+                modules.uploader.unspool(spool_dir, url, conf.country, analyser_name)
+
+    return err_code
+
+
+def analyser_upload_url(conf, logger, options, url, analyser_name, password, dst, filename=None):
+    """
+    Upload an analyser result to one frontend. Return the error code, 1 when the upload can be
+    tried again later, 4 when it was refused.
+    """
+    err_code = 0
+    filename = filename or os.path.basename(dst)
+
+    if options.upload_chunk_size:
+        try:
+            message = modules.uploader.chunked_upload(url, dst, {
+                'analyser': analyser_name,
+                'country': conf.country,
+                'code': password,
+                'filename': filename,
+            }, chunk_size=options.upload_chunk_size * 1024 * 1024, logger=logger.sub().sub())
+            logger.sub().sub().log(message)
+        except modules.uploader.UploadError as e:
+            logger.sub().sub().sub().err(u"UPDATE ERROR %s/%s : %s\n" % (conf.country, analyser_name, e))
+            if str(e) != "FAIL: Already up to date":
+                err_code |= 4 | 1
+        except Exception as e:
+            tb = traceback.format_exc()
+            logger.sub().err('error on update...')
+            for l in tb.splitlines():
+                logger.sub().sub().log(l)
+            err_code |= 1
+        return err_code
+
+    update_finished = False
+    nb_iter = 0
+    was_on_timeout = False
+    while not update_finished and nb_iter < 3:
+        if nb_iter > 0:
+            time.sleep(modules.uploader.backoff(nb_iter))
+        nb_iter += 1
+        logger.sub().sub().log("iteration=%d" % nb_iter)
+        try:
+            u = url + '?analyser=' + analyser_name + '&country=' + conf.country
+            with open(dst, 'rb') as content:
+                r = requests.post(u, timeout=1800, data={
+                    'analyser': analyser_name,
+                    'country': conf.country,
+                    'code': password
+                }, files={
+                    'content': (filename, content)
+                })
+            r.raise_for_status()
+            logger.sub().sub().log(r.text.strip())
+            update_finished = True
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 504:
+                was_on_timeout = True
+                logger.sub().sub().sub().err('got an HTTP timeout status')
+            else:
+                dt = r.text.strip()
+                logger.sub().sub().sub().err(u"UPDATE ERROR %s/%s : %s\n" % (conf.country, analyser_name, dt))
+                if dt == "FAIL: Already up to date":
+                    update_finished = True
+                if nb_iter >= 3 and not was_on_timeout:
+                    err_code |= 4
+        except Exception as e:
+            if isinstance(e, requests.exceptions.ConnectTimeout):
+                was_on_timeout = True
+                logger.sub().sub().sub().err('got a connection timeout')
+            else:
+                tb = traceback.format_exc()
+                logger.sub().err('error on update...')
+                for l in tb.splitlines():
+                    logger.sub().sub().log(l)
+
+    if not update_finished:
+        err_code |= 1
+
+    return err_code
+
+
+def upload_spooled(conf, logger, options):
+    """
+    Send again the results of the uploads failed on previous runs. Return the error code.
+    Drop the results that cannot be uploaded anymore.
+    """
+    err_code = 0
+    spool_dir = os.path.join(conf.dir_results, "spool")
+    for entry in modules.uploader.spooled(spool_dir, conf.country):
+        password = conf.analyser.get(entry['analyser'])
+        if not password or password == "xxx":
+            logger.warn("drop spooled {0}, no password to upload it to {1}".format(entry['filename'], entry['url']))
+            modules.uploader.unspool(spool_dir, entry['url'], conf.country, entry['analyser_name'])
+            continue
+        if time.time() - entry['time'] > modules.uploader.SPOOL_MAX_AGE:
+            logger.warn("drop spooled {0}, older than {1} days".format(entry['filename'], modules.uploader.SPOOL_MAX_AGE // (24 * 3600)))
+            modules.uploader.unspool(spool_dir, entry['url'], conf.country, entry['analyser_name'])
+            continue
+        logger.log(logger.log_av_r + "upload spooled " + entry['filename'] + logger.log_ap)
+        err = analyser_upload_url(conf, logger, options, entry['url'], entry['analyser_name'], password, entry['file'], entry['filename'])
+        if err != 1:
+            modules.uploader.unspool(spool_dir, entry['url'], conf.country, entry['analyser_name'])
+        err_code |= err
+
+    return err_code
+
+
 def clean(conf, logger, options, osmosis_manager):
     logger.log(logger.log_av_r + u"cleaning : " + logger.log_ap)
 
@@ -391,6 +655,9 @@ def run(conf, logger, analysers, options):
     if err != 0:
         return err
 
+    if not options.skip_upload and options.upload_spool:
+        err |= upload_spooled(conf, logger, options)
+
     try:
         osmosis_manager = None
         if hasattr(conf, "db_base") and conf.db_base:
@@ -401,7 +668,7 @@ def run(conf, logger, analysers, options):
                 logger.err(u"error in database initialisation")
                 return 0x10
 
-        return execc(conf, logger, analysers, options, osmosis_manager)
+        return err | execc(conf, logger, analysers, options, osmosis_manager)
     except:
         # Log error in case finally also fails
         traceback.print_exc()
@@ -519,6 +786,10 @@ def main(options):
     if os.getenv('SENTRY_DSN'):
         sentry_sdk.set_tag('country', None)
 
+    if modules.config.cache_max_size is not None:
+        downloader.evict()
+    logger.log("download cache: " + ", ".join(map(lambda kv: "%s=%s" % kv, downloader.stats.items())))
+
     logger.log(logger.log_av_green+u"end of analyses"+logger.log_ap)
     return err_code
 
@@ -543,6 +814,12 @@ if __name__ == "__main__":
                       help="Analyser to run (can be repeated)")
     parser.add_option("--plugin", dest="plugin", action="append",
                       help="Plugin to run (can be repeated). For analyser 'sax' only")
+    parser.add_option("--sax-workers", dest="sax_workers", type=int, default=1,
+                      help="Number of processes running the plugins on shards of the extract. For analyser 'sax' on .pbf only")
+    parser.add_option("--osmosis-workers", dest="osmosis_workers", type=int, default=1,
+                      help="Number of database connections running the tiles of the tiled osmosis analysers queries")
+    parser.add_option("--jobs", dest="jobs", type=int, default=1,
+                      help="Number of analysers run concurrently. Results are uploaded in background when greater than 1")
 
     parser.add_option("--change", dest="change", action="store_true",
                       help="Run analyser on change mode when available")
@@ -554,6 +831,10 @@ if __name__ == "__main__":
     parser.add_option("--resume-analyser", dest="resume_analyser", action="append",
                       help="Subset of analysers to run in resume mode (can be repeated)")
 
+    parser.add_option("--prefetch-workers", dest="prefetch_workers", type=int, default=0,
+                      help="Number of parallel downloads of the merge analysers sources, before running them. Default 0, to download them when used")
+    parser.add_option("--cache-max-size", dest="cache_max_size", type=float,
+                      help="Maximum size of the download cache (in GB), least recently used files are removed above")
     parser.add_option("--skip-download", dest="skip_download", action="store_true",
                       help="Don't download extract")
     parser.add_option("--skip-init", dest="skip_init", action="store_true",
@@ -564,12 +845,21 @@ if __name__ == "__main__":
                       help="Don't run the analyse part")
     parser.add_option("--skip-upload", dest="skip_upload", action="store_true",
                       help="Don't upload the analyse result")
+    parser.add_option("--upload-chunk-size", dest="upload_chunk_size", type=int, default=0,
+                      help="Upload the results by chunks of this size (in MiB), resumable after a failure. The frontend must support it. Default 0, upload in one request")
+    parser.add_option("--no-upload-spool", dest="upload_spool", action="store_false", default=True,
+                      help="Don't keep the failed uploads to send them again on the next run")
     parser.add_option("--no-clean", dest="no_clean", action="store_true",
                       help="Don't remove extract and database after analyses")
 
     parser.add_option("--result-format", dest="result_format", action="store", default="osmose",
                       type="choice", choices=["osmose", "csv", "geojson"],
                       help="Analyser result format. Default 'osmose' XML. For debug purpose can be 'csv' or 'geojson'")
+    parser.add_option("--result-compression", dest="result_compression", action="store", default="bz2",
+                      type="choice", choices=list(IssuesFile.compressions.keys()),
+                      help="Analyser result compression, done by blocks on several threads. Default 'bz2'")
+    parser.add_option("--result-compression-level", dest="result_compression_level", type="int",
+                      help="Analyser result compression level, default depends on the compression")
 
     parser.add_option("--cron", dest="cron", action="store_true",
                       help="Record output in a specific log")
@@ -582,7 +872,10 @@ if __name__ == "__main__":
                       help="Use \"osmosis\" (default) or \"osmium\" to update the OSM extract")
 
     parser.add_option("--import-tool", dest="import_tool", action="store", default="osmosis",
-                      help="Use \"osmosis\" (default) or \"osmosis-parallel\" to import to postgresql database")
+                      help="Use \"osmosis\" (default), \"osmosis-parallel\" or \"pyosmium\" to import to postgresql database")
+
+    parser.add_option("--post-import-workers", dest="post_import_workers", type=int, default=1,
+                      help="Number of database sessions building the indexes after the import. Default 1. Each session uses the db_maintenance_work_mem and db_max_parallel_maintenance_workers of modules/config.py")
 
     parser.add_option("--version", dest="version", action="store_true",
                       help="Output version information and exit")
@@ -597,4 +890,10 @@ if __name__ == "__main__":
         parser.print_help()
         sys.exit(1)
 
+    if options.cache_max_size is not None:
+        modules.config.cache_max_size = int(options.cache_max_size * 1024 * 1024 * 1024)
+
+    if options.result_compression == "zstd" and not IssuesFile.zstandard:
+        parser.error("zstandard module is required for --result-compression zstd")
+
     sys.exit(main(options))
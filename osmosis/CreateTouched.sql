@@ -50,10 +50,10 @@ FROM
 ;
 
 INSERT INTO transitive_touched
+WITH RECURSIVE touched_relations_ids(id) AS (
 (
 -- Row touched relation, create or modify only
 SELECT
-    'R',
     id
 FROM
     actions
@@ -65,8 +65,6 @@ UNION
 (
 -- touched relations from nodes
 SELECT
-    DISTINCT ON (id)
-    'R',
     relation_members.relation_id AS id
 FROM
     relation_members
@@ -81,8 +79,6 @@ UNION
 (
 -- touched relations from touched ways
 SELECT
-    DISTINCT ON (id)
-    'R',
     relation_members.relation_id AS id
 FROM
     relation_members
@@ -92,12 +88,53 @@ FROM
 WHERE
     relation_members.member_type = 'W'
 )
--- no touched relations from relations...
+UNION
+-- touched relations from touched relations, up to the top of nested
+-- relations. UNION stops on cyclic relations.
+SELECT
+    relation_members.relation_id AS id
+FROM
+    relation_members
+    JOIN touched_relations_ids ON
+        relation_members.member_id = touched_relations_ids.id
+WHERE
+    relation_members.member_type = 'R'
+)
+SELECT
+    'R',
+    id
+FROM
+    touched_relations_ids
 ;
 
+ANALYZE transitive_touched;
+
+
+-- touched_* were views, materialise them as small indexed tables
+DO $$
+DECLARE
+    r record;
+BEGIN
+    FOR r IN
+        SELECT
+            relname,
+            relkind
+        FROM
+            pg_class
+        WHERE
+            relnamespace = current_schema()::regnamespace AND
+            relname IN ('touched_nodes', 'touched_ways', 'touched_relations')
+    LOOP
+        IF r.relkind = 'v' THEN
+            EXECUTE format('DROP VIEW %I CASCADE', r.relname);
+        ELSE
+            EXECUTE format('DROP TABLE %I CASCADE', r.relname);
+        END IF;
+    END LOOP;
+END
+$$;
 
-DROP VIEW IF EXISTS touched_nodes CASCADE;
-CREATE VIEW touched_nodes AS
+CREATE UNLOGGED TABLE touched_nodes AS
 SELECT
     nodes.*
 FROM
@@ -106,9 +143,10 @@ FROM
         transitive_touched.data_type = 'N' AND
         nodes.id = transitive_touched.id
 ;
+CREATE UNIQUE INDEX idx_touched_nodes_id ON touched_nodes(id);
+ANALYZE touched_nodes;
 
-DROP VIEW IF EXISTS touched_ways CASCADE;
-CREATE VIEW touched_ways AS
+CREATE UNLOGGED TABLE touched_ways AS
 SELECT
     ways.*
 FROM
@@ -117,9 +155,10 @@ FROM
         transitive_touched.data_type = 'W' AND
         ways.id = transitive_touched.id
 ;
+CREATE UNIQUE INDEX idx_touched_ways_id ON touched_ways(id);
+ANALYZE touched_ways;
 
-DROP VIEW IF EXISTS touched_relations CASCADE;
-CREATE VIEW touched_relations AS
+CREATE UNLOGGED TABLE touched_relations AS
 SELECT
     relations.*
 FROM
@@ -128,6 +167,8 @@ FROM
         transitive_touched.data_type = 'R' AND
         relations.id = transitive_touched.id
 ;
+CREATE UNIQUE INDEX idx_touched_relations_id ON touched_relations(id);
+ANALYZE touched_relations;
 
 
 DROP VIEW IF EXISTS not_touched_nodes CASCADE;
@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 class Administrative_INSEE_Name(Plugin):
 
+    interesting_keys = {'place', 'boundary'}
+
     only_for = ["FR", "NC"]
 
     def init(self, logger):
@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 class Administrative_TooManyWays(Plugin):
 
+    interesting_keys = {'boundary'}
+
     def init(self, logger):
         Plugin.init(self, logger)
         self.errors[504] = self.def_class(item = 6020, level = 3, tags = ['boundary', 'fix:chair'],
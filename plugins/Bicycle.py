@@ -33,13 +33,8 @@ class Bicycle(PluginMapCSS):
         self.re_67b51e41 = re.compile(r'opposite|opposite_lane')
 
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # way[cycleway][cycleway:right][cycleway:left]
+    # way[cycleway][cycleway:right][cycleway:left]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('cycleway' in keys and 'cycleway:left' in keys and 'cycleway:right' in keys):
             match = False
             if not match:
@@ -53,7 +48,8 @@ class Bicycle(PluginMapCSS):
                 # assertMatch:"way cycleway=a cycleway:right=b cycleway:left=c"
                 err.append({'class': 40301, 'subclass': 0, 'text': mapcss.tr('{0} with {1} and {2}', 'cycleway', 'cycleway:right', 'cycleway:left')})
 
-        # way[footway=sidewalk][highway!~/footway|construction|proposed/][highway]
+    # way[footway=sidewalk][highway!~/footway|construction|proposed/][highway]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('footway' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -71,7 +67,8 @@ class Bicycle(PluginMapCSS):
                 # assertNoMatch:"way footway=sidewalk highway=proposed proposed=footway"
                 err.append({'class': 20805, 'subclass': 0, 'text': mapcss.tr('{0} without {1}', 'footway=sidewalk', 'highway=footway|construction|proposed')})
 
-        # way[highway=service][service=psv][psv!=yes]
+    # way[highway=service][service=psv][psv!=yes]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'service' in keys):
             match = False
             if not match:
@@ -93,7 +90,8 @@ class Bicycle(PluginMapCSS):
                     'service'])
                 }})
 
-        # way[highway=cycleway][cycleway=track]
+    # way[highway=cycleway][cycleway=track]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('cycleway' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -110,9 +108,10 @@ class Bicycle(PluginMapCSS):
                     'cycleway'])
                 }})
 
-        # way[bicycle=~/no|use_sidepath/][cycleway][cycleway!~/no|none|separate/]
-        # way[bicycle=~/no|use_sidepath/][cycleway:left][cycleway:left!~/no|none|separate/]
-        # way[bicycle=~/no|use_sidepath/][cycleway:right][cycleway:right!~/no|none|separate/]
+    # way[bicycle=~/no|use_sidepath/][cycleway][cycleway!~/no|none|separate/]
+    # way[bicycle=~/no|use_sidepath/][cycleway:left][cycleway:left!~/no|none|separate/]
+    # way[bicycle=~/no|use_sidepath/][cycleway:right][cycleway:right!~/no|none|separate/]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('bicycle' in keys and 'cycleway' in keys) or ('bicycle' in keys and 'cycleway:left' in keys) or ('bicycle' in keys and 'cycleway:right' in keys):
             match = False
             if not match:
@@ -139,8 +138,9 @@ class Bicycle(PluginMapCSS):
                 # assertNoMatch:"way highway=residential bicycle=use_sidepath"
                 err.append({'class': 30329, 'subclass': 0, 'text': mapcss.tr('{0} with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[cycleway=~/opposite|opposite_lane/][!oneway]
-        # way[cycleway=~/opposite|opposite_lane/][oneway=no]
+    # way[cycleway=~/opposite|opposite_lane/][!oneway]
+    # way[cycleway=~/opposite|opposite_lane/][oneway=no]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('cycleway' in keys) or ('cycleway' in keys and 'oneway' in keys):
             match = False
             if not match:
@@ -160,10 +160,11 @@ class Bicycle(PluginMapCSS):
                 # assertMatch:"way cycleway=opposite"
                 err.append({'class': 20301, 'subclass': 0, 'text': mapcss.tr('Opposite cycleway without oneway')})
 
-        # way:righthandtraffic["cycleway:right"=~/opposite|opposite_lane/][oneway=yes]
-        # way:righthandtraffic["cycleway:left"=~/opposite|opposite_lane/][oneway="-1"]
-        # way!:righthandtraffic["cycleway:left"=~/opposite|opposite_lane/][oneway=yes]
-        # way!:righthandtraffic["cycleway:right"=~/opposite|opposite_lane/][oneway="-1"]
+    # way:righthandtraffic["cycleway:right"=~/opposite|opposite_lane/][oneway=yes]
+    # way:righthandtraffic["cycleway:left"=~/opposite|opposite_lane/][oneway="-1"]
+    # way!:righthandtraffic["cycleway:left"=~/opposite|opposite_lane/][oneway=yes]
+    # way!:righthandtraffic["cycleway:right"=~/opposite|opposite_lane/][oneway="-1"]
+    def _way_rule_6(self, data, tags, nds, keys, err, sets):
         if ('cycleway:left' in keys and 'oneway' in keys) or ('cycleway:right' in keys and 'oneway' in keys):
             match = False
             if not match:
@@ -190,9 +191,10 @@ class Bicycle(PluginMapCSS):
                 # assertNoMatch:"way cycleway=opposite oneway=yes"
                 err.append({'class': 20302, 'subclass': 0, 'text': mapcss.tr('Opposite or opposite lane in the same way of the oneway')})
 
-        # way[cycleway:lanes:forward][cycleway:lanes:forward!~/^((shared_lane|share_busway|no|none|lane|(\w|:)*(advisory|exclusive|pictogram)(\w|:)*)?(\||$))+$/]
-        # way[cycleway:lanes:backward][cycleway:lanes:backward!~/^((shared_lane|share_busway|no|none|lane|(\w|:)*(advisory|exclusive|pictogram)(\w|:)*)?(\||$))+$/]
-        # way[cycleway:lanes][cycleway:lanes!~/^((shared_lane|share_busway|no|none|lane|(\w|:)*(advisory|exclusive|pictogram)(\w|:)*)?(\||$))+$/]
+    # way[cycleway:lanes:forward][cycleway:lanes:forward!~/^((shared_lane|share_busway|no|none|lane|(\w|:)*(advisory|exclusive|pictogram)(\w|:)*)?(\||$))+$/]
+    # way[cycleway:lanes:backward][cycleway:lanes:backward!~/^((shared_lane|share_busway|no|none|lane|(\w|:)*(advisory|exclusive|pictogram)(\w|:)*)?(\||$))+$/]
+    # way[cycleway:lanes][cycleway:lanes!~/^((shared_lane|share_busway|no|none|lane|(\w|:)*(advisory|exclusive|pictogram)(\w|:)*)?(\||$))+$/]
+    def _way_rule_7(self, data, tags, nds, keys, err, sets):
         if ('cycleway:lanes' in keys) or ('cycleway:lanes:backward' in keys) or ('cycleway:lanes:forward' in keys):
             match = False
             if not match:
@@ -224,6 +226,23 @@ class Bicycle(PluginMapCSS):
                 # assertNoMatch:"way cycleway:lanes=|shared_lane"
                 err.append({'class': 316020, 'subclass': 0, 'text': mapcss.tr('Uncommon value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['cycleway']),
+        (_way_rule_1, ['footway']),
+        (_way_rule_2, ['highway']),
+        (_way_rule_3, ['cycleway']),
+        (_way_rule_4, ['bicycle']),
+        (_way_rule_5, ['cycleway']),
+        (_way_rule_6, ['cycleway:left', 'cycleway:right']),
+        (_way_rule_7, ['cycleway:lanes', 'cycleway:lanes:backward', 'cycleway:lanes:forward']),
+    ])
+
+    def way(self, data, tags, nds):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
         return err
 
 
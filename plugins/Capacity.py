@@ -25,6 +25,9 @@ from plugins.modules.units import parseNumberUnitString
 import re
 
 class Capacity(Plugin):
+
+    interesting_keys = {'capacity'}
+
     def init(self, logger):
         Plugin.init(self, logger)
 
@@ -21,16 +21,11 @@ class Construction2(PluginMapCSS):
 
 
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # way[highway][construction][highway!=construction][construction!=minor]
-        # way[highway][proposed][highway!=proposed]
-        # way[railway][construction][railway!=construction][railway!=abandoned][railway!=razed][railway!=dismantled][construction!=minor]
-        # way[railway][proposed][railway!=proposed][railway!=abandoned][railway!=razed][railway!=dismantled][railway!=disused]
+    # way[highway][construction][highway!=construction][construction!=minor]
+    # way[highway][proposed][highway!=proposed]
+    # way[railway][construction][railway!=construction][railway!=abandoned][railway!=razed][railway!=dismantled][construction!=minor]
+    # way[railway][proposed][railway!=proposed][railway!=abandoned][railway!=razed][railway!=dismantled][railway!=disused]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('construction' in keys and 'highway' in keys) or ('construction' in keys and 'railway' in keys) or ('highway' in keys and 'proposed' in keys) or ('proposed' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -57,6 +52,16 @@ class Construction2(PluginMapCSS):
                 # assertMatch:"way highway=primary construction=primary"
                 err.append({'class': 40701, 'subclass': 0, 'text': mapcss.tr('Inconsistent tagging of {0}', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['construction', 'highway', 'proposed']),
+    ])
+
+    def way(self, data, tags, nds):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
         return err
 
 
@@ -26,13 +26,8 @@ class Covid19(PluginMapCSS):
         self.re_64916a2b = re.compile(r'same|off|open|restricted')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # *[takeaway:covid19=yes][takeaway!=yes][inside("FR")]
+    # *[takeaway:covid19=yes][takeaway!=yes][inside("FR")]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('takeaway:covid19' in keys):
             match = False
             if not match:
@@ -51,7 +46,8 @@ class Covid19(PluginMapCSS):
                     'takeaway:covid19'])
                 }})
 
-        # *[delivery:covid19=yes][delivery!=yes][inside("FR")]
+    # *[delivery:covid19=yes][delivery!=yes][inside("FR")]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('delivery:covid19' in keys):
             match = False
             if not match:
@@ -70,7 +66,8 @@ class Covid19(PluginMapCSS):
                     'delivery:covid19'])
                 }})
 
-        # *[opening_hours:covid19][opening_hours:covid19=~/off|restricted/][inside("FR")]
+    # *[opening_hours:covid19][opening_hours:covid19=~/off|restricted/][inside("FR")]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('opening_hours:covid19' in keys):
             match = False
             if not match:
@@ -86,7 +83,8 @@ class Covid19(PluginMapCSS):
                     'opening_hours:covid19'])
                 }})
 
-        # *[opening_hours:covid19][opening_hours:covid19!~/same|off|open|restricted/][!opening_hours][inside("FR")]
+    # *[opening_hours:covid19][opening_hours:covid19!~/same|off|open|restricted/][!opening_hours][inside("FR")]
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('opening_hours:covid19' in keys):
             match = False
             if not match:
@@ -104,15 +102,23 @@ class Covid19(PluginMapCSS):
                     'opening_hours:covid19'])
                 }})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['takeaway:covid19']),
+        (_node_rule_1, ['delivery:covid19']),
+        (_node_rule_2, ['opening_hours:covid19']),
+        (_node_rule_3, ['opening_hours:covid19']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # *[takeaway:covid19=yes][takeaway!=yes][inside("FR")]
+    # *[takeaway:covid19=yes][takeaway!=yes][inside("FR")]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('takeaway:covid19' in keys):
             match = False
             if not match:
@@ -134,7 +140,8 @@ class Covid19(PluginMapCSS):
                     'takeaway:covid19'])
                 }})
 
-        # *[delivery:covid19=yes][delivery!=yes][inside("FR")]
+    # *[delivery:covid19=yes][delivery!=yes][inside("FR")]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('delivery:covid19' in keys):
             match = False
             if not match:
@@ -156,7 +163,8 @@ class Covid19(PluginMapCSS):
                     'delivery:covid19'])
                 }})
 
-        # *[opening_hours:covid19][opening_hours:covid19=~/off|restricted/][inside("FR")]
+    # *[opening_hours:covid19][opening_hours:covid19=~/off|restricted/][inside("FR")]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('opening_hours:covid19' in keys):
             match = False
             if not match:
@@ -175,7 +183,8 @@ class Covid19(PluginMapCSS):
                     'opening_hours:covid19'])
                 }})
 
-        # *[opening_hours:covid19][opening_hours:covid19!~/same|off|open|restricted/][!opening_hours][inside("FR")]
+    # *[opening_hours:covid19][opening_hours:covid19!~/same|off|open|restricted/][!opening_hours][inside("FR")]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('opening_hours:covid19' in keys):
             match = False
             if not match:
@@ -195,15 +204,23 @@ class Covid19(PluginMapCSS):
                     'opening_hours:covid19'])
                 }})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['takeaway:covid19']),
+        (_way_rule_1, ['delivery:covid19']),
+        (_way_rule_2, ['opening_hours:covid19']),
+        (_way_rule_3, ['opening_hours:covid19']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # *[takeaway:covid19=yes][takeaway!=yes][inside("FR")]
+    # *[takeaway:covid19=yes][takeaway!=yes][inside("FR")]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('takeaway:covid19' in keys):
             match = False
             if not match:
@@ -221,7 +238,8 @@ class Covid19(PluginMapCSS):
                     'takeaway:covid19'])
                 }})
 
-        # *[delivery:covid19=yes][delivery!=yes][inside("FR")]
+    # *[delivery:covid19=yes][delivery!=yes][inside("FR")]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('delivery:covid19' in keys):
             match = False
             if not match:
@@ -239,7 +257,8 @@ class Covid19(PluginMapCSS):
                     'delivery:covid19'])
                 }})
 
-        # *[opening_hours:covid19][opening_hours:covid19=~/off|restricted/][inside("FR")]
+    # *[opening_hours:covid19][opening_hours:covid19=~/off|restricted/][inside("FR")]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('opening_hours:covid19' in keys):
             match = False
             if not match:
@@ -255,7 +274,8 @@ class Covid19(PluginMapCSS):
                     'opening_hours:covid19'])
                 }})
 
-        # *[opening_hours:covid19][opening_hours:covid19!~/same|off|open|restricted/][!opening_hours][inside("FR")]
+    # *[opening_hours:covid19][opening_hours:covid19!~/same|off|open|restricted/][!opening_hours][inside("FR")]
+    def _relation_rule_3(self, data, tags, members, keys, err, sets):
         if ('opening_hours:covid19' in keys):
             match = False
             if not match:
@@ -273,6 +293,19 @@ class Covid19(PluginMapCSS):
                     'opening_hours:covid19'])
                 }})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['takeaway:covid19']),
+        (_relation_rule_1, ['delivery:covid19']),
+        (_relation_rule_2, ['opening_hours:covid19']),
+        (_relation_rule_3, ['opening_hours:covid19']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
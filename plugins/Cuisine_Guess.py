@@ -27,6 +27,8 @@ from .modules import Cuisine_Guess_lib
 
 class Cuisine_Guess(Plugin):
 
+    interesting_keys = {'name'}
+
     only_for = ["FR"]
 
     def init(self, logger):
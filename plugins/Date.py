@@ -40,6 +40,7 @@ class Date(Plugin):
             "opening_date", "check_date", "open_date", "construction:date", "temporary:date_on",  # Construction
             "mhs:inscription_date", # Heritage
         ]
+        self.interesting_keys = set(self.tag_date)
         self.default_date = datetime.datetime(9999, 12, 1)
         self.Aprox = re.compile(u"^(?:early|mid|late|before|after|spring|summer|autumn|winter) [^ ]+")
 
@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 class Ele_MontainPass_Peak(Plugin):
 
+    interesting_keys = {'mountain_pass', 'natural'}
+
     def init(self, logger):
         Plugin.init(self, logger)
         self.errors[804] = self.def_class(item = 2020, level = 3, tags = ['tag', 'fix:survey'],
@@ -26,6 +26,8 @@ from modules.Stablehash import stablehash64
 
 class Highway_Lanes(Plugin):
 
+    interesting_keys = {'highway'}
+
     def init(self, logger):
         Plugin.init(self, logger)
         self.errors[31601] = self.def_class(item = 3160, level = 2, tags = ['highway', 'fix:chair'],
@@ -25,6 +25,8 @@ from modules.Stablehash import stablehash64
 
 class Highway_Parking_Lane(Plugin):
 
+    interesting_keys = {'highway'}
+
     def init(self, logger):
         Plugin.init(self, logger)
 
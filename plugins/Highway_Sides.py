@@ -24,6 +24,9 @@ from plugins.Plugin import Plugin
 from modules.Stablehash import stablehash64
 
 class Highway_Sides(Plugin):
+
+    interesting_keys = {'highway'}
+
     def init(self, logger):
         Plugin.init(self, logger)
 
@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 class Historic_Wayside_cross_without_material(Plugin):
 
+    interesting_keys = {'historic'}
+
     only_for = ["DE", "AT", "CH"]
 
     def init(self, logger):
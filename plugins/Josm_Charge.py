@@ -39,14 +39,9 @@ class Josm_Charge(PluginMapCSS):
         self.re_703b3dbd = re.compile(r'^(yes|no)$')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-        set_hasSimpleChargeFix = False
-
-        # *[charge:conditional=~/\p{Sc}/]
-        # *[charge=~/\p{Sc}/]
+    # *[charge:conditional=~/\p{Sc}/]
+    # *[charge=~/\p{Sc}/]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
@@ -65,20 +60,21 @@ class Josm_Charge(PluginMapCSS):
                 # assertMatch:"node charge:conditional=\"0.22 $/liter @ (Mo-Fr)\""
                 # assertNoMatch:"node charge=\"0.223 USD/m³\""
                 # assertMatch:"node charge=€12"
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 1, 'text': mapcss.tr('Expected 3-character currency code in {0}, found {1} instead', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss.get(mapcss.regexp_match(self.re_37963245, mapcss.tag(tags, mapcss._tag_uncapture(capture_tags, '{0.key}'))), 1))})
 
-        # *[charge:conditional=~/^[A-Z]{3} ?[0-9]/]!.hasSimpleChargeFix
-        # *[charge=~/^[A-Z]{3} ?[0-9]/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^[A-Z]{3} ?[0-9]/]!.hasSimpleChargeFix
+    # *[charge=~/^[A-Z]{3} ?[0-9]/]!.hasSimpleChargeFix
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_2b54497a), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_2b54497a), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_2b54497a), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_2b54497a), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
@@ -86,20 +82,21 @@ class Josm_Charge(PluginMapCSS):
                 # -osmoseItemClassLevel:"3091/30916:2/3"
                 # throwWarning:tr("The value should be before the currency code {0} in {1}",substring(tag("{0.key}"),0,3),"{0.key}")
                 # assertNoMatch:"node charge=\"0.223 USD/m³\""
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 2, 'text': mapcss.tr('The value should be before the currency code {0} in {1}', mapcss.substring(mapcss.tag(tags, mapcss._tag_uncapture(capture_tags, '{0.key}')), 0, 3), mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/^[0-9]+(?:\.[0-9]+)?[A-Z]{3}/]!.hasSimpleChargeFix
-        # *[charge=~/^[0-9]+(?:\.[0-9]+)?[A-Z]{3}/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^[0-9]+(?:\.[0-9]+)?[A-Z]{3}/]!.hasSimpleChargeFix
+    # *[charge=~/^[0-9]+(?:\.[0-9]+)?[A-Z]{3}/]!.hasSimpleChargeFix
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_639ef0ac), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_639ef0ac), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_639ef0ac), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_639ef0ac), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
@@ -108,20 +105,21 @@ class Josm_Charge(PluginMapCSS):
                 # throwWarning:tr("The value and the currency symbol in {0} should be separated by a space","{0.key}")
                 # assertNoMatch:"node charge=\"0.223 USD/m³\""
                 # assertNoMatch:"node charge=\"12 EUR\""
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 3, 'text': mapcss.tr('The value and the currency symbol in {0} should be separated by a space', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/^[0-9]+(?:\.[0-9]+)?( ?@| ?\/)/]!.hasSimpleChargeFix
-        # *[charge=~/^[0-9]+(?:\.[0-9]+)?($| ?\/)/][charge!=0]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^[0-9]+(?:\.[0-9]+)?( ?@| ?\/)/]!.hasSimpleChargeFix
+    # *[charge=~/^[0-9]+(?:\.[0-9]+)?($| ?\/)/][charge!=0]!.hasSimpleChargeFix
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_144caed9), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_144caed9), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_5d52f832), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))) and (mapcss._tag_capture(capture_tags, 1, tags, 'charge') != mapcss._value_capture(capture_tags, 1, 0)))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_5d52f832), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))) and (mapcss._tag_capture(capture_tags, 1, tags, 'charge') != mapcss._value_capture(capture_tags, 1, 0)))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
@@ -130,11 +128,12 @@ class Josm_Charge(PluginMapCSS):
                 # throwWarning:tr("Currency not specified in {0}","{0.key}")
                 # assertNoMatch:"node charge=\"0.223 USD/m³\""
                 # assertNoMatch:"node charge=0"
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 4, 'text': mapcss.tr('Currency not specified in {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional][charge:conditional=~/^(yes|no) ?@/]
-        # *[charge][charge=~/^(yes|no)$/]
+    # *[charge:conditional][charge:conditional=~/^(yes|no) ?@/]
+    # *[charge][charge=~/^(yes|no)$/]
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
@@ -154,20 +153,21 @@ class Josm_Charge(PluginMapCSS):
                 # suggestAlternative:"fee={0.value}"
                 # suggestAlternative:"toll:conditional={0.value} @ ..."
                 # suggestAlternative:"toll={0.value}"
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 5, 'text': mapcss.tr('Key {0} should contain the amount charged', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/(^|\/ ?|; ?)[0-9]+,[0-9]/]!.hasSimpleChargeFix
-        # *[charge=~/(^|\/ ?|; ?)[0-9]+,[0-9]/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/(^|\/ ?|; ?)[0-9]+,[0-9]/]!.hasSimpleChargeFix
+    # *[charge=~/(^|\/ ?|; ?)[0-9]+,[0-9]/]!.hasSimpleChargeFix
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_6221e95a), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_6221e95a), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_6221e95a), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_6221e95a), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
@@ -175,20 +175,21 @@ class Josm_Charge(PluginMapCSS):
                 # -osmoseItemClassLevel:"3091/30916:6/3"
                 # throwWarning:tr("unusual value of {0}: use . instead of , as decimal separator","{0.key}")
                 # assertNoMatch:"node charge=\"0.223 USD/30.4 m³\""
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 6, 'text': mapcss.tr('unusual value of {0}: use . instead of , as decimal separator', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/^([0-9]+(?:\.[0-9]+)? ?[A-Za-z _-]+|[A-Za-z _-]+ ?[0-9]+(?:\.[0-9]+)?)/][charge:conditional!~/^[0-9]+(?:\.[0-9]+)? ?[A-Z]{3}/]!.hasSimpleChargeFix
-        # *[charge=~/^([0-9]+(?:\.[0-9]+)? ?[A-Za-z _-]+|[A-Za-z _-]+ ?[0-9]+(?:\.[0-9]+)?)/][charge!~/^[0-9]+(?:\.[0-9]+)? ?[A-Z]{3}/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^([0-9]+(?:\.[0-9]+)? ?[A-Za-z _-]+|[A-Za-z _-]+ ?[0-9]+(?:\.[0-9]+)?)/][charge:conditional!~/^[0-9]+(?:\.[0-9]+)? ?[A-Z]{3}/]!.hasSimpleChargeFix
+    # *[charge=~/^([0-9]+(?:\.[0-9]+)? ?[A-Za-z _-]+|[A-Za-z _-]+ ?[0-9]+(?:\.[0-9]+)?)/][charge!~/^[0-9]+(?:\.[0-9]+)? ?[A-Z]{3}/]!.hasSimpleChargeFix
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_467f0986), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2e5fc639, '^[0-9]+(?:\\.[0-9]+)? ?[A-Z]{3}'), mapcss._tag_capture(capture_tags, 1, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_467f0986), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2e5fc639, '^[0-9]+(?:\\.[0-9]+)? ?[A-Z]{3}'), mapcss._tag_capture(capture_tags, 1, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_467f0986), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2e5fc639, '^[0-9]+(?:\\.[0-9]+)? ?[A-Z]{3}'), mapcss._tag_capture(capture_tags, 1, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_467f0986), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2e5fc639, '^[0-9]+(?:\\.[0-9]+)? ?[A-Z]{3}'), mapcss._tag_capture(capture_tags, 1, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
@@ -198,20 +199,21 @@ class Josm_Charge(PluginMapCSS):
                 # assertNoMatch:"node charge:conditional=\"0.223 USD @ (Mo-Fr)\""
                 # assertNoMatch:"node charge=\"0.223 USD/m³\""
                 # assertNoMatch:"node charge=\"0.223USD\""
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 7, 'text': mapcss.tr('Invalid currency code in {0}, should be a 3-letter (uppercase) code after the value', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/^[^@]+\/ ?(?:[0-9]+(?:\.[0-9]+)? ?)?(min|s|h|d|w) ?@./]!.hasSimpleChargeFix
-        # *[charge=~/\/ ?(?:[0-9]+(?:\.[0-9]+)? ?)?(min|s|h|d|w)$/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^[^@]+\/ ?(?:[0-9]+(?:\.[0-9]+)? ?)?(min|s|h|d|w) ?@./]!.hasSimpleChargeFix
+    # *[charge=~/\/ ?(?:[0-9]+(?:\.[0-9]+)? ?)?(min|s|h|d|w)$/]!.hasSimpleChargeFix
+    def _node_rule_7(self, data, tags, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_641b0e32), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_641b0e32), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_08865a26), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_08865a26), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
@@ -220,20 +222,21 @@ class Josm_Charge(PluginMapCSS):
                 # throwWarning:tr("Abbreviated time unit in {0}","{0.key}")
                 # assertNoMatch:"node charge=\"0.22 USD/liter/hour\""
                 # assertNoMatch:"node charge=\"12.223 YEN/12.4 m³/30.1 minutes\""
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 8, 'text': mapcss.tr('Abbreviated time unit in {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/^[^@]+\/ ?[0-9]+(?:\.[0-9]+)?[a-zA-Z³]+( ?@| ?\/)./]!.hasSimpleChargeFix
-        # *[charge=~/\/ ?[0-9]+(?:\.[0-9]+)?[a-zA-Z³]+($| ?\/)/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^[^@]+\/ ?[0-9]+(?:\.[0-9]+)?[a-zA-Z³]+( ?@| ?\/)./]!.hasSimpleChargeFix
+    # *[charge=~/\/ ?[0-9]+(?:\.[0-9]+)?[a-zA-Z³]+($| ?\/)/]!.hasSimpleChargeFix
+    def _node_rule_8(self, data, tags, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_1fcedb6f), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_1fcedb6f), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_45863706), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_45863706), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
@@ -242,20 +245,21 @@ class Josm_Charge(PluginMapCSS):
                 # throwWarning:tr("No space between value and unit in {0}","{0.key}")
                 # assertNoMatch:"node charge=\"0.22 USD/liter/hour\""
                 # assertNoMatch:"node charge=\"12.223 YEN/12.4 m³/30.1 minutes\""
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 9, 'text': mapcss.tr('No space between value and unit in {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional][charge:conditional!~/^(?:[0-9]+(?:\.[0-9]+)? [A-Z]{3}(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-z]{3,})? ?@)./]!.hasSimpleChargeFix
-        # *[charge][charge!=0][charge!~/^(?:[0-9]+(?:\.[0-9]+)? [A-Z]{3}(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-z]{3,})?(?:; ?(?!$)|$))+$/]!.hasSimpleChargeFix
+    # *[charge:conditional][charge:conditional!~/^(?:[0-9]+(?:\.[0-9]+)? [A-Z]{3}(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-z]{3,})? ?@)./]!.hasSimpleChargeFix
+    # *[charge][charge!=0][charge!~/^(?:[0-9]+(?:\.[0-9]+)? [A-Z]{3}(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-z]{3,})?(?:; ?(?!$)|$))+$/]!.hasSimpleChargeFix
+    def _node_rule_9(self, data, tags, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_61f9f7ad, '^(?:[0-9]+(?:\\.[0-9]+)? [A-Z]{3}(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-z]{3,})? ?@).'), mapcss._tag_capture(capture_tags, 1, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_61f9f7ad, '^(?:[0-9]+(?:\\.[0-9]+)? [A-Z]{3}(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-z]{3,})? ?@).'), mapcss._tag_capture(capture_tags, 1, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss._tag_capture(capture_tags, 0, tags, 'charge')) and (mapcss._tag_capture(capture_tags, 1, tags, 'charge') != mapcss._value_capture(capture_tags, 1, 0)) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_31192e6e, '^(?:[0-9]+(?:\\.[0-9]+)? [A-Z]{3}(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-z]{3,})?(?:; ?(?!$)|$))+$'), mapcss._tag_capture(capture_tags, 2, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'charge')) and (mapcss._tag_capture(capture_tags, 1, tags, 'charge') != mapcss._value_capture(capture_tags, 1, 0)) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_31192e6e, '^(?:[0-9]+(?:\\.[0-9]+)? [A-Z]{3}(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-z]{3,})?(?:; ?(?!$)|$))+$'), mapcss._tag_capture(capture_tags, 2, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("Invalid value of charge")
@@ -273,16 +277,30 @@ class Josm_Charge(PluginMapCSS):
                 # assertNoMatch:"node charge=0"
                 err.append({'class': 30916, 'subclass': 999, 'text': mapcss.tr('The charge in {0} should be structured as <(decimal) number><space><(uppercase) three letter currency code>[/optional unit][/optional time unit]', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['charge', 'charge:conditional']),
+        (_node_rule_1, ['charge', 'charge:conditional']),
+        (_node_rule_2, ['charge', 'charge:conditional']),
+        (_node_rule_3, ['charge', 'charge:conditional']),
+        (_node_rule_4, ['charge', 'charge:conditional']),
+        (_node_rule_5, ['charge', 'charge:conditional']),
+        (_node_rule_6, ['charge', 'charge:conditional']),
+        (_node_rule_7, ['charge', 'charge:conditional']),
+        (_node_rule_8, ['charge', 'charge:conditional']),
+        (_node_rule_9, ['charge', 'charge:conditional']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
-        set_hasSimpleChargeFix = False
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-        # *[charge:conditional=~/\p{Sc}/]
-        # *[charge=~/\p{Sc}/]
+    # *[charge:conditional=~/\p{Sc}/]
+    # *[charge=~/\p{Sc}/]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
@@ -298,71 +316,75 @@ class Josm_Charge(PluginMapCSS):
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:1/3"
                 # throwWarning:tr("Expected 3-character currency code in {0}, found {1} instead","{0.key}",get(regexp_match("^.*(\\p{Sc}).*$",tag("{0.key}")),1))
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 1, 'text': mapcss.tr('Expected 3-character currency code in {0}, found {1} instead', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss.get(mapcss.regexp_match(self.re_37963245, mapcss.tag(tags, mapcss._tag_uncapture(capture_tags, '{0.key}'))), 1))})
 
-        # *[charge:conditional=~/^[A-Z]{3} ?[0-9]/]!.hasSimpleChargeFix
-        # *[charge=~/^[A-Z]{3} ?[0-9]/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^[A-Z]{3} ?[0-9]/]!.hasSimpleChargeFix
+    # *[charge=~/^[A-Z]{3} ?[0-9]/]!.hasSimpleChargeFix
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_2b54497a), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_2b54497a), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_2b54497a), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_2b54497a), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:2/3"
                 # throwWarning:tr("The value should be before the currency code {0} in {1}",substring(tag("{0.key}"),0,3),"{0.key}")
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 2, 'text': mapcss.tr('The value should be before the currency code {0} in {1}', mapcss.substring(mapcss.tag(tags, mapcss._tag_uncapture(capture_tags, '{0.key}')), 0, 3), mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/^[0-9]+(?:\.[0-9]+)?[A-Z]{3}/]!.hasSimpleChargeFix
-        # *[charge=~/^[0-9]+(?:\.[0-9]+)?[A-Z]{3}/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^[0-9]+(?:\.[0-9]+)?[A-Z]{3}/]!.hasSimpleChargeFix
+    # *[charge=~/^[0-9]+(?:\.[0-9]+)?[A-Z]{3}/]!.hasSimpleChargeFix
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_639ef0ac), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_639ef0ac), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_639ef0ac), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_639ef0ac), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:3/3"
                 # throwWarning:tr("The value and the currency symbol in {0} should be separated by a space","{0.key}")
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 3, 'text': mapcss.tr('The value and the currency symbol in {0} should be separated by a space', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/^[0-9]+(?:\.[0-9]+)?( ?@| ?\/)/]!.hasSimpleChargeFix
-        # *[charge=~/^[0-9]+(?:\.[0-9]+)?($| ?\/)/][charge!=0]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^[0-9]+(?:\.[0-9]+)?( ?@| ?\/)/]!.hasSimpleChargeFix
+    # *[charge=~/^[0-9]+(?:\.[0-9]+)?($| ?\/)/][charge!=0]!.hasSimpleChargeFix
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_144caed9), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_144caed9), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_5d52f832), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))) and (mapcss._tag_capture(capture_tags, 1, tags, 'charge') != mapcss._value_capture(capture_tags, 1, 0)))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_5d52f832), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))) and (mapcss._tag_capture(capture_tags, 1, tags, 'charge') != mapcss._value_capture(capture_tags, 1, 0)))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:4/3"
                 # throwWarning:tr("Currency not specified in {0}","{0.key}")
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 4, 'text': mapcss.tr('Currency not specified in {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional][charge:conditional=~/^(yes|no) ?@/]
-        # *[charge][charge=~/^(yes|no)$/]
+    # *[charge:conditional][charge:conditional=~/^(yes|no) ?@/]
+    # *[charge][charge=~/^(yes|no)$/]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
@@ -382,100 +404,105 @@ class Josm_Charge(PluginMapCSS):
                 # suggestAlternative:"fee={0.value}"
                 # suggestAlternative:"toll:conditional={0.value} @ ..."
                 # suggestAlternative:"toll={0.value}"
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 5, 'text': mapcss.tr('Key {0} should contain the amount charged', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/(^|\/ ?|; ?)[0-9]+,[0-9]/]!.hasSimpleChargeFix
-        # *[charge=~/(^|\/ ?|; ?)[0-9]+,[0-9]/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/(^|\/ ?|; ?)[0-9]+,[0-9]/]!.hasSimpleChargeFix
+    # *[charge=~/(^|\/ ?|; ?)[0-9]+,[0-9]/]!.hasSimpleChargeFix
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_6221e95a), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_6221e95a), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_6221e95a), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_6221e95a), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:6/3"
                 # throwWarning:tr("unusual value of {0}: use . instead of , as decimal separator","{0.key}")
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 6, 'text': mapcss.tr('unusual value of {0}: use . instead of , as decimal separator', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/^([0-9]+(?:\.[0-9]+)? ?[A-Za-z _-]+|[A-Za-z _-]+ ?[0-9]+(?:\.[0-9]+)?)/][charge:conditional!~/^[0-9]+(?:\.[0-9]+)? ?[A-Z]{3}/]!.hasSimpleChargeFix
-        # *[charge=~/^([0-9]+(?:\.[0-9]+)? ?[A-Za-z _-]+|[A-Za-z _-]+ ?[0-9]+(?:\.[0-9]+)?)/][charge!~/^[0-9]+(?:\.[0-9]+)? ?[A-Z]{3}/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^([0-9]+(?:\.[0-9]+)? ?[A-Za-z _-]+|[A-Za-z _-]+ ?[0-9]+(?:\.[0-9]+)?)/][charge:conditional!~/^[0-9]+(?:\.[0-9]+)? ?[A-Z]{3}/]!.hasSimpleChargeFix
+    # *[charge=~/^([0-9]+(?:\.[0-9]+)? ?[A-Za-z _-]+|[A-Za-z _-]+ ?[0-9]+(?:\.[0-9]+)?)/][charge!~/^[0-9]+(?:\.[0-9]+)? ?[A-Z]{3}/]!.hasSimpleChargeFix
+    def _way_rule_6(self, data, tags, nds, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_467f0986), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2e5fc639, '^[0-9]+(?:\\.[0-9]+)? ?[A-Z]{3}'), mapcss._tag_capture(capture_tags, 1, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_467f0986), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2e5fc639, '^[0-9]+(?:\\.[0-9]+)? ?[A-Z]{3}'), mapcss._tag_capture(capture_tags, 1, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_467f0986), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2e5fc639, '^[0-9]+(?:\\.[0-9]+)? ?[A-Z]{3}'), mapcss._tag_capture(capture_tags, 1, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_467f0986), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2e5fc639, '^[0-9]+(?:\\.[0-9]+)? ?[A-Z]{3}'), mapcss._tag_capture(capture_tags, 1, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:7/3"
                 # throwWarning:tr("Invalid currency code in {0}, should be a 3-letter (uppercase) code after the value","{0.key}")
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 7, 'text': mapcss.tr('Invalid currency code in {0}, should be a 3-letter (uppercase) code after the value', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/^[^@]+\/ ?(?:[0-9]+(?:\.[0-9]+)? ?)?(min|s|h|d|w) ?@./]!.hasSimpleChargeFix
-        # *[charge=~/\/ ?(?:[0-9]+(?:\.[0-9]+)? ?)?(min|s|h|d|w)$/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^[^@]+\/ ?(?:[0-9]+(?:\.[0-9]+)? ?)?(min|s|h|d|w) ?@./]!.hasSimpleChargeFix
+    # *[charge=~/\/ ?(?:[0-9]+(?:\.[0-9]+)? ?)?(min|s|h|d|w)$/]!.hasSimpleChargeFix
+    def _way_rule_7(self, data, tags, nds, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_641b0e32), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_641b0e32), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_08865a26), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_08865a26), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:8/3"
                 # throwWarning:tr("Abbreviated time unit in {0}","{0.key}")
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 8, 'text': mapcss.tr('Abbreviated time unit in {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/^[^@]+\/ ?[0-9]+(?:\.[0-9]+)?[a-zA-Z³]+( ?@| ?\/)./]!.hasSimpleChargeFix
-        # *[charge=~/\/ ?[0-9]+(?:\.[0-9]+)?[a-zA-Z³]+($| ?\/)/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^[^@]+\/ ?[0-9]+(?:\.[0-9]+)?[a-zA-Z³]+( ?@| ?\/)./]!.hasSimpleChargeFix
+    # *[charge=~/\/ ?[0-9]+(?:\.[0-9]+)?[a-zA-Z³]+($| ?\/)/]!.hasSimpleChargeFix
+    def _way_rule_8(self, data, tags, nds, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_1fcedb6f), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_1fcedb6f), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_45863706), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_45863706), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:9/3"
                 # throwWarning:tr("No space between value and unit in {0}","{0.key}")
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 9, 'text': mapcss.tr('No space between value and unit in {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional][charge:conditional!~/^(?:[0-9]+(?:\.[0-9]+)? [A-Z]{3}(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-z]{3,})? ?@)./]!.hasSimpleChargeFix
-        # *[charge][charge!=0][charge!~/^(?:[0-9]+(?:\.[0-9]+)? [A-Z]{3}(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-z]{3,})?(?:; ?(?!$)|$))+$/]!.hasSimpleChargeFix
+    # *[charge:conditional][charge:conditional!~/^(?:[0-9]+(?:\.[0-9]+)? [A-Z]{3}(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-z]{3,})? ?@)./]!.hasSimpleChargeFix
+    # *[charge][charge!=0][charge!~/^(?:[0-9]+(?:\.[0-9]+)? [A-Z]{3}(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-z]{3,})?(?:; ?(?!$)|$))+$/]!.hasSimpleChargeFix
+    def _way_rule_9(self, data, tags, nds, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_61f9f7ad, '^(?:[0-9]+(?:\\.[0-9]+)? [A-Z]{3}(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-z]{3,})? ?@).'), mapcss._tag_capture(capture_tags, 1, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_61f9f7ad, '^(?:[0-9]+(?:\\.[0-9]+)? [A-Z]{3}(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-z]{3,})? ?@).'), mapcss._tag_capture(capture_tags, 1, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss._tag_capture(capture_tags, 0, tags, 'charge')) and (mapcss._tag_capture(capture_tags, 1, tags, 'charge') != mapcss._value_capture(capture_tags, 1, 0)) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_31192e6e, '^(?:[0-9]+(?:\\.[0-9]+)? [A-Z]{3}(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-z]{3,})?(?:; ?(?!$)|$))+$'), mapcss._tag_capture(capture_tags, 2, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'charge')) and (mapcss._tag_capture(capture_tags, 1, tags, 'charge') != mapcss._value_capture(capture_tags, 1, 0)) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_31192e6e, '^(?:[0-9]+(?:\\.[0-9]+)? [A-Z]{3}(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-z]{3,})?(?:; ?(?!$)|$))+$'), mapcss._tag_capture(capture_tags, 2, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("Invalid value of charge")
@@ -483,16 +510,30 @@ class Josm_Charge(PluginMapCSS):
                 # throwWarning:tr("The charge in {0} should be structured as <(decimal) number><space><(uppercase) three letter currency code>[/optional unit][/optional time unit]","{0.key}")
                 err.append({'class': 30916, 'subclass': 999, 'text': mapcss.tr('The charge in {0} should be structured as <(decimal) number><space><(uppercase) three letter currency code>[/optional unit][/optional time unit]', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['charge', 'charge:conditional']),
+        (_way_rule_1, ['charge', 'charge:conditional']),
+        (_way_rule_2, ['charge', 'charge:conditional']),
+        (_way_rule_3, ['charge', 'charge:conditional']),
+        (_way_rule_4, ['charge', 'charge:conditional']),
+        (_way_rule_5, ['charge', 'charge:conditional']),
+        (_way_rule_6, ['charge', 'charge:conditional']),
+        (_way_rule_7, ['charge', 'charge:conditional']),
+        (_way_rule_8, ['charge', 'charge:conditional']),
+        (_way_rule_9, ['charge', 'charge:conditional']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
-        set_hasSimpleChargeFix = False
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-        # *[charge:conditional=~/\p{Sc}/]
-        # *[charge=~/\p{Sc}/]
+    # *[charge:conditional=~/\p{Sc}/]
+    # *[charge=~/\p{Sc}/]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
@@ -508,71 +549,75 @@ class Josm_Charge(PluginMapCSS):
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:1/3"
                 # throwWarning:tr("Expected 3-character currency code in {0}, found {1} instead","{0.key}",get(regexp_match("^.*(\\p{Sc}).*$",tag("{0.key}")),1))
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 1, 'text': mapcss.tr('Expected 3-character currency code in {0}, found {1} instead', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss.get(mapcss.regexp_match(self.re_37963245, mapcss.tag(tags, mapcss._tag_uncapture(capture_tags, '{0.key}'))), 1))})
 
-        # *[charge:conditional=~/^[A-Z]{3} ?[0-9]/]!.hasSimpleChargeFix
-        # *[charge=~/^[A-Z]{3} ?[0-9]/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^[A-Z]{3} ?[0-9]/]!.hasSimpleChargeFix
+    # *[charge=~/^[A-Z]{3} ?[0-9]/]!.hasSimpleChargeFix
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_2b54497a), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_2b54497a), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_2b54497a), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_2b54497a), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:2/3"
                 # throwWarning:tr("The value should be before the currency code {0} in {1}",substring(tag("{0.key}"),0,3),"{0.key}")
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 2, 'text': mapcss.tr('The value should be before the currency code {0} in {1}', mapcss.substring(mapcss.tag(tags, mapcss._tag_uncapture(capture_tags, '{0.key}')), 0, 3), mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/^[0-9]+(?:\.[0-9]+)?[A-Z]{3}/]!.hasSimpleChargeFix
-        # *[charge=~/^[0-9]+(?:\.[0-9]+)?[A-Z]{3}/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^[0-9]+(?:\.[0-9]+)?[A-Z]{3}/]!.hasSimpleChargeFix
+    # *[charge=~/^[0-9]+(?:\.[0-9]+)?[A-Z]{3}/]!.hasSimpleChargeFix
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_639ef0ac), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_639ef0ac), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_639ef0ac), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_639ef0ac), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:3/3"
                 # throwWarning:tr("The value and the currency symbol in {0} should be separated by a space","{0.key}")
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 3, 'text': mapcss.tr('The value and the currency symbol in {0} should be separated by a space', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/^[0-9]+(?:\.[0-9]+)?( ?@| ?\/)/]!.hasSimpleChargeFix
-        # *[charge=~/^[0-9]+(?:\.[0-9]+)?($| ?\/)/][charge!=0]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^[0-9]+(?:\.[0-9]+)?( ?@| ?\/)/]!.hasSimpleChargeFix
+    # *[charge=~/^[0-9]+(?:\.[0-9]+)?($| ?\/)/][charge!=0]!.hasSimpleChargeFix
+    def _relation_rule_3(self, data, tags, members, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_144caed9), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_144caed9), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_5d52f832), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))) and (mapcss._tag_capture(capture_tags, 1, tags, 'charge') != mapcss._value_capture(capture_tags, 1, 0)))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_5d52f832), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))) and (mapcss._tag_capture(capture_tags, 1, tags, 'charge') != mapcss._value_capture(capture_tags, 1, 0)))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:4/3"
                 # throwWarning:tr("Currency not specified in {0}","{0.key}")
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 4, 'text': mapcss.tr('Currency not specified in {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional][charge:conditional=~/^(yes|no) ?@/]
-        # *[charge][charge=~/^(yes|no)$/]
+    # *[charge:conditional][charge:conditional=~/^(yes|no) ?@/]
+    # *[charge][charge=~/^(yes|no)$/]
+    def _relation_rule_4(self, data, tags, members, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
@@ -592,100 +637,105 @@ class Josm_Charge(PluginMapCSS):
                 # suggestAlternative:"fee={0.value}"
                 # suggestAlternative:"toll:conditional={0.value} @ ..."
                 # suggestAlternative:"toll={0.value}"
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 5, 'text': mapcss.tr('Key {0} should contain the amount charged', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/(^|\/ ?|; ?)[0-9]+,[0-9]/]!.hasSimpleChargeFix
-        # *[charge=~/(^|\/ ?|; ?)[0-9]+,[0-9]/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/(^|\/ ?|; ?)[0-9]+,[0-9]/]!.hasSimpleChargeFix
+    # *[charge=~/(^|\/ ?|; ?)[0-9]+,[0-9]/]!.hasSimpleChargeFix
+    def _relation_rule_5(self, data, tags, members, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_6221e95a), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_6221e95a), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_6221e95a), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_6221e95a), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:6/3"
                 # throwWarning:tr("unusual value of {0}: use . instead of , as decimal separator","{0.key}")
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 6, 'text': mapcss.tr('unusual value of {0}: use . instead of , as decimal separator', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/^([0-9]+(?:\.[0-9]+)? ?[A-Za-z _-]+|[A-Za-z _-]+ ?[0-9]+(?:\.[0-9]+)?)/][charge:conditional!~/^[0-9]+(?:\.[0-9]+)? ?[A-Z]{3}/]!.hasSimpleChargeFix
-        # *[charge=~/^([0-9]+(?:\.[0-9]+)? ?[A-Za-z _-]+|[A-Za-z _-]+ ?[0-9]+(?:\.[0-9]+)?)/][charge!~/^[0-9]+(?:\.[0-9]+)? ?[A-Z]{3}/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^([0-9]+(?:\.[0-9]+)? ?[A-Za-z _-]+|[A-Za-z _-]+ ?[0-9]+(?:\.[0-9]+)?)/][charge:conditional!~/^[0-9]+(?:\.[0-9]+)? ?[A-Z]{3}/]!.hasSimpleChargeFix
+    # *[charge=~/^([0-9]+(?:\.[0-9]+)? ?[A-Za-z _-]+|[A-Za-z _-]+ ?[0-9]+(?:\.[0-9]+)?)/][charge!~/^[0-9]+(?:\.[0-9]+)? ?[A-Z]{3}/]!.hasSimpleChargeFix
+    def _relation_rule_6(self, data, tags, members, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_467f0986), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2e5fc639, '^[0-9]+(?:\\.[0-9]+)? ?[A-Z]{3}'), mapcss._tag_capture(capture_tags, 1, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_467f0986), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2e5fc639, '^[0-9]+(?:\\.[0-9]+)? ?[A-Z]{3}'), mapcss._tag_capture(capture_tags, 1, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_467f0986), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2e5fc639, '^[0-9]+(?:\\.[0-9]+)? ?[A-Z]{3}'), mapcss._tag_capture(capture_tags, 1, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_467f0986), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2e5fc639, '^[0-9]+(?:\\.[0-9]+)? ?[A-Z]{3}'), mapcss._tag_capture(capture_tags, 1, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:7/3"
                 # throwWarning:tr("Invalid currency code in {0}, should be a 3-letter (uppercase) code after the value","{0.key}")
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 7, 'text': mapcss.tr('Invalid currency code in {0}, should be a 3-letter (uppercase) code after the value', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/^[^@]+\/ ?(?:[0-9]+(?:\.[0-9]+)? ?)?(min|s|h|d|w) ?@./]!.hasSimpleChargeFix
-        # *[charge=~/\/ ?(?:[0-9]+(?:\.[0-9]+)? ?)?(min|s|h|d|w)$/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^[^@]+\/ ?(?:[0-9]+(?:\.[0-9]+)? ?)?(min|s|h|d|w) ?@./]!.hasSimpleChargeFix
+    # *[charge=~/\/ ?(?:[0-9]+(?:\.[0-9]+)? ?)?(min|s|h|d|w)$/]!.hasSimpleChargeFix
+    def _relation_rule_7(self, data, tags, members, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_641b0e32), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_641b0e32), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_08865a26), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_08865a26), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:8/3"
                 # throwWarning:tr("Abbreviated time unit in {0}","{0.key}")
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 8, 'text': mapcss.tr('Abbreviated time unit in {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional=~/^[^@]+\/ ?[0-9]+(?:\.[0-9]+)?[a-zA-Z³]+( ?@| ?\/)./]!.hasSimpleChargeFix
-        # *[charge=~/\/ ?[0-9]+(?:\.[0-9]+)?[a-zA-Z³]+($| ?\/)/]!.hasSimpleChargeFix
+    # *[charge:conditional=~/^[^@]+\/ ?[0-9]+(?:\.[0-9]+)?[a-zA-Z³]+( ?@| ?\/)./]!.hasSimpleChargeFix
+    # *[charge=~/\/ ?[0-9]+(?:\.[0-9]+)?[a-zA-Z³]+($| ?\/)/]!.hasSimpleChargeFix
+    def _relation_rule_8(self, data, tags, members, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_1fcedb6f), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_1fcedb6f), mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_45863706), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_45863706), mapcss._tag_capture(capture_tags, 0, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasSimpleChargeFix
                 # group:tr("Invalid value of charge")
                 # -osmoseItemClassLevel:"3091/30916:9/3"
                 # throwWarning:tr("No space between value and unit in {0}","{0.key}")
-                set_hasSimpleChargeFix = True
+                sets.add('hasSimpleChargeFix')
                 err.append({'class': 30916, 'subclass': 9, 'text': mapcss.tr('No space between value and unit in {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[charge:conditional][charge:conditional!~/^(?:[0-9]+(?:\.[0-9]+)? [A-Z]{3}(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-z]{3,})? ?@)./]!.hasSimpleChargeFix
-        # *[charge][charge!=0][charge!~/^(?:[0-9]+(?:\.[0-9]+)? [A-Z]{3}(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-z]{3,})?(?:; ?(?!$)|$))+$/]!.hasSimpleChargeFix
+    # *[charge:conditional][charge:conditional!~/^(?:[0-9]+(?:\.[0-9]+)? [A-Z]{3}(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-z]{3,})? ?@)./]!.hasSimpleChargeFix
+    # *[charge][charge!=0][charge!~/^(?:[0-9]+(?:\.[0-9]+)? [A-Z]{3}(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\/ ?(?:[0-9]+(?:\.[0-9]+)? )?[a-z]{3,})?(?:; ?(?!$)|$))+$/]!.hasSimpleChargeFix
+    def _relation_rule_9(self, data, tags, members, keys, err, sets):
         if ('charge' in keys) or ('charge:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_61f9f7ad, '^(?:[0-9]+(?:\\.[0-9]+)? [A-Z]{3}(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-z]{3,})? ?@).'), mapcss._tag_capture(capture_tags, 1, tags, 'charge:conditional'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'charge:conditional')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_61f9f7ad, '^(?:[0-9]+(?:\\.[0-9]+)? [A-Z]{3}(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-z]{3,})? ?@).'), mapcss._tag_capture(capture_tags, 1, tags, 'charge:conditional'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasSimpleChargeFix) and (mapcss._tag_capture(capture_tags, 0, tags, 'charge')) and (mapcss._tag_capture(capture_tags, 1, tags, 'charge') != mapcss._value_capture(capture_tags, 1, 0)) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_31192e6e, '^(?:[0-9]+(?:\\.[0-9]+)? [A-Z]{3}(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-z]{3,})?(?:; ?(?!$)|$))+$'), mapcss._tag_capture(capture_tags, 2, tags, 'charge'))))
+                try: match = (('hasSimpleChargeFix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'charge')) and (mapcss._tag_capture(capture_tags, 1, tags, 'charge') != mapcss._value_capture(capture_tags, 1, 0)) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_31192e6e, '^(?:[0-9]+(?:\\.[0-9]+)? [A-Z]{3}(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-zA-Z³]+)?(?: ?\\/ ?(?:[0-9]+(?:\\.[0-9]+)? )?[a-z]{3,})?(?:; ?(?!$)|$))+$'), mapcss._tag_capture(capture_tags, 2, tags, 'charge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("Invalid value of charge")
@@ -693,6 +743,25 @@ class Josm_Charge(PluginMapCSS):
                 # throwWarning:tr("The charge in {0} should be structured as <(decimal) number><space><(uppercase) three letter currency code>[/optional unit][/optional time unit]","{0.key}")
                 err.append({'class': 30916, 'subclass': 999, 'text': mapcss.tr('The charge in {0} should be structured as <(decimal) number><space><(uppercase) three letter currency code>[/optional unit][/optional time unit]', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['charge', 'charge:conditional']),
+        (_relation_rule_1, ['charge', 'charge:conditional']),
+        (_relation_rule_2, ['charge', 'charge:conditional']),
+        (_relation_rule_3, ['charge', 'charge:conditional']),
+        (_relation_rule_4, ['charge', 'charge:conditional']),
+        (_relation_rule_5, ['charge', 'charge:conditional']),
+        (_relation_rule_6, ['charge', 'charge:conditional']),
+        (_relation_rule_7, ['charge', 'charge:conditional']),
+        (_relation_rule_8, ['charge', 'charge:conditional']),
+        (_relation_rule_9, ['charge', 'charge:conditional']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
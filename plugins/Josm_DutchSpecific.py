@@ -163,14 +163,9 @@ class Josm_DutchSpecific(PluginMapCSS):
         self.re_7d72e705 = re.compile(r'^maxaxleload(:forward|:backward|:both_ways)?(:conditional)?$')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-        set_abbrname = set_addrOnBuilding = set_altLivingStreet = set_badPhoneNumber = set_completedSurfacePavingStonesNumber = set_hasAddMofaPositive = set_housenameWithFix = set_markedSteps = set_multipleGsigns = set_stepsWithBicycleRamp = False
-
-        # node[traffic_sign~="NL:L2"][crossing!=uncontrolled][crossing!=marked][crossing:markings!=zebra][highway=crossing][crossing!=traffic_signals][crossing_ref!=zebra]
-        # node[traffic_sign~="NL:L02"][crossing!=uncontrolled][crossing!=marked][crossing:markings!=zebra][highway=crossing][crossing!=traffic_signals][crossing_ref!=zebra]
+    # node[traffic_sign~="NL:L2"][crossing!=uncontrolled][crossing!=marked][crossing:markings!=zebra][highway=crossing][crossing!=traffic_signals][crossing_ref!=zebra]
+    # node[traffic_sign~="NL:L02"][crossing!=uncontrolled][crossing!=marked][crossing:markings!=zebra][highway=crossing][crossing!=traffic_signals][crossing_ref!=zebra]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
@@ -192,10 +187,11 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertMatch:"node traffic_sign=NL:L2 highway=crossing"
                 err.append({'class': 90205, 'subclass': 1052673302, 'text': mapcss.tr('{0} without {1}, {2} or {3}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag} + crossing_ref=zebra'), mapcss._tag_uncapture(capture_tags, '{2.tag} + crossing_ref=zebra'), mapcss._tag_uncapture(capture_tags, '{3.tag}'))})
 
-        # *[contact:phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
-        # *[contact:mobile=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
-        # *[contact:whatsapp=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
-        # *[phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[contact:phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[contact:mobile=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[contact:whatsapp=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('contact:mobile' in keys) or ('contact:phone' in keys) or ('contact:whatsapp' in keys) or ('phone' in keys):
             match = False
             if not match:
@@ -227,12 +223,13 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"node phone=\"0031612345678\""
                 # assertNoMatch:"node phone=\"06 12 34 56 78\""
                 # assertNoMatch:"node phone=\"0612345678\""
-                set_badPhoneNumber = True
+                sets.add('badPhoneNumber')
                 err.append({'class': 90201, 'subclass': 1739574763, 'text': mapcss.tr('Invalid tag {0}: country code should not be followed by a 0', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[contact:phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
-        # *[contact:mobile=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
-        # *[phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    # *[contact:phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    # *[contact:mobile=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    # *[phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('contact:mobile' in keys) or ('contact:phone' in keys) or ('phone' in keys):
             match = False
             if not match:
@@ -264,30 +261,31 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"node phone=\"08008844\""
                 # assertNoMatch:"node phone=\"14024\""
                 # assertNoMatch:"node phone=\"140245\""
-                set_badPhoneNumber = True
+                sets.add('badPhoneNumber')
                 err.append({'class': 90201, 'subclass': 345342642, 'text': mapcss.tr('Invalid tag {0}: short phone numbers cannot be used with international prefix (or: wrong phone number length)', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[contact:phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
-        # *[contact:mobile=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
-        # *[contact:whatsapp=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
-        # *[phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[contact:phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[contact:mobile=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[contact:whatsapp=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('contact:mobile' in keys) or ('contact:phone' in keys) or ('contact:whatsapp' in keys) or ('phone' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_badPhoneNumber) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:phone'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('badPhoneNumber' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:phone'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_badPhoneNumber) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:mobile'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('badPhoneNumber' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:mobile'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_badPhoneNumber) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:whatsapp'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('badPhoneNumber' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:whatsapp'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_badPhoneNumber) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'phone'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('badPhoneNumber' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'phone'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("NL addresses and contacts")
@@ -302,8 +300,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"node phone=\"0800 1234567\""
                 err.append({'class': 90201, 'subclass': 50270752, 'text': mapcss.tr('Invalid tag {0}: too many digits (or foreign number, if so: ignore)', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # node[/^addr:(city|postcode)$/][!/(^|.+:)addr:housenumber($|:.+)/][!/(^|.+:)addr:street($|:.+)/][inside("NL")]
-        # node[addr:street][!/(^|.+:)addr:housenumber($|:.+)/][!addr:interpolation][!addr:flats][inside("NL")]
+    # node[/^addr:(city|postcode)$/][!/(^|.+:)addr:housenumber($|:.+)/][!/(^|.+:)addr:street($|:.+)/][inside("NL")]
+    # node[addr:street][!/(^|.+:)addr:housenumber($|:.+)/][!addr:interpolation][!addr:flats][inside("NL")]
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -325,10 +324,11 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"node addr:street=XXX proposed:addr:housenumber=123 addr:postcode=1234AB addr:city=XXX"
                 err.append({'class': 90201, 'subclass': 509151640, 'text': mapcss.tr('Incomplete address: {0} {1} {2} {3}', mapcss.any_(mapcss.tag(tags, 'addr:street'), '[street?]'), mapcss.any_(mapcss.tag(tags, 'addr:housenumber'), '[housenumber?]'), mapcss.any_(mapcss.tag(tags, 'addr:postcode'), ''), mapcss.any_(mapcss.tag(tags, 'addr:city'), ''))})
 
-        # node["addr:postcode"]["addr:postcode"!~/[0-9]{4} ?[A-Z]{2}/][inside("NL")]
-        # Rule Blacklisted (id: 1560886491)
+    # node["addr:postcode"]["addr:postcode"!~/[0-9]{4} ?[A-Z]{2}/][inside("NL")]
+    # Rule Blacklisted (id: 1560886491)
 
-        # *[addr:interpolation][inside("NL")]
+    # *[addr:interpolation][inside("NL")]
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('addr:interpolation' in keys):
             match = False
             if not match:
@@ -341,12 +341,13 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"meerdere addr:housenumber via een BAG importverzoek"
                 err.append({'class': 90202, 'subclass': 864819394, 'text': mapcss.tr('Adressen ({0}) worden in Nederland individueel geïmporteerd uit de BAG', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[is_in=NL]
-        # *[is_in:country][inside("NL")]
-        # *[is_in:city][inside("NL")]
-        # *[is_in:province][inside("NL")]
-        # *[is_in:continent][inside("NL")]
-        # *[is_in:country_code=NL]
+    # *[is_in=NL]
+    # *[is_in:country][inside("NL")]
+    # *[is_in:city][inside("NL")]
+    # *[is_in:province][inside("NL")]
+    # *[is_in:continent][inside("NL")]
+    # *[is_in:country_code=NL]
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if ('is_in' in keys) or ('is_in:city' in keys) or ('is_in:continent' in keys) or ('is_in:country' in keys) or ('is_in:country_code' in keys) or ('is_in:province' in keys):
             match = False
             if not match:
@@ -382,7 +383,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # node[/payment:O[vV][-_]?[cC]hipkaart/]
+    # node[/payment:O[vV][-_]?[cC]hipkaart/]
+    def _node_rule_7(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -401,7 +403,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=>payment:ov-chipkaart')).split('=>', 1)[0].strip()])
                 }})
 
-        # *[/.:covid19$/][inside("NL")]
+    # *[/.:covid19$/][inside("NL")]
+    def _node_rule_8(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -417,7 +420,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[material][material=~/\bhout|\bmetaal\b|^beton$|^brons$|steen\b|ijzer\b|staal\b/]
+    # *[material][material=~/\bhout|\bmetaal\b|^beton$|^brons$|steen\b|ijzer\b|staal\b/]
+    def _node_rule_9(self, data, tags, keys, err, sets):
         if ('material' in keys):
             match = False
             if not match:
@@ -431,7 +435,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertMatch:"node tourism=artwork material=hout,metaal"
                 err.append({'class': 90202, 'subclass': 1686750599, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[surface][surface=~/^paving_stones:([1-9])0$/][inside("NL")]
+    # *[surface][surface=~/^paving_stones:([1-9])0$/][inside("NL")]
+    def _node_rule_10(self, data, tags, keys, err, sets):
         if ('surface' in keys):
             match = False
             if not match:
@@ -452,7 +457,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     ['surface','paving_stones']])
                 }})
 
-        # *[/^(.+):surface$/][/^(.+):surface$/=~/^paving_stones:([1-9])0$/][count(tag_regex("^(.+):surface$"))==1][inside("NL")]
+    # *[/^(.+):surface$/][/^(.+):surface$/=~/^paving_stones:([1-9])0$/][count(tag_regex("^(.+):surface$"))==1][inside("NL")]
+    def _node_rule_11(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -467,7 +473,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # fixAdd:concat(get(regexp_match("^(.+):surface$","{0.key}"),1),":paving_stones:length=0.",get(regexp_match("^paving_stones:([1-9])0$",get(tag_regex("^(.+):surface$"),0)),1))
                 # fixAdd:concat(get(regexp_match("^(.+):surface$","{0.key}"),1),":paving_stones:shape=square")
                 # fixAdd:"{0.key}=paving_stones"
-                set_completedSurfacePavingStonesNumber = True
+                sets.add('completedSurfacePavingStonesNumber')
                 err.append({'class': 90202, 'subclass': 1911834456, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat(mapcss.get(mapcss.regexp_match(self.re_74d9b833, mapcss._tag_uncapture(capture_tags, '{0.key}')), 1), ':paving_stones:length=0.', mapcss.get(mapcss.regexp_match(self.re_19b1af6a, mapcss.get(mapcss.tag_regex(tags, self.re_74d9b833), 0)), 1))).split('=', 1),
@@ -475,12 +481,13 @@ class Josm_DutchSpecific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=paving_stones')).split('=', 1)])
                 }})
 
-        # *[/^(.+):surface$/=~/^paving_stones:([1-9])0$/][inside("NL")]!.completedSurfacePavingStonesNumber
+    # *[/^(.+):surface$/=~/^paving_stones:([1-9])0$/][inside("NL")]!.completedSurfacePavingStonesNumber
+    def _node_rule_12(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_completedSurfacePavingStonesNumber) and (mapcss.regexp_test(self.re_19b1af6a, mapcss._match_regex(tags, self.re_74d9b833))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('completedSurfacePavingStonesNumber' not in sets) and (mapcss.regexp_test(self.re_19b1af6a, mapcss._match_regex(tags, self.re_74d9b833))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("NL deprecated features")
@@ -488,7 +495,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"*:surface=paving_stones + *:paving_stones:shape=square + *:paving_stones:length=[length in meter, e.g. 0.3]"
                 err.append({'class': 90202, 'subclass': 1665978272, 'text': mapcss.tr('{0} is deprecated', '*:surface=paving_stones:NN')})
 
-        # *[winkelnummer]
+    # *[winkelnummer]
+    def _node_rule_13(self, data, tags, keys, err, sets):
         if ('winkelnummer' in keys):
             match = False
             if not match:
@@ -501,7 +509,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"ref=*"
                 err.append({'class': 90202, 'subclass': 340349535, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # node[opening_hours="24/7"][amenity=atm][/^(brand|name|operator)$/=~/(?i)^(Geldmaat|ABN.?AMRO|ING|Rabobank|SNS)\b/][inside("NL")]
+    # node[opening_hours="24/7"][amenity=atm][/^(brand|name|operator)$/=~/(?i)^(Geldmaat|ABN.?AMRO|ING|Rabobank|SNS)\b/][inside("NL")]
+    def _node_rule_14(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'opening_hours' in keys):
             match = False
             if not match:
@@ -513,8 +522,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("{0} op {1} is onwaarschijnlijk, Geldmaten zijn niet de hele nacht geopend","{0.tag}","{1.tag}")
                 err.append({'class': 90209, 'subclass': 1466427444, 'text': mapcss.tr('{0} op {1} is onwaarschijnlijk, Geldmaten zijn niet de hele nacht geopend', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # node[vehicle=designated][!amenity][!vehicle:conditional][inside("NL")]
-        # node[motor_vehicle=designated][!amenity][!motor_vehicle:conditional][inside("NL")]
+    # node[vehicle=designated][!amenity][!vehicle:conditional][inside("NL")]
+    # node[motor_vehicle=designated][!amenity][!motor_vehicle:conditional][inside("NL")]
+    def _node_rule_15(self, data, tags, keys, err, sets):
         if ('motor_vehicle' in keys) or ('vehicle' in keys):
             match = False
             if not match:
@@ -534,8 +544,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"node motor_vehicle=designated amenity=parking_entrance"
                 err.append({'class': 90209, 'subclass': 1720314934, 'text': mapcss.tr('{0} on a node, such a traffic sign does not exist. Possibly a typo for destination?', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[natural=tree][circumference][siunit_length(tag("circumference"))>10.32][siunit_length(tag("circumference"))<=45][inside("NL")]
-        # node[natural=tree][height][siunit_length(tag("height"))>61.32][inside("NL")]
+    # node[natural=tree][circumference][siunit_length(tag("circumference"))>10.32][siunit_length(tag("circumference"))<=45][inside("NL")]
+    # node[natural=tree][height][siunit_length(tag("height"))>61.32][inside("NL")]
+    def _node_rule_16(self, data, tags, keys, err, sets):
         if ('circumference' in keys and 'natural' in keys) or ('height' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -554,7 +565,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"node natural=tree height=51"
                 err.append({'class': 90209, 'subclass': 68044720, 'text': mapcss.tr('Unusually large value of {0} ({1} m), did you mean `{1} cm` or `{1} mm`?', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss.siunit_length(mapcss._tag_uncapture(capture_tags, '{1.value}')))})
 
-        # *[ref:bag][ref:bag!~/(; ?|^)([0-9]{0,3}[1-9]|[0-9]{0,2}[1-9][0-9]|[0-9]?[1-9][0-9]{2})[0-9]{12}($|;)/][inside("NL")]
+    # *[ref:bag][ref:bag!~/(; ?|^)([0-9]{0,3}[1-9]|[0-9]{0,2}[1-9][0-9]|[0-9]?[1-9][0-9]{2})[0-9]{12}($|;)/][inside("NL")]
+    def _node_rule_17(self, data, tags, keys, err, sets):
         if ('ref:bag' in keys):
             match = False
             if not match:
@@ -566,7 +578,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("Invalid value of {0}","{0.key}")
                 err.append({'class': 90209, 'subclass': 2021092431, 'text': mapcss.tr('Invalid value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[leisure][surface=gravel][sport~="tennis"][inside("NL")]
+    # *[leisure][surface=gravel][sport~="tennis"][inside("NL")]
+    def _node_rule_18(self, data, tags, keys, err, sets):
         if ('leisure' in keys and 'sport' in keys and 'surface' in keys):
             match = False
             if not match:
@@ -579,17 +592,18 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"surface=clay"
                 err.append({'class': 90209, 'subclass': 1521090750, 'text': mapcss.tr('unusual value of {0} for {1} (`gravel` in English means `grind` in Dutch)', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # node[name][highway][name=~/(?i)^(lift)$/]
-        # node[name][amenity=drinking_water][name=~/(?i)(drinkwater|\swater|kraan)/]
-        # node[name][amenity=charging_station][name=~/(?i)(oplaad|laadpunt|laadpaal)/]
-        # *[name][name="ijsbaan"]
-        # *[name][name=~/\b(([Aa]f)?gesloten|[Gg]eopend)\b/]
-        # *[name][amenity^=parking][name=~/(?i)(parkeren|parkeerplaats|parkeergarage|^garage)$/]
-        # *[name][name=~/(?i)^gratis\s|gratis\)/]
-        # *[name][name=~/(?i)(klanten|bezoek(ers)?|medewerkers)\b/][!route]
-        # *[name][leisure=playground][name=~/(?i)^speeltuin(tje)?$/]
-        # *[name][leisure^=dog][name=~/(?i)^(honden\s?)?(toilet|uitlaa[dt]|los.?loop)/]
-        # *[name][leisure=pitch][name=~/(?i)ball?(veld(je)?)?$/][!sport]
+    # node[name][highway][name=~/(?i)^(lift)$/]
+    # node[name][amenity=drinking_water][name=~/(?i)(drinkwater|\swater|kraan)/]
+    # node[name][amenity=charging_station][name=~/(?i)(oplaad|laadpunt|laadpaal)/]
+    # *[name][name="ijsbaan"]
+    # *[name][name=~/\b(([Aa]f)?gesloten|[Gg]eopend)\b/]
+    # *[name][amenity^=parking][name=~/(?i)(parkeren|parkeerplaats|parkeergarage|^garage)$/]
+    # *[name][name=~/(?i)^gratis\s|gratis\)/]
+    # *[name][name=~/(?i)(klanten|bezoek(ers)?|medewerkers)\b/][!route]
+    # *[name][leisure=playground][name=~/(?i)^speeltuin(tje)?$/]
+    # *[name][leisure^=dog][name=~/(?i)^(honden\s?)?(toilet|uitlaa[dt]|los.?loop)/]
+    # *[name][leisure=pitch][name=~/(?i)ball?(veld(je)?)?$/][!sport]
+    def _node_rule_19(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'name' in keys) or ('highway' in keys and 'name' in keys) or ('leisure' in keys and 'name' in keys) or ('name' in keys):
             match = False
             if not match:
@@ -645,7 +659,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertMatch:"node leisure=playground name=\"Abc (gesloten)\""
                 err.append({'class': 90203, 'subclass': 1470133234, 'text': mapcss.tr('descriptive name')})
 
-        # *[name][name=~/(?i)(voormalige?)/][!historic][tourism!=information][!landuse][!highway][!boundary][!waterway]
+    # *[name][name=~/(?i)(voormalige?)/][!historic][tourism!=information][!landuse][!highway][!boundary][!waterway]
+    def _node_rule_20(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -660,36 +675,38 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"old_name=*"
                 err.append({'class': 90203, 'subclass': 538711457, 'text': mapcss.tr('descriptive name')})
 
-        # *[name][place][name=~/\b(Adm|Br|Burg|Cmdt|Dr|Drs|Ds|Fam|Gebr|Gen|Ing|Ir|Jhr|Kard|Kon|Luit|Mej|Mevr|Mgr|Min|Mr|Past|Pr|Pres|Prof|St|Vr|Weth|Zr)\.? [A-Za-z]/][inside("NL")]!.abbrname
-        # *[name][place][name=~/^[A-Z][a-z]{1,4}\. /][name!~/^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\./][inside("NL")]!.abbrname
+    # *[name][place][name=~/\b(Adm|Br|Burg|Cmdt|Dr|Drs|Ds|Fam|Gebr|Gen|Ing|Ir|Jhr|Kard|Kon|Luit|Mej|Mevr|Mgr|Min|Mr|Past|Pr|Pres|Prof|St|Vr|Weth|Zr)\.? [A-Za-z]/][inside("NL")]!.abbrname
+    # *[name][place][name=~/^[A-Z][a-z]{1,4}\. /][name!~/^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\./][inside("NL")]!.abbrname
+    def _node_rule_21(self, data, tags, keys, err, sets):
         if ('name' in keys and 'place' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_abbrname) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'place')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_1a749120), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('abbrname' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'place')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_1a749120), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_abbrname) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'place')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_293c2706), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 3, self.re_2f938f56, '^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\\.'), mapcss._tag_capture(capture_tags, 3, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('abbrname' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'place')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_293c2706), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 3, self.re_2f938f56, '^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\\.'), mapcss._tag_capture(capture_tags, 3, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .abbrname
                 # group:tr("NL nomenclature")
                 # throwWarning:tr("Gebiedsnaam met afkorting")
-                set_abbrname = True
+                sets.add('abbrname')
                 err.append({'class': 90203, 'subclass': 1079482384, 'text': mapcss.tr('Gebiedsnaam met afkorting')})
 
-        # *[railway][name][name=~/(?i)(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\./][inside("NL")]!.abbrname
-        # *[railway][name][name=~/(?i)\b(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\b/][inside("NL")]!.abbrname
+    # *[railway][name][name=~/(?i)(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\./][inside("NL")]!.abbrname
+    # *[railway][name][name=~/(?i)\b(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\b/][inside("NL")]!.abbrname
+    def _node_rule_22(self, data, tags, keys, err, sets):
         if ('name' in keys and 'railway' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_abbrname) and (mapcss._tag_capture(capture_tags, 0, tags, 'railway')) and (mapcss._tag_capture(capture_tags, 1, tags, 'name')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_798edef1), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('abbrname' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'railway')) and (mapcss._tag_capture(capture_tags, 1, tags, 'name')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_798edef1), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_abbrname) and (mapcss._tag_capture(capture_tags, 0, tags, 'railway')) and (mapcss._tag_capture(capture_tags, 1, tags, 'name')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_2441139b), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('abbrname' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'railway')) and (mapcss._tag_capture(capture_tags, 1, tags, 'name')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_2441139b), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .abbrname
@@ -697,11 +714,12 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("Spoorgebied met afgekorte naam")
                 # suggestAlternative:"aansluiting, emplacement, goederen, industrieterrein, inhaalspoor, opstelterrein, overloopwissel, raccordement of rangeerterrein"
                 # assertNoMatch:"node railway=tram_stop name=Landgoed"
-                set_abbrname = True
+                sets.add('abbrname')
                 err.append({'class': 90203, 'subclass': 1558593366, 'text': mapcss.tr('Spoorgebied met afgekorte naam')})
 
-        # *[name:nl][!name][inside("NL")][type!=route][name:fy]["name:fy"=*"name:nl"]
-        # *[name:nl][!name][inside("NL")][type!=route][!name:fy]
+    # *[name:nl][!name][inside("NL")][type!=route][name:fy]["name:fy"=*"name:nl"]
+    # *[name:nl][!name][inside("NL")][type!=route][!name:fy]
+    def _node_rule_23(self, data, tags, keys, err, sets):
         if ('name:fy' in keys and 'name:nl' in keys) or ('name:nl' in keys):
             match = False
             if not match:
@@ -726,7 +744,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=>{1.key}')).split('=>', 1)[0].strip()])
                 }})
 
-        # node[operator][operator!=PostNL][operator=~/(?i)post\W?nl$/][amenity=post_box]
+    # node[operator][operator!=PostNL][operator=~/(?i)post\W?nl$/][amenity=post_box]
+    def _node_rule_24(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'operator' in keys):
             match = False
             if not match:
@@ -746,7 +765,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     ['operator','PostNL']])
                 }})
 
-        # *[heritage=2][heritage:operator!=rce][heritage:operator!~/(^|; ?)rce(;|$)/][inside("NL")]
+    # *[heritage=2][heritage:operator!=rce][heritage:operator!~/(^|; ?)rce(;|$)/][inside("NL")]
+    def _node_rule_25(self, data, tags, keys, err, sets):
         if ('heritage' in keys):
             match = False
             if not match:
@@ -763,7 +783,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     ['heritage:operator','rce']])
                 }})
 
-        # *[heritage:operator=rce][!heritage][inside("NL")]
+    # *[heritage:operator=rce][!heritage][inside("NL")]
+    def _node_rule_26(self, data, tags, keys, err, sets):
         if ('heritage:operator' in keys):
             match = False
             if not match:
@@ -779,21 +800,52 @@ class Josm_DutchSpecific(PluginMapCSS):
                     ['heritage','2']])
                 }})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['highway']),
+        (_node_rule_1, ['contact:mobile', 'contact:phone', 'contact:whatsapp', 'phone']),
+        (_node_rule_2, ['contact:mobile', 'contact:phone', 'phone']),
+        (_node_rule_3, ['contact:mobile', 'contact:phone', 'contact:whatsapp', 'phone']),
+        (_node_rule_4, None),
+        (_node_rule_5, ['addr:interpolation']),
+        (_node_rule_6, ['is_in', 'is_in:city', 'is_in:continent', 'is_in:country', 'is_in:country_code', 'is_in:province']),
+        (_node_rule_7, None),
+        (_node_rule_8, None),
+        (_node_rule_9, ['material']),
+        (_node_rule_10, ['surface']),
+        (_node_rule_11, None),
+        (_node_rule_12, None),
+        (_node_rule_13, ['winkelnummer']),
+        (_node_rule_14, ['amenity']),
+        (_node_rule_15, ['motor_vehicle', 'vehicle']),
+        (_node_rule_16, ['circumference', 'height']),
+        (_node_rule_17, ['ref:bag']),
+        (_node_rule_18, ['leisure']),
+        (_node_rule_19, ['amenity', 'highway', 'leisure', 'name']),
+        (_node_rule_20, ['name']),
+        (_node_rule_21, ['name']),
+        (_node_rule_22, ['name']),
+        (_node_rule_23, ['name:fy', 'name:nl']),
+        (_node_rule_24, ['amenity']),
+        (_node_rule_25, ['heritage']),
+        (_node_rule_26, ['heritage:operator']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
-        set_abbrname = set_addrOnBuilding = set_altLivingStreet = set_badPhoneNumber = set_completedSurfacePavingStonesNumber = set_hasAddMofaPositive = set_housenameWithFix = set_markedSteps = set_multipleGsigns = set_stepsWithBicycleRamp = False
-
-        # way[highway=cycleway][traffic_sign~="NL:G11"][moped][moped=~/^(yes|designated)$/]
-        # way[highway=cycleway][traffic_sign~="NL:G12a"][moped][moped=~/^(no|use_sidepath)$/]
-        # way[highway=cycleway][traffic_sign~="NL:G12a"][mofa][mofa=~/^(no|use_sidepath)$/]
-        # way[highway=cycleway][traffic_sign~="NL:G13"][moped][moped=~/^(yes|designated)$/]
-        # way[highway=cycleway][traffic_sign~="NL:G13"][mofa][mofa=~/^(yes|designated)$/]
-        # way[highway][traffic_sign~="NL:D103"][moped][moped=~/^(no|use_sidepath)$/][highway!=construction]
-        # way[highway][traffic_sign~="NL:D104"][moped][moped=~/^(no|use_sidepath)$/][highway!=construction]
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
+
+    # way[highway=cycleway][traffic_sign~="NL:G11"][moped][moped=~/^(yes|designated)$/]
+    # way[highway=cycleway][traffic_sign~="NL:G12a"][moped][moped=~/^(no|use_sidepath)$/]
+    # way[highway=cycleway][traffic_sign~="NL:G12a"][mofa][mofa=~/^(no|use_sidepath)$/]
+    # way[highway=cycleway][traffic_sign~="NL:G13"][moped][moped=~/^(yes|designated)$/]
+    # way[highway=cycleway][traffic_sign~="NL:G13"][mofa][mofa=~/^(yes|designated)$/]
+    # way[highway][traffic_sign~="NL:D103"][moped][moped=~/^(no|use_sidepath)$/][highway!=construction]
+    # way[highway][traffic_sign~="NL:D104"][moped][moped=~/^(no|use_sidepath)$/][highway!=construction]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'mofa' in keys and 'traffic_sign' in keys) or ('highway' in keys and 'moped' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
@@ -829,9 +881,10 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{1.tag}","{2.tag}")
                 err.append({'class': 90205, 'subclass': 1876831340, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # way[highway][traffic_sign~="NL:D103"][!moped]
-        # way[highway][traffic_sign~="NL:D104"][!moped]
-        # way[highway=cycleway][traffic_sign~="NL:G12a"][!moped]
+    # way[highway][traffic_sign~="NL:D103"][!moped]
+    # way[highway][traffic_sign~="NL:D104"][!moped]
+    # way[highway=cycleway][traffic_sign~="NL:G12a"][!moped]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
@@ -851,7 +904,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{1.tag}","moped=designated")
                 err.append({'class': 90205, 'subclass': 2100176109, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'moped=designated')})
 
-        # way[highway=cycleway][traffic_sign~="NL:G12a"][!mofa]
+    # way[highway=cycleway][traffic_sign~="NL:G12a"][!mofa]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
@@ -863,7 +917,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{1.tag}","{2.key}")
                 err.append({'class': 90205, 'subclass': 1066589580, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # way[highway=cycleway][traffic_sign~="NL:G13"][!mofa][!motor_vehicle][!access]
+    # way[highway=cycleway][traffic_sign~="NL:G13"][!mofa][!motor_vehicle][!access]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
@@ -875,11 +930,12 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{1.tag}","mofa=no")
                 err.append({'class': 90205, 'subclass': 1059219548, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'mofa=no')})
 
-        # way[highway][traffic_sign~="NL:F13"][!bus][!psv][highway!=busway][highway!=bus_guideway]
-        # way[highway][traffic_sign~="NL:F17"][!bus][!psv][highway!=busway][highway!=bus_guideway]
-        # way[highway][traffic_sign~="NL:F19"][!bus][!psv][highway!=busway][highway!=bus_guideway]
-        # way[highway][traffic_sign~="NL:F19"][!hgv]
-        # way[highway][traffic_sign~="NL:F21"][!hgv]
+    # way[highway][traffic_sign~="NL:F13"][!bus][!psv][highway!=busway][highway!=bus_guideway]
+    # way[highway][traffic_sign~="NL:F17"][!bus][!psv][highway!=busway][highway!=bus_guideway]
+    # way[highway][traffic_sign~="NL:F19"][!bus][!psv][highway!=busway][highway!=bus_guideway]
+    # way[highway][traffic_sign~="NL:F19"][!hgv]
+    # way[highway][traffic_sign~="NL:F21"][!hgv]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
@@ -911,14 +967,15 @@ class Josm_DutchSpecific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{2.key}=designated')).split('=', 1)])
                 }})
 
-        # way[highway][traffic_sign~="NL:F13"][bus=no][highway!=construction]
-        # way[highway][traffic_sign~="NL:F17"][bus=no][highway!=construction]
-        # way[highway][traffic_sign~="NL:F19"][bus=no][highway!=construction]
-        # way[highway][traffic_sign~="NL:F13"][psv=no][!bus][highway!=construction]
-        # way[highway][traffic_sign~="NL:F17"][psv=no][!bus][highway!=construction]
-        # way[highway][traffic_sign~="NL:F19"][psv=no][!bus][highway!=construction]
-        # way[highway][traffic_sign~="NL:F19"][hgv=no][highway!=construction]
-        # way[highway][traffic_sign~="NL:F21"][hgv=no][highway!=construction]
+    # way[highway][traffic_sign~="NL:F13"][bus=no][highway!=construction]
+    # way[highway][traffic_sign~="NL:F17"][bus=no][highway!=construction]
+    # way[highway][traffic_sign~="NL:F19"][bus=no][highway!=construction]
+    # way[highway][traffic_sign~="NL:F13"][psv=no][!bus][highway!=construction]
+    # way[highway][traffic_sign~="NL:F17"][psv=no][!bus][highway!=construction]
+    # way[highway][traffic_sign~="NL:F19"][psv=no][!bus][highway!=construction]
+    # way[highway][traffic_sign~="NL:F19"][hgv=no][highway!=construction]
+    # way[highway][traffic_sign~="NL:F21"][hgv=no][highway!=construction]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('bus' in keys and 'highway' in keys and 'traffic_sign' in keys) or ('hgv' in keys and 'highway' in keys and 'traffic_sign' in keys) or ('highway' in keys and 'psv' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
@@ -958,7 +1015,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{1.tag}","{2.tag}")
                 err.append({'class': 90205, 'subclass': 1630203133, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # way[highway=steps][traffic_sign=~/(^|; ?)NL:L301\b/]
+    # way[highway=steps][traffic_sign=~/(^|; ?)NL:L301\b/]
+    def _way_rule_6(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
@@ -967,10 +1025,11 @@ class Josm_DutchSpecific(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set .markedSteps
-                set_markedSteps = True
+                sets.add('markedSteps')
 
-        # way[highway=steps][ramp=yes]
-        # way[highway=steps][ramp:bicycle=yes]
+    # way[highway=steps][ramp=yes]
+    # way[highway=steps][ramp:bicycle=yes]
+    def _way_rule_7(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'ramp' in keys) or ('highway' in keys and 'ramp:bicycle' in keys):
             match = False
             if not match:
@@ -983,9 +1042,10 @@ class Josm_DutchSpecific(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set .stepsWithBicycleRamp
-                set_stepsWithBicycleRamp = True
+                sets.add('stepsWithBicycleRamp')
 
-        # way[highway][traffic_sign*="NL:G"][count(split(";NL:G",concat(";",replace(tag("traffic_sign")," ",""))))>2]
+    # way[highway][traffic_sign*="NL:G"][count(split(";NL:G",concat(";",replace(tag("traffic_sign")," ",""))))>2]
+    def _way_rule_8(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
@@ -994,9 +1054,10 @@ class Josm_DutchSpecific(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set multipleGsigns
-                set_multipleGsigns = True
+                sets.add('multipleGsigns')
 
-        # way[living_street=yes][highway][highway!~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/]
+    # way[living_street=yes][highway][highway!~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/]
+    def _way_rule_9(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'living_street' in keys):
             match = False
             if not match:
@@ -1005,21 +1066,22 @@ class Josm_DutchSpecific(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set .altLivingStreet
-                set_altLivingStreet = True
-
-        # way[highway][traffic_sign~="NL:F13"][highway!=busway][highway!=service][highway!=bus_guideway][highway!=construction]
-        # way[highway][traffic_sign~="NL:G5"][highway!=living_street][highway!=construction][highway!=path][highway!=cycleway][highway!=pedestrian][highway!=bridleway][highway!=steps]!.altLivingStreet
-        # way[highway][traffic_sign~="NL:G05"][highway!=living_street][highway!=construction][highway!=path][highway!=cycleway][highway!=pedestrian][highway!=bridleway][highway!=steps]!.altLivingStreet
-        # way[highway][traffic_sign~="NL:G7"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
-        # way[highway][traffic_sign~="NL:G07"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
-        # way[highway][traffic_sign~="NL:G7-ZB"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
-        # way[highway][traffic_sign~="NL:G07-ZB"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
-        # way[highway][traffic_sign~="NL:G9"][highway!=bridleway][highway!=construction]!.multipleGsigns!.markedSteps
-        # way[highway][traffic_sign~="NL:G09"][highway!=bridleway][highway!=construction]!.multipleGsigns!.markedSteps
-        # way[highway][traffic_sign~="NL:G11"][highway!=cycleway][highway!=construction]!.multipleGsigns!.markedSteps!.stepsWithBicycleRamp
-        # way[highway][traffic_sign~="NL:G12a"][highway!=cycleway][highway!=construction]!.multipleGsigns!.markedSteps
-        # way[highway][traffic_sign~="NL:G13"][highway!=cycleway][highway!=construction]!.multipleGsigns!.markedSteps!.stepsWithBicycleRamp
-        # way[highway][traffic_sign*="NL:L301"][highway!=steps][highway!=construction][traffic_sign=~/(^|; ?)NL:L301\b/]
+                sets.add('altLivingStreet')
+
+    # way[highway][traffic_sign~="NL:F13"][highway!=busway][highway!=service][highway!=bus_guideway][highway!=construction]
+    # way[highway][traffic_sign~="NL:G5"][highway!=living_street][highway!=construction][highway!=path][highway!=cycleway][highway!=pedestrian][highway!=bridleway][highway!=steps]!.altLivingStreet
+    # way[highway][traffic_sign~="NL:G05"][highway!=living_street][highway!=construction][highway!=path][highway!=cycleway][highway!=pedestrian][highway!=bridleway][highway!=steps]!.altLivingStreet
+    # way[highway][traffic_sign~="NL:G7"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
+    # way[highway][traffic_sign~="NL:G07"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
+    # way[highway][traffic_sign~="NL:G7-ZB"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
+    # way[highway][traffic_sign~="NL:G07-ZB"][highway!=footway][highway!=steps][highway!=pedestrian][highway!=construction]!.multipleGsigns
+    # way[highway][traffic_sign~="NL:G9"][highway!=bridleway][highway!=construction]!.multipleGsigns!.markedSteps
+    # way[highway][traffic_sign~="NL:G09"][highway!=bridleway][highway!=construction]!.multipleGsigns!.markedSteps
+    # way[highway][traffic_sign~="NL:G11"][highway!=cycleway][highway!=construction]!.multipleGsigns!.markedSteps!.stepsWithBicycleRamp
+    # way[highway][traffic_sign~="NL:G12a"][highway!=cycleway][highway!=construction]!.multipleGsigns!.markedSteps
+    # way[highway][traffic_sign~="NL:G13"][highway!=cycleway][highway!=construction]!.multipleGsigns!.markedSteps!.stepsWithBicycleRamp
+    # way[highway][traffic_sign*="NL:L301"][highway!=steps][highway!=construction][traffic_sign=~/(^|; ?)NL:L301\b/]
+    def _way_rule_10(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
@@ -1028,47 +1090,47 @@ class Josm_DutchSpecific(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_altLivingStreet) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G5'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'living_street', 'living_street')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'construction', 'construction')) and (mapcss._tag_capture(capture_tags, 4, tags, 'highway') != mapcss._value_const_capture(capture_tags, 4, 'path', 'path')) and (mapcss._tag_capture(capture_tags, 5, tags, 'highway') != mapcss._value_const_capture(capture_tags, 5, 'cycleway', 'cycleway')) and (mapcss._tag_capture(capture_tags, 6, tags, 'highway') != mapcss._value_const_capture(capture_tags, 6, 'pedestrian', 'pedestrian')) and (mapcss._tag_capture(capture_tags, 7, tags, 'highway') != mapcss._value_const_capture(capture_tags, 7, 'bridleway', 'bridleway')) and (mapcss._tag_capture(capture_tags, 8, tags, 'highway') != mapcss._value_const_capture(capture_tags, 8, 'steps', 'steps')))
+                try: match = (('altLivingStreet' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G5'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'living_street', 'living_street')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'construction', 'construction')) and (mapcss._tag_capture(capture_tags, 4, tags, 'highway') != mapcss._value_const_capture(capture_tags, 4, 'path', 'path')) and (mapcss._tag_capture(capture_tags, 5, tags, 'highway') != mapcss._value_const_capture(capture_tags, 5, 'cycleway', 'cycleway')) and (mapcss._tag_capture(capture_tags, 6, tags, 'highway') != mapcss._value_const_capture(capture_tags, 6, 'pedestrian', 'pedestrian')) and (mapcss._tag_capture(capture_tags, 7, tags, 'highway') != mapcss._value_const_capture(capture_tags, 7, 'bridleway', 'bridleway')) and (mapcss._tag_capture(capture_tags, 8, tags, 'highway') != mapcss._value_const_capture(capture_tags, 8, 'steps', 'steps')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_altLivingStreet) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G05'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'living_street', 'living_street')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'construction', 'construction')) and (mapcss._tag_capture(capture_tags, 4, tags, 'highway') != mapcss._value_const_capture(capture_tags, 4, 'path', 'path')) and (mapcss._tag_capture(capture_tags, 5, tags, 'highway') != mapcss._value_const_capture(capture_tags, 5, 'cycleway', 'cycleway')) and (mapcss._tag_capture(capture_tags, 6, tags, 'highway') != mapcss._value_const_capture(capture_tags, 6, 'pedestrian', 'pedestrian')) and (mapcss._tag_capture(capture_tags, 7, tags, 'highway') != mapcss._value_const_capture(capture_tags, 7, 'bridleway', 'bridleway')) and (mapcss._tag_capture(capture_tags, 8, tags, 'highway') != mapcss._value_const_capture(capture_tags, 8, 'steps', 'steps')))
+                try: match = (('altLivingStreet' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G05'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'living_street', 'living_street')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'construction', 'construction')) and (mapcss._tag_capture(capture_tags, 4, tags, 'highway') != mapcss._value_const_capture(capture_tags, 4, 'path', 'path')) and (mapcss._tag_capture(capture_tags, 5, tags, 'highway') != mapcss._value_const_capture(capture_tags, 5, 'cycleway', 'cycleway')) and (mapcss._tag_capture(capture_tags, 6, tags, 'highway') != mapcss._value_const_capture(capture_tags, 6, 'pedestrian', 'pedestrian')) and (mapcss._tag_capture(capture_tags, 7, tags, 'highway') != mapcss._value_const_capture(capture_tags, 7, 'bridleway', 'bridleway')) and (mapcss._tag_capture(capture_tags, 8, tags, 'highway') != mapcss._value_const_capture(capture_tags, 8, 'steps', 'steps')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_multipleGsigns) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G7'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'footway', 'footway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'steps', 'steps')) and (mapcss._tag_capture(capture_tags, 4, tags, 'highway') != mapcss._value_const_capture(capture_tags, 4, 'pedestrian', 'pedestrian')) and (mapcss._tag_capture(capture_tags, 5, tags, 'highway') != mapcss._value_const_capture(capture_tags, 5, 'construction', 'construction')))
+                try: match = (('multipleGsigns' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G7'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'footway', 'footway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'steps', 'steps')) and (mapcss._tag_capture(capture_tags, 4, tags, 'highway') != mapcss._value_const_capture(capture_tags, 4, 'pedestrian', 'pedestrian')) and (mapcss._tag_capture(capture_tags, 5, tags, 'highway') != mapcss._value_const_capture(capture_tags, 5, 'construction', 'construction')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_multipleGsigns) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G07'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'footway', 'footway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'steps', 'steps')) and (mapcss._tag_capture(capture_tags, 4, tags, 'highway') != mapcss._value_const_capture(capture_tags, 4, 'pedestrian', 'pedestrian')) and (mapcss._tag_capture(capture_tags, 5, tags, 'highway') != mapcss._value_const_capture(capture_tags, 5, 'construction', 'construction')))
+                try: match = (('multipleGsigns' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G07'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'footway', 'footway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'steps', 'steps')) and (mapcss._tag_capture(capture_tags, 4, tags, 'highway') != mapcss._value_const_capture(capture_tags, 4, 'pedestrian', 'pedestrian')) and (mapcss._tag_capture(capture_tags, 5, tags, 'highway') != mapcss._value_const_capture(capture_tags, 5, 'construction', 'construction')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_multipleGsigns) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G7-ZB'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'footway', 'footway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'steps', 'steps')) and (mapcss._tag_capture(capture_tags, 4, tags, 'highway') != mapcss._value_const_capture(capture_tags, 4, 'pedestrian', 'pedestrian')) and (mapcss._tag_capture(capture_tags, 5, tags, 'highway') != mapcss._value_const_capture(capture_tags, 5, 'construction', 'construction')))
+                try: match = (('multipleGsigns' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G7-ZB'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'footway', 'footway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'steps', 'steps')) and (mapcss._tag_capture(capture_tags, 4, tags, 'highway') != mapcss._value_const_capture(capture_tags, 4, 'pedestrian', 'pedestrian')) and (mapcss._tag_capture(capture_tags, 5, tags, 'highway') != mapcss._value_const_capture(capture_tags, 5, 'construction', 'construction')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_multipleGsigns) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G07-ZB'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'footway', 'footway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'steps', 'steps')) and (mapcss._tag_capture(capture_tags, 4, tags, 'highway') != mapcss._value_const_capture(capture_tags, 4, 'pedestrian', 'pedestrian')) and (mapcss._tag_capture(capture_tags, 5, tags, 'highway') != mapcss._value_const_capture(capture_tags, 5, 'construction', 'construction')))
+                try: match = (('multipleGsigns' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G07-ZB'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'footway', 'footway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'steps', 'steps')) and (mapcss._tag_capture(capture_tags, 4, tags, 'highway') != mapcss._value_const_capture(capture_tags, 4, 'pedestrian', 'pedestrian')) and (mapcss._tag_capture(capture_tags, 5, tags, 'highway') != mapcss._value_const_capture(capture_tags, 5, 'construction', 'construction')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_multipleGsigns) and (not set_markedSteps) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G9'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'bridleway', 'bridleway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'construction', 'construction')))
+                try: match = (('multipleGsigns' not in sets) and ('markedSteps' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G9'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'bridleway', 'bridleway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'construction', 'construction')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_multipleGsigns) and (not set_markedSteps) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G09'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'bridleway', 'bridleway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'construction', 'construction')))
+                try: match = (('multipleGsigns' not in sets) and ('markedSteps' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G09'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'bridleway', 'bridleway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'construction', 'construction')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_multipleGsigns) and (not set_markedSteps) and (not set_stepsWithBicycleRamp) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G11'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'cycleway', 'cycleway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'construction', 'construction')))
+                try: match = (('multipleGsigns' not in sets) and ('markedSteps' not in sets) and ('stepsWithBicycleRamp' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G11'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'cycleway', 'cycleway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'construction', 'construction')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_multipleGsigns) and (not set_markedSteps) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G12a'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'cycleway', 'cycleway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'construction', 'construction')))
+                try: match = (('multipleGsigns' not in sets) and ('markedSteps' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G12a'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'cycleway', 'cycleway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'construction', 'construction')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_multipleGsigns) and (not set_markedSteps) and (not set_stepsWithBicycleRamp) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G13'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'cycleway', 'cycleway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'construction', 'construction')))
+                try: match = (('multipleGsigns' not in sets) and ('markedSteps' not in sets) and ('stepsWithBicycleRamp' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G13'))) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway') != mapcss._value_const_capture(capture_tags, 2, 'cycleway', 'cycleway')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'construction', 'construction')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
@@ -1099,17 +1161,18 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=steps traffic_sign=NL:G13;NL:L301-B"
                 err.append({'class': 90205, 'subclass': 932689435, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[highway][traffic_sign~="NL:G5"][highway=~/^(path|cycleway|pedestrian|bridleway|steps)$/][moped][moped!~/^(no|use_sidepath)$/]!.altLivingStreet
-        # way[highway][traffic_sign~="NL:G05"][highway=~/^(path|cycleway|pedestrian|bridleway|steps)$/][moped][moped!~/^(no|use_sidepath)$/]!.altLivingStreet
+    # way[highway][traffic_sign~="NL:G5"][highway=~/^(path|cycleway|pedestrian|bridleway|steps)$/][moped][moped!~/^(no|use_sidepath)$/]!.altLivingStreet
+    # way[highway][traffic_sign~="NL:G05"][highway=~/^(path|cycleway|pedestrian|bridleway|steps)$/][moped][moped!~/^(no|use_sidepath)$/]!.altLivingStreet
+    def _way_rule_11(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'moped' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_altLivingStreet) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G5'))) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_1e92c009), mapcss._tag_capture(capture_tags, 2, tags, 'highway'))) and (mapcss._tag_capture(capture_tags, 3, tags, 'moped')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 4, self.re_143f11c5, '^(no|use_sidepath)$'), mapcss._tag_capture(capture_tags, 4, tags, 'moped'))))
+                try: match = (('altLivingStreet' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G5'))) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_1e92c009), mapcss._tag_capture(capture_tags, 2, tags, 'highway'))) and (mapcss._tag_capture(capture_tags, 3, tags, 'moped')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 4, self.re_143f11c5, '^(no|use_sidepath)$'), mapcss._tag_capture(capture_tags, 4, tags, 'moped'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_altLivingStreet) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G05'))) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_1e92c009), mapcss._tag_capture(capture_tags, 2, tags, 'highway'))) and (mapcss._tag_capture(capture_tags, 3, tags, 'moped')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 4, self.re_143f11c5, '^(no|use_sidepath)$'), mapcss._tag_capture(capture_tags, 4, tags, 'moped'))))
+                try: match = (('altLivingStreet' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'highway')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'traffic_sign'), mapcss._value_capture(capture_tags, 1, 'NL:G05'))) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_1e92c009), mapcss._tag_capture(capture_tags, 2, tags, 'highway'))) and (mapcss._tag_capture(capture_tags, 3, tags, 'moped')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 4, self.re_143f11c5, '^(no|use_sidepath)$'), mapcss._tag_capture(capture_tags, 4, tags, 'moped'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("NL traffic signs")
@@ -1119,7 +1182,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=living_street traffic_sign=NL:G05 moped=yes"
                 err.append({'class': 90205, 'subclass': 1097965115, 'text': mapcss.tr('{0} together with {1} but without {2}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{0.tag}'), 'living_street=yes')})
 
-        # way[highway][traffic_sign~="NL:L51"][!cyclestreet][highway!=construction]
+    # way[highway][traffic_sign~="NL:L51"][!cyclestreet][highway!=construction]
+    def _way_rule_12(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
@@ -1131,60 +1195,61 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{1.tag}","cyclestreet=yes")
                 err.append({'class': 90205, 'subclass': 1438158018, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'cyclestreet=yes')})
 
-        # way[highway][traffic_sign~="NL:C1"][!vehicle][!/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C1"][!vehicle:forward][!/^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C1"][!vehicle:backward][!/^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes]
-        # way[highway][traffic_sign~="NL:C01"][!vehicle][!/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C01"][!vehicle:forward][!/^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C01"][!vehicle:backward][!/^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes]
-        # way[highway][traffic_sign~="NL:C6"][!motor_vehicle][!/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C6"][!motor_vehicle:forward][!/^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C6"][!motor_vehicle:backward][!/^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes][oneway:motor_vehicle!=yes]
-        # way[highway][traffic_sign~="NL:C06"][!motor_vehicle][!/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C06"][!motor_vehicle:forward][!/^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C06"][!motor_vehicle:backward][!/^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes][oneway:motor_vehicle!=yes]
-        # way[highway][traffic_sign~="NL:C7"][!hgv][!/^hgv(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C7"][!hgv:forward][!/^hgv(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C7"][!hgv:backward][!/^hgv(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:hgv!=yes]
-        # way[highway][traffic_sign~="NL:C07"][!hgv][!/^hgv(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C07"][!hgv:forward][!/^hgv(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C07"][!hgv:backward][!/^hgv(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:hgv!=yes]
-        # way[highway][traffic_sign~="NL:C9"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C9"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C9"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes]
-        # way[highway][traffic_sign~="NL:C9"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C9"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C9"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes]
-        # way[highway][traffic_sign~="NL:C09"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C09"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C09"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes]
-        # way[highway][traffic_sign~="NL:C09"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C09"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C09"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes]
-        # way[highway][traffic_sign~="NL:C10"][!trailer][!/^trailer(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C10"][!trailer:forward][!/^trailer(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C10"][!trailer:backward][!/^trailer(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:trailer!=yes]
-        # way[highway][traffic_sign~="NL:C11"][!motorcycle][!/^motorcycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C11"][!motorcycle:forward][!/^motorcycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C11"][!motorcycle:backward][!/^motorcycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:motorcycle!=yes]
-        # way[highway][traffic_sign~="NL:C12"][!motor_vehicle][!/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C12"][!motor_vehicle:forward][!/^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C12"][!motor_vehicle:backward][!/^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes][oneway:motor_vehicle!=yes]
-        # way[highway][traffic_sign~="NL:C13"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:forward~="NL:C13"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:backward~="NL:C13"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes][highway!=footway]
-        # way[highway][traffic_sign~="NL:C14"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:forward~="NL:C14"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:backward~="NL:C14"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes][highway!=footway]
-        # way[highway][traffic_sign~="NL:C15"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:forward~="NL:C15"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:backward~="NL:C15"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes][highway!=footway]
-        # way[highway][traffic_sign~="NL:C15"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:forward~="NL:C15"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
-        # way[highway][traffic_sign:backward~="NL:C15"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes][highway!=footway]
-        # way[highway][traffic_sign~="NL:C16"][!foot][!/^foot(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C16"][!foot:forward][!/^foot(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C16"][!foot:backward][!/^foot(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:foot!=yes]
+    # way[highway][traffic_sign~="NL:C1"][!vehicle][!/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C1"][!vehicle:forward][!/^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C1"][!vehicle:backward][!/^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes]
+    # way[highway][traffic_sign~="NL:C01"][!vehicle][!/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C01"][!vehicle:forward][!/^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C01"][!vehicle:backward][!/^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes]
+    # way[highway][traffic_sign~="NL:C6"][!motor_vehicle][!/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C6"][!motor_vehicle:forward][!/^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C6"][!motor_vehicle:backward][!/^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes][oneway:motor_vehicle!=yes]
+    # way[highway][traffic_sign~="NL:C06"][!motor_vehicle][!/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C06"][!motor_vehicle:forward][!/^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C06"][!motor_vehicle:backward][!/^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes][oneway:motor_vehicle!=yes]
+    # way[highway][traffic_sign~="NL:C7"][!hgv][!/^hgv(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C7"][!hgv:forward][!/^hgv(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C7"][!hgv:backward][!/^hgv(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:hgv!=yes]
+    # way[highway][traffic_sign~="NL:C07"][!hgv][!/^hgv(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C07"][!hgv:forward][!/^hgv(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C07"][!hgv:backward][!/^hgv(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:hgv!=yes]
+    # way[highway][traffic_sign~="NL:C9"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C9"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C9"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes]
+    # way[highway][traffic_sign~="NL:C9"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C9"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C9"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes]
+    # way[highway][traffic_sign~="NL:C09"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C09"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C09"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes]
+    # way[highway][traffic_sign~="NL:C09"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C09"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C09"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes]
+    # way[highway][traffic_sign~="NL:C10"][!trailer][!/^trailer(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C10"][!trailer:forward][!/^trailer(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C10"][!trailer:backward][!/^trailer(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:trailer!=yes]
+    # way[highway][traffic_sign~="NL:C11"][!motorcycle][!/^motorcycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C11"][!motorcycle:forward][!/^motorcycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C11"][!motorcycle:backward][!/^motorcycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:motorcycle!=yes]
+    # way[highway][traffic_sign~="NL:C12"][!motor_vehicle][!/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C12"][!motor_vehicle:forward][!/^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C12"][!motor_vehicle:backward][!/^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway!=yes][oneway:motor_vehicle!=yes]
+    # way[highway][traffic_sign~="NL:C13"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:forward~="NL:C13"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:backward~="NL:C13"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes][highway!=footway]
+    # way[highway][traffic_sign~="NL:C14"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:forward~="NL:C14"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:backward~="NL:C14"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes][highway!=footway]
+    # way[highway][traffic_sign~="NL:C15"][!bicycle][!/^bicycle(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:forward~="NL:C15"][!bicycle:forward][!/^bicycle(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:backward~="NL:C15"][!bicycle:backward][!/^bicycle(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:bicycle!=yes][highway!=footway]
+    # way[highway][traffic_sign~="NL:C15"][!moped][!/^moped(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:forward~="NL:C15"][!moped:forward][!/^moped(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway!=footway]
+    # way[highway][traffic_sign:backward~="NL:C15"][!moped:backward][!/^moped(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:moped!=yes][highway!=footway]
+    # way[highway][traffic_sign~="NL:C16"][!foot][!/^foot(:forward|:backward|:both_ways)?(:conditional)?$/][!/^access(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C16"][!foot:forward][!/^foot(:forward|:both_ways)?(:conditional)?$/][!/^access(:forward|:both_ways)?(:conditional)?$/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C16"][!foot:backward][!/^foot(:backward|:both_ways)?(:conditional)?$/][!/^access(:backward|:both_ways)?(:conditional)?$/][highway!=construction][oneway:foot!=yes]
+    def _way_rule_13(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys) or ('highway' in keys and 'traffic_sign:backward' in keys) or ('highway' in keys and 'traffic_sign:forward' in keys):
             match = False
             if not match:
@@ -1420,9 +1485,10 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=track traffic_sign=\"NL:C12\" motor_vehicle=no"
                 err.append({'class': 90205, 'subclass': 767847379, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.key}=no/private/destination/...'))})
 
-        # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C22(\[[A-E]\])?(;|$)/][!/^hazmat(:[A-E])?(:forward|:backward|:both_ways)?(:conditional)?$/][!/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway]
-        # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C22(\[[A-E]\])?(;|$)/][!/^hazmat(:[A-E])?(:forward|:both_ways)?(:conditional)?$/][!/^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway]
-        # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C22(\[[A-E]\])?(;|$)/][!/^hazmat(:[A-E])?(:backward|:both_ways)?(:conditional)?$/][!/^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway][/^oneway:hazmat/!~/^yes$/]
+    # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C22(\[[A-E]\])?(;|$)/][!/^hazmat(:[A-E])?(:forward|:backward|:both_ways)?(:conditional)?$/][!/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway]
+    # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C22(\[[A-E]\])?(;|$)/][!/^hazmat(:[A-E])?(:forward|:both_ways)?(:conditional)?$/][!/^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$/][highway!=construction][highway]
+    # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C22(\[[A-E]\])?(;|$)/][!/^hazmat(:[A-E])?(:backward|:both_ways)?(:conditional)?$/][!/^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$/][highway!=construction][highway][/^oneway:hazmat/!~/^yes$/]
+    def _way_rule_14(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys) or ('highway' in keys and 'traffic_sign:backward' in keys) or ('highway' in keys and 'traffic_sign:forward' in keys):
             match = False
             if not match:
@@ -1452,21 +1518,22 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=service traffic_sign=\"NL:C22a\""
                 err.append({'class': 90205, 'subclass': 326989948, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), 'hazmat=no/private/destination/...', 'hazmat:A-E=no/private/destination/...')})
 
-        # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C17\b/][!maxlength][!/^maxlength(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C17\b/][!maxlength:forward][!/^maxlength(:forward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C17\b/][!maxlength:backward][!/^maxlength(:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C18\b/][!maxwidth][!/^maxwidth(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C18\b/][!maxwidth:forward][!/^maxwidth(:forward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C18\b/][!maxwidth:backward][!/^maxwidth(:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign][traffic_sign=~/(^|; ?)NL:(C19|L0?1)\b/][!maxheight][!/^maxheight(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:(C19|L0?1)\b/][!maxheight:forward][!/^maxheight(:forward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:(C19|L0?1)\b/][!maxheight:backward][!/^maxheight(:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C20\b/][!maxaxleload][!/^maxaxleload(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C20\b/][!maxaxleload:forward][!/^maxaxleload(:forward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C20\b/][!maxaxleload:backward][!/^maxaxleload(:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C21\b/][!maxweight][!/^maxweight(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C21\b/][!maxweight:forward][!/^maxweight(:forward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C21\b/][!maxweight:backward][!/^maxweight(:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C17\b/][!maxlength][!/^maxlength(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C17\b/][!maxlength:forward][!/^maxlength(:forward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C17\b/][!maxlength:backward][!/^maxlength(:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C18\b/][!maxwidth][!/^maxwidth(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C18\b/][!maxwidth:forward][!/^maxwidth(:forward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C18\b/][!maxwidth:backward][!/^maxwidth(:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign][traffic_sign=~/(^|; ?)NL:(C19|L0?1)\b/][!maxheight][!/^maxheight(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:(C19|L0?1)\b/][!maxheight:forward][!/^maxheight(:forward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:(C19|L0?1)\b/][!maxheight:backward][!/^maxheight(:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C20\b/][!maxaxleload][!/^maxaxleload(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C20\b/][!maxaxleload:forward][!/^maxaxleload(:forward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C20\b/][!maxaxleload:backward][!/^maxaxleload(:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign][traffic_sign=~/(^|; ?)NL:C21\b/][!maxweight][!/^maxweight(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:forward][traffic_sign:forward=~/(^|; ?)NL:C21\b/][!maxweight:forward][!/^maxweight(:forward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:backward][traffic_sign:backward=~/(^|; ?)NL:C21\b/][!maxweight:backward][!/^maxweight(:backward|:both_ways)?(:conditional)?$/][highway]
+    def _way_rule_15(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys) or ('highway' in keys and 'traffic_sign:backward' in keys) or ('highway' in keys and 'traffic_sign:forward' in keys):
             match = False
             if not match:
@@ -1542,14 +1609,15 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=residential traffic_sign=\"NL:J19;NL:C21[2.1];NL:OB108\" maxweight:conditional=xxx"
                 err.append({'class': 90205, 'subclass': 991745921, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # way[highway][traffic_sign~="NL:C2"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
-        # way[highway][traffic_sign~="NL:C02"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
-        # way[highway][traffic_sign~="NL:C3"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
-        # way[highway][traffic_sign~="NL:C03"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:C3"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction][traffic_sign:backward!~/\bNL:C0?2\b/]
-        # way[highway][traffic_sign:forward~="NL:C03"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction][traffic_sign:backward!~/\bNL:C0?2\b/]
-        # way[highway][traffic_sign:backward~="NL:C2"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:C02"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction]
+    # way[highway][traffic_sign~="NL:C2"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
+    # way[highway][traffic_sign~="NL:C02"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
+    # way[highway][traffic_sign~="NL:C3"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
+    # way[highway][traffic_sign~="NL:C03"][oneway!=yes][regexp_test("^(no|0)*$",join_list("",tag_regex("^oneway:")))][oneway!=-1][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:C3"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction][traffic_sign:backward!~/\bNL:C0?2\b/]
+    # way[highway][traffic_sign:forward~="NL:C03"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction][traffic_sign:backward!~/\bNL:C0?2\b/]
+    # way[highway][traffic_sign:backward~="NL:C2"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:C02"][oneway!=yes][regexp_test("^(no|-1|0)*$",join_list("",tag_regex("^oneway:")))][highway!=construction]
+    def _way_rule_16(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys) or ('highway' in keys and 'traffic_sign:backward' in keys) or ('highway' in keys and 'traffic_sign:forward' in keys):
             match = False
             if not match:
@@ -1605,8 +1673,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertMatch:"way highway=residential traffic_sign=\"NL:C3;NL:OB58\""
                 err.append({'class': 90205, 'subclass': 2031953960, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # way[highway][traffic_sign~="NL:C5"][oneway?][highway!=construction]
-        # way[highway][traffic_sign~="NL:C05"][oneway?][highway!=construction]
+    # way[highway][traffic_sign~="NL:C5"][oneway?][highway!=construction]
+    # way[highway][traffic_sign~="NL:C05"][oneway?][highway!=construction]
+    def _way_rule_17(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'oneway' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
@@ -1626,8 +1695,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=residential traffic_sign=\"NL:C5;NL:OB58\" oneway=no"
                 err.append({'class': 90205, 'subclass': 560436831, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # way[highway][traffic_sign~="NL:D1"][junction!=roundabout][junction!=circular]
-        # way[highway][traffic_sign~="NL:D01"][junction!=roundabout][junction!=circular]
+    # way[highway][traffic_sign~="NL:D1"][junction!=roundabout][junction!=circular]
+    # way[highway][traffic_sign~="NL:D01"][junction!=roundabout][junction!=circular]
+    def _way_rule_18(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
@@ -1646,8 +1716,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertMatch:"way highway=residential traffic_sign=NL:D1 oneway=yes"
                 err.append({'class': 90205, 'subclass': 439012160, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'))})
 
-        # way[highway][traffic_sign~="NL:D1"][junction=circular][oneway!~/^(yes|-?1)$/]
-        # way[highway][traffic_sign~="NL:D01"][junction=circular][oneway!~/^(yes|-?1)$/]
+    # way[highway][traffic_sign~="NL:D1"][junction=circular][oneway!~/^(yes|-?1)$/]
+    # way[highway][traffic_sign~="NL:D01"][junction=circular][oneway!~/^(yes|-?1)$/]
+    def _way_rule_19(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'junction' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
@@ -1667,12 +1738,13 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertMatch:"way highway=residential traffic_sign=NL:D1 oneway=no junction=circular"
                 err.append({'class': 90205, 'subclass': 1998584294, 'text': mapcss.tr('{0} together with {1} but without {2}', mapcss._tag_uncapture(capture_tags, '{2.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'oneway=yes')})
 
-        # way[traffic_sign="NL:B1"][!priority_road][!priority_road:forward][!priority_road:backward][!priority_road:both_ways][highway]
-        # way[traffic_sign="NL:B01"][!priority_road][!priority_road:forward][!priority_road:backward][!priority_road:both_ways][highway]
-        # way[traffic_sign:forward="NL:B1"][!priority_road][!priority_road:forward][!priority_road:both_ways][highway]
-        # way[traffic_sign:forward="NL:B01"][!priority_road][!priority_road:forward][!priority_road:both_ways][highway]
-        # way[traffic_sign:backward="NL:B1"][!priority_road][!priority_road:backward][!priority_road:both_ways][highway]
-        # way[traffic_sign:backward="NL:B01"][!priority_road][!priority_road:backward][!priority_road:both_ways][highway]
+    # way[traffic_sign="NL:B1"][!priority_road][!priority_road:forward][!priority_road:backward][!priority_road:both_ways][highway]
+    # way[traffic_sign="NL:B01"][!priority_road][!priority_road:forward][!priority_road:backward][!priority_road:both_ways][highway]
+    # way[traffic_sign:forward="NL:B1"][!priority_road][!priority_road:forward][!priority_road:both_ways][highway]
+    # way[traffic_sign:forward="NL:B01"][!priority_road][!priority_road:forward][!priority_road:both_ways][highway]
+    # way[traffic_sign:backward="NL:B1"][!priority_road][!priority_road:backward][!priority_road:both_ways][highway]
+    # way[traffic_sign:backward="NL:B01"][!priority_road][!priority_road:backward][!priority_road:both_ways][highway]
+    def _way_rule_20(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys) or ('highway' in keys and 'traffic_sign:backward' in keys) or ('highway' in keys and 'traffic_sign:forward' in keys):
             match = False
             if not match:
@@ -1705,30 +1777,31 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"{0.key}=designated"
                 err.append({'class': 90205, 'subclass': 2073220392, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E01"][highway][parking:both=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
-        # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E01"][highway][parking:left=no][parking:lane:right=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
-        # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E1"][highway][parking:both=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
-        # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E1"][highway][parking:left=no][parking:lane:right=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
-        # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E01"][highway][parking:both=no][parking:both:restriction!=no_parking]
-        # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E01"][highway][parking:right=no][parking:both:restriction!=no_parking]
-        # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E1"][highway][parking:both=no][parking:both:restriction!=no_parking]
-        # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E1"][highway][parking:right=no][parking:both:restriction!=no_parking]
-        # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E01"][highway][parking:both=no][parking:both:restriction!=no_parking]
-        # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E01"][highway][parking:left=no][parking:both:restriction!=no_parking]
-        # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E1"][highway][parking:both=no][parking:both:restriction!=no_parking]
-        # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E1"][highway][parking:left=no][parking:both:restriction!=no_parking]
-        # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E02"][highway][parking:both=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
-        # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E02"][highway][parking:left=no][parking:right=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
-        # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E2"][highway][parking:both=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
-        # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E2"][highway][parking:left=no][parking:right=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
-        # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E02"][highway][parking:both=no][parking:both:restriction!=no_stopping]
-        # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E02"][highway][parking:right=no][parking:both:restriction!=no_stopping]
-        # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E2"][highway][parking:both=no][parking:both:restriction!=no_stopping]
-        # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E2"][highway][parking:right=no][parking:both:restriction!=no_stopping]
-        # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E02"][highway][parking:both=no][parking:both:restriction!=no_stopping]
-        # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E02"][highway][parking:left=no][parking:both:restriction!=no_stopping]
-        # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E2"][highway][parking:both=no][parking:both:restriction!=no_stopping]
-        # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E2"][highway][parking:left=no][parking:both:restriction!=no_stopping]
+    # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E01"][highway][parking:both=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
+    # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E01"][highway][parking:left=no][parking:lane:right=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
+    # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E1"][highway][parking:both=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
+    # way[parking:both:restriction!=no_parking][traffic_sign~="NL:E1"][highway][parking:left=no][parking:lane:right=no][parking:right:restriction!=no_parking][parking:left:restriction!=no_parking]
+    # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E01"][highway][parking:both=no][parking:both:restriction!=no_parking]
+    # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E01"][highway][parking:right=no][parking:both:restriction!=no_parking]
+    # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E1"][highway][parking:both=no][parking:both:restriction!=no_parking]
+    # way[parking:right:restriction!=no_parking][traffic_sign:right~="NL:E1"][highway][parking:right=no][parking:both:restriction!=no_parking]
+    # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E01"][highway][parking:both=no][parking:both:restriction!=no_parking]
+    # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E01"][highway][parking:left=no][parking:both:restriction!=no_parking]
+    # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E1"][highway][parking:both=no][parking:both:restriction!=no_parking]
+    # way[parking:left:restriction!=no_parking][traffic_sign:left~="NL:E1"][highway][parking:left=no][parking:both:restriction!=no_parking]
+    # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E02"][highway][parking:both=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
+    # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E02"][highway][parking:left=no][parking:right=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
+    # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E2"][highway][parking:both=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
+    # way[parking:both:restriction!=no_stopping][traffic_sign~="NL:E2"][highway][parking:left=no][parking:right=no][parking:right:restriction!=no_stopping][parking:left:restriction!=no_stopping]
+    # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E02"][highway][parking:both=no][parking:both:restriction!=no_stopping]
+    # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E02"][highway][parking:right=no][parking:both:restriction!=no_stopping]
+    # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E2"][highway][parking:both=no][parking:both:restriction!=no_stopping]
+    # way[parking:right:restriction!=no_stopping][traffic_sign:right~="NL:E2"][highway][parking:right=no][parking:both:restriction!=no_stopping]
+    # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E02"][highway][parking:both=no][parking:both:restriction!=no_stopping]
+    # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E02"][highway][parking:left=no][parking:both:restriction!=no_stopping]
+    # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E2"][highway][parking:both=no][parking:both:restriction!=no_stopping]
+    # way[parking:left:restriction!=no_stopping][traffic_sign:left~="NL:E2"][highway][parking:left=no][parking:both:restriction!=no_stopping]
+    def _way_rule_21(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'parking:both' in keys and 'traffic_sign' in keys) or ('highway' in keys and 'parking:both' in keys and 'traffic_sign:left' in keys) or ('highway' in keys and 'parking:both' in keys and 'traffic_sign:right' in keys) or ('highway' in keys and 'parking:lane:right' in keys and 'parking:left' in keys and 'traffic_sign' in keys) or ('highway' in keys and 'parking:left' in keys and 'parking:right' in keys and 'traffic_sign' in keys) or ('highway' in keys and 'parking:left' in keys and 'traffic_sign:left' in keys) or ('highway' in keys and 'parking:right' in keys and 'traffic_sign:right' in keys):
             match = False
             if not match:
@@ -1841,10 +1914,11 @@ class Josm_DutchSpecific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.tag}')).split('=', 1)])
                 }})
 
-        # way[highway][traffic_sign~="NL:F5"][!priority][!/^priority:./][highway!=construction]
-        # way[highway][traffic_sign~="NL:F05"][!priority][!/^priority:./][highway!=construction]
-        # way[highway][traffic_sign~="NL:F6"][!priority][!/^priority:./][highway!=construction]
-        # way[highway][traffic_sign~="NL:F06"][!priority][!/^priority:./][highway!=construction]
+    # way[highway][traffic_sign~="NL:F5"][!priority][!/^priority:./][highway!=construction]
+    # way[highway][traffic_sign~="NL:F05"][!priority][!/^priority:./][highway!=construction]
+    # way[highway][traffic_sign~="NL:F6"][!priority][!/^priority:./][highway!=construction]
+    # way[highway][traffic_sign~="NL:F06"][!priority][!/^priority:./][highway!=construction]
+    def _way_rule_22(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign' in keys):
             match = False
             if not match:
@@ -1871,14 +1945,15 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertMatch:"way highway=residential traffic_sign=\"NL:F6;OB05\""
                 err.append({'class': 90205, 'subclass': 1040610185, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.key}=forward'), mapcss._tag_uncapture(capture_tags, '{2.key}=backward'))})
 
-        # way[highway][traffic_sign:forward~="NL:F5"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:F05"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:F6"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:F06"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:F5"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
-        # way[highway][traffic_sign:backward~="NL:F05"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:F6"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
-        # way[highway][traffic_sign:forward~="NL:F06"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:F5"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:F05"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:F6"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:F06"][priority!=backward][/^priority:./!~/backward/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:F5"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
+    # way[highway][traffic_sign:backward~="NL:F05"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:F6"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
+    # way[highway][traffic_sign:forward~="NL:F06"][priority!=forward][/^priority:./!~/forward/][highway!=construction]
+    def _way_rule_23(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'traffic_sign:backward' in keys) or ('highway' in keys and 'traffic_sign:forward' in keys):
             match = False
             if not match:
@@ -1928,10 +2003,11 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=residential traffic_sign:forward=\"NL:F6;OB05\" priority:agricultural=forward"
                 err.append({'class': 90205, 'subclass': 1108961023, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # *[contact:phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
-        # *[contact:mobile=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
-        # *[contact:whatsapp=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
-        # *[phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[contact:phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[contact:mobile=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[contact:whatsapp=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    def _way_rule_24(self, data, tags, nds, keys, err, sets):
         if ('contact:mobile' in keys) or ('contact:phone' in keys) or ('contact:whatsapp' in keys) or ('phone' in keys):
             match = False
             if not match:
@@ -1954,12 +2030,13 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # set .badPhoneNumber
                 # group:tr("NL addresses and contacts")
                 # throwWarning:tr("Invalid tag {0}: country code should not be followed by a 0","{0.key}")
-                set_badPhoneNumber = True
+                sets.add('badPhoneNumber')
                 err.append({'class': 90201, 'subclass': 1739574763, 'text': mapcss.tr('Invalid tag {0}: country code should not be followed by a 0', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[contact:phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
-        # *[contact:mobile=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
-        # *[phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    # *[contact:phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    # *[contact:mobile=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    # *[phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    def _way_rule_25(self, data, tags, nds, keys, err, sets):
         if ('contact:mobile' in keys) or ('contact:phone' in keys) or ('phone' in keys):
             match = False
             if not match:
@@ -1978,37 +2055,39 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # set .badPhoneNumber
                 # group:tr("NL addresses and contacts")
                 # throwWarning:tr("Invalid tag {0}: short phone numbers cannot be used with international prefix (or: wrong phone number length)","{0.key}")
-                set_badPhoneNumber = True
+                sets.add('badPhoneNumber')
                 err.append({'class': 90201, 'subclass': 345342642, 'text': mapcss.tr('Invalid tag {0}: short phone numbers cannot be used with international prefix (or: wrong phone number length)', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[contact:phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
-        # *[contact:mobile=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
-        # *[contact:whatsapp=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
-        # *[phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[contact:phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[contact:mobile=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[contact:whatsapp=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    def _way_rule_26(self, data, tags, nds, keys, err, sets):
         if ('contact:mobile' in keys) or ('contact:phone' in keys) or ('contact:whatsapp' in keys) or ('phone' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_badPhoneNumber) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:phone'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('badPhoneNumber' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:phone'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_badPhoneNumber) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:mobile'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('badPhoneNumber' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:mobile'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_badPhoneNumber) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:whatsapp'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('badPhoneNumber' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:whatsapp'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_badPhoneNumber) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'phone'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('badPhoneNumber' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'phone'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("NL addresses and contacts")
                 # throwWarning:tr("Invalid tag {0}: too many digits (or foreign number, if so: ignore)","{0.key}")
                 err.append({'class': 90201, 'subclass': 50270752, 'text': mapcss.tr('Invalid tag {0}: too many digits (or foreign number, if so: ignore)', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # area[building][/^addr:(street|housenumber|postcode|city)$/][amenity!=place_of_worship][shop!=mall][building!~/^(container|houseboat|static_caravan)$/][inside("NL")]:closed
+    # area[building][/^addr:(street|housenumber|postcode|city)$/][amenity!=place_of_worship][shop!=mall][building!~/^(container|houseboat|static_caravan)$/][inside("NL")]:closed
+    def _way_rule_27(self, data, tags, nds, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -2019,31 +2098,33 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # set .addrOnBuilding
                 # group:tr("NL addresses and contacts")
                 # throwWarning:tr("In Nederland is het gebouw niet gekoppeld aan het adres. Het adres is wel gekoppeld aan het gebruiksdoel.")
-                set_addrOnBuilding = True
+                sets.add('addrOnBuilding')
                 err.append({'class': 90201, 'subclass': 1486034706, 'text': mapcss.tr('In Nederland is het gebouw niet gekoppeld aan het adres. Het adres is wel gekoppeld aan het gebruiksdoel.')})
 
-        # area[/^addr:(city|postcode)$/][!/(^|.+:)addr:housenumber($|:.+)/][!/(^|.+:)addr:street($|:.+)/][inside("NL")]!.addrOnBuilding
-        # area[addr:street][!/(^|.+:)addr:housenumber($|:.+)/][!addr:interpolation][!addr:flats][inside("NL")]!.addrOnBuilding
+    # area[/^addr:(city|postcode)$/][!/(^|.+:)addr:housenumber($|:.+)/][!/(^|.+:)addr:street($|:.+)/][inside("NL")]!.addrOnBuilding
+    # area[addr:street][!/(^|.+:)addr:housenumber($|:.+)/][!addr:interpolation][!addr:flats][inside("NL")]!.addrOnBuilding
+    def _way_rule_28(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_addrOnBuilding) and (mapcss._tag_capture(capture_tags, 0, tags, self.re_561be3ff)) and (not mapcss._tag_capture(capture_tags, 1, tags, self.re_49026388)) and (not mapcss._tag_capture(capture_tags, 2, tags, self.re_32d334cf)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, -1, tags, 'area') != mapcss._value_const_capture(capture_tags, -1, 'no', 'no')))
+                try: match = (('addrOnBuilding' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, self.re_561be3ff)) and (not mapcss._tag_capture(capture_tags, 1, tags, self.re_49026388)) and (not mapcss._tag_capture(capture_tags, 2, tags, self.re_32d334cf)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, -1, tags, 'area') != mapcss._value_const_capture(capture_tags, -1, 'no', 'no')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_addrOnBuilding) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:street')) and (not mapcss._tag_capture(capture_tags, 1, tags, self.re_49026388)) and (not mapcss._tag_capture(capture_tags, 2, tags, 'addr:interpolation')) and (not mapcss._tag_capture(capture_tags, 3, tags, 'addr:flats')) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, -1, tags, 'area') != mapcss._value_const_capture(capture_tags, -1, 'no', 'no')))
+                try: match = (('addrOnBuilding' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:street')) and (not mapcss._tag_capture(capture_tags, 1, tags, self.re_49026388)) and (not mapcss._tag_capture(capture_tags, 2, tags, 'addr:interpolation')) and (not mapcss._tag_capture(capture_tags, 3, tags, 'addr:flats')) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, -1, tags, 'area') != mapcss._value_const_capture(capture_tags, -1, 'no', 'no')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("NL addresses and contacts")
                 # throwWarning:tr("Incomplete address: {0} {1} {2} {3}",any(tag("addr:street"),"[street?]"),any(tag("addr:housenumber"),"[housenumber?]"),any(tag("addr:postcode"),""),any(tag("addr:city"),""))
                 err.append({'class': 90201, 'subclass': 2087285475, 'text': mapcss.tr('Incomplete address: {0} {1} {2} {3}', mapcss.any_(mapcss.tag(tags, 'addr:street'), '[street?]'), mapcss.any_(mapcss.tag(tags, 'addr:housenumber'), '[housenumber?]'), mapcss.any_(mapcss.tag(tags, 'addr:postcode'), ''), mapcss.any_(mapcss.tag(tags, 'addr:city'), ''))})
 
-        # area["addr:postcode"]["addr:postcode"!~/[0-9]{4} ?[A-Z]{2}/][inside("NL")]!.addrOnBuilding
-        # Rule Blacklisted (id: 1411893821)
+    # area["addr:postcode"]["addr:postcode"!~/[0-9]{4} ?[A-Z]{2}/][inside("NL")]!.addrOnBuilding
+    # Rule Blacklisted (id: 1411893821)
 
-        # way[cycleway:surface][surface][highway=cycleway][surface=*"cycleway:surface"][inside("NL")]
-        # way[footway:surface][surface][highway=footway][surface=*"footway:surface"][inside("NL")]
+    # way[cycleway:surface][surface][highway=cycleway][surface=*"cycleway:surface"][inside("NL")]
+    # way[footway:surface][surface][highway=footway][surface=*"footway:surface"][inside("NL")]
+    def _way_rule_29(self, data, tags, nds, keys, err, sets):
         if ('cycleway:surface' in keys and 'highway' in keys and 'surface' in keys) or ('footway:surface' in keys and 'highway' in keys and 'surface' in keys):
             match = False
             if not match:
@@ -2063,8 +2144,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # way[cycleway:surface][surface][highway=cycleway][surface!=*"cycleway:surface"][inside("NL")]
-        # way[footway:surface][surface][highway=footway][surface!=*"footway:surface"][inside("NL")]
+    # way[cycleway:surface][surface][highway=cycleway][surface!=*"cycleway:surface"][inside("NL")]
+    # way[footway:surface][surface][highway=footway][surface!=*"footway:surface"][inside("NL")]
+    def _way_rule_30(self, data, tags, nds, keys, err, sets):
         if ('cycleway:surface' in keys and 'highway' in keys and 'surface' in keys) or ('footway:surface' in keys and 'highway' in keys and 'surface' in keys):
             match = False
             if not match:
@@ -2080,8 +2162,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("{0} and {1} together with {2} and conflicting values","{0.key}","{1.key}","{2.tag}")
                 err.append({'class': 90206, 'subclass': 719277245, 'text': mapcss.tr('{0} and {1} together with {2} and conflicting values', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # way[cycleway:surface][highway=cycleway][!surface][inside("NL")]
-        # way[footway:surface][highway=footway][!surface][inside("NL")]
+    # way[cycleway:surface][highway=cycleway][!surface][inside("NL")]
+    # way[footway:surface][highway=footway][!surface][inside("NL")]
+    def _way_rule_31(self, data, tags, nds, keys, err, sets):
         if ('cycleway:surface' in keys and 'highway' in keys) or ('footway:surface' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -2104,7 +2187,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=>surface')).split('=>', 1)[0].strip()])
                 }})
 
-        # way[footway:surface][cycleway:surface][segregated=no][highway][footway:surface!=*"cycleway:surface"][inside("NL")]
+    # way[footway:surface][cycleway:surface][segregated=no][highway][footway:surface!=*"cycleway:surface"][inside("NL")]
+    def _way_rule_32(self, data, tags, nds, keys, err, sets):
         if ('cycleway:surface' in keys and 'footway:surface' in keys and 'highway' in keys and 'segregated' in keys):
             match = False
             if not match:
@@ -2116,8 +2200,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("{0} and {1} together with {2} and conflicting values","{0.key}","{1.key}","{2.tag}")
                 err.append({'class': 90206, 'subclass': 1915077278, 'text': mapcss.tr('{0} and {1} together with {2} and conflicting values', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # way[/^footway(:left|:right|:both)?:/][/^sidewalk:(left|right|both)$/][/^sidewalk:(left|right|both)$/=~/^yes$/][inside("NL")]
-        # way[/^footway(:left|:right|:both)?:/][sidewalk][sidewalk=~/^(left|right|both|yes)$/][inside("NL")]
+    # way[/^footway(:left|:right|:both)?:/][/^sidewalk:(left|right|both)$/][/^sidewalk:(left|right|both)$/=~/^yes$/][inside("NL")]
+    # way[/^footway(:left|:right|:both)?:/][sidewalk][sidewalk=~/^(left|right|both|yes)$/][inside("NL")]
+    def _way_rule_33(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -2134,8 +2219,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"sidewalk:*"
                 err.append({'class': 90206, 'subclass': 800706341, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[highway=footway][cycleway][cycleway!=no][cycleway!=lane][traffic_sign!~/\bNL:G0?7\b/][inside("NL")]
-        # way[highway=footway][segregated=yes][traffic_sign!~/\bNL:G0?7\b/][inside("NL")]
+    # way[highway=footway][cycleway][cycleway!=no][cycleway!=lane][traffic_sign!~/\bNL:G0?7\b/][inside("NL")]
+    # way[highway=footway][segregated=yes][traffic_sign!~/\bNL:G0?7\b/][inside("NL")]
+    def _way_rule_34(self, data, tags, nds, keys, err, sets):
         if ('cycleway' in keys and 'highway' in keys) or ('highway' in keys and 'segregated' in keys):
             match = False
             if not match:
@@ -2157,7 +2243,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=footway segregated=yes traffic_sign=NL:G7"
                 err.append({'class': 90206, 'subclass': 1018129333, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[sidewalk=none][inside("NL")]
+    # way[sidewalk=none][inside("NL")]
+    def _way_rule_35(self, data, tags, nds, keys, err, sets):
         if ('sidewalk' in keys):
             match = False
             if not match:
@@ -2174,7 +2261,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=no')).split('=', 1)])
                 }})
 
-        # way[postal_code][inside("NL")]
+    # way[postal_code][inside("NL")]
+    def _way_rule_36(self, data, tags, nds, keys, err, sets):
         if ('postal_code' in keys):
             match = False
             if not match:
@@ -2191,7 +2279,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # area[building=terrace][inside("NL")]
+    # area[building=terrace][inside("NL")]
+    def _way_rule_37(self, data, tags, nds, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -2206,7 +2295,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"building=house via een BAG importverzoek voor huizen"
                 err.append({'class': 90202, 'subclass': 2130098421, 'text': mapcss.tr('Een rij met rijtjeshuizen ({0}) wordt in Nederland per huis geïmporteerd uit de BAG', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[addr:interpolation][inside("NL")]
+    # *[addr:interpolation][inside("NL")]
+    def _way_rule_38(self, data, tags, nds, keys, err, sets):
         if ('addr:interpolation' in keys):
             match = False
             if not match:
@@ -2219,12 +2309,13 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"meerdere addr:housenumber via een BAG importverzoek"
                 err.append({'class': 90202, 'subclass': 864819394, 'text': mapcss.tr('Adressen ({0}) worden in Nederland individueel geïmporteerd uit de BAG', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[is_in=NL]
-        # *[is_in:country][inside("NL")]
-        # *[is_in:city][inside("NL")]
-        # *[is_in:province][inside("NL")]
-        # *[is_in:continent][inside("NL")]
-        # *[is_in:country_code=NL]
+    # *[is_in=NL]
+    # *[is_in:country][inside("NL")]
+    # *[is_in:city][inside("NL")]
+    # *[is_in:province][inside("NL")]
+    # *[is_in:continent][inside("NL")]
+    # *[is_in:country_code=NL]
+    def _way_rule_39(self, data, tags, nds, keys, err, sets):
         if ('is_in' in keys) or ('is_in:city' in keys) or ('is_in:continent' in keys) or ('is_in:country' in keys) or ('is_in:country_code' in keys) or ('is_in:province' in keys):
             match = False
             if not match:
@@ -2260,7 +2351,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # way[railway][tracks][tracks!=1][inside("NL")]
+    # way[railway][tracks][tracks!=1][inside("NL")]
+    def _way_rule_40(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'tracks' in keys):
             match = False
             if not match:
@@ -2273,8 +2365,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"passenger_lines=* if the tracks are already drawn separately"
                 err.append({'class': 90202, 'subclass': 379490980, 'text': mapcss.tr('Railway lines should be drawn as separate ways per track, rather than one way with {0}', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # area[addr:housename][/^building(:part)?$/][inside("NL")][!name]
-        # area[building:name][/^building(:part)?$/][inside("NL")][!name]
+    # area[addr:housename][/^building(:part)?$/][inside("NL")][!name]
+    # area[building:name][/^building(:part)?$/][inside("NL")][!name]
+    def _way_rule_41(self, data, tags, nds, keys, err, sets):
         if ('addr:housename' in keys) or ('building:name' in keys):
             match = False
             if not match:
@@ -2291,7 +2384,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.key}")
                 # suggestAlternative:"name=*"
                 # fixChangeKey:"{0.key}=>name"
-                set_housenameWithFix = True
+                sets.add('housenameWithFix')
                 err.append({'class': 90202, 'subclass': 797359946, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     [(mapcss._tag_uncapture(capture_tags, '{0.key}=>name')).split('=>', 1)[1].strip(), mapcss.tag(tags, (mapcss._tag_uncapture(capture_tags, '{0.key}=>name')).split('=>', 1)[0].strip())]]),
@@ -2299,17 +2392,18 @@ class Josm_DutchSpecific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=>name')).split('=>', 1)[0].strip()])
                 }})
 
-        # area[addr:housename][/^building(:part)?$/][inside("NL")][name=*"addr:housename"]!.housenameWithFix
-        # area[building:name][/^building(:part)?$/][inside("NL")][name=*"building:name"]!.housenameWithFix
+    # area[addr:housename][/^building(:part)?$/][inside("NL")][name=*"addr:housename"]!.housenameWithFix
+    # area[building:name][/^building(:part)?$/][inside("NL")][name=*"building:name"]!.housenameWithFix
+    def _way_rule_42(self, data, tags, nds, keys, err, sets):
         if ('addr:housename' in keys and 'name' in keys) or ('building:name' in keys and 'name' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_housenameWithFix) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:housename')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name') == mapcss._value_capture(capture_tags, 3, mapcss.tag(tags, 'addr:housename'))) and (mapcss._tag_capture(capture_tags, -1, tags, 'area') != mapcss._value_const_capture(capture_tags, -1, 'no', 'no')))
+                try: match = (('housenameWithFix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:housename')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name') == mapcss._value_capture(capture_tags, 3, mapcss.tag(tags, 'addr:housename'))) and (mapcss._tag_capture(capture_tags, -1, tags, 'area') != mapcss._value_const_capture(capture_tags, -1, 'no', 'no')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_housenameWithFix) and (mapcss._tag_capture(capture_tags, 0, tags, 'building:name')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name') == mapcss._value_capture(capture_tags, 3, mapcss.tag(tags, 'building:name'))) and (mapcss._tag_capture(capture_tags, -1, tags, 'area') != mapcss._value_const_capture(capture_tags, -1, 'no', 'no')))
+                try: match = (('housenameWithFix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'building:name')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name') == mapcss._value_capture(capture_tags, 3, mapcss.tag(tags, 'building:name'))) and (mapcss._tag_capture(capture_tags, -1, tags, 'area') != mapcss._value_const_capture(capture_tags, -1, 'no', 'no')))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .housenameWithFix
@@ -2317,23 +2411,24 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.key}")
                 # suggestAlternative:"name=*"
                 # fixRemove:"{0.key}"
-                set_housenameWithFix = True
+                sets.add('housenameWithFix')
                 err.append({'class': 90202, 'subclass': 464057822, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '-': ([
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # area[addr:housename][/^building(:part)?$/][inside("NL")][name]!.housenameWithFix
-        # area[building:name][/^building(:part)?$/][inside("NL")][name]!.housenameWithFix
+    # area[addr:housename][/^building(:part)?$/][inside("NL")][name]!.housenameWithFix
+    # area[building:name][/^building(:part)?$/][inside("NL")][name]!.housenameWithFix
+    def _way_rule_43(self, data, tags, nds, keys, err, sets):
         if ('addr:housename' in keys and 'name' in keys) or ('building:name' in keys and 'name' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_housenameWithFix) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:housename')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name')) and (mapcss._tag_capture(capture_tags, -1, tags, 'area') != mapcss._value_const_capture(capture_tags, -1, 'no', 'no')))
+                try: match = (('housenameWithFix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:housename')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name')) and (mapcss._tag_capture(capture_tags, -1, tags, 'area') != mapcss._value_const_capture(capture_tags, -1, 'no', 'no')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_housenameWithFix) and (mapcss._tag_capture(capture_tags, 0, tags, 'building:name')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name')) and (mapcss._tag_capture(capture_tags, -1, tags, 'area') != mapcss._value_const_capture(capture_tags, -1, 'no', 'no')))
+                try: match = (('housenameWithFix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'building:name')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name')) and (mapcss._tag_capture(capture_tags, -1, tags, 'area') != mapcss._value_const_capture(capture_tags, -1, 'no', 'no')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("NL deprecated features")
@@ -2341,7 +2436,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"name=*"
                 err.append({'class': 90202, 'subclass': 1635606421, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[/.:covid19$/][inside("NL")]
+    # *[/.:covid19$/][inside("NL")]
+    def _way_rule_44(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -2357,7 +2453,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # way[bicycle_road?][inside("NL")]
+    # way[bicycle_road?][inside("NL")]
+    def _way_rule_45(self, data, tags, nds, keys, err, sets):
         if ('bicycle_road' in keys):
             match = False
             if not match:
@@ -2372,8 +2469,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"highway=cycleway (fietspad)"
                 err.append({'class': 90202, 'subclass': 1111134078, 'text': mapcss.tr('Het concept {0} bestaat niet in Nederland', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[surface][surface=~/stenen$|^hout$|\bbestraa?t(ing)?$|grond$|^puin$|^grind$|zand$/]
-        # *[material][material=~/\bhout|\bmetaal\b|^beton$|^brons$|steen\b|ijzer\b|staal\b/]
+    # way[surface][surface=~/stenen$|^hout$|\bbestraa?t(ing)?$|grond$|^puin$|^grind$|zand$/]
+    # *[material][material=~/\bhout|\bmetaal\b|^beton$|^brons$|steen\b|ijzer\b|staal\b/]
+    def _way_rule_46(self, data, tags, nds, keys, err, sets):
         if ('material' in keys) or ('surface' in keys):
             match = False
             if not match:
@@ -2393,7 +2491,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way tourism=artwork material=bronze"
                 err.append({'class': 90202, 'subclass': 1205828493, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[surface][surface=~/^paving_stones:([1-9])0$/][inside("NL")]
+    # *[surface][surface=~/^paving_stones:([1-9])0$/][inside("NL")]
+    def _way_rule_47(self, data, tags, nds, keys, err, sets):
         if ('surface' in keys):
             match = False
             if not match:
@@ -2415,7 +2514,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     ['surface','paving_stones']])
                 }})
 
-        # *[/^(.+):surface$/][/^(.+):surface$/=~/^paving_stones:([1-9])0$/][count(tag_regex("^(.+):surface$"))==1][inside("NL")]
+    # *[/^(.+):surface$/][/^(.+):surface$/=~/^paving_stones:([1-9])0$/][count(tag_regex("^(.+):surface$"))==1][inside("NL")]
+    def _way_rule_48(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -2432,7 +2532,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # fixAdd:"{0.key}=paving_stones"
                 # assertNoMatch:"way highway=residential sidewalk:surface=paving_stones cycleway:surface=paving_stones:20"
                 # assertNoMatch:"way highway=residential sidewalk:surface=paving_stones:30 cycleway:surface=paving_stones:20"
-                set_completedSurfacePavingStonesNumber = True
+                sets.add('completedSurfacePavingStonesNumber')
                 err.append({'class': 90202, 'subclass': 1911834456, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat(mapcss.get(mapcss.regexp_match(self.re_74d9b833, mapcss._tag_uncapture(capture_tags, '{0.key}')), 1), ':paving_stones:length=0.', mapcss.get(mapcss.regexp_match(self.re_19b1af6a, mapcss.get(mapcss.tag_regex(tags, self.re_74d9b833), 0)), 1))).split('=', 1),
@@ -2440,12 +2540,13 @@ class Josm_DutchSpecific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=paving_stones')).split('=', 1)])
                 }})
 
-        # *[/^(.+):surface$/=~/^paving_stones:([1-9])0$/][inside("NL")]!.completedSurfacePavingStonesNumber
+    # *[/^(.+):surface$/=~/^paving_stones:([1-9])0$/][inside("NL")]!.completedSurfacePavingStonesNumber
+    def _way_rule_49(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_completedSurfacePavingStonesNumber) and (mapcss.regexp_test(self.re_19b1af6a, mapcss._match_regex(tags, self.re_74d9b833))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('completedSurfacePavingStonesNumber' not in sets) and (mapcss.regexp_test(self.re_19b1af6a, mapcss._match_regex(tags, self.re_74d9b833))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("NL deprecated features")
@@ -2453,7 +2554,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"*:surface=paving_stones + *:paving_stones:shape=square + *:paving_stones:length=[length in meter, e.g. 0.3]"
                 err.append({'class': 90202, 'subclass': 1665978272, 'text': mapcss.tr('{0} is deprecated', '*:surface=paving_stones:NN')})
 
-        # *[winkelnummer]
+    # *[winkelnummer]
+    def _way_rule_50(self, data, tags, nds, keys, err, sets):
         if ('winkelnummer' in keys):
             match = False
             if not match:
@@ -2466,7 +2568,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"ref=*"
                 err.append({'class': 90202, 'subclass': 340349535, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[highway=cycleway][vehicle=no][!bicycle][traffic_sign!~/\bNL:(C0?1|C0?9|C14|C15|D103|D104)\b/][!vehicle:conditional][!bicycle:conditional][inside("NL")]
+    # way[highway=cycleway][vehicle=no][!bicycle][traffic_sign!~/\bNL:(C0?1|C0?9|C14|C15|D103|D104)\b/][!vehicle:conditional][!bicycle:conditional][inside("NL")]
+    def _way_rule_51(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'vehicle' in keys):
             match = False
             if not match:
@@ -2481,7 +2584,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=cycleway vehicle=no traffic_sign=NL:D104 moped=designated"
                 err.append({'class': 90209, 'subclass': 48304768, 'text': mapcss.tr('Suspicious combination: {0} together with {1} equals {2}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.key}={1.value}'))})
 
-        # *[ref:bag][ref:bag!~/(; ?|^)([0-9]{0,3}[1-9]|[0-9]{0,2}[1-9][0-9]|[0-9]?[1-9][0-9]{2})[0-9]{12}($|;)/][inside("NL")]
+    # *[ref:bag][ref:bag!~/(; ?|^)([0-9]{0,3}[1-9]|[0-9]{0,2}[1-9][0-9]|[0-9]?[1-9][0-9]{2})[0-9]{12}($|;)/][inside("NL")]
+    def _way_rule_52(self, data, tags, nds, keys, err, sets):
         if ('ref:bag' in keys):
             match = False
             if not match:
@@ -2493,7 +2597,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("Invalid value of {0}","{0.key}")
                 err.append({'class': 90209, 'subclass': 2021092431, 'text': mapcss.tr('Invalid value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[leisure][surface=gravel][sport~="tennis"][inside("NL")]
+    # *[leisure][surface=gravel][sport~="tennis"][inside("NL")]
+    def _way_rule_53(self, data, tags, nds, keys, err, sets):
         if ('leisure' in keys and 'sport' in keys and 'surface' in keys):
             match = False
             if not match:
@@ -2507,23 +2612,24 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way leisure=pitch sport=boules surface=gravel"
                 err.append({'class': 90209, 'subclass': 1521090750, 'text': mapcss.tr('unusual value of {0} for {1} (`gravel` in English means `grind` in Dutch)', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # way[name][highway=service][name=~/(?i)(parkeren$|parkeerplaats$|^toegang(sweg)?\s|^richting\s|drive.thro?u(gh)?)/]
-        # way[name][highway][name=~/(?i)(^|\sen\s)((on)?verplicht\s)?(\(?brom\)?)?fietspad$/]
-        # way[name][highway][name=~/(?i)^roltrap(pen)?$/]
-        # way[name][highway][name=~/(?i)(rolstoel|invaliden)/]
-        # way[name][highway][name=~/(?i)(uit?laa[dt]|honden.*wandel|los.?loop)/]
-        # way[name][highway][name=~/(?i)bus\s?(baan|strook)/][highway!=busway][highway!=service][highway!=construction]
-        # way[name][highway][name=~/\bbouwweg/]
-        # area[name][name=~/(?i)^wadi$/][tag("natural")||tag("landuse")]
-        # area[name][natural=water][name=visvijver]
-        # *[name][name="ijsbaan"]
-        # *[name][name=~/\b(([Aa]f)?gesloten|[Gg]eopend)\b/]
-        # *[name][amenity^=parking][name=~/(?i)(parkeren|parkeerplaats|parkeergarage|^garage)$/]
-        # *[name][name=~/(?i)^gratis\s|gratis\)/]
-        # *[name][name=~/(?i)(klanten|bezoek(ers)?|medewerkers)\b/][!route]
-        # *[name][leisure=playground][name=~/(?i)^speeltuin(tje)?$/]
-        # *[name][leisure^=dog][name=~/(?i)^(honden\s?)?(toilet|uitlaa[dt]|los.?loop)/]
-        # *[name][leisure=pitch][name=~/(?i)ball?(veld(je)?)?$/][!sport]
+    # way[name][highway=service][name=~/(?i)(parkeren$|parkeerplaats$|^toegang(sweg)?\s|^richting\s|drive.thro?u(gh)?)/]
+    # way[name][highway][name=~/(?i)(^|\sen\s)((on)?verplicht\s)?(\(?brom\)?)?fietspad$/]
+    # way[name][highway][name=~/(?i)^roltrap(pen)?$/]
+    # way[name][highway][name=~/(?i)(rolstoel|invaliden)/]
+    # way[name][highway][name=~/(?i)(uit?laa[dt]|honden.*wandel|los.?loop)/]
+    # way[name][highway][name=~/(?i)bus\s?(baan|strook)/][highway!=busway][highway!=service][highway!=construction]
+    # way[name][highway][name=~/\bbouwweg/]
+    # area[name][name=~/(?i)^wadi$/][tag("natural")||tag("landuse")]
+    # area[name][natural=water][name=visvijver]
+    # *[name][name="ijsbaan"]
+    # *[name][name=~/\b(([Aa]f)?gesloten|[Gg]eopend)\b/]
+    # *[name][amenity^=parking][name=~/(?i)(parkeren|parkeerplaats|parkeergarage|^garage)$/]
+    # *[name][name=~/(?i)^gratis\s|gratis\)/]
+    # *[name][name=~/(?i)(klanten|bezoek(ers)?|medewerkers)\b/][!route]
+    # *[name][leisure=playground][name=~/(?i)^speeltuin(tje)?$/]
+    # *[name][leisure^=dog][name=~/(?i)^(honden\s?)?(toilet|uitlaa[dt]|los.?loop)/]
+    # *[name][leisure=pitch][name=~/(?i)ball?(veld(je)?)?$/][!sport]
+    def _way_rule_54(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'name' in keys) or ('highway' in keys and 'name' in keys) or ('leisure' in keys and 'name' in keys) or ('name' in keys) or ('name' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -2606,7 +2712,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=unclassified name=Landbouwweg"
                 err.append({'class': 90203, 'subclass': 2144375058, 'text': mapcss.tr('descriptive name')})
 
-        # *[name][name=~/(?i)(voormalige?)/][!historic][tourism!=information][!landuse][!highway][!boundary][!waterway]
+    # *[name][name=~/(?i)(voormalige?)/][!historic][tourism!=information][!landuse][!highway][!boundary][!waterway]
+    def _way_rule_55(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -2621,17 +2728,18 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"old_name=*"
                 err.append({'class': 90203, 'subclass': 538711457, 'text': mapcss.tr('descriptive name')})
 
-        # way[name][highway][name=~/\b(Adm|Br|Burg|Cmdt|Dr|Drs|Ds|Fam|Gebr|Gen|Ing|Ir|Jhr|Kard|Kon|Luit|Mej|Mevr|Mgr|Min|Mr|Past|Pr|Pres|Prof|St|Vr|Weth|Zr)\.? [A-Za-z]/][inside("NL")]!.abbrname
-        # way[name][highway][name=~/^[A-Z][a-z]{1,4}\. /][name!~/^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\./][inside("NL")]!.abbrname
+    # way[name][highway][name=~/\b(Adm|Br|Burg|Cmdt|Dr|Drs|Ds|Fam|Gebr|Gen|Ing|Ir|Jhr|Kard|Kon|Luit|Mej|Mevr|Mgr|Min|Mr|Past|Pr|Pres|Prof|St|Vr|Weth|Zr)\.? [A-Za-z]/][inside("NL")]!.abbrname
+    # way[name][highway][name=~/^[A-Z][a-z]{1,4}\. /][name!~/^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\./][inside("NL")]!.abbrname
+    def _way_rule_56(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'name' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_abbrname) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'highway')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_1a749120), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('abbrname' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'highway')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_1a749120), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_abbrname) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'highway')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_293c2706), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 3, self.re_2f938f56, '^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\\.'), mapcss._tag_capture(capture_tags, 3, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('abbrname' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'highway')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_293c2706), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 3, self.re_2f938f56, '^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\\.'), mapcss._tag_capture(capture_tags, 3, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .abbrname
@@ -2642,50 +2750,53 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=residential name=\"Jac. P. Thijsseplein\""
                 # assertNoMatch:"way highway=residential name=\"Th. Weeversweg\""
                 # assertNoMatch:"way highway=residential name=\"Wim Kan Dreef\""
-                set_abbrname = True
+                sets.add('abbrname')
                 err.append({'class': 90203, 'subclass': 1873267871, 'text': mapcss.tr('Straatnaam met afkorting')})
 
-        # *[name][place][name=~/\b(Adm|Br|Burg|Cmdt|Dr|Drs|Ds|Fam|Gebr|Gen|Ing|Ir|Jhr|Kard|Kon|Luit|Mej|Mevr|Mgr|Min|Mr|Past|Pr|Pres|Prof|St|Vr|Weth|Zr)\.? [A-Za-z]/][inside("NL")]!.abbrname
-        # *[name][place][name=~/^[A-Z][a-z]{1,4}\. /][name!~/^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\./][inside("NL")]!.abbrname
+    # *[name][place][name=~/\b(Adm|Br|Burg|Cmdt|Dr|Drs|Ds|Fam|Gebr|Gen|Ing|Ir|Jhr|Kard|Kon|Luit|Mej|Mevr|Mgr|Min|Mr|Past|Pr|Pres|Prof|St|Vr|Weth|Zr)\.? [A-Za-z]/][inside("NL")]!.abbrname
+    # *[name][place][name=~/^[A-Z][a-z]{1,4}\. /][name!~/^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\./][inside("NL")]!.abbrname
+    def _way_rule_57(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'place' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_abbrname) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'place')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_1a749120), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('abbrname' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'place')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_1a749120), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_abbrname) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'place')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_293c2706), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 3, self.re_2f938f56, '^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\\.'), mapcss._tag_capture(capture_tags, 3, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('abbrname' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'place')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_293c2706), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 3, self.re_2f938f56, '^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\\.'), mapcss._tag_capture(capture_tags, 3, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .abbrname
                 # group:tr("NL nomenclature")
                 # throwWarning:tr("Gebiedsnaam met afkorting")
-                set_abbrname = True
+                sets.add('abbrname')
                 err.append({'class': 90203, 'subclass': 1079482384, 'text': mapcss.tr('Gebiedsnaam met afkorting')})
 
-        # *[railway][name][name=~/(?i)(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\./][inside("NL")]!.abbrname
-        # *[railway][name][name=~/(?i)\b(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\b/][inside("NL")]!.abbrname
+    # *[railway][name][name=~/(?i)(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\./][inside("NL")]!.abbrname
+    # *[railway][name][name=~/(?i)\b(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\b/][inside("NL")]!.abbrname
+    def _way_rule_58(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'railway' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_abbrname) and (mapcss._tag_capture(capture_tags, 0, tags, 'railway')) and (mapcss._tag_capture(capture_tags, 1, tags, 'name')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_798edef1), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('abbrname' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'railway')) and (mapcss._tag_capture(capture_tags, 1, tags, 'name')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_798edef1), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_abbrname) and (mapcss._tag_capture(capture_tags, 0, tags, 'railway')) and (mapcss._tag_capture(capture_tags, 1, tags, 'name')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_2441139b), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('abbrname' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'railway')) and (mapcss._tag_capture(capture_tags, 1, tags, 'name')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_2441139b), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .abbrname
                 # group:tr("NL nomenclature")
                 # throwWarning:tr("Spoorgebied met afgekorte naam")
                 # suggestAlternative:"aansluiting, emplacement, goederen, industrieterrein, inhaalspoor, opstelterrein, overloopwissel, raccordement of rangeerterrein"
-                set_abbrname = True
+                sets.add('abbrname')
                 err.append({'class': 90203, 'subclass': 1558593366, 'text': mapcss.tr('Spoorgebied met afgekorte naam')})
 
-        # *[name:nl][!name][inside("NL")][type!=route][name:fy]["name:fy"=*"name:nl"]
-        # *[name:nl][!name][inside("NL")][type!=route][!name:fy]
+    # *[name:nl][!name][inside("NL")][type!=route][name:fy]["name:fy"=*"name:nl"]
+    # *[name:nl][!name][inside("NL")][type!=route][!name:fy]
+    def _way_rule_59(self, data, tags, nds, keys, err, sets):
         if ('name:fy' in keys and 'name:nl' in keys) or ('name:nl' in keys):
             match = False
             if not match:
@@ -2708,7 +2819,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=>{1.key}')).split('=>', 1)[0].strip()])
                 }})
 
-        # *[heritage=2][heritage:operator!=rce][heritage:operator!~/(^|; ?)rce(;|$)/][inside("NL")]
+    # *[heritage=2][heritage:operator!=rce][heritage:operator!~/(^|; ?)rce(;|$)/][inside("NL")]
+    def _way_rule_60(self, data, tags, nds, keys, err, sets):
         if ('heritage' in keys):
             match = False
             if not match:
@@ -2724,7 +2836,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     ['heritage:operator','rce']])
                 }})
 
-        # *[heritage:operator=rce][!heritage][inside("NL")]
+    # *[heritage:operator=rce][!heritage][inside("NL")]
+    def _way_rule_61(self, data, tags, nds, keys, err, sets):
         if ('heritage:operator' in keys):
             match = False
             if not match:
@@ -2740,13 +2853,14 @@ class Josm_DutchSpecific(PluginMapCSS):
                     ['heritage','2']])
                 }})
 
-        # way[highway=living_street][maxspeed!=15][!/^maxspeed(:forward|:backward|:both_ways)?$/][inside("NL")]
-        # way[living_street=yes][maxspeed!=15][!/^maxspeed(:forward|:backward|:both_ways)?$/][inside("NL")][highway=~/^(path|cycleway|bridleway)$/][moped][moped!~/^(no|use_sidepath)$/]
-        # way[living_street=yes][maxspeed!=15][!/^maxspeed(:forward|:backward|:both_ways)?$/][inside("NL")][highway!~/^(path|cycleway|bridleway|footway|living_street)$/]
-        # way[maxspeed:type="NL:zone30"][maxspeed!=30][!maxspeed][maxspeed:both_ways!=30][highway]
-        # way[maxspeed:type="NL:zone60"][maxspeed!=60][!maxspeed][maxspeed:both_ways!=60][highway]
-        # way[maxspeed:type="NL:urban"][maxspeed!=50][!maxspeed][maxspeed:both_ways!=50][highway][highway!=cycleway]
-        # way[maxspeed:type="NL:rural"][maxspeed!=80][!maxspeed][maxspeed:both_ways!=80][highway][highway!=cycleway]
+    # way[highway=living_street][maxspeed!=15][!/^maxspeed(:forward|:backward|:both_ways)?$/][inside("NL")]
+    # way[living_street=yes][maxspeed!=15][!/^maxspeed(:forward|:backward|:both_ways)?$/][inside("NL")][highway=~/^(path|cycleway|bridleway)$/][moped][moped!~/^(no|use_sidepath)$/]
+    # way[living_street=yes][maxspeed!=15][!/^maxspeed(:forward|:backward|:both_ways)?$/][inside("NL")][highway!~/^(path|cycleway|bridleway|footway|living_street)$/]
+    # way[maxspeed:type="NL:zone30"][maxspeed!=30][!maxspeed][maxspeed:both_ways!=30][highway]
+    # way[maxspeed:type="NL:zone60"][maxspeed!=60][!maxspeed][maxspeed:both_ways!=60][highway]
+    # way[maxspeed:type="NL:urban"][maxspeed!=50][!maxspeed][maxspeed:both_ways!=50][highway][highway!=cycleway]
+    # way[maxspeed:type="NL:rural"][maxspeed!=80][!maxspeed][maxspeed:both_ways!=80][highway][highway!=cycleway]
+    def _way_rule_62(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys) or ('highway' in keys and 'living_street' in keys and 'moped' in keys) or ('highway' in keys and 'maxspeed:type' in keys) or ('living_street' in keys):
             match = False
             if not match:
@@ -2791,14 +2905,15 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=residential source:maxspeed=NL:rural"
                 err.append({'class': 90207, 'subclass': 1217260303, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[maxspeed:type="NL:zone30"][maxspeed][maxspeed!=30][highway]
-        # way[maxspeed:type="NL:zone60"][maxspeed][maxspeed!=60][highway]
-        # way[maxspeed:type="NL:urban"][maxspeed][maxspeed!=50][highway][highway!=cycleway]
-        # way[maxspeed:type="NL:rural"][maxspeed][maxspeed!=80][highway][highway!=cycleway]
-        # way[source:maxspeed="NL:zone30"][maxspeed][maxspeed!=30][highway]
-        # way[source:maxspeed="NL:zone60"][maxspeed][maxspeed!=60][highway]
-        # way[source:maxspeed="NL:urban"][maxspeed][maxspeed!=50][highway][highway!=cycleway]
-        # way[source:maxspeed="NL:rural"][maxspeed][maxspeed!=80][highway][highway!=cycleway]
+    # way[maxspeed:type="NL:zone30"][maxspeed][maxspeed!=30][highway]
+    # way[maxspeed:type="NL:zone60"][maxspeed][maxspeed!=60][highway]
+    # way[maxspeed:type="NL:urban"][maxspeed][maxspeed!=50][highway][highway!=cycleway]
+    # way[maxspeed:type="NL:rural"][maxspeed][maxspeed!=80][highway][highway!=cycleway]
+    # way[source:maxspeed="NL:zone30"][maxspeed][maxspeed!=30][highway]
+    # way[source:maxspeed="NL:zone60"][maxspeed][maxspeed!=60][highway]
+    # way[source:maxspeed="NL:urban"][maxspeed][maxspeed!=50][highway][highway!=cycleway]
+    # way[source:maxspeed="NL:rural"][maxspeed][maxspeed!=80][highway][highway!=cycleway]
+    def _way_rule_63(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'maxspeed' in keys and 'maxspeed:type' in keys) or ('highway' in keys and 'maxspeed' in keys and 'source:maxspeed' in keys):
             match = False
             if not match:
@@ -2841,13 +2956,14 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertMatch:"way highway=primary source:maxspeed=NL:zone60 maxspeed=50"
                 err.append({'class': 90207, 'subclass': 1487727138, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[maxspeed:type][!maxspeed][maxspeed:type^="NL:zone"][!maxspeed:both_ways][maxspeed:type!~/^NL:zone[36]0$/][highway]
-        # way[traffic_sign][!maxspeed][traffic_sign=~/(^|; ?)NL:A0?1-/][!/^maxspeed(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:forward][!maxspeed:forward][traffic_sign:forward=~/(^|; ?)NL:A0?1-/][!/^maxspeed(:forward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:backward][!maxspeed:backward][traffic_sign:backward=~/(^|; ?)NL:A0?1-/][!/^maxspeed(:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign][!maxspeed:advisory][traffic_sign=~/(^|; ?)NL:A0?4\b/][!/^maxspeed:advisory(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:forward][!maxspeed:advisory:forward][traffic_sign:forward=~/(^|; ?)NL:A0?4\b/][!/^maxspeed:advisory(:forward|:both_ways)?(:conditional)?$/][highway]
-        # way[traffic_sign:backward][!maxspeed:advisory:backward][traffic_sign:backward=~/(^|; ?)NL:A0?4\b/][!/^maxspeed:advisory(:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[maxspeed:type][!maxspeed][maxspeed:type^="NL:zone"][!maxspeed:both_ways][maxspeed:type!~/^NL:zone[36]0$/][highway]
+    # way[traffic_sign][!maxspeed][traffic_sign=~/(^|; ?)NL:A0?1-/][!/^maxspeed(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:forward][!maxspeed:forward][traffic_sign:forward=~/(^|; ?)NL:A0?1-/][!/^maxspeed(:forward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:backward][!maxspeed:backward][traffic_sign:backward=~/(^|; ?)NL:A0?1-/][!/^maxspeed(:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign][!maxspeed:advisory][traffic_sign=~/(^|; ?)NL:A0?4\b/][!/^maxspeed:advisory(:forward|:backward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:forward][!maxspeed:advisory:forward][traffic_sign:forward=~/(^|; ?)NL:A0?4\b/][!/^maxspeed:advisory(:forward|:both_ways)?(:conditional)?$/][highway]
+    # way[traffic_sign:backward][!maxspeed:advisory:backward][traffic_sign:backward=~/(^|; ?)NL:A0?4\b/][!/^maxspeed:advisory(:backward|:both_ways)?(:conditional)?$/][highway]
+    def _way_rule_64(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'maxspeed:type' in keys) or ('highway' in keys and 'traffic_sign' in keys) or ('highway' in keys and 'traffic_sign:backward' in keys) or ('highway' in keys and 'traffic_sign:forward' in keys):
             match = False
             if not match:
@@ -2895,7 +3011,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertMatch:"way highway=residential traffic_sign=NL:A4"
                 err.append({'class': 90207, 'subclass': 1250414020, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[highway=motorway][maxspeed][maxspeed=~/^1[23]0$/][maxspeed:conditional=~/100.+19:00/][inside("NL")]
+    # way[highway=motorway][maxspeed][maxspeed=~/^1[23]0$/][maxspeed:conditional=~/100.+19:00/][inside("NL")]
+    def _way_rule_65(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'maxspeed' in keys and 'maxspeed:conditional' in keys):
             match = False
             if not match:
@@ -2907,13 +3024,14 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("Agreed upon was to use 100 as the maximum speed and {0} as the conditional maximum speed","{1.value}")
                 err.append({'class': 90207, 'subclass': 640790005, 'text': mapcss.tr('Agreed upon was to use 100 as the maximum speed and {0} as the conditional maximum speed', mapcss._tag_uncapture(capture_tags, '{1.value}'))})
 
-        # way[highway=motorway][maxspeed][maxspeed>130][inside("NL")]
-        # way[highway=motorway_link][maxspeed][maxspeed>130][inside("NL")]
-        # way[highway=trunk][maxspeed][maxspeed>100][inside("NL")]
-        # way[highway=trunk_link][maxspeed][maxspeed>100][inside("NL")]
-        # way[motorroad=yes][maxspeed][maxspeed>100][inside("NL")][highway!~/^(motorway(_link)?|construction|proposed)$/]
-        # way[highway][maxspeed][maxspeed>80][highway!~/^(motorway(_link)?|trunk(_link)?|cycleway|service|busway|construction|proposed|raceway)$/][motorroad!=yes][inside("NL")]
-        # way[highway=cycleway][maxspeed][maxspeed>40][!/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][inside("NL")]
+    # way[highway=motorway][maxspeed][maxspeed>130][inside("NL")]
+    # way[highway=motorway_link][maxspeed][maxspeed>130][inside("NL")]
+    # way[highway=trunk][maxspeed][maxspeed>100][inside("NL")]
+    # way[highway=trunk_link][maxspeed][maxspeed>100][inside("NL")]
+    # way[motorroad=yes][maxspeed][maxspeed>100][inside("NL")][highway!~/^(motorway(_link)?|construction|proposed)$/]
+    # way[highway][maxspeed][maxspeed>80][highway!~/^(motorway(_link)?|trunk(_link)?|cycleway|service|busway|construction|proposed|raceway)$/][motorroad!=yes][inside("NL")]
+    # way[highway=cycleway][maxspeed][maxspeed>40][!/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][inside("NL")]
+    def _way_rule_66(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'maxspeed' in keys) or ('maxspeed' in keys and 'motorroad' in keys):
             match = False
             if not match:
@@ -2957,11 +3075,12 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=unclassified maxspeed=80"
                 err.append({'class': 90207, 'subclass': 2041800782, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[maxspeed:mofa][maxspeed:mofa>25][inside("NL")]
-        # way[maxspeed:moped][maxspeed:moped>45][inside("NL")]
-        # way[maxspeed:bus][maxspeed:bus>100][inside("NL")]
-        # way[maxspeed:trailer][maxspeed:trailer>90][inside("NL")]
-        # way[maxspeed:hgv][maxspeed:hgv>80][inside("NL")]
+    # way[maxspeed:mofa][maxspeed:mofa>25][inside("NL")]
+    # way[maxspeed:moped][maxspeed:moped>45][inside("NL")]
+    # way[maxspeed:bus][maxspeed:bus>100][inside("NL")]
+    # way[maxspeed:trailer][maxspeed:trailer>90][inside("NL")]
+    # way[maxspeed:hgv][maxspeed:hgv>80][inside("NL")]
+    def _way_rule_67(self, data, tags, nds, keys, err, sets):
         if ('maxspeed:bus' in keys) or ('maxspeed:hgv' in keys) or ('maxspeed:mofa' in keys) or ('maxspeed:moped' in keys) or ('maxspeed:trailer' in keys):
             match = False
             if not match:
@@ -2990,8 +3109,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=unclassified maxspeed:moped=45"
                 err.append({'class': 90207, 'subclass': 790150725, 'text': mapcss.tr('{0} overschrijdt de maximumsnelheid van RVV art. 22', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[highway=living_street][maxspeed][maxspeed>15][inside("NL")][maxspeed<=20]
-        # way[living_street=yes][maxspeed][maxspeed>15][highway!=living_street][inside("NL")]
+    # way[highway=living_street][maxspeed][maxspeed>15][inside("NL")][maxspeed<=20]
+    # way[living_street=yes][maxspeed][maxspeed>15][highway!=living_street][inside("NL")]
+    def _way_rule_68(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'maxspeed' in keys) or ('living_street' in keys and 'maxspeed' in keys):
             match = False
             if not match:
@@ -3008,9 +3128,10 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=living_street maxspeed=10 traffic_sign=\"NL:A01-10\""
                 err.append({'class': 90207, 'subclass': 1145458059, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[maxspeed][maxspeed=~/[1-9]$/][maxspeed!=5][maxspeed!=15][highway=~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/][!access][!vehicle][!motor_vehicle][inside("NL")]
-        # way[maxspeed=20][highway=~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/][!access][!vehicle][!motor_vehicle][source:maxspeed!="NL:zone20"][maxspeed:type!="NL:zone20"][inside("NL")]
-        # way[maxspeed=40][highway=~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/][!access][!vehicle][!motor_vehicle][source:maxspeed!="NL:zone40"][maxspeed:type!="NL:zone40"][inside("NL")]
+    # way[maxspeed][maxspeed=~/[1-9]$/][maxspeed!=5][maxspeed!=15][highway=~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/][!access][!vehicle][!motor_vehicle][inside("NL")]
+    # way[maxspeed=20][highway=~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/][!access][!vehicle][!motor_vehicle][source:maxspeed!="NL:zone20"][maxspeed:type!="NL:zone20"][inside("NL")]
+    # way[maxspeed=40][highway=~/^(residential|unclassified|tertiary|secondary|primary|trunk|motorway|busway)(_link)?$/][!access][!vehicle][!motor_vehicle][source:maxspeed!="NL:zone40"][maxspeed:type!="NL:zone40"][inside("NL")]
+    def _way_rule_69(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'maxspeed' in keys):
             match = False
             if not match:
@@ -3033,11 +3154,12 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way highway=unclassified access=permissive note=eigen_weg maxspeed=25"
                 err.append({'class': 90207, 'subclass': 293871183, 'text': mapcss.tr('{0} is a non-standard speed limit. Possibly this is an advisory speed limit instead?', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[bicycle:conditional][moped:conditional][bicycle:conditional=*"moped:conditional"][!mofa:conditional][inside("NL")]
-        # way[bicycle:forward][moped:forward][bicycle:forward=*"moped:forward"][!mofa:forward][!mofa][!mofa:both_ways][bicycle:forward!=designated][bicycle:forward!=yes][inside("NL")]
-        # way[bicycle:backward][moped:backward][bicycle:backward=*"moped:backward"][!mofa:backward][!mofa][!mofa:both_ways][bicycle:backward!=designated][bicycle:backward!=yes][inside("NL")]
-        # way[bicycle:both_ways][moped:both_ways][bicycle:both_ways=*"moped:both_ways"][!mofa:both_ways][!mofa][bicycle:both_ways!=designated][bicycle:both_ways!=yes][inside("NL")]
-        # way[bicycle][moped][bicycle=*moped][!mofa][bicycle!=designated][bicycle!=yes][inside("NL")]
+    # way[bicycle:conditional][moped:conditional][bicycle:conditional=*"moped:conditional"][!mofa:conditional][inside("NL")]
+    # way[bicycle:forward][moped:forward][bicycle:forward=*"moped:forward"][!mofa:forward][!mofa][!mofa:both_ways][bicycle:forward!=designated][bicycle:forward!=yes][inside("NL")]
+    # way[bicycle:backward][moped:backward][bicycle:backward=*"moped:backward"][!mofa:backward][!mofa][!mofa:both_ways][bicycle:backward!=designated][bicycle:backward!=yes][inside("NL")]
+    # way[bicycle:both_ways][moped:both_ways][bicycle:both_ways=*"moped:both_ways"][!mofa:both_ways][!mofa][bicycle:both_ways!=designated][bicycle:both_ways!=yes][inside("NL")]
+    # way[bicycle][moped][bicycle=*moped][!mofa][bicycle!=designated][bicycle!=yes][inside("NL")]
+    def _way_rule_70(self, data, tags, nds, keys, err, sets):
         if ('bicycle' in keys and 'moped' in keys) or ('bicycle:backward' in keys and 'moped:backward' in keys) or ('bicycle:both_ways' in keys and 'moped:both_ways' in keys) or ('bicycle:conditional' in keys and 'moped:conditional' in keys) or ('bicycle:forward' in keys and 'moped:forward' in keys):
             match = False
             if not match:
@@ -3069,9 +3191,10 @@ class Josm_DutchSpecific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{3.key}={0.value}')).split('=', 1)])
                 }})
 
-        # way[bicycle:forward][moped:forward][bicycle:forward=*"moped:forward"][!mofa:forward][/^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$/][!mofa][!mofa:both_ways][bicycle:forward=~/^(yes|designated)$/][join_list(";",uniq_list(tag_regex("^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$")))!=tag("bicycle:forward")][inside("NL")]
-        # way[bicycle:backward][moped:backward][bicycle:backward=*"moped:backward"][!mofa:backward][/^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$/][!mofa][!mofa:both_ways][bicycle:backward=~/^(yes|designated)$/][join_list(";",uniq_list(tag_regex("^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$")))!=tag("bicycle:backward")][inside("NL")]
-        # way[bicycle][moped][bicycle=*moped][!mofa][/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][!mofa:both_ways][bicycle=~/^(yes|designated)$/][join_list(";",uniq_list(tag_regex("^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$")))!=tag("bicycle")][inside("NL")]
+    # way[bicycle:forward][moped:forward][bicycle:forward=*"moped:forward"][!mofa:forward][/^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$/][!mofa][!mofa:both_ways][bicycle:forward=~/^(yes|designated)$/][join_list(";",uniq_list(tag_regex("^(access|vehicle|motor_vehicle)(:forward|:both_ways)?(:conditional)?$")))!=tag("bicycle:forward")][inside("NL")]
+    # way[bicycle:backward][moped:backward][bicycle:backward=*"moped:backward"][!mofa:backward][/^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$/][!mofa][!mofa:both_ways][bicycle:backward=~/^(yes|designated)$/][join_list(";",uniq_list(tag_regex("^(access|vehicle|motor_vehicle)(:backward|:both_ways)?(:conditional)?$")))!=tag("bicycle:backward")][inside("NL")]
+    # way[bicycle][moped][bicycle=*moped][!mofa][/^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$/][!mofa:both_ways][bicycle=~/^(yes|designated)$/][join_list(";",uniq_list(tag_regex("^(access|vehicle|motor_vehicle)(:forward|:backward|:both_ways)?(:conditional)?$")))!=tag("bicycle")][inside("NL")]
+    def _way_rule_71(self, data, tags, nds, keys, err, sets):
         if ('bicycle' in keys and 'moped' in keys) or ('bicycle:backward' in keys and 'moped:backward' in keys) or ('bicycle:forward' in keys and 'moped:forward' in keys):
             match = False
             if not match:
@@ -3094,43 +3217,44 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way bicycle=designated moped=designated highway=residential access=designated"
                 # assertNoMatch:"way bicycle=designated moped=designated highway=residential"
                 # assertNoMatch:"way bicycle=designated moped=designated mofa=designated highway=residential access=no"
-                set_hasAddMofaPositive = True
+                sets.add('hasAddMofaPositive')
                 err.append({'class': 90208, 'subclass': 2061019359, 'text': mapcss.tr('{0}, {1} and {2} without {3}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{4.tag}'), mapcss._tag_uncapture(capture_tags, '{3.key}={0.value}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss._tag_uncapture(capture_tags, '{3.key}={0.value}')).split('=', 1)])
                 }})
 
-        # way[bicycle:forward][moped:forward][bicycle:forward=*"moped:forward"][!mofa:forward][!mofa][!mofa:both_ways][bicycle:forward=~/^(yes|designated)$/][highway=~/^(trunk|motorway|busway|path|busway|bridleway|footway|pedestrian)(_link)?$/][inside("NL")]!.hasAddMofaPositive
-        # way[bicycle:backward][moped:backward][bicycle:backward=*"moped:backward"][!mofa:backward][!mofa][!mofa:both_ways][bicycle:backward=~/^(yes|designated)$/][highway=~/^(trunk|motorway|busway|path|busway|bridleway|footway|pedestrian)(_link)?$/][inside("NL")]!.hasAddMofaPositive
-        # way[bicycle][moped][bicycle=*moped][!mofa][!mofa:both_ways][bicycle=~/^(yes|designated)$/][highway=~/^(trunk|motorway|busway|path|busway|bridleway|footway|pedestrian)(_link)?$/][inside("NL")]!.hasAddMofaPositive
-        # way[bicycle:forward][moped:forward][bicycle:forward=*"moped:forward"][!mofa:forward][!mofa][!mofa:both_ways][bicycle:forward=~/^(yes|designated)$/][!highway][inside("NL")]!.hasAddMofaPositive
-        # way[bicycle:backward][moped:backward][bicycle:backward=*"moped:backward"][!mofa:backward][!mofa][!mofa:both_ways][bicycle:backward=~/^(yes|designated)$/][!highway][inside("NL")]!.hasAddMofaPositive
-        # way[bicycle][moped][bicycle=*moped][!mofa][!mofa:both_ways][bicycle=~/^(yes|designated)$/][!highway][inside("NL")]!.hasAddMofaPositive
+    # way[bicycle:forward][moped:forward][bicycle:forward=*"moped:forward"][!mofa:forward][!mofa][!mofa:both_ways][bicycle:forward=~/^(yes|designated)$/][highway=~/^(trunk|motorway|busway|path|busway|bridleway|footway|pedestrian)(_link)?$/][inside("NL")]!.hasAddMofaPositive
+    # way[bicycle:backward][moped:backward][bicycle:backward=*"moped:backward"][!mofa:backward][!mofa][!mofa:both_ways][bicycle:backward=~/^(yes|designated)$/][highway=~/^(trunk|motorway|busway|path|busway|bridleway|footway|pedestrian)(_link)?$/][inside("NL")]!.hasAddMofaPositive
+    # way[bicycle][moped][bicycle=*moped][!mofa][!mofa:both_ways][bicycle=~/^(yes|designated)$/][highway=~/^(trunk|motorway|busway|path|busway|bridleway|footway|pedestrian)(_link)?$/][inside("NL")]!.hasAddMofaPositive
+    # way[bicycle:forward][moped:forward][bicycle:forward=*"moped:forward"][!mofa:forward][!mofa][!mofa:both_ways][bicycle:forward=~/^(yes|designated)$/][!highway][inside("NL")]!.hasAddMofaPositive
+    # way[bicycle:backward][moped:backward][bicycle:backward=*"moped:backward"][!mofa:backward][!mofa][!mofa:both_ways][bicycle:backward=~/^(yes|designated)$/][!highway][inside("NL")]!.hasAddMofaPositive
+    # way[bicycle][moped][bicycle=*moped][!mofa][!mofa:both_ways][bicycle=~/^(yes|designated)$/][!highway][inside("NL")]!.hasAddMofaPositive
+    def _way_rule_72(self, data, tags, nds, keys, err, sets):
         if ('bicycle' in keys and 'highway' in keys and 'moped' in keys) or ('bicycle' in keys and 'moped' in keys) or ('bicycle:backward' in keys and 'highway' in keys and 'moped:backward' in keys) or ('bicycle:backward' in keys and 'moped:backward' in keys) or ('bicycle:forward' in keys and 'highway' in keys and 'moped:forward' in keys) or ('bicycle:forward' in keys and 'moped:forward' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasAddMofaPositive) and (mapcss._tag_capture(capture_tags, 0, tags, 'bicycle:forward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'moped:forward')) and (mapcss._tag_capture(capture_tags, 2, tags, 'bicycle:forward') == mapcss._value_capture(capture_tags, 2, mapcss.tag(tags, 'moped:forward'))) and (not mapcss._tag_capture(capture_tags, 3, tags, 'mofa:forward')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'mofa')) and (not mapcss._tag_capture(capture_tags, 5, tags, 'mofa:both_ways')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 6, self.re_47aaa0f7), mapcss._tag_capture(capture_tags, 6, tags, 'bicycle:forward'))) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 7, self.re_6460cbf8), mapcss._tag_capture(capture_tags, 7, tags, 'highway'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('hasAddMofaPositive' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'bicycle:forward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'moped:forward')) and (mapcss._tag_capture(capture_tags, 2, tags, 'bicycle:forward') == mapcss._value_capture(capture_tags, 2, mapcss.tag(tags, 'moped:forward'))) and (not mapcss._tag_capture(capture_tags, 3, tags, 'mofa:forward')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'mofa')) and (not mapcss._tag_capture(capture_tags, 5, tags, 'mofa:both_ways')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 6, self.re_47aaa0f7), mapcss._tag_capture(capture_tags, 6, tags, 'bicycle:forward'))) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 7, self.re_6460cbf8), mapcss._tag_capture(capture_tags, 7, tags, 'highway'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasAddMofaPositive) and (mapcss._tag_capture(capture_tags, 0, tags, 'bicycle:backward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'moped:backward')) and (mapcss._tag_capture(capture_tags, 2, tags, 'bicycle:backward') == mapcss._value_capture(capture_tags, 2, mapcss.tag(tags, 'moped:backward'))) and (not mapcss._tag_capture(capture_tags, 3, tags, 'mofa:backward')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'mofa')) and (not mapcss._tag_capture(capture_tags, 5, tags, 'mofa:both_ways')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 6, self.re_47aaa0f7), mapcss._tag_capture(capture_tags, 6, tags, 'bicycle:backward'))) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 7, self.re_6460cbf8), mapcss._tag_capture(capture_tags, 7, tags, 'highway'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('hasAddMofaPositive' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'bicycle:backward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'moped:backward')) and (mapcss._tag_capture(capture_tags, 2, tags, 'bicycle:backward') == mapcss._value_capture(capture_tags, 2, mapcss.tag(tags, 'moped:backward'))) and (not mapcss._tag_capture(capture_tags, 3, tags, 'mofa:backward')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'mofa')) and (not mapcss._tag_capture(capture_tags, 5, tags, 'mofa:both_ways')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 6, self.re_47aaa0f7), mapcss._tag_capture(capture_tags, 6, tags, 'bicycle:backward'))) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 7, self.re_6460cbf8), mapcss._tag_capture(capture_tags, 7, tags, 'highway'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasAddMofaPositive) and (mapcss._tag_capture(capture_tags, 0, tags, 'bicycle')) and (mapcss._tag_capture(capture_tags, 1, tags, 'moped')) and (mapcss._tag_capture(capture_tags, 2, tags, 'bicycle') == mapcss._value_capture(capture_tags, 2, mapcss.tag(tags, 'moped'))) and (not mapcss._tag_capture(capture_tags, 3, tags, 'mofa')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'mofa:both_ways')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 5, self.re_47aaa0f7), mapcss._tag_capture(capture_tags, 5, tags, 'bicycle'))) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 6, self.re_6460cbf8), mapcss._tag_capture(capture_tags, 6, tags, 'highway'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('hasAddMofaPositive' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'bicycle')) and (mapcss._tag_capture(capture_tags, 1, tags, 'moped')) and (mapcss._tag_capture(capture_tags, 2, tags, 'bicycle') == mapcss._value_capture(capture_tags, 2, mapcss.tag(tags, 'moped'))) and (not mapcss._tag_capture(capture_tags, 3, tags, 'mofa')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'mofa:both_ways')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 5, self.re_47aaa0f7), mapcss._tag_capture(capture_tags, 5, tags, 'bicycle'))) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 6, self.re_6460cbf8), mapcss._tag_capture(capture_tags, 6, tags, 'highway'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasAddMofaPositive) and (mapcss._tag_capture(capture_tags, 0, tags, 'bicycle:forward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'moped:forward')) and (mapcss._tag_capture(capture_tags, 2, tags, 'bicycle:forward') == mapcss._value_capture(capture_tags, 2, mapcss.tag(tags, 'moped:forward'))) and (not mapcss._tag_capture(capture_tags, 3, tags, 'mofa:forward')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'mofa')) and (not mapcss._tag_capture(capture_tags, 5, tags, 'mofa:both_ways')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 6, self.re_47aaa0f7), mapcss._tag_capture(capture_tags, 6, tags, 'bicycle:forward'))) and (not mapcss._tag_capture(capture_tags, 7, tags, 'highway')) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('hasAddMofaPositive' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'bicycle:forward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'moped:forward')) and (mapcss._tag_capture(capture_tags, 2, tags, 'bicycle:forward') == mapcss._value_capture(capture_tags, 2, mapcss.tag(tags, 'moped:forward'))) and (not mapcss._tag_capture(capture_tags, 3, tags, 'mofa:forward')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'mofa')) and (not mapcss._tag_capture(capture_tags, 5, tags, 'mofa:both_ways')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 6, self.re_47aaa0f7), mapcss._tag_capture(capture_tags, 6, tags, 'bicycle:forward'))) and (not mapcss._tag_capture(capture_tags, 7, tags, 'highway')) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasAddMofaPositive) and (mapcss._tag_capture(capture_tags, 0, tags, 'bicycle:backward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'moped:backward')) and (mapcss._tag_capture(capture_tags, 2, tags, 'bicycle:backward') == mapcss._value_capture(capture_tags, 2, mapcss.tag(tags, 'moped:backward'))) and (not mapcss._tag_capture(capture_tags, 3, tags, 'mofa:backward')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'mofa')) and (not mapcss._tag_capture(capture_tags, 5, tags, 'mofa:both_ways')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 6, self.re_47aaa0f7), mapcss._tag_capture(capture_tags, 6, tags, 'bicycle:backward'))) and (not mapcss._tag_capture(capture_tags, 7, tags, 'highway')) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('hasAddMofaPositive' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'bicycle:backward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'moped:backward')) and (mapcss._tag_capture(capture_tags, 2, tags, 'bicycle:backward') == mapcss._value_capture(capture_tags, 2, mapcss.tag(tags, 'moped:backward'))) and (not mapcss._tag_capture(capture_tags, 3, tags, 'mofa:backward')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'mofa')) and (not mapcss._tag_capture(capture_tags, 5, tags, 'mofa:both_ways')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 6, self.re_47aaa0f7), mapcss._tag_capture(capture_tags, 6, tags, 'bicycle:backward'))) and (not mapcss._tag_capture(capture_tags, 7, tags, 'highway')) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_hasAddMofaPositive) and (mapcss._tag_capture(capture_tags, 0, tags, 'bicycle')) and (mapcss._tag_capture(capture_tags, 1, tags, 'moped')) and (mapcss._tag_capture(capture_tags, 2, tags, 'bicycle') == mapcss._value_capture(capture_tags, 2, mapcss.tag(tags, 'moped'))) and (not mapcss._tag_capture(capture_tags, 3, tags, 'mofa')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'mofa:both_ways')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 5, self.re_47aaa0f7), mapcss._tag_capture(capture_tags, 5, tags, 'bicycle'))) and (not mapcss._tag_capture(capture_tags, 6, tags, 'highway')) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('hasAddMofaPositive' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'bicycle')) and (mapcss._tag_capture(capture_tags, 1, tags, 'moped')) and (mapcss._tag_capture(capture_tags, 2, tags, 'bicycle') == mapcss._value_capture(capture_tags, 2, mapcss.tag(tags, 'moped'))) and (not mapcss._tag_capture(capture_tags, 3, tags, 'mofa')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'mofa:both_ways')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 5, self.re_47aaa0f7), mapcss._tag_capture(capture_tags, 5, tags, 'bicycle'))) and (not mapcss._tag_capture(capture_tags, 6, tags, 'highway')) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .hasAddMofaPositive
@@ -3140,24 +3264,101 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"way bicycle=designated moped=designated highway=residential"
                 # assertNoMatch:"way bicycle=designated moped=designated mofa=designated highway=busway"
                 # assertNoMatch:"way bicycle=designated moped=destination highway=busway"
-                set_hasAddMofaPositive = True
+                sets.add('hasAddMofaPositive')
                 err.append({'class': 90208, 'subclass': 1443086133, 'text': mapcss.tr('{0} and {1} without {2}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{3.key}={0.value}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss._tag_uncapture(capture_tags, '{3.key}={0.value}')).split('=', 1)])
                 }})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['highway']),
+        (_way_rule_1, ['highway']),
+        (_way_rule_2, ['highway']),
+        (_way_rule_3, ['highway']),
+        (_way_rule_4, ['highway']),
+        (_way_rule_5, ['bus', 'hgv', 'highway']),
+        (_way_rule_6, ['highway']),
+        (_way_rule_7, ['highway']),
+        (_way_rule_8, ['highway']),
+        (_way_rule_9, ['highway']),
+        (_way_rule_10, ['highway']),
+        (_way_rule_11, ['highway']),
+        (_way_rule_12, ['highway']),
+        (_way_rule_13, ['highway']),
+        (_way_rule_14, ['highway']),
+        (_way_rule_15, ['highway']),
+        (_way_rule_16, ['highway']),
+        (_way_rule_17, ['highway']),
+        (_way_rule_18, ['highway']),
+        (_way_rule_19, ['highway']),
+        (_way_rule_20, ['highway']),
+        (_way_rule_21, ['highway']),
+        (_way_rule_22, ['highway']),
+        (_way_rule_23, ['highway']),
+        (_way_rule_24, ['contact:mobile', 'contact:phone', 'contact:whatsapp', 'phone']),
+        (_way_rule_25, ['contact:mobile', 'contact:phone', 'phone']),
+        (_way_rule_26, ['contact:mobile', 'contact:phone', 'contact:whatsapp', 'phone']),
+        (_way_rule_27, ['building']),
+        (_way_rule_28, None),
+        (_way_rule_29, ['cycleway:surface', 'footway:surface']),
+        (_way_rule_30, ['cycleway:surface', 'footway:surface']),
+        (_way_rule_31, ['cycleway:surface', 'footway:surface']),
+        (_way_rule_32, ['cycleway:surface']),
+        (_way_rule_33, None),
+        (_way_rule_34, ['cycleway', 'highway']),
+        (_way_rule_35, ['sidewalk']),
+        (_way_rule_36, ['postal_code']),
+        (_way_rule_37, ['building']),
+        (_way_rule_38, ['addr:interpolation']),
+        (_way_rule_39, ['is_in', 'is_in:city', 'is_in:continent', 'is_in:country', 'is_in:country_code', 'is_in:province']),
+        (_way_rule_40, ['railway']),
+        (_way_rule_41, ['addr:housename', 'building:name']),
+        (_way_rule_42, ['addr:housename', 'building:name']),
+        (_way_rule_43, ['addr:housename', 'building:name']),
+        (_way_rule_44, None),
+        (_way_rule_45, ['bicycle_road']),
+        (_way_rule_46, ['material', 'surface']),
+        (_way_rule_47, ['surface']),
+        (_way_rule_48, None),
+        (_way_rule_49, None),
+        (_way_rule_50, ['winkelnummer']),
+        (_way_rule_51, ['highway']),
+        (_way_rule_52, ['ref:bag']),
+        (_way_rule_53, ['leisure']),
+        (_way_rule_54, ['amenity', 'highway', 'leisure', 'name']),
+        (_way_rule_55, ['name']),
+        (_way_rule_56, ['highway']),
+        (_way_rule_57, ['name']),
+        (_way_rule_58, ['name']),
+        (_way_rule_59, ['name:fy', 'name:nl']),
+        (_way_rule_60, ['heritage']),
+        (_way_rule_61, ['heritage:operator']),
+        (_way_rule_62, ['highway', 'living_street']),
+        (_way_rule_63, ['highway']),
+        (_way_rule_64, ['highway']),
+        (_way_rule_65, ['highway']),
+        (_way_rule_66, ['highway', 'maxspeed']),
+        (_way_rule_67, ['maxspeed:bus', 'maxspeed:hgv', 'maxspeed:mofa', 'maxspeed:moped', 'maxspeed:trailer']),
+        (_way_rule_68, ['highway', 'living_street']),
+        (_way_rule_69, ['highway']),
+        (_way_rule_70, ['bicycle', 'bicycle:backward', 'bicycle:both_ways', 'bicycle:conditional', 'bicycle:forward']),
+        (_way_rule_71, ['bicycle', 'bicycle:backward', 'bicycle:forward']),
+        (_way_rule_72, ['bicycle', 'bicycle:backward', 'bicycle:forward']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
-        set_abbrname = set_addrOnBuilding = set_altLivingStreet = set_badPhoneNumber = set_completedSurfacePavingStonesNumber = set_hasAddMofaPositive = set_housenameWithFix = set_markedSteps = set_multipleGsigns = set_stepsWithBicycleRamp = False
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-        # *[contact:phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
-        # *[contact:mobile=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
-        # *[contact:whatsapp=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
-        # *[phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[contact:phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[contact:mobile=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[contact:whatsapp=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    # *[phone=~/^(00|\+)31 ?0( ?[0-9]){7,}/]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('contact:mobile' in keys) or ('contact:phone' in keys) or ('contact:whatsapp' in keys) or ('phone' in keys):
             match = False
             if not match:
@@ -3180,12 +3381,13 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # set .badPhoneNumber
                 # group:tr("NL addresses and contacts")
                 # throwWarning:tr("Invalid tag {0}: country code should not be followed by a 0","{0.key}")
-                set_badPhoneNumber = True
+                sets.add('badPhoneNumber')
                 err.append({'class': 90201, 'subclass': 1739574763, 'text': mapcss.tr('Invalid tag {0}: country code should not be followed by a 0', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[contact:phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
-        # *[contact:mobile=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
-        # *[phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    # *[contact:phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    # *[contact:mobile=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    # *[phone=~/^(\+|00)31 ?0?( ?[0-9]){3,6}$/]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('contact:mobile' in keys) or ('contact:phone' in keys) or ('phone' in keys):
             match = False
             if not match:
@@ -3204,37 +3406,39 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # set .badPhoneNumber
                 # group:tr("NL addresses and contacts")
                 # throwWarning:tr("Invalid tag {0}: short phone numbers cannot be used with international prefix (or: wrong phone number length)","{0.key}")
-                set_badPhoneNumber = True
+                sets.add('badPhoneNumber')
                 err.append({'class': 90201, 'subclass': 345342642, 'text': mapcss.tr('Invalid tag {0}: short phone numbers cannot be used with international prefix (or: wrong phone number length)', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[contact:phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
-        # *[contact:mobile=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
-        # *[contact:whatsapp=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
-        # *[phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[contact:phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[contact:mobile=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[contact:whatsapp=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    # *[phone=~/^(0031|\+31|0) ?[1-9]( ?[0-9]){11}/][inside("NL")]!.badPhoneNumber
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('contact:mobile' in keys) or ('contact:phone' in keys) or ('contact:whatsapp' in keys) or ('phone' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_badPhoneNumber) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:phone'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('badPhoneNumber' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:phone'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_badPhoneNumber) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:mobile'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('badPhoneNumber' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:mobile'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_badPhoneNumber) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:whatsapp'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('badPhoneNumber' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'contact:whatsapp'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_badPhoneNumber) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'phone'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('badPhoneNumber' not in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 0, self.re_7c3d18b2), mapcss._tag_capture(capture_tags, 0, tags, 'phone'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("NL addresses and contacts")
                 # throwWarning:tr("Invalid tag {0}: too many digits (or foreign number, if so: ignore)","{0.key}")
                 err.append({'class': 90201, 'subclass': 50270752, 'text': mapcss.tr('Invalid tag {0}: too many digits (or foreign number, if so: ignore)', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # area[building][/^addr:(street|housenumber|postcode|city)$/][amenity!=place_of_worship][shop!=mall][building!~/^(container|houseboat|static_caravan)$/][inside("NL")]:closed
+    # area[building][/^addr:(street|housenumber|postcode|city)$/][amenity!=place_of_worship][shop!=mall][building!~/^(container|houseboat|static_caravan)$/][inside("NL")]:closed
+    def _relation_rule_3(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'type' in keys):
             match = False
             if not match:
@@ -3248,30 +3452,32 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"relation type=multipolygon building=house"
                 # assertNoMatch:"relation type=multipolygon building=houseboat addr:housenumber=2"
                 # assertNoMatch:"relation type=multipolygon building=yes addr:housename=huis"
-                set_addrOnBuilding = True
+                sets.add('addrOnBuilding')
                 err.append({'class': 90201, 'subclass': 1486034706, 'text': mapcss.tr('In Nederland is het gebouw niet gekoppeld aan het adres. Het adres is wel gekoppeld aan het gebruiksdoel.')})
 
-        # area[/^addr:(city|postcode)$/][!/(^|.+:)addr:housenumber($|:.+)/][!/(^|.+:)addr:street($|:.+)/][inside("NL")]!.addrOnBuilding
-        # area[addr:street][!/(^|.+:)addr:housenumber($|:.+)/][!addr:interpolation][!addr:flats][inside("NL")]!.addrOnBuilding
+    # area[/^addr:(city|postcode)$/][!/(^|.+:)addr:housenumber($|:.+)/][!/(^|.+:)addr:street($|:.+)/][inside("NL")]!.addrOnBuilding
+    # area[addr:street][!/(^|.+:)addr:housenumber($|:.+)/][!addr:interpolation][!addr:flats][inside("NL")]!.addrOnBuilding
+    def _relation_rule_4(self, data, tags, members, keys, err, sets):
         if ('addr:street' in keys and 'type' in keys) or ('type' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_addrOnBuilding) and (mapcss._tag_capture(capture_tags, 0, tags, self.re_561be3ff)) and (not mapcss._tag_capture(capture_tags, 1, tags, self.re_49026388)) and (not mapcss._tag_capture(capture_tags, 2, tags, self.re_32d334cf)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, -1, tags, 'type') == mapcss._value_capture(capture_tags, -1, 'multipolygon')))
+                try: match = (('addrOnBuilding' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, self.re_561be3ff)) and (not mapcss._tag_capture(capture_tags, 1, tags, self.re_49026388)) and (not mapcss._tag_capture(capture_tags, 2, tags, self.re_32d334cf)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, -1, tags, 'type') == mapcss._value_capture(capture_tags, -1, 'multipolygon')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_addrOnBuilding) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:street')) and (not mapcss._tag_capture(capture_tags, 1, tags, self.re_49026388)) and (not mapcss._tag_capture(capture_tags, 2, tags, 'addr:interpolation')) and (not mapcss._tag_capture(capture_tags, 3, tags, 'addr:flats')) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, -1, tags, 'type') == mapcss._value_capture(capture_tags, -1, 'multipolygon')))
+                try: match = (('addrOnBuilding' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:street')) and (not mapcss._tag_capture(capture_tags, 1, tags, self.re_49026388)) and (not mapcss._tag_capture(capture_tags, 2, tags, 'addr:interpolation')) and (not mapcss._tag_capture(capture_tags, 3, tags, 'addr:flats')) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, -1, tags, 'type') == mapcss._value_capture(capture_tags, -1, 'multipolygon')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("NL addresses and contacts")
                 # throwWarning:tr("Incomplete address: {0} {1} {2} {3}",any(tag("addr:street"),"[street?]"),any(tag("addr:housenumber"),"[housenumber?]"),any(tag("addr:postcode"),""),any(tag("addr:city"),""))
                 err.append({'class': 90201, 'subclass': 2087285475, 'text': mapcss.tr('Incomplete address: {0} {1} {2} {3}', mapcss.any_(mapcss.tag(tags, 'addr:street'), '[street?]'), mapcss.any_(mapcss.tag(tags, 'addr:housenumber'), '[housenumber?]'), mapcss.any_(mapcss.tag(tags, 'addr:postcode'), ''), mapcss.any_(mapcss.tag(tags, 'addr:city'), ''))})
 
-        # area["addr:postcode"]["addr:postcode"!~/[0-9]{4} ?[A-Z]{2}/][inside("NL")]!.addrOnBuilding
-        # Rule Blacklisted (id: 1411893821)
+    # area["addr:postcode"]["addr:postcode"!~/[0-9]{4} ?[A-Z]{2}/][inside("NL")]!.addrOnBuilding
+    # Rule Blacklisted (id: 1411893821)
 
-        # relation[type=associatedStreet][inside("NL")]
+    # relation[type=associatedStreet][inside("NL")]
+    def _relation_rule_5(self, data, tags, members, keys, err, sets):
         if ('type' in keys):
             match = False
             if not match:
@@ -3285,7 +3491,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"type=street"
                 err.append({'class': 90202, 'subclass': 1207029826, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # area[building=terrace][inside("NL")]
+    # area[building=terrace][inside("NL")]
+    def _relation_rule_6(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'type' in keys):
             match = False
             if not match:
@@ -3300,7 +3507,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"building=house via een BAG importverzoek voor huizen"
                 err.append({'class': 90202, 'subclass': 2130098421, 'text': mapcss.tr('Een rij met rijtjeshuizen ({0}) wordt in Nederland per huis geïmporteerd uit de BAG', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[addr:interpolation][inside("NL")]
+    # *[addr:interpolation][inside("NL")]
+    def _relation_rule_7(self, data, tags, members, keys, err, sets):
         if ('addr:interpolation' in keys):
             match = False
             if not match:
@@ -3313,12 +3521,13 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"meerdere addr:housenumber via een BAG importverzoek"
                 err.append({'class': 90202, 'subclass': 864819394, 'text': mapcss.tr('Adressen ({0}) worden in Nederland individueel geïmporteerd uit de BAG', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[is_in=NL]
-        # *[is_in:country][inside("NL")]
-        # *[is_in:city][inside("NL")]
-        # *[is_in:province][inside("NL")]
-        # *[is_in:continent][inside("NL")]
-        # *[is_in:country_code=NL]
+    # *[is_in=NL]
+    # *[is_in:country][inside("NL")]
+    # *[is_in:city][inside("NL")]
+    # *[is_in:province][inside("NL")]
+    # *[is_in:continent][inside("NL")]
+    # *[is_in:country_code=NL]
+    def _relation_rule_8(self, data, tags, members, keys, err, sets):
         if ('is_in' in keys) or ('is_in:city' in keys) or ('is_in:continent' in keys) or ('is_in:country' in keys) or ('is_in:country_code' in keys) or ('is_in:province' in keys):
             match = False
             if not match:
@@ -3354,8 +3563,9 @@ class Josm_DutchSpecific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # area[addr:housename][/^building(:part)?$/][inside("NL")][!name]
-        # area[building:name][/^building(:part)?$/][inside("NL")][!name]
+    # area[addr:housename][/^building(:part)?$/][inside("NL")][!name]
+    # area[building:name][/^building(:part)?$/][inside("NL")][!name]
+    def _relation_rule_9(self, data, tags, members, keys, err, sets):
         if ('addr:housename' in keys and 'type' in keys) or ('building:name' in keys and 'type' in keys):
             match = False
             if not match:
@@ -3372,7 +3582,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.key}")
                 # suggestAlternative:"name=*"
                 # fixChangeKey:"{0.key}=>name"
-                set_housenameWithFix = True
+                sets.add('housenameWithFix')
                 err.append({'class': 90202, 'subclass': 797359946, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     [(mapcss._tag_uncapture(capture_tags, '{0.key}=>name')).split('=>', 1)[1].strip(), mapcss.tag(tags, (mapcss._tag_uncapture(capture_tags, '{0.key}=>name')).split('=>', 1)[0].strip())]]),
@@ -3380,17 +3590,18 @@ class Josm_DutchSpecific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=>name')).split('=>', 1)[0].strip()])
                 }})
 
-        # area[addr:housename][/^building(:part)?$/][inside("NL")][name=*"addr:housename"]!.housenameWithFix
-        # area[building:name][/^building(:part)?$/][inside("NL")][name=*"building:name"]!.housenameWithFix
+    # area[addr:housename][/^building(:part)?$/][inside("NL")][name=*"addr:housename"]!.housenameWithFix
+    # area[building:name][/^building(:part)?$/][inside("NL")][name=*"building:name"]!.housenameWithFix
+    def _relation_rule_10(self, data, tags, members, keys, err, sets):
         if ('addr:housename' in keys and 'name' in keys and 'type' in keys) or ('building:name' in keys and 'name' in keys and 'type' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_housenameWithFix) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:housename')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name') == mapcss._value_capture(capture_tags, 3, mapcss.tag(tags, 'addr:housename'))) and (mapcss._tag_capture(capture_tags, -1, tags, 'type') == mapcss._value_capture(capture_tags, -1, 'multipolygon')))
+                try: match = (('housenameWithFix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:housename')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name') == mapcss._value_capture(capture_tags, 3, mapcss.tag(tags, 'addr:housename'))) and (mapcss._tag_capture(capture_tags, -1, tags, 'type') == mapcss._value_capture(capture_tags, -1, 'multipolygon')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_housenameWithFix) and (mapcss._tag_capture(capture_tags, 0, tags, 'building:name')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name') == mapcss._value_capture(capture_tags, 3, mapcss.tag(tags, 'building:name'))) and (mapcss._tag_capture(capture_tags, -1, tags, 'type') == mapcss._value_capture(capture_tags, -1, 'multipolygon')))
+                try: match = (('housenameWithFix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'building:name')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name') == mapcss._value_capture(capture_tags, 3, mapcss.tag(tags, 'building:name'))) and (mapcss._tag_capture(capture_tags, -1, tags, 'type') == mapcss._value_capture(capture_tags, -1, 'multipolygon')))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .housenameWithFix
@@ -3398,23 +3609,24 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.key}")
                 # suggestAlternative:"name=*"
                 # fixRemove:"{0.key}"
-                set_housenameWithFix = True
+                sets.add('housenameWithFix')
                 err.append({'class': 90202, 'subclass': 464057822, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '-': ([
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # area[addr:housename][/^building(:part)?$/][inside("NL")][name]!.housenameWithFix
-        # area[building:name][/^building(:part)?$/][inside("NL")][name]!.housenameWithFix
+    # area[addr:housename][/^building(:part)?$/][inside("NL")][name]!.housenameWithFix
+    # area[building:name][/^building(:part)?$/][inside("NL")][name]!.housenameWithFix
+    def _relation_rule_11(self, data, tags, members, keys, err, sets):
         if ('addr:housename' in keys and 'name' in keys and 'type' in keys) or ('building:name' in keys and 'name' in keys and 'type' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_housenameWithFix) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:housename')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name')) and (mapcss._tag_capture(capture_tags, -1, tags, 'type') == mapcss._value_capture(capture_tags, -1, 'multipolygon')))
+                try: match = (('housenameWithFix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:housename')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name')) and (mapcss._tag_capture(capture_tags, -1, tags, 'type') == mapcss._value_capture(capture_tags, -1, 'multipolygon')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_housenameWithFix) and (mapcss._tag_capture(capture_tags, 0, tags, 'building:name')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name')) and (mapcss._tag_capture(capture_tags, -1, tags, 'type') == mapcss._value_capture(capture_tags, -1, 'multipolygon')))
+                try: match = (('housenameWithFix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'building:name')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_550ffc74)) and (mapcss.inside(self.father.config.options, 'NL')) and (mapcss._tag_capture(capture_tags, 3, tags, 'name')) and (mapcss._tag_capture(capture_tags, -1, tags, 'type') == mapcss._value_capture(capture_tags, -1, 'multipolygon')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("NL deprecated features")
@@ -3422,7 +3634,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"name=*"
                 err.append({'class': 90202, 'subclass': 1635606421, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[/.:covid19$/][inside("NL")]
+    # *[/.:covid19$/][inside("NL")]
+    def _relation_rule_12(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -3438,7 +3651,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[material][material=~/\bhout|\bmetaal\b|^beton$|^brons$|steen\b|ijzer\b|staal\b/]
+    # *[material][material=~/\bhout|\bmetaal\b|^beton$|^brons$|steen\b|ijzer\b|staal\b/]
+    def _relation_rule_13(self, data, tags, members, keys, err, sets):
         if ('material' in keys):
             match = False
             if not match:
@@ -3450,7 +3664,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("unusual value of {0}","{0.key}")
                 err.append({'class': 90202, 'subclass': 1686750599, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[surface][surface=~/^paving_stones:([1-9])0$/][inside("NL")]
+    # *[surface][surface=~/^paving_stones:([1-9])0$/][inside("NL")]
+    def _relation_rule_14(self, data, tags, members, keys, err, sets):
         if ('surface' in keys):
             match = False
             if not match:
@@ -3471,7 +3686,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     ['surface','paving_stones']])
                 }})
 
-        # *[/^(.+):surface$/][/^(.+):surface$/=~/^paving_stones:([1-9])0$/][count(tag_regex("^(.+):surface$"))==1][inside("NL")]
+    # *[/^(.+):surface$/][/^(.+):surface$/=~/^paving_stones:([1-9])0$/][count(tag_regex("^(.+):surface$"))==1][inside("NL")]
+    def _relation_rule_15(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -3486,7 +3702,7 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # fixAdd:concat(get(regexp_match("^(.+):surface$","{0.key}"),1),":paving_stones:length=0.",get(regexp_match("^paving_stones:([1-9])0$",get(tag_regex("^(.+):surface$"),0)),1))
                 # fixAdd:concat(get(regexp_match("^(.+):surface$","{0.key}"),1),":paving_stones:shape=square")
                 # fixAdd:"{0.key}=paving_stones"
-                set_completedSurfacePavingStonesNumber = True
+                sets.add('completedSurfacePavingStonesNumber')
                 err.append({'class': 90202, 'subclass': 1911834456, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat(mapcss.get(mapcss.regexp_match(self.re_74d9b833, mapcss._tag_uncapture(capture_tags, '{0.key}')), 1), ':paving_stones:length=0.', mapcss.get(mapcss.regexp_match(self.re_19b1af6a, mapcss.get(mapcss.tag_regex(tags, self.re_74d9b833), 0)), 1))).split('=', 1),
@@ -3494,12 +3710,13 @@ class Josm_DutchSpecific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=paving_stones')).split('=', 1)])
                 }})
 
-        # *[/^(.+):surface$/=~/^paving_stones:([1-9])0$/][inside("NL")]!.completedSurfacePavingStonesNumber
+    # *[/^(.+):surface$/=~/^paving_stones:([1-9])0$/][inside("NL")]!.completedSurfacePavingStonesNumber
+    def _relation_rule_16(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_completedSurfacePavingStonesNumber) and (mapcss.regexp_test(self.re_19b1af6a, mapcss._match_regex(tags, self.re_74d9b833))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('completedSurfacePavingStonesNumber' not in sets) and (mapcss.regexp_test(self.re_19b1af6a, mapcss._match_regex(tags, self.re_74d9b833))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("NL deprecated features")
@@ -3507,7 +3724,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"*:surface=paving_stones + *:paving_stones:shape=square + *:paving_stones:length=[length in meter, e.g. 0.3]"
                 err.append({'class': 90202, 'subclass': 1665978272, 'text': mapcss.tr('{0} is deprecated', '*:surface=paving_stones:NN')})
 
-        # *[winkelnummer]
+    # *[winkelnummer]
+    def _relation_rule_17(self, data, tags, members, keys, err, sets):
         if ('winkelnummer' in keys):
             match = False
             if not match:
@@ -3520,7 +3738,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"ref=*"
                 err.append({'class': 90202, 'subclass': 340349535, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[ref:bag][ref:bag!~/(; ?|^)([0-9]{0,3}[1-9]|[0-9]{0,2}[1-9][0-9]|[0-9]?[1-9][0-9]{2})[0-9]{12}($|;)/][inside("NL")]
+    # *[ref:bag][ref:bag!~/(; ?|^)([0-9]{0,3}[1-9]|[0-9]{0,2}[1-9][0-9]|[0-9]?[1-9][0-9]{2})[0-9]{12}($|;)/][inside("NL")]
+    def _relation_rule_18(self, data, tags, members, keys, err, sets):
         if ('ref:bag' in keys):
             match = False
             if not match:
@@ -3544,7 +3763,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # assertNoMatch:"relation type=multipolygon ref:bag=50123456789012"
                 err.append({'class': 90209, 'subclass': 2021092431, 'text': mapcss.tr('Invalid value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[leisure][surface=gravel][sport~="tennis"][inside("NL")]
+    # *[leisure][surface=gravel][sport~="tennis"][inside("NL")]
+    def _relation_rule_19(self, data, tags, members, keys, err, sets):
         if ('leisure' in keys and 'sport' in keys and 'surface' in keys):
             match = False
             if not match:
@@ -3557,16 +3777,17 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"surface=clay"
                 err.append({'class': 90209, 'subclass': 1521090750, 'text': mapcss.tr('unusual value of {0} for {1} (`gravel` in English means `grind` in Dutch)', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # *[name][name="ijsbaan"]
-        # *[name][name=~/\b(([Aa]f)?gesloten|[Gg]eopend)\b/]
-        # *[name][amenity^=parking][name=~/(?i)(parkeren|parkeerplaats|parkeergarage|^garage)$/]
-        # *[name][name=~/(?i)^gratis\s|gratis\)/]
-        # *[name][name=~/(?i)(klanten|bezoek(ers)?|medewerkers)\b/][!route]
-        # *[name][leisure=playground][name=~/(?i)^speeltuin(tje)?$/]
-        # *[name][leisure^=dog][name=~/(?i)^(honden\s?)?(toilet|uitlaa[dt]|los.?loop)/]
-        # *[name][leisure=pitch][name=~/(?i)ball?(veld(je)?)?$/][!sport]
-        # area[name][name=~/(?i)^wadi$/][tag("natural")||tag("landuse")]
-        # area[name][natural=water][name=visvijver]
+    # *[name][name="ijsbaan"]
+    # *[name][name=~/\b(([Aa]f)?gesloten|[Gg]eopend)\b/]
+    # *[name][amenity^=parking][name=~/(?i)(parkeren|parkeerplaats|parkeergarage|^garage)$/]
+    # *[name][name=~/(?i)^gratis\s|gratis\)/]
+    # *[name][name=~/(?i)(klanten|bezoek(ers)?|medewerkers)\b/][!route]
+    # *[name][leisure=playground][name=~/(?i)^speeltuin(tje)?$/]
+    # *[name][leisure^=dog][name=~/(?i)^(honden\s?)?(toilet|uitlaa[dt]|los.?loop)/]
+    # *[name][leisure=pitch][name=~/(?i)ball?(veld(je)?)?$/][!sport]
+    # area[name][name=~/(?i)^wadi$/][tag("natural")||tag("landuse")]
+    # area[name][natural=water][name=visvijver]
+    def _relation_rule_20(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'name' in keys) or ('leisure' in keys and 'name' in keys) or ('name' in keys) or ('name' in keys and 'natural' in keys and 'type' in keys) or ('name' in keys and 'type' in keys):
             match = False
             if not match:
@@ -3614,7 +3835,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # throwWarning:tr("descriptive name")
                 err.append({'class': 90203, 'subclass': 147135230, 'text': mapcss.tr('descriptive name')})
 
-        # *[name][name=~/(?i)(voormalige?)/][!historic][tourism!=information][!landuse][!highway][!boundary][!waterway]
+    # *[name][name=~/(?i)(voormalige?)/][!historic][tourism!=information][!landuse][!highway][!boundary][!waterway]
+    def _relation_rule_21(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -3629,47 +3851,50 @@ class Josm_DutchSpecific(PluginMapCSS):
                 # suggestAlternative:"old_name=*"
                 err.append({'class': 90203, 'subclass': 538711457, 'text': mapcss.tr('descriptive name')})
 
-        # *[name][place][name=~/\b(Adm|Br|Burg|Cmdt|Dr|Drs|Ds|Fam|Gebr|Gen|Ing|Ir|Jhr|Kard|Kon|Luit|Mej|Mevr|Mgr|Min|Mr|Past|Pr|Pres|Prof|St|Vr|Weth|Zr)\.? [A-Za-z]/][inside("NL")]!.abbrname
-        # *[name][place][name=~/^[A-Z][a-z]{1,4}\. /][name!~/^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\./][inside("NL")]!.abbrname
+    # *[name][place][name=~/\b(Adm|Br|Burg|Cmdt|Dr|Drs|Ds|Fam|Gebr|Gen|Ing|Ir|Jhr|Kard|Kon|Luit|Mej|Mevr|Mgr|Min|Mr|Past|Pr|Pres|Prof|St|Vr|Weth|Zr)\.? [A-Za-z]/][inside("NL")]!.abbrname
+    # *[name][place][name=~/^[A-Z][a-z]{1,4}\. /][name!~/^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\./][inside("NL")]!.abbrname
+    def _relation_rule_22(self, data, tags, members, keys, err, sets):
         if ('name' in keys and 'place' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_abbrname) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'place')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_1a749120), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('abbrname' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'place')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_1a749120), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_abbrname) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'place')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_293c2706), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 3, self.re_2f938f56, '^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\\.'), mapcss._tag_capture(capture_tags, 3, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('abbrname' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'name')) and (mapcss._tag_capture(capture_tags, 1, tags, 'place')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_293c2706), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 3, self.re_2f938f56, '^(Adr|Anth?|Chr?|Corn|Fred|Hub|Jacq?|Joh|Jos|Mac|Nic|Ph|Th)\\.'), mapcss._tag_capture(capture_tags, 3, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .abbrname
                 # group:tr("NL nomenclature")
                 # throwWarning:tr("Gebiedsnaam met afkorting")
-                set_abbrname = True
+                sets.add('abbrname')
                 err.append({'class': 90203, 'subclass': 1079482384, 'text': mapcss.tr('Gebiedsnaam met afkorting')})
 
-        # *[railway][name][name=~/(?i)(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\./][inside("NL")]!.abbrname
-        # *[railway][name][name=~/(?i)\b(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\b/][inside("NL")]!.abbrname
+    # *[railway][name][name=~/(?i)(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\./][inside("NL")]!.abbrname
+    # *[railway][name][name=~/(?i)\b(aansl|empl|goed|ind|inhaalsp|opstel|overloopw|racc|rang|terr)\b/][inside("NL")]!.abbrname
+    def _relation_rule_23(self, data, tags, members, keys, err, sets):
         if ('name' in keys and 'railway' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_abbrname) and (mapcss._tag_capture(capture_tags, 0, tags, 'railway')) and (mapcss._tag_capture(capture_tags, 1, tags, 'name')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_798edef1), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('abbrname' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'railway')) and (mapcss._tag_capture(capture_tags, 1, tags, 'name')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_798edef1), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_abbrname) and (mapcss._tag_capture(capture_tags, 0, tags, 'railway')) and (mapcss._tag_capture(capture_tags, 1, tags, 'name')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_2441139b), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
+                try: match = (('abbrname' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'railway')) and (mapcss._tag_capture(capture_tags, 1, tags, 'name')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_2441139b), mapcss._tag_capture(capture_tags, 2, tags, 'name'))) and (mapcss.inside(self.father.config.options, 'NL')))
                 except mapcss.RuleAbort: pass
             if match:
                 # set .abbrname
                 # group:tr("NL nomenclature")
                 # throwWarning:tr("Spoorgebied met afgekorte naam")
                 # suggestAlternative:"aansluiting, emplacement, goederen, industrieterrein, inhaalspoor, opstelterrein, overloopwissel, raccordement of rangeerterrein"
-                set_abbrname = True
+                sets.add('abbrname')
                 err.append({'class': 90203, 'subclass': 1558593366, 'text': mapcss.tr('Spoorgebied met afgekorte naam')})
 
-        # *[name:nl][!name][inside("NL")][type!=route][name:fy]["name:fy"=*"name:nl"]
-        # *[name:nl][!name][inside("NL")][type!=route][!name:fy]
+    # *[name:nl][!name][inside("NL")][type!=route][name:fy]["name:fy"=*"name:nl"]
+    # *[name:nl][!name][inside("NL")][type!=route][!name:fy]
+    def _relation_rule_24(self, data, tags, members, keys, err, sets):
         if ('name:fy' in keys and 'name:nl' in keys) or ('name:nl' in keys):
             match = False
             if not match:
@@ -3692,7 +3917,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=>{1.key}')).split('=>', 1)[0].strip()])
                 }})
 
-        # *[heritage=2][heritage:operator!=rce][heritage:operator!~/(^|; ?)rce(;|$)/][inside("NL")]
+    # *[heritage=2][heritage:operator!=rce][heritage:operator!~/(^|; ?)rce(;|$)/][inside("NL")]
+    def _relation_rule_25(self, data, tags, members, keys, err, sets):
         if ('heritage' in keys):
             match = False
             if not match:
@@ -3708,7 +3934,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     ['heritage:operator','rce']])
                 }})
 
-        # *[heritage:operator=rce][!heritage][inside("NL")]
+    # *[heritage:operator=rce][!heritage][inside("NL")]
+    def _relation_rule_26(self, data, tags, members, keys, err, sets):
         if ('heritage:operator' in keys):
             match = False
             if not match:
@@ -3724,7 +3951,8 @@ class Josm_DutchSpecific(PluginMapCSS):
                     ['heritage','2']])
                 }})
 
-        # relation[except][except~=bicycle][except~=moped][except!~/(^|; ?)mofa(;|$)/]
+    # relation[except][except~=bicycle][except~=moped][except!~/(^|; ?)mofa(;|$)/]
+    def _relation_rule_27(self, data, tags, members, keys, err, sets):
         if ('except' in keys):
             match = False
             if not match:
@@ -3743,6 +3971,43 @@ class Josm_DutchSpecific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}={0.value};mofa')).split('=', 1)])
                 }})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['contact:mobile', 'contact:phone', 'contact:whatsapp', 'phone']),
+        (_relation_rule_1, ['contact:mobile', 'contact:phone', 'phone']),
+        (_relation_rule_2, ['contact:mobile', 'contact:phone', 'contact:whatsapp', 'phone']),
+        (_relation_rule_3, ['building']),
+        (_relation_rule_4, ['addr:street', 'type']),
+        (_relation_rule_5, ['type']),
+        (_relation_rule_6, ['building']),
+        (_relation_rule_7, ['addr:interpolation']),
+        (_relation_rule_8, ['is_in', 'is_in:city', 'is_in:continent', 'is_in:country', 'is_in:country_code', 'is_in:province']),
+        (_relation_rule_9, ['addr:housename', 'building:name']),
+        (_relation_rule_10, ['addr:housename', 'building:name']),
+        (_relation_rule_11, ['addr:housename', 'building:name']),
+        (_relation_rule_12, None),
+        (_relation_rule_13, ['material']),
+        (_relation_rule_14, ['surface']),
+        (_relation_rule_15, None),
+        (_relation_rule_16, None),
+        (_relation_rule_17, ['winkelnummer']),
+        (_relation_rule_18, ['ref:bag']),
+        (_relation_rule_19, ['leisure']),
+        (_relation_rule_20, ['amenity', 'leisure', 'name']),
+        (_relation_rule_21, ['name']),
+        (_relation_rule_22, ['name']),
+        (_relation_rule_23, ['name']),
+        (_relation_rule_24, ['name:fy', 'name:nl']),
+        (_relation_rule_25, ['heritage']),
+        (_relation_rule_26, ['heritage:operator']),
+        (_relation_rule_27, ['except']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
@@ -63,13 +63,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
         self.re_7f8ed87f = re.compile(r'^([0-9]{14};)*[0-9]{14}$')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # *[name=~/(?i)co.?voiturage/][amenity][amenity!=car_pooling][!carpool][inside("FR")]
+    # *[name=~/(?i)co.?voiturage/][amenity][amenity!=car_pooling][!carpool][inside("FR")]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -89,7 +84,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                     ['carpool','designated']])
                 }})
 
-        # *[amenity=fuel]["fuel:octane_95"=yes][!"fuel:e10"][inside("FR")]
+    # *[amenity=fuel]["fuel:octane_95"=yes][!"fuel:e10"][inside("FR")]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'fuel:octane_95' in keys):
             match = False
             if not match:
@@ -103,7 +99,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # suggestAlternative:"fuel:e10=yes/no"
                 err.append({'class': 40612, 'subclass': 0, 'text': mapcss.tr('Does this station still sell SP95, or has it been replaced by the SP95-E10?')})
 
-        # *[operator=ERDF][inside("FR")]
+    # *[operator=ERDF][inside("FR")]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('operator' in keys):
             match = False
             if not match:
@@ -122,7 +119,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                     ['operator','Enedis']])
                 }})
 
-        # *["ref:ERDF:gdo"][inside("FR")]
+    # *["ref:ERDF:gdo"][inside("FR")]
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('ref:ERDF:gdo' in keys):
             match = False
             if not match:
@@ -143,7 +141,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                     'ref:ERDF:gdo'])
                 }})
 
-        # *["ref:FR:gdo"]["ref:FR:gdo"!~/[0-9AB]{5}[A-Z]{1,3}[0-9]{4}|[0-9AB]{5}EEM[0-9]{2}/][inside("FR")]
+    # *["ref:FR:gdo"]["ref:FR:gdo"!~/[0-9AB]{5}[A-Z]{1,3}[0-9]{4}|[0-9AB]{5}EEM[0-9]{2}/][inside("FR")]
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if ('ref:FR:gdo' in keys):
             match = False
             if not match:
@@ -156,8 +155,9 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is invalid","{0.tag}")
                 err.append({'class': 30406, 'subclass': 0, 'text': mapcss.tr('{0} is invalid', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[power=substation][!"ref:FR:gdo"][ref][operator=~/^(Enedis|GRDF)$/][inside("FR")]
-        # *[power=switch][!"ref:FR:gdo"][ref][operator=Enedis][inside("FR")]
+    # *[power=substation][!"ref:FR:gdo"][ref][operator=~/^(Enedis|GRDF)$/][inside("FR")]
+    # *[power=switch][!"ref:FR:gdo"][ref][operator=Enedis][inside("FR")]
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('operator' in keys and 'power' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -175,7 +175,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.tag}","{1.key}")
                 err.append({'class': 30402, 'subclass': 0, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # node[power=~/^(pole|tower)$/][!operator][inside("FR")]
+    # node[power=~/^(pole|tower)$/][!operator][inside("FR")]
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if ('power' in keys):
             match = False
             if not match:
@@ -187,11 +188,12 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.tag}","{1.key}")
                 err.append({'class': 9019003, 'subclass': 567532769, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *["ref:FR:ARCEP"][telecom!=connection_point]
-        # *["ref:FR:ARCEP"]["telecom:medium"!=fibre]
-        # *["ref:FR:Orange"]["telecom:medium"!=fibre]
-        # *["ref:FR:SFR"]["telecom:medium"!=fibre]
-        # *["ref:FR:PTT"]["telecom:medium"!=copper]
+    # *["ref:FR:ARCEP"][telecom!=connection_point]
+    # *["ref:FR:ARCEP"]["telecom:medium"!=fibre]
+    # *["ref:FR:Orange"]["telecom:medium"!=fibre]
+    # *["ref:FR:SFR"]["telecom:medium"!=fibre]
+    # *["ref:FR:PTT"]["telecom:medium"!=copper]
+    def _node_rule_7(self, data, tags, keys, err, sets):
         if ('ref:FR:ARCEP' in keys) or ('ref:FR:Orange' in keys) or ('ref:FR:PTT' in keys) or ('ref:FR:SFR' in keys):
             match = False
             if not match:
@@ -221,7 +223,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.key}","{1.tag}")
                 err.append({'class': 30403, 'subclass': 0, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *["ref:FR:Orange"]["ref:FR:Orange"!~/PT[1-9]{1}[0-9]*/][inside("FR")]
+    # *["ref:FR:Orange"]["ref:FR:Orange"!~/PT[1-9]{1}[0-9]*/][inside("FR")]
+    def _node_rule_8(self, data, tags, keys, err, sets):
         if ('ref:FR:Orange' in keys):
             match = False
             if not match:
@@ -234,7 +237,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is invalid. Should look like PT123 without leading zeros","{0.tag}")
                 err.append({'class': 30407, 'subclass': 0, 'text': mapcss.tr('{0} is invalid. Should look like PT123 without leading zeros', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *["ref:FR:Orange:NRO"]["ref:FR:Orange:NRO"!~/[0-9]{5}[A-Z0-9]{3}/][inside("FR")]
+    # *["ref:FR:Orange:NRO"]["ref:FR:Orange:NRO"!~/[0-9]{5}[A-Z0-9]{3}/][inside("FR")]
+    def _node_rule_9(self, data, tags, keys, err, sets):
         if ('ref:FR:Orange:NRO' in keys):
             match = False
             if not match:
@@ -247,7 +251,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is invalid. Should look like 12345ABC","{0.tag}")
                 err.append({'class': 30408, 'subclass': 0, 'text': mapcss.tr('{0} is invalid. Should look like 12345ABC', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *["ref:FR:PTT"]["ref:FR:PTT"!~/[A-Z0-9]{3}/][inside("FR")]
+    # *["ref:FR:PTT"]["ref:FR:PTT"!~/[A-Z0-9]{3}/][inside("FR")]
+    def _node_rule_10(self, data, tags, keys, err, sets):
         if ('ref:FR:PTT' in keys):
             match = False
             if not match:
@@ -260,7 +265,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is invalid. Should look like ABC","{0.tag}")
                 err.append({'class': 30409, 'subclass': 0, 'text': mapcss.tr('{0} is invalid. Should look like ABC', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *["ref:FR:PTT:NRA"]["ref:FR:PTT:NRA"!~/[0-9]{5}[A-Z0-9]{3}/][inside("FR")]
+    # *["ref:FR:PTT:NRA"]["ref:FR:PTT:NRA"!~/[0-9]{5}[A-Z0-9]{3}/][inside("FR")]
+    def _node_rule_11(self, data, tags, keys, err, sets):
         if ('ref:FR:PTT:NRA' in keys):
             match = False
             if not match:
@@ -273,7 +279,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is invalid. Should look like 12345ABC","{0.tag}")
                 err.append({'class': 30410, 'subclass': 0, 'text': mapcss.tr('{0} is invalid. Should look like 12345ABC', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[highway=milestone][operator][nat_ref][nat_ref!~/^((0[1-9]|1[0-9]|2[1-9]|[3-8][0-9]|9[0-5]|973|975|976)PR([0-9]|[1-9][0-9]|[1-9][0-9][0-9])[DGU](|C))$/][inside("FR")]
+    # node[highway=milestone][operator][nat_ref][nat_ref!~/^((0[1-9]|1[0-9]|2[1-9]|[3-8][0-9]|9[0-5]|973|975|976)PR([0-9]|[1-9][0-9]|[1-9][0-9][0-9])[DGU](|C))$/][inside("FR")]
+    def _node_rule_12(self, data, tags, keys, err, sets):
         if ('highway' in keys and 'nat_ref' in keys and 'operator' in keys):
             match = False
             if not match:
@@ -291,7 +298,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # -osmoseAssertMatchWithContext:list("node highway=milestone distance=38 nat_ref=974PR38DC operator=SANEF","inside=FR")
                 err.append({'class': 9019001, 'subclass': 2, 'text': mapcss.tr('{0} is not a milestone valid reference RIU', mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # node[highway=milestone][operator][nat_ref][!distance][inside("FR")]
+    # node[highway=milestone][operator][nat_ref][!distance][inside("FR")]
+    def _node_rule_13(self, data, tags, keys, err, sets):
         if ('highway' in keys and 'nat_ref' in keys and 'operator' in keys):
             match = False
             if not match:
@@ -307,7 +315,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # -osmoseAssertMatchWithContext:list("node highway=milestone nat_ref=77PR38DC operator=SANEF","inside=FR")
                 err.append({'class': 9019001, 'subclass': 1, 'text': mapcss.tr('missing distance')})
 
-        # node[highway=motorway_junction][ref=~/^\D/][inside("FR")]
+    # node[highway=motorway_junction][ref=~/^\D/][inside("FR")]
+    def _node_rule_14(self, data, tags, keys, err, sets):
         if ('highway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -324,7 +333,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                     'ref'])
                 }})
 
-        # *[amenity=kindergarten]["school:FR"=maternelle][inside("FR")]
+    # *[amenity=kindergarten]["school:FR"=maternelle][inside("FR")]
+    def _node_rule_15(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'school:FR' in keys):
             match = False
             if not match:
@@ -342,9 +352,10 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                     ['amenity','school']])
                 }})
 
-        # *["ref:FR:FANTOIR"]["ref:FR:FANTOIR"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
-        # *["ref:FR:FANTOIR:left"]["ref:FR:FANTOIR:left"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
-        # *["ref:FR:FANTOIR:right"]["ref:FR:FANTOIR:right"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
+    # *["ref:FR:FANTOIR"]["ref:FR:FANTOIR"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
+    # *["ref:FR:FANTOIR:left"]["ref:FR:FANTOIR:left"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
+    # *["ref:FR:FANTOIR:right"]["ref:FR:FANTOIR:right"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
+    def _node_rule_16(self, data, tags, keys, err, sets):
         if ('ref:FR:FANTOIR' in keys) or ('ref:FR:FANTOIR:left' in keys) or ('ref:FR:FANTOIR:right' in keys):
             match = False
             if not match:
@@ -366,7 +377,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:"format code ref:FR:FANTOIR"
                 err.append({'class': 9019005, 'subclass': 0, 'text': {'en': 'format code ref:FR:FANTOIR'}})
 
-        # *["ref:FR:SIREN"]["ref:FR:SIREN"!~/^([0-9]{9};)*[0-9]{9}$/][inside("FR")]
+    # *["ref:FR:SIREN"]["ref:FR:SIREN"!~/^([0-9]{9};)*[0-9]{9}$/][inside("FR")]
+    def _node_rule_17(self, data, tags, keys, err, sets):
         if ('ref:FR:SIREN' in keys):
             match = False
             if not match:
@@ -378,7 +390,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is not a valid SIREN number","{0.tag}")
                 err.append({'class': 9019006, 'subclass': 0, 'text': mapcss.tr('{0} is not a valid SIREN number', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *["ref:FR:SIRET"]["ref:FR:SIRET"!~/^([0-9]{14};)*[0-9]{14}$/][inside("FR")]
+    # *["ref:FR:SIRET"]["ref:FR:SIRET"!~/^([0-9]{14};)*[0-9]{14}$/][inside("FR")]
+    def _node_rule_18(self, data, tags, keys, err, sets):
         if ('ref:FR:SIRET' in keys):
             match = False
             if not match:
@@ -390,7 +403,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is not a valid SIRET number","{0.tag}")
                 err.append({'class': 9019007, 'subclass': 0, 'text': mapcss.tr('{0} is not a valid SIRET number', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *["ref:FR:NAF"]["ref:FR:NAF"!~/^([0-9]{2}\.[0-9]{2}[A-Z];)*[0-9]{2}\.[0-9]{2}[A-Z]$/][inside("FR")]
+    # *["ref:FR:NAF"]["ref:FR:NAF"!~/^([0-9]{2}\.[0-9]{2}[A-Z];)*[0-9]{2}\.[0-9]{2}[A-Z]$/][inside("FR")]
+    def _node_rule_19(self, data, tags, keys, err, sets):
         if ('ref:FR:NAF' in keys):
             match = False
             if not match:
@@ -401,15 +415,39 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is not a valid code NAF/APE value","{0.tag}")
                 err.append({'class': 9019008, 'subclass': 1955725258, 'text': mapcss.tr('{0} is not a valid code NAF/APE value', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['amenity']),
+        (_node_rule_1, ['amenity']),
+        (_node_rule_2, ['operator']),
+        (_node_rule_3, ['ref:ERDF:gdo']),
+        (_node_rule_4, ['ref:FR:gdo']),
+        (_node_rule_5, ['operator']),
+        (_node_rule_6, ['power']),
+        (_node_rule_7, ['ref:FR:ARCEP', 'ref:FR:Orange', 'ref:FR:PTT', 'ref:FR:SFR']),
+        (_node_rule_8, ['ref:FR:Orange']),
+        (_node_rule_9, ['ref:FR:Orange:NRO']),
+        (_node_rule_10, ['ref:FR:PTT']),
+        (_node_rule_11, ['ref:FR:PTT:NRA']),
+        (_node_rule_12, ['highway']),
+        (_node_rule_13, ['highway']),
+        (_node_rule_14, ['highway']),
+        (_node_rule_15, ['amenity']),
+        (_node_rule_16, ['ref:FR:FANTOIR', 'ref:FR:FANTOIR:left', 'ref:FR:FANTOIR:right']),
+        (_node_rule_17, ['ref:FR:SIREN']),
+        (_node_rule_18, ['ref:FR:SIRET']),
+        (_node_rule_19, ['ref:FR:NAF']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # way[railway=rail][!gauge][inside("FR")]
+    # way[railway=rail][!gauge][inside("FR")]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys):
             match = False
             if not match:
@@ -426,7 +464,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # -osmoseAssertMatchWithContext:list("way railway=rail","inside=FR")
                 err.append({'class': 21600, 'subclass': 0, 'text': mapcss.tr('Missing tag gauge on rail')})
 
-        # *[name=~/(?i)co.?voiturage/][amenity][amenity!=car_pooling][!carpool][inside("FR")]
+    # *[name=~/(?i)co.?voiturage/][amenity][amenity!=car_pooling][!carpool][inside("FR")]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -449,7 +488,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                     ['carpool','designated']])
                 }})
 
-        # *[amenity=fuel]["fuel:octane_95"=yes][!"fuel:e10"][inside("FR")]
+    # *[amenity=fuel]["fuel:octane_95"=yes][!"fuel:e10"][inside("FR")]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'fuel:octane_95' in keys):
             match = False
             if not match:
@@ -463,7 +503,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # suggestAlternative:"fuel:e10=yes/no"
                 err.append({'class': 40612, 'subclass': 0, 'text': mapcss.tr('Does this station still sell SP95, or has it been replaced by the SP95-E10?')})
 
-        # *[operator=ERDF][inside("FR")]
+    # *[operator=ERDF][inside("FR")]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('operator' in keys):
             match = False
             if not match:
@@ -482,7 +523,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                     ['operator','Enedis']])
                 }})
 
-        # *["ref:ERDF:gdo"][inside("FR")]
+    # *["ref:ERDF:gdo"][inside("FR")]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('ref:ERDF:gdo' in keys):
             match = False
             if not match:
@@ -503,7 +545,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                     'ref:ERDF:gdo'])
                 }})
 
-        # *["ref:FR:gdo"]["ref:FR:gdo"!~/[0-9AB]{5}[A-Z]{1,3}[0-9]{4}|[0-9AB]{5}EEM[0-9]{2}/][inside("FR")]
+    # *["ref:FR:gdo"]["ref:FR:gdo"!~/[0-9AB]{5}[A-Z]{1,3}[0-9]{4}|[0-9AB]{5}EEM[0-9]{2}/][inside("FR")]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('ref:FR:gdo' in keys):
             match = False
             if not match:
@@ -516,8 +559,9 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is invalid","{0.tag}")
                 err.append({'class': 30406, 'subclass': 0, 'text': mapcss.tr('{0} is invalid', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[power=substation][!"ref:FR:gdo"][ref][operator=~/^(Enedis|GRDF)$/][inside("FR")]
-        # *[power=switch][!"ref:FR:gdo"][ref][operator=Enedis][inside("FR")]
+    # *[power=substation][!"ref:FR:gdo"][ref][operator=~/^(Enedis|GRDF)$/][inside("FR")]
+    # *[power=switch][!"ref:FR:gdo"][ref][operator=Enedis][inside("FR")]
+    def _way_rule_6(self, data, tags, nds, keys, err, sets):
         if ('operator' in keys and 'power' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -535,11 +579,12 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.tag}","{1.key}")
                 err.append({'class': 30402, 'subclass': 0, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *["ref:FR:ARCEP"][telecom!=connection_point]
-        # *["ref:FR:ARCEP"]["telecom:medium"!=fibre]
-        # *["ref:FR:Orange"]["telecom:medium"!=fibre]
-        # *["ref:FR:SFR"]["telecom:medium"!=fibre]
-        # *["ref:FR:PTT"]["telecom:medium"!=copper]
+    # *["ref:FR:ARCEP"][telecom!=connection_point]
+    # *["ref:FR:ARCEP"]["telecom:medium"!=fibre]
+    # *["ref:FR:Orange"]["telecom:medium"!=fibre]
+    # *["ref:FR:SFR"]["telecom:medium"!=fibre]
+    # *["ref:FR:PTT"]["telecom:medium"!=copper]
+    def _way_rule_7(self, data, tags, nds, keys, err, sets):
         if ('ref:FR:ARCEP' in keys) or ('ref:FR:Orange' in keys) or ('ref:FR:PTT' in keys) or ('ref:FR:SFR' in keys):
             match = False
             if not match:
@@ -569,7 +614,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.key}","{1.tag}")
                 err.append({'class': 30403, 'subclass': 0, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *["ref:FR:Orange"]["ref:FR:Orange"!~/PT[1-9]{1}[0-9]*/][inside("FR")]
+    # *["ref:FR:Orange"]["ref:FR:Orange"!~/PT[1-9]{1}[0-9]*/][inside("FR")]
+    def _way_rule_8(self, data, tags, nds, keys, err, sets):
         if ('ref:FR:Orange' in keys):
             match = False
             if not match:
@@ -582,7 +628,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is invalid. Should look like PT123 without leading zeros","{0.tag}")
                 err.append({'class': 30407, 'subclass': 0, 'text': mapcss.tr('{0} is invalid. Should look like PT123 without leading zeros', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *["ref:FR:Orange:NRO"]["ref:FR:Orange:NRO"!~/[0-9]{5}[A-Z0-9]{3}/][inside("FR")]
+    # *["ref:FR:Orange:NRO"]["ref:FR:Orange:NRO"!~/[0-9]{5}[A-Z0-9]{3}/][inside("FR")]
+    def _way_rule_9(self, data, tags, nds, keys, err, sets):
         if ('ref:FR:Orange:NRO' in keys):
             match = False
             if not match:
@@ -595,7 +642,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is invalid. Should look like 12345ABC","{0.tag}")
                 err.append({'class': 30408, 'subclass': 0, 'text': mapcss.tr('{0} is invalid. Should look like 12345ABC', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *["ref:FR:PTT"]["ref:FR:PTT"!~/[A-Z0-9]{3}/][inside("FR")]
+    # *["ref:FR:PTT"]["ref:FR:PTT"!~/[A-Z0-9]{3}/][inside("FR")]
+    def _way_rule_10(self, data, tags, nds, keys, err, sets):
         if ('ref:FR:PTT' in keys):
             match = False
             if not match:
@@ -608,7 +656,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is invalid. Should look like ABC","{0.tag}")
                 err.append({'class': 30409, 'subclass': 0, 'text': mapcss.tr('{0} is invalid. Should look like ABC', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *["ref:FR:PTT:NRA"]["ref:FR:PTT:NRA"!~/[0-9]{5}[A-Z0-9]{3}/][inside("FR")]
+    # *["ref:FR:PTT:NRA"]["ref:FR:PTT:NRA"!~/[0-9]{5}[A-Z0-9]{3}/][inside("FR")]
+    def _way_rule_11(self, data, tags, nds, keys, err, sets):
         if ('ref:FR:PTT:NRA' in keys):
             match = False
             if not match:
@@ -621,8 +670,9 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is invalid. Should look like 12345ABC","{0.tag}")
                 err.append({'class': 30410, 'subclass': 0, 'text': mapcss.tr('{0} is invalid. Should look like 12345ABC', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[highway=~/^(motorway|trunk|primary|secondary|tertiary|unclassified)$/][nat_ref][operator][!junction][inside("FR")]
-        # way[highway=service][nat_ref][nat_ref!~/^^(0[1-9]|1[0-9]|2[1-9]|[3-8][0-9]|9[0-5]|973|975|976)[ANP](8|9)[0-9]{3}(|A|N)([0-9]?[0-9])(|[A-Z]|[a-z])(|CD)_(1[0-9]|[1-9])D$/][operator][!junction][inside("FR")]
+    # way[highway=~/^(motorway|trunk|primary|secondary|tertiary|unclassified)$/][nat_ref][operator][!junction][inside("FR")]
+    # way[highway=service][nat_ref][nat_ref!~/^^(0[1-9]|1[0-9]|2[1-9]|[3-8][0-9]|9[0-5]|973|975|976)[ANP](8|9)[0-9]{3}(|A|N)([0-9]?[0-9])(|[A-Z]|[a-z])(|CD)_(1[0-9]|[1-9])D$/][operator][!junction][inside("FR")]
+    def _way_rule_12(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'nat_ref' in keys and 'operator' in keys):
             match = False
             if not match:
@@ -644,8 +694,9 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # -osmoseAssertNoMatchWithContext:list("way highway=service nat_ref=50A802209_1D operator=DIRO","inside=FR")
                 err.append({'class': 9019002, 'subclass': 0, 'text': mapcss.tr('{0} must be a link road or roundabout', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[highway=~/^(motorway|trunk|primary|secondary|tertiary|unclassified|service)$/]["nat_ref:backward"][operator][inside("FR")]
-        # way[highway=~/^(motorway|trunk|primary|secondary|tertiary|unclassified|service)$/]["nat_ref:forward"][operator][inside("FR")]
+    # way[highway=~/^(motorway|trunk|primary|secondary|tertiary|unclassified|service)$/]["nat_ref:backward"][operator][inside("FR")]
+    # way[highway=~/^(motorway|trunk|primary|secondary|tertiary|unclassified|service)$/]["nat_ref:forward"][operator][inside("FR")]
+    def _way_rule_13(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'nat_ref:backward' in keys and 'operator' in keys) or ('highway' in keys and 'nat_ref:forward' in keys and 'operator' in keys):
             match = False
             if not match:
@@ -664,7 +715,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # -osmoseAssertNoMatchWithContext:list("way highway=motorway_link nat_ref:forward=62A902615CD_11D nat_ref:backward=62A902615CD_2D operator='SANEF'","inside=FR")
                 err.append({'class': 9019002, 'subclass': 0, 'text': mapcss.tr('{0} must be a link road ', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[highway=~/^(motorway_link|trunk_link|primary_link|secondary_link|tertiary_link)$/][nat_ref][nat_ref!~/^(0[1-9]|1[0-9]|2[1-9]|[3-8][0-9]|9[0-5]|973|975|976)[ANP](8|9)[0-9]{3}(|A|N)([0-9]?[0-9]|B1|B2)(|[A-Z]|[a-z])(|CD)_(1[0-9]|[1-9])D$/][operator!="Ville de Paris"][inside("FR")]
+    # way[highway=~/^(motorway_link|trunk_link|primary_link|secondary_link|tertiary_link)$/][nat_ref][nat_ref!~/^(0[1-9]|1[0-9]|2[1-9]|[3-8][0-9]|9[0-5]|973|975|976)[ANP](8|9)[0-9]{3}(|A|N)([0-9]?[0-9]|B1|B2)(|[A-Z]|[a-z])(|CD)_(1[0-9]|[1-9])D$/][operator!="Ville de Paris"][inside("FR")]
+    def _way_rule_14(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'nat_ref' in keys):
             match = False
             if not match:
@@ -682,7 +734,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # -osmoseAssertNoMatchWithContext:list("way highway=motorway_link nat_ref=80A901645CD_16D operator=SANEF","inside=FR")
                 err.append({'class': 9019002, 'subclass': 0, 'text': mapcss.tr('{0} is not a valid reference', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[junction=roundabout][highway=~/^(motorway|trunk|primary|secondary|tertiary|unclassified|service)$/][nat_ref][nat_ref!~/^(0[1-9]|1[0-9]|2[1-9]|[3-8][0-9]|9[0-5]|973|975|976)[ANP](8|9)[0-9]{3}(|A|N)([0-9]?[0-9]|B1|B2)(|[A-Z]|[a-z])(|CD)_(1[0-9]|[1-9])D$/][inside("FR")]
+    # way[junction=roundabout][highway=~/^(motorway|trunk|primary|secondary|tertiary|unclassified|service)$/][nat_ref][nat_ref!~/^(0[1-9]|1[0-9]|2[1-9]|[3-8][0-9]|9[0-5]|973|975|976)[ANP](8|9)[0-9]{3}(|A|N)([0-9]?[0-9]|B1|B2)(|[A-Z]|[a-z])(|CD)_(1[0-9]|[1-9])D$/][inside("FR")]
+    def _way_rule_15(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'junction' in keys and 'nat_ref' in keys):
             match = False
             if not match:
@@ -700,7 +753,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # -osmoseAssertNoMatchWithContext:list("way highway=service junction=roundabout nat_ref=80A801645_6D operator=DIRN","inside=FR")
                 err.append({'class': 9019002, 'subclass': 0, 'text': mapcss.tr('{0} is not a valid reference', mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # way[highway=~/^(motorway_link|trunk_link|primary_link|secondary_link|tertiary_link)$/][nat_ref][nat_ref!~/^(75Periph_Paris_[0-9]{2}_(1[0-9]|[1-9])D)$/][operator="Ville de Paris"][inside("FR")]
+    # way[highway=~/^(motorway_link|trunk_link|primary_link|secondary_link|tertiary_link)$/][nat_ref][nat_ref!~/^(75Periph_Paris_[0-9]{2}_(1[0-9]|[1-9])D)$/][operator="Ville de Paris"][inside("FR")]
+    def _way_rule_16(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'nat_ref' in keys and 'operator' in keys):
             match = False
             if not match:
@@ -716,8 +770,9 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # -osmoseAssertNoMatchWithContext:list("way highway=trunk_link nat_ref=75Periph_Paris_05_3D operator=\"Ville de Paris\"","inside=FR")
                 err.append({'class': 9019002, 'subclass': 0, 'text': mapcss.tr('{0} is not a valid reference (Paris)', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[highway=~/^(motorway_link|trunk_link|primary_link|secondary_link|tertiary_link)$/]["nat_ref:forward"]["nat_ref:forward"!~/^(0[1-9]|1[0-9]|2[1-9]|[3-8][0-9]|9[0-5]|973|975|976)[ANP](8|9)[0-9]{3}(|A|N)([0-9]?[0-9]|B1|B2)(|[A-Z]|[a-z])(|CD)_(1[0-9]|[1-9])D$/][inside("FR")]
-        # way[highway=~/^(motorway_link|trunk_link|primary_link|secondary_link|tertiary_link)$/]["nat_ref:backward"]["nat_ref:backward"!~/^(0[1-9]|1[0-9]|2[1-9]|[3-8][0-9]|9[0-5]|973|975|976)[ANP](8|9)[0-9]{3}(|A|N)([0-9]?[0-9]|B1|B2)(|[A-Z]|[a-z])(|CD)_(1[0-9]|[1-9])D$/][inside("FR")]
+    # way[highway=~/^(motorway_link|trunk_link|primary_link|secondary_link|tertiary_link)$/]["nat_ref:forward"]["nat_ref:forward"!~/^(0[1-9]|1[0-9]|2[1-9]|[3-8][0-9]|9[0-5]|973|975|976)[ANP](8|9)[0-9]{3}(|A|N)([0-9]?[0-9]|B1|B2)(|[A-Z]|[a-z])(|CD)_(1[0-9]|[1-9])D$/][inside("FR")]
+    # way[highway=~/^(motorway_link|trunk_link|primary_link|secondary_link|tertiary_link)$/]["nat_ref:backward"]["nat_ref:backward"!~/^(0[1-9]|1[0-9]|2[1-9]|[3-8][0-9]|9[0-5]|973|975|976)[ANP](8|9)[0-9]{3}(|A|N)([0-9]?[0-9]|B1|B2)(|[A-Z]|[a-z])(|CD)_(1[0-9]|[1-9])D$/][inside("FR")]
+    def _way_rule_17(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'nat_ref:backward' in keys) or ('highway' in keys and 'nat_ref:forward' in keys):
             match = False
             if not match:
@@ -738,7 +793,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # -osmoseAssertNoMatchWithContext:list("way highway=motorway_link nat_ref:forward=62A902615CD_1D nat_ref:backward=62A902615CD_2D operator=SANEF","inside=FR")
                 err.append({'class': 9019002, 'subclass': 0, 'text': mapcss.tr('{0} is not a valid reference', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[highway][highway=~/^(motorway_link|trunk_link|primary_link|secondary_link|tertiary_link)$/][nat_ref][!operator][inside("FR")]
+    # way[highway][highway=~/^(motorway_link|trunk_link|primary_link|secondary_link|tertiary_link)$/][nat_ref][!operator][inside("FR")]
+    def _way_rule_18(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'nat_ref' in keys):
             match = False
             if not match:
@@ -752,8 +808,9 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("Missing tag operator with nat_ref")
                 err.append({'class': 9019002, 'subclass': 0, 'text': mapcss.tr('Missing tag operator with nat_ref')})
 
-        # way[highway][highway=~/^(motorway_link|trunk_link|primary_link|secondary_link|tertiary_link)$/]["nat_ref:forward"][!operator][inside("FR")]
-        # way[highway][highway=~/^(motorway_link|trunk_link|primary_link|secondary_link|tertiary_link)$/]["nat_ref:backward"][!operator][inside("FR")]
+    # way[highway][highway=~/^(motorway_link|trunk_link|primary_link|secondary_link|tertiary_link)$/]["nat_ref:forward"][!operator][inside("FR")]
+    # way[highway][highway=~/^(motorway_link|trunk_link|primary_link|secondary_link|tertiary_link)$/]["nat_ref:backward"][!operator][inside("FR")]
+    def _way_rule_19(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'nat_ref:backward' in keys) or ('highway' in keys and 'nat_ref:forward' in keys):
             match = False
             if not match:
@@ -771,7 +828,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("Missing tag operator with nat_ref")
                 err.append({'class': 9019002, 'subclass': 0, 'text': mapcss.tr('Missing tag operator with nat_ref')})
 
-        # *[amenity=kindergarten]["school:FR"=maternelle][inside("FR")]
+    # *[amenity=kindergarten]["school:FR"=maternelle][inside("FR")]
+    def _way_rule_20(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'school:FR' in keys):
             match = False
             if not match:
@@ -789,9 +847,10 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                     ['amenity','school']])
                 }})
 
-        # *["ref:FR:FANTOIR"]["ref:FR:FANTOIR"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
-        # *["ref:FR:FANTOIR:left"]["ref:FR:FANTOIR:left"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
-        # *["ref:FR:FANTOIR:right"]["ref:FR:FANTOIR:right"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
+    # *["ref:FR:FANTOIR"]["ref:FR:FANTOIR"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
+    # *["ref:FR:FANTOIR:left"]["ref:FR:FANTOIR:left"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
+    # *["ref:FR:FANTOIR:right"]["ref:FR:FANTOIR:right"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
+    def _way_rule_21(self, data, tags, nds, keys, err, sets):
         if ('ref:FR:FANTOIR' in keys) or ('ref:FR:FANTOIR:left' in keys) or ('ref:FR:FANTOIR:right' in keys):
             match = False
             if not match:
@@ -820,7 +879,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # -osmoseAssertNoMatchWithContext:list("way highway=residential name=impasse ref:FR:FANTOIR=95106A581T","inside=FR")
                 err.append({'class': 9019005, 'subclass': 0, 'text': {'en': 'format code ref:FR:FANTOIR'}})
 
-        # *["ref:FR:SIREN"]["ref:FR:SIREN"!~/^([0-9]{9};)*[0-9]{9}$/][inside("FR")]
+    # *["ref:FR:SIREN"]["ref:FR:SIREN"!~/^([0-9]{9};)*[0-9]{9}$/][inside("FR")]
+    def _way_rule_22(self, data, tags, nds, keys, err, sets):
         if ('ref:FR:SIREN' in keys):
             match = False
             if not match:
@@ -832,7 +892,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is not a valid SIREN number","{0.tag}")
                 err.append({'class': 9019006, 'subclass': 0, 'text': mapcss.tr('{0} is not a valid SIREN number', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *["ref:FR:SIRET"]["ref:FR:SIRET"!~/^([0-9]{14};)*[0-9]{14}$/][inside("FR")]
+    # *["ref:FR:SIRET"]["ref:FR:SIRET"!~/^([0-9]{14};)*[0-9]{14}$/][inside("FR")]
+    def _way_rule_23(self, data, tags, nds, keys, err, sets):
         if ('ref:FR:SIRET' in keys):
             match = False
             if not match:
@@ -844,7 +905,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is not a valid SIRET number","{0.tag}")
                 err.append({'class': 9019007, 'subclass': 0, 'text': mapcss.tr('{0} is not a valid SIRET number', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *["ref:FR:NAF"]["ref:FR:NAF"!~/^([0-9]{2}\.[0-9]{2}[A-Z];)*[0-9]{2}\.[0-9]{2}[A-Z]$/][inside("FR")]
+    # *["ref:FR:NAF"]["ref:FR:NAF"!~/^([0-9]{2}\.[0-9]{2}[A-Z];)*[0-9]{2}\.[0-9]{2}[A-Z]$/][inside("FR")]
+    def _way_rule_24(self, data, tags, nds, keys, err, sets):
         if ('ref:FR:NAF' in keys):
             match = False
             if not match:
@@ -855,15 +917,44 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is not a valid code NAF/APE value","{0.tag}")
                 err.append({'class': 9019008, 'subclass': 1955725258, 'text': mapcss.tr('{0} is not a valid code NAF/APE value', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['railway']),
+        (_way_rule_1, ['amenity']),
+        (_way_rule_2, ['amenity']),
+        (_way_rule_3, ['operator']),
+        (_way_rule_4, ['ref:ERDF:gdo']),
+        (_way_rule_5, ['ref:FR:gdo']),
+        (_way_rule_6, ['operator']),
+        (_way_rule_7, ['ref:FR:ARCEP', 'ref:FR:Orange', 'ref:FR:PTT', 'ref:FR:SFR']),
+        (_way_rule_8, ['ref:FR:Orange']),
+        (_way_rule_9, ['ref:FR:Orange:NRO']),
+        (_way_rule_10, ['ref:FR:PTT']),
+        (_way_rule_11, ['ref:FR:PTT:NRA']),
+        (_way_rule_12, ['highway']),
+        (_way_rule_13, ['highway']),
+        (_way_rule_14, ['highway']),
+        (_way_rule_15, ['highway']),
+        (_way_rule_16, ['highway']),
+        (_way_rule_17, ['highway']),
+        (_way_rule_18, ['highway']),
+        (_way_rule_19, ['highway']),
+        (_way_rule_20, ['amenity']),
+        (_way_rule_21, ['ref:FR:FANTOIR', 'ref:FR:FANTOIR:left', 'ref:FR:FANTOIR:right']),
+        (_way_rule_22, ['ref:FR:SIREN']),
+        (_way_rule_23, ['ref:FR:SIRET']),
+        (_way_rule_24, ['ref:FR:NAF']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # *[name=~/(?i)co.?voiturage/][amenity][amenity!=car_pooling][!carpool][inside("FR")]
+    # *[name=~/(?i)co.?voiturage/][amenity][amenity!=car_pooling][!carpool][inside("FR")]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -882,7 +973,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                     ['carpool','designated']])
                 }})
 
-        # *[amenity=fuel]["fuel:octane_95"=yes][!"fuel:e10"][inside("FR")]
+    # *[amenity=fuel]["fuel:octane_95"=yes][!"fuel:e10"][inside("FR")]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'fuel:octane_95' in keys):
             match = False
             if not match:
@@ -896,7 +988,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # suggestAlternative:"fuel:e10=yes/no"
                 err.append({'class': 40612, 'subclass': 0, 'text': mapcss.tr('Does this station still sell SP95, or has it been replaced by the SP95-E10?')})
 
-        # *[operator=ERDF][inside("FR")]
+    # *[operator=ERDF][inside("FR")]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('operator' in keys):
             match = False
             if not match:
@@ -915,7 +1008,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                     ['operator','Enedis']])
                 }})
 
-        # *["ref:ERDF:gdo"][inside("FR")]
+    # *["ref:ERDF:gdo"][inside("FR")]
+    def _relation_rule_3(self, data, tags, members, keys, err, sets):
         if ('ref:ERDF:gdo' in keys):
             match = False
             if not match:
@@ -936,7 +1030,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                     'ref:ERDF:gdo'])
                 }})
 
-        # *["ref:FR:gdo"]["ref:FR:gdo"!~/[0-9AB]{5}[A-Z]{1,3}[0-9]{4}|[0-9AB]{5}EEM[0-9]{2}/][inside("FR")]
+    # *["ref:FR:gdo"]["ref:FR:gdo"!~/[0-9AB]{5}[A-Z]{1,3}[0-9]{4}|[0-9AB]{5}EEM[0-9]{2}/][inside("FR")]
+    def _relation_rule_4(self, data, tags, members, keys, err, sets):
         if ('ref:FR:gdo' in keys):
             match = False
             if not match:
@@ -949,8 +1044,9 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is invalid","{0.tag}")
                 err.append({'class': 30406, 'subclass': 0, 'text': mapcss.tr('{0} is invalid', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[power=substation][!"ref:FR:gdo"][ref][operator=~/^(Enedis|GRDF)$/][inside("FR")]
-        # *[power=switch][!"ref:FR:gdo"][ref][operator=Enedis][inside("FR")]
+    # *[power=substation][!"ref:FR:gdo"][ref][operator=~/^(Enedis|GRDF)$/][inside("FR")]
+    # *[power=switch][!"ref:FR:gdo"][ref][operator=Enedis][inside("FR")]
+    def _relation_rule_5(self, data, tags, members, keys, err, sets):
         if ('operator' in keys and 'power' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -968,11 +1064,12 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.tag}","{1.key}")
                 err.append({'class': 30402, 'subclass': 0, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *["ref:FR:ARCEP"][telecom!=connection_point]
-        # *["ref:FR:ARCEP"]["telecom:medium"!=fibre]
-        # *["ref:FR:Orange"]["telecom:medium"!=fibre]
-        # *["ref:FR:SFR"]["telecom:medium"!=fibre]
-        # *["ref:FR:PTT"]["telecom:medium"!=copper]
+    # *["ref:FR:ARCEP"][telecom!=connection_point]
+    # *["ref:FR:ARCEP"]["telecom:medium"!=fibre]
+    # *["ref:FR:Orange"]["telecom:medium"!=fibre]
+    # *["ref:FR:SFR"]["telecom:medium"!=fibre]
+    # *["ref:FR:PTT"]["telecom:medium"!=copper]
+    def _relation_rule_6(self, data, tags, members, keys, err, sets):
         if ('ref:FR:ARCEP' in keys) or ('ref:FR:Orange' in keys) or ('ref:FR:PTT' in keys) or ('ref:FR:SFR' in keys):
             match = False
             if not match:
@@ -1002,7 +1099,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.key}","{1.tag}")
                 err.append({'class': 30403, 'subclass': 0, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *["ref:FR:Orange"]["ref:FR:Orange"!~/PT[1-9]{1}[0-9]*/][inside("FR")]
+    # *["ref:FR:Orange"]["ref:FR:Orange"!~/PT[1-9]{1}[0-9]*/][inside("FR")]
+    def _relation_rule_7(self, data, tags, members, keys, err, sets):
         if ('ref:FR:Orange' in keys):
             match = False
             if not match:
@@ -1015,7 +1113,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is invalid. Should look like PT123 without leading zeros","{0.tag}")
                 err.append({'class': 30407, 'subclass': 0, 'text': mapcss.tr('{0} is invalid. Should look like PT123 without leading zeros', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *["ref:FR:Orange:NRO"]["ref:FR:Orange:NRO"!~/[0-9]{5}[A-Z0-9]{3}/][inside("FR")]
+    # *["ref:FR:Orange:NRO"]["ref:FR:Orange:NRO"!~/[0-9]{5}[A-Z0-9]{3}/][inside("FR")]
+    def _relation_rule_8(self, data, tags, members, keys, err, sets):
         if ('ref:FR:Orange:NRO' in keys):
             match = False
             if not match:
@@ -1028,7 +1127,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is invalid. Should look like 12345ABC","{0.tag}")
                 err.append({'class': 30408, 'subclass': 0, 'text': mapcss.tr('{0} is invalid. Should look like 12345ABC', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *["ref:FR:PTT"]["ref:FR:PTT"!~/[A-Z0-9]{3}/][inside("FR")]
+    # *["ref:FR:PTT"]["ref:FR:PTT"!~/[A-Z0-9]{3}/][inside("FR")]
+    def _relation_rule_9(self, data, tags, members, keys, err, sets):
         if ('ref:FR:PTT' in keys):
             match = False
             if not match:
@@ -1041,7 +1141,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is invalid. Should look like ABC","{0.tag}")
                 err.append({'class': 30409, 'subclass': 0, 'text': mapcss.tr('{0} is invalid. Should look like ABC', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *["ref:FR:PTT:NRA"]["ref:FR:PTT:NRA"!~/[0-9]{5}[A-Z0-9]{3}/][inside("FR")]
+    # *["ref:FR:PTT:NRA"]["ref:FR:PTT:NRA"!~/[0-9]{5}[A-Z0-9]{3}/][inside("FR")]
+    def _relation_rule_10(self, data, tags, members, keys, err, sets):
         if ('ref:FR:PTT:NRA' in keys):
             match = False
             if not match:
@@ -1054,7 +1155,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is invalid. Should look like 12345ABC","{0.tag}")
                 err.append({'class': 30410, 'subclass': 0, 'text': mapcss.tr('{0} is invalid. Should look like 12345ABC', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=kindergarten]["school:FR"=maternelle][inside("FR")]
+    # *[amenity=kindergarten]["school:FR"=maternelle][inside("FR")]
+    def _relation_rule_11(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'school:FR' in keys):
             match = False
             if not match:
@@ -1072,9 +1174,10 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                     ['amenity','school']])
                 }})
 
-        # *["ref:FR:FANTOIR"]["ref:FR:FANTOIR"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
-        # *["ref:FR:FANTOIR:left"]["ref:FR:FANTOIR:left"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
-        # *["ref:FR:FANTOIR:right"]["ref:FR:FANTOIR:right"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
+    # *["ref:FR:FANTOIR"]["ref:FR:FANTOIR"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
+    # *["ref:FR:FANTOIR:left"]["ref:FR:FANTOIR:left"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
+    # *["ref:FR:FANTOIR:right"]["ref:FR:FANTOIR:right"!~/^(((((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|))(|;(((((0[1-9]|1[0-9]|2A|2B|2[1-9]|[3-8][0-9]|9[0-5])([0-9]{3}))|((971(0[1-9]|[1-3][0-9]))|(972(0[1-9]|[1-3][0-9]))|(973(0[1-9]|[1-6][0-9]))|(974(0[1-9]|[1-2][0-9]))|(976(0[1-9]|1[0-7]))))([0-9]|[A-Z])([0-9]{3}))([ABCDEFGHJKLMNPRSTUVWXYZ]|)))+)|no)$/][inside("FR")]
+    def _relation_rule_12(self, data, tags, members, keys, err, sets):
         if ('ref:FR:FANTOIR' in keys) or ('ref:FR:FANTOIR:left' in keys) or ('ref:FR:FANTOIR:right' in keys):
             match = False
             if not match:
@@ -1096,7 +1199,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:"format code ref:FR:FANTOIR"
                 err.append({'class': 9019005, 'subclass': 0, 'text': {'en': 'format code ref:FR:FANTOIR'}})
 
-        # *["ref:FR:SIREN"]["ref:FR:SIREN"!~/^([0-9]{9};)*[0-9]{9}$/][inside("FR")]
+    # *["ref:FR:SIREN"]["ref:FR:SIREN"!~/^([0-9]{9};)*[0-9]{9}$/][inside("FR")]
+    def _relation_rule_13(self, data, tags, members, keys, err, sets):
         if ('ref:FR:SIREN' in keys):
             match = False
             if not match:
@@ -1108,7 +1212,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is not a valid SIREN number","{0.tag}")
                 err.append({'class': 9019006, 'subclass': 0, 'text': mapcss.tr('{0} is not a valid SIREN number', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *["ref:FR:SIRET"]["ref:FR:SIRET"!~/^([0-9]{14};)*[0-9]{14}$/][inside("FR")]
+    # *["ref:FR:SIRET"]["ref:FR:SIRET"!~/^([0-9]{14};)*[0-9]{14}$/][inside("FR")]
+    def _relation_rule_14(self, data, tags, members, keys, err, sets):
         if ('ref:FR:SIRET' in keys):
             match = False
             if not match:
@@ -1120,7 +1225,8 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is not a valid SIRET number","{0.tag}")
                 err.append({'class': 9019007, 'subclass': 0, 'text': mapcss.tr('{0} is not a valid SIRET number', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *["ref:FR:NAF"]["ref:FR:NAF"!~/^([0-9]{2}\.[0-9]{2}[A-Z];)*[0-9]{2}\.[0-9]{2}[A-Z]$/][inside("FR")]
+    # *["ref:FR:NAF"]["ref:FR:NAF"!~/^([0-9]{2}\.[0-9]{2}[A-Z];)*[0-9]{2}\.[0-9]{2}[A-Z]$/][inside("FR")]
+    def _relation_rule_15(self, data, tags, members, keys, err, sets):
         if ('ref:FR:NAF' in keys):
             match = False
             if not match:
@@ -1131,6 +1237,31 @@ class Josm_FranceSpecificRules(PluginMapCSS):
                 # throwWarning:tr("{0} is not a valid code NAF/APE value","{0.tag}")
                 err.append({'class': 9019008, 'subclass': 1955725258, 'text': mapcss.tr('{0} is not a valid code NAF/APE value', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['amenity']),
+        (_relation_rule_1, ['amenity']),
+        (_relation_rule_2, ['operator']),
+        (_relation_rule_3, ['ref:ERDF:gdo']),
+        (_relation_rule_4, ['ref:FR:gdo']),
+        (_relation_rule_5, ['operator']),
+        (_relation_rule_6, ['ref:FR:ARCEP', 'ref:FR:Orange', 'ref:FR:PTT', 'ref:FR:SFR']),
+        (_relation_rule_7, ['ref:FR:Orange']),
+        (_relation_rule_8, ['ref:FR:Orange:NRO']),
+        (_relation_rule_9, ['ref:FR:PTT']),
+        (_relation_rule_10, ['ref:FR:PTT:NRA']),
+        (_relation_rule_11, ['amenity']),
+        (_relation_rule_12, ['ref:FR:FANTOIR', 'ref:FR:FANTOIR:left', 'ref:FR:FANTOIR:right']),
+        (_relation_rule_13, ['ref:FR:SIREN']),
+        (_relation_rule_14, ['ref:FR:SIRET']),
+        (_relation_rule_15, ['ref:FR:NAF']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
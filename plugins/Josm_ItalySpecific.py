@@ -24,13 +24,8 @@ class Josm_ItalySpecific(PluginMapCSS):
 
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # *[amenity=pharmacy][!dispensing][inside("IT")]
+    # *[amenity=pharmacy][!dispensing][inside("IT")]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -43,15 +38,20 @@ class Josm_ItalySpecific(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.tag}","{1.key}")
                 err.append({'class': 21001, 'subclass': 0, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['amenity']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # *[amenity=pharmacy][!dispensing][inside("IT")]
+    # *[amenity=pharmacy][!dispensing][inside("IT")]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -64,15 +64,20 @@ class Josm_ItalySpecific(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.tag}","{1.key}")
                 err.append({'class': 21001, 'subclass': 0, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['amenity']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # *[amenity=pharmacy][!dispensing][inside("IT")]
+    # *[amenity=pharmacy][!dispensing][inside("IT")]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -85,4 +90,14 @@ class Josm_ItalySpecific(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.tag}","{1.key}")
                 err.append({'class': 21001, 'subclass': 0, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['amenity']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
@@ -160,13 +160,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
         self.re_7f53e992 = re.compile(r'^(?i)(?u)(campo|est(á|a)dio|gin(á|a)sio|quadra)( de (futebol|esportes?))?$')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # *["addr:street"]["addr:street"!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodovia|Rotatória|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    # *["addr:street"]["addr:street"!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodovia|Rotatória|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('addr:street' in keys):
             match = False
             if not match:
@@ -178,7 +173,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} com logradouro ausente, errado ou abreviado","{0.key}")
                 err.append({'class': 9018002, 'subclass': 279840772, 'text': mapcss.tr('{0} com logradouro ausente, errado ou abreviado', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[!highway][route!=road][!public_transport][type!~/route|street/][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|passarela|rodovia|rotatória|rua|travessa|trevo|viela|(anel|complexo|dispositivo) viário) .*/][name!~/^(?i)estrada de ferro/][inside("BR")]
+    # *[!highway][route!=road][!public_transport][type!~/route|street/][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|passarela|rodovia|rotatória|rua|travessa|trevo|viela|(anel|complexo|dispositivo) viário) .*/][name!~/^(?i)estrada de ferro/][inside("BR")]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -190,7 +186,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto com nome de via mas sem tag de {0}","{0.key}")
                 err.append({'class': 9018002, 'subclass': 535280341, 'text': mapcss.tr('objeto com nome de via mas sem tag de {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[name=~/^(?i)(?u)[a-z0-9]+_([a-z0-9]_?)+$/][inside("BR")]
+    # *[name=~/^(?i)(?u)[a-z0-9]+_([a-z0-9]_?)+$/][inside("BR")]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -202,7 +199,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("utilizar espaço ao invés de underscore")
                 err.append({'class': 9018002, 'subclass': 1476954926, 'text': mapcss.tr('utilizar espaço ao invés de underscore')})
 
-        # *[name=~/(?i)(^|.* )(Cel|Cmte|Cond|Conj|Dª|Dr|Eng|Gov|Hab|Jd|Jr|Marg|Mun|p\/|Pde|Pe|Pq|Pst|Pref|Profa|Profª|Prof|Res|s\/|Sr(a|ª)?|Sta|Sto|Ver)\.? .*/][inside("BR")]
+    # *[name=~/(?i)(^|.* )(Cel|Cmte|Cond|Conj|Dª|Dr|Eng|Gov|Hab|Jd|Jr|Marg|Mun|p\/|Pde|Pe|Pq|Pst|Pref|Profa|Profª|Prof|Res|s\/|Sr(a|ª)?|Sta|Sto|Ver)\.? .*/][inside("BR")]
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -213,7 +211,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("palavra abreviada em {0}","{0.key}")
                 err.append({'class': 9018003, 'subclass': 749019091, 'text': mapcss.tr('palavra abreviada em {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[leisure][name=~/^(?i)(?u)(campo|est(á|a)dio|gin(á|a)sio|quadra)( de (futebol|esportes?))?$/][inside("BR")]
+    # *[leisure][name=~/^(?i)(?u)(campo|est(á|a)dio|gin(á|a)sio|quadra)( de (futebol|esportes?))?$/][inside("BR")]
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if ('leisure' in keys and 'name' in keys):
             match = False
             if not match:
@@ -224,7 +223,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("nome supérfluo/incompleto de local de lazer")
                 err.append({'class': 9018004, 'subclass': 1485441713, 'text': mapcss.tr('nome supérfluo/incompleto de local de lazer')})
 
-        # *[name=~/^(?i)(?u)((Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF|hospital)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)((Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF|hospital)$/][inside("BR")]
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -235,7 +235,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("nome supérfluo/incompleto de local de saúde")
                 err.append({'class': 9018005, 'subclass': 1497769259, 'text': mapcss.tr('nome supérfluo/incompleto de local de saúde')})
 
-        # *[amenity=~/^(clinic|doctors|hospital)$/][name=~/(?i)\bsaude\b/][inside("BR")]
+    # *[amenity=~/^(clinic|doctors|hospital)$/][name=~/(?i)\bsaude\b/][inside("BR")]
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -247,7 +248,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("erro de ortografia em ''saúde''")
                 err.append({'class': 9018002, 'subclass': 1962359328, 'text': mapcss.tr('erro de ortografia em \'\'saúde\'\'')})
 
-        # *[place=farm][name^="Sitio "][inside("BR")]
+    # *[place=farm][name^="Sitio "][inside("BR")]
+    def _node_rule_7(self, data, tags, keys, err, sets):
         if ('name' in keys and 'place' in keys):
             match = False
             if not match:
@@ -259,7 +261,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("faltando acento em ''Sítio''")
                 err.append({'class': 9018002, 'subclass': 653860263, 'text': mapcss.tr('faltando acento em \'\'Sítio\'\'')})
 
-        # *[name=~/^(?i)(?u)(aldeia|borrach(aria|eiro)|bosque|capela|cemit(é|e)rio|c(ó|o)rrego|escola|estacionamento|fazenda|floresta|hospital|igreja|lago|lagoa|mata( nativa)?|praça|parque|parquinho|posto( de gasolina)?|riacho|rio|rodovi(á|a)ria|vila)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)(aldeia|borrach(aria|eiro)|bosque|capela|cemit(é|e)rio|c(ó|o)rrego|escola|estacionamento|fazenda|floresta|hospital|igreja|lago|lagoa|mata( nativa)?|praça|parque|parquinho|posto( de gasolina)?|riacho|rio|rodovi(á|a)ria|vila)$/][inside("BR")]
+    def _node_rule_8(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -271,23 +274,24 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("local com nome supérfluo, incompleto ou descritivo")
                 err.append({'class': 9018002, 'subclass': 1104230922, 'text': mapcss.tr('local com nome supérfluo, incompleto ou descritivo')})
 
-        # *[amenity=parking][name=~/(?i)^Estacionamento /][inside("BR")]
-        # Rule Blacklisted (id: 1322492249)
-
-        # *[designation=*"addr:housename"][inside("BR")]
-        # *[ref=*designation][inside("BR")]
-        # *[ref=*old_ref][inside("BR")]
-        # *[name=*"addr:housename"][inside("BR")]
-        # *[name=*designation][inside("BR")]
-        # *[name=*alt_name][inside("BR")]
-        # *[name=*int_name][inside("BR")]
-        # *[name=*loc_name][inside("BR")]
-        # *[name=*nat_name][inside("BR")]
-        # *[name=*official_name][inside("BR")]
-        # *[name=*old_name][inside("BR")]
-        # *[name=*reg_name][inside("BR")]
-        # *[name=*short_name][inside("BR")]
-        # *[name=*sorting_name][inside("BR")]
+    # *[amenity=parking][name=~/(?i)^Estacionamento /][inside("BR")]
+    # Rule Blacklisted (id: 1322492249)
+
+    # *[designation=*"addr:housename"][inside("BR")]
+    # *[ref=*designation][inside("BR")]
+    # *[ref=*old_ref][inside("BR")]
+    # *[name=*"addr:housename"][inside("BR")]
+    # *[name=*designation][inside("BR")]
+    # *[name=*alt_name][inside("BR")]
+    # *[name=*int_name][inside("BR")]
+    # *[name=*loc_name][inside("BR")]
+    # *[name=*nat_name][inside("BR")]
+    # *[name=*official_name][inside("BR")]
+    # *[name=*old_name][inside("BR")]
+    # *[name=*reg_name][inside("BR")]
+    # *[name=*short_name][inside("BR")]
+    # *[name=*sorting_name][inside("BR")]
+    def _node_rule_9(self, data, tags, keys, err, sets):
         if ('designation' in keys) or ('name' in keys) or ('ref' in keys):
             match = False
             if not match:
@@ -355,7 +359,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.value}')])
                 }})
 
-        # *[source=*name][inside("BR")]
+    # *[source=*name][inside("BR")]
+    def _node_rule_10(self, data, tags, keys, err, sets):
         if ('source' in keys):
             match = False
             if not match:
@@ -367,7 +372,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} e {1} são iguais","{0.key}","{0.value}")
                 err.append({'class': 9018002, 'subclass': 470146003, 'text': mapcss.tr('{0} e {1} são iguais', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[name=~/(?i)(?u)((sem (denomina(ç|c)(ã|a)o|nome|sa(i|í)da))|desconhecido|n(ã|a)o conhecido)/][inside("BR")]
+    # *[name=~/(?i)(?u)((sem (denomina(ç|c)(ã|a)o|nome|sa(i|í)da))|desconhecido|n(ã|a)o conhecido)/][inside("BR")]
+    def _node_rule_11(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -379,8 +385,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"noname"
                 err.append({'class': 9018007, 'subclass': 1272098213, 'text': mapcss.tr('objeto com nomenclatura incorreta')})
 
-        # node[maxheight][barrier!=height_restrictor][!traffic_sign][inside("BR")]
-        # node[maxspeed][highway!=speed_camera][!traffic_sign][inside("BR")]
+    # node[maxheight][barrier!=height_restrictor][!traffic_sign][inside("BR")]
+    # node[maxspeed][highway!=speed_camera][!traffic_sign][inside("BR")]
+    def _node_rule_12(self, data, tags, keys, err, sets):
         if ('maxheight' in keys) or ('maxspeed' in keys):
             match = False
             if not match:
@@ -395,7 +402,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} não deve ser utilizado em nó; utilizar a restrição na via","{0.key}")
                 err.append({'class': 9018008, 'subclass': 427326608, 'text': mapcss.tr('{0} não deve ser utilizado em nó; utilizar a restrição na via', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # node[noname?][inside("BR")]
+    # node[noname?][inside("BR")]
+    def _node_rule_13(self, data, tags, keys, err, sets):
         if ('noname' in keys):
             match = False
             if not match:
@@ -407,7 +415,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("uso suspeito de {0} em nó","{0.key}")
                 err.append({'class': 9018002, 'subclass': 1940682714, 'text': mapcss.tr('uso suspeito de {0} em nó', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[designation][inside("BR")]
+    # *[designation][inside("BR")]
+    def _node_rule_14(self, data, tags, keys, err, sets):
         if ('designation' in keys):
             match = False
             if not match:
@@ -420,7 +429,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"name"
                 err.append({'class': 9018009, 'subclass': 1818234763, 'text': mapcss.tr('{0} é uma chave utilizada apenas no Reino Unido', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # node[highway=motorway_junction][!name][!ref][inside("BR")]
+    # node[highway=motorway_junction][!name][!ref][inside("BR")]
+    def _node_rule_15(self, data, tags, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -431,7 +441,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} sem pelo menos uma das tags: {1} ou {2}","{0.value}","{1.key}","{2.key}")
                 err.append({'class': 9018010, 'subclass': 1629006877, 'text': mapcss.tr('{0} sem pelo menos uma das tags: {1} ou {2}', mapcss._tag_uncapture(capture_tags, '{0.value}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[place=~/hamlet|isolated_dwelling|town|village/][population>=100000][inside("BR")]
+    # *[place=~/hamlet|isolated_dwelling|town|village/][population>=100000][inside("BR")]
+    def _node_rule_16(self, data, tags, keys, err, sets):
         if ('place' in keys and 'population' in keys):
             match = False
             if not match:
@@ -447,7 +458,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['place','city']])
                 }})
 
-        # *[place=~/city|hamlet|isolated_dwelling|village/][population>=10000][population<100000][inside("BR")]
+    # *[place=~/city|hamlet|isolated_dwelling|village/][population>=10000][population<100000][inside("BR")]
+    def _node_rule_17(self, data, tags, keys, err, sets):
         if ('place' in keys and 'population' in keys):
             match = False
             if not match:
@@ -463,7 +475,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['place','town']])
                 }})
 
-        # *[place][place!~/hamlet|island|isolated_dwelling|neighbourhood|suburb|village/][population<10000][inside("BR")]
+    # *[place][place!~/hamlet|island|isolated_dwelling|neighbourhood|suburb|village/][population<10000][inside("BR")]
+    def _node_rule_18(self, data, tags, keys, err, sets):
         if ('place' in keys and 'population' in keys):
             match = False
             if not match:
@@ -479,14 +492,15 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['place','village']])
                 }})
 
-        # *[place=city][!population][inside("BR")]
-        # *[place=town][!population][inside("BR")]
-        # *[place=village][!population][inside("BR")]
-        # Rule Blacklisted (id: 339470124)
+    # *[place=city][!population][inside("BR")]
+    # *[place=town][!population][inside("BR")]
+    # *[place=village][!population][inside("BR")]
+    # Rule Blacklisted (id: 339470124)
 
-        # *[place=city][!name][inside("BR")]
-        # *[place=town][!name][inside("BR")]
-        # *[place=village][!name][inside("BR")]
+    # *[place=city][!name][inside("BR")]
+    # *[place=town][!name][inside("BR")]
+    # *[place=village][!name][inside("BR")]
+    def _node_rule_19(self, data, tags, keys, err, sets):
         if ('place' in keys):
             match = False
             if not match:
@@ -505,8 +519,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} sem nome","{0.value}")
                 err.append({'class': 9018012, 'subclass': 1473808194, 'text': mapcss.tr('{0} sem nome', mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # node[place=~/village|town|city/]["addr:city"=*name][inside("BR")]
-        # node[place=suburb]["addr:suburb"=*name][inside("BR")]
+    # node[place=~/village|town|city/]["addr:city"=*name][inside("BR")]
+    # node[place=suburb]["addr:suburb"=*name][inside("BR")]
+    def _node_rule_20(self, data, tags, keys, err, sets):
         if ('addr:city' in keys and 'place' in keys) or ('addr:suburb' in keys and 'place' in keys):
             match = False
             if not match:
@@ -526,7 +541,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{1.key}')])
                 }})
 
-        # *["addr:city"=~/(,|( |-) ?[A-Z]{2})/][inside("BR")]
+    # *["addr:city"=~/(,|( |-) ?[A-Z]{2})/][inside("BR")]
+    def _node_rule_21(self, data, tags, keys, err, sets):
         if ('addr:city' in keys):
             match = False
             if not match:
@@ -537,7 +553,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve conter apenas o nome da cidade","{0.key}")
                 err.append({'class': 9018013, 'subclass': 1479274467, 'text': mapcss.tr('{0} deve conter apenas o nome da cidade', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[name=~/^(?i)(?u)(Faz\.|Fazenda|Sítio|Chácara)/][place][place!~/city|farm|neighbourhood|suburb|town|village/][inside("BR")]
+    # *[name=~/^(?i)(?u)(Faz\.|Fazenda|Sítio|Chácara)/][place][place!~/city|farm|neighbourhood|suburb|town|village/][inside("BR")]
+    def _node_rule_22(self, data, tags, keys, err, sets):
         if ('name' in keys and 'place' in keys):
             match = False
             if not match:
@@ -549,7 +566,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto talvez deva ser {0}=farm","{1.key}")
                 err.append({'class': 9018002, 'subclass': 337742963, 'text': mapcss.tr('objeto talvez deva ser {0}=farm', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[place][name=~/^(?i)Bairro\b/][name!~/^(?i)Bairro d(a|e|o)s?\b/][inside("BR")]
+    # *[place][name=~/^(?i)Bairro\b/][name!~/^(?i)Bairro d(a|e|o)s?\b/][inside("BR")]
+    def _node_rule_23(self, data, tags, keys, err, sets):
         if ('name' in keys and 'place' in keys):
             match = False
             if not match:
@@ -561,7 +579,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto talvez não deva ter ''Bairro'' no nome")
                 err.append({'class': 9018002, 'subclass': 1441242115, 'text': mapcss.tr('objeto talvez não deva ter \'\'Bairro\'\' no nome')})
 
-        # node[place=~/^(island|islet)$/][inside("BR")]
+    # node[place=~/^(island|islet)$/][inside("BR")]
+    def _node_rule_24(self, data, tags, keys, err, sets):
         if ('place' in keys):
             match = False
             if not match:
@@ -573,7 +592,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("representar a ilha, se possível, como uma área")
                 err.append({'class': 9018002, 'subclass': 820669758, 'text': mapcss.tr('representar a ilha, se possível, como uma área')})
 
-        # *[iata="0"][inside("BR")]
+    # *[iata="0"][inside("BR")]
+    def _node_rule_25(self, data, tags, keys, err, sets):
         if ('iata' in keys):
             match = False
             if not match:
@@ -584,7 +604,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} com valor = {1}","{0.key}","{0.value}")
                 err.append({'class': 9018014, 'subclass': 1098244333, 'text': mapcss.tr('{0} com valor = {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[amenity=~/college|school/][name=~/^(?i)(?u)(Centro Universitário|Faculdades?|FATEC|Instituto Federal)\b/][inside("BR")]
+    # *[amenity=~/college|school/][name=~/^(?i)(?u)(Centro Universitário|Faculdades?|FATEC|Instituto Federal)\b/][inside("BR")]
+    def _node_rule_26(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -601,8 +622,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=university')).split('=', 1)])
                 }})
 
-        # *[amenity=school][name=~/^(?i)(?u)(SENAC|SENAI|Serviço Nacional de Aprendizagem)/][inside("BR")]
-        # *[amenity=~/school|university/][name=~/(?i)(?u)\b(Centro Paula Souza|Escola Técnica|ETEC)\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)(?u)(SENAC|SENAI|Serviço Nacional de Aprendizagem)/][inside("BR")]
+    # *[amenity=~/school|university/][name=~/(?i)(?u)\b(Centro Paula Souza|Escola Técnica|ETEC)\b/][inside("BR")]
+    def _node_rule_27(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -623,7 +645,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=college')).split('=', 1)])
                 }})
 
-        # *[amenity=school][name=~/^(?i)(?u)(auto(-| )?( moto )?escola|centro de formação de condutores|cfc|moto escola)\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)(?u)(auto(-| )?( moto )?escola|centro de formação de condutores|cfc|moto escola)\b/][inside("BR")]
+    def _node_rule_28(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -640,7 +663,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=driving_school')).split('=', 1)])
                 }})
 
-        # *[amenity=school][name=~/^(?i)creche\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)creche\b/][inside("BR")]
+    def _node_rule_29(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -657,20 +681,21 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=kindergarten')).split('=', 1)])
                 }})
 
-        # *[name=~/^(?i)(?u)Subestação .*/][power][power!=substation][inside("BR")]
-        # *[name=~/^(?i)(?u)Fórum .*/][amenity][amenity!=courthouse][inside("BR")]
-        # *[name=~/^(?i)Hospital .*/][building][building!=hospital][inside("BR")]
-        # *[name=~/^(?i)Universidade .*/][building][building!=university][inside("BR")]
-        # *[name=~/^(?i)Escola .*/][building][building!=school][inside("BR")]
-        # *[name=~/^(?i)Hotel .*/][building][building!=hotel][inside("BR")]
-        # *[name=~/^(?i)Capela .*/][building][building!=chapel][inside("BR")]
-        # *[name=~/^(?i)Igreja .*/][building][building!=church][inside("BR")]
-        # *[name=~/^(?i)Catedral .*/][building][building!=cathedral][inside("BR")]
-        # *[name=~/^(?i)Fazenda .*/][building][building!=farm][inside("BR")]
-        # *[name=~/^(?i)Supermercado .*/][building][building!=supermarket][inside("BR")]
-        # Rule Blacklisted (id: 1123790420)
-
-        # *[name=~/^(?i)(?u)(AM(A|E)|(Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF).*/][amenity=hospital][inside("BR")]
+    # *[name=~/^(?i)(?u)Subestação .*/][power][power!=substation][inside("BR")]
+    # *[name=~/^(?i)(?u)Fórum .*/][amenity][amenity!=courthouse][inside("BR")]
+    # *[name=~/^(?i)Hospital .*/][building][building!=hospital][inside("BR")]
+    # *[name=~/^(?i)Universidade .*/][building][building!=university][inside("BR")]
+    # *[name=~/^(?i)Escola .*/][building][building!=school][inside("BR")]
+    # *[name=~/^(?i)Hotel .*/][building][building!=hotel][inside("BR")]
+    # *[name=~/^(?i)Capela .*/][building][building!=chapel][inside("BR")]
+    # *[name=~/^(?i)Igreja .*/][building][building!=church][inside("BR")]
+    # *[name=~/^(?i)Catedral .*/][building][building!=cathedral][inside("BR")]
+    # *[name=~/^(?i)Fazenda .*/][building][building!=farm][inside("BR")]
+    # *[name=~/^(?i)Supermercado .*/][building][building!=supermarket][inside("BR")]
+    # Rule Blacklisted (id: 1123790420)
+
+    # *[name=~/^(?i)(?u)(AM(A|E)|(Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF).*/][amenity=hospital][inside("BR")]
+    def _node_rule_30(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -686,7 +711,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['amenity','clinic']])
                 }})
 
-        # *[name=~/^(?i)\bSAMU\b/][amenity=~/clinic|doctors|hospital/][inside("BR")]
+    # *[name=~/^(?i)\bSAMU\b/][amenity=~/clinic|doctors|hospital/][inside("BR")]
+    def _node_rule_31(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -698,7 +724,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"emergency=ambulance_station"
                 err.append({'class': 9018016, 'subclass': 392029310, 'text': mapcss.tr('SAMU classificado de forma errada')})
 
-        # node[highway=~/^(give_way|mini_roundabout|stop|turning_circle)$/][name][inside("BR")]
+    # node[highway=~/^(give_way|mini_roundabout|stop|turning_circle)$/][name][inside("BR")]
+    def _node_rule_32(self, data, tags, keys, err, sets):
         if ('highway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -709,7 +736,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto não deve possuir {0}","{1.key}")
                 err.append({'class': 9018017, 'subclass': 1025728334, 'text': mapcss.tr('objeto não deve possuir {0}', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # node[highway=speed_camera][!maxspeed][inside("BR")]
+    # node[highway=speed_camera][!maxspeed][inside("BR")]
+    def _node_rule_33(self, data, tags, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -720,7 +748,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("adicionar {0} ao {1}","{1.key}","{0.tag}")
                 err.append({'class': 9018018, 'subclass': 1228671542, 'text': mapcss.tr('adicionar {0} ao {1}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[crossing][!highway][!railway][inside("BR")]
+    # *[crossing][!highway][!railway][inside("BR")]
+    def _node_rule_34(self, data, tags, keys, err, sets):
         if ('crossing' in keys):
             match = False
             if not match:
@@ -731,8 +760,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve ser utilizado com {1}={0} ou {2}={0}","{0.key}","{1.key}","{2.key}")
                 err.append({'class': 9018019, 'subclass': 2098306424, 'text': mapcss.tr('{0} deve ser utilizado com {1}={0} ou {2}={0}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[aeroway][designation=~/^[A-Z]{4}$/][!icao][inside("BR")]
-        # *[aeroway][ref=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    # *[aeroway][designation=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    # *[aeroway][ref=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    def _node_rule_35(self, data, tags, keys, err, sets):
         if ('aeroway' in keys and 'designation' in keys) or ('aeroway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -754,7 +784,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{1.key} => {2.key}')).split('=>', 1)[0].strip()])
                 }})
 
-        # *[access=permissive][inside("BR")]
+    # *[access=permissive][inside("BR")]
+    def _node_rule_36(self, data, tags, keys, err, sets):
         if ('access' in keys):
             match = False
             if not match:
@@ -766,17 +797,18 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve ser utilizado apenas em vias privadas com permissão de acesso e não em vias de acesso público","{0.tag}")
                 err.append({'class': 9018002, 'subclass': 1240816112, 'text': mapcss.tr('{0} deve ser utilizado apenas em vias privadas com permissão de acesso e não em vias de acesso público', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[name=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
-        # *["addr:street"=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
-        # Rule Blacklisted (id: 951501764)
+    # *[name=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
+    # *["addr:street"=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
+    # Rule Blacklisted (id: 951501764)
 
-        # *["addr:postcode"=~/^[0-9]{8}$/][inside("BR")]
-        # Rule Blacklisted (id: 1948798798)
+    # *["addr:postcode"=~/^[0-9]{8}$/][inside("BR")]
+    # Rule Blacklisted (id: 1948798798)
 
-        # *[postal_code=~/^[0-9]{8}$/][inside("BR")]
-        # Rule Blacklisted (id: 733725137)
+    # *[postal_code=~/^[0-9]{8}$/][inside("BR")]
+    # Rule Blacklisted (id: 733725137)
 
-        # *["addr:postcode"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    # *["addr:postcode"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    def _node_rule_37(self, data, tags, keys, err, sets):
         if ('addr:postcode' in keys):
             match = False
             if not match:
@@ -792,7 +824,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss.concat('addr:postcode=', mapcss.replace(mapcss.replace(mapcss.tag(tags, 'addr:postcode'), ' ', '-'), '.', '-'))).split('=', 1)])
                 }})
 
-        # *["postal_code"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    # *["postal_code"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    def _node_rule_38(self, data, tags, keys, err, sets):
         if ('postal_code' in keys):
             match = False
             if not match:
@@ -808,11 +841,12 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss.concat('postal_code=', mapcss.replace(mapcss.replace(mapcss.tag(tags, 'postal_code'), ' ', '-'), '.', '-'))).split('=', 1)])
                 }})
 
-        # *["addr:postcode"]["addr:postcode"!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
-        # *[postal_code][postal_code!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
-        # Rule Blacklisted (id: 2074305530)
+    # *["addr:postcode"]["addr:postcode"!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
+    # *[postal_code][postal_code!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
+    # Rule Blacklisted (id: 2074305530)
 
-        # *[alt_source][source][inside("BR")]
+    # *[alt_source][source][inside("BR")]
+    def _node_rule_39(self, data, tags, keys, err, sets):
         if ('alt_source' in keys and 'source' in keys):
             match = False
             if not match:
@@ -823,7 +857,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve estar incluído em {1}, separado por '';'' caso necessário","{0.key}","{1.key}")
                 err.append({'class': 9018020, 'subclass': 472956812, 'text': mapcss.tr('{0} deve estar incluído em {1}, separado por \'\';\'\' caso necessário', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[landuse?][inside("BR")]
+    # *[landuse?][inside("BR")]
+    def _node_rule_40(self, data, tags, keys, err, sets):
         if ('landuse' in keys):
             match = False
             if not match:
@@ -834,7 +869,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("especificar valor correto para {0} ao invés de ''{1}''","{0.key}",tag("landuse"))
                 err.append({'class': 9018021, 'subclass': 6418462, 'text': mapcss.tr('especificar valor correto para {0} ao invés de \'\'{1}\'\'', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss.tag(tags, 'landuse'))})
 
-        # *[long_name][inside("BR")]
+    # *[long_name][inside("BR")]
+    def _node_rule_41(self, data, tags, keys, err, sets):
         if ('long_name' in keys):
             match = False
             if not match:
@@ -848,7 +884,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"official_name"
                 err.append({'class': 9018022, 'subclass': 1737555221, 'text': mapcss.tr('chave inválida: {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *["building:levels"<1][inside("BR")]
+    # *["building:levels"<1][inside("BR")]
+    def _node_rule_42(self, data, tags, keys, err, sets):
         if ('building:levels' in keys):
             match = False
             if not match:
@@ -860,7 +897,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} com valor inválido","{0.key}")
                 err.append({'class': 9018002, 'subclass': 775859422, 'text': mapcss.tr('{0} com valor inválido', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[hires?][inside("BR")]
+    # *[hires?][inside("BR")]
+    def _node_rule_43(self, data, tags, keys, err, sets):
         if ('hires' in keys):
             match = False
             if not match:
@@ -871,7 +909,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("não se deve utilizar {0} para demarcar áreas de cobertura de imagem","{0.key}")
                 err.append({'class': 9018023, 'subclass': 895278192, 'text': mapcss.tr('não se deve utilizar {0} para demarcar áreas de cobertura de imagem', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # node[man_made=tower]["tower:type"=lighting][inside("BR")]
+    # node[man_made=tower]["tower:type"=lighting][inside("BR")]
+    def _node_rule_44(self, data, tags, keys, err, sets):
         if ('man_made' in keys and 'tower:type' in keys):
             match = False
             if not match:
@@ -887,8 +926,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['man_made','mast']])
                 }})
 
-        # *[tourism=motel][amenity!=love_hotel][inside("BR")]
-        # *[name=~/(?i)\bmotel\b/][amenity!=love_hotel][inside("BR")]
+    # *[tourism=motel][amenity!=love_hotel][inside("BR")]
+    # *[name=~/(?i)\bmotel\b/][amenity!=love_hotel][inside("BR")]
+    def _node_rule_45(self, data, tags, keys, err, sets):
         if ('name' in keys) or ('tourism' in keys):
             match = False
             if not match:
@@ -908,7 +948,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{1.key}={1.value}')).split('=', 1)])
                 }})
 
-        # *[amenity=love_hotel][tourism][tourism!=motel][inside("BR")]
+    # *[amenity=love_hotel][tourism][tourism!=motel][inside("BR")]
+    def _node_rule_46(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'tourism' in keys):
             match = False
             if not match:
@@ -920,7 +961,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("provavelmente deve ser ''{0}={1}''","{2.key}","{2.value}")
                 err.append({'class': 9018002, 'subclass': 1760828878, 'text': mapcss.tr('provavelmente deve ser \'\'{0}={1}\'\'', mapcss._tag_uncapture(capture_tags, '{2.key}'), mapcss._tag_uncapture(capture_tags, '{2.value}'))})
 
-        # *[name=~/(?i)^motel\b/][tourism!=motel][inside("BR")]
+    # *[name=~/(?i)^motel\b/][tourism!=motel][inside("BR")]
+    def _node_rule_47(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -933,8 +975,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"tourism=motel"
                 err.append({'class': 9018002, 'subclass': 1456128106, 'text': mapcss.tr('motel classificado incorretamente')})
 
-        # *[aeroway=aerodrome][name=~/(?i).*airport$/][inside("BR")]
-        # *[aeroway=helipad][name=~/(?i).*heliport$/][inside("BR")]
+    # *[aeroway=aerodrome][name=~/(?i).*airport$/][inside("BR")]
+    # *[aeroway=helipad][name=~/(?i).*heliport$/][inside("BR")]
+    def _node_rule_48(self, data, tags, keys, err, sets):
         if ('aeroway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -950,8 +993,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} com nome em inglês","{0.tag}")
                 err.append({'class': 9018002, 'subclass': 1743601177, 'text': mapcss.tr('{0} com nome em inglês', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[aeroway=aerodrome][name=~/(?i)^Aer(ódromo|oporto) de.*/][inside("BR")]
-        # *[aeroway=helipad][name=~/(?i)^Helipo(n|r)to.*/][inside("BR")]
+    # *[aeroway=aerodrome][name=~/(?i)^Aer(ódromo|oporto) de.*/][inside("BR")]
+    # *[aeroway=helipad][name=~/(?i)^Helipo(n|r)to.*/][inside("BR")]
+    def _node_rule_49(self, data, tags, keys, err, sets):
         if ('aeroway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -967,7 +1011,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("conferir se existe nome oficial do {0}","{0.value}")
                 err.append({'class': 9018002, 'subclass': 136467214, 'text': mapcss.tr('conferir se existe nome oficial do {0}', mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[aeroway=aerodrome][ref][inside("BR")]
+    # *[aeroway=aerodrome][ref][inside("BR")]
+    def _node_rule_50(self, data, tags, keys, err, sets):
         if ('aeroway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -979,10 +1024,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("''{0}'' não faz sentido em aeroporto","{1.key}")
                 err.append({'class': 9018002, 'subclass': 1633437696, 'text': mapcss.tr('\'\'{0}\'\' não faz sentido em aeroporto', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # node[surface][!traffic_calming][inside("BR")]
-        # Rule Blacklisted (id: 282605167)
+    # node[surface][!traffic_calming][inside("BR")]
+    # Rule Blacklisted (id: 282605167)
 
-        # *[waterway][layer<0][!tunnel][inside("BR")]
+    # *[waterway][layer<0][!tunnel][inside("BR")]
+    def _node_rule_51(self, data, tags, keys, err, sets):
         if ('layer' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -994,7 +1040,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} negativo de {1} com ausência de {2}","{1.key}","{0.key}","{2.key}")
                 err.append({'class': 9018002, 'subclass': 203420779, 'text': mapcss.tr('{0} negativo de {1} com ausência de {2}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[waterway][layer>0][!bridge][inside("BR")]
+    # *[waterway][layer>0][!bridge][inside("BR")]
+    def _node_rule_52(self, data, tags, keys, err, sets):
         if ('layer' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -1006,10 +1053,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} positivo de {1} com ausência de {2}","{1.key}","{0.key}","{2.key}")
                 err.append({'class': 9018002, 'subclass': 1870051659, 'text': mapcss.tr('{0} positivo de {1} com ausência de {2}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[layer][!building][!highway][man_made!=pipeline][!railway][!waterway][power!=line][inside("BR")]
-        # Rule Blacklisted (id: 39095837)
+    # *[layer][!building][!highway][man_made!=pipeline][!railway][!waterway][power!=line][inside("BR")]
+    # Rule Blacklisted (id: 39095837)
 
-        # *[name=~/^(?i)(?u)edifício.*/][!building][inside("BR")]
+    # *[name=~/^(?i)(?u)edifício.*/][!building][inside("BR")]
+    def _node_rule_53(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -1020,7 +1068,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("possível ausência de tag {0}","{1.key}")
                 err.append({'class': 9018026, 'subclass': 1332986859, 'text': mapcss.tr('possível ausência de tag {0}', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[route=ferry][!duration][inside("BR")]
+    # *[route=ferry][!duration][inside("BR")]
+    def _node_rule_54(self, data, tags, keys, err, sets):
         if ('route' in keys):
             match = False
             if not match:
@@ -1031,8 +1080,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("ausência do tempo de duração ({0}) da balsa","{1.key}")
                 err.append({'class': 9018027, 'subclass': 1343391603, 'text': mapcss.tr('ausência do tempo de duração ({0}) da balsa', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[name=~/^(?i)(?u)praça.*/][!leisure][landuse=~/^(forest|grass|greenfield|meadow|orchard)$/][inside("BR")]
-        # *[name=~/^(?i)(?u)praça.*/][!leisure][natural=~/^(grassland|heath|scrub|wood)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)praça.*/][!leisure][landuse=~/^(forest|grass|greenfield|meadow|orchard)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)praça.*/][!leisure][natural=~/^(grassland|heath|scrub|wood)$/][inside("BR")]
+    def _node_rule_55(self, data, tags, keys, err, sets):
         if ('landuse' in keys and 'name' in keys) or ('name' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -1048,7 +1098,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"leisure=park"
                 err.append({'class': 9018029, 'subclass': 181066872, 'text': mapcss.tr('possível definição incorreta para praça: \'\'{0}\'\'', mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[wikipedia][wikipedia!~/^pt:/][inside("BR")]
+    # *[wikipedia][wikipedia!~/^pt:/][inside("BR")]
+    def _node_rule_56(self, data, tags, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -1059,19 +1110,20 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("utilizar prefixo em português (pt:) para {0}","{0.key}")
                 err.append({'class': 9018030, 'subclass': 1431112366, 'text': mapcss.tr('utilizar prefixo em português (pt:) para {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[name=~/.*\(.*\).*/][inside("BR")]
-        # Rule Blacklisted (id: 2146320716)
+    # *[name=~/.*\(.*\).*/][inside("BR")]
+    # Rule Blacklisted (id: 2146320716)
 
-        # *[name=~/ - /][inside("BR")]
-        # Rule Blacklisted (id: 1840875080)
+    # *[name=~/ - /][inside("BR")]
+    # Rule Blacklisted (id: 1840875080)
 
-        # *[name=~/, /][inside("BR")]
-        # Rule Blacklisted (id: 1508736498)
+    # *[name=~/, /][inside("BR")]
+    # Rule Blacklisted (id: 1508736498)
 
-        # *[name=~/: /][inside("BR")]
-        # Rule Blacklisted (id: 877403916)
+    # *[name=~/: /][inside("BR")]
+    # Rule Blacklisted (id: 877403916)
 
-        # *[name=~/ ou /][inside("BR")]
+    # *[name=~/ ou /][inside("BR")]
+    def _node_rule_57(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -1083,10 +1135,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"name e alt_name"
                 err.append({'class': 9018031, 'subclass': 115703372, 'text': mapcss.tr('nome utilizado de forma incorreta')})
 
-        # node[admin_level][!capital][inside("BR")]
-        # node[border_type][inside("BR")]
-        # node[boundary][inside("BR")]
-        # node[type=boundary][inside("BR")]
+    # node[admin_level][!capital][inside("BR")]
+    # node[border_type][inside("BR")]
+    # node[boundary][inside("BR")]
+    # node[type=boundary][inside("BR")]
+    def _node_rule_58(self, data, tags, keys, err, sets):
         if ('admin_level' in keys) or ('border_type' in keys) or ('boundary' in keys) or ('type' in keys):
             match = False
             if not match:
@@ -1109,9 +1162,10 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwError:tr("nó não deve possuir {0}","{0.tag}")
                 err.append({'class': 9018032, 'subclass': 90903508, 'text': mapcss.tr('nó não deve possuir {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[boundary=national_park][!name][inside("BR")]
-        # *[boundary=protected_area][!name][inside("BR")]
-        # *[leisure=nature_reserve][!name][inside("BR")]
+    # *[boundary=national_park][!name][inside("BR")]
+    # *[boundary=protected_area][!name][inside("BR")]
+    # *[leisure=nature_reserve][!name][inside("BR")]
+    def _node_rule_59(self, data, tags, keys, err, sets):
         if ('boundary' in keys) or ('leisure' in keys):
             match = False
             if not match:
@@ -1130,7 +1184,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve possuir {1}","{0.tag}","{1.key}")
                 err.append({'class': 9018033, 'subclass': 1196875584, 'text': mapcss.tr('{0} deve possuir {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[boundary=protected_area][!protect_class][inside("BR")]
+    # *[boundary=protected_area][!protect_class][inside("BR")]
+    def _node_rule_60(self, data, tags, keys, err, sets):
         if ('boundary' in keys):
             match = False
             if not match:
@@ -1141,7 +1196,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve possuir {1}","{0.tag}","{1.key}")
                 err.append({'class': 9018033, 'subclass': 1593244126, 'text': mapcss.tr('{0} deve possuir {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[protect_class][protect_class!~/^(1(a|b)?|[1-9][0-9]?)$/][inside("BR")]
+    # *[protect_class][protect_class!~/^(1(a|b)?|[1-9][0-9]?)$/][inside("BR")]
+    def _node_rule_61(self, data, tags, keys, err, sets):
         if ('protect_class' in keys):
             match = False
             if not match:
@@ -1152,7 +1208,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("valor incorreto para {0}","{0.key}")
                 err.append({'class': 9018034, 'subclass': 1183781531, 'text': mapcss.tr('valor incorreto para {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[protect_class][boundary!=protected_area][inside("BR")]
+    # *[protect_class][boundary!=protected_area][inside("BR")]
+    def _node_rule_62(self, data, tags, keys, err, sets):
         if ('protect_class' in keys):
             match = False
             if not match:
@@ -1163,7 +1220,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("ausência de boundary=protected_area")
                 err.append({'class': 9018035, 'subclass': 1649283274, 'text': mapcss.tr('ausência de boundary=protected_area')})
 
-        # node[destination][inside("BR")]
+    # node[destination][inside("BR")]
+    def _node_rule_63(self, data, tags, keys, err, sets):
         if ('destination' in keys):
             match = False
             if not match:
@@ -1174,7 +1232,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve ser usado apenas em ways","{0.key}")
                 err.append({'class': 9018036, 'subclass': 878235238, 'text': mapcss.tr('{0} deve ser usado apenas em ways', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # node[exit_to][inside("BR")]
+    # node[exit_to][inside("BR")]
+    def _node_rule_64(self, data, tags, keys, err, sets):
         if ('exit_to' in keys):
             match = False
             if not match:
@@ -1185,7 +1244,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("utilize ''destination'' no caminho de saída ao invés de ''exit_to''")
                 err.append({'class': 9018037, 'subclass': 1738747667, 'text': mapcss.tr('utilize \'\'destination\'\' no caminho de saída ao invés de \'\'exit_to\'\'')})
 
-        # node[highway=motorway_junction][ref][ref!~/^[0-9]+( |-)*([A-Z])?$/][inside("BR")]
+    # node[highway=motorway_junction][ref][ref!~/^[0-9]+( |-)*([A-Z])?$/][inside("BR")]
+    def _node_rule_65(self, data, tags, keys, err, sets):
         if ('highway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -1197,7 +1257,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("saída de rodovia ({0}) fora do padrão","{1.key}")
                 err.append({'class': 9018002, 'subclass': 1001734093, 'text': mapcss.tr('saída de rodovia ({0}) fora do padrão', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # node[highway=motorway_junction][name][inside("BR")]
+    # node[highway=motorway_junction][name][inside("BR")]
+    def _node_rule_66(self, data, tags, keys, err, sets):
         if ('highway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -1209,7 +1270,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} geralmente não possui nome; use ''destination'' no caminho de saída","{0.tag}")
                 err.append({'class': 9018002, 'subclass': 625356625, 'text': mapcss.tr('{0} geralmente não possui nome; use \'\'destination\'\' no caminho de saída', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[junction][inside("BR")]
+    # node[junction][inside("BR")]
+    def _node_rule_67(self, data, tags, keys, err, sets):
         if ('junction' in keys):
             match = False
             if not match:
@@ -1223,7 +1285,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"highway=turning_circle"
                 err.append({'class': 9018002, 'subclass': 1621901547, 'text': mapcss.tr('junção ({0}) em um nó', mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[name=~/.* D(a|e|o)s? .*/][inside("BR")]
+    # *[name=~/.* D(a|e|o)s? .*/][inside("BR")]
+    def _node_rule_68(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -1235,7 +1298,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("''da'', ''de'' e ''do'' são minúsculos nos nomes em português")
                 err.append({'class': 9018002, 'subclass': 874509528, 'text': mapcss.tr('\'\'da\'\', \'\'de\'\' e \'\'do\'\' são minúsculos nos nomes em português')})
 
-        # *[name=~/^[a-z].*/][inside("BR")]
+    # *[name=~/^[a-z].*/][inside("BR")]
+    def _node_rule_69(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -1247,7 +1311,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("nome iniciando com letra minúscula")
                 err.append({'class': 9018002, 'subclass': 2073274467, 'text': mapcss.tr('nome iniciando com letra minúscula')})
 
-        # *[alt_ref][inside("BR")]
+    # *[alt_ref][inside("BR")]
+    def _node_rule_70(self, data, tags, keys, err, sets):
         if ('alt_ref' in keys):
             match = False
             if not match:
@@ -1259,7 +1324,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"ref"
                 err.append({'class': 9018039, 'subclass': 836388143, 'text': mapcss.tr('o conteúdo de {0} deve fazer parte de ref, separado por ;', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[surface][eval(number_of_tags())=1][inside("BR")]
+    # *[surface][eval(number_of_tags())=1][inside("BR")]
+    def _node_rule_71(self, data, tags, keys, err, sets):
         if ('surface' in keys):
             match = False
             if not match:
@@ -1270,8 +1336,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto incompleto: possui apenas {0}","{0.key}")
                 err.append({'class': 9018041, 'subclass': 411244066, 'text': mapcss.tr('objeto incompleto: possui apenas {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[name][surface][eval(number_of_tags())=2][inside("BR")]
-        # *[name][website][eval(number_of_tags())=2][inside("BR")]
+    # *[name][surface][eval(number_of_tags())=2][inside("BR")]
+    # *[name][website][eval(number_of_tags())=2][inside("BR")]
+    def _node_rule_72(self, data, tags, keys, err, sets):
         if ('name' in keys and 'surface' in keys) or ('name' in keys and 'website' in keys):
             match = False
             if not match:
@@ -1286,7 +1353,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto incompleto: possui apenas {0} e {1}","{0.key}","{1.key}")
                 err.append({'class': 9018042, 'subclass': 585137381, 'text': mapcss.tr('objeto incompleto: possui apenas {0} e {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # node[natural=peak][name=~/(?i)\b[0-9]+ ?m?\b/][inside("BR")]
+    # node[natural=peak][name=~/(?i)\b[0-9]+ ?m?\b/][inside("BR")]
+    def _node_rule_73(self, data, tags, keys, err, sets):
         if ('name' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -1299,7 +1367,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"ele"
                 err.append({'class': 9018002, 'subclass': 907675189, 'text': mapcss.tr('nome não deve conter a elevação do pico')})
 
-        # *[leisure=pitch][sport=tennis][surface=unpaved][inside("BR")]
+    # *[leisure=pitch][sport=tennis][surface=unpaved][inside("BR")]
+    def _node_rule_74(self, data, tags, keys, err, sets):
         if ('leisure' in keys and 'sport' in keys and 'surface' in keys):
             match = False
             if not match:
@@ -1316,7 +1385,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['surface','clay']])
                 }})
 
-        # *[amenity=fuel][name=~/(?i)(?u)\b(Ale|BR|Esso|Ipiranga|Petrobr(á|a)s|Shell|Texaco)\b/][inside("BR")]
+    # *[amenity=fuel][name=~/(?i)(?u)\b(Ale|BR|Esso|Ipiranga|Petrobr(á|a)s|Shell|Texaco)\b/][inside("BR")]
+    def _node_rule_75(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -1329,7 +1399,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"brand"
                 err.append({'class': 9018002, 'subclass': 1724035987, 'text': mapcss.tr('o nome não deve conter a bandeira/marca do posto')})
 
-        # *[amenity=fuel][brand=BR][inside("BR")]
+    # *[amenity=fuel][brand=BR][inside("BR")]
+    def _node_rule_76(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'brand' in keys):
             match = False
             if not match:
@@ -1346,7 +1417,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['brand','Petrobras']])
                 }})
 
-        # *[shop=gas][name=~/(?i)(?u)^(Brasilg(á|a)s|Consigaz|Copagaz|Liquig(á|a)s|Minasg(á|a)s|Nacional G(á|a)s|Supergasbras|Ultragaz)$/][inside("BR")]
+    # *[shop=gas][name=~/(?i)(?u)^(Brasilg(á|a)s|Consigaz|Copagaz|Liquig(á|a)s|Minasg(á|a)s|Nacional G(á|a)s|Supergasbras|Ultragaz)$/][inside("BR")]
+    def _node_rule_77(self, data, tags, keys, err, sets):
         if ('name' in keys and 'shop' in keys):
             match = False
             if not match:
@@ -1359,7 +1431,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"brand"
                 err.append({'class': 9018002, 'subclass': 867102166, 'text': mapcss.tr('o nome não deve conter a bandeira/marca da loja')})
 
-        # *[/_[0-9]$/][!"is_in:iso_3166_2"][inside("BR")]
+    # *[/_[0-9]$/][!"is_in:iso_3166_2"][inside("BR")]
+    def _node_rule_78(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -1370,7 +1443,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwError:tr("chave inválida: {0}","{0.key}")
                 err.append({'class': 9018022, 'subclass': 231229079, 'text': mapcss.tr('chave inválida: {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][!note][inside("BR")]
+    # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][!note][inside("BR")]
+    def _node_rule_79(self, data, tags, keys, err, sets):
         if ('addr:housenumber' in keys):
             match = False
             if not match:
@@ -1390,7 +1464,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     'addr:housenumber'])
                 }})
 
-        # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][note][inside("BR")]
+    # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][note][inside("BR")]
+    def _node_rule_80(self, data, tags, keys, err, sets):
         if ('addr:housenumber' in keys and 'note' in keys):
             match = False
             if not match:
@@ -1402,7 +1477,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"note"
                 err.append({'class': 9018043, 'subclass': 1150070765, 'text': mapcss.tr('não utilizar \'\'{0}\'\' para locais sem número', mapcss.tag(tags, 'addr:housenumber'))})
 
-        # *[source=~/(?i)google/][inside("BR")]
+    # *[source=~/(?i)google/][inside("BR")]
+    def _node_rule_81(self, data, tags, keys, err, sets):
         if ('source' in keys):
             match = False
             if not match:
@@ -1413,7 +1489,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwError:tr("objeto contém Google como source")
                 err.append({'class': 9018044, 'subclass': 1159310436, 'text': mapcss.tr('objeto contém Google como source')})
 
-        # *[amenity=townhall][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    # *[amenity=townhall][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    def _node_rule_82(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -1426,7 +1503,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"office=government + government=legislative"
                 err.append({'class': 9018002, 'subclass': 532372413, 'text': mapcss.tr('câmara de vereadores mapeada incorretamente')})
 
-        # *[office=government][government!=legislative][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    # *[office=government][government!=legislative][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    def _node_rule_83(self, data, tags, keys, err, sets):
         if ('name' in keys and 'office' in keys):
             match = False
             if not match:
@@ -1438,8 +1516,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("ausência de government=legislative")
                 err.append({'class': 9018002, 'subclass': 2126685099, 'text': mapcss.tr('ausência de government=legislative')})
 
-        # *[amenity=townhall][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
-        # *[office=government][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    # *[amenity=townhall][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    # *[office=government][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    def _node_rule_84(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'name' in keys) or ('name' in keys and 'office' in keys):
             match = False
             if not match:
@@ -1455,7 +1534,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("erro de ortografia em ''câmara''")
                 err.append({'class': 9018002, 'subclass': 1277153079, 'text': mapcss.tr('erro de ortografia em \'\'câmara\'\'')})
 
-        # *[name=~/(?i)^prefeitura\b/][amenity!=townhall][inside("BR")]
+    # *[name=~/(?i)^prefeitura\b/][amenity!=townhall][inside("BR")]
+    def _node_rule_85(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -1468,7 +1548,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"amenity=townhall"
                 err.append({'class': 9018002, 'subclass': 1445137044, 'text': mapcss.tr('prefeitura possivelmente mapeada de forma incorreta')})
 
-        # *[name=~/(?i)(?u)^paço\b/][amenity!=townhall][inside("BR")]
+    # *[name=~/(?i)(?u)^paço\b/][amenity!=townhall][inside("BR")]
+    def _node_rule_86(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -1481,7 +1562,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"amenity=townhall"
                 err.append({'class': 9018002, 'subclass': 1169494638, 'text': mapcss.tr('paço possivelmente mapeado de forma incorreta')})
 
-        # *[amenity=charging_station][inside("BR")]
+    # *[amenity=charging_station][inside("BR")]
+    def _node_rule_87(self, data, tags, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -1493,7 +1575,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("possivelmente deve ser amenity=fuel")
                 err.append({'class': 9018002, 'subclass': 2011797637, 'text': mapcss.tr('possivelmente deve ser amenity=fuel')})
 
-        # *[name=~/(?i)^Borrach(aria|eiro)/][shop=tyres][!repair][inside("BR")]
+    # *[name=~/(?i)^Borrach(aria|eiro)/][shop=tyres][!repair][inside("BR")]
+    def _node_rule_88(self, data, tags, keys, err, sets):
         if ('name' in keys and 'shop' in keys):
             match = False
             if not match:
@@ -1506,7 +1589,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"repair=yes"
                 err.append({'class': 9018002, 'subclass': 1225518759, 'text': mapcss.tr('borracharia sem \'\'repair=yes\'\'')})
 
-        # *[name=~/(?i)^Borrach(aria|eiro)/][shop!=tyres][inside("BR")]
+    # *[name=~/(?i)^Borrach(aria|eiro)/][shop!=tyres][inside("BR")]
+    def _node_rule_89(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -1519,7 +1603,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"shop=tyres"
                 err.append({'class': 9018002, 'subclass': 755877630, 'text': mapcss.tr('borracharia sem \'\'shop=tyres\'\'')})
 
-        # *[name=~/(?i)\bcoreto\b/][leisure!=bandstand][leisure!=park][inside("BR")]
+    # *[name=~/(?i)\bcoreto\b/][leisure!=bandstand][leisure!=park][inside("BR")]
+    def _node_rule_90(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -1532,7 +1617,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"leisure=bandstand"
                 err.append({'class': 9018002, 'subclass': 810497942, 'text': mapcss.tr('coreto possivelmente classificado de forma incorreta')})
 
-        # *[leisure=recreation_ground][inside("BR")]
+    # *[leisure=recreation_ground][inside("BR")]
+    def _node_rule_91(self, data, tags, keys, err, sets):
         if ('leisure' in keys):
             match = False
             if not match:
@@ -1546,7 +1632,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"leisure=park"
                 err.append({'class': 9018002, 'subclass': 1594563801, 'text': mapcss.tr('{0} impreciso', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[leisure=recreation_ground][landuse=recreation_ground][inside("BR")]
+    # *[leisure=recreation_ground][landuse=recreation_ground][inside("BR")]
+    def _node_rule_92(self, data, tags, keys, err, sets):
         if ('landuse' in keys and 'leisure' in keys):
             match = False
             if not match:
@@ -1562,7 +1649,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     'leisure'])
                 }})
 
-        # *["ref:vatin"]["ref:vatin"!~/^BR[0-9]{14}$/][inside("BR")]
+    # *["ref:vatin"]["ref:vatin"!~/^BR[0-9]{14}$/][inside("BR")]
+    def _node_rule_93(self, data, tags, keys, err, sets):
         if ('ref:vatin' in keys):
             match = False
             if not match:
@@ -1574,7 +1662,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("CNPJ diferente do formato BRxxxxxxxxxxxxxx")
                 err.append({'class': 9018002, 'subclass': 1793026117, 'text': mapcss.tr('CNPJ diferente do formato BRxxxxxxxxxxxxxx')})
 
-        # *["ref:vatin"=~/^[0-9]{2}\.[0-9]{3}\.[0-9]{3}\/[0-9]{4}-[0-9]{2}$/][inside("BR")]
+    # *["ref:vatin"=~/^[0-9]{2}\.[0-9]{3}\.[0-9]{3}\/[0-9]{4}-[0-9]{2}$/][inside("BR")]
+    def _node_rule_94(self, data, tags, keys, err, sets):
         if ('ref:vatin' in keys):
             match = False
             if not match:
@@ -1590,7 +1679,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss.concat('ref:vatin=BR', mapcss.replace(mapcss.replace(mapcss.replace(mapcss.tag(tags, 'ref:vatin'), '/', ''), '.', ''), '-', ''))).split('=', 1)])
                 }})
 
-        # *["ref:vatin"=~/^(br|bR|Br)[0-9]{14}$/][inside("BR")]
+    # *["ref:vatin"=~/^(br|bR|Br)[0-9]{14}$/][inside("BR")]
+    def _node_rule_95(self, data, tags, keys, err, sets):
         if ('ref:vatin' in keys):
             match = False
             if not match:
@@ -1606,8 +1696,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss.concat('ref:vatin=', mapcss.upper(mapcss.tag(tags, 'ref:vatin')))).split('=', 1)])
                 }})
 
-        # *[phone][phone!~/^(\+55|0800)/][inside("BR")]
-        # *["contact:phone"]["contact:phone"!~/^(\+55|0800)/][inside("BR")]
+    # *[phone][phone!~/^(\+55|0800)/][inside("BR")]
+    # *["contact:phone"]["contact:phone"!~/^(\+55|0800)/][inside("BR")]
+    def _node_rule_96(self, data, tags, keys, err, sets):
         if ('contact:phone' in keys) or ('phone' in keys):
             match = False
             if not match:
@@ -1623,8 +1714,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} em formato diferente do internacional +55 XX YYYY-YYYY","{0.key}")
                 err.append({'class': 9018002, 'subclass': 1438682200, 'text': mapcss.tr('{0} em formato diferente do internacional +55 XX YYYY-YYYY', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[phone=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
-        # *["contact:phone"=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    # *[phone=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    # *["contact:phone"=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    def _node_rule_97(self, data, tags, keys, err, sets):
         if ('contact:phone' in keys) or ('phone' in keys):
             match = False
             if not match:
@@ -1644,18 +1736,120 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['addr:street']),
+        (_node_rule_1, ['name']),
+        (_node_rule_2, ['name']),
+        (_node_rule_3, ['name']),
+        (_node_rule_4, ['leisure']),
+        (_node_rule_5, ['name']),
+        (_node_rule_6, ['amenity']),
+        (_node_rule_7, ['name']),
+        (_node_rule_8, ['name']),
+        (_node_rule_9, ['designation', 'name', 'ref']),
+        (_node_rule_10, ['source']),
+        (_node_rule_11, ['name']),
+        (_node_rule_12, ['maxheight', 'maxspeed']),
+        (_node_rule_13, ['noname']),
+        (_node_rule_14, ['designation']),
+        (_node_rule_15, ['highway']),
+        (_node_rule_16, ['place']),
+        (_node_rule_17, ['place']),
+        (_node_rule_18, ['place']),
+        (_node_rule_19, ['place']),
+        (_node_rule_20, ['addr:city', 'addr:suburb']),
+        (_node_rule_21, ['addr:city']),
+        (_node_rule_22, ['name']),
+        (_node_rule_23, ['name']),
+        (_node_rule_24, ['place']),
+        (_node_rule_25, ['iata']),
+        (_node_rule_26, ['amenity']),
+        (_node_rule_27, ['amenity']),
+        (_node_rule_28, ['amenity']),
+        (_node_rule_29, ['amenity']),
+        (_node_rule_30, ['amenity']),
+        (_node_rule_31, ['amenity']),
+        (_node_rule_32, ['highway']),
+        (_node_rule_33, ['highway']),
+        (_node_rule_34, ['crossing']),
+        (_node_rule_35, ['aeroway']),
+        (_node_rule_36, ['access']),
+        (_node_rule_37, ['addr:postcode']),
+        (_node_rule_38, ['postal_code']),
+        (_node_rule_39, ['alt_source']),
+        (_node_rule_40, ['landuse']),
+        (_node_rule_41, ['long_name']),
+        (_node_rule_42, ['building:levels']),
+        (_node_rule_43, ['hires']),
+        (_node_rule_44, ['man_made']),
+        (_node_rule_45, ['name', 'tourism']),
+        (_node_rule_46, ['amenity']),
+        (_node_rule_47, ['name']),
+        (_node_rule_48, ['aeroway']),
+        (_node_rule_49, ['aeroway']),
+        (_node_rule_50, ['aeroway']),
+        (_node_rule_51, ['layer']),
+        (_node_rule_52, ['layer']),
+        (_node_rule_53, ['name']),
+        (_node_rule_54, ['route']),
+        (_node_rule_55, ['landuse', 'name']),
+        (_node_rule_56, ['wikipedia']),
+        (_node_rule_57, ['name']),
+        (_node_rule_58, ['admin_level', 'border_type', 'boundary', 'type']),
+        (_node_rule_59, ['boundary', 'leisure']),
+        (_node_rule_60, ['boundary']),
+        (_node_rule_61, ['protect_class']),
+        (_node_rule_62, ['protect_class']),
+        (_node_rule_63, ['destination']),
+        (_node_rule_64, ['exit_to']),
+        (_node_rule_65, ['highway']),
+        (_node_rule_66, ['highway']),
+        (_node_rule_67, ['junction']),
+        (_node_rule_68, ['name']),
+        (_node_rule_69, ['name']),
+        (_node_rule_70, ['alt_ref']),
+        (_node_rule_71, ['surface']),
+        (_node_rule_72, ['name']),
+        (_node_rule_73, ['name']),
+        (_node_rule_74, ['leisure']),
+        (_node_rule_75, ['amenity']),
+        (_node_rule_76, ['amenity']),
+        (_node_rule_77, ['name']),
+        (_node_rule_78, None),
+        (_node_rule_79, ['addr:housenumber']),
+        (_node_rule_80, ['addr:housenumber']),
+        (_node_rule_81, ['source']),
+        (_node_rule_82, ['amenity']),
+        (_node_rule_83, ['name']),
+        (_node_rule_84, ['amenity', 'name']),
+        (_node_rule_85, ['name']),
+        (_node_rule_86, ['name']),
+        (_node_rule_87, ['amenity']),
+        (_node_rule_88, ['name']),
+        (_node_rule_89, ['name']),
+        (_node_rule_90, ['name']),
+        (_node_rule_91, ['leisure']),
+        (_node_rule_92, ['landuse']),
+        (_node_rule_93, ['ref:vatin']),
+        (_node_rule_94, ['ref:vatin']),
+        (_node_rule_95, ['ref:vatin']),
+        (_node_rule_96, ['contact:phone', 'phone']),
+        (_node_rule_97, ['contact:phone', 'phone']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
+    # way[name=*ref][highway][inside("BR")]
+    # Rule Blacklisted (id: 995006835)
 
-        # way[name=*ref][highway][inside("BR")]
-        # Rule Blacklisted (id: 995006835)
-
-        # way[highway][name=~/\b[A-Z]{2,4} (- )?[0-9]{2,3}\b/][inside("BR")]
+    # way[highway][name=~/\b[A-Z]{2,4} (- )?[0-9]{2,3}\b/][inside("BR")]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -1667,8 +1861,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("rodovia com ref no nome")
                 err.append({'class': 9018002, 'subclass': 457207682, 'text': mapcss.tr('rodovia com ref no nome')})
 
-        # way[highway=cycleway][name][name!~/^(?i)ciclovia .*/][inside("BR")]
-        # way[highway][highway!~/bridleway|bus_stop|cycleway|crossing|footway|give_way|motorway_junction|path|raceway|rest_area|services|speed_camera|steps|stop/][name][name!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodoanel|Rodovia|Rotatória|Rótula|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    # way[highway=cycleway][name][name!~/^(?i)ciclovia .*/][inside("BR")]
+    # way[highway][highway!~/bridleway|bus_stop|cycleway|crossing|footway|give_way|motorway_junction|path|raceway|rest_area|services|speed_camera|steps|stop/][name][name!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodoanel|Rodovia|Rotatória|Rótula|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -1684,7 +1879,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} com logradouro ausente, errado ou abreviado","{0.key}")
                 err.append({'class': 9018002, 'subclass': 20071126, 'text': mapcss.tr('{0} com logradouro ausente, errado ou abreviado', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *["addr:street"]["addr:street"!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodovia|Rotatória|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    # *["addr:street"]["addr:street"!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodovia|Rotatória|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('addr:street' in keys):
             match = False
             if not match:
@@ -1696,7 +1892,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} com logradouro ausente, errado ou abreviado","{0.key}")
                 err.append({'class': 9018002, 'subclass': 279840772, 'text': mapcss.tr('{0} com logradouro ausente, errado ou abreviado', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[highway][name][name=~/\./]
+    # way[highway][name][name=~/\./]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -1708,7 +1905,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("Rua com nome abreviado; procurar nome completo nas camadas de nomes")
                 err.append({'class': 9018002, 'subclass': 2131010585, 'text': mapcss.tr('Rua com nome abreviado; procurar nome completo nas camadas de nomes')})
 
-        # *[!highway][route!=road][!public_transport][type!~/route|street/][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|passarela|rodovia|rotatória|rua|travessa|trevo|viela|(anel|complexo|dispositivo) viário) .*/][name!~/^(?i)estrada de ferro/][inside("BR")]
+    # *[!highway][route!=road][!public_transport][type!~/route|street/][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|passarela|rodovia|rotatória|rua|travessa|trevo|viela|(anel|complexo|dispositivo) viário) .*/][name!~/^(?i)estrada de ferro/][inside("BR")]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -1720,7 +1918,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto com nome de via mas sem tag de {0}","{0.key}")
                 err.append({'class': 9018002, 'subclass': 535280341, 'text': mapcss.tr('objeto com nome de via mas sem tag de {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[highway=track][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|rodovia|rotatória|rua|travessa|trevo|viela) .*/][inside("BR")]
+    # way[highway=track][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|rodovia|rotatória|rua|travessa|trevo|viela) .*/][inside("BR")]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -1733,7 +1932,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"highway=unclassified"
                 err.append({'class': 9018051, 'subclass': 1145810098, 'text': mapcss.tr('não classificar via como {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[name=~/^(?i)(?u)[a-z0-9]+_([a-z0-9]_?)+$/][inside("BR")]
+    # *[name=~/^(?i)(?u)[a-z0-9]+_([a-z0-9]_?)+$/][inside("BR")]
+    def _way_rule_6(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -1745,7 +1945,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("utilizar espaço ao invés de underscore")
                 err.append({'class': 9018002, 'subclass': 1476954926, 'text': mapcss.tr('utilizar espaço ao invés de underscore')})
 
-        # *[name=~/(?i)(^|.* )(Cel|Cmte|Cond|Conj|Dª|Dr|Eng|Gov|Hab|Jd|Jr|Marg|Mun|p\/|Pde|Pe|Pq|Pst|Pref|Profa|Profª|Prof|Res|s\/|Sr(a|ª)?|Sta|Sto|Ver)\.? .*/][inside("BR")]
+    # *[name=~/(?i)(^|.* )(Cel|Cmte|Cond|Conj|Dª|Dr|Eng|Gov|Hab|Jd|Jr|Marg|Mun|p\/|Pde|Pe|Pq|Pst|Pref|Profa|Profª|Prof|Res|s\/|Sr(a|ª)?|Sta|Sto|Ver)\.? .*/][inside("BR")]
+    def _way_rule_7(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -1756,7 +1957,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("palavra abreviada em {0}","{0.key}")
                 err.append({'class': 9018003, 'subclass': 749019091, 'text': mapcss.tr('palavra abreviada em {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[highway][name=~/^(?i)(?u)((via de )?(acesso|ligação)(( (a|à))? propriedade)?|entrada|entroncamento|rampa|retorno|rotat(ó|o)ria|r(ó|o)tula|sa(í|i)da|trevo|estrada( municipal| de terra)?|rua|rodovia|via)( (de acesso|sem nome|projetad(a|o)))?$/][inside("BR")]
+    # way[highway][name=~/^(?i)(?u)((via de )?(acesso|ligação)(( (a|à))? propriedade)?|entrada|entroncamento|rampa|retorno|rotat(ó|o)ria|r(ó|o)tula|sa(í|i)da|trevo|estrada( municipal| de terra)?|rua|rodovia|via)( (de acesso|sem nome|projetad(a|o)))?$/][inside("BR")]
+    def _way_rule_8(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -1769,7 +1971,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"destination"
                 err.append({'class': 9018052, 'subclass': 736885884, 'text': mapcss.tr('{0} com nome supérfluo/incompleto', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[leisure][name=~/^(?i)(?u)(campo|est(á|a)dio|gin(á|a)sio|quadra)( de (futebol|esportes?))?$/][inside("BR")]
+    # *[leisure][name=~/^(?i)(?u)(campo|est(á|a)dio|gin(á|a)sio|quadra)( de (futebol|esportes?))?$/][inside("BR")]
+    def _way_rule_9(self, data, tags, nds, keys, err, sets):
         if ('leisure' in keys and 'name' in keys):
             match = False
             if not match:
@@ -1780,7 +1983,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("nome supérfluo/incompleto de local de lazer")
                 err.append({'class': 9018004, 'subclass': 1485441713, 'text': mapcss.tr('nome supérfluo/incompleto de local de lazer')})
 
-        # *[name=~/^(?i)(?u)((Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF|hospital)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)((Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF|hospital)$/][inside("BR")]
+    def _way_rule_10(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -1791,7 +1995,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("nome supérfluo/incompleto de local de saúde")
                 err.append({'class': 9018005, 'subclass': 1497769259, 'text': mapcss.tr('nome supérfluo/incompleto de local de saúde')})
 
-        # *[amenity=~/^(clinic|doctors|hospital)$/][name=~/(?i)\bsaude\b/][inside("BR")]
+    # *[amenity=~/^(clinic|doctors|hospital)$/][name=~/(?i)\bsaude\b/][inside("BR")]
+    def _way_rule_11(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -1803,7 +2008,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("erro de ortografia em ''saúde''")
                 err.append({'class': 9018002, 'subclass': 1962359328, 'text': mapcss.tr('erro de ortografia em \'\'saúde\'\'')})
 
-        # *[place=farm][name^="Sitio "][inside("BR")]
+    # *[place=farm][name^="Sitio "][inside("BR")]
+    def _way_rule_12(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'place' in keys):
             match = False
             if not match:
@@ -1815,7 +2021,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("faltando acento em ''Sítio''")
                 err.append({'class': 9018002, 'subclass': 653860263, 'text': mapcss.tr('faltando acento em \'\'Sítio\'\'')})
 
-        # *[name=~/^(?i)(?u)(aldeia|borrach(aria|eiro)|bosque|capela|cemit(é|e)rio|c(ó|o)rrego|escola|estacionamento|fazenda|floresta|hospital|igreja|lago|lagoa|mata( nativa)?|praça|parque|parquinho|posto( de gasolina)?|riacho|rio|rodovi(á|a)ria|vila)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)(aldeia|borrach(aria|eiro)|bosque|capela|cemit(é|e)rio|c(ó|o)rrego|escola|estacionamento|fazenda|floresta|hospital|igreja|lago|lagoa|mata( nativa)?|praça|parque|parquinho|posto( de gasolina)?|riacho|rio|rodovi(á|a)ria|vila)$/][inside("BR")]
+    def _way_rule_13(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -1827,10 +2034,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("local com nome supérfluo, incompleto ou descritivo")
                 err.append({'class': 9018002, 'subclass': 1104230922, 'text': mapcss.tr('local com nome supérfluo, incompleto ou descritivo')})
 
-        # *[amenity=parking][name=~/(?i)^Estacionamento /][inside("BR")]
-        # Rule Blacklisted (id: 1322492249)
+    # *[amenity=parking][name=~/(?i)^Estacionamento /][inside("BR")]
+    # Rule Blacklisted (id: 1322492249)
 
-        # way[highway][type=route][inside("BR")]
+    # way[highway][type=route][inside("BR")]
+    def _way_rule_14(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'type' in keys):
             match = False
             if not match:
@@ -1841,10 +2049,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} não deve possuir {1}","{0.key}","{1.tag}")
                 err.append({'class': 9018053, 'subclass': 1158257088, 'text': mapcss.tr('{0} não deve possuir {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[highway][highway!~/bus_stop|milestone|motorway_junction|traffic_signals/][ref][ref!~/^(([A-Z]{2,3}-[0-9]{2,4}|SPM(-| )[0-9]{3} ?(D|E)?|SP(A|D|I)(-| )[0-9]{3}\/[0-9]{3}|[A-Z]{3}-[0-9]{3}\/[0-9]{3});?)+$/][inside("BR")]
-        # Rule Blacklisted (id: 481849808)
+    # way[highway][highway!~/bus_stop|milestone|motorway_junction|traffic_signals/][ref][ref!~/^(([A-Z]{2,3}-[0-9]{2,4}|SPM(-| )[0-9]{3} ?(D|E)?|SP(A|D|I)(-| )[0-9]{3}\/[0-9]{3}|[A-Z]{3}-[0-9]{3}\/[0-9]{3});?)+$/][inside("BR")]
+    # Rule Blacklisted (id: 481849808)
 
-        # way[highway][!ref][name=~/.*([A-Z]{2,3}-[0-9]{2,4}|SPM(-| )[0-9]{3} ?(D|E)?|SP(A|D|I)(-| )[0-9]{3}\/[0-9]{3}|[A-Z]{3}-[0-9]{3}\/[0-9]{3}).*/][inside("BR")]
+    # way[highway][!ref][name=~/.*([A-Z]{2,3}-[0-9]{2,4}|SPM(-| )[0-9]{3} ?(D|E)?|SP(A|D|I)(-| )[0-9]{3}\/[0-9]{3}|[A-Z]{3}-[0-9]{3}\/[0-9]{3}).*/][inside("BR")]
+    def _way_rule_15(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -1856,7 +2065,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("utilizar o código/sigla da rodovia também na tag {0}","{1.key}")
                 err.append({'class': 9018002, 'subclass': 2109205925, 'text': mapcss.tr('utilizar o código/sigla da rodovia também na tag {0}', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[highway][name=~/Rodovia ([A-Z]{2,3}-[0-9]{2,4})/][inside("BR")]
+    # way[highway][name=~/Rodovia ([A-Z]{2,3}-[0-9]{2,4})/][inside("BR")]
+    def _way_rule_16(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -1868,24 +2078,25 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("nome incorreto de rodovia; utilizar o nome oficial ou apenas ref")
                 err.append({'class': 9018002, 'subclass': 718023291, 'text': mapcss.tr('nome incorreto de rodovia; utilizar o nome oficial ou apenas ref')})
 
-        # way[name=*"addr:street"][highway][inside("BR")]
-        # *[designation=*"addr:housename"][inside("BR")]
-        # *[ref=*designation][inside("BR")]
-        # *[ref=*old_ref][inside("BR")]
-        # *[name=*"addr:housename"][inside("BR")]
-        # *[name=*designation][inside("BR")]
-        # *[name=*alt_name][inside("BR")]
-        # *[name=*int_name][inside("BR")]
-        # *[name=*loc_name][inside("BR")]
-        # *[name=*nat_name][inside("BR")]
-        # *[name=*official_name][inside("BR")]
-        # *[name=*old_name][inside("BR")]
-        # *[name=*reg_name][inside("BR")]
-        # *[name=*short_name][inside("BR")]
-        # *[name=*sorting_name][inside("BR")]
-        # Rule Blacklisted (id: 1279481357)
-
-        # *[source=*name][inside("BR")]
+    # way[name=*"addr:street"][highway][inside("BR")]
+    # *[designation=*"addr:housename"][inside("BR")]
+    # *[ref=*designation][inside("BR")]
+    # *[ref=*old_ref][inside("BR")]
+    # *[name=*"addr:housename"][inside("BR")]
+    # *[name=*designation][inside("BR")]
+    # *[name=*alt_name][inside("BR")]
+    # *[name=*int_name][inside("BR")]
+    # *[name=*loc_name][inside("BR")]
+    # *[name=*nat_name][inside("BR")]
+    # *[name=*official_name][inside("BR")]
+    # *[name=*old_name][inside("BR")]
+    # *[name=*reg_name][inside("BR")]
+    # *[name=*short_name][inside("BR")]
+    # *[name=*sorting_name][inside("BR")]
+    # Rule Blacklisted (id: 1279481357)
+
+    # *[source=*name][inside("BR")]
+    def _way_rule_17(self, data, tags, nds, keys, err, sets):
         if ('source' in keys):
             match = False
             if not match:
@@ -1897,7 +2108,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} e {1} são iguais","{0.key}","{0.value}")
                 err.append({'class': 9018002, 'subclass': 470146003, 'text': mapcss.tr('{0} e {1} são iguais', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[name=~/(?i)(?u)((sem (denomina(ç|c)(ã|a)o|nome|sa(i|í)da))|desconhecido|n(ã|a)o conhecido)/][inside("BR")]
+    # *[name=~/(?i)(?u)((sem (denomina(ç|c)(ã|a)o|nome|sa(i|í)da))|desconhecido|n(ã|a)o conhecido)/][inside("BR")]
+    def _way_rule_18(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -1909,7 +2121,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"noname"
                 err.append({'class': 9018007, 'subclass': 1272098213, 'text': mapcss.tr('objeto com nomenclatura incorreta')})
 
-        # *[designation][inside("BR")]
+    # *[designation][inside("BR")]
+    def _way_rule_19(self, data, tags, nds, keys, err, sets):
         if ('designation' in keys):
             match = False
             if not match:
@@ -1922,13 +2135,14 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"name"
                 err.append({'class': 9018009, 'subclass': 1818234763, 'text': mapcss.tr('{0} é uma chave utilizada apenas no Reino Unido', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[highway=~/^(trunk|motorway)$/][!operator][inside("BR")]
-        # Rule Blacklisted (id: 1594044971)
+    # way[highway=~/^(trunk|motorway)$/][!operator][inside("BR")]
+    # Rule Blacklisted (id: 1594044971)
 
-        # way[highway$=_link][name=~/(Alameda|Avenida|Rua|Travessa|Viela) .*/][inside("BR")]
-        # Rule Blacklisted (id: 200264401)
+    # way[highway$=_link][name=~/(Alameda|Avenida|Rua|Travessa|Viela) .*/][inside("BR")]
+    # Rule Blacklisted (id: 200264401)
 
-        # way[highway][name=~/(Alameda|Avenida|Rua|Travessa|Viela) .*/][ref][inside("BR")]
+    # way[highway][name=~/(Alameda|Avenida|Rua|Travessa|Viela) .*/][ref][inside("BR")]
+    def _way_rule_20(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'name' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -1940,7 +2154,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("possível uso desnecessário/errado de ref em {0}={1}","{0.key}",tag("highway"))
                 err.append({'class': 9018002, 'subclass': 227495312, 'text': mapcss.tr('possível uso desnecessário/errado de ref em {0}={1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss.tag(tags, 'highway'))})
 
-        # *[place=~/hamlet|isolated_dwelling|town|village/][population>=100000][inside("BR")]
+    # *[place=~/hamlet|isolated_dwelling|town|village/][population>=100000][inside("BR")]
+    def _way_rule_21(self, data, tags, nds, keys, err, sets):
         if ('place' in keys and 'population' in keys):
             match = False
             if not match:
@@ -1956,7 +2171,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['place','city']])
                 }})
 
-        # *[place=~/city|hamlet|isolated_dwelling|village/][population>=10000][population<100000][inside("BR")]
+    # *[place=~/city|hamlet|isolated_dwelling|village/][population>=10000][population<100000][inside("BR")]
+    def _way_rule_22(self, data, tags, nds, keys, err, sets):
         if ('place' in keys and 'population' in keys):
             match = False
             if not match:
@@ -1972,7 +2188,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['place','town']])
                 }})
 
-        # *[place][place!~/hamlet|island|isolated_dwelling|neighbourhood|suburb|village/][population<10000][inside("BR")]
+    # *[place][place!~/hamlet|island|isolated_dwelling|neighbourhood|suburb|village/][population<10000][inside("BR")]
+    def _way_rule_23(self, data, tags, nds, keys, err, sets):
         if ('place' in keys and 'population' in keys):
             match = False
             if not match:
@@ -1988,14 +2205,15 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['place','village']])
                 }})
 
-        # *[place=city][!population][inside("BR")]
-        # *[place=town][!population][inside("BR")]
-        # *[place=village][!population][inside("BR")]
-        # Rule Blacklisted (id: 339470124)
+    # *[place=city][!population][inside("BR")]
+    # *[place=town][!population][inside("BR")]
+    # *[place=village][!population][inside("BR")]
+    # Rule Blacklisted (id: 339470124)
 
-        # *[place=city][!name][inside("BR")]
-        # *[place=town][!name][inside("BR")]
-        # *[place=village][!name][inside("BR")]
+    # *[place=city][!name][inside("BR")]
+    # *[place=town][!name][inside("BR")]
+    # *[place=village][!name][inside("BR")]
+    def _way_rule_24(self, data, tags, nds, keys, err, sets):
         if ('place' in keys):
             match = False
             if not match:
@@ -2014,8 +2232,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} sem nome","{0.value}")
                 err.append({'class': 9018012, 'subclass': 1473808194, 'text': mapcss.tr('{0} sem nome', mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # area[place=~/village|town|city/]["addr:city"=*name][inside("BR")]
-        # area[place=suburb]["addr:suburb"=*name][inside("BR")]
+    # area[place=~/village|town|city/]["addr:city"=*name][inside("BR")]
+    # area[place=suburb]["addr:suburb"=*name][inside("BR")]
+    def _way_rule_25(self, data, tags, nds, keys, err, sets):
         if ('addr:city' in keys and 'place' in keys) or ('addr:suburb' in keys and 'place' in keys):
             match = False
             if not match:
@@ -2035,7 +2254,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{1.key}')])
                 }})
 
-        # *["addr:city"=~/(,|( |-) ?[A-Z]{2})/][inside("BR")]
+    # *["addr:city"=~/(,|( |-) ?[A-Z]{2})/][inside("BR")]
+    def _way_rule_26(self, data, tags, nds, keys, err, sets):
         if ('addr:city' in keys):
             match = False
             if not match:
@@ -2046,7 +2266,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve conter apenas o nome da cidade","{0.key}")
                 err.append({'class': 9018013, 'subclass': 1479274467, 'text': mapcss.tr('{0} deve conter apenas o nome da cidade', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[name=~/^(?i)(?u)(Faz\.|Fazenda|Sítio|Chácara)/][place][place!~/city|farm|neighbourhood|suburb|town|village/][inside("BR")]
+    # *[name=~/^(?i)(?u)(Faz\.|Fazenda|Sítio|Chácara)/][place][place!~/city|farm|neighbourhood|suburb|town|village/][inside("BR")]
+    def _way_rule_27(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'place' in keys):
             match = False
             if not match:
@@ -2058,7 +2279,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto talvez deva ser {0}=farm","{1.key}")
                 err.append({'class': 9018002, 'subclass': 337742963, 'text': mapcss.tr('objeto talvez deva ser {0}=farm', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[place][name=~/^(?i)Bairro\b/][name!~/^(?i)Bairro d(a|e|o)s?\b/][inside("BR")]
+    # *[place][name=~/^(?i)Bairro\b/][name!~/^(?i)Bairro d(a|e|o)s?\b/][inside("BR")]
+    def _way_rule_28(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'place' in keys):
             match = False
             if not match:
@@ -2070,13 +2292,14 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto talvez não deva ter ''Bairro'' no nome")
                 err.append({'class': 9018002, 'subclass': 1441242115, 'text': mapcss.tr('objeto talvez não deva ter \'\'Bairro\'\' no nome')})
 
-        # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=island][eval(areasize())>1000000][inside("BR")]
-        # Part of rule not implemented
+    # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=island][eval(areasize())>1000000][inside("BR")]
+    # Part of rule not implemented
 
-        # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=islet][eval(areasize())<=1000000][inside("BR")]
-        # Part of rule not implemented
+    # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=islet][eval(areasize())<=1000000][inside("BR")]
+    # Part of rule not implemented
 
-        # *[iata="0"][inside("BR")]
+    # *[iata="0"][inside("BR")]
+    def _way_rule_29(self, data, tags, nds, keys, err, sets):
         if ('iata' in keys):
             match = False
             if not match:
@@ -2087,7 +2310,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} com valor = {1}","{0.key}","{0.value}")
                 err.append({'class': 9018014, 'subclass': 1098244333, 'text': mapcss.tr('{0} com valor = {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[amenity=~/college|school/][name=~/^(?i)(?u)(Centro Universitário|Faculdades?|FATEC|Instituto Federal)\b/][inside("BR")]
+    # *[amenity=~/college|school/][name=~/^(?i)(?u)(Centro Universitário|Faculdades?|FATEC|Instituto Federal)\b/][inside("BR")]
+    def _way_rule_30(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -2104,8 +2328,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=university')).split('=', 1)])
                 }})
 
-        # *[amenity=school][name=~/^(?i)(?u)(SENAC|SENAI|Serviço Nacional de Aprendizagem)/][inside("BR")]
-        # *[amenity=~/school|university/][name=~/(?i)(?u)\b(Centro Paula Souza|Escola Técnica|ETEC)\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)(?u)(SENAC|SENAI|Serviço Nacional de Aprendizagem)/][inside("BR")]
+    # *[amenity=~/school|university/][name=~/(?i)(?u)\b(Centro Paula Souza|Escola Técnica|ETEC)\b/][inside("BR")]
+    def _way_rule_31(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -2126,7 +2351,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=college')).split('=', 1)])
                 }})
 
-        # *[amenity=school][name=~/^(?i)(?u)(auto(-| )?( moto )?escola|centro de formação de condutores|cfc|moto escola)\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)(?u)(auto(-| )?( moto )?escola|centro de formação de condutores|cfc|moto escola)\b/][inside("BR")]
+    def _way_rule_32(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -2143,7 +2369,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=driving_school')).split('=', 1)])
                 }})
 
-        # *[amenity=school][name=~/^(?i)creche\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)creche\b/][inside("BR")]
+    def _way_rule_33(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -2160,20 +2387,21 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=kindergarten')).split('=', 1)])
                 }})
 
-        # *[name=~/^(?i)(?u)Subestação .*/][power][power!=substation][inside("BR")]
-        # *[name=~/^(?i)(?u)Fórum .*/][amenity][amenity!=courthouse][inside("BR")]
-        # *[name=~/^(?i)Hospital .*/][building][building!=hospital][inside("BR")]
-        # *[name=~/^(?i)Universidade .*/][building][building!=university][inside("BR")]
-        # *[name=~/^(?i)Escola .*/][building][building!=school][inside("BR")]
-        # *[name=~/^(?i)Hotel .*/][building][building!=hotel][inside("BR")]
-        # *[name=~/^(?i)Capela .*/][building][building!=chapel][inside("BR")]
-        # *[name=~/^(?i)Igreja .*/][building][building!=church][inside("BR")]
-        # *[name=~/^(?i)Catedral .*/][building][building!=cathedral][inside("BR")]
-        # *[name=~/^(?i)Fazenda .*/][building][building!=farm][inside("BR")]
-        # *[name=~/^(?i)Supermercado .*/][building][building!=supermarket][inside("BR")]
-        # Rule Blacklisted (id: 1123790420)
-
-        # *[name=~/^(?i)(?u)(AM(A|E)|(Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF).*/][amenity=hospital][inside("BR")]
+    # *[name=~/^(?i)(?u)Subestação .*/][power][power!=substation][inside("BR")]
+    # *[name=~/^(?i)(?u)Fórum .*/][amenity][amenity!=courthouse][inside("BR")]
+    # *[name=~/^(?i)Hospital .*/][building][building!=hospital][inside("BR")]
+    # *[name=~/^(?i)Universidade .*/][building][building!=university][inside("BR")]
+    # *[name=~/^(?i)Escola .*/][building][building!=school][inside("BR")]
+    # *[name=~/^(?i)Hotel .*/][building][building!=hotel][inside("BR")]
+    # *[name=~/^(?i)Capela .*/][building][building!=chapel][inside("BR")]
+    # *[name=~/^(?i)Igreja .*/][building][building!=church][inside("BR")]
+    # *[name=~/^(?i)Catedral .*/][building][building!=cathedral][inside("BR")]
+    # *[name=~/^(?i)Fazenda .*/][building][building!=farm][inside("BR")]
+    # *[name=~/^(?i)Supermercado .*/][building][building!=supermarket][inside("BR")]
+    # Rule Blacklisted (id: 1123790420)
+
+    # *[name=~/^(?i)(?u)(AM(A|E)|(Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF).*/][amenity=hospital][inside("BR")]
+    def _way_rule_34(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -2189,7 +2417,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['amenity','clinic']])
                 }})
 
-        # *[name=~/^(?i)\bSAMU\b/][amenity=~/clinic|doctors|hospital/][inside("BR")]
+    # *[name=~/^(?i)\bSAMU\b/][amenity=~/clinic|doctors|hospital/][inside("BR")]
+    def _way_rule_35(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -2201,10 +2430,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"emergency=ambulance_station"
                 err.append({'class': 9018016, 'subclass': 392029310, 'text': mapcss.tr('SAMU classificado de forma errada')})
 
-        # way[highway=give_way][inside("BR")]
-        # way[highway=mini_roundabout][inside("BR")]
-        # way[highway=stop][inside("BR")]
-        # way[highway=turning_circle][inside("BR")]
+    # way[highway=give_way][inside("BR")]
+    # way[highway=mini_roundabout][inside("BR")]
+    # way[highway=stop][inside("BR")]
+    # way[highway=turning_circle][inside("BR")]
+    def _way_rule_36(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -2227,7 +2457,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve ser utilizado apenas em nós","{0.tag}")
                 err.append({'class': 9018047, 'subclass': 1154213374, 'text': mapcss.tr('{0} deve ser utilizado apenas em nós', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[highway][junction=circular][!oneway?][inside("BR")]
+    # way[highway][junction=circular][!oneway?][inside("BR")]
+    def _way_rule_37(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'junction' in keys):
             match = False
             if not match:
@@ -2243,7 +2474,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['oneway','yes']])
                 }})
 
-        # *[crossing][!highway][!railway][inside("BR")]
+    # *[crossing][!highway][!railway][inside("BR")]
+    def _way_rule_38(self, data, tags, nds, keys, err, sets):
         if ('crossing' in keys):
             match = False
             if not match:
@@ -2254,8 +2486,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve ser utilizado com {1}={0} ou {2}={0}","{0.key}","{1.key}","{2.key}")
                 err.append({'class': 9018019, 'subclass': 2098306424, 'text': mapcss.tr('{0} deve ser utilizado com {1}={0} ou {2}={0}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[aeroway][designation=~/^[A-Z]{4}$/][!icao][inside("BR")]
-        # *[aeroway][ref=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    # *[aeroway][designation=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    # *[aeroway][ref=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    def _way_rule_39(self, data, tags, nds, keys, err, sets):
         if ('aeroway' in keys and 'designation' in keys) or ('aeroway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -2277,7 +2510,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{1.key} => {2.key}')).split('=>', 1)[0].strip()])
                 }})
 
-        # *[access=permissive][inside("BR")]
+    # *[access=permissive][inside("BR")]
+    def _way_rule_40(self, data, tags, nds, keys, err, sets):
         if ('access' in keys):
             match = False
             if not match:
@@ -2289,17 +2523,18 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve ser utilizado apenas em vias privadas com permissão de acesso e não em vias de acesso público","{0.tag}")
                 err.append({'class': 9018002, 'subclass': 1240816112, 'text': mapcss.tr('{0} deve ser utilizado apenas em vias privadas com permissão de acesso e não em vias de acesso público', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[name=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
-        # *["addr:street"=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
-        # Rule Blacklisted (id: 951501764)
+    # *[name=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
+    # *["addr:street"=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
+    # Rule Blacklisted (id: 951501764)
 
-        # *["addr:postcode"=~/^[0-9]{8}$/][inside("BR")]
-        # Rule Blacklisted (id: 1948798798)
+    # *["addr:postcode"=~/^[0-9]{8}$/][inside("BR")]
+    # Rule Blacklisted (id: 1948798798)
 
-        # *[postal_code=~/^[0-9]{8}$/][inside("BR")]
-        # Rule Blacklisted (id: 733725137)
+    # *[postal_code=~/^[0-9]{8}$/][inside("BR")]
+    # Rule Blacklisted (id: 733725137)
 
-        # *["addr:postcode"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    # *["addr:postcode"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    def _way_rule_41(self, data, tags, nds, keys, err, sets):
         if ('addr:postcode' in keys):
             match = False
             if not match:
@@ -2315,7 +2550,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss.concat('addr:postcode=', mapcss.replace(mapcss.replace(mapcss.tag(tags, 'addr:postcode'), ' ', '-'), '.', '-'))).split('=', 1)])
                 }})
 
-        # *["postal_code"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    # *["postal_code"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    def _way_rule_42(self, data, tags, nds, keys, err, sets):
         if ('postal_code' in keys):
             match = False
             if not match:
@@ -2331,12 +2567,13 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss.concat('postal_code=', mapcss.replace(mapcss.replace(mapcss.tag(tags, 'postal_code'), ' ', '-'), '.', '-'))).split('=', 1)])
                 }})
 
-        # *["addr:postcode"]["addr:postcode"!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
-        # *[postal_code][postal_code!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
-        # Rule Blacklisted (id: 2074305530)
+    # *["addr:postcode"]["addr:postcode"!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
+    # *[postal_code][postal_code!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
+    # Rule Blacklisted (id: 2074305530)
 
-        # way[highway]["addr:postcode"][highway!=services][inside("BR")]
-        # area[place]["addr:postcode"][inside("BR")]
+    # way[highway]["addr:postcode"][highway!=services][inside("BR")]
+    # area[place]["addr:postcode"][inside("BR")]
+    def _way_rule_43(self, data, tags, nds, keys, err, sets):
         if ('addr:postcode' in keys and 'highway' in keys) or ('addr:postcode' in keys and 'place' in keys):
             match = False
             if not match:
@@ -2359,7 +2596,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{1.key} => postal_code')).split('=>', 1)[0].strip()])
                 }})
 
-        # *[alt_source][source][inside("BR")]
+    # *[alt_source][source][inside("BR")]
+    def _way_rule_44(self, data, tags, nds, keys, err, sets):
         if ('alt_source' in keys and 'source' in keys):
             match = False
             if not match:
@@ -2370,7 +2608,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve estar incluído em {1}, separado por '';'' caso necessário","{0.key}","{1.key}")
                 err.append({'class': 9018020, 'subclass': 472956812, 'text': mapcss.tr('{0} deve estar incluído em {1}, separado por \'\';\'\' caso necessário', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[landuse?][inside("BR")]
+    # *[landuse?][inside("BR")]
+    def _way_rule_45(self, data, tags, nds, keys, err, sets):
         if ('landuse' in keys):
             match = False
             if not match:
@@ -2381,7 +2620,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("especificar valor correto para {0} ao invés de ''{1}''","{0.key}",tag("landuse"))
                 err.append({'class': 9018021, 'subclass': 6418462, 'text': mapcss.tr('especificar valor correto para {0} ao invés de \'\'{1}\'\'', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss.tag(tags, 'landuse'))})
 
-        # *[long_name][inside("BR")]
+    # *[long_name][inside("BR")]
+    def _way_rule_46(self, data, tags, nds, keys, err, sets):
         if ('long_name' in keys):
             match = False
             if not match:
@@ -2395,7 +2635,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"official_name"
                 err.append({'class': 9018022, 'subclass': 1737555221, 'text': mapcss.tr('chave inválida: {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *["building:levels"<1][inside("BR")]
+    # *["building:levels"<1][inside("BR")]
+    def _way_rule_47(self, data, tags, nds, keys, err, sets):
         if ('building:levels' in keys):
             match = False
             if not match:
@@ -2407,7 +2648,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} com valor inválido","{0.key}")
                 err.append({'class': 9018002, 'subclass': 775859422, 'text': mapcss.tr('{0} com valor inválido', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[hires?][inside("BR")]
+    # *[hires?][inside("BR")]
+    def _way_rule_48(self, data, tags, nds, keys, err, sets):
         if ('hires' in keys):
             match = False
             if not match:
@@ -2418,8 +2660,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("não se deve utilizar {0} para demarcar áreas de cobertura de imagem","{0.key}")
                 err.append({'class': 9018023, 'subclass': 895278192, 'text': mapcss.tr('não se deve utilizar {0} para demarcar áreas de cobertura de imagem', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[tourism=motel][amenity!=love_hotel][inside("BR")]
-        # *[name=~/(?i)\bmotel\b/][amenity!=love_hotel][inside("BR")]
+    # *[tourism=motel][amenity!=love_hotel][inside("BR")]
+    # *[name=~/(?i)\bmotel\b/][amenity!=love_hotel][inside("BR")]
+    def _way_rule_49(self, data, tags, nds, keys, err, sets):
         if ('name' in keys) or ('tourism' in keys):
             match = False
             if not match:
@@ -2439,7 +2682,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{1.key}={1.value}')).split('=', 1)])
                 }})
 
-        # *[amenity=love_hotel][tourism][tourism!=motel][inside("BR")]
+    # *[amenity=love_hotel][tourism][tourism!=motel][inside("BR")]
+    def _way_rule_50(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'tourism' in keys):
             match = False
             if not match:
@@ -2451,7 +2695,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("provavelmente deve ser ''{0}={1}''","{2.key}","{2.value}")
                 err.append({'class': 9018002, 'subclass': 1760828878, 'text': mapcss.tr('provavelmente deve ser \'\'{0}={1}\'\'', mapcss._tag_uncapture(capture_tags, '{2.key}'), mapcss._tag_uncapture(capture_tags, '{2.value}'))})
 
-        # *[name=~/(?i)^motel\b/][tourism!=motel][inside("BR")]
+    # *[name=~/(?i)^motel\b/][tourism!=motel][inside("BR")]
+    def _way_rule_51(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -2464,8 +2709,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"tourism=motel"
                 err.append({'class': 9018002, 'subclass': 1456128106, 'text': mapcss.tr('motel classificado incorretamente')})
 
-        # *[aeroway=aerodrome][name=~/(?i).*airport$/][inside("BR")]
-        # *[aeroway=helipad][name=~/(?i).*heliport$/][inside("BR")]
+    # *[aeroway=aerodrome][name=~/(?i).*airport$/][inside("BR")]
+    # *[aeroway=helipad][name=~/(?i).*heliport$/][inside("BR")]
+    def _way_rule_52(self, data, tags, nds, keys, err, sets):
         if ('aeroway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -2481,8 +2727,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} com nome em inglês","{0.tag}")
                 err.append({'class': 9018002, 'subclass': 1743601177, 'text': mapcss.tr('{0} com nome em inglês', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[aeroway=aerodrome][name=~/(?i)^Aer(ódromo|oporto) de.*/][inside("BR")]
-        # *[aeroway=helipad][name=~/(?i)^Helipo(n|r)to.*/][inside("BR")]
+    # *[aeroway=aerodrome][name=~/(?i)^Aer(ódromo|oporto) de.*/][inside("BR")]
+    # *[aeroway=helipad][name=~/(?i)^Helipo(n|r)to.*/][inside("BR")]
+    def _way_rule_53(self, data, tags, nds, keys, err, sets):
         if ('aeroway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -2498,7 +2745,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("conferir se existe nome oficial do {0}","{0.value}")
                 err.append({'class': 9018002, 'subclass': 136467214, 'text': mapcss.tr('conferir se existe nome oficial do {0}', mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[aeroway=aerodrome][ref][inside("BR")]
+    # *[aeroway=aerodrome][ref][inside("BR")]
+    def _way_rule_54(self, data, tags, nds, keys, err, sets):
         if ('aeroway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -2510,21 +2758,22 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("''{0}'' não faz sentido em aeroporto","{1.key}")
                 err.append({'class': 9018002, 'subclass': 1633437696, 'text': mapcss.tr('\'\'{0}\'\' não faz sentido em aeroporto', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[waterway][tunnel=yes][inside("BR")]
-        # Rule Blacklisted (id: 1154433213)
+    # way[waterway][tunnel=yes][inside("BR")]
+    # Rule Blacklisted (id: 1154433213)
 
-        # way[highway][layer<0][!tunnel][inside("BR")]
-        # *[waterway][layer<0][!tunnel][inside("BR")]
-        # Rule Blacklisted (id: 1415734409)
+    # way[highway][layer<0][!tunnel][inside("BR")]
+    # *[waterway][layer<0][!tunnel][inside("BR")]
+    # Rule Blacklisted (id: 1415734409)
 
-        # way[highway][layer>0][!bridge][highway!=bus_stop][inside("BR")]
-        # *[waterway][layer>0][!bridge][inside("BR")]
-        # Rule Blacklisted (id: 58812649)
+    # way[highway][layer>0][!bridge][highway!=bus_stop][inside("BR")]
+    # *[waterway][layer>0][!bridge][inside("BR")]
+    # Rule Blacklisted (id: 58812649)
 
-        # *[layer][!building][!highway][man_made!=pipeline][!railway][!waterway][power!=line][inside("BR")]
-        # Rule Blacklisted (id: 39095837)
+    # *[layer][!building][!highway][man_made!=pipeline][!railway][!waterway][power!=line][inside("BR")]
+    # Rule Blacklisted (id: 39095837)
 
-        # way[highway=motorway_junction][inside("BR")]
+    # way[highway=motorway_junction][inside("BR")]
+    def _way_rule_55(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -2536,7 +2785,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"highway=motorway_link"
                 err.append({'class': 9018056, 'subclass': 687515179, 'text': mapcss.tr('{0} deve ser utilizado apenas no nó de saída da rodovia', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[name=~/^(?i)(?u)edifício.*/][!building][inside("BR")]
+    # *[name=~/^(?i)(?u)edifício.*/][!building][inside("BR")]
+    def _way_rule_56(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -2547,7 +2797,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("possível ausência de tag {0}","{1.key}")
                 err.append({'class': 9018026, 'subclass': 1332986859, 'text': mapcss.tr('possível ausência de tag {0}', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[highway][maxspeed][maxspeed!~/^[0-9]+$/][inside("BR")]
+    # way[highway][maxspeed][maxspeed!~/^[0-9]+$/][inside("BR")]
+    def _way_rule_57(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'maxspeed' in keys):
             match = False
             if not match:
@@ -2559,7 +2810,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("velocidade máxima deve ser apenas o valor numérico, em km/h")
                 err.append({'class': 9018002, 'subclass': 78890622, 'text': mapcss.tr('velocidade máxima deve ser apenas o valor numérico, em km/h')})
 
-        # way[highway][maxspeed][maxspeed!~/^[0-9]+0$/][inside("BR")]
+    # way[highway][maxspeed][maxspeed!~/^[0-9]+0$/][inside("BR")]
+    def _way_rule_58(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'maxspeed' in keys):
             match = False
             if not match:
@@ -2571,7 +2823,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("velocidade máxima deveria ser múltiplo de 10")
                 err.append({'class': 9018002, 'subclass': 1298210435, 'text': mapcss.tr('velocidade máxima deveria ser múltiplo de 10')})
 
-        # *[route=ferry][!duration][inside("BR")]
+    # *[route=ferry][!duration][inside("BR")]
+    def _way_rule_59(self, data, tags, nds, keys, err, sets):
         if ('route' in keys):
             match = False
             if not match:
@@ -2582,8 +2835,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("ausência do tempo de duração ({0}) da balsa","{1.key}")
                 err.append({'class': 9018027, 'subclass': 1343391603, 'text': mapcss.tr('ausência do tempo de duração ({0}) da balsa', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[name=~/^(?i)(?u)praça.*/][!leisure][landuse=~/^(forest|grass|greenfield|meadow|orchard)$/][inside("BR")]
-        # *[name=~/^(?i)(?u)praça.*/][!leisure][natural=~/^(grassland|heath|scrub|wood)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)praça.*/][!leisure][landuse=~/^(forest|grass|greenfield|meadow|orchard)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)praça.*/][!leisure][natural=~/^(grassland|heath|scrub|wood)$/][inside("BR")]
+    def _way_rule_60(self, data, tags, nds, keys, err, sets):
         if ('landuse' in keys and 'name' in keys) or ('name' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -2599,7 +2853,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"leisure=park"
                 err.append({'class': 9018029, 'subclass': 181066872, 'text': mapcss.tr('possível definição incorreta para praça: \'\'{0}\'\'', mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[wikipedia][wikipedia!~/^pt:/][inside("BR")]
+    # *[wikipedia][wikipedia!~/^pt:/][inside("BR")]
+    def _way_rule_61(self, data, tags, nds, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -2610,11 +2865,12 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("utilizar prefixo em português (pt:) para {0}","{0.key}")
                 err.append({'class': 9018030, 'subclass': 1431112366, 'text': mapcss.tr('utilizar prefixo em português (pt:) para {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[highway][lanes=1][!oneway?][!junction][!narrow][inside("BR")]
-        # Rule Blacklisted (id: 226394604)
+    # way[highway][lanes=1][!oneway?][!junction][!narrow][inside("BR")]
+    # Rule Blacklisted (id: 226394604)
 
-        # way[cycleway=lane]["cycleway:left"=lane][inside("BR")]
-        # way[cycleway=lane]["cycleway:right"=lane][inside("BR")]
+    # way[cycleway=lane]["cycleway:left"=lane][inside("BR")]
+    # way[cycleway=lane]["cycleway:right"=lane][inside("BR")]
+    def _way_rule_62(self, data, tags, nds, keys, err, sets):
         if ('cycleway' in keys and 'cycleway:left' in keys) or ('cycleway' in keys and 'cycleway:right' in keys):
             match = False
             if not match:
@@ -2630,19 +2886,20 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"{1.tag}"
                 err.append({'class': 9018063, 'subclass': 1071847858, 'text': mapcss.tr('uso incorreto de {0} com {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[name=~/.*\(.*\).*/][inside("BR")]
-        # Rule Blacklisted (id: 2146320716)
+    # *[name=~/.*\(.*\).*/][inside("BR")]
+    # Rule Blacklisted (id: 2146320716)
 
-        # *[name=~/ - /][inside("BR")]
-        # Rule Blacklisted (id: 1840875080)
+    # *[name=~/ - /][inside("BR")]
+    # Rule Blacklisted (id: 1840875080)
 
-        # *[name=~/, /][inside("BR")]
-        # Rule Blacklisted (id: 1508736498)
+    # *[name=~/, /][inside("BR")]
+    # Rule Blacklisted (id: 1508736498)
 
-        # *[name=~/: /][inside("BR")]
-        # Rule Blacklisted (id: 877403916)
+    # *[name=~/: /][inside("BR")]
+    # Rule Blacklisted (id: 877403916)
 
-        # *[name=~/ ou /][inside("BR")]
+    # *[name=~/ ou /][inside("BR")]
+    def _way_rule_63(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -2654,7 +2911,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"name e alt_name"
                 err.append({'class': 9018031, 'subclass': 115703372, 'text': mapcss.tr('nome utilizado de forma incorreta')})
 
-        # way[boundary=administrative][!admin_level]!.way_in_relation
+    # way[boundary=administrative][!admin_level]!.way_in_relation
+    def _way_rule_64(self, data, tags, nds, keys, err, sets):
         if ('boundary' in keys):
             match = False
             # Skip selector using undeclared class way_in_relation
@@ -2662,7 +2920,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwError:tr("{0} deve possuir {1}","{0.tag}","{1.key}")
                 err.append({'class': 9018033, 'subclass': 1118919413, 'text': mapcss.tr('{0} deve possuir {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[place][place!~/^(city_block|farm|hamlet|island|islet|isolated_dwelling|neighbourhood|square)$/][!admin_level][!boundary][inside("BR")]
+    # way[place][place!~/^(city_block|farm|hamlet|island|islet|isolated_dwelling|neighbourhood|square)$/][!admin_level][!boundary][inside("BR")]
+    def _way_rule_65(self, data, tags, nds, keys, err, sets):
         if ('place' in keys):
             match = False
             if not match:
@@ -2674,8 +2933,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("local com ausência/incoerência de limite administrativo")
                 err.append({'class': 9018002, 'subclass': 1502787309, 'text': mapcss.tr('local com ausência/incoerência de limite administrativo')})
 
-        # way[admin_level][!boundary]!.way_in_relation
-        # way[admin_level][boundary][boundary!=administrative]!.way_in_relation
+    # way[admin_level][!boundary]!.way_in_relation
+    # way[admin_level][boundary][boundary!=administrative]!.way_in_relation
+    def _way_rule_66(self, data, tags, nds, keys, err, sets):
         if ('admin_level' in keys) or ('admin_level' in keys and 'boundary' in keys):
             match = False
             # Skip selector using undeclared class way_in_relation
@@ -2689,9 +2949,10 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['boundary','administrative']])
                 }})
 
-        # *[boundary=national_park][!name][inside("BR")]
-        # *[boundary=protected_area][!name][inside("BR")]
-        # *[leisure=nature_reserve][!name][inside("BR")]
+    # *[boundary=national_park][!name][inside("BR")]
+    # *[boundary=protected_area][!name][inside("BR")]
+    # *[leisure=nature_reserve][!name][inside("BR")]
+    def _way_rule_67(self, data, tags, nds, keys, err, sets):
         if ('boundary' in keys) or ('leisure' in keys):
             match = False
             if not match:
@@ -2710,7 +2971,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve possuir {1}","{0.tag}","{1.key}")
                 err.append({'class': 9018033, 'subclass': 1196875584, 'text': mapcss.tr('{0} deve possuir {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[boundary=protected_area][!protect_class][inside("BR")]
+    # *[boundary=protected_area][!protect_class][inside("BR")]
+    def _way_rule_68(self, data, tags, nds, keys, err, sets):
         if ('boundary' in keys):
             match = False
             if not match:
@@ -2721,7 +2983,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve possuir {1}","{0.tag}","{1.key}")
                 err.append({'class': 9018033, 'subclass': 1593244126, 'text': mapcss.tr('{0} deve possuir {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[protect_class][protect_class!~/^(1(a|b)?|[1-9][0-9]?)$/][inside("BR")]
+    # *[protect_class][protect_class!~/^(1(a|b)?|[1-9][0-9]?)$/][inside("BR")]
+    def _way_rule_69(self, data, tags, nds, keys, err, sets):
         if ('protect_class' in keys):
             match = False
             if not match:
@@ -2732,7 +2995,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("valor incorreto para {0}","{0.key}")
                 err.append({'class': 9018034, 'subclass': 1183781531, 'text': mapcss.tr('valor incorreto para {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[protect_class][boundary!=protected_area][inside("BR")]
+    # *[protect_class][boundary!=protected_area][inside("BR")]
+    def _way_rule_70(self, data, tags, nds, keys, err, sets):
         if ('protect_class' in keys):
             match = False
             if not match:
@@ -2743,7 +3007,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("ausência de boundary=protected_area")
                 err.append({'class': 9018035, 'subclass': 1649283274, 'text': mapcss.tr('ausência de boundary=protected_area')})
 
-        # area[boundary=protected_area][leisure=nature_reserve][name=~/(?i)(?u)\bAPA\b|Área de Proteção Ambiental/][inside("BR")]
+    # area[boundary=protected_area][leisure=nature_reserve][name=~/(?i)(?u)\bAPA\b|Área de Proteção Ambiental/][inside("BR")]
+    def _way_rule_71(self, data, tags, nds, keys, err, sets):
         if ('boundary' in keys and 'leisure' in keys and 'name' in keys):
             match = False
             if not match:
@@ -2759,7 +3024,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     'leisure'])
                 }})
 
-        # area[boundary=protected_area][name=~/(?i)\bAPA\b/][inside("BR")]
+    # area[boundary=protected_area][name=~/(?i)\bAPA\b/][inside("BR")]
+    def _way_rule_72(self, data, tags, nds, keys, err, sets):
         if ('boundary' in keys and 'name' in keys):
             match = False
             if not match:
@@ -2772,7 +3038,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"short_name"
                 err.append({'class': 9018002, 'subclass': 2108639028, 'text': mapcss.tr('Utilizar o nome por extenso ao invés de \'\'APA\'\'')})
 
-        # *[name=~/.* D(a|e|o)s? .*/][inside("BR")]
+    # *[name=~/.* D(a|e|o)s? .*/][inside("BR")]
+    def _way_rule_73(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -2784,7 +3051,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("''da'', ''de'' e ''do'' são minúsculos nos nomes em português")
                 err.append({'class': 9018002, 'subclass': 874509528, 'text': mapcss.tr('\'\'da\'\', \'\'de\'\' e \'\'do\'\' são minúsculos nos nomes em português')})
 
-        # *[name=~/^[a-z].*/][inside("BR")]
+    # *[name=~/^[a-z].*/][inside("BR")]
+    def _way_rule_74(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -2796,7 +3064,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("nome iniciando com letra minúscula")
                 err.append({'class': 9018002, 'subclass': 2073274467, 'text': mapcss.tr('nome iniciando com letra minúscula')})
 
-        # *[alt_ref][inside("BR")]
+    # *[alt_ref][inside("BR")]
+    def _way_rule_75(self, data, tags, nds, keys, err, sets):
         if ('alt_ref' in keys):
             match = False
             if not match:
@@ -2808,7 +3077,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"ref"
                 err.append({'class': 9018039, 'subclass': 836388143, 'text': mapcss.tr('o conteúdo de {0} deve fazer parte de ref, separado por ;', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[highway=path][tracktype][inside("BR")]
+    # way[highway=path][tracktype][inside("BR")]
+    def _way_rule_76(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'tracktype' in keys):
             match = False
             if not match:
@@ -2820,10 +3090,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"trail_visibility"
                 err.append({'class': 9018064, 'subclass': 1242889729, 'text': mapcss.tr('uso incorreto de {0}', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[highway!=track][tracktype][inside("BR")]
-        # Rule Blacklisted (id: 2012241162)
+    # way[highway!=track][tracktype][inside("BR")]
+    # Rule Blacklisted (id: 2012241162)
 
-        # *[surface][eval(number_of_tags())=1][inside("BR")]
+    # *[surface][eval(number_of_tags())=1][inside("BR")]
+    def _way_rule_77(self, data, tags, nds, keys, err, sets):
         if ('surface' in keys):
             match = False
             if not match:
@@ -2834,8 +3105,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto incompleto: possui apenas {0}","{0.key}")
                 err.append({'class': 9018041, 'subclass': 411244066, 'text': mapcss.tr('objeto incompleto: possui apenas {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[name][surface][eval(number_of_tags())=2][inside("BR")]
-        # *[name][website][eval(number_of_tags())=2][inside("BR")]
+    # *[name][surface][eval(number_of_tags())=2][inside("BR")]
+    # *[name][website][eval(number_of_tags())=2][inside("BR")]
+    def _way_rule_78(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'surface' in keys) or ('name' in keys and 'website' in keys):
             match = False
             if not match:
@@ -2850,7 +3122,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto incompleto: possui apenas {0} e {1}","{0.key}","{1.key}")
                 err.append({'class': 9018042, 'subclass': 585137381, 'text': mapcss.tr('objeto incompleto: possui apenas {0} e {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[highway=~/^(living_street|pedestrian|residential|road|service|track)$/][ref][inside("BR")]
+    # way[highway=~/^(living_street|pedestrian|residential|road|service|track)$/][ref][inside("BR")]
+    def _way_rule_79(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -2862,7 +3135,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("a via deve ser ao menos tertiary")
                 err.append({'class': 9018002, 'subclass': 728045324, 'text': mapcss.tr('a via deve ser ao menos tertiary')})
 
-        # area[natural=wetland][!wetland][inside("BR")]
+    # area[natural=wetland][!wetland][inside("BR")]
+    def _way_rule_80(self, data, tags, nds, keys, err, sets):
         if ('natural' in keys):
             match = False
             if not match:
@@ -2873,7 +3147,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("ausência de wetland=*")
                 err.append({'class': 9018065, 'subclass': 1029145948, 'text': mapcss.tr('ausência de wetland=*')})
 
-        # area[natural=beach][!surface][inside("BR")]
+    # area[natural=beach][!surface][inside("BR")]
+    def _way_rule_81(self, data, tags, nds, keys, err, sets):
         if ('natural' in keys):
             match = False
             if not match:
@@ -2884,7 +3159,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("''{0}'' sem ''{1}'' definida","{0.tag}","{1.key}")
                 err.append({'class': 9018066, 'subclass': 653607218, 'text': mapcss.tr('\'\'{0}\'\' sem \'\'{1}\'\' definida', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # area[natural=beach][surface][surface!~/^(fine_gravel|gravel|pebbles|pebblestone|sand|shells|shingle|stones)$/][inside("BR")]
+    # area[natural=beach][surface][surface!~/^(fine_gravel|gravel|pebbles|pebblestone|sand|shells|shingle|stones)$/][inside("BR")]
+    def _way_rule_82(self, data, tags, nds, keys, err, sets):
         if ('natural' in keys and 'surface' in keys):
             match = False
             if not match:
@@ -2895,11 +3171,12 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} inapropriada para ''{1}''","{1.key}","{0.tag}")
                 err.append({'class': 9018067, 'subclass': 231893104, 'text': mapcss.tr('{0} inapropriada para \'\'{1}\'\'', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[bridge][!layer][inside("BR")]
-        # way[tunnel][!layer][inside("BR")]
-        # Rule Blacklisted (id: 1354724892)
+    # way[bridge][!layer][inside("BR")]
+    # way[tunnel][!layer][inside("BR")]
+    # Rule Blacklisted (id: 1354724892)
 
-        # *[leisure=pitch][sport=tennis][surface=unpaved][inside("BR")]
+    # *[leisure=pitch][sport=tennis][surface=unpaved][inside("BR")]
+    def _way_rule_83(self, data, tags, nds, keys, err, sets):
         if ('leisure' in keys and 'sport' in keys and 'surface' in keys):
             match = False
             if not match:
@@ -2916,7 +3193,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['surface','clay']])
                 }})
 
-        # way[leisure=track][!area?][inside("BR")]:closed
+    # way[leisure=track][!area?][inside("BR")]:closed
+    def _way_rule_84(self, data, tags, nds, keys, err, sets):
         if ('leisure' in keys):
             match = False
             if not match:
@@ -2928,10 +3206,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("adicionar ''area=yes'' caso esteja representando uma área")
                 err.append({'class': 9018002, 'subclass': 691633247, 'text': mapcss.tr('adicionar \'\'area=yes\'\' caso esteja representando uma área')})
 
-        # area[amenity=fuel][eval(areasize())>2500][inside("BR")]
-        # Part of rule not implemented
+    # area[amenity=fuel][eval(areasize())>2500][inside("BR")]
+    # Part of rule not implemented
 
-        # *[amenity=fuel][name=~/(?i)(?u)\b(Ale|BR|Esso|Ipiranga|Petrobr(á|a)s|Shell|Texaco)\b/][inside("BR")]
+    # *[amenity=fuel][name=~/(?i)(?u)\b(Ale|BR|Esso|Ipiranga|Petrobr(á|a)s|Shell|Texaco)\b/][inside("BR")]
+    def _way_rule_85(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -2944,7 +3223,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"brand"
                 err.append({'class': 9018002, 'subclass': 1724035987, 'text': mapcss.tr('o nome não deve conter a bandeira/marca do posto')})
 
-        # *[amenity=fuel][brand=BR][inside("BR")]
+    # *[amenity=fuel][brand=BR][inside("BR")]
+    def _way_rule_86(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'brand' in keys):
             match = False
             if not match:
@@ -2961,7 +3241,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['brand','Petrobras']])
                 }})
 
-        # *[shop=gas][name=~/(?i)(?u)^(Brasilg(á|a)s|Consigaz|Copagaz|Liquig(á|a)s|Minasg(á|a)s|Nacional G(á|a)s|Supergasbras|Ultragaz)$/][inside("BR")]
+    # *[shop=gas][name=~/(?i)(?u)^(Brasilg(á|a)s|Consigaz|Copagaz|Liquig(á|a)s|Minasg(á|a)s|Nacional G(á|a)s|Supergasbras|Ultragaz)$/][inside("BR")]
+    def _way_rule_87(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'shop' in keys):
             match = False
             if not match:
@@ -2974,7 +3255,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"brand"
                 err.append({'class': 9018002, 'subclass': 867102166, 'text': mapcss.tr('o nome não deve conter a bandeira/marca da loja')})
 
-        # *[/_[0-9]$/][!"is_in:iso_3166_2"][inside("BR")]
+    # *[/_[0-9]$/][!"is_in:iso_3166_2"][inside("BR")]
+    def _way_rule_88(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -2985,7 +3267,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwError:tr("chave inválida: {0}","{0.key}")
                 err.append({'class': 9018022, 'subclass': 231229079, 'text': mapcss.tr('chave inválida: {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][!note][inside("BR")]
+    # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][!note][inside("BR")]
+    def _way_rule_89(self, data, tags, nds, keys, err, sets):
         if ('addr:housenumber' in keys):
             match = False
             if not match:
@@ -3005,7 +3288,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     'addr:housenumber'])
                 }})
 
-        # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][note][inside("BR")]
+    # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][note][inside("BR")]
+    def _way_rule_90(self, data, tags, nds, keys, err, sets):
         if ('addr:housenumber' in keys and 'note' in keys):
             match = False
             if not match:
@@ -3017,7 +3301,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"note"
                 err.append({'class': 9018043, 'subclass': 1150070765, 'text': mapcss.tr('não utilizar \'\'{0}\'\' para locais sem número', mapcss.tag(tags, 'addr:housenumber'))})
 
-        # *[source=~/(?i)google/][inside("BR")]
+    # *[source=~/(?i)google/][inside("BR")]
+    def _way_rule_91(self, data, tags, nds, keys, err, sets):
         if ('source' in keys):
             match = False
             if not match:
@@ -3028,7 +3313,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwError:tr("objeto contém Google como source")
                 err.append({'class': 9018044, 'subclass': 1159310436, 'text': mapcss.tr('objeto contém Google como source')})
 
-        # *[amenity=townhall][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    # *[amenity=townhall][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    def _way_rule_92(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -3041,7 +3327,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"office=government + government=legislative"
                 err.append({'class': 9018002, 'subclass': 532372413, 'text': mapcss.tr('câmara de vereadores mapeada incorretamente')})
 
-        # *[office=government][government!=legislative][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    # *[office=government][government!=legislative][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    def _way_rule_93(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'office' in keys):
             match = False
             if not match:
@@ -3053,8 +3340,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("ausência de government=legislative")
                 err.append({'class': 9018002, 'subclass': 2126685099, 'text': mapcss.tr('ausência de government=legislative')})
 
-        # *[amenity=townhall][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
-        # *[office=government][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    # *[amenity=townhall][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    # *[office=government][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    def _way_rule_94(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'name' in keys) or ('name' in keys and 'office' in keys):
             match = False
             if not match:
@@ -3070,7 +3358,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("erro de ortografia em ''câmara''")
                 err.append({'class': 9018002, 'subclass': 1277153079, 'text': mapcss.tr('erro de ortografia em \'\'câmara\'\'')})
 
-        # *[name=~/(?i)^prefeitura\b/][amenity!=townhall][inside("BR")]
+    # *[name=~/(?i)^prefeitura\b/][amenity!=townhall][inside("BR")]
+    def _way_rule_95(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -3083,7 +3372,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"amenity=townhall"
                 err.append({'class': 9018002, 'subclass': 1445137044, 'text': mapcss.tr('prefeitura possivelmente mapeada de forma incorreta')})
 
-        # *[name=~/(?i)(?u)^paço\b/][amenity!=townhall][inside("BR")]
+    # *[name=~/(?i)(?u)^paço\b/][amenity!=townhall][inside("BR")]
+    def _way_rule_96(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -3096,7 +3386,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"amenity=townhall"
                 err.append({'class': 9018002, 'subclass': 1169494638, 'text': mapcss.tr('paço possivelmente mapeado de forma incorreta')})
 
-        # *[amenity=charging_station][inside("BR")]
+    # *[amenity=charging_station][inside("BR")]
+    def _way_rule_97(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -3108,7 +3399,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("possivelmente deve ser amenity=fuel")
                 err.append({'class': 9018002, 'subclass': 2011797637, 'text': mapcss.tr('possivelmente deve ser amenity=fuel')})
 
-        # *[name=~/(?i)^Borrach(aria|eiro)/][shop=tyres][!repair][inside("BR")]
+    # *[name=~/(?i)^Borrach(aria|eiro)/][shop=tyres][!repair][inside("BR")]
+    def _way_rule_98(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'shop' in keys):
             match = False
             if not match:
@@ -3121,7 +3413,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"repair=yes"
                 err.append({'class': 9018002, 'subclass': 1225518759, 'text': mapcss.tr('borracharia sem \'\'repair=yes\'\'')})
 
-        # *[name=~/(?i)^Borrach(aria|eiro)/][shop!=tyres][inside("BR")]
+    # *[name=~/(?i)^Borrach(aria|eiro)/][shop!=tyres][inside("BR")]
+    def _way_rule_99(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -3134,8 +3427,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"shop=tyres"
                 err.append({'class': 9018002, 'subclass': 755877630, 'text': mapcss.tr('borracharia sem \'\'shop=tyres\'\'')})
 
-        # way[waterway=~/^(river|stream)$/][name][name!~/^(?U)(Água|Arroio|Cabeceira|Córrego|Furo|Grota|Igarapé|Lajeado|Paraná|Restinga|Riacho|Ribeirão|Rio|Sanga)\b/][inside("BR")]
-        # way[waterway=~/^(river|stream)$/][alt_name][alt_name!~/^(?U)(Água|Arroio|Cabeceira|Córrego|Furo|Grota|Igarapé|Lajeado|Paraná|Restinga|Riacho|Ribeirão|Rio|Sanga)\b/][inside("BR")]
+    # way[waterway=~/^(river|stream)$/][name][name!~/^(?U)(Água|Arroio|Cabeceira|Córrego|Furo|Grota|Igarapé|Lajeado|Paraná|Restinga|Riacho|Ribeirão|Rio|Sanga)\b/][inside("BR")]
+    # way[waterway=~/^(river|stream)$/][alt_name][alt_name!~/^(?U)(Água|Arroio|Cabeceira|Córrego|Furo|Grota|Igarapé|Lajeado|Paraná|Restinga|Riacho|Ribeirão|Rio|Sanga)\b/][inside("BR")]
+    def _way_rule_100(self, data, tags, nds, keys, err, sets):
         if ('alt_name' in keys and 'waterway' in keys) or ('name' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -3151,7 +3445,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} com possível nome errado/incompleto",tag(waterway))
                 err.append({'class': 9018002, 'subclass': 139982797, 'text': mapcss.tr('{0} com possível nome errado/incompleto', mapcss.tag(tags, 'waterway'))})
 
-        # area[place=square][leisure!=park][inside("BR")]
+    # area[place=square][leisure!=park][inside("BR")]
+    def _way_rule_101(self, data, tags, nds, keys, err, sets):
         if ('place' in keys):
             match = False
             if not match:
@@ -3164,7 +3459,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"leisure=park"
                 err.append({'class': 9018002, 'subclass': 758716021, 'text': mapcss.tr('{0} deve ser usado em praças pavimentadas (plaza)', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[name=~/(?i)\bcoreto\b/][leisure!=bandstand][leisure!=park][inside("BR")]
+    # *[name=~/(?i)\bcoreto\b/][leisure!=bandstand][leisure!=park][inside("BR")]
+    def _way_rule_102(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -3177,7 +3473,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"leisure=bandstand"
                 err.append({'class': 9018002, 'subclass': 810497942, 'text': mapcss.tr('coreto possivelmente classificado de forma incorreta')})
 
-        # *[leisure=recreation_ground][inside("BR")]
+    # *[leisure=recreation_ground][inside("BR")]
+    def _way_rule_103(self, data, tags, nds, keys, err, sets):
         if ('leisure' in keys):
             match = False
             if not match:
@@ -3191,7 +3488,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"leisure=park"
                 err.append({'class': 9018002, 'subclass': 1594563801, 'text': mapcss.tr('{0} impreciso', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[leisure=recreation_ground][landuse=recreation_ground][inside("BR")]
+    # *[leisure=recreation_ground][landuse=recreation_ground][inside("BR")]
+    def _way_rule_104(self, data, tags, nds, keys, err, sets):
         if ('landuse' in keys and 'leisure' in keys):
             match = False
             if not match:
@@ -3207,7 +3505,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     'leisure'])
                 }})
 
-        # *["ref:vatin"]["ref:vatin"!~/^BR[0-9]{14}$/][inside("BR")]
+    # *["ref:vatin"]["ref:vatin"!~/^BR[0-9]{14}$/][inside("BR")]
+    def _way_rule_105(self, data, tags, nds, keys, err, sets):
         if ('ref:vatin' in keys):
             match = False
             if not match:
@@ -3219,7 +3518,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("CNPJ diferente do formato BRxxxxxxxxxxxxxx")
                 err.append({'class': 9018002, 'subclass': 1793026117, 'text': mapcss.tr('CNPJ diferente do formato BRxxxxxxxxxxxxxx')})
 
-        # *["ref:vatin"=~/^[0-9]{2}\.[0-9]{3}\.[0-9]{3}\/[0-9]{4}-[0-9]{2}$/][inside("BR")]
+    # *["ref:vatin"=~/^[0-9]{2}\.[0-9]{3}\.[0-9]{3}\/[0-9]{4}-[0-9]{2}$/][inside("BR")]
+    def _way_rule_106(self, data, tags, nds, keys, err, sets):
         if ('ref:vatin' in keys):
             match = False
             if not match:
@@ -3235,7 +3535,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss.concat('ref:vatin=BR', mapcss.replace(mapcss.replace(mapcss.replace(mapcss.tag(tags, 'ref:vatin'), '/', ''), '.', ''), '-', ''))).split('=', 1)])
                 }})
 
-        # *["ref:vatin"=~/^(br|bR|Br)[0-9]{14}$/][inside("BR")]
+    # *["ref:vatin"=~/^(br|bR|Br)[0-9]{14}$/][inside("BR")]
+    def _way_rule_107(self, data, tags, nds, keys, err, sets):
         if ('ref:vatin' in keys):
             match = False
             if not match:
@@ -3251,11 +3552,12 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss.concat('ref:vatin=', mapcss.upper(mapcss.tag(tags, 'ref:vatin')))).split('=', 1)])
                 }})
 
-        # area:closed[building=~/^(apartments|house|residential|dormitory|yes)$/][eval(areasize())>5000][inside("BR")]
-        # Part of rule not implemented
+    # area:closed[building=~/^(apartments|house|residential|dormitory|yes)$/][eval(areasize())>5000][inside("BR")]
+    # Part of rule not implemented
 
-        # *[phone][phone!~/^(\+55|0800)/][inside("BR")]
-        # *["contact:phone"]["contact:phone"!~/^(\+55|0800)/][inside("BR")]
+    # *[phone][phone!~/^(\+55|0800)/][inside("BR")]
+    # *["contact:phone"]["contact:phone"!~/^(\+55|0800)/][inside("BR")]
+    def _way_rule_108(self, data, tags, nds, keys, err, sets):
         if ('contact:phone' in keys) or ('phone' in keys):
             match = False
             if not match:
@@ -3271,8 +3573,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} em formato diferente do internacional +55 XX YYYY-YYYY","{0.key}")
                 err.append({'class': 9018002, 'subclass': 1438682200, 'text': mapcss.tr('{0} em formato diferente do internacional +55 XX YYYY-YYYY', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[phone=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
-        # *["contact:phone"=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    # *[phone=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    # *["contact:phone"=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    def _way_rule_109(self, data, tags, nds, keys, err, sets):
         if ('contact:phone' in keys) or ('phone' in keys):
             match = False
             if not match:
@@ -3292,15 +3595,129 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['highway']),
+        (_way_rule_1, ['highway']),
+        (_way_rule_2, ['addr:street']),
+        (_way_rule_3, ['highway']),
+        (_way_rule_4, ['name']),
+        (_way_rule_5, ['highway']),
+        (_way_rule_6, ['name']),
+        (_way_rule_7, ['name']),
+        (_way_rule_8, ['highway']),
+        (_way_rule_9, ['leisure']),
+        (_way_rule_10, ['name']),
+        (_way_rule_11, ['amenity']),
+        (_way_rule_12, ['name']),
+        (_way_rule_13, ['name']),
+        (_way_rule_14, ['highway']),
+        (_way_rule_15, ['highway']),
+        (_way_rule_16, ['highway']),
+        (_way_rule_17, ['source']),
+        (_way_rule_18, ['name']),
+        (_way_rule_19, ['designation']),
+        (_way_rule_20, ['highway']),
+        (_way_rule_21, ['place']),
+        (_way_rule_22, ['place']),
+        (_way_rule_23, ['place']),
+        (_way_rule_24, ['place']),
+        (_way_rule_25, ['addr:city', 'addr:suburb']),
+        (_way_rule_26, ['addr:city']),
+        (_way_rule_27, ['name']),
+        (_way_rule_28, ['name']),
+        (_way_rule_29, ['iata']),
+        (_way_rule_30, ['amenity']),
+        (_way_rule_31, ['amenity']),
+        (_way_rule_32, ['amenity']),
+        (_way_rule_33, ['amenity']),
+        (_way_rule_34, ['amenity']),
+        (_way_rule_35, ['amenity']),
+        (_way_rule_36, ['highway']),
+        (_way_rule_37, ['highway']),
+        (_way_rule_38, ['crossing']),
+        (_way_rule_39, ['aeroway']),
+        (_way_rule_40, ['access']),
+        (_way_rule_41, ['addr:postcode']),
+        (_way_rule_42, ['postal_code']),
+        (_way_rule_43, ['addr:postcode']),
+        (_way_rule_44, ['alt_source']),
+        (_way_rule_45, ['landuse']),
+        (_way_rule_46, ['long_name']),
+        (_way_rule_47, ['building:levels']),
+        (_way_rule_48, ['hires']),
+        (_way_rule_49, ['name', 'tourism']),
+        (_way_rule_50, ['amenity']),
+        (_way_rule_51, ['name']),
+        (_way_rule_52, ['aeroway']),
+        (_way_rule_53, ['aeroway']),
+        (_way_rule_54, ['aeroway']),
+        (_way_rule_55, ['highway']),
+        (_way_rule_56, ['name']),
+        (_way_rule_57, ['highway']),
+        (_way_rule_58, ['highway']),
+        (_way_rule_59, ['route']),
+        (_way_rule_60, ['landuse', 'name']),
+        (_way_rule_61, ['wikipedia']),
+        (_way_rule_62, ['cycleway']),
+        (_way_rule_63, ['name']),
+        (_way_rule_64, ['boundary']),
+        (_way_rule_65, ['place']),
+        (_way_rule_66, ['admin_level']),
+        (_way_rule_67, ['boundary', 'leisure']),
+        (_way_rule_68, ['boundary']),
+        (_way_rule_69, ['protect_class']),
+        (_way_rule_70, ['protect_class']),
+        (_way_rule_71, ['boundary']),
+        (_way_rule_72, ['boundary']),
+        (_way_rule_73, ['name']),
+        (_way_rule_74, ['name']),
+        (_way_rule_75, ['alt_ref']),
+        (_way_rule_76, ['highway']),
+        (_way_rule_77, ['surface']),
+        (_way_rule_78, ['name']),
+        (_way_rule_79, ['highway']),
+        (_way_rule_80, ['natural']),
+        (_way_rule_81, ['natural']),
+        (_way_rule_82, ['natural']),
+        (_way_rule_83, ['leisure']),
+        (_way_rule_84, ['leisure']),
+        (_way_rule_85, ['amenity']),
+        (_way_rule_86, ['amenity']),
+        (_way_rule_87, ['name']),
+        (_way_rule_88, None),
+        (_way_rule_89, ['addr:housenumber']),
+        (_way_rule_90, ['addr:housenumber']),
+        (_way_rule_91, ['source']),
+        (_way_rule_92, ['amenity']),
+        (_way_rule_93, ['name']),
+        (_way_rule_94, ['amenity', 'name']),
+        (_way_rule_95, ['name']),
+        (_way_rule_96, ['name']),
+        (_way_rule_97, ['amenity']),
+        (_way_rule_98, ['name']),
+        (_way_rule_99, ['name']),
+        (_way_rule_100, ['alt_name', 'name']),
+        (_way_rule_101, ['place']),
+        (_way_rule_102, ['name']),
+        (_way_rule_103, ['leisure']),
+        (_way_rule_104, ['landuse']),
+        (_way_rule_105, ['ref:vatin']),
+        (_way_rule_106, ['ref:vatin']),
+        (_way_rule_107, ['ref:vatin']),
+        (_way_rule_108, ['contact:phone', 'phone']),
+        (_way_rule_109, ['contact:phone', 'phone']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # relation[highway][name=~/\b[A-Z]{2,3} (- )?[0-9]{2,3}\b/][inside("BR")]
+    # relation[highway][name=~/\b[A-Z]{2,3} (- )?[0-9]{2,3}\b/][inside("BR")]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('highway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -3312,7 +3729,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("rodovia com ref no nome")
                 err.append({'class': 9018002, 'subclass': 1625358529, 'text': mapcss.tr('rodovia com ref no nome')})
 
-        # *["addr:street"]["addr:street"!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodovia|Rotatória|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    # *["addr:street"]["addr:street"!~/^(Aeroporto|Alameda|Área|Avenida|([1-9][0-9]?º )?Beco|Boulevard|Calçadão|Caminho|Campo|Chácara|Colônia|Condomínio|Conjunto|Contorno|Distrito|Elevado|Esplanada|Estação|Estrada|Favela|Fazenda|Feira|Jardim|Ladeira|Lago|Lagoa|Largo|Loteamento|Marginal|Morro|Núcleo|([1-9][0-9]?ª )?Paralela|Parque|Passagem|Passarela|Pátio|Ponte|Praça|Quadra|Recanto|Residencial|Rodovia|Rotatória|Rua|Servidão|Setor|Sítio|([1-9][0-9]?ª )?Subida|([1-9][0-9]?ª )?Travessa|Trecho|Trevo|Túnel|Vale|Vereda|Via|Viadutos?|Viela|Vila|(Anel|Complexo|Dispositivo) (Rodo)?(V|v)iário) .*/][inside("BR")]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('addr:street' in keys):
             match = False
             if not match:
@@ -3324,7 +3742,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} com logradouro ausente, errado ou abreviado","{0.key}")
                 err.append({'class': 9018002, 'subclass': 279840772, 'text': mapcss.tr('{0} com logradouro ausente, errado ou abreviado', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[!highway][route!=road][!public_transport][type!~/route|street/][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|passarela|rodovia|rotatória|rua|travessa|trevo|viela|(anel|complexo|dispositivo) viário) .*/][name!~/^(?i)estrada de ferro/][inside("BR")]
+    # *[!highway][route!=road][!public_transport][type!~/route|street/][name][name=~/^(?i)(?u)(alameda|avenida|beco|estrada|ladeira|passarela|rodovia|rotatória|rua|travessa|trevo|viela|(anel|complexo|dispositivo) viário) .*/][name!~/^(?i)estrada de ferro/][inside("BR")]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -3336,7 +3755,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto com nome de via mas sem tag de {0}","{0.key}")
                 err.append({'class': 9018002, 'subclass': 535280341, 'text': mapcss.tr('objeto com nome de via mas sem tag de {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[name=~/^(?i)(?u)[a-z0-9]+_([a-z0-9]_?)+$/][inside("BR")]
+    # *[name=~/^(?i)(?u)[a-z0-9]+_([a-z0-9]_?)+$/][inside("BR")]
+    def _relation_rule_3(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -3348,7 +3768,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("utilizar espaço ao invés de underscore")
                 err.append({'class': 9018002, 'subclass': 1476954926, 'text': mapcss.tr('utilizar espaço ao invés de underscore')})
 
-        # *[name=~/(?i)(^|.* )(Cel|Cmte|Cond|Conj|Dª|Dr|Eng|Gov|Hab|Jd|Jr|Marg|Mun|p\/|Pde|Pe|Pq|Pst|Pref|Profa|Profª|Prof|Res|s\/|Sr(a|ª)?|Sta|Sto|Ver)\.? .*/][inside("BR")]
+    # *[name=~/(?i)(^|.* )(Cel|Cmte|Cond|Conj|Dª|Dr|Eng|Gov|Hab|Jd|Jr|Marg|Mun|p\/|Pde|Pe|Pq|Pst|Pref|Profa|Profª|Prof|Res|s\/|Sr(a|ª)?|Sta|Sto|Ver)\.? .*/][inside("BR")]
+    def _relation_rule_4(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -3359,7 +3780,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("palavra abreviada em {0}","{0.key}")
                 err.append({'class': 9018003, 'subclass': 749019091, 'text': mapcss.tr('palavra abreviada em {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[leisure][name=~/^(?i)(?u)(campo|est(á|a)dio|gin(á|a)sio|quadra)( de (futebol|esportes?))?$/][inside("BR")]
+    # *[leisure][name=~/^(?i)(?u)(campo|est(á|a)dio|gin(á|a)sio|quadra)( de (futebol|esportes?))?$/][inside("BR")]
+    def _relation_rule_5(self, data, tags, members, keys, err, sets):
         if ('leisure' in keys and 'name' in keys):
             match = False
             if not match:
@@ -3370,7 +3792,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("nome supérfluo/incompleto de local de lazer")
                 err.append({'class': 9018004, 'subclass': 1485441713, 'text': mapcss.tr('nome supérfluo/incompleto de local de lazer')})
 
-        # *[name=~/^(?i)(?u)((Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF|hospital)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)((Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF|hospital)$/][inside("BR")]
+    def _relation_rule_6(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -3381,7 +3804,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("nome supérfluo/incompleto de local de saúde")
                 err.append({'class': 9018005, 'subclass': 1497769259, 'text': mapcss.tr('nome supérfluo/incompleto de local de saúde')})
 
-        # *[amenity=~/^(clinic|doctors|hospital)$/][name=~/(?i)\bsaude\b/][inside("BR")]
+    # *[amenity=~/^(clinic|doctors|hospital)$/][name=~/(?i)\bsaude\b/][inside("BR")]
+    def _relation_rule_7(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -3393,7 +3817,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("erro de ortografia em ''saúde''")
                 err.append({'class': 9018002, 'subclass': 1962359328, 'text': mapcss.tr('erro de ortografia em \'\'saúde\'\'')})
 
-        # *[place=farm][name^="Sitio "][inside("BR")]
+    # *[place=farm][name^="Sitio "][inside("BR")]
+    def _relation_rule_8(self, data, tags, members, keys, err, sets):
         if ('name' in keys and 'place' in keys):
             match = False
             if not match:
@@ -3405,7 +3830,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("faltando acento em ''Sítio''")
                 err.append({'class': 9018002, 'subclass': 653860263, 'text': mapcss.tr('faltando acento em \'\'Sítio\'\'')})
 
-        # *[name=~/^(?i)(?u)(aldeia|borrach(aria|eiro)|bosque|capela|cemit(é|e)rio|c(ó|o)rrego|escola|estacionamento|fazenda|floresta|hospital|igreja|lago|lagoa|mata( nativa)?|praça|parque|parquinho|posto( de gasolina)?|riacho|rio|rodovi(á|a)ria|vila)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)(aldeia|borrach(aria|eiro)|bosque|capela|cemit(é|e)rio|c(ó|o)rrego|escola|estacionamento|fazenda|floresta|hospital|igreja|lago|lagoa|mata( nativa)?|praça|parque|parquinho|posto( de gasolina)?|riacho|rio|rodovi(á|a)ria|vila)$/][inside("BR")]
+    def _relation_rule_9(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -3417,10 +3843,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("local com nome supérfluo, incompleto ou descritivo")
                 err.append({'class': 9018002, 'subclass': 1104230922, 'text': mapcss.tr('local com nome supérfluo, incompleto ou descritivo')})
 
-        # *[amenity=parking][name=~/(?i)^Estacionamento /][inside("BR")]
-        # Rule Blacklisted (id: 1322492249)
+    # *[amenity=parking][name=~/(?i)^Estacionamento /][inside("BR")]
+    # Rule Blacklisted (id: 1322492249)
 
-        # relation[type=route][highway][inside("BR")]
+    # relation[type=route][highway][inside("BR")]
+    def _relation_rule_10(self, data, tags, members, keys, err, sets):
         if ('highway' in keys and 'type' in keys):
             match = False
             if not match:
@@ -3431,20 +3858,21 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("relação não deve possuir {0}","{1.key}")
                 err.append({'class': 9018046, 'subclass': 954714547, 'text': mapcss.tr('relação não deve possuir {0}', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[designation=*"addr:housename"][inside("BR")]
-        # *[ref=*designation][inside("BR")]
-        # *[ref=*old_ref][inside("BR")]
-        # *[name=*"addr:housename"][inside("BR")]
-        # *[name=*designation][inside("BR")]
-        # *[name=*alt_name][inside("BR")]
-        # *[name=*int_name][inside("BR")]
-        # *[name=*loc_name][inside("BR")]
-        # *[name=*nat_name][inside("BR")]
-        # *[name=*official_name][inside("BR")]
-        # *[name=*old_name][inside("BR")]
-        # *[name=*reg_name][inside("BR")]
-        # *[name=*short_name][inside("BR")]
-        # *[name=*sorting_name][inside("BR")]
+    # *[designation=*"addr:housename"][inside("BR")]
+    # *[ref=*designation][inside("BR")]
+    # *[ref=*old_ref][inside("BR")]
+    # *[name=*"addr:housename"][inside("BR")]
+    # *[name=*designation][inside("BR")]
+    # *[name=*alt_name][inside("BR")]
+    # *[name=*int_name][inside("BR")]
+    # *[name=*loc_name][inside("BR")]
+    # *[name=*nat_name][inside("BR")]
+    # *[name=*official_name][inside("BR")]
+    # *[name=*old_name][inside("BR")]
+    # *[name=*reg_name][inside("BR")]
+    # *[name=*short_name][inside("BR")]
+    # *[name=*sorting_name][inside("BR")]
+    def _relation_rule_11(self, data, tags, members, keys, err, sets):
         if ('designation' in keys) or ('name' in keys) or ('ref' in keys):
             match = False
             if not match:
@@ -3512,7 +3940,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.value}')])
                 }})
 
-        # *[source=*name][inside("BR")]
+    # *[source=*name][inside("BR")]
+    def _relation_rule_12(self, data, tags, members, keys, err, sets):
         if ('source' in keys):
             match = False
             if not match:
@@ -3524,7 +3953,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} e {1} são iguais","{0.key}","{0.value}")
                 err.append({'class': 9018002, 'subclass': 470146003, 'text': mapcss.tr('{0} e {1} são iguais', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[name=~/(?i)(?u)((sem (denomina(ç|c)(ã|a)o|nome|sa(i|í)da))|desconhecido|n(ã|a)o conhecido)/][inside("BR")]
+    # *[name=~/(?i)(?u)((sem (denomina(ç|c)(ã|a)o|nome|sa(i|í)da))|desconhecido|n(ã|a)o conhecido)/][inside("BR")]
+    def _relation_rule_13(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -3536,7 +3966,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"noname"
                 err.append({'class': 9018007, 'subclass': 1272098213, 'text': mapcss.tr('objeto com nomenclatura incorreta')})
 
-        # *[designation][inside("BR")]
+    # *[designation][inside("BR")]
+    def _relation_rule_14(self, data, tags, members, keys, err, sets):
         if ('designation' in keys):
             match = False
             if not match:
@@ -3549,7 +3980,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"name"
                 err.append({'class': 9018009, 'subclass': 1818234763, 'text': mapcss.tr('{0} é uma chave utilizada apenas no Reino Unido', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[place=~/hamlet|isolated_dwelling|town|village/][population>=100000][inside("BR")]
+    # *[place=~/hamlet|isolated_dwelling|town|village/][population>=100000][inside("BR")]
+    def _relation_rule_15(self, data, tags, members, keys, err, sets):
         if ('place' in keys and 'population' in keys):
             match = False
             if not match:
@@ -3565,7 +3997,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['place','city']])
                 }})
 
-        # *[place=~/city|hamlet|isolated_dwelling|village/][population>=10000][population<100000][inside("BR")]
+    # *[place=~/city|hamlet|isolated_dwelling|village/][population>=10000][population<100000][inside("BR")]
+    def _relation_rule_16(self, data, tags, members, keys, err, sets):
         if ('place' in keys and 'population' in keys):
             match = False
             if not match:
@@ -3581,7 +4014,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['place','town']])
                 }})
 
-        # *[place][place!~/hamlet|island|isolated_dwelling|neighbourhood|suburb|village/][population<10000][inside("BR")]
+    # *[place][place!~/hamlet|island|isolated_dwelling|neighbourhood|suburb|village/][population<10000][inside("BR")]
+    def _relation_rule_17(self, data, tags, members, keys, err, sets):
         if ('place' in keys and 'population' in keys):
             match = False
             if not match:
@@ -3597,14 +4031,15 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['place','village']])
                 }})
 
-        # *[place=city][!population][inside("BR")]
-        # *[place=town][!population][inside("BR")]
-        # *[place=village][!population][inside("BR")]
-        # Rule Blacklisted (id: 339470124)
+    # *[place=city][!population][inside("BR")]
+    # *[place=town][!population][inside("BR")]
+    # *[place=village][!population][inside("BR")]
+    # Rule Blacklisted (id: 339470124)
 
-        # *[place=city][!name][inside("BR")]
-        # *[place=town][!name][inside("BR")]
-        # *[place=village][!name][inside("BR")]
+    # *[place=city][!name][inside("BR")]
+    # *[place=town][!name][inside("BR")]
+    # *[place=village][!name][inside("BR")]
+    def _relation_rule_18(self, data, tags, members, keys, err, sets):
         if ('place' in keys):
             match = False
             if not match:
@@ -3623,8 +4058,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} sem nome","{0.value}")
                 err.append({'class': 9018012, 'subclass': 1473808194, 'text': mapcss.tr('{0} sem nome', mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # area[place=~/village|town|city/]["addr:city"=*name][inside("BR")]
-        # area[place=suburb]["addr:suburb"=*name][inside("BR")]
+    # area[place=~/village|town|city/]["addr:city"=*name][inside("BR")]
+    # area[place=suburb]["addr:suburb"=*name][inside("BR")]
+    def _relation_rule_19(self, data, tags, members, keys, err, sets):
         if ('addr:city' in keys and 'place' in keys and 'type' in keys) or ('addr:suburb' in keys and 'place' in keys and 'type' in keys):
             match = False
             if not match:
@@ -3644,7 +4080,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{1.key}')])
                 }})
 
-        # *["addr:city"=~/(,|( |-) ?[A-Z]{2})/][inside("BR")]
+    # *["addr:city"=~/(,|( |-) ?[A-Z]{2})/][inside("BR")]
+    def _relation_rule_20(self, data, tags, members, keys, err, sets):
         if ('addr:city' in keys):
             match = False
             if not match:
@@ -3655,7 +4092,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve conter apenas o nome da cidade","{0.key}")
                 err.append({'class': 9018013, 'subclass': 1479274467, 'text': mapcss.tr('{0} deve conter apenas o nome da cidade', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[name=~/^(?i)(?u)(Faz\.|Fazenda|Sítio|Chácara)/][place][place!~/city|farm|neighbourhood|suburb|town|village/][inside("BR")]
+    # *[name=~/^(?i)(?u)(Faz\.|Fazenda|Sítio|Chácara)/][place][place!~/city|farm|neighbourhood|suburb|town|village/][inside("BR")]
+    def _relation_rule_21(self, data, tags, members, keys, err, sets):
         if ('name' in keys and 'place' in keys):
             match = False
             if not match:
@@ -3667,7 +4105,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto talvez deva ser {0}=farm","{1.key}")
                 err.append({'class': 9018002, 'subclass': 337742963, 'text': mapcss.tr('objeto talvez deva ser {0}=farm', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[place][name=~/^(?i)Bairro\b/][name!~/^(?i)Bairro d(a|e|o)s?\b/][inside("BR")]
+    # *[place][name=~/^(?i)Bairro\b/][name!~/^(?i)Bairro d(a|e|o)s?\b/][inside("BR")]
+    def _relation_rule_22(self, data, tags, members, keys, err, sets):
         if ('name' in keys and 'place' in keys):
             match = False
             if not match:
@@ -3679,13 +4118,14 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto talvez não deva ter ''Bairro'' no nome")
                 err.append({'class': 9018002, 'subclass': 1441242115, 'text': mapcss.tr('objeto talvez não deva ter \'\'Bairro\'\' no nome')})
 
-        # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=island][eval(areasize())>1000000][inside("BR")]
-        # Part of rule not implemented
+    # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=island][eval(areasize())>1000000][inside("BR")]
+    # Part of rule not implemented
 
-        # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=islet][eval(areasize())<=1000000][inside("BR")]
-        # Part of rule not implemented
+    # area:closed[name=~/^(?i)(Ilha|Ilhota|Ilhote)\b/][!shop][!amenity][!building][place!=islet][eval(areasize())<=1000000][inside("BR")]
+    # Part of rule not implemented
 
-        # *[iata="0"][inside("BR")]
+    # *[iata="0"][inside("BR")]
+    def _relation_rule_23(self, data, tags, members, keys, err, sets):
         if ('iata' in keys):
             match = False
             if not match:
@@ -3696,7 +4136,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} com valor = {1}","{0.key}","{0.value}")
                 err.append({'class': 9018014, 'subclass': 1098244333, 'text': mapcss.tr('{0} com valor = {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[amenity=~/college|school/][name=~/^(?i)(?u)(Centro Universitário|Faculdades?|FATEC|Instituto Federal)\b/][inside("BR")]
+    # *[amenity=~/college|school/][name=~/^(?i)(?u)(Centro Universitário|Faculdades?|FATEC|Instituto Federal)\b/][inside("BR")]
+    def _relation_rule_24(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -3713,8 +4154,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=university')).split('=', 1)])
                 }})
 
-        # *[amenity=school][name=~/^(?i)(?u)(SENAC|SENAI|Serviço Nacional de Aprendizagem)/][inside("BR")]
-        # *[amenity=~/school|university/][name=~/(?i)(?u)\b(Centro Paula Souza|Escola Técnica|ETEC)\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)(?u)(SENAC|SENAI|Serviço Nacional de Aprendizagem)/][inside("BR")]
+    # *[amenity=~/school|university/][name=~/(?i)(?u)\b(Centro Paula Souza|Escola Técnica|ETEC)\b/][inside("BR")]
+    def _relation_rule_25(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -3735,7 +4177,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=college')).split('=', 1)])
                 }})
 
-        # *[amenity=school][name=~/^(?i)(?u)(auto(-| )?( moto )?escola|centro de formação de condutores|cfc|moto escola)\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)(?u)(auto(-| )?( moto )?escola|centro de formação de condutores|cfc|moto escola)\b/][inside("BR")]
+    def _relation_rule_26(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -3752,7 +4195,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=driving_school')).split('=', 1)])
                 }})
 
-        # *[amenity=school][name=~/^(?i)creche\b/][inside("BR")]
+    # *[amenity=school][name=~/^(?i)creche\b/][inside("BR")]
+    def _relation_rule_27(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -3769,20 +4213,21 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key}=kindergarten')).split('=', 1)])
                 }})
 
-        # *[name=~/^(?i)(?u)Subestação .*/][power][power!=substation][inside("BR")]
-        # *[name=~/^(?i)(?u)Fórum .*/][amenity][amenity!=courthouse][inside("BR")]
-        # *[name=~/^(?i)Hospital .*/][building][building!=hospital][inside("BR")]
-        # *[name=~/^(?i)Universidade .*/][building][building!=university][inside("BR")]
-        # *[name=~/^(?i)Escola .*/][building][building!=school][inside("BR")]
-        # *[name=~/^(?i)Hotel .*/][building][building!=hotel][inside("BR")]
-        # *[name=~/^(?i)Capela .*/][building][building!=chapel][inside("BR")]
-        # *[name=~/^(?i)Igreja .*/][building][building!=church][inside("BR")]
-        # *[name=~/^(?i)Catedral .*/][building][building!=cathedral][inside("BR")]
-        # *[name=~/^(?i)Fazenda .*/][building][building!=farm][inside("BR")]
-        # *[name=~/^(?i)Supermercado .*/][building][building!=supermarket][inside("BR")]
-        # Rule Blacklisted (id: 1123790420)
-
-        # *[name=~/^(?i)(?u)(AM(A|E)|(Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF).*/][amenity=hospital][inside("BR")]
+    # *[name=~/^(?i)(?u)Subestação .*/][power][power!=substation][inside("BR")]
+    # *[name=~/^(?i)(?u)Fórum .*/][amenity][amenity!=courthouse][inside("BR")]
+    # *[name=~/^(?i)Hospital .*/][building][building!=hospital][inside("BR")]
+    # *[name=~/^(?i)Universidade .*/][building][building!=university][inside("BR")]
+    # *[name=~/^(?i)Escola .*/][building][building!=school][inside("BR")]
+    # *[name=~/^(?i)Hotel .*/][building][building!=hotel][inside("BR")]
+    # *[name=~/^(?i)Capela .*/][building][building!=chapel][inside("BR")]
+    # *[name=~/^(?i)Igreja .*/][building][building!=church][inside("BR")]
+    # *[name=~/^(?i)Catedral .*/][building][building!=cathedral][inside("BR")]
+    # *[name=~/^(?i)Fazenda .*/][building][building!=farm][inside("BR")]
+    # *[name=~/^(?i)Supermercado .*/][building][building!=supermarket][inside("BR")]
+    # Rule Blacklisted (id: 1123790420)
+
+    # *[name=~/^(?i)(?u)(AM(A|E)|(Posto|Unidade (Básica)?) de Sa(u|ú)de|UBS|PSF).*/][amenity=hospital][inside("BR")]
+    def _relation_rule_28(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -3798,7 +4243,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['amenity','clinic']])
                 }})
 
-        # *[name=~/^(?i)\bSAMU\b/][amenity=~/clinic|doctors|hospital/][inside("BR")]
+    # *[name=~/^(?i)\bSAMU\b/][amenity=~/clinic|doctors|hospital/][inside("BR")]
+    def _relation_rule_29(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -3810,10 +4256,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"emergency=ambulance_station"
                 err.append({'class': 9018016, 'subclass': 392029310, 'text': mapcss.tr('SAMU classificado de forma errada')})
 
-        # relation[highway=give_way][inside("BR")]
-        # relation[highway=mini_roundabout][inside("BR")]
-        # relation[highway=stop][inside("BR")]
-        # relation[highway=turning_circle][inside("BR")]
+    # relation[highway=give_way][inside("BR")]
+    # relation[highway=mini_roundabout][inside("BR")]
+    # relation[highway=stop][inside("BR")]
+    # relation[highway=turning_circle][inside("BR")]
+    def _relation_rule_30(self, data, tags, members, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -3836,9 +4283,10 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve ser utilizado apenas em nós","{0.tag}")
                 err.append({'class': 9018047, 'subclass': 484299691, 'text': mapcss.tr('{0} deve ser utilizado apenas em nós', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # relation[enforcement=maxspeed][!maxspeed][inside("BR")]
-        # relation[enforcement=maxheight][!maxheight][inside("BR")]
-        # relation[enforcement=maxweight][!maxweight][inside("BR")]
+    # relation[enforcement=maxspeed][!maxspeed][inside("BR")]
+    # relation[enforcement=maxheight][!maxheight][inside("BR")]
+    # relation[enforcement=maxweight][!maxweight][inside("BR")]
+    def _relation_rule_31(self, data, tags, members, keys, err, sets):
         if ('enforcement' in keys):
             match = False
             if not match:
@@ -3857,7 +4305,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("adicionar {0} ao {1}","{1.key}","{0.tag}")
                 err.append({'class': 9018018, 'subclass': 24087693, 'text': mapcss.tr('adicionar {0} ao {1}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[crossing][!highway][!railway][inside("BR")]
+    # *[crossing][!highway][!railway][inside("BR")]
+    def _relation_rule_32(self, data, tags, members, keys, err, sets):
         if ('crossing' in keys):
             match = False
             if not match:
@@ -3868,8 +4317,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve ser utilizado com {1}={0} ou {2}={0}","{0.key}","{1.key}","{2.key}")
                 err.append({'class': 9018019, 'subclass': 2098306424, 'text': mapcss.tr('{0} deve ser utilizado com {1}={0} ou {2}={0}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[aeroway][designation=~/^[A-Z]{4}$/][!icao][inside("BR")]
-        # *[aeroway][ref=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    # *[aeroway][designation=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    # *[aeroway][ref=~/^[A-Z]{4}$/][!icao][inside("BR")]
+    def _relation_rule_33(self, data, tags, members, keys, err, sets):
         if ('aeroway' in keys and 'designation' in keys) or ('aeroway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -3891,7 +4341,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{1.key} => {2.key}')).split('=>', 1)[0].strip()])
                 }})
 
-        # *[access=permissive][inside("BR")]
+    # *[access=permissive][inside("BR")]
+    def _relation_rule_34(self, data, tags, members, keys, err, sets):
         if ('access' in keys):
             match = False
             if not match:
@@ -3903,17 +4354,18 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve ser utilizado apenas em vias privadas com permissão de acesso e não em vias de acesso público","{0.tag}")
                 err.append({'class': 9018002, 'subclass': 1240816112, 'text': mapcss.tr('{0} deve ser utilizado apenas em vias privadas com permissão de acesso e não em vias de acesso público', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[name=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
-        # *["addr:street"=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
-        # Rule Blacklisted (id: 951501764)
+    # *[name=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
+    # *["addr:street"=~/^(?U)(\p{Upper}| )+$/][inside("BR")]
+    # Rule Blacklisted (id: 951501764)
 
-        # *["addr:postcode"=~/^[0-9]{8}$/][inside("BR")]
-        # Rule Blacklisted (id: 1948798798)
+    # *["addr:postcode"=~/^[0-9]{8}$/][inside("BR")]
+    # Rule Blacklisted (id: 1948798798)
 
-        # *[postal_code=~/^[0-9]{8}$/][inside("BR")]
-        # Rule Blacklisted (id: 733725137)
+    # *[postal_code=~/^[0-9]{8}$/][inside("BR")]
+    # Rule Blacklisted (id: 733725137)
 
-        # *["addr:postcode"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    # *["addr:postcode"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    def _relation_rule_35(self, data, tags, members, keys, err, sets):
         if ('addr:postcode' in keys):
             match = False
             if not match:
@@ -3929,7 +4381,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss.concat('addr:postcode=', mapcss.replace(mapcss.replace(mapcss.tag(tags, 'addr:postcode'), ' ', '-'), '.', '-'))).split('=', 1)])
                 }})
 
-        # *["postal_code"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    # *["postal_code"=~/^[0-9]{5}( |\.)[0-9]{3}$/][inside("BR")]
+    def _relation_rule_36(self, data, tags, members, keys, err, sets):
         if ('postal_code' in keys):
             match = False
             if not match:
@@ -3945,11 +4398,12 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss.concat('postal_code=', mapcss.replace(mapcss.replace(mapcss.tag(tags, 'postal_code'), ' ', '-'), '.', '-'))).split('=', 1)])
                 }})
 
-        # *["addr:postcode"]["addr:postcode"!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
-        # *[postal_code][postal_code!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
-        # Rule Blacklisted (id: 2074305530)
+    # *["addr:postcode"]["addr:postcode"!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
+    # *[postal_code][postal_code!~/^[0-9]{5}-[0-9]{3}$/][inside("BR")]
+    # Rule Blacklisted (id: 2074305530)
 
-        # area[place]["addr:postcode"][inside("BR")]
+    # area[place]["addr:postcode"][inside("BR")]
+    def _relation_rule_37(self, data, tags, members, keys, err, sets):
         if ('addr:postcode' in keys and 'place' in keys and 'type' in keys):
             match = False
             if not match:
@@ -3968,7 +4422,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{1.key} => postal_code')).split('=>', 1)[0].strip()])
                 }})
 
-        # *[alt_source][source][inside("BR")]
+    # *[alt_source][source][inside("BR")]
+    def _relation_rule_38(self, data, tags, members, keys, err, sets):
         if ('alt_source' in keys and 'source' in keys):
             match = False
             if not match:
@@ -3979,7 +4434,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve estar incluído em {1}, separado por '';'' caso necessário","{0.key}","{1.key}")
                 err.append({'class': 9018020, 'subclass': 472956812, 'text': mapcss.tr('{0} deve estar incluído em {1}, separado por \'\';\'\' caso necessário', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[landuse?][inside("BR")]
+    # *[landuse?][inside("BR")]
+    def _relation_rule_39(self, data, tags, members, keys, err, sets):
         if ('landuse' in keys):
             match = False
             if not match:
@@ -3990,7 +4446,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("especificar valor correto para {0} ao invés de ''{1}''","{0.key}",tag("landuse"))
                 err.append({'class': 9018021, 'subclass': 6418462, 'text': mapcss.tr('especificar valor correto para {0} ao invés de \'\'{1}\'\'', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss.tag(tags, 'landuse'))})
 
-        # *[long_name][inside("BR")]
+    # *[long_name][inside("BR")]
+    def _relation_rule_40(self, data, tags, members, keys, err, sets):
         if ('long_name' in keys):
             match = False
             if not match:
@@ -4004,7 +4461,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"official_name"
                 err.append({'class': 9018022, 'subclass': 1737555221, 'text': mapcss.tr('chave inválida: {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *["building:levels"<1][inside("BR")]
+    # *["building:levels"<1][inside("BR")]
+    def _relation_rule_41(self, data, tags, members, keys, err, sets):
         if ('building:levels' in keys):
             match = False
             if not match:
@@ -4016,7 +4474,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} com valor inválido","{0.key}")
                 err.append({'class': 9018002, 'subclass': 775859422, 'text': mapcss.tr('{0} com valor inválido', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[hires?][inside("BR")]
+    # *[hires?][inside("BR")]
+    def _relation_rule_42(self, data, tags, members, keys, err, sets):
         if ('hires' in keys):
             match = False
             if not match:
@@ -4027,8 +4486,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("não se deve utilizar {0} para demarcar áreas de cobertura de imagem","{0.key}")
                 err.append({'class': 9018023, 'subclass': 895278192, 'text': mapcss.tr('não se deve utilizar {0} para demarcar áreas de cobertura de imagem', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[tourism=motel][amenity!=love_hotel][inside("BR")]
-        # *[name=~/(?i)\bmotel\b/][amenity!=love_hotel][inside("BR")]
+    # *[tourism=motel][amenity!=love_hotel][inside("BR")]
+    # *[name=~/(?i)\bmotel\b/][amenity!=love_hotel][inside("BR")]
+    def _relation_rule_43(self, data, tags, members, keys, err, sets):
         if ('name' in keys) or ('tourism' in keys):
             match = False
             if not match:
@@ -4048,7 +4508,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{1.key}={1.value}')).split('=', 1)])
                 }})
 
-        # *[amenity=love_hotel][tourism][tourism!=motel][inside("BR")]
+    # *[amenity=love_hotel][tourism][tourism!=motel][inside("BR")]
+    def _relation_rule_44(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'tourism' in keys):
             match = False
             if not match:
@@ -4060,7 +4521,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("provavelmente deve ser ''{0}={1}''","{2.key}","{2.value}")
                 err.append({'class': 9018002, 'subclass': 1760828878, 'text': mapcss.tr('provavelmente deve ser \'\'{0}={1}\'\'', mapcss._tag_uncapture(capture_tags, '{2.key}'), mapcss._tag_uncapture(capture_tags, '{2.value}'))})
 
-        # *[name=~/(?i)^motel\b/][tourism!=motel][inside("BR")]
+    # *[name=~/(?i)^motel\b/][tourism!=motel][inside("BR")]
+    def _relation_rule_45(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -4073,8 +4535,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"tourism=motel"
                 err.append({'class': 9018002, 'subclass': 1456128106, 'text': mapcss.tr('motel classificado incorretamente')})
 
-        # *[aeroway=aerodrome][name=~/(?i).*airport$/][inside("BR")]
-        # *[aeroway=helipad][name=~/(?i).*heliport$/][inside("BR")]
+    # *[aeroway=aerodrome][name=~/(?i).*airport$/][inside("BR")]
+    # *[aeroway=helipad][name=~/(?i).*heliport$/][inside("BR")]
+    def _relation_rule_46(self, data, tags, members, keys, err, sets):
         if ('aeroway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -4090,8 +4553,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} com nome em inglês","{0.tag}")
                 err.append({'class': 9018002, 'subclass': 1743601177, 'text': mapcss.tr('{0} com nome em inglês', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[aeroway=aerodrome][name=~/(?i)^Aer(ódromo|oporto) de.*/][inside("BR")]
-        # *[aeroway=helipad][name=~/(?i)^Helipo(n|r)to.*/][inside("BR")]
+    # *[aeroway=aerodrome][name=~/(?i)^Aer(ódromo|oporto) de.*/][inside("BR")]
+    # *[aeroway=helipad][name=~/(?i)^Helipo(n|r)to.*/][inside("BR")]
+    def _relation_rule_47(self, data, tags, members, keys, err, sets):
         if ('aeroway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -4107,7 +4571,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("conferir se existe nome oficial do {0}","{0.value}")
                 err.append({'class': 9018002, 'subclass': 136467214, 'text': mapcss.tr('conferir se existe nome oficial do {0}', mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[aeroway=aerodrome][ref][inside("BR")]
+    # *[aeroway=aerodrome][ref][inside("BR")]
+    def _relation_rule_48(self, data, tags, members, keys, err, sets):
         if ('aeroway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -4119,7 +4584,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("''{0}'' não faz sentido em aeroporto","{1.key}")
                 err.append({'class': 9018002, 'subclass': 1633437696, 'text': mapcss.tr('\'\'{0}\'\' não faz sentido em aeroporto', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[waterway][layer<0][!tunnel][inside("BR")]
+    # *[waterway][layer<0][!tunnel][inside("BR")]
+    def _relation_rule_49(self, data, tags, members, keys, err, sets):
         if ('layer' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -4131,7 +4597,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} negativo de {1} com ausência de {2}","{1.key}","{0.key}","{2.key}")
                 err.append({'class': 9018002, 'subclass': 203420779, 'text': mapcss.tr('{0} negativo de {1} com ausência de {2}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[waterway][layer>0][!bridge][inside("BR")]
+    # *[waterway][layer>0][!bridge][inside("BR")]
+    def _relation_rule_50(self, data, tags, members, keys, err, sets):
         if ('layer' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -4143,10 +4610,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} positivo de {1} com ausência de {2}","{1.key}","{0.key}","{2.key}")
                 err.append({'class': 9018002, 'subclass': 1870051659, 'text': mapcss.tr('{0} positivo de {1} com ausência de {2}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[layer][!building][!highway][man_made!=pipeline][!railway][!waterway][power!=line][inside("BR")]
-        # Rule Blacklisted (id: 39095837)
+    # *[layer][!building][!highway][man_made!=pipeline][!railway][!waterway][power!=line][inside("BR")]
+    # Rule Blacklisted (id: 39095837)
 
-        # *[name=~/^(?i)(?u)edifício.*/][!building][inside("BR")]
+    # *[name=~/^(?i)(?u)edifício.*/][!building][inside("BR")]
+    def _relation_rule_51(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -4157,7 +4625,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("possível ausência de tag {0}","{1.key}")
                 err.append({'class': 9018026, 'subclass': 1332986859, 'text': mapcss.tr('possível ausência de tag {0}', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[route=ferry][!duration][inside("BR")]
+    # *[route=ferry][!duration][inside("BR")]
+    def _relation_rule_52(self, data, tags, members, keys, err, sets):
         if ('route' in keys):
             match = False
             if not match:
@@ -4168,8 +4637,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("ausência do tempo de duração ({0}) da balsa","{1.key}")
                 err.append({'class': 9018027, 'subclass': 1343391603, 'text': mapcss.tr('ausência do tempo de duração ({0}) da balsa', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[name=~/^(?i)(?u)praça.*/][!leisure][landuse=~/^(forest|grass|greenfield|meadow|orchard)$/][inside("BR")]
-        # *[name=~/^(?i)(?u)praça.*/][!leisure][natural=~/^(grassland|heath|scrub|wood)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)praça.*/][!leisure][landuse=~/^(forest|grass|greenfield|meadow|orchard)$/][inside("BR")]
+    # *[name=~/^(?i)(?u)praça.*/][!leisure][natural=~/^(grassland|heath|scrub|wood)$/][inside("BR")]
+    def _relation_rule_53(self, data, tags, members, keys, err, sets):
         if ('landuse' in keys and 'name' in keys) or ('name' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -4185,7 +4655,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"leisure=park"
                 err.append({'class': 9018029, 'subclass': 181066872, 'text': mapcss.tr('possível definição incorreta para praça: \'\'{0}\'\'', mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[wikipedia][wikipedia!~/^pt:/][inside("BR")]
+    # *[wikipedia][wikipedia!~/^pt:/][inside("BR")]
+    def _relation_rule_54(self, data, tags, members, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -4196,19 +4667,20 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("utilizar prefixo em português (pt:) para {0}","{0.key}")
                 err.append({'class': 9018030, 'subclass': 1431112366, 'text': mapcss.tr('utilizar prefixo em português (pt:) para {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[name=~/.*\(.*\).*/][inside("BR")]
-        # Rule Blacklisted (id: 2146320716)
+    # *[name=~/.*\(.*\).*/][inside("BR")]
+    # Rule Blacklisted (id: 2146320716)
 
-        # *[name=~/ - /][inside("BR")]
-        # Rule Blacklisted (id: 1840875080)
+    # *[name=~/ - /][inside("BR")]
+    # Rule Blacklisted (id: 1840875080)
 
-        # *[name=~/, /][inside("BR")]
-        # Rule Blacklisted (id: 1508736498)
+    # *[name=~/, /][inside("BR")]
+    # Rule Blacklisted (id: 1508736498)
 
-        # *[name=~/: /][inside("BR")]
-        # Rule Blacklisted (id: 877403916)
+    # *[name=~/: /][inside("BR")]
+    # Rule Blacklisted (id: 877403916)
 
-        # *[name=~/ ou /][inside("BR")]
+    # *[name=~/ ou /][inside("BR")]
+    def _relation_rule_55(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -4220,7 +4692,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"name e alt_name"
                 err.append({'class': 9018031, 'subclass': 115703372, 'text': mapcss.tr('nome utilizado de forma incorreta')})
 
-        # relation[boundary][type!=boundary][inside("BR")]
+    # relation[boundary][type!=boundary][inside("BR")]
+    def _relation_rule_56(self, data, tags, members, keys, err, sets):
         if ('boundary' in keys):
             match = False
             if not match:
@@ -4231,7 +4704,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve possuir ''type=boundary''","{0.key}")
                 err.append({'class': 9018048, 'subclass': 1926430386, 'text': mapcss.tr('{0} deve possuir \'\'type=boundary\'\'', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # relation[type=boundary][!boundary][inside("BR")]
+    # relation[type=boundary][!boundary][inside("BR")]
+    def _relation_rule_57(self, data, tags, members, keys, err, sets):
         if ('type' in keys):
             match = False
             if not match:
@@ -4242,7 +4716,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve ser utilizado junto com {1}","{0.tag}","{1.key}")
                 err.append({'class': 9018049, 'subclass': 1270177491, 'text': mapcss.tr('{0} deve ser utilizado junto com {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # relation[admin_level][boundary!=administrative][inside("BR")]
+    # relation[admin_level][boundary!=administrative][inside("BR")]
+    def _relation_rule_58(self, data, tags, members, keys, err, sets):
         if ('admin_level' in keys):
             match = False
             if not match:
@@ -4258,7 +4733,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['boundary','administrative']])
                 }})
 
-        # relation[boundary=administrative][!admin_level][inside("BR")]
+    # relation[boundary=administrative][!admin_level][inside("BR")]
+    def _relation_rule_59(self, data, tags, members, keys, err, sets):
         if ('boundary' in keys):
             match = False
             if not match:
@@ -4269,7 +4745,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwError:tr("{0} deve possuir {1}","{0.tag}","{1.key}")
                 err.append({'class': 9018033, 'subclass': 802276360, 'text': mapcss.tr('{0} deve possuir {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # relation[place][place!~/^(city_block|farm|hamlet|island|islet|isolated_dwelling|neighbourhood|square)$/][!admin_level][!boundary][inside("BR")]
+    # relation[place][place!~/^(city_block|farm|hamlet|island|islet|isolated_dwelling|neighbourhood|square)$/][!admin_level][!boundary][inside("BR")]
+    def _relation_rule_60(self, data, tags, members, keys, err, sets):
         if ('place' in keys):
             match = False
             if not match:
@@ -4281,7 +4758,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("local com ausência/incoerência de limite administrativo")
                 err.append({'class': 9018002, 'subclass': 1689081650, 'text': mapcss.tr('local com ausência/incoerência de limite administrativo')})
 
-        # relation[boundary=administrative][type=multipolygon][inside("BR")]
+    # relation[boundary=administrative][type=multipolygon][inside("BR")]
+    def _relation_rule_61(self, data, tags, members, keys, err, sets):
         if ('boundary' in keys and 'type' in keys):
             match = False
             if not match:
@@ -4297,9 +4775,10 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['type','boundary']])
                 }})
 
-        # *[boundary=national_park][!name][inside("BR")]
-        # *[boundary=protected_area][!name][inside("BR")]
-        # *[leisure=nature_reserve][!name][inside("BR")]
+    # *[boundary=national_park][!name][inside("BR")]
+    # *[boundary=protected_area][!name][inside("BR")]
+    # *[leisure=nature_reserve][!name][inside("BR")]
+    def _relation_rule_62(self, data, tags, members, keys, err, sets):
         if ('boundary' in keys) or ('leisure' in keys):
             match = False
             if not match:
@@ -4318,7 +4797,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve possuir {1}","{0.tag}","{1.key}")
                 err.append({'class': 9018033, 'subclass': 1196875584, 'text': mapcss.tr('{0} deve possuir {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[boundary=protected_area][!protect_class][inside("BR")]
+    # *[boundary=protected_area][!protect_class][inside("BR")]
+    def _relation_rule_63(self, data, tags, members, keys, err, sets):
         if ('boundary' in keys):
             match = False
             if not match:
@@ -4329,7 +4809,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve possuir {1}","{0.tag}","{1.key}")
                 err.append({'class': 9018033, 'subclass': 1593244126, 'text': mapcss.tr('{0} deve possuir {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[protect_class][protect_class!~/^(1(a|b)?|[1-9][0-9]?)$/][inside("BR")]
+    # *[protect_class][protect_class!~/^(1(a|b)?|[1-9][0-9]?)$/][inside("BR")]
+    def _relation_rule_64(self, data, tags, members, keys, err, sets):
         if ('protect_class' in keys):
             match = False
             if not match:
@@ -4340,7 +4821,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("valor incorreto para {0}","{0.key}")
                 err.append({'class': 9018034, 'subclass': 1183781531, 'text': mapcss.tr('valor incorreto para {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[protect_class][boundary!=protected_area][inside("BR")]
+    # *[protect_class][boundary!=protected_area][inside("BR")]
+    def _relation_rule_65(self, data, tags, members, keys, err, sets):
         if ('protect_class' in keys):
             match = False
             if not match:
@@ -4351,7 +4833,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("ausência de boundary=protected_area")
                 err.append({'class': 9018035, 'subclass': 1649283274, 'text': mapcss.tr('ausência de boundary=protected_area')})
 
-        # area[boundary=protected_area][leisure=nature_reserve][name=~/(?i)(?u)\bAPA\b|Área de Proteção Ambiental/][inside("BR")]
+    # area[boundary=protected_area][leisure=nature_reserve][name=~/(?i)(?u)\bAPA\b|Área de Proteção Ambiental/][inside("BR")]
+    def _relation_rule_66(self, data, tags, members, keys, err, sets):
         if ('boundary' in keys and 'leisure' in keys and 'name' in keys and 'type' in keys):
             match = False
             if not match:
@@ -4367,7 +4850,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     'leisure'])
                 }})
 
-        # area[boundary=protected_area][name=~/(?i)\bAPA\b/][inside("BR")]
+    # area[boundary=protected_area][name=~/(?i)\bAPA\b/][inside("BR")]
+    def _relation_rule_67(self, data, tags, members, keys, err, sets):
         if ('boundary' in keys and 'name' in keys and 'type' in keys):
             match = False
             if not match:
@@ -4380,7 +4864,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"short_name"
                 err.append({'class': 9018002, 'subclass': 2108639028, 'text': mapcss.tr('Utilizar o nome por extenso ao invés de \'\'APA\'\'')})
 
-        # relation[destination][type!=waterway][inside("BR")]
+    # relation[destination][type!=waterway][inside("BR")]
+    def _relation_rule_68(self, data, tags, members, keys, err, sets):
         if ('destination' in keys):
             match = False
             if not match:
@@ -4391,7 +4876,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} deve ser usado apenas em ways","{0.key}")
                 err.append({'class': 9018036, 'subclass': 1899110172, 'text': mapcss.tr('{0} deve ser usado apenas em ways', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[name=~/.* D(a|e|o)s? .*/][inside("BR")]
+    # *[name=~/.* D(a|e|o)s? .*/][inside("BR")]
+    def _relation_rule_69(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -4403,7 +4889,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("''da'', ''de'' e ''do'' são minúsculos nos nomes em português")
                 err.append({'class': 9018002, 'subclass': 874509528, 'text': mapcss.tr('\'\'da\'\', \'\'de\'\' e \'\'do\'\' são minúsculos nos nomes em português')})
 
-        # *[name=~/^[a-z].*/][inside("BR")]
+    # *[name=~/^[a-z].*/][inside("BR")]
+    def _relation_rule_70(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -4415,7 +4902,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("nome iniciando com letra minúscula")
                 err.append({'class': 9018002, 'subclass': 2073274467, 'text': mapcss.tr('nome iniciando com letra minúscula')})
 
-        # *[alt_ref][inside("BR")]
+    # *[alt_ref][inside("BR")]
+    def _relation_rule_71(self, data, tags, members, keys, err, sets):
         if ('alt_ref' in keys):
             match = False
             if not match:
@@ -4427,7 +4915,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"ref"
                 err.append({'class': 9018039, 'subclass': 836388143, 'text': mapcss.tr('o conteúdo de {0} deve fazer parte de ref, separado por ;', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[surface][eval(number_of_tags())=1][inside("BR")]
+    # *[surface][eval(number_of_tags())=1][inside("BR")]
+    def _relation_rule_72(self, data, tags, members, keys, err, sets):
         if ('surface' in keys):
             match = False
             if not match:
@@ -4438,8 +4927,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto incompleto: possui apenas {0}","{0.key}")
                 err.append({'class': 9018041, 'subclass': 411244066, 'text': mapcss.tr('objeto incompleto: possui apenas {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[name][surface][eval(number_of_tags())=2][inside("BR")]
-        # *[name][website][eval(number_of_tags())=2][inside("BR")]
+    # *[name][surface][eval(number_of_tags())=2][inside("BR")]
+    # *[name][website][eval(number_of_tags())=2][inside("BR")]
+    def _relation_rule_73(self, data, tags, members, keys, err, sets):
         if ('name' in keys and 'surface' in keys) or ('name' in keys and 'website' in keys):
             match = False
             if not match:
@@ -4454,7 +4944,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("objeto incompleto: possui apenas {0} e {1}","{0.key}","{1.key}")
                 err.append({'class': 9018042, 'subclass': 585137381, 'text': mapcss.tr('objeto incompleto: possui apenas {0} e {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # area[natural=wetland][!wetland][inside("BR")]
+    # area[natural=wetland][!wetland][inside("BR")]
+    def _relation_rule_74(self, data, tags, members, keys, err, sets):
         if ('natural' in keys and 'type' in keys):
             match = False
             if not match:
@@ -4465,7 +4956,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("ausência de wetland=*")
                 err.append({'class': 9018065, 'subclass': 1029145948, 'text': mapcss.tr('ausência de wetland=*')})
 
-        # area[natural=beach][!surface][inside("BR")]
+    # area[natural=beach][!surface][inside("BR")]
+    def _relation_rule_75(self, data, tags, members, keys, err, sets):
         if ('natural' in keys and 'type' in keys):
             match = False
             if not match:
@@ -4476,7 +4968,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("''{0}'' sem ''{1}'' definida","{0.tag}","{1.key}")
                 err.append({'class': 9018066, 'subclass': 653607218, 'text': mapcss.tr('\'\'{0}\'\' sem \'\'{1}\'\' definida', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # area[natural=beach][surface][surface!~/^(fine_gravel|gravel|pebbles|pebblestone|sand|shells|shingle|stones)$/][inside("BR")]
+    # area[natural=beach][surface][surface!~/^(fine_gravel|gravel|pebbles|pebblestone|sand|shells|shingle|stones)$/][inside("BR")]
+    def _relation_rule_76(self, data, tags, members, keys, err, sets):
         if ('natural' in keys and 'surface' in keys and 'type' in keys):
             match = False
             if not match:
@@ -4487,7 +4980,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} inapropriada para ''{1}''","{1.key}","{0.tag}")
                 err.append({'class': 9018067, 'subclass': 231893104, 'text': mapcss.tr('{0} inapropriada para \'\'{1}\'\'', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[leisure=pitch][sport=tennis][surface=unpaved][inside("BR")]
+    # *[leisure=pitch][sport=tennis][surface=unpaved][inside("BR")]
+    def _relation_rule_77(self, data, tags, members, keys, err, sets):
         if ('leisure' in keys and 'sport' in keys and 'surface' in keys):
             match = False
             if not match:
@@ -4504,10 +4998,11 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['surface','clay']])
                 }})
 
-        # area[amenity=fuel][eval(areasize())>2500][inside("BR")]
-        # Part of rule not implemented
+    # area[amenity=fuel][eval(areasize())>2500][inside("BR")]
+    # Part of rule not implemented
 
-        # *[amenity=fuel][name=~/(?i)(?u)\b(Ale|BR|Esso|Ipiranga|Petrobr(á|a)s|Shell|Texaco)\b/][inside("BR")]
+    # *[amenity=fuel][name=~/(?i)(?u)\b(Ale|BR|Esso|Ipiranga|Petrobr(á|a)s|Shell|Texaco)\b/][inside("BR")]
+    def _relation_rule_78(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -4520,7 +5015,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"brand"
                 err.append({'class': 9018002, 'subclass': 1724035987, 'text': mapcss.tr('o nome não deve conter a bandeira/marca do posto')})
 
-        # *[amenity=fuel][brand=BR][inside("BR")]
+    # *[amenity=fuel][brand=BR][inside("BR")]
+    def _relation_rule_79(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'brand' in keys):
             match = False
             if not match:
@@ -4537,7 +5033,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     ['brand','Petrobras']])
                 }})
 
-        # *[shop=gas][name=~/(?i)(?u)^(Brasilg(á|a)s|Consigaz|Copagaz|Liquig(á|a)s|Minasg(á|a)s|Nacional G(á|a)s|Supergasbras|Ultragaz)$/][inside("BR")]
+    # *[shop=gas][name=~/(?i)(?u)^(Brasilg(á|a)s|Consigaz|Copagaz|Liquig(á|a)s|Minasg(á|a)s|Nacional G(á|a)s|Supergasbras|Ultragaz)$/][inside("BR")]
+    def _relation_rule_80(self, data, tags, members, keys, err, sets):
         if ('name' in keys and 'shop' in keys):
             match = False
             if not match:
@@ -4550,7 +5047,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"brand"
                 err.append({'class': 9018002, 'subclass': 867102166, 'text': mapcss.tr('o nome não deve conter a bandeira/marca da loja')})
 
-        # *[/_[0-9]$/][!"is_in:iso_3166_2"][inside("BR")]
+    # *[/_[0-9]$/][!"is_in:iso_3166_2"][inside("BR")]
+    def _relation_rule_81(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -4561,7 +5059,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwError:tr("chave inválida: {0}","{0.key}")
                 err.append({'class': 9018022, 'subclass': 231229079, 'text': mapcss.tr('chave inválida: {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][!note][inside("BR")]
+    # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][!note][inside("BR")]
+    def _relation_rule_82(self, data, tags, members, keys, err, sets):
         if ('addr:housenumber' in keys):
             match = False
             if not match:
@@ -4581,7 +5080,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     'addr:housenumber'])
                 }})
 
-        # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][note][inside("BR")]
+    # *["addr:housenumber"=~/(?i)^s(\.|-| )?\/?n\.?º?$/][note][inside("BR")]
+    def _relation_rule_83(self, data, tags, members, keys, err, sets):
         if ('addr:housenumber' in keys and 'note' in keys):
             match = False
             if not match:
@@ -4593,7 +5093,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"note"
                 err.append({'class': 9018043, 'subclass': 1150070765, 'text': mapcss.tr('não utilizar \'\'{0}\'\' para locais sem número', mapcss.tag(tags, 'addr:housenumber'))})
 
-        # *[source=~/(?i)google/][inside("BR")]
+    # *[source=~/(?i)google/][inside("BR")]
+    def _relation_rule_84(self, data, tags, members, keys, err, sets):
         if ('source' in keys):
             match = False
             if not match:
@@ -4604,7 +5105,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwError:tr("objeto contém Google como source")
                 err.append({'class': 9018044, 'subclass': 1159310436, 'text': mapcss.tr('objeto contém Google como source')})
 
-        # *[amenity=townhall][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    # *[amenity=townhall][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    def _relation_rule_85(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -4617,7 +5119,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"office=government + government=legislative"
                 err.append({'class': 9018002, 'subclass': 532372413, 'text': mapcss.tr('câmara de vereadores mapeada incorretamente')})
 
-        # *[office=government][government!=legislative][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    # *[office=government][government!=legislative][name=~/^(?i)(?u)c(â|a)mara\b/][inside("BR")]
+    def _relation_rule_86(self, data, tags, members, keys, err, sets):
         if ('name' in keys and 'office' in keys):
             match = False
             if not match:
@@ -4629,8 +5132,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("ausência de government=legislative")
                 err.append({'class': 9018002, 'subclass': 2126685099, 'text': mapcss.tr('ausência de government=legislative')})
 
-        # *[amenity=townhall][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
-        # *[office=government][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    # *[amenity=townhall][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    # *[office=government][name=~/^(?i)(?u)c((â|a)me|ama)ra\b/][inside("BR")]
+    def _relation_rule_87(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'name' in keys) or ('name' in keys and 'office' in keys):
             match = False
             if not match:
@@ -4646,7 +5150,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("erro de ortografia em ''câmara''")
                 err.append({'class': 9018002, 'subclass': 1277153079, 'text': mapcss.tr('erro de ortografia em \'\'câmara\'\'')})
 
-        # *[name=~/(?i)^prefeitura\b/][amenity!=townhall][inside("BR")]
+    # *[name=~/(?i)^prefeitura\b/][amenity!=townhall][inside("BR")]
+    def _relation_rule_88(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -4659,7 +5164,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"amenity=townhall"
                 err.append({'class': 9018002, 'subclass': 1445137044, 'text': mapcss.tr('prefeitura possivelmente mapeada de forma incorreta')})
 
-        # *[name=~/(?i)(?u)^paço\b/][amenity!=townhall][inside("BR")]
+    # *[name=~/(?i)(?u)^paço\b/][amenity!=townhall][inside("BR")]
+    def _relation_rule_89(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -4672,7 +5178,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"amenity=townhall"
                 err.append({'class': 9018002, 'subclass': 1169494638, 'text': mapcss.tr('paço possivelmente mapeado de forma incorreta')})
 
-        # *[amenity=charging_station][inside("BR")]
+    # *[amenity=charging_station][inside("BR")]
+    def _relation_rule_90(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -4684,7 +5191,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("possivelmente deve ser amenity=fuel")
                 err.append({'class': 9018002, 'subclass': 2011797637, 'text': mapcss.tr('possivelmente deve ser amenity=fuel')})
 
-        # *[name=~/(?i)^Borrach(aria|eiro)/][shop=tyres][!repair][inside("BR")]
+    # *[name=~/(?i)^Borrach(aria|eiro)/][shop=tyres][!repair][inside("BR")]
+    def _relation_rule_91(self, data, tags, members, keys, err, sets):
         if ('name' in keys and 'shop' in keys):
             match = False
             if not match:
@@ -4697,7 +5205,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"repair=yes"
                 err.append({'class': 9018002, 'subclass': 1225518759, 'text': mapcss.tr('borracharia sem \'\'repair=yes\'\'')})
 
-        # *[name=~/(?i)^Borrach(aria|eiro)/][shop!=tyres][inside("BR")]
+    # *[name=~/(?i)^Borrach(aria|eiro)/][shop!=tyres][inside("BR")]
+    def _relation_rule_92(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -4710,7 +5219,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"shop=tyres"
                 err.append({'class': 9018002, 'subclass': 755877630, 'text': mapcss.tr('borracharia sem \'\'shop=tyres\'\'')})
 
-        # area[place=square][leisure!=park][inside("BR")]
+    # area[place=square][leisure!=park][inside("BR")]
+    def _relation_rule_93(self, data, tags, members, keys, err, sets):
         if ('place' in keys and 'type' in keys):
             match = False
             if not match:
@@ -4723,7 +5233,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"leisure=park"
                 err.append({'class': 9018002, 'subclass': 758716021, 'text': mapcss.tr('{0} deve ser usado em praças pavimentadas (plaza)', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[name=~/(?i)\bcoreto\b/][leisure!=bandstand][leisure!=park][inside("BR")]
+    # *[name=~/(?i)\bcoreto\b/][leisure!=bandstand][leisure!=park][inside("BR")]
+    def _relation_rule_94(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -4736,7 +5247,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"leisure=bandstand"
                 err.append({'class': 9018002, 'subclass': 810497942, 'text': mapcss.tr('coreto possivelmente classificado de forma incorreta')})
 
-        # *[leisure=recreation_ground][inside("BR")]
+    # *[leisure=recreation_ground][inside("BR")]
+    def _relation_rule_95(self, data, tags, members, keys, err, sets):
         if ('leisure' in keys):
             match = False
             if not match:
@@ -4750,7 +5262,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # suggestAlternative:"leisure=park"
                 err.append({'class': 9018002, 'subclass': 1594563801, 'text': mapcss.tr('{0} impreciso', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[leisure=recreation_ground][landuse=recreation_ground][inside("BR")]
+    # *[leisure=recreation_ground][landuse=recreation_ground][inside("BR")]
+    def _relation_rule_96(self, data, tags, members, keys, err, sets):
         if ('landuse' in keys and 'leisure' in keys):
             match = False
             if not match:
@@ -4766,7 +5279,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     'leisure'])
                 }})
 
-        # *["ref:vatin"]["ref:vatin"!~/^BR[0-9]{14}$/][inside("BR")]
+    # *["ref:vatin"]["ref:vatin"!~/^BR[0-9]{14}$/][inside("BR")]
+    def _relation_rule_97(self, data, tags, members, keys, err, sets):
         if ('ref:vatin' in keys):
             match = False
             if not match:
@@ -4778,7 +5292,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("CNPJ diferente do formato BRxxxxxxxxxxxxxx")
                 err.append({'class': 9018002, 'subclass': 1793026117, 'text': mapcss.tr('CNPJ diferente do formato BRxxxxxxxxxxxxxx')})
 
-        # *["ref:vatin"=~/^[0-9]{2}\.[0-9]{3}\.[0-9]{3}\/[0-9]{4}-[0-9]{2}$/][inside("BR")]
+    # *["ref:vatin"=~/^[0-9]{2}\.[0-9]{3}\.[0-9]{3}\/[0-9]{4}-[0-9]{2}$/][inside("BR")]
+    def _relation_rule_98(self, data, tags, members, keys, err, sets):
         if ('ref:vatin' in keys):
             match = False
             if not match:
@@ -4794,7 +5309,8 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss.concat('ref:vatin=BR', mapcss.replace(mapcss.replace(mapcss.replace(mapcss.tag(tags, 'ref:vatin'), '/', ''), '.', ''), '-', ''))).split('=', 1)])
                 }})
 
-        # *["ref:vatin"=~/^(br|bR|Br)[0-9]{14}$/][inside("BR")]
+    # *["ref:vatin"=~/^(br|bR|Br)[0-9]{14}$/][inside("BR")]
+    def _relation_rule_99(self, data, tags, members, keys, err, sets):
         if ('ref:vatin' in keys):
             match = False
             if not match:
@@ -4810,11 +5326,12 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     (mapcss.concat('ref:vatin=', mapcss.upper(mapcss.tag(tags, 'ref:vatin')))).split('=', 1)])
                 }})
 
-        # area:closed[building=~/^(apartments|house|residential|dormitory|yes)$/][eval(areasize())>5000][inside("BR")]
-        # Part of rule not implemented
+    # area:closed[building=~/^(apartments|house|residential|dormitory|yes)$/][eval(areasize())>5000][inside("BR")]
+    # Part of rule not implemented
 
-        # *[phone][phone!~/^(\+55|0800)/][inside("BR")]
-        # *["contact:phone"]["contact:phone"!~/^(\+55|0800)/][inside("BR")]
+    # *[phone][phone!~/^(\+55|0800)/][inside("BR")]
+    # *["contact:phone"]["contact:phone"!~/^(\+55|0800)/][inside("BR")]
+    def _relation_rule_100(self, data, tags, members, keys, err, sets):
         if ('contact:phone' in keys) or ('phone' in keys):
             match = False
             if not match:
@@ -4830,8 +5347,9 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                 # throwWarning:tr("{0} em formato diferente do internacional +55 XX YYYY-YYYY","{0.key}")
                 err.append({'class': 9018002, 'subclass': 1438682200, 'text': mapcss.tr('{0} em formato diferente do internacional +55 XX YYYY-YYYY', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[phone=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
-        # *["contact:phone"=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    # *[phone=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    # *["contact:phone"=~/^(100|18{0,1}|19[0-9])$/][inside("BR")]
+    def _relation_rule_101(self, data, tags, members, keys, err, sets):
         if ('contact:phone' in keys) or ('phone' in keys):
             match = False
             if not match:
@@ -4851,4 +5369,115 @@ class Josm_Rules_Brazilian_Specific(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['highway']),
+        (_relation_rule_1, ['addr:street']),
+        (_relation_rule_2, ['name']),
+        (_relation_rule_3, ['name']),
+        (_relation_rule_4, ['name']),
+        (_relation_rule_5, ['leisure']),
+        (_relation_rule_6, ['name']),
+        (_relation_rule_7, ['amenity']),
+        (_relation_rule_8, ['name']),
+        (_relation_rule_9, ['name']),
+        (_relation_rule_10, ['highway']),
+        (_relation_rule_11, ['designation', 'name', 'ref']),
+        (_relation_rule_12, ['source']),
+        (_relation_rule_13, ['name']),
+        (_relation_rule_14, ['designation']),
+        (_relation_rule_15, ['place']),
+        (_relation_rule_16, ['place']),
+        (_relation_rule_17, ['place']),
+        (_relation_rule_18, ['place']),
+        (_relation_rule_19, ['addr:city', 'addr:suburb']),
+        (_relation_rule_20, ['addr:city']),
+        (_relation_rule_21, ['name']),
+        (_relation_rule_22, ['name']),
+        (_relation_rule_23, ['iata']),
+        (_relation_rule_24, ['amenity']),
+        (_relation_rule_25, ['amenity']),
+        (_relation_rule_26, ['amenity']),
+        (_relation_rule_27, ['amenity']),
+        (_relation_rule_28, ['amenity']),
+        (_relation_rule_29, ['amenity']),
+        (_relation_rule_30, ['highway']),
+        (_relation_rule_31, ['enforcement']),
+        (_relation_rule_32, ['crossing']),
+        (_relation_rule_33, ['aeroway']),
+        (_relation_rule_34, ['access']),
+        (_relation_rule_35, ['addr:postcode']),
+        (_relation_rule_36, ['postal_code']),
+        (_relation_rule_37, ['addr:postcode']),
+        (_relation_rule_38, ['alt_source']),
+        (_relation_rule_39, ['landuse']),
+        (_relation_rule_40, ['long_name']),
+        (_relation_rule_41, ['building:levels']),
+        (_relation_rule_42, ['hires']),
+        (_relation_rule_43, ['name', 'tourism']),
+        (_relation_rule_44, ['amenity']),
+        (_relation_rule_45, ['name']),
+        (_relation_rule_46, ['aeroway']),
+        (_relation_rule_47, ['aeroway']),
+        (_relation_rule_48, ['aeroway']),
+        (_relation_rule_49, ['layer']),
+        (_relation_rule_50, ['layer']),
+        (_relation_rule_51, ['name']),
+        (_relation_rule_52, ['route']),
+        (_relation_rule_53, ['landuse', 'name']),
+        (_relation_rule_54, ['wikipedia']),
+        (_relation_rule_55, ['name']),
+        (_relation_rule_56, ['boundary']),
+        (_relation_rule_57, ['type']),
+        (_relation_rule_58, ['admin_level']),
+        (_relation_rule_59, ['boundary']),
+        (_relation_rule_60, ['place']),
+        (_relation_rule_61, ['boundary']),
+        (_relation_rule_62, ['boundary', 'leisure']),
+        (_relation_rule_63, ['boundary']),
+        (_relation_rule_64, ['protect_class']),
+        (_relation_rule_65, ['protect_class']),
+        (_relation_rule_66, ['boundary']),
+        (_relation_rule_67, ['boundary']),
+        (_relation_rule_68, ['destination']),
+        (_relation_rule_69, ['name']),
+        (_relation_rule_70, ['name']),
+        (_relation_rule_71, ['alt_ref']),
+        (_relation_rule_72, ['surface']),
+        (_relation_rule_73, ['name']),
+        (_relation_rule_74, ['natural']),
+        (_relation_rule_75, ['natural']),
+        (_relation_rule_76, ['natural']),
+        (_relation_rule_77, ['leisure']),
+        (_relation_rule_78, ['amenity']),
+        (_relation_rule_79, ['amenity']),
+        (_relation_rule_80, ['name']),
+        (_relation_rule_81, None),
+        (_relation_rule_82, ['addr:housenumber']),
+        (_relation_rule_83, ['addr:housenumber']),
+        (_relation_rule_84, ['source']),
+        (_relation_rule_85, ['amenity']),
+        (_relation_rule_86, ['name']),
+        (_relation_rule_87, ['amenity', 'name']),
+        (_relation_rule_88, ['name']),
+        (_relation_rule_89, ['name']),
+        (_relation_rule_90, ['amenity']),
+        (_relation_rule_91, ['name']),
+        (_relation_rule_92, ['name']),
+        (_relation_rule_93, ['place']),
+        (_relation_rule_94, ['name']),
+        (_relation_rule_95, ['leisure']),
+        (_relation_rule_96, ['landuse']),
+        (_relation_rule_97, ['ref:vatin']),
+        (_relation_rule_98, ['ref:vatin']),
+        (_relation_rule_99, ['ref:vatin']),
+        (_relation_rule_100, ['contact:phone', 'phone']),
+        (_relation_rule_101, ['contact:phone', 'phone']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
@@ -22,21 +22,16 @@ class Josm_SuspiciousSwimming_Pool(PluginMapCSS):
 
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # node[leisure=swimming_pool][name]
-        # *[leisure=swimming_pool][building=yes]
-        # *[leisure=swimming_pool][website]
-        # *[leisure=swimming_pool][url]
-        # *[leisure=swimming_pool][contact:website]
-        # *[leisure=swimming_pool][contact:url]
-        # *[leisure=swimming_pool][phone]
-        # *[leisure=swimming_pool][contact:phone]
-        # *[leisure=swimming_pool][wikipedia]
+    # node[leisure=swimming_pool][name]
+    # *[leisure=swimming_pool][building=yes]
+    # *[leisure=swimming_pool][website]
+    # *[leisure=swimming_pool][url]
+    # *[leisure=swimming_pool][contact:website]
+    # *[leisure=swimming_pool][contact:url]
+    # *[leisure=swimming_pool][phone]
+    # *[leisure=swimming_pool][contact:phone]
+    # *[leisure=swimming_pool][wikipedia]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('building' in keys and 'leisure' in keys) or ('contact:phone' in keys and 'leisure' in keys) or ('contact:url' in keys and 'leisure' in keys) or ('contact:website' in keys and 'leisure' in keys) or ('leisure' in keys and 'name' in keys) or ('leisure' in keys and 'phone' in keys) or ('leisure' in keys and 'url' in keys) or ('leisure' in keys and 'website' in keys) or ('leisure' in keys and 'wikipedia' in keys):
             match = False
             if not match:
@@ -83,22 +78,27 @@ class Josm_SuspiciousSwimming_Pool(PluginMapCSS):
                 # assertMatch:"node leisure=swimming_pool building=yes"
                 err.append({'class': 30801, 'subclass': 0, 'text': mapcss.tr('If this is a facility containing one or more swimming pools it should be tagged leisure=sports_centre + sport=swimming.')})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['building', 'contact:phone', 'contact:url', 'contact:website', 'leisure']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # *[leisure=swimming_pool][building=yes]
-        # *[leisure=swimming_pool][website]
-        # *[leisure=swimming_pool][url]
-        # *[leisure=swimming_pool][contact:website]
-        # *[leisure=swimming_pool][contact:url]
-        # *[leisure=swimming_pool][phone]
-        # *[leisure=swimming_pool][contact:phone]
-        # *[leisure=swimming_pool][wikipedia]
+    # *[leisure=swimming_pool][building=yes]
+    # *[leisure=swimming_pool][website]
+    # *[leisure=swimming_pool][url]
+    # *[leisure=swimming_pool][contact:website]
+    # *[leisure=swimming_pool][contact:url]
+    # *[leisure=swimming_pool][phone]
+    # *[leisure=swimming_pool][contact:phone]
+    # *[leisure=swimming_pool][wikipedia]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('building' in keys and 'leisure' in keys) or ('contact:phone' in keys and 'leisure' in keys) or ('contact:url' in keys and 'leisure' in keys) or ('contact:website' in keys and 'leisure' in keys) or ('leisure' in keys and 'phone' in keys) or ('leisure' in keys and 'url' in keys) or ('leisure' in keys and 'website' in keys) or ('leisure' in keys and 'wikipedia' in keys):
             match = False
             if not match:
@@ -142,22 +142,27 @@ class Josm_SuspiciousSwimming_Pool(PluginMapCSS):
                 # assertNoMatch:"way leisure=swimming_pool"
                 err.append({'class': 30801, 'subclass': 0, 'text': mapcss.tr('If this is a facility containing one or more swimming pools it should be tagged leisure=sports_centre + sport=swimming.')})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['building', 'contact:phone', 'contact:url', 'contact:website', 'leisure']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # *[leisure=swimming_pool][building=yes]
-        # *[leisure=swimming_pool][website]
-        # *[leisure=swimming_pool][url]
-        # *[leisure=swimming_pool][contact:website]
-        # *[leisure=swimming_pool][contact:url]
-        # *[leisure=swimming_pool][phone]
-        # *[leisure=swimming_pool][contact:phone]
-        # *[leisure=swimming_pool][wikipedia]
+    # *[leisure=swimming_pool][building=yes]
+    # *[leisure=swimming_pool][website]
+    # *[leisure=swimming_pool][url]
+    # *[leisure=swimming_pool][contact:website]
+    # *[leisure=swimming_pool][contact:url]
+    # *[leisure=swimming_pool][phone]
+    # *[leisure=swimming_pool][contact:phone]
+    # *[leisure=swimming_pool][wikipedia]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'leisure' in keys) or ('contact:phone' in keys and 'leisure' in keys) or ('contact:url' in keys and 'leisure' in keys) or ('contact:website' in keys and 'leisure' in keys) or ('leisure' in keys and 'phone' in keys) or ('leisure' in keys and 'url' in keys) or ('leisure' in keys and 'website' in keys) or ('leisure' in keys and 'wikipedia' in keys):
             match = False
             if not match:
@@ -200,6 +205,16 @@ class Josm_SuspiciousSwimming_Pool(PluginMapCSS):
                 # assertMatch:"relation leisure=swimming_pool phone=+3334656565"
                 err.append({'class': 30801, 'subclass': 0, 'text': mapcss.tr('If this is a facility containing one or more swimming pools it should be tagged leisure=sports_centre + sport=swimming.')})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['building', 'contact:phone', 'contact:url', 'contact:website', 'leisure']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
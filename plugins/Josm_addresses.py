@@ -26,13 +26,8 @@ class Josm_addresses(PluginMapCSS):
         self.re_4983542e = re.compile(r'[0-9]')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-        set_ok_housenumber = False
-
-        # *[addr:housenumber][addr:housename]["addr:housenumber"=*"addr:housename"]
+    # *[addr:housenumber][addr:housename]["addr:housenumber"=*"addr:housename"]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('addr:housename' in keys and 'addr:housenumber' in keys):
             match = False
             if not match:
@@ -45,7 +40,8 @@ class Josm_addresses(PluginMapCSS):
                 # assertNoMatch:"node addr:housename=1 addr:housenumber=2"
                 err.append({'class': 9000003, 'subclass': 1820984183, 'text': mapcss.tr('Same value of {0} and {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[addr:housenumber=bb][inside("BA")]
+    # *[addr:housenumber=bb][inside("BA")]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('addr:housenumber' in keys):
             match = False
             if not match:
@@ -54,28 +50,36 @@ class Josm_addresses(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set ok_housenumber
-                set_ok_housenumber = True
+                sets.add('ok_housenumber')
 
-        # *[addr:housenumber][addr:housenumber!~/[0-9]/]!.ok_housenumber
+    # *[addr:housenumber][addr:housenumber!~/[0-9]/]!.ok_housenumber
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('addr:housenumber' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_ok_housenumber) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:housenumber')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4983542e, '[0-9]'), mapcss._tag_capture(capture_tags, 1, tags, 'addr:housenumber'))))
+                try: match = (('ok_housenumber' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:housenumber')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4983542e, '[0-9]'), mapcss._tag_capture(capture_tags, 1, tags, 'addr:housenumber'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwWarning:tr("{0} without number","{0.key}")
                 err.append({'class': 9000004, 'subclass': 1053226919, 'text': mapcss.tr('{0} without number', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['addr:housename']),
+        (_node_rule_1, ['addr:housenumber']),
+        (_node_rule_2, ['addr:housenumber']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
-        set_ok_housenumber = False
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-        # *[addr:housenumber][addr:housename]["addr:housenumber"=*"addr:housename"]
+    # *[addr:housenumber][addr:housename]["addr:housenumber"=*"addr:housename"]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('addr:housename' in keys and 'addr:housenumber' in keys):
             match = False
             if not match:
@@ -86,7 +90,8 @@ class Josm_addresses(PluginMapCSS):
                 # throwWarning:tr("Same value of {0} and {1}","{0.key}","{1.key}")
                 err.append({'class': 9000003, 'subclass': 1820984183, 'text': mapcss.tr('Same value of {0} and {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[addr:housenumber=bb][inside("BA")]
+    # *[addr:housenumber=bb][inside("BA")]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('addr:housenumber' in keys):
             match = False
             if not match:
@@ -95,14 +100,15 @@ class Josm_addresses(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set ok_housenumber
-                set_ok_housenumber = True
+                sets.add('ok_housenumber')
 
-        # *[addr:housenumber][addr:housenumber!~/[0-9]/]!.ok_housenumber
+    # *[addr:housenumber][addr:housenumber!~/[0-9]/]!.ok_housenumber
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('addr:housenumber' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_ok_housenumber) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:housenumber')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4983542e, '[0-9]'), mapcss._tag_capture(capture_tags, 1, tags, 'addr:housenumber'))))
+                try: match = (('ok_housenumber' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:housenumber')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4983542e, '[0-9]'), mapcss._tag_capture(capture_tags, 1, tags, 'addr:housenumber'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwWarning:tr("{0} without number","{0.key}")
@@ -115,15 +121,22 @@ class Josm_addresses(PluginMapCSS):
                 # assertMatch:"way addr:housenumber=unknown"
                 err.append({'class': 9000004, 'subclass': 1053226919, 'text': mapcss.tr('{0} without number', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['addr:housename']),
+        (_way_rule_1, ['addr:housenumber']),
+        (_way_rule_2, ['addr:housenumber']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
-        set_ok_housenumber = False
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-        # *[addr:housenumber][addr:housename]["addr:housenumber"=*"addr:housename"]
+    # *[addr:housenumber][addr:housename]["addr:housenumber"=*"addr:housename"]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('addr:housename' in keys and 'addr:housenumber' in keys):
             match = False
             if not match:
@@ -134,7 +147,8 @@ class Josm_addresses(PluginMapCSS):
                 # throwWarning:tr("Same value of {0} and {1}","{0.key}","{1.key}")
                 err.append({'class': 9000003, 'subclass': 1820984183, 'text': mapcss.tr('Same value of {0} and {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[addr:housenumber=bb][inside("BA")]
+    # *[addr:housenumber=bb][inside("BA")]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('addr:housenumber' in keys):
             match = False
             if not match:
@@ -143,19 +157,32 @@ class Josm_addresses(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set ok_housenumber
-                set_ok_housenumber = True
+                sets.add('ok_housenumber')
 
-        # *[addr:housenumber][addr:housenumber!~/[0-9]/]!.ok_housenumber
+    # *[addr:housenumber][addr:housenumber!~/[0-9]/]!.ok_housenumber
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('addr:housenumber' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_ok_housenumber) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:housenumber')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4983542e, '[0-9]'), mapcss._tag_capture(capture_tags, 1, tags, 'addr:housenumber'))))
+                try: match = (('ok_housenumber' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'addr:housenumber')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4983542e, '[0-9]'), mapcss._tag_capture(capture_tags, 1, tags, 'addr:housenumber'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwWarning:tr("{0} without number","{0.key}")
                 err.append({'class': 9000004, 'subclass': 1053226919, 'text': mapcss.tr('{0} without number', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['addr:housename']),
+        (_relation_rule_1, ['addr:housenumber']),
+        (_relation_rule_2, ['addr:housenumber']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
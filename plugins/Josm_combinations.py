@@ -90,45 +90,40 @@ class Josm_combinations(PluginMapCSS):
         self.re_7e9ae763 = re.compile(r'^cycleway(:left|:both):.')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-        set_AllSameCycleway = set_AllSameMaxspeed = set_AllSameSidewalk = set_MotorwayTrunk = set_PlacementTransitionWarning = set_TunnelCulvertWithoutWaterway = set_fully_paved_surface = set_only_one_tag = set_unpaved_surface = False
-
-        # node[voltage:primary][!transformer]
-        # node[voltage:secondary][!transformer]
-        # node[voltage:tertiary][!transformer]
-        # node[ntd_id][!highway]
-        # *[border_type][!boundary]
-        # *[piste:difficulty][!piste:type]
-        # *[place][!name][place!=islet][place!=plot][noname!=yes]
-        # *[transformer][!power]
-        # *[source:date][!source]
-        # *[source:name][!name][noname!=yes]
-        # *[source:maxspeed:forward][!maxspeed:forward][!maxspeed]
-        # *[source:maxspeed:backward][!maxspeed:backward][!maxspeed]
-        # *[source:building][!building]
-        # *[source:ref][!ref][noref!=yes]
-        # *[source:population][!population]
-        # *[source:postal_code][!postal_code]
-        # *[source:ele][!ele]
-        # *[source:ref:INSEE][!ref:INSEE]
-        # *[source:lit][!lit]
-        # *[source:hgv][!hgv]
-        # *[source:highway][!highway]
-        # *[source:maxaxleload][!maxaxleload]
-        # *[source:surface][!surface]
-        # *[source:bridge][!bridge]
-        # *[source:old_name][!old_name]
-        # *[source:bicycle][!bicycle]
-        # *[source:designation][!designation]
-        # *[source:height][!height]
-        # *[source:lanes][!lanes]
-        # *[source:postcode][!addr:postcode]
-        # *[source:housenumber][!addr:housenumber]
-        # *[source:addr:postcode][!addr:postcode]
-        # *[source:addr:housenumber][!addr:housenumber]
+    # node[voltage:primary][!transformer]
+    # node[voltage:secondary][!transformer]
+    # node[voltage:tertiary][!transformer]
+    # node[ntd_id][!highway]
+    # *[border_type][!boundary]
+    # *[piste:difficulty][!piste:type]
+    # *[place][!name][place!=islet][place!=plot][noname!=yes]
+    # *[transformer][!power]
+    # *[source:date][!source]
+    # *[source:name][!name][noname!=yes]
+    # *[source:maxspeed:forward][!maxspeed:forward][!maxspeed]
+    # *[source:maxspeed:backward][!maxspeed:backward][!maxspeed]
+    # *[source:building][!building]
+    # *[source:ref][!ref][noref!=yes]
+    # *[source:population][!population]
+    # *[source:postal_code][!postal_code]
+    # *[source:ele][!ele]
+    # *[source:ref:INSEE][!ref:INSEE]
+    # *[source:lit][!lit]
+    # *[source:hgv][!hgv]
+    # *[source:highway][!highway]
+    # *[source:maxaxleload][!maxaxleload]
+    # *[source:surface][!surface]
+    # *[source:bridge][!bridge]
+    # *[source:old_name][!old_name]
+    # *[source:bicycle][!bicycle]
+    # *[source:designation][!designation]
+    # *[source:height][!height]
+    # *[source:lanes][!lanes]
+    # *[source:postcode][!addr:postcode]
+    # *[source:housenumber][!addr:housenumber]
+    # *[source:addr:postcode][!addr:postcode]
+    # *[source:addr:housenumber][!addr:housenumber]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('border_type' in keys) or ('ntd_id' in keys) or ('piste:difficulty' in keys) or ('place' in keys) or ('source:addr:housenumber' in keys) or ('source:addr:postcode' in keys) or ('source:bicycle' in keys) or ('source:bridge' in keys) or ('source:building' in keys) or ('source:date' in keys) or ('source:designation' in keys) or ('source:ele' in keys) or ('source:height' in keys) or ('source:hgv' in keys) or ('source:highway' in keys) or ('source:housenumber' in keys) or ('source:lanes' in keys) or ('source:lit' in keys) or ('source:maxaxleload' in keys) or ('source:maxspeed:backward' in keys) or ('source:maxspeed:forward' in keys) or ('source:name' in keys) or ('source:old_name' in keys) or ('source:population' in keys) or ('source:postal_code' in keys) or ('source:postcode' in keys) or ('source:ref' in keys) or ('source:ref:INSEE' in keys) or ('source:surface' in keys) or ('transformer' in keys) or ('voltage:primary' in keys) or ('voltage:secondary' in keys) or ('voltage:tertiary' in keys):
             match = False
             if not match:
@@ -269,24 +264,25 @@ class Josm_combinations(PluginMapCSS):
                 # assertMatch:"node source:addr:postcode=postman"
                 err.append({'class': 9001001, 'subclass': 31231113, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # node[railway:switch][railway!=switch]
-        # *[generator:source][power!=generator]
-        # *[generator:method][power!=generator]
-        # *[generator:type][power!=generator]
-        # node[fire_hydrant:type][emergency!=fire_hydrant][disused:emergency!=fire_hydrant]
-        # node[manhole][man_made!=manhole]
-        # *[recycling_type][amenity!=recycling]
-        # *[information][tourism!=information]
-        # node[board_type][information!=board]
-        # *[shelter_type][amenity!=shelter]
-        # node[lamp_type][highway!=street_lamp]
-        # node[map_type][information!=map]
-        # *[archaeological_site][historic!=archaeological_site]
-        # *[artwork_type][tourism!=artwork][exhibit!=artwork]
-        # *[castle_type][historic!=castle]
-        # *[parking][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking)$/][parking!=yes][parking!=no]
-        # *[zoo][tourism!=zoo]
-        # *[bunker_type][military!=bunker]
+    # node[railway:switch][railway!=switch]
+    # *[generator:source][power!=generator]
+    # *[generator:method][power!=generator]
+    # *[generator:type][power!=generator]
+    # node[fire_hydrant:type][emergency!=fire_hydrant][disused:emergency!=fire_hydrant]
+    # node[manhole][man_made!=manhole]
+    # *[recycling_type][amenity!=recycling]
+    # *[information][tourism!=information]
+    # node[board_type][information!=board]
+    # *[shelter_type][amenity!=shelter]
+    # node[lamp_type][highway!=street_lamp]
+    # node[map_type][information!=map]
+    # *[archaeological_site][historic!=archaeological_site]
+    # *[artwork_type][tourism!=artwork][exhibit!=artwork]
+    # *[castle_type][historic!=castle]
+    # *[parking][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking)$/][parking!=yes][parking!=no]
+    # *[zoo][tourism!=zoo]
+    # *[bunker_type][military!=bunker]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('archaeological_site' in keys) or ('artwork_type' in keys) or ('board_type' in keys) or ('bunker_type' in keys) or ('castle_type' in keys) or ('fire_hydrant:type' in keys) or ('generator:method' in keys) or ('generator:source' in keys) or ('generator:type' in keys) or ('information' in keys) or ('lamp_type' in keys) or ('manhole' in keys) or ('map_type' in keys) or ('parking' in keys) or ('railway:switch' in keys) or ('recycling_type' in keys) or ('shelter_type' in keys) or ('zoo' in keys):
             match = False
             if not match:
@@ -366,9 +362,10 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.key}","{1.tag}")
                 err.append({'class': 9001001, 'subclass': 1864412486, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[bridge:movable][bridge!=movable][man_made!=bridge]
-        # *[substation][power!=substation][pipeline!=substation]
-        # *[reservoir_type][landuse!=reservoir][water!=reservoir]
+    # *[bridge:movable][bridge!=movable][man_made!=bridge]
+    # *[substation][power!=substation][pipeline!=substation]
+    # *[reservoir_type][landuse!=reservoir][water!=reservoir]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('bridge:movable' in keys) or ('reservoir_type' in keys) or ('substation' in keys):
             match = False
             if not match:
@@ -388,8 +385,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1} or {2}","{0.key}","{1.tag}","{2.tag}")
                 err.append({'class': 9001001, 'subclass': 1195794842, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # *[iata][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
-        # *[icao][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
+    # *[iata][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
+    # *[icao][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('iata' in keys) or ('icao' in keys):
             match = False
             if not match:
@@ -405,7 +403,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2} or {3}","{0.key}","{1.tag}","{2.tag}","{3.tag}")
                 err.append({'class': 9001001, 'subclass': 1908755652, 'text': mapcss.tr('{0} without {1}, {2} or {3}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'))})
 
-        # *[pump_mechanism][man_made!=pump][man_made!=windpump][man_made!=water_well][man_made!=petroleum_well]
+    # *[pump_mechanism][man_made!=pump][man_made!=windpump][man_made!=water_well][man_made!=petroleum_well]
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if ('pump_mechanism' in keys):
             match = False
             if not match:
@@ -417,18 +416,19 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2}, {3} or {4}","{0.key}","{1.tag}","{2.tag}","{3.tag}","{4.tag}")
                 err.append({'class': 9001001, 'subclass': 1271875329, 'text': mapcss.tr('{0} without {1}, {2}, {3} or {4}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'), mapcss._tag_uncapture(capture_tags, '{4.tag}'))})
 
-        # node[traffic_sign=maxspeed][!maxspeed][!/^maxspeed:.+/]
-        # *[actuator=manual][!handle]
-        # *[mechanical_driver=manual][!handle]
-        # node[emergency=fire_hydrant][!fire_hydrant:type]
-        # *[tourism=information][!information]
-        # *[leisure=pitch][!sport]
-        # *[aeroway=terminal][!building]
-        # *[office=government][!government]
-        # *[power=generator][!generator:source]
-        # *[amenity=social_facility][!social_facility]
-        # *[amenity=place_of_worship][!religion]
-        # *[man_made=tower][!tower:type]
+    # node[traffic_sign=maxspeed][!maxspeed][!/^maxspeed:.+/]
+    # *[actuator=manual][!handle]
+    # *[mechanical_driver=manual][!handle]
+    # node[emergency=fire_hydrant][!fire_hydrant:type]
+    # *[tourism=information][!information]
+    # *[leisure=pitch][!sport]
+    # *[aeroway=terminal][!building]
+    # *[office=government][!government]
+    # *[power=generator][!generator:source]
+    # *[amenity=social_facility][!social_facility]
+    # *[amenity=place_of_worship][!religion]
+    # *[man_made=tower][!tower:type]
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('actuator' in keys) or ('aeroway' in keys) or ('amenity' in keys) or ('emergency' in keys) or ('leisure' in keys) or ('man_made' in keys) or ('mechanical_driver' in keys) or ('office' in keys) or ('power' in keys) or ('tourism' in keys) or ('traffic_sign' in keys):
             match = False
             if not match:
@@ -485,7 +485,8 @@ class Josm_combinations(PluginMapCSS):
                 # assertNoMatch:"node traffic_sign=maxspeed maxspeed:hgv:conditional=\"80 @ (weight>7.5 AND 22:00-05:00)\""
                 err.append({'class': 9001001, 'subclass': 2095780217, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[segregated][!highway][railway!=crossing]
+    # *[segregated][!highway][railway!=crossing]
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if ('segregated' in keys):
             match = False
             if not match:
@@ -497,7 +498,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1} or {2}","{0.key}","{1.key}","{2.tag}")
                 err.append({'class': 9001001, 'subclass': 413539177, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # *[amenity=recycling][recycling_type!=container][recycling_type!=centre]
+    # *[amenity=recycling][recycling_type!=container][recycling_type!=centre]
+    def _node_rule_7(self, data, tags, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -509,7 +511,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1} or {2}","{0.tag}","{1.tag}","{2.tag}")
                 err.append({'class': 9001001, 'subclass': 747056792, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # *[smoothness][!highway][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking|bicycle_parking)$/][barrier!=kerb][!kerb]
+    # *[smoothness][!highway][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking|bicycle_parking)$/][barrier!=kerb][!kerb]
+    def _node_rule_8(self, data, tags, keys, err, sets):
         if ('smoothness' in keys):
             match = False
             if not match:
@@ -521,8 +524,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2}, {3} or {4}","{0.key}","{1.key}","{2.tag}","{3.tag}","{4.key}")
                 err.append({'class': 9001001, 'subclass': 1922079652, 'text': mapcss.tr('{0} without {1}, {2}, {3} or {4}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'), mapcss._tag_uncapture(capture_tags, '{4.key}'))})
 
-        # *[intermittent][!waterway][natural!~/^(water|spring)$/][landuse!~/^(basin|reservoir)$/][ford!~/^(yes|stepping_stones)$/]
-        # *[boat][!waterway][natural!=water][landuse!~/^(basin|reservoir)$/][ford!=yes]
+    # *[intermittent][!waterway][natural!~/^(water|spring)$/][landuse!~/^(basin|reservoir)$/][ford!~/^(yes|stepping_stones)$/]
+    # *[boat][!waterway][natural!=water][landuse!~/^(basin|reservoir)$/][ford!=yes]
+    def _node_rule_9(self, data, tags, keys, err, sets):
         if ('boat' in keys) or ('intermittent' in keys):
             match = False
             if not match:
@@ -538,7 +542,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2}, {3} or {4}","{0.key}","{1.key}","{2.tag}","{3.tag}","{4.tag}")
                 err.append({'class': 9001001, 'subclass': 1547975047, 'text': mapcss.tr('{0} without {1}, {2}, {3} or {4}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'), mapcss._tag_uncapture(capture_tags, '{4.tag}'))})
 
-        # *[snowplowing][!highway][!amenity][!leisure]
+    # *[snowplowing][!highway][!amenity][!leisure]
+    def _node_rule_10(self, data, tags, keys, err, sets):
         if ('snowplowing' in keys):
             match = False
             if not match:
@@ -550,7 +555,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2} or {3}","{0.key}","{1.key}","{2.key}","{3.key}")
                 err.append({'class': 9001001, 'subclass': 585636657, 'text': mapcss.tr('{0} without {1}, {2} or {3}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'), mapcss._tag_uncapture(capture_tags, '{3.key}'))})
 
-        # *[toll][!highway][!barrier][route!~/^(ferry|road)$/]
+    # *[toll][!highway][!barrier][route!~/^(ferry|road)$/]
+    def _node_rule_11(self, data, tags, keys, err, sets):
         if ('toll' in keys):
             match = False
             if not match:
@@ -562,20 +568,21 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2} or {3}","{0.key}","{1.key}","{2.key}","{3.tag}")
                 err.append({'class': 9001001, 'subclass': 1689494174, 'text': mapcss.tr('{0} without {1}, {2} or {3}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'))})
 
-        # *[amenity=marketplace][highway]
-        # *[power=plant][/^generator:/]
-        # *[power=generator][/^plant:/]
-        # *[power=plant][voltage]
-        # *[power=plant][frequency]
-        # *[internet_access=no][internet_access:fee]
-        # node[power=transformer][voltage]
-        # node[transformer=distribution][voltage][power=pole]
-        # *[amenity=vending_machine][shop]
-        # *[noname?][name]
-        # *[noref?][ref]
-        # *[nohousenumber?][addr:housenumber]
-        # *[actuator][handle][actuator!~/(^|;)manual(;|$)/]
-        # *[mechanical_driver][handle][mechanical_driver!~/(^|;)manual(;|$)/]
+    # *[amenity=marketplace][highway]
+    # *[power=plant][/^generator:/]
+    # *[power=generator][/^plant:/]
+    # *[power=plant][voltage]
+    # *[power=plant][frequency]
+    # *[internet_access=no][internet_access:fee]
+    # node[power=transformer][voltage]
+    # node[transformer=distribution][voltage][power=pole]
+    # *[amenity=vending_machine][shop]
+    # *[noname?][name]
+    # *[noref?][ref]
+    # *[nohousenumber?][addr:housenumber]
+    # *[actuator][handle][actuator!~/(^|;)manual(;|$)/]
+    # *[mechanical_driver][handle][mechanical_driver!~/(^|;)manual(;|$)/]
+    def _node_rule_12(self, data, tags, keys, err, sets):
         if ('actuator' in keys and 'handle' in keys) or ('addr:housenumber' in keys and 'nohousenumber' in keys) or ('amenity' in keys and 'highway' in keys) or ('amenity' in keys and 'shop' in keys) or ('frequency' in keys and 'power' in keys) or ('handle' in keys and 'mechanical_driver' in keys) or ('internet_access' in keys and 'internet_access:fee' in keys) or ('name' in keys and 'noname' in keys) or ('noref' in keys and 'ref' in keys) or ('power' in keys) or ('power' in keys and 'transformer' in keys and 'voltage' in keys) or ('power' in keys and 'voltage' in keys):
             match = False
             if not match:
@@ -639,12 +646,13 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.tag}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 778725600, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[barrier=kerb][kerb=no]
-        # *[man_made=bridge][bridge=yes]
-        # *[man_made=tunnel][tunnel=yes]
-        # *[amenity=police][police]
-        # node[highway=crossing][crossing=no]
-        # node[railway=crossing][crossing=no]
+    # *[barrier=kerb][kerb=no]
+    # *[man_made=bridge][bridge=yes]
+    # *[man_made=tunnel][tunnel=yes]
+    # *[amenity=police][police]
+    # node[highway=crossing][crossing=no]
+    # node[railway=crossing][crossing=no]
+    def _node_rule_13(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'police' in keys) or ('barrier' in keys and 'kerb' in keys) or ('bridge' in keys and 'man_made' in keys) or ('crossing' in keys and 'highway' in keys) or ('crossing' in keys and 'railway' in keys) or ('man_made' in keys and 'tunnel' in keys):
             match = False
             if not match:
@@ -676,14 +684,15 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.tag}","{1.tag}")
                 err.append({'class': 9001002, 'subclass': 2109026588, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # node[transformer][voltage]
-        # node[marker][cover]
-        # node[marker][voltage]
-        # node[marker][pressure]
-        # node[marker][diameter]
-        # node[marker][substance]
-        # *[building:part][building]
-        # *[addr:street][addr:place][outside("CZ,DK")]
+    # node[transformer][voltage]
+    # node[marker][cover]
+    # node[marker][voltage]
+    # node[marker][pressure]
+    # node[marker][diameter]
+    # node[marker][substance]
+    # *[building:part][building]
+    # *[addr:street][addr:place][outside("CZ,DK")]
+    def _node_rule_14(self, data, tags, keys, err, sets):
         if ('addr:place' in keys and 'addr:street' in keys) or ('building' in keys and 'building:part' in keys) or ('cover' in keys and 'marker' in keys) or ('diameter' in keys and 'marker' in keys) or ('marker' in keys and 'pressure' in keys) or ('marker' in keys and 'substance' in keys) or ('marker' in keys and 'voltage' in keys) or ('transformer' in keys and 'voltage' in keys):
             match = False
             if not match:
@@ -723,14 +732,15 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.key}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 1424906562, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # node[access][eval(number_of_tags())=1]
-        # node[area][eval(number_of_tags())=1]!.area_yes_autofix
-        # node[lanes][eval(number_of_tags())=1]
-        # node[layer][eval(number_of_tags())=1]
-        # node[lit][eval(number_of_tags())=1]
-        # node[name][eval(number_of_tags())=1]
-        # node[ref][eval(number_of_tags())=1]
-        # node[surface][eval(number_of_tags())=1]
+    # node[access][eval(number_of_tags())=1]
+    # node[area][eval(number_of_tags())=1]!.area_yes_autofix
+    # node[lanes][eval(number_of_tags())=1]
+    # node[layer][eval(number_of_tags())=1]
+    # node[lit][eval(number_of_tags())=1]
+    # node[name][eval(number_of_tags())=1]
+    # node[ref][eval(number_of_tags())=1]
+    # node[surface][eval(number_of_tags())=1]
+    def _node_rule_15(self, data, tags, keys, err, sets):
         if ('access' in keys) or ('area' in keys) or ('lanes' in keys) or ('layer' in keys) or ('lit' in keys) or ('name' in keys) or ('ref' in keys) or ('surface' in keys):
             match = False
             if not match:
@@ -766,11 +776,12 @@ class Josm_combinations(PluginMapCSS):
                 # set only_one_tag
                 # group:tr("missing tag")
                 # throwWarning:tr("incomplete object: only {0}","{0.key}")
-                set_only_one_tag = True
+                sets.add('only_one_tag')
                 err.append({'class': 9001001, 'subclass': 729897947, 'text': mapcss.tr('incomplete object: only {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # node[name][area][eval(number_of_tags())=2]
-        # node[name][ref][eval(number_of_tags())=2]
+    # node[name][area][eval(number_of_tags())=2]
+    # node[name][ref][eval(number_of_tags())=2]
+    def _node_rule_16(self, data, tags, keys, err, sets):
         if ('area' in keys and 'name' in keys) or ('name' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -786,7 +797,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("incomplete object: only {0} and {1}","{0.key}","{1.key}")
                 err.append({'class': 9001001, 'subclass': 1930775280, 'text': mapcss.tr('incomplete object: only {0} and {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # node[tourism=attraction][eval(number_of_tags())=1]
+    # node[tourism=attraction][eval(number_of_tags())=1]
+    def _node_rule_17(self, data, tags, keys, err, sets):
         if ('tourism' in keys):
             match = False
             if not match:
@@ -798,7 +810,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("incomplete object: only {0}","{0.tag}")
                 err.append({'class': 9001001, 'subclass': 413890824, 'text': mapcss.tr('incomplete object: only {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[name][tourism=attraction][eval(number_of_tags())=2]
+    # node[name][tourism=attraction][eval(number_of_tags())=2]
+    def _node_rule_18(self, data, tags, keys, err, sets):
         if ('name' in keys and 'tourism' in keys):
             match = False
             if not match:
@@ -810,9 +823,10 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("incomplete object: only {0} and {1}","{0.key}","{1.tag}")
                 err.append({'class': 9001001, 'subclass': 13522860, 'text': mapcss.tr('incomplete object: only {0} and {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[place][place!=farm][place!=plot][/^(addr:housenumber|addr:housename|addr:flats|addr:conscriptionnumber|addr:street|addr:place|addr:city|addr:country|addr:full|addr:hamlet|addr:suburb|addr:subdistrict|addr:district|addr:province|addr:state|addr:interpolation|addr:interpolation|addr:inclusion)$/]
-        # *[boundary][/^addr:/]
-        # *[highway][/^addr:/][highway!=services][highway!=rest_area][!"addr:postcode"]
+    # *[place][place!=farm][place!=plot][/^(addr:housenumber|addr:housename|addr:flats|addr:conscriptionnumber|addr:street|addr:place|addr:city|addr:country|addr:full|addr:hamlet|addr:suburb|addr:subdistrict|addr:district|addr:province|addr:state|addr:interpolation|addr:interpolation|addr:inclusion)$/]
+    # *[boundary][/^addr:/]
+    # *[highway][/^addr:/][highway!=services][highway!=rest_area][!"addr:postcode"]
+    def _node_rule_19(self, data, tags, keys, err, sets):
         if ('boundary' in keys) or ('highway' in keys) or ('place' in keys):
             match = False
             if not match:
@@ -835,7 +849,8 @@ class Josm_combinations(PluginMapCSS):
                 # assertMatch:"node place=foo addr:housenumber=5"
                 err.append({'class': 9001002, 'subclass': 1053814004, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'addr:*')})
 
-        # *[postal_code]["addr:postcode"][!highway][postal_code=*"addr:postcode"]
+    # *[postal_code]["addr:postcode"][!highway][postal_code=*"addr:postcode"]
+    def _node_rule_20(self, data, tags, keys, err, sets):
         if ('addr:postcode' in keys and 'postal_code' in keys):
             match = False
             if not match:
@@ -847,7 +862,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.key}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 731431309, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[postal_code]["addr:postcode"][!highway][postal_code!=*"addr:postcode"]
+    # *[postal_code]["addr:postcode"][!highway][postal_code!=*"addr:postcode"]
+    def _node_rule_21(self, data, tags, keys, err, sets):
         if ('addr:postcode' in keys and 'postal_code' in keys):
             match = False
             if not match:
@@ -859,17 +875,18 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1} and conflicting values","{0.key}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 433558919, 'text': mapcss.tr('{0} together with {1} and conflicting values', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # node[lanes][!barrier][!ford][highway!=mini_roundabout][!junction][leisure!~/^(bowling_alley|slipway|swimming_pool|track)$/][!traffic_calming]!.only_one_tag
-        # *[tunnel][!highway][!area:highway][!railway][!waterway][!piste:type][type!=tunnel][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=tunnel][power!=cable]!.TunnelCulvertWithoutWaterway
-        # *[bridge][!highway][!area:highway][!railway][!waterway][!piste:type][type!=bridge][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=bridge][building!=bridge]
-        # *[psv][!highway][!area:highway][!railway][!waterway][barrier!~/^(bollard|bump_gate|bus_trap|cattle_grid|chain|coupure|entrance|gate|height_restrictor|jersey_barrier|kerb|lift_gate|rope|sally_port|sliding_beam|sliding_gate|spikes|swing_gate|toll_booth|yes)$/][amenity!~/^parking.*/]
-        # *[width][!highway][!area:highway][!railway][!waterway][!aeroway][!cycleway][!footway][!barrier][!man_made][!entrance][natural!=stone][leisure!=track]
-        # *[maxspeed][!highway][!area:highway][!railway][traffic_sign!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:forward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:backward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][type!=enforcement][waterway!~/^(canal|fairway|lock|river|tidal_channel)$/][!traffic_calming][aerialway!=zip_line]
+    # node[lanes][!barrier][!ford][highway!=mini_roundabout][!junction][leisure!~/^(bowling_alley|slipway|swimming_pool|track)$/][!traffic_calming]!.only_one_tag
+    # *[tunnel][!highway][!area:highway][!railway][!waterway][!piste:type][type!=tunnel][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=tunnel][power!=cable]!.TunnelCulvertWithoutWaterway
+    # *[bridge][!highway][!area:highway][!railway][!waterway][!piste:type][type!=bridge][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=bridge][building!=bridge]
+    # *[psv][!highway][!area:highway][!railway][!waterway][barrier!~/^(bollard|bump_gate|bus_trap|cattle_grid|chain|coupure|entrance|gate|height_restrictor|jersey_barrier|kerb|lift_gate|rope|sally_port|sliding_beam|sliding_gate|spikes|swing_gate|toll_booth|yes)$/][amenity!~/^parking.*/]
+    # *[width][!highway][!area:highway][!railway][!waterway][!aeroway][!cycleway][!footway][!barrier][!man_made][!entrance][natural!=stone][leisure!=track]
+    # *[maxspeed][!highway][!area:highway][!railway][traffic_sign!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:forward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:backward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][type!=enforcement][waterway!~/^(canal|fairway|lock|river|tidal_channel)$/][!traffic_calming][aerialway!=zip_line]
+    def _node_rule_22(self, data, tags, keys, err, sets):
         if ('bridge' in keys) or ('lanes' in keys) or ('maxspeed' in keys) or ('psv' in keys) or ('tunnel' in keys) or ('width' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_only_one_tag) and (mapcss._tag_capture(capture_tags, 0, tags, 'lanes')) and (not mapcss._tag_capture(capture_tags, 1, tags, 'barrier')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'ford')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'mini_roundabout', 'mini_roundabout')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'junction')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 5, self.re_49fc2c26, '^(bowling_alley|slipway|swimming_pool|track)$'), mapcss._tag_capture(capture_tags, 5, tags, 'leisure'))) and (not mapcss._tag_capture(capture_tags, 6, tags, 'traffic_calming')))
+                try: match = (('only_one_tag' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'lanes')) and (not mapcss._tag_capture(capture_tags, 1, tags, 'barrier')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'ford')) and (mapcss._tag_capture(capture_tags, 3, tags, 'highway') != mapcss._value_const_capture(capture_tags, 3, 'mini_roundabout', 'mini_roundabout')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'junction')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 5, self.re_49fc2c26, '^(bowling_alley|slipway|swimming_pool|track)$'), mapcss._tag_capture(capture_tags, 5, tags, 'leisure'))) and (not mapcss._tag_capture(capture_tags, 6, tags, 'traffic_calming')))
                 except mapcss.RuleAbort: pass
             # Skip selector using undeclared class TunnelCulvertWithoutWaterway
             if not match:
@@ -893,8 +910,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} on suspicious object","{0.key}")
                 err.append({'class': 9001002, 'subclass': 1211215386, 'text': mapcss.tr('{0} on suspicious object', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[highway][waterway][waterway!=dam][waterway!=weir]
-        # *[landuse][building][landuse!=retail]
+    # *[highway][waterway][waterway!=dam][waterway!=weir]
+    # *[landuse][building][landuse!=retail]
+    def _node_rule_23(self, data, tags, keys, err, sets):
         if ('building' in keys and 'landuse' in keys) or ('highway' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -911,7 +929,8 @@ class Josm_combinations(PluginMapCSS):
                 # assertNoMatch:"node highway=street_lamp natural=birds_nest"
                 err.append({'class': 9001002, 'subclass': 1750941961, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[natural=water][leisure=swimming_pool]
+    # *[natural=water][leisure=swimming_pool]
+    def _node_rule_24(self, data, tags, keys, err, sets):
         if ('leisure' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -927,7 +946,8 @@ class Josm_combinations(PluginMapCSS):
                     'natural'])
                 }})
 
-        # *[sport][sport!=skiing][!building][!"building:part"][!club][tourism!=hotel][highway!~/^(pedestrian|raceway)$/][!leisure][natural!~/^(beach|bare_rock|cliff|peak|water)$/][amenity!~/^(bar|dojo|pub|restaurant|swimming_pool)$/][landuse!~/^(recreation_ground|piste|farm|farmland)$/][barrier!~/^(wall|retaining_wall)$/][!"piste:type"][shop!=sports][attraction!=summer_toboggan]
+    # *[sport][sport!=skiing][!building][!"building:part"][!club][tourism!=hotel][highway!~/^(pedestrian|raceway)$/][!leisure][natural!~/^(beach|bare_rock|cliff|peak|water)$/][amenity!~/^(bar|dojo|pub|restaurant|swimming_pool)$/][landuse!~/^(recreation_ground|piste|farm|farmland)$/][barrier!~/^(wall|retaining_wall)$/][!"piste:type"][shop!=sports][attraction!=summer_toboggan]
+    def _node_rule_25(self, data, tags, keys, err, sets):
         if ('sport' in keys):
             match = False
             if not match:
@@ -946,7 +966,8 @@ class Josm_combinations(PluginMapCSS):
                 # assertMatch:"node sport=tennis"
                 err.append({'class': 9001001, 'subclass': 1738767711, 'text': mapcss.tr('sport without physical feature')})
 
-        # *[building:levels][!building][!building:part]
+    # *[building:levels][!building][!building:part]
+    def _node_rule_26(self, data, tags, keys, err, sets):
         if ('building:levels' in keys):
             match = False
             if not match:
@@ -958,7 +979,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1} or {2}","{0.key}","{1.key}","{2.key}")
                 err.append({'class': 9001001, 'subclass': 1821512557, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[/_name$/][!name][!old_name][!loc_name][!reg_name][!uic_name][!artist_name][!lock_name][!"osak:municipality_name"][!"osak:street_name"][NHD:subbasin_name!~/^(Des Moines Headwaters|Upper Des Moines|East Fork Des Moines)$/][noname!=yes]
+    # *[/_name$/][!name][!old_name][!loc_name][!reg_name][!uic_name][!artist_name][!lock_name][!"osak:municipality_name"][!"osak:street_name"][NHD:subbasin_name!~/^(Des Moines Headwaters|Upper Des Moines|East Fork Des Moines)$/][noname!=yes]
+    def _node_rule_27(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -970,7 +992,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("alternative name without {0}","{1.key}")
                 err.append({'class': 9001001, 'subclass': 1822630838, 'text': mapcss.tr('alternative name without {0}', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # node[leisure=park][natural=tree]
+    # node[leisure=park][natural=tree]
+    def _node_rule_28(self, data, tags, keys, err, sets):
         if ('leisure' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -986,7 +1009,8 @@ class Josm_combinations(PluginMapCSS):
                     'leisure'])
                 }})
 
-        # *[highway=cycleway][cycleway=track]
+    # *[highway=cycleway][cycleway=track]
+    def _node_rule_29(self, data, tags, keys, err, sets):
         if ('cycleway' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -1002,7 +1026,8 @@ class Josm_combinations(PluginMapCSS):
                     'cycleway'])
                 }})
 
-        # node[emergency_ward_entrance][emergency!=emergency_ward_entrance]
+    # node[emergency_ward_entrance][emergency!=emergency_ward_entrance]
+    def _node_rule_30(self, data, tags, keys, err, sets):
         if ('emergency_ward_entrance' in keys):
             match = False
             if not match:
@@ -1018,10 +1043,11 @@ class Josm_combinations(PluginMapCSS):
                     ['emergency','emergency_ward_entrance']])
                 }})
 
-        # *[construction:building][!building][!construction]
-        # *[construction:highway][!highway][!construction]
-        # *[construction:railway][!railway][!construction]
-        # *[construction:landuse][!landuse][!construction]
+    # *[construction:building][!building][!construction]
+    # *[construction:highway][!highway][!construction]
+    # *[construction:railway][!railway][!construction]
+    # *[construction:landuse][!landuse][!construction]
+    def _node_rule_31(self, data, tags, keys, err, sets):
         if ('construction:building' in keys) or ('construction:highway' in keys) or ('construction:landuse' in keys) or ('construction:railway' in keys):
             match = False
             if not match:
@@ -1051,10 +1077,11 @@ class Josm_combinations(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{1.key}=construction')).split('=', 1)])
                 }})
 
-        # *[building=construction]["construction:building"][!construction]
-        # *[highway=construction]["construction:highway"][!construction]
-        # *[railway=construction]["construction:railway"][!construction]
-        # *[landuse=construction]["construction:landuse"][!construction]
+    # *[building=construction]["construction:building"][!construction]
+    # *[highway=construction]["construction:highway"][!construction]
+    # *[railway=construction]["construction:railway"][!construction]
+    # *[landuse=construction]["construction:landuse"][!construction]
+    def _node_rule_32(self, data, tags, keys, err, sets):
         if ('building' in keys and 'construction:building' in keys) or ('construction:highway' in keys and 'highway' in keys) or ('construction:landuse' in keys and 'landuse' in keys) or ('construction:railway' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1082,10 +1109,11 @@ class Josm_combinations(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, 'construction={1.value}')).split('=', 1)])
                 }})
 
-        # *[building]["construction:building"][!construction][building!=construction]
-        # *[highway]["construction:highway"][!construction][highway!=construction]
-        # *[railway]["construction:railway"][!construction][railway!=construction]
-        # *[landuse]["construction:landuse"][!construction][landuse!=construction]
+    # *[building]["construction:building"][!construction][building!=construction]
+    # *[highway]["construction:highway"][!construction][highway!=construction]
+    # *[railway]["construction:railway"][!construction][railway!=construction]
+    # *[landuse]["construction:landuse"][!construction][landuse!=construction]
+    def _node_rule_33(self, data, tags, keys, err, sets):
         if ('building' in keys and 'construction:building' in keys) or ('construction:highway' in keys and 'highway' in keys) or ('construction:landuse' in keys and 'landuse' in keys) or ('construction:railway' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1109,10 +1137,11 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1} and conflicting values plus no {2}","{0.key}","{1.key}","{2.key}")
                 err.append({'class': 9001002, 'subclass': 164864338, 'text': mapcss.tr('{0} together with {1} and conflicting values plus no {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *["construction:building"][construction][construction:building!=*construction]
-        # *["construction:highway"][construction][construction:highway!=*construction]
-        # *["construction:railway"][construction][construction:railway!=*construction]
-        # *["construction:landuse"][construction][construction:landuse!=*construction]
+    # *["construction:building"][construction][construction:building!=*construction]
+    # *["construction:highway"][construction][construction:highway!=*construction]
+    # *["construction:railway"][construction][construction:railway!=*construction]
+    # *["construction:landuse"][construction][construction:landuse!=*construction]
+    def _node_rule_34(self, data, tags, keys, err, sets):
         if ('construction' in keys and 'construction:building' in keys) or ('construction' in keys and 'construction:highway' in keys) or ('construction' in keys and 'construction:landuse' in keys) or ('construction' in keys and 'construction:railway' in keys):
             match = False
             if not match:
@@ -1136,8 +1165,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1} and conflicting values","{0.key}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 1971600459, 'text': mapcss.tr('{0} together with {1} and conflicting values', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[amenity=recycling][collection_times="24/7"][!opening_hours]
-        # *[amenity=recycling][collection_times][!opening_hours][collection_times=~/[a-z]-[A-Z].*[0-9]-[0-9]/]
+    # *[amenity=recycling][collection_times="24/7"][!opening_hours]
+    # *[amenity=recycling][collection_times][!opening_hours][collection_times=~/[a-z]-[A-Z].*[0-9]-[0-9]/]
+    def _node_rule_35(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'collection_times' in keys):
             match = False
             if not match:
@@ -1163,7 +1193,8 @@ class Josm_combinations(PluginMapCSS):
                     'collection_times'])
                 }})
 
-        # *[amenity=recycling][!/^recycling:/][recycling_type!=centre]
+    # *[amenity=recycling][!/^recycling:/][recycling_type!=centre]
+    def _node_rule_36(self, data, tags, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -1175,7 +1206,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.tag}","recycling:*")
                 err.append({'class': 9001001, 'subclass': 321354601, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), 'recycling:*')})
 
-        # *[source:addr][!/^addr:/]
+    # *[source:addr][!/^addr:/]
+    def _node_rule_37(self, data, tags, keys, err, sets):
         if ('source:addr' in keys):
             match = False
             if not match:
@@ -1189,7 +1221,8 @@ class Josm_combinations(PluginMapCSS):
                 # assertMatch:"node source:addr=postman"
                 err.append({'class': 9001001, 'subclass': 886065920, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'addr:*')})
 
-        # *[source:maxspeed][!/^maxspeed:?/]
+    # *[source:maxspeed][!/^maxspeed:?/]
+    def _node_rule_38(self, data, tags, keys, err, sets):
         if ('source:maxspeed' in keys):
             match = False
             if not match:
@@ -1201,7 +1234,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1} or {2}","{0.key}","maxspeed","maxspeed:*")
                 err.append({'class': 9001001, 'subclass': 480030366, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'maxspeed', 'maxspeed:*')})
 
-        # *[man_made=communications_tower][height][siunit_length(tag(height))<75]
+    # *[man_made=communications_tower][height][siunit_length(tag(height))<75]
+    def _node_rule_39(self, data, tags, keys, err, sets):
         if ('height' in keys and 'man_made' in keys):
             match = False
             if not match:
@@ -1225,8 +1259,9 @@ class Josm_combinations(PluginMapCSS):
                 # assertNoMatch:"node man_made=communications_tower height=75.72"
                 err.append({'class': 9001002, 'subclass': 1533608671, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[fixme][count(split(" ",tag("fixme")))==1][has_tag_key(tag("fixme"))]
-        # *[FIXME][count(split(" ",tag("FIXME")))==1][has_tag_key(tag("FIXME"))]
+    # *[fixme][count(split(" ",tag("fixme")))==1][has_tag_key(tag("fixme"))]
+    # *[FIXME][count(split(" ",tag("FIXME")))==1][has_tag_key(tag("FIXME"))]
+    def _node_rule_40(self, data, tags, keys, err, sets):
         if ('FIXME' in keys) or ('fixme' in keys):
             match = False
             if not match:
@@ -1242,13 +1277,14 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}. Is the fixme fixed?","{0.tag}","{0.value}")
                 err.append({'class': 9001002, 'subclass': 2092275873, 'text': mapcss.tr('{0} together with {1}. Is the fixme fixed?', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # node:righthandtraffic[highway=mini_roundabout][direction=clockwise]
-        # Rule Blacklisted (id: 643796350)
+    # node:righthandtraffic[highway=mini_roundabout][direction=clockwise]
+    # Rule Blacklisted (id: 643796350)
 
-        # node!:righthandtraffic[highway=mini_roundabout][direction=anticlockwise]
-        # Rule Blacklisted (id: 317760248)
+    # node!:righthandtraffic[highway=mini_roundabout][direction=anticlockwise]
+    # Rule Blacklisted (id: 317760248)
 
-        # *[voltage:primary][voltage:secondary][transformer=generator][tag("voltage:secondary")<tag("voltage:primary")]
+    # *[voltage:primary][voltage:secondary][transformer=generator][tag("voltage:secondary")<tag("voltage:primary")]
+    def _node_rule_41(self, data, tags, keys, err, sets):
         if ('transformer' in keys and 'voltage:primary' in keys and 'voltage:secondary' in keys):
             match = False
             if not match:
@@ -1260,15 +1296,61 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} is lower than {1} on {2}.","{1.key}","{0.key}","{2.tag}")
                 err.append({'class': 9001002, 'subclass': 1175862429, 'text': mapcss.tr('{0} is lower than {1} on {2}.', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['border_type', 'ntd_id', 'piste:difficulty', 'place', 'source:addr:housenumber', 'source:addr:postcode', 'source:bicycle', 'source:bridge', 'source:building', 'source:date', 'source:designation', 'source:ele', 'source:height', 'source:hgv', 'source:highway', 'source:housenumber', 'source:lanes', 'source:lit', 'source:maxaxleload', 'source:maxspeed:backward', 'source:maxspeed:forward', 'source:name', 'source:old_name', 'source:population', 'source:postal_code', 'source:postcode', 'source:ref', 'source:ref:INSEE', 'source:surface', 'transformer', 'voltage:primary', 'voltage:secondary', 'voltage:tertiary']),
+        (_node_rule_1, ['archaeological_site', 'artwork_type', 'board_type', 'bunker_type', 'castle_type', 'fire_hydrant:type', 'generator:method', 'generator:source', 'generator:type', 'information', 'lamp_type', 'manhole', 'map_type', 'parking', 'railway:switch', 'recycling_type', 'shelter_type', 'zoo']),
+        (_node_rule_2, ['bridge:movable', 'reservoir_type', 'substation']),
+        (_node_rule_3, ['iata', 'icao']),
+        (_node_rule_4, ['pump_mechanism']),
+        (_node_rule_5, ['actuator', 'aeroway', 'amenity', 'emergency', 'leisure', 'man_made', 'mechanical_driver', 'office', 'power', 'tourism', 'traffic_sign']),
+        (_node_rule_6, ['segregated']),
+        (_node_rule_7, ['amenity']),
+        (_node_rule_8, ['smoothness']),
+        (_node_rule_9, ['boat', 'intermittent']),
+        (_node_rule_10, ['snowplowing']),
+        (_node_rule_11, ['toll']),
+        (_node_rule_12, ['actuator', 'addr:housenumber', 'amenity', 'frequency', 'handle', 'internet_access', 'name', 'noref', 'power']),
+        (_node_rule_13, ['amenity', 'barrier', 'bridge', 'crossing', 'man_made']),
+        (_node_rule_14, ['addr:place', 'building', 'cover', 'diameter', 'marker', 'transformer']),
+        (_node_rule_15, ['access', 'area', 'lanes', 'layer', 'lit', 'name', 'ref', 'surface']),
+        (_node_rule_16, ['area', 'name']),
+        (_node_rule_17, ['tourism']),
+        (_node_rule_18, ['name']),
+        (_node_rule_19, ['boundary', 'highway', 'place']),
+        (_node_rule_20, ['addr:postcode']),
+        (_node_rule_21, ['addr:postcode']),
+        (_node_rule_22, ['bridge', 'lanes', 'maxspeed', 'psv', 'tunnel', 'width']),
+        (_node_rule_23, ['building', 'highway']),
+        (_node_rule_24, ['leisure']),
+        (_node_rule_25, ['sport']),
+        (_node_rule_26, ['building:levels']),
+        (_node_rule_27, None),
+        (_node_rule_28, ['leisure']),
+        (_node_rule_29, ['cycleway']),
+        (_node_rule_30, ['emergency_ward_entrance']),
+        (_node_rule_31, ['construction:building', 'construction:highway', 'construction:landuse', 'construction:railway']),
+        (_node_rule_32, ['building', 'construction:highway', 'construction:landuse', 'construction:railway']),
+        (_node_rule_33, ['building', 'construction:highway', 'construction:landuse', 'construction:railway']),
+        (_node_rule_34, ['construction']),
+        (_node_rule_35, ['amenity']),
+        (_node_rule_36, ['amenity']),
+        (_node_rule_37, ['source:addr']),
+        (_node_rule_38, ['source:maxspeed']),
+        (_node_rule_39, ['height']),
+        (_node_rule_40, ['FIXME', 'fixme']),
+        (_node_rule_41, ['transformer']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
-        set_AllSameCycleway = set_AllSameMaxspeed = set_AllSameSidewalk = set_MotorwayTrunk = set_PlacementTransitionWarning = set_TunnelCulvertWithoutWaterway = set_fully_paved_surface = set_only_one_tag = set_unpaved_surface = False
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-        # way[surface=~/^(unpaved|compacted|gravel|fine_gravel|pebblestone|ground|earth|dirt|grass|sand|mud|ice|salt|snow|woodchips)$/]
+    # way[surface=~/^(unpaved|compacted|gravel|fine_gravel|pebblestone|ground|earth|dirt|grass|sand|mud|ice|salt|snow|woodchips)$/]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('surface' in keys):
             match = False
             if not match:
@@ -1277,9 +1359,10 @@ class Josm_combinations(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set unpaved_surface
-                set_unpaved_surface = True
+                sets.add('unpaved_surface')
 
-        # way[surface=~/^(paved|asphalt|cobblestone|cobblestone:flattened|sett|concrete|concrete:plates|paving_stones|metal|wood|unhewn_cobblestone)$/]
+    # way[surface=~/^(paved|asphalt|cobblestone|cobblestone:flattened|sett|concrete|concrete:plates|paving_stones|metal|wood|unhewn_cobblestone)$/]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('surface' in keys):
             match = False
             if not match:
@@ -1288,72 +1371,73 @@ class Josm_combinations(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set fully_paved_surface
-                set_fully_paved_surface = True
-
-        # way[junction][!highway][junction!=yes][!area:highway]
-        # way[living_street][!highway]
-        # way[maintenance][!highway]
-        # way[median][!highway]
-        # way[motorroad][!highway]
-        # way[sac_scale][!highway]
-        # way[sidewalk][!highway]
-        # way[step_count][!highway][man_made!=tower]
-        # way[tracktype][!highway]
-        # way[trail_visibility][!highway]
-        # way[trolley_wire][!highway]
-        # way[zip_left][!highway]
-        # way[zip_right][!highway]
-        # way[detail][!railway][route!=railway]
-        # way[eddy_current_brake][!railway][route!=railway]
-        # way[electrified][!railway][route!=railway][!highway]
-        # way[etcs][!railway][route!=railway]
-        # way[gauge][!railway][route!=railway]
-        # way[grade_of_track][!railway][route!=railway]
-        # way[kursbuchstrecke][!railway][route!=railway]
-        # way[lzb][!railway][route!=railway]
-        # way[old_railway_operator][!railway][route!=railway]
-        # way[operating_procedure][!railway][route!=railway]
-        # way[pzb][!railway][route!=railway]
-        # way[structure_gauge][!railway][route!=railway]
-        # way[tilting_technology][!railway][route!=railway]
-        # way[track_class][!railway][route!=railway]
-        # way[tracks][!railway][route!=railway]
-        # way[traffic_mode][!railway][route!=railway]
-        # way[workrules][!railway][route!=railway]
-        # way[length_unit][!waterway]
-        # way[canal][!waterway]
-        # way[have_riverbank][!waterway]
-        # area[min_height][!height][/^(building|building:part)$/]
-        # area[building:min_level][!building:levels][/^(building|building:part)$/]
-        # *[border_type][!boundary]
-        # *[piste:difficulty][!piste:type]
-        # *[place][!name][place!=islet][place!=plot][noname!=yes]
-        # *[transformer][!power]
-        # *[source:date][!source]
-        # *[source:name][!name][noname!=yes]
-        # *[source:maxspeed:forward][!maxspeed:forward][!maxspeed]
-        # *[source:maxspeed:backward][!maxspeed:backward][!maxspeed]
-        # *[source:building][!building]
-        # *[source:ref][!ref][noref!=yes]
-        # *[source:population][!population]
-        # *[source:postal_code][!postal_code]
-        # *[source:ele][!ele]
-        # *[source:ref:INSEE][!ref:INSEE]
-        # *[source:lit][!lit]
-        # *[source:hgv][!hgv]
-        # *[source:highway][!highway]
-        # *[source:maxaxleload][!maxaxleload]
-        # *[source:surface][!surface]
-        # *[source:bridge][!bridge]
-        # *[source:old_name][!old_name]
-        # *[source:bicycle][!bicycle]
-        # *[source:designation][!designation]
-        # *[source:height][!height]
-        # *[source:lanes][!lanes]
-        # *[source:postcode][!addr:postcode]
-        # *[source:housenumber][!addr:housenumber]
-        # *[source:addr:postcode][!addr:postcode]
-        # *[source:addr:housenumber][!addr:housenumber]
+                sets.add('fully_paved_surface')
+
+    # way[junction][!highway][junction!=yes][!area:highway]
+    # way[living_street][!highway]
+    # way[maintenance][!highway]
+    # way[median][!highway]
+    # way[motorroad][!highway]
+    # way[sac_scale][!highway]
+    # way[sidewalk][!highway]
+    # way[step_count][!highway][man_made!=tower]
+    # way[tracktype][!highway]
+    # way[trail_visibility][!highway]
+    # way[trolley_wire][!highway]
+    # way[zip_left][!highway]
+    # way[zip_right][!highway]
+    # way[detail][!railway][route!=railway]
+    # way[eddy_current_brake][!railway][route!=railway]
+    # way[electrified][!railway][route!=railway][!highway]
+    # way[etcs][!railway][route!=railway]
+    # way[gauge][!railway][route!=railway]
+    # way[grade_of_track][!railway][route!=railway]
+    # way[kursbuchstrecke][!railway][route!=railway]
+    # way[lzb][!railway][route!=railway]
+    # way[old_railway_operator][!railway][route!=railway]
+    # way[operating_procedure][!railway][route!=railway]
+    # way[pzb][!railway][route!=railway]
+    # way[structure_gauge][!railway][route!=railway]
+    # way[tilting_technology][!railway][route!=railway]
+    # way[track_class][!railway][route!=railway]
+    # way[tracks][!railway][route!=railway]
+    # way[traffic_mode][!railway][route!=railway]
+    # way[workrules][!railway][route!=railway]
+    # way[length_unit][!waterway]
+    # way[canal][!waterway]
+    # way[have_riverbank][!waterway]
+    # area[min_height][!height][/^(building|building:part)$/]
+    # area[building:min_level][!building:levels][/^(building|building:part)$/]
+    # *[border_type][!boundary]
+    # *[piste:difficulty][!piste:type]
+    # *[place][!name][place!=islet][place!=plot][noname!=yes]
+    # *[transformer][!power]
+    # *[source:date][!source]
+    # *[source:name][!name][noname!=yes]
+    # *[source:maxspeed:forward][!maxspeed:forward][!maxspeed]
+    # *[source:maxspeed:backward][!maxspeed:backward][!maxspeed]
+    # *[source:building][!building]
+    # *[source:ref][!ref][noref!=yes]
+    # *[source:population][!population]
+    # *[source:postal_code][!postal_code]
+    # *[source:ele][!ele]
+    # *[source:ref:INSEE][!ref:INSEE]
+    # *[source:lit][!lit]
+    # *[source:hgv][!hgv]
+    # *[source:highway][!highway]
+    # *[source:maxaxleload][!maxaxleload]
+    # *[source:surface][!surface]
+    # *[source:bridge][!bridge]
+    # *[source:old_name][!old_name]
+    # *[source:bicycle][!bicycle]
+    # *[source:designation][!designation]
+    # *[source:height][!height]
+    # *[source:lanes][!lanes]
+    # *[source:postcode][!addr:postcode]
+    # *[source:housenumber][!addr:housenumber]
+    # *[source:addr:postcode][!addr:postcode]
+    # *[source:addr:housenumber][!addr:housenumber]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('border_type' in keys) or ('building:min_level' in keys) or ('canal' in keys) or ('detail' in keys) or ('eddy_current_brake' in keys) or ('electrified' in keys) or ('etcs' in keys) or ('gauge' in keys) or ('grade_of_track' in keys) or ('have_riverbank' in keys) or ('junction' in keys) or ('kursbuchstrecke' in keys) or ('length_unit' in keys) or ('living_street' in keys) or ('lzb' in keys) or ('maintenance' in keys) or ('median' in keys) or ('min_height' in keys) or ('motorroad' in keys) or ('old_railway_operator' in keys) or ('operating_procedure' in keys) or ('piste:difficulty' in keys) or ('place' in keys) or ('pzb' in keys) or ('sac_scale' in keys) or ('sidewalk' in keys) or ('source:addr:housenumber' in keys) or ('source:addr:postcode' in keys) or ('source:bicycle' in keys) or ('source:bridge' in keys) or ('source:building' in keys) or ('source:date' in keys) or ('source:designation' in keys) or ('source:ele' in keys) or ('source:height' in keys) or ('source:hgv' in keys) or ('source:highway' in keys) or ('source:housenumber' in keys) or ('source:lanes' in keys) or ('source:lit' in keys) or ('source:maxaxleload' in keys) or ('source:maxspeed:backward' in keys) or ('source:maxspeed:forward' in keys) or ('source:name' in keys) or ('source:old_name' in keys) or ('source:population' in keys) or ('source:postal_code' in keys) or ('source:postcode' in keys) or ('source:ref' in keys) or ('source:ref:INSEE' in keys) or ('source:surface' in keys) or ('step_count' in keys) or ('structure_gauge' in keys) or ('tilting_technology' in keys) or ('track_class' in keys) or ('tracks' in keys) or ('tracktype' in keys) or ('traffic_mode' in keys) or ('trail_visibility' in keys) or ('transformer' in keys) or ('trolley_wire' in keys) or ('workrules' in keys) or ('zip_left' in keys) or ('zip_right' in keys):
             match = False
             if not match:
@@ -1617,20 +1701,21 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.key}","{1.key}")
                 err.append({'class': 9001001, 'subclass': 1598649795, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[generator:source][power!=generator]
-        # *[generator:method][power!=generator]
-        # *[generator:type][power!=generator]
-        # way[fence_type][barrier!=fence]
-        # *[recycling_type][amenity!=recycling]
-        # *[information][tourism!=information]
-        # *[shelter_type][amenity!=shelter]
-        # *[archaeological_site][historic!=archaeological_site]
-        # *[artwork_type][tourism!=artwork][exhibit!=artwork]
-        # *[castle_type][historic!=castle]
-        # *[parking][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking)$/][parking!=yes][parking!=no]
-        # way[cutline][man_made!=cutline]
-        # *[zoo][tourism!=zoo]
-        # *[bunker_type][military!=bunker]
+    # *[generator:source][power!=generator]
+    # *[generator:method][power!=generator]
+    # *[generator:type][power!=generator]
+    # way[fence_type][barrier!=fence]
+    # *[recycling_type][amenity!=recycling]
+    # *[information][tourism!=information]
+    # *[shelter_type][amenity!=shelter]
+    # *[archaeological_site][historic!=archaeological_site]
+    # *[artwork_type][tourism!=artwork][exhibit!=artwork]
+    # *[castle_type][historic!=castle]
+    # *[parking][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking)$/][parking!=yes][parking!=no]
+    # way[cutline][man_made!=cutline]
+    # *[zoo][tourism!=zoo]
+    # *[bunker_type][military!=bunker]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('archaeological_site' in keys) or ('artwork_type' in keys) or ('bunker_type' in keys) or ('castle_type' in keys) or ('cutline' in keys) or ('fence_type' in keys) or ('generator:method' in keys) or ('generator:source' in keys) or ('generator:type' in keys) or ('information' in keys) or ('parking' in keys) or ('recycling_type' in keys) or ('shelter_type' in keys) or ('zoo' in keys):
             match = False
             if not match:
@@ -1694,10 +1779,11 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.key}","{1.tag}")
                 err.append({'class': 9001001, 'subclass': 1261817376, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[bridge:movable][bridge!=movable][man_made!=bridge]
-        # *[substation][power!=substation][pipeline!=substation]
-        # *[reservoir_type][landuse!=reservoir][water!=reservoir]
-        # way[waterway=pressurised][tunnel!=flooded][man_made!=pipeline]
+    # *[bridge:movable][bridge!=movable][man_made!=bridge]
+    # *[substation][power!=substation][pipeline!=substation]
+    # *[reservoir_type][landuse!=reservoir][water!=reservoir]
+    # way[waterway=pressurised][tunnel!=flooded][man_made!=pipeline]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('bridge:movable' in keys) or ('reservoir_type' in keys) or ('substation' in keys) or ('waterway' in keys):
             match = False
             if not match:
@@ -1721,8 +1807,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1} or {2}","{0.key}","{1.tag}","{2.tag}")
                 err.append({'class': 9001001, 'subclass': 214618643, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # *[iata][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
-        # *[icao][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
+    # *[iata][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
+    # *[icao][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('iata' in keys) or ('icao' in keys):
             match = False
             if not match:
@@ -1738,7 +1825,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2} or {3}","{0.key}","{1.tag}","{2.tag}","{3.tag}")
                 err.append({'class': 9001001, 'subclass': 1908755652, 'text': mapcss.tr('{0} without {1}, {2} or {3}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'))})
 
-        # *[pump_mechanism][man_made!=pump][man_made!=windpump][man_made!=water_well][man_made!=petroleum_well]
+    # *[pump_mechanism][man_made!=pump][man_made!=windpump][man_made!=water_well][man_made!=petroleum_well]
+    def _way_rule_6(self, data, tags, nds, keys, err, sets):
         if ('pump_mechanism' in keys):
             match = False
             if not match:
@@ -1750,21 +1838,22 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2}, {3} or {4}","{0.key}","{1.tag}","{2.tag}","{3.tag}","{4.tag}")
                 err.append({'class': 9001001, 'subclass': 1271875329, 'text': mapcss.tr('{0} without {1}, {2}, {3} or {4}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'), mapcss._tag_uncapture(capture_tags, '{4.tag}'))})
 
-        # way[railway=construction][!construction][!construction:railway]
-        # way[highway=construction][!construction][!construction:highway]
-        # area[building=construction][!construction][!construction:building]
-        # area[landuse=construction][!construction][!construction:landuse]
-        # *[actuator=manual][!handle]
-        # *[mechanical_driver=manual][!handle]
-        # way[boundary=administrative][!admin_level]
-        # *[tourism=information][!information]
-        # *[leisure=pitch][!sport]
-        # *[aeroway=terminal][!building]
-        # *[office=government][!government]
-        # *[power=generator][!generator:source]
-        # *[amenity=social_facility][!social_facility]
-        # *[amenity=place_of_worship][!religion]
-        # *[man_made=tower][!tower:type]
+    # way[railway=construction][!construction][!construction:railway]
+    # way[highway=construction][!construction][!construction:highway]
+    # area[building=construction][!construction][!construction:building]
+    # area[landuse=construction][!construction][!construction:landuse]
+    # *[actuator=manual][!handle]
+    # *[mechanical_driver=manual][!handle]
+    # way[boundary=administrative][!admin_level]
+    # *[tourism=information][!information]
+    # *[leisure=pitch][!sport]
+    # *[aeroway=terminal][!building]
+    # *[office=government][!government]
+    # *[power=generator][!generator:source]
+    # *[amenity=social_facility][!social_facility]
+    # *[amenity=place_of_worship][!religion]
+    # *[man_made=tower][!tower:type]
+    def _way_rule_7(self, data, tags, nds, keys, err, sets):
         if ('actuator' in keys) or ('aeroway' in keys) or ('amenity' in keys) or ('boundary' in keys) or ('building' in keys) or ('highway' in keys) or ('landuse' in keys) or ('leisure' in keys) or ('man_made' in keys) or ('mechanical_driver' in keys) or ('office' in keys) or ('power' in keys) or ('railway' in keys) or ('tourism' in keys):
             match = False
             if not match:
@@ -1832,8 +1921,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.tag}","{1.key}")
                 err.append({'class': 9001001, 'subclass': 1166107880, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[bridge:structure][!bridge][man_made!=bridge]
-        # *[segregated][!highway][railway!=crossing]
+    # way[bridge:structure][!bridge][man_made!=bridge]
+    # *[segregated][!highway][railway!=crossing]
+    def _way_rule_8(self, data, tags, nds, keys, err, sets):
         if ('bridge:structure' in keys) or ('segregated' in keys):
             match = False
             if not match:
@@ -1849,7 +1939,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1} or {2}","{0.key}","{1.key}","{2.tag}")
                 err.append({'class': 9001001, 'subclass': 1408612243, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # way[tunnel=culvert][man_made!=tunnel][!waterway]
+    # way[tunnel=culvert][man_made!=tunnel][!waterway]
+    def _way_rule_9(self, data, tags, nds, keys, err, sets):
         if ('tunnel' in keys):
             match = False
             if not match:
@@ -1860,11 +1951,12 @@ class Josm_combinations(PluginMapCSS):
                 # set TunnelCulvertWithoutWaterway
                 # group:tr("suspicious tag combination")
                 # throwWarning:tr("{0} without {1} or {2}","{0.tag}","{1.tag}","{2.key}")
-                set_TunnelCulvertWithoutWaterway = True
+                sets.add('TunnelCulvertWithoutWaterway')
                 err.append({'class': 9001002, 'subclass': 633859539, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # way[usage=penstock][man_made!=pipeline]
-        # way[usage=penstock][waterway!=pressurised]
+    # way[usage=penstock][man_made!=pipeline]
+    # way[usage=penstock][waterway!=pressurised]
+    def _way_rule_10(self, data, tags, nds, keys, err, sets):
         if ('usage' in keys):
             match = False
             if not match:
@@ -1880,7 +1972,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.tag}","{1.tag}")
                 err.append({'class': 9001001, 'subclass': 758205383, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[amenity=recycling][recycling_type!=container][recycling_type!=centre]
+    # *[amenity=recycling][recycling_type!=container][recycling_type!=centre]
+    def _way_rule_11(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -1892,7 +1985,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1} or {2}","{0.tag}","{1.tag}","{2.tag}")
                 err.append({'class': 9001001, 'subclass': 747056792, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # *[smoothness][!highway][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking|bicycle_parking)$/][barrier!=kerb][!kerb]
+    # *[smoothness][!highway][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking|bicycle_parking)$/][barrier!=kerb][!kerb]
+    def _way_rule_12(self, data, tags, nds, keys, err, sets):
         if ('smoothness' in keys):
             match = False
             if not match:
@@ -1904,8 +1998,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2}, {3} or {4}","{0.key}","{1.key}","{2.tag}","{3.tag}","{4.key}")
                 err.append({'class': 9001001, 'subclass': 1922079652, 'text': mapcss.tr('{0} without {1}, {2}, {3} or {4}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'), mapcss._tag_uncapture(capture_tags, '{4.key}'))})
 
-        # *[intermittent][!waterway][natural!~/^(water|spring)$/][landuse!~/^(basin|reservoir)$/][ford!~/^(yes|stepping_stones)$/]
-        # *[boat][!waterway][natural!=water][landuse!~/^(basin|reservoir)$/][ford!=yes]
+    # *[intermittent][!waterway][natural!~/^(water|spring)$/][landuse!~/^(basin|reservoir)$/][ford!~/^(yes|stepping_stones)$/]
+    # *[boat][!waterway][natural!=water][landuse!~/^(basin|reservoir)$/][ford!=yes]
+    def _way_rule_13(self, data, tags, nds, keys, err, sets):
         if ('boat' in keys) or ('intermittent' in keys):
             match = False
             if not match:
@@ -1921,7 +2016,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2}, {3} or {4}","{0.key}","{1.key}","{2.tag}","{3.tag}","{4.tag}")
                 err.append({'class': 9001001, 'subclass': 1547975047, 'text': mapcss.tr('{0} without {1}, {2}, {3} or {4}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'), mapcss._tag_uncapture(capture_tags, '{4.tag}'))})
 
-        # *[snowplowing][!highway][!amenity][!leisure]
+    # *[snowplowing][!highway][!amenity][!leisure]
+    def _way_rule_14(self, data, tags, nds, keys, err, sets):
         if ('snowplowing' in keys):
             match = False
             if not match:
@@ -1933,7 +2029,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2} or {3}","{0.key}","{1.key}","{2.key}","{3.key}")
                 err.append({'class': 9001001, 'subclass': 585636657, 'text': mapcss.tr('{0} without {1}, {2} or {3}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'), mapcss._tag_uncapture(capture_tags, '{3.key}'))})
 
-        # *[toll][!highway][!barrier][route!~/^(ferry|road)$/]
+    # *[toll][!highway][!barrier][route!~/^(ferry|road)$/]
+    def _way_rule_15(self, data, tags, nds, keys, err, sets):
         if ('toll' in keys):
             match = False
             if not match:
@@ -1945,22 +2042,23 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2} or {3}","{0.key}","{1.key}","{2.key}","{3.tag}")
                 err.append({'class': 9001001, 'subclass': 1689494174, 'text': mapcss.tr('{0} without {1}, {2} or {3}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'))})
 
-        # *[amenity=marketplace][highway]
-        # *[power=plant][/^generator:/]
-        # *[power=generator][/^plant:/]
-        # *[power=plant][voltage]
-        # *[power=plant][frequency]
-        # *[internet_access=no][internet_access:fee]
-        # *[amenity=vending_machine][shop]
-        # *[noname?][name]
-        # *[noref?][ref]
-        # *[nohousenumber?][addr:housenumber]
-        # *[actuator][handle][actuator!~/(^|;)manual(;|$)/]
-        # *[mechanical_driver][handle][mechanical_driver!~/(^|;)manual(;|$)/]
-        # way[oneway?][/:backward/][!traffic_sign:backward][bicycle:backward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
-        # way[oneway?][/:forward/][!traffic_sign:forward][bicycle:forward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
-        # way[oneway=-1][/:backward/][!traffic_sign:backward][bicycle:backward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
-        # way[oneway=-1][/:forward/][!traffic_sign:forward][bicycle:forward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
+    # *[amenity=marketplace][highway]
+    # *[power=plant][/^generator:/]
+    # *[power=generator][/^plant:/]
+    # *[power=plant][voltage]
+    # *[power=plant][frequency]
+    # *[internet_access=no][internet_access:fee]
+    # *[amenity=vending_machine][shop]
+    # *[noname?][name]
+    # *[noref?][ref]
+    # *[nohousenumber?][addr:housenumber]
+    # *[actuator][handle][actuator!~/(^|;)manual(;|$)/]
+    # *[mechanical_driver][handle][mechanical_driver!~/(^|;)manual(;|$)/]
+    # way[oneway?][/:backward/][!traffic_sign:backward][bicycle:backward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
+    # way[oneway?][/:forward/][!traffic_sign:forward][bicycle:forward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
+    # way[oneway=-1][/:backward/][!traffic_sign:backward][bicycle:backward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
+    # way[oneway=-1][/:forward/][!traffic_sign:forward][bicycle:forward!=use_sidepath][/^oneway:(bicycle|bus|mofa|moped|psv)$/!~/^no$/][!/^oneway:(.+:)?conditional$/]
+    def _way_rule_16(self, data, tags, nds, keys, err, sets):
         if ('actuator' in keys and 'handle' in keys) or ('addr:housenumber' in keys and 'nohousenumber' in keys) or ('amenity' in keys and 'highway' in keys) or ('amenity' in keys and 'shop' in keys) or ('frequency' in keys and 'power' in keys) or ('handle' in keys and 'mechanical_driver' in keys) or ('internet_access' in keys and 'internet_access:fee' in keys) or ('name' in keys and 'noname' in keys) or ('noref' in keys and 'ref' in keys) or ('oneway' in keys) or ('power' in keys) or ('power' in keys and 'voltage' in keys):
             match = False
             if not match:
@@ -2038,22 +2136,23 @@ class Josm_combinations(PluginMapCSS):
                 # assertMatch:"way power=plant generator:source=wind"
                 err.append({'class': 9001002, 'subclass': 1751419774, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[barrier=kerb][kerb=no]
-        # way[highway=construction][construction][construction=~/^(yes|minor|no)$/]
-        # way[railway=construction][construction][construction=~/^(yes|minor|no)$/]
-        # area[building=construction][construction][construction=~/^(yes|minor|no)$/]
-        # area[landuse=construction][construction][construction=~/^(yes|minor|no)$/]
-        # *[man_made=bridge][bridge=yes]
-        # *[man_made=tunnel][tunnel=yes]
-        # *[amenity=police][police]
-        # way[junction=yes][highway]
-        # way[tracktype=grade1][surface].unpaved_surface
-        # way[tracktype=grade2][surface][surface=~/^(sand|mud|earth|dirt|grass|ice|salt|snow|woodchips)$/]
-        # way[tracktype=grade4][surface].fully_paved_surface
-        # way[tracktype=grade5][surface].fully_paved_surface
-        # way[segregated][bicycle=no]
-        # way[segregated][foot=no]
-        # way[man_made=pipeline][tunnel=flooded]
+    # *[barrier=kerb][kerb=no]
+    # way[highway=construction][construction][construction=~/^(yes|minor|no)$/]
+    # way[railway=construction][construction][construction=~/^(yes|minor|no)$/]
+    # area[building=construction][construction][construction=~/^(yes|minor|no)$/]
+    # area[landuse=construction][construction][construction=~/^(yes|minor|no)$/]
+    # *[man_made=bridge][bridge=yes]
+    # *[man_made=tunnel][tunnel=yes]
+    # *[amenity=police][police]
+    # way[junction=yes][highway]
+    # way[tracktype=grade1][surface].unpaved_surface
+    # way[tracktype=grade2][surface][surface=~/^(sand|mud|earth|dirt|grass|ice|salt|snow|woodchips)$/]
+    # way[tracktype=grade4][surface].fully_paved_surface
+    # way[tracktype=grade5][surface].fully_paved_surface
+    # way[segregated][bicycle=no]
+    # way[segregated][foot=no]
+    # way[man_made=pipeline][tunnel=flooded]
+    def _way_rule_17(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'police' in keys) or ('barrier' in keys and 'kerb' in keys) or ('bicycle' in keys and 'segregated' in keys) or ('bridge' in keys and 'man_made' in keys) or ('building' in keys and 'construction' in keys) or ('construction' in keys and 'highway' in keys) or ('construction' in keys and 'landuse' in keys) or ('construction' in keys and 'railway' in keys) or ('foot' in keys and 'segregated' in keys) or ('highway' in keys and 'junction' in keys) or ('man_made' in keys and 'tunnel' in keys) or ('surface' in keys and 'tracktype' in keys):
             match = False
             if not match:
@@ -2094,7 +2193,7 @@ class Josm_combinations(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_unpaved_surface) and (mapcss._tag_capture(capture_tags, 0, tags, 'tracktype') == mapcss._value_capture(capture_tags, 0, 'grade1')) and (mapcss._tag_capture(capture_tags, 1, tags, 'surface')))
+                try: match = (('unpaved_surface' in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'tracktype') == mapcss._value_capture(capture_tags, 0, 'grade1')) and (mapcss._tag_capture(capture_tags, 1, tags, 'surface')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
@@ -2102,11 +2201,11 @@ class Josm_combinations(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_fully_paved_surface) and (mapcss._tag_capture(capture_tags, 0, tags, 'tracktype') == mapcss._value_capture(capture_tags, 0, 'grade4')) and (mapcss._tag_capture(capture_tags, 1, tags, 'surface')))
+                try: match = (('fully_paved_surface' in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'tracktype') == mapcss._value_capture(capture_tags, 0, 'grade4')) and (mapcss._tag_capture(capture_tags, 1, tags, 'surface')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_fully_paved_surface) and (mapcss._tag_capture(capture_tags, 0, tags, 'tracktype') == mapcss._value_capture(capture_tags, 0, 'grade5')) and (mapcss._tag_capture(capture_tags, 1, tags, 'surface')))
+                try: match = (('fully_paved_surface' in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'tracktype') == mapcss._value_capture(capture_tags, 0, 'grade5')) and (mapcss._tag_capture(capture_tags, 1, tags, 'surface')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
@@ -2125,8 +2224,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.tag}","{1.tag}")
                 err.append({'class': 9001002, 'subclass': 3517519, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[building:part][building]
-        # *[addr:street][addr:place][outside("CZ,DK")]
+    # *[building:part][building]
+    # *[addr:street][addr:place][outside("CZ,DK")]
+    def _way_rule_18(self, data, tags, nds, keys, err, sets):
         if ('addr:place' in keys and 'addr:street' in keys) or ('building' in keys and 'building:part' in keys):
             match = False
             if not match:
@@ -2142,7 +2242,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.key}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 1590654104, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[highway=~/^(cycleway|footway|path)$/][segregated=no][sidewalk=~/^(left|right|both)$/]
+    # way[highway=~/^(cycleway|footway|path)$/][segregated=no][sidewalk=~/^(left|right|both)$/]
+    def _way_rule_19(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'segregated' in keys and 'sidewalk' in keys):
             match = False
             if not match:
@@ -2154,8 +2255,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1} and {2}","{0.tag}","{1.tag}","{2.key}")
                 err.append({'class': 9001002, 'subclass': 340416718, 'text': mapcss.tr('{0} together with {1} and {2}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # way[railway][electrified=no][frequency]
-        # way[railway][electrified=no][voltage]
+    # way[railway][electrified=no][frequency]
+    # way[railway][electrified=no][voltage]
+    def _way_rule_20(self, data, tags, nds, keys, err, sets):
         if ('electrified' in keys and 'frequency' in keys and 'railway' in keys) or ('electrified' in keys and 'railway' in keys and 'voltage' in keys):
             match = False
             if not match:
@@ -2171,7 +2273,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1} and {2}","{0.key}","{1.tag}","{2.key}")
                 err.append({'class': 9001002, 'subclass': 154935939, 'text': mapcss.tr('{0} together with {1} and {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # way[waterway][bridge=yes][waterway!=weir]
+    # way[waterway][bridge=yes][waterway!=weir]
+    def _way_rule_21(self, data, tags, nds, keys, err, sets):
         if ('bridge' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -2188,7 +2291,8 @@ class Josm_combinations(PluginMapCSS):
                     ['bridge','aqueduct']])
                 }})
 
-        # way[waterway=weir][bridge=yes][highway]
+    # way[waterway=weir][bridge=yes][highway]
+    def _way_rule_22(self, data, tags, nds, keys, err, sets):
         if ('bridge' in keys and 'highway' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -2203,15 +2307,16 @@ class Josm_combinations(PluginMapCSS):
                 # suggestAlternative:"waterway=weir + ford=yes"
                 err.append({'class': 9001002, 'subclass': 842989092, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[access][eval(number_of_tags())=1]
-        # way[area][eval(number_of_tags())=1]!.area_yes_autofix
-        # way[lanes][eval(number_of_tags())=1]
-        # way[layer][eval(number_of_tags())=1]
-        # way[level][eval(number_of_tags())=1]
-        # way[lit][eval(number_of_tags())=1]
-        # way[name][eval(number_of_tags())=1]
-        # way[ref][eval(number_of_tags())=1]
-        # way[surface][eval(number_of_tags())=1]
+    # way[access][eval(number_of_tags())=1]
+    # way[area][eval(number_of_tags())=1]!.area_yes_autofix
+    # way[lanes][eval(number_of_tags())=1]
+    # way[layer][eval(number_of_tags())=1]
+    # way[level][eval(number_of_tags())=1]
+    # way[lit][eval(number_of_tags())=1]
+    # way[name][eval(number_of_tags())=1]
+    # way[ref][eval(number_of_tags())=1]
+    # way[surface][eval(number_of_tags())=1]
+    def _way_rule_23(self, data, tags, nds, keys, err, sets):
         if ('access' in keys) or ('area' in keys) or ('lanes' in keys) or ('layer' in keys) or ('level' in keys) or ('lit' in keys) or ('name' in keys) or ('ref' in keys) or ('surface' in keys):
             match = False
             if not match:
@@ -2251,11 +2356,12 @@ class Josm_combinations(PluginMapCSS):
                 # set only_one_tag
                 # group:tr("missing tag")
                 # throwWarning:tr("incomplete object: only {0}","{0.key}")
-                set_only_one_tag = True
+                sets.add('only_one_tag')
                 err.append({'class': 9001001, 'subclass': 396232069, 'text': mapcss.tr('incomplete object: only {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[name][area][eval(number_of_tags())=2]
-        # way[name][ref][eval(number_of_tags())=2]
+    # way[name][area][eval(number_of_tags())=2]
+    # way[name][ref][eval(number_of_tags())=2]
+    def _way_rule_24(self, data, tags, nds, keys, err, sets):
         if ('area' in keys and 'name' in keys) or ('name' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -2271,7 +2377,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("incomplete object: only {0} and {1}","{0.key}","{1.key}")
                 err.append({'class': 9001001, 'subclass': 24958270, 'text': mapcss.tr('incomplete object: only {0} and {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[tourism=attraction][eval(number_of_tags())=1]
+    # way[tourism=attraction][eval(number_of_tags())=1]
+    def _way_rule_25(self, data, tags, nds, keys, err, sets):
         if ('tourism' in keys):
             match = False
             if not match:
@@ -2283,7 +2390,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("incomplete object: only {0}","{0.tag}")
                 err.append({'class': 9001001, 'subclass': 557203641, 'text': mapcss.tr('incomplete object: only {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[name][tourism=attraction][eval(number_of_tags())=2]
+    # way[name][tourism=attraction][eval(number_of_tags())=2]
+    def _way_rule_26(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'tourism' in keys):
             match = False
             if not match:
@@ -2295,9 +2403,10 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("incomplete object: only {0} and {1}","{0.key}","{1.tag}")
                 err.append({'class': 9001001, 'subclass': 1755320367, 'text': mapcss.tr('incomplete object: only {0} and {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[place][place!=farm][place!=plot][/^(addr:housenumber|addr:housename|addr:flats|addr:conscriptionnumber|addr:street|addr:place|addr:city|addr:country|addr:full|addr:hamlet|addr:suburb|addr:subdistrict|addr:district|addr:province|addr:state|addr:interpolation|addr:interpolation|addr:inclusion)$/]
-        # *[boundary][/^addr:/]
-        # *[highway][/^addr:/][highway!=services][highway!=rest_area][!"addr:postcode"]
+    # *[place][place!=farm][place!=plot][/^(addr:housenumber|addr:housename|addr:flats|addr:conscriptionnumber|addr:street|addr:place|addr:city|addr:country|addr:full|addr:hamlet|addr:suburb|addr:subdistrict|addr:district|addr:province|addr:state|addr:interpolation|addr:interpolation|addr:inclusion)$/]
+    # *[boundary][/^addr:/]
+    # *[highway][/^addr:/][highway!=services][highway!=rest_area][!"addr:postcode"]
+    def _way_rule_27(self, data, tags, nds, keys, err, sets):
         if ('boundary' in keys) or ('highway' in keys) or ('place' in keys):
             match = False
             if not match:
@@ -2317,7 +2426,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.key}","addr:*")
                 err.append({'class': 9001002, 'subclass': 1053814004, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'addr:*')})
 
-        # *[postal_code]["addr:postcode"][!highway][postal_code=*"addr:postcode"]
+    # *[postal_code]["addr:postcode"][!highway][postal_code=*"addr:postcode"]
+    def _way_rule_28(self, data, tags, nds, keys, err, sets):
         if ('addr:postcode' in keys and 'postal_code' in keys):
             match = False
             if not match:
@@ -2329,7 +2439,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.key}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 731431309, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[postal_code]["addr:postcode"][!highway][postal_code!=*"addr:postcode"]
+    # *[postal_code]["addr:postcode"][!highway][postal_code!=*"addr:postcode"]
+    def _way_rule_29(self, data, tags, nds, keys, err, sets):
         if ('addr:postcode' in keys and 'postal_code' in keys):
             match = False
             if not match:
@@ -2341,7 +2452,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1} and conflicting values","{0.key}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 433558919, 'text': mapcss.tr('{0} together with {1} and conflicting values', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[postal_code]["addr:postcode"][highway][postal_code=*"addr:postcode"]
+    # way[postal_code]["addr:postcode"][highway][postal_code=*"addr:postcode"]
+    def _way_rule_30(self, data, tags, nds, keys, err, sets):
         if ('addr:postcode' in keys and 'highway' in keys and 'postal_code' in keys):
             match = False
             if not match:
@@ -2357,7 +2469,8 @@ class Josm_combinations(PluginMapCSS):
                     'addr:postcode'])
                 }})
 
-        # way[postal_code]["addr:postcode"][highway][postal_code!=*"addr:postcode"]
+    # way[postal_code]["addr:postcode"][highway][postal_code!=*"addr:postcode"]
+    def _way_rule_31(self, data, tags, nds, keys, err, sets):
         if ('addr:postcode' in keys and 'highway' in keys and 'postal_code' in keys):
             match = False
             if not match:
@@ -2369,7 +2482,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1} and conflicting values","{0.key}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 724652011, 'text': mapcss.tr('{0} together with {1} and conflicting values', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[highway]["addr:postcode"][highway!=services][highway!=rest_area][!postal_code]
+    # way[highway]["addr:postcode"][highway!=services][highway!=rest_area][!postal_code]
+    def _way_rule_32(self, data, tags, nds, keys, err, sets):
         if ('addr:postcode' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -2388,7 +2502,8 @@ class Josm_combinations(PluginMapCSS):
                     'addr:postcode'])
                 }})
 
-        # way[highway=footway][cycleway=lane]
+    # way[highway=footway][cycleway=lane]
+    def _way_rule_33(self, data, tags, nds, keys, err, sets):
         if ('cycleway' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -2401,14 +2516,15 @@ class Josm_combinations(PluginMapCSS):
                 # suggestAlternative:"highway=path + foot=designated + bicycle=designated + segregated=yes"
                 err.append({'class': 9001002, 'subclass': 393240150, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[oneway][!highway][!area:highway][!railway][!aerialway][attraction!=summer_toboggan][aeroway!~/^(runway|taxiway)$/][leisure!=track][waterway!~/^(canal|fairway|lock|river|tidal_channel)$/]
-        # way[lanes][!barrier][!ford][!highway][!area:highway][!junction][leisure!~/^(bowling_alley|slipway|swimming_pool|track)$/][!traffic_calming]!.only_one_tag
-        # *[tunnel][!highway][!area:highway][!railway][!waterway][!piste:type][type!=tunnel][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=tunnel][power!=cable]!.TunnelCulvertWithoutWaterway
-        # *[bridge][!highway][!area:highway][!railway][!waterway][!piste:type][type!=bridge][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=bridge][building!=bridge]
-        # *[psv][!highway][!area:highway][!railway][!waterway][barrier!~/^(bollard|bump_gate|bus_trap|cattle_grid|chain|coupure|entrance|gate|height_restrictor|jersey_barrier|kerb|lift_gate|rope|sally_port|sliding_beam|sliding_gate|spikes|swing_gate|toll_booth|yes)$/][amenity!~/^parking.*/]
-        # *[width][!highway][!area:highway][!railway][!waterway][!aeroway][!cycleway][!footway][!barrier][!man_made][!entrance][natural!=stone][leisure!=track]
-        # *[maxspeed][!highway][!area:highway][!railway][traffic_sign!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:forward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:backward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][type!=enforcement][waterway!~/^(canal|fairway|lock|river|tidal_channel)$/][!traffic_calming][aerialway!=zip_line]
-        # way[incline][!highway][!area:highway][!railway][aeroway!~/^(runway|taxiway)$/][attraction!=summer_toboggan][leisure!=slipway]
+    # way[oneway][!highway][!area:highway][!railway][!aerialway][attraction!=summer_toboggan][aeroway!~/^(runway|taxiway)$/][leisure!=track][waterway!~/^(canal|fairway|lock|river|tidal_channel)$/]
+    # way[lanes][!barrier][!ford][!highway][!area:highway][!junction][leisure!~/^(bowling_alley|slipway|swimming_pool|track)$/][!traffic_calming]!.only_one_tag
+    # *[tunnel][!highway][!area:highway][!railway][!waterway][!piste:type][type!=tunnel][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=tunnel][power!=cable]!.TunnelCulvertWithoutWaterway
+    # *[bridge][!highway][!area:highway][!railway][!waterway][!piste:type][type!=bridge][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=bridge][building!=bridge]
+    # *[psv][!highway][!area:highway][!railway][!waterway][barrier!~/^(bollard|bump_gate|bus_trap|cattle_grid|chain|coupure|entrance|gate|height_restrictor|jersey_barrier|kerb|lift_gate|rope|sally_port|sliding_beam|sliding_gate|spikes|swing_gate|toll_booth|yes)$/][amenity!~/^parking.*/]
+    # *[width][!highway][!area:highway][!railway][!waterway][!aeroway][!cycleway][!footway][!barrier][!man_made][!entrance][natural!=stone][leisure!=track]
+    # *[maxspeed][!highway][!area:highway][!railway][traffic_sign!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:forward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:backward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][type!=enforcement][waterway!~/^(canal|fairway|lock|river|tidal_channel)$/][!traffic_calming][aerialway!=zip_line]
+    # way[incline][!highway][!area:highway][!railway][aeroway!~/^(runway|taxiway)$/][attraction!=summer_toboggan][leisure!=slipway]
+    def _way_rule_34(self, data, tags, nds, keys, err, sets):
         if ('bridge' in keys) or ('incline' in keys) or ('lanes' in keys) or ('maxspeed' in keys) or ('oneway' in keys) or ('psv' in keys) or ('tunnel' in keys) or ('width' in keys):
             match = False
             if not match:
@@ -2417,11 +2533,11 @@ class Josm_combinations(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_only_one_tag) and (mapcss._tag_capture(capture_tags, 0, tags, 'lanes')) and (not mapcss._tag_capture(capture_tags, 1, tags, 'barrier')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'ford')) and (not mapcss._tag_capture(capture_tags, 3, tags, 'highway')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'area:highway')) and (not mapcss._tag_capture(capture_tags, 5, tags, 'junction')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 6, self.re_49fc2c26, '^(bowling_alley|slipway|swimming_pool|track)$'), mapcss._tag_capture(capture_tags, 6, tags, 'leisure'))) and (not mapcss._tag_capture(capture_tags, 7, tags, 'traffic_calming')))
+                try: match = (('only_one_tag' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'lanes')) and (not mapcss._tag_capture(capture_tags, 1, tags, 'barrier')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'ford')) and (not mapcss._tag_capture(capture_tags, 3, tags, 'highway')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'area:highway')) and (not mapcss._tag_capture(capture_tags, 5, tags, 'junction')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 6, self.re_49fc2c26, '^(bowling_alley|slipway|swimming_pool|track)$'), mapcss._tag_capture(capture_tags, 6, tags, 'leisure'))) and (not mapcss._tag_capture(capture_tags, 7, tags, 'traffic_calming')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_TunnelCulvertWithoutWaterway) and (mapcss._tag_capture(capture_tags, 0, tags, 'tunnel')) and (not mapcss._tag_capture(capture_tags, 1, tags, 'highway')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'area:highway')) and (not mapcss._tag_capture(capture_tags, 3, tags, 'railway')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'waterway')) and (not mapcss._tag_capture(capture_tags, 5, tags, 'piste:type')) and (mapcss._tag_capture(capture_tags, 6, tags, 'type') != mapcss._value_const_capture(capture_tags, 6, 'tunnel', 'tunnel')) and (mapcss._tag_capture(capture_tags, 7, tags, 'public_transport') != mapcss._value_const_capture(capture_tags, 7, 'platform', 'platform')) and (mapcss._tag_capture(capture_tags, 8, tags, 'route') != mapcss._value_const_capture(capture_tags, 8, 'ferry', 'ferry')) and (mapcss._tag_capture(capture_tags, 9, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 9, 'pipeline', 'pipeline')) and (mapcss._tag_capture(capture_tags, 10, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 10, 'goods_conveyor', 'goods_conveyor')) and (mapcss._tag_capture(capture_tags, 11, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 11, 'wildlife_crossing', 'wildlife_crossing')) and (mapcss._tag_capture(capture_tags, 12, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 12, 'tunnel', 'tunnel')) and (mapcss._tag_capture(capture_tags, 13, tags, 'power') != mapcss._value_const_capture(capture_tags, 13, 'cable', 'cable')))
+                try: match = (('TunnelCulvertWithoutWaterway' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'tunnel')) and (not mapcss._tag_capture(capture_tags, 1, tags, 'highway')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'area:highway')) and (not mapcss._tag_capture(capture_tags, 3, tags, 'railway')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'waterway')) and (not mapcss._tag_capture(capture_tags, 5, tags, 'piste:type')) and (mapcss._tag_capture(capture_tags, 6, tags, 'type') != mapcss._value_const_capture(capture_tags, 6, 'tunnel', 'tunnel')) and (mapcss._tag_capture(capture_tags, 7, tags, 'public_transport') != mapcss._value_const_capture(capture_tags, 7, 'platform', 'platform')) and (mapcss._tag_capture(capture_tags, 8, tags, 'route') != mapcss._value_const_capture(capture_tags, 8, 'ferry', 'ferry')) and (mapcss._tag_capture(capture_tags, 9, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 9, 'pipeline', 'pipeline')) and (mapcss._tag_capture(capture_tags, 10, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 10, 'goods_conveyor', 'goods_conveyor')) and (mapcss._tag_capture(capture_tags, 11, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 11, 'wildlife_crossing', 'wildlife_crossing')) and (mapcss._tag_capture(capture_tags, 12, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 12, 'tunnel', 'tunnel')) and (mapcss._tag_capture(capture_tags, 13, tags, 'power') != mapcss._value_const_capture(capture_tags, 13, 'cable', 'cable')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
@@ -2448,10 +2564,11 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} on suspicious object","{0.key}")
                 err.append({'class': 9001002, 'subclass': 1496920948, 'text': mapcss.tr('{0} on suspicious object', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[highway][barrier]
-        # *[highway][waterway][waterway!=dam][waterway!=weir]
-        # way[highway][natural][natural!=ridge]
-        # *[landuse][building][landuse!=retail]
+    # way[highway][barrier]
+    # *[highway][waterway][waterway!=dam][waterway!=weir]
+    # way[highway][natural][natural!=ridge]
+    # *[landuse][building][landuse!=retail]
+    def _way_rule_35(self, data, tags, nds, keys, err, sets):
         if ('barrier' in keys and 'highway' in keys) or ('building' in keys and 'landuse' in keys) or ('highway' in keys and 'natural' in keys) or ('highway' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -2475,7 +2592,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.key}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 636059786, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[natural=water][leisure=swimming_pool]
+    # *[natural=water][leisure=swimming_pool]
+    def _way_rule_36(self, data, tags, nds, keys, err, sets):
         if ('leisure' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -2491,7 +2609,8 @@ class Josm_combinations(PluginMapCSS):
                     'natural'])
                 }})
 
-        # *[sport][sport!=skiing][!building][!"building:part"][!club][tourism!=hotel][highway!~/^(pedestrian|raceway)$/][!leisure][natural!~/^(beach|bare_rock|cliff|peak|water)$/][amenity!~/^(bar|dojo|pub|restaurant|swimming_pool)$/][landuse!~/^(recreation_ground|piste|farm|farmland)$/][barrier!~/^(wall|retaining_wall)$/][!"piste:type"][shop!=sports][attraction!=summer_toboggan]
+    # *[sport][sport!=skiing][!building][!"building:part"][!club][tourism!=hotel][highway!~/^(pedestrian|raceway)$/][!leisure][natural!~/^(beach|bare_rock|cliff|peak|water)$/][amenity!~/^(bar|dojo|pub|restaurant|swimming_pool)$/][landuse!~/^(recreation_ground|piste|farm|farmland)$/][barrier!~/^(wall|retaining_wall)$/][!"piste:type"][shop!=sports][attraction!=summer_toboggan]
+    def _way_rule_37(self, data, tags, nds, keys, err, sets):
         if ('sport' in keys):
             match = False
             if not match:
@@ -2503,8 +2622,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("sport without physical feature")
                 err.append({'class': 9001001, 'subclass': 1738767711, 'text': mapcss.tr('sport without physical feature')})
 
-        # *[building:levels][!building][!building:part]
-        # way[usage][!railway][!waterway][route!=railway][man_made!=pipeline][!aerialway]
+    # *[building:levels][!building][!building:part]
+    # way[usage][!railway][!waterway][route!=railway][man_made!=pipeline][!aerialway]
+    def _way_rule_38(self, data, tags, nds, keys, err, sets):
         if ('building:levels' in keys) or ('usage' in keys):
             match = False
             if not match:
@@ -2520,7 +2640,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1} or {2}","{0.key}","{1.key}","{2.key}")
                 err.append({'class': 9001001, 'subclass': 1552380544, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[/_name$/][!name][!old_name][!loc_name][!reg_name][!uic_name][!artist_name][!lock_name][!"osak:municipality_name"][!"osak:street_name"][NHD:subbasin_name!~/^(Des Moines Headwaters|Upper Des Moines|East Fork Des Moines)$/][noname!=yes]
+    # *[/_name$/][!name][!old_name][!loc_name][!reg_name][!uic_name][!artist_name][!lock_name][!"osak:municipality_name"][!"osak:street_name"][NHD:subbasin_name!~/^(Des Moines Headwaters|Upper Des Moines|East Fork Des Moines)$/][noname!=yes]
+    def _way_rule_39(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -2534,7 +2655,8 @@ class Josm_combinations(PluginMapCSS):
                 # assertMatch:"way alt_name=Foo"
                 err.append({'class': 9001001, 'subclass': 1822630838, 'text': mapcss.tr('alternative name without {0}', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[name][alt_name][name=*alt_name]
+    # way[name][alt_name][name=*alt_name]
+    def _way_rule_40(self, data, tags, nds, keys, err, sets):
         if ('alt_name' in keys and 'name' in keys):
             match = False
             if not match:
@@ -2550,7 +2672,8 @@ class Josm_combinations(PluginMapCSS):
                     'alt_name'])
                 }})
 
-        # way[destination][!oneway?][junction!=roundabout][highway]
+    # way[destination][!oneway?][junction!=roundabout][highway]
+    def _way_rule_41(self, data, tags, nds, keys, err, sets):
         if ('destination' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -2563,7 +2686,8 @@ class Josm_combinations(PluginMapCSS):
                 # suggestAlternative:"destination:forward"
                 err.append({'class': 9001004, 'subclass': 915799973, 'text': mapcss.tr('incomplete usage of {0} on a way without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[maxspeed:forward][maxspeed:backward][!maxspeed]["maxspeed:forward"=*"maxspeed:backward"]
+    # way[maxspeed:forward][maxspeed:backward][!maxspeed]["maxspeed:forward"=*"maxspeed:backward"]
+    def _way_rule_42(self, data, tags, nds, keys, err, sets):
         if ('maxspeed:backward' in keys and 'maxspeed:forward' in keys):
             match = False
             if not match:
@@ -2584,7 +2708,8 @@ class Josm_combinations(PluginMapCSS):
                     'maxspeed:forward'])
                 }})
 
-        # way[maxspeed:forward][maxspeed:backward][maxspeed]["maxspeed:forward"=*maxspeed]["maxspeed:backward"=*maxspeed]
+    # way[maxspeed:forward][maxspeed:backward][maxspeed]["maxspeed:forward"=*maxspeed]["maxspeed:backward"=*maxspeed]
+    def _way_rule_43(self, data, tags, nds, keys, err, sets):
         if ('maxspeed' in keys and 'maxspeed:backward' in keys and 'maxspeed:forward' in keys):
             match = False
             if not match:
@@ -2598,14 +2723,15 @@ class Josm_combinations(PluginMapCSS):
                 # suggestAlternative:"maxspeed"
                 # fixRemove:"maxspeed:backward"
                 # fixRemove:"maxspeed:forward"
-                set_AllSameMaxspeed = True
+                sets.add('AllSameMaxspeed')
                 err.append({'class': 9001002, 'subclass': 1144434553, 'text': mapcss.tr('Same value of {0}, {1} and {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}')), 'allow_fix_override': True, 'fix': {
                     '-': ([
                     'maxspeed:backward',
                     'maxspeed:forward'])
                 }})
 
-        # way[cycleway:left][cycleway:right][!cycleway]["cycleway:left"=*"cycleway:right"]
+    # way[cycleway:left][cycleway:right][!cycleway]["cycleway:left"=*"cycleway:right"]
+    def _way_rule_44(self, data, tags, nds, keys, err, sets):
         if ('cycleway:left' in keys and 'cycleway:right' in keys):
             match = False
             if not match:
@@ -2626,7 +2752,8 @@ class Josm_combinations(PluginMapCSS):
                     'cycleway:right'])
                 }})
 
-        # way[cycleway:left][cycleway:right][cycleway]["cycleway:left"=*cycleway]["cycleway:right"=*cycleway]
+    # way[cycleway:left][cycleway:right][cycleway]["cycleway:left"=*cycleway]["cycleway:right"=*cycleway]
+    def _way_rule_45(self, data, tags, nds, keys, err, sets):
         if ('cycleway' in keys and 'cycleway:left' in keys and 'cycleway:right' in keys):
             match = False
             if not match:
@@ -2640,14 +2767,15 @@ class Josm_combinations(PluginMapCSS):
                 # suggestAlternative:"cycleway"
                 # fixRemove:"cycleway:left"
                 # fixRemove:"cycleway:right"
-                set_AllSameCycleway = True
+                sets.add('AllSameCycleway')
                 err.append({'class': 9001002, 'subclass': 746971984, 'text': mapcss.tr('Same value of {0}, {1} and {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}')), 'allow_fix_override': True, 'fix': {
                     '-': ([
                     'cycleway:left',
                     'cycleway:right'])
                 }})
 
-        # way[sidewalk:left][sidewalk:right][!sidewalk]["sidewalk:left"=*"sidewalk:right"]
+    # way[sidewalk:left][sidewalk:right][!sidewalk]["sidewalk:left"=*"sidewalk:right"]
+    def _way_rule_46(self, data, tags, nds, keys, err, sets):
         if ('sidewalk:left' in keys and 'sidewalk:right' in keys):
             match = False
             if not match:
@@ -2668,7 +2796,8 @@ class Josm_combinations(PluginMapCSS):
                     'sidewalk:right'])
                 }})
 
-        # way[sidewalk:left][sidewalk:right][sidewalk]["sidewalk:left"=*sidewalk]["sidewalk:right"=*sidewalk]
+    # way[sidewalk:left][sidewalk:right][sidewalk]["sidewalk:left"=*sidewalk]["sidewalk:right"=*sidewalk]
+    def _way_rule_47(self, data, tags, nds, keys, err, sets):
         if ('sidewalk' in keys and 'sidewalk:left' in keys and 'sidewalk:right' in keys):
             match = False
             if not match:
@@ -2682,41 +2811,43 @@ class Josm_combinations(PluginMapCSS):
                 # suggestAlternative:"sidewalk"
                 # fixRemove:"sidewalk:left"
                 # fixRemove:"sidewalk:right"
-                set_AllSameSidewalk = True
+                sets.add('AllSameSidewalk')
                 err.append({'class': 9001002, 'subclass': 1539830684, 'text': mapcss.tr('Same value of {0}, {1} and {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}')), 'allow_fix_override': True, 'fix': {
                     '-': ([
                     'sidewalk:left',
                     'sidewalk:right'])
                 }})
 
-        # way["maxspeed:forward"]["maxspeed:backward"][maxspeed]!.AllSameMaxspeed
-        # way["cycleway:left"]["cycleway:right"][cycleway]!.AllSameCycleway
-        # way["sidewalk:left"]["sidewalk:right"][sidewalk]!.AllSameSidewalk
+    # way["maxspeed:forward"]["maxspeed:backward"][maxspeed]!.AllSameMaxspeed
+    # way["cycleway:left"]["cycleway:right"][cycleway]!.AllSameCycleway
+    # way["sidewalk:left"]["sidewalk:right"][sidewalk]!.AllSameSidewalk
+    def _way_rule_48(self, data, tags, nds, keys, err, sets):
         if ('cycleway' in keys and 'cycleway:left' in keys and 'cycleway:right' in keys) or ('maxspeed' in keys and 'maxspeed:backward' in keys and 'maxspeed:forward' in keys) or ('sidewalk' in keys and 'sidewalk:left' in keys and 'sidewalk:right' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_AllSameMaxspeed) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxspeed:forward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'maxspeed:backward')) and (mapcss._tag_capture(capture_tags, 2, tags, 'maxspeed')))
+                try: match = (('AllSameMaxspeed' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxspeed:forward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'maxspeed:backward')) and (mapcss._tag_capture(capture_tags, 2, tags, 'maxspeed')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_AllSameCycleway) and (mapcss._tag_capture(capture_tags, 0, tags, 'cycleway:left')) and (mapcss._tag_capture(capture_tags, 1, tags, 'cycleway:right')) and (mapcss._tag_capture(capture_tags, 2, tags, 'cycleway')))
+                try: match = (('AllSameCycleway' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'cycleway:left')) and (mapcss._tag_capture(capture_tags, 1, tags, 'cycleway:right')) and (mapcss._tag_capture(capture_tags, 2, tags, 'cycleway')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_AllSameSidewalk) and (mapcss._tag_capture(capture_tags, 0, tags, 'sidewalk:left')) and (mapcss._tag_capture(capture_tags, 1, tags, 'sidewalk:right')) and (mapcss._tag_capture(capture_tags, 2, tags, 'sidewalk')))
+                try: match = (('AllSameSidewalk' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'sidewalk:left')) and (mapcss._tag_capture(capture_tags, 1, tags, 'sidewalk:right')) and (mapcss._tag_capture(capture_tags, 2, tags, 'sidewalk')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("suspicious tag combination")
                 # throwWarning:tr("{0} and {1} together with {2} and conflicting values","{0.key}","{1.key}","{2.key}")
                 err.append({'class': 9001002, 'subclass': 321600037, 'text': mapcss.tr('{0} and {1} together with {2} and conflicting values', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # way["maxspeed:forward"][maxspeed][!"maxspeed:backward"]
-        # way["maxspeed:backward"][maxspeed][!"maxspeed:forward"]
-        # way["cycleway:left"][cycleway][!"cycleway:right"]
-        # way["cycleway:right"][cycleway][!"cycleway:left"]
-        # way["sidewalk:left"][sidewalk][!"sidewalk:right"]
-        # way["sidewalk:right"][sidewalk][!"sidewalk:left"]
+    # way["maxspeed:forward"][maxspeed][!"maxspeed:backward"]
+    # way["maxspeed:backward"][maxspeed][!"maxspeed:forward"]
+    # way["cycleway:left"][cycleway][!"cycleway:right"]
+    # way["cycleway:right"][cycleway][!"cycleway:left"]
+    # way["sidewalk:left"][sidewalk][!"sidewalk:right"]
+    # way["sidewalk:right"][sidewalk][!"sidewalk:left"]
+    def _way_rule_49(self, data, tags, nds, keys, err, sets):
         if ('cycleway' in keys and 'cycleway:left' in keys) or ('cycleway' in keys and 'cycleway:right' in keys) or ('maxspeed' in keys and 'maxspeed:backward' in keys) or ('maxspeed' in keys and 'maxspeed:forward' in keys) or ('sidewalk' in keys and 'sidewalk:left' in keys) or ('sidewalk' in keys and 'sidewalk:right' in keys):
             match = False
             if not match:
@@ -2748,8 +2879,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.key}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 1987260958, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[bridge][layer][layer<0][bridge!=no][location!=underground][indoor!=yes][!tunnel]
-        # way[tunnel][layer][layer>0][tunnel!=no][location!=overground][indoor!=yes][!bridge]
+    # way[bridge][layer][layer<0][bridge!=no][location!=underground][indoor!=yes][!tunnel]
+    # way[tunnel][layer][layer>0][tunnel!=no][location!=overground][indoor!=yes][!bridge]
+    def _way_rule_50(self, data, tags, nds, keys, err, sets):
         if ('bridge' in keys and 'layer' in keys) or ('layer' in keys and 'tunnel' in keys):
             match = False
             if not match:
@@ -2765,11 +2897,12 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.tag}","{1.tag}")
                 err.append({'class': 9001002, 'subclass': 1336318030, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[waterway][layer][layer=~/^(-1|-2|-3|-4|-5)$/][!tunnel][culvert!=yes][covered!=yes][pipeline!=yes][location!=underground][eval(waylength())>400]
-        # Part of rule not implemented
+    # way[waterway][layer][layer=~/^(-1|-2|-3|-4|-5)$/][!tunnel][culvert!=yes][covered!=yes][pipeline!=yes][location!=underground][eval(waylength())>400]
+    # Part of rule not implemented
 
-        # way[water][natural!~/water|bay|strait/][water!=intermittent][amenity!=lavoir]!:closed
-        # area[water][natural!~/water|bay|strait/][water!=intermittent][amenity!=lavoir]:closed
+    # way[water][natural!~/water|bay|strait/][water!=intermittent][amenity!=lavoir]!:closed
+    # area[water][natural!~/water|bay|strait/][water!=intermittent][amenity!=lavoir]:closed
+    def _way_rule_51(self, data, tags, nds, keys, err, sets):
         if ('water' in keys):
             match = False
             if not match:
@@ -2785,7 +2918,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.key}","{1.tag}")
                 err.append({'class': 9001001, 'subclass': 1901340680, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # area[golf=bunker][natural=beach]
+    # area[golf=bunker][natural=beach]
+    def _way_rule_52(self, data, tags, nds, keys, err, sets):
         if ('golf' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -2799,7 +2933,8 @@ class Josm_combinations(PluginMapCSS):
                 # suggestAlternative:"surface=sand"
                 err.append({'class': 9001002, 'subclass': 253392874, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[highway=~/^(motorway|motorway_link|trunk|trunk_link)$/]
+    # way[highway=~/^(motorway|motorway_link|trunk|trunk_link)$/]
+    def _way_rule_53(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -2808,51 +2943,53 @@ class Josm_combinations(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set MotorwayTrunk
-                set_MotorwayTrunk = True
-
-        # way.MotorwayTrunk[lanes][turn:lanes][tag(lanes)!=eval(count(split("|",tag("turn:lanes"))))]
-        # way.MotorwayTrunk[lanes][change:lanes][tag(lanes)!=eval(count(split("|",tag("change:lanes"))))]
-        # way.MotorwayTrunk[lanes][maxspeed:lanes][tag(lanes)!=eval(count(split("|",tag("maxspeed:lanes"))))]
-        # way.MotorwayTrunk[lanes][minspeed:lanes][tag(lanes)!=eval(count(split("|",tag("minspeed:lanes"))))]
-        # way.MotorwayTrunk[lanes][destination:lanes][tag(lanes)!=eval(count(split("|",tag("destination:lanes"))))]
-        # way.MotorwayTrunk[lanes][destination:ref:lanes][tag(lanes)!=eval(count(split("|",tag("destination:ref:lanes"))))]
-        # way.MotorwayTrunk[lanes][destination:symbol:lanes][tag(lanes)!=eval(count(split("|",tag("destination:symbol:lanes"))))]
+                sets.add('MotorwayTrunk')
+
+    # way.MotorwayTrunk[lanes][turn:lanes][tag(lanes)!=eval(count(split("|",tag("turn:lanes"))))]
+    # way.MotorwayTrunk[lanes][change:lanes][tag(lanes)!=eval(count(split("|",tag("change:lanes"))))]
+    # way.MotorwayTrunk[lanes][maxspeed:lanes][tag(lanes)!=eval(count(split("|",tag("maxspeed:lanes"))))]
+    # way.MotorwayTrunk[lanes][minspeed:lanes][tag(lanes)!=eval(count(split("|",tag("minspeed:lanes"))))]
+    # way.MotorwayTrunk[lanes][destination:lanes][tag(lanes)!=eval(count(split("|",tag("destination:lanes"))))]
+    # way.MotorwayTrunk[lanes][destination:ref:lanes][tag(lanes)!=eval(count(split("|",tag("destination:ref:lanes"))))]
+    # way.MotorwayTrunk[lanes][destination:symbol:lanes][tag(lanes)!=eval(count(split("|",tag("destination:symbol:lanes"))))]
+    def _way_rule_54(self, data, tags, nds, keys, err, sets):
         if ('change:lanes' in keys and 'lanes' in keys) or ('destination:lanes' in keys and 'lanes' in keys) or ('destination:ref:lanes' in keys and 'lanes' in keys) or ('destination:symbol:lanes' in keys and 'lanes' in keys) or ('lanes' in keys and 'maxspeed:lanes' in keys) or ('lanes' in keys and 'minspeed:lanes' in keys) or ('lanes' in keys and 'turn:lanes' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((set_MotorwayTrunk) and (mapcss._tag_capture(capture_tags, 1, tags, 'lanes')) and (mapcss._tag_capture(capture_tags, 2, tags, 'turn:lanes')) and (mapcss.tag(tags, 'lanes') != mapcss.count(mapcss.split('|', mapcss.tag(tags, 'turn:lanes')))))
+                try: match = (('MotorwayTrunk' in sets) and (mapcss._tag_capture(capture_tags, 1, tags, 'lanes')) and (mapcss._tag_capture(capture_tags, 2, tags, 'turn:lanes')) and (mapcss.tag(tags, 'lanes') != mapcss.count(mapcss.split('|', mapcss.tag(tags, 'turn:lanes')))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_MotorwayTrunk) and (mapcss._tag_capture(capture_tags, 1, tags, 'lanes')) and (mapcss._tag_capture(capture_tags, 2, tags, 'change:lanes')) and (mapcss.tag(tags, 'lanes') != mapcss.count(mapcss.split('|', mapcss.tag(tags, 'change:lanes')))))
+                try: match = (('MotorwayTrunk' in sets) and (mapcss._tag_capture(capture_tags, 1, tags, 'lanes')) and (mapcss._tag_capture(capture_tags, 2, tags, 'change:lanes')) and (mapcss.tag(tags, 'lanes') != mapcss.count(mapcss.split('|', mapcss.tag(tags, 'change:lanes')))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_MotorwayTrunk) and (mapcss._tag_capture(capture_tags, 1, tags, 'lanes')) and (mapcss._tag_capture(capture_tags, 2, tags, 'maxspeed:lanes')) and (mapcss.tag(tags, 'lanes') != mapcss.count(mapcss.split('|', mapcss.tag(tags, 'maxspeed:lanes')))))
+                try: match = (('MotorwayTrunk' in sets) and (mapcss._tag_capture(capture_tags, 1, tags, 'lanes')) and (mapcss._tag_capture(capture_tags, 2, tags, 'maxspeed:lanes')) and (mapcss.tag(tags, 'lanes') != mapcss.count(mapcss.split('|', mapcss.tag(tags, 'maxspeed:lanes')))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_MotorwayTrunk) and (mapcss._tag_capture(capture_tags, 1, tags, 'lanes')) and (mapcss._tag_capture(capture_tags, 2, tags, 'minspeed:lanes')) and (mapcss.tag(tags, 'lanes') != mapcss.count(mapcss.split('|', mapcss.tag(tags, 'minspeed:lanes')))))
+                try: match = (('MotorwayTrunk' in sets) and (mapcss._tag_capture(capture_tags, 1, tags, 'lanes')) and (mapcss._tag_capture(capture_tags, 2, tags, 'minspeed:lanes')) and (mapcss.tag(tags, 'lanes') != mapcss.count(mapcss.split('|', mapcss.tag(tags, 'minspeed:lanes')))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_MotorwayTrunk) and (mapcss._tag_capture(capture_tags, 1, tags, 'lanes')) and (mapcss._tag_capture(capture_tags, 2, tags, 'destination:lanes')) and (mapcss.tag(tags, 'lanes') != mapcss.count(mapcss.split('|', mapcss.tag(tags, 'destination:lanes')))))
+                try: match = (('MotorwayTrunk' in sets) and (mapcss._tag_capture(capture_tags, 1, tags, 'lanes')) and (mapcss._tag_capture(capture_tags, 2, tags, 'destination:lanes')) and (mapcss.tag(tags, 'lanes') != mapcss.count(mapcss.split('|', mapcss.tag(tags, 'destination:lanes')))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_MotorwayTrunk) and (mapcss._tag_capture(capture_tags, 1, tags, 'lanes')) and (mapcss._tag_capture(capture_tags, 2, tags, 'destination:ref:lanes')) and (mapcss.tag(tags, 'lanes') != mapcss.count(mapcss.split('|', mapcss.tag(tags, 'destination:ref:lanes')))))
+                try: match = (('MotorwayTrunk' in sets) and (mapcss._tag_capture(capture_tags, 1, tags, 'lanes')) and (mapcss._tag_capture(capture_tags, 2, tags, 'destination:ref:lanes')) and (mapcss.tag(tags, 'lanes') != mapcss.count(mapcss.split('|', mapcss.tag(tags, 'destination:ref:lanes')))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_MotorwayTrunk) and (mapcss._tag_capture(capture_tags, 1, tags, 'lanes')) and (mapcss._tag_capture(capture_tags, 2, tags, 'destination:symbol:lanes')) and (mapcss.tag(tags, 'lanes') != mapcss.count(mapcss.split('|', mapcss.tag(tags, 'destination:symbol:lanes')))))
+                try: match = (('MotorwayTrunk' in sets) and (mapcss._tag_capture(capture_tags, 1, tags, 'lanes')) and (mapcss._tag_capture(capture_tags, 2, tags, 'destination:symbol:lanes')) and (mapcss.tag(tags, 'lanes') != mapcss.count(mapcss.split('|', mapcss.tag(tags, 'destination:symbol:lanes')))))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("suspicious tag combination")
                 # throwWarning:tr("Different number of lanes in the keys {0} and {1}","{1.key}","{2.key}")
                 err.append({'class': 9001002, 'subclass': 32264269, 'text': mapcss.tr('Different number of lanes in the keys {0} and {1}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # way[highway][lanes][!lanes:forward][!lanes:backward][oneway!=yes][oneway!=-1][oneway!=reversible][highway!=motorway][junction!=roundabout][lanes>2][mod(tag(lanes),2)=1]
+    # way[highway][lanes][!lanes:forward][!lanes:backward][oneway!=yes][oneway!=-1][oneway!=reversible][highway!=motorway][junction!=roundabout][lanes>2][mod(tag(lanes),2)=1]
+    def _way_rule_55(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'lanes' in keys):
             match = False
             if not match:
@@ -2869,9 +3006,10 @@ class Josm_combinations(PluginMapCSS):
                 # assertNoMatch:"way highway=primary lanes=4"
                 err.append({'class': 9001001, 'subclass': 1503842400, 'text': mapcss.tr('street with odd number of {0}, but without {1} and {2} or {3}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'), mapcss._tag_uncapture(capture_tags, '{3.key}'), mapcss._tag_uncapture(capture_tags, '{4.key}'))})
 
-        # way[/^.*:lanes$/][!lanes][highway][!source:lanes]
-        # way[/^.*:lanes:(forward|backward|both_ways)$/][!lanes][highway]
-        # way[/^.*:lanes:both_ways$/][!lanes:both_ways][highway]
+    # way[/^.*:lanes$/][!lanes][highway][!source:lanes]
+    # way[/^.*:lanes:(forward|backward|both_ways)$/][!lanes][highway]
+    # way[/^.*:lanes:both_ways$/][!lanes:both_ways][highway]
+    def _way_rule_56(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -2894,7 +3032,8 @@ class Josm_combinations(PluginMapCSS):
                 # assertMatch:"way highway=primary turn:lanes=left|right"
                 err.append({'class': 9001001, 'subclass': 1407445006, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # area[boundary=administrative][landuse=residential]
+    # area[boundary=administrative][landuse=residential]
+    def _way_rule_57(self, data, tags, nds, keys, err, sets):
         if ('boundary' in keys and 'landuse' in keys):
             match = False
             if not match:
@@ -2906,7 +3045,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.tag}","{1.tag}")
                 err.append({'class': 9001002, 'subclass': 1711273436, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[highway=pedestrian][width][siunit_length(tag(width))<3]
+    # way[highway=pedestrian][width][siunit_length(tag(width))<3]
+    def _way_rule_58(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'width' in keys):
             match = False
             if not match:
@@ -2927,7 +3067,8 @@ class Josm_combinations(PluginMapCSS):
                     ['highway','footway']])
                 }})
 
-        # area[cemetery=sector][landuse=cemetery]
+    # area[cemetery=sector][landuse=cemetery]
+    def _way_rule_59(self, data, tags, nds, keys, err, sets):
         if ('cemetery' in keys and 'landuse' in keys):
             match = False
             if not match:
@@ -2939,7 +3080,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.tag}","{1.tag}")
                 err.append({'class': 9001002, 'subclass': 1139622431, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[highway=cycleway][cycleway=track]
+    # *[highway=cycleway][cycleway=track]
+    def _way_rule_60(self, data, tags, nds, keys, err, sets):
         if ('cycleway' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -2955,9 +3097,10 @@ class Josm_combinations(PluginMapCSS):
                     'cycleway'])
                 }})
 
-        # way[highway=path][!segregated][foot=designated][bicycle=designated]
-        # way[highway=footway][!segregated][bicycle=designated]
-        # way[highway=cycleway][!segregated][foot=designated]
+    # way[highway=path][!segregated][foot=designated][bicycle=designated]
+    # way[highway=footway][!segregated][bicycle=designated]
+    # way[highway=cycleway][!segregated][foot=designated]
+    def _way_rule_61(self, data, tags, nds, keys, err, sets):
         if ('bicycle' in keys and 'foot' in keys and 'highway' in keys) or ('bicycle' in keys and 'highway' in keys) or ('foot' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -2977,10 +3120,11 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("Combined foot- and cycleway without {0}.","{1.key}")
                 err.append({'class': 9001001, 'subclass': 130310293, 'text': mapcss.tr('Combined foot- and cycleway without {0}.', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[construction:building][!building][!construction]
-        # *[construction:highway][!highway][!construction]
-        # *[construction:railway][!railway][!construction]
-        # *[construction:landuse][!landuse][!construction]
+    # *[construction:building][!building][!construction]
+    # *[construction:highway][!highway][!construction]
+    # *[construction:railway][!railway][!construction]
+    # *[construction:landuse][!landuse][!construction]
+    def _way_rule_62(self, data, tags, nds, keys, err, sets):
         if ('construction:building' in keys) or ('construction:highway' in keys) or ('construction:landuse' in keys) or ('construction:railway' in keys):
             match = False
             if not match:
@@ -3013,10 +3157,11 @@ class Josm_combinations(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{1.key}=construction')).split('=', 1)])
                 }})
 
-        # *[building=construction]["construction:building"][!construction]
-        # *[highway=construction]["construction:highway"][!construction]
-        # *[railway=construction]["construction:railway"][!construction]
-        # *[landuse=construction]["construction:landuse"][!construction]
+    # *[building=construction]["construction:building"][!construction]
+    # *[highway=construction]["construction:highway"][!construction]
+    # *[railway=construction]["construction:railway"][!construction]
+    # *[landuse=construction]["construction:landuse"][!construction]
+    def _way_rule_63(self, data, tags, nds, keys, err, sets):
         if ('building' in keys and 'construction:building' in keys) or ('construction:highway' in keys and 'highway' in keys) or ('construction:landuse' in keys and 'landuse' in keys) or ('construction:railway' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -3047,10 +3192,11 @@ class Josm_combinations(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, 'construction={1.value}')).split('=', 1)])
                 }})
 
-        # *[building]["construction:building"][!construction][building!=construction]
-        # *[highway]["construction:highway"][!construction][highway!=construction]
-        # *[railway]["construction:railway"][!construction][railway!=construction]
-        # *[landuse]["construction:landuse"][!construction][landuse!=construction]
+    # *[building]["construction:building"][!construction][building!=construction]
+    # *[highway]["construction:highway"][!construction][highway!=construction]
+    # *[railway]["construction:railway"][!construction][railway!=construction]
+    # *[landuse]["construction:landuse"][!construction][landuse!=construction]
+    def _way_rule_64(self, data, tags, nds, keys, err, sets):
         if ('building' in keys and 'construction:building' in keys) or ('construction:highway' in keys and 'highway' in keys) or ('construction:landuse' in keys and 'landuse' in keys) or ('construction:railway' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -3077,10 +3223,11 @@ class Josm_combinations(PluginMapCSS):
                 # assertNoMatch:"way construction:building=house construction=house"
                 err.append({'class': 9001002, 'subclass': 164864338, 'text': mapcss.tr('{0} together with {1} and conflicting values plus no {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *["construction:building"][construction][construction:building!=*construction]
-        # *["construction:highway"][construction][construction:highway!=*construction]
-        # *["construction:railway"][construction][construction:railway!=*construction]
-        # *["construction:landuse"][construction][construction:landuse!=*construction]
+    # *["construction:building"][construction][construction:building!=*construction]
+    # *["construction:highway"][construction][construction:highway!=*construction]
+    # *["construction:railway"][construction][construction:railway!=*construction]
+    # *["construction:landuse"][construction][construction:landuse!=*construction]
+    def _way_rule_65(self, data, tags, nds, keys, err, sets):
         if ('construction' in keys and 'construction:building' in keys) or ('construction' in keys and 'construction:highway' in keys) or ('construction' in keys and 'construction:landuse' in keys) or ('construction' in keys and 'construction:railway' in keys):
             match = False
             if not match:
@@ -3106,10 +3253,11 @@ class Josm_combinations(PluginMapCSS):
                 # assertMatch:"way construction:building=house construction=office"
                 err.append({'class': 9001002, 'subclass': 1971600459, 'text': mapcss.tr('{0} together with {1} and conflicting values', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[highway][construction][construction!~/^(yes|minor|no)$/][highway!=construction]
-        # way[railway][construction][construction!~/^(yes|minor|no)$/][railway!=construction]
-        # area[building][construction][construction!~/^(yes|minor|no)$/][building!=construction]
-        # area[landuse][construction][construction!~/^(yes|minor|no)$/][landuse!=construction]
+    # way[highway][construction][construction!~/^(yes|minor|no)$/][highway!=construction]
+    # way[railway][construction][construction!~/^(yes|minor|no)$/][railway!=construction]
+    # area[building][construction][construction!~/^(yes|minor|no)$/][building!=construction]
+    # area[landuse][construction][construction!~/^(yes|minor|no)$/][landuse!=construction]
+    def _way_rule_66(self, data, tags, nds, keys, err, sets):
         if ('building' in keys and 'construction' in keys) or ('construction' in keys and 'highway' in keys) or ('construction' in keys and 'landuse' in keys) or ('construction' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -3133,8 +3281,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.tag}","{1.tag}")
                 err.append({'class': 9001002, 'subclass': 864644489, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[amenity=recycling][collection_times="24/7"][!opening_hours]
-        # *[amenity=recycling][collection_times][!opening_hours][collection_times=~/[a-z]-[A-Z].*[0-9]-[0-9]/]
+    # *[amenity=recycling][collection_times="24/7"][!opening_hours]
+    # *[amenity=recycling][collection_times][!opening_hours][collection_times=~/[a-z]-[A-Z].*[0-9]-[0-9]/]
+    def _way_rule_67(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'collection_times' in keys):
             match = False
             if not match:
@@ -3156,7 +3305,8 @@ class Josm_combinations(PluginMapCSS):
                     'collection_times'])
                 }})
 
-        # way[highway][crossing][highway=~/^(motorway|motorway_link|trunk|trunk_link|primary|primary_link|secondary|secondary_link|tertiary|tertiary_link|unclassified|residential|service|living_street)$/]
+    # way[highway][crossing][highway=~/^(motorway|motorway_link|trunk|trunk_link|primary|primary_link|secondary|secondary_link|tertiary|tertiary_link|unclassified|residential|service|living_street)$/]
+    def _way_rule_68(self, data, tags, nds, keys, err, sets):
         if ('crossing' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -3174,7 +3324,8 @@ class Josm_combinations(PluginMapCSS):
                     'crossing'])
                 }})
 
-        # *[amenity=recycling][!/^recycling:/][recycling_type!=centre]
+    # *[amenity=recycling][!/^recycling:/][recycling_type!=centre]
+    def _way_rule_69(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -3186,7 +3337,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.tag}","recycling:*")
                 err.append({'class': 9001001, 'subclass': 321354601, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), 'recycling:*')})
 
-        # *[source:addr][!/^addr:/]
+    # *[source:addr][!/^addr:/]
+    def _way_rule_70(self, data, tags, nds, keys, err, sets):
         if ('source:addr' in keys):
             match = False
             if not match:
@@ -3198,7 +3350,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.key}","addr:*")
                 err.append({'class': 9001001, 'subclass': 886065920, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'addr:*')})
 
-        # *[source:maxspeed][!/^maxspeed:?/]
+    # *[source:maxspeed][!/^maxspeed:?/]
+    def _way_rule_71(self, data, tags, nds, keys, err, sets):
         if ('source:maxspeed' in keys):
             match = False
             if not match:
@@ -3210,7 +3363,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1} or {2}","{0.key}","maxspeed","maxspeed:*")
                 err.append({'class': 9001001, 'subclass': 480030366, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'maxspeed', 'maxspeed:*')})
 
-        # *[man_made=communications_tower][height][siunit_length(tag(height))<75]
+    # *[man_made=communications_tower][height][siunit_length(tag(height))<75]
+    def _way_rule_72(self, data, tags, nds, keys, err, sets):
         if ('height' in keys and 'man_made' in keys):
             match = False
             if not match:
@@ -3223,8 +3377,9 @@ class Josm_combinations(PluginMapCSS):
                 # suggestAlternative:"man_made=tower + tower:type=communication + height"
                 err.append({'class': 9001002, 'subclass': 1533608671, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[fixme][count(split(" ",tag("fixme")))==1][has_tag_key(tag("fixme"))]
-        # *[FIXME][count(split(" ",tag("FIXME")))==1][has_tag_key(tag("FIXME"))]
+    # *[fixme][count(split(" ",tag("fixme")))==1][has_tag_key(tag("fixme"))]
+    # *[FIXME][count(split(" ",tag("FIXME")))==1][has_tag_key(tag("FIXME"))]
+    def _way_rule_73(self, data, tags, nds, keys, err, sets):
         if ('FIXME' in keys) or ('fixme' in keys):
             match = False
             if not match:
@@ -3245,8 +3400,9 @@ class Josm_combinations(PluginMapCSS):
                 # assertNoMatch:"way name=\"Florist Gump\""
                 err.append({'class': 9001002, 'subclass': 2092275873, 'text': mapcss.tr('{0} together with {1}. Is the fixme fixed?', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # way[highway][placement=transition][join_list("",uniq_list(tag_regex("^placement:.*$")))==transition]
-        # way[highway][!placement][/^placement:.*$/][join_list("",uniq_list(tag_regex("^placement:.*$")))==transition]
+    # way[highway][placement=transition][join_list("",uniq_list(tag_regex("^placement:.*$")))==transition]
+    # way[highway][!placement][/^placement:.*$/][join_list("",uniq_list(tag_regex("^placement:.*$")))==transition]
+    def _way_rule_74(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys) or ('highway' in keys and 'placement' in keys):
             match = False
             if not match:
@@ -3268,7 +3424,7 @@ class Josm_combinations(PluginMapCSS):
                 # assertMatch:"way highway=primary placement:backward=transition placement:forward=transition"
                 # assertNoMatch:"way highway=primary placement=middle_of:1 placement:backward=transition placement:forward=transition"
                 # assertMatch:"way highway=primary placement=transition placement:both_ways=transition"
-                set_PlacementTransitionWarning = True
+                sets.add('PlacementTransitionWarning')
                 err.append({'class': 9001005, 'subclass': 942326561, 'text': mapcss.tr('Use {0} only as value of {1}', 'transition', 'placement'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['placement','transition']]),
@@ -3278,27 +3434,28 @@ class Josm_combinations(PluginMapCSS):
                     'placement:forward'])
                 }})
 
-        # way[placement][/^placement:.*$/][highway]!.PlacementTransitionWarning
-        # way["placement:forward"]["placement:backward"][highway]!.PlacementTransitionWarning
-        # way["placement:forward"]["placement:both_ways"][highway]!.PlacementTransitionWarning
-        # way["placement:backward"]["placement:both_ways"][highway]!.PlacementTransitionWarning
+    # way[placement][/^placement:.*$/][highway]!.PlacementTransitionWarning
+    # way["placement:forward"]["placement:backward"][highway]!.PlacementTransitionWarning
+    # way["placement:forward"]["placement:both_ways"][highway]!.PlacementTransitionWarning
+    # way["placement:backward"]["placement:both_ways"][highway]!.PlacementTransitionWarning
+    def _way_rule_75(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'placement' in keys) or ('highway' in keys and 'placement:backward' in keys and 'placement:both_ways' in keys) or ('highway' in keys and 'placement:backward' in keys and 'placement:forward' in keys) or ('highway' in keys and 'placement:both_ways' in keys and 'placement:forward' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_PlacementTransitionWarning) and (mapcss._tag_capture(capture_tags, 0, tags, 'placement')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_57c5150b)) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway')))
+                try: match = (('PlacementTransitionWarning' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'placement')) and (mapcss._tag_capture(capture_tags, 1, tags, self.re_57c5150b)) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_PlacementTransitionWarning) and (mapcss._tag_capture(capture_tags, 0, tags, 'placement:forward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'placement:backward')) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway')))
+                try: match = (('PlacementTransitionWarning' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'placement:forward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'placement:backward')) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_PlacementTransitionWarning) and (mapcss._tag_capture(capture_tags, 0, tags, 'placement:forward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'placement:both_ways')) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway')))
+                try: match = (('PlacementTransitionWarning' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'placement:forward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'placement:both_ways')) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_PlacementTransitionWarning) and (mapcss._tag_capture(capture_tags, 0, tags, 'placement:backward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'placement:both_ways')) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway')))
+                try: match = (('PlacementTransitionWarning' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'placement:backward')) and (mapcss._tag_capture(capture_tags, 1, tags, 'placement:both_ways')) and (mapcss._tag_capture(capture_tags, 2, tags, 'highway')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("suspicious tag combination")
@@ -3308,7 +3465,8 @@ class Josm_combinations(PluginMapCSS):
                 # assertMatch:"way highway=primary placement=left_of:2 placement:forward=right_of:1"
                 err.append({'class': 9001002, 'subclass': 2100246844, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[footway][highway][footway=sidewalk][highway!~/^(path|footway|cycleway|construction|proposed)$/]
+    # way[footway][highway][footway=sidewalk][highway!~/^(path|footway|cycleway|construction|proposed)$/]
+    def _way_rule_76(self, data, tags, nds, keys, err, sets):
         if ('footway' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -3324,7 +3482,8 @@ class Josm_combinations(PluginMapCSS):
                 # suggestAlternative:"sidewalk=separate"
                 err.append({'class': 9001002, 'subclass': 1490104380, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[footway][highway][footway!=sidewalk][highway!~/^(path|footway|cycleway|construction|proposed)$/]
+    # way[footway][highway][footway!=sidewalk][highway!~/^(path|footway|cycleway|construction|proposed)$/]
+    def _way_rule_77(self, data, tags, nds, keys, err, sets):
         if ('footway' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -3336,8 +3495,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.tag}","{1.tag}")
                 err.append({'class': 9001002, 'subclass': 1488812195, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[footway][!highway][!/:highway$/]
-        # way[cycleway][!highway][!/:highway$/]
+    # way[footway][!highway][!/:highway$/]
+    # way[cycleway][!highway][!/:highway$/]
+    def _way_rule_78(self, data, tags, nds, keys, err, sets):
         if ('cycleway' in keys) or ('footway' in keys):
             match = False
             if not match:
@@ -3354,7 +3514,8 @@ class Josm_combinations(PluginMapCSS):
                 # assertNoMatch:"way footway=sidewalk abandoned:highway=unclassified"
                 err.append({'class': 9001001, 'subclass': 1698700242, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[bicycle][/^cycleway(:|$)/][!/^bicycle:/][bicycle=~/^(no|use_sidepath)$/][/^cycleway(:|$)/!~/^(no|none|separate)$/]
+    # way[bicycle][/^cycleway(:|$)/][!/^bicycle:/][bicycle=~/^(no|use_sidepath)$/][/^cycleway(:|$)/!~/^(no|none|separate)$/]
+    def _way_rule_79(self, data, tags, nds, keys, err, sets):
         if ('bicycle' in keys):
             match = False
             if not match:
@@ -3375,8 +3536,9 @@ class Josm_combinations(PluginMapCSS):
                 # assertNoMatch:"way highway=residential bicycle=use_sidepath"
                 err.append({'class': 9001002, 'subclass': 340613033, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[highway=living_street][maxspeed][maxspeed=~/mph/][get(split(" ",tag(maxspeed)),0)>15]
-        # way[highway=living_street][maxspeed][maxspeed!~/mph/][get(split(" ",tag(maxspeed)),0)>20]
+    # way[highway=living_street][maxspeed][maxspeed=~/mph/][get(split(" ",tag(maxspeed)),0)>15]
+    # way[highway=living_street][maxspeed][maxspeed!~/mph/][get(split(" ",tag(maxspeed)),0)>20]
+    def _way_rule_80(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'maxspeed' in keys):
             match = False
             if not match:
@@ -3398,7 +3560,8 @@ class Josm_combinations(PluginMapCSS):
                 # assertNoMatch:"way highway=living_street"
                 err.append({'class': 9001002, 'subclass': 1040857321, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[piste:type=nordic][!piste:grooming]
+    # way[piste:type=nordic][!piste:grooming]
+    def _way_rule_81(self, data, tags, nds, keys, err, sets):
         if ('piste:type' in keys):
             match = False
             if not match:
@@ -3412,10 +3575,11 @@ class Josm_combinations(PluginMapCSS):
                 # assertMatch:"way piste:type=nordic"
                 err.append({'class': 9001001, 'subclass': 716854348, 'text': mapcss.tr('No grooming defined for {0} skiing, add {1}', 'nordic', 'piste:grooming=')})
 
-        # way[piste:type=~/^downhill|nordic|skitour$/][!piste:difficulty][count(parent_tags("piste:difficulty"))==0]
-        # Part of rule not implemented
+    # way[piste:type=~/^downhill|nordic|skitour$/][!piste:difficulty][count(parent_tags("piste:difficulty"))==0]
+    # Part of rule not implemented
 
-        # *[voltage:primary][voltage:secondary][transformer=generator][tag("voltage:secondary")<tag("voltage:primary")]
+    # *[voltage:primary][voltage:secondary][transformer=generator][tag("voltage:secondary")<tag("voltage:primary")]
+    def _way_rule_82(self, data, tags, nds, keys, err, sets):
         if ('transformer' in keys and 'voltage:primary' in keys and 'voltage:secondary' in keys):
             match = False
             if not match:
@@ -3427,8 +3591,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} is lower than {1} on {2}.","{1.key}","{0.key}","{2.tag}")
                 err.append({'class': 9001002, 'subclass': 1175862429, 'text': mapcss.tr('{0} is lower than {1} on {2}.', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # area[/^(building|building:part)$/][height][min_height][siunit_length(tag(height))<=siunit_length(tag(min_height))]
-        # area[/^(building|building:part)$/][building:levels][building:min_level][tag("building:levels")<=tag("building:min_level")]
+    # area[/^(building|building:part)$/][height][min_height][siunit_length(tag(height))<=siunit_length(tag(min_height))]
+    # area[/^(building|building:part)$/][building:levels][building:min_level][tag("building:levels")<=tag("building:min_level")]
+    def _way_rule_83(self, data, tags, nds, keys, err, sets):
         if ('building:levels' in keys and 'building:min_level' in keys) or ('height' in keys and 'min_height' in keys):
             match = False
             if not match:
@@ -3444,10 +3609,11 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} is lower or equal to {1} on {2}","{1.key}","{2.key}","{0.key}")
                 err.append({'class': 9001002, 'subclass': 1399744513, 'text': mapcss.tr('{0} is lower or equal to {1} on {2}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'), mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[cycleway:right][cycleway:right!=lane][cycleway:right!=separate][/^cycleway(:right|:both|):buffer/]
-        # way[cycleway:left][cycleway:left!=lane][cycleway:left!=separate][/^cycleway(:left|:both|):buffer/]
-        # way[cycleway:both][cycleway:both!=lane][cycleway:both!=separate][/^cycleway(:right|:left|:both|):buffer/]
-        # way[cycleway][cycleway!=lane][cycleway!=separate][/^cycleway(:right|:left|:both|):buffer/]
+    # way[cycleway:right][cycleway:right!=lane][cycleway:right!=separate][/^cycleway(:right|:both|):buffer/]
+    # way[cycleway:left][cycleway:left!=lane][cycleway:left!=separate][/^cycleway(:left|:both|):buffer/]
+    # way[cycleway:both][cycleway:both!=lane][cycleway:both!=separate][/^cycleway(:right|:left|:both|):buffer/]
+    # way[cycleway][cycleway!=lane][cycleway!=separate][/^cycleway(:right|:left|:both|):buffer/]
+    def _way_rule_84(self, data, tags, nds, keys, err, sets):
         if ('cycleway' in keys) or ('cycleway:both' in keys) or ('cycleway:left' in keys) or ('cycleway:right' in keys):
             match = False
             if not match:
@@ -3483,10 +3649,11 @@ class Josm_combinations(PluginMapCSS):
                 # assertMatch:"way cycleway=shared_busway cycleway:buffer=no"
                 err.append({'class': 9001002, 'subclass': 89219844, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'))})
 
-        # way[cycleway:right=separate][/^cycleway(:right|:both):./]
-        # way[cycleway:left=separate][/^cycleway(:left|:both):./]
-        # way[cycleway:both=separate][/^cycleway(:right|:left|:both):./]
-        # way[cycleway=separate][/^cycleway(:right|:left|:both):./]
+    # way[cycleway:right=separate][/^cycleway(:right|:both):./]
+    # way[cycleway:left=separate][/^cycleway(:left|:both):./]
+    # way[cycleway:both=separate][/^cycleway(:right|:left|:both):./]
+    # way[cycleway=separate][/^cycleway(:right|:left|:both):./]
+    def _way_rule_85(self, data, tags, nds, keys, err, sets):
         if ('cycleway' in keys) or ('cycleway:both' in keys) or ('cycleway:left' in keys) or ('cycleway:right' in keys):
             match = False
             if not match:
@@ -3524,10 +3691,11 @@ class Josm_combinations(PluginMapCSS):
                 # assertNoMatch:"way cycleway=separate"
                 err.append({'class': 9001002, 'subclass': 1546310512, 'text': mapcss.tr('{0} together with {1}. Remove {1}.', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[/^cycleway:right:/][!cycleway:right][!cycleway:both][!cycleway]
-        # way[/^cycleway:left:/][!cycleway:left][!cycleway:both][!cycleway]
-        # way[/^cycleway:both:/][!cycleway:both][!cycleway][!cycleway:left][!cycleway:right]
-        # way[/^cycleway(?!:right|:left|:both|:lanes):/][!cycleway][!cycleway:both][!cycleway:left][!cycleway:right][segregated!=yes]
+    # way[/^cycleway:right:/][!cycleway:right][!cycleway:both][!cycleway]
+    # way[/^cycleway:left:/][!cycleway:left][!cycleway:both][!cycleway]
+    # way[/^cycleway:both:/][!cycleway:both][!cycleway][!cycleway:left][!cycleway:right]
+    # way[/^cycleway(?!:right|:left|:both|:lanes):/][!cycleway][!cycleway:both][!cycleway:left][!cycleway:right][segregated!=yes]
+    def _way_rule_86(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -3571,45 +3739,136 @@ class Josm_combinations(PluginMapCSS):
                 # assertNoMatch:"way highway=primary oneway=yes bicycle:lanes=no|designated|yes cycleway:lanes=|lane|no"
                 err.append({'class': 9001001, 'subclass': 1754047217, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['surface']),
+        (_way_rule_1, ['surface']),
+        (_way_rule_2, ['border_type', 'building:min_level', 'canal', 'detail', 'eddy_current_brake', 'electrified', 'etcs', 'gauge', 'grade_of_track', 'have_riverbank', 'junction', 'kursbuchstrecke', 'length_unit', 'living_street', 'lzb', 'maintenance', 'median', 'min_height', 'motorroad', 'old_railway_operator', 'operating_procedure', 'piste:difficulty', 'place', 'pzb', 'sac_scale', 'sidewalk', 'source:addr:housenumber', 'source:addr:postcode', 'source:bicycle', 'source:bridge', 'source:building', 'source:date', 'source:designation', 'source:ele', 'source:height', 'source:hgv', 'source:highway', 'source:housenumber', 'source:lanes', 'source:lit', 'source:maxaxleload', 'source:maxspeed:backward', 'source:maxspeed:forward', 'source:name', 'source:old_name', 'source:population', 'source:postal_code', 'source:postcode', 'source:ref', 'source:ref:INSEE', 'source:surface', 'step_count', 'structure_gauge', 'tilting_technology', 'track_class', 'tracks', 'tracktype', 'traffic_mode', 'trail_visibility', 'transformer', 'trolley_wire', 'workrules', 'zip_left', 'zip_right']),
+        (_way_rule_3, ['archaeological_site', 'artwork_type', 'bunker_type', 'castle_type', 'cutline', 'fence_type', 'generator:method', 'generator:source', 'generator:type', 'information', 'parking', 'recycling_type', 'shelter_type', 'zoo']),
+        (_way_rule_4, ['bridge:movable', 'reservoir_type', 'substation', 'waterway']),
+        (_way_rule_5, ['iata', 'icao']),
+        (_way_rule_6, ['pump_mechanism']),
+        (_way_rule_7, ['actuator', 'aeroway', 'amenity', 'boundary', 'building', 'highway', 'landuse', 'leisure', 'man_made', 'mechanical_driver', 'office', 'power', 'railway', 'tourism']),
+        (_way_rule_8, ['bridge:structure', 'segregated']),
+        (_way_rule_9, ['tunnel']),
+        (_way_rule_10, ['usage']),
+        (_way_rule_11, ['amenity']),
+        (_way_rule_12, ['smoothness']),
+        (_way_rule_13, ['boat', 'intermittent']),
+        (_way_rule_14, ['snowplowing']),
+        (_way_rule_15, ['toll']),
+        (_way_rule_16, ['actuator', 'addr:housenumber', 'amenity', 'frequency', 'handle', 'internet_access', 'name', 'noref', 'oneway', 'power']),
+        (_way_rule_17, ['amenity', 'barrier', 'bicycle', 'bridge', 'building', 'construction', 'foot', 'highway', 'man_made', 'surface']),
+        (_way_rule_18, ['addr:place', 'building']),
+        (_way_rule_19, ['highway']),
+        (_way_rule_20, ['electrified']),
+        (_way_rule_21, ['bridge']),
+        (_way_rule_22, ['bridge']),
+        (_way_rule_23, ['access', 'area', 'lanes', 'layer', 'level', 'lit', 'name', 'ref', 'surface']),
+        (_way_rule_24, ['area', 'name']),
+        (_way_rule_25, ['tourism']),
+        (_way_rule_26, ['name']),
+        (_way_rule_27, ['boundary', 'highway', 'place']),
+        (_way_rule_28, ['addr:postcode']),
+        (_way_rule_29, ['addr:postcode']),
+        (_way_rule_30, ['addr:postcode']),
+        (_way_rule_31, ['addr:postcode']),
+        (_way_rule_32, ['addr:postcode']),
+        (_way_rule_33, ['cycleway']),
+        (_way_rule_34, ['bridge', 'incline', 'lanes', 'maxspeed', 'oneway', 'psv', 'tunnel', 'width']),
+        (_way_rule_35, ['barrier', 'building', 'highway']),
+        (_way_rule_36, ['leisure']),
+        (_way_rule_37, ['sport']),
+        (_way_rule_38, ['building:levels', 'usage']),
+        (_way_rule_39, None),
+        (_way_rule_40, ['alt_name']),
+        (_way_rule_41, ['destination']),
+        (_way_rule_42, ['maxspeed:backward']),
+        (_way_rule_43, ['maxspeed']),
+        (_way_rule_44, ['cycleway:left']),
+        (_way_rule_45, ['cycleway']),
+        (_way_rule_46, ['sidewalk:left']),
+        (_way_rule_47, ['sidewalk']),
+        (_way_rule_48, ['cycleway', 'maxspeed', 'sidewalk']),
+        (_way_rule_49, ['cycleway', 'maxspeed', 'sidewalk']),
+        (_way_rule_50, ['bridge', 'layer']),
+        (_way_rule_51, ['water']),
+        (_way_rule_52, ['golf']),
+        (_way_rule_53, ['highway']),
+        (_way_rule_54, ['change:lanes', 'destination:lanes', 'destination:ref:lanes', 'destination:symbol:lanes', 'lanes']),
+        (_way_rule_55, ['highway']),
+        (_way_rule_56, ['highway']),
+        (_way_rule_57, ['boundary']),
+        (_way_rule_58, ['highway']),
+        (_way_rule_59, ['cemetery']),
+        (_way_rule_60, ['cycleway']),
+        (_way_rule_61, ['bicycle', 'foot']),
+        (_way_rule_62, ['construction:building', 'construction:highway', 'construction:landuse', 'construction:railway']),
+        (_way_rule_63, ['building', 'construction:highway', 'construction:landuse', 'construction:railway']),
+        (_way_rule_64, ['building', 'construction:highway', 'construction:landuse', 'construction:railway']),
+        (_way_rule_65, ['construction']),
+        (_way_rule_66, ['building', 'construction']),
+        (_way_rule_67, ['amenity']),
+        (_way_rule_68, ['crossing']),
+        (_way_rule_69, ['amenity']),
+        (_way_rule_70, ['source:addr']),
+        (_way_rule_71, ['source:maxspeed']),
+        (_way_rule_72, ['height']),
+        (_way_rule_73, ['FIXME', 'fixme']),
+        (_way_rule_74, ['highway']),
+        (_way_rule_75, ['highway']),
+        (_way_rule_76, ['footway']),
+        (_way_rule_77, ['footway']),
+        (_way_rule_78, ['cycleway', 'footway']),
+        (_way_rule_79, ['bicycle']),
+        (_way_rule_80, ['highway']),
+        (_way_rule_81, ['piste:type']),
+        (_way_rule_82, ['transformer']),
+        (_way_rule_83, ['building:levels', 'height']),
+        (_way_rule_84, ['cycleway', 'cycleway:both', 'cycleway:left', 'cycleway:right']),
+        (_way_rule_85, ['cycleway', 'cycleway:both', 'cycleway:left', 'cycleway:right']),
+        (_way_rule_86, None),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
-        set_AllSameCycleway = set_AllSameMaxspeed = set_AllSameSidewalk = set_MotorwayTrunk = set_PlacementTransitionWarning = set_TunnelCulvertWithoutWaterway = set_fully_paved_surface = set_only_one_tag = set_unpaved_surface = False
-
-        # *[border_type][!boundary]
-        # *[piste:difficulty][!piste:type]
-        # *[place][!name][place!=islet][place!=plot][noname!=yes]
-        # *[transformer][!power]
-        # *[source:date][!source]
-        # *[source:name][!name][noname!=yes]
-        # *[source:maxspeed:forward][!maxspeed:forward][!maxspeed]
-        # *[source:maxspeed:backward][!maxspeed:backward][!maxspeed]
-        # *[source:building][!building]
-        # *[source:ref][!ref][noref!=yes]
-        # *[source:population][!population]
-        # *[source:postal_code][!postal_code]
-        # *[source:ele][!ele]
-        # *[source:ref:INSEE][!ref:INSEE]
-        # *[source:lit][!lit]
-        # *[source:hgv][!hgv]
-        # *[source:highway][!highway]
-        # *[source:maxaxleload][!maxaxleload]
-        # *[source:surface][!surface]
-        # *[source:bridge][!bridge]
-        # *[source:old_name][!old_name]
-        # *[source:bicycle][!bicycle]
-        # *[source:designation][!designation]
-        # *[source:height][!height]
-        # *[source:lanes][!lanes]
-        # *[source:postcode][!addr:postcode]
-        # *[source:housenumber][!addr:housenumber]
-        # *[source:addr:postcode][!addr:postcode]
-        # *[source:addr:housenumber][!addr:housenumber]
-        # area[min_height][!height][/^(building|building:part)$/]
-        # area[building:min_level][!building:levels][/^(building|building:part)$/]
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
+
+    # *[border_type][!boundary]
+    # *[piste:difficulty][!piste:type]
+    # *[place][!name][place!=islet][place!=plot][noname!=yes]
+    # *[transformer][!power]
+    # *[source:date][!source]
+    # *[source:name][!name][noname!=yes]
+    # *[source:maxspeed:forward][!maxspeed:forward][!maxspeed]
+    # *[source:maxspeed:backward][!maxspeed:backward][!maxspeed]
+    # *[source:building][!building]
+    # *[source:ref][!ref][noref!=yes]
+    # *[source:population][!population]
+    # *[source:postal_code][!postal_code]
+    # *[source:ele][!ele]
+    # *[source:ref:INSEE][!ref:INSEE]
+    # *[source:lit][!lit]
+    # *[source:hgv][!hgv]
+    # *[source:highway][!highway]
+    # *[source:maxaxleload][!maxaxleload]
+    # *[source:surface][!surface]
+    # *[source:bridge][!bridge]
+    # *[source:old_name][!old_name]
+    # *[source:bicycle][!bicycle]
+    # *[source:designation][!designation]
+    # *[source:height][!height]
+    # *[source:lanes][!lanes]
+    # *[source:postcode][!addr:postcode]
+    # *[source:housenumber][!addr:housenumber]
+    # *[source:addr:postcode][!addr:postcode]
+    # *[source:addr:housenumber][!addr:housenumber]
+    # area[min_height][!height][/^(building|building:part)$/]
+    # area[building:min_level][!building:levels][/^(building|building:part)$/]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('border_type' in keys) or ('building:min_level' in keys and 'type' in keys) or ('min_height' in keys and 'type' in keys) or ('piste:difficulty' in keys) or ('place' in keys) or ('source:addr:housenumber' in keys) or ('source:addr:postcode' in keys) or ('source:bicycle' in keys) or ('source:bridge' in keys) or ('source:building' in keys) or ('source:date' in keys) or ('source:designation' in keys) or ('source:ele' in keys) or ('source:height' in keys) or ('source:hgv' in keys) or ('source:highway' in keys) or ('source:housenumber' in keys) or ('source:lanes' in keys) or ('source:lit' in keys) or ('source:maxaxleload' in keys) or ('source:maxspeed:backward' in keys) or ('source:maxspeed:forward' in keys) or ('source:name' in keys) or ('source:old_name' in keys) or ('source:population' in keys) or ('source:postal_code' in keys) or ('source:postcode' in keys) or ('source:ref' in keys) or ('source:ref:INSEE' in keys) or ('source:surface' in keys) or ('transformer' in keys):
             match = False
             if not match:
@@ -3741,18 +4000,19 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.key}","{1.key}")
                 err.append({'class': 9001001, 'subclass': 845575979, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[generator:source][power!=generator]
-        # *[generator:method][power!=generator]
-        # *[generator:type][power!=generator]
-        # *[recycling_type][amenity!=recycling]
-        # *[information][tourism!=information]
-        # *[shelter_type][amenity!=shelter]
-        # *[archaeological_site][historic!=archaeological_site]
-        # *[artwork_type][tourism!=artwork][exhibit!=artwork]
-        # *[castle_type][historic!=castle]
-        # *[parking][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking)$/][parking!=yes][parking!=no]
-        # *[zoo][tourism!=zoo]
-        # *[bunker_type][military!=bunker]
+    # *[generator:source][power!=generator]
+    # *[generator:method][power!=generator]
+    # *[generator:type][power!=generator]
+    # *[recycling_type][amenity!=recycling]
+    # *[information][tourism!=information]
+    # *[shelter_type][amenity!=shelter]
+    # *[archaeological_site][historic!=archaeological_site]
+    # *[artwork_type][tourism!=artwork][exhibit!=artwork]
+    # *[castle_type][historic!=castle]
+    # *[parking][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking)$/][parking!=yes][parking!=no]
+    # *[zoo][tourism!=zoo]
+    # *[bunker_type][military!=bunker]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('archaeological_site' in keys) or ('artwork_type' in keys) or ('bunker_type' in keys) or ('castle_type' in keys) or ('generator:method' in keys) or ('generator:source' in keys) or ('generator:type' in keys) or ('information' in keys) or ('parking' in keys) or ('recycling_type' in keys) or ('shelter_type' in keys) or ('zoo' in keys):
             match = False
             if not match:
@@ -3808,9 +4068,10 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.key}","{1.tag}")
                 err.append({'class': 9001001, 'subclass': 1921138977, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[bridge:movable][bridge!=movable][man_made!=bridge]
-        # *[substation][power!=substation][pipeline!=substation]
-        # *[reservoir_type][landuse!=reservoir][water!=reservoir]
+    # *[bridge:movable][bridge!=movable][man_made!=bridge]
+    # *[substation][power!=substation][pipeline!=substation]
+    # *[reservoir_type][landuse!=reservoir][water!=reservoir]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('bridge:movable' in keys) or ('reservoir_type' in keys) or ('substation' in keys):
             match = False
             if not match:
@@ -3830,8 +4091,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1} or {2}","{0.key}","{1.tag}","{2.tag}")
                 err.append({'class': 9001001, 'subclass': 1195794842, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # *[iata][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
-        # *[icao][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
+    # *[iata][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
+    # *[icao][aeroway!=aerodrome][aeroway!=heliport][aeroway!=helipad]
+    def _relation_rule_3(self, data, tags, members, keys, err, sets):
         if ('iata' in keys) or ('icao' in keys):
             match = False
             if not match:
@@ -3847,7 +4109,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2} or {3}","{0.key}","{1.tag}","{2.tag}","{3.tag}")
                 err.append({'class': 9001001, 'subclass': 1908755652, 'text': mapcss.tr('{0} without {1}, {2} or {3}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'))})
 
-        # *[pump_mechanism][man_made!=pump][man_made!=windpump][man_made!=water_well][man_made!=petroleum_well]
+    # *[pump_mechanism][man_made!=pump][man_made!=windpump][man_made!=water_well][man_made!=petroleum_well]
+    def _relation_rule_4(self, data, tags, members, keys, err, sets):
         if ('pump_mechanism' in keys):
             match = False
             if not match:
@@ -3859,25 +4122,26 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2}, {3} or {4}","{0.key}","{1.tag}","{2.tag}","{3.tag}","{4.tag}")
                 err.append({'class': 9001001, 'subclass': 1271875329, 'text': mapcss.tr('{0} without {1}, {2}, {3} or {4}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'), mapcss._tag_uncapture(capture_tags, '{4.tag}'))})
 
-        # *[actuator=manual][!handle]
-        # *[mechanical_driver=manual][!handle]
-        # relation[boundary=administrative][!admin_level]
-        # relation[route=bicycle][!network][type=route]
-        # relation[route=hiking][!network][type=route]
-        # relation[route=foot][!network][type=route]
-        # relation[route=horse][!network][type=route]
-        # relation[route=piste][!piste:type][type=route]
-        # relation[route=ski][!piste:type][type=route]
-        # *[tourism=information][!information]
-        # *[leisure=pitch][!sport]
-        # *[aeroway=terminal][!building]
-        # *[office=government][!government]
-        # *[power=generator][!generator:source]
-        # *[amenity=social_facility][!social_facility]
-        # *[amenity=place_of_worship][!religion]
-        # *[man_made=tower][!tower:type]
-        # area[building=construction][!construction][!construction:building]
-        # area[landuse=construction][!construction][!construction:landuse]
+    # *[actuator=manual][!handle]
+    # *[mechanical_driver=manual][!handle]
+    # relation[boundary=administrative][!admin_level]
+    # relation[route=bicycle][!network][type=route]
+    # relation[route=hiking][!network][type=route]
+    # relation[route=foot][!network][type=route]
+    # relation[route=horse][!network][type=route]
+    # relation[route=piste][!piste:type][type=route]
+    # relation[route=ski][!piste:type][type=route]
+    # *[tourism=information][!information]
+    # *[leisure=pitch][!sport]
+    # *[aeroway=terminal][!building]
+    # *[office=government][!government]
+    # *[power=generator][!generator:source]
+    # *[amenity=social_facility][!social_facility]
+    # *[amenity=place_of_worship][!religion]
+    # *[man_made=tower][!tower:type]
+    # area[building=construction][!construction][!construction:building]
+    # area[landuse=construction][!construction][!construction:landuse]
+    def _relation_rule_5(self, data, tags, members, keys, err, sets):
         if ('actuator' in keys) or ('aeroway' in keys) or ('amenity' in keys) or ('boundary' in keys) or ('building' in keys and 'type' in keys) or ('landuse' in keys and 'type' in keys) or ('leisure' in keys) or ('man_made' in keys) or ('mechanical_driver' in keys) or ('office' in keys) or ('power' in keys) or ('route' in keys and 'type' in keys) or ('tourism' in keys):
             match = False
             if not match:
@@ -3961,7 +4225,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.tag}","{1.key}")
                 err.append({'class': 9001001, 'subclass': 1165316570, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[segregated][!highway][railway!=crossing]
+    # *[segregated][!highway][railway!=crossing]
+    def _relation_rule_6(self, data, tags, members, keys, err, sets):
         if ('segregated' in keys):
             match = False
             if not match:
@@ -3973,7 +4238,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1} or {2}","{0.key}","{1.key}","{2.tag}")
                 err.append({'class': 9001001, 'subclass': 413539177, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # *[amenity=recycling][recycling_type!=container][recycling_type!=centre]
+    # *[amenity=recycling][recycling_type!=container][recycling_type!=centre]
+    def _relation_rule_7(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -3985,7 +4251,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1} or {2}","{0.tag}","{1.tag}","{2.tag}")
                 err.append({'class': 9001001, 'subclass': 747056792, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # *[smoothness][!highway][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking|bicycle_parking)$/][barrier!=kerb][!kerb]
+    # *[smoothness][!highway][amenity!~/^(parking|parking_space|parking_entrance|motorcycle_parking|bicycle_parking)$/][barrier!=kerb][!kerb]
+    def _relation_rule_8(self, data, tags, members, keys, err, sets):
         if ('smoothness' in keys):
             match = False
             if not match:
@@ -3997,8 +4264,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2}, {3} or {4}","{0.key}","{1.key}","{2.tag}","{3.tag}","{4.key}")
                 err.append({'class': 9001001, 'subclass': 1922079652, 'text': mapcss.tr('{0} without {1}, {2}, {3} or {4}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'), mapcss._tag_uncapture(capture_tags, '{4.key}'))})
 
-        # *[intermittent][!waterway][natural!~/^(water|spring)$/][landuse!~/^(basin|reservoir)$/][ford!~/^(yes|stepping_stones)$/]
-        # *[boat][!waterway][natural!=water][landuse!~/^(basin|reservoir)$/][ford!=yes]
+    # *[intermittent][!waterway][natural!~/^(water|spring)$/][landuse!~/^(basin|reservoir)$/][ford!~/^(yes|stepping_stones)$/]
+    # *[boat][!waterway][natural!=water][landuse!~/^(basin|reservoir)$/][ford!=yes]
+    def _relation_rule_9(self, data, tags, members, keys, err, sets):
         if ('boat' in keys) or ('intermittent' in keys):
             match = False
             if not match:
@@ -4014,7 +4282,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2}, {3} or {4}","{0.key}","{1.key}","{2.tag}","{3.tag}","{4.tag}")
                 err.append({'class': 9001001, 'subclass': 1547975047, 'text': mapcss.tr('{0} without {1}, {2}, {3} or {4}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'), mapcss._tag_uncapture(capture_tags, '{4.tag}'))})
 
-        # *[snowplowing][!highway][!amenity][!leisure]
+    # *[snowplowing][!highway][!amenity][!leisure]
+    def _relation_rule_10(self, data, tags, members, keys, err, sets):
         if ('snowplowing' in keys):
             match = False
             if not match:
@@ -4026,7 +4295,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2} or {3}","{0.key}","{1.key}","{2.key}","{3.key}")
                 err.append({'class': 9001001, 'subclass': 585636657, 'text': mapcss.tr('{0} without {1}, {2} or {3}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'), mapcss._tag_uncapture(capture_tags, '{3.key}'))})
 
-        # *[toll][!highway][!barrier][route!~/^(ferry|road)$/]
+    # *[toll][!highway][!barrier][route!~/^(ferry|road)$/]
+    def _relation_rule_11(self, data, tags, members, keys, err, sets):
         if ('toll' in keys):
             match = False
             if not match:
@@ -4038,18 +4308,19 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}, {2} or {3}","{0.key}","{1.key}","{2.key}","{3.tag}")
                 err.append({'class': 9001001, 'subclass': 1689494174, 'text': mapcss.tr('{0} without {1}, {2} or {3}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'), mapcss._tag_uncapture(capture_tags, '{3.tag}'))})
 
-        # *[amenity=marketplace][highway]
-        # *[power=plant][/^generator:/]
-        # *[power=generator][/^plant:/]
-        # *[power=plant][voltage]
-        # *[power=plant][frequency]
-        # *[internet_access=no][internet_access:fee]
-        # *[amenity=vending_machine][shop]
-        # *[noname?][name]
-        # *[noref?][ref]
-        # *[nohousenumber?][addr:housenumber]
-        # *[actuator][handle][actuator!~/(^|;)manual(;|$)/]
-        # *[mechanical_driver][handle][mechanical_driver!~/(^|;)manual(;|$)/]
+    # *[amenity=marketplace][highway]
+    # *[power=plant][/^generator:/]
+    # *[power=generator][/^plant:/]
+    # *[power=plant][voltage]
+    # *[power=plant][frequency]
+    # *[internet_access=no][internet_access:fee]
+    # *[amenity=vending_machine][shop]
+    # *[noname?][name]
+    # *[noref?][ref]
+    # *[nohousenumber?][addr:housenumber]
+    # *[actuator][handle][actuator!~/(^|;)manual(;|$)/]
+    # *[mechanical_driver][handle][mechanical_driver!~/(^|;)manual(;|$)/]
+    def _relation_rule_12(self, data, tags, members, keys, err, sets):
         if ('actuator' in keys and 'handle' in keys) or ('addr:housenumber' in keys and 'nohousenumber' in keys) or ('amenity' in keys and 'highway' in keys) or ('amenity' in keys and 'shop' in keys) or ('frequency' in keys and 'power' in keys) or ('handle' in keys and 'mechanical_driver' in keys) or ('internet_access' in keys and 'internet_access:fee' in keys) or ('name' in keys and 'noname' in keys) or ('noref' in keys and 'ref' in keys) or ('power' in keys) or ('power' in keys and 'voltage' in keys):
             match = False
             if not match:
@@ -4105,12 +4376,13 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.tag}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 1052450987, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[barrier=kerb][kerb=no]
-        # *[man_made=bridge][bridge=yes]
-        # *[man_made=tunnel][tunnel=yes]
-        # *[amenity=police][police]
-        # area[building=construction][construction][construction=~/^(yes|minor|no)$/]
-        # area[landuse=construction][construction][construction=~/^(yes|minor|no)$/]
+    # *[barrier=kerb][kerb=no]
+    # *[man_made=bridge][bridge=yes]
+    # *[man_made=tunnel][tunnel=yes]
+    # *[amenity=police][police]
+    # area[building=construction][construction][construction=~/^(yes|minor|no)$/]
+    # area[landuse=construction][construction][construction=~/^(yes|minor|no)$/]
+    def _relation_rule_13(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'police' in keys) or ('barrier' in keys and 'kerb' in keys) or ('bridge' in keys and 'man_made' in keys) or ('building' in keys and 'construction' in keys and 'type' in keys) or ('construction' in keys and 'landuse' in keys and 'type' in keys) or ('man_made' in keys and 'tunnel' in keys):
             match = False
             if not match:
@@ -4142,7 +4414,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.tag}","{1.tag}")
                 err.append({'class': 9001002, 'subclass': 1975860553, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # relation[type=multipolygon][area=no]
+    # relation[type=multipolygon][area=no]
+    def _relation_rule_14(self, data, tags, members, keys, err, sets):
         if ('area' in keys and 'type' in keys):
             match = False
             if not match:
@@ -4154,8 +4427,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwError:tr("{0} together with {1}","{0.tag}","{1.tag}")
                 err.append({'class': 9001002, 'subclass': 1091177792, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[building:part][building]
-        # *[addr:street][addr:place][outside("CZ,DK")]
+    # *[building:part][building]
+    # *[addr:street][addr:place][outside("CZ,DK")]
+    def _relation_rule_15(self, data, tags, members, keys, err, sets):
         if ('addr:place' in keys and 'addr:street' in keys) or ('building' in keys and 'building:part' in keys):
             match = False
             if not match:
@@ -4171,9 +4445,10 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.key}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 1590654104, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[place][place!=farm][place!=plot][/^(addr:housenumber|addr:housename|addr:flats|addr:conscriptionnumber|addr:street|addr:place|addr:city|addr:country|addr:full|addr:hamlet|addr:suburb|addr:subdistrict|addr:district|addr:province|addr:state|addr:interpolation|addr:interpolation|addr:inclusion)$/]
-        # *[boundary][/^addr:/]
-        # *[highway][/^addr:/][highway!=services][highway!=rest_area][!"addr:postcode"]
+    # *[place][place!=farm][place!=plot][/^(addr:housenumber|addr:housename|addr:flats|addr:conscriptionnumber|addr:street|addr:place|addr:city|addr:country|addr:full|addr:hamlet|addr:suburb|addr:subdistrict|addr:district|addr:province|addr:state|addr:interpolation|addr:interpolation|addr:inclusion)$/]
+    # *[boundary][/^addr:/]
+    # *[highway][/^addr:/][highway!=services][highway!=rest_area][!"addr:postcode"]
+    def _relation_rule_16(self, data, tags, members, keys, err, sets):
         if ('boundary' in keys) or ('highway' in keys) or ('place' in keys):
             match = False
             if not match:
@@ -4193,7 +4468,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.key}","addr:*")
                 err.append({'class': 9001002, 'subclass': 1053814004, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'addr:*')})
 
-        # *[postal_code]["addr:postcode"][!highway][postal_code=*"addr:postcode"]
+    # *[postal_code]["addr:postcode"][!highway][postal_code=*"addr:postcode"]
+    def _relation_rule_17(self, data, tags, members, keys, err, sets):
         if ('addr:postcode' in keys and 'postal_code' in keys):
             match = False
             if not match:
@@ -4205,7 +4481,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.key}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 731431309, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[postal_code]["addr:postcode"][!highway][postal_code!=*"addr:postcode"]
+    # *[postal_code]["addr:postcode"][!highway][postal_code!=*"addr:postcode"]
+    def _relation_rule_18(self, data, tags, members, keys, err, sets):
         if ('addr:postcode' in keys and 'postal_code' in keys):
             match = False
             if not match:
@@ -4217,16 +4494,17 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1} and conflicting values","{0.key}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 433558919, 'text': mapcss.tr('{0} together with {1} and conflicting values', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[tunnel][!highway][!area:highway][!railway][!waterway][!piste:type][type!=tunnel][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=tunnel][power!=cable]!.TunnelCulvertWithoutWaterway
-        # *[bridge][!highway][!area:highway][!railway][!waterway][!piste:type][type!=bridge][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=bridge][building!=bridge]
-        # *[psv][!highway][!area:highway][!railway][!waterway][barrier!~/^(bollard|bump_gate|bus_trap|cattle_grid|chain|coupure|entrance|gate|height_restrictor|jersey_barrier|kerb|lift_gate|rope|sally_port|sliding_beam|sliding_gate|spikes|swing_gate|toll_booth|yes)$/][amenity!~/^parking.*/]
-        # *[width][!highway][!area:highway][!railway][!waterway][!aeroway][!cycleway][!footway][!barrier][!man_made][!entrance][natural!=stone][leisure!=track]
-        # *[maxspeed][!highway][!area:highway][!railway][traffic_sign!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:forward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:backward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][type!=enforcement][waterway!~/^(canal|fairway|lock|river|tidal_channel)$/][!traffic_calming][aerialway!=zip_line]
+    # *[tunnel][!highway][!area:highway][!railway][!waterway][!piste:type][type!=tunnel][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=tunnel][power!=cable]!.TunnelCulvertWithoutWaterway
+    # *[bridge][!highway][!area:highway][!railway][!waterway][!piste:type][type!=bridge][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=bridge][building!=bridge]
+    # *[psv][!highway][!area:highway][!railway][!waterway][barrier!~/^(bollard|bump_gate|bus_trap|cattle_grid|chain|coupure|entrance|gate|height_restrictor|jersey_barrier|kerb|lift_gate|rope|sally_port|sliding_beam|sliding_gate|spikes|swing_gate|toll_booth|yes)$/][amenity!~/^parking.*/]
+    # *[width][!highway][!area:highway][!railway][!waterway][!aeroway][!cycleway][!footway][!barrier][!man_made][!entrance][natural!=stone][leisure!=track]
+    # *[maxspeed][!highway][!area:highway][!railway][traffic_sign!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:forward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][traffic_sign:backward!~/^((.*;)?maxspeed(;.*)?|[A-Z][A-Z]:.+)$/][type!=enforcement][waterway!~/^(canal|fairway|lock|river|tidal_channel)$/][!traffic_calming][aerialway!=zip_line]
+    def _relation_rule_19(self, data, tags, members, keys, err, sets):
         if ('bridge' in keys) or ('maxspeed' in keys) or ('psv' in keys) or ('tunnel' in keys) or ('width' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_TunnelCulvertWithoutWaterway) and (mapcss._tag_capture(capture_tags, 0, tags, 'tunnel')) and (not mapcss._tag_capture(capture_tags, 1, tags, 'highway')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'area:highway')) and (not mapcss._tag_capture(capture_tags, 3, tags, 'railway')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'waterway')) and (not mapcss._tag_capture(capture_tags, 5, tags, 'piste:type')) and (mapcss._tag_capture(capture_tags, 6, tags, 'type') != mapcss._value_const_capture(capture_tags, 6, 'tunnel', 'tunnel')) and (mapcss._tag_capture(capture_tags, 7, tags, 'public_transport') != mapcss._value_const_capture(capture_tags, 7, 'platform', 'platform')) and (mapcss._tag_capture(capture_tags, 8, tags, 'route') != mapcss._value_const_capture(capture_tags, 8, 'ferry', 'ferry')) and (mapcss._tag_capture(capture_tags, 9, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 9, 'pipeline', 'pipeline')) and (mapcss._tag_capture(capture_tags, 10, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 10, 'goods_conveyor', 'goods_conveyor')) and (mapcss._tag_capture(capture_tags, 11, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 11, 'wildlife_crossing', 'wildlife_crossing')) and (mapcss._tag_capture(capture_tags, 12, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 12, 'tunnel', 'tunnel')) and (mapcss._tag_capture(capture_tags, 13, tags, 'power') != mapcss._value_const_capture(capture_tags, 13, 'cable', 'cable')))
+                try: match = (('TunnelCulvertWithoutWaterway' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'tunnel')) and (not mapcss._tag_capture(capture_tags, 1, tags, 'highway')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'area:highway')) and (not mapcss._tag_capture(capture_tags, 3, tags, 'railway')) and (not mapcss._tag_capture(capture_tags, 4, tags, 'waterway')) and (not mapcss._tag_capture(capture_tags, 5, tags, 'piste:type')) and (mapcss._tag_capture(capture_tags, 6, tags, 'type') != mapcss._value_const_capture(capture_tags, 6, 'tunnel', 'tunnel')) and (mapcss._tag_capture(capture_tags, 7, tags, 'public_transport') != mapcss._value_const_capture(capture_tags, 7, 'platform', 'platform')) and (mapcss._tag_capture(capture_tags, 8, tags, 'route') != mapcss._value_const_capture(capture_tags, 8, 'ferry', 'ferry')) and (mapcss._tag_capture(capture_tags, 9, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 9, 'pipeline', 'pipeline')) and (mapcss._tag_capture(capture_tags, 10, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 10, 'goods_conveyor', 'goods_conveyor')) and (mapcss._tag_capture(capture_tags, 11, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 11, 'wildlife_crossing', 'wildlife_crossing')) and (mapcss._tag_capture(capture_tags, 12, tags, 'man_made') != mapcss._value_const_capture(capture_tags, 12, 'tunnel', 'tunnel')) and (mapcss._tag_capture(capture_tags, 13, tags, 'power') != mapcss._value_const_capture(capture_tags, 13, 'cable', 'cable')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
@@ -4249,8 +4527,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} on suspicious object","{0.key}")
                 err.append({'class': 9001002, 'subclass': 808700716, 'text': mapcss.tr('{0} on suspicious object', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[highway][waterway][waterway!=dam][waterway!=weir]
-        # *[landuse][building][landuse!=retail]
+    # *[highway][waterway][waterway!=dam][waterway!=weir]
+    # *[landuse][building][landuse!=retail]
+    def _relation_rule_20(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'landuse' in keys) or ('highway' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -4266,7 +4545,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.key}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 1750941961, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[natural=water][leisure=swimming_pool]
+    # *[natural=water][leisure=swimming_pool]
+    def _relation_rule_21(self, data, tags, members, keys, err, sets):
         if ('leisure' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -4282,7 +4562,8 @@ class Josm_combinations(PluginMapCSS):
                     'natural'])
                 }})
 
-        # *[sport][sport!=skiing][!building][!"building:part"][!club][tourism!=hotel][highway!~/^(pedestrian|raceway)$/][!leisure][natural!~/^(beach|bare_rock|cliff|peak|water)$/][amenity!~/^(bar|dojo|pub|restaurant|swimming_pool)$/][landuse!~/^(recreation_ground|piste|farm|farmland)$/][barrier!~/^(wall|retaining_wall)$/][!"piste:type"][shop!=sports][attraction!=summer_toboggan]
+    # *[sport][sport!=skiing][!building][!"building:part"][!club][tourism!=hotel][highway!~/^(pedestrian|raceway)$/][!leisure][natural!~/^(beach|bare_rock|cliff|peak|water)$/][amenity!~/^(bar|dojo|pub|restaurant|swimming_pool)$/][landuse!~/^(recreation_ground|piste|farm|farmland)$/][barrier!~/^(wall|retaining_wall)$/][!"piste:type"][shop!=sports][attraction!=summer_toboggan]
+    def _relation_rule_22(self, data, tags, members, keys, err, sets):
         if ('sport' in keys):
             match = False
             if not match:
@@ -4294,7 +4575,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("sport without physical feature")
                 err.append({'class': 9001001, 'subclass': 1738767711, 'text': mapcss.tr('sport without physical feature')})
 
-        # *[building:levels][!building][!building:part]
+    # *[building:levels][!building][!building:part]
+    def _relation_rule_23(self, data, tags, members, keys, err, sets):
         if ('building:levels' in keys):
             match = False
             if not match:
@@ -4306,7 +4588,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1} or {2}","{0.key}","{1.key}","{2.key}")
                 err.append({'class': 9001001, 'subclass': 1821512557, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[/_name$/][!name][!old_name][!loc_name][!reg_name][!uic_name][!artist_name][!lock_name][!"osak:municipality_name"][!"osak:street_name"][NHD:subbasin_name!~/^(Des Moines Headwaters|Upper Des Moines|East Fork Des Moines)$/][noname!=yes]
+    # *[/_name$/][!name][!old_name][!loc_name][!reg_name][!uic_name][!artist_name][!lock_name][!"osak:municipality_name"][!"osak:street_name"][NHD:subbasin_name!~/^(Des Moines Headwaters|Upper Des Moines|East Fork Des Moines)$/][noname!=yes]
+    def _relation_rule_24(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -4318,7 +4601,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("alternative name without {0}","{1.key}")
                 err.append({'class': 9001001, 'subclass': 1822630838, 'text': mapcss.tr('alternative name without {0}', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # relation[oneway][type!=route]
+    # relation[oneway][type!=route]
+    def _relation_rule_25(self, data, tags, members, keys, err, sets):
         if ('oneway' in keys):
             match = False
             if not match:
@@ -4329,7 +4613,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} on a relation without {1}","{0.key}","{1.tag}")
                 err.append({'class': 9001003, 'subclass': 1921058011, 'text': mapcss.tr('{0} on a relation without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # area[water][natural!~/water|bay|strait/][water!=intermittent][amenity!=lavoir]:closed
+    # area[water][natural!~/water|bay|strait/][water!=intermittent][amenity!=lavoir]:closed
+    def _relation_rule_26(self, data, tags, members, keys, err, sets):
         if ('type' in keys and 'water' in keys):
             match = False
             if not match:
@@ -4341,7 +4626,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.key}","{1.tag}")
                 err.append({'class': 9001001, 'subclass': 712980290, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # area[golf=bunker][natural=beach]
+    # area[golf=bunker][natural=beach]
+    def _relation_rule_27(self, data, tags, members, keys, err, sets):
         if ('golf' in keys and 'natural' in keys and 'type' in keys):
             match = False
             if not match:
@@ -4355,7 +4641,8 @@ class Josm_combinations(PluginMapCSS):
                 # suggestAlternative:"surface=sand"
                 err.append({'class': 9001002, 'subclass': 253392874, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # area[boundary=administrative][landuse=residential]
+    # area[boundary=administrative][landuse=residential]
+    def _relation_rule_28(self, data, tags, members, keys, err, sets):
         if ('boundary' in keys and 'landuse' in keys and 'type' in keys):
             match = False
             if not match:
@@ -4367,7 +4654,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.tag}","{1.tag}")
                 err.append({'class': 9001002, 'subclass': 1711273436, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # area[cemetery=sector][landuse=cemetery]
+    # area[cemetery=sector][landuse=cemetery]
+    def _relation_rule_29(self, data, tags, members, keys, err, sets):
         if ('cemetery' in keys and 'landuse' in keys and 'type' in keys):
             match = False
             if not match:
@@ -4379,7 +4667,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.tag}","{1.tag}")
                 err.append({'class': 9001002, 'subclass': 1139622431, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[highway=cycleway][cycleway=track]
+    # *[highway=cycleway][cycleway=track]
+    def _relation_rule_30(self, data, tags, members, keys, err, sets):
         if ('cycleway' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -4395,10 +4684,11 @@ class Josm_combinations(PluginMapCSS):
                     'cycleway'])
                 }})
 
-        # *[construction:building][!building][!construction]
-        # *[construction:highway][!highway][!construction]
-        # *[construction:railway][!railway][!construction]
-        # *[construction:landuse][!landuse][!construction]
+    # *[construction:building][!building][!construction]
+    # *[construction:highway][!highway][!construction]
+    # *[construction:railway][!railway][!construction]
+    # *[construction:landuse][!landuse][!construction]
+    def _relation_rule_31(self, data, tags, members, keys, err, sets):
         if ('construction:building' in keys) or ('construction:highway' in keys) or ('construction:landuse' in keys) or ('construction:railway' in keys):
             match = False
             if not match:
@@ -4428,10 +4718,11 @@ class Josm_combinations(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{1.key}=construction')).split('=', 1)])
                 }})
 
-        # *[building=construction]["construction:building"][!construction]
-        # *[highway=construction]["construction:highway"][!construction]
-        # *[railway=construction]["construction:railway"][!construction]
-        # *[landuse=construction]["construction:landuse"][!construction]
+    # *[building=construction]["construction:building"][!construction]
+    # *[highway=construction]["construction:highway"][!construction]
+    # *[railway=construction]["construction:railway"][!construction]
+    # *[landuse=construction]["construction:landuse"][!construction]
+    def _relation_rule_32(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'construction:building' in keys) or ('construction:highway' in keys and 'highway' in keys) or ('construction:landuse' in keys and 'landuse' in keys) or ('construction:railway' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -4459,10 +4750,11 @@ class Josm_combinations(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, 'construction={1.value}')).split('=', 1)])
                 }})
 
-        # *[building]["construction:building"][!construction][building!=construction]
-        # *[highway]["construction:highway"][!construction][highway!=construction]
-        # *[railway]["construction:railway"][!construction][railway!=construction]
-        # *[landuse]["construction:landuse"][!construction][landuse!=construction]
+    # *[building]["construction:building"][!construction][building!=construction]
+    # *[highway]["construction:highway"][!construction][highway!=construction]
+    # *[railway]["construction:railway"][!construction][railway!=construction]
+    # *[landuse]["construction:landuse"][!construction][landuse!=construction]
+    def _relation_rule_33(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'construction:building' in keys) or ('construction:highway' in keys and 'highway' in keys) or ('construction:landuse' in keys and 'landuse' in keys) or ('construction:railway' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -4486,10 +4778,11 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1} and conflicting values plus no {2}","{0.key}","{1.key}","{2.key}")
                 err.append({'class': 9001002, 'subclass': 164864338, 'text': mapcss.tr('{0} together with {1} and conflicting values plus no {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *["construction:building"][construction][construction:building!=*construction]
-        # *["construction:highway"][construction][construction:highway!=*construction]
-        # *["construction:railway"][construction][construction:railway!=*construction]
-        # *["construction:landuse"][construction][construction:landuse!=*construction]
+    # *["construction:building"][construction][construction:building!=*construction]
+    # *["construction:highway"][construction][construction:highway!=*construction]
+    # *["construction:railway"][construction][construction:railway!=*construction]
+    # *["construction:landuse"][construction][construction:landuse!=*construction]
+    def _relation_rule_34(self, data, tags, members, keys, err, sets):
         if ('construction' in keys and 'construction:building' in keys) or ('construction' in keys and 'construction:highway' in keys) or ('construction' in keys and 'construction:landuse' in keys) or ('construction' in keys and 'construction:railway' in keys):
             match = False
             if not match:
@@ -4513,8 +4806,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1} and conflicting values","{0.key}","{1.key}")
                 err.append({'class': 9001002, 'subclass': 1971600459, 'text': mapcss.tr('{0} together with {1} and conflicting values', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # area[building][construction][construction!~/^(yes|minor|no)$/][building!=construction]
-        # area[landuse][construction][construction!~/^(yes|minor|no)$/][landuse!=construction]
+    # area[building][construction][construction!~/^(yes|minor|no)$/][building!=construction]
+    # area[landuse][construction][construction!~/^(yes|minor|no)$/][landuse!=construction]
+    def _relation_rule_35(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'construction' in keys and 'type' in keys) or ('construction' in keys and 'landuse' in keys and 'type' in keys):
             match = False
             if not match:
@@ -4530,8 +4824,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.tag}","{1.tag}")
                 err.append({'class': 9001002, 'subclass': 1489908627, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[amenity=recycling][collection_times="24/7"][!opening_hours]
-        # *[amenity=recycling][collection_times][!opening_hours][collection_times=~/[a-z]-[A-Z].*[0-9]-[0-9]/]
+    # *[amenity=recycling][collection_times="24/7"][!opening_hours]
+    # *[amenity=recycling][collection_times][!opening_hours][collection_times=~/[a-z]-[A-Z].*[0-9]-[0-9]/]
+    def _relation_rule_36(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'collection_times' in keys):
             match = False
             if not match:
@@ -4553,7 +4848,8 @@ class Josm_combinations(PluginMapCSS):
                     'collection_times'])
                 }})
 
-        # *[amenity=recycling][!/^recycling:/][recycling_type!=centre]
+    # *[amenity=recycling][!/^recycling:/][recycling_type!=centre]
+    def _relation_rule_37(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -4565,7 +4861,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.tag}","recycling:*")
                 err.append({'class': 9001001, 'subclass': 321354601, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), 'recycling:*')})
 
-        # *[source:addr][!/^addr:/]
+    # *[source:addr][!/^addr:/]
+    def _relation_rule_38(self, data, tags, members, keys, err, sets):
         if ('source:addr' in keys):
             match = False
             if not match:
@@ -4577,7 +4874,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.key}","addr:*")
                 err.append({'class': 9001001, 'subclass': 886065920, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'addr:*')})
 
-        # *[source:maxspeed][!/^maxspeed:?/]
+    # *[source:maxspeed][!/^maxspeed:?/]
+    def _relation_rule_39(self, data, tags, members, keys, err, sets):
         if ('source:maxspeed' in keys):
             match = False
             if not match:
@@ -4589,7 +4887,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} without {1} or {2}","{0.key}","maxspeed","maxspeed:*")
                 err.append({'class': 9001001, 'subclass': 480030366, 'text': mapcss.tr('{0} without {1} or {2}', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'maxspeed', 'maxspeed:*')})
 
-        # *[man_made=communications_tower][height][siunit_length(tag(height))<75]
+    # *[man_made=communications_tower][height][siunit_length(tag(height))<75]
+    def _relation_rule_40(self, data, tags, members, keys, err, sets):
         if ('height' in keys and 'man_made' in keys):
             match = False
             if not match:
@@ -4602,8 +4901,9 @@ class Josm_combinations(PluginMapCSS):
                 # suggestAlternative:"man_made=tower + tower:type=communication + height"
                 err.append({'class': 9001002, 'subclass': 1533608671, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[fixme][count(split(" ",tag("fixme")))==1][has_tag_key(tag("fixme"))]
-        # *[FIXME][count(split(" ",tag("FIXME")))==1][has_tag_key(tag("FIXME"))]
+    # *[fixme][count(split(" ",tag("fixme")))==1][has_tag_key(tag("fixme"))]
+    # *[FIXME][count(split(" ",tag("FIXME")))==1][has_tag_key(tag("FIXME"))]
+    def _relation_rule_41(self, data, tags, members, keys, err, sets):
         if ('FIXME' in keys) or ('fixme' in keys):
             match = False
             if not match:
@@ -4619,7 +4919,8 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}. Is the fixme fixed?","{0.tag}","{0.value}")
                 err.append({'class': 9001002, 'subclass': 2092275873, 'text': mapcss.tr('{0} together with {1}. Is the fixme fixed?', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[voltage:primary][voltage:secondary][transformer=generator][tag("voltage:secondary")<tag("voltage:primary")]
+    # *[voltage:primary][voltage:secondary][transformer=generator][tag("voltage:secondary")<tag("voltage:primary")]
+    def _relation_rule_42(self, data, tags, members, keys, err, sets):
         if ('transformer' in keys and 'voltage:primary' in keys and 'voltage:secondary' in keys):
             match = False
             if not match:
@@ -4631,8 +4932,9 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} is lower than {1} on {2}.","{1.key}","{0.key}","{2.tag}")
                 err.append({'class': 9001002, 'subclass': 1175862429, 'text': mapcss.tr('{0} is lower than {1} on {2}.', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # area[/^(building|building:part)$/][height][min_height][siunit_length(tag(height))<=siunit_length(tag(min_height))]
-        # area[/^(building|building:part)$/][building:levels][building:min_level][tag("building:levels")<=tag("building:min_level")]
+    # area[/^(building|building:part)$/][height][min_height][siunit_length(tag(height))<=siunit_length(tag(min_height))]
+    # area[/^(building|building:part)$/][building:levels][building:min_level][tag("building:levels")<=tag("building:min_level")]
+    def _relation_rule_43(self, data, tags, members, keys, err, sets):
         if ('building:levels' in keys and 'building:min_level' in keys and 'type' in keys) or ('height' in keys and 'min_height' in keys and 'type' in keys):
             match = False
             if not match:
@@ -4648,6 +4950,59 @@ class Josm_combinations(PluginMapCSS):
                 # throwWarning:tr("{0} is lower or equal to {1} on {2}","{1.key}","{2.key}","{0.key}")
                 err.append({'class': 9001002, 'subclass': 1399744513, 'text': mapcss.tr('{0} is lower or equal to {1} on {2}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'), mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['border_type', 'building:min_level', 'min_height', 'piste:difficulty', 'place', 'source:addr:housenumber', 'source:addr:postcode', 'source:bicycle', 'source:bridge', 'source:building', 'source:date', 'source:designation', 'source:ele', 'source:height', 'source:hgv', 'source:highway', 'source:housenumber', 'source:lanes', 'source:lit', 'source:maxaxleload', 'source:maxspeed:backward', 'source:maxspeed:forward', 'source:name', 'source:old_name', 'source:population', 'source:postal_code', 'source:postcode', 'source:ref', 'source:ref:INSEE', 'source:surface', 'transformer']),
+        (_relation_rule_1, ['archaeological_site', 'artwork_type', 'bunker_type', 'castle_type', 'generator:method', 'generator:source', 'generator:type', 'information', 'parking', 'recycling_type', 'shelter_type', 'zoo']),
+        (_relation_rule_2, ['bridge:movable', 'reservoir_type', 'substation']),
+        (_relation_rule_3, ['iata', 'icao']),
+        (_relation_rule_4, ['pump_mechanism']),
+        (_relation_rule_5, ['actuator', 'aeroway', 'amenity', 'boundary', 'building', 'landuse', 'leisure', 'man_made', 'mechanical_driver', 'office', 'power', 'route', 'tourism']),
+        (_relation_rule_6, ['segregated']),
+        (_relation_rule_7, ['amenity']),
+        (_relation_rule_8, ['smoothness']),
+        (_relation_rule_9, ['boat', 'intermittent']),
+        (_relation_rule_10, ['snowplowing']),
+        (_relation_rule_11, ['toll']),
+        (_relation_rule_12, ['actuator', 'addr:housenumber', 'amenity', 'frequency', 'handle', 'internet_access', 'name', 'noref', 'power']),
+        (_relation_rule_13, ['amenity', 'barrier', 'bridge', 'building', 'construction', 'man_made']),
+        (_relation_rule_14, ['area']),
+        (_relation_rule_15, ['addr:place', 'building']),
+        (_relation_rule_16, ['boundary', 'highway', 'place']),
+        (_relation_rule_17, ['addr:postcode']),
+        (_relation_rule_18, ['addr:postcode']),
+        (_relation_rule_19, ['bridge', 'maxspeed', 'psv', 'tunnel', 'width']),
+        (_relation_rule_20, ['building', 'highway']),
+        (_relation_rule_21, ['leisure']),
+        (_relation_rule_22, ['sport']),
+        (_relation_rule_23, ['building:levels']),
+        (_relation_rule_24, None),
+        (_relation_rule_25, ['oneway']),
+        (_relation_rule_26, ['type']),
+        (_relation_rule_27, ['golf']),
+        (_relation_rule_28, ['boundary']),
+        (_relation_rule_29, ['cemetery']),
+        (_relation_rule_30, ['cycleway']),
+        (_relation_rule_31, ['construction:building', 'construction:highway', 'construction:landuse', 'construction:railway']),
+        (_relation_rule_32, ['building', 'construction:highway', 'construction:landuse', 'construction:railway']),
+        (_relation_rule_33, ['building', 'construction:highway', 'construction:landuse', 'construction:railway']),
+        (_relation_rule_34, ['construction']),
+        (_relation_rule_35, ['building', 'construction']),
+        (_relation_rule_36, ['amenity']),
+        (_relation_rule_37, ['amenity']),
+        (_relation_rule_38, ['source:addr']),
+        (_relation_rule_39, ['source:maxspeed']),
+        (_relation_rule_40, ['height']),
+        (_relation_rule_41, ['FIXME', 'fixme']),
+        (_relation_rule_42, ['transformer']),
+        (_relation_rule_43, ['building:levels', 'height']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
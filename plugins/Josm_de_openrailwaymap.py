@@ -66,18 +66,13 @@ class Josm_de_openrailwaymap(PluginMapCSS):
         self.re_77700681 = re.compile(r'^(.*;)?DE-ESO:kennlicht(;.*)?$')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # node[railway=signal][railway:signal:main="DE-ESO:ks"][railway:signal:main:form!=light]
-        # node[railway=signal][railway:signal:distant="DE-ESO:ks"][railway:signal:distant:form!=light]
-        # node[railway=signal][railway:signal:combined="DE-ESO:ks"][railway:signal:combined:form!=light]
-        # node[railway=signal][railway:signal:main="DE-ESO:hl"][railway:signal:main:form!=light]
-        # node[railway=signal][railway:signal:distant="DE-ESO:hl"][railway:signal:distant:form!=light]
-        # node[railway=signal][railway:signal:combined="DE-ESO:hl"][railway:signal:combined:form!=light]
+    # node[railway=signal][railway:signal:main="DE-ESO:ks"][railway:signal:main:form!=light]
+    # node[railway=signal][railway:signal:distant="DE-ESO:ks"][railway:signal:distant:form!=light]
+    # node[railway=signal][railway:signal:combined="DE-ESO:ks"][railway:signal:combined:form!=light]
+    # node[railway=signal][railway:signal:main="DE-ESO:hl"][railway:signal:main:form!=light]
+    # node[railway=signal][railway:signal:distant="DE-ESO:hl"][railway:signal:distant:form!=light]
+    # node[railway=signal][railway:signal:combined="DE-ESO:hl"][railway:signal:combined:form!=light]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:signal:combined' in keys) or ('railway' in keys and 'railway:signal:distant' in keys) or ('railway' in keys and 'railway:signal:main' in keys):
             match = False
             if not match:
@@ -118,8 +113,9 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{2.key}=light')).split('=', 1)])
                 }})
 
-        # node[railway=signal][railway:signal:main="DE-ESO:hp"][railway:signal:main:form!=light][railway:signal:main:form!=semaphore]
-        # node[railway=signal][railway:signal:distant="DE-ESO:vr"][railway:signal:distant:form!=light][railway:signal:distant:form!=semaphore]
+    # node[railway=signal][railway:signal:main="DE-ESO:hp"][railway:signal:main:form!=light][railway:signal:main:form!=semaphore]
+    # node[railway=signal][railway:signal:distant="DE-ESO:vr"][railway:signal:distant:form!=light][railway:signal:distant:form!=semaphore]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:signal:distant' in keys) or ('railway' in keys and 'railway:signal:main' in keys):
             match = False
             if not match:
@@ -138,7 +134,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertMatch:"node railway=signal railway:signal:main=DE-ESO:hp"
                 err.append({'class': 9016002, 'subclass': 1455678760, 'text': {'en': 'hp signals only exist as semaphore or light signals'}})
 
-        # node[railway=signal][railway:signal:combined="DE-KVB:hp"][railway:signal:combined:form!=light]
+    # node[railway=signal][railway:signal:combined="DE-KVB:hp"][railway:signal:combined:form!=light]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:signal:combined' in keys):
             match = False
             if not match:
@@ -154,7 +151,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertMatch:"node railway=signal railway:signal:combined=DE-KVB:hp"
                 err.append({'class': 9016003, 'subclass': 1610282655, 'text': {'en': 'KVB hp signals only exist as light signals'}})
 
-        # node[railway=signal]["railway:signal:distant"="DE-ESO:vr"]["railway:signal:distant:repeated"="yes"]["railway:signal:distant:form"!="light"]
+    # node[railway=signal]["railway:signal:distant"="DE-ESO:vr"]["railway:signal:distant:repeated"="yes"]["railway:signal:distant:form"!="light"]
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:signal:distant' in keys and 'railway:signal:distant:repeated' in keys):
             match = False
             if not match:
@@ -168,8 +166,9 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertMatch:"node railway=signal railway:signal:distant=DE-ESO:vr railway:signal:distant:repeated=yes"
                 err.append({'class': 9016004, 'subclass': 377147416, 'text': {'en': 'Vr repeated signals only exist as light signals'}})
 
-        # node["railway:signal:minor:states"="DE-ESO:sh0;DE-ESO:gsp2"]
-        # node["railway:signal:minor:states"="sh0;gsp2"]
+    # node["railway:signal:minor:states"="DE-ESO:sh0;DE-ESO:gsp2"]
+    # node["railway:signal:minor:states"="sh0;gsp2"]
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if ('railway:signal:minor:states' in keys):
             match = False
             if not match:
@@ -193,7 +192,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                     ['railway:signal:minor:states','DE-ESO:sh0;DE-ESO:wn7']])
                 }})
 
-        # node["railway:signal:train_protection"="DE-ESO:ne14"]["railway:signal:train_protection:type"!=block_marker]
+    # node["railway:signal:train_protection"="DE-ESO:ne14"]["railway:signal:train_protection:type"!=block_marker]
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('railway:signal:train_protection' in keys):
             match = False
             if not match:
@@ -212,10 +212,11 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                     ['railway:signal:train_protection:type','block_marker']])
                 }})
 
-        # node["railway:signal:distant:repeated"="yes"]["railway:signal:main"="DE-ESO:hp"]["railway:signal:main:states"!~/^(.*;)?DE-ESO:kennlicht(;.*)?$/]
-        # node["railway:signal:distant:repeated"="yes"]["railway:signal:main"="DE-ESO:hp"]["railway:signal:main:states"~="DE-ESO:kennlicht"]["railway:signal:distant:shortened"="no"]
-        # node["railway:signal:distant:repeated"="yes"]["railway:signal:main"="DE-ESO:hp"]["railway:signal:main:states"~="DE-ESO:kennlicht"][!"railway:signal:distant:shortened"]
-        # node["railway:signal:distant:repeated"="yes"]["railway:signal:main"=~/^DE-ESO:/]["railway:signal:main"!="DE-ESO:hp"]
+    # node["railway:signal:distant:repeated"="yes"]["railway:signal:main"="DE-ESO:hp"]["railway:signal:main:states"!~/^(.*;)?DE-ESO:kennlicht(;.*)?$/]
+    # node["railway:signal:distant:repeated"="yes"]["railway:signal:main"="DE-ESO:hp"]["railway:signal:main:states"~="DE-ESO:kennlicht"]["railway:signal:distant:shortened"="no"]
+    # node["railway:signal:distant:repeated"="yes"]["railway:signal:main"="DE-ESO:hp"]["railway:signal:main:states"~="DE-ESO:kennlicht"][!"railway:signal:distant:shortened"]
+    # node["railway:signal:distant:repeated"="yes"]["railway:signal:main"=~/^DE-ESO:/]["railway:signal:main"!="DE-ESO:hp"]
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if ('railway:signal:distant:repeated' in keys and 'railway:signal:distant:shortened' in keys and 'railway:signal:main' in keys and 'railway:signal:main:states' in keys) or ('railway:signal:distant:repeated' in keys and 'railway:signal:main' in keys) or ('railway:signal:distant:repeated' in keys and 'railway:signal:main' in keys and 'railway:signal:main:states' in keys):
             match = False
             if not match:
@@ -252,10 +253,11 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                     'railway:signal:distant:repeated'])
                 }})
 
-        # node["railway:signal:distant:repeated"="yes"]["railway:signal:distant:shortened"="yes"]["railway:signal:distant"=~/^DE-ESO:/]["railway:signal:distant"!="DE-ESO:vr"]
-        # node["railway:signal:distant:repeated"="yes"]["railway:signal:distant:shortened"="yes"]["railway:signal:distant"="DE-ESO:vr"][!"railway:signal:main"]
-        # node["railway:signal:distant:repeated"="yes"]["railway:signal:distant:shortened"="yes"]["railway:signal:main"]["railway:signal:main"!="DE-ESO:hp"]
-        # node["railway:signal:distant:repeated"="yes"]["railway:signal:distant:shortened"="yes"]["railway:signal:distant"="DE-ESO:vr"]["railway:signal:main"="DE-ESO:hp"]["railway:signal:main:states"!~/^(.*;)?DE-ESO:kennlicht(;.*)?$/]
+    # node["railway:signal:distant:repeated"="yes"]["railway:signal:distant:shortened"="yes"]["railway:signal:distant"=~/^DE-ESO:/]["railway:signal:distant"!="DE-ESO:vr"]
+    # node["railway:signal:distant:repeated"="yes"]["railway:signal:distant:shortened"="yes"]["railway:signal:distant"="DE-ESO:vr"][!"railway:signal:main"]
+    # node["railway:signal:distant:repeated"="yes"]["railway:signal:distant:shortened"="yes"]["railway:signal:main"]["railway:signal:main"!="DE-ESO:hp"]
+    # node["railway:signal:distant:repeated"="yes"]["railway:signal:distant:shortened"="yes"]["railway:signal:distant"="DE-ESO:vr"]["railway:signal:main"="DE-ESO:hp"]["railway:signal:main:states"!~/^(.*;)?DE-ESO:kennlicht(;.*)?$/]
+    def _node_rule_7(self, data, tags, keys, err, sets):
         if ('railway:signal:distant' in keys and 'railway:signal:distant:repeated' in keys and 'railway:signal:distant:shortened' in keys) or ('railway:signal:distant' in keys and 'railway:signal:distant:repeated' in keys and 'railway:signal:distant:shortened' in keys and 'railway:signal:main' in keys) or ('railway:signal:distant:repeated' in keys and 'railway:signal:distant:shortened' in keys and 'railway:signal:main' in keys):
             match = False
             if not match:
@@ -288,8 +290,9 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"node railway=signal railway:signal:distant=DE-ESO:vr railway:signal:distant:shortened=yes"
                 err.append({'class': 9016008, 'subclass': 331861787, 'text': {'en': 'German distant signals can\'t be repeated and shortened at the same time'}})
 
-        # node["railway:signal:main"="DE-ESO:ks"]["railway:signal:distant"]
-        # node["railway:signal:main"]["railway:signal:distant"="DE-ESO:ks"]
+    # node["railway:signal:main"="DE-ESO:ks"]["railway:signal:distant"]
+    # node["railway:signal:main"]["railway:signal:distant"="DE-ESO:ks"]
+    def _node_rule_8(self, data, tags, keys, err, sets):
         if ('railway:signal:distant' in keys and 'railway:signal:main' in keys):
             match = False
             if not match:
@@ -308,7 +311,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertMatch:"node railway=signal railway:signal:main=DE-ESO:ks railway:signal:distant=DE-ESO:vr"
                 err.append({'class': 9016009, 'subclass': 832014689, 'text': {'en': 'German Ks signals can\'t have main and distant signal at the same place, try a combined signal instead'}})
 
-        # node[railway=signal]["railway:signal:minor"="DE-ESO:sh"]["railway:signal:minor:form"=semaphore]["railway:signal:minor:states"~="DE-ESO:hp0"]
+    # node[railway=signal]["railway:signal:minor"="DE-ESO:sh"]["railway:signal:minor:form"=semaphore]["railway:signal:minor:states"~="DE-ESO:hp0"]
+    def _node_rule_9(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:signal:minor' in keys and 'railway:signal:minor:form' in keys and 'railway:signal:minor:states' in keys):
             match = False
             if not match:
@@ -325,7 +329,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"node railway=signal railway:signal:minor=DE-ESO:sh railway:signal:minor:form=semaphore railway:signal:minor:states=DE-ESO:sh0;DE-ESO:sh1"
                 err.append({'class': 9016010, 'subclass': 1342331763, 'text': {'en': 'Sh semaphore signals cannot display Hp 0, but only Sh 0'}})
 
-        # node[railway=signal]["railway:signal:minor"="DE-ESO:sh"]["railway:signal:minor:form"=light]["railway:signal:minor:states"~="DE-ESO:sh0"]
+    # node[railway=signal]["railway:signal:minor"="DE-ESO:sh"]["railway:signal:minor:form"=light]["railway:signal:minor:states"~="DE-ESO:sh0"]
+    def _node_rule_10(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:signal:minor' in keys and 'railway:signal:minor:form' in keys and 'railway:signal:minor:states' in keys):
             match = False
             if not match:
@@ -342,8 +347,9 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"node railway=signal railway:signal:minor=DE-ESO:sh railway:signal:minor:form=semaphore railway:signal:minor:states=DE-ESO:sh0;DE-ESO:sh1"
                 err.append({'class': 9016011, 'subclass': 1627617188, 'text': {'en': 'Sh light signals cannot display Sh 0, but only Hp 0'}})
 
-        # node[railway=signal]["railway:signal:speed_limit_distant"="DE-ESO:zs3v"]["railway:signal:speed_limit_distant:form"=sign]["railway:signal:speed_limit_distant:speed"]["railway:signal:speed_limit_distant:speed"!~/^[1-9][0-9]?[05]$/]["railway:signal:speed_limit_distant:speed"!=5]["railway:signal:speed_limit_distant:speed"!="?"]
-        # node[railway=signal]["railway:signal:speed_limit_distant"="DE-ESO:zs3v"]["railway:signal:speed_limit_distant:form"=sign]["railway:signal:speed_limit_distant:speed">160]
+    # node[railway=signal]["railway:signal:speed_limit_distant"="DE-ESO:zs3v"]["railway:signal:speed_limit_distant:form"=sign]["railway:signal:speed_limit_distant:speed"]["railway:signal:speed_limit_distant:speed"!~/^[1-9][0-9]?[05]$/]["railway:signal:speed_limit_distant:speed"!=5]["railway:signal:speed_limit_distant:speed"!="?"]
+    # node[railway=signal]["railway:signal:speed_limit_distant"="DE-ESO:zs3v"]["railway:signal:speed_limit_distant:form"=sign]["railway:signal:speed_limit_distant:speed">160]
+    def _node_rule_11(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:signal:speed_limit_distant' in keys and 'railway:signal:speed_limit_distant:form' in keys and 'railway:signal:speed_limit_distant:speed' in keys):
             match = False
             if not match:
@@ -370,8 +376,9 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertMatch:"node railway=signal railway:signal:speed_limit_distant=\"DE-ESO:zs3v\" railway:signal:speed_limit_distant:form=sign railway:signal:speed_limit_distant:speed=foo"
                 err.append({'class': 9016012, 'subclass': 1868832018, 'text': {'en': 'Zs3v sign signals can only have a single speed, are a multiple of 5 and cannot be greater than 160'}})
 
-        # node[railway=signal]["railway:signal:speed_limit"="DE-ESO:zs3"]["railway:signal:speed_limit:form"=sign]["railway:signal:speed_limit:speed"]["railway:signal:speed_limit:speed"!~/^[1-9][0-9]?[05]$/]["railway:signal:speed_limit:speed"!=5]["railway:signal:speed_limit:speed"!="?"]
-        # node[railway=signal]["railway:signal:speed_limit"="DE-ESO:zs3"]["railway:signal:speed_limit:form"=sign]["railway:signal:speed_limit:speed">160]
+    # node[railway=signal]["railway:signal:speed_limit"="DE-ESO:zs3"]["railway:signal:speed_limit:form"=sign]["railway:signal:speed_limit:speed"]["railway:signal:speed_limit:speed"!~/^[1-9][0-9]?[05]$/]["railway:signal:speed_limit:speed"!=5]["railway:signal:speed_limit:speed"!="?"]
+    # node[railway=signal]["railway:signal:speed_limit"="DE-ESO:zs3"]["railway:signal:speed_limit:form"=sign]["railway:signal:speed_limit:speed">160]
+    def _node_rule_12(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:signal:speed_limit' in keys and 'railway:signal:speed_limit:form' in keys and 'railway:signal:speed_limit:speed' in keys):
             match = False
             if not match:
@@ -398,7 +405,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertMatch:"node railway=signal railway:signal:speed_limit=\"DE-ESO:zs3\" railway:signal:speed_limit:form=sign railway:signal:speed_limit:speed=foo"
                 err.append({'class': 9016013, 'subclass': 1804825947, 'text': {'en': 'Zs3 sign signals can only have a single speed, are a multiple of 5 and cannot be greater than 160'}})
 
-        # node[railway=signal]["railway:signal:speed_limit_distant"="DE-ESO:zs3v"]["railway:signal:speed_limit:form"=light]["railway:signal:speed_limit_distant:speed"]["railway:signal:speed_limit_distant:speed"!~/^([1-9]0|1[0-6]0|off|\?)(;([1-9]0|1[0-6]0|off|\?))*$/]
+    # node[railway=signal]["railway:signal:speed_limit_distant"="DE-ESO:zs3v"]["railway:signal:speed_limit:form"=light]["railway:signal:speed_limit_distant:speed"]["railway:signal:speed_limit_distant:speed"!~/^([1-9]0|1[0-6]0|off|\?)(;([1-9]0|1[0-6]0|off|\?))*$/]
+    def _node_rule_13(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:signal:speed_limit:form' in keys and 'railway:signal:speed_limit_distant' in keys and 'railway:signal:speed_limit_distant:speed' in keys):
             match = False
             if not match:
@@ -420,7 +428,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertMatch:"node railway=signal railway:signal:speed_limit_distant=\"DE-ESO:zs3v\" railway:signal:speed_limit:form=light railway:signal:speed_limit_distant:speed=foo"
                 err.append({'class': 9016014, 'subclass': 720472651, 'text': {'en': 'Zs3v light signal states should have the form \'speed[;speed …][;off][;?], speeds can only be multiples of 10'}})
 
-        # node[railway=signal]["railway:signal:speed_limit"="DE-ESO:zs3"]["railway:signal:speed_limit:form"=light]["railway:signal:speed_limit:speed"]["railway:signal:speed_limit:speed"!~/^([1-9]0|1[0-6]0|off|\?)(;([1-9]0|1[0-6]0|off|\?))*$/]
+    # node[railway=signal]["railway:signal:speed_limit"="DE-ESO:zs3"]["railway:signal:speed_limit:form"=light]["railway:signal:speed_limit:speed"]["railway:signal:speed_limit:speed"!~/^([1-9]0|1[0-6]0|off|\?)(;([1-9]0|1[0-6]0|off|\?))*$/]
+    def _node_rule_14(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:signal:speed_limit' in keys and 'railway:signal:speed_limit:form' in keys and 'railway:signal:speed_limit:speed' in keys):
             match = False
             if not match:
@@ -442,7 +451,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertMatch:"node railway=signal railway:signal:speed_limit=\"DE-ESO:zs3\" railway:signal:speed_limit:form=light railway:signal:speed_limit:speed=foo"
                 err.append({'class': 9016015, 'subclass': 1065351347, 'text': {'en': 'Zs3 light signal states should have the form \'speed[;speed …][;off][;?], speeds can only be multiples of 10'}})
 
-        # node|z16-[railway=signal]["railway:signal:speed_limit"="DE-ESO:db:zs10"]["railway:signal:speed_limit:form"=light]
+    # node|z16-[railway=signal]["railway:signal:speed_limit"="DE-ESO:db:zs10"]["railway:signal:speed_limit:form"=light]
+    def _node_rule_15(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:signal:speed_limit' in keys and 'railway:signal:speed_limit:form' in keys):
             match = False
             if not match:
@@ -456,8 +466,9 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"node railway=signal railway:signal:speed_limit=\"DE-ESO:db:zs10\" railway:signal:speed_limit:form=sign"
                 err.append({'class': 9016016, 'subclass': 1437297810, 'text': {'en': 'It is unclear if Zs10 light signals have ever been placed, please double check.'}})
 
-        # node[railway=signal]["railway:signal:main:substitute_signal"=~/;no|no;/]
-        # node[railway=signal]["railway:signal:combined:substitute_signal"=~/;no|no;/]
+    # node[railway=signal]["railway:signal:main:substitute_signal"=~/;no|no;/]
+    # node[railway=signal]["railway:signal:combined:substitute_signal"=~/;no|no;/]
+    def _node_rule_16(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:signal:combined:substitute_signal' in keys) or ('railway' in keys and 'railway:signal:main:substitute_signal' in keys):
             match = False
             if not match:
@@ -477,16 +488,37 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"node railway=signal railway:signal:main:substitute_signal=no"
                 err.append({'class': 9016032, 'subclass': 1068560505, 'text': {'en': 'It is not possible that a main or combined signal both has a substitute signal and has no substitute signal.'}})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['railway']),
+        (_node_rule_1, ['railway']),
+        (_node_rule_2, ['railway']),
+        (_node_rule_3, ['railway']),
+        (_node_rule_4, ['railway:signal:minor:states']),
+        (_node_rule_5, ['railway:signal:train_protection']),
+        (_node_rule_6, ['railway:signal:distant:repeated']),
+        (_node_rule_7, ['railway:signal:distant', 'railway:signal:distant:repeated']),
+        (_node_rule_8, ['railway:signal:distant']),
+        (_node_rule_9, ['railway']),
+        (_node_rule_10, ['railway']),
+        (_node_rule_11, ['railway']),
+        (_node_rule_12, ['railway']),
+        (_node_rule_13, ['railway']),
+        (_node_rule_14, ['railway']),
+        (_node_rule_15, ['railway']),
+        (_node_rule_16, ['railway']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # way[railway][name=~/^KBS [0-9]*.*/]
-        # way[railway][name=~/^Kursbuchstrecke [0-9]*.*/]
+    # way[railway][name=~/^KBS [0-9]*.*/]
+    # way[railway][name=~/^Kursbuchstrecke [0-9]*.*/]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -505,8 +537,9 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"way railway=rail name=Frankenbahn"
                 err.append({'class': 9016017, 'subclass': 460679615, 'text': {'en': 'Tracks should not be named by their timetable number (KBS xy). Use a route relation with route=railway, instead.'}})
 
-        # way[railway][ref=~/^KBS [0-9]*.*/]
-        # way[railway][ref=~/^Kursbuchstrecke [0-9]*.*/]
+    # way[railway][ref=~/^KBS [0-9]*.*/]
+    # way[railway][ref=~/^Kursbuchstrecke [0-9]*.*/]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -524,7 +557,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"way railway=rail ref=7400"
                 err.append({'class': 9016018, 'subclass': 1307191883, 'text': {'en': 'ref=* should be a VzG number (without "VzG"). Use a route relation with route=railway for KBS numbers, instead.'}})
 
-        # way[railway][ref=~/^VzG [0-9]*.*/]
+    # way[railway][ref=~/^VzG [0-9]*.*/]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -537,7 +571,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"way railway=rail ref=7400"
                 err.append({'class': 9016019, 'subclass': 1513071347, 'text': {'en': 'ref=* should be a VzG number without "VzG"'}})
 
-        # way[railway][name=~/^VzG [0-9]*.*/]
+    # way[railway][name=~/^VzG [0-9]*.*/]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -550,7 +585,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"way railway=rail name=7400"
                 err.append({'class': 9016020, 'subclass': 498921024, 'text': {'en': 'VzG numbers should be tagged as ref=* without "VzG"'}})
 
-        # way[railway][ref=~/^[0-9]{4}-[0-9]+/]
+    # way[railway][ref=~/^[0-9]{4}-[0-9]+/]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -563,7 +599,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertMatch:"way railway=rail ref=7400-1"
                 err.append({'class': 9016021, 'subclass': 1211908367, 'text': {'en': 'ref=* should only be a VzG number, it should not contain the track number'}})
 
-        # way[railway][name=~/^[0-9]{4}$/]
+    # way[railway][name=~/^[0-9]{4}$/]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -585,8 +622,9 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                     'name'])
                 }})
 
-        # way[railway][name=~/^[0-9]{3}\.[0-9]+$/]
-        # way[railway][name=~/^[0-9]{3}\.[0-9]{1,2}[-.][0-9]{1,2}$/]
+    # way[railway][name=~/^[0-9]{3}\.[0-9]+$/]
+    # way[railway][name=~/^[0-9]{3}\.[0-9]{1,2}[-.][0-9]{1,2}$/]
+    def _way_rule_6(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -611,7 +649,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"way railway=rail name=Hohenlohebahn"
                 err.append({'class': 9016023, 'subclass': 1319009137, 'text': {'en': 'Track names should be real names. KBS numbers should be mapped as a relation with route=railway.'}})
 
-        # way[railway][name=~/^[0-9]{3}$/]
+    # way[railway][name=~/^[0-9]{3}$/]
+    def _way_rule_7(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -632,8 +671,9 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"way railway=rail name=Hohenlohebahn"
                 err.append({'class': 9016024, 'subclass': 1536179499, 'text': {'en': 'Track names should be real names. KBS numbers should be mapped as a relation with route=railway, track numbers as railway:track_ref=*.'}})
 
-        # way[railway][ref=~/^[0-9]{3}\.[0-9]+$/]
-        # way[railway][ref=~/^[0-9]{3}\.[0-9]{1,2}[-.][0-9]{1,2}$/]
+    # way[railway][ref=~/^[0-9]{3}\.[0-9]+$/]
+    # way[railway][ref=~/^[0-9]{3}\.[0-9]{1,2}[-.][0-9]{1,2}$/]
+    def _way_rule_8(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -657,7 +697,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"way railway=rail ref=7400a"
                 err.append({'class': 9016025, 'subclass': 1194218564, 'text': {'en': 'Track refs should be VzG numbers in Germany. KBS numbers should be mapped as a relation with route=railway.'}})
 
-        # way[railway][ref=~/^[0-9]{3}$/]
+    # way[railway][ref=~/^[0-9]{3}$/]
+    def _way_rule_9(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -677,9 +718,10 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"way railway=rail ref=7400a"
                 err.append({'class': 9016026, 'subclass': 2032079245, 'text': {'en': 'Track refs should be VzG numbers in Germany. KBS numbers should be mapped as a relation with route=railway, track numbers as railway:track_ref=*.'}})
 
-        # way[railway][workrules=EBO]
-        # way[railway][workrules=ESBO]
-        # way[railway][workrules=BOStrab]
+    # way[railway][workrules=EBO]
+    # way[railway][workrules=ESBO]
+    # way[railway][workrules=BOStrab]
+    def _way_rule_10(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'workrules' in keys):
             match = False
             if not match:
@@ -709,7 +751,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, 'workrules=DE:{1.value}')).split('=', 1)])
                 }})
 
-        # way[railway][workrules=BOA]
+    # way[railway][workrules=BOA]
+    def _way_rule_11(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'workrules' in keys):
             match = False
             if not match:
@@ -723,7 +766,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"way railway=rail"
                 err.append({'class': 9016028, 'subclass': 219100574, 'text': {'en': 'workrules=BOA is deprecated, replace by an adequate value'}})
 
-        # way[railway][workrules="DE-BOStrab"]
+    # way[railway][workrules="DE-BOStrab"]
+    def _way_rule_12(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'workrules' in keys):
             match = False
             if not match:
@@ -741,7 +785,8 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                     ['workrules','DE:BOStrab']])
                 }})
 
-        # way[railway][workrules="DE-EBO"]
+    # way[railway][workrules="DE-EBO"]
+    def _way_rule_13(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'workrules' in keys):
             match = False
             if not match:
@@ -759,6 +804,29 @@ class Josm_de_openrailwaymap(PluginMapCSS):
                     ['workrules','DE:EBO']])
                 }})
 
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['name']),
+        (_way_rule_1, ['railway']),
+        (_way_rule_2, ['railway']),
+        (_way_rule_3, ['name']),
+        (_way_rule_4, ['railway']),
+        (_way_rule_5, ['name']),
+        (_way_rule_6, ['name']),
+        (_way_rule_7, ['name']),
+        (_way_rule_8, ['railway']),
+        (_way_rule_9, ['railway']),
+        (_way_rule_10, ['railway']),
+        (_way_rule_11, ['railway']),
+        (_way_rule_12, ['railway']),
+        (_way_rule_13, ['railway']),
+    ])
+
+    def way(self, data, tags, nds):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
         return err
 
 
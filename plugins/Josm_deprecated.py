@@ -62,13 +62,8 @@ class Josm_deprecated(PluginMapCSS):
         self.re_7d409ed5 = re.compile(r'(?i)(_bbq)')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-        set_bbq_autofix = set_beam_pump_no_mech = set_diaper___checked = set_diaper_checked = set_generic_power_tower_type_warning = set_levels_building = set_parcel_fixable = set_power_pole_type_warning = set_power_tower_type_warning = set_pumping_ring_no_mech = set_samebuildingcolor = set_sameroofcolor = False
-
-        # *[barrier=wire_fence]
+    # *[barrier=wire_fence]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('barrier' in keys):
             match = False
             if not match:
@@ -87,7 +82,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['fence_type','chain_link']])
                 }})
 
-        # *[barrier=wood_fence]
+    # *[barrier=wood_fence]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('barrier' in keys):
             match = False
             if not match:
@@ -106,29 +102,30 @@ class Josm_deprecated(PluginMapCSS):
                     ['fence_type','wood']])
                 }})
 
-        # node[highway=ford]
-        # Rule Blacklisted (id: 1317841090)
+    # node[highway=ford]
+    # Rule Blacklisted (id: 1317841090)
 
-        # *[highway=stile]
-        # Rule Blacklisted (id: 1435678043)
+    # *[highway=stile]
+    # Rule Blacklisted (id: 1435678043)
 
-        # *[highway=incline]
-        # Rule Blacklisted (id: 765169083)
+    # *[highway=incline]
+    # Rule Blacklisted (id: 765169083)
 
-        # *[highway=incline_steep]
-        # Rule Blacklisted (id: 1966772390)
+    # *[highway=incline_steep]
+    # Rule Blacklisted (id: 1966772390)
 
-        # *[highway=unsurfaced]
-        # Rule Blacklisted (id: 20631498)
+    # *[highway=unsurfaced]
+    # Rule Blacklisted (id: 20631498)
 
-        # *[landuse=wood]
-        # Rule Blacklisted (id: 469903103)
+    # *[landuse=wood]
+    # Rule Blacklisted (id: 469903103)
 
-        # *[natural=marsh]
-        # Rule Blacklisted (id: 1459865523)
+    # *[natural=marsh]
+    # Rule Blacklisted (id: 1459865523)
 
-        # *[landuse=reservoir][!reservoir_type]
-        # *[landuse=reservoir][reservoir_type=water_storage]
+    # *[landuse=reservoir][!reservoir_type]
+    # *[landuse=reservoir][reservoir_type=water_storage]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('landuse' in keys) or ('landuse' in keys and 'reservoir_type' in keys):
             match = False
             if not match:
@@ -154,7 +151,8 @@ class Josm_deprecated(PluginMapCSS):
                     'reservoir_type'])
                 }})
 
-        # *[landuse=reservoir][reservoir_type=tailings]
+    # *[landuse=reservoir][reservoir_type=tailings]
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('landuse' in keys and 'reservoir_type' in keys):
             match = False
             if not match:
@@ -176,7 +174,8 @@ class Josm_deprecated(PluginMapCSS):
                     'reservoir_type'])
                 }})
 
-        # *[landuse=reservoir][reservoir_type=evaporator]
+    # *[landuse=reservoir][reservoir_type=evaporator]
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if ('landuse' in keys and 'reservoir_type' in keys):
             match = False
             if not match:
@@ -189,7 +188,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"basin=evaporation or landuse=salt_pond"
                 err.append({'class': 9002001, 'subclass': 1494361034, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[landuse=reservoir][reservoir_type=sewage]
+    # *[landuse=reservoir][reservoir_type=sewage]
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('landuse' in keys and 'reservoir_type' in keys):
             match = False
             if not match:
@@ -202,19 +202,20 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=water + water=wastewater or landuse=basin + basin=settling or man_made=basin + basin=settling"
                 err.append({'class': 9002001, 'subclass': 833262066, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[highway=byway]
-        # Rule Blacklisted (id: 1844620979)
+    # *[highway=byway]
+    # Rule Blacklisted (id: 1844620979)
 
-        # *[power_source]
-        # Rule Blacklisted (id: 34751027)
+    # *[power_source]
+    # Rule Blacklisted (id: 34751027)
 
-        # *[power_rating]
-        # Rule Blacklisted (id: 904750343)
+    # *[power_rating]
+    # Rule Blacklisted (id: 904750343)
 
-        # *[shop=antique]
-        # Rule Blacklisted (id: 596668979)
+    # *[shop=antique]
+    # Rule Blacklisted (id: 596668979)
 
-        # *[shop=bags]
+    # *[shop=bags]
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -231,7 +232,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','bag']])
                 }})
 
-        # *[shop=fashion]
+    # *[shop=fashion]
+    def _node_rule_7(self, data, tags, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -248,10 +250,11 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','clothes']])
                 }})
 
-        # *[shop=organic]
-        # Rule Blacklisted (id: 1959365145)
+    # *[shop=organic]
+    # Rule Blacklisted (id: 1959365145)
 
-        # *[shop=pets]
+    # *[shop=pets]
+    def _node_rule_8(self, data, tags, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -268,7 +271,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','pet']])
                 }})
 
-        # *[shop=pharmacy]
+    # *[shop=pharmacy]
+    def _node_rule_9(self, data, tags, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -287,7 +291,8 @@ class Josm_deprecated(PluginMapCSS):
                     'shop'])
                 }})
 
-        # *[bicycle_parking=sheffield]
+    # *[bicycle_parking=sheffield]
+    def _node_rule_10(self, data, tags, keys, err, sets):
         if ('bicycle_parking' in keys):
             match = False
             if not match:
@@ -304,19 +309,20 @@ class Josm_deprecated(PluginMapCSS):
                     ['bicycle_parking','stands']])
                 }})
 
-        # *[amenity=emergency_phone]
-        # Rule Blacklisted (id: 1108230656)
+    # *[amenity=emergency_phone]
+    # Rule Blacklisted (id: 1108230656)
 
-        # *[sport=gaelic_football]
-        # Rule Blacklisted (id: 1768681881)
+    # *[sport=gaelic_football]
+    # Rule Blacklisted (id: 1768681881)
 
-        # *[power=station]
-        # Rule Blacklisted (id: 52025933)
+    # *[power=station]
+    # Rule Blacklisted (id: 52025933)
 
-        # *[power=sub_station]
-        # Rule Blacklisted (id: 1423074682)
+    # *[power=sub_station]
+    # Rule Blacklisted (id: 1423074682)
 
-        # *[location=rooftop]
+    # *[location=rooftop]
+    def _node_rule_11(self, data, tags, keys, err, sets):
         if ('location' in keys):
             match = False
             if not match:
@@ -333,7 +339,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['location','roof']])
                 }})
 
-        # *[generator:location]
+    # *[generator:location]
+    def _node_rule_12(self, data, tags, keys, err, sets):
         if ('generator:location' in keys):
             match = False
             if not match:
@@ -352,7 +359,8 @@ class Josm_deprecated(PluginMapCSS):
                     'generator:location'])
                 }})
 
-        # *[generator:method=dam]
+    # *[generator:method=dam]
+    def _node_rule_13(self, data, tags, keys, err, sets):
         if ('generator:method' in keys):
             match = False
             if not match:
@@ -369,7 +377,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['generator:method','water-storage']])
                 }})
 
-        # *[generator:method=pumped-storage]
+    # *[generator:method=pumped-storage]
+    def _node_rule_14(self, data, tags, keys, err, sets):
         if ('generator:method' in keys):
             match = False
             if not match:
@@ -386,7 +395,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['generator:method','water-pumped-storage']])
                 }})
 
-        # *[generator:method=pumping]
+    # *[generator:method=pumping]
+    def _node_rule_15(self, data, tags, keys, err, sets):
         if ('generator:method' in keys):
             match = False
             if not match:
@@ -403,7 +413,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['generator:method','water-pumped-storage']])
                 }})
 
-        # *[fence_type=chain]
+    # *[fence_type=chain]
+    def _node_rule_16(self, data, tags, keys, err, sets):
         if ('fence_type' in keys):
             match = False
             if not match:
@@ -417,10 +428,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"barrier=fence + fence_type=chain_link"
                 err.append({'class': 9002001, 'subclass': 19409288, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[building=entrance]
-        # Rule Blacklisted (id: 306662985)
+    # *[building=entrance]
+    # Rule Blacklisted (id: 306662985)
 
-        # *[board_type=board]
+    # *[board_type=board]
+    def _node_rule_17(self, data, tags, keys, err, sets):
         if ('board_type' in keys):
             match = False
             if not match:
@@ -436,7 +448,8 @@ class Josm_deprecated(PluginMapCSS):
                     'board_type'])
                 }})
 
-        # *[man_made=measurement_station]
+    # *[man_made=measurement_station]
+    def _node_rule_18(self, data, tags, keys, err, sets):
         if ('man_made' in keys):
             match = False
             if not match:
@@ -453,7 +466,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['man_made','monitoring_station']])
                 }})
 
-        # *[measurement=water_level]
+    # *[measurement=water_level]
+    def _node_rule_19(self, data, tags, keys, err, sets):
         if ('measurement' in keys):
             match = False
             if not match:
@@ -473,7 +487,8 @@ class Josm_deprecated(PluginMapCSS):
                     'measurement'])
                 }})
 
-        # *[measurement=weather]
+    # *[measurement=weather]
+    def _node_rule_20(self, data, tags, keys, err, sets):
         if ('measurement' in keys):
             match = False
             if not match:
@@ -493,7 +508,8 @@ class Josm_deprecated(PluginMapCSS):
                     'measurement'])
                 }})
 
-        # *[measurement=seismic]
+    # *[measurement=seismic]
+    def _node_rule_21(self, data, tags, keys, err, sets):
         if ('measurement' in keys):
             match = False
             if not match:
@@ -513,7 +529,8 @@ class Josm_deprecated(PluginMapCSS):
                     'measurement'])
                 }})
 
-        # *[monitoring:river_level]
+    # *[monitoring:river_level]
+    def _node_rule_22(self, data, tags, keys, err, sets):
         if ('monitoring:river_level' in keys):
             match = False
             if not match:
@@ -532,7 +549,8 @@ class Josm_deprecated(PluginMapCSS):
                     'monitoring:river_level'])
                 }})
 
-        # *[stay]
+    # *[stay]
+    def _node_rule_23(self, data, tags, keys, err, sets):
         if ('stay' in keys):
             match = False
             if not match:
@@ -551,18 +569,19 @@ class Josm_deprecated(PluginMapCSS):
                     'stay'])
                 }})
 
-        # *[emergency=aed]
-        # Rule Blacklisted (id: 707111885)
+    # *[emergency=aed]
+    # Rule Blacklisted (id: 707111885)
 
-        # *[day_on][!restriction]
-        # *[day_off][!restriction]
-        # *[date_on][!restriction]
-        # *[date_off][!restriction]
-        # *[hour_on][!restriction]
-        # *[hour_off][!restriction]
-        # Rule Blacklisted (id: 294264920)
+    # *[day_on][!restriction]
+    # *[day_off][!restriction]
+    # *[date_on][!restriction]
+    # *[date_off][!restriction]
+    # *[hour_on][!restriction]
+    # *[hour_off][!restriction]
+    # Rule Blacklisted (id: 294264920)
 
-        # *[access=designated]
+    # *[access=designated]
+    def _node_rule_24(self, data, tags, keys, err, sets):
         if ('access' in keys):
             match = False
             if not match:
@@ -573,7 +592,8 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("''{0}'' is meaningless, use more specific tags, e.g. ''{1}''","access=designated","bicycle=designated")
                 err.append({'class': 9002002, 'subclass': 2057594338, 'text': mapcss.tr('\'\'{0}\'\' is meaningless, use more specific tags, e.g. \'\'{1}\'\'', 'access=designated', 'bicycle=designated')})
 
-        # *[access=official]
+    # *[access=official]
+    def _node_rule_25(self, data, tags, keys, err, sets):
         if ('access' in keys):
             match = False
             if not match:
@@ -584,8 +604,9 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("''{0}'' does not specify the official mode of transportation, use ''{1}'' for example","access=official","bicycle=official")
                 err.append({'class': 9002003, 'subclass': 1909133836, 'text': mapcss.tr('\'\'{0}\'\' does not specify the official mode of transportation, use \'\'{1}\'\' for example', 'access=official', 'bicycle=official')})
 
-        # *[fixme=yes]
-        # *[FIXME=yes]
+    # *[fixme=yes]
+    # *[FIXME=yes]
+    def _node_rule_26(self, data, tags, keys, err, sets):
         if ('FIXME' in keys) or ('fixme' in keys):
             match = False
             if not match:
@@ -600,7 +621,8 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0}={1} is unspecific. Instead of ''{1}'' please give more information about what exactly should be fixed.","{0.key}","{0.value}")
                 err.append({'class': 9002004, 'subclass': 136657482, 'text': mapcss.tr('{0}={1} is unspecific. Instead of \'\'{1}\'\' please give more information about what exactly should be fixed.', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[name][name=~/^(?i)fixme$/]
+    # *[name][name=~/^(?i)fixme$/]
+    def _node_rule_27(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -619,7 +641,8 @@ class Josm_deprecated(PluginMapCSS):
                     'name'])
                 }})
 
-        # *[note][note=~/^(?i)fixme$/]
+    # *[note][note=~/^(?i)fixme$/]
+    def _node_rule_28(self, data, tags, keys, err, sets):
         if ('note' in keys):
             match = False
             if not match:
@@ -630,8 +653,9 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is unspecific. Instead use the key fixme with the information what exactly should be fixed in the value of fixme.","{0.tag}")
                 err.append({'class': 9002006, 'subclass': 1243120287, 'text': mapcss.tr('{0} is unspecific. Instead use the key fixme with the information what exactly should be fixed in the value of fixme.', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[type=broad_leaved]
-        # *[type=broad_leafed]
+    # *[type=broad_leaved]
+    # *[type=broad_leafed]
+    def _node_rule_29(self, data, tags, keys, err, sets):
         if ('type' in keys):
             match = False
             if not match:
@@ -655,9 +679,10 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[wood=coniferous]
-        # *[type=coniferous]
-        # *[type=conifer]
+    # *[wood=coniferous]
+    # *[type=coniferous]
+    # *[type=conifer]
+    def _node_rule_30(self, data, tags, keys, err, sets):
         if ('type' in keys) or ('wood' in keys):
             match = False
             if not match:
@@ -685,7 +710,8 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[wood=mixed]
+    # *[wood=mixed]
+    def _node_rule_31(self, data, tags, keys, err, sets):
         if ('wood' in keys):
             match = False
             if not match:
@@ -705,8 +731,9 @@ class Josm_deprecated(PluginMapCSS):
                     'wood'])
                 }})
 
-        # *[wood=evergreen]
-        # *[type=evergreen]
+    # *[wood=evergreen]
+    # *[type=evergreen]
+    def _node_rule_32(self, data, tags, keys, err, sets):
         if ('type' in keys) or ('wood' in keys):
             match = False
             if not match:
@@ -730,9 +757,10 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[wood=deciduous]
-        # *[type=deciduous]
-        # *[type=deciduos]
+    # *[wood=deciduous]
+    # *[type=deciduous]
+    # *[type=deciduos]
+    def _node_rule_33(self, data, tags, keys, err, sets):
         if ('type' in keys) or ('wood' in keys):
             match = False
             if not match:
@@ -760,7 +788,8 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # node[type=palm]
+    # node[type=palm]
+    def _node_rule_34(self, data, tags, keys, err, sets):
         if ('type' in keys):
             match = False
             if not match:
@@ -775,10 +804,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"trees"
                 err.append({'class': 9002001, 'subclass': 1453672853, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[natural=land]
-        # Rule Blacklisted (id: 94558529)
+    # *[natural=land]
+    # Rule Blacklisted (id: 94558529)
 
-        # *[bridge=causeway]
+    # *[bridge=causeway]
+    def _node_rule_35(self, data, tags, keys, err, sets):
         if ('bridge' in keys):
             match = False
             if not match:
@@ -793,18 +823,19 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"ford=yes"
                 err.append({'class': 9002001, 'subclass': 461671124, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[bridge=swing]
-        # Rule Blacklisted (id: 1047428067)
+    # *[bridge=swing]
+    # Rule Blacklisted (id: 1047428067)
 
-        # *[bridge=suspension]
-        # Rule Blacklisted (id: 1157046268)
+    # *[bridge=suspension]
+    # Rule Blacklisted (id: 1157046268)
 
-        # *[bridge=pontoon]
-        # Rule Blacklisted (id: 1195531951)
+    # *[bridge=pontoon]
+    # Rule Blacklisted (id: 1195531951)
 
-        # *[fee=interval]
-        # *[lit=interval]
-        # *[supervised=interval]
+    # *[fee=interval]
+    # *[lit=interval]
+    # *[supervised=interval]
+    def _node_rule_36(self, data, tags, keys, err, sets):
         if ('fee' in keys) or ('lit' in keys) or ('supervised' in keys):
             match = False
             if not match:
@@ -824,7 +855,8 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated. Please specify interval by using opening_hours syntax","{0.tag}")
                 err.append({'class': 9002001, 'subclass': 417886592, 'text': mapcss.tr('{0} is deprecated. Please specify interval by using opening_hours syntax', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[/josm\/ignore/]
+    # *[/josm\/ignore/]
+    def _node_rule_37(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -837,10 +869,11 @@ class Josm_deprecated(PluginMapCSS):
                 # fixDeleteObject:this
                 err.append({'class': 9002001, 'subclass': 1402743016, 'text': mapcss.tr('{0} is deprecated. Please delete this object and use a private layer instead', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[sport=diving]
-        # Rule Blacklisted (id: 590643159)
+    # *[sport=diving]
+    # Rule Blacklisted (id: 590643159)
 
-        # *[parking=park_and_ride]
+    # *[parking=park_and_ride]
+    def _node_rule_38(self, data, tags, keys, err, sets):
         if ('parking' in keys):
             match = False
             if not match:
@@ -862,24 +895,25 @@ class Josm_deprecated(PluginMapCSS):
                     'parking'])
                 }})
 
-        # *[parking=yes]
-        # *[playground=yes]
-        # *[manhole=plain]
-        # *[manhole=unknown]
-        # *[manhole=yes]
-        # *[police=yes]
-        # *[traffic_calming=yes]
-        # *[access=restricted]
-        # *[barrier=yes]
-        # *[aerialway=yes][!public_transport]
-        # *[amenity=yes]
-        # *[leisure=yes]
-        # *[landuse=yes]
-        # *[shop="*"]
-        # *[shop=yes][amenity!=fuel]
-        # *[craft=yes]
-        # *[service=yes]
-        # *[place=yes]
+    # *[parking=yes]
+    # *[playground=yes]
+    # *[manhole=plain]
+    # *[manhole=unknown]
+    # *[manhole=yes]
+    # *[police=yes]
+    # *[traffic_calming=yes]
+    # *[access=restricted]
+    # *[barrier=yes]
+    # *[aerialway=yes][!public_transport]
+    # *[amenity=yes]
+    # *[leisure=yes]
+    # *[landuse=yes]
+    # *[shop="*"]
+    # *[shop=yes][amenity!=fuel]
+    # *[craft=yes]
+    # *[service=yes]
+    # *[place=yes]
+    def _node_rule_39(self, data, tags, keys, err, sets):
         if ('access' in keys) or ('aerialway' in keys) or ('amenity' in keys) or ('barrier' in keys) or ('craft' in keys) or ('landuse' in keys) or ('leisure' in keys) or ('manhole' in keys) or ('parking' in keys) or ('place' in keys) or ('playground' in keys) or ('police' in keys) or ('service' in keys) or ('shop' in keys) or ('traffic_calming' in keys):
             match = False
             if not match:
@@ -958,13 +992,14 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0}={1} is unspecific. Please replace ''{1}'' by a specific value.","{0.key}","{0.value}")
                 err.append({'class': 9002007, 'subclass': 1452069773, 'text': mapcss.tr('{0}={1} is unspecific. Please replace \'\'{1}\'\' by a specific value.', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[place_name][!name]
-        # Rule Blacklisted (id: 1089331760)
+    # *[place_name][!name]
+    # Rule Blacklisted (id: 1089331760)
 
-        # *[place][place_name=*name]
-        # Rule Blacklisted (id: 1116761280)
+    # *[place][place_name=*name]
+    # Rule Blacklisted (id: 1116761280)
 
-        # *[waterway=water_point]
+    # *[waterway=water_point]
+    def _node_rule_40(self, data, tags, keys, err, sets):
         if ('waterway' in keys):
             match = False
             if not match:
@@ -983,7 +1018,8 @@ class Josm_deprecated(PluginMapCSS):
                     'waterway'])
                 }})
 
-        # *[waterway=waste_disposal]
+    # *[waterway=waste_disposal]
+    def _node_rule_41(self, data, tags, keys, err, sets):
         if ('waterway' in keys):
             match = False
             if not match:
@@ -1002,7 +1038,8 @@ class Josm_deprecated(PluginMapCSS):
                     'waterway'])
                 }})
 
-        # *[waterway=mooring]
+    # *[waterway=mooring]
+    def _node_rule_42(self, data, tags, keys, err, sets):
         if ('waterway' in keys):
             match = False
             if not match:
@@ -1022,8 +1059,9 @@ class Josm_deprecated(PluginMapCSS):
                     'waterway'])
                 }})
 
-        # *[building][levels]
-        # *[building:part][levels]
+    # *[building][levels]
+    # *[building:part][levels]
+    def _node_rule_43(self, data, tags, keys, err, sets):
         if ('building' in keys and 'levels' in keys) or ('building:part' in keys and 'levels' in keys):
             match = False
             if not match:
@@ -1040,7 +1078,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{1.key}")
                 # suggestAlternative:"building:levels"
                 # fixChangeKey:"levels => building:levels"
-                set_levels_building = True
+                sets.add('levels_building')
                 err.append({'class': 9002001, 'subclass': 869936714, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{1.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['building:levels', mapcss.tag(tags, 'levels')]]),
@@ -1048,18 +1086,20 @@ class Josm_deprecated(PluginMapCSS):
                     'levels'])
                 }})
 
-        # *[levels]!.levels_building
+    # *[levels]!.levels_building
+    def _node_rule_44(self, data, tags, keys, err, sets):
         if ('levels' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_levels_building) and (mapcss._tag_capture(capture_tags, 0, tags, 'levels')))
+                try: match = (('levels_building' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'levels')))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwWarning:tr("Unusual key {0}, maybe {1} or {2} is meant","{0.key}","level","building:levels")
                 err.append({'class': 9002021, 'subclass': 1172699526, 'text': mapcss.tr('Unusual key {0}, maybe {1} or {2} is meant', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'level', 'building:levels')})
 
-        # *[building:level][!building:levels]
+    # *[building:level][!building:levels]
+    def _node_rule_45(self, data, tags, keys, err, sets):
         if ('building:level' in keys):
             match = False
             if not match:
@@ -1078,7 +1118,8 @@ class Josm_deprecated(PluginMapCSS):
                     'building:level'])
                 }})
 
-        # *[building:level][building:levels]
+    # *[building:level][building:levels]
+    def _node_rule_46(self, data, tags, keys, err, sets):
         if ('building:level' in keys and 'building:levels' in keys):
             match = False
             if not match:
@@ -1091,7 +1132,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"building:levels"
                 err.append({'class': 9002001, 'subclass': 902689123, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[protected_class]
+    # *[protected_class]
+    def _node_rule_47(self, data, tags, keys, err, sets):
         if ('protected_class' in keys):
             match = False
             if not match:
@@ -1110,19 +1152,20 @@ class Josm_deprecated(PluginMapCSS):
                     'protected_class'])
                 }})
 
-        # *[kerb=unknown]
-        # *[lock=unknown]
-        # *[hide=unknown]
-        # *[shelter=unknown]
-        # *[access=unknown]
-        # *[capacity:parent=unknown]
-        # *[capacity:women=unknown]
-        # *[capacity:disabled=unknown]
-        # *[crossing=unknown]
-        # *[foot=unknown]
-        # Rule Blacklisted (id: 1052866123)
-
-        # *[sport=skiing]
+    # *[kerb=unknown]
+    # *[lock=unknown]
+    # *[hide=unknown]
+    # *[shelter=unknown]
+    # *[access=unknown]
+    # *[capacity:parent=unknown]
+    # *[capacity:women=unknown]
+    # *[capacity:disabled=unknown]
+    # *[crossing=unknown]
+    # *[foot=unknown]
+    # Rule Blacklisted (id: 1052866123)
+
+    # *[sport=skiing]
+    def _node_rule_48(self, data, tags, keys, err, sets):
         if ('sport' in keys):
             match = False
             if not match:
@@ -1135,28 +1178,29 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:tr("{0} + {1} + {2}","piste:type=*","piste:difficulty=*","piste:grooming=*")
                 err.append({'class': 9002001, 'subclass': 1578959559, 'text': mapcss.tr('Definition of {0} is unclear', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[waterway=wadi]
-        # Rule Blacklisted (id: 719234223)
+    # *[waterway=wadi]
+    # Rule Blacklisted (id: 719234223)
 
-        # *[drinkable]
-        # Rule Blacklisted (id: 1785584789)
+    # *[drinkable]
+    # Rule Blacklisted (id: 1785584789)
 
-        # *[color][!colour]
-        # Rule Blacklisted (id: 1850270072)
+    # *[color][!colour]
+    # Rule Blacklisted (id: 1850270072)
 
-        # *[color][colour][color=*colour]
-        # Rule Blacklisted (id: 1825345743)
+    # *[color][colour][color=*colour]
+    # Rule Blacklisted (id: 1825345743)
 
-        # *[color][colour]!.samecolor
-        # Rule Blacklisted (id: 1064658218)
+    # *[color][colour]!.samecolor
+    # Rule Blacklisted (id: 1064658218)
 
-        # *[building:color][building:colour]!.samebuildingcolor
-        # Rule Blacklisted (id: 740601387)
+    # *[building:color][building:colour]!.samebuildingcolor
+    # Rule Blacklisted (id: 740601387)
 
-        # *[roof:color][roof:colour]!.sameroofcolor
-        # Rule Blacklisted (id: 512779280)
+    # *[roof:color][roof:colour]!.sameroofcolor
+    # Rule Blacklisted (id: 512779280)
 
-        # *[/:color/][!building:color][!roof:color][!gpxd:color]
+    # *[/:color/][!building:color][!roof:color][!gpxd:color]
+    def _node_rule_49(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -1169,7 +1213,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:":colour"
                 err.append({'class': 9002001, 'subclass': 1632389707, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[/color:/]
+    # *[/color:/]
+    def _node_rule_50(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -1182,11 +1227,12 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"colour:"
                 err.append({'class': 9002001, 'subclass': 1390370717, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[/=|\+|\/|&|<|>|;|'|"|%|#|@|\\|,|\.|\{|\}|\?|\*|\^|\$/]
-        # Rule Blacklisted (id: 1752615188)
+    # *[/=|\+|\/|&|<|>|;|'|"|%|#|@|\\|,|\.|\{|\}|\?|\*|\^|\$/]
+    # Rule Blacklisted (id: 1752615188)
 
-        # *[/^.$/]
-        # node[/^..$/][!kp][!pk]
+    # *[/^.$/]
+    # node[/^..$/][!kp][!pk]
+    def _node_rule_51(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -1205,12 +1251,13 @@ class Josm_deprecated(PluginMapCSS):
                 # assertNoMatch:"node pk=7"
                 err.append({'class': 9002012, 'subclass': 79709106, 'text': mapcss.tr('uncommon short key')})
 
-        # *[sport=hockey]
-        # Rule Blacklisted (id: 651933474)
+    # *[sport=hockey]
+    # Rule Blacklisted (id: 651933474)
 
-        # *[sport=billard]
-        # *[sport=billards]
-        # *[sport=billiard]
+    # *[sport=billard]
+    # *[sport=billards]
+    # *[sport=billiard]
+    def _node_rule_52(self, data, tags, keys, err, sets):
         if ('sport' in keys):
             match = False
             if not match:
@@ -1235,10 +1282,11 @@ class Josm_deprecated(PluginMapCSS):
                     ['sport','billiards']])
                 }})
 
-        # *[payment:ep_quick]
-        # *[payment:ep_cash]
-        # *[payment:ep_proton]
-        # *[payment:ep_chipknip]
+    # *[payment:ep_quick]
+    # *[payment:ep_cash]
+    # *[payment:ep_proton]
+    # *[payment:ep_chipknip]
+    def _node_rule_53(self, data, tags, keys, err, sets):
         if ('payment:ep_cash' in keys) or ('payment:ep_chipknip' in keys) or ('payment:ep_proton' in keys) or ('payment:ep_quick' in keys):
             match = False
             if not match:
@@ -1266,7 +1314,8 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[kp][railway!=milestone]
+    # *[kp][railway!=milestone]
+    def _node_rule_54(self, data, tags, keys, err, sets):
         if ('kp' in keys):
             match = False
             if not match:
@@ -1285,7 +1334,8 @@ class Josm_deprecated(PluginMapCSS):
                     'kp'])
                 }})
 
-        # *[pk][railway!=milestone]
+    # *[pk][railway!=milestone]
+    def _node_rule_55(self, data, tags, keys, err, sets):
         if ('pk' in keys):
             match = False
             if not match:
@@ -1304,7 +1354,8 @@ class Josm_deprecated(PluginMapCSS):
                     'pk'])
                 }})
 
-        # *[kp][railway=milestone]
+    # *[kp][railway=milestone]
+    def _node_rule_56(self, data, tags, keys, err, sets):
         if ('kp' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1323,7 +1374,8 @@ class Josm_deprecated(PluginMapCSS):
                     'kp'])
                 }})
 
-        # *[pk][railway=milestone]
+    # *[pk][railway=milestone]
+    def _node_rule_57(self, data, tags, keys, err, sets):
         if ('pk' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1342,7 +1394,8 @@ class Josm_deprecated(PluginMapCSS):
                     'pk'])
                 }})
 
-        # *[distance][railway=milestone]
+    # *[distance][railway=milestone]
+    def _node_rule_58(self, data, tags, keys, err, sets):
         if ('distance' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1361,7 +1414,8 @@ class Josm_deprecated(PluginMapCSS):
                     'distance'])
                 }})
 
-        # *[postcode]
+    # *[postcode]
+    def _node_rule_59(self, data, tags, keys, err, sets):
         if ('postcode' in keys):
             match = False
             if not match:
@@ -1375,7 +1429,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"postal_code"
                 err.append({'class': 9002001, 'subclass': 1942523538, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[water=intermittent]
+    # *[water=intermittent]
+    def _node_rule_60(self, data, tags, keys, err, sets):
         if ('water' in keys):
             match = False
             if not match:
@@ -1395,13 +1450,14 @@ class Josm_deprecated(PluginMapCSS):
                     'water'])
                 }})
 
-        # node[type][pipeline=marker]
-        # Rule Blacklisted (id: 1878458659)
+    # node[type][pipeline=marker]
+    # Rule Blacklisted (id: 1878458659)
 
-        # *[landuse=farm]
-        # Rule Blacklisted (id: 1968473048)
+    # *[landuse=farm]
+    # Rule Blacklisted (id: 1968473048)
 
-        # *[seamark=buoy]["seamark:type"=~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    # *[seamark=buoy]["seamark:type"=~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    def _node_rule_61(self, data, tags, keys, err, sets):
         if ('seamark' in keys and 'seamark:type' in keys):
             match = False
             if not match:
@@ -1418,7 +1474,8 @@ class Josm_deprecated(PluginMapCSS):
                     'seamark'])
                 }})
 
-        # *[seamark=buoy]["seamark:type"!~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    # *[seamark=buoy]["seamark:type"!~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    def _node_rule_62(self, data, tags, keys, err, sets):
         if ('seamark' in keys):
             match = False
             if not match:
@@ -1431,7 +1488,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"{1.tag}"
                 err.append({'class': 9002001, 'subclass': 1481035998, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[landuse=conservation]
+    # *[landuse=conservation]
+    def _node_rule_63(self, data, tags, keys, err, sets):
         if ('landuse' in keys):
             match = False
             if not match:
@@ -1451,16 +1509,17 @@ class Josm_deprecated(PluginMapCSS):
                     'landuse'])
                 }})
 
-        # *[amenity=kiosk]
-        # Rule Blacklisted (id: 1331930630)
+    # *[amenity=kiosk]
+    # Rule Blacklisted (id: 1331930630)
 
-        # *[amenity=shop]
-        # Rule Blacklisted (id: 1562207150)
+    # *[amenity=shop]
+    # Rule Blacklisted (id: 1562207150)
 
-        # *[shop=fishmonger]
-        # Rule Blacklisted (id: 1376789416)
+    # *[shop=fishmonger]
+    # Rule Blacklisted (id: 1376789416)
 
-        # *[shop=fish]
+    # *[shop=fish]
+    def _node_rule_64(self, data, tags, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -1475,7 +1534,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=seafood"
                 err.append({'class': 9002001, 'subclass': 47191734, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[shop=betting]
+    # *[shop=betting]
+    def _node_rule_65(self, data, tags, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -1493,10 +1553,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=lottery"
                 err.append({'class': 9002001, 'subclass': 1035501389, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[shop=perfume]
-        # Rule Blacklisted (id: 2075099676)
+    # *[shop=perfume]
+    # Rule Blacklisted (id: 2075099676)
 
-        # *[amenity=exercise_point]
+    # *[amenity=exercise_point]
+    def _node_rule_66(self, data, tags, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -1516,16 +1577,17 @@ class Josm_deprecated(PluginMapCSS):
                     'amenity'])
                 }})
 
-        # *[shop=auto_parts]
-        # Rule Blacklisted (id: 1675828779)
+    # *[shop=auto_parts]
+    # Rule Blacklisted (id: 1675828779)
 
-        # *[amenity=car_repair]
-        # Rule Blacklisted (id: 1681273585)
+    # *[amenity=car_repair]
+    # Rule Blacklisted (id: 1681273585)
 
-        # *[amenity=studio][type=audio]
-        # *[amenity=studio][type=radio]
-        # *[amenity=studio][type=television]
-        # *[amenity=studio][type=video]
+    # *[amenity=studio][type=audio]
+    # *[amenity=studio][type=radio]
+    # *[amenity=studio][type=television]
+    # *[amenity=studio][type=video]
+    def _node_rule_67(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'type' in keys):
             match = False
             if not match:
@@ -1556,10 +1618,11 @@ class Josm_deprecated(PluginMapCSS):
                     'type'])
                 }})
 
-        # *[power=cable_distribution_cabinet]
-        # Rule Blacklisted (id: 1007567078)
+    # *[power=cable_distribution_cabinet]
+    # Rule Blacklisted (id: 1007567078)
 
-        # *[power][location=kiosk]
+    # *[power][location=kiosk]
+    def _node_rule_68(self, data, tags, keys, err, sets):
         if ('location' in keys and 'power' in keys):
             match = False
             if not match:
@@ -1580,7 +1643,8 @@ class Josm_deprecated(PluginMapCSS):
                     'location'])
                 }})
 
-        # *[man_made=well]
+    # *[man_made=well]
+    def _node_rule_69(self, data, tags, keys, err, sets):
         if ('man_made' in keys):
             match = False
             if not match:
@@ -1594,37 +1658,38 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"man_made=water_well"
                 err.append({'class': 9002001, 'subclass': 1740864107, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=dog_bin]
-        # *[amenity=dog_waste_bin]
-        # Rule Blacklisted (id: 2091877281)
+    # *[amenity=dog_bin]
+    # *[amenity=dog_waste_bin]
+    # Rule Blacklisted (id: 2091877281)
 
-        # *[amenity=artwork]
-        # Rule Blacklisted (id: 728429076)
+    # *[amenity=artwork]
+    # Rule Blacklisted (id: 728429076)
 
-        # *[amenity=community_center]
-        # Rule Blacklisted (id: 690512681)
+    # *[amenity=community_center]
+    # Rule Blacklisted (id: 690512681)
 
-        # *[man_made=cut_line]
-        # Rule Blacklisted (id: 1008752382)
+    # *[man_made=cut_line]
+    # Rule Blacklisted (id: 1008752382)
 
-        # *[amenity=park]
-        # Rule Blacklisted (id: 2085280194)
+    # *[amenity=park]
+    # Rule Blacklisted (id: 2085280194)
 
-        # *[amenity=hotel]
-        # Rule Blacklisted (id: 1341786818)
+    # *[amenity=hotel]
+    # Rule Blacklisted (id: 1341786818)
 
-        # *[shop=window]
-        # *[shop=windows]
-        # Rule Blacklisted (id: 532391183)
+    # *[shop=window]
+    # *[shop=windows]
+    # Rule Blacklisted (id: 532391183)
 
-        # *[amenity=education]
-        # Rule Blacklisted (id: 796960259)
+    # *[amenity=education]
+    # Rule Blacklisted (id: 796960259)
 
-        # *[shop=gallery]
-        # Rule Blacklisted (id: 1319611546)
+    # *[shop=gallery]
+    # Rule Blacklisted (id: 1319611546)
 
-        # *[shop=gambling]
-        # *[leisure=gambling]
+    # *[shop=gambling]
+    # *[leisure=gambling]
+    def _node_rule_70(self, data, tags, keys, err, sets):
         if ('leisure' in keys) or ('shop' in keys):
             match = False
             if not match:
@@ -1645,11 +1710,12 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=lottery"
                 err.append({'class': 9002001, 'subclass': 1955724853, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[office=real_estate]
-        # *[office=real_estate_agent]
-        # Rule Blacklisted (id: 2027311706)
+    # *[office=real_estate]
+    # *[office=real_estate_agent]
+    # Rule Blacklisted (id: 2027311706)
 
-        # *[shop=glass]
+    # *[shop=glass]
+    def _node_rule_71(self, data, tags, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -1663,20 +1729,21 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=glaziery"
                 err.append({'class': 9002001, 'subclass': 712020531, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=proposed]
-        # *[amenity=disused]
-        # *[shop=disused]
-        # *[highway=abandoned]
-        # *[historic=abandoned]
-        # Rule Blacklisted (id: 847809313)
+    # *[amenity=proposed]
+    # *[amenity=disused]
+    # *[shop=disused]
+    # *[highway=abandoned]
+    # *[historic=abandoned]
+    # Rule Blacklisted (id: 847809313)
 
-        # *[amenity=swimming_pool]
-        # Rule Blacklisted (id: 2012807801)
+    # *[amenity=swimming_pool]
+    # Rule Blacklisted (id: 2012807801)
 
-        # *[amenity=sauna]
-        # Rule Blacklisted (id: 1450116742)
+    # *[amenity=sauna]
+    # Rule Blacklisted (id: 1450116742)
 
-        # *[/^[^t][^i][^g].+_[0-9]$/][!/^note_[0-9]$/][!/^description_[0-9]$/]
+    # *[/^[^t][^i][^g].+_[0-9]$/][!/^note_[0-9]$/][!/^description_[0-9]$/]
+    def _node_rule_72(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -1688,7 +1755,8 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0}","{0.key}")
                 err.append({'class': 9002014, 'subclass': 2081989305, 'text': mapcss.tr('{0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[sport=skating]
+    # *[sport=skating]
+    def _node_rule_73(self, data, tags, keys, err, sets):
         if ('sport' in keys):
             match = False
             if not match:
@@ -1702,7 +1770,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"sport=roller_skating"
                 err.append({'class': 9002001, 'subclass': 170699177, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=public_building]
+    # *[amenity=public_building]
+    def _node_rule_74(self, data, tags, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -1722,10 +1791,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"office=government"
                 err.append({'class': 9002001, 'subclass': 1295642010, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[office=administrative]
-        # Rule Blacklisted (id: 213844674)
+    # *[office=administrative]
+    # Rule Blacklisted (id: 213844674)
 
-        # *[vending=news_papers]
+    # *[vending=news_papers]
+    def _node_rule_75(self, data, tags, keys, err, sets):
         if ('vending' in keys):
             match = False
             if not match:
@@ -1742,7 +1812,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['vending','newspapers']])
                 }})
 
-        # *[service=drive_through]
+    # *[service=drive_through]
+    def _node_rule_76(self, data, tags, keys, err, sets):
         if ('service' in keys):
             match = False
             if not match:
@@ -1759,7 +1830,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['service','drive-through']])
                 }})
 
-        # *[noexit][noexit!=yes][noexit!=no]
+    # *[noexit][noexit!=yes][noexit!=no]
+    def _node_rule_77(self, data, tags, keys, err, sets):
         if ('noexit' in keys):
             match = False
             if not match:
@@ -1770,11 +1842,12 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("The key {0} has an uncommon value.","{1.key}")
                 err.append({'class': 9002017, 'subclass': 1357403556, 'text': mapcss.tr('The key {0} has an uncommon value.', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[name:botanical]
-        # Rule Blacklisted (id: 1061429000)
+    # *[name:botanical]
+    # Rule Blacklisted (id: 1061429000)
 
-        # node[pole=air_to_ground]
-        # node[pole=transition]
+    # node[pole=air_to_ground]
+    # node[pole=transition]
+    def _node_rule_78(self, data, tags, keys, err, sets):
         if ('pole' in keys):
             match = False
             if not match:
@@ -1798,8 +1871,9 @@ class Josm_deprecated(PluginMapCSS):
                     'pole'])
                 }})
 
-        # node[tower=air_to_ground]
-        # node[tower=transition]
+    # node[tower=air_to_ground]
+    # node[tower=transition]
+    def _node_rule_79(self, data, tags, keys, err, sets):
         if ('tower' in keys):
             match = False
             if not match:
@@ -1823,9 +1897,10 @@ class Josm_deprecated(PluginMapCSS):
                     'tower'])
                 }})
 
-        # *[shop=souvenir]
-        # *[shop=souvenirs]
-        # *[shop=souveniers]
+    # *[shop=souvenir]
+    # *[shop=souvenirs]
+    # *[shop=souveniers]
+    def _node_rule_80(self, data, tags, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -1850,7 +1925,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','gift']])
                 }})
 
-        # *[vending=animal_food]
+    # *[vending=animal_food]
+    def _node_rule_81(self, data, tags, keys, err, sets):
         if ('vending' in keys):
             match = False
             if not match:
@@ -1867,8 +1943,9 @@ class Josm_deprecated(PluginMapCSS):
                     ['vending','animal_feed']])
                 }})
 
-        # node[vending=photos][amenity=vending_machine]
-        # node[vending=photo][amenity=vending_machine]
+    # node[vending=photos][amenity=vending_machine]
+    # node[vending=photo][amenity=vending_machine]
+    def _node_rule_82(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'vending' in keys):
             match = False
             if not match:
@@ -1892,7 +1969,8 @@ class Josm_deprecated(PluginMapCSS):
                     'vending'])
                 }})
 
-        # node[vending=photos][amenity!=vending_machine]
+    # node[vending=photos][amenity!=vending_machine]
+    def _node_rule_83(self, data, tags, keys, err, sets):
         if ('vending' in keys):
             match = False
             if not match:
@@ -1905,7 +1983,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"amenity=photo_booth"
                 err.append({'class': 9002001, 'subclass': 1506790891, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[highway=emergency_access_point][phone][!emergency_telephone_code]
+    # node[highway=emergency_access_point][phone][!emergency_telephone_code]
+    def _node_rule_84(self, data, tags, keys, err, sets):
         if ('highway' in keys and 'phone' in keys):
             match = False
             if not match:
@@ -1928,7 +2007,8 @@ class Josm_deprecated(PluginMapCSS):
                     'phone'])
                 }})
 
-        # node[highway=emergency_access_point][phone=*emergency_telephone_code]
+    # node[highway=emergency_access_point][phone=*emergency_telephone_code]
+    def _node_rule_85(self, data, tags, keys, err, sets):
         if ('highway' in keys and 'phone' in keys):
             match = False
             if not match:
@@ -1948,7 +2028,8 @@ class Josm_deprecated(PluginMapCSS):
                     'phone'])
                 }})
 
-        # node[highway=emergency_access_point][phone][emergency_telephone_code][phone!=*emergency_telephone_code]
+    # node[highway=emergency_access_point][phone][emergency_telephone_code][phone!=*emergency_telephone_code]
+    def _node_rule_86(self, data, tags, keys, err, sets):
         if ('emergency_telephone_code' in keys and 'highway' in keys and 'phone' in keys):
             match = False
             if not match:
@@ -1964,8 +2045,9 @@ class Josm_deprecated(PluginMapCSS):
                 # assertNoMatch:"node highway=emergency_access_point phone=123"
                 err.append({'class': 9002001, 'subclass': 663070970, 'text': mapcss.tr('{0} is deprecated for {1}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=hunting_stand][lock=yes]
-        # *[amenity=hunting_stand][lock=no]
+    # *[amenity=hunting_stand][lock=yes]
+    # *[amenity=hunting_stand][lock=no]
+    def _node_rule_87(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'lock' in keys):
             match = False
             if not match:
@@ -1988,17 +2070,18 @@ class Josm_deprecated(PluginMapCSS):
                     'lock'])
                 }})
 
-        # *[amenity=advertising][!advertising]
-        # Rule Blacklisted (id: 1696784412)
+    # *[amenity=advertising][!advertising]
+    # Rule Blacklisted (id: 1696784412)
 
-        # *[amenity=advertising][advertising]
-        # Rule Blacklisted (id: 1538706366)
+    # *[amenity=advertising][advertising]
+    # Rule Blacklisted (id: 1538706366)
 
-        # *[building=true]
-        # *[building="*"]
-        # *[building=Y]
-        # *[building=y]
-        # *[building=1]
+    # *[building=true]
+    # *[building="*"]
+    # *[building=Y]
+    # *[building=y]
+    # *[building=1]
+    def _node_rule_88(self, data, tags, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -2031,16 +2114,17 @@ class Josm_deprecated(PluginMapCSS):
                     ['building','yes']])
                 }})
 
-        # *[building=abandoned]
-        # *[building=address]
-        # *[building=bing]
-        # *[building=collapsed]
-        # *[building=damaged]
-        # *[building=demolished]
-        # *[building=disused]
-        # *[building=fixme]
-        # *[building=occupied]
-        # *[building=razed]
+    # *[building=abandoned]
+    # *[building=address]
+    # *[building=bing]
+    # *[building=collapsed]
+    # *[building=damaged]
+    # *[building=demolished]
+    # *[building=disused]
+    # *[building=fixme]
+    # *[building=occupied]
+    # *[building=razed]
+    def _node_rule_89(self, data, tags, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -2088,11 +2172,12 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is not a building type.","{0.tag}")
                 err.append({'class': 9002001, 'subclass': 938825828, 'text': mapcss.tr('{0} is not a building type.', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[building=other]
-        # *[building=unclassified]
-        # *[building=undefined]
-        # *[building=unknown]
-        # *[building=unidentified]
+    # *[building=other]
+    # *[building=unclassified]
+    # *[building=undefined]
+    # *[building=unknown]
+    # *[building=unidentified]
+    def _node_rule_90(self, data, tags, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -2124,7 +2209,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['building','yes']])
                 }})
 
-        # node[power=transformer][location=pole][transformer]
+    # node[power=transformer][location=pole][transformer]
+    def _node_rule_91(self, data, tags, keys, err, sets):
         if ('location' in keys and 'power' in keys and 'transformer' in keys):
             match = False
             if not match:
@@ -2142,7 +2228,8 @@ class Josm_deprecated(PluginMapCSS):
                     'location'])
                 }})
 
-        # node[power=transformer][location=pole][!transformer]
+    # node[power=transformer][location=pole][!transformer]
+    def _node_rule_92(self, data, tags, keys, err, sets):
         if ('location' in keys and 'power' in keys):
             match = False
             if not match:
@@ -2162,10 +2249,11 @@ class Josm_deprecated(PluginMapCSS):
                     'location'])
                 }})
 
-        # node[tourism=picnic_table]
-        # node[amenity=picnic_table]
-        # node[leisure=picnic]
-        # node[leisure=picnic_site]
+    # node[tourism=picnic_table]
+    # node[amenity=picnic_table]
+    # node[leisure=picnic]
+    # node[leisure=picnic_site]
+    def _node_rule_93(self, data, tags, keys, err, sets):
         if ('amenity' in keys) or ('leisure' in keys) or ('tourism' in keys):
             match = False
             if not match:
@@ -2191,7 +2279,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"tourism=picnic_site"
                 err.append({'class': 9002001, 'subclass': 480506019, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=toilet]
+    # *[amenity=toilet]
+    def _node_rule_94(self, data, tags, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -2208,11 +2297,12 @@ class Josm_deprecated(PluginMapCSS):
                     ['amenity','toilets']])
                 }})
 
-        # *[man_made=MDF]
-        # *[man_made=telephone_exchange]
-        # Rule Blacklisted (id: 634698090)
+    # *[man_made=MDF]
+    # *[man_made=telephone_exchange]
+    # Rule Blacklisted (id: 634698090)
 
-        # *[building=central_office]
+    # *[building=central_office]
+    def _node_rule_95(self, data, tags, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -2231,12 +2321,13 @@ class Josm_deprecated(PluginMapCSS):
                     ['telecom','exchange']])
                 }})
 
-        # *[telecom=central_office]
-        # Rule Blacklisted (id: 1503278830)
+    # *[telecom=central_office]
+    # Rule Blacklisted (id: 1503278830)
 
-        # node[communication=outdoor_dslam]
-        # node[man_made=outdoor_dslam]
-        # node[street_cabinet=outdoor_dslam]
+    # node[communication=outdoor_dslam]
+    # node[man_made=outdoor_dslam]
+    # node[street_cabinet=outdoor_dslam]
+    def _node_rule_96(self, data, tags, keys, err, sets):
         if ('communication' in keys) or ('man_made' in keys) or ('street_cabinet' in keys):
             match = False
             if not match:
@@ -2264,8 +2355,9 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # node[telecom=dslam]
-        # node[telecom=outdoor_dslam]
+    # node[telecom=dslam]
+    # node[telecom=outdoor_dslam]
+    def _node_rule_97(self, data, tags, keys, err, sets):
         if ('telecom' in keys):
             match = False
             if not match:
@@ -2286,10 +2378,11 @@ class Josm_deprecated(PluginMapCSS):
                     ['telecom','service_device']])
                 }})
 
-        # node[amenity=fire_hydrant]
-        # Rule Blacklisted (id: 967497433)
+    # node[amenity=fire_hydrant]
+    # Rule Blacklisted (id: 967497433)
 
-        # node[fire_hydrant:type=pond]
+    # node[fire_hydrant:type=pond]
+    def _node_rule_98(self, data, tags, keys, err, sets):
         if ('fire_hydrant:type' in keys):
             match = False
             if not match:
@@ -2309,7 +2402,8 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # node[fire_hydrant:flow_capacity]
+    # node[fire_hydrant:flow_capacity]
+    def _node_rule_99(self, data, tags, keys, err, sets):
         if ('fire_hydrant:flow_capacity' in keys):
             match = False
             if not match:
@@ -2322,7 +2416,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"flow_rate"
                 err.append({'class': 9002001, 'subclass': 1864683984, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # node[emergency=fire_hydrant][in_service=no]
+    # node[emergency=fire_hydrant][in_service=no]
+    def _node_rule_100(self, data, tags, keys, err, sets):
         if ('emergency' in keys and 'in_service' in keys):
             match = False
             if not match:
@@ -2344,7 +2439,8 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{1.key}')])
                 }})
 
-        # node[fire_hydrant:water_source]
+    # node[fire_hydrant:water_source]
+    def _node_rule_101(self, data, tags, keys, err, sets):
         if ('fire_hydrant:water_source' in keys):
             match = False
             if not match:
@@ -2363,7 +2459,8 @@ class Josm_deprecated(PluginMapCSS):
                     'fire_hydrant:water_source'])
                 }})
 
-        # *[natural=waterfall]
+    # *[natural=waterfall]
+    def _node_rule_102(self, data, tags, keys, err, sets):
         if ('natural' in keys):
             match = False
             if not match:
@@ -2382,7 +2479,8 @@ class Josm_deprecated(PluginMapCSS):
                     'natural'])
                 }})
 
-        # *[religion=unitarian]
+    # *[religion=unitarian]
+    def _node_rule_103(self, data, tags, keys, err, sets):
         if ('religion' in keys):
             match = False
             if not match:
@@ -2399,7 +2497,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['religion','unitarian_universalist']])
                 }})
 
-        # *[shop=shopping_centre]
+    # *[shop=shopping_centre]
+    def _node_rule_104(self, data, tags, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -2416,8 +2515,9 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','mall']])
                 }})
 
-        # *[is_in]
-        # node[/^is_in:/]
+    # *[is_in]
+    # node[/^is_in:/]
+    def _node_rule_105(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -2437,7 +2537,8 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[sport=football]
+    # *[sport=football]
+    def _node_rule_106(self, data, tags, keys, err, sets):
         if ('sport' in keys):
             match = False
             if not match:
@@ -2456,7 +2557,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"sport=soccer"
                 err.append({'class': 9002001, 'subclass': 73038577, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[leisure=common]
+    # *[leisure=common]
+    def _node_rule_107(self, data, tags, keys, err, sets):
         if ('leisure' in keys):
             match = False
             if not match:
@@ -2471,8 +2573,9 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"leisure=*"
                 err.append({'class': 9002001, 'subclass': 157636301, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[cuisine=vegan]
-        # *[cuisine=vegetarian]
+    # *[cuisine=vegan]
+    # *[cuisine=vegetarian]
+    def _node_rule_108(self, data, tags, keys, err, sets):
         if ('cuisine' in keys):
             match = False
             if not match:
@@ -2490,7 +2593,8 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 err.append({'class': 9002001, 'subclass': 43604574, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[kitchen_hours]
+    # *[kitchen_hours]
+    def _node_rule_109(self, data, tags, keys, err, sets):
         if ('kitchen_hours' in keys):
             match = False
             if not match:
@@ -2509,7 +2613,8 @@ class Josm_deprecated(PluginMapCSS):
                     'kitchen_hours'])
                 }})
 
-        # *[shop=money_transfer]
+    # *[shop=money_transfer]
+    def _node_rule_110(self, data, tags, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -2528,7 +2633,8 @@ class Josm_deprecated(PluginMapCSS):
                     'shop'])
                 }})
 
-        # *[contact:google_plus]
+    # *[contact:google_plus]
+    def _node_rule_111(self, data, tags, keys, err, sets):
         if ('contact:google_plus' in keys):
             match = False
             if not match:
@@ -2544,8 +2650,9 @@ class Josm_deprecated(PluginMapCSS):
                     'contact:google_plus'])
                 }})
 
-        # *[amenity=garages]
-        # *[amenity=garage]
+    # *[amenity=garages]
+    # *[amenity=garage]
+    def _node_rule_112(self, data, tags, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -2564,8 +2671,9 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"landuse=garages"
                 err.append({'class': 9002001, 'subclass': 863228118, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[shop=winery]
-        # *[amenity=winery]
+    # *[shop=winery]
+    # *[amenity=winery]
+    def _node_rule_113(self, data, tags, keys, err, sets):
         if ('amenity' in keys) or ('shop' in keys):
             match = False
             if not match:
@@ -2583,7 +2691,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=wine"
                 err.append({'class': 9002001, 'subclass': 1773574987, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=youth_centre]
+    # *[amenity=youth_centre]
+    def _node_rule_114(self, data, tags, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -2602,8 +2711,9 @@ class Josm_deprecated(PluginMapCSS):
                     ['community_centre','youth_centre']])
                 }})
 
-        # *[building:type][building=yes]
-        # *[building:type][!building]
+    # *[building:type][building=yes]
+    # *[building:type][!building]
+    def _node_rule_115(self, data, tags, keys, err, sets):
         if ('building' in keys and 'building:type' in keys) or ('building:type' in keys):
             match = False
             if not match:
@@ -2626,7 +2736,8 @@ class Josm_deprecated(PluginMapCSS):
                     'building:type'])
                 }})
 
-        # *[building:type][building][building!=yes]
+    # *[building:type][building][building!=yes]
+    def _node_rule_116(self, data, tags, keys, err, sets):
         if ('building' in keys and 'building:type' in keys):
             match = False
             if not match:
@@ -2639,19 +2750,20 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"building"
                 err.append({'class': 9002001, 'subclass': 1133239698, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[escalator]
-        # Rule Blacklisted (id: 967271828)
+    # *[escalator]
+    # Rule Blacklisted (id: 967271828)
 
-        # *[historic_name][!old_name]
-        # Rule Blacklisted (id: 1034538127)
+    # *[historic_name][!old_name]
+    # Rule Blacklisted (id: 1034538127)
 
-        # *[historic_name][old_name]
-        # Rule Blacklisted (id: 30762614)
+    # *[historic_name][old_name]
+    # Rule Blacklisted (id: 30762614)
 
-        # *[landuse=field]
-        # Rule Blacklisted (id: 426261497)
+    # *[landuse=field]
+    # Rule Blacklisted (id: 426261497)
 
-        # *[leisure=beach]
+    # *[leisure=beach]
+    def _node_rule_117(self, data, tags, keys, err, sets):
         if ('leisure' in keys):
             match = False
             if not match:
@@ -2665,22 +2777,23 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=beach"
                 err.append({'class': 9002001, 'subclass': 1767286055, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[leisure=club]
-        # Rule Blacklisted (id: 1282397509)
+    # *[leisure=club]
+    # Rule Blacklisted (id: 1282397509)
 
-        # *[leisure=video_arcade]
-        # Rule Blacklisted (id: 1463909830)
+    # *[leisure=video_arcade]
+    # Rule Blacklisted (id: 1463909830)
 
-        # *[man_made=jetty]
-        # Rule Blacklisted (id: 192707176)
+    # *[man_made=jetty]
+    # Rule Blacklisted (id: 192707176)
 
-        # *[man_made=village_pump]
-        # Rule Blacklisted (id: 423232686)
+    # *[man_made=village_pump]
+    # Rule Blacklisted (id: 423232686)
 
-        # *[man_made=water_tank]
-        # Rule Blacklisted (id: 563629665)
+    # *[man_made=water_tank]
+    # Rule Blacklisted (id: 563629665)
 
-        # *[natural=moor]
+    # *[natural=moor]
+    def _node_rule_118(self, data, tags, keys, err, sets):
         if ('natural' in keys):
             match = False
             if not match:
@@ -2699,16 +2812,17 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=wetland"
                 err.append({'class': 9002001, 'subclass': 374637717, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[noexit=no][!fixme]
-        # Rule Blacklisted (id: 647435126)
+    # *[noexit=no][!fixme]
+    # Rule Blacklisted (id: 647435126)
 
-        # *[noexit=no][fixme]
-        # Rule Blacklisted (id: 881828009)
+    # *[noexit=no][fixme]
+    # Rule Blacklisted (id: 881828009)
 
-        # *[shop=dive]
-        # Rule Blacklisted (id: 1582968978)
+    # *[shop=dive]
+    # Rule Blacklisted (id: 1582968978)
 
-        # *[shop=furnace]
+    # *[shop=furnace]
+    def _node_rule_119(self, data, tags, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -2722,17 +2836,18 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=fireplace"
                 err.append({'class': 9002001, 'subclass': 1155821104, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[sport=paragliding]
-        # Rule Blacklisted (id: 1531788430)
+    # *[sport=paragliding]
+    # Rule Blacklisted (id: 1531788430)
 
-        # *[tourism=bed_and_breakfast]
-        # Rule Blacklisted (id: 954237438)
+    # *[tourism=bed_and_breakfast]
+    # Rule Blacklisted (id: 954237438)
 
-        # *[diaper=yes]
-        # *[diaper=no]
-        # Rule Blacklisted (id: 1957125311)
+    # *[diaper=yes]
+    # *[diaper=no]
+    # Rule Blacklisted (id: 1957125311)
 
-        # *[diaper][diaper=~/^[1-9][0-9]*$/]
+    # *[diaper][diaper=~/^[1-9][0-9]*$/]
+    def _node_rule_120(self, data, tags, keys, err, sets):
         if ('diaper' in keys):
             match = False
             if not match:
@@ -2746,7 +2861,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixAdd:"changing_table=yes"
                 # fixChangeKey:"diaper => changing_table:count"
-                set_diaper_checked = True
+                sets.add('diaper_checked')
                 err.append({'class': 9002001, 'subclass': 2105051472, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table','yes'],
@@ -2755,7 +2870,8 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper'])
                 }})
 
-        # *[diaper=room]
+    # *[diaper=room]
+    def _node_rule_121(self, data, tags, keys, err, sets):
         if ('diaper' in keys):
             match = False
             if not match:
@@ -2768,13 +2884,14 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"changing_table=dedicated_room"
                 # suggestAlternative:"changing_table=room"
-                set_diaper_checked = True
+                sets.add('diaper_checked')
                 err.append({'class': 9002001, 'subclass': 883202329, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[diaper]!.diaper_checked
-        # Rule Blacklisted (id: 693675339)
+    # *[diaper]!.diaper_checked
+    # Rule Blacklisted (id: 693675339)
 
-        # *[diaper:male=yes]
+    # *[diaper:male=yes]
+    def _node_rule_122(self, data, tags, keys, err, sets):
         if ('diaper:male' in keys):
             match = False
             if not match:
@@ -2788,7 +2905,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=male_toilet"
                 # fixAdd:"changing_table:location=male_toilet"
                 # fixRemove:"diaper:male"
-                set_diaper___checked = True
+                sets.add('diaper___checked')
                 err.append({'class': 9002001, 'subclass': 799035479, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table:location','male_toilet']]),
@@ -2796,7 +2913,8 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper:male'])
                 }})
 
-        # *[diaper:female=yes]
+    # *[diaper:female=yes]
+    def _node_rule_123(self, data, tags, keys, err, sets):
         if ('diaper:female' in keys):
             match = False
             if not match:
@@ -2810,7 +2928,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=female_toilet"
                 # fixAdd:"changing_table:location=female_toilet"
                 # fixRemove:"diaper:female"
-                set_diaper___checked = True
+                sets.add('diaper___checked')
                 err.append({'class': 9002001, 'subclass': 1450901137, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table:location','female_toilet']]),
@@ -2818,7 +2936,8 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper:female'])
                 }})
 
-        # *[diaper:unisex=yes]
+    # *[diaper:unisex=yes]
+    def _node_rule_124(self, data, tags, keys, err, sets):
         if ('diaper:unisex' in keys):
             match = False
             if not match:
@@ -2832,7 +2951,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=unisex_toilet"
                 # fixAdd:"changing_table:location=unisex_toilet"
                 # fixRemove:"diaper:unisex"
-                set_diaper___checked = True
+                sets.add('diaper___checked')
                 err.append({'class': 9002001, 'subclass': 1460378712, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table:location','unisex_toilet']]),
@@ -2840,8 +2959,9 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper:unisex'])
                 }})
 
-        # *[diaper:wheelchair=yes]
-        # *[diaper:wheelchair=no]
+    # *[diaper:wheelchair=yes]
+    # *[diaper:wheelchair=no]
+    def _node_rule_125(self, data, tags, keys, err, sets):
         if ('diaper:wheelchair' in keys):
             match = False
             if not match:
@@ -2858,7 +2978,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("changing_table:wheelchair=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"diaper:wheelchair => changing_table:wheelchair"
-                set_diaper___checked = True
+                sets.add('diaper___checked')
                 err.append({'class': 9002001, 'subclass': 1951967281, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table:wheelchair', mapcss.tag(tags, 'diaper:wheelchair')]]),
@@ -2866,8 +2986,9 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper:wheelchair'])
                 }})
 
-        # *[diaper:fee=yes]
-        # *[diaper:fee=no]
+    # *[diaper:fee=yes]
+    # *[diaper:fee=no]
+    def _node_rule_126(self, data, tags, keys, err, sets):
         if ('diaper:fee' in keys):
             match = False
             if not match:
@@ -2884,7 +3005,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("changing_table:fee=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"diaper:fee => changing_table:fee"
-                set_diaper___checked = True
+                sets.add('diaper___checked')
                 err.append({'class': 9002001, 'subclass': 2008573526, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table:fee', mapcss.tag(tags, 'diaper:fee')]]),
@@ -2892,12 +3013,13 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper:fee'])
                 }})
 
-        # *[/^diaper:/]!.diaper___checked
+    # *[/^diaper:/]!.diaper___checked
+    def _node_rule_127(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_diaper___checked) and (mapcss._tag_capture(capture_tags, 0, tags, self.re_6029fe03)))
+                try: match = (('diaper___checked' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, self.re_6029fe03)))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("deprecated tagging")
@@ -2905,7 +3027,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:*"
                 err.append({'class': 9002001, 'subclass': 26578864, 'text': mapcss.tr('{0} is deprecated', 'diaper:*')})
 
-        # *[changing_table][changing_table!~/^(yes|no|limited)$/]
+    # *[changing_table][changing_table!~/^(yes|no|limited)$/]
+    def _node_rule_128(self, data, tags, keys, err, sets):
         if ('changing_table' in keys):
             match = False
             if not match:
@@ -2919,7 +3042,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table=yes"
                 err.append({'class': 9002019, 'subclass': 1965225408, 'text': mapcss.tr('wrong value: {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[roof:shape=half_hipped]
+    # *[roof:shape=half_hipped]
+    def _node_rule_129(self, data, tags, keys, err, sets):
         if ('roof:shape' in keys):
             match = False
             if not match:
@@ -2936,7 +3060,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['roof:shape','half-hipped']])
                 }})
 
-        # *[bridge_name]
+    # *[bridge_name]
+    def _node_rule_130(self, data, tags, keys, err, sets):
         if ('bridge_name' in keys):
             match = False
             if not match:
@@ -2955,10 +3080,11 @@ class Josm_deprecated(PluginMapCSS):
                     'bridge_name'])
                 }})
 
-        # *[access=public]
-        # Rule Blacklisted (id: 1115157097)
+    # *[access=public]
+    # Rule Blacklisted (id: 1115157097)
 
-        # *[crossing=island]
+    # *[crossing=island]
+    def _node_rule_131(self, data, tags, keys, err, sets):
         if ('crossing' in keys):
             match = False
             if not match:
@@ -2978,7 +3104,8 @@ class Josm_deprecated(PluginMapCSS):
                     'crossing'])
                 }})
 
-        # *[recycling:metal]
+    # *[recycling:metal]
+    def _node_rule_132(self, data, tags, keys, err, sets):
         if ('recycling:metal' in keys):
             match = False
             if not match:
@@ -2997,7 +3124,8 @@ class Josm_deprecated(PluginMapCSS):
                     'recycling:metal'])
                 }})
 
-        # *[shop=dog_grooming]
+    # *[shop=dog_grooming]
+    def _node_rule_133(self, data, tags, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -3014,8 +3142,9 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','pet_grooming']])
                 }})
 
-        # *[tower:type=anchor]
-        # *[tower:type=suspension]
+    # *[tower:type=anchor]
+    # *[tower:type=suspension]
+    def _node_rule_134(self, data, tags, keys, err, sets):
         if ('tower:type' in keys):
             match = False
             if not match:
@@ -3032,7 +3161,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("line_attachment=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"tower:type => line_attachment"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 180380605, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_attachment', mapcss.tag(tags, 'tower:type')]]),
@@ -3040,8 +3169,9 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=branch][branch:type=split]
-        # *[tower:type=branch][branch:type=loop]
+    # *[tower:type=branch][branch:type=split]
+    # *[tower:type=branch][branch:type=loop]
+    def _node_rule_135(self, data, tags, keys, err, sets):
         if ('branch:type' in keys and 'tower:type' in keys):
             match = False
             if not match:
@@ -3060,7 +3190,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=split"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 362350862, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','split']]),
@@ -3069,8 +3199,9 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=branch][!branch:type]
-        # *[tower:type=branch][branch:type=tap]
+    # *[tower:type=branch][!branch:type]
+    # *[tower:type=branch][branch:type=tap]
+    def _node_rule_136(self, data, tags, keys, err, sets):
         if ('branch:type' in keys and 'tower:type' in keys) or ('tower:type' in keys):
             match = False
             if not match:
@@ -3089,7 +3220,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=branch"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 476423517, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','branch']]),
@@ -3098,7 +3229,8 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=branch][branch:type=cross]
+    # *[tower:type=branch][branch:type=cross]
+    def _node_rule_137(self, data, tags, keys, err, sets):
         if ('branch:type' in keys and 'tower:type' in keys):
             match = False
             if not match:
@@ -3113,7 +3245,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=cross"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 2103059531, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','cross']]),
@@ -3122,7 +3254,8 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=termination]
+    # *[tower:type=termination]
+    def _node_rule_138(self, data, tags, keys, err, sets):
         if ('tower:type' in keys):
             match = False
             if not match:
@@ -3136,7 +3269,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management=termination"
                 # fixAdd:"line_management=termination"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 232235847, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','termination']]),
@@ -3144,7 +3277,8 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=transition]
+    # *[tower:type=transition]
+    def _node_rule_139(self, data, tags, keys, err, sets):
         if ('tower:type' in keys):
             match = False
             if not match:
@@ -3158,7 +3292,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"location:transition=yes"
                 # fixAdd:"location:transition=yes"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 1124904944, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['location:transition','yes']]),
@@ -3166,7 +3300,8 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=transposing]
+    # *[tower:type=transposing]
+    def _node_rule_140(self, data, tags, keys, err, sets):
         if ('tower:type' in keys):
             match = False
             if not match:
@@ -3180,7 +3315,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management=transpose"
                 # fixAdd:"line_management=transpose"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 1795169098, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','transpose']]),
@@ -3188,7 +3323,8 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=crossing]
+    # *[tower:type=crossing]
+    def _node_rule_141(self, data, tags, keys, err, sets):
         if ('tower:type' in keys):
             match = False
             if not match:
@@ -3200,15 +3336,16 @@ class Josm_deprecated(PluginMapCSS):
                 # group:tr("deprecated tagging")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"height=* + design=*"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 1301565974, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[tower:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_tower_type_warning
+    # *[tower:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_tower_type_warning
+    def _node_rule_142(self, data, tags, keys, err, sets):
         if ('power' in keys and 'tower:type' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_power_tower_type_warning) and (mapcss._tag_capture(capture_tags, 0, tags, 'tower:type')) and (mapcss._tag_capture(capture_tags, 1, tags, 'power')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_24dfeb95), mapcss._tag_capture(capture_tags, 2, tags, 'power'))))
+                try: match = (('power_tower_type_warning' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'tower:type')) and (mapcss._tag_capture(capture_tags, 1, tags, 'power')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_24dfeb95), mapcss._tag_capture(capture_tags, 2, tags, 'power'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set generic_power_tower_type_warning
@@ -3219,11 +3356,12 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_attachment"
                 # suggestAlternative:"line_management"
                 # suggestAlternative:"structure"
-                set_generic_power_tower_type_warning = True
+                sets.add('generic_power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 2020421267, 'text': mapcss.tr('{0} is deprecated for {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # node[pole:type=anchor]
-        # node[pole:type=suspension]
+    # node[pole:type=anchor]
+    # node[pole:type=suspension]
+    def _node_rule_143(self, data, tags, keys, err, sets):
         if ('pole:type' in keys):
             match = False
             if not match:
@@ -3240,7 +3378,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("line_attachment=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"pole:type => line_attachment"
-                set_power_pole_type_warning = True
+                sets.add('power_pole_type_warning')
                 err.append({'class': 9002001, 'subclass': 1925507031, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_attachment', mapcss.tag(tags, 'pole:type')]]),
@@ -3248,8 +3386,9 @@ class Josm_deprecated(PluginMapCSS):
                     'pole:type'])
                 }})
 
-        # node[pole:type=branch][branch:type=split]
-        # node[pole:type=branch][branch:type=loop]
+    # node[pole:type=branch][branch:type=split]
+    # node[pole:type=branch][branch:type=loop]
+    def _node_rule_144(self, data, tags, keys, err, sets):
         if ('branch:type' in keys and 'pole:type' in keys):
             match = False
             if not match:
@@ -3268,7 +3407,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=split"
                 # fixRemove:"pole:type"
-                set_power_pole_type_warning = True
+                sets.add('power_pole_type_warning')
                 err.append({'class': 9002001, 'subclass': 1645001021, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','split']]),
@@ -3277,8 +3416,9 @@ class Josm_deprecated(PluginMapCSS):
                     'pole:type'])
                 }})
 
-        # node[pole:type=branch][!branch:type]
-        # node[pole:type=branch][branch:type=tap]
+    # node[pole:type=branch][!branch:type]
+    # node[pole:type=branch][branch:type=tap]
+    def _node_rule_145(self, data, tags, keys, err, sets):
         if ('branch:type' in keys and 'pole:type' in keys) or ('pole:type' in keys):
             match = False
             if not match:
@@ -3297,7 +3437,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=branch"
                 # fixRemove:"pole:type"
-                set_power_pole_type_warning = True
+                sets.add('power_pole_type_warning')
                 err.append({'class': 9002001, 'subclass': 686268660, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','branch']]),
@@ -3306,7 +3446,8 @@ class Josm_deprecated(PluginMapCSS):
                     'pole:type'])
                 }})
 
-        # node[pole:type=branch][branch:type=cross]
+    # node[pole:type=branch][branch:type=cross]
+    def _node_rule_146(self, data, tags, keys, err, sets):
         if ('branch:type' in keys and 'pole:type' in keys):
             match = False
             if not match:
@@ -3321,7 +3462,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=cross"
                 # fixRemove:"pole:type"
-                set_power_pole_type_warning = True
+                sets.add('power_pole_type_warning')
                 err.append({'class': 9002001, 'subclass': 160459065, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','cross']]),
@@ -3330,7 +3471,8 @@ class Josm_deprecated(PluginMapCSS):
                     'pole:type'])
                 }})
 
-        # node[pole:type=termination]
+    # node[pole:type=termination]
+    def _node_rule_147(self, data, tags, keys, err, sets):
         if ('pole:type' in keys):
             match = False
             if not match:
@@ -3344,7 +3486,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management=termination"
                 # fixAdd:"line_management=termination"
                 # fixRemove:"pole:type"
-                set_power_pole_type_warning = True
+                sets.add('power_pole_type_warning')
                 err.append({'class': 9002001, 'subclass': 1675908395, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','termination']]),
@@ -3352,7 +3494,8 @@ class Josm_deprecated(PluginMapCSS):
                     'pole:type'])
                 }})
 
-        # node[pole:type=transition]
+    # node[pole:type=transition]
+    def _node_rule_148(self, data, tags, keys, err, sets):
         if ('pole:type' in keys):
             match = False
             if not match:
@@ -3366,7 +3509,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"location:transition=yes"
                 # fixAdd:"location:transition=yes"
                 # fixRemove:"pole:type"
-                set_power_pole_type_warning = True
+                sets.add('power_pole_type_warning')
                 err.append({'class': 9002001, 'subclass': 1266956723, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['location:transition','yes']]),
@@ -3374,12 +3517,13 @@ class Josm_deprecated(PluginMapCSS):
                     'pole:type'])
                 }})
 
-        # *[pole:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_pole_type_warning!.generic_power_tower_type_warning
+    # *[pole:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_pole_type_warning!.generic_power_tower_type_warning
+    def _node_rule_149(self, data, tags, keys, err, sets):
         if ('pole:type' in keys and 'power' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_power_pole_type_warning) and (not set_generic_power_tower_type_warning) and (mapcss._tag_capture(capture_tags, 0, tags, 'pole:type')) and (mapcss._tag_capture(capture_tags, 1, tags, 'power')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_24dfeb95), mapcss._tag_capture(capture_tags, 2, tags, 'power'))))
+                try: match = (('power_pole_type_warning' not in sets) and ('generic_power_tower_type_warning' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'pole:type')) and (mapcss._tag_capture(capture_tags, 1, tags, 'power')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_24dfeb95), mapcss._tag_capture(capture_tags, 2, tags, 'power'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("deprecated tagging")
@@ -3389,10 +3533,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management"
                 err.append({'class': 9002001, 'subclass': 1513543887, 'text': mapcss.tr('{0} is deprecated for {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # node[man_made=pipeline_marker]
-        # node[pipeline=marker]
-        # node[power=marker]
-        # node[cable=marker]
+    # node[man_made=pipeline_marker]
+    # node[pipeline=marker]
+    # node[power=marker]
+    # node[cable=marker]
+    def _node_rule_150(self, data, tags, keys, err, sets):
         if ('cable' in keys) or ('man_made' in keys) or ('pipeline' in keys) or ('power' in keys):
             match = False
             if not match:
@@ -3417,8 +3562,9 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"marker=* + utility=*"
                 err.append({'class': 9002001, 'subclass': 296597752, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[sloped_curb=yes][!kerb]
-        # *[sloped_curb=both][!kerb]
+    # *[sloped_curb=yes][!kerb]
+    # *[sloped_curb=both][!kerb]
+    def _node_rule_151(self, data, tags, keys, err, sets):
         if ('sloped_curb' in keys):
             match = False
             if not match:
@@ -3442,7 +3588,8 @@ class Josm_deprecated(PluginMapCSS):
                     'sloped_curb'])
                 }})
 
-        # *[sloped_curb=no][!kerb]
+    # *[sloped_curb=no][!kerb]
+    def _node_rule_152(self, data, tags, keys, err, sets):
         if ('sloped_curb' in keys):
             match = False
             if not match:
@@ -3462,8 +3609,9 @@ class Josm_deprecated(PluginMapCSS):
                     'sloped_curb'])
                 }})
 
-        # *[sloped_curb][sloped_curb!~/^(yes|both|no)$/][!kerb]
-        # *[sloped_curb][kerb]
+    # *[sloped_curb][sloped_curb!~/^(yes|both|no)$/][!kerb]
+    # *[sloped_curb][kerb]
+    def _node_rule_153(self, data, tags, keys, err, sets):
         if ('kerb' in keys and 'sloped_curb' in keys) or ('sloped_curb' in keys):
             match = False
             if not match:
@@ -3480,7 +3628,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"kerb=*"
                 err.append({'class': 9002001, 'subclass': 1682376745, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[unnamed=yes]
+    # *[unnamed=yes]
+    def _node_rule_154(self, data, tags, keys, err, sets):
         if ('unnamed' in keys):
             match = False
             if not match:
@@ -3499,7 +3648,8 @@ class Josm_deprecated(PluginMapCSS):
                     'unnamed'])
                 }})
 
-        # node[segregated][segregated!=yes][segregated!=no]
+    # node[segregated][segregated!=yes][segregated!=no]
+    def _node_rule_155(self, data, tags, keys, err, sets):
         if ('segregated' in keys):
             match = False
             if not match:
@@ -3510,7 +3660,8 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("unusual value of {0}","{0.key}")
                 err.append({'class': 9002020, 'subclass': 1015641959, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[building:height]
+    # *[building:height]
+    def _node_rule_156(self, data, tags, keys, err, sets):
         if ('building:height' in keys):
             match = False
             if not match:
@@ -3529,7 +3680,8 @@ class Josm_deprecated(PluginMapCSS):
                     'building:height'])
                 }})
 
-        # *[building:min_height]
+    # *[building:min_height]
+    def _node_rule_157(self, data, tags, keys, err, sets):
         if ('building:min_height' in keys):
             match = False
             if not match:
@@ -3548,11 +3700,12 @@ class Josm_deprecated(PluginMapCSS):
                     'building:min_height'])
                 }})
 
-        # *[car]
-        # Rule Blacklisted (id: 297159061)
+    # *[car]
+    # Rule Blacklisted (id: 297159061)
 
-        # *[navigationaid=approach_light]
-        # *[navigationaid="ALS (Approach lighting system)"]
+    # *[navigationaid=approach_light]
+    # *[navigationaid="ALS (Approach lighting system)"]
+    def _node_rule_158(self, data, tags, keys, err, sets):
         if ('navigationaid' in keys):
             match = False
             if not match:
@@ -3573,7 +3726,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['navigationaid','als']])
                 }})
 
-        # node[exit_to]
+    # node[exit_to]
+    def _node_rule_159(self, data, tags, keys, err, sets):
         if ('exit_to' in keys):
             match = False
             if not match:
@@ -3586,7 +3740,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"destination"
                 err.append({'class': 9002001, 'subclass': 2117439762, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[water=riverbank][!natural]
+    # *[water=riverbank][!natural]
+    def _node_rule_160(self, data, tags, keys, err, sets):
         if ('water' in keys):
             match = False
             if not match:
@@ -3605,7 +3760,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['water','river']])
                 }})
 
-        # *[water=riverbank][natural]
+    # *[water=riverbank][natural]
+    def _node_rule_161(self, data, tags, keys, err, sets):
         if ('natural' in keys and 'water' in keys):
             match = False
             if not match:
@@ -3618,10 +3774,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=water + water=river"
                 err.append({'class': 9002001, 'subclass': 630806094, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[waterway=riverbank][!natural][!water]
-        # *[waterway=riverbank][natural=water][!water]
-        # *[waterway=riverbank][!natural][water=river]
-        # *[waterway=riverbank][natural=water][water=river]
+    # *[waterway=riverbank][!natural][!water]
+    # *[waterway=riverbank][natural=water][!water]
+    # *[waterway=riverbank][!natural][water=river]
+    # *[waterway=riverbank][natural=water][water=river]
+    def _node_rule_162(self, data, tags, keys, err, sets):
         if ('natural' in keys and 'water' in keys and 'waterway' in keys) or ('natural' in keys and 'waterway' in keys) or ('water' in keys and 'waterway' in keys) or ('waterway' in keys):
             match = False
             if not match:
@@ -3655,8 +3812,9 @@ class Josm_deprecated(PluginMapCSS):
                     'waterway'])
                 }})
 
-        # *[waterway=riverbank][natural][natural!=water]
-        # *[waterway=riverbank][water][water!=river]
+    # *[waterway=riverbank][natural][natural!=water]
+    # *[waterway=riverbank][water][water!=river]
+    def _node_rule_163(self, data, tags, keys, err, sets):
         if ('natural' in keys and 'waterway' in keys) or ('water' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -3673,7 +3831,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=water + water=river"
                 err.append({'class': 9002001, 'subclass': 301661430, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[amenity=bench][capacity][!seats]
+    # node[amenity=bench][capacity][!seats]
+    def _node_rule_164(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'capacity' in keys):
             match = False
             if not match:
@@ -3692,7 +3851,8 @@ class Josm_deprecated(PluginMapCSS):
                     'capacity'])
                 }})
 
-        # node[amenity=bench][capacity][seats]
+    # node[amenity=bench][capacity][seats]
+    def _node_rule_165(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'capacity' in keys and 'seats' in keys):
             match = False
             if not match:
@@ -3705,7 +3865,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"seats"
                 err.append({'class': 9002001, 'subclass': 2124584560, 'text': mapcss.tr('{0} is deprecated for {1}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[shop=lamps]
+    # *[shop=lamps]
+    def _node_rule_166(self, data, tags, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -3722,7 +3883,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','lighting']])
                 }})
 
-        # *[access=customer]
+    # *[access=customer]
+    def _node_rule_167(self, data, tags, keys, err, sets):
         if ('access' in keys):
             match = False
             if not match:
@@ -3739,7 +3901,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['access','customers']])
                 }})
 
-        # *[addr:inclusion=estimated]
+    # *[addr:inclusion=estimated]
+    def _node_rule_168(self, data, tags, keys, err, sets):
         if ('addr:inclusion' in keys):
             match = False
             if not match:
@@ -3756,7 +3919,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['addr:inclusion','estimate']])
                 }})
 
-        # *[building=apartment]
+    # *[building=apartment]
+    def _node_rule_169(self, data, tags, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -3773,7 +3937,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['building','apartments']])
                 }})
 
-        # node[lamp_mount="bent mast"]
+    # node[lamp_mount="bent mast"]
+    def _node_rule_170(self, data, tags, keys, err, sets):
         if ('lamp_mount' in keys):
             match = False
             if not match:
@@ -3790,7 +3955,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['lamp_mount','bent_mast']])
                 }})
 
-        # node[lamp_mount="straight mast"]
+    # node[lamp_mount="straight mast"]
+    def _node_rule_171(self, data, tags, keys, err, sets):
         if ('lamp_mount' in keys):
             match = False
             if not match:
@@ -3807,7 +3973,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['lamp_mount','straight_mast']])
                 }})
 
-        # node[lamp_type=electrical]
+    # node[lamp_type=electrical]
+    def _node_rule_172(self, data, tags, keys, err, sets):
         if ('lamp_type' in keys):
             match = False
             if not match:
@@ -3824,7 +3991,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['lamp_type','electric']])
                 }})
 
-        # *[generator:type=solar_photovoltaic_panels]
+    # *[generator:type=solar_photovoltaic_panels]
+    def _node_rule_173(self, data, tags, keys, err, sets):
         if ('generator:type' in keys):
             match = False
             if not match:
@@ -3841,7 +4009,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['generator:type','solar_photovoltaic_panel']])
                 }})
 
-        # *[building=part]
+    # *[building=part]
+    def _node_rule_174(self, data, tags, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -3854,7 +4023,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"building:part=yes"
                 err.append({'class': 9002001, 'subclass': 455695847, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[natural=sink_hole]
+    # *[natural=sink_hole]
+    def _node_rule_175(self, data, tags, keys, err, sets):
         if ('natural' in keys):
             match = False
             if not match:
@@ -3871,7 +4041,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['natural','sinkhole']])
                 }})
 
-        # *[climbing:grade:UIAA:min]
+    # *[climbing:grade:UIAA:min]
+    def _node_rule_176(self, data, tags, keys, err, sets):
         if ('climbing:grade:UIAA:min' in keys):
             match = False
             if not match:
@@ -3890,7 +4061,8 @@ class Josm_deprecated(PluginMapCSS):
                     'climbing:grade:UIAA:min'])
                 }})
 
-        # *[climbing:grade:UIAA:max]
+    # *[climbing:grade:UIAA:max]
+    def _node_rule_177(self, data, tags, keys, err, sets):
         if ('climbing:grade:UIAA:max' in keys):
             match = False
             if not match:
@@ -3909,7 +4081,8 @@ class Josm_deprecated(PluginMapCSS):
                     'climbing:grade:UIAA:max'])
                 }})
 
-        # *[climbing:grade:UIAA:mean]
+    # *[climbing:grade:UIAA:mean]
+    def _node_rule_178(self, data, tags, keys, err, sets):
         if ('climbing:grade:UIAA:mean' in keys):
             match = False
             if not match:
@@ -3928,7 +4101,8 @@ class Josm_deprecated(PluginMapCSS):
                     'climbing:grade:UIAA:mean'])
                 }})
 
-        # *[climbing:grade:UIAA]
+    # *[climbing:grade:UIAA]
+    def _node_rule_179(self, data, tags, keys, err, sets):
         if ('climbing:grade:UIAA' in keys):
             match = False
             if not match:
@@ -3947,7 +4121,8 @@ class Josm_deprecated(PluginMapCSS):
                     'climbing:grade:UIAA'])
                 }})
 
-        # *[cuisine][cuisine=~/^(?i)(bbq)$/]
+    # *[cuisine][cuisine=~/^(?i)(bbq)$/]
+    def _node_rule_180(self, data, tags, keys, err, sets):
         if ('cuisine' in keys):
             match = False
             if not match:
@@ -3960,13 +4135,14 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"cuisine=barbecue"
                 # fixAdd:"cuisine=barbecue"
-                set_bbq_autofix = True
+                sets.add('bbq_autofix')
                 err.append({'class': 9002001, 'subclass': 1943338875, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['cuisine','barbecue']])
                 }})
 
-        # *[cuisine=~/(?i)(;bbq|bbq;)/][cuisine!~/(?i)(_bbq)/]
+    # *[cuisine=~/(?i)(;bbq|bbq;)/][cuisine!~/(?i)(_bbq)/]
+    def _node_rule_181(self, data, tags, keys, err, sets):
         if ('cuisine' in keys):
             match = False
             if not match:
@@ -3979,7 +4155,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"cuisine=barbecue"
                 err.append({'class': 9002001, 'subclass': 1958782130, 'text': mapcss.tr('{0} is deprecated', 'cuisine=bbq')})
 
-        # *[Fixme]
+    # *[Fixme]
+    def _node_rule_182(self, data, tags, keys, err, sets):
         if ('Fixme' in keys):
             match = False
             if not match:
@@ -3998,10 +4175,11 @@ class Josm_deprecated(PluginMapCSS):
                     'Fixme'])
                 }})
 
-        # *[amenity=embassy]
-        # Rule Blacklisted (id: 1751915206)
+    # *[amenity=embassy]
+    # Rule Blacklisted (id: 1751915206)
 
-        # *[service:bicycle:chaintool]
+    # *[service:bicycle:chaintool]
+    def _node_rule_183(self, data, tags, keys, err, sets):
         if ('service:bicycle:chaintool' in keys):
             match = False
             if not match:
@@ -4020,7 +4198,8 @@ class Josm_deprecated(PluginMapCSS):
                     'service:bicycle:chaintool'])
                 }})
 
-        # *[building:roof:shape]
+    # *[building:roof:shape]
+    def _node_rule_184(self, data, tags, keys, err, sets):
         if ('building:roof:shape' in keys):
             match = False
             if not match:
@@ -4039,7 +4218,8 @@ class Josm_deprecated(PluginMapCSS):
                     'building:roof:shape'])
                 }})
 
-        # *[man_made=pumping_rig][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    # *[man_made=pumping_rig][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    def _node_rule_185(self, data, tags, keys, err, sets):
         if ('man_made' in keys):
             match = False
             if not match:
@@ -4055,7 +4235,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"mechanical_coupling=nodding_donkey"
                 # fixAdd:"mechanical_driver=combustion_engine"
                 # fixAdd:"pump_mechanism=piston"
-                set_pumping_ring_no_mech = True
+                sets.add('pumping_ring_no_mech')
                 err.append({'class': 9002001, 'subclass': 6568074, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['mechanical_coupling','nodding_donkey'],
@@ -4063,12 +4243,13 @@ class Josm_deprecated(PluginMapCSS):
                     ['pump_mechanism','piston']])
                 }})
 
-        # *[man_made=pumping_rig]!.pumping_ring_no_mech
+    # *[man_made=pumping_rig]!.pumping_ring_no_mech
+    def _node_rule_186(self, data, tags, keys, err, sets):
         if ('man_made' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_pumping_ring_no_mech) and (mapcss._tag_capture(capture_tags, 0, tags, 'man_made') == mapcss._value_capture(capture_tags, 0, 'pumping_rig')))
+                try: match = (('pumping_ring_no_mech' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'man_made') == mapcss._value_capture(capture_tags, 0, 'pumping_rig')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("deprecated tagging")
@@ -4077,7 +4258,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"man_made=water_well"
                 err.append({'class': 9002001, 'subclass': 1031026578, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[pump:type=beam_pump][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    # *[pump:type=beam_pump][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    def _node_rule_187(self, data, tags, keys, err, sets):
         if ('pump:type' in keys):
             match = False
             if not match:
@@ -4093,7 +4275,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"mechanical_driver=combustion_engine"
                 # fixRemove:"pump:type"
                 # fixAdd:"pump_mechanism=piston"
-                set_beam_pump_no_mech = True
+                sets.add('beam_pump_no_mech')
                 err.append({'class': 9002001, 'subclass': 1519103279, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['mechanical_coupling','nodding_donkey'],
@@ -4103,12 +4285,13 @@ class Josm_deprecated(PluginMapCSS):
                     'pump:type'])
                 }})
 
-        # *[pump:type]!.beam_pump_no_mech
+    # *[pump:type]!.beam_pump_no_mech
+    def _node_rule_188(self, data, tags, keys, err, sets):
         if ('pump:type' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_beam_pump_no_mech) and (mapcss._tag_capture(capture_tags, 0, tags, 'pump:type')))
+                try: match = (('beam_pump_no_mech' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'pump:type')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("deprecated tagging")
@@ -4116,7 +4299,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"pump_mechanism"
                 err.append({'class': 9002001, 'subclass': 2015679777, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[substance=heat]
+    # *[substance=heat]
+    def _node_rule_189(self, data, tags, keys, err, sets):
         if ('substance' in keys):
             match = False
             if not match:
@@ -4130,7 +4314,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"substance=steam"
                 err.append({'class': 9002001, 'subclass': 1528467304, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[landuse=school]
+    # *[landuse=school]
+    def _node_rule_190(self, data, tags, keys, err, sets):
         if ('landuse' in keys):
             match = False
             if not match:
@@ -4146,11 +4331,12 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"landuse=education"
                 err.append({'class': 9002001, 'subclass': 817812278, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=vending_machine][vending=parcel_mail_in]
-        # *[amenity=vending_machine][vending=parcel_pickup]
-        # Rule Blacklisted (id: 1305128315)
+    # *[amenity=vending_machine][vending=parcel_mail_in]
+    # *[amenity=vending_machine][vending=parcel_pickup]
+    # Rule Blacklisted (id: 1305128315)
 
-        # *[amenity=vending_machine][vending][vending~=parcel_mail_in][vending~=parcel_pickup][count(uniq_list(split(";",tag("vending"))))==2]
+    # *[amenity=vending_machine][vending][vending~=parcel_mail_in][vending~=parcel_pickup][count(uniq_list(split(";",tag("vending"))))==2]
+    def _node_rule_191(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'vending' in keys):
             match = False
             if not match:
@@ -4168,7 +4354,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"vending"
                 # assertMatch:"node amenity=vending_machine vending=parcel_mail_in;parcel_pickup"
                 # assertMatch:"node amenity=vending_machine vending=parcel_pickup;parcel_mail_in"
-                set_parcel_fixable = True
+                sets.add('parcel_fixable')
                 err.append({'class': 9002001, 'subclass': 954921281, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{1.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['amenity','parcel_locker'],
@@ -4178,17 +4364,18 @@ class Josm_deprecated(PluginMapCSS):
                     'vending'])
                 }})
 
-        # *[amenity=vending_machine][vending~=parcel_mail_in]!.parcel_fixable
-        # *[amenity=vending_machine][vending~=parcel_pickup]!.parcel_fixable
+    # *[amenity=vending_machine][vending~=parcel_mail_in]!.parcel_fixable
+    # *[amenity=vending_machine][vending~=parcel_pickup]!.parcel_fixable
+    def _node_rule_192(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'vending' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_parcel_fixable) and (mapcss._tag_capture(capture_tags, 0, tags, 'amenity') == mapcss._value_capture(capture_tags, 0, 'vending_machine')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'vending'), mapcss._value_capture(capture_tags, 1, 'parcel_mail_in'))))
+                try: match = (('parcel_fixable' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'amenity') == mapcss._value_capture(capture_tags, 0, 'vending_machine')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'vending'), mapcss._value_capture(capture_tags, 1, 'parcel_mail_in'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_parcel_fixable) and (mapcss._tag_capture(capture_tags, 0, tags, 'amenity') == mapcss._value_capture(capture_tags, 0, 'vending_machine')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'vending'), mapcss._value_capture(capture_tags, 1, 'parcel_pickup'))))
+                try: match = (('parcel_fixable' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'amenity') == mapcss._value_capture(capture_tags, 0, 'vending_machine')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'vending'), mapcss._value_capture(capture_tags, 1, 'parcel_pickup'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("deprecated tagging")
@@ -4197,7 +4384,8 @@ class Josm_deprecated(PluginMapCSS):
                 # assertMatch:"node amenity=vending_machine vending=parcel_pickup;stamp"
                 err.append({'class': 9002001, 'subclass': 424486726, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[surface=decoturf]
+    # *[surface=decoturf]
+    def _node_rule_193(self, data, tags, keys, err, sets):
         if ('surface' in keys):
             match = False
             if not match:
@@ -4214,10 +4402,11 @@ class Josm_deprecated(PluginMapCSS):
                     ['surface','acrylic']])
                 }})
 
-        # *[role]
-        # Rule Blacklisted (id: 2041296832)
+    # *[role]
+    # Rule Blacklisted (id: 2041296832)
 
-        # *[school=entrance]
+    # *[school=entrance]
+    def _node_rule_194(self, data, tags, keys, err, sets):
         if ('school' in keys):
             match = False
             if not match:
@@ -4231,8 +4420,9 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"entrance=yes"
                 err.append({'class': 9002001, 'subclass': 1398581809, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[voltage-high]
-        # *[voltage-low]
+    # *[voltage-high]
+    # *[voltage-low]
+    def _node_rule_195(self, data, tags, keys, err, sets):
         if ('voltage-high' in keys) or ('voltage-low' in keys):
             match = False
             if not match:
@@ -4250,7 +4440,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"voltage:secondary"
                 err.append({'class': 9002001, 'subclass': 1379077827, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[toilet][!toilets]
+    # *[toilet][!toilets]
+    def _node_rule_196(self, data, tags, keys, err, sets):
         if ('toilet' in keys):
             match = False
             if not match:
@@ -4269,7 +4460,8 @@ class Josm_deprecated(PluginMapCSS):
                     'toilet'])
                 }})
 
-        # *[toilet][toilets]
+    # *[toilet][toilets]
+    def _node_rule_197(self, data, tags, keys, err, sets):
         if ('toilet' in keys and 'toilets' in keys):
             match = False
             if not match:
@@ -4282,7 +4474,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"toilets"
                 err.append({'class': 9002001, 'subclass': 1092230744, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[type="turnlanes:turns"]
+    # *[type="turnlanes:turns"]
+    def _node_rule_198(self, data, tags, keys, err, sets):
         if ('type' in keys):
             match = False
             if not match:
@@ -4295,7 +4488,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"type=connectivity"
                 err.append({'class': 9002001, 'subclass': 1789083769, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[image][image=~/^https:\/\/westnordost.de\/p\//]
+    # *[image][image=~/^https:\/\/westnordost.de\/p\//]
+    def _node_rule_199(self, data, tags, keys, err, sets):
         if ('image' in keys):
             match = False
             if not match:
@@ -4313,14 +4507,15 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[historic=archaeological_site][site_type]
-        # Rule Blacklisted (id: 595008939)
+    # *[historic=archaeological_site][site_type]
+    # Rule Blacklisted (id: 595008939)
 
-        # *[gnis:id][!gnis:feature_id]
-        # *[tiger:PLACENS][!gnis:feature_id]
-        # *[NHD:GNIS_ID][!gnis:feature_id]
-        # *[nhd:gnis_id][!gnis:feature_id]
-        # *[ref:gnis][!gnis:feature_id]
+    # *[gnis:id][!gnis:feature_id]
+    # *[tiger:PLACENS][!gnis:feature_id]
+    # *[NHD:GNIS_ID][!gnis:feature_id]
+    # *[nhd:gnis_id][!gnis:feature_id]
+    # *[ref:gnis][!gnis:feature_id]
+    def _node_rule_200(self, data, tags, keys, err, sets):
         if ('NHD:GNIS_ID' in keys) or ('gnis:id' in keys) or ('nhd:gnis_id' in keys) or ('ref:gnis' in keys) or ('tiger:PLACENS' in keys):
             match = False
             if not match:
@@ -4355,11 +4550,12 @@ class Josm_deprecated(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key} => {1.key}')).split('=>', 1)[0].strip()])
                 }})
 
-        # *[gnis:id][gnis:feature_id]
-        # *[tiger:PLACENS][gnis:feature_id]
-        # *[NHD:GNIS_ID][gnis:feature_id]
-        # *[nhd:gnis_id][gnis:feature_id]
-        # *[ref:gnis][gnis:feature_id]
+    # *[gnis:id][gnis:feature_id]
+    # *[tiger:PLACENS][gnis:feature_id]
+    # *[NHD:GNIS_ID][gnis:feature_id]
+    # *[nhd:gnis_id][gnis:feature_id]
+    # *[ref:gnis][gnis:feature_id]
+    def _node_rule_201(self, data, tags, keys, err, sets):
         if ('NHD:GNIS_ID' in keys and 'gnis:feature_id' in keys) or ('gnis:feature_id' in keys and 'gnis:id' in keys) or ('gnis:feature_id' in keys and 'nhd:gnis_id' in keys) or ('gnis:feature_id' in keys and 'ref:gnis' in keys) or ('gnis:feature_id' in keys and 'tiger:PLACENS' in keys):
             match = False
             if not match:
@@ -4388,7 +4584,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"{1.key}"
                 err.append({'class': 9002001, 'subclass': 1736205096, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[natural=landform][landform=esker]
+    # *[natural=landform][landform=esker]
+    def _node_rule_202(self, data, tags, keys, err, sets):
         if ('landform' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -4401,7 +4598,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=ridge or geological=esker"
                 err.append({'class': 9002001, 'subclass': 1008024827, 'text': mapcss.tr('{0} should be replaced by {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'geological=esker')})
 
-        # *[natural=landform][landform=moraine]
+    # *[natural=landform][landform=moraine]
+    def _node_rule_203(self, data, tags, keys, err, sets):
         if ('landform' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -4414,7 +4612,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"geological=moraine"
                 err.append({'class': 9002001, 'subclass': 1223091758, 'text': mapcss.tr('{0} should be replaced by {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'geological=moraine')})
 
-        # *[natural=landform][landform=beach]
+    # *[natural=landform][landform=beach]
+    def _node_rule_204(self, data, tags, keys, err, sets):
         if ('landform' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -4427,7 +4626,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=beach"
                 err.append({'class': 9002001, 'subclass': 2005356131, 'text': mapcss.tr('{0} should be replaced by {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'natural=beach')})
 
-        # *[natural=landform][landform=tundra_polygon]
+    # *[natural=landform][landform=tundra_polygon]
+    def _node_rule_205(self, data, tags, keys, err, sets):
         if ('landform' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -4440,18 +4640,228 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=tundra or natural=fell"
                 err.append({'class': 9002001, 'subclass': 149743951, 'text': mapcss.tr('{0} should be replaced by {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'natural=tundra')})
 
-        # *[residential=condominium]
-        # Rule Blacklisted (id: 1861188094)
+    # *[residential=condominium]
+    # Rule Blacklisted (id: 1861188094)
+
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['barrier']),
+        (_node_rule_1, ['barrier']),
+        (_node_rule_2, ['landuse']),
+        (_node_rule_3, ['landuse']),
+        (_node_rule_4, ['landuse']),
+        (_node_rule_5, ['landuse']),
+        (_node_rule_6, ['shop']),
+        (_node_rule_7, ['shop']),
+        (_node_rule_8, ['shop']),
+        (_node_rule_9, ['shop']),
+        (_node_rule_10, ['bicycle_parking']),
+        (_node_rule_11, ['location']),
+        (_node_rule_12, ['generator:location']),
+        (_node_rule_13, ['generator:method']),
+        (_node_rule_14, ['generator:method']),
+        (_node_rule_15, ['generator:method']),
+        (_node_rule_16, ['fence_type']),
+        (_node_rule_17, ['board_type']),
+        (_node_rule_18, ['man_made']),
+        (_node_rule_19, ['measurement']),
+        (_node_rule_20, ['measurement']),
+        (_node_rule_21, ['measurement']),
+        (_node_rule_22, ['monitoring:river_level']),
+        (_node_rule_23, ['stay']),
+        (_node_rule_24, ['access']),
+        (_node_rule_25, ['access']),
+        (_node_rule_26, ['FIXME', 'fixme']),
+        (_node_rule_27, ['name']),
+        (_node_rule_28, ['note']),
+        (_node_rule_29, ['type']),
+        (_node_rule_30, ['type', 'wood']),
+        (_node_rule_31, ['wood']),
+        (_node_rule_32, ['type', 'wood']),
+        (_node_rule_33, ['type', 'wood']),
+        (_node_rule_34, ['type']),
+        (_node_rule_35, ['bridge']),
+        (_node_rule_36, ['fee', 'lit', 'supervised']),
+        (_node_rule_37, None),
+        (_node_rule_38, ['parking']),
+        (_node_rule_39, ['access', 'aerialway', 'amenity', 'barrier', 'craft', 'landuse', 'leisure', 'manhole', 'parking', 'place', 'playground', 'police', 'service', 'shop', 'traffic_calming']),
+        (_node_rule_40, ['waterway']),
+        (_node_rule_41, ['waterway']),
+        (_node_rule_42, ['waterway']),
+        (_node_rule_43, ['building', 'building:part']),
+        (_node_rule_44, ['levels']),
+        (_node_rule_45, ['building:level']),
+        (_node_rule_46, ['building:level']),
+        (_node_rule_47, ['protected_class']),
+        (_node_rule_48, ['sport']),
+        (_node_rule_49, None),
+        (_node_rule_50, None),
+        (_node_rule_51, None),
+        (_node_rule_52, ['sport']),
+        (_node_rule_53, ['payment:ep_cash', 'payment:ep_chipknip', 'payment:ep_proton', 'payment:ep_quick']),
+        (_node_rule_54, ['kp']),
+        (_node_rule_55, ['pk']),
+        (_node_rule_56, ['kp']),
+        (_node_rule_57, ['pk']),
+        (_node_rule_58, ['distance']),
+        (_node_rule_59, ['postcode']),
+        (_node_rule_60, ['water']),
+        (_node_rule_61, ['seamark']),
+        (_node_rule_62, ['seamark']),
+        (_node_rule_63, ['landuse']),
+        (_node_rule_64, ['shop']),
+        (_node_rule_65, ['shop']),
+        (_node_rule_66, ['amenity']),
+        (_node_rule_67, ['amenity']),
+        (_node_rule_68, ['location']),
+        (_node_rule_69, ['man_made']),
+        (_node_rule_70, ['leisure', 'shop']),
+        (_node_rule_71, ['shop']),
+        (_node_rule_72, None),
+        (_node_rule_73, ['sport']),
+        (_node_rule_74, ['amenity']),
+        (_node_rule_75, ['vending']),
+        (_node_rule_76, ['service']),
+        (_node_rule_77, ['noexit']),
+        (_node_rule_78, ['pole']),
+        (_node_rule_79, ['tower']),
+        (_node_rule_80, ['shop']),
+        (_node_rule_81, ['vending']),
+        (_node_rule_82, ['amenity']),
+        (_node_rule_83, ['vending']),
+        (_node_rule_84, ['highway']),
+        (_node_rule_85, ['highway']),
+        (_node_rule_86, ['emergency_telephone_code']),
+        (_node_rule_87, ['amenity']),
+        (_node_rule_88, ['building']),
+        (_node_rule_89, ['building']),
+        (_node_rule_90, ['building']),
+        (_node_rule_91, ['location']),
+        (_node_rule_92, ['location']),
+        (_node_rule_93, ['amenity', 'leisure', 'tourism']),
+        (_node_rule_94, ['amenity']),
+        (_node_rule_95, ['building']),
+        (_node_rule_96, ['communication', 'man_made', 'street_cabinet']),
+        (_node_rule_97, ['telecom']),
+        (_node_rule_98, ['fire_hydrant:type']),
+        (_node_rule_99, ['fire_hydrant:flow_capacity']),
+        (_node_rule_100, ['emergency']),
+        (_node_rule_101, ['fire_hydrant:water_source']),
+        (_node_rule_102, ['natural']),
+        (_node_rule_103, ['religion']),
+        (_node_rule_104, ['shop']),
+        (_node_rule_105, None),
+        (_node_rule_106, ['sport']),
+        (_node_rule_107, ['leisure']),
+        (_node_rule_108, ['cuisine']),
+        (_node_rule_109, ['kitchen_hours']),
+        (_node_rule_110, ['shop']),
+        (_node_rule_111, ['contact:google_plus']),
+        (_node_rule_112, ['amenity']),
+        (_node_rule_113, ['amenity', 'shop']),
+        (_node_rule_114, ['amenity']),
+        (_node_rule_115, ['building', 'building:type']),
+        (_node_rule_116, ['building']),
+        (_node_rule_117, ['leisure']),
+        (_node_rule_118, ['natural']),
+        (_node_rule_119, ['shop']),
+        (_node_rule_120, ['diaper']),
+        (_node_rule_121, ['diaper']),
+        (_node_rule_122, ['diaper:male']),
+        (_node_rule_123, ['diaper:female']),
+        (_node_rule_124, ['diaper:unisex']),
+        (_node_rule_125, ['diaper:wheelchair']),
+        (_node_rule_126, ['diaper:fee']),
+        (_node_rule_127, None),
+        (_node_rule_128, ['changing_table']),
+        (_node_rule_129, ['roof:shape']),
+        (_node_rule_130, ['bridge_name']),
+        (_node_rule_131, ['crossing']),
+        (_node_rule_132, ['recycling:metal']),
+        (_node_rule_133, ['shop']),
+        (_node_rule_134, ['tower:type']),
+        (_node_rule_135, ['branch:type']),
+        (_node_rule_136, ['branch:type', 'tower:type']),
+        (_node_rule_137, ['branch:type']),
+        (_node_rule_138, ['tower:type']),
+        (_node_rule_139, ['tower:type']),
+        (_node_rule_140, ['tower:type']),
+        (_node_rule_141, ['tower:type']),
+        (_node_rule_142, ['power']),
+        (_node_rule_143, ['pole:type']),
+        (_node_rule_144, ['branch:type']),
+        (_node_rule_145, ['branch:type', 'pole:type']),
+        (_node_rule_146, ['branch:type']),
+        (_node_rule_147, ['pole:type']),
+        (_node_rule_148, ['pole:type']),
+        (_node_rule_149, ['pole:type']),
+        (_node_rule_150, ['cable', 'man_made', 'pipeline', 'power']),
+        (_node_rule_151, ['sloped_curb']),
+        (_node_rule_152, ['sloped_curb']),
+        (_node_rule_153, ['kerb', 'sloped_curb']),
+        (_node_rule_154, ['unnamed']),
+        (_node_rule_155, ['segregated']),
+        (_node_rule_156, ['building:height']),
+        (_node_rule_157, ['building:min_height']),
+        (_node_rule_158, ['navigationaid']),
+        (_node_rule_159, ['exit_to']),
+        (_node_rule_160, ['water']),
+        (_node_rule_161, ['natural']),
+        (_node_rule_162, ['natural', 'water', 'waterway']),
+        (_node_rule_163, ['natural', 'water']),
+        (_node_rule_164, ['amenity']),
+        (_node_rule_165, ['amenity']),
+        (_node_rule_166, ['shop']),
+        (_node_rule_167, ['access']),
+        (_node_rule_168, ['addr:inclusion']),
+        (_node_rule_169, ['building']),
+        (_node_rule_170, ['lamp_mount']),
+        (_node_rule_171, ['lamp_mount']),
+        (_node_rule_172, ['lamp_type']),
+        (_node_rule_173, ['generator:type']),
+        (_node_rule_174, ['building']),
+        (_node_rule_175, ['natural']),
+        (_node_rule_176, ['climbing:grade:UIAA:min']),
+        (_node_rule_177, ['climbing:grade:UIAA:max']),
+        (_node_rule_178, ['climbing:grade:UIAA:mean']),
+        (_node_rule_179, ['climbing:grade:UIAA']),
+        (_node_rule_180, ['cuisine']),
+        (_node_rule_181, ['cuisine']),
+        (_node_rule_182, ['Fixme']),
+        (_node_rule_183, ['service:bicycle:chaintool']),
+        (_node_rule_184, ['building:roof:shape']),
+        (_node_rule_185, ['man_made']),
+        (_node_rule_186, ['man_made']),
+        (_node_rule_187, ['pump:type']),
+        (_node_rule_188, ['pump:type']),
+        (_node_rule_189, ['substance']),
+        (_node_rule_190, ['landuse']),
+        (_node_rule_191, ['amenity']),
+        (_node_rule_192, ['amenity']),
+        (_node_rule_193, ['surface']),
+        (_node_rule_194, ['school']),
+        (_node_rule_195, ['voltage-high', 'voltage-low']),
+        (_node_rule_196, ['toilet']),
+        (_node_rule_197, ['toilet']),
+        (_node_rule_198, ['type']),
+        (_node_rule_199, ['image']),
+        (_node_rule_200, ['NHD:GNIS_ID', 'gnis:id', 'nhd:gnis_id', 'ref:gnis', 'tiger:PLACENS']),
+        (_node_rule_201, ['NHD:GNIS_ID', 'gnis:feature_id']),
+        (_node_rule_202, ['landform']),
+        (_node_rule_203, ['landform']),
+        (_node_rule_204, ['landform']),
+        (_node_rule_205, ['landform']),
+    ])
 
-        return err
-
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
-        set_bbq_autofix = set_beam_pump_no_mech = set_diaper___checked = set_diaper_checked = set_generic_power_tower_type_warning = set_levels_building = set_parcel_fixable = set_power_pole_type_warning = set_power_tower_type_warning = set_pumping_ring_no_mech = set_samebuildingcolor = set_sameroofcolor = False
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-        # *[barrier=wire_fence]
+    # *[barrier=wire_fence]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('barrier' in keys):
             match = False
             if not match:
@@ -4472,7 +4882,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['fence_type','chain_link']])
                 }})
 
-        # *[barrier=wood_fence]
+    # *[barrier=wood_fence]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('barrier' in keys):
             match = False
             if not match:
@@ -4491,32 +4902,33 @@ class Josm_deprecated(PluginMapCSS):
                     ['fence_type','wood']])
                 }})
 
-        # way[highway=ford]
-        # Rule Blacklisted (id: 591931361)
+    # way[highway=ford]
+    # Rule Blacklisted (id: 591931361)
 
-        # way[class]
-        # Rule Blacklisted (id: 905310794)
+    # way[class]
+    # Rule Blacklisted (id: 905310794)
 
-        # *[highway=stile]
-        # Rule Blacklisted (id: 1435678043)
+    # *[highway=stile]
+    # Rule Blacklisted (id: 1435678043)
 
-        # *[highway=incline]
-        # Rule Blacklisted (id: 765169083)
+    # *[highway=incline]
+    # Rule Blacklisted (id: 765169083)
 
-        # *[highway=incline_steep]
-        # Rule Blacklisted (id: 1966772390)
+    # *[highway=incline_steep]
+    # Rule Blacklisted (id: 1966772390)
 
-        # *[highway=unsurfaced]
-        # Rule Blacklisted (id: 20631498)
+    # *[highway=unsurfaced]
+    # Rule Blacklisted (id: 20631498)
 
-        # *[landuse=wood]
-        # Rule Blacklisted (id: 469903103)
+    # *[landuse=wood]
+    # Rule Blacklisted (id: 469903103)
 
-        # *[natural=marsh]
-        # Rule Blacklisted (id: 1459865523)
+    # *[natural=marsh]
+    # Rule Blacklisted (id: 1459865523)
 
-        # *[landuse=reservoir][!reservoir_type]
-        # *[landuse=reservoir][reservoir_type=water_storage]
+    # *[landuse=reservoir][!reservoir_type]
+    # *[landuse=reservoir][reservoir_type=water_storage]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('landuse' in keys) or ('landuse' in keys and 'reservoir_type' in keys):
             match = False
             if not match:
@@ -4542,7 +4954,8 @@ class Josm_deprecated(PluginMapCSS):
                     'reservoir_type'])
                 }})
 
-        # *[landuse=reservoir][reservoir_type=tailings]
+    # *[landuse=reservoir][reservoir_type=tailings]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('landuse' in keys and 'reservoir_type' in keys):
             match = False
             if not match:
@@ -4564,7 +4977,8 @@ class Josm_deprecated(PluginMapCSS):
                     'reservoir_type'])
                 }})
 
-        # *[landuse=reservoir][reservoir_type=evaporator]
+    # *[landuse=reservoir][reservoir_type=evaporator]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('landuse' in keys and 'reservoir_type' in keys):
             match = False
             if not match:
@@ -4577,7 +4991,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"basin=evaporation or landuse=salt_pond"
                 err.append({'class': 9002001, 'subclass': 1494361034, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[landuse=reservoir][reservoir_type=sewage]
+    # *[landuse=reservoir][reservoir_type=sewage]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('landuse' in keys and 'reservoir_type' in keys):
             match = False
             if not match:
@@ -4590,19 +5005,20 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=water + water=wastewater or landuse=basin + basin=settling or man_made=basin + basin=settling"
                 err.append({'class': 9002001, 'subclass': 833262066, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[highway=byway]
-        # Rule Blacklisted (id: 1844620979)
+    # *[highway=byway]
+    # Rule Blacklisted (id: 1844620979)
 
-        # *[power_source]
-        # Rule Blacklisted (id: 34751027)
+    # *[power_source]
+    # Rule Blacklisted (id: 34751027)
 
-        # *[power_rating]
-        # Rule Blacklisted (id: 904750343)
+    # *[power_rating]
+    # Rule Blacklisted (id: 904750343)
 
-        # *[shop=antique]
-        # Rule Blacklisted (id: 596668979)
+    # *[shop=antique]
+    # Rule Blacklisted (id: 596668979)
 
-        # *[shop=bags]
+    # *[shop=bags]
+    def _way_rule_6(self, data, tags, nds, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -4619,7 +5035,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','bag']])
                 }})
 
-        # *[shop=fashion]
+    # *[shop=fashion]
+    def _way_rule_7(self, data, tags, nds, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -4636,10 +5053,11 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','clothes']])
                 }})
 
-        # *[shop=organic]
-        # Rule Blacklisted (id: 1959365145)
+    # *[shop=organic]
+    # Rule Blacklisted (id: 1959365145)
 
-        # *[shop=pets]
+    # *[shop=pets]
+    def _way_rule_8(self, data, tags, nds, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -4656,7 +5074,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','pet']])
                 }})
 
-        # *[shop=pharmacy]
+    # *[shop=pharmacy]
+    def _way_rule_9(self, data, tags, nds, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -4675,7 +5094,8 @@ class Josm_deprecated(PluginMapCSS):
                     'shop'])
                 }})
 
-        # *[bicycle_parking=sheffield]
+    # *[bicycle_parking=sheffield]
+    def _way_rule_10(self, data, tags, nds, keys, err, sets):
         if ('bicycle_parking' in keys):
             match = False
             if not match:
@@ -4692,19 +5112,20 @@ class Josm_deprecated(PluginMapCSS):
                     ['bicycle_parking','stands']])
                 }})
 
-        # *[amenity=emergency_phone]
-        # Rule Blacklisted (id: 1108230656)
+    # *[amenity=emergency_phone]
+    # Rule Blacklisted (id: 1108230656)
 
-        # *[sport=gaelic_football]
-        # Rule Blacklisted (id: 1768681881)
+    # *[sport=gaelic_football]
+    # Rule Blacklisted (id: 1768681881)
 
-        # *[power=station]
-        # Rule Blacklisted (id: 52025933)
+    # *[power=station]
+    # Rule Blacklisted (id: 52025933)
 
-        # *[power=sub_station]
-        # Rule Blacklisted (id: 1423074682)
+    # *[power=sub_station]
+    # Rule Blacklisted (id: 1423074682)
 
-        # *[location=rooftop]
+    # *[location=rooftop]
+    def _way_rule_11(self, data, tags, nds, keys, err, sets):
         if ('location' in keys):
             match = False
             if not match:
@@ -4721,7 +5142,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['location','roof']])
                 }})
 
-        # *[generator:location]
+    # *[generator:location]
+    def _way_rule_12(self, data, tags, nds, keys, err, sets):
         if ('generator:location' in keys):
             match = False
             if not match:
@@ -4740,7 +5162,8 @@ class Josm_deprecated(PluginMapCSS):
                     'generator:location'])
                 }})
 
-        # *[generator:method=dam]
+    # *[generator:method=dam]
+    def _way_rule_13(self, data, tags, nds, keys, err, sets):
         if ('generator:method' in keys):
             match = False
             if not match:
@@ -4757,7 +5180,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['generator:method','water-storage']])
                 }})
 
-        # *[generator:method=pumped-storage]
+    # *[generator:method=pumped-storage]
+    def _way_rule_14(self, data, tags, nds, keys, err, sets):
         if ('generator:method' in keys):
             match = False
             if not match:
@@ -4774,7 +5198,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['generator:method','water-pumped-storage']])
                 }})
 
-        # *[generator:method=pumping]
+    # *[generator:method=pumping]
+    def _way_rule_15(self, data, tags, nds, keys, err, sets):
         if ('generator:method' in keys):
             match = False
             if not match:
@@ -4791,7 +5216,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['generator:method','water-pumped-storage']])
                 }})
 
-        # *[fence_type=chain]
+    # *[fence_type=chain]
+    def _way_rule_16(self, data, tags, nds, keys, err, sets):
         if ('fence_type' in keys):
             match = False
             if not match:
@@ -4805,10 +5231,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"barrier=fence + fence_type=chain_link"
                 err.append({'class': 9002001, 'subclass': 19409288, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[building=entrance]
-        # Rule Blacklisted (id: 306662985)
+    # *[building=entrance]
+    # Rule Blacklisted (id: 306662985)
 
-        # *[board_type=board]
+    # *[board_type=board]
+    def _way_rule_17(self, data, tags, nds, keys, err, sets):
         if ('board_type' in keys):
             match = False
             if not match:
@@ -4824,7 +5251,8 @@ class Josm_deprecated(PluginMapCSS):
                     'board_type'])
                 }})
 
-        # *[man_made=measurement_station]
+    # *[man_made=measurement_station]
+    def _way_rule_18(self, data, tags, nds, keys, err, sets):
         if ('man_made' in keys):
             match = False
             if not match:
@@ -4841,7 +5269,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['man_made','monitoring_station']])
                 }})
 
-        # *[measurement=water_level]
+    # *[measurement=water_level]
+    def _way_rule_19(self, data, tags, nds, keys, err, sets):
         if ('measurement' in keys):
             match = False
             if not match:
@@ -4861,7 +5290,8 @@ class Josm_deprecated(PluginMapCSS):
                     'measurement'])
                 }})
 
-        # *[measurement=weather]
+    # *[measurement=weather]
+    def _way_rule_20(self, data, tags, nds, keys, err, sets):
         if ('measurement' in keys):
             match = False
             if not match:
@@ -4881,7 +5311,8 @@ class Josm_deprecated(PluginMapCSS):
                     'measurement'])
                 }})
 
-        # *[measurement=seismic]
+    # *[measurement=seismic]
+    def _way_rule_21(self, data, tags, nds, keys, err, sets):
         if ('measurement' in keys):
             match = False
             if not match:
@@ -4901,7 +5332,8 @@ class Josm_deprecated(PluginMapCSS):
                     'measurement'])
                 }})
 
-        # *[monitoring:river_level]
+    # *[monitoring:river_level]
+    def _way_rule_22(self, data, tags, nds, keys, err, sets):
         if ('monitoring:river_level' in keys):
             match = False
             if not match:
@@ -4920,7 +5352,8 @@ class Josm_deprecated(PluginMapCSS):
                     'monitoring:river_level'])
                 }})
 
-        # *[stay]
+    # *[stay]
+    def _way_rule_23(self, data, tags, nds, keys, err, sets):
         if ('stay' in keys):
             match = False
             if not match:
@@ -4939,18 +5372,19 @@ class Josm_deprecated(PluginMapCSS):
                     'stay'])
                 }})
 
-        # *[emergency=aed]
-        # Rule Blacklisted (id: 707111885)
+    # *[emergency=aed]
+    # Rule Blacklisted (id: 707111885)
 
-        # *[day_on][!restriction]
-        # *[day_off][!restriction]
-        # *[date_on][!restriction]
-        # *[date_off][!restriction]
-        # *[hour_on][!restriction]
-        # *[hour_off][!restriction]
-        # Rule Blacklisted (id: 294264920)
+    # *[day_on][!restriction]
+    # *[day_off][!restriction]
+    # *[date_on][!restriction]
+    # *[date_off][!restriction]
+    # *[hour_on][!restriction]
+    # *[hour_off][!restriction]
+    # Rule Blacklisted (id: 294264920)
 
-        # *[access=designated]
+    # *[access=designated]
+    def _way_rule_24(self, data, tags, nds, keys, err, sets):
         if ('access' in keys):
             match = False
             if not match:
@@ -4962,7 +5396,8 @@ class Josm_deprecated(PluginMapCSS):
                 # assertMatch:"way access=designated"
                 err.append({'class': 9002002, 'subclass': 2057594338, 'text': mapcss.tr('\'\'{0}\'\' is meaningless, use more specific tags, e.g. \'\'{1}\'\'', 'access=designated', 'bicycle=designated')})
 
-        # *[access=official]
+    # *[access=official]
+    def _way_rule_25(self, data, tags, nds, keys, err, sets):
         if ('access' in keys):
             match = False
             if not match:
@@ -4974,8 +5409,9 @@ class Josm_deprecated(PluginMapCSS):
                 # assertMatch:"way access=official"
                 err.append({'class': 9002003, 'subclass': 1909133836, 'text': mapcss.tr('\'\'{0}\'\' does not specify the official mode of transportation, use \'\'{1}\'\' for example', 'access=official', 'bicycle=official')})
 
-        # *[fixme=yes]
-        # *[FIXME=yes]
+    # *[fixme=yes]
+    # *[FIXME=yes]
+    def _way_rule_26(self, data, tags, nds, keys, err, sets):
         if ('FIXME' in keys) or ('fixme' in keys):
             match = False
             if not match:
@@ -4991,7 +5427,8 @@ class Josm_deprecated(PluginMapCSS):
                 # assertMatch:"way fixme=yes"
                 err.append({'class': 9002004, 'subclass': 136657482, 'text': mapcss.tr('{0}={1} is unspecific. Instead of \'\'{1}\'\' please give more information about what exactly should be fixed.', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[name][name=~/^(?i)fixme$/]
+    # *[name][name=~/^(?i)fixme$/]
+    def _way_rule_27(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -5006,7 +5443,8 @@ class Josm_deprecated(PluginMapCSS):
                     'name'])
                 }})
 
-        # *[note][note=~/^(?i)fixme$/]
+    # *[note][note=~/^(?i)fixme$/]
+    def _way_rule_28(self, data, tags, nds, keys, err, sets):
         if ('note' in keys):
             match = False
             if not match:
@@ -5017,8 +5455,9 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is unspecific. Instead use the key fixme with the information what exactly should be fixed in the value of fixme.","{0.tag}")
                 err.append({'class': 9002006, 'subclass': 1243120287, 'text': mapcss.tr('{0} is unspecific. Instead use the key fixme with the information what exactly should be fixed in the value of fixme.', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[type=broad_leaved]
-        # *[type=broad_leafed]
+    # *[type=broad_leaved]
+    # *[type=broad_leafed]
+    def _way_rule_29(self, data, tags, nds, keys, err, sets):
         if ('type' in keys):
             match = False
             if not match:
@@ -5042,9 +5481,10 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[wood=coniferous]
-        # *[type=coniferous]
-        # *[type=conifer]
+    # *[wood=coniferous]
+    # *[type=coniferous]
+    # *[type=conifer]
+    def _way_rule_30(self, data, tags, nds, keys, err, sets):
         if ('type' in keys) or ('wood' in keys):
             match = False
             if not match:
@@ -5072,7 +5512,8 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[wood=mixed]
+    # *[wood=mixed]
+    def _way_rule_31(self, data, tags, nds, keys, err, sets):
         if ('wood' in keys):
             match = False
             if not match:
@@ -5092,8 +5533,9 @@ class Josm_deprecated(PluginMapCSS):
                     'wood'])
                 }})
 
-        # *[wood=evergreen]
-        # *[type=evergreen]
+    # *[wood=evergreen]
+    # *[type=evergreen]
+    def _way_rule_32(self, data, tags, nds, keys, err, sets):
         if ('type' in keys) or ('wood' in keys):
             match = False
             if not match:
@@ -5117,9 +5559,10 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[wood=deciduous]
-        # *[type=deciduous]
-        # *[type=deciduos]
+    # *[wood=deciduous]
+    # *[type=deciduous]
+    # *[type=deciduos]
+    def _way_rule_33(self, data, tags, nds, keys, err, sets):
         if ('type' in keys) or ('wood' in keys):
             match = False
             if not match:
@@ -5147,7 +5590,8 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # way[type=palm]
+    # way[type=palm]
+    def _way_rule_34(self, data, tags, nds, keys, err, sets):
         if ('type' in keys):
             match = False
             if not match:
@@ -5162,10 +5606,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"trees"
                 err.append({'class': 9002001, 'subclass': 1757132153, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[natural=land]
-        # Rule Blacklisted (id: 94558529)
+    # *[natural=land]
+    # Rule Blacklisted (id: 94558529)
 
-        # *[bridge=causeway]
+    # *[bridge=causeway]
+    def _way_rule_35(self, data, tags, nds, keys, err, sets):
         if ('bridge' in keys):
             match = False
             if not match:
@@ -5180,18 +5625,19 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"ford=yes"
                 err.append({'class': 9002001, 'subclass': 461671124, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[bridge=swing]
-        # Rule Blacklisted (id: 1047428067)
+    # *[bridge=swing]
+    # Rule Blacklisted (id: 1047428067)
 
-        # *[bridge=suspension]
-        # Rule Blacklisted (id: 1157046268)
+    # *[bridge=suspension]
+    # Rule Blacklisted (id: 1157046268)
 
-        # *[bridge=pontoon]
-        # Rule Blacklisted (id: 1195531951)
+    # *[bridge=pontoon]
+    # Rule Blacklisted (id: 1195531951)
 
-        # *[fee=interval]
-        # *[lit=interval]
-        # *[supervised=interval]
+    # *[fee=interval]
+    # *[lit=interval]
+    # *[supervised=interval]
+    def _way_rule_36(self, data, tags, nds, keys, err, sets):
         if ('fee' in keys) or ('lit' in keys) or ('supervised' in keys):
             match = False
             if not match:
@@ -5211,7 +5657,8 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated. Please specify interval by using opening_hours syntax","{0.tag}")
                 err.append({'class': 9002001, 'subclass': 417886592, 'text': mapcss.tr('{0} is deprecated. Please specify interval by using opening_hours syntax', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[/josm\/ignore/]
+    # *[/josm\/ignore/]
+    def _way_rule_37(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -5224,10 +5671,11 @@ class Josm_deprecated(PluginMapCSS):
                 # fixDeleteObject:this
                 err.append({'class': 9002001, 'subclass': 1402743016, 'text': mapcss.tr('{0} is deprecated. Please delete this object and use a private layer instead', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[sport=diving]
-        # Rule Blacklisted (id: 590643159)
+    # *[sport=diving]
+    # Rule Blacklisted (id: 590643159)
 
-        # *[parking=park_and_ride]
+    # *[parking=park_and_ride]
+    def _way_rule_38(self, data, tags, nds, keys, err, sets):
         if ('parking' in keys):
             match = False
             if not match:
@@ -5249,24 +5697,25 @@ class Josm_deprecated(PluginMapCSS):
                     'parking'])
                 }})
 
-        # *[parking=yes]
-        # *[playground=yes]
-        # *[manhole=plain]
-        # *[manhole=unknown]
-        # *[manhole=yes]
-        # *[police=yes]
-        # *[traffic_calming=yes]
-        # *[access=restricted]
-        # *[barrier=yes]
-        # *[aerialway=yes][!public_transport]
-        # *[amenity=yes]
-        # *[leisure=yes]
-        # *[landuse=yes]
-        # *[shop="*"]
-        # *[shop=yes][amenity!=fuel]
-        # *[craft=yes]
-        # *[service=yes]
-        # *[place=yes]
+    # *[parking=yes]
+    # *[playground=yes]
+    # *[manhole=plain]
+    # *[manhole=unknown]
+    # *[manhole=yes]
+    # *[police=yes]
+    # *[traffic_calming=yes]
+    # *[access=restricted]
+    # *[barrier=yes]
+    # *[aerialway=yes][!public_transport]
+    # *[amenity=yes]
+    # *[leisure=yes]
+    # *[landuse=yes]
+    # *[shop="*"]
+    # *[shop=yes][amenity!=fuel]
+    # *[craft=yes]
+    # *[service=yes]
+    # *[place=yes]
+    def _way_rule_39(self, data, tags, nds, keys, err, sets):
         if ('access' in keys) or ('aerialway' in keys) or ('amenity' in keys) or ('barrier' in keys) or ('craft' in keys) or ('landuse' in keys) or ('leisure' in keys) or ('manhole' in keys) or ('parking' in keys) or ('place' in keys) or ('playground' in keys) or ('police' in keys) or ('service' in keys) or ('shop' in keys) or ('traffic_calming' in keys):
             match = False
             if not match:
@@ -5345,13 +5794,14 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0}={1} is unspecific. Please replace ''{1}'' by a specific value.","{0.key}","{0.value}")
                 err.append({'class': 9002007, 'subclass': 1452069773, 'text': mapcss.tr('{0}={1} is unspecific. Please replace \'\'{1}\'\' by a specific value.', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[place_name][!name]
-        # Rule Blacklisted (id: 1089331760)
+    # *[place_name][!name]
+    # Rule Blacklisted (id: 1089331760)
 
-        # *[place][place_name=*name]
-        # Rule Blacklisted (id: 1116761280)
+    # *[place][place_name=*name]
+    # Rule Blacklisted (id: 1116761280)
 
-        # way[sidewalk=yes]
+    # way[sidewalk=yes]
+    def _way_rule_40(self, data, tags, nds, keys, err, sets):
         if ('sidewalk' in keys):
             match = False
             if not match:
@@ -5366,7 +5816,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"sidewalk=separate"
                 err.append({'class': 9002024, 'subclass': 36539821, 'text': mapcss.tr('{0} is unspecific', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[waterway=water_point]
+    # *[waterway=water_point]
+    def _way_rule_41(self, data, tags, nds, keys, err, sets):
         if ('waterway' in keys):
             match = False
             if not match:
@@ -5385,7 +5836,8 @@ class Josm_deprecated(PluginMapCSS):
                     'waterway'])
                 }})
 
-        # *[waterway=waste_disposal]
+    # *[waterway=waste_disposal]
+    def _way_rule_42(self, data, tags, nds, keys, err, sets):
         if ('waterway' in keys):
             match = False
             if not match:
@@ -5404,7 +5856,8 @@ class Josm_deprecated(PluginMapCSS):
                     'waterway'])
                 }})
 
-        # *[waterway=mooring]
+    # *[waterway=mooring]
+    def _way_rule_43(self, data, tags, nds, keys, err, sets):
         if ('waterway' in keys):
             match = False
             if not match:
@@ -5424,8 +5877,9 @@ class Josm_deprecated(PluginMapCSS):
                     'waterway'])
                 }})
 
-        # *[building][levels]
-        # *[building:part][levels]
+    # *[building][levels]
+    # *[building:part][levels]
+    def _way_rule_44(self, data, tags, nds, keys, err, sets):
         if ('building' in keys and 'levels' in keys) or ('building:part' in keys and 'levels' in keys):
             match = False
             if not match:
@@ -5442,7 +5896,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{1.key}")
                 # suggestAlternative:"building:levels"
                 # fixChangeKey:"levels => building:levels"
-                set_levels_building = True
+                sets.add('levels_building')
                 err.append({'class': 9002001, 'subclass': 869936714, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{1.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['building:levels', mapcss.tag(tags, 'levels')]]),
@@ -5450,18 +5904,20 @@ class Josm_deprecated(PluginMapCSS):
                     'levels'])
                 }})
 
-        # *[levels]!.levels_building
+    # *[levels]!.levels_building
+    def _way_rule_45(self, data, tags, nds, keys, err, sets):
         if ('levels' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_levels_building) and (mapcss._tag_capture(capture_tags, 0, tags, 'levels')))
+                try: match = (('levels_building' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'levels')))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwWarning:tr("Unusual key {0}, maybe {1} or {2} is meant","{0.key}","level","building:levels")
                 err.append({'class': 9002021, 'subclass': 1172699526, 'text': mapcss.tr('Unusual key {0}, maybe {1} or {2} is meant', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'level', 'building:levels')})
 
-        # *[building:level][!building:levels]
+    # *[building:level][!building:levels]
+    def _way_rule_46(self, data, tags, nds, keys, err, sets):
         if ('building:level' in keys):
             match = False
             if not match:
@@ -5480,7 +5936,8 @@ class Josm_deprecated(PluginMapCSS):
                     'building:level'])
                 }})
 
-        # *[building:level][building:levels]
+    # *[building:level][building:levels]
+    def _way_rule_47(self, data, tags, nds, keys, err, sets):
         if ('building:level' in keys and 'building:levels' in keys):
             match = False
             if not match:
@@ -5493,7 +5950,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"building:levels"
                 err.append({'class': 9002001, 'subclass': 902689123, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[protected_class]
+    # *[protected_class]
+    def _way_rule_48(self, data, tags, nds, keys, err, sets):
         if ('protected_class' in keys):
             match = False
             if not match:
@@ -5512,19 +5970,20 @@ class Josm_deprecated(PluginMapCSS):
                     'protected_class'])
                 }})
 
-        # *[kerb=unknown]
-        # *[lock=unknown]
-        # *[hide=unknown]
-        # *[shelter=unknown]
-        # *[access=unknown]
-        # *[capacity:parent=unknown]
-        # *[capacity:women=unknown]
-        # *[capacity:disabled=unknown]
-        # *[crossing=unknown]
-        # *[foot=unknown]
-        # Rule Blacklisted (id: 1052866123)
-
-        # *[sport=skiing]
+    # *[kerb=unknown]
+    # *[lock=unknown]
+    # *[hide=unknown]
+    # *[shelter=unknown]
+    # *[access=unknown]
+    # *[capacity:parent=unknown]
+    # *[capacity:women=unknown]
+    # *[capacity:disabled=unknown]
+    # *[crossing=unknown]
+    # *[foot=unknown]
+    # Rule Blacklisted (id: 1052866123)
+
+    # *[sport=skiing]
+    def _way_rule_49(self, data, tags, nds, keys, err, sets):
         if ('sport' in keys):
             match = False
             if not match:
@@ -5537,10 +5996,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:tr("{0} + {1} + {2}","piste:type=*","piste:difficulty=*","piste:grooming=*")
                 err.append({'class': 9002001, 'subclass': 1578959559, 'text': mapcss.tr('Definition of {0} is unclear', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[waterway=wadi]
-        # Rule Blacklisted (id: 719234223)
+    # *[waterway=wadi]
+    # Rule Blacklisted (id: 719234223)
 
-        # way[oneway=1]
+    # way[oneway=1]
+    def _way_rule_50(self, data, tags, nds, keys, err, sets):
         if ('oneway' in keys):
             match = False
             if not match:
@@ -5557,7 +6017,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['oneway','yes']])
                 }})
 
-        # way[oneway=-1]
+    # way[oneway=-1]
+    def _way_rule_51(self, data, tags, nds, keys, err, sets):
         if ('oneway' in keys):
             match = False
             if not match:
@@ -5568,13 +6029,14 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is not recommended. Use the Reverse Ways function from the Tools menu.","{0.tag}")
                 err.append({'class': 9002016, 'subclass': 579355135, 'text': mapcss.tr('{0} is not recommended. Use the Reverse Ways function from the Tools menu.', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[drinkable]
-        # Rule Blacklisted (id: 1785584789)
+    # *[drinkable]
+    # Rule Blacklisted (id: 1785584789)
 
-        # *[color][!colour]
-        # Rule Blacklisted (id: 1850270072)
+    # *[color][!colour]
+    # Rule Blacklisted (id: 1850270072)
 
-        # area[building:color][!building:colour]
+    # area[building:color][!building:colour]
+    def _way_rule_52(self, data, tags, nds, keys, err, sets):
         if ('building:color' in keys):
             match = False
             if not match:
@@ -5595,7 +6057,8 @@ class Josm_deprecated(PluginMapCSS):
                     'building:color'])
                 }})
 
-        # area[roof:color][!roof:colour]
+    # area[roof:color][!roof:colour]
+    def _way_rule_53(self, data, tags, nds, keys, err, sets):
         if ('roof:color' in keys):
             match = False
             if not match:
@@ -5616,10 +6079,11 @@ class Josm_deprecated(PluginMapCSS):
                     'roof:color'])
                 }})
 
-        # *[color][colour][color=*colour]
-        # Rule Blacklisted (id: 1825345743)
+    # *[color][colour][color=*colour]
+    # Rule Blacklisted (id: 1825345743)
 
-        # area[building:color][building:colour]["building:color"=*"building:colour"]
+    # area[building:color][building:colour]["building:color"=*"building:colour"]
+    def _way_rule_54(self, data, tags, nds, keys, err, sets):
         if ('building:color' in keys and 'building:colour' in keys):
             match = False
             if not match:
@@ -5634,13 +6098,14 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"building:color"
                 # assertNoMatch:"way building:color=red building:colour=green"
                 # assertMatch:"way building:color=red building:colour=red"
-                set_samebuildingcolor = True
+                sets.add('samebuildingcolor')
                 err.append({'class': 9002001, 'subclass': 1236974991, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}')), 'allow_fix_override': True, 'fix': {
                     '-': ([
                     'building:color'])
                 }})
 
-        # area[roof:color][roof:colour]["roof:color"=*"roof:colour"]
+    # area[roof:color][roof:colour]["roof:color"=*"roof:colour"]
+    def _way_rule_55(self, data, tags, nds, keys, err, sets):
         if ('roof:color' in keys and 'roof:colour' in keys):
             match = False
             if not match:
@@ -5655,22 +6120,23 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"roof:color"
                 # assertNoMatch:"way roof:color=red roof:colour=green"
                 # assertMatch:"way roof:color=red roof:colour=red"
-                set_sameroofcolor = True
+                sets.add('sameroofcolor')
                 err.append({'class': 9002001, 'subclass': 1815260806, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}')), 'allow_fix_override': True, 'fix': {
                     '-': ([
                     'roof:color'])
                 }})
 
-        # *[color][colour]!.samecolor
-        # Rule Blacklisted (id: 1064658218)
+    # *[color][colour]!.samecolor
+    # Rule Blacklisted (id: 1064658218)
 
-        # *[building:color][building:colour]!.samebuildingcolor
-        # Rule Blacklisted (id: 740601387)
+    # *[building:color][building:colour]!.samebuildingcolor
+    # Rule Blacklisted (id: 740601387)
 
-        # *[roof:color][roof:colour]!.sameroofcolor
-        # Rule Blacklisted (id: 512779280)
+    # *[roof:color][roof:colour]!.sameroofcolor
+    # Rule Blacklisted (id: 512779280)
 
-        # *[/:color/][!building:color][!roof:color][!gpxd:color]
+    # *[/:color/][!building:color][!roof:color][!gpxd:color]
+    def _way_rule_56(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -5686,7 +6152,8 @@ class Josm_deprecated(PluginMapCSS):
                 # assertNoMatch:"way roof:color=grey"
                 err.append({'class': 9002001, 'subclass': 1632389707, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[/color:/]
+    # *[/color:/]
+    def _way_rule_57(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -5701,12 +6168,13 @@ class Josm_deprecated(PluginMapCSS):
                 # assertNoMatch:"way color=red"
                 err.append({'class': 9002001, 'subclass': 1390370717, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[/=|\+|\/|&|<|>|;|'|"|%|#|@|\\|,|\.|\{|\}|\?|\*|\^|\$/]
-        # Rule Blacklisted (id: 1752615188)
+    # *[/=|\+|\/|&|<|>|;|'|"|%|#|@|\\|,|\.|\{|\}|\?|\*|\^|\$/]
+    # Rule Blacklisted (id: 1752615188)
 
-        # *[/^.$/]
-        # way[/^..$/][route=ferry][!to]
-        # way[/^..$/][route!=ferry]
+    # *[/^.$/]
+    # way[/^..$/][route=ferry][!to]
+    # way[/^..$/][route!=ferry]
+    def _way_rule_58(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -5727,12 +6195,13 @@ class Josm_deprecated(PluginMapCSS):
                 # assertMatch:"way to=bar"
                 err.append({'class': 9002012, 'subclass': 1765060211, 'text': mapcss.tr('uncommon short key')})
 
-        # *[sport=hockey]
-        # Rule Blacklisted (id: 651933474)
+    # *[sport=hockey]
+    # Rule Blacklisted (id: 651933474)
 
-        # *[sport=billard]
-        # *[sport=billards]
-        # *[sport=billiard]
+    # *[sport=billard]
+    # *[sport=billards]
+    # *[sport=billiard]
+    def _way_rule_59(self, data, tags, nds, keys, err, sets):
         if ('sport' in keys):
             match = False
             if not match:
@@ -5757,10 +6226,11 @@ class Josm_deprecated(PluginMapCSS):
                     ['sport','billiards']])
                 }})
 
-        # *[payment:ep_quick]
-        # *[payment:ep_cash]
-        # *[payment:ep_proton]
-        # *[payment:ep_chipknip]
+    # *[payment:ep_quick]
+    # *[payment:ep_cash]
+    # *[payment:ep_proton]
+    # *[payment:ep_chipknip]
+    def _way_rule_60(self, data, tags, nds, keys, err, sets):
         if ('payment:ep_cash' in keys) or ('payment:ep_chipknip' in keys) or ('payment:ep_proton' in keys) or ('payment:ep_quick' in keys):
             match = False
             if not match:
@@ -5788,7 +6258,8 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[kp][railway!=milestone]
+    # *[kp][railway!=milestone]
+    def _way_rule_61(self, data, tags, nds, keys, err, sets):
         if ('kp' in keys):
             match = False
             if not match:
@@ -5807,7 +6278,8 @@ class Josm_deprecated(PluginMapCSS):
                     'kp'])
                 }})
 
-        # *[pk][railway!=milestone]
+    # *[pk][railway!=milestone]
+    def _way_rule_62(self, data, tags, nds, keys, err, sets):
         if ('pk' in keys):
             match = False
             if not match:
@@ -5826,7 +6298,8 @@ class Josm_deprecated(PluginMapCSS):
                     'pk'])
                 }})
 
-        # *[kp][railway=milestone]
+    # *[kp][railway=milestone]
+    def _way_rule_63(self, data, tags, nds, keys, err, sets):
         if ('kp' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -5845,7 +6318,8 @@ class Josm_deprecated(PluginMapCSS):
                     'kp'])
                 }})
 
-        # *[pk][railway=milestone]
+    # *[pk][railway=milestone]
+    def _way_rule_64(self, data, tags, nds, keys, err, sets):
         if ('pk' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -5864,7 +6338,8 @@ class Josm_deprecated(PluginMapCSS):
                     'pk'])
                 }})
 
-        # *[distance][railway=milestone]
+    # *[distance][railway=milestone]
+    def _way_rule_65(self, data, tags, nds, keys, err, sets):
         if ('distance' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -5883,7 +6358,8 @@ class Josm_deprecated(PluginMapCSS):
                     'distance'])
                 }})
 
-        # *[postcode]
+    # *[postcode]
+    def _way_rule_66(self, data, tags, nds, keys, err, sets):
         if ('postcode' in keys):
             match = False
             if not match:
@@ -5897,7 +6373,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"postal_code"
                 err.append({'class': 9002001, 'subclass': 1942523538, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[water=intermittent]
+    # *[water=intermittent]
+    def _way_rule_67(self, data, tags, nds, keys, err, sets):
         if ('water' in keys):
             match = False
             if not match:
@@ -5917,7 +6394,8 @@ class Josm_deprecated(PluginMapCSS):
                     'water'])
                 }})
 
-        # way[type][type!=waterway][man_made=pipeline]
+    # way[type][type!=waterway][man_made=pipeline]
+    def _way_rule_68(self, data, tags, nds, keys, err, sets):
         if ('man_made' in keys and 'type' in keys):
             match = False
             if not match:
@@ -5936,10 +6414,11 @@ class Josm_deprecated(PluginMapCSS):
                     'type'])
                 }})
 
-        # *[landuse=farm]
-        # Rule Blacklisted (id: 1968473048)
+    # *[landuse=farm]
+    # Rule Blacklisted (id: 1968473048)
 
-        # *[seamark=buoy]["seamark:type"=~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    # *[seamark=buoy]["seamark:type"=~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    def _way_rule_69(self, data, tags, nds, keys, err, sets):
         if ('seamark' in keys and 'seamark:type' in keys):
             match = False
             if not match:
@@ -5956,7 +6435,8 @@ class Josm_deprecated(PluginMapCSS):
                     'seamark'])
                 }})
 
-        # *[seamark=buoy]["seamark:type"!~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    # *[seamark=buoy]["seamark:type"!~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    def _way_rule_70(self, data, tags, nds, keys, err, sets):
         if ('seamark' in keys):
             match = False
             if not match:
@@ -5969,7 +6449,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"{1.tag}"
                 err.append({'class': 9002001, 'subclass': 1481035998, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[landuse=conservation]
+    # *[landuse=conservation]
+    def _way_rule_71(self, data, tags, nds, keys, err, sets):
         if ('landuse' in keys):
             match = False
             if not match:
@@ -5989,16 +6470,17 @@ class Josm_deprecated(PluginMapCSS):
                     'landuse'])
                 }})
 
-        # *[amenity=kiosk]
-        # Rule Blacklisted (id: 1331930630)
+    # *[amenity=kiosk]
+    # Rule Blacklisted (id: 1331930630)
 
-        # *[amenity=shop]
-        # Rule Blacklisted (id: 1562207150)
+    # *[amenity=shop]
+    # Rule Blacklisted (id: 1562207150)
 
-        # *[shop=fishmonger]
-        # Rule Blacklisted (id: 1376789416)
+    # *[shop=fishmonger]
+    # Rule Blacklisted (id: 1376789416)
 
-        # *[shop=fish]
+    # *[shop=fish]
+    def _way_rule_72(self, data, tags, nds, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -6013,7 +6495,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=seafood"
                 err.append({'class': 9002001, 'subclass': 47191734, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[shop=betting]
+    # *[shop=betting]
+    def _way_rule_73(self, data, tags, nds, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -6031,10 +6514,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=lottery"
                 err.append({'class': 9002001, 'subclass': 1035501389, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[shop=perfume]
-        # Rule Blacklisted (id: 2075099676)
+    # *[shop=perfume]
+    # Rule Blacklisted (id: 2075099676)
 
-        # *[amenity=exercise_point]
+    # *[amenity=exercise_point]
+    def _way_rule_74(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -6054,16 +6538,17 @@ class Josm_deprecated(PluginMapCSS):
                     'amenity'])
                 }})
 
-        # *[shop=auto_parts]
-        # Rule Blacklisted (id: 1675828779)
+    # *[shop=auto_parts]
+    # Rule Blacklisted (id: 1675828779)
 
-        # *[amenity=car_repair]
-        # Rule Blacklisted (id: 1681273585)
+    # *[amenity=car_repair]
+    # Rule Blacklisted (id: 1681273585)
 
-        # *[amenity=studio][type=audio]
-        # *[amenity=studio][type=radio]
-        # *[amenity=studio][type=television]
-        # *[amenity=studio][type=video]
+    # *[amenity=studio][type=audio]
+    # *[amenity=studio][type=radio]
+    # *[amenity=studio][type=television]
+    # *[amenity=studio][type=video]
+    def _way_rule_75(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'type' in keys):
             match = False
             if not match:
@@ -6094,10 +6579,11 @@ class Josm_deprecated(PluginMapCSS):
                     'type'])
                 }})
 
-        # *[power=cable_distribution_cabinet]
-        # Rule Blacklisted (id: 1007567078)
+    # *[power=cable_distribution_cabinet]
+    # Rule Blacklisted (id: 1007567078)
 
-        # *[power][location=kiosk]
+    # *[power][location=kiosk]
+    def _way_rule_76(self, data, tags, nds, keys, err, sets):
         if ('location' in keys and 'power' in keys):
             match = False
             if not match:
@@ -6118,7 +6604,8 @@ class Josm_deprecated(PluginMapCSS):
                     'location'])
                 }})
 
-        # *[man_made=well]
+    # *[man_made=well]
+    def _way_rule_77(self, data, tags, nds, keys, err, sets):
         if ('man_made' in keys):
             match = False
             if not match:
@@ -6132,37 +6619,38 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"man_made=water_well"
                 err.append({'class': 9002001, 'subclass': 1740864107, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=dog_bin]
-        # *[amenity=dog_waste_bin]
-        # Rule Blacklisted (id: 2091877281)
+    # *[amenity=dog_bin]
+    # *[amenity=dog_waste_bin]
+    # Rule Blacklisted (id: 2091877281)
 
-        # *[amenity=artwork]
-        # Rule Blacklisted (id: 728429076)
+    # *[amenity=artwork]
+    # Rule Blacklisted (id: 728429076)
 
-        # *[amenity=community_center]
-        # Rule Blacklisted (id: 690512681)
+    # *[amenity=community_center]
+    # Rule Blacklisted (id: 690512681)
 
-        # *[man_made=cut_line]
-        # Rule Blacklisted (id: 1008752382)
+    # *[man_made=cut_line]
+    # Rule Blacklisted (id: 1008752382)
 
-        # *[amenity=park]
-        # Rule Blacklisted (id: 2085280194)
+    # *[amenity=park]
+    # Rule Blacklisted (id: 2085280194)
 
-        # *[amenity=hotel]
-        # Rule Blacklisted (id: 1341786818)
+    # *[amenity=hotel]
+    # Rule Blacklisted (id: 1341786818)
 
-        # *[shop=window]
-        # *[shop=windows]
-        # Rule Blacklisted (id: 532391183)
+    # *[shop=window]
+    # *[shop=windows]
+    # Rule Blacklisted (id: 532391183)
 
-        # *[amenity=education]
-        # Rule Blacklisted (id: 796960259)
+    # *[amenity=education]
+    # Rule Blacklisted (id: 796960259)
 
-        # *[shop=gallery]
-        # Rule Blacklisted (id: 1319611546)
+    # *[shop=gallery]
+    # Rule Blacklisted (id: 1319611546)
 
-        # *[shop=gambling]
-        # *[leisure=gambling]
+    # *[shop=gambling]
+    # *[leisure=gambling]
+    def _way_rule_78(self, data, tags, nds, keys, err, sets):
         if ('leisure' in keys) or ('shop' in keys):
             match = False
             if not match:
@@ -6183,11 +6671,12 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=lottery"
                 err.append({'class': 9002001, 'subclass': 1955724853, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[office=real_estate]
-        # *[office=real_estate_agent]
-        # Rule Blacklisted (id: 2027311706)
+    # *[office=real_estate]
+    # *[office=real_estate_agent]
+    # Rule Blacklisted (id: 2027311706)
 
-        # *[shop=glass]
+    # *[shop=glass]
+    def _way_rule_79(self, data, tags, nds, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -6201,20 +6690,21 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=glaziery"
                 err.append({'class': 9002001, 'subclass': 712020531, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=proposed]
-        # *[amenity=disused]
-        # *[shop=disused]
-        # *[highway=abandoned]
-        # *[historic=abandoned]
-        # Rule Blacklisted (id: 847809313)
+    # *[amenity=proposed]
+    # *[amenity=disused]
+    # *[shop=disused]
+    # *[highway=abandoned]
+    # *[historic=abandoned]
+    # Rule Blacklisted (id: 847809313)
 
-        # *[amenity=swimming_pool]
-        # Rule Blacklisted (id: 2012807801)
+    # *[amenity=swimming_pool]
+    # Rule Blacklisted (id: 2012807801)
 
-        # *[amenity=sauna]
-        # Rule Blacklisted (id: 1450116742)
+    # *[amenity=sauna]
+    # Rule Blacklisted (id: 1450116742)
 
-        # *[/^[^t][^i][^g].+_[0-9]$/][!/^note_[0-9]$/][!/^description_[0-9]$/]
+    # *[/^[^t][^i][^g].+_[0-9]$/][!/^note_[0-9]$/][!/^description_[0-9]$/]
+    def _way_rule_80(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -6230,7 +6720,8 @@ class Josm_deprecated(PluginMapCSS):
                 # assertNoMatch:"way tiger:name_base_1=bar"
                 err.append({'class': 9002014, 'subclass': 2081989305, 'text': mapcss.tr('{0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[sport=skating]
+    # *[sport=skating]
+    def _way_rule_81(self, data, tags, nds, keys, err, sets):
         if ('sport' in keys):
             match = False
             if not match:
@@ -6244,8 +6735,9 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"sport=roller_skating"
                 err.append({'class': 9002001, 'subclass': 170699177, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[barrier=wall][type=noise_barrier][!wall]
-        # way[barrier=wall][type=noise_barrier][wall=noise_barrier]
+    # way[barrier=wall][type=noise_barrier][!wall]
+    # way[barrier=wall][type=noise_barrier][wall=noise_barrier]
+    def _way_rule_82(self, data, tags, nds, keys, err, sets):
         if ('barrier' in keys and 'type' in keys) or ('barrier' in keys and 'type' in keys and 'wall' in keys):
             match = False
             if not match:
@@ -6268,7 +6760,8 @@ class Josm_deprecated(PluginMapCSS):
                     'type'])
                 }})
 
-        # way[barrier=wall][type=noise_barrier][wall][wall!=noise_barrier]
+    # way[barrier=wall][type=noise_barrier][wall][wall!=noise_barrier]
+    def _way_rule_83(self, data, tags, nds, keys, err, sets):
         if ('barrier' in keys and 'type' in keys and 'wall' in keys):
             match = False
             if not match:
@@ -6281,7 +6774,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"wall=noise_barrier"
                 err.append({'class': 9002001, 'subclass': 2130256462, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[amenity=public_building]
+    # *[amenity=public_building]
+    def _way_rule_84(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -6301,10 +6795,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"office=government"
                 err.append({'class': 9002001, 'subclass': 1295642010, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[office=administrative]
-        # Rule Blacklisted (id: 213844674)
+    # *[office=administrative]
+    # Rule Blacklisted (id: 213844674)
 
-        # *[vending=news_papers]
+    # *[vending=news_papers]
+    def _way_rule_85(self, data, tags, nds, keys, err, sets):
         if ('vending' in keys):
             match = False
             if not match:
@@ -6321,7 +6816,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['vending','newspapers']])
                 }})
 
-        # *[service=drive_through]
+    # *[service=drive_through]
+    def _way_rule_86(self, data, tags, nds, keys, err, sets):
         if ('service' in keys):
             match = False
             if not match:
@@ -6338,10 +6834,11 @@ class Josm_deprecated(PluginMapCSS):
                     ['service','drive-through']])
                 }})
 
-        # *[noexit][noexit!=yes][noexit!=no]
-        # way[highway=service][service][service!~/^(alley|drive-through|drive_through|driveway|emergency_access|parking_aisle|rest_area|slipway|yes)$/]
-        # way[railway=rail][service][service!~/^(crossover|siding|spur|yard)$/]
-        # way[waterway=canal][service][service!~/^(irrigation|transportation|water_power)$/]
+    # *[noexit][noexit!=yes][noexit!=no]
+    # way[highway=service][service][service!~/^(alley|drive-through|drive_through|driveway|emergency_access|parking_aisle|rest_area|slipway|yes)$/]
+    # way[railway=rail][service][service!~/^(crossover|siding|spur|yard)$/]
+    # way[waterway=canal][service][service!~/^(irrigation|transportation|water_power)$/]
+    def _way_rule_87(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'service' in keys) or ('noexit' in keys) or ('railway' in keys and 'service' in keys) or ('service' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -6364,10 +6861,11 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("The key {0} has an uncommon value.","{1.key}")
                 err.append({'class': 9002017, 'subclass': 806344140, 'text': mapcss.tr('The key {0} has an uncommon value.', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[name:botanical]
-        # Rule Blacklisted (id: 1061429000)
+    # *[name:botanical]
+    # Rule Blacklisted (id: 1061429000)
 
-        # area[landuse=pond]
+    # area[landuse=pond]
+    def _way_rule_88(self, data, tags, nds, keys, err, sets):
         if ('landuse' in keys):
             match = False
             if not match:
@@ -6389,9 +6887,10 @@ class Josm_deprecated(PluginMapCSS):
                     'landuse'])
                 }})
 
-        # *[shop=souvenir]
-        # *[shop=souvenirs]
-        # *[shop=souveniers]
+    # *[shop=souvenir]
+    # *[shop=souvenirs]
+    # *[shop=souveniers]
+    def _way_rule_89(self, data, tags, nds, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -6416,7 +6915,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','gift']])
                 }})
 
-        # *[vending=animal_food]
+    # *[vending=animal_food]
+    def _way_rule_90(self, data, tags, nds, keys, err, sets):
         if ('vending' in keys):
             match = False
             if not match:
@@ -6433,7 +6933,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['vending','animal_feed']])
                 }})
 
-        # way[highway=emergency_access_point][phone][!emergency_telephone_code]
+    # way[highway=emergency_access_point][phone][!emergency_telephone_code]
+    def _way_rule_91(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'phone' in keys):
             match = False
             if not match:
@@ -6452,7 +6953,8 @@ class Josm_deprecated(PluginMapCSS):
                     'phone'])
                 }})
 
-        # way[highway=emergency_access_point][phone=*emergency_telephone_code]
+    # way[highway=emergency_access_point][phone=*emergency_telephone_code]
+    def _way_rule_92(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'phone' in keys):
             match = False
             if not match:
@@ -6469,7 +6971,8 @@ class Josm_deprecated(PluginMapCSS):
                     'phone'])
                 }})
 
-        # way[highway=emergency_access_point][phone][emergency_telephone_code][phone!=*emergency_telephone_code]
+    # way[highway=emergency_access_point][phone][emergency_telephone_code][phone!=*emergency_telephone_code]
+    def _way_rule_93(self, data, tags, nds, keys, err, sets):
         if ('emergency_telephone_code' in keys and 'highway' in keys and 'phone' in keys):
             match = False
             if not match:
@@ -6482,7 +6985,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"emergency_telephone_code"
                 err.append({'class': 9002001, 'subclass': 144379729, 'text': mapcss.tr('{0} is deprecated for {1}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[tracktype=1]
+    # way[tracktype=1]
+    def _way_rule_94(self, data, tags, nds, keys, err, sets):
         if ('tracktype' in keys):
             match = False
             if not match:
@@ -6499,7 +7003,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['tracktype','grade1']])
                 }})
 
-        # way[tracktype=2]
+    # way[tracktype=2]
+    def _way_rule_95(self, data, tags, nds, keys, err, sets):
         if ('tracktype' in keys):
             match = False
             if not match:
@@ -6516,7 +7021,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['tracktype','grade2']])
                 }})
 
-        # way[tracktype=3]
+    # way[tracktype=3]
+    def _way_rule_96(self, data, tags, nds, keys, err, sets):
         if ('tracktype' in keys):
             match = False
             if not match:
@@ -6533,7 +7039,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['tracktype','grade3']])
                 }})
 
-        # way[tracktype=4]
+    # way[tracktype=4]
+    def _way_rule_97(self, data, tags, nds, keys, err, sets):
         if ('tracktype' in keys):
             match = False
             if not match:
@@ -6550,7 +7057,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['tracktype','grade4']])
                 }})
 
-        # way[tracktype=5]
+    # way[tracktype=5]
+    def _way_rule_98(self, data, tags, nds, keys, err, sets):
         if ('tracktype' in keys):
             match = False
             if not match:
@@ -6567,7 +7075,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['tracktype','grade5']])
                 }})
 
-        # way[tracktype][tracktype!~/^(1|2|3|4|5|grade1|grade2|grade3|grade4|grade5)$/]
+    # way[tracktype][tracktype!~/^(1|2|3|4|5|grade1|grade2|grade3|grade4|grade5)$/]
+    def _way_rule_99(self, data, tags, nds, keys, err, sets):
         if ('tracktype' in keys):
             match = False
             if not match:
@@ -6583,7 +7092,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"tracktype=grade5"
                 err.append({'class': 9002019, 'subclass': 1665196665, 'text': mapcss.tr('wrong value: {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # area[area][area!=yes][area!=no]
+    # area[area][area!=yes][area!=no]
+    def _way_rule_100(self, data, tags, nds, keys, err, sets):
         if ('area' in keys):
             match = False
             if not match:
@@ -6596,8 +7106,9 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"area=yes"
                 err.append({'class': 9002019, 'subclass': 131196621, 'text': mapcss.tr('wrong value: {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=hunting_stand][lock=yes]
-        # *[amenity=hunting_stand][lock=no]
+    # *[amenity=hunting_stand][lock=yes]
+    # *[amenity=hunting_stand][lock=no]
+    def _way_rule_101(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'lock' in keys):
             match = False
             if not match:
@@ -6620,16 +7131,17 @@ class Josm_deprecated(PluginMapCSS):
                     'lock'])
                 }})
 
-        # *[amenity=advertising][!advertising]
-        # Rule Blacklisted (id: 1696784412)
+    # *[amenity=advertising][!advertising]
+    # Rule Blacklisted (id: 1696784412)
 
-        # *[amenity=advertising][advertising]
-        # Rule Blacklisted (id: 1538706366)
+    # *[amenity=advertising][advertising]
+    # Rule Blacklisted (id: 1538706366)
 
-        # way[direction=up][incline=up]
-        # way[direction=down][incline=down]
-        # way[direction=up][!incline]
-        # way[direction=down][!incline]
+    # way[direction=up][incline=up]
+    # way[direction=down][incline=down]
+    # way[direction=up][!incline]
+    # way[direction=down][!incline]
+    def _way_rule_102(self, data, tags, nds, keys, err, sets):
         if ('direction' in keys) or ('direction' in keys and 'incline' in keys):
             match = False
             if not match:
@@ -6660,8 +7172,9 @@ class Josm_deprecated(PluginMapCSS):
                     'direction'])
                 }})
 
-        # way[direction=up][incline][incline!=up]
-        # way[direction=down][incline][incline!=down]
+    # way[direction=up][incline][incline!=up]
+    # way[direction=down][incline][incline!=down]
+    def _way_rule_103(self, data, tags, nds, keys, err, sets):
         if ('direction' in keys and 'incline' in keys):
             match = False
             if not match:
@@ -6678,11 +7191,12 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"incline"
                 err.append({'class': 9002001, 'subclass': 937812227, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[building=true]
-        # *[building="*"]
-        # *[building=Y]
-        # *[building=y]
-        # *[building=1]
+    # *[building=true]
+    # *[building="*"]
+    # *[building=Y]
+    # *[building=y]
+    # *[building=1]
+    def _way_rule_104(self, data, tags, nds, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -6715,16 +7229,17 @@ class Josm_deprecated(PluginMapCSS):
                     ['building','yes']])
                 }})
 
-        # *[building=abandoned]
-        # *[building=address]
-        # *[building=bing]
-        # *[building=collapsed]
-        # *[building=damaged]
-        # *[building=demolished]
-        # *[building=disused]
-        # *[building=fixme]
-        # *[building=occupied]
-        # *[building=razed]
+    # *[building=abandoned]
+    # *[building=address]
+    # *[building=bing]
+    # *[building=collapsed]
+    # *[building=damaged]
+    # *[building=demolished]
+    # *[building=disused]
+    # *[building=fixme]
+    # *[building=occupied]
+    # *[building=razed]
+    def _way_rule_105(self, data, tags, nds, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -6772,11 +7287,12 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is not a building type.","{0.tag}")
                 err.append({'class': 9002001, 'subclass': 938825828, 'text': mapcss.tr('{0} is not a building type.', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[building=other]
-        # *[building=unclassified]
-        # *[building=undefined]
-        # *[building=unknown]
-        # *[building=unidentified]
+    # *[building=other]
+    # *[building=unclassified]
+    # *[building=undefined]
+    # *[building=unknown]
+    # *[building=unidentified]
+    def _way_rule_106(self, data, tags, nds, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -6808,10 +7324,11 @@ class Josm_deprecated(PluginMapCSS):
                     ['building','yes']])
                 }})
 
-        # way[water=salt]
-        # way[water=salt_pool]
-        # way[water=salt_panne]
-        # way[water=salt_pond]
+    # way[water=salt]
+    # way[water=salt_pool]
+    # way[water=salt_panne]
+    # way[water=salt_pond]
+    def _way_rule_107(self, data, tags, nds, keys, err, sets):
         if ('water' in keys):
             match = False
             if not match:
@@ -6837,7 +7354,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"salt=yes"
                 err.append({'class': 9002001, 'subclass': 403932956, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[water=tidal]
+    # way[water=tidal]
+    def _way_rule_108(self, data, tags, nds, keys, err, sets):
         if ('water' in keys):
             match = False
             if not match:
@@ -6857,7 +7375,8 @@ class Josm_deprecated(PluginMapCSS):
                     'water'])
                 }})
 
-        # *[amenity=toilet]
+    # *[amenity=toilet]
+    def _way_rule_109(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -6874,7 +7393,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['amenity','toilets']])
                 }})
 
-        # way[power=busbar]
+    # way[power=busbar]
+    def _way_rule_110(self, data, tags, nds, keys, err, sets):
         if ('power' in keys):
             match = False
             if not match:
@@ -6893,11 +7413,12 @@ class Josm_deprecated(PluginMapCSS):
                     ['power','line']])
                 }})
 
-        # *[man_made=MDF]
-        # *[man_made=telephone_exchange]
-        # Rule Blacklisted (id: 634698090)
+    # *[man_made=MDF]
+    # *[man_made=telephone_exchange]
+    # Rule Blacklisted (id: 634698090)
 
-        # *[building=central_office]
+    # *[building=central_office]
+    def _way_rule_111(self, data, tags, nds, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -6916,10 +7437,11 @@ class Josm_deprecated(PluginMapCSS):
                     ['telecom','exchange']])
                 }})
 
-        # *[telecom=central_office]
-        # Rule Blacklisted (id: 1503278830)
+    # *[telecom=central_office]
+    # Rule Blacklisted (id: 1503278830)
 
-        # *[natural=waterfall]
+    # *[natural=waterfall]
+    def _way_rule_112(self, data, tags, nds, keys, err, sets):
         if ('natural' in keys):
             match = False
             if not match:
@@ -6938,7 +7460,8 @@ class Josm_deprecated(PluginMapCSS):
                     'natural'])
                 }})
 
-        # *[religion=unitarian]
+    # *[religion=unitarian]
+    def _way_rule_113(self, data, tags, nds, keys, err, sets):
         if ('religion' in keys):
             match = False
             if not match:
@@ -6955,7 +7478,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['religion','unitarian_universalist']])
                 }})
 
-        # *[shop=shopping_centre]
+    # *[shop=shopping_centre]
+    def _way_rule_114(self, data, tags, nds, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -6972,8 +7496,9 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','mall']])
                 }})
 
-        # *[is_in]
-        # way[/^is_in:/]
+    # *[is_in]
+    # way[/^is_in:/]
+    def _way_rule_115(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -6993,7 +7518,8 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[sport=football]
+    # *[sport=football]
+    def _way_rule_116(self, data, tags, nds, keys, err, sets):
         if ('sport' in keys):
             match = False
             if not match:
@@ -7012,7 +7538,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"sport=soccer"
                 err.append({'class': 9002001, 'subclass': 73038577, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[leisure=common]
+    # *[leisure=common]
+    def _way_rule_117(self, data, tags, nds, keys, err, sets):
         if ('leisure' in keys):
             match = False
             if not match:
@@ -7027,8 +7554,9 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"leisure=*"
                 err.append({'class': 9002001, 'subclass': 157636301, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[cuisine=vegan]
-        # *[cuisine=vegetarian]
+    # *[cuisine=vegan]
+    # *[cuisine=vegetarian]
+    def _way_rule_118(self, data, tags, nds, keys, err, sets):
         if ('cuisine' in keys):
             match = False
             if not match:
@@ -7046,7 +7574,8 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 err.append({'class': 9002001, 'subclass': 43604574, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[kitchen_hours]
+    # *[kitchen_hours]
+    def _way_rule_119(self, data, tags, nds, keys, err, sets):
         if ('kitchen_hours' in keys):
             match = False
             if not match:
@@ -7065,7 +7594,8 @@ class Josm_deprecated(PluginMapCSS):
                     'kitchen_hours'])
                 }})
 
-        # *[shop=money_transfer]
+    # *[shop=money_transfer]
+    def _way_rule_120(self, data, tags, nds, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -7084,7 +7614,8 @@ class Josm_deprecated(PluginMapCSS):
                     'shop'])
                 }})
 
-        # *[contact:google_plus]
+    # *[contact:google_plus]
+    def _way_rule_121(self, data, tags, nds, keys, err, sets):
         if ('contact:google_plus' in keys):
             match = False
             if not match:
@@ -7100,8 +7631,9 @@ class Josm_deprecated(PluginMapCSS):
                     'contact:google_plus'])
                 }})
 
-        # *[amenity=garages]
-        # *[amenity=garage]
+    # *[amenity=garages]
+    # *[amenity=garage]
+    def _way_rule_122(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -7120,8 +7652,9 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"landuse=garages"
                 err.append({'class': 9002001, 'subclass': 863228118, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[shop=winery]
-        # *[amenity=winery]
+    # *[shop=winery]
+    # *[amenity=winery]
+    def _way_rule_123(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys) or ('shop' in keys):
             match = False
             if not match:
@@ -7139,7 +7672,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=wine"
                 err.append({'class': 9002001, 'subclass': 1773574987, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=youth_centre]
+    # *[amenity=youth_centre]
+    def _way_rule_124(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -7158,8 +7692,9 @@ class Josm_deprecated(PluginMapCSS):
                     ['community_centre','youth_centre']])
                 }})
 
-        # *[building:type][building=yes]
-        # *[building:type][!building]
+    # *[building:type][building=yes]
+    # *[building:type][!building]
+    def _way_rule_125(self, data, tags, nds, keys, err, sets):
         if ('building' in keys and 'building:type' in keys) or ('building:type' in keys):
             match = False
             if not match:
@@ -7185,7 +7720,8 @@ class Josm_deprecated(PluginMapCSS):
                     'building:type'])
                 }})
 
-        # *[building:type][building][building!=yes]
+    # *[building:type][building][building!=yes]
+    def _way_rule_126(self, data, tags, nds, keys, err, sets):
         if ('building' in keys and 'building:type' in keys):
             match = False
             if not match:
@@ -7201,19 +7737,20 @@ class Josm_deprecated(PluginMapCSS):
                 # assertNoMatch:"way building:type=church"
                 err.append({'class': 9002001, 'subclass': 1133239698, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[escalator]
-        # Rule Blacklisted (id: 967271828)
+    # *[escalator]
+    # Rule Blacklisted (id: 967271828)
 
-        # *[historic_name][!old_name]
-        # Rule Blacklisted (id: 1034538127)
+    # *[historic_name][!old_name]
+    # Rule Blacklisted (id: 1034538127)
 
-        # *[historic_name][old_name]
-        # Rule Blacklisted (id: 30762614)
+    # *[historic_name][old_name]
+    # Rule Blacklisted (id: 30762614)
 
-        # *[landuse=field]
-        # Rule Blacklisted (id: 426261497)
+    # *[landuse=field]
+    # Rule Blacklisted (id: 426261497)
 
-        # *[leisure=beach]
+    # *[leisure=beach]
+    def _way_rule_127(self, data, tags, nds, keys, err, sets):
         if ('leisure' in keys):
             match = False
             if not match:
@@ -7227,22 +7764,23 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=beach"
                 err.append({'class': 9002001, 'subclass': 1767286055, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[leisure=club]
-        # Rule Blacklisted (id: 1282397509)
+    # *[leisure=club]
+    # Rule Blacklisted (id: 1282397509)
 
-        # *[leisure=video_arcade]
-        # Rule Blacklisted (id: 1463909830)
+    # *[leisure=video_arcade]
+    # Rule Blacklisted (id: 1463909830)
 
-        # *[man_made=jetty]
-        # Rule Blacklisted (id: 192707176)
+    # *[man_made=jetty]
+    # Rule Blacklisted (id: 192707176)
 
-        # *[man_made=village_pump]
-        # Rule Blacklisted (id: 423232686)
+    # *[man_made=village_pump]
+    # Rule Blacklisted (id: 423232686)
 
-        # *[man_made=water_tank]
-        # Rule Blacklisted (id: 563629665)
+    # *[man_made=water_tank]
+    # Rule Blacklisted (id: 563629665)
 
-        # *[natural=moor]
+    # *[natural=moor]
+    def _way_rule_128(self, data, tags, nds, keys, err, sets):
         if ('natural' in keys):
             match = False
             if not match:
@@ -7261,16 +7799,17 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=wetland"
                 err.append({'class': 9002001, 'subclass': 374637717, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[noexit=no][!fixme]
-        # Rule Blacklisted (id: 647435126)
+    # *[noexit=no][!fixme]
+    # Rule Blacklisted (id: 647435126)
 
-        # *[noexit=no][fixme]
-        # Rule Blacklisted (id: 881828009)
+    # *[noexit=no][fixme]
+    # Rule Blacklisted (id: 881828009)
 
-        # *[shop=dive]
-        # Rule Blacklisted (id: 1582968978)
+    # *[shop=dive]
+    # Rule Blacklisted (id: 1582968978)
 
-        # *[shop=furnace]
+    # *[shop=furnace]
+    def _way_rule_129(self, data, tags, nds, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -7284,17 +7823,18 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=fireplace"
                 err.append({'class': 9002001, 'subclass': 1155821104, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[sport=paragliding]
-        # Rule Blacklisted (id: 1531788430)
+    # *[sport=paragliding]
+    # Rule Blacklisted (id: 1531788430)
 
-        # *[tourism=bed_and_breakfast]
-        # Rule Blacklisted (id: 954237438)
+    # *[tourism=bed_and_breakfast]
+    # Rule Blacklisted (id: 954237438)
 
-        # *[diaper=yes]
-        # *[diaper=no]
-        # Rule Blacklisted (id: 1957125311)
+    # *[diaper=yes]
+    # *[diaper=no]
+    # Rule Blacklisted (id: 1957125311)
 
-        # *[diaper][diaper=~/^[1-9][0-9]*$/]
+    # *[diaper][diaper=~/^[1-9][0-9]*$/]
+    def _way_rule_130(self, data, tags, nds, keys, err, sets):
         if ('diaper' in keys):
             match = False
             if not match:
@@ -7308,7 +7848,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixAdd:"changing_table=yes"
                 # fixChangeKey:"diaper => changing_table:count"
-                set_diaper_checked = True
+                sets.add('diaper_checked')
                 err.append({'class': 9002001, 'subclass': 2105051472, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table','yes'],
@@ -7317,7 +7857,8 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper'])
                 }})
 
-        # *[diaper=room]
+    # *[diaper=room]
+    def _way_rule_131(self, data, tags, nds, keys, err, sets):
         if ('diaper' in keys):
             match = False
             if not match:
@@ -7330,13 +7871,14 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"changing_table=dedicated_room"
                 # suggestAlternative:"changing_table=room"
-                set_diaper_checked = True
+                sets.add('diaper_checked')
                 err.append({'class': 9002001, 'subclass': 883202329, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[diaper]!.diaper_checked
-        # Rule Blacklisted (id: 693675339)
+    # *[diaper]!.diaper_checked
+    # Rule Blacklisted (id: 693675339)
 
-        # *[diaper:male=yes]
+    # *[diaper:male=yes]
+    def _way_rule_132(self, data, tags, nds, keys, err, sets):
         if ('diaper:male' in keys):
             match = False
             if not match:
@@ -7350,7 +7892,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=male_toilet"
                 # fixAdd:"changing_table:location=male_toilet"
                 # fixRemove:"diaper:male"
-                set_diaper___checked = True
+                sets.add('diaper___checked')
                 err.append({'class': 9002001, 'subclass': 799035479, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table:location','male_toilet']]),
@@ -7358,7 +7900,8 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper:male'])
                 }})
 
-        # *[diaper:female=yes]
+    # *[diaper:female=yes]
+    def _way_rule_133(self, data, tags, nds, keys, err, sets):
         if ('diaper:female' in keys):
             match = False
             if not match:
@@ -7372,7 +7915,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=female_toilet"
                 # fixAdd:"changing_table:location=female_toilet"
                 # fixRemove:"diaper:female"
-                set_diaper___checked = True
+                sets.add('diaper___checked')
                 err.append({'class': 9002001, 'subclass': 1450901137, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table:location','female_toilet']]),
@@ -7380,7 +7923,8 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper:female'])
                 }})
 
-        # *[diaper:unisex=yes]
+    # *[diaper:unisex=yes]
+    def _way_rule_134(self, data, tags, nds, keys, err, sets):
         if ('diaper:unisex' in keys):
             match = False
             if not match:
@@ -7394,7 +7938,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=unisex_toilet"
                 # fixAdd:"changing_table:location=unisex_toilet"
                 # fixRemove:"diaper:unisex"
-                set_diaper___checked = True
+                sets.add('diaper___checked')
                 err.append({'class': 9002001, 'subclass': 1460378712, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table:location','unisex_toilet']]),
@@ -7402,8 +7946,9 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper:unisex'])
                 }})
 
-        # *[diaper:wheelchair=yes]
-        # *[diaper:wheelchair=no]
+    # *[diaper:wheelchair=yes]
+    # *[diaper:wheelchair=no]
+    def _way_rule_135(self, data, tags, nds, keys, err, sets):
         if ('diaper:wheelchair' in keys):
             match = False
             if not match:
@@ -7420,7 +7965,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("changing_table:wheelchair=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"diaper:wheelchair => changing_table:wheelchair"
-                set_diaper___checked = True
+                sets.add('diaper___checked')
                 err.append({'class': 9002001, 'subclass': 1951967281, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table:wheelchair', mapcss.tag(tags, 'diaper:wheelchair')]]),
@@ -7428,8 +7973,9 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper:wheelchair'])
                 }})
 
-        # *[diaper:fee=yes]
-        # *[diaper:fee=no]
+    # *[diaper:fee=yes]
+    # *[diaper:fee=no]
+    def _way_rule_136(self, data, tags, nds, keys, err, sets):
         if ('diaper:fee' in keys):
             match = False
             if not match:
@@ -7446,7 +7992,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("changing_table:fee=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"diaper:fee => changing_table:fee"
-                set_diaper___checked = True
+                sets.add('diaper___checked')
                 err.append({'class': 9002001, 'subclass': 2008573526, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table:fee', mapcss.tag(tags, 'diaper:fee')]]),
@@ -7454,12 +8000,13 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper:fee'])
                 }})
 
-        # *[/^diaper:/]!.diaper___checked
+    # *[/^diaper:/]!.diaper___checked
+    def _way_rule_137(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_diaper___checked) and (mapcss._tag_capture(capture_tags, 0, tags, self.re_6029fe03)))
+                try: match = (('diaper___checked' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, self.re_6029fe03)))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("deprecated tagging")
@@ -7467,7 +8014,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:*"
                 err.append({'class': 9002001, 'subclass': 26578864, 'text': mapcss.tr('{0} is deprecated', 'diaper:*')})
 
-        # *[changing_table][changing_table!~/^(yes|no|limited)$/]
+    # *[changing_table][changing_table!~/^(yes|no|limited)$/]
+    def _way_rule_138(self, data, tags, nds, keys, err, sets):
         if ('changing_table' in keys):
             match = False
             if not match:
@@ -7481,7 +8029,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table=yes"
                 err.append({'class': 9002019, 'subclass': 1965225408, 'text': mapcss.tr('wrong value: {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[roof:shape=half_hipped]
+    # *[roof:shape=half_hipped]
+    def _way_rule_139(self, data, tags, nds, keys, err, sets):
         if ('roof:shape' in keys):
             match = False
             if not match:
@@ -7498,7 +8047,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['roof:shape','half-hipped']])
                 }})
 
-        # *[bridge_name]
+    # *[bridge_name]
+    def _way_rule_140(self, data, tags, nds, keys, err, sets):
         if ('bridge_name' in keys):
             match = False
             if not match:
@@ -7517,10 +8067,11 @@ class Josm_deprecated(PluginMapCSS):
                     'bridge_name'])
                 }})
 
-        # *[access=public]
-        # Rule Blacklisted (id: 1115157097)
+    # *[access=public]
+    # Rule Blacklisted (id: 1115157097)
 
-        # *[crossing=island]
+    # *[crossing=island]
+    def _way_rule_141(self, data, tags, nds, keys, err, sets):
         if ('crossing' in keys):
             match = False
             if not match:
@@ -7540,7 +8091,8 @@ class Josm_deprecated(PluginMapCSS):
                     'crossing'])
                 }})
 
-        # *[recycling:metal]
+    # *[recycling:metal]
+    def _way_rule_142(self, data, tags, nds, keys, err, sets):
         if ('recycling:metal' in keys):
             match = False
             if not match:
@@ -7559,7 +8111,8 @@ class Josm_deprecated(PluginMapCSS):
                     'recycling:metal'])
                 }})
 
-        # *[shop=dog_grooming]
+    # *[shop=dog_grooming]
+    def _way_rule_143(self, data, tags, nds, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -7576,8 +8129,9 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','pet_grooming']])
                 }})
 
-        # *[tower:type=anchor]
-        # *[tower:type=suspension]
+    # *[tower:type=anchor]
+    # *[tower:type=suspension]
+    def _way_rule_144(self, data, tags, nds, keys, err, sets):
         if ('tower:type' in keys):
             match = False
             if not match:
@@ -7594,7 +8148,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("line_attachment=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"tower:type => line_attachment"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 180380605, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_attachment', mapcss.tag(tags, 'tower:type')]]),
@@ -7602,8 +8156,9 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=branch][branch:type=split]
-        # *[tower:type=branch][branch:type=loop]
+    # *[tower:type=branch][branch:type=split]
+    # *[tower:type=branch][branch:type=loop]
+    def _way_rule_145(self, data, tags, nds, keys, err, sets):
         if ('branch:type' in keys and 'tower:type' in keys):
             match = False
             if not match:
@@ -7622,7 +8177,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=split"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 362350862, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','split']]),
@@ -7631,8 +8186,9 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=branch][!branch:type]
-        # *[tower:type=branch][branch:type=tap]
+    # *[tower:type=branch][!branch:type]
+    # *[tower:type=branch][branch:type=tap]
+    def _way_rule_146(self, data, tags, nds, keys, err, sets):
         if ('branch:type' in keys and 'tower:type' in keys) or ('tower:type' in keys):
             match = False
             if not match:
@@ -7651,7 +8207,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=branch"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 476423517, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','branch']]),
@@ -7660,7 +8216,8 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=branch][branch:type=cross]
+    # *[tower:type=branch][branch:type=cross]
+    def _way_rule_147(self, data, tags, nds, keys, err, sets):
         if ('branch:type' in keys and 'tower:type' in keys):
             match = False
             if not match:
@@ -7675,7 +8232,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=cross"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 2103059531, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','cross']]),
@@ -7684,7 +8241,8 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=termination]
+    # *[tower:type=termination]
+    def _way_rule_148(self, data, tags, nds, keys, err, sets):
         if ('tower:type' in keys):
             match = False
             if not match:
@@ -7698,7 +8256,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management=termination"
                 # fixAdd:"line_management=termination"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 232235847, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','termination']]),
@@ -7706,7 +8264,8 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=transition]
+    # *[tower:type=transition]
+    def _way_rule_149(self, data, tags, nds, keys, err, sets):
         if ('tower:type' in keys):
             match = False
             if not match:
@@ -7720,7 +8279,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"location:transition=yes"
                 # fixAdd:"location:transition=yes"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 1124904944, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['location:transition','yes']]),
@@ -7728,7 +8287,8 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=transposing]
+    # *[tower:type=transposing]
+    def _way_rule_150(self, data, tags, nds, keys, err, sets):
         if ('tower:type' in keys):
             match = False
             if not match:
@@ -7742,7 +8302,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management=transpose"
                 # fixAdd:"line_management=transpose"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 1795169098, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','transpose']]),
@@ -7750,7 +8310,8 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=crossing]
+    # *[tower:type=crossing]
+    def _way_rule_151(self, data, tags, nds, keys, err, sets):
         if ('tower:type' in keys):
             match = False
             if not match:
@@ -7762,15 +8323,16 @@ class Josm_deprecated(PluginMapCSS):
                 # group:tr("deprecated tagging")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"height=* + design=*"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 1301565974, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[tower:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_tower_type_warning
+    # *[tower:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_tower_type_warning
+    def _way_rule_152(self, data, tags, nds, keys, err, sets):
         if ('power' in keys and 'tower:type' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_power_tower_type_warning) and (mapcss._tag_capture(capture_tags, 0, tags, 'tower:type')) and (mapcss._tag_capture(capture_tags, 1, tags, 'power')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_24dfeb95), mapcss._tag_capture(capture_tags, 2, tags, 'power'))))
+                try: match = (('power_tower_type_warning' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'tower:type')) and (mapcss._tag_capture(capture_tags, 1, tags, 'power')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_24dfeb95), mapcss._tag_capture(capture_tags, 2, tags, 'power'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set generic_power_tower_type_warning
@@ -7781,15 +8343,16 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_attachment"
                 # suggestAlternative:"line_management"
                 # suggestAlternative:"structure"
-                set_generic_power_tower_type_warning = True
+                sets.add('generic_power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 2020421267, 'text': mapcss.tr('{0} is deprecated for {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[pole:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_pole_type_warning!.generic_power_tower_type_warning
+    # *[pole:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_pole_type_warning!.generic_power_tower_type_warning
+    def _way_rule_153(self, data, tags, nds, keys, err, sets):
         if ('pole:type' in keys and 'power' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_power_pole_type_warning) and (not set_generic_power_tower_type_warning) and (mapcss._tag_capture(capture_tags, 0, tags, 'pole:type')) and (mapcss._tag_capture(capture_tags, 1, tags, 'power')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_24dfeb95), mapcss._tag_capture(capture_tags, 2, tags, 'power'))))
+                try: match = (('power_pole_type_warning' not in sets) and ('generic_power_tower_type_warning' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'pole:type')) and (mapcss._tag_capture(capture_tags, 1, tags, 'power')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_24dfeb95), mapcss._tag_capture(capture_tags, 2, tags, 'power'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("deprecated tagging")
@@ -7799,7 +8362,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management"
                 err.append({'class': 9002001, 'subclass': 1513543887, 'text': mapcss.tr('{0} is deprecated for {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[barrier=embankment]
+    # way[barrier=embankment]
+    def _way_rule_154(self, data, tags, nds, keys, err, sets):
         if ('barrier' in keys):
             match = False
             if not match:
@@ -7813,7 +8377,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"man_made=embankment"
                 err.append({'class': 9002001, 'subclass': 2131554464, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[landuse=churchyard]
+    # way[landuse=churchyard]
+    def _way_rule_155(self, data, tags, nds, keys, err, sets):
         if ('landuse' in keys):
             match = False
             if not match:
@@ -7827,8 +8392,9 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"landuse=religious"
                 err.append({'class': 9002001, 'subclass': 1973571425, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[sloped_curb=yes][!kerb]
-        # *[sloped_curb=both][!kerb]
+    # *[sloped_curb=yes][!kerb]
+    # *[sloped_curb=both][!kerb]
+    def _way_rule_156(self, data, tags, nds, keys, err, sets):
         if ('sloped_curb' in keys):
             match = False
             if not match:
@@ -7852,7 +8418,8 @@ class Josm_deprecated(PluginMapCSS):
                     'sloped_curb'])
                 }})
 
-        # *[sloped_curb=no][!kerb]
+    # *[sloped_curb=no][!kerb]
+    def _way_rule_157(self, data, tags, nds, keys, err, sets):
         if ('sloped_curb' in keys):
             match = False
             if not match:
@@ -7872,8 +8439,9 @@ class Josm_deprecated(PluginMapCSS):
                     'sloped_curb'])
                 }})
 
-        # *[sloped_curb][sloped_curb!~/^(yes|both|no)$/][!kerb]
-        # *[sloped_curb][kerb]
+    # *[sloped_curb][sloped_curb!~/^(yes|both|no)$/][!kerb]
+    # *[sloped_curb][kerb]
+    def _way_rule_158(self, data, tags, nds, keys, err, sets):
         if ('kerb' in keys and 'sloped_curb' in keys) or ('sloped_curb' in keys):
             match = False
             if not match:
@@ -7890,7 +8458,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"kerb=*"
                 err.append({'class': 9002001, 'subclass': 1682376745, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[unnamed=yes]
+    # *[unnamed=yes]
+    def _way_rule_159(self, data, tags, nds, keys, err, sets):
         if ('unnamed' in keys):
             match = False
             if not match:
@@ -7909,7 +8478,8 @@ class Josm_deprecated(PluginMapCSS):
                     'unnamed'])
                 }})
 
-        # way[segregated][segregated!=yes][segregated!=no]
+    # way[segregated][segregated!=yes][segregated!=no]
+    def _way_rule_160(self, data, tags, nds, keys, err, sets):
         if ('segregated' in keys):
             match = False
             if not match:
@@ -7920,7 +8490,8 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("unusual value of {0}","{0.key}")
                 err.append({'class': 9002020, 'subclass': 1585094150, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[bicycle:oneway]
+    # way[bicycle:oneway]
+    def _way_rule_161(self, data, tags, nds, keys, err, sets):
         if ('bicycle:oneway' in keys):
             match = False
             if not match:
@@ -7939,7 +8510,8 @@ class Josm_deprecated(PluginMapCSS):
                     'bicycle:oneway'])
                 }})
 
-        # *[building:height]
+    # *[building:height]
+    def _way_rule_162(self, data, tags, nds, keys, err, sets):
         if ('building:height' in keys):
             match = False
             if not match:
@@ -7958,7 +8530,8 @@ class Josm_deprecated(PluginMapCSS):
                     'building:height'])
                 }})
 
-        # *[building:min_height]
+    # *[building:min_height]
+    def _way_rule_163(self, data, tags, nds, keys, err, sets):
         if ('building:min_height' in keys):
             match = False
             if not match:
@@ -7977,7 +8550,8 @@ class Josm_deprecated(PluginMapCSS):
                     'building:min_height'])
                 }})
 
-        # way[highway][construction=yes][highway!=construction]
+    # way[highway][construction=yes][highway!=construction]
+    def _way_rule_164(self, data, tags, nds, keys, err, sets):
         if ('construction' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -7991,11 +8565,12 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"construction=minor"
                 err.append({'class': 9002001, 'subclass': 585996498, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[car]
-        # Rule Blacklisted (id: 297159061)
+    # *[car]
+    # Rule Blacklisted (id: 297159061)
 
-        # *[navigationaid=approach_light]
-        # *[navigationaid="ALS (Approach lighting system)"]
+    # *[navigationaid=approach_light]
+    # *[navigationaid="ALS (Approach lighting system)"]
+    def _way_rule_165(self, data, tags, nds, keys, err, sets):
         if ('navigationaid' in keys):
             match = False
             if not match:
@@ -8016,7 +8591,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['navigationaid','als']])
                 }})
 
-        # *[water=riverbank][!natural]
+    # *[water=riverbank][!natural]
+    def _way_rule_166(self, data, tags, nds, keys, err, sets):
         if ('water' in keys):
             match = False
             if not match:
@@ -8035,7 +8611,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['water','river']])
                 }})
 
-        # *[water=riverbank][natural]
+    # *[water=riverbank][natural]
+    def _way_rule_167(self, data, tags, nds, keys, err, sets):
         if ('natural' in keys and 'water' in keys):
             match = False
             if not match:
@@ -8048,10 +8625,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=water + water=river"
                 err.append({'class': 9002001, 'subclass': 630806094, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[waterway=riverbank][!natural][!water]
-        # *[waterway=riverbank][natural=water][!water]
-        # *[waterway=riverbank][!natural][water=river]
-        # *[waterway=riverbank][natural=water][water=river]
+    # *[waterway=riverbank][!natural][!water]
+    # *[waterway=riverbank][natural=water][!water]
+    # *[waterway=riverbank][!natural][water=river]
+    # *[waterway=riverbank][natural=water][water=river]
+    def _way_rule_168(self, data, tags, nds, keys, err, sets):
         if ('natural' in keys and 'water' in keys and 'waterway' in keys) or ('natural' in keys and 'waterway' in keys) or ('water' in keys and 'waterway' in keys) or ('waterway' in keys):
             match = False
             if not match:
@@ -8093,8 +8671,9 @@ class Josm_deprecated(PluginMapCSS):
                     'waterway'])
                 }})
 
-        # *[waterway=riverbank][natural][natural!=water]
-        # *[waterway=riverbank][water][water!=river]
+    # *[waterway=riverbank][natural][natural!=water]
+    # *[waterway=riverbank][water][water!=river]
+    def _way_rule_169(self, data, tags, nds, keys, err, sets):
         if ('natural' in keys and 'waterway' in keys) or ('water' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -8117,7 +8696,8 @@ class Josm_deprecated(PluginMapCSS):
                 # assertNoMatch:"way waterway=riverbank"
                 err.append({'class': 9002001, 'subclass': 301661430, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[amenity=bench][capacity][!seats]
+    # way[amenity=bench][capacity][!seats]
+    def _way_rule_170(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'capacity' in keys):
             match = False
             if not match:
@@ -8136,7 +8716,8 @@ class Josm_deprecated(PluginMapCSS):
                     'capacity'])
                 }})
 
-        # way[amenity=bench][capacity][seats]
+    # way[amenity=bench][capacity][seats]
+    def _way_rule_171(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'capacity' in keys and 'seats' in keys):
             match = False
             if not match:
@@ -8149,7 +8730,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"seats"
                 err.append({'class': 9002001, 'subclass': 1445114632, 'text': mapcss.tr('{0} is deprecated for {1}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[stream=intermittent]
+    # way[stream=intermittent]
+    def _way_rule_172(self, data, tags, nds, keys, err, sets):
         if ('stream' in keys):
             match = False
             if not match:
@@ -8163,7 +8745,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"seasonal=yes"
                 err.append({'class': 9002001, 'subclass': 1710194213, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[shop=lamps]
+    # *[shop=lamps]
+    def _way_rule_173(self, data, tags, nds, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -8180,7 +8763,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','lighting']])
                 }})
 
-        # *[access=customer]
+    # *[access=customer]
+    def _way_rule_174(self, data, tags, nds, keys, err, sets):
         if ('access' in keys):
             match = False
             if not match:
@@ -8197,7 +8781,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['access','customers']])
                 }})
 
-        # *[addr:inclusion=estimated]
+    # *[addr:inclusion=estimated]
+    def _way_rule_175(self, data, tags, nds, keys, err, sets):
         if ('addr:inclusion' in keys):
             match = False
             if not match:
@@ -8214,7 +8799,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['addr:inclusion','estimate']])
                 }})
 
-        # *[building=apartment]
+    # *[building=apartment]
+    def _way_rule_176(self, data, tags, nds, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -8231,7 +8817,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['building','apartments']])
                 }})
 
-        # *[generator:type=solar_photovoltaic_panels]
+    # *[generator:type=solar_photovoltaic_panels]
+    def _way_rule_177(self, data, tags, nds, keys, err, sets):
         if ('generator:type' in keys):
             match = False
             if not match:
@@ -8248,7 +8835,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['generator:type','solar_photovoltaic_panel']])
                 }})
 
-        # *[building=part]
+    # *[building=part]
+    def _way_rule_178(self, data, tags, nds, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -8261,7 +8849,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"building:part=yes"
                 err.append({'class': 9002001, 'subclass': 455695847, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[natural=sink_hole]
+    # *[natural=sink_hole]
+    def _way_rule_179(self, data, tags, nds, keys, err, sets):
         if ('natural' in keys):
             match = False
             if not match:
@@ -8278,7 +8867,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['natural','sinkhole']])
                 }})
 
-        # *[climbing:grade:UIAA:min]
+    # *[climbing:grade:UIAA:min]
+    def _way_rule_180(self, data, tags, nds, keys, err, sets):
         if ('climbing:grade:UIAA:min' in keys):
             match = False
             if not match:
@@ -8297,7 +8887,8 @@ class Josm_deprecated(PluginMapCSS):
                     'climbing:grade:UIAA:min'])
                 }})
 
-        # *[climbing:grade:UIAA:max]
+    # *[climbing:grade:UIAA:max]
+    def _way_rule_181(self, data, tags, nds, keys, err, sets):
         if ('climbing:grade:UIAA:max' in keys):
             match = False
             if not match:
@@ -8316,7 +8907,8 @@ class Josm_deprecated(PluginMapCSS):
                     'climbing:grade:UIAA:max'])
                 }})
 
-        # *[climbing:grade:UIAA:mean]
+    # *[climbing:grade:UIAA:mean]
+    def _way_rule_182(self, data, tags, nds, keys, err, sets):
         if ('climbing:grade:UIAA:mean' in keys):
             match = False
             if not match:
@@ -8335,7 +8927,8 @@ class Josm_deprecated(PluginMapCSS):
                     'climbing:grade:UIAA:mean'])
                 }})
 
-        # *[climbing:grade:UIAA]
+    # *[climbing:grade:UIAA]
+    def _way_rule_183(self, data, tags, nds, keys, err, sets):
         if ('climbing:grade:UIAA' in keys):
             match = False
             if not match:
@@ -8354,7 +8947,8 @@ class Josm_deprecated(PluginMapCSS):
                     'climbing:grade:UIAA'])
                 }})
 
-        # *[cuisine][cuisine=~/^(?i)(bbq)$/]
+    # *[cuisine][cuisine=~/^(?i)(bbq)$/]
+    def _way_rule_184(self, data, tags, nds, keys, err, sets):
         if ('cuisine' in keys):
             match = False
             if not match:
@@ -8375,13 +8969,14 @@ class Josm_deprecated(PluginMapCSS):
                 # assertNoMatch:"way cuisine=pasta;bbq;pizza"
                 # assertNoMatch:"way cuisine=pizza;Bbq"
                 # assertNoMatch:"way cuisine=pizza;bbq"
-                set_bbq_autofix = True
+                sets.add('bbq_autofix')
                 err.append({'class': 9002001, 'subclass': 1943338875, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['cuisine','barbecue']])
                 }})
 
-        # *[cuisine=~/(?i)(;bbq|bbq;)/][cuisine!~/(?i)(_bbq)/]
+    # *[cuisine=~/(?i)(;bbq|bbq;)/][cuisine!~/(?i)(_bbq)/]
+    def _way_rule_185(self, data, tags, nds, keys, err, sets):
         if ('cuisine' in keys):
             match = False
             if not match:
@@ -8402,10 +8997,11 @@ class Josm_deprecated(PluginMapCSS):
                 # assertMatch:"way cuisine=pizza;bbq"
                 err.append({'class': 9002001, 'subclass': 1958782130, 'text': mapcss.tr('{0} is deprecated', 'cuisine=bbq')})
 
-        # way[cycleway=none]
-        # way[cycleway:left=none]
-        # way[cycleway:right=none]
-        # way[shoulder=none]
+    # way[cycleway=none]
+    # way[cycleway:left=none]
+    # way[cycleway:right=none]
+    # way[shoulder=none]
+    def _way_rule_186(self, data, tags, nds, keys, err, sets):
         if ('cycleway' in keys) or ('cycleway:left' in keys) or ('cycleway:right' in keys) or ('shoulder' in keys):
             match = False
             if not match:
@@ -8434,7 +9030,8 @@ class Josm_deprecated(PluginMapCSS):
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}'), '=no')).split('=', 1)])
                 }})
 
-        # *[Fixme]
+    # *[Fixme]
+    def _way_rule_187(self, data, tags, nds, keys, err, sets):
         if ('Fixme' in keys):
             match = False
             if not match:
@@ -8456,10 +9053,11 @@ class Josm_deprecated(PluginMapCSS):
                     'Fixme'])
                 }})
 
-        # *[amenity=embassy]
-        # Rule Blacklisted (id: 1751915206)
+    # *[amenity=embassy]
+    # Rule Blacklisted (id: 1751915206)
 
-        # *[service:bicycle:chaintool]
+    # *[service:bicycle:chaintool]
+    def _way_rule_188(self, data, tags, nds, keys, err, sets):
         if ('service:bicycle:chaintool' in keys):
             match = False
             if not match:
@@ -8478,7 +9076,8 @@ class Josm_deprecated(PluginMapCSS):
                     'service:bicycle:chaintool'])
                 }})
 
-        # *[building:roof:shape]
+    # *[building:roof:shape]
+    def _way_rule_189(self, data, tags, nds, keys, err, sets):
         if ('building:roof:shape' in keys):
             match = False
             if not match:
@@ -8497,7 +9096,8 @@ class Josm_deprecated(PluginMapCSS):
                     'building:roof:shape'])
                 }})
 
-        # *[man_made=pumping_rig][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    # *[man_made=pumping_rig][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    def _way_rule_190(self, data, tags, nds, keys, err, sets):
         if ('man_made' in keys):
             match = False
             if not match:
@@ -8513,7 +9113,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"mechanical_coupling=nodding_donkey"
                 # fixAdd:"mechanical_driver=combustion_engine"
                 # fixAdd:"pump_mechanism=piston"
-                set_pumping_ring_no_mech = True
+                sets.add('pumping_ring_no_mech')
                 err.append({'class': 9002001, 'subclass': 6568074, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['mechanical_coupling','nodding_donkey'],
@@ -8521,12 +9121,13 @@ class Josm_deprecated(PluginMapCSS):
                     ['pump_mechanism','piston']])
                 }})
 
-        # *[man_made=pumping_rig]!.pumping_ring_no_mech
+    # *[man_made=pumping_rig]!.pumping_ring_no_mech
+    def _way_rule_191(self, data, tags, nds, keys, err, sets):
         if ('man_made' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_pumping_ring_no_mech) and (mapcss._tag_capture(capture_tags, 0, tags, 'man_made') == mapcss._value_capture(capture_tags, 0, 'pumping_rig')))
+                try: match = (('pumping_ring_no_mech' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'man_made') == mapcss._value_capture(capture_tags, 0, 'pumping_rig')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("deprecated tagging")
@@ -8535,7 +9136,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"man_made=water_well"
                 err.append({'class': 9002001, 'subclass': 1031026578, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[pump:type=beam_pump][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    # *[pump:type=beam_pump][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    def _way_rule_192(self, data, tags, nds, keys, err, sets):
         if ('pump:type' in keys):
             match = False
             if not match:
@@ -8551,7 +9153,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"mechanical_driver=combustion_engine"
                 # fixRemove:"pump:type"
                 # fixAdd:"pump_mechanism=piston"
-                set_beam_pump_no_mech = True
+                sets.add('beam_pump_no_mech')
                 err.append({'class': 9002001, 'subclass': 1519103279, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['mechanical_coupling','nodding_donkey'],
@@ -8561,12 +9163,13 @@ class Josm_deprecated(PluginMapCSS):
                     'pump:type'])
                 }})
 
-        # *[pump:type]!.beam_pump_no_mech
+    # *[pump:type]!.beam_pump_no_mech
+    def _way_rule_193(self, data, tags, nds, keys, err, sets):
         if ('pump:type' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_beam_pump_no_mech) and (mapcss._tag_capture(capture_tags, 0, tags, 'pump:type')))
+                try: match = (('beam_pump_no_mech' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'pump:type')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("deprecated tagging")
@@ -8574,7 +9177,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"pump_mechanism"
                 err.append({'class': 9002001, 'subclass': 2015679777, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[substance=heat]
+    # *[substance=heat]
+    def _way_rule_194(self, data, tags, nds, keys, err, sets):
         if ('substance' in keys):
             match = False
             if not match:
@@ -8588,7 +9192,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"substance=steam"
                 err.append({'class': 9002001, 'subclass': 1528467304, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[landuse=school]
+    # *[landuse=school]
+    def _way_rule_195(self, data, tags, nds, keys, err, sets):
         if ('landuse' in keys):
             match = False
             if not match:
@@ -8604,11 +9209,12 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"landuse=education"
                 err.append({'class': 9002001, 'subclass': 817812278, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=vending_machine][vending=parcel_mail_in]
-        # *[amenity=vending_machine][vending=parcel_pickup]
-        # Rule Blacklisted (id: 1305128315)
+    # *[amenity=vending_machine][vending=parcel_mail_in]
+    # *[amenity=vending_machine][vending=parcel_pickup]
+    # Rule Blacklisted (id: 1305128315)
 
-        # *[amenity=vending_machine][vending][vending~=parcel_mail_in][vending~=parcel_pickup][count(uniq_list(split(";",tag("vending"))))==2]
+    # *[amenity=vending_machine][vending][vending~=parcel_mail_in][vending~=parcel_pickup][count(uniq_list(split(";",tag("vending"))))==2]
+    def _way_rule_196(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'vending' in keys):
             match = False
             if not match:
@@ -8624,7 +9230,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"parcel_mail_in=yes"
                 # fixAdd:"parcel_pickup=yes"
                 # fixRemove:"vending"
-                set_parcel_fixable = True
+                sets.add('parcel_fixable')
                 err.append({'class': 9002001, 'subclass': 954921281, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{1.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['amenity','parcel_locker'],
@@ -8634,17 +9240,18 @@ class Josm_deprecated(PluginMapCSS):
                     'vending'])
                 }})
 
-        # *[amenity=vending_machine][vending~=parcel_mail_in]!.parcel_fixable
-        # *[amenity=vending_machine][vending~=parcel_pickup]!.parcel_fixable
+    # *[amenity=vending_machine][vending~=parcel_mail_in]!.parcel_fixable
+    # *[amenity=vending_machine][vending~=parcel_pickup]!.parcel_fixable
+    def _way_rule_197(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'vending' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_parcel_fixable) and (mapcss._tag_capture(capture_tags, 0, tags, 'amenity') == mapcss._value_capture(capture_tags, 0, 'vending_machine')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'vending'), mapcss._value_capture(capture_tags, 1, 'parcel_mail_in'))))
+                try: match = (('parcel_fixable' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'amenity') == mapcss._value_capture(capture_tags, 0, 'vending_machine')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'vending'), mapcss._value_capture(capture_tags, 1, 'parcel_mail_in'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_parcel_fixable) and (mapcss._tag_capture(capture_tags, 0, tags, 'amenity') == mapcss._value_capture(capture_tags, 0, 'vending_machine')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'vending'), mapcss._value_capture(capture_tags, 1, 'parcel_pickup'))))
+                try: match = (('parcel_fixable' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'amenity') == mapcss._value_capture(capture_tags, 0, 'vending_machine')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'vending'), mapcss._value_capture(capture_tags, 1, 'parcel_pickup'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("deprecated tagging")
@@ -8652,7 +9259,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"amenity=parcel_locker + {1.value}=yes"
                 err.append({'class': 9002001, 'subclass': 424486726, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[surface=decoturf]
+    # *[surface=decoturf]
+    def _way_rule_198(self, data, tags, nds, keys, err, sets):
         if ('surface' in keys):
             match = False
             if not match:
@@ -8669,10 +9277,11 @@ class Josm_deprecated(PluginMapCSS):
                     ['surface','acrylic']])
                 }})
 
-        # *[role]
-        # Rule Blacklisted (id: 2041296832)
+    # *[role]
+    # Rule Blacklisted (id: 2041296832)
 
-        # *[school=entrance]
+    # *[school=entrance]
+    def _way_rule_199(self, data, tags, nds, keys, err, sets):
         if ('school' in keys):
             match = False
             if not match:
@@ -8686,8 +9295,9 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"entrance=yes"
                 err.append({'class': 9002001, 'subclass': 1398581809, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[voltage-high]
-        # *[voltage-low]
+    # *[voltage-high]
+    # *[voltage-low]
+    def _way_rule_200(self, data, tags, nds, keys, err, sets):
         if ('voltage-high' in keys) or ('voltage-low' in keys):
             match = False
             if not match:
@@ -8705,7 +9315,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"voltage:secondary"
                 err.append({'class': 9002001, 'subclass': 1379077827, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[toilet][!toilets]
+    # *[toilet][!toilets]
+    def _way_rule_201(self, data, tags, nds, keys, err, sets):
         if ('toilet' in keys):
             match = False
             if not match:
@@ -8724,7 +9335,8 @@ class Josm_deprecated(PluginMapCSS):
                     'toilet'])
                 }})
 
-        # *[toilet][toilets]
+    # *[toilet][toilets]
+    def _way_rule_202(self, data, tags, nds, keys, err, sets):
         if ('toilet' in keys and 'toilets' in keys):
             match = False
             if not match:
@@ -8737,7 +9349,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"toilets"
                 err.append({'class': 9002001, 'subclass': 1092230744, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[type="turnlanes:turns"]
+    # *[type="turnlanes:turns"]
+    def _way_rule_203(self, data, tags, nds, keys, err, sets):
         if ('type' in keys):
             match = False
             if not match:
@@ -8750,7 +9363,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"type=connectivity"
                 err.append({'class': 9002001, 'subclass': 1789083769, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[image][image=~/^https:\/\/westnordost.de\/p\//]
+    # *[image][image=~/^https:\/\/westnordost.de\/p\//]
+    def _way_rule_204(self, data, tags, nds, keys, err, sets):
         if ('image' in keys):
             match = False
             if not match:
@@ -8765,23 +9379,24 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[historic=archaeological_site][site_type]
-        # Rule Blacklisted (id: 595008939)
+    # *[historic=archaeological_site][site_type]
+    # Rule Blacklisted (id: 595008939)
 
-        # area[parking:orientation][!orientation]
-        # Rule Blacklisted (id: 1600840641)
+    # area[parking:orientation][!orientation]
+    # Rule Blacklisted (id: 1600840641)
 
-        # area[parking:orientation][orientation]["parking:orientation"=*orientation]
-        # Rule Blacklisted (id: 145760951)
+    # area[parking:orientation][orientation]["parking:orientation"=*orientation]
+    # Rule Blacklisted (id: 145760951)
 
-        # area[parking:orientation][orientation]["parking:orientation"!=*orientation]
-        # Rule Blacklisted (id: 488242503)
+    # area[parking:orientation][orientation]["parking:orientation"!=*orientation]
+    # Rule Blacklisted (id: 488242503)
 
-        # *[gnis:id][!gnis:feature_id]
-        # *[tiger:PLACENS][!gnis:feature_id]
-        # *[NHD:GNIS_ID][!gnis:feature_id]
-        # *[nhd:gnis_id][!gnis:feature_id]
-        # *[ref:gnis][!gnis:feature_id]
+    # *[gnis:id][!gnis:feature_id]
+    # *[tiger:PLACENS][!gnis:feature_id]
+    # *[NHD:GNIS_ID][!gnis:feature_id]
+    # *[nhd:gnis_id][!gnis:feature_id]
+    # *[ref:gnis][!gnis:feature_id]
+    def _way_rule_205(self, data, tags, nds, keys, err, sets):
         if ('NHD:GNIS_ID' in keys) or ('gnis:id' in keys) or ('nhd:gnis_id' in keys) or ('ref:gnis' in keys) or ('tiger:PLACENS' in keys):
             match = False
             if not match:
@@ -8816,11 +9431,12 @@ class Josm_deprecated(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key} => {1.key}')).split('=>', 1)[0].strip()])
                 }})
 
-        # *[gnis:id][gnis:feature_id]
-        # *[tiger:PLACENS][gnis:feature_id]
-        # *[NHD:GNIS_ID][gnis:feature_id]
-        # *[nhd:gnis_id][gnis:feature_id]
-        # *[ref:gnis][gnis:feature_id]
+    # *[gnis:id][gnis:feature_id]
+    # *[tiger:PLACENS][gnis:feature_id]
+    # *[NHD:GNIS_ID][gnis:feature_id]
+    # *[nhd:gnis_id][gnis:feature_id]
+    # *[ref:gnis][gnis:feature_id]
+    def _way_rule_206(self, data, tags, nds, keys, err, sets):
         if ('NHD:GNIS_ID' in keys and 'gnis:feature_id' in keys) or ('gnis:feature_id' in keys and 'gnis:id' in keys) or ('gnis:feature_id' in keys and 'nhd:gnis_id' in keys) or ('gnis:feature_id' in keys and 'ref:gnis' in keys) or ('gnis:feature_id' in keys and 'tiger:PLACENS' in keys):
             match = False
             if not match:
@@ -8849,7 +9465,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"{1.key}"
                 err.append({'class': 9002001, 'subclass': 1736205096, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[natural=landform][landform=esker]
+    # *[natural=landform][landform=esker]
+    def _way_rule_207(self, data, tags, nds, keys, err, sets):
         if ('landform' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -8862,7 +9479,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=ridge or geological=esker"
                 err.append({'class': 9002001, 'subclass': 1008024827, 'text': mapcss.tr('{0} should be replaced by {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'geological=esker')})
 
-        # *[natural=landform][landform=moraine]
+    # *[natural=landform][landform=moraine]
+    def _way_rule_208(self, data, tags, nds, keys, err, sets):
         if ('landform' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -8875,7 +9493,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"geological=moraine"
                 err.append({'class': 9002001, 'subclass': 1223091758, 'text': mapcss.tr('{0} should be replaced by {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'geological=moraine')})
 
-        # *[natural=landform][landform=beach]
+    # *[natural=landform][landform=beach]
+    def _way_rule_209(self, data, tags, nds, keys, err, sets):
         if ('landform' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -8888,7 +9507,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=beach"
                 err.append({'class': 9002001, 'subclass': 2005356131, 'text': mapcss.tr('{0} should be replaced by {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'natural=beach')})
 
-        # *[natural=landform][landform=tundra_polygon]
+    # *[natural=landform][landform=tundra_polygon]
+    def _way_rule_210(self, data, tags, nds, keys, err, sets):
         if ('landform' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -8901,10 +9521,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=tundra or natural=fell"
                 err.append({'class': 9002001, 'subclass': 149743951, 'text': mapcss.tr('{0} should be replaced by {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'natural=tundra')})
 
-        # way[cycleway=opposite]
-        # way[cycleway:left=opposite]
-        # way[cycleway:right=opposite]
-        # way[cycleway:both=opposite]
+    # way[cycleway=opposite]
+    # way[cycleway:left=opposite]
+    # way[cycleway:right=opposite]
+    # way[cycleway:both=opposite]
+    def _way_rule_211(self, data, tags, nds, keys, err, sets):
         if ('cycleway' in keys) or ('cycleway:both' in keys) or ('cycleway:left' in keys) or ('cycleway:right' in keys):
             match = False
             if not match:
@@ -8935,8 +9556,9 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # way[cycleway:left][cycleway:left^=opposite_]
-        # way[cycleway:right][cycleway:right^=opposite_]
+    # way[cycleway:left][cycleway:left^=opposite_]
+    # way[cycleway:right][cycleway:right^=opposite_]
+    def _way_rule_212(self, data, tags, nds, keys, err, sets):
         if ('cycleway:left' in keys) or ('cycleway:right' in keys):
             match = False
             if not match:
@@ -8952,24 +9574,241 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 err.append({'class': 9002001, 'subclass': 447590287, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[cycleway][cycleway^=opposite_]:righthandtraffic
-        # Rule Blacklisted (id: 430042074)
+    # way[cycleway][cycleway^=opposite_]:righthandtraffic
+    # Rule Blacklisted (id: 430042074)
+
+    # way[cycleway][cycleway^=opposite_]!:righthandtraffic
+    # Rule Blacklisted (id: 50459238)
+
+    # *[residential=condominium]
+    # Rule Blacklisted (id: 1861188094)
+
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['barrier']),
+        (_way_rule_1, ['barrier']),
+        (_way_rule_2, ['landuse']),
+        (_way_rule_3, ['landuse']),
+        (_way_rule_4, ['landuse']),
+        (_way_rule_5, ['landuse']),
+        (_way_rule_6, ['shop']),
+        (_way_rule_7, ['shop']),
+        (_way_rule_8, ['shop']),
+        (_way_rule_9, ['shop']),
+        (_way_rule_10, ['bicycle_parking']),
+        (_way_rule_11, ['location']),
+        (_way_rule_12, ['generator:location']),
+        (_way_rule_13, ['generator:method']),
+        (_way_rule_14, ['generator:method']),
+        (_way_rule_15, ['generator:method']),
+        (_way_rule_16, ['fence_type']),
+        (_way_rule_17, ['board_type']),
+        (_way_rule_18, ['man_made']),
+        (_way_rule_19, ['measurement']),
+        (_way_rule_20, ['measurement']),
+        (_way_rule_21, ['measurement']),
+        (_way_rule_22, ['monitoring:river_level']),
+        (_way_rule_23, ['stay']),
+        (_way_rule_24, ['access']),
+        (_way_rule_25, ['access']),
+        (_way_rule_26, ['FIXME', 'fixme']),
+        (_way_rule_27, ['name']),
+        (_way_rule_28, ['note']),
+        (_way_rule_29, ['type']),
+        (_way_rule_30, ['type', 'wood']),
+        (_way_rule_31, ['wood']),
+        (_way_rule_32, ['type', 'wood']),
+        (_way_rule_33, ['type', 'wood']),
+        (_way_rule_34, ['type']),
+        (_way_rule_35, ['bridge']),
+        (_way_rule_36, ['fee', 'lit', 'supervised']),
+        (_way_rule_37, None),
+        (_way_rule_38, ['parking']),
+        (_way_rule_39, ['access', 'aerialway', 'amenity', 'barrier', 'craft', 'landuse', 'leisure', 'manhole', 'parking', 'place', 'playground', 'police', 'service', 'shop', 'traffic_calming']),
+        (_way_rule_40, ['sidewalk']),
+        (_way_rule_41, ['waterway']),
+        (_way_rule_42, ['waterway']),
+        (_way_rule_43, ['waterway']),
+        (_way_rule_44, ['building', 'building:part']),
+        (_way_rule_45, ['levels']),
+        (_way_rule_46, ['building:level']),
+        (_way_rule_47, ['building:level']),
+        (_way_rule_48, ['protected_class']),
+        (_way_rule_49, ['sport']),
+        (_way_rule_50, ['oneway']),
+        (_way_rule_51, ['oneway']),
+        (_way_rule_52, ['building:color']),
+        (_way_rule_53, ['roof:color']),
+        (_way_rule_54, ['building:color']),
+        (_way_rule_55, ['roof:color']),
+        (_way_rule_56, None),
+        (_way_rule_57, None),
+        (_way_rule_58, None),
+        (_way_rule_59, ['sport']),
+        (_way_rule_60, ['payment:ep_cash', 'payment:ep_chipknip', 'payment:ep_proton', 'payment:ep_quick']),
+        (_way_rule_61, ['kp']),
+        (_way_rule_62, ['pk']),
+        (_way_rule_63, ['kp']),
+        (_way_rule_64, ['pk']),
+        (_way_rule_65, ['distance']),
+        (_way_rule_66, ['postcode']),
+        (_way_rule_67, ['water']),
+        (_way_rule_68, ['man_made']),
+        (_way_rule_69, ['seamark']),
+        (_way_rule_70, ['seamark']),
+        (_way_rule_71, ['landuse']),
+        (_way_rule_72, ['shop']),
+        (_way_rule_73, ['shop']),
+        (_way_rule_74, ['amenity']),
+        (_way_rule_75, ['amenity']),
+        (_way_rule_76, ['location']),
+        (_way_rule_77, ['man_made']),
+        (_way_rule_78, ['leisure', 'shop']),
+        (_way_rule_79, ['shop']),
+        (_way_rule_80, None),
+        (_way_rule_81, ['sport']),
+        (_way_rule_82, ['barrier']),
+        (_way_rule_83, ['barrier']),
+        (_way_rule_84, ['amenity']),
+        (_way_rule_85, ['vending']),
+        (_way_rule_86, ['service']),
+        (_way_rule_87, ['highway', 'noexit', 'railway', 'service']),
+        (_way_rule_88, ['landuse']),
+        (_way_rule_89, ['shop']),
+        (_way_rule_90, ['vending']),
+        (_way_rule_91, ['highway']),
+        (_way_rule_92, ['highway']),
+        (_way_rule_93, ['emergency_telephone_code']),
+        (_way_rule_94, ['tracktype']),
+        (_way_rule_95, ['tracktype']),
+        (_way_rule_96, ['tracktype']),
+        (_way_rule_97, ['tracktype']),
+        (_way_rule_98, ['tracktype']),
+        (_way_rule_99, ['tracktype']),
+        (_way_rule_100, ['area']),
+        (_way_rule_101, ['amenity']),
+        (_way_rule_102, ['direction']),
+        (_way_rule_103, ['direction']),
+        (_way_rule_104, ['building']),
+        (_way_rule_105, ['building']),
+        (_way_rule_106, ['building']),
+        (_way_rule_107, ['water']),
+        (_way_rule_108, ['water']),
+        (_way_rule_109, ['amenity']),
+        (_way_rule_110, ['power']),
+        (_way_rule_111, ['building']),
+        (_way_rule_112, ['natural']),
+        (_way_rule_113, ['religion']),
+        (_way_rule_114, ['shop']),
+        (_way_rule_115, None),
+        (_way_rule_116, ['sport']),
+        (_way_rule_117, ['leisure']),
+        (_way_rule_118, ['cuisine']),
+        (_way_rule_119, ['kitchen_hours']),
+        (_way_rule_120, ['shop']),
+        (_way_rule_121, ['contact:google_plus']),
+        (_way_rule_122, ['amenity']),
+        (_way_rule_123, ['amenity', 'shop']),
+        (_way_rule_124, ['amenity']),
+        (_way_rule_125, ['building', 'building:type']),
+        (_way_rule_126, ['building']),
+        (_way_rule_127, ['leisure']),
+        (_way_rule_128, ['natural']),
+        (_way_rule_129, ['shop']),
+        (_way_rule_130, ['diaper']),
+        (_way_rule_131, ['diaper']),
+        (_way_rule_132, ['diaper:male']),
+        (_way_rule_133, ['diaper:female']),
+        (_way_rule_134, ['diaper:unisex']),
+        (_way_rule_135, ['diaper:wheelchair']),
+        (_way_rule_136, ['diaper:fee']),
+        (_way_rule_137, None),
+        (_way_rule_138, ['changing_table']),
+        (_way_rule_139, ['roof:shape']),
+        (_way_rule_140, ['bridge_name']),
+        (_way_rule_141, ['crossing']),
+        (_way_rule_142, ['recycling:metal']),
+        (_way_rule_143, ['shop']),
+        (_way_rule_144, ['tower:type']),
+        (_way_rule_145, ['branch:type']),
+        (_way_rule_146, ['branch:type', 'tower:type']),
+        (_way_rule_147, ['branch:type']),
+        (_way_rule_148, ['tower:type']),
+        (_way_rule_149, ['tower:type']),
+        (_way_rule_150, ['tower:type']),
+        (_way_rule_151, ['tower:type']),
+        (_way_rule_152, ['power']),
+        (_way_rule_153, ['pole:type']),
+        (_way_rule_154, ['barrier']),
+        (_way_rule_155, ['landuse']),
+        (_way_rule_156, ['sloped_curb']),
+        (_way_rule_157, ['sloped_curb']),
+        (_way_rule_158, ['kerb', 'sloped_curb']),
+        (_way_rule_159, ['unnamed']),
+        (_way_rule_160, ['segregated']),
+        (_way_rule_161, ['bicycle:oneway']),
+        (_way_rule_162, ['building:height']),
+        (_way_rule_163, ['building:min_height']),
+        (_way_rule_164, ['construction']),
+        (_way_rule_165, ['navigationaid']),
+        (_way_rule_166, ['water']),
+        (_way_rule_167, ['natural']),
+        (_way_rule_168, ['natural', 'water', 'waterway']),
+        (_way_rule_169, ['natural', 'water']),
+        (_way_rule_170, ['amenity']),
+        (_way_rule_171, ['amenity']),
+        (_way_rule_172, ['stream']),
+        (_way_rule_173, ['shop']),
+        (_way_rule_174, ['access']),
+        (_way_rule_175, ['addr:inclusion']),
+        (_way_rule_176, ['building']),
+        (_way_rule_177, ['generator:type']),
+        (_way_rule_178, ['building']),
+        (_way_rule_179, ['natural']),
+        (_way_rule_180, ['climbing:grade:UIAA:min']),
+        (_way_rule_181, ['climbing:grade:UIAA:max']),
+        (_way_rule_182, ['climbing:grade:UIAA:mean']),
+        (_way_rule_183, ['climbing:grade:UIAA']),
+        (_way_rule_184, ['cuisine']),
+        (_way_rule_185, ['cuisine']),
+        (_way_rule_186, ['cycleway', 'cycleway:left', 'cycleway:right', 'shoulder']),
+        (_way_rule_187, ['Fixme']),
+        (_way_rule_188, ['service:bicycle:chaintool']),
+        (_way_rule_189, ['building:roof:shape']),
+        (_way_rule_190, ['man_made']),
+        (_way_rule_191, ['man_made']),
+        (_way_rule_192, ['pump:type']),
+        (_way_rule_193, ['pump:type']),
+        (_way_rule_194, ['substance']),
+        (_way_rule_195, ['landuse']),
+        (_way_rule_196, ['amenity']),
+        (_way_rule_197, ['amenity']),
+        (_way_rule_198, ['surface']),
+        (_way_rule_199, ['school']),
+        (_way_rule_200, ['voltage-high', 'voltage-low']),
+        (_way_rule_201, ['toilet']),
+        (_way_rule_202, ['toilet']),
+        (_way_rule_203, ['type']),
+        (_way_rule_204, ['image']),
+        (_way_rule_205, ['NHD:GNIS_ID', 'gnis:id', 'nhd:gnis_id', 'ref:gnis', 'tiger:PLACENS']),
+        (_way_rule_206, ['NHD:GNIS_ID', 'gnis:feature_id']),
+        (_way_rule_207, ['landform']),
+        (_way_rule_208, ['landform']),
+        (_way_rule_209, ['landform']),
+        (_way_rule_210, ['landform']),
+        (_way_rule_211, ['cycleway', 'cycleway:both', 'cycleway:left', 'cycleway:right']),
+        (_way_rule_212, ['cycleway:left', 'cycleway:right']),
+    ])
 
-        # way[cycleway][cycleway^=opposite_]!:righthandtraffic
-        # Rule Blacklisted (id: 50459238)
-
-        # *[residential=condominium]
-        # Rule Blacklisted (id: 1861188094)
-
-        return err
-
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
-        set_bbq_autofix = set_beam_pump_no_mech = set_diaper___checked = set_diaper_checked = set_generic_power_tower_type_warning = set_levels_building = set_parcel_fixable = set_power_pole_type_warning = set_power_tower_type_warning = set_pumping_ring_no_mech = set_samebuildingcolor = set_sameroofcolor = False
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-        # *[barrier=wire_fence]
+    # *[barrier=wire_fence]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('barrier' in keys):
             match = False
             if not match:
@@ -8988,7 +9827,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['fence_type','chain_link']])
                 }})
 
-        # *[barrier=wood_fence]
+    # *[barrier=wood_fence]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('barrier' in keys):
             match = False
             if not match:
@@ -9007,26 +9847,27 @@ class Josm_deprecated(PluginMapCSS):
                     ['fence_type','wood']])
                 }})
 
-        # *[highway=stile]
-        # Rule Blacklisted (id: 1435678043)
+    # *[highway=stile]
+    # Rule Blacklisted (id: 1435678043)
 
-        # *[highway=incline]
-        # Rule Blacklisted (id: 765169083)
+    # *[highway=incline]
+    # Rule Blacklisted (id: 765169083)
 
-        # *[highway=incline_steep]
-        # Rule Blacklisted (id: 1966772390)
+    # *[highway=incline_steep]
+    # Rule Blacklisted (id: 1966772390)
 
-        # *[highway=unsurfaced]
-        # Rule Blacklisted (id: 20631498)
+    # *[highway=unsurfaced]
+    # Rule Blacklisted (id: 20631498)
 
-        # *[landuse=wood]
-        # Rule Blacklisted (id: 469903103)
+    # *[landuse=wood]
+    # Rule Blacklisted (id: 469903103)
 
-        # *[natural=marsh]
-        # Rule Blacklisted (id: 1459865523)
+    # *[natural=marsh]
+    # Rule Blacklisted (id: 1459865523)
 
-        # *[landuse=reservoir][!reservoir_type]
-        # *[landuse=reservoir][reservoir_type=water_storage]
+    # *[landuse=reservoir][!reservoir_type]
+    # *[landuse=reservoir][reservoir_type=water_storage]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('landuse' in keys) or ('landuse' in keys and 'reservoir_type' in keys):
             match = False
             if not match:
@@ -9052,7 +9893,8 @@ class Josm_deprecated(PluginMapCSS):
                     'reservoir_type'])
                 }})
 
-        # *[landuse=reservoir][reservoir_type=tailings]
+    # *[landuse=reservoir][reservoir_type=tailings]
+    def _relation_rule_3(self, data, tags, members, keys, err, sets):
         if ('landuse' in keys and 'reservoir_type' in keys):
             match = False
             if not match:
@@ -9074,7 +9916,8 @@ class Josm_deprecated(PluginMapCSS):
                     'reservoir_type'])
                 }})
 
-        # *[landuse=reservoir][reservoir_type=evaporator]
+    # *[landuse=reservoir][reservoir_type=evaporator]
+    def _relation_rule_4(self, data, tags, members, keys, err, sets):
         if ('landuse' in keys and 'reservoir_type' in keys):
             match = False
             if not match:
@@ -9087,7 +9930,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"basin=evaporation or landuse=salt_pond"
                 err.append({'class': 9002001, 'subclass': 1494361034, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[landuse=reservoir][reservoir_type=sewage]
+    # *[landuse=reservoir][reservoir_type=sewage]
+    def _relation_rule_5(self, data, tags, members, keys, err, sets):
         if ('landuse' in keys and 'reservoir_type' in keys):
             match = False
             if not match:
@@ -9100,19 +9944,20 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=water + water=wastewater or landuse=basin + basin=settling or man_made=basin + basin=settling"
                 err.append({'class': 9002001, 'subclass': 833262066, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[highway=byway]
-        # Rule Blacklisted (id: 1844620979)
+    # *[highway=byway]
+    # Rule Blacklisted (id: 1844620979)
 
-        # *[power_source]
-        # Rule Blacklisted (id: 34751027)
+    # *[power_source]
+    # Rule Blacklisted (id: 34751027)
 
-        # *[power_rating]
-        # Rule Blacklisted (id: 904750343)
+    # *[power_rating]
+    # Rule Blacklisted (id: 904750343)
 
-        # *[shop=antique]
-        # Rule Blacklisted (id: 596668979)
+    # *[shop=antique]
+    # Rule Blacklisted (id: 596668979)
 
-        # *[shop=bags]
+    # *[shop=bags]
+    def _relation_rule_6(self, data, tags, members, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -9129,7 +9974,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','bag']])
                 }})
 
-        # *[shop=fashion]
+    # *[shop=fashion]
+    def _relation_rule_7(self, data, tags, members, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -9146,10 +9992,11 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','clothes']])
                 }})
 
-        # *[shop=organic]
-        # Rule Blacklisted (id: 1959365145)
+    # *[shop=organic]
+    # Rule Blacklisted (id: 1959365145)
 
-        # *[shop=pets]
+    # *[shop=pets]
+    def _relation_rule_8(self, data, tags, members, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -9166,7 +10013,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','pet']])
                 }})
 
-        # *[shop=pharmacy]
+    # *[shop=pharmacy]
+    def _relation_rule_9(self, data, tags, members, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -9185,7 +10033,8 @@ class Josm_deprecated(PluginMapCSS):
                     'shop'])
                 }})
 
-        # *[bicycle_parking=sheffield]
+    # *[bicycle_parking=sheffield]
+    def _relation_rule_10(self, data, tags, members, keys, err, sets):
         if ('bicycle_parking' in keys):
             match = False
             if not match:
@@ -9202,19 +10051,20 @@ class Josm_deprecated(PluginMapCSS):
                     ['bicycle_parking','stands']])
                 }})
 
-        # *[amenity=emergency_phone]
-        # Rule Blacklisted (id: 1108230656)
+    # *[amenity=emergency_phone]
+    # Rule Blacklisted (id: 1108230656)
 
-        # *[sport=gaelic_football]
-        # Rule Blacklisted (id: 1768681881)
+    # *[sport=gaelic_football]
+    # Rule Blacklisted (id: 1768681881)
 
-        # *[power=station]
-        # Rule Blacklisted (id: 52025933)
+    # *[power=station]
+    # Rule Blacklisted (id: 52025933)
 
-        # *[power=sub_station]
-        # Rule Blacklisted (id: 1423074682)
+    # *[power=sub_station]
+    # Rule Blacklisted (id: 1423074682)
 
-        # *[location=rooftop]
+    # *[location=rooftop]
+    def _relation_rule_11(self, data, tags, members, keys, err, sets):
         if ('location' in keys):
             match = False
             if not match:
@@ -9231,7 +10081,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['location','roof']])
                 }})
 
-        # *[generator:location]
+    # *[generator:location]
+    def _relation_rule_12(self, data, tags, members, keys, err, sets):
         if ('generator:location' in keys):
             match = False
             if not match:
@@ -9250,7 +10101,8 @@ class Josm_deprecated(PluginMapCSS):
                     'generator:location'])
                 }})
 
-        # *[generator:method=dam]
+    # *[generator:method=dam]
+    def _relation_rule_13(self, data, tags, members, keys, err, sets):
         if ('generator:method' in keys):
             match = False
             if not match:
@@ -9267,7 +10119,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['generator:method','water-storage']])
                 }})
 
-        # *[generator:method=pumped-storage]
+    # *[generator:method=pumped-storage]
+    def _relation_rule_14(self, data, tags, members, keys, err, sets):
         if ('generator:method' in keys):
             match = False
             if not match:
@@ -9284,7 +10137,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['generator:method','water-pumped-storage']])
                 }})
 
-        # *[generator:method=pumping]
+    # *[generator:method=pumping]
+    def _relation_rule_15(self, data, tags, members, keys, err, sets):
         if ('generator:method' in keys):
             match = False
             if not match:
@@ -9301,7 +10155,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['generator:method','water-pumped-storage']])
                 }})
 
-        # *[fence_type=chain]
+    # *[fence_type=chain]
+    def _relation_rule_16(self, data, tags, members, keys, err, sets):
         if ('fence_type' in keys):
             match = False
             if not match:
@@ -9315,10 +10170,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"barrier=fence + fence_type=chain_link"
                 err.append({'class': 9002001, 'subclass': 19409288, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[building=entrance]
-        # Rule Blacklisted (id: 306662985)
+    # *[building=entrance]
+    # Rule Blacklisted (id: 306662985)
 
-        # *[board_type=board]
+    # *[board_type=board]
+    def _relation_rule_17(self, data, tags, members, keys, err, sets):
         if ('board_type' in keys):
             match = False
             if not match:
@@ -9334,7 +10190,8 @@ class Josm_deprecated(PluginMapCSS):
                     'board_type'])
                 }})
 
-        # *[man_made=measurement_station]
+    # *[man_made=measurement_station]
+    def _relation_rule_18(self, data, tags, members, keys, err, sets):
         if ('man_made' in keys):
             match = False
             if not match:
@@ -9351,7 +10208,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['man_made','monitoring_station']])
                 }})
 
-        # *[measurement=water_level]
+    # *[measurement=water_level]
+    def _relation_rule_19(self, data, tags, members, keys, err, sets):
         if ('measurement' in keys):
             match = False
             if not match:
@@ -9371,7 +10229,8 @@ class Josm_deprecated(PluginMapCSS):
                     'measurement'])
                 }})
 
-        # *[measurement=weather]
+    # *[measurement=weather]
+    def _relation_rule_20(self, data, tags, members, keys, err, sets):
         if ('measurement' in keys):
             match = False
             if not match:
@@ -9391,7 +10250,8 @@ class Josm_deprecated(PluginMapCSS):
                     'measurement'])
                 }})
 
-        # *[measurement=seismic]
+    # *[measurement=seismic]
+    def _relation_rule_21(self, data, tags, members, keys, err, sets):
         if ('measurement' in keys):
             match = False
             if not match:
@@ -9411,7 +10271,8 @@ class Josm_deprecated(PluginMapCSS):
                     'measurement'])
                 }})
 
-        # *[monitoring:river_level]
+    # *[monitoring:river_level]
+    def _relation_rule_22(self, data, tags, members, keys, err, sets):
         if ('monitoring:river_level' in keys):
             match = False
             if not match:
@@ -9430,7 +10291,8 @@ class Josm_deprecated(PluginMapCSS):
                     'monitoring:river_level'])
                 }})
 
-        # *[stay]
+    # *[stay]
+    def _relation_rule_23(self, data, tags, members, keys, err, sets):
         if ('stay' in keys):
             match = False
             if not match:
@@ -9449,18 +10311,19 @@ class Josm_deprecated(PluginMapCSS):
                     'stay'])
                 }})
 
-        # *[emergency=aed]
-        # Rule Blacklisted (id: 707111885)
+    # *[emergency=aed]
+    # Rule Blacklisted (id: 707111885)
 
-        # *[day_on][!restriction]
-        # *[day_off][!restriction]
-        # *[date_on][!restriction]
-        # *[date_off][!restriction]
-        # *[hour_on][!restriction]
-        # *[hour_off][!restriction]
-        # Rule Blacklisted (id: 294264920)
+    # *[day_on][!restriction]
+    # *[day_off][!restriction]
+    # *[date_on][!restriction]
+    # *[date_off][!restriction]
+    # *[hour_on][!restriction]
+    # *[hour_off][!restriction]
+    # Rule Blacklisted (id: 294264920)
 
-        # *[access=designated]
+    # *[access=designated]
+    def _relation_rule_24(self, data, tags, members, keys, err, sets):
         if ('access' in keys):
             match = False
             if not match:
@@ -9471,7 +10334,8 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("''{0}'' is meaningless, use more specific tags, e.g. ''{1}''","access=designated","bicycle=designated")
                 err.append({'class': 9002002, 'subclass': 2057594338, 'text': mapcss.tr('\'\'{0}\'\' is meaningless, use more specific tags, e.g. \'\'{1}\'\'', 'access=designated', 'bicycle=designated')})
 
-        # *[access=official]
+    # *[access=official]
+    def _relation_rule_25(self, data, tags, members, keys, err, sets):
         if ('access' in keys):
             match = False
             if not match:
@@ -9482,8 +10346,9 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("''{0}'' does not specify the official mode of transportation, use ''{1}'' for example","access=official","bicycle=official")
                 err.append({'class': 9002003, 'subclass': 1909133836, 'text': mapcss.tr('\'\'{0}\'\' does not specify the official mode of transportation, use \'\'{1}\'\' for example', 'access=official', 'bicycle=official')})
 
-        # *[fixme=yes]
-        # *[FIXME=yes]
+    # *[fixme=yes]
+    # *[FIXME=yes]
+    def _relation_rule_26(self, data, tags, members, keys, err, sets):
         if ('FIXME' in keys) or ('fixme' in keys):
             match = False
             if not match:
@@ -9498,7 +10363,8 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0}={1} is unspecific. Instead of ''{1}'' please give more information about what exactly should be fixed.","{0.key}","{0.value}")
                 err.append({'class': 9002004, 'subclass': 136657482, 'text': mapcss.tr('{0}={1} is unspecific. Instead of \'\'{1}\'\' please give more information about what exactly should be fixed.', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[name][name=~/^(?i)fixme$/]
+    # *[name][name=~/^(?i)fixme$/]
+    def _relation_rule_27(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -9513,7 +10379,8 @@ class Josm_deprecated(PluginMapCSS):
                     'name'])
                 }})
 
-        # *[note][note=~/^(?i)fixme$/]
+    # *[note][note=~/^(?i)fixme$/]
+    def _relation_rule_28(self, data, tags, members, keys, err, sets):
         if ('note' in keys):
             match = False
             if not match:
@@ -9524,8 +10391,9 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is unspecific. Instead use the key fixme with the information what exactly should be fixed in the value of fixme.","{0.tag}")
                 err.append({'class': 9002006, 'subclass': 1243120287, 'text': mapcss.tr('{0} is unspecific. Instead use the key fixme with the information what exactly should be fixed in the value of fixme.', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[type=broad_leaved]
-        # *[type=broad_leafed]
+    # *[type=broad_leaved]
+    # *[type=broad_leafed]
+    def _relation_rule_29(self, data, tags, members, keys, err, sets):
         if ('type' in keys):
             match = False
             if not match:
@@ -9549,9 +10417,10 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[wood=coniferous]
-        # *[type=coniferous]
-        # *[type=conifer]
+    # *[wood=coniferous]
+    # *[type=coniferous]
+    # *[type=conifer]
+    def _relation_rule_30(self, data, tags, members, keys, err, sets):
         if ('type' in keys) or ('wood' in keys):
             match = False
             if not match:
@@ -9579,7 +10448,8 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[wood=mixed]
+    # *[wood=mixed]
+    def _relation_rule_31(self, data, tags, members, keys, err, sets):
         if ('wood' in keys):
             match = False
             if not match:
@@ -9599,8 +10469,9 @@ class Josm_deprecated(PluginMapCSS):
                     'wood'])
                 }})
 
-        # *[wood=evergreen]
-        # *[type=evergreen]
+    # *[wood=evergreen]
+    # *[type=evergreen]
+    def _relation_rule_32(self, data, tags, members, keys, err, sets):
         if ('type' in keys) or ('wood' in keys):
             match = False
             if not match:
@@ -9624,9 +10495,10 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[wood=deciduous]
-        # *[type=deciduous]
-        # *[type=deciduos]
+    # *[wood=deciduous]
+    # *[type=deciduous]
+    # *[type=deciduos]
+    def _relation_rule_33(self, data, tags, members, keys, err, sets):
         if ('type' in keys) or ('wood' in keys):
             match = False
             if not match:
@@ -9654,10 +10526,11 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[natural=land]
-        # Rule Blacklisted (id: 94558529)
+    # *[natural=land]
+    # Rule Blacklisted (id: 94558529)
 
-        # *[bridge=causeway]
+    # *[bridge=causeway]
+    def _relation_rule_34(self, data, tags, members, keys, err, sets):
         if ('bridge' in keys):
             match = False
             if not match:
@@ -9672,18 +10545,19 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"ford=yes"
                 err.append({'class': 9002001, 'subclass': 461671124, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[bridge=swing]
-        # Rule Blacklisted (id: 1047428067)
+    # *[bridge=swing]
+    # Rule Blacklisted (id: 1047428067)
 
-        # *[bridge=suspension]
-        # Rule Blacklisted (id: 1157046268)
+    # *[bridge=suspension]
+    # Rule Blacklisted (id: 1157046268)
 
-        # *[bridge=pontoon]
-        # Rule Blacklisted (id: 1195531951)
+    # *[bridge=pontoon]
+    # Rule Blacklisted (id: 1195531951)
 
-        # *[fee=interval]
-        # *[lit=interval]
-        # *[supervised=interval]
+    # *[fee=interval]
+    # *[lit=interval]
+    # *[supervised=interval]
+    def _relation_rule_35(self, data, tags, members, keys, err, sets):
         if ('fee' in keys) or ('lit' in keys) or ('supervised' in keys):
             match = False
             if not match:
@@ -9703,7 +10577,8 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated. Please specify interval by using opening_hours syntax","{0.tag}")
                 err.append({'class': 9002001, 'subclass': 417886592, 'text': mapcss.tr('{0} is deprecated. Please specify interval by using opening_hours syntax', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[/josm\/ignore/]
+    # *[/josm\/ignore/]
+    def _relation_rule_36(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -9716,10 +10591,11 @@ class Josm_deprecated(PluginMapCSS):
                 # fixDeleteObject:this
                 err.append({'class': 9002001, 'subclass': 1402743016, 'text': mapcss.tr('{0} is deprecated. Please delete this object and use a private layer instead', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[sport=diving]
-        # Rule Blacklisted (id: 590643159)
+    # *[sport=diving]
+    # Rule Blacklisted (id: 590643159)
 
-        # *[parking=park_and_ride]
+    # *[parking=park_and_ride]
+    def _relation_rule_37(self, data, tags, members, keys, err, sets):
         if ('parking' in keys):
             match = False
             if not match:
@@ -9741,24 +10617,25 @@ class Josm_deprecated(PluginMapCSS):
                     'parking'])
                 }})
 
-        # *[parking=yes]
-        # *[playground=yes]
-        # *[manhole=plain]
-        # *[manhole=unknown]
-        # *[manhole=yes]
-        # *[police=yes]
-        # *[traffic_calming=yes]
-        # *[access=restricted]
-        # *[barrier=yes]
-        # *[aerialway=yes][!public_transport]
-        # *[amenity=yes]
-        # *[leisure=yes]
-        # *[landuse=yes]
-        # *[shop="*"]
-        # *[shop=yes][amenity!=fuel]
-        # *[craft=yes]
-        # *[service=yes]
-        # *[place=yes]
+    # *[parking=yes]
+    # *[playground=yes]
+    # *[manhole=plain]
+    # *[manhole=unknown]
+    # *[manhole=yes]
+    # *[police=yes]
+    # *[traffic_calming=yes]
+    # *[access=restricted]
+    # *[barrier=yes]
+    # *[aerialway=yes][!public_transport]
+    # *[amenity=yes]
+    # *[leisure=yes]
+    # *[landuse=yes]
+    # *[shop="*"]
+    # *[shop=yes][amenity!=fuel]
+    # *[craft=yes]
+    # *[service=yes]
+    # *[place=yes]
+    def _relation_rule_38(self, data, tags, members, keys, err, sets):
         if ('access' in keys) or ('aerialway' in keys) or ('amenity' in keys) or ('barrier' in keys) or ('craft' in keys) or ('landuse' in keys) or ('leisure' in keys) or ('manhole' in keys) or ('parking' in keys) or ('place' in keys) or ('playground' in keys) or ('police' in keys) or ('service' in keys) or ('shop' in keys) or ('traffic_calming' in keys):
             match = False
             if not match:
@@ -9837,13 +10714,14 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0}={1} is unspecific. Please replace ''{1}'' by a specific value.","{0.key}","{0.value}")
                 err.append({'class': 9002007, 'subclass': 1452069773, 'text': mapcss.tr('{0}={1} is unspecific. Please replace \'\'{1}\'\' by a specific value.', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # *[place_name][!name]
-        # Rule Blacklisted (id: 1089331760)
+    # *[place_name][!name]
+    # Rule Blacklisted (id: 1089331760)
 
-        # *[place][place_name=*name]
-        # Rule Blacklisted (id: 1116761280)
+    # *[place][place_name=*name]
+    # Rule Blacklisted (id: 1116761280)
 
-        # *[waterway=water_point]
+    # *[waterway=water_point]
+    def _relation_rule_39(self, data, tags, members, keys, err, sets):
         if ('waterway' in keys):
             match = False
             if not match:
@@ -9862,7 +10740,8 @@ class Josm_deprecated(PluginMapCSS):
                     'waterway'])
                 }})
 
-        # *[waterway=waste_disposal]
+    # *[waterway=waste_disposal]
+    def _relation_rule_40(self, data, tags, members, keys, err, sets):
         if ('waterway' in keys):
             match = False
             if not match:
@@ -9881,7 +10760,8 @@ class Josm_deprecated(PluginMapCSS):
                     'waterway'])
                 }})
 
-        # *[waterway=mooring]
+    # *[waterway=mooring]
+    def _relation_rule_41(self, data, tags, members, keys, err, sets):
         if ('waterway' in keys):
             match = False
             if not match:
@@ -9901,8 +10781,9 @@ class Josm_deprecated(PluginMapCSS):
                     'waterway'])
                 }})
 
-        # *[building][levels]
-        # *[building:part][levels]
+    # *[building][levels]
+    # *[building:part][levels]
+    def _relation_rule_42(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'levels' in keys) or ('building:part' in keys and 'levels' in keys):
             match = False
             if not match:
@@ -9919,7 +10800,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{1.key}")
                 # suggestAlternative:"building:levels"
                 # fixChangeKey:"levels => building:levels"
-                set_levels_building = True
+                sets.add('levels_building')
                 err.append({'class': 9002001, 'subclass': 869936714, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{1.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['building:levels', mapcss.tag(tags, 'levels')]]),
@@ -9927,18 +10808,20 @@ class Josm_deprecated(PluginMapCSS):
                     'levels'])
                 }})
 
-        # *[levels]!.levels_building
+    # *[levels]!.levels_building
+    def _relation_rule_43(self, data, tags, members, keys, err, sets):
         if ('levels' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_levels_building) and (mapcss._tag_capture(capture_tags, 0, tags, 'levels')))
+                try: match = (('levels_building' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'levels')))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwWarning:tr("Unusual key {0}, maybe {1} or {2} is meant","{0.key}","level","building:levels")
                 err.append({'class': 9002021, 'subclass': 1172699526, 'text': mapcss.tr('Unusual key {0}, maybe {1} or {2} is meant', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'level', 'building:levels')})
 
-        # *[building:level][!building:levels]
+    # *[building:level][!building:levels]
+    def _relation_rule_44(self, data, tags, members, keys, err, sets):
         if ('building:level' in keys):
             match = False
             if not match:
@@ -9957,7 +10840,8 @@ class Josm_deprecated(PluginMapCSS):
                     'building:level'])
                 }})
 
-        # *[building:level][building:levels]
+    # *[building:level][building:levels]
+    def _relation_rule_45(self, data, tags, members, keys, err, sets):
         if ('building:level' in keys and 'building:levels' in keys):
             match = False
             if not match:
@@ -9970,7 +10854,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"building:levels"
                 err.append({'class': 9002001, 'subclass': 902689123, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[protected_class]
+    # *[protected_class]
+    def _relation_rule_46(self, data, tags, members, keys, err, sets):
         if ('protected_class' in keys):
             match = False
             if not match:
@@ -9989,19 +10874,20 @@ class Josm_deprecated(PluginMapCSS):
                     'protected_class'])
                 }})
 
-        # *[kerb=unknown]
-        # *[lock=unknown]
-        # *[hide=unknown]
-        # *[shelter=unknown]
-        # *[access=unknown]
-        # *[capacity:parent=unknown]
-        # *[capacity:women=unknown]
-        # *[capacity:disabled=unknown]
-        # *[crossing=unknown]
-        # *[foot=unknown]
-        # Rule Blacklisted (id: 1052866123)
-
-        # *[sport=skiing]
+    # *[kerb=unknown]
+    # *[lock=unknown]
+    # *[hide=unknown]
+    # *[shelter=unknown]
+    # *[access=unknown]
+    # *[capacity:parent=unknown]
+    # *[capacity:women=unknown]
+    # *[capacity:disabled=unknown]
+    # *[crossing=unknown]
+    # *[foot=unknown]
+    # Rule Blacklisted (id: 1052866123)
+
+    # *[sport=skiing]
+    def _relation_rule_47(self, data, tags, members, keys, err, sets):
         if ('sport' in keys):
             match = False
             if not match:
@@ -10014,16 +10900,17 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:tr("{0} + {1} + {2}","piste:type=*","piste:difficulty=*","piste:grooming=*")
                 err.append({'class': 9002001, 'subclass': 1578959559, 'text': mapcss.tr('Definition of {0} is unclear', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[waterway=wadi]
-        # Rule Blacklisted (id: 719234223)
+    # *[waterway=wadi]
+    # Rule Blacklisted (id: 719234223)
 
-        # *[drinkable]
-        # Rule Blacklisted (id: 1785584789)
+    # *[drinkable]
+    # Rule Blacklisted (id: 1785584789)
 
-        # *[color][!colour]
-        # Rule Blacklisted (id: 1850270072)
+    # *[color][!colour]
+    # Rule Blacklisted (id: 1850270072)
 
-        # area[building:color][!building:colour]
+    # area[building:color][!building:colour]
+    def _relation_rule_48(self, data, tags, members, keys, err, sets):
         if ('building:color' in keys and 'type' in keys):
             match = False
             if not match:
@@ -10042,7 +10929,8 @@ class Josm_deprecated(PluginMapCSS):
                     'building:color'])
                 }})
 
-        # area[roof:color][!roof:colour]
+    # area[roof:color][!roof:colour]
+    def _relation_rule_49(self, data, tags, members, keys, err, sets):
         if ('roof:color' in keys and 'type' in keys):
             match = False
             if not match:
@@ -10061,10 +10949,11 @@ class Josm_deprecated(PluginMapCSS):
                     'roof:color'])
                 }})
 
-        # *[color][colour][color=*colour]
-        # Rule Blacklisted (id: 1825345743)
+    # *[color][colour][color=*colour]
+    # Rule Blacklisted (id: 1825345743)
 
-        # area[building:color][building:colour]["building:color"=*"building:colour"]
+    # area[building:color][building:colour]["building:color"=*"building:colour"]
+    def _relation_rule_50(self, data, tags, members, keys, err, sets):
         if ('building:color' in keys and 'building:colour' in keys and 'type' in keys):
             match = False
             if not match:
@@ -10077,13 +10966,14 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.key}","{1.key}")
                 # suggestAlternative:"building:colour"
                 # fixRemove:"building:color"
-                set_samebuildingcolor = True
+                sets.add('samebuildingcolor')
                 err.append({'class': 9002001, 'subclass': 1236974991, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}')), 'allow_fix_override': True, 'fix': {
                     '-': ([
                     'building:color'])
                 }})
 
-        # area[roof:color][roof:colour]["roof:color"=*"roof:colour"]
+    # area[roof:color][roof:colour]["roof:color"=*"roof:colour"]
+    def _relation_rule_51(self, data, tags, members, keys, err, sets):
         if ('roof:color' in keys and 'roof:colour' in keys and 'type' in keys):
             match = False
             if not match:
@@ -10096,22 +10986,23 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}","{0.key}","{1.key}")
                 # suggestAlternative:"roof:colour"
                 # fixRemove:"roof:color"
-                set_sameroofcolor = True
+                sets.add('sameroofcolor')
                 err.append({'class': 9002001, 'subclass': 1815260806, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}')), 'allow_fix_override': True, 'fix': {
                     '-': ([
                     'roof:color'])
                 }})
 
-        # *[color][colour]!.samecolor
-        # Rule Blacklisted (id: 1064658218)
+    # *[color][colour]!.samecolor
+    # Rule Blacklisted (id: 1064658218)
 
-        # *[building:color][building:colour]!.samebuildingcolor
-        # Rule Blacklisted (id: 740601387)
+    # *[building:color][building:colour]!.samebuildingcolor
+    # Rule Blacklisted (id: 740601387)
 
-        # *[roof:color][roof:colour]!.sameroofcolor
-        # Rule Blacklisted (id: 512779280)
+    # *[roof:color][roof:colour]!.sameroofcolor
+    # Rule Blacklisted (id: 512779280)
 
-        # *[/:color/][!building:color][!roof:color][!gpxd:color]
+    # *[/:color/][!building:color][!roof:color][!gpxd:color]
+    def _relation_rule_52(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -10124,7 +11015,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:":colour"
                 err.append({'class': 9002001, 'subclass': 1632389707, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[/color:/]
+    # *[/color:/]
+    def _relation_rule_53(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -10137,11 +11029,12 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"colour:"
                 err.append({'class': 9002001, 'subclass': 1390370717, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[/=|\+|\/|&|<|>|;|'|"|%|#|@|\\|,|\.|\{|\}|\?|\*|\^|\$/]
-        # Rule Blacklisted (id: 1752615188)
+    # *[/=|\+|\/|&|<|>|;|'|"|%|#|@|\\|,|\.|\{|\}|\?|\*|\^|\$/]
+    # Rule Blacklisted (id: 1752615188)
 
-        # *[/^.$/]
-        # relation[/^..$/][!to]
+    # *[/^.$/]
+    # relation[/^..$/][!to]
+    def _relation_rule_54(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -10158,12 +11051,13 @@ class Josm_deprecated(PluginMapCSS):
                 # assertNoMatch:"relation to=Berlin"
                 err.append({'class': 9002012, 'subclass': 518970721, 'text': mapcss.tr('uncommon short key')})
 
-        # *[sport=hockey]
-        # Rule Blacklisted (id: 651933474)
+    # *[sport=hockey]
+    # Rule Blacklisted (id: 651933474)
 
-        # *[sport=billard]
-        # *[sport=billards]
-        # *[sport=billiard]
+    # *[sport=billard]
+    # *[sport=billards]
+    # *[sport=billiard]
+    def _relation_rule_55(self, data, tags, members, keys, err, sets):
         if ('sport' in keys):
             match = False
             if not match:
@@ -10188,10 +11082,11 @@ class Josm_deprecated(PluginMapCSS):
                     ['sport','billiards']])
                 }})
 
-        # *[payment:ep_quick]
-        # *[payment:ep_cash]
-        # *[payment:ep_proton]
-        # *[payment:ep_chipknip]
+    # *[payment:ep_quick]
+    # *[payment:ep_cash]
+    # *[payment:ep_proton]
+    # *[payment:ep_chipknip]
+    def _relation_rule_56(self, data, tags, members, keys, err, sets):
         if ('payment:ep_cash' in keys) or ('payment:ep_chipknip' in keys) or ('payment:ep_proton' in keys) or ('payment:ep_quick' in keys):
             match = False
             if not match:
@@ -10219,7 +11114,8 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[kp][railway!=milestone]
+    # *[kp][railway!=milestone]
+    def _relation_rule_57(self, data, tags, members, keys, err, sets):
         if ('kp' in keys):
             match = False
             if not match:
@@ -10238,7 +11134,8 @@ class Josm_deprecated(PluginMapCSS):
                     'kp'])
                 }})
 
-        # *[pk][railway!=milestone]
+    # *[pk][railway!=milestone]
+    def _relation_rule_58(self, data, tags, members, keys, err, sets):
         if ('pk' in keys):
             match = False
             if not match:
@@ -10257,7 +11154,8 @@ class Josm_deprecated(PluginMapCSS):
                     'pk'])
                 }})
 
-        # *[kp][railway=milestone]
+    # *[kp][railway=milestone]
+    def _relation_rule_59(self, data, tags, members, keys, err, sets):
         if ('kp' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -10276,7 +11174,8 @@ class Josm_deprecated(PluginMapCSS):
                     'kp'])
                 }})
 
-        # *[pk][railway=milestone]
+    # *[pk][railway=milestone]
+    def _relation_rule_60(self, data, tags, members, keys, err, sets):
         if ('pk' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -10295,7 +11194,8 @@ class Josm_deprecated(PluginMapCSS):
                     'pk'])
                 }})
 
-        # *[distance][railway=milestone]
+    # *[distance][railway=milestone]
+    def _relation_rule_61(self, data, tags, members, keys, err, sets):
         if ('distance' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -10314,7 +11214,8 @@ class Josm_deprecated(PluginMapCSS):
                     'distance'])
                 }})
 
-        # *[postcode]
+    # *[postcode]
+    def _relation_rule_62(self, data, tags, members, keys, err, sets):
         if ('postcode' in keys):
             match = False
             if not match:
@@ -10328,7 +11229,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"postal_code"
                 err.append({'class': 9002001, 'subclass': 1942523538, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[water=intermittent]
+    # *[water=intermittent]
+    def _relation_rule_63(self, data, tags, members, keys, err, sets):
         if ('water' in keys):
             match = False
             if not match:
@@ -10348,10 +11250,11 @@ class Josm_deprecated(PluginMapCSS):
                     'water'])
                 }})
 
-        # *[landuse=farm]
-        # Rule Blacklisted (id: 1968473048)
+    # *[landuse=farm]
+    # Rule Blacklisted (id: 1968473048)
 
-        # *[seamark=buoy]["seamark:type"=~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    # *[seamark=buoy]["seamark:type"=~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    def _relation_rule_64(self, data, tags, members, keys, err, sets):
         if ('seamark' in keys and 'seamark:type' in keys):
             match = False
             if not match:
@@ -10368,7 +11271,8 @@ class Josm_deprecated(PluginMapCSS):
                     'seamark'])
                 }})
 
-        # *[seamark=buoy]["seamark:type"!~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    # *[seamark=buoy]["seamark:type"!~/^(buoy_cardinal|buoy_installation|buoy_isolated_danger|buoy_lateral|buoy_safe_water|buoy_special_purpose|mooring)$/]
+    def _relation_rule_65(self, data, tags, members, keys, err, sets):
         if ('seamark' in keys):
             match = False
             if not match:
@@ -10381,7 +11285,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"{1.tag}"
                 err.append({'class': 9002001, 'subclass': 1481035998, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[landuse=conservation]
+    # *[landuse=conservation]
+    def _relation_rule_66(self, data, tags, members, keys, err, sets):
         if ('landuse' in keys):
             match = False
             if not match:
@@ -10401,16 +11306,17 @@ class Josm_deprecated(PluginMapCSS):
                     'landuse'])
                 }})
 
-        # *[amenity=kiosk]
-        # Rule Blacklisted (id: 1331930630)
+    # *[amenity=kiosk]
+    # Rule Blacklisted (id: 1331930630)
 
-        # *[amenity=shop]
-        # Rule Blacklisted (id: 1562207150)
+    # *[amenity=shop]
+    # Rule Blacklisted (id: 1562207150)
 
-        # *[shop=fishmonger]
-        # Rule Blacklisted (id: 1376789416)
+    # *[shop=fishmonger]
+    # Rule Blacklisted (id: 1376789416)
 
-        # *[shop=fish]
+    # *[shop=fish]
+    def _relation_rule_67(self, data, tags, members, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -10425,7 +11331,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=seafood"
                 err.append({'class': 9002001, 'subclass': 47191734, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[shop=betting]
+    # *[shop=betting]
+    def _relation_rule_68(self, data, tags, members, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -10443,10 +11350,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=lottery"
                 err.append({'class': 9002001, 'subclass': 1035501389, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[shop=perfume]
-        # Rule Blacklisted (id: 2075099676)
+    # *[shop=perfume]
+    # Rule Blacklisted (id: 2075099676)
 
-        # *[amenity=exercise_point]
+    # *[amenity=exercise_point]
+    def _relation_rule_69(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -10466,16 +11374,17 @@ class Josm_deprecated(PluginMapCSS):
                     'amenity'])
                 }})
 
-        # *[shop=auto_parts]
-        # Rule Blacklisted (id: 1675828779)
+    # *[shop=auto_parts]
+    # Rule Blacklisted (id: 1675828779)
 
-        # *[amenity=car_repair]
-        # Rule Blacklisted (id: 1681273585)
+    # *[amenity=car_repair]
+    # Rule Blacklisted (id: 1681273585)
 
-        # *[amenity=studio][type=audio]
-        # *[amenity=studio][type=radio]
-        # *[amenity=studio][type=television]
-        # *[amenity=studio][type=video]
+    # *[amenity=studio][type=audio]
+    # *[amenity=studio][type=radio]
+    # *[amenity=studio][type=television]
+    # *[amenity=studio][type=video]
+    def _relation_rule_70(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'type' in keys):
             match = False
             if not match:
@@ -10506,10 +11415,11 @@ class Josm_deprecated(PluginMapCSS):
                     'type'])
                 }})
 
-        # *[power=cable_distribution_cabinet]
-        # Rule Blacklisted (id: 1007567078)
+    # *[power=cable_distribution_cabinet]
+    # Rule Blacklisted (id: 1007567078)
 
-        # *[power][location=kiosk]
+    # *[power][location=kiosk]
+    def _relation_rule_71(self, data, tags, members, keys, err, sets):
         if ('location' in keys and 'power' in keys):
             match = False
             if not match:
@@ -10530,7 +11440,8 @@ class Josm_deprecated(PluginMapCSS):
                     'location'])
                 }})
 
-        # *[man_made=well]
+    # *[man_made=well]
+    def _relation_rule_72(self, data, tags, members, keys, err, sets):
         if ('man_made' in keys):
             match = False
             if not match:
@@ -10544,37 +11455,38 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"man_made=water_well"
                 err.append({'class': 9002001, 'subclass': 1740864107, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=dog_bin]
-        # *[amenity=dog_waste_bin]
-        # Rule Blacklisted (id: 2091877281)
+    # *[amenity=dog_bin]
+    # *[amenity=dog_waste_bin]
+    # Rule Blacklisted (id: 2091877281)
 
-        # *[amenity=artwork]
-        # Rule Blacklisted (id: 728429076)
+    # *[amenity=artwork]
+    # Rule Blacklisted (id: 728429076)
 
-        # *[amenity=community_center]
-        # Rule Blacklisted (id: 690512681)
+    # *[amenity=community_center]
+    # Rule Blacklisted (id: 690512681)
 
-        # *[man_made=cut_line]
-        # Rule Blacklisted (id: 1008752382)
+    # *[man_made=cut_line]
+    # Rule Blacklisted (id: 1008752382)
 
-        # *[amenity=park]
-        # Rule Blacklisted (id: 2085280194)
+    # *[amenity=park]
+    # Rule Blacklisted (id: 2085280194)
 
-        # *[amenity=hotel]
-        # Rule Blacklisted (id: 1341786818)
+    # *[amenity=hotel]
+    # Rule Blacklisted (id: 1341786818)
 
-        # *[shop=window]
-        # *[shop=windows]
-        # Rule Blacklisted (id: 532391183)
+    # *[shop=window]
+    # *[shop=windows]
+    # Rule Blacklisted (id: 532391183)
 
-        # *[amenity=education]
-        # Rule Blacklisted (id: 796960259)
+    # *[amenity=education]
+    # Rule Blacklisted (id: 796960259)
 
-        # *[shop=gallery]
-        # Rule Blacklisted (id: 1319611546)
+    # *[shop=gallery]
+    # Rule Blacklisted (id: 1319611546)
 
-        # *[shop=gambling]
-        # *[leisure=gambling]
+    # *[shop=gambling]
+    # *[leisure=gambling]
+    def _relation_rule_73(self, data, tags, members, keys, err, sets):
         if ('leisure' in keys) or ('shop' in keys):
             match = False
             if not match:
@@ -10595,11 +11507,12 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=lottery"
                 err.append({'class': 9002001, 'subclass': 1955724853, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[office=real_estate]
-        # *[office=real_estate_agent]
-        # Rule Blacklisted (id: 2027311706)
+    # *[office=real_estate]
+    # *[office=real_estate_agent]
+    # Rule Blacklisted (id: 2027311706)
 
-        # *[shop=glass]
+    # *[shop=glass]
+    def _relation_rule_74(self, data, tags, members, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -10613,20 +11526,21 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=glaziery"
                 err.append({'class': 9002001, 'subclass': 712020531, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=proposed]
-        # *[amenity=disused]
-        # *[shop=disused]
-        # *[highway=abandoned]
-        # *[historic=abandoned]
-        # Rule Blacklisted (id: 847809313)
+    # *[amenity=proposed]
+    # *[amenity=disused]
+    # *[shop=disused]
+    # *[highway=abandoned]
+    # *[historic=abandoned]
+    # Rule Blacklisted (id: 847809313)
 
-        # *[amenity=swimming_pool]
-        # Rule Blacklisted (id: 2012807801)
+    # *[amenity=swimming_pool]
+    # Rule Blacklisted (id: 2012807801)
 
-        # *[amenity=sauna]
-        # Rule Blacklisted (id: 1450116742)
+    # *[amenity=sauna]
+    # Rule Blacklisted (id: 1450116742)
 
-        # *[/^[^t][^i][^g].+_[0-9]$/][!/^note_[0-9]$/][!/^description_[0-9]$/]
+    # *[/^[^t][^i][^g].+_[0-9]$/][!/^note_[0-9]$/][!/^description_[0-9]$/]
+    def _relation_rule_75(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -10638,7 +11552,8 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0}","{0.key}")
                 err.append({'class': 9002014, 'subclass': 2081989305, 'text': mapcss.tr('{0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[sport=skating]
+    # *[sport=skating]
+    def _relation_rule_76(self, data, tags, members, keys, err, sets):
         if ('sport' in keys):
             match = False
             if not match:
@@ -10652,7 +11567,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"sport=roller_skating"
                 err.append({'class': 9002001, 'subclass': 170699177, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=public_building]
+    # *[amenity=public_building]
+    def _relation_rule_77(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -10672,10 +11588,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"office=government"
                 err.append({'class': 9002001, 'subclass': 1295642010, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[office=administrative]
-        # Rule Blacklisted (id: 213844674)
+    # *[office=administrative]
+    # Rule Blacklisted (id: 213844674)
 
-        # *[vending=news_papers]
+    # *[vending=news_papers]
+    def _relation_rule_78(self, data, tags, members, keys, err, sets):
         if ('vending' in keys):
             match = False
             if not match:
@@ -10692,7 +11609,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['vending','newspapers']])
                 }})
 
-        # *[service=drive_through]
+    # *[service=drive_through]
+    def _relation_rule_79(self, data, tags, members, keys, err, sets):
         if ('service' in keys):
             match = False
             if not match:
@@ -10709,7 +11627,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['service','drive-through']])
                 }})
 
-        # *[noexit][noexit!=yes][noexit!=no]
+    # *[noexit][noexit!=yes][noexit!=no]
+    def _relation_rule_80(self, data, tags, members, keys, err, sets):
         if ('noexit' in keys):
             match = False
             if not match:
@@ -10720,10 +11639,11 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("The key {0} has an uncommon value.","{1.key}")
                 err.append({'class': 9002017, 'subclass': 1357403556, 'text': mapcss.tr('The key {0} has an uncommon value.', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[name:botanical]
-        # Rule Blacklisted (id: 1061429000)
+    # *[name:botanical]
+    # Rule Blacklisted (id: 1061429000)
 
-        # area[landuse=pond]
+    # area[landuse=pond]
+    def _relation_rule_81(self, data, tags, members, keys, err, sets):
         if ('landuse' in keys and 'type' in keys):
             match = False
             if not match:
@@ -10745,9 +11665,10 @@ class Josm_deprecated(PluginMapCSS):
                     'landuse'])
                 }})
 
-        # *[shop=souvenir]
-        # *[shop=souvenirs]
-        # *[shop=souveniers]
+    # *[shop=souvenir]
+    # *[shop=souvenirs]
+    # *[shop=souveniers]
+    def _relation_rule_82(self, data, tags, members, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -10772,7 +11693,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','gift']])
                 }})
 
-        # *[vending=animal_food]
+    # *[vending=animal_food]
+    def _relation_rule_83(self, data, tags, members, keys, err, sets):
         if ('vending' in keys):
             match = False
             if not match:
@@ -10789,7 +11711,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['vending','animal_feed']])
                 }})
 
-        # area[area][area!=yes][area!=no]
+    # area[area][area!=yes][area!=no]
+    def _relation_rule_84(self, data, tags, members, keys, err, sets):
         if ('area' in keys and 'type' in keys):
             match = False
             if not match:
@@ -10802,8 +11725,9 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"area=yes"
                 err.append({'class': 9002019, 'subclass': 131196621, 'text': mapcss.tr('wrong value: {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=hunting_stand][lock=yes]
-        # *[amenity=hunting_stand][lock=no]
+    # *[amenity=hunting_stand][lock=yes]
+    # *[amenity=hunting_stand][lock=no]
+    def _relation_rule_85(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'lock' in keys):
             match = False
             if not match:
@@ -10826,17 +11750,18 @@ class Josm_deprecated(PluginMapCSS):
                     'lock'])
                 }})
 
-        # *[amenity=advertising][!advertising]
-        # Rule Blacklisted (id: 1696784412)
+    # *[amenity=advertising][!advertising]
+    # Rule Blacklisted (id: 1696784412)
 
-        # *[amenity=advertising][advertising]
-        # Rule Blacklisted (id: 1538706366)
+    # *[amenity=advertising][advertising]
+    # Rule Blacklisted (id: 1538706366)
 
-        # *[building=true]
-        # *[building="*"]
-        # *[building=Y]
-        # *[building=y]
-        # *[building=1]
+    # *[building=true]
+    # *[building="*"]
+    # *[building=Y]
+    # *[building=y]
+    # *[building=1]
+    def _relation_rule_86(self, data, tags, members, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -10869,16 +11794,17 @@ class Josm_deprecated(PluginMapCSS):
                     ['building','yes']])
                 }})
 
-        # *[building=abandoned]
-        # *[building=address]
-        # *[building=bing]
-        # *[building=collapsed]
-        # *[building=damaged]
-        # *[building=demolished]
-        # *[building=disused]
-        # *[building=fixme]
-        # *[building=occupied]
-        # *[building=razed]
+    # *[building=abandoned]
+    # *[building=address]
+    # *[building=bing]
+    # *[building=collapsed]
+    # *[building=damaged]
+    # *[building=demolished]
+    # *[building=disused]
+    # *[building=fixme]
+    # *[building=occupied]
+    # *[building=razed]
+    def _relation_rule_87(self, data, tags, members, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -10926,11 +11852,12 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is not a building type.","{0.tag}")
                 err.append({'class': 9002001, 'subclass': 938825828, 'text': mapcss.tr('{0} is not a building type.', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[building=other]
-        # *[building=unclassified]
-        # *[building=undefined]
-        # *[building=unknown]
-        # *[building=unidentified]
+    # *[building=other]
+    # *[building=unclassified]
+    # *[building=undefined]
+    # *[building=unknown]
+    # *[building=unidentified]
+    def _relation_rule_88(self, data, tags, members, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -10962,7 +11889,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['building','yes']])
                 }})
 
-        # relation[water=salt]
+    # relation[water=salt]
+    def _relation_rule_89(self, data, tags, members, keys, err, sets):
         if ('water' in keys):
             match = False
             if not match:
@@ -10976,7 +11904,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"salt=yes"
                 err.append({'class': 9002001, 'subclass': 1845964412, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=toilet]
+    # *[amenity=toilet]
+    def _relation_rule_90(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -10993,11 +11922,12 @@ class Josm_deprecated(PluginMapCSS):
                     ['amenity','toilets']])
                 }})
 
-        # *[man_made=MDF]
-        # *[man_made=telephone_exchange]
-        # Rule Blacklisted (id: 634698090)
+    # *[man_made=MDF]
+    # *[man_made=telephone_exchange]
+    # Rule Blacklisted (id: 634698090)
 
-        # *[building=central_office]
+    # *[building=central_office]
+    def _relation_rule_91(self, data, tags, members, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -11016,10 +11946,11 @@ class Josm_deprecated(PluginMapCSS):
                     ['telecom','exchange']])
                 }})
 
-        # *[telecom=central_office]
-        # Rule Blacklisted (id: 1503278830)
+    # *[telecom=central_office]
+    # Rule Blacklisted (id: 1503278830)
 
-        # *[natural=waterfall]
+    # *[natural=waterfall]
+    def _relation_rule_92(self, data, tags, members, keys, err, sets):
         if ('natural' in keys):
             match = False
             if not match:
@@ -11038,7 +11969,8 @@ class Josm_deprecated(PluginMapCSS):
                     'natural'])
                 }})
 
-        # *[religion=unitarian]
+    # *[religion=unitarian]
+    def _relation_rule_93(self, data, tags, members, keys, err, sets):
         if ('religion' in keys):
             match = False
             if not match:
@@ -11055,7 +11987,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['religion','unitarian_universalist']])
                 }})
 
-        # *[shop=shopping_centre]
+    # *[shop=shopping_centre]
+    def _relation_rule_94(self, data, tags, members, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -11072,7 +12005,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','mall']])
                 }})
 
-        # *[is_in]
+    # *[is_in]
+    def _relation_rule_95(self, data, tags, members, keys, err, sets):
         if ('is_in' in keys):
             match = False
             if not match:
@@ -11088,7 +12022,8 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[sport=football]
+    # *[sport=football]
+    def _relation_rule_96(self, data, tags, members, keys, err, sets):
         if ('sport' in keys):
             match = False
             if not match:
@@ -11107,7 +12042,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"sport=soccer"
                 err.append({'class': 9002001, 'subclass': 73038577, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[leisure=common]
+    # *[leisure=common]
+    def _relation_rule_97(self, data, tags, members, keys, err, sets):
         if ('leisure' in keys):
             match = False
             if not match:
@@ -11122,8 +12058,9 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"leisure=*"
                 err.append({'class': 9002001, 'subclass': 157636301, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[cuisine=vegan]
-        # *[cuisine=vegetarian]
+    # *[cuisine=vegan]
+    # *[cuisine=vegetarian]
+    def _relation_rule_98(self, data, tags, members, keys, err, sets):
         if ('cuisine' in keys):
             match = False
             if not match:
@@ -11141,7 +12078,8 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 err.append({'class': 9002001, 'subclass': 43604574, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[kitchen_hours]
+    # *[kitchen_hours]
+    def _relation_rule_99(self, data, tags, members, keys, err, sets):
         if ('kitchen_hours' in keys):
             match = False
             if not match:
@@ -11160,7 +12098,8 @@ class Josm_deprecated(PluginMapCSS):
                     'kitchen_hours'])
                 }})
 
-        # *[shop=money_transfer]
+    # *[shop=money_transfer]
+    def _relation_rule_100(self, data, tags, members, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -11179,7 +12118,8 @@ class Josm_deprecated(PluginMapCSS):
                     'shop'])
                 }})
 
-        # *[contact:google_plus]
+    # *[contact:google_plus]
+    def _relation_rule_101(self, data, tags, members, keys, err, sets):
         if ('contact:google_plus' in keys):
             match = False
             if not match:
@@ -11195,8 +12135,9 @@ class Josm_deprecated(PluginMapCSS):
                     'contact:google_plus'])
                 }})
 
-        # *[amenity=garages]
-        # *[amenity=garage]
+    # *[amenity=garages]
+    # *[amenity=garage]
+    def _relation_rule_102(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -11215,8 +12156,9 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"landuse=garages"
                 err.append({'class': 9002001, 'subclass': 863228118, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[shop=winery]
-        # *[amenity=winery]
+    # *[shop=winery]
+    # *[amenity=winery]
+    def _relation_rule_103(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys) or ('shop' in keys):
             match = False
             if not match:
@@ -11234,7 +12176,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=wine"
                 err.append({'class': 9002001, 'subclass': 1773574987, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=youth_centre]
+    # *[amenity=youth_centre]
+    def _relation_rule_104(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -11253,8 +12196,9 @@ class Josm_deprecated(PluginMapCSS):
                     ['community_centre','youth_centre']])
                 }})
 
-        # *[building:type][building=yes]
-        # *[building:type][!building]
+    # *[building:type][building=yes]
+    # *[building:type][!building]
+    def _relation_rule_105(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'building:type' in keys) or ('building:type' in keys):
             match = False
             if not match:
@@ -11277,7 +12221,8 @@ class Josm_deprecated(PluginMapCSS):
                     'building:type'])
                 }})
 
-        # *[building:type][building][building!=yes]
+    # *[building:type][building][building!=yes]
+    def _relation_rule_106(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'building:type' in keys):
             match = False
             if not match:
@@ -11290,19 +12235,20 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"building"
                 err.append({'class': 9002001, 'subclass': 1133239698, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[escalator]
-        # Rule Blacklisted (id: 967271828)
+    # *[escalator]
+    # Rule Blacklisted (id: 967271828)
 
-        # *[historic_name][!old_name]
-        # Rule Blacklisted (id: 1034538127)
+    # *[historic_name][!old_name]
+    # Rule Blacklisted (id: 1034538127)
 
-        # *[historic_name][old_name]
-        # Rule Blacklisted (id: 30762614)
+    # *[historic_name][old_name]
+    # Rule Blacklisted (id: 30762614)
 
-        # *[landuse=field]
-        # Rule Blacklisted (id: 426261497)
+    # *[landuse=field]
+    # Rule Blacklisted (id: 426261497)
 
-        # *[leisure=beach]
+    # *[leisure=beach]
+    def _relation_rule_107(self, data, tags, members, keys, err, sets):
         if ('leisure' in keys):
             match = False
             if not match:
@@ -11316,22 +12262,23 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=beach"
                 err.append({'class': 9002001, 'subclass': 1767286055, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[leisure=club]
-        # Rule Blacklisted (id: 1282397509)
+    # *[leisure=club]
+    # Rule Blacklisted (id: 1282397509)
 
-        # *[leisure=video_arcade]
-        # Rule Blacklisted (id: 1463909830)
+    # *[leisure=video_arcade]
+    # Rule Blacklisted (id: 1463909830)
 
-        # *[man_made=jetty]
-        # Rule Blacklisted (id: 192707176)
+    # *[man_made=jetty]
+    # Rule Blacklisted (id: 192707176)
 
-        # *[man_made=village_pump]
-        # Rule Blacklisted (id: 423232686)
+    # *[man_made=village_pump]
+    # Rule Blacklisted (id: 423232686)
 
-        # *[man_made=water_tank]
-        # Rule Blacklisted (id: 563629665)
+    # *[man_made=water_tank]
+    # Rule Blacklisted (id: 563629665)
 
-        # *[natural=moor]
+    # *[natural=moor]
+    def _relation_rule_108(self, data, tags, members, keys, err, sets):
         if ('natural' in keys):
             match = False
             if not match:
@@ -11350,16 +12297,17 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=wetland"
                 err.append({'class': 9002001, 'subclass': 374637717, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[noexit=no][!fixme]
-        # Rule Blacklisted (id: 647435126)
+    # *[noexit=no][!fixme]
+    # Rule Blacklisted (id: 647435126)
 
-        # *[noexit=no][fixme]
-        # Rule Blacklisted (id: 881828009)
+    # *[noexit=no][fixme]
+    # Rule Blacklisted (id: 881828009)
 
-        # *[shop=dive]
-        # Rule Blacklisted (id: 1582968978)
+    # *[shop=dive]
+    # Rule Blacklisted (id: 1582968978)
 
-        # *[shop=furnace]
+    # *[shop=furnace]
+    def _relation_rule_109(self, data, tags, members, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -11373,17 +12321,18 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"shop=fireplace"
                 err.append({'class': 9002001, 'subclass': 1155821104, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[sport=paragliding]
-        # Rule Blacklisted (id: 1531788430)
+    # *[sport=paragliding]
+    # Rule Blacklisted (id: 1531788430)
 
-        # *[tourism=bed_and_breakfast]
-        # Rule Blacklisted (id: 954237438)
+    # *[tourism=bed_and_breakfast]
+    # Rule Blacklisted (id: 954237438)
 
-        # *[diaper=yes]
-        # *[diaper=no]
-        # Rule Blacklisted (id: 1957125311)
+    # *[diaper=yes]
+    # *[diaper=no]
+    # Rule Blacklisted (id: 1957125311)
 
-        # *[diaper][diaper=~/^[1-9][0-9]*$/]
+    # *[diaper][diaper=~/^[1-9][0-9]*$/]
+    def _relation_rule_110(self, data, tags, members, keys, err, sets):
         if ('diaper' in keys):
             match = False
             if not match:
@@ -11397,7 +12346,7 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixAdd:"changing_table=yes"
                 # fixChangeKey:"diaper => changing_table:count"
-                set_diaper_checked = True
+                sets.add('diaper_checked')
                 err.append({'class': 9002001, 'subclass': 2105051472, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table','yes'],
@@ -11406,7 +12355,8 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper'])
                 }})
 
-        # *[diaper=room]
+    # *[diaper=room]
+    def _relation_rule_111(self, data, tags, members, keys, err, sets):
         if ('diaper' in keys):
             match = False
             if not match:
@@ -11419,13 +12369,14 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"changing_table=dedicated_room"
                 # suggestAlternative:"changing_table=room"
-                set_diaper_checked = True
+                sets.add('diaper_checked')
                 err.append({'class': 9002001, 'subclass': 883202329, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[diaper]!.diaper_checked
-        # Rule Blacklisted (id: 693675339)
+    # *[diaper]!.diaper_checked
+    # Rule Blacklisted (id: 693675339)
 
-        # *[diaper:male=yes]
+    # *[diaper:male=yes]
+    def _relation_rule_112(self, data, tags, members, keys, err, sets):
         if ('diaper:male' in keys):
             match = False
             if not match:
@@ -11439,7 +12390,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=male_toilet"
                 # fixAdd:"changing_table:location=male_toilet"
                 # fixRemove:"diaper:male"
-                set_diaper___checked = True
+                sets.add('diaper___checked')
                 err.append({'class': 9002001, 'subclass': 799035479, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table:location','male_toilet']]),
@@ -11447,7 +12398,8 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper:male'])
                 }})
 
-        # *[diaper:female=yes]
+    # *[diaper:female=yes]
+    def _relation_rule_113(self, data, tags, members, keys, err, sets):
         if ('diaper:female' in keys):
             match = False
             if not match:
@@ -11461,7 +12413,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=female_toilet"
                 # fixAdd:"changing_table:location=female_toilet"
                 # fixRemove:"diaper:female"
-                set_diaper___checked = True
+                sets.add('diaper___checked')
                 err.append({'class': 9002001, 'subclass': 1450901137, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table:location','female_toilet']]),
@@ -11469,7 +12421,8 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper:female'])
                 }})
 
-        # *[diaper:unisex=yes]
+    # *[diaper:unisex=yes]
+    def _relation_rule_114(self, data, tags, members, keys, err, sets):
         if ('diaper:unisex' in keys):
             match = False
             if not match:
@@ -11483,7 +12436,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:location=unisex_toilet"
                 # fixAdd:"changing_table:location=unisex_toilet"
                 # fixRemove:"diaper:unisex"
-                set_diaper___checked = True
+                sets.add('diaper___checked')
                 err.append({'class': 9002001, 'subclass': 1460378712, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table:location','unisex_toilet']]),
@@ -11491,8 +12444,9 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper:unisex'])
                 }})
 
-        # *[diaper:wheelchair=yes]
-        # *[diaper:wheelchair=no]
+    # *[diaper:wheelchair=yes]
+    # *[diaper:wheelchair=no]
+    def _relation_rule_115(self, data, tags, members, keys, err, sets):
         if ('diaper:wheelchair' in keys):
             match = False
             if not match:
@@ -11509,7 +12463,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("changing_table:wheelchair=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"diaper:wheelchair => changing_table:wheelchair"
-                set_diaper___checked = True
+                sets.add('diaper___checked')
                 err.append({'class': 9002001, 'subclass': 1951967281, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table:wheelchair', mapcss.tag(tags, 'diaper:wheelchair')]]),
@@ -11517,8 +12471,9 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper:wheelchair'])
                 }})
 
-        # *[diaper:fee=yes]
-        # *[diaper:fee=no]
+    # *[diaper:fee=yes]
+    # *[diaper:fee=no]
+    def _relation_rule_116(self, data, tags, members, keys, err, sets):
         if ('diaper:fee' in keys):
             match = False
             if not match:
@@ -11535,7 +12490,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("changing_table:fee=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"diaper:fee => changing_table:fee"
-                set_diaper___checked = True
+                sets.add('diaper___checked')
                 err.append({'class': 9002001, 'subclass': 2008573526, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['changing_table:fee', mapcss.tag(tags, 'diaper:fee')]]),
@@ -11543,12 +12498,13 @@ class Josm_deprecated(PluginMapCSS):
                     'diaper:fee'])
                 }})
 
-        # *[/^diaper:/]!.diaper___checked
+    # *[/^diaper:/]!.diaper___checked
+    def _relation_rule_117(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_diaper___checked) and (mapcss._tag_capture(capture_tags, 0, tags, self.re_6029fe03)))
+                try: match = (('diaper___checked' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, self.re_6029fe03)))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("deprecated tagging")
@@ -11556,7 +12512,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table:*"
                 err.append({'class': 9002001, 'subclass': 26578864, 'text': mapcss.tr('{0} is deprecated', 'diaper:*')})
 
-        # *[changing_table][changing_table!~/^(yes|no|limited)$/]
+    # *[changing_table][changing_table!~/^(yes|no|limited)$/]
+    def _relation_rule_118(self, data, tags, members, keys, err, sets):
         if ('changing_table' in keys):
             match = False
             if not match:
@@ -11570,7 +12527,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"changing_table=yes"
                 err.append({'class': 9002019, 'subclass': 1965225408, 'text': mapcss.tr('wrong value: {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[roof:shape=half_hipped]
+    # *[roof:shape=half_hipped]
+    def _relation_rule_119(self, data, tags, members, keys, err, sets):
         if ('roof:shape' in keys):
             match = False
             if not match:
@@ -11587,7 +12545,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['roof:shape','half-hipped']])
                 }})
 
-        # *[bridge_name]
+    # *[bridge_name]
+    def _relation_rule_120(self, data, tags, members, keys, err, sets):
         if ('bridge_name' in keys):
             match = False
             if not match:
@@ -11606,10 +12565,11 @@ class Josm_deprecated(PluginMapCSS):
                     'bridge_name'])
                 }})
 
-        # *[access=public]
-        # Rule Blacklisted (id: 1115157097)
+    # *[access=public]
+    # Rule Blacklisted (id: 1115157097)
 
-        # *[crossing=island]
+    # *[crossing=island]
+    def _relation_rule_121(self, data, tags, members, keys, err, sets):
         if ('crossing' in keys):
             match = False
             if not match:
@@ -11629,7 +12589,8 @@ class Josm_deprecated(PluginMapCSS):
                     'crossing'])
                 }})
 
-        # *[recycling:metal]
+    # *[recycling:metal]
+    def _relation_rule_122(self, data, tags, members, keys, err, sets):
         if ('recycling:metal' in keys):
             match = False
             if not match:
@@ -11648,7 +12609,8 @@ class Josm_deprecated(PluginMapCSS):
                     'recycling:metal'])
                 }})
 
-        # *[shop=dog_grooming]
+    # *[shop=dog_grooming]
+    def _relation_rule_123(self, data, tags, members, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -11665,8 +12627,9 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','pet_grooming']])
                 }})
 
-        # *[tower:type=anchor]
-        # *[tower:type=suspension]
+    # *[tower:type=anchor]
+    # *[tower:type=suspension]
+    def _relation_rule_124(self, data, tags, members, keys, err, sets):
         if ('tower:type' in keys):
             match = False
             if not match:
@@ -11683,7 +12646,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:concat("line_attachment=","{0.value}")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # fixChangeKey:"tower:type => line_attachment"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 180380605, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_attachment', mapcss.tag(tags, 'tower:type')]]),
@@ -11691,8 +12654,9 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=branch][branch:type=split]
-        # *[tower:type=branch][branch:type=loop]
+    # *[tower:type=branch][branch:type=split]
+    # *[tower:type=branch][branch:type=loop]
+    def _relation_rule_125(self, data, tags, members, keys, err, sets):
         if ('branch:type' in keys and 'tower:type' in keys):
             match = False
             if not match:
@@ -11711,7 +12675,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=split"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 362350862, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','split']]),
@@ -11720,8 +12684,9 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=branch][!branch:type]
-        # *[tower:type=branch][branch:type=tap]
+    # *[tower:type=branch][!branch:type]
+    # *[tower:type=branch][branch:type=tap]
+    def _relation_rule_126(self, data, tags, members, keys, err, sets):
         if ('branch:type' in keys and 'tower:type' in keys) or ('tower:type' in keys):
             match = False
             if not match:
@@ -11740,7 +12705,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=branch"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 476423517, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','branch']]),
@@ -11749,7 +12714,8 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=branch][branch:type=cross]
+    # *[tower:type=branch][branch:type=cross]
+    def _relation_rule_127(self, data, tags, members, keys, err, sets):
         if ('branch:type' in keys and 'tower:type' in keys):
             match = False
             if not match:
@@ -11764,7 +12730,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixRemove:"branch:type"
                 # fixAdd:"line_management=cross"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 2103059531, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','cross']]),
@@ -11773,7 +12739,8 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=termination]
+    # *[tower:type=termination]
+    def _relation_rule_128(self, data, tags, members, keys, err, sets):
         if ('tower:type' in keys):
             match = False
             if not match:
@@ -11787,7 +12754,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management=termination"
                 # fixAdd:"line_management=termination"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 232235847, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','termination']]),
@@ -11795,7 +12762,8 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=transition]
+    # *[tower:type=transition]
+    def _relation_rule_129(self, data, tags, members, keys, err, sets):
         if ('tower:type' in keys):
             match = False
             if not match:
@@ -11809,7 +12777,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"location:transition=yes"
                 # fixAdd:"location:transition=yes"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 1124904944, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['location:transition','yes']]),
@@ -11817,7 +12785,8 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=transposing]
+    # *[tower:type=transposing]
+    def _relation_rule_130(self, data, tags, members, keys, err, sets):
         if ('tower:type' in keys):
             match = False
             if not match:
@@ -11831,7 +12800,7 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management=transpose"
                 # fixAdd:"line_management=transpose"
                 # fixRemove:"tower:type"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 1795169098, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['line_management','transpose']]),
@@ -11839,7 +12808,8 @@ class Josm_deprecated(PluginMapCSS):
                     'tower:type'])
                 }})
 
-        # *[tower:type=crossing]
+    # *[tower:type=crossing]
+    def _relation_rule_131(self, data, tags, members, keys, err, sets):
         if ('tower:type' in keys):
             match = False
             if not match:
@@ -11851,15 +12821,16 @@ class Josm_deprecated(PluginMapCSS):
                 # group:tr("deprecated tagging")
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"height=* + design=*"
-                set_power_tower_type_warning = True
+                sets.add('power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 1301565974, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[tower:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_tower_type_warning
+    # *[tower:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_tower_type_warning
+    def _relation_rule_132(self, data, tags, members, keys, err, sets):
         if ('power' in keys and 'tower:type' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_power_tower_type_warning) and (mapcss._tag_capture(capture_tags, 0, tags, 'tower:type')) and (mapcss._tag_capture(capture_tags, 1, tags, 'power')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_24dfeb95), mapcss._tag_capture(capture_tags, 2, tags, 'power'))))
+                try: match = (('power_tower_type_warning' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'tower:type')) and (mapcss._tag_capture(capture_tags, 1, tags, 'power')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_24dfeb95), mapcss._tag_capture(capture_tags, 2, tags, 'power'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set generic_power_tower_type_warning
@@ -11870,15 +12841,16 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_attachment"
                 # suggestAlternative:"line_management"
                 # suggestAlternative:"structure"
-                set_generic_power_tower_type_warning = True
+                sets.add('generic_power_tower_type_warning')
                 err.append({'class': 9002001, 'subclass': 2020421267, 'text': mapcss.tr('{0} is deprecated for {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[pole:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_pole_type_warning!.generic_power_tower_type_warning
+    # *[pole:type][power][power=~/^(tower|pole|insulator|portal|terminal)$/]!.power_pole_type_warning!.generic_power_tower_type_warning
+    def _relation_rule_133(self, data, tags, members, keys, err, sets):
         if ('pole:type' in keys and 'power' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_power_pole_type_warning) and (not set_generic_power_tower_type_warning) and (mapcss._tag_capture(capture_tags, 0, tags, 'pole:type')) and (mapcss._tag_capture(capture_tags, 1, tags, 'power')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_24dfeb95), mapcss._tag_capture(capture_tags, 2, tags, 'power'))))
+                try: match = (('power_pole_type_warning' not in sets) and ('generic_power_tower_type_warning' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'pole:type')) and (mapcss._tag_capture(capture_tags, 1, tags, 'power')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 2, self.re_24dfeb95), mapcss._tag_capture(capture_tags, 2, tags, 'power'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("deprecated tagging")
@@ -11888,8 +12860,9 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"line_management"
                 err.append({'class': 9002001, 'subclass': 1513543887, 'text': mapcss.tr('{0} is deprecated for {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[sloped_curb=yes][!kerb]
-        # *[sloped_curb=both][!kerb]
+    # *[sloped_curb=yes][!kerb]
+    # *[sloped_curb=both][!kerb]
+    def _relation_rule_134(self, data, tags, members, keys, err, sets):
         if ('sloped_curb' in keys):
             match = False
             if not match:
@@ -11913,7 +12886,8 @@ class Josm_deprecated(PluginMapCSS):
                     'sloped_curb'])
                 }})
 
-        # *[sloped_curb=no][!kerb]
+    # *[sloped_curb=no][!kerb]
+    def _relation_rule_135(self, data, tags, members, keys, err, sets):
         if ('sloped_curb' in keys):
             match = False
             if not match:
@@ -11933,8 +12907,9 @@ class Josm_deprecated(PluginMapCSS):
                     'sloped_curb'])
                 }})
 
-        # *[sloped_curb][sloped_curb!~/^(yes|both|no)$/][!kerb]
-        # *[sloped_curb][kerb]
+    # *[sloped_curb][sloped_curb!~/^(yes|both|no)$/][!kerb]
+    # *[sloped_curb][kerb]
+    def _relation_rule_136(self, data, tags, members, keys, err, sets):
         if ('kerb' in keys and 'sloped_curb' in keys) or ('sloped_curb' in keys):
             match = False
             if not match:
@@ -11951,7 +12926,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"kerb=*"
                 err.append({'class': 9002001, 'subclass': 1682376745, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[unnamed=yes]
+    # *[unnamed=yes]
+    def _relation_rule_137(self, data, tags, members, keys, err, sets):
         if ('unnamed' in keys):
             match = False
             if not match:
@@ -11970,7 +12946,8 @@ class Josm_deprecated(PluginMapCSS):
                     'unnamed'])
                 }})
 
-        # *[building:height]
+    # *[building:height]
+    def _relation_rule_138(self, data, tags, members, keys, err, sets):
         if ('building:height' in keys):
             match = False
             if not match:
@@ -11989,7 +12966,8 @@ class Josm_deprecated(PluginMapCSS):
                     'building:height'])
                 }})
 
-        # *[building:min_height]
+    # *[building:min_height]
+    def _relation_rule_139(self, data, tags, members, keys, err, sets):
         if ('building:min_height' in keys):
             match = False
             if not match:
@@ -12008,11 +12986,12 @@ class Josm_deprecated(PluginMapCSS):
                     'building:min_height'])
                 }})
 
-        # *[car]
-        # Rule Blacklisted (id: 297159061)
+    # *[car]
+    # Rule Blacklisted (id: 297159061)
 
-        # *[navigationaid=approach_light]
-        # *[navigationaid="ALS (Approach lighting system)"]
+    # *[navigationaid=approach_light]
+    # *[navigationaid="ALS (Approach lighting system)"]
+    def _relation_rule_140(self, data, tags, members, keys, err, sets):
         if ('navigationaid' in keys):
             match = False
             if not match:
@@ -12033,7 +13012,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['navigationaid','als']])
                 }})
 
-        # *[water=riverbank][!natural]
+    # *[water=riverbank][!natural]
+    def _relation_rule_141(self, data, tags, members, keys, err, sets):
         if ('water' in keys):
             match = False
             if not match:
@@ -12052,7 +13032,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['water','river']])
                 }})
 
-        # *[water=riverbank][natural]
+    # *[water=riverbank][natural]
+    def _relation_rule_142(self, data, tags, members, keys, err, sets):
         if ('natural' in keys and 'water' in keys):
             match = False
             if not match:
@@ -12065,10 +13046,11 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=water + water=river"
                 err.append({'class': 9002001, 'subclass': 630806094, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[waterway=riverbank][!natural][!water]
-        # *[waterway=riverbank][natural=water][!water]
-        # *[waterway=riverbank][!natural][water=river]
-        # *[waterway=riverbank][natural=water][water=river]
+    # *[waterway=riverbank][!natural][!water]
+    # *[waterway=riverbank][natural=water][!water]
+    # *[waterway=riverbank][!natural][water=river]
+    # *[waterway=riverbank][natural=water][water=river]
+    def _relation_rule_143(self, data, tags, members, keys, err, sets):
         if ('natural' in keys and 'water' in keys and 'waterway' in keys) or ('natural' in keys and 'waterway' in keys) or ('water' in keys and 'waterway' in keys) or ('waterway' in keys):
             match = False
             if not match:
@@ -12102,8 +13084,9 @@ class Josm_deprecated(PluginMapCSS):
                     'waterway'])
                 }})
 
-        # *[waterway=riverbank][natural][natural!=water]
-        # *[waterway=riverbank][water][water!=river]
+    # *[waterway=riverbank][natural][natural!=water]
+    # *[waterway=riverbank][water][water!=river]
+    def _relation_rule_144(self, data, tags, members, keys, err, sets):
         if ('natural' in keys and 'waterway' in keys) or ('water' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -12120,7 +13103,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=water + water=river"
                 err.append({'class': 9002001, 'subclass': 301661430, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[shop=lamps]
+    # *[shop=lamps]
+    def _relation_rule_145(self, data, tags, members, keys, err, sets):
         if ('shop' in keys):
             match = False
             if not match:
@@ -12137,7 +13121,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['shop','lighting']])
                 }})
 
-        # *[access=customer]
+    # *[access=customer]
+    def _relation_rule_146(self, data, tags, members, keys, err, sets):
         if ('access' in keys):
             match = False
             if not match:
@@ -12154,7 +13139,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['access','customers']])
                 }})
 
-        # *[addr:inclusion=estimated]
+    # *[addr:inclusion=estimated]
+    def _relation_rule_147(self, data, tags, members, keys, err, sets):
         if ('addr:inclusion' in keys):
             match = False
             if not match:
@@ -12171,7 +13157,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['addr:inclusion','estimate']])
                 }})
 
-        # *[building=apartment]
+    # *[building=apartment]
+    def _relation_rule_148(self, data, tags, members, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -12188,7 +13175,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['building','apartments']])
                 }})
 
-        # *[generator:type=solar_photovoltaic_panels]
+    # *[generator:type=solar_photovoltaic_panels]
+    def _relation_rule_149(self, data, tags, members, keys, err, sets):
         if ('generator:type' in keys):
             match = False
             if not match:
@@ -12205,7 +13193,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['generator:type','solar_photovoltaic_panel']])
                 }})
 
-        # *[building=part]
+    # *[building=part]
+    def _relation_rule_150(self, data, tags, members, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -12218,7 +13207,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"building:part=yes"
                 err.append({'class': 9002001, 'subclass': 455695847, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[natural=sink_hole]
+    # *[natural=sink_hole]
+    def _relation_rule_151(self, data, tags, members, keys, err, sets):
         if ('natural' in keys):
             match = False
             if not match:
@@ -12235,7 +13225,8 @@ class Josm_deprecated(PluginMapCSS):
                     ['natural','sinkhole']])
                 }})
 
-        # *[climbing:grade:UIAA:min]
+    # *[climbing:grade:UIAA:min]
+    def _relation_rule_152(self, data, tags, members, keys, err, sets):
         if ('climbing:grade:UIAA:min' in keys):
             match = False
             if not match:
@@ -12254,7 +13245,8 @@ class Josm_deprecated(PluginMapCSS):
                     'climbing:grade:UIAA:min'])
                 }})
 
-        # *[climbing:grade:UIAA:max]
+    # *[climbing:grade:UIAA:max]
+    def _relation_rule_153(self, data, tags, members, keys, err, sets):
         if ('climbing:grade:UIAA:max' in keys):
             match = False
             if not match:
@@ -12273,7 +13265,8 @@ class Josm_deprecated(PluginMapCSS):
                     'climbing:grade:UIAA:max'])
                 }})
 
-        # *[climbing:grade:UIAA:mean]
+    # *[climbing:grade:UIAA:mean]
+    def _relation_rule_154(self, data, tags, members, keys, err, sets):
         if ('climbing:grade:UIAA:mean' in keys):
             match = False
             if not match:
@@ -12292,7 +13285,8 @@ class Josm_deprecated(PluginMapCSS):
                     'climbing:grade:UIAA:mean'])
                 }})
 
-        # *[climbing:grade:UIAA]
+    # *[climbing:grade:UIAA]
+    def _relation_rule_155(self, data, tags, members, keys, err, sets):
         if ('climbing:grade:UIAA' in keys):
             match = False
             if not match:
@@ -12311,7 +13305,8 @@ class Josm_deprecated(PluginMapCSS):
                     'climbing:grade:UIAA'])
                 }})
 
-        # *[cuisine][cuisine=~/^(?i)(bbq)$/]
+    # *[cuisine][cuisine=~/^(?i)(bbq)$/]
+    def _relation_rule_156(self, data, tags, members, keys, err, sets):
         if ('cuisine' in keys):
             match = False
             if not match:
@@ -12324,13 +13319,14 @@ class Josm_deprecated(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"cuisine=barbecue"
                 # fixAdd:"cuisine=barbecue"
-                set_bbq_autofix = True
+                sets.add('bbq_autofix')
                 err.append({'class': 9002001, 'subclass': 1943338875, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['cuisine','barbecue']])
                 }})
 
-        # *[cuisine=~/(?i)(;bbq|bbq;)/][cuisine!~/(?i)(_bbq)/]
+    # *[cuisine=~/(?i)(;bbq|bbq;)/][cuisine!~/(?i)(_bbq)/]
+    def _relation_rule_157(self, data, tags, members, keys, err, sets):
         if ('cuisine' in keys):
             match = False
             if not match:
@@ -12343,7 +13339,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"cuisine=barbecue"
                 err.append({'class': 9002001, 'subclass': 1958782130, 'text': mapcss.tr('{0} is deprecated', 'cuisine=bbq')})
 
-        # *[Fixme]
+    # *[Fixme]
+    def _relation_rule_158(self, data, tags, members, keys, err, sets):
         if ('Fixme' in keys):
             match = False
             if not match:
@@ -12362,10 +13359,11 @@ class Josm_deprecated(PluginMapCSS):
                     'Fixme'])
                 }})
 
-        # *[amenity=embassy]
-        # Rule Blacklisted (id: 1751915206)
+    # *[amenity=embassy]
+    # Rule Blacklisted (id: 1751915206)
 
-        # *[service:bicycle:chaintool]
+    # *[service:bicycle:chaintool]
+    def _relation_rule_159(self, data, tags, members, keys, err, sets):
         if ('service:bicycle:chaintool' in keys):
             match = False
             if not match:
@@ -12384,7 +13382,8 @@ class Josm_deprecated(PluginMapCSS):
                     'service:bicycle:chaintool'])
                 }})
 
-        # *[building:roof:shape]
+    # *[building:roof:shape]
+    def _relation_rule_160(self, data, tags, members, keys, err, sets):
         if ('building:roof:shape' in keys):
             match = False
             if not match:
@@ -12403,7 +13402,8 @@ class Josm_deprecated(PluginMapCSS):
                     'building:roof:shape'])
                 }})
 
-        # *[man_made=pumping_rig][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    # *[man_made=pumping_rig][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    def _relation_rule_161(self, data, tags, members, keys, err, sets):
         if ('man_made' in keys):
             match = False
             if not match:
@@ -12419,7 +13419,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"mechanical_coupling=nodding_donkey"
                 # fixAdd:"mechanical_driver=combustion_engine"
                 # fixAdd:"pump_mechanism=piston"
-                set_pumping_ring_no_mech = True
+                sets.add('pumping_ring_no_mech')
                 err.append({'class': 9002001, 'subclass': 6568074, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['mechanical_coupling','nodding_donkey'],
@@ -12427,12 +13427,13 @@ class Josm_deprecated(PluginMapCSS):
                     ['pump_mechanism','piston']])
                 }})
 
-        # *[man_made=pumping_rig]!.pumping_ring_no_mech
+    # *[man_made=pumping_rig]!.pumping_ring_no_mech
+    def _relation_rule_162(self, data, tags, members, keys, err, sets):
         if ('man_made' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_pumping_ring_no_mech) and (mapcss._tag_capture(capture_tags, 0, tags, 'man_made') == mapcss._value_capture(capture_tags, 0, 'pumping_rig')))
+                try: match = (('pumping_ring_no_mech' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'man_made') == mapcss._value_capture(capture_tags, 0, 'pumping_rig')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("deprecated tagging")
@@ -12441,7 +13442,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"man_made=water_well"
                 err.append({'class': 9002001, 'subclass': 1031026578, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[pump:type=beam_pump][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    # *[pump:type=beam_pump][!pump_mechanism][!mechanical_driver][!mechanical_coupling]
+    def _relation_rule_163(self, data, tags, members, keys, err, sets):
         if ('pump:type' in keys):
             match = False
             if not match:
@@ -12457,7 +13459,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"mechanical_driver=combustion_engine"
                 # fixRemove:"pump:type"
                 # fixAdd:"pump_mechanism=piston"
-                set_beam_pump_no_mech = True
+                sets.add('beam_pump_no_mech')
                 err.append({'class': 9002001, 'subclass': 1519103279, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['mechanical_coupling','nodding_donkey'],
@@ -12467,12 +13469,13 @@ class Josm_deprecated(PluginMapCSS):
                     'pump:type'])
                 }})
 
-        # *[pump:type]!.beam_pump_no_mech
+    # *[pump:type]!.beam_pump_no_mech
+    def _relation_rule_164(self, data, tags, members, keys, err, sets):
         if ('pump:type' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_beam_pump_no_mech) and (mapcss._tag_capture(capture_tags, 0, tags, 'pump:type')))
+                try: match = (('beam_pump_no_mech' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'pump:type')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("deprecated tagging")
@@ -12480,7 +13483,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"pump_mechanism"
                 err.append({'class': 9002001, 'subclass': 2015679777, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[substance=heat]
+    # *[substance=heat]
+    def _relation_rule_165(self, data, tags, members, keys, err, sets):
         if ('substance' in keys):
             match = False
             if not match:
@@ -12494,7 +13498,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"substance=steam"
                 err.append({'class': 9002001, 'subclass': 1528467304, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[landuse=school]
+    # *[landuse=school]
+    def _relation_rule_166(self, data, tags, members, keys, err, sets):
         if ('landuse' in keys):
             match = False
             if not match:
@@ -12510,11 +13515,12 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"landuse=education"
                 err.append({'class': 9002001, 'subclass': 817812278, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[amenity=vending_machine][vending=parcel_mail_in]
-        # *[amenity=vending_machine][vending=parcel_pickup]
-        # Rule Blacklisted (id: 1305128315)
+    # *[amenity=vending_machine][vending=parcel_mail_in]
+    # *[amenity=vending_machine][vending=parcel_pickup]
+    # Rule Blacklisted (id: 1305128315)
 
-        # *[amenity=vending_machine][vending][vending~=parcel_mail_in][vending~=parcel_pickup][count(uniq_list(split(";",tag("vending"))))==2]
+    # *[amenity=vending_machine][vending][vending~=parcel_mail_in][vending~=parcel_pickup][count(uniq_list(split(";",tag("vending"))))==2]
+    def _relation_rule_167(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'vending' in keys):
             match = False
             if not match:
@@ -12530,7 +13536,7 @@ class Josm_deprecated(PluginMapCSS):
                 # fixAdd:"parcel_mail_in=yes"
                 # fixAdd:"parcel_pickup=yes"
                 # fixRemove:"vending"
-                set_parcel_fixable = True
+                sets.add('parcel_fixable')
                 err.append({'class': 9002001, 'subclass': 954921281, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{1.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['amenity','parcel_locker'],
@@ -12540,17 +13546,18 @@ class Josm_deprecated(PluginMapCSS):
                     'vending'])
                 }})
 
-        # *[amenity=vending_machine][vending~=parcel_mail_in]!.parcel_fixable
-        # *[amenity=vending_machine][vending~=parcel_pickup]!.parcel_fixable
+    # *[amenity=vending_machine][vending~=parcel_mail_in]!.parcel_fixable
+    # *[amenity=vending_machine][vending~=parcel_pickup]!.parcel_fixable
+    def _relation_rule_168(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'vending' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_parcel_fixable) and (mapcss._tag_capture(capture_tags, 0, tags, 'amenity') == mapcss._value_capture(capture_tags, 0, 'vending_machine')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'vending'), mapcss._value_capture(capture_tags, 1, 'parcel_mail_in'))))
+                try: match = (('parcel_fixable' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'amenity') == mapcss._value_capture(capture_tags, 0, 'vending_machine')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'vending'), mapcss._value_capture(capture_tags, 1, 'parcel_mail_in'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_parcel_fixable) and (mapcss._tag_capture(capture_tags, 0, tags, 'amenity') == mapcss._value_capture(capture_tags, 0, 'vending_machine')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'vending'), mapcss._value_capture(capture_tags, 1, 'parcel_pickup'))))
+                try: match = (('parcel_fixable' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'amenity') == mapcss._value_capture(capture_tags, 0, 'vending_machine')) and (mapcss.list_contains(mapcss._tag_capture(capture_tags, 1, tags, 'vending'), mapcss._value_capture(capture_tags, 1, 'parcel_pickup'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("deprecated tagging")
@@ -12558,7 +13565,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"amenity=parcel_locker + {1.value}=yes"
                 err.append({'class': 9002001, 'subclass': 424486726, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[surface=decoturf]
+    # *[surface=decoturf]
+    def _relation_rule_169(self, data, tags, members, keys, err, sets):
         if ('surface' in keys):
             match = False
             if not match:
@@ -12575,10 +13583,11 @@ class Josm_deprecated(PluginMapCSS):
                     ['surface','acrylic']])
                 }})
 
-        # *[role]
-        # Rule Blacklisted (id: 2041296832)
+    # *[role]
+    # Rule Blacklisted (id: 2041296832)
 
-        # *[school=entrance]
+    # *[school=entrance]
+    def _relation_rule_170(self, data, tags, members, keys, err, sets):
         if ('school' in keys):
             match = False
             if not match:
@@ -12592,8 +13601,9 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"entrance=yes"
                 err.append({'class': 9002001, 'subclass': 1398581809, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[voltage-high]
-        # *[voltage-low]
+    # *[voltage-high]
+    # *[voltage-low]
+    def _relation_rule_171(self, data, tags, members, keys, err, sets):
         if ('voltage-high' in keys) or ('voltage-low' in keys):
             match = False
             if not match:
@@ -12611,7 +13621,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"voltage:secondary"
                 err.append({'class': 9002001, 'subclass': 1379077827, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[toilet][!toilets]
+    # *[toilet][!toilets]
+    def _relation_rule_172(self, data, tags, members, keys, err, sets):
         if ('toilet' in keys):
             match = False
             if not match:
@@ -12630,7 +13641,8 @@ class Josm_deprecated(PluginMapCSS):
                     'toilet'])
                 }})
 
-        # *[toilet][toilets]
+    # *[toilet][toilets]
+    def _relation_rule_173(self, data, tags, members, keys, err, sets):
         if ('toilet' in keys and 'toilets' in keys):
             match = False
             if not match:
@@ -12643,7 +13655,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"toilets"
                 err.append({'class': 9002001, 'subclass': 1092230744, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[type="turnlanes:turns"]
+    # *[type="turnlanes:turns"]
+    def _relation_rule_174(self, data, tags, members, keys, err, sets):
         if ('type' in keys):
             match = False
             if not match:
@@ -12656,7 +13669,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"type=connectivity"
                 err.append({'class': 9002001, 'subclass': 1789083769, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[image][image=~/^https:\/\/westnordost.de\/p\//]
+    # *[image][image=~/^https:\/\/westnordost.de\/p\//]
+    def _relation_rule_175(self, data, tags, members, keys, err, sets):
         if ('image' in keys):
             match = False
             if not match:
@@ -12671,23 +13685,24 @@ class Josm_deprecated(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[historic=archaeological_site][site_type]
-        # Rule Blacklisted (id: 595008939)
+    # *[historic=archaeological_site][site_type]
+    # Rule Blacklisted (id: 595008939)
 
-        # area[parking:orientation][!orientation]
-        # Rule Blacklisted (id: 1600840641)
+    # area[parking:orientation][!orientation]
+    # Rule Blacklisted (id: 1600840641)
 
-        # area[parking:orientation][orientation]["parking:orientation"=*orientation]
-        # Rule Blacklisted (id: 145760951)
+    # area[parking:orientation][orientation]["parking:orientation"=*orientation]
+    # Rule Blacklisted (id: 145760951)
 
-        # area[parking:orientation][orientation]["parking:orientation"!=*orientation]
-        # Rule Blacklisted (id: 488242503)
+    # area[parking:orientation][orientation]["parking:orientation"!=*orientation]
+    # Rule Blacklisted (id: 488242503)
 
-        # *[gnis:id][!gnis:feature_id]
-        # *[tiger:PLACENS][!gnis:feature_id]
-        # *[NHD:GNIS_ID][!gnis:feature_id]
-        # *[nhd:gnis_id][!gnis:feature_id]
-        # *[ref:gnis][!gnis:feature_id]
+    # *[gnis:id][!gnis:feature_id]
+    # *[tiger:PLACENS][!gnis:feature_id]
+    # *[NHD:GNIS_ID][!gnis:feature_id]
+    # *[nhd:gnis_id][!gnis:feature_id]
+    # *[ref:gnis][!gnis:feature_id]
+    def _relation_rule_176(self, data, tags, members, keys, err, sets):
         if ('NHD:GNIS_ID' in keys) or ('gnis:id' in keys) or ('nhd:gnis_id' in keys) or ('ref:gnis' in keys) or ('tiger:PLACENS' in keys):
             match = False
             if not match:
@@ -12722,11 +13737,12 @@ class Josm_deprecated(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{0.key} => {1.key}')).split('=>', 1)[0].strip()])
                 }})
 
-        # *[gnis:id][gnis:feature_id]
-        # *[tiger:PLACENS][gnis:feature_id]
-        # *[NHD:GNIS_ID][gnis:feature_id]
-        # *[nhd:gnis_id][gnis:feature_id]
-        # *[ref:gnis][gnis:feature_id]
+    # *[gnis:id][gnis:feature_id]
+    # *[tiger:PLACENS][gnis:feature_id]
+    # *[NHD:GNIS_ID][gnis:feature_id]
+    # *[nhd:gnis_id][gnis:feature_id]
+    # *[ref:gnis][gnis:feature_id]
+    def _relation_rule_177(self, data, tags, members, keys, err, sets):
         if ('NHD:GNIS_ID' in keys and 'gnis:feature_id' in keys) or ('gnis:feature_id' in keys and 'gnis:id' in keys) or ('gnis:feature_id' in keys and 'nhd:gnis_id' in keys) or ('gnis:feature_id' in keys and 'ref:gnis' in keys) or ('gnis:feature_id' in keys and 'tiger:PLACENS' in keys):
             match = False
             if not match:
@@ -12755,7 +13771,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"{1.key}"
                 err.append({'class': 9002001, 'subclass': 1736205096, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[natural=landform][landform=esker]
+    # *[natural=landform][landform=esker]
+    def _relation_rule_178(self, data, tags, members, keys, err, sets):
         if ('landform' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -12768,7 +13785,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=ridge or geological=esker"
                 err.append({'class': 9002001, 'subclass': 1008024827, 'text': mapcss.tr('{0} should be replaced by {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'geological=esker')})
 
-        # *[natural=landform][landform=moraine]
+    # *[natural=landform][landform=moraine]
+    def _relation_rule_179(self, data, tags, members, keys, err, sets):
         if ('landform' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -12781,7 +13799,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"geological=moraine"
                 err.append({'class': 9002001, 'subclass': 1223091758, 'text': mapcss.tr('{0} should be replaced by {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'geological=moraine')})
 
-        # *[natural=landform][landform=beach]
+    # *[natural=landform][landform=beach]
+    def _relation_rule_180(self, data, tags, members, keys, err, sets):
         if ('landform' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -12794,7 +13813,8 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=beach"
                 err.append({'class': 9002001, 'subclass': 2005356131, 'text': mapcss.tr('{0} should be replaced by {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'natural=beach')})
 
-        # *[natural=landform][landform=tundra_polygon]
+    # *[natural=landform][landform=tundra_polygon]
+    def _relation_rule_181(self, data, tags, members, keys, err, sets):
         if ('landform' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -12807,9 +13827,200 @@ class Josm_deprecated(PluginMapCSS):
                 # suggestAlternative:"natural=tundra or natural=fell"
                 err.append({'class': 9002001, 'subclass': 149743951, 'text': mapcss.tr('{0} should be replaced by {1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'natural=tundra')})
 
-        # *[residential=condominium]
-        # Rule Blacklisted (id: 1861188094)
+    # *[residential=condominium]
+    # Rule Blacklisted (id: 1861188094)
+
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['barrier']),
+        (_relation_rule_1, ['barrier']),
+        (_relation_rule_2, ['landuse']),
+        (_relation_rule_3, ['landuse']),
+        (_relation_rule_4, ['landuse']),
+        (_relation_rule_5, ['landuse']),
+        (_relation_rule_6, ['shop']),
+        (_relation_rule_7, ['shop']),
+        (_relation_rule_8, ['shop']),
+        (_relation_rule_9, ['shop']),
+        (_relation_rule_10, ['bicycle_parking']),
+        (_relation_rule_11, ['location']),
+        (_relation_rule_12, ['generator:location']),
+        (_relation_rule_13, ['generator:method']),
+        (_relation_rule_14, ['generator:method']),
+        (_relation_rule_15, ['generator:method']),
+        (_relation_rule_16, ['fence_type']),
+        (_relation_rule_17, ['board_type']),
+        (_relation_rule_18, ['man_made']),
+        (_relation_rule_19, ['measurement']),
+        (_relation_rule_20, ['measurement']),
+        (_relation_rule_21, ['measurement']),
+        (_relation_rule_22, ['monitoring:river_level']),
+        (_relation_rule_23, ['stay']),
+        (_relation_rule_24, ['access']),
+        (_relation_rule_25, ['access']),
+        (_relation_rule_26, ['FIXME', 'fixme']),
+        (_relation_rule_27, ['name']),
+        (_relation_rule_28, ['note']),
+        (_relation_rule_29, ['type']),
+        (_relation_rule_30, ['type', 'wood']),
+        (_relation_rule_31, ['wood']),
+        (_relation_rule_32, ['type', 'wood']),
+        (_relation_rule_33, ['type', 'wood']),
+        (_relation_rule_34, ['bridge']),
+        (_relation_rule_35, ['fee', 'lit', 'supervised']),
+        (_relation_rule_36, None),
+        (_relation_rule_37, ['parking']),
+        (_relation_rule_38, ['access', 'aerialway', 'amenity', 'barrier', 'craft', 'landuse', 'leisure', 'manhole', 'parking', 'place', 'playground', 'police', 'service', 'shop', 'traffic_calming']),
+        (_relation_rule_39, ['waterway']),
+        (_relation_rule_40, ['waterway']),
+        (_relation_rule_41, ['waterway']),
+        (_relation_rule_42, ['building', 'building:part']),
+        (_relation_rule_43, ['levels']),
+        (_relation_rule_44, ['building:level']),
+        (_relation_rule_45, ['building:level']),
+        (_relation_rule_46, ['protected_class']),
+        (_relation_rule_47, ['sport']),
+        (_relation_rule_48, ['building:color']),
+        (_relation_rule_49, ['roof:color']),
+        (_relation_rule_50, ['building:color']),
+        (_relation_rule_51, ['roof:color']),
+        (_relation_rule_52, None),
+        (_relation_rule_53, None),
+        (_relation_rule_54, None),
+        (_relation_rule_55, ['sport']),
+        (_relation_rule_56, ['payment:ep_cash', 'payment:ep_chipknip', 'payment:ep_proton', 'payment:ep_quick']),
+        (_relation_rule_57, ['kp']),
+        (_relation_rule_58, ['pk']),
+        (_relation_rule_59, ['kp']),
+        (_relation_rule_60, ['pk']),
+        (_relation_rule_61, ['distance']),
+        (_relation_rule_62, ['postcode']),
+        (_relation_rule_63, ['water']),
+        (_relation_rule_64, ['seamark']),
+        (_relation_rule_65, ['seamark']),
+        (_relation_rule_66, ['landuse']),
+        (_relation_rule_67, ['shop']),
+        (_relation_rule_68, ['shop']),
+        (_relation_rule_69, ['amenity']),
+        (_relation_rule_70, ['amenity']),
+        (_relation_rule_71, ['location']),
+        (_relation_rule_72, ['man_made']),
+        (_relation_rule_73, ['leisure', 'shop']),
+        (_relation_rule_74, ['shop']),
+        (_relation_rule_75, None),
+        (_relation_rule_76, ['sport']),
+        (_relation_rule_77, ['amenity']),
+        (_relation_rule_78, ['vending']),
+        (_relation_rule_79, ['service']),
+        (_relation_rule_80, ['noexit']),
+        (_relation_rule_81, ['landuse']),
+        (_relation_rule_82, ['shop']),
+        (_relation_rule_83, ['vending']),
+        (_relation_rule_84, ['area']),
+        (_relation_rule_85, ['amenity']),
+        (_relation_rule_86, ['building']),
+        (_relation_rule_87, ['building']),
+        (_relation_rule_88, ['building']),
+        (_relation_rule_89, ['water']),
+        (_relation_rule_90, ['amenity']),
+        (_relation_rule_91, ['building']),
+        (_relation_rule_92, ['natural']),
+        (_relation_rule_93, ['religion']),
+        (_relation_rule_94, ['shop']),
+        (_relation_rule_95, ['is_in']),
+        (_relation_rule_96, ['sport']),
+        (_relation_rule_97, ['leisure']),
+        (_relation_rule_98, ['cuisine']),
+        (_relation_rule_99, ['kitchen_hours']),
+        (_relation_rule_100, ['shop']),
+        (_relation_rule_101, ['contact:google_plus']),
+        (_relation_rule_102, ['amenity']),
+        (_relation_rule_103, ['amenity', 'shop']),
+        (_relation_rule_104, ['amenity']),
+        (_relation_rule_105, ['building', 'building:type']),
+        (_relation_rule_106, ['building']),
+        (_relation_rule_107, ['leisure']),
+        (_relation_rule_108, ['natural']),
+        (_relation_rule_109, ['shop']),
+        (_relation_rule_110, ['diaper']),
+        (_relation_rule_111, ['diaper']),
+        (_relation_rule_112, ['diaper:male']),
+        (_relation_rule_113, ['diaper:female']),
+        (_relation_rule_114, ['diaper:unisex']),
+        (_relation_rule_115, ['diaper:wheelchair']),
+        (_relation_rule_116, ['diaper:fee']),
+        (_relation_rule_117, None),
+        (_relation_rule_118, ['changing_table']),
+        (_relation_rule_119, ['roof:shape']),
+        (_relation_rule_120, ['bridge_name']),
+        (_relation_rule_121, ['crossing']),
+        (_relation_rule_122, ['recycling:metal']),
+        (_relation_rule_123, ['shop']),
+        (_relation_rule_124, ['tower:type']),
+        (_relation_rule_125, ['branch:type']),
+        (_relation_rule_126, ['branch:type', 'tower:type']),
+        (_relation_rule_127, ['branch:type']),
+        (_relation_rule_128, ['tower:type']),
+        (_relation_rule_129, ['tower:type']),
+        (_relation_rule_130, ['tower:type']),
+        (_relation_rule_131, ['tower:type']),
+        (_relation_rule_132, ['power']),
+        (_relation_rule_133, ['pole:type']),
+        (_relation_rule_134, ['sloped_curb']),
+        (_relation_rule_135, ['sloped_curb']),
+        (_relation_rule_136, ['kerb', 'sloped_curb']),
+        (_relation_rule_137, ['unnamed']),
+        (_relation_rule_138, ['building:height']),
+        (_relation_rule_139, ['building:min_height']),
+        (_relation_rule_140, ['navigationaid']),
+        (_relation_rule_141, ['water']),
+        (_relation_rule_142, ['natural']),
+        (_relation_rule_143, ['natural', 'water', 'waterway']),
+        (_relation_rule_144, ['natural', 'water']),
+        (_relation_rule_145, ['shop']),
+        (_relation_rule_146, ['access']),
+        (_relation_rule_147, ['addr:inclusion']),
+        (_relation_rule_148, ['building']),
+        (_relation_rule_149, ['generator:type']),
+        (_relation_rule_150, ['building']),
+        (_relation_rule_151, ['natural']),
+        (_relation_rule_152, ['climbing:grade:UIAA:min']),
+        (_relation_rule_153, ['climbing:grade:UIAA:max']),
+        (_relation_rule_154, ['climbing:grade:UIAA:mean']),
+        (_relation_rule_155, ['climbing:grade:UIAA']),
+        (_relation_rule_156, ['cuisine']),
+        (_relation_rule_157, ['cuisine']),
+        (_relation_rule_158, ['Fixme']),
+        (_relation_rule_159, ['service:bicycle:chaintool']),
+        (_relation_rule_160, ['building:roof:shape']),
+        (_relation_rule_161, ['man_made']),
+        (_relation_rule_162, ['man_made']),
+        (_relation_rule_163, ['pump:type']),
+        (_relation_rule_164, ['pump:type']),
+        (_relation_rule_165, ['substance']),
+        (_relation_rule_166, ['landuse']),
+        (_relation_rule_167, ['amenity']),
+        (_relation_rule_168, ['amenity']),
+        (_relation_rule_169, ['surface']),
+        (_relation_rule_170, ['school']),
+        (_relation_rule_171, ['voltage-high', 'voltage-low']),
+        (_relation_rule_172, ['toilet']),
+        (_relation_rule_173, ['toilet']),
+        (_relation_rule_174, ['type']),
+        (_relation_rule_175, ['image']),
+        (_relation_rule_176, ['NHD:GNIS_ID', 'gnis:id', 'nhd:gnis_id', 'ref:gnis', 'tiger:PLACENS']),
+        (_relation_rule_177, ['NHD:GNIS_ID', 'gnis:feature_id']),
+        (_relation_rule_178, ['landform']),
+        (_relation_rule_179, ['landform']),
+        (_relation_rule_180, ['landform']),
+        (_relation_rule_181, ['landform']),
+    ])
 
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
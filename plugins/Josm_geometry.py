@@ -35,53 +35,48 @@ class Josm_geometry(PluginMapCSS):
         self.re_76b0146b = re.compile(r'^(water|wetland)$')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-        set_water_area = False
-
-        # node[area=no]
-        # node[oneway]
-        # node[bridge]
-        # node[sidewalk]
-        # node[footway][footway!=crossing]
-        # node[man_made=embankment]
-        # node[man_made=groyne]
-        # node[man_made=cutline]
-        # node[power=line]
-        # node[cutline]
-        # node[aerialway=cable_car]
-        # node[aerialway=gondola]
-        # node[aerialway=chair_lift]
-        # node[aerialway=mixed_lift]
-        # node[aerialway=drag_lift]
-        # node[aerialway=t-bar]
-        # node[aerialway=j-bar]
-        # node[aerialway=platter]
-        # node[aerialway=magic_carpet]
-        # node[aerialway=rope_tow]
-        # node[aerialway=goods]
-        # node[aeroway=taxiway]
-        # node[aeroway=runway]
-        # node[railway=rail]
-        # node[railway=narrow_gauge]
-        # node[railway=monorail]
-        # node[railway=preserved]
-        # node[railway=light_rail]
-        # node[railway=subway]
-        # node[railway=tram]
-        # node[railway=disused]
-        # node[railway=abandoned]
-        # node[waterway=river]
-        # node[waterway=canal]
-        # node[waterway=stream]
-        # node[waterway=ditch]
-        # node[waterway=drain]
-        # node[natural=coastline]
-        # node[natural=ridge]
-        # node[natural=valley]
-        # node[natural=tree_row]
+    # node[area=no]
+    # node[oneway]
+    # node[bridge]
+    # node[sidewalk]
+    # node[footway][footway!=crossing]
+    # node[man_made=embankment]
+    # node[man_made=groyne]
+    # node[man_made=cutline]
+    # node[power=line]
+    # node[cutline]
+    # node[aerialway=cable_car]
+    # node[aerialway=gondola]
+    # node[aerialway=chair_lift]
+    # node[aerialway=mixed_lift]
+    # node[aerialway=drag_lift]
+    # node[aerialway=t-bar]
+    # node[aerialway=j-bar]
+    # node[aerialway=platter]
+    # node[aerialway=magic_carpet]
+    # node[aerialway=rope_tow]
+    # node[aerialway=goods]
+    # node[aeroway=taxiway]
+    # node[aeroway=runway]
+    # node[railway=rail]
+    # node[railway=narrow_gauge]
+    # node[railway=monorail]
+    # node[railway=preserved]
+    # node[railway=light_rail]
+    # node[railway=subway]
+    # node[railway=tram]
+    # node[railway=disused]
+    # node[railway=abandoned]
+    # node[waterway=river]
+    # node[waterway=canal]
+    # node[waterway=stream]
+    # node[waterway=ditch]
+    # node[waterway=drain]
+    # node[natural=coastline]
+    # node[natural=ridge]
+    # node[natural=valley]
+    # node[natural=tree_row]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('aerialway' in keys) or ('aeroway' in keys) or ('area' in keys) or ('bridge' in keys) or ('cutline' in keys) or ('footway' in keys) or ('man_made' in keys) or ('natural' in keys) or ('oneway' in keys) or ('power' in keys) or ('railway' in keys) or ('sidewalk' in keys) or ('waterway' in keys):
             match = False
             if not match:
@@ -255,7 +250,8 @@ class Josm_geometry(PluginMapCSS):
                 # assertMatch:"node oneway=-1"
                 err.append({'class': 9003001, 'subclass': 431750003, 'text': mapcss.tr('{0} on a node. Should be used on a way.', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[boundary=administrative]
+    # node[boundary=administrative]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('boundary' in keys):
             match = False
             if not match:
@@ -266,36 +262,37 @@ class Josm_geometry(PluginMapCSS):
                 # throwWarning:tr("{0} on a node. Should be used on a way or relation.","{0.tag}")
                 err.append({'class': 9003002, 'subclass': 1005532536, 'text': mapcss.tr('{0} on a node. Should be used on a way or relation.', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[golf=green]
-        # node[golf=bunker]
-        # node[golf=fairway]
-        # node[area=yes]
-        # node[area:highway]
-        # node[landuse]
-        # node[natural=bare_rock]
-        # node[natural=beach]
-        # node[natural=fell]
-        # node[natural=glacier]
-        # node[natural=grassland]
-        # node[natural=heath]
-        # node[natural=mud]
-        # node[natural=sand]
-        # node[natural=scree]
-        # node[natural=scrub]
-        # node[natural=shrubbery]
-        # node[natural=water]
-        # node[natural=wetland]
-        # node[natural=wood]
-        # node[leisure=park][natural!=tree]
-        # node[leisure=nature_reserve]
-        # node[waterway=riverbank]
-        # node[man_made=bridge]
-        # node[man_made=breakwater]
-        # node[aeroway=apron]
-        # node[power=plant]
-        # node[power=switchgear]
-        # node[building:part]
-        # node[source:outline]
+    # node[golf=green]
+    # node[golf=bunker]
+    # node[golf=fairway]
+    # node[area=yes]
+    # node[area:highway]
+    # node[landuse]
+    # node[natural=bare_rock]
+    # node[natural=beach]
+    # node[natural=fell]
+    # node[natural=glacier]
+    # node[natural=grassland]
+    # node[natural=heath]
+    # node[natural=mud]
+    # node[natural=sand]
+    # node[natural=scree]
+    # node[natural=scrub]
+    # node[natural=shrubbery]
+    # node[natural=water]
+    # node[natural=wetland]
+    # node[natural=wood]
+    # node[leisure=park][natural!=tree]
+    # node[leisure=nature_reserve]
+    # node[waterway=riverbank]
+    # node[man_made=bridge]
+    # node[man_made=breakwater]
+    # node[aeroway=apron]
+    # node[power=plant]
+    # node[power=switchgear]
+    # node[building:part]
+    # node[source:outline]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('aeroway' in keys) or ('area' in keys) or ('area:highway' in keys) or ('building:part' in keys) or ('golf' in keys) or ('landuse' in keys) or ('leisure' in keys) or ('man_made' in keys) or ('natural' in keys) or ('power' in keys) or ('source:outline' in keys) or ('waterway' in keys):
             match = False
             if not match:
@@ -422,10 +419,11 @@ class Josm_geometry(PluginMapCSS):
                 # throwWarning:tr("{0} on a node. Should be drawn as an area.","{0.tag}")
                 err.append({'class': 9003003, 'subclass': 916650129, 'text': mapcss.tr('{0} on a node. Should be drawn as an area.', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[type=multipolygon]
-        # node[interval]
-        # node[route]
-        # node[restriction]
+    # node[type=multipolygon]
+    # node[interval]
+    # node[route]
+    # node[restriction]
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('interval' in keys) or ('restriction' in keys) or ('route' in keys) or ('type' in keys):
             match = False
             if not match:
@@ -448,7 +446,8 @@ class Josm_geometry(PluginMapCSS):
                 # throwError:tr("{0} on a node. Should be used in a relation","{0.tag}")
                 err.append({'class': 9003004, 'subclass': 104835602, 'text': mapcss.tr('{0} on a node. Should be used in a relation', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[man_made!=monitoring_station][at(0.0,0.0)]
+    # node[man_made!=monitoring_station][at(0.0,0.0)]
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -460,7 +459,8 @@ class Josm_geometry(PluginMapCSS):
                 # fixDeleteObject:this
                 err.append({'class': 9003009, 'subclass': 829325630, 'text': mapcss.tr('Object at Position 0.00E 0.00N. There is nothing at this position except an already mapped weather buoy.')})
 
-        # node[source:geometry]
+    # node[source:geometry]
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('source:geometry' in keys):
             match = False
             if not match:
@@ -477,7 +477,8 @@ class Josm_geometry(PluginMapCSS):
                     'source:geometry'])
                 }})
 
-        # node.missing_switch_railway_crossing
+    # node.missing_switch_railway_crossing
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if True:
             match = False
             # Skip selector using undeclared class missing_switch_railway_crossing
@@ -486,38 +487,49 @@ class Josm_geometry(PluginMapCSS):
                 # throwWarning:tr("Railways connection node without {0} or {1}","railway=switch","railway=railway_crossing")
                 err.append({'class': 9003014, 'subclass': 1770020640, 'text': mapcss.tr('Railways connection node without {0} or {1}', 'railway=switch', 'railway=railway_crossing')})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['aerialway', 'aeroway', 'area', 'bridge', 'cutline', 'footway', 'man_made', 'natural', 'oneway', 'power', 'railway', 'sidewalk', 'waterway']),
+        (_node_rule_1, ['boundary']),
+        (_node_rule_2, ['aeroway', 'area', 'area:highway', 'building:part', 'golf', 'landuse', 'leisure', 'man_made', 'natural', 'power', 'source:outline', 'waterway']),
+        (_node_rule_3, ['interval', 'restriction', 'route', 'type']),
+        (_node_rule_4, None),
+        (_node_rule_5, ['source:geometry']),
+        (_node_rule_6, None),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
-        set_water_area = False
-
-        # way[emergency=fire_hydrant]
-        # way[emergency=defibrillator]
-        # way[railway=subway_entrance]
-        # way[man_made=survey_point]
-        # way[power=transformer]
-        # way[power=pole]
-        # way[power=catenary_mast]
-        # way[power=connection]
-        # way[power=terminal]
-        # way[power=tower]!:closed
-        # way[amenity=vending_machine]
-        # way[natural=peak]
-        # way[natural=saddle]
-        # way[natural=volcano]
-        # way[natural=tree]
-        # way[highway=give_way]
-        # way[highway=milestone]
-        # way[highway=mini_roundabout]
-        # way[highway=stop]
-        # way[highway=street_lamp]
-        # way[highway=traffic_signals]
-        # way[highway=turning_loop]
-        # way[highway=turning_circle]
-        # way[highway=motorway_junction]
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
+
+    # way[emergency=fire_hydrant]
+    # way[emergency=defibrillator]
+    # way[railway=subway_entrance]
+    # way[man_made=survey_point]
+    # way[power=transformer]
+    # way[power=pole]
+    # way[power=catenary_mast]
+    # way[power=connection]
+    # way[power=terminal]
+    # way[power=tower]!:closed
+    # way[amenity=vending_machine]
+    # way[natural=peak]
+    # way[natural=saddle]
+    # way[natural=volcano]
+    # way[natural=tree]
+    # way[highway=give_way]
+    # way[highway=milestone]
+    # way[highway=mini_roundabout]
+    # way[highway=stop]
+    # way[highway=street_lamp]
+    # way[highway=traffic_signals]
+    # way[highway=turning_loop]
+    # way[highway=turning_circle]
+    # way[highway=motorway_junction]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys) or ('emergency' in keys) or ('highway' in keys) or ('man_made' in keys) or ('natural' in keys) or ('power' in keys) or ('railway' in keys):
             match = False
             if not match:
@@ -620,15 +632,16 @@ class Josm_geometry(PluginMapCSS):
                 # throwWarning:tr("{0} on a way. Should be used on a node.","{0.tag}")
                 err.append({'class': 9003007, 'subclass': 1619711985, 'text': mapcss.tr('{0} on a way. Should be used on a node.', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[voltage:primary]
-        # way[voltage:secondary]
-        # way[voltage:tertiary]
-        # way[transformer]
-        # way[line_arrangement]
-        # way[line_attachment]
-        # way[line_management]
-        # way[entrance]
-        # way[door]
+    # way[voltage:primary]
+    # way[voltage:secondary]
+    # way[voltage:tertiary]
+    # way[transformer]
+    # way[line_arrangement]
+    # way[line_attachment]
+    # way[line_management]
+    # way[entrance]
+    # way[door]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('door' in keys) or ('entrance' in keys) or ('line_arrangement' in keys) or ('line_attachment' in keys) or ('line_management' in keys) or ('transformer' in keys) or ('voltage:primary' in keys) or ('voltage:secondary' in keys) or ('voltage:tertiary' in keys):
             match = False
             if not match:
@@ -671,10 +684,11 @@ class Josm_geometry(PluginMapCSS):
                 # throwWarning:tr("{0} on a way. Should be used on a node.","{0.key}")
                 err.append({'class': 9003007, 'subclass': 1380324691, 'text': mapcss.tr('{0} on a way. Should be used on a node.', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[restriction][restriction=~/^(no_right_turn|no_left_turn|no_u_turn|no_straight_on|only_right_turn|only_left_turn|only_straight_on|no_entry|no_exit)$/]
-        # way[type=multipolygon]
-        # way[interval][route!=ferry]
-        # way[route=bus]
+    # way[restriction][restriction=~/^(no_right_turn|no_left_turn|no_u_turn|no_straight_on|only_right_turn|only_left_turn|only_straight_on|no_entry|no_exit)$/]
+    # way[type=multipolygon]
+    # way[interval][route!=ferry]
+    # way[route=bus]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('interval' in keys) or ('restriction' in keys) or ('route' in keys) or ('type' in keys):
             match = False
             if not match:
@@ -697,7 +711,8 @@ class Josm_geometry(PluginMapCSS):
                 # throwError:tr("{0} on a way. Should be used in a relation","{0.tag}")
                 err.append({'class': 9003008, 'subclass': 665916193, 'text': mapcss.tr('{0} on a way. Should be used in a relation', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way:closed[power=line]
+    # way:closed[power=line]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('power' in keys):
             match = False
             if not match:
@@ -708,9 +723,10 @@ class Josm_geometry(PluginMapCSS):
                 # throwWarning:tr("{0} on a closed way. Should be used on an unclosed way.","{1.tag}")
                 err.append({'class': 9003011, 'subclass': 2100265426, 'text': mapcss.tr('{0} on a closed way. Should be used on an unclosed way.', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # area[natural=~/^(water|wetland)$/]
-        # area[waterway=riverbank]
-        # area[landuse=reservoir]
+    # area[natural=~/^(water|wetland)$/]
+    # area[waterway=riverbank]
+    # area[landuse=reservoir]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('landuse' in keys) or ('natural' in keys) or ('waterway' in keys):
             match = False
             if not match:
@@ -727,22 +743,23 @@ class Josm_geometry(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set water_area
-                set_water_area = True
+                sets.add('water_area')
 
-        # area:closed[place=islet][eval(areasize())>1500000]
-        # Part of rule not implemented
+    # area:closed[place=islet][eval(areasize())>1500000]
+    # Part of rule not implemented
 
-        # area:closed[place=island][eval(areasize())<500000]
-        # Part of rule not implemented
+    # area:closed[place=island][eval(areasize())<500000]
+    # Part of rule not implemented
 
-        # area:closed[building][building!=no][eval(areasize())>920000]
-        # Part of rule not implemented
+    # area:closed[building][building!=no][eval(areasize())>920000]
+    # Part of rule not implemented
 
-        # area:closed[waterway=canal][area!=no]
-        # area:closed[waterway=drain][area!=no]
-        # area:closed[waterway=ditch][area!=no]
-        # area:closed[waterway=stream][area!=no]
-        # area:closed[waterway=river][area!=no]
+    # area:closed[waterway=canal][area!=no]
+    # area:closed[waterway=drain][area!=no]
+    # area:closed[waterway=ditch][area!=no]
+    # area:closed[waterway=stream][area!=no]
+    # area:closed[waterway=river][area!=no]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('waterway' in keys):
             match = False
             if not match:
@@ -769,15 +786,25 @@ class Josm_geometry(PluginMapCSS):
                 # throwWarning:tr("{0} is the tag for the linear waterway. To tag the water area use {1} + {2} instead.","{1.tag}","natural=water","water=*")
                 err.append({'class': 9003013, 'subclass': 2034482714, 'text': mapcss.tr('{0} is the tag for the linear waterway. To tag the water area use {1} + {2} instead.', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'natural=water', 'water=*')})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['amenity', 'emergency', 'highway', 'man_made', 'natural', 'power', 'railway']),
+        (_way_rule_1, ['door', 'entrance', 'line_arrangement', 'line_attachment', 'line_management', 'transformer', 'voltage:primary', 'voltage:secondary', 'voltage:tertiary']),
+        (_way_rule_2, ['interval', 'restriction', 'route', 'type']),
+        (_way_rule_3, ['power']),
+        (_way_rule_4, ['landuse', 'natural', 'waterway']),
+        (_way_rule_5, ['waterway']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
-        set_water_area = False
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-        # relation[area?]
+    # relation[area?]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('area' in keys):
             match = False
             if not match:
@@ -792,9 +819,10 @@ class Josm_geometry(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # area[natural=~/^(water|wetland)$/]
-        # area[waterway=riverbank]
-        # area[landuse=reservoir]
+    # area[natural=~/^(water|wetland)$/]
+    # area[waterway=riverbank]
+    # area[landuse=reservoir]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('landuse' in keys and 'type' in keys) or ('natural' in keys and 'type' in keys) or ('type' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -811,22 +839,23 @@ class Josm_geometry(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set water_area
-                set_water_area = True
+                sets.add('water_area')
 
-        # area:closed[place=islet][eval(areasize())>1500000]
-        # Part of rule not implemented
+    # area:closed[place=islet][eval(areasize())>1500000]
+    # Part of rule not implemented
 
-        # area:closed[place=island][eval(areasize())<500000]
-        # Part of rule not implemented
+    # area:closed[place=island][eval(areasize())<500000]
+    # Part of rule not implemented
 
-        # area:closed[building][building!=no][eval(areasize())>920000]
-        # Part of rule not implemented
+    # area:closed[building][building!=no][eval(areasize())>920000]
+    # Part of rule not implemented
 
-        # area:closed[waterway=canal][area!=no]
-        # area:closed[waterway=drain][area!=no]
-        # area:closed[waterway=ditch][area!=no]
-        # area:closed[waterway=stream][area!=no]
-        # area:closed[waterway=river][area!=no]
+    # area:closed[waterway=canal][area!=no]
+    # area:closed[waterway=drain][area!=no]
+    # area:closed[waterway=ditch][area!=no]
+    # area:closed[waterway=stream][area!=no]
+    # area:closed[waterway=river][area!=no]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('type' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -853,6 +882,18 @@ class Josm_geometry(PluginMapCSS):
                 # throwWarning:tr("{0} is the tag for the linear waterway. To tag the water area use {1} + {2} instead.","{1.tag}","natural=water","water=*")
                 err.append({'class': 9003013, 'subclass': 2034482714, 'text': mapcss.tr('{0} is the tag for the linear waterway. To tag the water area use {1} + {2} instead.', mapcss._tag_uncapture(capture_tags, '{1.tag}'), 'natural=water', 'water=*')})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['area']),
+        (_relation_rule_1, ['landuse', 'natural', 'type']),
+        (_relation_rule_2, ['type']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
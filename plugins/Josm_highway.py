@@ -42,13 +42,8 @@ class Josm_highway(PluginMapCSS):
         self.re_5757d731 = re.compile(r'^((motorway|trunk|primary|secondary|tertiary)(_link)?|residential|unclassified)$')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-        set_fixable_footway = set_link_road = set_major_road = set_minor_road = set_not_fixable_footway = False
-
-        # node[highway=~/motorway|trunk|primary|secondary|tertiary|unclassified|residential|service|living_street|pedestrian|track|path|footway|cycleway|busway|bus_guideway|bridleway/][highway!=motorway_junction][highway!=services]
+    # node[highway=~/motorway|trunk|primary|secondary|tertiary|unclassified|residential|service|living_street|pedestrian|track|path|footway|cycleway|busway|bus_guideway|bridleway/][highway!=motorway_junction][highway!=services]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -76,7 +71,8 @@ class Josm_highway(PluginMapCSS):
                 # assertNoMatch:"node highway=turning_circle"
                 err.append({'class': 9004008, 'subclass': 224371448, 'text': mapcss.tr('wrong highway tag on a node')})
 
-        # node[footway=crossing]
+    # node[footway=crossing]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('footway' in keys):
             match = False
             if not match:
@@ -89,7 +85,8 @@ class Josm_highway(PluginMapCSS):
                 # suggestAlternative:"railway=crossing"
                 err.append({'class': 9004010, 'subclass': 1262520638, 'text': mapcss.tr('{0} on a node', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[cycleway=crossing]
+    # node[cycleway=crossing]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('cycleway' in keys):
             match = False
             if not match:
@@ -102,7 +99,8 @@ class Josm_highway(PluginMapCSS):
                 # suggestAlternative:"railway=crossing + bicycle=yes"
                 err.append({'class': 9004010, 'subclass': 1385847744, 'text': mapcss.tr('{0} on a node', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[railway!=crossing][crossing!=no].is_in_railway.is_in_minor_road!.is_in_major_road
+    # node[railway!=crossing][crossing!=no].is_in_railway.is_in_minor_road!.is_in_major_road
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if True:
             match = False
             # Skip selector using undeclared class is_in_major_road, is_in_minor_road, is_in_railway
@@ -115,7 +113,8 @@ class Josm_highway(PluginMapCSS):
                     ['railway','crossing']])
                 }})
 
-        # node[railway!=level_crossing].is_in_railway.is_in_major_road!.is_in_minor_road
+    # node[railway!=level_crossing].is_in_railway.is_in_major_road!.is_in_minor_road
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if True:
             match = False
             # Skip selector using undeclared class is_in_major_road, is_in_minor_road, is_in_railway
@@ -128,7 +127,8 @@ class Josm_highway(PluginMapCSS):
                     ['railway','level_crossing']])
                 }})
 
-        # node[highway=crossing][barrier=kerb].is_in_major_road
+    # node[highway=crossing][barrier=kerb].is_in_major_road
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('barrier' in keys and 'highway' in keys):
             match = False
             # Skip selector using undeclared class is_in_major_road
@@ -138,7 +138,8 @@ class Josm_highway(PluginMapCSS):
                 # suggestAlternative:"kerb=*"
                 err.append({'class': 9004011, 'subclass': 440952770, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[surface=~/^paving_stones:(\d+)$/]
+    # *[surface=~/^paving_stones:(\d+)$/]
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if ('surface' in keys):
             match = False
             if not match:
@@ -152,15 +153,26 @@ class Josm_highway(PluginMapCSS):
                 # suggestAlternative:"paving_stones:width"
                 err.append({'class': 9004012, 'subclass': 291757414, 'text': mapcss.tr('{0} with trailing number', 'paving_stones')})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['highway']),
+        (_node_rule_1, ['footway']),
+        (_node_rule_2, ['cycleway']),
+        (_node_rule_3, None),
+        (_node_rule_4, None),
+        (_node_rule_5, ['barrier']),
+        (_node_rule_6, ['surface']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
-        set_fixable_footway = set_link_road = set_major_road = set_minor_road = set_not_fixable_footway = False
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-        # way[highway=~/^(motorway|trunk|primary|secondary|tertiary)$/]
+    # way[highway=~/^(motorway|trunk|primary|secondary|tertiary)$/]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -169,9 +181,10 @@ class Josm_highway(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set major_road
-                set_major_road = True
+                sets.add('major_road')
 
-        # way[highway=~/^.*_link$/]
+    # way[highway=~/^.*_link$/]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -180,9 +193,10 @@ class Josm_highway(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set link_road
-                set_link_road = True
+                sets.add('link_road')
 
-        # way[highway=~/^(unclassified|residential|living_street|service)$/]
+    # way[highway=~/^(unclassified|residential|living_street|service)$/]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -191,9 +205,10 @@ class Josm_highway(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set minor_road
-                set_minor_road = True
+                sets.add('minor_road')
 
-        # way[highway][name=~/(?i).* (Ave|Blvd|Bnd|Br|Brg|Cct|Cir|Cl|Cr|Crct|Cres|Crt|Ct|Cv|Dr|Drv|Esp|Espl|Hwy|Ln|Mw|Mwy|Pky|Pkwy|Pl|Rd|Qy|Qys|Sq|St|Str|Ter|Tce|Tr|Trl|Vw|Wy|Xing)[.]?$/]
+    # way[highway][name=~/(?i).* (Ave|Blvd|Bnd|Br|Brg|Cct|Cir|Cl|Cr|Crct|Cres|Crt|Ct|Cv|Dr|Drv|Esp|Espl|Hwy|Ln|Mw|Mwy|Pky|Pkwy|Pl|Rd|Qy|Qys|Sq|St|Str|Ter|Tce|Tr|Trl|Vw|Wy|Xing)[.]?$/]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys and 'name' in keys):
             match = False
             if not match:
@@ -208,9 +223,10 @@ class Josm_highway(PluginMapCSS):
                 # assertMatch:"way highway=unclassified name=\"Foo Ave.\""
                 err.append({'class': 9004001, 'subclass': 1120623403, 'text': mapcss.tr('abbreviated street name')})
 
-        # way[highway=crossing]
-        # way[railway=crossing]
-        # way[railway=level_crossing]
+    # way[highway=crossing]
+    # way[railway=crossing]
+    # way[railway=level_crossing]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys) or ('railway' in keys):
             match = False
             if not match:
@@ -230,8 +246,9 @@ class Josm_highway(PluginMapCSS):
                 # assertMatch:"way highway=crossing"
                 err.append({'class': 9004002, 'subclass': 1549110307, 'text': mapcss.tr('wrong crossing tag on a way')})
 
-        # way[highway=yes]
-        # way[highway=road]
+    # way[highway=yes]
+    # way[highway=road]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -248,11 +265,12 @@ class Josm_highway(PluginMapCSS):
                 # assertMatch:"way highway=road"
                 err.append({'class': 9004004, 'subclass': 1729022478, 'text': mapcss.tr('Unspecific highway type')})
 
-        # way[highway=footway][maxspeed]
-        # way[highway=steps][maxspeed]
-        # way[highway=cycleway][bicycle=no]
-        # way[highway=footway][foot=no]
-        # way[highway=cycleway][cycleway=lane]
+    # way[highway=footway][maxspeed]
+    # way[highway=steps][maxspeed]
+    # way[highway=cycleway][bicycle=no]
+    # way[highway=footway][foot=no]
+    # way[highway=cycleway][cycleway=lane]
+    def _way_rule_6(self, data, tags, nds, keys, err, sets):
         if ('bicycle' in keys and 'highway' in keys) or ('cycleway' in keys and 'highway' in keys) or ('foot' in keys and 'highway' in keys) or ('highway' in keys and 'maxspeed' in keys):
             match = False
             if not match:
@@ -287,11 +305,12 @@ class Josm_highway(PluginMapCSS):
                 # assertNoMatch:"way highway=residential maxspeed=20"
                 err.append({'class': 9004013, 'subclass': 469607562, 'text': mapcss.tr('{0} together with {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[footway=left][/^footway:/]
-        # way[footway=right][/^footway:/]
-        # way[footway=both][/^footway:/]
-        # way[footway=separate][/^footway:/]
-        # way[footway=no][/^footway:/]
+    # way[footway=left][/^footway:/]
+    # way[footway=right][/^footway:/]
+    # way[footway=both][/^footway:/]
+    # way[footway=separate][/^footway:/]
+    # way[footway=no][/^footway:/]
+    def _way_rule_7(self, data, tags, nds, keys, err, sets):
         if ('footway' in keys):
             match = False
             if not match:
@@ -320,10 +339,11 @@ class Josm_highway(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated, use {1} instead. Also check similar tags like {2}","{0.tag}","sidewalk","{1.key}")
                 # assertMatch:"way footway=both footway:surface=asphalt"
                 # assertMatch:"way footway=separate footway:surface=asphalt"
-                set_not_fixable_footway = True
+                sets.add('not_fixable_footway')
                 err.append({'class': 9004006, 'subclass': 1255595246, 'text': mapcss.tr('{0} is deprecated, use {1} instead. Also check similar tags like {2}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), 'sidewalk', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[footway=none][/^footway:/]
+    # way[footway=none][/^footway:/]
+    def _way_rule_8(self, data, tags, nds, keys, err, sets):
         if ('footway' in keys):
             match = False
             if not match:
@@ -336,35 +356,36 @@ class Josm_highway(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated, use {1} instead. Also check similar tags like {2}","{0.tag}","sidewalk=no","{1.key}")
                 # assertNoMatch:"way footway=no footway:surface=asphalt"
                 # assertMatch:"way footway=none footway:surface=asphalt"
-                set_not_fixable_footway = True
+                sets.add('not_fixable_footway')
                 err.append({'class': 9004006, 'subclass': 2016837729, 'text': mapcss.tr('{0} is deprecated, use {1} instead. Also check similar tags like {2}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), 'sidewalk=no', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[footway=left]!.not_fixable_footway
-        # way[footway=right]!.not_fixable_footway
-        # way[footway=both]!.not_fixable_footway
-        # way[footway=separate]!.not_fixable_footway
-        # way[footway=no]!.not_fixable_footway
+    # way[footway=left]!.not_fixable_footway
+    # way[footway=right]!.not_fixable_footway
+    # way[footway=both]!.not_fixable_footway
+    # way[footway=separate]!.not_fixable_footway
+    # way[footway=no]!.not_fixable_footway
+    def _way_rule_9(self, data, tags, nds, keys, err, sets):
         if ('footway' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_not_fixable_footway) and (mapcss._tag_capture(capture_tags, 0, tags, 'footway') == mapcss._value_capture(capture_tags, 0, 'left')))
+                try: match = (('not_fixable_footway' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'footway') == mapcss._value_capture(capture_tags, 0, 'left')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_not_fixable_footway) and (mapcss._tag_capture(capture_tags, 0, tags, 'footway') == mapcss._value_capture(capture_tags, 0, 'right')))
+                try: match = (('not_fixable_footway' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'footway') == mapcss._value_capture(capture_tags, 0, 'right')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_not_fixable_footway) and (mapcss._tag_capture(capture_tags, 0, tags, 'footway') == mapcss._value_capture(capture_tags, 0, 'both')))
+                try: match = (('not_fixable_footway' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'footway') == mapcss._value_capture(capture_tags, 0, 'both')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_not_fixable_footway) and (mapcss._tag_capture(capture_tags, 0, tags, 'footway') == mapcss._value_capture(capture_tags, 0, 'separate')))
+                try: match = (('not_fixable_footway' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'footway') == mapcss._value_capture(capture_tags, 0, 'separate')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_not_fixable_footway) and (mapcss._tag_capture(capture_tags, 0, tags, 'footway') == mapcss._value_capture(capture_tags, 0, 'no')))
+                try: match = (('not_fixable_footway' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'footway') == mapcss._value_capture(capture_tags, 0, 'no')))
                 except mapcss.RuleAbort: pass
             if match:
                 # set fixable_footway
@@ -372,7 +393,7 @@ class Josm_highway(PluginMapCSS):
                 # throwWarning:tr("{0} is deprecated","{0.tag}")
                 # suggestAlternative:"sidewalk"
                 # fixChangeKey:"footway => sidewalk"
-                set_fixable_footway = True
+                sets.add('fixable_footway')
                 err.append({'class': 9004006, 'subclass': 1136570919, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['sidewalk', mapcss.tag(tags, 'footway')]]),
@@ -380,12 +401,13 @@ class Josm_highway(PluginMapCSS):
                     'footway'])
                 }})
 
-        # way[footway=none]!.not_fixable_footway
+    # way[footway=none]!.not_fixable_footway
+    def _way_rule_10(self, data, tags, nds, keys, err, sets):
         if ('footway' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_not_fixable_footway) and (mapcss._tag_capture(capture_tags, 0, tags, 'footway') == mapcss._value_capture(capture_tags, 0, 'none')))
+                try: match = (('not_fixable_footway' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'footway') == mapcss._value_capture(capture_tags, 0, 'none')))
                 except mapcss.RuleAbort: pass
             if match:
                 # set fixable_footway
@@ -394,7 +416,7 @@ class Josm_highway(PluginMapCSS):
                 # suggestAlternative:"sidewalk=no"
                 # fixRemove:"footway"
                 # fixAdd:"sidewalk=no"
-                set_fixable_footway = True
+                sets.add('fixable_footway')
                 err.append({'class': 9004006, 'subclass': 430589555, 'text': mapcss.tr('{0} is deprecated', mapcss._tag_uncapture(capture_tags, '{0.tag}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['sidewalk','no']]),
@@ -402,18 +424,19 @@ class Josm_highway(PluginMapCSS):
                     'footway'])
                 }})
 
-        # way[turn][turn!~/^(none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)$/]
-        # way[turn:forward][turn:forward!~/^(none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)$/]
-        # way[turn:backward][turn:backward!~/^(none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)$/]
-        # way[turn:both_ways][turn:both_ways!~/^(none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)$/]
-        # way[turn:both_ways:forward][turn:both_ways:forward!~/^(none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)$/]
-        # way[turn:both_ways:backward][turn:both_ways:backward!~/^(none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)$/]
-        # way[turn:lanes][turn:lanes!~/^(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)(\|(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*))*$/]
-        # way[turn:lanes:forward][turn:lanes:forward!~/^(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)(\|(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*))*$/]
-        # way[turn:lanes:backward][turn:lanes:backward!~/^(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)(\|(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*))*$/]
-        # way[turn:lanes:both_ways][turn:lanes:both_ways!~/^(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)(\|(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*))*$/]
-        # way[turn:lanes:both_ways:forward][turn:lanes:both_ways:forward!~/^(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)(\|(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*))*$/]
-        # way[turn:lanes:both_ways:backward][turn:lanes:both_ways:backward!~/^(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)(\|(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*))*$/]
+    # way[turn][turn!~/^(none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)$/]
+    # way[turn:forward][turn:forward!~/^(none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)$/]
+    # way[turn:backward][turn:backward!~/^(none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)$/]
+    # way[turn:both_ways][turn:both_ways!~/^(none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)$/]
+    # way[turn:both_ways:forward][turn:both_ways:forward!~/^(none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)$/]
+    # way[turn:both_ways:backward][turn:both_ways:backward!~/^(none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)$/]
+    # way[turn:lanes][turn:lanes!~/^(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)(\|(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*))*$/]
+    # way[turn:lanes:forward][turn:lanes:forward!~/^(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)(\|(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*))*$/]
+    # way[turn:lanes:backward][turn:lanes:backward!~/^(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)(\|(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*))*$/]
+    # way[turn:lanes:both_ways][turn:lanes:both_ways!~/^(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)(\|(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*))*$/]
+    # way[turn:lanes:both_ways:forward][turn:lanes:both_ways:forward!~/^(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)(\|(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*))*$/]
+    # way[turn:lanes:both_ways:backward][turn:lanes:both_ways:backward!~/^(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*)(\|(|none|((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through)(;((sharp_|slight_|merge_to_|slide_)?(left|right)|reverse|through))*))*$/]
+    def _way_rule_11(self, data, tags, nds, keys, err, sets):
         if ('turn' in keys) or ('turn:backward' in keys) or ('turn:both_ways' in keys) or ('turn:both_ways:backward' in keys) or ('turn:both_ways:forward' in keys) or ('turn:forward' in keys) or ('turn:lanes' in keys) or ('turn:lanes:backward' in keys) or ('turn:lanes:both_ways' in keys) or ('turn:lanes:both_ways:backward' in keys) or ('turn:lanes:both_ways:forward' in keys) or ('turn:lanes:forward' in keys):
             match = False
             if not match:
@@ -476,7 +499,8 @@ class Josm_highway(PluginMapCSS):
                 # assertMatch:"way turn=through|right"
                 err.append({'class': 9004014, 'subclass': 1634496690, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[highway=~/^((motorway|trunk|primary|secondary|tertiary)(_link)?|residential|unclassified)$/][area=yes]
+    # way[highway=~/^((motorway|trunk|primary|secondary|tertiary)(_link)?|residential|unclassified)$/][area=yes]
+    def _way_rule_12(self, data, tags, nds, keys, err, sets):
         if ('area' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -492,7 +516,8 @@ class Josm_highway(PluginMapCSS):
                 # assertNoMatch:"way highway=trunk"
                 err.append({'class': 9004011, 'subclass': 610375152, 'text': mapcss.tr('Area with {0} above {1} is invalid', 'highway=*', 'highway=service')})
 
-        # *[surface=~/^paving_stones:(\d+)$/]
+    # *[surface=~/^paving_stones:(\d+)$/]
+    def _way_rule_13(self, data, tags, nds, keys, err, sets):
         if ('surface' in keys):
             match = False
             if not match:
@@ -506,15 +531,33 @@ class Josm_highway(PluginMapCSS):
                 # suggestAlternative:"paving_stones:width"
                 err.append({'class': 9004012, 'subclass': 291757414, 'text': mapcss.tr('{0} with trailing number', 'paving_stones')})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['highway']),
+        (_way_rule_1, ['highway']),
+        (_way_rule_2, ['highway']),
+        (_way_rule_3, ['highway']),
+        (_way_rule_4, ['highway', 'railway']),
+        (_way_rule_5, ['highway']),
+        (_way_rule_6, ['bicycle', 'cycleway', 'foot', 'highway']),
+        (_way_rule_7, ['footway']),
+        (_way_rule_8, ['footway']),
+        (_way_rule_9, ['footway']),
+        (_way_rule_10, ['footway']),
+        (_way_rule_11, ['turn', 'turn:backward', 'turn:both_ways', 'turn:both_ways:backward', 'turn:both_ways:forward', 'turn:forward', 'turn:lanes', 'turn:lanes:backward', 'turn:lanes:both_ways', 'turn:lanes:both_ways:backward', 'turn:lanes:both_ways:forward', 'turn:lanes:forward']),
+        (_way_rule_12, ['area']),
+        (_way_rule_13, ['surface']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
-        set_fixable_footway = set_link_road = set_major_road = set_minor_road = set_not_fixable_footway = False
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-        # relation[highway=~/^((motorway|trunk|primary|secondary|tertiary)(_link)?|residential|unclassified)$/][type=multipolygon]
+    # relation[highway=~/^((motorway|trunk|primary|secondary|tertiary)(_link)?|residential|unclassified)$/][type=multipolygon]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('highway' in keys and 'type' in keys):
             match = False
             if not match:
@@ -528,7 +571,8 @@ class Josm_highway(PluginMapCSS):
                 # assertMatch:"relation highway=trunk type=multipolygon"
                 err.append({'class': 9004011, 'subclass': 2126629809, 'text': mapcss.tr('Area with {0} above {1} is invalid', 'highway=*', 'highway=service')})
 
-        # *[surface=~/^paving_stones:(\d+)$/]
+    # *[surface=~/^paving_stones:(\d+)$/]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('surface' in keys):
             match = False
             if not match:
@@ -542,6 +586,17 @@ class Josm_highway(PluginMapCSS):
                 # suggestAlternative:"paving_stones:width"
                 err.append({'class': 9004012, 'subclass': 291757414, 'text': mapcss.tr('{0} with trailing number', 'paving_stones')})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['highway']),
+        (_relation_rule_1, ['surface']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
@@ -25,20 +25,15 @@ class Josm_multiple(PluginMapCSS):
         self.re_579c7c6a = re.compile(r'^(;.*|.*;;.*|.*;)$')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # *["telecom:medium"=~/.+;(.+)?/]
-        # *["addr:street"=~/.+;(.+)?/]
-        # *[highway=~/.+;(.+)?/]
-        # *[lanes=~/.+;(.+)?/]
-        # *[maxspeed=~/.+;(.+)?/]
-        # *[name=~/.+;(.+)?/]
-        # *[surface=~/.+;(.+)?/]
-        # *[water=~/.+;(.+)?/]
+    # *["telecom:medium"=~/.+;(.+)?/]
+    # *["addr:street"=~/.+;(.+)?/]
+    # *[highway=~/.+;(.+)?/]
+    # *[lanes=~/.+;(.+)?/]
+    # *[maxspeed=~/.+;(.+)?/]
+    # *[name=~/.+;(.+)?/]
+    # *[surface=~/.+;(.+)?/]
+    # *[water=~/.+;(.+)?/]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('addr:street' in keys) or ('highway' in keys) or ('lanes' in keys) or ('maxspeed' in keys) or ('name' in keys) or ('surface' in keys) or ('telecom:medium' in keys) or ('water' in keys):
             match = False
             if not match:
@@ -77,31 +72,32 @@ class Josm_multiple(PluginMapCSS):
                 # throwWarning:tr("{0} with multiple values","{0.key}")
                 err.append({'class': 9005001, 'subclass': 126367661, 'text': mapcss.tr('{0} with multiple values', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[source=~/^(;.*|.*;;.*|.*;)$/]
-        # *["source:addr"=~/^(;.*|.*;;.*|.*;)$/]
-        # *["source:maxspeed"=~/^(;.*|.*;;.*|.*;)$/]
-        # *["source:name"=~/^(;.*|.*;;.*|.*;)$/]
-        # *["source:position"=~/^(;.*|.*;;.*|.*;)$/]
-        # *["source:postcode"=~/^(;.*|.*;;.*|.*;)$/]
-        # *[ref=~/^(;.*|.*;;.*|.*;)$/]
-        # *[int_ref=~/^(;.*|.*;;.*|.*;)$/]
-        # *[old_ref=~/^(;.*|.*;;.*|.*;)$/]
-        # *[source_ref=~/^(;.*|.*;;.*|.*;)$/]
-        # *[route_ref=~/^(;.*|.*;;.*|.*;)$/]
-        # *[attribution=~/^(;.*|.*;;.*|.*;)$/]
-        # *[name=~/^(;.*|.*;;.*|.*;)$/]
-        # *[alt_name=~/^(;.*|.*;;.*|.*;)$/]
-        # *[note=~/^(;.*|.*;;.*|.*;)$/]
-        # *[fixme=~/^(;.*|.*;;.*|.*;)$/]
-        # *["addr:housenumber"=~/^(;.*|.*;;.*|.*;)$/]
-        # *[destination=~/^(;.*|.*;;.*|.*;)$/]
-        # *[exit_to=~/^(;.*|.*;;.*|.*;)$/]
-        # *[surface=~/^(;.*|.*;;.*|.*;)$/]
-        # *["building:use"=~/^(;.*|.*;;.*|.*;)$/]
-        # *[traffic_sign=~/^(;.*|.*;;.*|.*;)$/]
-        # *[voltage=~/^(;.*|.*;;.*|.*;)$/]
-        # *[sport=~/^(;.*|.*;;.*|.*;)$/]
-        # *[cuisine=~/^(;.*|.*;;.*|.*;)$/]
+    # *[source=~/^(;.*|.*;;.*|.*;)$/]
+    # *["source:addr"=~/^(;.*|.*;;.*|.*;)$/]
+    # *["source:maxspeed"=~/^(;.*|.*;;.*|.*;)$/]
+    # *["source:name"=~/^(;.*|.*;;.*|.*;)$/]
+    # *["source:position"=~/^(;.*|.*;;.*|.*;)$/]
+    # *["source:postcode"=~/^(;.*|.*;;.*|.*;)$/]
+    # *[ref=~/^(;.*|.*;;.*|.*;)$/]
+    # *[int_ref=~/^(;.*|.*;;.*|.*;)$/]
+    # *[old_ref=~/^(;.*|.*;;.*|.*;)$/]
+    # *[source_ref=~/^(;.*|.*;;.*|.*;)$/]
+    # *[route_ref=~/^(;.*|.*;;.*|.*;)$/]
+    # *[attribution=~/^(;.*|.*;;.*|.*;)$/]
+    # *[name=~/^(;.*|.*;;.*|.*;)$/]
+    # *[alt_name=~/^(;.*|.*;;.*|.*;)$/]
+    # *[note=~/^(;.*|.*;;.*|.*;)$/]
+    # *[fixme=~/^(;.*|.*;;.*|.*;)$/]
+    # *["addr:housenumber"=~/^(;.*|.*;;.*|.*;)$/]
+    # *[destination=~/^(;.*|.*;;.*|.*;)$/]
+    # *[exit_to=~/^(;.*|.*;;.*|.*;)$/]
+    # *[surface=~/^(;.*|.*;;.*|.*;)$/]
+    # *["building:use"=~/^(;.*|.*;;.*|.*;)$/]
+    # *[traffic_sign=~/^(;.*|.*;;.*|.*;)$/]
+    # *[voltage=~/^(;.*|.*;;.*|.*;)$/]
+    # *[sport=~/^(;.*|.*;;.*|.*;)$/]
+    # *[cuisine=~/^(;.*|.*;;.*|.*;)$/]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('addr:housenumber' in keys) or ('alt_name' in keys) or ('attribution' in keys) or ('building:use' in keys) or ('cuisine' in keys) or ('destination' in keys) or ('exit_to' in keys) or ('fixme' in keys) or ('int_ref' in keys) or ('name' in keys) or ('note' in keys) or ('old_ref' in keys) or ('ref' in keys) or ('route_ref' in keys) or ('source' in keys) or ('source:addr' in keys) or ('source:maxspeed' in keys) or ('source:name' in keys) or ('source:position' in keys) or ('source:postcode' in keys) or ('source_ref' in keys) or ('sport' in keys) or ('surface' in keys) or ('traffic_sign' in keys) or ('voltage' in keys):
             match = False
             if not match:
@@ -214,22 +210,28 @@ class Josm_multiple(PluginMapCSS):
                 # assertNoMatch:"node ref=A1;A2"
                 err.append({'class': 9005002, 'subclass': 1082723721, 'text': mapcss.tr('empty value in semicolon-separated \'\'{0}\'\'', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['addr:street', 'highway', 'lanes', 'maxspeed', 'name', 'surface', 'telecom:medium', 'water']),
+        (_node_rule_1, ['addr:housenumber', 'alt_name', 'attribution', 'building:use', 'cuisine', 'destination', 'exit_to', 'fixme', 'int_ref', 'name', 'note', 'old_ref', 'ref', 'route_ref', 'source', 'source:addr', 'source:maxspeed', 'source:name', 'source:position', 'source:postcode', 'source_ref', 'sport', 'surface', 'traffic_sign', 'voltage']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # *["telecom:medium"=~/.+;(.+)?/]
-        # *["addr:street"=~/.+;(.+)?/]
-        # *[highway=~/.+;(.+)?/]
-        # *[lanes=~/.+;(.+)?/]
-        # *[maxspeed=~/.+;(.+)?/]
-        # *[name=~/.+;(.+)?/]
-        # *[surface=~/.+;(.+)?/]
-        # *[water=~/.+;(.+)?/]
+    # *["telecom:medium"=~/.+;(.+)?/]
+    # *["addr:street"=~/.+;(.+)?/]
+    # *[highway=~/.+;(.+)?/]
+    # *[lanes=~/.+;(.+)?/]
+    # *[maxspeed=~/.+;(.+)?/]
+    # *[name=~/.+;(.+)?/]
+    # *[surface=~/.+;(.+)?/]
+    # *[water=~/.+;(.+)?/]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('addr:street' in keys) or ('highway' in keys) or ('lanes' in keys) or ('maxspeed' in keys) or ('name' in keys) or ('surface' in keys) or ('telecom:medium' in keys) or ('water' in keys):
             match = False
             if not match:
@@ -268,31 +270,32 @@ class Josm_multiple(PluginMapCSS):
                 # throwWarning:tr("{0} with multiple values","{0.key}")
                 err.append({'class': 9005001, 'subclass': 126367661, 'text': mapcss.tr('{0} with multiple values', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[source=~/^(;.*|.*;;.*|.*;)$/]
-        # *["source:addr"=~/^(;.*|.*;;.*|.*;)$/]
-        # *["source:maxspeed"=~/^(;.*|.*;;.*|.*;)$/]
-        # *["source:name"=~/^(;.*|.*;;.*|.*;)$/]
-        # *["source:position"=~/^(;.*|.*;;.*|.*;)$/]
-        # *["source:postcode"=~/^(;.*|.*;;.*|.*;)$/]
-        # *[ref=~/^(;.*|.*;;.*|.*;)$/]
-        # *[int_ref=~/^(;.*|.*;;.*|.*;)$/]
-        # *[old_ref=~/^(;.*|.*;;.*|.*;)$/]
-        # *[source_ref=~/^(;.*|.*;;.*|.*;)$/]
-        # *[route_ref=~/^(;.*|.*;;.*|.*;)$/]
-        # *[attribution=~/^(;.*|.*;;.*|.*;)$/]
-        # *[name=~/^(;.*|.*;;.*|.*;)$/]
-        # *[alt_name=~/^(;.*|.*;;.*|.*;)$/]
-        # *[note=~/^(;.*|.*;;.*|.*;)$/]
-        # *[fixme=~/^(;.*|.*;;.*|.*;)$/]
-        # *["addr:housenumber"=~/^(;.*|.*;;.*|.*;)$/]
-        # *[destination=~/^(;.*|.*;;.*|.*;)$/]
-        # *[exit_to=~/^(;.*|.*;;.*|.*;)$/]
-        # *[surface=~/^(;.*|.*;;.*|.*;)$/]
-        # *["building:use"=~/^(;.*|.*;;.*|.*;)$/]
-        # *[traffic_sign=~/^(;.*|.*;;.*|.*;)$/]
-        # *[voltage=~/^(;.*|.*;;.*|.*;)$/]
-        # *[sport=~/^(;.*|.*;;.*|.*;)$/]
-        # *[cuisine=~/^(;.*|.*;;.*|.*;)$/]
+    # *[source=~/^(;.*|.*;;.*|.*;)$/]
+    # *["source:addr"=~/^(;.*|.*;;.*|.*;)$/]
+    # *["source:maxspeed"=~/^(;.*|.*;;.*|.*;)$/]
+    # *["source:name"=~/^(;.*|.*;;.*|.*;)$/]
+    # *["source:position"=~/^(;.*|.*;;.*|.*;)$/]
+    # *["source:postcode"=~/^(;.*|.*;;.*|.*;)$/]
+    # *[ref=~/^(;.*|.*;;.*|.*;)$/]
+    # *[int_ref=~/^(;.*|.*;;.*|.*;)$/]
+    # *[old_ref=~/^(;.*|.*;;.*|.*;)$/]
+    # *[source_ref=~/^(;.*|.*;;.*|.*;)$/]
+    # *[route_ref=~/^(;.*|.*;;.*|.*;)$/]
+    # *[attribution=~/^(;.*|.*;;.*|.*;)$/]
+    # *[name=~/^(;.*|.*;;.*|.*;)$/]
+    # *[alt_name=~/^(;.*|.*;;.*|.*;)$/]
+    # *[note=~/^(;.*|.*;;.*|.*;)$/]
+    # *[fixme=~/^(;.*|.*;;.*|.*;)$/]
+    # *["addr:housenumber"=~/^(;.*|.*;;.*|.*;)$/]
+    # *[destination=~/^(;.*|.*;;.*|.*;)$/]
+    # *[exit_to=~/^(;.*|.*;;.*|.*;)$/]
+    # *[surface=~/^(;.*|.*;;.*|.*;)$/]
+    # *["building:use"=~/^(;.*|.*;;.*|.*;)$/]
+    # *[traffic_sign=~/^(;.*|.*;;.*|.*;)$/]
+    # *[voltage=~/^(;.*|.*;;.*|.*;)$/]
+    # *[sport=~/^(;.*|.*;;.*|.*;)$/]
+    # *[cuisine=~/^(;.*|.*;;.*|.*;)$/]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('addr:housenumber' in keys) or ('alt_name' in keys) or ('attribution' in keys) or ('building:use' in keys) or ('cuisine' in keys) or ('destination' in keys) or ('exit_to' in keys) or ('fixme' in keys) or ('int_ref' in keys) or ('name' in keys) or ('note' in keys) or ('old_ref' in keys) or ('ref' in keys) or ('route_ref' in keys) or ('source' in keys) or ('source:addr' in keys) or ('source:maxspeed' in keys) or ('source:name' in keys) or ('source:position' in keys) or ('source:postcode' in keys) or ('source_ref' in keys) or ('sport' in keys) or ('surface' in keys) or ('traffic_sign' in keys) or ('voltage' in keys):
             match = False
             if not match:
@@ -399,22 +402,28 @@ class Josm_multiple(PluginMapCSS):
                 # throwWarning:tr("empty value in semicolon-separated ''{0}''","{0.key}")
                 err.append({'class': 9005002, 'subclass': 1082723721, 'text': mapcss.tr('empty value in semicolon-separated \'\'{0}\'\'', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['addr:street', 'highway', 'lanes', 'maxspeed', 'name', 'surface', 'telecom:medium', 'water']),
+        (_way_rule_1, ['addr:housenumber', 'alt_name', 'attribution', 'building:use', 'cuisine', 'destination', 'exit_to', 'fixme', 'int_ref', 'name', 'note', 'old_ref', 'ref', 'route_ref', 'source', 'source:addr', 'source:maxspeed', 'source:name', 'source:position', 'source:postcode', 'source_ref', 'sport', 'surface', 'traffic_sign', 'voltage']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # *["telecom:medium"=~/.+;(.+)?/]
-        # *["addr:street"=~/.+;(.+)?/]
-        # *[highway=~/.+;(.+)?/]
-        # *[lanes=~/.+;(.+)?/]
-        # *[maxspeed=~/.+;(.+)?/]
-        # *[name=~/.+;(.+)?/]
-        # *[surface=~/.+;(.+)?/]
-        # *[water=~/.+;(.+)?/]
+    # *["telecom:medium"=~/.+;(.+)?/]
+    # *["addr:street"=~/.+;(.+)?/]
+    # *[highway=~/.+;(.+)?/]
+    # *[lanes=~/.+;(.+)?/]
+    # *[maxspeed=~/.+;(.+)?/]
+    # *[name=~/.+;(.+)?/]
+    # *[surface=~/.+;(.+)?/]
+    # *[water=~/.+;(.+)?/]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('addr:street' in keys) or ('highway' in keys) or ('lanes' in keys) or ('maxspeed' in keys) or ('name' in keys) or ('surface' in keys) or ('telecom:medium' in keys) or ('water' in keys):
             match = False
             if not match:
@@ -453,31 +462,32 @@ class Josm_multiple(PluginMapCSS):
                 # throwWarning:tr("{0} with multiple values","{0.key}")
                 err.append({'class': 9005001, 'subclass': 126367661, 'text': mapcss.tr('{0} with multiple values', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[source=~/^(;.*|.*;;.*|.*;)$/]
-        # *["source:addr"=~/^(;.*|.*;;.*|.*;)$/]
-        # *["source:maxspeed"=~/^(;.*|.*;;.*|.*;)$/]
-        # *["source:name"=~/^(;.*|.*;;.*|.*;)$/]
-        # *["source:position"=~/^(;.*|.*;;.*|.*;)$/]
-        # *["source:postcode"=~/^(;.*|.*;;.*|.*;)$/]
-        # *[ref=~/^(;.*|.*;;.*|.*;)$/]
-        # *[int_ref=~/^(;.*|.*;;.*|.*;)$/]
-        # *[old_ref=~/^(;.*|.*;;.*|.*;)$/]
-        # *[source_ref=~/^(;.*|.*;;.*|.*;)$/]
-        # *[route_ref=~/^(;.*|.*;;.*|.*;)$/]
-        # *[attribution=~/^(;.*|.*;;.*|.*;)$/]
-        # *[name=~/^(;.*|.*;;.*|.*;)$/]
-        # *[alt_name=~/^(;.*|.*;;.*|.*;)$/]
-        # *[note=~/^(;.*|.*;;.*|.*;)$/]
-        # *[fixme=~/^(;.*|.*;;.*|.*;)$/]
-        # *["addr:housenumber"=~/^(;.*|.*;;.*|.*;)$/]
-        # *[destination=~/^(;.*|.*;;.*|.*;)$/]
-        # *[exit_to=~/^(;.*|.*;;.*|.*;)$/]
-        # *[surface=~/^(;.*|.*;;.*|.*;)$/]
-        # *["building:use"=~/^(;.*|.*;;.*|.*;)$/]
-        # *[traffic_sign=~/^(;.*|.*;;.*|.*;)$/]
-        # *[voltage=~/^(;.*|.*;;.*|.*;)$/]
-        # *[sport=~/^(;.*|.*;;.*|.*;)$/]
-        # *[cuisine=~/^(;.*|.*;;.*|.*;)$/]
+    # *[source=~/^(;.*|.*;;.*|.*;)$/]
+    # *["source:addr"=~/^(;.*|.*;;.*|.*;)$/]
+    # *["source:maxspeed"=~/^(;.*|.*;;.*|.*;)$/]
+    # *["source:name"=~/^(;.*|.*;;.*|.*;)$/]
+    # *["source:position"=~/^(;.*|.*;;.*|.*;)$/]
+    # *["source:postcode"=~/^(;.*|.*;;.*|.*;)$/]
+    # *[ref=~/^(;.*|.*;;.*|.*;)$/]
+    # *[int_ref=~/^(;.*|.*;;.*|.*;)$/]
+    # *[old_ref=~/^(;.*|.*;;.*|.*;)$/]
+    # *[source_ref=~/^(;.*|.*;;.*|.*;)$/]
+    # *[route_ref=~/^(;.*|.*;;.*|.*;)$/]
+    # *[attribution=~/^(;.*|.*;;.*|.*;)$/]
+    # *[name=~/^(;.*|.*;;.*|.*;)$/]
+    # *[alt_name=~/^(;.*|.*;;.*|.*;)$/]
+    # *[note=~/^(;.*|.*;;.*|.*;)$/]
+    # *[fixme=~/^(;.*|.*;;.*|.*;)$/]
+    # *["addr:housenumber"=~/^(;.*|.*;;.*|.*;)$/]
+    # *[destination=~/^(;.*|.*;;.*|.*;)$/]
+    # *[exit_to=~/^(;.*|.*;;.*|.*;)$/]
+    # *[surface=~/^(;.*|.*;;.*|.*;)$/]
+    # *["building:use"=~/^(;.*|.*;;.*|.*;)$/]
+    # *[traffic_sign=~/^(;.*|.*;;.*|.*;)$/]
+    # *[voltage=~/^(;.*|.*;;.*|.*;)$/]
+    # *[sport=~/^(;.*|.*;;.*|.*;)$/]
+    # *[cuisine=~/^(;.*|.*;;.*|.*;)$/]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('addr:housenumber' in keys) or ('alt_name' in keys) or ('attribution' in keys) or ('building:use' in keys) or ('cuisine' in keys) or ('destination' in keys) or ('exit_to' in keys) or ('fixme' in keys) or ('int_ref' in keys) or ('name' in keys) or ('note' in keys) or ('old_ref' in keys) or ('ref' in keys) or ('route_ref' in keys) or ('source' in keys) or ('source:addr' in keys) or ('source:maxspeed' in keys) or ('source:name' in keys) or ('source:position' in keys) or ('source:postcode' in keys) or ('source_ref' in keys) or ('sport' in keys) or ('surface' in keys) or ('traffic_sign' in keys) or ('voltage' in keys):
             match = False
             if not match:
@@ -584,6 +594,17 @@ class Josm_multiple(PluginMapCSS):
                 # throwWarning:tr("empty value in semicolon-separated ''{0}''","{0.key}")
                 err.append({'class': 9005002, 'subclass': 1082723721, 'text': mapcss.tr('empty value in semicolon-separated \'\'{0}\'\'', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['addr:street', 'highway', 'lanes', 'maxspeed', 'name', 'surface', 'telecom:medium', 'water']),
+        (_relation_rule_1, ['addr:housenumber', 'alt_name', 'attribution', 'building:use', 'cuisine', 'destination', 'exit_to', 'fixme', 'int_ref', 'name', 'note', 'old_ref', 'ref', 'route_ref', 'source', 'source:addr', 'source:maxspeed', 'source:name', 'source:position', 'source:postcode', 'source_ref', 'sport', 'surface', 'traffic_sign', 'voltage']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
@@ -90,13 +90,8 @@ class Josm_numeric(PluginMapCSS):
         self.re_7f19b94b = re.compile(r'^((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5)(;((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5))*$')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-        set__unit_auto_fix = set_ele_meter_remove_autofix = set_ele_separator_autofix = set_imprecise_gauge = set_maxstay_autofix = set_negative_value = set_unusual_gauge = set_zero_roof_height_flat = False
-
-        # *[/^[0-9]+$/]
+    # *[/^[0-9]+$/]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -107,7 +102,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("numerical key")
                 err.append({'class': 9006001, 'subclass': 750700308, 'text': mapcss.tr('numerical key')})
 
-        # *[layer=~/^\+\d/]
+    # *[layer=~/^\+\d/]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('layer' in keys):
             match = False
             if not match:
@@ -126,7 +122,8 @@ class Josm_numeric(PluginMapCSS):
                     (mapcss.concat('layer=', mapcss.replace(mapcss.tag(tags, 'layer'), '+', ''))).split('=', 1)])
                 }})
 
-        # *[layer][layer!~/^0$|^(-|\+)?[1-5]$/]
+    # *[layer][layer!~/^0$|^(-|\+)?[1-5]$/]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('layer' in keys):
             match = False
             if not match:
@@ -146,7 +143,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"node layer=6"
                 err.append({'class': 9006003, 'subclass': 1089386010, 'text': mapcss.tr('{0} should be an integer value between -5 and 5', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[building:levels^="-"]
+    # *[building:levels^="-"]
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('building:levels' in keys):
             match = False
             if not match:
@@ -162,16 +160,17 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"node building:levels=1"
                 # assertNoMatch:"node building:levels=foo"
                 # assertNoMatch:"node level=-1"
-                set_negative_value = True
+                sets.add('negative_value')
                 err.append({'class': 9006023, 'subclass': 29188290, 'text': mapcss.tr('negative {0} value', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[building:levels][building:levels!~/^(([0-9]|[1-9][0-9]*)(\.5)?)$/]!.negative_value
-        # *[level][level!~/^((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5)(;((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5))*$/]
+    # *[building:levels][building:levels!~/^(([0-9]|[1-9][0-9]*)(\.5)?)$/]!.negative_value
+    # *[level][level!~/^((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5)(;((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5))*$/]
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if ('building:levels' in keys) or ('level' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_negative_value) and (mapcss._tag_capture(capture_tags, 0, tags, 'building:levels')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2a784076, '^(([0-9]|[1-9][0-9]*)(\\.5)?)$'), mapcss._tag_capture(capture_tags, 1, tags, 'building:levels'))))
+                try: match = (('negative_value' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'building:levels')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2a784076, '^(([0-9]|[1-9][0-9]*)(\\.5)?)$'), mapcss._tag_capture(capture_tags, 1, tags, 'building:levels'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
@@ -203,7 +202,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"node level=one"
                 err.append({'class': 9006004, 'subclass': 1292315112, 'text': mapcss.tr('{0} should have numbers only with optional .5 increments', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[roof:height][siunit_length(tag("roof:height"))==0][roof:shape=flat]
+    # *[roof:height][siunit_length(tag("roof:height"))==0][roof:shape=flat]
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('roof:height' in keys and 'roof:shape' in keys):
             match = False
             if not match:
@@ -219,19 +219,20 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"node roof:height=0 roof:shape=gabled"
                 # assertMatch:"node roof:shape=flat roof:height=\"00.00000 ft\" roof:shape=flat"
                 # assertNoMatch:"node roof:shape=flat roof:height=2 m roof:shape=flat"
-                set_zero_roof_height_flat = True
+                sets.add('zero_roof_height_flat')
                 err.append({'class': 9006025, 'subclass': 301901487, 'text': mapcss.tr('{0} is unnecessary for {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}')), 'allow_fix_override': True, 'fix': {
                     '-': ([
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[height][height=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
-        # *[roof:height][roof:height=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]!.zero_roof_height_flat
-        # *[width][width=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
-        # *[maxwidth][maxwidth=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
-        # *[min_height][min_height=~/^(?i)-?[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
-        # *[maxheight][maxheight=~/^(?i)[1-9][0-9]*([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
-        # *[maxlength][maxlength=~/^(?i)[1-9][0-9]*([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[height][height=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[roof:height][roof:height=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]!.zero_roof_height_flat
+    # *[width][width=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[maxwidth][maxwidth=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[min_height][min_height=~/^(?i)-?[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[maxheight][maxheight=~/^(?i)[1-9][0-9]*([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[maxlength][maxlength=~/^(?i)[1-9][0-9]*([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if ('height' in keys) or ('maxheight' in keys) or ('maxlength' in keys) or ('maxwidth' in keys) or ('min_height' in keys) or ('roof:height' in keys) or ('width' in keys):
             match = False
             if not match:
@@ -240,7 +241,7 @@ class Josm_numeric(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_zero_roof_height_flat) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_5dbcb7bc), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
+                try: match = (('zero_roof_height_flat' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_5dbcb7bc), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
@@ -302,18 +303,19 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"node width=5  metre"
                 # assertNoMatch:"node width=5"
                 # assertMatch:"node width=6.78 meters"
-                set__unit_auto_fix = True
+                sets.add('_unit_auto_fix')
                 err.append({'class': 9006024, 'subclass': 1245344673, 'text': mapcss.tr('unusual value of {0}: use abbreviation for unit and space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}'), '=', mapcss.get(mapcss.regexp_match(self.re_6ae26377, mapcss._tag_uncapture(capture_tags, '{0.value}')), 1), ' m')).split('=', 1)])
                 }})
 
-        # *[height][height=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
-        # *[maxheight][maxheight=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
-        # *[roof:height][roof:height=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]!.zero_roof_height_flat
-        # *[maxlength][maxlength=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
-        # *[width][width=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
-        # *[maxwidth][maxwidth=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    # *[height][height=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    # *[maxheight][maxheight=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    # *[roof:height][roof:height=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]!.zero_roof_height_flat
+    # *[maxlength][maxlength=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    # *[width][width=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    # *[maxwidth][maxwidth=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    def _node_rule_7(self, data, tags, keys, err, sets):
         if ('height' in keys) or ('maxheight' in keys) or ('maxlength' in keys) or ('maxwidth' in keys) or ('roof:height' in keys) or ('width' in keys):
             match = False
             if not match:
@@ -326,7 +328,7 @@ class Josm_numeric(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_zero_roof_height_flat) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_549d66c4), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
+                try: match = (('zero_roof_height_flat' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_549d66c4), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
@@ -374,22 +376,23 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"node width=5  Feet"
                 # assertNoMatch:"node width=5"
                 # assertMatch:"node width=6.78 foot"
-                set__unit_auto_fix = True
+                sets.add('_unit_auto_fix')
                 err.append({'class': 9006031, 'subclass': 1118826626, 'text': mapcss.tr('unusual value of {0}: use \'\' for foot and " for inches, no spaces', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}'), '=', mapcss.get(mapcss.regexp_match(self.re_6ae26377, mapcss._tag_uncapture(capture_tags, '{0.value}')), 1), '\'')).split('=', 1)])
                 }})
 
-        # *[height][height=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[maxheight][maxheight=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[roof:height][roof:height=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[maxlength][maxlength=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[width][width=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[maxwidth][maxwidth=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[min_height][min_height=~/^-?[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[maxaxleload][maxaxleload=~/^[0-9]+,[0-9][0-9]?( (t|kg|st|lbs))?$/]
-        # *[maxweight][maxweight=~/^[0-9]+,[0-9][0-9]?( (t|kg|st|lbs))?$/]
-        # *[distance][distance=~/^[0-9]+,[0-9][0-9]?( (m|km|mi|nmi))?$/]
+    # *[height][height=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[maxheight][maxheight=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[roof:height][roof:height=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[maxlength][maxlength=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[width][width=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[maxwidth][maxwidth=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[min_height][min_height=~/^-?[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[maxaxleload][maxaxleload=~/^[0-9]+,[0-9][0-9]?( (t|kg|st|lbs))?$/]
+    # *[maxweight][maxweight=~/^[0-9]+,[0-9][0-9]?( (t|kg|st|lbs))?$/]
+    # *[distance][distance=~/^[0-9]+,[0-9][0-9]?( (m|km|mi|nmi))?$/]
+    def _node_rule_8(self, data, tags, keys, err, sets):
         if ('distance' in keys) or ('height' in keys) or ('maxaxleload' in keys) or ('maxheight' in keys) or ('maxlength' in keys) or ('maxweight' in keys) or ('maxwidth' in keys) or ('min_height' in keys) or ('roof:height' in keys) or ('width' in keys):
             match = False
             if not match:
@@ -501,48 +504,49 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"node width=3.5"
                 # assertNoMatch:"node width=4"
                 # assertMatch:"node width=5,5"
-                set__unit_auto_fix = True
+                sets.add('_unit_auto_fix')
                 err.append({'class': 9006017, 'subclass': 1619669445, 'text': mapcss.tr('unusual value of {0}: use . instead of , as decimal separator', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}'), '=', mapcss.replace(mapcss.tag(tags, mapcss._tag_uncapture(capture_tags, '{0.key}')), ',', '.'))).split('=', 1)])
                 }})
 
-        # *[height][height!~/^(([0-9]+(\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!._unit_auto_fix
-        # *[maxheight][maxheight!~/^(([1-9][0-9]*(\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\.[0-9]*)?\")?)|none|default|below_default)$/]!._unit_auto_fix
-        # *[min_height][min_height!~/^(-?([0-9]+(\.[0-9]+)?( m)?)|(-?[1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!._unit_auto_fix
-        # *[roof:height][roof:height!~/^(([0-9]+(\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!.zero_roof_height_flat!._unit_auto_fix
-        # *[maxlength][maxlength!~/^(([1-9][0-9]*(\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\.[0-9]*)?\")?)|none|default|below_default)$/]!._unit_auto_fix
-        # *[width][width!~/^(([0-9]+(\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]!._unit_auto_fix
-        # *[maxwidth][maxwidth!~/^(([0-9]+(\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]!._unit_auto_fix
+    # *[height][height!~/^(([0-9]+(\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!._unit_auto_fix
+    # *[maxheight][maxheight!~/^(([1-9][0-9]*(\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\.[0-9]*)?\")?)|none|default|below_default)$/]!._unit_auto_fix
+    # *[min_height][min_height!~/^(-?([0-9]+(\.[0-9]+)?( m)?)|(-?[1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!._unit_auto_fix
+    # *[roof:height][roof:height!~/^(([0-9]+(\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!.zero_roof_height_flat!._unit_auto_fix
+    # *[maxlength][maxlength!~/^(([1-9][0-9]*(\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\.[0-9]*)?\")?)|none|default|below_default)$/]!._unit_auto_fix
+    # *[width][width!~/^(([0-9]+(\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]!._unit_auto_fix
+    # *[maxwidth][maxwidth!~/^(([0-9]+(\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]!._unit_auto_fix
+    def _node_rule_9(self, data, tags, keys, err, sets):
         if ('height' in keys) or ('maxheight' in keys) or ('maxlength' in keys) or ('maxwidth' in keys) or ('min_height' in keys) or ('roof:height' in keys) or ('width' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_76fe90df, '^(([0-9]+(\\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'height'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_76fe90df, '^(([0-9]+(\\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'height'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxheight')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_40277cab, '^(([1-9][0-9]*(\\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\\.[0-9]*)?\\")?)|none|default|below_default)$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxheight'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxheight')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_40277cab, '^(([1-9][0-9]*(\\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\\.[0-9]*)?\\")?)|none|default|below_default)$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxheight'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'min_height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_470ea515, '^(-?([0-9]+(\\.[0-9]+)?( m)?)|(-?[1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'min_height'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'min_height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_470ea515, '^(-?([0-9]+(\\.[0-9]+)?( m)?)|(-?[1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'min_height'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_zero_roof_height_flat) and (not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_76fe90df, '^(([0-9]+(\\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
+                try: match = (('zero_roof_height_flat' not in sets) and ('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_76fe90df, '^(([0-9]+(\\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxlength')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_40277cab, '^(([1-9][0-9]*(\\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\\.[0-9]*)?\\")?)|none|default|below_default)$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxlength'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxlength')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_40277cab, '^(([1-9][0-9]*(\\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\\.[0-9]*)?\\")?)|none|default|below_default)$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxlength'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'width')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4a678586, '^(([0-9]+(\\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\\.[0-9]+)?\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'width'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'width')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4a678586, '^(([0-9]+(\\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\\.[0-9]+)?\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'width'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxwidth')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4a678586, '^(([0-9]+(\\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\\.[0-9]+)?\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxwidth'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxwidth')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4a678586, '^(([0-9]+(\\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\\.[0-9]+)?\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxwidth'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwWarning:tr("unusual value of {0}: meters is default; only positive values; point is decimal separator; if units, put space then unit","{0.key}")
@@ -567,8 +571,9 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"node width=10'5\""
                 err.append({'class': 9006032, 'subclass': 516585238, 'text': mapcss.tr('unusual value of {0}: meters is default; only positive values; point is decimal separator; if units, put space then unit', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[maxaxleload][maxaxleload!~/^([0-9]+(\.[0-9]+)?( (t|kg|st|lbs))?)$/]
-        # *[maxweight][maxweight!~/^([0-9]+(\.[0-9]+)?( (t|kg|st|lbs))?)$/]
+    # *[maxaxleload][maxaxleload!~/^([0-9]+(\.[0-9]+)?( (t|kg|st|lbs))?)$/]
+    # *[maxweight][maxweight!~/^([0-9]+(\.[0-9]+)?( (t|kg|st|lbs))?)$/]
+    def _node_rule_10(self, data, tags, keys, err, sets):
         if ('maxaxleload' in keys) or ('maxweight' in keys):
             match = False
             if not match:
@@ -588,7 +593,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"node maxweight=-5"
                 err.append({'class': 9006026, 'subclass': 326659919, 'text': mapcss.tr('unusual value of {0}: {1} is default; only positive values; point is decimal separator; if units, put space then unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss.tr('tonne'))})
 
-        # *[distance][distance!~/^(([0-9]+(\.[0-9]+)?( (m|km|mi|nmi))?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]
+    # *[distance][distance!~/^(([0-9]+(\.[0-9]+)?( (m|km|mi|nmi))?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]
+    def _node_rule_11(self, data, tags, keys, err, sets):
         if ('distance' in keys):
             match = False
             if not match:
@@ -599,7 +605,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("unusual value of {0}: {1} is default; only positive values; point is decimal separator; if units, put space then unit","{0.key}",tr("kilometers"))
                 err.append({'class': 9006026, 'subclass': 1210743405, 'text': mapcss.tr('unusual value of {0}: {1} is default; only positive values; point is decimal separator; if units, put space then unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss.tr('kilometers'))})
 
-        # *[population][population!~/^[0-9]+$/]
+    # *[population][population!~/^[0-9]+$/]
+    def _node_rule_12(self, data, tags, keys, err, sets):
         if ('population' in keys):
             match = False
             if not match:
@@ -610,8 +617,9 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("{0} must be a numeric value","{0.key}")
                 err.append({'class': 9006008, 'subclass': 313743521, 'text': mapcss.tr('{0} must be a numeric value', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # node[seats][seats!~/^[1-9]([0-9]*)$/][amenity=bench]
-        # *[screen][screen!~/^[1-9]([0-9]*)$/][amenity=cinema]
+    # node[seats][seats!~/^[1-9]([0-9]*)$/][amenity=bench]
+    # *[screen][screen!~/^[1-9]([0-9]*)$/][amenity=cinema]
+    def _node_rule_13(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'screen' in keys) or ('amenity' in keys and 'seats' in keys):
             match = False
             if not match:
@@ -628,7 +636,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"node amenity=cinema screen=led"
                 err.append({'class': 9006009, 'subclass': 2104305963, 'text': mapcss.tr('{0} must be a positive integer number', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[admin_level][admin_level!~/^(1|2|3|4|5|6|7|8|9|10|11|12)$/]
+    # *[admin_level][admin_level!~/^(1|2|3|4|5|6|7|8|9|10|11|12)$/]
+    def _node_rule_14(self, data, tags, keys, err, sets):
         if ('admin_level' in keys):
             match = False
             if not match:
@@ -643,9 +652,10 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"node admin_level=5"
                 err.append({'class': 9006010, 'subclass': 1514270237, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[direction][direction<0]
-        # *[direction][direction>=360]
-        # *[direction][direction!~/^([0-9][0-9]?[0-9]?|north|east|south|west|N|E|S|W|NE|SE|SW|NW|NNE|ENE|ESE|SSE|SSW|WSW|WNW|NNW|forward|backward|both|clockwise|anti-clockwise|anticlockwise|up|down)((-|;)([0-9][0-9]?[0-9]?|N|E|S|W|NE|SE|SW|NW|NNE|ENE|ESE|SSE|SSW|WSW|WNW|NNW))*$/]
+    # *[direction][direction<0]
+    # *[direction][direction>=360]
+    # *[direction][direction!~/^([0-9][0-9]?[0-9]?|north|east|south|west|N|E|S|W|NE|SE|SW|NW|NNE|ENE|ESE|SSE|SSW|WSW|WNW|NNW|forward|backward|both|clockwise|anti-clockwise|anticlockwise|up|down)((-|;)([0-9][0-9]?[0-9]?|N|E|S|W|NE|SE|SW|NW|NNE|ENE|ESE|SSE|SSW|WSW|WNW|NNW))*$/]
+    def _node_rule_15(self, data, tags, keys, err, sets):
         if ('direction' in keys):
             match = False
             if not match:
@@ -689,7 +699,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"node direction=west"
                 err.append({'class': 9006010, 'subclass': 51356092, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[ele][ele=~/^-?[0-9]+(\.[0-9]+)? ?m$/]
+    # *[ele][ele=~/^-?[0-9]+(\.[0-9]+)? ?m$/]
+    def _node_rule_16(self, data, tags, keys, err, sets):
         if ('ele' in keys):
             match = False
             if not match:
@@ -707,13 +718,14 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"node ele=12km"
                 # assertMatch:"node ele=12m"
                 # assertNoMatch:"node ele=high"
-                set_ele_meter_remove_autofix = True
+                sets.add('ele_meter_remove_autofix')
                 err.append({'class': 9006011, 'subclass': 1672584043, 'text': mapcss.tr('{0} must be a numeric value, in meters and without units', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('ele=', mapcss.trim(mapcss.replace(mapcss.tag(tags, 'ele'), 'm', '')))).split('=', 1)])
                 }})
 
-        # *[ele][ele=~/^[0-9]+,[0-9][0-9]?$/]
+    # *[ele][ele=~/^[0-9]+,[0-9][0-9]?$/]
+    def _node_rule_17(self, data, tags, keys, err, sets):
         if ('ele' in keys):
             match = False
             if not match:
@@ -730,18 +742,19 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"node ele=4"
                 # assertMatch:"node ele=5,5"
                 # assertNoMatch:"node ele=8,848"
-                set_ele_separator_autofix = True
+                sets.add('ele_separator_autofix')
                 err.append({'class': 9006017, 'subclass': 202511106, 'text': mapcss.tr('unusual value of {0}: use . instead of , as decimal separator', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('ele=', mapcss.replace(mapcss.tag(tags, 'ele'), ',', '.'))).split('=', 1)])
                 }})
 
-        # *[ele][ele!~/^-?[0-9]+(\.[0-9]+)?$/]!.ele_meter_remove_autofix!.ele_separator_autofix
+    # *[ele][ele!~/^-?[0-9]+(\.[0-9]+)?$/]!.ele_meter_remove_autofix!.ele_separator_autofix
+    def _node_rule_18(self, data, tags, keys, err, sets):
         if ('ele' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_ele_meter_remove_autofix) and (not set_ele_separator_autofix) and (mapcss._tag_capture(capture_tags, 0, tags, 'ele')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_45b46d60, '^-?[0-9]+(\\.[0-9]+)?$'), mapcss._tag_capture(capture_tags, 1, tags, 'ele'))))
+                try: match = (('ele_meter_remove_autofix' not in sets) and ('ele_separator_autofix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'ele')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_45b46d60, '^-?[0-9]+(\\.[0-9]+)?$'), mapcss._tag_capture(capture_tags, 1, tags, 'ele'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwWarning:tr("{0} must be a numeric value, in meters and without units","{0.key}")
@@ -754,7 +767,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"node ele=high"
                 err.append({'class': 9006011, 'subclass': 1781084832, 'text': mapcss.tr('{0} must be a numeric value, in meters and without units', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[ele][ele=~/^-?[0-9]+\.[0-9][0-9][0-9]+$/]
+    # *[ele][ele=~/^-?[0-9]+\.[0-9][0-9][0-9]+$/]
+    def _node_rule_19(self, data, tags, keys, err, sets):
         if ('ele' in keys):
             match = False
             if not match:
@@ -777,7 +791,8 @@ class Josm_numeric(PluginMapCSS):
                     (mapcss.concat('ele=', mapcss.round_(mapcss.tag(tags, 'ele')*100)/100)).split('=', 1)])
                 }})
 
-        # node[fire_hydrant:pressure="#"]
+    # node[fire_hydrant:pressure="#"]
+    def _node_rule_20(self, data, tags, keys, err, sets):
         if ('fire_hydrant:pressure' in keys):
             match = False
             if not match:
@@ -788,7 +803,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwError:tr("unusual value of {0}","{0.key}")
                 err.append({'class': 9006010, 'subclass': 256087474, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[interval][interval!~/^([0-9][0-9]?[0-9]?|[0-9]+[0-9]:[0-5][0-9](:[0-5][0-9])?)$/]
+    # *[interval][interval!~/^([0-9][0-9]?[0-9]?|[0-9]+[0-9]:[0-5][0-9](:[0-5][0-9])?)$/]
+    def _node_rule_21(self, data, tags, keys, err, sets):
         if ('interval' in keys):
             match = False
             if not match:
@@ -799,8 +815,9 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("unusual value of {0}","{0.key}")
                 err.append({'class': 9006010, 'subclass': 234727583, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[aeroway=helipad][iata][iata!~/^[A-Z]{3}$/]
-        # *[aeroway=aerodrome][iata][iata!~/^[A-Z]{3}$/]
+    # *[aeroway=helipad][iata][iata!~/^[A-Z]{3}$/]
+    # *[aeroway=aerodrome][iata][iata!~/^[A-Z]{3}$/]
+    def _node_rule_22(self, data, tags, keys, err, sets):
         if ('aeroway' in keys and 'iata' in keys):
             match = False
             if not match:
@@ -816,8 +833,9 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("wrong value: {0}","{1.tag}")
                 err.append({'class': 9006022, 'subclass': 206938530, 'text': mapcss.tr('wrong value: {0}', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[aeroway=helipad][icao][icao!~/^[A-Z]{4}$/]
-        # *[aeroway=aerodrome][icao][icao!~/^[A-Z]{4}$/]
+    # *[aeroway=helipad][icao][icao!~/^[A-Z]{4}$/]
+    # *[aeroway=aerodrome][icao][icao!~/^[A-Z]{4}$/]
+    def _node_rule_23(self, data, tags, keys, err, sets):
         if ('aeroway' in keys and 'icao' in keys):
             match = False
             if not match:
@@ -833,8 +851,9 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("wrong value: {0}","{1.tag}")
                 err.append({'class': 9006022, 'subclass': 311618853, 'text': mapcss.tr('wrong value: {0}', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[aeroway=helipad][icao][icao!~/^(AG|AN|AY|BG|BI|BK|C|DA|DB|DF|DG|DI|DN|DR|DT|DX|EB|ED|EE|EF|EG|EH|EI|EK|EL|EN|EP|ES|ET|EV|EY|FA|FB|FC|FD|FE|FG|FH|FI|FJ|FK|FL|FM|FN|FO|FP|FQ|FS|FT|FV|FW|FX|FY|FZ|GA|GB|GC|GE|GF|GG|GL|GM|GO|GQ|GS|GU|GV|HA|HB|HC|HD|HE|HH|HK|HL|HR|HS|HT|HU|K|LA|LB|LC|LD|LE|LF|LG|LH|LI|LJ|LK|LL|LM|LN|LO|LP|LQ|LR|LS|LT|LU|LV|LW|LX|LY|LZ|MB|MD|MG|MH|MK|MM|MN|MP|MR|MS|MT|MU|MW|MY|MZ|NC|NF|NG|NI|NL|NS|NT|NV|NW|NZ|OA|OB|OE|OI|OJ|OK|OL|OM|OO|OP|OR|OS|OT|OY|PA|PB|PC|PF|PG|PH|PJ|PK|PL|PM|PO|PP|PT|PW|RC|RJ|RK|RO|RP|SA|SB|SC|SD|SE|SF|SG|SH|SI|SJ|SK|SL|SM|SN|SO|SP|SS|SU|SV|SW|SY|TA|TB|TD|TF|TG|TI|TJ|TK|TL|TN|TQ|TR|TT|TU|TV|TX|U|UA|UB|UC|UD|UG|UK|UM|UT|VA|VC|VD|VE|VG|VH|VI|VL|VM|VN|VO|VQ|VR|VT|VV|VY|WA|WB|WI|WM|WP|WQ|WR|WS|Y|Z|ZK|ZM)/]
-        # *[aeroway=aerodrome][icao][icao!~/^(AG|AN|AY|BG|BI|BK|C|DA|DB|DF|DG|DI|DN|DR|DT|DX|EB|ED|EE|EF|EG|EH|EI|EK|EL|EN|EP|ES|ET|EV|EY|FA|FB|FC|FD|FE|FG|FH|FI|FJ|FK|FL|FM|FN|FO|FP|FQ|FS|FT|FV|FW|FX|FY|FZ|GA|GB|GC|GE|GF|GG|GL|GM|GO|GQ|GS|GU|GV|HA|HB|HC|HD|HE|HH|HK|HL|HR|HS|HT|HU|K|LA|LB|LC|LD|LE|LF|LG|LH|LI|LJ|LK|LL|LM|LN|LO|LP|LQ|LR|LS|LT|LU|LV|LW|LX|LY|LZ|MB|MD|MG|MH|MK|MM|MN|MP|MR|MS|MT|MU|MW|MY|MZ|NC|NF|NG|NI|NL|NS|NT|NV|NW|NZ|OA|OB|OE|OI|OJ|OK|OL|OM|OO|OP|OR|OS|OT|OY|PA|PB|PC|PF|PG|PH|PJ|PK|PL|PM|PO|PP|PT|PW|RC|RJ|RK|RO|RP|SA|SB|SC|SD|SE|SF|SG|SH|SI|SJ|SK|SL|SM|SN|SO|SP|SS|SU|SV|SW|SY|TA|TB|TD|TF|TG|TI|TJ|TK|TL|TN|TQ|TR|TT|TU|TV|TX|U|UA|UB|UC|UD|UG|UK|UM|UT|VA|VC|VD|VE|VG|VH|VI|VL|VM|VN|VO|VQ|VR|VT|VV|VY|WA|WB|WI|WM|WP|WQ|WR|WS|Y|Z|ZK|ZM)/]
+    # *[aeroway=helipad][icao][icao!~/^(AG|AN|AY|BG|BI|BK|C|DA|DB|DF|DG|DI|DN|DR|DT|DX|EB|ED|EE|EF|EG|EH|EI|EK|EL|EN|EP|ES|ET|EV|EY|FA|FB|FC|FD|FE|FG|FH|FI|FJ|FK|FL|FM|FN|FO|FP|FQ|FS|FT|FV|FW|FX|FY|FZ|GA|GB|GC|GE|GF|GG|GL|GM|GO|GQ|GS|GU|GV|HA|HB|HC|HD|HE|HH|HK|HL|HR|HS|HT|HU|K|LA|LB|LC|LD|LE|LF|LG|LH|LI|LJ|LK|LL|LM|LN|LO|LP|LQ|LR|LS|LT|LU|LV|LW|LX|LY|LZ|MB|MD|MG|MH|MK|MM|MN|MP|MR|MS|MT|MU|MW|MY|MZ|NC|NF|NG|NI|NL|NS|NT|NV|NW|NZ|OA|OB|OE|OI|OJ|OK|OL|OM|OO|OP|OR|OS|OT|OY|PA|PB|PC|PF|PG|PH|PJ|PK|PL|PM|PO|PP|PT|PW|RC|RJ|RK|RO|RP|SA|SB|SC|SD|SE|SF|SG|SH|SI|SJ|SK|SL|SM|SN|SO|SP|SS|SU|SV|SW|SY|TA|TB|TD|TF|TG|TI|TJ|TK|TL|TN|TQ|TR|TT|TU|TV|TX|U|UA|UB|UC|UD|UG|UK|UM|UT|VA|VC|VD|VE|VG|VH|VI|VL|VM|VN|VO|VQ|VR|VT|VV|VY|WA|WB|WI|WM|WP|WQ|WR|WS|Y|Z|ZK|ZM)/]
+    # *[aeroway=aerodrome][icao][icao!~/^(AG|AN|AY|BG|BI|BK|C|DA|DB|DF|DG|DI|DN|DR|DT|DX|EB|ED|EE|EF|EG|EH|EI|EK|EL|EN|EP|ES|ET|EV|EY|FA|FB|FC|FD|FE|FG|FH|FI|FJ|FK|FL|FM|FN|FO|FP|FQ|FS|FT|FV|FW|FX|FY|FZ|GA|GB|GC|GE|GF|GG|GL|GM|GO|GQ|GS|GU|GV|HA|HB|HC|HD|HE|HH|HK|HL|HR|HS|HT|HU|K|LA|LB|LC|LD|LE|LF|LG|LH|LI|LJ|LK|LL|LM|LN|LO|LP|LQ|LR|LS|LT|LU|LV|LW|LX|LY|LZ|MB|MD|MG|MH|MK|MM|MN|MP|MR|MS|MT|MU|MW|MY|MZ|NC|NF|NG|NI|NL|NS|NT|NV|NW|NZ|OA|OB|OE|OI|OJ|OK|OL|OM|OO|OP|OR|OS|OT|OY|PA|PB|PC|PF|PG|PH|PJ|PK|PL|PM|PO|PP|PT|PW|RC|RJ|RK|RO|RP|SA|SB|SC|SD|SE|SF|SG|SH|SI|SJ|SK|SL|SM|SN|SO|SP|SS|SU|SV|SW|SY|TA|TB|TD|TF|TG|TI|TJ|TK|TL|TN|TQ|TR|TT|TU|TV|TX|U|UA|UB|UC|UD|UG|UK|UM|UT|VA|VC|VD|VE|VG|VH|VI|VL|VM|VN|VO|VQ|VR|VT|VV|VY|WA|WB|WI|WM|WP|WQ|WR|WS|Y|Z|ZK|ZM)/]
+    def _node_rule_24(self, data, tags, keys, err, sets):
         if ('aeroway' in keys and 'icao' in keys):
             match = False
             if not match:
@@ -850,7 +869,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("wrong value: {0}","{1.tag}")
                 err.append({'class': 9006022, 'subclass': 345477776, 'text': mapcss.tr('wrong value: {0}', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[isced:level][isced:level!~/^(0|1|2|3|4|5|6|7|8)((;|-)(1|2|3|4|5|6|7|8))*$/]
+    # *[isced:level][isced:level!~/^(0|1|2|3|4|5|6|7|8)((;|-)(1|2|3|4|5|6|7|8))*$/]
+    def _node_rule_25(self, data, tags, keys, err, sets):
         if ('isced:level' in keys):
             match = False
             if not match:
@@ -869,7 +889,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"node isced:level=secondary"
                 err.append({'class': 9006010, 'subclass': 1091907371, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[maxstay=0]
+    # *[maxstay=0]
+    def _node_rule_26(self, data, tags, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -882,7 +903,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"node maxstay=2"
                 err.append({'class': 9006027, 'subclass': 1756130010, 'text': mapcss.tr('Definition of {0} is unclear', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? min)$/][maxstay!="1 min"]
+    # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? min)$/][maxstay!="1 min"]
+    def _node_rule_27(self, data, tags, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -898,15 +920,16 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"node maxstay=\"15 min\""
                 # assertNoMatch:"node maxstay=\"2 minutes\""
                 # assertMatch:"node maxstay=\"5 min\""
-                set_maxstay_autofix = True
+                sets.add('maxstay_autofix')
                 err.append({'class': 9006028, 'subclass': 606655085, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('maxstay=', mapcss.replace(mapcss.tag(tags, 'maxstay'), 'min', 'minutes'))).split('=', 1)])
                 }})
 
-        # *[maxstay="1h"]
-        # *[maxstay="1 h"]
-        # *[maxstay="1 hr"]
+    # *[maxstay="1h"]
+    # *[maxstay="1 h"]
+    # *[maxstay="1 hr"]
+    def _node_rule_28(self, data, tags, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -928,13 +951,14 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"node maxstay=\"1 h\""
                 # assertMatch:"node maxstay=\"1 hr\""
                 # assertMatch:"node maxstay=1h"
-                set_maxstay_autofix = True
+                sets.add('maxstay_autofix')
                 err.append({'class': 9006028, 'subclass': 872535915, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['maxstay','1 hour']])
                 }})
 
-        # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? h)$/][maxstay!="1 h"]
+    # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? h)$/][maxstay!="1 h"]
+    def _node_rule_29(self, data, tags, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -950,13 +974,14 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"node maxstay=\"15 h\""
                 # assertNoMatch:"node maxstay=\"2 hours\""
                 # assertMatch:"node maxstay=\"5 h\""
-                set_maxstay_autofix = True
+                sets.add('maxstay_autofix')
                 err.append({'class': 9006028, 'subclass': 59629984, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('maxstay=', mapcss.replace(mapcss.tag(tags, 'maxstay'), 'h', 'hours'))).split('=', 1)])
                 }})
 
-        # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? hr)$/][maxstay!="1 hr"]
+    # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? hr)$/][maxstay!="1 hr"]
+    def _node_rule_30(self, data, tags, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -972,13 +997,14 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"node maxstay=\"15 hr\""
                 # assertNoMatch:"node maxstay=\"2 hours\""
                 # assertMatch:"node maxstay=\"5 hr\""
-                set_maxstay_autofix = True
+                sets.add('maxstay_autofix')
                 err.append({'class': 9006028, 'subclass': 814970301, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('maxstay=', mapcss.replace(mapcss.tag(tags, 'maxstay'), 'hr', 'hours'))).split('=', 1)])
                 }})
 
-        # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)?h)$/][maxstay!="1h"]
+    # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)?h)$/][maxstay!="1h"]
+    def _node_rule_31(self, data, tags, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -996,18 +1022,19 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"node maxstay=1h"
                 # assertNoMatch:"node maxstay=2hours"
                 # assertMatch:"node maxstay=5h"
-                set_maxstay_autofix = True
+                sets.add('maxstay_autofix')
                 err.append({'class': 9006028, 'subclass': 1721471777, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('maxstay=', mapcss.replace(mapcss.tag(tags, 'maxstay'), 'h', ' hours'))).split('=', 1)])
                 }})
 
-        # *[maxstay][maxstay!~/^(([1-9][0-9]*(\.[0-9]+)?( (minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)))|(no|unlimited|0|load-unload))$/]!.maxstay_autofix
+    # *[maxstay][maxstay!~/^(([1-9][0-9]*(\.[0-9]+)?( (minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)))|(no|unlimited|0|load-unload))$/]!.maxstay_autofix
+    def _node_rule_32(self, data, tags, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_maxstay_autofix) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxstay')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_17733c6c, '^(([1-9][0-9]*(\\.[0-9]+)?( (minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)))|(no|unlimited|0|load-unload))$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxstay'))))
+                try: match = (('maxstay_autofix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxstay')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_17733c6c, '^(([1-9][0-9]*(\\.[0-9]+)?( (minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)))|(no|unlimited|0|load-unload))$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxstay'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwWarning:tr("unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit","{0.key}","minutes","hours")
@@ -1027,7 +1054,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"node maxstay=unlimited"
                 err.append({'class': 9006028, 'subclass': 1976092293, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours')})
 
-        # node[natural=tree][circumference][siunit_length(tag(circumference))>45]
+    # node[natural=tree][circumference][siunit_length(tag(circumference))>45]
+    def _node_rule_33(self, data, tags, keys, err, sets):
         if ('circumference' in keys and 'natural' in keys):
             match = False
             if not match:
@@ -1043,15 +1071,53 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"node natural=tree circumference=82.4"
                 err.append({'class': 9006033, 'subclass': 556959007, 'text': mapcss.tr('Unusually large value of {0}, possibly centimeter units are meant?', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, None),
+        (_node_rule_1, ['layer']),
+        (_node_rule_2, ['layer']),
+        (_node_rule_3, ['building:levels']),
+        (_node_rule_4, ['building:levels', 'level']),
+        (_node_rule_5, ['roof:height']),
+        (_node_rule_6, ['height', 'maxheight', 'maxlength', 'maxwidth', 'min_height', 'roof:height', 'width']),
+        (_node_rule_7, ['height', 'maxheight', 'maxlength', 'maxwidth', 'roof:height', 'width']),
+        (_node_rule_8, ['distance', 'height', 'maxaxleload', 'maxheight', 'maxlength', 'maxweight', 'maxwidth', 'min_height', 'roof:height', 'width']),
+        (_node_rule_9, ['height', 'maxheight', 'maxlength', 'maxwidth', 'min_height', 'roof:height', 'width']),
+        (_node_rule_10, ['maxaxleload', 'maxweight']),
+        (_node_rule_11, ['distance']),
+        (_node_rule_12, ['population']),
+        (_node_rule_13, ['amenity']),
+        (_node_rule_14, ['admin_level']),
+        (_node_rule_15, ['direction']),
+        (_node_rule_16, ['ele']),
+        (_node_rule_17, ['ele']),
+        (_node_rule_18, ['ele']),
+        (_node_rule_19, ['ele']),
+        (_node_rule_20, ['fire_hydrant:pressure']),
+        (_node_rule_21, ['interval']),
+        (_node_rule_22, ['aeroway']),
+        (_node_rule_23, ['aeroway']),
+        (_node_rule_24, ['aeroway']),
+        (_node_rule_25, ['isced:level']),
+        (_node_rule_26, ['maxstay']),
+        (_node_rule_27, ['maxstay']),
+        (_node_rule_28, ['maxstay']),
+        (_node_rule_29, ['maxstay']),
+        (_node_rule_30, ['maxstay']),
+        (_node_rule_31, ['maxstay']),
+        (_node_rule_32, ['maxstay']),
+        (_node_rule_33, ['circumference']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
-        set__unit_auto_fix = set_ele_meter_remove_autofix = set_ele_separator_autofix = set_imprecise_gauge = set_maxstay_autofix = set_negative_value = set_unusual_gauge = set_zero_roof_height_flat = False
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-        # *[/^[0-9]+$/]
+    # *[/^[0-9]+$/]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -1064,7 +1130,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"way ref.1=foo"
                 err.append({'class': 9006001, 'subclass': 750700308, 'text': mapcss.tr('numerical key')})
 
-        # *[layer=~/^\+\d/]
+    # *[layer=~/^\+\d/]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('layer' in keys):
             match = False
             if not match:
@@ -1079,7 +1146,8 @@ class Josm_numeric(PluginMapCSS):
                     (mapcss.concat('layer=', mapcss.replace(mapcss.tag(tags, 'layer'), '+', ''))).split('=', 1)])
                 }})
 
-        # *[layer][layer!~/^0$|^(-|\+)?[1-5]$/]
+    # *[layer][layer!~/^0$|^(-|\+)?[1-5]$/]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('layer' in keys):
             match = False
             if not match:
@@ -1090,7 +1158,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("{0} should be an integer value between -5 and 5","{0.key}")
                 err.append({'class': 9006003, 'subclass': 1089386010, 'text': mapcss.tr('{0} should be an integer value between -5 and 5', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[building:levels^="-"]
+    # *[building:levels^="-"]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('building:levels' in keys):
             match = False
             if not match:
@@ -1100,16 +1169,17 @@ class Josm_numeric(PluginMapCSS):
             if match:
                 # set negative_value
                 # throwError:tr("negative {0} value","{0.key}")
-                set_negative_value = True
+                sets.add('negative_value')
                 err.append({'class': 9006023, 'subclass': 29188290, 'text': mapcss.tr('negative {0} value', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[building:levels][building:levels!~/^(([0-9]|[1-9][0-9]*)(\.5)?)$/]!.negative_value
-        # *[level][level!~/^((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5)(;((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5))*$/]
+    # *[building:levels][building:levels!~/^(([0-9]|[1-9][0-9]*)(\.5)?)$/]!.negative_value
+    # *[level][level!~/^((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5)(;((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5))*$/]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('building:levels' in keys) or ('level' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_negative_value) and (mapcss._tag_capture(capture_tags, 0, tags, 'building:levels')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2a784076, '^(([0-9]|[1-9][0-9]*)(\\.5)?)$'), mapcss._tag_capture(capture_tags, 1, tags, 'building:levels'))))
+                try: match = (('negative_value' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'building:levels')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2a784076, '^(([0-9]|[1-9][0-9]*)(\\.5)?)$'), mapcss._tag_capture(capture_tags, 1, tags, 'building:levels'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
@@ -1119,7 +1189,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("{0} should have numbers only with optional .5 increments","{0.key}")
                 err.append({'class': 9006004, 'subclass': 1292315112, 'text': mapcss.tr('{0} should have numbers only with optional .5 increments', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[roof:height][siunit_length(tag("roof:height"))==0][roof:shape=flat]
+    # *[roof:height][siunit_length(tag("roof:height"))==0][roof:shape=flat]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('roof:height' in keys and 'roof:shape' in keys):
             match = False
             if not match:
@@ -1131,19 +1202,20 @@ class Josm_numeric(PluginMapCSS):
                 # group:tr("unnecessary tag")
                 # throwWarning:tr("{0} is unnecessary for {1}","{0.tag}","{2.tag}")
                 # fixRemove:"{0.key}"
-                set_zero_roof_height_flat = True
+                sets.add('zero_roof_height_flat')
                 err.append({'class': 9006025, 'subclass': 301901487, 'text': mapcss.tr('{0} is unnecessary for {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}')), 'allow_fix_override': True, 'fix': {
                     '-': ([
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[height][height=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
-        # *[roof:height][roof:height=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]!.zero_roof_height_flat
-        # *[width][width=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
-        # *[maxwidth][maxwidth=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
-        # *[min_height][min_height=~/^(?i)-?[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
-        # *[maxheight][maxheight=~/^(?i)[1-9][0-9]*([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
-        # *[maxlength][maxlength=~/^(?i)[1-9][0-9]*([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[height][height=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[roof:height][roof:height=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]!.zero_roof_height_flat
+    # *[width][width=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[maxwidth][maxwidth=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[min_height][min_height=~/^(?i)-?[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[maxheight][maxheight=~/^(?i)[1-9][0-9]*([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[maxlength][maxlength=~/^(?i)[1-9][0-9]*([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    def _way_rule_6(self, data, tags, nds, keys, err, sets):
         if ('height' in keys) or ('maxheight' in keys) or ('maxlength' in keys) or ('maxwidth' in keys) or ('min_height' in keys) or ('roof:height' in keys) or ('width' in keys):
             match = False
             if not match:
@@ -1152,7 +1224,7 @@ class Josm_numeric(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_zero_roof_height_flat) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_5dbcb7bc), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
+                try: match = (('zero_roof_height_flat' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_5dbcb7bc), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
@@ -1178,18 +1250,19 @@ class Josm_numeric(PluginMapCSS):
                 # set _unit_auto_fix
                 # throwWarning:tr("unusual value of {0}: use abbreviation for unit and space between value and unit","{0.key}")
                 # fixAdd:concat("{0.key}","=",get(regexp_match("([0-9.,]+) *.+","{0.value}"),1)," m")
-                set__unit_auto_fix = True
+                sets.add('_unit_auto_fix')
                 err.append({'class': 9006024, 'subclass': 1245344673, 'text': mapcss.tr('unusual value of {0}: use abbreviation for unit and space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}'), '=', mapcss.get(mapcss.regexp_match(self.re_6ae26377, mapcss._tag_uncapture(capture_tags, '{0.value}')), 1), ' m')).split('=', 1)])
                 }})
 
-        # *[height][height=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
-        # *[maxheight][maxheight=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
-        # *[roof:height][roof:height=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]!.zero_roof_height_flat
-        # *[maxlength][maxlength=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
-        # *[width][width=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
-        # *[maxwidth][maxwidth=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    # *[height][height=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    # *[maxheight][maxheight=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    # *[roof:height][roof:height=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]!.zero_roof_height_flat
+    # *[maxlength][maxlength=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    # *[width][width=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    # *[maxwidth][maxwidth=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    def _way_rule_7(self, data, tags, nds, keys, err, sets):
         if ('height' in keys) or ('maxheight' in keys) or ('maxlength' in keys) or ('maxwidth' in keys) or ('roof:height' in keys) or ('width' in keys):
             match = False
             if not match:
@@ -1202,7 +1275,7 @@ class Josm_numeric(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_zero_roof_height_flat) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_549d66c4), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
+                try: match = (('zero_roof_height_flat' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_549d66c4), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
@@ -1220,22 +1293,23 @@ class Josm_numeric(PluginMapCSS):
                 # set _unit_auto_fix
                 # throwWarning:tr("unusual value of {0}: use '' for foot and \" for inches, no spaces","{0.key}")
                 # fixAdd:concat("{0.key}","=",get(regexp_match("([0-9.,]+) *.+","{0.value}"),1),"'")
-                set__unit_auto_fix = True
+                sets.add('_unit_auto_fix')
                 err.append({'class': 9006031, 'subclass': 1118826626, 'text': mapcss.tr('unusual value of {0}: use \'\' for foot and " for inches, no spaces', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}'), '=', mapcss.get(mapcss.regexp_match(self.re_6ae26377, mapcss._tag_uncapture(capture_tags, '{0.value}')), 1), '\'')).split('=', 1)])
                 }})
 
-        # *[height][height=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[maxheight][maxheight=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[roof:height][roof:height=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[maxlength][maxlength=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[width][width=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[maxwidth][maxwidth=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[min_height][min_height=~/^-?[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[maxaxleload][maxaxleload=~/^[0-9]+,[0-9][0-9]?( (t|kg|st|lbs))?$/]
-        # *[maxweight][maxweight=~/^[0-9]+,[0-9][0-9]?( (t|kg|st|lbs))?$/]
-        # *[distance][distance=~/^[0-9]+,[0-9][0-9]?( (m|km|mi|nmi))?$/]
+    # *[height][height=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[maxheight][maxheight=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[roof:height][roof:height=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[maxlength][maxlength=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[width][width=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[maxwidth][maxwidth=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[min_height][min_height=~/^-?[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[maxaxleload][maxaxleload=~/^[0-9]+,[0-9][0-9]?( (t|kg|st|lbs))?$/]
+    # *[maxweight][maxweight=~/^[0-9]+,[0-9][0-9]?( (t|kg|st|lbs))?$/]
+    # *[distance][distance=~/^[0-9]+,[0-9][0-9]?( (m|km|mi|nmi))?$/]
+    def _way_rule_8(self, data, tags, nds, keys, err, sets):
         if ('distance' in keys) or ('height' in keys) or ('maxaxleload' in keys) or ('maxheight' in keys) or ('maxlength' in keys) or ('maxweight' in keys) or ('maxwidth' in keys) or ('min_height' in keys) or ('roof:height' in keys) or ('width' in keys):
             match = False
             if not match:
@@ -1282,55 +1356,57 @@ class Josm_numeric(PluginMapCSS):
                 # set _unit_auto_fix
                 # throwWarning:tr("unusual value of {0}: use . instead of , as decimal separator","{0.key}")
                 # fixAdd:concat("{0.key}","=",replace(tag("{0.key}"),",","."))
-                set__unit_auto_fix = True
+                sets.add('_unit_auto_fix')
                 err.append({'class': 9006017, 'subclass': 1619669445, 'text': mapcss.tr('unusual value of {0}: use . instead of , as decimal separator', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}'), '=', mapcss.replace(mapcss.tag(tags, mapcss._tag_uncapture(capture_tags, '{0.key}')), ',', '.'))).split('=', 1)])
                 }})
 
-        # *[height][height!~/^(([0-9]+(\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!._unit_auto_fix
-        # *[maxheight][maxheight!~/^(([1-9][0-9]*(\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\.[0-9]*)?\")?)|none|default|below_default)$/]!._unit_auto_fix
-        # *[min_height][min_height!~/^(-?([0-9]+(\.[0-9]+)?( m)?)|(-?[1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!._unit_auto_fix
-        # *[roof:height][roof:height!~/^(([0-9]+(\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!.zero_roof_height_flat!._unit_auto_fix
-        # *[maxlength][maxlength!~/^(([1-9][0-9]*(\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\.[0-9]*)?\")?)|none|default|below_default)$/]!._unit_auto_fix
-        # *[width][width!~/^(([0-9]+(\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]!._unit_auto_fix
-        # *[maxwidth][maxwidth!~/^(([0-9]+(\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]!._unit_auto_fix
+    # *[height][height!~/^(([0-9]+(\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!._unit_auto_fix
+    # *[maxheight][maxheight!~/^(([1-9][0-9]*(\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\.[0-9]*)?\")?)|none|default|below_default)$/]!._unit_auto_fix
+    # *[min_height][min_height!~/^(-?([0-9]+(\.[0-9]+)?( m)?)|(-?[1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!._unit_auto_fix
+    # *[roof:height][roof:height!~/^(([0-9]+(\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!.zero_roof_height_flat!._unit_auto_fix
+    # *[maxlength][maxlength!~/^(([1-9][0-9]*(\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\.[0-9]*)?\")?)|none|default|below_default)$/]!._unit_auto_fix
+    # *[width][width!~/^(([0-9]+(\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]!._unit_auto_fix
+    # *[maxwidth][maxwidth!~/^(([0-9]+(\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]!._unit_auto_fix
+    def _way_rule_9(self, data, tags, nds, keys, err, sets):
         if ('height' in keys) or ('maxheight' in keys) or ('maxlength' in keys) or ('maxwidth' in keys) or ('min_height' in keys) or ('roof:height' in keys) or ('width' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_76fe90df, '^(([0-9]+(\\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'height'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_76fe90df, '^(([0-9]+(\\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'height'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxheight')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_40277cab, '^(([1-9][0-9]*(\\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\\.[0-9]*)?\\")?)|none|default|below_default)$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxheight'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxheight')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_40277cab, '^(([1-9][0-9]*(\\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\\.[0-9]*)?\\")?)|none|default|below_default)$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxheight'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'min_height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_470ea515, '^(-?([0-9]+(\\.[0-9]+)?( m)?)|(-?[1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'min_height'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'min_height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_470ea515, '^(-?([0-9]+(\\.[0-9]+)?( m)?)|(-?[1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'min_height'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_zero_roof_height_flat) and (not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_76fe90df, '^(([0-9]+(\\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
+                try: match = (('zero_roof_height_flat' not in sets) and ('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_76fe90df, '^(([0-9]+(\\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxlength')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_40277cab, '^(([1-9][0-9]*(\\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\\.[0-9]*)?\\")?)|none|default|below_default)$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxlength'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxlength')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_40277cab, '^(([1-9][0-9]*(\\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\\.[0-9]*)?\\")?)|none|default|below_default)$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxlength'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'width')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4a678586, '^(([0-9]+(\\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\\.[0-9]+)?\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'width'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'width')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4a678586, '^(([0-9]+(\\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\\.[0-9]+)?\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'width'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxwidth')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4a678586, '^(([0-9]+(\\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\\.[0-9]+)?\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxwidth'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxwidth')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4a678586, '^(([0-9]+(\\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\\.[0-9]+)?\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxwidth'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwWarning:tr("unusual value of {0}: meters is default; only positive values; point is decimal separator; if units, put space then unit","{0.key}")
                 err.append({'class': 9006032, 'subclass': 516585238, 'text': mapcss.tr('unusual value of {0}: meters is default; only positive values; point is decimal separator; if units, put space then unit', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[maxaxleload][maxaxleload!~/^([0-9]+(\.[0-9]+)?( (t|kg|st|lbs))?)$/]
-        # *[maxweight][maxweight!~/^([0-9]+(\.[0-9]+)?( (t|kg|st|lbs))?)$/]
+    # *[maxaxleload][maxaxleload!~/^([0-9]+(\.[0-9]+)?( (t|kg|st|lbs))?)$/]
+    # *[maxweight][maxweight!~/^([0-9]+(\.[0-9]+)?( (t|kg|st|lbs))?)$/]
+    def _way_rule_10(self, data, tags, nds, keys, err, sets):
         if ('maxaxleload' in keys) or ('maxweight' in keys):
             match = False
             if not match:
@@ -1345,9 +1421,10 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("unusual value of {0}: {1} is default; only positive values; point is decimal separator; if units, put space then unit","{0.key}",tr("tonne"))
                 err.append({'class': 9006026, 'subclass': 326659919, 'text': mapcss.tr('unusual value of {0}: {1} is default; only positive values; point is decimal separator; if units, put space then unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss.tr('tonne'))})
 
-        # way[maxspeed][maxspeed!~/^(signals|none|unposted|variable|walk|[1-9][0-9]*( [a-z]+)?|[A-Z][A-Z]:(urban|rural|living_street|motorway))$/]
-        # way[maxspeed:forward][maxspeed:forward!~/^(signals|none|unposted|variable|walk|[1-9][0-9]*( [a-z]+)?|[A-Z][A-Z]:(urban|rural|living_street|motorway))$/]
-        # way[maxspeed:backward][maxspeed:backward!~/^(signals|none|unposted|variable|walk|[1-9][0-9]*( [a-z]+)?|[A-Z][A-Z]:(urban|rural|living_street|motorway))$/]
+    # way[maxspeed][maxspeed!~/^(signals|none|unposted|variable|walk|[1-9][0-9]*( [a-z]+)?|[A-Z][A-Z]:(urban|rural|living_street|motorway))$/]
+    # way[maxspeed:forward][maxspeed:forward!~/^(signals|none|unposted|variable|walk|[1-9][0-9]*( [a-z]+)?|[A-Z][A-Z]:(urban|rural|living_street|motorway))$/]
+    # way[maxspeed:backward][maxspeed:backward!~/^(signals|none|unposted|variable|walk|[1-9][0-9]*( [a-z]+)?|[A-Z][A-Z]:(urban|rural|living_street|motorway))$/]
+    def _way_rule_11(self, data, tags, nds, keys, err, sets):
         if ('maxspeed' in keys) or ('maxspeed:backward' in keys) or ('maxspeed:forward' in keys):
             match = False
             if not match:
@@ -1378,7 +1455,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"way maxspeed=variable"
                 err.append({'class': 9006026, 'subclass': 683878293, 'text': mapcss.tr('unusual value of {0}: {1} is default; only positive values; point is decimal separator; if units, put space then unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss.tr('km/h'))})
 
-        # *[distance][distance!~/^(([0-9]+(\.[0-9]+)?( (m|km|mi|nmi))?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]
+    # *[distance][distance!~/^(([0-9]+(\.[0-9]+)?( (m|km|mi|nmi))?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]
+    def _way_rule_12(self, data, tags, nds, keys, err, sets):
         if ('distance' in keys):
             match = False
             if not match:
@@ -1395,10 +1473,11 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"way distance=something"
                 err.append({'class': 9006026, 'subclass': 1210743405, 'text': mapcss.tr('unusual value of {0}: {1} is default; only positive values; point is decimal separator; if units, put space then unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss.tr('kilometers'))})
 
-        # way[voltage][voltage=~/(.*[A-Za-z].*)|.*,.*|.*( ).*/]
-        # way[voltage:primary][voltage:primary=~/(.*[A-Za-z].*)|.*,.*|.*( ).*/]
-        # way[voltage:secondary][voltage:secondary=~/(.*[A-Za-z].*)|.*,.*|.*( ).*/]
-        # way[voltage:tertiary][voltage:tertiary=~/(.*[A-Za-z].*)|.*,.*|.*( ).*/]
+    # way[voltage][voltage=~/(.*[A-Za-z].*)|.*,.*|.*( ).*/]
+    # way[voltage:primary][voltage:primary=~/(.*[A-Za-z].*)|.*,.*|.*( ).*/]
+    # way[voltage:secondary][voltage:secondary=~/(.*[A-Za-z].*)|.*,.*|.*( ).*/]
+    # way[voltage:tertiary][voltage:tertiary=~/(.*[A-Za-z].*)|.*,.*|.*( ).*/]
+    def _way_rule_13(self, data, tags, nds, keys, err, sets):
         if ('voltage' in keys) or ('voltage:primary' in keys) or ('voltage:secondary' in keys) or ('voltage:tertiary' in keys):
             match = False
             if not match:
@@ -1423,7 +1502,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"way voltage=medium"
                 err.append({'class': 9006013, 'subclass': 44019535, 'text': mapcss.tr('voltage should be in volts with no units/delimiter/spaces')})
 
-        # way[frequency][frequency!~/^(0|[1-9][0-9]*(\.[0-9]+)?)( (kHz|MHz|GHz|THz))?$/]
+    # way[frequency][frequency!~/^(0|[1-9][0-9]*(\.[0-9]+)?)( (kHz|MHz|GHz|THz))?$/]
+    def _way_rule_14(self, data, tags, nds, keys, err, sets):
         if ('frequency' in keys):
             match = False
             if not match:
@@ -1440,7 +1520,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"way frequency=something"
                 err.append({'class': 9006010, 'subclass': 582321238, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[gauge][gauge=~/^(broad|standard|narrow)$/]
+    # way[gauge][gauge=~/^(broad|standard|narrow)$/]
+    def _way_rule_15(self, data, tags, nds, keys, err, sets):
         if ('gauge' in keys):
             match = False
             if not match:
@@ -1457,15 +1538,16 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"way gauge=narrow"
                 # assertNoMatch:"way gauge=something"
                 # assertMatch:"way gauge=standard"
-                set_imprecise_gauge = True
+                sets.add('imprecise_gauge')
                 err.append({'class': 9006029, 'subclass': 1280409235, 'text': mapcss.tr('imprecise value of {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[gauge][gauge!~/^([1-9][0-9]{1,3}(;[1-9][0-9]{1,3})*)$/]!.imprecise_gauge
+    # way[gauge][gauge!~/^([1-9][0-9]{1,3}(;[1-9][0-9]{1,3})*)$/]!.imprecise_gauge
+    def _way_rule_16(self, data, tags, nds, keys, err, sets):
         if ('gauge' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_imprecise_gauge) and (mapcss._tag_capture(capture_tags, 0, tags, 'gauge')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_58d78904, '^([1-9][0-9]{1,3}(;[1-9][0-9]{1,3})*)$'), mapcss._tag_capture(capture_tags, 1, tags, 'gauge'))))
+                try: match = (('imprecise_gauge' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'gauge')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_58d78904, '^([1-9][0-9]{1,3}(;[1-9][0-9]{1,3})*)$'), mapcss._tag_capture(capture_tags, 1, tags, 'gauge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set unusual_gauge
@@ -1476,15 +1558,16 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"way gauge=narrow"
                 # assertMatch:"way gauge=something"
                 # assertNoMatch:"way gauge=standard"
-                set_unusual_gauge = True
+                sets.add('unusual_gauge')
                 err.append({'class': 9006010, 'subclass': 2055848679, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[/railway$/=~/^narrow_gauge$/][gauge][gauge!~/^((14(?:3[0-4]|[4-9])|(?:14[0-2]|(?:1[0-3]|9)[0-9])[0-9]?|143|(?:[2-7][0-9]|1[5-9])[0-9]|8(?:[0-8][0-9]|9[0-9]?));?)+$/]!.imprecise_gauge!.unusual_gauge
+    # way[/railway$/=~/^narrow_gauge$/][gauge][gauge!~/^((14(?:3[0-4]|[4-9])|(?:14[0-2]|(?:1[0-3]|9)[0-9])[0-9]?|143|(?:[2-7][0-9]|1[5-9])[0-9]|8(?:[0-8][0-9]|9[0-9]?));?)+$/]!.imprecise_gauge!.unusual_gauge
+    def _way_rule_17(self, data, tags, nds, keys, err, sets):
         if ('gauge' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_imprecise_gauge) and (not set_unusual_gauge) and (mapcss.regexp_test(self.re_70dc3282, mapcss._match_regex(tags, self.re_7e626945))) and (mapcss._tag_capture(capture_tags, 1, tags, 'gauge')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_33ecb9da, '^((14(?:3[0-4]|[4-9])|(?:14[0-2]|(?:1[0-3]|9)[0-9])[0-9]?|143|(?:[2-7][0-9]|1[5-9])[0-9]|8(?:[0-8][0-9]|9[0-9]?));?)+$'), mapcss._tag_capture(capture_tags, 2, tags, 'gauge'))))
+                try: match = (('imprecise_gauge' not in sets) and ('unusual_gauge' not in sets) and (mapcss.regexp_test(self.re_70dc3282, mapcss._match_regex(tags, self.re_7e626945))) and (mapcss._tag_capture(capture_tags, 1, tags, 'gauge')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_33ecb9da, '^((14(?:3[0-4]|[4-9])|(?:14[0-2]|(?:1[0-3]|9)[0-9])[0-9]?|143|(?:[2-7][0-9]|1[5-9])[0-9]|8(?:[0-8][0-9]|9[0-9]?));?)+$'), mapcss._tag_capture(capture_tags, 2, tags, 'gauge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("suspicious tag combination")
@@ -1500,7 +1583,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"way railway=narrow_gauge gauge=something"
                 err.append({'class': 9006030, 'subclass': 2028551999, 'text': mapcss.tr('unusual {0} value on narrow gauge railway', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # way[incline][incline!~/^(up|down|-?([0-9]+?(\.[1-9]%)?|100)[%°]?)$/]
+    # way[incline][incline!~/^(up|down|-?([0-9]+?(\.[1-9]%)?|100)[%°]?)$/]
+    def _way_rule_18(self, data, tags, nds, keys, err, sets):
         if ('incline' in keys):
             match = False
             if not match:
@@ -1521,7 +1605,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"way incline=up"
                 err.append({'class': 9006010, 'subclass': 901779967, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[population][population!~/^[0-9]+$/]
+    # *[population][population!~/^[0-9]+$/]
+    def _way_rule_19(self, data, tags, nds, keys, err, sets):
         if ('population' in keys):
             match = False
             if not match:
@@ -1532,11 +1617,12 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("{0} must be a numeric value","{0.key}")
                 err.append({'class': 9006008, 'subclass': 313743521, 'text': mapcss.tr('{0} must be a numeric value', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[seats][seats!~/^[1-9]([0-9]*)$/][amenity=bench]
-        # way[lanes][lanes!~/^[1-9]([0-9]*)$/][highway]
-        # way["lanes:backward"]["lanes:backward"!~/^[1-9]([0-9]*)$/][highway]
-        # way["lanes:forward"]["lanes:forward"!~/^[1-9]([0-9]*)$/][highway]
-        # *[screen][screen!~/^[1-9]([0-9]*)$/][amenity=cinema]
+    # way[seats][seats!~/^[1-9]([0-9]*)$/][amenity=bench]
+    # way[lanes][lanes!~/^[1-9]([0-9]*)$/][highway]
+    # way["lanes:backward"]["lanes:backward"!~/^[1-9]([0-9]*)$/][highway]
+    # way["lanes:forward"]["lanes:forward"!~/^[1-9]([0-9]*)$/][highway]
+    # *[screen][screen!~/^[1-9]([0-9]*)$/][amenity=cinema]
+    def _way_rule_20(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'screen' in keys) or ('amenity' in keys and 'seats' in keys) or ('highway' in keys and 'lanes' in keys) or ('highway' in keys and 'lanes:backward' in keys) or ('highway' in keys and 'lanes:forward' in keys):
             match = False
             if not match:
@@ -1569,7 +1655,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"way highway=residential lanes=5.5"
                 err.append({'class': 9006009, 'subclass': 2089206793, 'text': mapcss.tr('{0} must be a positive integer number', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[admin_level][admin_level!~/^(1|2|3|4|5|6|7|8|9|10|11|12)$/]
+    # *[admin_level][admin_level!~/^(1|2|3|4|5|6|7|8|9|10|11|12)$/]
+    def _way_rule_21(self, data, tags, nds, keys, err, sets):
         if ('admin_level' in keys):
             match = False
             if not match:
@@ -1580,9 +1667,10 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("unusual value of {0}","{0.key}")
                 err.append({'class': 9006010, 'subclass': 1514270237, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[direction][direction<0]
-        # *[direction][direction>=360]
-        # *[direction][direction!~/^([0-9][0-9]?[0-9]?|north|east|south|west|N|E|S|W|NE|SE|SW|NW|NNE|ENE|ESE|SSE|SSW|WSW|WNW|NNW|forward|backward|both|clockwise|anti-clockwise|anticlockwise|up|down)((-|;)([0-9][0-9]?[0-9]?|N|E|S|W|NE|SE|SW|NW|NNE|ENE|ESE|SSE|SSW|WSW|WNW|NNW))*$/]
+    # *[direction][direction<0]
+    # *[direction][direction>=360]
+    # *[direction][direction!~/^([0-9][0-9]?[0-9]?|north|east|south|west|N|E|S|W|NE|SE|SW|NW|NNE|ENE|ESE|SSE|SSW|WSW|WNW|NNW|forward|backward|both|clockwise|anti-clockwise|anticlockwise|up|down)((-|;)([0-9][0-9]?[0-9]?|N|E|S|W|NE|SE|SW|NW|NNE|ENE|ESE|SSE|SSW|WSW|WNW|NNW))*$/]
+    def _way_rule_22(self, data, tags, nds, keys, err, sets):
         if ('direction' in keys):
             match = False
             if not match:
@@ -1601,7 +1689,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("unusual value of {0}","{0.key}")
                 err.append({'class': 9006010, 'subclass': 51356092, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[ele][ele=~/^-?[0-9]+(\.[0-9]+)? ?m$/]
+    # *[ele][ele=~/^-?[0-9]+(\.[0-9]+)? ?m$/]
+    def _way_rule_23(self, data, tags, nds, keys, err, sets):
         if ('ele' in keys):
             match = False
             if not match:
@@ -1612,13 +1701,14 @@ class Josm_numeric(PluginMapCSS):
                 # set ele_meter_remove_autofix
                 # throwWarning:tr("{0} must be a numeric value, in meters and without units","{0.key}")
                 # fixAdd:concat("ele=",trim(replace(tag("ele"),"m","")))
-                set_ele_meter_remove_autofix = True
+                sets.add('ele_meter_remove_autofix')
                 err.append({'class': 9006011, 'subclass': 1672584043, 'text': mapcss.tr('{0} must be a numeric value, in meters and without units', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('ele=', mapcss.trim(mapcss.replace(mapcss.tag(tags, 'ele'), 'm', '')))).split('=', 1)])
                 }})
 
-        # *[ele][ele=~/^[0-9]+,[0-9][0-9]?$/]
+    # *[ele][ele=~/^[0-9]+,[0-9][0-9]?$/]
+    def _way_rule_24(self, data, tags, nds, keys, err, sets):
         if ('ele' in keys):
             match = False
             if not match:
@@ -1629,24 +1719,26 @@ class Josm_numeric(PluginMapCSS):
                 # set ele_separator_autofix
                 # throwWarning:tr("unusual value of {0}: use . instead of , as decimal separator","{0.key}")
                 # fixAdd:concat("ele=",replace(tag("ele"),",","."))
-                set_ele_separator_autofix = True
+                sets.add('ele_separator_autofix')
                 err.append({'class': 9006017, 'subclass': 202511106, 'text': mapcss.tr('unusual value of {0}: use . instead of , as decimal separator', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('ele=', mapcss.replace(mapcss.tag(tags, 'ele'), ',', '.'))).split('=', 1)])
                 }})
 
-        # *[ele][ele!~/^-?[0-9]+(\.[0-9]+)?$/]!.ele_meter_remove_autofix!.ele_separator_autofix
+    # *[ele][ele!~/^-?[0-9]+(\.[0-9]+)?$/]!.ele_meter_remove_autofix!.ele_separator_autofix
+    def _way_rule_25(self, data, tags, nds, keys, err, sets):
         if ('ele' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_ele_meter_remove_autofix) and (not set_ele_separator_autofix) and (mapcss._tag_capture(capture_tags, 0, tags, 'ele')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_45b46d60, '^-?[0-9]+(\\.[0-9]+)?$'), mapcss._tag_capture(capture_tags, 1, tags, 'ele'))))
+                try: match = (('ele_meter_remove_autofix' not in sets) and ('ele_separator_autofix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'ele')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_45b46d60, '^-?[0-9]+(\\.[0-9]+)?$'), mapcss._tag_capture(capture_tags, 1, tags, 'ele'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwWarning:tr("{0} must be a numeric value, in meters and without units","{0.key}")
                 err.append({'class': 9006011, 'subclass': 1781084832, 'text': mapcss.tr('{0} must be a numeric value, in meters and without units', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[ele][ele=~/^-?[0-9]+\.[0-9][0-9][0-9]+$/]
+    # *[ele][ele=~/^-?[0-9]+\.[0-9][0-9][0-9]+$/]
+    def _way_rule_26(self, data, tags, nds, keys, err, sets):
         if ('ele' in keys):
             match = False
             if not match:
@@ -1662,7 +1754,8 @@ class Josm_numeric(PluginMapCSS):
                     (mapcss.concat('ele=', mapcss.round_(mapcss.tag(tags, 'ele')*100)/100)).split('=', 1)])
                 }})
 
-        # *[interval][interval!~/^([0-9][0-9]?[0-9]?|[0-9]+[0-9]:[0-5][0-9](:[0-5][0-9])?)$/]
+    # *[interval][interval!~/^([0-9][0-9]?[0-9]?|[0-9]+[0-9]:[0-5][0-9](:[0-5][0-9])?)$/]
+    def _way_rule_27(self, data, tags, nds, keys, err, sets):
         if ('interval' in keys):
             match = False
             if not match:
@@ -1681,8 +1774,9 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"way interval=5"
                 err.append({'class': 9006010, 'subclass': 234727583, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[aeroway=helipad][iata][iata!~/^[A-Z]{3}$/]
-        # *[aeroway=aerodrome][iata][iata!~/^[A-Z]{3}$/]
+    # *[aeroway=helipad][iata][iata!~/^[A-Z]{3}$/]
+    # *[aeroway=aerodrome][iata][iata!~/^[A-Z]{3}$/]
+    def _way_rule_28(self, data, tags, nds, keys, err, sets):
         if ('aeroway' in keys and 'iata' in keys):
             match = False
             if not match:
@@ -1702,8 +1796,9 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"way aeroway=aerodrome iata=ber"
                 err.append({'class': 9006022, 'subclass': 206938530, 'text': mapcss.tr('wrong value: {0}', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[aeroway=helipad][icao][icao!~/^[A-Z]{4}$/]
-        # *[aeroway=aerodrome][icao][icao!~/^[A-Z]{4}$/]
+    # *[aeroway=helipad][icao][icao!~/^[A-Z]{4}$/]
+    # *[aeroway=aerodrome][icao][icao!~/^[A-Z]{4}$/]
+    def _way_rule_29(self, data, tags, nds, keys, err, sets):
         if ('aeroway' in keys and 'icao' in keys):
             match = False
             if not match:
@@ -1723,8 +1818,9 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"way aeroway=aerodrome icao=eddb"
                 err.append({'class': 9006022, 'subclass': 311618853, 'text': mapcss.tr('wrong value: {0}', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[aeroway=helipad][icao][icao!~/^(AG|AN|AY|BG|BI|BK|C|DA|DB|DF|DG|DI|DN|DR|DT|DX|EB|ED|EE|EF|EG|EH|EI|EK|EL|EN|EP|ES|ET|EV|EY|FA|FB|FC|FD|FE|FG|FH|FI|FJ|FK|FL|FM|FN|FO|FP|FQ|FS|FT|FV|FW|FX|FY|FZ|GA|GB|GC|GE|GF|GG|GL|GM|GO|GQ|GS|GU|GV|HA|HB|HC|HD|HE|HH|HK|HL|HR|HS|HT|HU|K|LA|LB|LC|LD|LE|LF|LG|LH|LI|LJ|LK|LL|LM|LN|LO|LP|LQ|LR|LS|LT|LU|LV|LW|LX|LY|LZ|MB|MD|MG|MH|MK|MM|MN|MP|MR|MS|MT|MU|MW|MY|MZ|NC|NF|NG|NI|NL|NS|NT|NV|NW|NZ|OA|OB|OE|OI|OJ|OK|OL|OM|OO|OP|OR|OS|OT|OY|PA|PB|PC|PF|PG|PH|PJ|PK|PL|PM|PO|PP|PT|PW|RC|RJ|RK|RO|RP|SA|SB|SC|SD|SE|SF|SG|SH|SI|SJ|SK|SL|SM|SN|SO|SP|SS|SU|SV|SW|SY|TA|TB|TD|TF|TG|TI|TJ|TK|TL|TN|TQ|TR|TT|TU|TV|TX|U|UA|UB|UC|UD|UG|UK|UM|UT|VA|VC|VD|VE|VG|VH|VI|VL|VM|VN|VO|VQ|VR|VT|VV|VY|WA|WB|WI|WM|WP|WQ|WR|WS|Y|Z|ZK|ZM)/]
-        # *[aeroway=aerodrome][icao][icao!~/^(AG|AN|AY|BG|BI|BK|C|DA|DB|DF|DG|DI|DN|DR|DT|DX|EB|ED|EE|EF|EG|EH|EI|EK|EL|EN|EP|ES|ET|EV|EY|FA|FB|FC|FD|FE|FG|FH|FI|FJ|FK|FL|FM|FN|FO|FP|FQ|FS|FT|FV|FW|FX|FY|FZ|GA|GB|GC|GE|GF|GG|GL|GM|GO|GQ|GS|GU|GV|HA|HB|HC|HD|HE|HH|HK|HL|HR|HS|HT|HU|K|LA|LB|LC|LD|LE|LF|LG|LH|LI|LJ|LK|LL|LM|LN|LO|LP|LQ|LR|LS|LT|LU|LV|LW|LX|LY|LZ|MB|MD|MG|MH|MK|MM|MN|MP|MR|MS|MT|MU|MW|MY|MZ|NC|NF|NG|NI|NL|NS|NT|NV|NW|NZ|OA|OB|OE|OI|OJ|OK|OL|OM|OO|OP|OR|OS|OT|OY|PA|PB|PC|PF|PG|PH|PJ|PK|PL|PM|PO|PP|PT|PW|RC|RJ|RK|RO|RP|SA|SB|SC|SD|SE|SF|SG|SH|SI|SJ|SK|SL|SM|SN|SO|SP|SS|SU|SV|SW|SY|TA|TB|TD|TF|TG|TI|TJ|TK|TL|TN|TQ|TR|TT|TU|TV|TX|U|UA|UB|UC|UD|UG|UK|UM|UT|VA|VC|VD|VE|VG|VH|VI|VL|VM|VN|VO|VQ|VR|VT|VV|VY|WA|WB|WI|WM|WP|WQ|WR|WS|Y|Z|ZK|ZM)/]
+    # *[aeroway=helipad][icao][icao!~/^(AG|AN|AY|BG|BI|BK|C|DA|DB|DF|DG|DI|DN|DR|DT|DX|EB|ED|EE|EF|EG|EH|EI|EK|EL|EN|EP|ES|ET|EV|EY|FA|FB|FC|FD|FE|FG|FH|FI|FJ|FK|FL|FM|FN|FO|FP|FQ|FS|FT|FV|FW|FX|FY|FZ|GA|GB|GC|GE|GF|GG|GL|GM|GO|GQ|GS|GU|GV|HA|HB|HC|HD|HE|HH|HK|HL|HR|HS|HT|HU|K|LA|LB|LC|LD|LE|LF|LG|LH|LI|LJ|LK|LL|LM|LN|LO|LP|LQ|LR|LS|LT|LU|LV|LW|LX|LY|LZ|MB|MD|MG|MH|MK|MM|MN|MP|MR|MS|MT|MU|MW|MY|MZ|NC|NF|NG|NI|NL|NS|NT|NV|NW|NZ|OA|OB|OE|OI|OJ|OK|OL|OM|OO|OP|OR|OS|OT|OY|PA|PB|PC|PF|PG|PH|PJ|PK|PL|PM|PO|PP|PT|PW|RC|RJ|RK|RO|RP|SA|SB|SC|SD|SE|SF|SG|SH|SI|SJ|SK|SL|SM|SN|SO|SP|SS|SU|SV|SW|SY|TA|TB|TD|TF|TG|TI|TJ|TK|TL|TN|TQ|TR|TT|TU|TV|TX|U|UA|UB|UC|UD|UG|UK|UM|UT|VA|VC|VD|VE|VG|VH|VI|VL|VM|VN|VO|VQ|VR|VT|VV|VY|WA|WB|WI|WM|WP|WQ|WR|WS|Y|Z|ZK|ZM)/]
+    # *[aeroway=aerodrome][icao][icao!~/^(AG|AN|AY|BG|BI|BK|C|DA|DB|DF|DG|DI|DN|DR|DT|DX|EB|ED|EE|EF|EG|EH|EI|EK|EL|EN|EP|ES|ET|EV|EY|FA|FB|FC|FD|FE|FG|FH|FI|FJ|FK|FL|FM|FN|FO|FP|FQ|FS|FT|FV|FW|FX|FY|FZ|GA|GB|GC|GE|GF|GG|GL|GM|GO|GQ|GS|GU|GV|HA|HB|HC|HD|HE|HH|HK|HL|HR|HS|HT|HU|K|LA|LB|LC|LD|LE|LF|LG|LH|LI|LJ|LK|LL|LM|LN|LO|LP|LQ|LR|LS|LT|LU|LV|LW|LX|LY|LZ|MB|MD|MG|MH|MK|MM|MN|MP|MR|MS|MT|MU|MW|MY|MZ|NC|NF|NG|NI|NL|NS|NT|NV|NW|NZ|OA|OB|OE|OI|OJ|OK|OL|OM|OO|OP|OR|OS|OT|OY|PA|PB|PC|PF|PG|PH|PJ|PK|PL|PM|PO|PP|PT|PW|RC|RJ|RK|RO|RP|SA|SB|SC|SD|SE|SF|SG|SH|SI|SJ|SK|SL|SM|SN|SO|SP|SS|SU|SV|SW|SY|TA|TB|TD|TF|TG|TI|TJ|TK|TL|TN|TQ|TR|TT|TU|TV|TX|U|UA|UB|UC|UD|UG|UK|UM|UT|VA|VC|VD|VE|VG|VH|VI|VL|VM|VN|VO|VQ|VR|VT|VV|VY|WA|WB|WI|WM|WP|WQ|WR|WS|Y|Z|ZK|ZM)/]
+    def _way_rule_30(self, data, tags, nds, keys, err, sets):
         if ('aeroway' in keys and 'icao' in keys):
             match = False
             if not match:
@@ -1742,7 +1838,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertMatch:"way aeroway=aerodrome icao=EQQQ"
                 err.append({'class': 9006022, 'subclass': 345477776, 'text': mapcss.tr('wrong value: {0}', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[isced:level][isced:level!~/^(0|1|2|3|4|5|6|7|8)((;|-)(1|2|3|4|5|6|7|8))*$/]
+    # *[isced:level][isced:level!~/^(0|1|2|3|4|5|6|7|8)((;|-)(1|2|3|4|5|6|7|8))*$/]
+    def _way_rule_31(self, data, tags, nds, keys, err, sets):
         if ('isced:level' in keys):
             match = False
             if not match:
@@ -1753,7 +1850,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("unusual value of {0}","{0.key}")
                 err.append({'class': 9006010, 'subclass': 1091907371, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[maxstay=0]
+    # *[maxstay=0]
+    def _way_rule_32(self, data, tags, nds, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -1766,7 +1864,8 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"way maxstay=no"
                 err.append({'class': 9006027, 'subclass': 1756130010, 'text': mapcss.tr('Definition of {0} is unclear', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? min)$/][maxstay!="1 min"]
+    # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? min)$/][maxstay!="1 min"]
+    def _way_rule_33(self, data, tags, nds, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -1777,15 +1876,16 @@ class Josm_numeric(PluginMapCSS):
                 # set maxstay_autofix
                 # throwWarning:tr("unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit","{0.key}","minutes","hours")
                 # fixAdd:concat("maxstay=",replace(tag("maxstay"),"min","minutes"))
-                set_maxstay_autofix = True
+                sets.add('maxstay_autofix')
                 err.append({'class': 9006028, 'subclass': 606655085, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('maxstay=', mapcss.replace(mapcss.tag(tags, 'maxstay'), 'min', 'minutes'))).split('=', 1)])
                 }})
 
-        # *[maxstay="1h"]
-        # *[maxstay="1 h"]
-        # *[maxstay="1 hr"]
+    # *[maxstay="1h"]
+    # *[maxstay="1 h"]
+    # *[maxstay="1 hr"]
+    def _way_rule_34(self, data, tags, nds, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -1804,13 +1904,14 @@ class Josm_numeric(PluginMapCSS):
                 # set maxstay_autofix
                 # throwWarning:tr("unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit","{0.key}","minutes","hours")
                 # fixAdd:"maxstay=1 hour"
-                set_maxstay_autofix = True
+                sets.add('maxstay_autofix')
                 err.append({'class': 9006028, 'subclass': 872535915, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['maxstay','1 hour']])
                 }})
 
-        # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? h)$/][maxstay!="1 h"]
+    # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? h)$/][maxstay!="1 h"]
+    def _way_rule_35(self, data, tags, nds, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -1821,13 +1922,14 @@ class Josm_numeric(PluginMapCSS):
                 # set maxstay_autofix
                 # throwWarning:tr("unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit","{0.key}","minutes","hours")
                 # fixAdd:concat("maxstay=",replace(tag("maxstay"),"h","hours"))
-                set_maxstay_autofix = True
+                sets.add('maxstay_autofix')
                 err.append({'class': 9006028, 'subclass': 59629984, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('maxstay=', mapcss.replace(mapcss.tag(tags, 'maxstay'), 'h', 'hours'))).split('=', 1)])
                 }})
 
-        # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? hr)$/][maxstay!="1 hr"]
+    # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? hr)$/][maxstay!="1 hr"]
+    def _way_rule_36(self, data, tags, nds, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -1838,13 +1940,14 @@ class Josm_numeric(PluginMapCSS):
                 # set maxstay_autofix
                 # throwWarning:tr("unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit","{0.key}","minutes","hours")
                 # fixAdd:concat("maxstay=",replace(tag("maxstay"),"hr","hours"))
-                set_maxstay_autofix = True
+                sets.add('maxstay_autofix')
                 err.append({'class': 9006028, 'subclass': 814970301, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('maxstay=', mapcss.replace(mapcss.tag(tags, 'maxstay'), 'hr', 'hours'))).split('=', 1)])
                 }})
 
-        # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)?h)$/][maxstay!="1h"]
+    # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)?h)$/][maxstay!="1h"]
+    def _way_rule_37(self, data, tags, nds, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -1855,32 +1958,76 @@ class Josm_numeric(PluginMapCSS):
                 # set maxstay_autofix
                 # throwWarning:tr("unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit","{0.key}","minutes","hours")
                 # fixAdd:concat("maxstay=",replace(tag("maxstay"),"h"," hours"))
-                set_maxstay_autofix = True
+                sets.add('maxstay_autofix')
                 err.append({'class': 9006028, 'subclass': 1721471777, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('maxstay=', mapcss.replace(mapcss.tag(tags, 'maxstay'), 'h', ' hours'))).split('=', 1)])
                 }})
 
-        # *[maxstay][maxstay!~/^(([1-9][0-9]*(\.[0-9]+)?( (minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)))|(no|unlimited|0|load-unload))$/]!.maxstay_autofix
+    # *[maxstay][maxstay!~/^(([1-9][0-9]*(\.[0-9]+)?( (minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)))|(no|unlimited|0|load-unload))$/]!.maxstay_autofix
+    def _way_rule_38(self, data, tags, nds, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_maxstay_autofix) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxstay')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_17733c6c, '^(([1-9][0-9]*(\\.[0-9]+)?( (minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)))|(no|unlimited|0|load-unload))$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxstay'))))
+                try: match = (('maxstay_autofix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxstay')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_17733c6c, '^(([1-9][0-9]*(\\.[0-9]+)?( (minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)))|(no|unlimited|0|load-unload))$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxstay'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwWarning:tr("unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit","{0.key}","minutes","hours")
                 err.append({'class': 9006028, 'subclass': 1976092293, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours')})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, None),
+        (_way_rule_1, ['layer']),
+        (_way_rule_2, ['layer']),
+        (_way_rule_3, ['building:levels']),
+        (_way_rule_4, ['building:levels', 'level']),
+        (_way_rule_5, ['roof:height']),
+        (_way_rule_6, ['height', 'maxheight', 'maxlength', 'maxwidth', 'min_height', 'roof:height', 'width']),
+        (_way_rule_7, ['height', 'maxheight', 'maxlength', 'maxwidth', 'roof:height', 'width']),
+        (_way_rule_8, ['distance', 'height', 'maxaxleload', 'maxheight', 'maxlength', 'maxweight', 'maxwidth', 'min_height', 'roof:height', 'width']),
+        (_way_rule_9, ['height', 'maxheight', 'maxlength', 'maxwidth', 'min_height', 'roof:height', 'width']),
+        (_way_rule_10, ['maxaxleload', 'maxweight']),
+        (_way_rule_11, ['maxspeed', 'maxspeed:backward', 'maxspeed:forward']),
+        (_way_rule_12, ['distance']),
+        (_way_rule_13, ['voltage', 'voltage:primary', 'voltage:secondary', 'voltage:tertiary']),
+        (_way_rule_14, ['frequency']),
+        (_way_rule_15, ['gauge']),
+        (_way_rule_16, ['gauge']),
+        (_way_rule_17, ['gauge']),
+        (_way_rule_18, ['incline']),
+        (_way_rule_19, ['population']),
+        (_way_rule_20, ['amenity', 'highway']),
+        (_way_rule_21, ['admin_level']),
+        (_way_rule_22, ['direction']),
+        (_way_rule_23, ['ele']),
+        (_way_rule_24, ['ele']),
+        (_way_rule_25, ['ele']),
+        (_way_rule_26, ['ele']),
+        (_way_rule_27, ['interval']),
+        (_way_rule_28, ['aeroway']),
+        (_way_rule_29, ['aeroway']),
+        (_way_rule_30, ['aeroway']),
+        (_way_rule_31, ['isced:level']),
+        (_way_rule_32, ['maxstay']),
+        (_way_rule_33, ['maxstay']),
+        (_way_rule_34, ['maxstay']),
+        (_way_rule_35, ['maxstay']),
+        (_way_rule_36, ['maxstay']),
+        (_way_rule_37, ['maxstay']),
+        (_way_rule_38, ['maxstay']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
-        set__unit_auto_fix = set_ele_meter_remove_autofix = set_ele_separator_autofix = set_imprecise_gauge = set_maxstay_autofix = set_negative_value = set_unusual_gauge = set_zero_roof_height_flat = False
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-        # *[/^[0-9]+$/]
+    # *[/^[0-9]+$/]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -1891,7 +2038,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("numerical key")
                 err.append({'class': 9006001, 'subclass': 750700308, 'text': mapcss.tr('numerical key')})
 
-        # *[layer=~/^\+\d/]
+    # *[layer=~/^\+\d/]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('layer' in keys):
             match = False
             if not match:
@@ -1906,7 +2054,8 @@ class Josm_numeric(PluginMapCSS):
                     (mapcss.concat('layer=', mapcss.replace(mapcss.tag(tags, 'layer'), '+', ''))).split('=', 1)])
                 }})
 
-        # *[layer][layer!~/^0$|^(-|\+)?[1-5]$/]
+    # *[layer][layer!~/^0$|^(-|\+)?[1-5]$/]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('layer' in keys):
             match = False
             if not match:
@@ -1917,7 +2066,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("{0} should be an integer value between -5 and 5","{0.key}")
                 err.append({'class': 9006003, 'subclass': 1089386010, 'text': mapcss.tr('{0} should be an integer value between -5 and 5', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[building:levels^="-"]
+    # *[building:levels^="-"]
+    def _relation_rule_3(self, data, tags, members, keys, err, sets):
         if ('building:levels' in keys):
             match = False
             if not match:
@@ -1927,16 +2077,17 @@ class Josm_numeric(PluginMapCSS):
             if match:
                 # set negative_value
                 # throwError:tr("negative {0} value","{0.key}")
-                set_negative_value = True
+                sets.add('negative_value')
                 err.append({'class': 9006023, 'subclass': 29188290, 'text': mapcss.tr('negative {0} value', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[building:levels][building:levels!~/^(([0-9]|[1-9][0-9]*)(\.5)?)$/]!.negative_value
-        # *[level][level!~/^((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5)(;((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5))*$/]
+    # *[building:levels][building:levels!~/^(([0-9]|[1-9][0-9]*)(\.5)?)$/]!.negative_value
+    # *[level][level!~/^((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5)(;((((-*[1-9]|[0-9])|-*[1-9][0-9]*)(\.5)?)|-0\.5))*$/]
+    def _relation_rule_4(self, data, tags, members, keys, err, sets):
         if ('building:levels' in keys) or ('level' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_negative_value) and (mapcss._tag_capture(capture_tags, 0, tags, 'building:levels')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2a784076, '^(([0-9]|[1-9][0-9]*)(\\.5)?)$'), mapcss._tag_capture(capture_tags, 1, tags, 'building:levels'))))
+                try: match = (('negative_value' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'building:levels')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_2a784076, '^(([0-9]|[1-9][0-9]*)(\\.5)?)$'), mapcss._tag_capture(capture_tags, 1, tags, 'building:levels'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
@@ -1946,7 +2097,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("{0} should have numbers only with optional .5 increments","{0.key}")
                 err.append({'class': 9006004, 'subclass': 1292315112, 'text': mapcss.tr('{0} should have numbers only with optional .5 increments', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[roof:height][siunit_length(tag("roof:height"))==0][roof:shape=flat]
+    # *[roof:height][siunit_length(tag("roof:height"))==0][roof:shape=flat]
+    def _relation_rule_5(self, data, tags, members, keys, err, sets):
         if ('roof:height' in keys and 'roof:shape' in keys):
             match = False
             if not match:
@@ -1958,19 +2110,20 @@ class Josm_numeric(PluginMapCSS):
                 # group:tr("unnecessary tag")
                 # throwWarning:tr("{0} is unnecessary for {1}","{0.tag}","{2.tag}")
                 # fixRemove:"{0.key}"
-                set_zero_roof_height_flat = True
+                sets.add('zero_roof_height_flat')
                 err.append({'class': 9006025, 'subclass': 301901487, 'text': mapcss.tr('{0} is unnecessary for {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}')), 'allow_fix_override': True, 'fix': {
                     '-': ([
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[height][height=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
-        # *[roof:height][roof:height=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]!.zero_roof_height_flat
-        # *[width][width=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
-        # *[maxwidth][maxwidth=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
-        # *[min_height][min_height=~/^(?i)-?[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
-        # *[maxheight][maxheight=~/^(?i)[1-9][0-9]*([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
-        # *[maxlength][maxlength=~/^(?i)[1-9][0-9]*([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[height][height=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[roof:height][roof:height=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]!.zero_roof_height_flat
+    # *[width][width=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[maxwidth][maxwidth=~/^(?i)[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[min_height][min_height=~/^(?i)-?[0-9]+([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[maxheight][maxheight=~/^(?i)[1-9][0-9]*([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    # *[maxlength][maxlength=~/^(?i)[1-9][0-9]*([.,][0-9]+)?( *(metres?|meters?)|m| {2,}m)$/]
+    def _relation_rule_6(self, data, tags, members, keys, err, sets):
         if ('height' in keys) or ('maxheight' in keys) or ('maxlength' in keys) or ('maxwidth' in keys) or ('min_height' in keys) or ('roof:height' in keys) or ('width' in keys):
             match = False
             if not match:
@@ -1979,7 +2132,7 @@ class Josm_numeric(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_zero_roof_height_flat) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_5dbcb7bc), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
+                try: match = (('zero_roof_height_flat' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_5dbcb7bc), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
@@ -2005,18 +2158,19 @@ class Josm_numeric(PluginMapCSS):
                 # set _unit_auto_fix
                 # throwWarning:tr("unusual value of {0}: use abbreviation for unit and space between value and unit","{0.key}")
                 # fixAdd:concat("{0.key}","=",get(regexp_match("([0-9.,]+) *.+","{0.value}"),1)," m")
-                set__unit_auto_fix = True
+                sets.add('_unit_auto_fix')
                 err.append({'class': 9006024, 'subclass': 1245344673, 'text': mapcss.tr('unusual value of {0}: use abbreviation for unit and space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}'), '=', mapcss.get(mapcss.regexp_match(self.re_6ae26377, mapcss._tag_uncapture(capture_tags, '{0.value}')), 1), ' m')).split('=', 1)])
                 }})
 
-        # *[height][height=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
-        # *[maxheight][maxheight=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
-        # *[roof:height][roof:height=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]!.zero_roof_height_flat
-        # *[maxlength][maxlength=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
-        # *[width][width=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
-        # *[maxwidth][maxwidth=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    # *[height][height=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    # *[maxheight][maxheight=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    # *[roof:height][roof:height=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]!.zero_roof_height_flat
+    # *[maxlength][maxlength=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    # *[width][width=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    # *[maxwidth][maxwidth=~/^(?i)[0-9]+([.,][0-9]+)?( *(foot|feet|ft)| +\')$/]
+    def _relation_rule_7(self, data, tags, members, keys, err, sets):
         if ('height' in keys) or ('maxheight' in keys) or ('maxlength' in keys) or ('maxwidth' in keys) or ('roof:height' in keys) or ('width' in keys):
             match = False
             if not match:
@@ -2029,7 +2183,7 @@ class Josm_numeric(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_zero_roof_height_flat) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_549d66c4), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
+                try: match = (('zero_roof_height_flat' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_549d66c4), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
@@ -2047,22 +2201,23 @@ class Josm_numeric(PluginMapCSS):
                 # set _unit_auto_fix
                 # throwWarning:tr("unusual value of {0}: use '' for foot and \" for inches, no spaces","{0.key}")
                 # fixAdd:concat("{0.key}","=",get(regexp_match("([0-9.,]+) *.+","{0.value}"),1),"'")
-                set__unit_auto_fix = True
+                sets.add('_unit_auto_fix')
                 err.append({'class': 9006031, 'subclass': 1118826626, 'text': mapcss.tr('unusual value of {0}: use \'\' for foot and " for inches, no spaces', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}'), '=', mapcss.get(mapcss.regexp_match(self.re_6ae26377, mapcss._tag_uncapture(capture_tags, '{0.value}')), 1), '\'')).split('=', 1)])
                 }})
 
-        # *[height][height=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[maxheight][maxheight=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[roof:height][roof:height=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[maxlength][maxlength=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[width][width=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[maxwidth][maxwidth=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[min_height][min_height=~/^-?[0-9]+,[0-9][0-9]?( m|\')?$/]
-        # *[maxaxleload][maxaxleload=~/^[0-9]+,[0-9][0-9]?( (t|kg|st|lbs))?$/]
-        # *[maxweight][maxweight=~/^[0-9]+,[0-9][0-9]?( (t|kg|st|lbs))?$/]
-        # *[distance][distance=~/^[0-9]+,[0-9][0-9]?( (m|km|mi|nmi))?$/]
+    # *[height][height=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[maxheight][maxheight=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[roof:height][roof:height=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[maxlength][maxlength=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[width][width=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[maxwidth][maxwidth=~/^[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[min_height][min_height=~/^-?[0-9]+,[0-9][0-9]?( m|\')?$/]
+    # *[maxaxleload][maxaxleload=~/^[0-9]+,[0-9][0-9]?( (t|kg|st|lbs))?$/]
+    # *[maxweight][maxweight=~/^[0-9]+,[0-9][0-9]?( (t|kg|st|lbs))?$/]
+    # *[distance][distance=~/^[0-9]+,[0-9][0-9]?( (m|km|mi|nmi))?$/]
+    def _relation_rule_8(self, data, tags, members, keys, err, sets):
         if ('distance' in keys) or ('height' in keys) or ('maxaxleload' in keys) or ('maxheight' in keys) or ('maxlength' in keys) or ('maxweight' in keys) or ('maxwidth' in keys) or ('min_height' in keys) or ('roof:height' in keys) or ('width' in keys):
             match = False
             if not match:
@@ -2109,55 +2264,57 @@ class Josm_numeric(PluginMapCSS):
                 # set _unit_auto_fix
                 # throwWarning:tr("unusual value of {0}: use . instead of , as decimal separator","{0.key}")
                 # fixAdd:concat("{0.key}","=",replace(tag("{0.key}"),",","."))
-                set__unit_auto_fix = True
+                sets.add('_unit_auto_fix')
                 err.append({'class': 9006017, 'subclass': 1619669445, 'text': mapcss.tr('unusual value of {0}: use . instead of , as decimal separator', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}'), '=', mapcss.replace(mapcss.tag(tags, mapcss._tag_uncapture(capture_tags, '{0.key}')), ',', '.'))).split('=', 1)])
                 }})
 
-        # *[height][height!~/^(([0-9]+(\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!._unit_auto_fix
-        # *[maxheight][maxheight!~/^(([1-9][0-9]*(\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\.[0-9]*)?\")?)|none|default|below_default)$/]!._unit_auto_fix
-        # *[min_height][min_height!~/^(-?([0-9]+(\.[0-9]+)?( m)?)|(-?[1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!._unit_auto_fix
-        # *[roof:height][roof:height!~/^(([0-9]+(\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!.zero_roof_height_flat!._unit_auto_fix
-        # *[maxlength][maxlength!~/^(([1-9][0-9]*(\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\.[0-9]*)?\")?)|none|default|below_default)$/]!._unit_auto_fix
-        # *[width][width!~/^(([0-9]+(\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]!._unit_auto_fix
-        # *[maxwidth][maxwidth!~/^(([0-9]+(\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]!._unit_auto_fix
+    # *[height][height!~/^(([0-9]+(\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!._unit_auto_fix
+    # *[maxheight][maxheight!~/^(([1-9][0-9]*(\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\.[0-9]*)?\")?)|none|default|below_default)$/]!._unit_auto_fix
+    # *[min_height][min_height!~/^(-?([0-9]+(\.[0-9]+)?( m)?)|(-?[1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!._unit_auto_fix
+    # *[roof:height][roof:height!~/^(([0-9]+(\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\.[0-9]+)?)\")?))$/]!.zero_roof_height_flat!._unit_auto_fix
+    # *[maxlength][maxlength!~/^(([1-9][0-9]*(\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\.[0-9]*)?\")?)|none|default|below_default)$/]!._unit_auto_fix
+    # *[width][width!~/^(([0-9]+(\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]!._unit_auto_fix
+    # *[maxwidth][maxwidth!~/^(([0-9]+(\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]!._unit_auto_fix
+    def _relation_rule_9(self, data, tags, members, keys, err, sets):
         if ('height' in keys) or ('maxheight' in keys) or ('maxlength' in keys) or ('maxwidth' in keys) or ('min_height' in keys) or ('roof:height' in keys) or ('width' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_76fe90df, '^(([0-9]+(\\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'height'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_76fe90df, '^(([0-9]+(\\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'height'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxheight')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_40277cab, '^(([1-9][0-9]*(\\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\\.[0-9]*)?\\")?)|none|default|below_default)$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxheight'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxheight')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_40277cab, '^(([1-9][0-9]*(\\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\\.[0-9]*)?\\")?)|none|default|below_default)$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxheight'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'min_height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_470ea515, '^(-?([0-9]+(\\.[0-9]+)?( m)?)|(-?[1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'min_height'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'min_height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_470ea515, '^(-?([0-9]+(\\.[0-9]+)?( m)?)|(-?[1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'min_height'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set_zero_roof_height_flat) and (not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_76fe90df, '^(([0-9]+(\\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
+                try: match = (('zero_roof_height_flat' not in sets) and ('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'roof:height')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_76fe90df, '^(([0-9]+(\\.[0-9]+)?( m)?)|([1-9][0-9]*\'((10|11|[0-9])((\\.[0-9]+)?)\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'roof:height'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxlength')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_40277cab, '^(([1-9][0-9]*(\\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\\.[0-9]*)?\\")?)|none|default|below_default)$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxlength'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxlength')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_40277cab, '^(([1-9][0-9]*(\\.[0-9]+)?( m)?)|([0-9]+\'(([0-9]|10|11)(\\.[0-9]*)?\\")?)|none|default|below_default)$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxlength'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'width')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4a678586, '^(([0-9]+(\\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\\.[0-9]+)?\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'width'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'width')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4a678586, '^(([0-9]+(\\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\\.[0-9]+)?\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'width'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((not set__unit_auto_fix) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxwidth')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4a678586, '^(([0-9]+(\\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\\.[0-9]+)?\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxwidth'))))
+                try: match = (('_unit_auto_fix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxwidth')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_4a678586, '^(([0-9]+(\\.[0-9]+)?( m)?)|([0-9]+\'([0-9]+(\\.[0-9]+)?\\")?))$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxwidth'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwWarning:tr("unusual value of {0}: meters is default; only positive values; point is decimal separator; if units, put space then unit","{0.key}")
                 err.append({'class': 9006032, 'subclass': 516585238, 'text': mapcss.tr('unusual value of {0}: meters is default; only positive values; point is decimal separator; if units, put space then unit', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[maxaxleload][maxaxleload!~/^([0-9]+(\.[0-9]+)?( (t|kg|st|lbs))?)$/]
-        # *[maxweight][maxweight!~/^([0-9]+(\.[0-9]+)?( (t|kg|st|lbs))?)$/]
+    # *[maxaxleload][maxaxleload!~/^([0-9]+(\.[0-9]+)?( (t|kg|st|lbs))?)$/]
+    # *[maxweight][maxweight!~/^([0-9]+(\.[0-9]+)?( (t|kg|st|lbs))?)$/]
+    def _relation_rule_10(self, data, tags, members, keys, err, sets):
         if ('maxaxleload' in keys) or ('maxweight' in keys):
             match = False
             if not match:
@@ -2172,7 +2329,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("unusual value of {0}: {1} is default; only positive values; point is decimal separator; if units, put space then unit","{0.key}",tr("tonne"))
                 err.append({'class': 9006026, 'subclass': 326659919, 'text': mapcss.tr('unusual value of {0}: {1} is default; only positive values; point is decimal separator; if units, put space then unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss.tr('tonne'))})
 
-        # *[distance][distance!~/^(([0-9]+(\.[0-9]+)?( (m|km|mi|nmi))?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]
+    # *[distance][distance!~/^(([0-9]+(\.[0-9]+)?( (m|km|mi|nmi))?)|([0-9]+\'([0-9]+(\.[0-9]+)?\")?))$/]
+    def _relation_rule_11(self, data, tags, members, keys, err, sets):
         if ('distance' in keys):
             match = False
             if not match:
@@ -2183,7 +2341,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("unusual value of {0}: {1} is default; only positive values; point is decimal separator; if units, put space then unit","{0.key}",tr("kilometers"))
                 err.append({'class': 9006026, 'subclass': 1210743405, 'text': mapcss.tr('unusual value of {0}: {1} is default; only positive values; point is decimal separator; if units, put space then unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss.tr('kilometers'))})
 
-        # relation[gauge][gauge=~/^(broad|standard|narrow)$/]
+    # relation[gauge][gauge=~/^(broad|standard|narrow)$/]
+    def _relation_rule_12(self, data, tags, members, keys, err, sets):
         if ('gauge' in keys):
             match = False
             if not match:
@@ -2194,35 +2353,38 @@ class Josm_numeric(PluginMapCSS):
                 # set imprecise_gauge
                 # suggestAlternative:tr("an integer value in millimeters, without unit")
                 # throwWarning:tr("imprecise value of {0}","{0.tag}")
-                set_imprecise_gauge = True
+                sets.add('imprecise_gauge')
                 err.append({'class': 9006029, 'subclass': 1590792813, 'text': mapcss.tr('imprecise value of {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # relation[gauge][gauge!~/^([1-9][0-9]{1,3}(;[1-9][0-9]{1,3})*)$/]!.imprecise_gauge
+    # relation[gauge][gauge!~/^([1-9][0-9]{1,3}(;[1-9][0-9]{1,3})*)$/]!.imprecise_gauge
+    def _relation_rule_13(self, data, tags, members, keys, err, sets):
         if ('gauge' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_imprecise_gauge) and (mapcss._tag_capture(capture_tags, 0, tags, 'gauge')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_58d78904, '^([1-9][0-9]{1,3}(;[1-9][0-9]{1,3})*)$'), mapcss._tag_capture(capture_tags, 1, tags, 'gauge'))))
+                try: match = (('imprecise_gauge' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'gauge')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_58d78904, '^([1-9][0-9]{1,3}(;[1-9][0-9]{1,3})*)$'), mapcss._tag_capture(capture_tags, 1, tags, 'gauge'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # set unusual_gauge
                 # throwWarning:tr("unusual value of {0}","{0.key}")
-                set_unusual_gauge = True
+                sets.add('unusual_gauge')
                 err.append({'class': 9006010, 'subclass': 1964213800, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # relation[/railway$/=~/^narrow_gauge$/][gauge][gauge!~/^((14(?:3[0-4]|[4-9])|(?:14[0-2]|(?:1[0-3]|9)[0-9])[0-9]?|143|(?:[2-7][0-9]|1[5-9])[0-9]|8(?:[0-8][0-9]|9[0-9]?));?)+$/]!.imprecise_gauge!.unusual_gauge[type=route]
+    # relation[/railway$/=~/^narrow_gauge$/][gauge][gauge!~/^((14(?:3[0-4]|[4-9])|(?:14[0-2]|(?:1[0-3]|9)[0-9])[0-9]?|143|(?:[2-7][0-9]|1[5-9])[0-9]|8(?:[0-8][0-9]|9[0-9]?));?)+$/]!.imprecise_gauge!.unusual_gauge[type=route]
+    def _relation_rule_14(self, data, tags, members, keys, err, sets):
         if ('gauge' in keys and 'type' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_imprecise_gauge) and (not set_unusual_gauge) and (mapcss.regexp_test(self.re_70dc3282, mapcss._match_regex(tags, self.re_7e626945))) and (mapcss._tag_capture(capture_tags, 1, tags, 'gauge')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_33ecb9da, '^((14(?:3[0-4]|[4-9])|(?:14[0-2]|(?:1[0-3]|9)[0-9])[0-9]?|143|(?:[2-7][0-9]|1[5-9])[0-9]|8(?:[0-8][0-9]|9[0-9]?));?)+$'), mapcss._tag_capture(capture_tags, 2, tags, 'gauge'))) and (mapcss._tag_capture(capture_tags, 5, tags, 'type') == mapcss._value_capture(capture_tags, 5, 'route')))
+                try: match = (('imprecise_gauge' not in sets) and ('unusual_gauge' not in sets) and (mapcss.regexp_test(self.re_70dc3282, mapcss._match_regex(tags, self.re_7e626945))) and (mapcss._tag_capture(capture_tags, 1, tags, 'gauge')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_33ecb9da, '^((14(?:3[0-4]|[4-9])|(?:14[0-2]|(?:1[0-3]|9)[0-9])[0-9]?|143|(?:[2-7][0-9]|1[5-9])[0-9]|8(?:[0-8][0-9]|9[0-9]?));?)+$'), mapcss._tag_capture(capture_tags, 2, tags, 'gauge'))) and (mapcss._tag_capture(capture_tags, 5, tags, 'type') == mapcss._value_capture(capture_tags, 5, 'route')))
                 except mapcss.RuleAbort: pass
             if match:
                 # group:tr("suspicious tag combination")
                 # throwWarning:tr("unusual {0} value on narrow gauge railway","{1.key}")
                 err.append({'class': 9006030, 'subclass': 1005704701, 'text': mapcss.tr('unusual {0} value on narrow gauge railway', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[population][population!~/^[0-9]+$/]
+    # *[population][population!~/^[0-9]+$/]
+    def _relation_rule_15(self, data, tags, members, keys, err, sets):
         if ('population' in keys):
             match = False
             if not match:
@@ -2233,7 +2395,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("{0} must be a numeric value","{0.key}")
                 err.append({'class': 9006008, 'subclass': 313743521, 'text': mapcss.tr('{0} must be a numeric value', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[screen][screen!~/^[1-9]([0-9]*)$/][amenity=cinema]
+    # *[screen][screen!~/^[1-9]([0-9]*)$/][amenity=cinema]
+    def _relation_rule_16(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'screen' in keys):
             match = False
             if not match:
@@ -2244,7 +2407,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwError:tr("{0} must be a positive integer number","{0.key}")
                 err.append({'class': 9006009, 'subclass': 1499065449, 'text': mapcss.tr('{0} must be a positive integer number', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[admin_level][admin_level!~/^(1|2|3|4|5|6|7|8|9|10|11|12)$/]
+    # *[admin_level][admin_level!~/^(1|2|3|4|5|6|7|8|9|10|11|12)$/]
+    def _relation_rule_17(self, data, tags, members, keys, err, sets):
         if ('admin_level' in keys):
             match = False
             if not match:
@@ -2255,9 +2419,10 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("unusual value of {0}","{0.key}")
                 err.append({'class': 9006010, 'subclass': 1514270237, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[direction][direction<0]
-        # *[direction][direction>=360]
-        # *[direction][direction!~/^([0-9][0-9]?[0-9]?|north|east|south|west|N|E|S|W|NE|SE|SW|NW|NNE|ENE|ESE|SSE|SSW|WSW|WNW|NNW|forward|backward|both|clockwise|anti-clockwise|anticlockwise|up|down)((-|;)([0-9][0-9]?[0-9]?|N|E|S|W|NE|SE|SW|NW|NNE|ENE|ESE|SSE|SSW|WSW|WNW|NNW))*$/]
+    # *[direction][direction<0]
+    # *[direction][direction>=360]
+    # *[direction][direction!~/^([0-9][0-9]?[0-9]?|north|east|south|west|N|E|S|W|NE|SE|SW|NW|NNE|ENE|ESE|SSE|SSW|WSW|WNW|NNW|forward|backward|both|clockwise|anti-clockwise|anticlockwise|up|down)((-|;)([0-9][0-9]?[0-9]?|N|E|S|W|NE|SE|SW|NW|NNE|ENE|ESE|SSE|SSW|WSW|WNW|NNW))*$/]
+    def _relation_rule_18(self, data, tags, members, keys, err, sets):
         if ('direction' in keys):
             match = False
             if not match:
@@ -2276,7 +2441,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("unusual value of {0}","{0.key}")
                 err.append({'class': 9006010, 'subclass': 51356092, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[ele][ele=~/^-?[0-9]+(\.[0-9]+)? ?m$/]
+    # *[ele][ele=~/^-?[0-9]+(\.[0-9]+)? ?m$/]
+    def _relation_rule_19(self, data, tags, members, keys, err, sets):
         if ('ele' in keys):
             match = False
             if not match:
@@ -2287,13 +2453,14 @@ class Josm_numeric(PluginMapCSS):
                 # set ele_meter_remove_autofix
                 # throwWarning:tr("{0} must be a numeric value, in meters and without units","{0.key}")
                 # fixAdd:concat("ele=",trim(replace(tag("ele"),"m","")))
-                set_ele_meter_remove_autofix = True
+                sets.add('ele_meter_remove_autofix')
                 err.append({'class': 9006011, 'subclass': 1672584043, 'text': mapcss.tr('{0} must be a numeric value, in meters and without units', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('ele=', mapcss.trim(mapcss.replace(mapcss.tag(tags, 'ele'), 'm', '')))).split('=', 1)])
                 }})
 
-        # *[ele][ele=~/^[0-9]+,[0-9][0-9]?$/]
+    # *[ele][ele=~/^[0-9]+,[0-9][0-9]?$/]
+    def _relation_rule_20(self, data, tags, members, keys, err, sets):
         if ('ele' in keys):
             match = False
             if not match:
@@ -2304,24 +2471,26 @@ class Josm_numeric(PluginMapCSS):
                 # set ele_separator_autofix
                 # throwWarning:tr("unusual value of {0}: use . instead of , as decimal separator","{0.key}")
                 # fixAdd:concat("ele=",replace(tag("ele"),",","."))
-                set_ele_separator_autofix = True
+                sets.add('ele_separator_autofix')
                 err.append({'class': 9006017, 'subclass': 202511106, 'text': mapcss.tr('unusual value of {0}: use . instead of , as decimal separator', mapcss._tag_uncapture(capture_tags, '{0.key}')), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('ele=', mapcss.replace(mapcss.tag(tags, 'ele'), ',', '.'))).split('=', 1)])
                 }})
 
-        # *[ele][ele!~/^-?[0-9]+(\.[0-9]+)?$/]!.ele_meter_remove_autofix!.ele_separator_autofix
+    # *[ele][ele!~/^-?[0-9]+(\.[0-9]+)?$/]!.ele_meter_remove_autofix!.ele_separator_autofix
+    def _relation_rule_21(self, data, tags, members, keys, err, sets):
         if ('ele' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_ele_meter_remove_autofix) and (not set_ele_separator_autofix) and (mapcss._tag_capture(capture_tags, 0, tags, 'ele')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_45b46d60, '^-?[0-9]+(\\.[0-9]+)?$'), mapcss._tag_capture(capture_tags, 1, tags, 'ele'))))
+                try: match = (('ele_meter_remove_autofix' not in sets) and ('ele_separator_autofix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'ele')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_45b46d60, '^-?[0-9]+(\\.[0-9]+)?$'), mapcss._tag_capture(capture_tags, 1, tags, 'ele'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwWarning:tr("{0} must be a numeric value, in meters and without units","{0.key}")
                 err.append({'class': 9006011, 'subclass': 1781084832, 'text': mapcss.tr('{0} must be a numeric value, in meters and without units', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[ele][ele=~/^-?[0-9]+\.[0-9][0-9][0-9]+$/]
+    # *[ele][ele=~/^-?[0-9]+\.[0-9][0-9][0-9]+$/]
+    def _relation_rule_22(self, data, tags, members, keys, err, sets):
         if ('ele' in keys):
             match = False
             if not match:
@@ -2337,7 +2506,8 @@ class Josm_numeric(PluginMapCSS):
                     (mapcss.concat('ele=', mapcss.round_(mapcss.tag(tags, 'ele')*100)/100)).split('=', 1)])
                 }})
 
-        # *[interval][interval!~/^([0-9][0-9]?[0-9]?|[0-9]+[0-9]:[0-5][0-9](:[0-5][0-9])?)$/]
+    # *[interval][interval!~/^([0-9][0-9]?[0-9]?|[0-9]+[0-9]:[0-5][0-9](:[0-5][0-9])?)$/]
+    def _relation_rule_23(self, data, tags, members, keys, err, sets):
         if ('interval' in keys):
             match = False
             if not match:
@@ -2350,8 +2520,9 @@ class Josm_numeric(PluginMapCSS):
                 # assertNoMatch:"relation interval=168:00:00"
                 err.append({'class': 9006010, 'subclass': 234727583, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[aeroway=helipad][iata][iata!~/^[A-Z]{3}$/]
-        # *[aeroway=aerodrome][iata][iata!~/^[A-Z]{3}$/]
+    # *[aeroway=helipad][iata][iata!~/^[A-Z]{3}$/]
+    # *[aeroway=aerodrome][iata][iata!~/^[A-Z]{3}$/]
+    def _relation_rule_24(self, data, tags, members, keys, err, sets):
         if ('aeroway' in keys and 'iata' in keys):
             match = False
             if not match:
@@ -2367,8 +2538,9 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("wrong value: {0}","{1.tag}")
                 err.append({'class': 9006022, 'subclass': 206938530, 'text': mapcss.tr('wrong value: {0}', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[aeroway=helipad][icao][icao!~/^[A-Z]{4}$/]
-        # *[aeroway=aerodrome][icao][icao!~/^[A-Z]{4}$/]
+    # *[aeroway=helipad][icao][icao!~/^[A-Z]{4}$/]
+    # *[aeroway=aerodrome][icao][icao!~/^[A-Z]{4}$/]
+    def _relation_rule_25(self, data, tags, members, keys, err, sets):
         if ('aeroway' in keys and 'icao' in keys):
             match = False
             if not match:
@@ -2384,8 +2556,9 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("wrong value: {0}","{1.tag}")
                 err.append({'class': 9006022, 'subclass': 311618853, 'text': mapcss.tr('wrong value: {0}', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[aeroway=helipad][icao][icao!~/^(AG|AN|AY|BG|BI|BK|C|DA|DB|DF|DG|DI|DN|DR|DT|DX|EB|ED|EE|EF|EG|EH|EI|EK|EL|EN|EP|ES|ET|EV|EY|FA|FB|FC|FD|FE|FG|FH|FI|FJ|FK|FL|FM|FN|FO|FP|FQ|FS|FT|FV|FW|FX|FY|FZ|GA|GB|GC|GE|GF|GG|GL|GM|GO|GQ|GS|GU|GV|HA|HB|HC|HD|HE|HH|HK|HL|HR|HS|HT|HU|K|LA|LB|LC|LD|LE|LF|LG|LH|LI|LJ|LK|LL|LM|LN|LO|LP|LQ|LR|LS|LT|LU|LV|LW|LX|LY|LZ|MB|MD|MG|MH|MK|MM|MN|MP|MR|MS|MT|MU|MW|MY|MZ|NC|NF|NG|NI|NL|NS|NT|NV|NW|NZ|OA|OB|OE|OI|OJ|OK|OL|OM|OO|OP|OR|OS|OT|OY|PA|PB|PC|PF|PG|PH|PJ|PK|PL|PM|PO|PP|PT|PW|RC|RJ|RK|RO|RP|SA|SB|SC|SD|SE|SF|SG|SH|SI|SJ|SK|SL|SM|SN|SO|SP|SS|SU|SV|SW|SY|TA|TB|TD|TF|TG|TI|TJ|TK|TL|TN|TQ|TR|TT|TU|TV|TX|U|UA|UB|UC|UD|UG|UK|UM|UT|VA|VC|VD|VE|VG|VH|VI|VL|VM|VN|VO|VQ|VR|VT|VV|VY|WA|WB|WI|WM|WP|WQ|WR|WS|Y|Z|ZK|ZM)/]
-        # *[aeroway=aerodrome][icao][icao!~/^(AG|AN|AY|BG|BI|BK|C|DA|DB|DF|DG|DI|DN|DR|DT|DX|EB|ED|EE|EF|EG|EH|EI|EK|EL|EN|EP|ES|ET|EV|EY|FA|FB|FC|FD|FE|FG|FH|FI|FJ|FK|FL|FM|FN|FO|FP|FQ|FS|FT|FV|FW|FX|FY|FZ|GA|GB|GC|GE|GF|GG|GL|GM|GO|GQ|GS|GU|GV|HA|HB|HC|HD|HE|HH|HK|HL|HR|HS|HT|HU|K|LA|LB|LC|LD|LE|LF|LG|LH|LI|LJ|LK|LL|LM|LN|LO|LP|LQ|LR|LS|LT|LU|LV|LW|LX|LY|LZ|MB|MD|MG|MH|MK|MM|MN|MP|MR|MS|MT|MU|MW|MY|MZ|NC|NF|NG|NI|NL|NS|NT|NV|NW|NZ|OA|OB|OE|OI|OJ|OK|OL|OM|OO|OP|OR|OS|OT|OY|PA|PB|PC|PF|PG|PH|PJ|PK|PL|PM|PO|PP|PT|PW|RC|RJ|RK|RO|RP|SA|SB|SC|SD|SE|SF|SG|SH|SI|SJ|SK|SL|SM|SN|SO|SP|SS|SU|SV|SW|SY|TA|TB|TD|TF|TG|TI|TJ|TK|TL|TN|TQ|TR|TT|TU|TV|TX|U|UA|UB|UC|UD|UG|UK|UM|UT|VA|VC|VD|VE|VG|VH|VI|VL|VM|VN|VO|VQ|VR|VT|VV|VY|WA|WB|WI|WM|WP|WQ|WR|WS|Y|Z|ZK|ZM)/]
+    # *[aeroway=helipad][icao][icao!~/^(AG|AN|AY|BG|BI|BK|C|DA|DB|DF|DG|DI|DN|DR|DT|DX|EB|ED|EE|EF|EG|EH|EI|EK|EL|EN|EP|ES|ET|EV|EY|FA|FB|FC|FD|FE|FG|FH|FI|FJ|FK|FL|FM|FN|FO|FP|FQ|FS|FT|FV|FW|FX|FY|FZ|GA|GB|GC|GE|GF|GG|GL|GM|GO|GQ|GS|GU|GV|HA|HB|HC|HD|HE|HH|HK|HL|HR|HS|HT|HU|K|LA|LB|LC|LD|LE|LF|LG|LH|LI|LJ|LK|LL|LM|LN|LO|LP|LQ|LR|LS|LT|LU|LV|LW|LX|LY|LZ|MB|MD|MG|MH|MK|MM|MN|MP|MR|MS|MT|MU|MW|MY|MZ|NC|NF|NG|NI|NL|NS|NT|NV|NW|NZ|OA|OB|OE|OI|OJ|OK|OL|OM|OO|OP|OR|OS|OT|OY|PA|PB|PC|PF|PG|PH|PJ|PK|PL|PM|PO|PP|PT|PW|RC|RJ|RK|RO|RP|SA|SB|SC|SD|SE|SF|SG|SH|SI|SJ|SK|SL|SM|SN|SO|SP|SS|SU|SV|SW|SY|TA|TB|TD|TF|TG|TI|TJ|TK|TL|TN|TQ|TR|TT|TU|TV|TX|U|UA|UB|UC|UD|UG|UK|UM|UT|VA|VC|VD|VE|VG|VH|VI|VL|VM|VN|VO|VQ|VR|VT|VV|VY|WA|WB|WI|WM|WP|WQ|WR|WS|Y|Z|ZK|ZM)/]
+    # *[aeroway=aerodrome][icao][icao!~/^(AG|AN|AY|BG|BI|BK|C|DA|DB|DF|DG|DI|DN|DR|DT|DX|EB|ED|EE|EF|EG|EH|EI|EK|EL|EN|EP|ES|ET|EV|EY|FA|FB|FC|FD|FE|FG|FH|FI|FJ|FK|FL|FM|FN|FO|FP|FQ|FS|FT|FV|FW|FX|FY|FZ|GA|GB|GC|GE|GF|GG|GL|GM|GO|GQ|GS|GU|GV|HA|HB|HC|HD|HE|HH|HK|HL|HR|HS|HT|HU|K|LA|LB|LC|LD|LE|LF|LG|LH|LI|LJ|LK|LL|LM|LN|LO|LP|LQ|LR|LS|LT|LU|LV|LW|LX|LY|LZ|MB|MD|MG|MH|MK|MM|MN|MP|MR|MS|MT|MU|MW|MY|MZ|NC|NF|NG|NI|NL|NS|NT|NV|NW|NZ|OA|OB|OE|OI|OJ|OK|OL|OM|OO|OP|OR|OS|OT|OY|PA|PB|PC|PF|PG|PH|PJ|PK|PL|PM|PO|PP|PT|PW|RC|RJ|RK|RO|RP|SA|SB|SC|SD|SE|SF|SG|SH|SI|SJ|SK|SL|SM|SN|SO|SP|SS|SU|SV|SW|SY|TA|TB|TD|TF|TG|TI|TJ|TK|TL|TN|TQ|TR|TT|TU|TV|TX|U|UA|UB|UC|UD|UG|UK|UM|UT|VA|VC|VD|VE|VG|VH|VI|VL|VM|VN|VO|VQ|VR|VT|VV|VY|WA|WB|WI|WM|WP|WQ|WR|WS|Y|Z|ZK|ZM)/]
+    def _relation_rule_26(self, data, tags, members, keys, err, sets):
         if ('aeroway' in keys and 'icao' in keys):
             match = False
             if not match:
@@ -2401,7 +2574,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("wrong value: {0}","{1.tag}")
                 err.append({'class': 9006022, 'subclass': 345477776, 'text': mapcss.tr('wrong value: {0}', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[isced:level][isced:level!~/^(0|1|2|3|4|5|6|7|8)((;|-)(1|2|3|4|5|6|7|8))*$/]
+    # *[isced:level][isced:level!~/^(0|1|2|3|4|5|6|7|8)((;|-)(1|2|3|4|5|6|7|8))*$/]
+    def _relation_rule_27(self, data, tags, members, keys, err, sets):
         if ('isced:level' in keys):
             match = False
             if not match:
@@ -2412,7 +2586,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("unusual value of {0}","{0.key}")
                 err.append({'class': 9006010, 'subclass': 1091907371, 'text': mapcss.tr('unusual value of {0}', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # *[maxstay=0]
+    # *[maxstay=0]
+    def _relation_rule_28(self, data, tags, members, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -2423,7 +2598,8 @@ class Josm_numeric(PluginMapCSS):
                 # throwWarning:tr("Definition of {0} is unclear","{0.tag}")
                 err.append({'class': 9006027, 'subclass': 1756130010, 'text': mapcss.tr('Definition of {0} is unclear', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? min)$/][maxstay!="1 min"]
+    # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? min)$/][maxstay!="1 min"]
+    def _relation_rule_29(self, data, tags, members, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -2434,15 +2610,16 @@ class Josm_numeric(PluginMapCSS):
                 # set maxstay_autofix
                 # throwWarning:tr("unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit","{0.key}","minutes","hours")
                 # fixAdd:concat("maxstay=",replace(tag("maxstay"),"min","minutes"))
-                set_maxstay_autofix = True
+                sets.add('maxstay_autofix')
                 err.append({'class': 9006028, 'subclass': 606655085, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('maxstay=', mapcss.replace(mapcss.tag(tags, 'maxstay'), 'min', 'minutes'))).split('=', 1)])
                 }})
 
-        # *[maxstay="1h"]
-        # *[maxstay="1 h"]
-        # *[maxstay="1 hr"]
+    # *[maxstay="1h"]
+    # *[maxstay="1 h"]
+    # *[maxstay="1 hr"]
+    def _relation_rule_30(self, data, tags, members, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -2461,13 +2638,14 @@ class Josm_numeric(PluginMapCSS):
                 # set maxstay_autofix
                 # throwWarning:tr("unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit","{0.key}","minutes","hours")
                 # fixAdd:"maxstay=1 hour"
-                set_maxstay_autofix = True
+                sets.add('maxstay_autofix')
                 err.append({'class': 9006028, 'subclass': 872535915, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     ['maxstay','1 hour']])
                 }})
 
-        # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? h)$/][maxstay!="1 h"]
+    # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? h)$/][maxstay!="1 h"]
+    def _relation_rule_31(self, data, tags, members, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -2478,13 +2656,14 @@ class Josm_numeric(PluginMapCSS):
                 # set maxstay_autofix
                 # throwWarning:tr("unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit","{0.key}","minutes","hours")
                 # fixAdd:concat("maxstay=",replace(tag("maxstay"),"h","hours"))
-                set_maxstay_autofix = True
+                sets.add('maxstay_autofix')
                 err.append({'class': 9006028, 'subclass': 59629984, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('maxstay=', mapcss.replace(mapcss.tag(tags, 'maxstay'), 'h', 'hours'))).split('=', 1)])
                 }})
 
-        # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? hr)$/][maxstay!="1 hr"]
+    # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)? hr)$/][maxstay!="1 hr"]
+    def _relation_rule_32(self, data, tags, members, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -2495,13 +2674,14 @@ class Josm_numeric(PluginMapCSS):
                 # set maxstay_autofix
                 # throwWarning:tr("unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit","{0.key}","minutes","hours")
                 # fixAdd:concat("maxstay=",replace(tag("maxstay"),"hr","hours"))
-                set_maxstay_autofix = True
+                sets.add('maxstay_autofix')
                 err.append({'class': 9006028, 'subclass': 814970301, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('maxstay=', mapcss.replace(mapcss.tag(tags, 'maxstay'), 'hr', 'hours'))).split('=', 1)])
                 }})
 
-        # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)?h)$/][maxstay!="1h"]
+    # *[maxstay][maxstay=~/^([1-9][0-9]*(\.[0-9]+)?h)$/][maxstay!="1h"]
+    def _relation_rule_33(self, data, tags, members, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
@@ -2512,23 +2692,68 @@ class Josm_numeric(PluginMapCSS):
                 # set maxstay_autofix
                 # throwWarning:tr("unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit","{0.key}","minutes","hours")
                 # fixAdd:concat("maxstay=",replace(tag("maxstay"),"h"," hours"))
-                set_maxstay_autofix = True
+                sets.add('maxstay_autofix')
                 err.append({'class': 9006028, 'subclass': 1721471777, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours'), 'allow_fix_override': True, 'fix': {
                     '+': dict([
                     (mapcss.concat('maxstay=', mapcss.replace(mapcss.tag(tags, 'maxstay'), 'h', ' hours'))).split('=', 1)])
                 }})
 
-        # *[maxstay][maxstay!~/^(([1-9][0-9]*(\.[0-9]+)?( (minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)))|(no|unlimited|0|load-unload))$/]!.maxstay_autofix
+    # *[maxstay][maxstay!~/^(([1-9][0-9]*(\.[0-9]+)?( (minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)))|(no|unlimited|0|load-unload))$/]!.maxstay_autofix
+    def _relation_rule_34(self, data, tags, members, keys, err, sets):
         if ('maxstay' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((not set_maxstay_autofix) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxstay')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_17733c6c, '^(([1-9][0-9]*(\\.[0-9]+)?( (minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)))|(no|unlimited|0|load-unload))$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxstay'))))
+                try: match = (('maxstay_autofix' not in sets) and (mapcss._tag_capture(capture_tags, 0, tags, 'maxstay')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 1, self.re_17733c6c, '^(([1-9][0-9]*(\\.[0-9]+)?( (minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)))|(no|unlimited|0|load-unload))$'), mapcss._tag_capture(capture_tags, 1, tags, 'maxstay'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwWarning:tr("unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit","{0.key}","minutes","hours")
                 err.append({'class': 9006028, 'subclass': 1976092293, 'text': mapcss.tr('unusual value of {0}: set unit e.g. {1} or {2}; only positive values; point is decimal separator; space between value and unit', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'minutes', 'hours')})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, None),
+        (_relation_rule_1, ['layer']),
+        (_relation_rule_2, ['layer']),
+        (_relation_rule_3, ['building:levels']),
+        (_relation_rule_4, ['building:levels', 'level']),
+        (_relation_rule_5, ['roof:height']),
+        (_relation_rule_6, ['height', 'maxheight', 'maxlength', 'maxwidth', 'min_height', 'roof:height', 'width']),
+        (_relation_rule_7, ['height', 'maxheight', 'maxlength', 'maxwidth', 'roof:height', 'width']),
+        (_relation_rule_8, ['distance', 'height', 'maxaxleload', 'maxheight', 'maxlength', 'maxweight', 'maxwidth', 'min_height', 'roof:height', 'width']),
+        (_relation_rule_9, ['height', 'maxheight', 'maxlength', 'maxwidth', 'min_height', 'roof:height', 'width']),
+        (_relation_rule_10, ['maxaxleload', 'maxweight']),
+        (_relation_rule_11, ['distance']),
+        (_relation_rule_12, ['gauge']),
+        (_relation_rule_13, ['gauge']),
+        (_relation_rule_14, ['gauge']),
+        (_relation_rule_15, ['population']),
+        (_relation_rule_16, ['amenity']),
+        (_relation_rule_17, ['admin_level']),
+        (_relation_rule_18, ['direction']),
+        (_relation_rule_19, ['ele']),
+        (_relation_rule_20, ['ele']),
+        (_relation_rule_21, ['ele']),
+        (_relation_rule_22, ['ele']),
+        (_relation_rule_23, ['interval']),
+        (_relation_rule_24, ['aeroway']),
+        (_relation_rule_25, ['aeroway']),
+        (_relation_rule_26, ['aeroway']),
+        (_relation_rule_27, ['isced:level']),
+        (_relation_rule_28, ['maxstay']),
+        (_relation_rule_29, ['maxstay']),
+        (_relation_rule_30, ['maxstay']),
+        (_relation_rule_31, ['maxstay']),
+        (_relation_rule_32, ['maxstay']),
+        (_relation_rule_33, ['maxstay']),
+        (_relation_rule_34, ['maxstay']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
@@ -78,13 +78,8 @@ class Josm_openrailwaymap(PluginMapCSS):
         self.re_7cf15856 = re.compile(r'^[Gg]leis [0-9]+[a-z]*.*')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # node[railway=milestone][!railway:position]
+    # node[railway=milestone][!railway:position]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('railway' in keys):
             match = False
             if not match:
@@ -97,7 +92,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertMatch:"node railway=milestone"
                 err.append({'class': 9015028, 'subclass': 1237934683, 'text': {'en': 'Milestone without position, add railway:position=*'}})
 
-        # node[railway][workrules]
+    # node[railway][workrules]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'workrules' in keys):
             match = False
             if not match:
@@ -109,11 +105,12 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertMatch:"node railway=rail workrules=EBO"
                 err.append({'class': 9015047, 'subclass': 1912633428, 'text': {'en': 'workrules should be used on ways and not on nodes.'}})
 
-        # node[railway=level_crossing][supervised]
-        # node[railway=crossing][supervised]
-        # Rule Blacklisted (id: 321695123)
+    # node[railway=level_crossing][supervised]
+    # node[railway=crossing][supervised]
+    # Rule Blacklisted (id: 321695123)
 
-        # node[/^railway:signal:/][railway!=signal][railway!=buffer_stop][railway!=derail]
+    # node[/^railway:signal:/][railway!=signal][railway!=buffer_stop][railway!=derail]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -130,26 +127,27 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"node railway=signal railway:signal:direction=forward"
                 err.append({'class': 9015030, 'subclass': 908641862, 'text': {'en': 'signal specification given but node is not tagged as signal or equivalent type'}})
 
-        # node[railway=signal]["railway:signal:main:form"=sign]["railway:signal:main:states"]
-        # node[railway=signal]["railway:signal:distant:form"=sign]["railway:signal:distant:states"]
-        # node[railway=signal]["railway:signal:combined:form"=sign]["railway:signal:combined:states"]
-        # node[railway=signal]["railway:signal:shunting:form"=sign]["railway:signal:shunting:states"]
-        # node[railway=signal]["railway:signal:main_repeated:form"=sign]["railway:signal:main_repeated:states"]
-        # node[railway=signal]["railway:signal:minor:form"=sign]["railway:signal:minor:states"]
-        # node[railway=signal]["railway:signal:minor_distant:form"=sign]["railway:signal:minor_distant:states"]
-        # node[railway=signal]["railway:signal:crossing:form"=sign]["railway:signal:crossing:states"]
-        # node[railway=signal]["railway:signal:crossing_distant:form"=sign]["railway:signal:crossing_distant:states"]
-        # node[railway=signal]["railway:signal:humping:form"=sign]["railway:signal:humping:states"]
-        # node[railway=signal]["railway:signal:speed_limit:form"=sign]["railway:signal:speed_limit:speed"=~/;/]
-        # node[railway=signal]["railway:signal:speed_limit_distant:form"=sign]["railway:signal:speed_limit_distant:speed"=~/;/]
-        # node[railway=signal]["railway:signal:route:form"=sign]["railway:signal:route:states"]
-        # node[railway=signal]["railway:signal:route_distant:form"=sign]["railway:signal:route_distant:states"]
-        # node[railway=signal]["railway:signal:wrong_road:form"=sign]["railway:signal:wrong_road:states"]
-        # node[railway=signal]["railway:signal:stop_demand:form"=sign]["railway:signal:stop_demand:states"]
-        # node[railway=signal]["railway:signal:departure:form"=sign]["railway:signal:departure:states"]
-        # node[railway=signal]["railway:signal:resetting_switch:form"=sign]["railway:signal:resetting_switch:states"]
-        # node[railway=signal]["railway:signal:short_route:form"=sign]["railway:signal:short_route:states"]
-        # node[railway=signal]["railway:signal:brake_test:form"=sign]["railway:signal:brake_test:states"]
+    # node[railway=signal]["railway:signal:main:form"=sign]["railway:signal:main:states"]
+    # node[railway=signal]["railway:signal:distant:form"=sign]["railway:signal:distant:states"]
+    # node[railway=signal]["railway:signal:combined:form"=sign]["railway:signal:combined:states"]
+    # node[railway=signal]["railway:signal:shunting:form"=sign]["railway:signal:shunting:states"]
+    # node[railway=signal]["railway:signal:main_repeated:form"=sign]["railway:signal:main_repeated:states"]
+    # node[railway=signal]["railway:signal:minor:form"=sign]["railway:signal:minor:states"]
+    # node[railway=signal]["railway:signal:minor_distant:form"=sign]["railway:signal:minor_distant:states"]
+    # node[railway=signal]["railway:signal:crossing:form"=sign]["railway:signal:crossing:states"]
+    # node[railway=signal]["railway:signal:crossing_distant:form"=sign]["railway:signal:crossing_distant:states"]
+    # node[railway=signal]["railway:signal:humping:form"=sign]["railway:signal:humping:states"]
+    # node[railway=signal]["railway:signal:speed_limit:form"=sign]["railway:signal:speed_limit:speed"=~/;/]
+    # node[railway=signal]["railway:signal:speed_limit_distant:form"=sign]["railway:signal:speed_limit_distant:speed"=~/;/]
+    # node[railway=signal]["railway:signal:route:form"=sign]["railway:signal:route:states"]
+    # node[railway=signal]["railway:signal:route_distant:form"=sign]["railway:signal:route_distant:states"]
+    # node[railway=signal]["railway:signal:wrong_road:form"=sign]["railway:signal:wrong_road:states"]
+    # node[railway=signal]["railway:signal:stop_demand:form"=sign]["railway:signal:stop_demand:states"]
+    # node[railway=signal]["railway:signal:departure:form"=sign]["railway:signal:departure:states"]
+    # node[railway=signal]["railway:signal:resetting_switch:form"=sign]["railway:signal:resetting_switch:states"]
+    # node[railway=signal]["railway:signal:short_route:form"=sign]["railway:signal:short_route:states"]
+    # node[railway=signal]["railway:signal:brake_test:form"=sign]["railway:signal:brake_test:states"]
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:signal:brake_test:form' in keys and 'railway:signal:brake_test:states' in keys) or ('railway' in keys and 'railway:signal:combined:form' in keys and 'railway:signal:combined:states' in keys) or ('railway' in keys and 'railway:signal:crossing:form' in keys and 'railway:signal:crossing:states' in keys) or ('railway' in keys and 'railway:signal:crossing_distant:form' in keys and 'railway:signal:crossing_distant:states' in keys) or ('railway' in keys and 'railway:signal:departure:form' in keys and 'railway:signal:departure:states' in keys) or ('railway' in keys and 'railway:signal:distant:form' in keys and 'railway:signal:distant:states' in keys) or ('railway' in keys and 'railway:signal:humping:form' in keys and 'railway:signal:humping:states' in keys) or ('railway' in keys and 'railway:signal:main:form' in keys and 'railway:signal:main:states' in keys) or ('railway' in keys and 'railway:signal:main_repeated:form' in keys and 'railway:signal:main_repeated:states' in keys) or ('railway' in keys and 'railway:signal:minor:form' in keys and 'railway:signal:minor:states' in keys) or ('railway' in keys and 'railway:signal:minor_distant:form' in keys and 'railway:signal:minor_distant:states' in keys) or ('railway' in keys and 'railway:signal:resetting_switch:form' in keys and 'railway:signal:resetting_switch:states' in keys) or ('railway' in keys and 'railway:signal:route:form' in keys and 'railway:signal:route:states' in keys) or ('railway' in keys and 'railway:signal:route_distant:form' in keys and 'railway:signal:route_distant:states' in keys) or ('railway' in keys and 'railway:signal:short_route:form' in keys and 'railway:signal:short_route:states' in keys) or ('railway' in keys and 'railway:signal:shunting:form' in keys and 'railway:signal:shunting:states' in keys) or ('railway' in keys and 'railway:signal:speed_limit:form' in keys and 'railway:signal:speed_limit:speed' in keys) or ('railway' in keys and 'railway:signal:speed_limit_distant:form' in keys and 'railway:signal:speed_limit_distant:speed' in keys) or ('railway' in keys and 'railway:signal:stop_demand:form' in keys and 'railway:signal:stop_demand:states' in keys) or ('railway' in keys and 'railway:signal:wrong_road:form' in keys and 'railway:signal:wrong_road:states' in keys):
             match = False
             if not match:
@@ -241,7 +239,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertMatch:"node railway=signal railway:signal:speed_limit:form=sign railway:signal:speed_limit:speed=80;90"
                 err.append({'class': 9015031, 'subclass': 285269206, 'text': {'en': 'A sign cannot have different states.'}})
 
-        # node[railway][priority]
+    # node[railway][priority]
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if ('priority' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -257,7 +256,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'priority'])
                 }})
 
-        # node[railway=flat_crossing]
+    # node[railway=flat_crossing]
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('railway' in keys):
             match = False
             if not match:
@@ -276,7 +276,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     ['railway','railway_crossing']])
                 }})
 
-        # node[railway:signal:stop:description][!railway:signal:stop:caption]
+    # node[railway:signal:stop:description][!railway:signal:stop:caption]
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if ('railway:signal:stop:description' in keys):
             match = False
             if not match:
@@ -297,7 +298,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'railway:signal:stop:description'])
                 }})
 
-        # node[railway:signal:stop:description][railway:signal:stop:caption]
+    # node[railway:signal:stop:description][railway:signal:stop:caption]
+    def _node_rule_7(self, data, tags, keys, err, sets):
         if ('railway:signal:stop:caption' in keys and 'railway:signal:stop:description' in keys):
             match = False
             if not match:
@@ -311,7 +313,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"node railway=signal railway:signal:stop:description=70"
                 err.append({'class': 9015034, 'subclass': 1820225369, 'text': {'en': 'railway:signal:stop:description is deprecated, replace by appropiate railway:signal:stop:caption value'}})
 
-        # node["railway:signal:combined"]["railway:signal:main"]
+    # node["railway:signal:combined"]["railway:signal:main"]
+    def _node_rule_8(self, data, tags, keys, err, sets):
         if ('railway:signal:combined' in keys and 'railway:signal:main' in keys):
             match = False
             if not match:
@@ -325,7 +328,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"node railway=signal railway:signal:distant=DE-ESO:vr railway:signal:main=DE-ESO:hp"
                 err.append({'class': 9015035, 'subclass': 371617473, 'text': {'en': 'main and combined signal at the same place'}})
 
-        # node["railway:signal:combined"]["railway:signal:distant"]
+    # node["railway:signal:combined"]["railway:signal:distant"]
+    def _node_rule_9(self, data, tags, keys, err, sets):
         if ('railway:signal:combined' in keys and 'railway:signal:distant' in keys):
             match = False
             if not match:
@@ -339,7 +343,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"node railway=signal railway:signal:distant=DE-ESO:vr railway:signal:main=DE-ESO:hp"
                 err.append({'class': 9015035, 'subclass': 570327409, 'text': {'en': 'main and combined signal at the same place'}})
 
-        # node[railway=signal]["railway:ref"][!ref]
+    # node[railway=signal]["railway:ref"][!ref]
+    def _node_rule_10(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:ref' in keys):
             match = False
             if not match:
@@ -360,7 +365,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'railway:ref'])
                 }})
 
-        # node[railway=signal]["railway:ref"][ref]
+    # node[railway=signal]["railway:ref"][ref]
+    def _node_rule_11(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:ref' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -381,7 +387,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'railway:ref'])
                 }})
 
-        # node[railway=signal][!"railway:signal:direction"]
+    # node[railway=signal][!"railway:signal:direction"]
+    def _node_rule_12(self, data, tags, keys, err, sets):
         if ('railway' in keys):
             match = False
             if not match:
@@ -394,26 +401,27 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertMatch:"node railway=signal"
                 err.append({'class': 9015037, 'subclass': 1288245325, 'text': {'en': 'signals should have a railway:signal:direction=* tag'}})
 
-        # node[railway=signal]["railway:signal:main"]["railway:signal:main"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:combined"]["railway:signal:combined"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:distant"]["railway:signal:distant"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:shunting"]["railway:signal:shunting"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:main_repeated"]["railway:signal:main_repeated"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:minor"]["railway:signal:minor"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:minor_distant"]["railway:signal:minor_distant"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:crossing"]["railway:signal:crossing"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:crossing_distant"]["railway:signal:crossing_distant"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:humping"]["railway:signal:humping"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:speed_limit"]["railway:signal:speed_limit"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:speed_limit_distant"]["railway:signal:speed_limit_distant"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:route"]["railway:signal:route"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:route_distant"]["railway:signal:route_distant"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:wrong_road"]["railway:signal:wrong_road"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:stop_demand"]["railway:signal:stop_demand"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:departure"]["railway:signal:departure"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:resetting_switch"]["railway:signal:resetting_switch"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:short_route"]["railway:signal:short_route"!~/.+:.+/]
-        # node[railway=signal]["railway:signal:brake_test"]["railway:signal:brake_test"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:main"]["railway:signal:main"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:combined"]["railway:signal:combined"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:distant"]["railway:signal:distant"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:shunting"]["railway:signal:shunting"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:main_repeated"]["railway:signal:main_repeated"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:minor"]["railway:signal:minor"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:minor_distant"]["railway:signal:minor_distant"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:crossing"]["railway:signal:crossing"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:crossing_distant"]["railway:signal:crossing_distant"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:humping"]["railway:signal:humping"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:speed_limit"]["railway:signal:speed_limit"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:speed_limit_distant"]["railway:signal:speed_limit_distant"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:route"]["railway:signal:route"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:route_distant"]["railway:signal:route_distant"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:wrong_road"]["railway:signal:wrong_road"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:stop_demand"]["railway:signal:stop_demand"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:departure"]["railway:signal:departure"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:resetting_switch"]["railway:signal:resetting_switch"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:short_route"]["railway:signal:short_route"!~/.+:.+/]
+    # node[railway=signal]["railway:signal:brake_test"]["railway:signal:brake_test"!~/.+:.+/]
+    def _node_rule_13(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:signal:brake_test' in keys) or ('railway' in keys and 'railway:signal:combined' in keys) or ('railway' in keys and 'railway:signal:crossing' in keys) or ('railway' in keys and 'railway:signal:crossing_distant' in keys) or ('railway' in keys and 'railway:signal:departure' in keys) or ('railway' in keys and 'railway:signal:distant' in keys) or ('railway' in keys and 'railway:signal:humping' in keys) or ('railway' in keys and 'railway:signal:main' in keys) or ('railway' in keys and 'railway:signal:main_repeated' in keys) or ('railway' in keys and 'railway:signal:minor' in keys) or ('railway' in keys and 'railway:signal:minor_distant' in keys) or ('railway' in keys and 'railway:signal:resetting_switch' in keys) or ('railway' in keys and 'railway:signal:route' in keys) or ('railway' in keys and 'railway:signal:route_distant' in keys) or ('railway' in keys and 'railway:signal:short_route' in keys) or ('railway' in keys and 'railway:signal:shunting' in keys) or ('railway' in keys and 'railway:signal:speed_limit' in keys) or ('railway' in keys and 'railway:signal:speed_limit_distant' in keys) or ('railway' in keys and 'railway:signal:stop_demand' in keys) or ('railway' in keys and 'railway:signal:wrong_road' in keys):
             match = False
             if not match:
@@ -508,10 +516,11 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertMatch:"node railway=signal railway:signal:route=zs2"
                 err.append({'class': 9015038, 'subclass': 946563032, 'text': {'en': 'signal names should be prefixed with an operator or country prefix'}})
 
-        # node[railway=signal][name][!ref]
-        # node[railway=signal][name][ref=*name]
-        # node[railway=switch][name][!ref]
-        # node[railway=switch][name][ref=*name]
+    # node[railway=signal][name][!ref]
+    # node[railway=signal][name][ref=*name]
+    # node[railway=switch][name][!ref]
+    # node[railway=switch][name][ref=*name]
+    def _node_rule_14(self, data, tags, keys, err, sets):
         if ('name' in keys and 'railway' in keys) or ('name' in keys and 'railway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -549,7 +558,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'name'])
                 }})
 
-        # node[railway=switch]["railway:switch"=resetting]
+    # node[railway=switch]["railway:switch"=resetting]
+    def _node_rule_15(self, data, tags, keys, err, sets):
         if ('railway' in keys and 'railway:switch' in keys):
             match = False
             if not match:
@@ -569,15 +579,16 @@ class Josm_openrailwaymap(PluginMapCSS):
                     ['railway:switch:resetting','yes']])
                 }})
 
-        # node[railway=station][station!=funicular][!name]
-        # node[railway=halt][!name]
-        # node[railway=junction][!name]
-        # node[railway=spur_junction][!name]
-        # node[railway=service_station][!name]
-        # node[railway=site][!name]
-        # node[railway=tram_stop][!name]
-        # node[railway=yard][!name]
-        # node[railway=crossover][!name]
+    # node[railway=station][station!=funicular][!name]
+    # node[railway=halt][!name]
+    # node[railway=junction][!name]
+    # node[railway=spur_junction][!name]
+    # node[railway=service_station][!name]
+    # node[railway=site][!name]
+    # node[railway=tram_stop][!name]
+    # node[railway=yard][!name]
+    # node[railway=crossover][!name]
+    def _node_rule_16(self, data, tags, keys, err, sets):
         if ('railway' in keys):
             match = False
             if not match:
@@ -638,15 +649,36 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertMatch:"node railway=yard"
                 err.append({'class': 9015044, 'subclass': 1433036676, 'text': mapcss.tr('{0}={1} without name', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['railway']),
+        (_node_rule_1, ['railway']),
+        (_node_rule_2, None),
+        (_node_rule_3, ['railway']),
+        (_node_rule_4, ['priority']),
+        (_node_rule_5, ['railway']),
+        (_node_rule_6, ['railway:signal:stop:description']),
+        (_node_rule_7, ['railway:signal:stop:caption']),
+        (_node_rule_8, ['railway:signal:combined']),
+        (_node_rule_9, ['railway:signal:combined']),
+        (_node_rule_10, ['railway']),
+        (_node_rule_11, ['railway']),
+        (_node_rule_12, ['railway']),
+        (_node_rule_13, ['railway']),
+        (_node_rule_14, ['name']),
+        (_node_rule_15, ['railway']),
+        (_node_rule_16, ['railway']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # way[railway][usage][usage!=industrial][usage!=military][service]
+    # way[railway][usage][usage!=industrial][usage!=military][service]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'service' in keys and 'usage' in keys):
             match = False
             if not match:
@@ -666,8 +698,9 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'service'])
                 }})
 
-        # way[railway=station]
-        # area[railway=station]
+    # way[railway=station]
+    # area[railway=station]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys):
             match = False
             if not match:
@@ -683,7 +716,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertMatch:"way railway=station"
                 err.append({'class': 9015002, 'subclass': 610823238, 'text': {'en': 'Station mapped as a way, but should be mapped as a node'}})
 
-        # way[railway][traffic_mode]
+    # way[railway][traffic_mode]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'traffic_mode' in keys):
             match = False
             if not match:
@@ -704,8 +738,9 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'traffic_mode'])
                 }})
 
-        # way[railway][usage=freight][!railway:traffic_mode]
-        # way[railway][usage=freight][railway:traffic_mode=freight]
+    # way[railway][usage=freight][!railway:traffic_mode]
+    # way[railway][usage=freight][railway:traffic_mode=freight]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'railway:traffic_mode' in keys and 'usage' in keys) or ('railway' in keys and 'usage' in keys):
             match = False
             if not match:
@@ -733,7 +768,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'usage'])
                 }})
 
-        # way[railway][usage=freight][railway:traffic_mode=~/^(passenger|mixed)$/]
+    # way[railway][usage=freight][railway:traffic_mode=~/^(passenger|mixed)$/]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'railway:traffic_mode' in keys and 'usage' in keys):
             match = False
             if not match:
@@ -759,7 +795,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'usage'])
                 }})
 
-        # way[railway][railway!=platform][railway!=platform_edge][name=~/^[0-9]+[a-z]*.*/]["railway:track_ref"=*name]
+    # way[railway][railway!=platform][railway!=platform_edge][name=~/^[0-9]+[a-z]*.*/]["railway:track_ref"=*name]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'railway' in keys and 'railway:track_ref' in keys):
             match = False
             if not match:
@@ -782,7 +819,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'name'])
                 }})
 
-        # way[railway][railway!=platform][railway!=platform_edge][name=~/^[0-9]+[a-z]*.*/][!"railway:track_ref"]
+    # way[railway][railway!=platform][railway!=platform_edge][name=~/^[0-9]+[a-z]*.*/][!"railway:track_ref"]
+    def _way_rule_6(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -808,7 +846,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'name'])
                 }})
 
-        # way[railway][railway!=platform][railway!=platform_edge][service][ref]
+    # way[railway][railway!=platform][railway!=platform_edge][service][ref]
+    def _way_rule_7(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'ref' in keys and 'service' in keys):
             match = False
             if not match:
@@ -833,10 +872,11 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'ref'])
                 }})
 
-        # way[railway=platform]["railway:track_ref"][!ref]
-        # way[railway=platform]["railway:track_ref"]["railway:track_ref"=*ref]
-        # way[railway=platform_edge]["railway:track_ref"][!ref]
-        # way[railway=platform_edge]["railway:track_ref"]["railway:track_ref"=*ref]
+    # way[railway=platform]["railway:track_ref"][!ref]
+    # way[railway=platform]["railway:track_ref"]["railway:track_ref"=*ref]
+    # way[railway=platform_edge]["railway:track_ref"][!ref]
+    # way[railway=platform_edge]["railway:track_ref"]["railway:track_ref"=*ref]
+    def _way_rule_8(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'railway:track_ref' in keys):
             match = False
             if not match:
@@ -873,8 +913,9 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'railway:track_ref'])
                 }})
 
-        # way[railway=platform]["railway:track_ref"]["ref"]["railway:track_ref"!=*ref]
-        # way[railway=platform_edge]["railway:track_ref"]["ref"]["railway:track_ref"!=*ref]
+    # way[railway=platform]["railway:track_ref"]["ref"]["railway:track_ref"!=*ref]
+    # way[railway=platform_edge]["railway:track_ref"]["ref"]["railway:track_ref"!=*ref]
+    def _way_rule_9(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'railway:track_ref' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -896,14 +937,15 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"way railway=rail railway:track_ref=3"
                 err.append({'class': 9015008, 'subclass': 197759443, 'text': {'en': 'platforms should have the numbers in ref, not railway:track_ref'}})
 
-        # way[railway][railway!=platform][railway!=platform_edge][name=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway][railway!=platform][railway!=platform_edge]["name:de"=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway][railway!=platform][railway!=platform_edge][name=~/^[Tt]rack [0-9]+[a-z]*.*/]
-        # way[railway][railway!=platform][railway!=platform_edge][name=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway][railway!=platform][railway!=platform_edge]["name:fr"=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway][railway!=platform][railway!=platform_edge][ref=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway][railway!=platform][railway!=platform_edge][ref=~/^[Tt]rack [0-9]+[a-z]*.*/]
-        # way[railway][railway!=platform][railway!=platform_edge][ref=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway][railway!=platform][railway!=platform_edge][name=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway][railway!=platform][railway!=platform_edge]["name:de"=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway][railway!=platform][railway!=platform_edge][name=~/^[Tt]rack [0-9]+[a-z]*.*/]
+    # way[railway][railway!=platform][railway!=platform_edge][name=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway][railway!=platform][railway!=platform_edge]["name:fr"=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway][railway!=platform][railway!=platform_edge][ref=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway][railway!=platform][railway!=platform_edge][ref=~/^[Tt]rack [0-9]+[a-z]*.*/]
+    # way[railway][railway!=platform][railway!=platform_edge][ref=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    def _way_rule_10(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'railway' in keys) or ('name:de' in keys and 'railway' in keys) or ('name:fr' in keys and 'railway' in keys) or ('railway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -945,38 +987,39 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertMatch:"way railway=rail ref=\"track 4b\""
                 err.append({'class': 9015009, 'subclass': 1419534293, 'text': {'en': 'track names or refs should not include the word \'track\', tag those numbers as railway:track_ref'}})
 
-        # way[railway=platform][!description][name=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform][!description]["name:de"=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform][!description][name=~/^[Tt]rack [0-9]+[a-z]*.*/]
-        # way[railway=platform][!description][name=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform][!description]["name:fr"=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform][!description][ref=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform][!description][ref=~/^[Tt]rack [0-9]+[a-z]*.*/]
-        # way[railway=platform][!description][ref=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform][description=*name][name=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform][description=*"name:de"]["name:de"=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform][description=*name][name=~/^[Tt]rack [0-9]+[a-z]*.*/]
-        # way[railway=platform][description=*name][name=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform][description=*"name:fr"]["name:fr"=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform][description=*ref][ref=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform][description=*ref][ref=~/^[Tt]rack [0-9]+[a-z]*.*/]
-        # way[railway=platform][description=*ref][ref=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][!description][name=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][!description]["name:de"=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][!description][name=~/^[Tt]rack [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][!description][name=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][!description]["name:fr"=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][!description][ref=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][!description][ref=~/^[Tt]rack [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][!description][ref=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description=*name][name=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description=*"name:de"]["name:de"=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description=*name][name=~/^[Tt]rack [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description=*name][name=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description=*"name:fr"]["name:fr"=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description=*ref][ref=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description=*ref][ref=~/^[Tt]rack [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description=*ref][ref=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform][!description][name=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform][!description]["name:de"=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform][!description][name=~/^[Tt]rack [0-9]+[a-z]*.*/]
+    # way[railway=platform][!description][name=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform][!description]["name:fr"=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform][!description][ref=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform][!description][ref=~/^[Tt]rack [0-9]+[a-z]*.*/]
+    # way[railway=platform][!description][ref=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform][description=*name][name=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform][description=*"name:de"]["name:de"=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform][description=*name][name=~/^[Tt]rack [0-9]+[a-z]*.*/]
+    # way[railway=platform][description=*name][name=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform][description=*"name:fr"]["name:fr"=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform][description=*ref][ref=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform][description=*ref][ref=~/^[Tt]rack [0-9]+[a-z]*.*/]
+    # way[railway=platform][description=*ref][ref=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][!description][name=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][!description]["name:de"=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][!description][name=~/^[Tt]rack [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][!description][name=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][!description]["name:fr"=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][!description][ref=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][!description][ref=~/^[Tt]rack [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][!description][ref=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description=*name][name=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description=*"name:de"]["name:de"=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description=*name][name=~/^[Tt]rack [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description=*name][name=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description=*"name:fr"]["name:fr"=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description=*ref][ref=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description=*ref][ref=~/^[Tt]rack [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description=*ref][ref=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    def _way_rule_11(self, data, tags, nds, keys, err, sets):
         if ('description' in keys and 'name' in keys and 'railway' in keys) or ('description' in keys and 'name:de' in keys and 'railway' in keys) or ('description' in keys and 'name:fr' in keys and 'railway' in keys) or ('description' in keys and 'railway' in keys and 'ref' in keys) or ('name' in keys and 'railway' in keys) or ('name:de' in keys and 'railway' in keys) or ('name:fr' in keys and 'railway' in keys) or ('railway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -1131,22 +1174,23 @@ class Josm_openrailwaymap(PluginMapCSS):
                     (mapcss._tag_uncapture(capture_tags, '{2.key}=>description')).split('=>', 1)[0].strip()])
                 }})
 
-        # way[railway=platform][description][description!=*name][name=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform][description][description!=*"name:de"]["name:de"=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform][description][description!=*name][name=~/^[Tt]rack [0-9]+[a-z]*.*/]
-        # way[railway=platform][description][description!=*name][name=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform][description][description!=*"name:fr"]["name:fr"=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform][description][description!=*ref][ref=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform][description][description!=*ref][ref=~/^[Tt]rack [0-9]+[a-z]*.*/]
-        # way[railway=platform][description][description!=*ref][ref=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description][description!=*name][name=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description][description!=*"name:de"]["name:de"=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description][description!=*name][name=~/^[Tt]rack [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description][description!=*name][name=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description][description!=*"name:fr"]["name:fr"=~/^[Vv]oie [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description][description!=*ref][ref=~/^[Gg]leis [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description][description!=*ref][ref=~/^[Tt]rack [0-9]+[a-z]*.*/]
-        # way[railway=platform_edge][description][description!=*ref][ref=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform][description][description!=*name][name=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform][description][description!=*"name:de"]["name:de"=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform][description][description!=*name][name=~/^[Tt]rack [0-9]+[a-z]*.*/]
+    # way[railway=platform][description][description!=*name][name=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform][description][description!=*"name:fr"]["name:fr"=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform][description][description!=*ref][ref=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform][description][description!=*ref][ref=~/^[Tt]rack [0-9]+[a-z]*.*/]
+    # way[railway=platform][description][description!=*ref][ref=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description][description!=*name][name=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description][description!=*"name:de"]["name:de"=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description][description!=*name][name=~/^[Tt]rack [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description][description!=*name][name=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description][description!=*"name:fr"]["name:fr"=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description][description!=*ref][ref=~/^[Gg]leis [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description][description!=*ref][ref=~/^[Tt]rack [0-9]+[a-z]*.*/]
+    # way[railway=platform_edge][description][description!=*ref][ref=~/^[Vv]oie [0-9]+[a-z]*.*/]
+    def _way_rule_12(self, data, tags, nds, keys, err, sets):
         if ('description' in keys and 'name' in keys and 'railway' in keys) or ('description' in keys and 'name:de' in keys and 'railway' in keys) or ('description' in keys and 'name:fr' in keys and 'railway' in keys) or ('description' in keys and 'railway' in keys and 'ref' in keys):
             match = False
             if not match:
@@ -1225,7 +1269,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertMatch:"way railway=platform_edge ref=\"track 4b\" description=other"
                 err.append({'class': 9015010, 'subclass': 640924794, 'text': {'en': 'platform names or refs should not include the word \'track\', write that as \'description\', put the bare numbers in \'ref\', separated by \';\''}})
 
-        # way[railway]["power:type"=overhead][electrified=contact_line]
+    # way[railway]["power:type"=overhead][electrified=contact_line]
+    def _way_rule_13(self, data, tags, nds, keys, err, sets):
         if ('electrified' in keys and 'power:type' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1243,8 +1288,9 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'power:type'])
                 }})
 
-        # way[railway]["power:type"=overhead][electrified=yes]
-        # way[railway]["power:type"=overhead][!electrified]
+    # way[railway]["power:type"=overhead][electrified=yes]
+    # way[railway]["power:type"=overhead][!electrified]
+    def _way_rule_14(self, data, tags, nds, keys, err, sets):
         if ('electrified' in keys and 'power:type' in keys and 'railway' in keys) or ('power:type' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1270,7 +1316,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'power:type'])
                 }})
 
-        # way[railway]["power:type"=overhead][electrified][electrified!=yes][electrified!=contact_line]
+    # way[railway]["power:type"=overhead][electrified][electrified!=yes][electrified!=contact_line]
+    def _way_rule_15(self, data, tags, nds, keys, err, sets):
         if ('electrified' in keys and 'power:type' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1283,7 +1330,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"way railway=rail power:type=overhead electrified=yes"
                 err.append({'class': 9015012, 'subclass': 1465196539, 'text': mapcss.tr('power:type=overhead is deprecated, conflict between {0} and {1}', 'power:type=overhead', 'electrified=*')})
 
-        # way[railway]["power:type"]["power:type"!=overhead][electrified]
+    # way[railway]["power:type"]["power:type"!=overhead][electrified]
+    def _way_rule_16(self, data, tags, nds, keys, err, sets):
         if ('electrified' in keys and 'power:type' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1296,7 +1344,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertMatch:"way railway=rail power:type=something electrified=yes"
                 err.append({'class': 9015013, 'subclass': 356393984, 'text': {'en': 'power:type is deprecated, change to proper electrified value'}})
 
-        # way[railway]["power:type"]["power:type"!=overhead][!electrified]
+    # way[railway]["power:type"]["power:type"!=overhead][!electrified]
+    def _way_rule_17(self, data, tags, nds, keys, err, sets):
         if ('power:type' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1309,7 +1358,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertMatch:"way railway=rail power:type=something"
                 err.append({'class': 9015013, 'subclass': 410100568, 'text': {'en': 'power:type is deprecated, change to proper electrified value'}})
 
-        # way[railway][priority]
+    # way[railway][priority]
+    def _way_rule_18(self, data, tags, nds, keys, err, sets):
         if ('priority' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1328,7 +1378,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'priority'])
                 }})
 
-        # way[railway][tracks=1][detail=track]
+    # way[railway][tracks=1][detail=track]
+    def _way_rule_19(self, data, tags, nds, keys, err, sets):
         if ('detail' in keys and 'railway' in keys and 'tracks' in keys):
             match = False
             if not match:
@@ -1347,7 +1398,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'tracks'])
                 }})
 
-        # way[railway][tracks!=1][tracks][service]
+    # way[railway][tracks!=1][tracks][service]
+    def _way_rule_20(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'service' in keys and 'tracks' in keys):
             match = False
             if not match:
@@ -1361,10 +1413,11 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"way railway=rail tracks=2 usage=bar"
                 err.append({'class': 9015016, 'subclass': 256757521, 'text': {'en': 'If tracks are tagged with service=*, they should be mapped as one way per track.'}})
 
-        # way[railway=crossing]
-        # way[railway=level_crossing]
-        # area[railway=crossing]
-        # area[railway=level_crossing]
+    # way[railway=crossing]
+    # way[railway=level_crossing]
+    # area[railway=crossing]
+    # area[railway=level_crossing]
+    def _way_rule_21(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys):
             match = False
             if not match:
@@ -1389,8 +1442,9 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertMatch:"way railway=level_crossing railway:position:exact=2.4"
                 err.append({'class': 9015017, 'subclass': 145776718, 'text': {'en': 'Crossings and level crossings should be mapped as nodes'}})
 
-        # way[railway][radio="GSM-R"][!"railway:radio"]
-        # way[railway][radio="GSM-R"]["railway:radio"="gsm-r"]
+    # way[railway][radio="GSM-R"][!"railway:radio"]
+    # way[railway][radio="GSM-R"]["railway:radio"="gsm-r"]
+    def _way_rule_22(self, data, tags, nds, keys, err, sets):
         if ('radio' in keys and 'railway' in keys) or ('radio' in keys and 'railway' in keys and 'railway:radio' in keys):
             match = False
             if not match:
@@ -1417,8 +1471,9 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'radio'])
                 }})
 
-        # way[railway][radio="GSM-R"]["railway:radio"]["railway:radio"!="gsm-r"]
-        # way[railway][radio][radio!="GSM-R"]
+    # way[railway][radio="GSM-R"]["railway:radio"]["railway:radio"!="gsm-r"]
+    # way[railway][radio][radio!="GSM-R"]
+    def _way_rule_23(self, data, tags, nds, keys, err, sets):
         if ('radio' in keys and 'railway' in keys) or ('radio' in keys and 'railway' in keys and 'railway:radio' in keys):
             match = False
             if not match:
@@ -1437,8 +1492,9 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"way railway=rail radio=\"GSM-R\""
                 err.append({'class': 9015019, 'subclass': 406318522, 'text': {'en': 'radio=* is deprecated, change to proper railway:radio value'}})
 
-        # way[railway][railway!=platform][railway!=platform_edge][name=~/[Tt]unnel/][!"tunnel:name"]
-        # way[railway][railway!=platform][railway!=platform_edge][name=~/[Tt]unnel/]["tunnel:name"=*name]
+    # way[railway][railway!=platform][railway!=platform_edge][name=~/[Tt]unnel/][!"tunnel:name"]
+    # way[railway][railway!=platform][railway!=platform_edge][name=~/[Tt]unnel/]["tunnel:name"=*name]
+    def _way_rule_24(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'railway' in keys) or ('name' in keys and 'railway' in keys and 'tunnel:name' in keys):
             match = False
             if not match:
@@ -1464,8 +1520,9 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'name'])
                 }})
 
-        # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Tt]unnel/][!"tunnel:wikipedia"]
-        # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Tt]unnel/]["tunnel:wikipedia"=*wikipedia]
+    # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Tt]unnel/][!"tunnel:wikipedia"]
+    # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Tt]unnel/]["tunnel:wikipedia"=*wikipedia]
+    def _way_rule_25(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys and 'tunnel:wikipedia' in keys and 'wikipedia' in keys) or ('railway' in keys and 'wikipedia' in keys):
             match = False
             if not match:
@@ -1491,12 +1548,13 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'wikipedia'])
                 }})
 
-        # way[railway][railway!=platform][railway!=platform_edge][name=~/[Bb]ridge/][!"bridge:name"]
-        # way[railway][railway!=platform][railway!=platform_edge][name=~/[Bb]ridge/]["bridge:name"=*name]
-        # way[railway][railway!=platform][railway!=platform_edge][name=~/[Vv]iadu[ck]t/][!"bridge:name"]
-        # way[railway][railway!=platform][railway!=platform_edge][name=~/[Vv]iadu[ck]t/]["bridge:name"=*name]
-        # way[railway][railway!=platform][railway!=platform_edge][name=~/[Bb]rücke/][!"bridge:name"]
-        # way[railway][railway!=platform][railway!=platform_edge][name=~/[Bb]rücke/]["bridge:name"=*name]
+    # way[railway][railway!=platform][railway!=platform_edge][name=~/[Bb]ridge/][!"bridge:name"]
+    # way[railway][railway!=platform][railway!=platform_edge][name=~/[Bb]ridge/]["bridge:name"=*name]
+    # way[railway][railway!=platform][railway!=platform_edge][name=~/[Vv]iadu[ck]t/][!"bridge:name"]
+    # way[railway][railway!=platform][railway!=platform_edge][name=~/[Vv]iadu[ck]t/]["bridge:name"=*name]
+    # way[railway][railway!=platform][railway!=platform_edge][name=~/[Bb]rücke/][!"bridge:name"]
+    # way[railway][railway!=platform][railway!=platform_edge][name=~/[Bb]rücke/]["bridge:name"=*name]
+    def _way_rule_26(self, data, tags, nds, keys, err, sets):
         if ('bridge:name' in keys and 'name' in keys and 'railway' in keys) or ('name' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1540,12 +1598,13 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'name'])
                 }})
 
-        # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Bb]ridge/][!"bridge:wikipedia"]
-        # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Bb]ridge/]["bridge:wikipedia"=*wikipedia]
-        # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Vv]iadu[ck]t/][!"bridge:wikipedia"]
-        # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Vv]iadu[ck]t/]["bridge:wikipedia"=*wikipedia]
-        # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Bb]rücke/][!"bridge:wikipedia"]
-        # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Bb]rücke/]["bridge:wikipedia"=*wikipedia]
+    # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Bb]ridge/][!"bridge:wikipedia"]
+    # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Bb]ridge/]["bridge:wikipedia"=*wikipedia]
+    # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Vv]iadu[ck]t/][!"bridge:wikipedia"]
+    # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Vv]iadu[ck]t/]["bridge:wikipedia"=*wikipedia]
+    # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Bb]rücke/][!"bridge:wikipedia"]
+    # way[railway][railway!=platform][railway!=platform_edge][wikipedia=~/[Bb]rücke/]["bridge:wikipedia"=*wikipedia]
+    def _way_rule_27(self, data, tags, nds, keys, err, sets):
         if ('bridge:wikipedia' in keys and 'railway' in keys and 'wikipedia' in keys) or ('railway' in keys and 'wikipedia' in keys):
             match = False
             if not match:
@@ -1589,7 +1648,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'wikipedia'])
                 }})
 
-        # way[railway][!highway][lanes]
+    # way[railway][!highway][lanes]
+    def _way_rule_28(self, data, tags, nds, keys, err, sets):
         if ('lanes' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1612,7 +1672,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'lanes'])
                 }})
 
-        # way[railway][maxspeed=signals]
+    # way[railway][maxspeed=signals]
+    def _way_rule_29(self, data, tags, nds, keys, err, sets):
         if ('maxspeed' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1625,7 +1686,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"way railway=subway maxspeed=100"
                 err.append({'class': 9015025, 'subclass': 650821308, 'text': {'en': 'maxspeed=signals is deprecated, tag the highest possible speed instead'}})
 
-        # way[railway]["mph:maxspeed"=~/^[0-9]+$/]["maxspeed"]
+    # way[railway]["mph:maxspeed"=~/^[0-9]+$/]["maxspeed"]
+    def _way_rule_30(self, data, tags, nds, keys, err, sets):
         if ('maxspeed' in keys and 'mph:maxspeed' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1641,7 +1703,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertMatch:"way railway=rail \"mph:maxspeed\"=100 maxspeed=161"
                 err.append({'class': 9015026, 'subclass': 317587071, 'text': {'en': 'maxspeed should contain the value as it is shown on the line with mph as unit'}})
 
-        # way[railway]["mph:maxspeed"=~/^[0-9]+ mph$/]["maxspeed"]
+    # way[railway]["mph:maxspeed"=~/^[0-9]+ mph$/]["maxspeed"]
+    def _way_rule_31(self, data, tags, nds, keys, err, sets):
         if ('maxspeed' in keys and 'mph:maxspeed' in keys and 'railway' in keys):
             match = False
             if not match:
@@ -1663,8 +1726,9 @@ class Josm_openrailwaymap(PluginMapCSS):
                     'mph:maxspeed'])
                 }})
 
-        # area[building=station]
-        # area[building=railway_station]
+    # area[building=station]
+    # area[building=railway_station]
+    def _way_rule_32(self, data, tags, nds, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -1684,22 +1748,59 @@ class Josm_openrailwaymap(PluginMapCSS):
                     ['building','train_station']])
                 }})
 
-        # way|z9-[railway=disused][!"disused:railway"]
-        # way|z9-[railway=abandoned][!"abandoned:railway"]
-        # way|z9-[railway=razed][!"razed:railway"]
-        # way|z9-[railway=proposed][!"proposed:railway"]
-        # way|z9-[railway=construction][!"construction:railway"]
-        # Rule Blacklisted (id: 160705788)
+    # way|z9-[railway=disused][!"disused:railway"]
+    # way|z9-[railway=abandoned][!"abandoned:railway"]
+    # way|z9-[railway=razed][!"razed:railway"]
+    # way|z9-[railway=proposed][!"proposed:railway"]
+    # way|z9-[railway=construction][!"construction:railway"]
+    # Rule Blacklisted (id: 160705788)
+
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['railway']),
+        (_way_rule_1, ['railway']),
+        (_way_rule_2, ['railway']),
+        (_way_rule_3, ['railway']),
+        (_way_rule_4, ['railway']),
+        (_way_rule_5, ['name']),
+        (_way_rule_6, ['name']),
+        (_way_rule_7, ['railway']),
+        (_way_rule_8, ['railway']),
+        (_way_rule_9, ['railway']),
+        (_way_rule_10, ['name', 'name:de', 'name:fr', 'railway']),
+        (_way_rule_11, ['description', 'name', 'name:de', 'name:fr', 'railway']),
+        (_way_rule_12, ['description']),
+        (_way_rule_13, ['electrified']),
+        (_way_rule_14, ['electrified', 'power:type']),
+        (_way_rule_15, ['electrified']),
+        (_way_rule_16, ['electrified']),
+        (_way_rule_17, ['power:type']),
+        (_way_rule_18, ['priority']),
+        (_way_rule_19, ['detail']),
+        (_way_rule_20, ['railway']),
+        (_way_rule_21, ['railway']),
+        (_way_rule_22, ['radio']),
+        (_way_rule_23, ['radio']),
+        (_way_rule_24, ['name']),
+        (_way_rule_25, ['railway']),
+        (_way_rule_26, ['bridge:name', 'name']),
+        (_way_rule_27, ['bridge:wikipedia', 'railway']),
+        (_way_rule_28, ['lanes']),
+        (_way_rule_29, ['maxspeed']),
+        (_way_rule_30, ['maxspeed']),
+        (_way_rule_31, ['maxspeed']),
+        (_way_rule_32, ['building']),
+    ])
 
-        return err
-
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # area[railway=station]
+    # area[railway=station]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('railway' in keys and 'type' in keys):
             match = False
             if not match:
@@ -1710,8 +1811,9 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # throwError:"Station mapped as a way, but should be mapped as a node"
                 err.append({'class': 9015002, 'subclass': 641708275, 'text': {'en': 'Station mapped as a way, but should be mapped as a node'}})
 
-        # area[railway=crossing]
-        # area[railway=level_crossing]
+    # area[railway=crossing]
+    # area[railway=level_crossing]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('railway' in keys and 'type' in keys):
             match = False
             if not match:
@@ -1726,7 +1828,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # throwError:"Crossings and level crossings should be mapped as nodes"
                 err.append({'class': 9015017, 'subclass': 803023253, 'text': {'en': 'Crossings and level crossings should be mapped as nodes'}})
 
-        # relation[railway=controlled_area]
+    # relation[railway=controlled_area]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('railway' in keys):
             match = False
             if not match:
@@ -1744,7 +1847,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     ['railway','interlocking']])
                 }})
 
-        # relation[railway=interlocking][!type]
+    # relation[railway=interlocking][!type]
+    def _relation_rule_3(self, data, tags, members, keys, err, sets):
         if ('railway' in keys):
             match = False
             if not match:
@@ -1762,7 +1866,8 @@ class Josm_openrailwaymap(PluginMapCSS):
                     ['type','railway']])
                 }})
 
-        # relation[railway=interlocking][type][type!=railway]
+    # relation[railway=interlocking][type][type!=railway]
+    def _relation_rule_4(self, data, tags, members, keys, err, sets):
         if ('railway' in keys and 'type' in keys):
             match = False
             if not match:
@@ -1775,8 +1880,9 @@ class Josm_openrailwaymap(PluginMapCSS):
                 # assertNoMatch:"relation railway=interlocking type=railway"
                 err.append({'class': 9015043, 'subclass': 1419769139, 'text': {'en': 'interlocking relation with type other than railway'}})
 
-        # area[building=station]
-        # area[building=railway_station]
+    # area[building=station]
+    # area[building=railway_station]
+    def _relation_rule_5(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'type' in keys):
             match = False
             if not match:
@@ -1796,6 +1902,21 @@ class Josm_openrailwaymap(PluginMapCSS):
                     ['building','train_station']])
                 }})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['railway']),
+        (_relation_rule_1, ['railway']),
+        (_relation_rule_2, ['railway']),
+        (_relation_rule_3, ['railway']),
+        (_relation_rule_4, ['railway']),
+        (_relation_rule_5, ['building']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
@@ -23,22 +23,17 @@ class Josm_relation(PluginMapCSS):
         self.re_67b11051 = re.compile(r'^restriction')
 
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # relation[!type]
-        # Rule Blacklisted (id: 1457279320)
-
-        # relation[type=boundary][!boundary][!disused:boundary]
-        # relation[type=destination_sign][!destination]
-        # relation[type=enforcement][!enforcement]
-        # relation[type=public_transport][!public_transport]
-        # relation[type=route][!route]
-        # relation[type=route_master][!route_master]
-        # relation[type=waterway][!waterway]
+    # relation[!type]
+    # Rule Blacklisted (id: 1457279320)
+
+    # relation[type=boundary][!boundary][!disused:boundary]
+    # relation[type=destination_sign][!destination]
+    # relation[type=enforcement][!enforcement]
+    # relation[type=public_transport][!public_transport]
+    # relation[type=route][!route]
+    # relation[type=route_master][!route_master]
+    # relation[type=waterway][!waterway]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('type' in keys):
             match = False
             if not match:
@@ -87,7 +82,8 @@ class Josm_relation(PluginMapCSS):
                 # assertMatch:"relation type=waterway"
                 err.append({'class': 9007001, 'subclass': 93004660, 'text': mapcss.tr('{0} relation without {0} tag', mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # relation[type=restriction][!/^restriction/]
+    # relation[type=restriction][!/^restriction/]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('type' in keys):
             match = False
             if not match:
@@ -102,6 +98,17 @@ class Josm_relation(PluginMapCSS):
                 # assertMatch:"relation type=restriction"
                 err.append({'class': 9007001, 'subclass': 1097316614, 'text': mapcss.tr('{0} relation without {0} tag', 'restriction')})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['type']),
+        (_relation_rule_1, ['type']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
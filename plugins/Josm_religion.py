@@ -22,13 +22,8 @@ class Josm_religion(PluginMapCSS):
 
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # *[religion=catholic]
+    # *[religion=catholic]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('religion' in keys):
             match = False
             if not match:
@@ -48,15 +43,20 @@ class Josm_religion(PluginMapCSS):
                     'religion'])
                 }})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['religion']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # *[religion=catholic]
+    # *[religion=catholic]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('religion' in keys):
             match = False
             if not match:
@@ -76,15 +76,20 @@ class Josm_religion(PluginMapCSS):
                     'religion'])
                 }})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['religion']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # *[religion=catholic]
+    # *[religion=catholic]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('religion' in keys):
             match = False
             if not match:
@@ -104,4 +109,14 @@ class Josm_religion(PluginMapCSS):
                     'religion'])
                 }})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['religion']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
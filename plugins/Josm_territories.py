@@ -28,14 +28,9 @@ class Josm_territories(PluginMapCSS):
         self.re_5b84a257 = re.compile(r'(?i).*Strasse.*')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # *[addr:street=~/(?i).*Strasse.*/][addr:street!~/(?i).*Strasser.*/][inside("DE,AT")]
-        # *[name=~/(?i).*Strasse.*/][name!~/(?i).*Strasser.*/][name!~/(?i).*spannungstrasse.*/][inside("DE,AT")]
+    # *[addr:street=~/(?i).*Strasse.*/][addr:street!~/(?i).*Strasser.*/][inside("DE,AT")]
+    # *[name=~/(?i).*Strasse.*/][name!~/(?i).*Strasser.*/][name!~/(?i).*spannungstrasse.*/][inside("DE,AT")]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('addr:street' in keys) or ('name' in keys):
             match = False
             if not match:
@@ -50,8 +45,9 @@ class Josm_territories(PluginMapCSS):
                 # throwError:tr("street name contains ss")
                 err.append({'class': 9009002, 'subclass': 1817721249, 'text': mapcss.tr('street name contains ss')})
 
-        # *[addr:street=~/(?i).*Straße.*/][inside("LI,CH")]
-        # *[name=~/(?i).*Straße.*/][inside("LI,CH")]
+    # *[addr:street=~/(?i).*Straße.*/][inside("LI,CH")]
+    # *[name=~/(?i).*Straße.*/][inside("LI,CH")]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('addr:street' in keys) or ('name' in keys):
             match = False
             if not match:
@@ -66,16 +62,22 @@ class Josm_territories(PluginMapCSS):
                 # throwError:tr("street name contains ß")
                 err.append({'class': 9009003, 'subclass': 610086334, 'text': mapcss.tr('street name contains ß')})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['addr:street', 'name']),
+        (_node_rule_1, ['addr:street', 'name']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # *[addr:street=~/(?i).*Strasse.*/][addr:street!~/(?i).*Strasser.*/][inside("DE,AT")]
-        # *[name=~/(?i).*Strasse.*/][name!~/(?i).*Strasser.*/][name!~/(?i).*spannungstrasse.*/][inside("DE,AT")]
+    # *[addr:street=~/(?i).*Strasse.*/][addr:street!~/(?i).*Strasser.*/][inside("DE,AT")]
+    # *[name=~/(?i).*Strasse.*/][name!~/(?i).*Strasser.*/][name!~/(?i).*spannungstrasse.*/][inside("DE,AT")]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('addr:street' in keys) or ('name' in keys):
             match = False
             if not match:
@@ -95,8 +97,9 @@ class Josm_territories(PluginMapCSS):
                 # assertNoMatch:"way name=Peter-Strasser-Platz"
                 err.append({'class': 9009002, 'subclass': 1817721249, 'text': mapcss.tr('street name contains ss')})
 
-        # *[addr:street=~/(?i).*Straße.*/][inside("LI,CH")]
-        # *[name=~/(?i).*Straße.*/][inside("LI,CH")]
+    # *[addr:street=~/(?i).*Straße.*/][inside("LI,CH")]
+    # *[name=~/(?i).*Straße.*/][inside("LI,CH")]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('addr:street' in keys) or ('name' in keys):
             match = False
             if not match:
@@ -113,16 +116,22 @@ class Josm_territories(PluginMapCSS):
                 # assertMatch:"way name=Hauptstraße"
                 err.append({'class': 9009003, 'subclass': 610086334, 'text': mapcss.tr('street name contains ß')})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['addr:street', 'name']),
+        (_way_rule_1, ['addr:street', 'name']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # *[addr:street=~/(?i).*Strasse.*/][addr:street!~/(?i).*Strasser.*/][inside("DE,AT")]
-        # *[name=~/(?i).*Strasse.*/][name!~/(?i).*Strasser.*/][name!~/(?i).*spannungstrasse.*/][inside("DE,AT")]
+    # *[addr:street=~/(?i).*Strasse.*/][addr:street!~/(?i).*Strasser.*/][inside("DE,AT")]
+    # *[name=~/(?i).*Strasse.*/][name!~/(?i).*Strasser.*/][name!~/(?i).*spannungstrasse.*/][inside("DE,AT")]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('addr:street' in keys) or ('name' in keys):
             match = False
             if not match:
@@ -137,8 +146,9 @@ class Josm_territories(PluginMapCSS):
                 # throwError:tr("street name contains ss")
                 err.append({'class': 9009002, 'subclass': 1817721249, 'text': mapcss.tr('street name contains ss')})
 
-        # *[addr:street=~/(?i).*Straße.*/][inside("LI,CH")]
-        # *[name=~/(?i).*Straße.*/][inside("LI,CH")]
+    # *[addr:street=~/(?i).*Straße.*/][inside("LI,CH")]
+    # *[name=~/(?i).*Straße.*/][inside("LI,CH")]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('addr:street' in keys) or ('name' in keys):
             match = False
             if not match:
@@ -153,7 +163,8 @@ class Josm_territories(PluginMapCSS):
                 # throwError:tr("street name contains ß")
                 err.append({'class': 9009003, 'subclass': 610086334, 'text': mapcss.tr('street name contains ß')})
 
-        # relation[type=associatedStreet][inside("DE")]
+    # relation[type=associatedStreet][inside("DE")]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('type' in keys):
             match = False
             if not match:
@@ -166,6 +177,18 @@ class Josm_territories(PluginMapCSS):
                 # suggestAlternative:"addr:street"
                 err.append({'class': 9009001, 'subclass': 746730328, 'text': mapcss.tr('{0} is deprecated in {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), 'Deutschland')})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['addr:street', 'name']),
+        (_relation_rule_1, ['addr:street', 'name']),
+        (_relation_rule_2, ['type']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
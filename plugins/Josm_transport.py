@@ -46,13 +46,8 @@ class Josm_transport(PluginMapCSS):
         self.re_6194d2a4 = re.compile(r'^(bus|coach|train|subway|monorail|trolleybus|aerialway|funicular|ferry|tram|share_taxi|light_rail|school_bus|walking_bus)$')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-        set_pt_route = set_pt_route_master = set_pt_route_probably_v2 = False
-
-        # node[highway=bus_stop][amenity=bus_station]
+    # node[highway=bus_stop][amenity=bus_station]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -67,7 +62,8 @@ class Josm_transport(PluginMapCSS):
                     'amenity'])
                 }})
 
-        # node[highway=bus_stop][!public_transport]
+    # node[highway=bus_stop][!public_transport]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -87,7 +83,8 @@ class Josm_transport(PluginMapCSS):
                     ['public_transport','platform']])
                 }})
 
-        # node[railway=tram_stop][!public_transport]
+    # node[railway=tram_stop][!public_transport]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('railway' in keys):
             match = False
             if not match:
@@ -107,7 +104,8 @@ class Josm_transport(PluginMapCSS):
                     ['public_transport','stop_position']])
                 }})
 
-        # node[public_transport=platform][!highway][!railway][!bus][!tram][!ferry][!walking_bus]
+    # node[public_transport=platform][!highway][!railway][!bus][!tram][!ferry][!walking_bus]
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('public_transport' in keys):
             match = False
             if not match:
@@ -120,7 +118,8 @@ class Josm_transport(PluginMapCSS):
                 # throwError:tr("Is this a bus or tram stop ? Add a tag to precise the kind of platform")
                 err.append({'class': 21412, 'subclass': 1, 'text': mapcss.tr('Is this a bus or tram stop ? Add a tag to precise the kind of platform')})
 
-        # node[public_transport=platform][!highway][!railway][bus=yes]
+    # node[public_transport=platform][!highway][!railway][bus=yes]
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if ('bus' in keys and 'public_transport' in keys):
             match = False
             if not match:
@@ -138,8 +137,9 @@ class Josm_transport(PluginMapCSS):
                     ['highway','bus_stop']])
                 }})
 
-        # node[highway=bus_stop][note]
-        # node[highway=bus_stop][note:fr][inside("FR")]
+    # node[highway=bus_stop][note]
+    # node[highway=bus_stop][note:fr][inside("FR")]
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('highway' in keys and 'note' in keys) or ('highway' in keys and 'note:fr' in keys):
             match = False
             if not match:
@@ -154,7 +154,8 @@ class Josm_transport(PluginMapCSS):
                 # throwWarning:tr("Check if the note can be deleted")
                 err.append({'class': 9014006, 'subclass': 673170504, 'text': mapcss.tr('Check if the note can be deleted')})
 
-        # node[highway=bus_stop][network][inside("FR")]
+    # node[highway=bus_stop][network][inside("FR")]
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if ('highway' in keys and 'network' in keys):
             match = False
             if not match:
@@ -169,7 +170,8 @@ class Josm_transport(PluginMapCSS):
                     'network'])
                 }})
 
-        # node[highway=bus_stop][operator][inside("FR")]
+    # node[highway=bus_stop][operator][inside("FR")]
+    def _node_rule_7(self, data, tags, keys, err, sets):
         if ('highway' in keys and 'operator' in keys):
             match = False
             if not match:
@@ -184,15 +186,27 @@ class Josm_transport(PluginMapCSS):
                     'operator'])
                 }})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['amenity']),
+        (_node_rule_1, ['highway']),
+        (_node_rule_2, ['railway']),
+        (_node_rule_3, ['public_transport']),
+        (_node_rule_4, ['bus']),
+        (_node_rule_5, ['highway']),
+        (_node_rule_6, ['highway']),
+        (_node_rule_7, ['highway']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
-        set_pt_route = set_pt_route_master = set_pt_route_probably_v2 = False
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-        # way[highway=bus_stop]
+    # way[highway=bus_stop]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -203,8 +217,9 @@ class Josm_transport(PluginMapCSS):
                 # throwError:tr("A bus stop is supposed to be a node")
                 err.append({'class': 9014019, 'subclass': 1153984743, 'text': mapcss.tr('A bus stop is supposed to be a node')})
 
-        # way[railway=subway_entrance]
-        # way[railway=train_station_entrance]
+    # way[railway=subway_entrance]
+    # way[railway=train_station_entrance]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('railway' in keys):
             match = False
             if not match:
@@ -220,15 +235,21 @@ class Josm_transport(PluginMapCSS):
                 # assertMatch:"way railway=subway_entrance"
                 err.append({'class': 9014027, 'subclass': 514884813, 'text': mapcss.tr('Subway entrances should be mapped as nodes')})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['highway']),
+        (_way_rule_1, ['railway']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
-        set_pt_route = set_pt_route_master = set_pt_route_probably_v2 = False
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-        # relation[type=route][!route][!disused:route]
+    # relation[type=route][!route][!disused:route]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('type' in keys):
             match = False
             if not match:
@@ -239,7 +260,8 @@ class Josm_transport(PluginMapCSS):
                 # throwError:tr("Missing transportation mode, add a tag route = bus/coach/tram/etc")
                 err.append({'class': 9014009, 'subclass': 1678105256, 'text': mapcss.tr('Missing transportation mode, add a tag route = bus/coach/tram/etc')})
 
-        # relation[type=route_master][!route_master][!route][!disused:route_master]
+    # relation[type=route_master][!route_master][!route][!disused:route_master]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('type' in keys):
             match = False
             if not match:
@@ -250,7 +272,8 @@ class Josm_transport(PluginMapCSS):
                 # throwError:tr("Missing transportation mode, add a tag route = bus/coach/tram/etc")
                 err.append({'class': 9014009, 'subclass': 1165025485, 'text': mapcss.tr('Missing transportation mode, add a tag route = bus/coach/tram/etc')})
 
-        # relation[type=route_master][!route_master][route]
+    # relation[type=route_master][!route_master][route]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('route' in keys and 'type' in keys):
             match = False
             if not match:
@@ -267,7 +290,8 @@ class Josm_transport(PluginMapCSS):
                     'route'])
                 }})
 
-        # relation[type=route][route=~/^(bus|coach|train|subway|monorail|trolleybus|aerialway|funicular|ferry|tram|share_taxi|light_rail|school_bus|walking_bus)$/]
+    # relation[type=route][route=~/^(bus|coach|train|subway|monorail|trolleybus|aerialway|funicular|ferry|tram|share_taxi|light_rail|school_bus|walking_bus)$/]
+    def _relation_rule_3(self, data, tags, members, keys, err, sets):
         if ('route' in keys and 'type' in keys):
             match = False
             if not match:
@@ -276,9 +300,10 @@ class Josm_transport(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set pt_route
-                set_pt_route = True
+                sets.add('pt_route')
 
-        # relation[type=route_master][route_master=~/^(bus|coach|train|subway|monorail|trolleybus|aerialway|funicular|ferry|tram|share_taxi|light_rail|school_bus|walking_bus)$/]
+    # relation[type=route_master][route_master=~/^(bus|coach|train|subway|monorail|trolleybus|aerialway|funicular|ferry|tram|share_taxi|light_rail|school_bus|walking_bus)$/]
+    def _relation_rule_4(self, data, tags, members, keys, err, sets):
         if ('route_master' in keys and 'type' in keys):
             match = False
             if not match:
@@ -287,22 +312,24 @@ class Josm_transport(PluginMapCSS):
                 except mapcss.RuleAbort: pass
             if match:
                 # set pt_route_master
-                set_pt_route_master = True
+                sets.add('pt_route_master')
 
-        # relation.route_in_master.pt_route
+    # relation.route_in_master.pt_route
+    def _relation_rule_5(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             # Skip selector using undeclared class pt_route, route_in_master
             if match:
                 # set pt_route_probably_v2
-                set_pt_route_probably_v2 = True
+                sets.add('pt_route_probably_v2')
 
-        # relation.pt_route[!public_transport:version]
+    # relation.pt_route[!public_transport:version]
+    def _relation_rule_6(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route) and (not mapcss._tag_capture(capture_tags, 1, tags, 'public_transport:version')))
+                try: match = (('pt_route' in sets) and (not mapcss._tag_capture(capture_tags, 1, tags, 'public_transport:version')))
                 except mapcss.RuleAbort: pass
             if match:
                 # -osmoseItemClassLevel:"2140/21401/3"
@@ -311,17 +338,18 @@ class Josm_transport(PluginMapCSS):
                 # assertMatch:"relation type=route route=bus"
                 err.append({'class': 21401, 'subclass': 0, 'text': mapcss.tr('Missing public_transport:version tag on a public_transport route relation')})
 
-        # relation.pt_route[!network]
-        # relation.pt_route_master[!network]
+    # relation.pt_route[!network]
+    # relation.pt_route_master[!network]
+    def _relation_rule_7(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route) and (not mapcss._tag_capture(capture_tags, 1, tags, 'network')))
+                try: match = (('pt_route' in sets) and (not mapcss._tag_capture(capture_tags, 1, tags, 'network')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route_master) and (not mapcss._tag_capture(capture_tags, 1, tags, 'network')))
+                try: match = (('pt_route_master' in sets) and (not mapcss._tag_capture(capture_tags, 1, tags, 'network')))
                 except mapcss.RuleAbort: pass
             if match:
                 # -osmoseItemClassLevel:"2140/21402/3"
@@ -330,17 +358,18 @@ class Josm_transport(PluginMapCSS):
                 # assertMatch:"relation type=route route=bus"
                 err.append({'class': 21402, 'subclass': 0, 'text': mapcss.tr('Missing network tag on a public_transport relation')})
 
-        # relation.pt_route[!operator]
-        # relation.pt_route_master[!operator]
+    # relation.pt_route[!operator]
+    # relation.pt_route_master[!operator]
+    def _relation_rule_8(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route) and (not mapcss._tag_capture(capture_tags, 1, tags, 'operator')))
+                try: match = (('pt_route' in sets) and (not mapcss._tag_capture(capture_tags, 1, tags, 'operator')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route_master) and (not mapcss._tag_capture(capture_tags, 1, tags, 'operator')))
+                try: match = (('pt_route_master' in sets) and (not mapcss._tag_capture(capture_tags, 1, tags, 'operator')))
                 except mapcss.RuleAbort: pass
             if match:
                 # -osmoseItemClassLevel:"2140/21403/3"
@@ -349,17 +378,18 @@ class Josm_transport(PluginMapCSS):
                 # assertMatch:"relation type=route route=bus"
                 err.append({'class': 21403, 'subclass': 0, 'text': mapcss.tr('Missing operator tag on a public_transport relation')})
 
-        # relation.pt_route[!from]
-        # relation.pt_route[!to]
+    # relation.pt_route[!from]
+    # relation.pt_route[!to]
+    def _relation_rule_9(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route) and (not mapcss._tag_capture(capture_tags, 1, tags, 'from')))
+                try: match = (('pt_route' in sets) and (not mapcss._tag_capture(capture_tags, 1, tags, 'from')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route) and (not mapcss._tag_capture(capture_tags, 1, tags, 'to')))
+                try: match = (('pt_route' in sets) and (not mapcss._tag_capture(capture_tags, 1, tags, 'to')))
                 except mapcss.RuleAbort: pass
             if match:
                 # -osmoseItemClassLevel:"2140/21405/3"
@@ -370,32 +400,33 @@ class Josm_transport(PluginMapCSS):
                 # assertMatch:"relation type=route route=bus"
                 err.append({'class': 21405, 'subclass': 0, 'text': mapcss.tr('Missing from/to tag on a public_transport route relation')})
 
-        # relation.pt_route[tag(network)!=parent_tag(network)]
-        # Part of rule not implemented
+    # relation.pt_route[tag(network)!=parent_tag(network)]
+    # Part of rule not implemented
 
-        # relation.pt_route[tag(operator)!=parent_tag(operator)]
-        # Part of rule not implemented
+    # relation.pt_route[tag(operator)!=parent_tag(operator)]
+    # Part of rule not implemented
 
-        # relation.pt_route[tag(ref)!=parent_tag(ref)]
-        # Part of rule not implemented
+    # relation.pt_route[tag(ref)!=parent_tag(ref)]
+    # Part of rule not implemented
 
-        # relation.pt_route[tag(colour)!=parent_tag(colour)]
-        # Part of rule not implemented
+    # relation.pt_route[tag(colour)!=parent_tag(colour)]
+    # Part of rule not implemented
 
-        # relation.pt_route[tag(route)!=parent_tag(route_master)]
-        # Part of rule not implemented
+    # relation.pt_route[tag(route)!=parent_tag(route_master)]
+    # Part of rule not implemented
 
-        # relation.pt_route[!colour][color]
-        # relation.pt_route_master[!colour][color]
+    # relation.pt_route[!colour][color]
+    # relation.pt_route_master[!colour][color]
+    def _relation_rule_10(self, data, tags, members, keys, err, sets):
         if ('color' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route) and (not mapcss._tag_capture(capture_tags, 1, tags, 'colour')) and (mapcss._tag_capture(capture_tags, 2, tags, 'color')))
+                try: match = (('pt_route' in sets) and (not mapcss._tag_capture(capture_tags, 1, tags, 'colour')) and (mapcss._tag_capture(capture_tags, 2, tags, 'color')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route_master) and (not mapcss._tag_capture(capture_tags, 1, tags, 'colour')) and (mapcss._tag_capture(capture_tags, 2, tags, 'color')))
+                try: match = (('pt_route_master' in sets) and (not mapcss._tag_capture(capture_tags, 1, tags, 'colour')) and (mapcss._tag_capture(capture_tags, 2, tags, 'color')))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwError:tr("The color of the public transport line should be in a colour tag")
@@ -407,39 +438,42 @@ class Josm_transport(PluginMapCSS):
                     'color'])
                 }})
 
-        # relation.pt_route["operator"=~/STIF|Kéolis|Véolia/][inside("FR")]
-        # relation.pt_route_master["operator"=~/STIF|Kéolis|Véolia/][inside("FR")]
+    # relation.pt_route["operator"=~/STIF|Kéolis|Véolia/][inside("FR")]
+    # relation.pt_route_master["operator"=~/STIF|Kéolis|Véolia/][inside("FR")]
+    def _relation_rule_11(self, data, tags, members, keys, err, sets):
         if ('operator' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_25554804), mapcss._tag_capture(capture_tags, 1, tags, 'operator'))) and (mapcss.inside(self.father.config.options, 'FR')))
+                try: match = (('pt_route' in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_25554804), mapcss._tag_capture(capture_tags, 1, tags, 'operator'))) and (mapcss.inside(self.father.config.options, 'FR')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route_master) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_25554804), mapcss._tag_capture(capture_tags, 1, tags, 'operator'))) and (mapcss.inside(self.father.config.options, 'FR')))
+                try: match = (('pt_route_master' in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_25554804), mapcss._tag_capture(capture_tags, 1, tags, 'operator'))) and (mapcss.inside(self.father.config.options, 'FR')))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwError:tr("Check the operator tag : this operator does not exist, it may be a typo")
                 err.append({'class': 9014025, 'subclass': 286137008, 'text': mapcss.tr('Check the operator tag : this operator does not exist, it may be a typo')})
 
-        # relation.pt_route["network"=~/STIF|Kéolis|Véolia/][inside("FR")]
-        # relation.pt_route_master["network"=~/STIF|Kéolis|Véolia/][inside("FR")]
+    # relation.pt_route["network"=~/STIF|Kéolis|Véolia/][inside("FR")]
+    # relation.pt_route_master["network"=~/STIF|Kéolis|Véolia/][inside("FR")]
+    def _relation_rule_12(self, data, tags, members, keys, err, sets):
         if ('network' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_25554804), mapcss._tag_capture(capture_tags, 1, tags, 'network'))) and (mapcss.inside(self.father.config.options, 'FR')))
+                try: match = (('pt_route' in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_25554804), mapcss._tag_capture(capture_tags, 1, tags, 'network'))) and (mapcss.inside(self.father.config.options, 'FR')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route_master) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_25554804), mapcss._tag_capture(capture_tags, 1, tags, 'network'))) and (mapcss.inside(self.father.config.options, 'FR')))
+                try: match = (('pt_route_master' in sets) and (mapcss.regexp_test(mapcss._value_capture(capture_tags, 1, self.re_25554804), mapcss._tag_capture(capture_tags, 1, tags, 'network'))) and (mapcss.inside(self.father.config.options, 'FR')))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwError:tr("Check the network tag : this network does not exist, it may be a typo")
                 err.append({'class': 9014026, 'subclass': 735027962, 'text': mapcss.tr('Check the network tag : this network does not exist, it may be a typo')})
 
-        # relation[highway=bus_stop]
+    # relation[highway=bus_stop]
+    def _relation_rule_13(self, data, tags, members, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -450,7 +484,8 @@ class Josm_transport(PluginMapCSS):
                 # throwError:tr("A bus stop is supposed to be a node")
                 err.append({'class': 9014019, 'subclass': 1590282811, 'text': mapcss.tr('A bus stop is supposed to be a node')})
 
-        # relation.pt_route!.route_ok
+    # relation.pt_route!.route_ok
+    def _relation_rule_14(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             # Skip selector using undeclared class pt_route, route_ok
@@ -458,17 +493,18 @@ class Josm_transport(PluginMapCSS):
                 # throwError:tr("The line variant does not belong to any line, add it to the route_master relation")
                 err.append({'class': 9014028, 'subclass': 1286525207, 'text': mapcss.tr('The line variant does not belong to any line, add it to the route_master relation')})
 
-        # relation.pt_route[interval][interval!~/^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$/]
-        # relation.pt_route_master[interval][interval!~/^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$/]
+    # relation.pt_route[interval][interval!~/^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$/]
+    # relation.pt_route_master[interval][interval!~/^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$/]
+    def _relation_rule_15(self, data, tags, members, keys, err, sets):
         if ('interval' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route) and (mapcss._tag_capture(capture_tags, 1, tags, 'interval')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_2fe0817d, '^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$'), mapcss._tag_capture(capture_tags, 2, tags, 'interval'))))
+                try: match = (('pt_route' in sets) and (mapcss._tag_capture(capture_tags, 1, tags, 'interval')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_2fe0817d, '^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$'), mapcss._tag_capture(capture_tags, 2, tags, 'interval'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route_master) and (mapcss._tag_capture(capture_tags, 1, tags, 'interval')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_2fe0817d, '^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$'), mapcss._tag_capture(capture_tags, 2, tags, 'interval'))))
+                try: match = (('pt_route_master' in sets) and (mapcss._tag_capture(capture_tags, 1, tags, 'interval')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_2fe0817d, '^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$'), mapcss._tag_capture(capture_tags, 2, tags, 'interval'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwError:tr("The interval is invalid (try a number of minutes)")
@@ -484,17 +520,18 @@ class Josm_transport(PluginMapCSS):
                 # assertMatch:"relation type=route_master route_master=bus interval=1240"
                 err.append({'class': 9014021, 'subclass': 170114261, 'text': mapcss.tr('The interval is invalid (try a number of minutes)')})
 
-        # relation.pt_route[duration][duration!~/^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$/]
-        # relation.pt_route_master[duration][duration!~/^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$/]
+    # relation.pt_route[duration][duration!~/^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$/]
+    # relation.pt_route_master[duration][duration!~/^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$/]
+    def _relation_rule_16(self, data, tags, members, keys, err, sets):
         if ('duration' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route) and (mapcss._tag_capture(capture_tags, 1, tags, 'duration')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_2fe0817d, '^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$'), mapcss._tag_capture(capture_tags, 2, tags, 'duration'))))
+                try: match = (('pt_route' in sets) and (mapcss._tag_capture(capture_tags, 1, tags, 'duration')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_2fe0817d, '^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$'), mapcss._tag_capture(capture_tags, 2, tags, 'duration'))))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route_master) and (mapcss._tag_capture(capture_tags, 1, tags, 'duration')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_2fe0817d, '^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$'), mapcss._tag_capture(capture_tags, 2, tags, 'duration'))))
+                try: match = (('pt_route_master' in sets) and (mapcss._tag_capture(capture_tags, 1, tags, 'duration')) and (not mapcss.regexp_test(mapcss._value_const_capture(capture_tags, 2, self.re_2fe0817d, '^([0-9][0-9]?[0-9]?|[0-2][0-9]:[0-5][0-9](:[0-5][0-9])?)$'), mapcss._tag_capture(capture_tags, 2, tags, 'duration'))))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwError:tr("The duration is invalid (try a number of minutes)")
@@ -507,40 +544,43 @@ class Josm_transport(PluginMapCSS):
                 # assertNoMatch:"relation type=route_master route_master=bus duration=5"
                 err.append({'class': 9014022, 'subclass': 317647061, 'text': mapcss.tr('The duration is invalid (try a number of minutes)')})
 
-        # relation.pt_route["interval:conditional"][!interval]
-        # relation.pt_route_master["interval:conditional"][!interval]
+    # relation.pt_route["interval:conditional"][!interval]
+    # relation.pt_route_master["interval:conditional"][!interval]
+    def _relation_rule_17(self, data, tags, members, keys, err, sets):
         if ('interval:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route) and (mapcss._tag_capture(capture_tags, 1, tags, 'interval:conditional')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'interval')))
+                try: match = (('pt_route' in sets) and (mapcss._tag_capture(capture_tags, 1, tags, 'interval:conditional')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'interval')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route_master) and (mapcss._tag_capture(capture_tags, 1, tags, 'interval:conditional')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'interval')))
+                try: match = (('pt_route_master' in sets) and (mapcss._tag_capture(capture_tags, 1, tags, 'interval:conditional')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'interval')))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwError:tr("Missing interval tag to specify the main interval")
                 err.append({'class': 9014023, 'subclass': 1710360237, 'text': mapcss.tr('Missing interval tag to specify the main interval')})
 
-        # relation.pt_route["interval:conditional"][!opening_hours]
-        # relation.pt_route_master["interval:conditional"][!opening_hours]
+    # relation.pt_route["interval:conditional"][!opening_hours]
+    # relation.pt_route_master["interval:conditional"][!opening_hours]
+    def _relation_rule_18(self, data, tags, members, keys, err, sets):
         if ('interval:conditional' in keys):
             match = False
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route) and (mapcss._tag_capture(capture_tags, 1, tags, 'interval:conditional')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'opening_hours')))
+                try: match = (('pt_route' in sets) and (mapcss._tag_capture(capture_tags, 1, tags, 'interval:conditional')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'opening_hours')))
                 except mapcss.RuleAbort: pass
             if not match:
                 capture_tags = {}
-                try: match = ((set_pt_route_master) and (mapcss._tag_capture(capture_tags, 1, tags, 'interval:conditional')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'opening_hours')))
+                try: match = (('pt_route_master' in sets) and (mapcss._tag_capture(capture_tags, 1, tags, 'interval:conditional')) and (not mapcss._tag_capture(capture_tags, 2, tags, 'opening_hours')))
                 except mapcss.RuleAbort: pass
             if match:
                 # throwError:tr("Missing opening_hours tag")
                 err.append({'class': 9014024, 'subclass': 210081506, 'text': mapcss.tr('Missing opening_hours tag')})
 
-        # relation[railway=subway_entrance]
-        # relation[railway=train_station_entrance]
+    # relation[railway=subway_entrance]
+    # relation[railway=train_station_entrance]
+    def _relation_rule_19(self, data, tags, members, keys, err, sets):
         if ('railway' in keys):
             match = False
             if not match:
@@ -555,6 +595,35 @@ class Josm_transport(PluginMapCSS):
                 # throwError:tr("Subway entrances should be mapped as nodes")
                 err.append({'class': 9014027, 'subclass': 569512108, 'text': mapcss.tr('Subway entrances should be mapped as nodes')})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['type']),
+        (_relation_rule_1, ['type']),
+        (_relation_rule_2, ['route']),
+        (_relation_rule_3, ['route']),
+        (_relation_rule_4, ['route_master']),
+        (_relation_rule_5, None),
+        (_relation_rule_6, None),
+        (_relation_rule_7, None),
+        (_relation_rule_8, None),
+        (_relation_rule_9, None),
+        (_relation_rule_10, ['color']),
+        (_relation_rule_11, ['operator']),
+        (_relation_rule_12, ['network']),
+        (_relation_rule_13, ['highway']),
+        (_relation_rule_14, None),
+        (_relation_rule_15, ['interval']),
+        (_relation_rule_16, ['duration']),
+        (_relation_rule_17, ['interval:conditional']),
+        (_relation_rule_18, ['interval:conditional']),
+        (_relation_rule_19, ['railway']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
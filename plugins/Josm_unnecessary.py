@@ -58,17 +58,12 @@ class Josm_unnecessary(PluginMapCSS):
         self.re_7dc8f17a = re.compile(r'^(?i)(playground|spielplatz)$')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # *[access][highway=proposed]
-        # *[bridge=no]
-        # *[building=no]
-        # *[elevation="0"]
-        # *[layer="0"]
+    # *[access][highway=proposed]
+    # *[bridge=no]
+    # *[building=no]
+    # *[elevation="0"]
+    # *[layer="0"]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('access' in keys and 'highway' in keys) or ('bridge' in keys) or ('building' in keys) or ('elevation' in keys) or ('layer' in keys):
             match = False
             if not match:
@@ -100,11 +95,12 @@ class Josm_unnecessary(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[gnis:Class="Populated Place"][place=city]
-        # *[gnis:Class="Populated Place"][place=town]
-        # *[gnis:Class="Populated Place"][place=village]
-        # *[gnis:Class="Populated Place"][place=hamlet]
-        # *[gnis:Class=Summit][natural=peak]
+    # *[gnis:Class="Populated Place"][place=city]
+    # *[gnis:Class="Populated Place"][place=town]
+    # *[gnis:Class="Populated Place"][place=village]
+    # *[gnis:Class="Populated Place"][place=hamlet]
+    # *[gnis:Class=Summit][natural=peak]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('gnis:Class' in keys and 'natural' in keys) or ('gnis:Class' in keys and 'place' in keys):
             match = False
             if not match:
@@ -138,7 +134,8 @@ class Josm_unnecessary(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[emergency=permissive]
+    # *[emergency=permissive]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('emergency' in keys):
             match = False
             if not match:
@@ -153,7 +150,8 @@ class Josm_unnecessary(PluginMapCSS):
                     ['emergency','yes']])
                 }})
 
-        # *[payment:cash][payment:coins][payment:notes]
+    # *[payment:cash][payment:coins][payment:notes]
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('payment:cash' in keys and 'payment:coins' in keys and 'payment:notes' in keys):
             match = False
             if not match:
@@ -169,7 +167,8 @@ class Josm_unnecessary(PluginMapCSS):
                     'payment:cash'])
                 }})
 
-        # node[emergency=fire_hydrant][fire_hydrant:count=1]
+    # node[emergency=fire_hydrant][fire_hydrant:count=1]
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if ('emergency' in keys and 'fire_hydrant:count' in keys):
             match = False
             if not match:
@@ -185,36 +184,37 @@ class Josm_unnecessary(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{1.key}')])
                 }})
 
-        # *[name][name=~/^(?i)(library|biblioteca|biblioteka|bibliothek|bibliotheek)$/][amenity=library]
-        # *[name][name=~/^(?i)(parc|park)$/][leisure=park]
-        # *[name][name=~/^(?i)(pond)$/][water=pond]
-        # *[name][name=~/^(?i)(church|église|biserica)$/][amenity=place_of_worship][religion=christian]
-        # *[name][name=~/^(?i)(mosque|cami|masjid|مسجد)$/][amenity=place_of_worship][religion=muslim]
-        # *[name][name=~/^(?i)(parking|parkplatz)$/][amenity=parking]
-        # *[name][name=~/^(?i)(post office)$/][amenity=post_office]
-        # *[name][name=~/^(?i)(restaurant)$/][amenity=restaurant]
-        # *[name][name=~/^(?i)(toilets?)$/][amenity=toilets]
-        # *[name][name=~/^(?i)(playground|spielplatz)$/][leisure=playground]
-        # *[name][name=~/^(?i)(shop|boutique)$/][shop][shop!=no]
-        # *[name][name=~/^(?i)(building|bangunan|bâtiment|batiment)$/][building][building!=no]
-        # *[name][name=~/^(?i)(house|maison|rumah|vivienda)$/][building=house]
-        # *[name][name=~/^(?i)(casa)$/][building=house][outside("FR")]
-        # *[name][name=~/^(?i)(kiosk)$/][shop=kiosk][outside("NL")]
-        # *[name][name=~/^(?i)(path)$/][highway=path]
-        # *[name][name=~/^(?i)(jalan)$/][highway]
-        # *[name][name=~/^(?i)(silo)$/][man_made=silo]
-        # *[name][name=~/^(?i)(cemetery|cementerio|cimetière|cmentarz|friedhof)$/][amenity=grave_yard]
-        # *[name][name=~/^(?i)(cemetery|cementerio|cimetière|cmentarz|friedhof)$/][landuse=cemetery]
-        # *[name][name=~/^(?i)(monument aux morts|war memorial)$/][historic=memorial][memorial=war_memorial]
-        # *[name][name=~/^(?i)(school|école|Школа)$/][amenity=school]
-        # *[name][name=~/^(?i)(école élémentaire)$/][amenity=school]["school:FR"="élémentaire"]
-        # *[name][name=~/^(?i)(école maternelle)$/][amenity=school]["school:FR"="maternelle"]
-        # *[name][name=~/^(?i)(école primaire)$/][amenity=school]["school:FR"="primaire"]
-        # *[name][name=~/^(?i)(collège)$/][amenity=school]["school:FR"="collège"]
-        # *[name][name=~/^(?i)(lycée)$/][amenity=school]["school:FR"="lycée"]
-        # *[name][name=~/^(?i)(Аптека|farmacia|pharmacy|pharmacie)$/][amenity=pharmacy]
-        # *[name][name=~/^(?i)(hydrant)$/][emergency=fire_hydrant]
-        # *[name][name=~/^(?i)(АГЗС|АЗС)$/][amenity=fuel]
+    # *[name][name=~/^(?i)(library|biblioteca|biblioteka|bibliothek|bibliotheek)$/][amenity=library]
+    # *[name][name=~/^(?i)(parc|park)$/][leisure=park]
+    # *[name][name=~/^(?i)(pond)$/][water=pond]
+    # *[name][name=~/^(?i)(church|église|biserica)$/][amenity=place_of_worship][religion=christian]
+    # *[name][name=~/^(?i)(mosque|cami|masjid|مسجد)$/][amenity=place_of_worship][religion=muslim]
+    # *[name][name=~/^(?i)(parking|parkplatz)$/][amenity=parking]
+    # *[name][name=~/^(?i)(post office)$/][amenity=post_office]
+    # *[name][name=~/^(?i)(restaurant)$/][amenity=restaurant]
+    # *[name][name=~/^(?i)(toilets?)$/][amenity=toilets]
+    # *[name][name=~/^(?i)(playground|spielplatz)$/][leisure=playground]
+    # *[name][name=~/^(?i)(shop|boutique)$/][shop][shop!=no]
+    # *[name][name=~/^(?i)(building|bangunan|bâtiment|batiment)$/][building][building!=no]
+    # *[name][name=~/^(?i)(house|maison|rumah|vivienda)$/][building=house]
+    # *[name][name=~/^(?i)(casa)$/][building=house][outside("FR")]
+    # *[name][name=~/^(?i)(kiosk)$/][shop=kiosk][outside("NL")]
+    # *[name][name=~/^(?i)(path)$/][highway=path]
+    # *[name][name=~/^(?i)(jalan)$/][highway]
+    # *[name][name=~/^(?i)(silo)$/][man_made=silo]
+    # *[name][name=~/^(?i)(cemetery|cementerio|cimetière|cmentarz|friedhof)$/][amenity=grave_yard]
+    # *[name][name=~/^(?i)(cemetery|cementerio|cimetière|cmentarz|friedhof)$/][landuse=cemetery]
+    # *[name][name=~/^(?i)(monument aux morts|war memorial)$/][historic=memorial][memorial=war_memorial]
+    # *[name][name=~/^(?i)(school|école|Школа)$/][amenity=school]
+    # *[name][name=~/^(?i)(école élémentaire)$/][amenity=school]["school:FR"="élémentaire"]
+    # *[name][name=~/^(?i)(école maternelle)$/][amenity=school]["school:FR"="maternelle"]
+    # *[name][name=~/^(?i)(école primaire)$/][amenity=school]["school:FR"="primaire"]
+    # *[name][name=~/^(?i)(collège)$/][amenity=school]["school:FR"="collège"]
+    # *[name][name=~/^(?i)(lycée)$/][amenity=school]["school:FR"="lycée"]
+    # *[name][name=~/^(?i)(Аптека|farmacia|pharmacy|pharmacie)$/][amenity=pharmacy]
+    # *[name][name=~/^(?i)(hydrant)$/][emergency=fire_hydrant]
+    # *[name][name=~/^(?i)(АГЗС|АЗС)$/][amenity=fuel]
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'name' in keys) or ('amenity' in keys and 'name' in keys and 'religion' in keys) or ('amenity' in keys and 'name' in keys and 'school:FR' in keys) or ('building' in keys and 'name' in keys) or ('emergency' in keys and 'name' in keys) or ('highway' in keys and 'name' in keys) or ('historic' in keys and 'memorial' in keys and 'name' in keys) or ('landuse' in keys and 'name' in keys) or ('leisure' in keys and 'name' in keys) or ('man_made' in keys and 'name' in keys) or ('name' in keys and 'shop' in keys) or ('name' in keys and 'water' in keys):
             match = False
             if not match:
@@ -353,11 +353,12 @@ class Josm_unnecessary(PluginMapCSS):
                     'name'])
                 }})
 
-        # *[name][name=~/^(?i)(chapel|chapelle|kapelle)$/][tag("building")=="chapel"||tag("amenity")=="place_of_worship"]
-        # *[name][name=~/^(?i)(silo)$/][man_made!=silo]
-        # *[name][name=~/^(?i)(school|école|Школа)$/][amenity!=school]
-        # *[name][name=~/^(?i)(house|rumah|vivienda)$/][building][building!=house][building!=no]
-        # *[name][name=~/^(?i)(casa)$/][building][building!=house][building!=no][outside("FR")]
+    # *[name][name=~/^(?i)(chapel|chapelle|kapelle)$/][tag("building")=="chapel"||tag("amenity")=="place_of_worship"]
+    # *[name][name=~/^(?i)(silo)$/][man_made!=silo]
+    # *[name][name=~/^(?i)(school|école|Школа)$/][amenity!=school]
+    # *[name][name=~/^(?i)(house|rumah|vivienda)$/][building][building!=house][building!=no]
+    # *[name][name=~/^(?i)(casa)$/][building][building!=house][building!=no][outside("FR")]
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if ('building' in keys and 'name' in keys) or ('name' in keys):
             match = False
             if not match:
@@ -385,9 +386,10 @@ class Josm_unnecessary(PluginMapCSS):
                 # throwWarning:tr("{0}","{0.tag}")
                 err.append({'class': 9010003, 'subclass': 2140357823, 'text': mapcss.tr('{0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[/^gpx:/]
-        # *[/^gpxx:/]
-        # *[/^gpxd:/]
+    # *[/^gpx:/]
+    # *[/^gpxx:/]
+    # *[/^gpxd:/]
+    def _node_rule_7(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -414,19 +416,31 @@ class Josm_unnecessary(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['access', 'bridge', 'building', 'elevation', 'layer']),
+        (_node_rule_1, ['gnis:Class']),
+        (_node_rule_2, ['emergency']),
+        (_node_rule_3, ['payment:cash']),
+        (_node_rule_4, ['emergency']),
+        (_node_rule_5, ['amenity', 'building', 'emergency', 'highway', 'historic', 'landuse', 'leisure', 'man_made', 'name']),
+        (_node_rule_6, ['building', 'name']),
+        (_node_rule_7, None),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # *[access][highway=proposed]
-        # *[bridge=no]
-        # *[building=no]
-        # *[elevation="0"]
-        # *[layer="0"]
+    # *[access][highway=proposed]
+    # *[bridge=no]
+    # *[building=no]
+    # *[elevation="0"]
+    # *[layer="0"]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('access' in keys and 'highway' in keys) or ('bridge' in keys) or ('building' in keys) or ('elevation' in keys) or ('layer' in keys):
             match = False
             if not match:
@@ -461,16 +475,17 @@ class Josm_unnecessary(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # way:closed[boundary][area?]
-        # way:closed[indoor][area?][!highway][indoor!=no]
-        # way:closed[office][area?]
-        # way:closed[place][area?][!highway]
-        # way:closed[amenity][area?][!highway]
-        # way:closed[building][area?]
-        # way:closed[landuse][area?][!highway]
-        # way:closed[leisure][area?][!highway][leisure!=track][leisure!=slipway]
-        # way:closed[natural][area?]
-        # way:closed[shop][area?]
+    # way:closed[boundary][area?]
+    # way:closed[indoor][area?][!highway][indoor!=no]
+    # way:closed[office][area?]
+    # way:closed[place][area?][!highway]
+    # way:closed[amenity][area?][!highway]
+    # way:closed[building][area?]
+    # way:closed[landuse][area?][!highway]
+    # way:closed[leisure][area?][!highway][leisure!=track][leisure!=slipway]
+    # way:closed[natural][area?]
+    # way:closed[shop][area?]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'area' in keys) or ('area' in keys and 'boundary' in keys) or ('area' in keys and 'building' in keys) or ('area' in keys and 'indoor' in keys) or ('area' in keys and 'landuse' in keys) or ('area' in keys and 'leisure' in keys) or ('area' in keys and 'natural' in keys) or ('area' in keys and 'office' in keys) or ('area' in keys and 'place' in keys) or ('area' in keys and 'shop' in keys):
             match = False
             if not match:
@@ -522,11 +537,12 @@ class Josm_unnecessary(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{2.key}')])
                 }})
 
-        # way:closed[highway=rest_area][area?]
-        # way:closed[highway=services][area?]
-        # way:closed[aeroway=aerodrome][area?]
-        # way:closed[waterway=riverbank][area?]
-        # way:closed[aeroway=helipad][area?]
+    # way:closed[highway=rest_area][area?]
+    # way:closed[highway=services][area?]
+    # way:closed[aeroway=aerodrome][area?]
+    # way:closed[waterway=riverbank][area?]
+    # way:closed[aeroway=helipad][area?]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('aeroway' in keys and 'area' in keys) or ('area' in keys and 'highway' in keys) or ('area' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -558,11 +574,12 @@ class Josm_unnecessary(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{2.key}')])
                 }})
 
-        # *[gnis:Class="Populated Place"][place=city]
-        # *[gnis:Class="Populated Place"][place=town]
-        # *[gnis:Class="Populated Place"][place=village]
-        # *[gnis:Class="Populated Place"][place=hamlet]
-        # *[gnis:Class=Summit][natural=peak]
+    # *[gnis:Class="Populated Place"][place=city]
+    # *[gnis:Class="Populated Place"][place=town]
+    # *[gnis:Class="Populated Place"][place=village]
+    # *[gnis:Class="Populated Place"][place=hamlet]
+    # *[gnis:Class=Summit][natural=peak]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('gnis:Class' in keys and 'natural' in keys) or ('gnis:Class' in keys and 'place' in keys):
             match = False
             if not match:
@@ -594,7 +611,8 @@ class Josm_unnecessary(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[emergency=permissive]
+    # *[emergency=permissive]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('emergency' in keys):
             match = False
             if not match:
@@ -611,7 +629,8 @@ class Josm_unnecessary(PluginMapCSS):
                     ['emergency','yes']])
                 }})
 
-        # *[payment:cash][payment:coins][payment:notes]
+    # *[payment:cash][payment:coins][payment:notes]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('payment:cash' in keys and 'payment:coins' in keys and 'payment:notes' in keys):
             match = False
             if not match:
@@ -627,36 +646,37 @@ class Josm_unnecessary(PluginMapCSS):
                     'payment:cash'])
                 }})
 
-        # *[name][name=~/^(?i)(library|biblioteca|biblioteka|bibliothek|bibliotheek)$/][amenity=library]
-        # *[name][name=~/^(?i)(parc|park)$/][leisure=park]
-        # *[name][name=~/^(?i)(pond)$/][water=pond]
-        # *[name][name=~/^(?i)(church|église|biserica)$/][amenity=place_of_worship][religion=christian]
-        # *[name][name=~/^(?i)(mosque|cami|masjid|مسجد)$/][amenity=place_of_worship][religion=muslim]
-        # *[name][name=~/^(?i)(parking|parkplatz)$/][amenity=parking]
-        # *[name][name=~/^(?i)(post office)$/][amenity=post_office]
-        # *[name][name=~/^(?i)(restaurant)$/][amenity=restaurant]
-        # *[name][name=~/^(?i)(toilets?)$/][amenity=toilets]
-        # *[name][name=~/^(?i)(playground|spielplatz)$/][leisure=playground]
-        # *[name][name=~/^(?i)(shop|boutique)$/][shop][shop!=no]
-        # *[name][name=~/^(?i)(building|bangunan|bâtiment|batiment)$/][building][building!=no]
-        # *[name][name=~/^(?i)(house|maison|rumah|vivienda)$/][building=house]
-        # *[name][name=~/^(?i)(casa)$/][building=house][outside("FR")]
-        # *[name][name=~/^(?i)(kiosk)$/][shop=kiosk][outside("NL")]
-        # *[name][name=~/^(?i)(path)$/][highway=path]
-        # *[name][name=~/^(?i)(jalan)$/][highway]
-        # *[name][name=~/^(?i)(silo)$/][man_made=silo]
-        # *[name][name=~/^(?i)(cemetery|cementerio|cimetière|cmentarz|friedhof)$/][amenity=grave_yard]
-        # *[name][name=~/^(?i)(cemetery|cementerio|cimetière|cmentarz|friedhof)$/][landuse=cemetery]
-        # *[name][name=~/^(?i)(monument aux morts|war memorial)$/][historic=memorial][memorial=war_memorial]
-        # *[name][name=~/^(?i)(school|école|Школа)$/][amenity=school]
-        # *[name][name=~/^(?i)(école élémentaire)$/][amenity=school]["school:FR"="élémentaire"]
-        # *[name][name=~/^(?i)(école maternelle)$/][amenity=school]["school:FR"="maternelle"]
-        # *[name][name=~/^(?i)(école primaire)$/][amenity=school]["school:FR"="primaire"]
-        # *[name][name=~/^(?i)(collège)$/][amenity=school]["school:FR"="collège"]
-        # *[name][name=~/^(?i)(lycée)$/][amenity=school]["school:FR"="lycée"]
-        # *[name][name=~/^(?i)(Аптека|farmacia|pharmacy|pharmacie)$/][amenity=pharmacy]
-        # *[name][name=~/^(?i)(hydrant)$/][emergency=fire_hydrant]
-        # *[name][name=~/^(?i)(АГЗС|АЗС)$/][amenity=fuel]
+    # *[name][name=~/^(?i)(library|biblioteca|biblioteka|bibliothek|bibliotheek)$/][amenity=library]
+    # *[name][name=~/^(?i)(parc|park)$/][leisure=park]
+    # *[name][name=~/^(?i)(pond)$/][water=pond]
+    # *[name][name=~/^(?i)(church|église|biserica)$/][amenity=place_of_worship][religion=christian]
+    # *[name][name=~/^(?i)(mosque|cami|masjid|مسجد)$/][amenity=place_of_worship][religion=muslim]
+    # *[name][name=~/^(?i)(parking|parkplatz)$/][amenity=parking]
+    # *[name][name=~/^(?i)(post office)$/][amenity=post_office]
+    # *[name][name=~/^(?i)(restaurant)$/][amenity=restaurant]
+    # *[name][name=~/^(?i)(toilets?)$/][amenity=toilets]
+    # *[name][name=~/^(?i)(playground|spielplatz)$/][leisure=playground]
+    # *[name][name=~/^(?i)(shop|boutique)$/][shop][shop!=no]
+    # *[name][name=~/^(?i)(building|bangunan|bâtiment|batiment)$/][building][building!=no]
+    # *[name][name=~/^(?i)(house|maison|rumah|vivienda)$/][building=house]
+    # *[name][name=~/^(?i)(casa)$/][building=house][outside("FR")]
+    # *[name][name=~/^(?i)(kiosk)$/][shop=kiosk][outside("NL")]
+    # *[name][name=~/^(?i)(path)$/][highway=path]
+    # *[name][name=~/^(?i)(jalan)$/][highway]
+    # *[name][name=~/^(?i)(silo)$/][man_made=silo]
+    # *[name][name=~/^(?i)(cemetery|cementerio|cimetière|cmentarz|friedhof)$/][amenity=grave_yard]
+    # *[name][name=~/^(?i)(cemetery|cementerio|cimetière|cmentarz|friedhof)$/][landuse=cemetery]
+    # *[name][name=~/^(?i)(monument aux morts|war memorial)$/][historic=memorial][memorial=war_memorial]
+    # *[name][name=~/^(?i)(school|école|Школа)$/][amenity=school]
+    # *[name][name=~/^(?i)(école élémentaire)$/][amenity=school]["school:FR"="élémentaire"]
+    # *[name][name=~/^(?i)(école maternelle)$/][amenity=school]["school:FR"="maternelle"]
+    # *[name][name=~/^(?i)(école primaire)$/][amenity=school]["school:FR"="primaire"]
+    # *[name][name=~/^(?i)(collège)$/][amenity=school]["school:FR"="collège"]
+    # *[name][name=~/^(?i)(lycée)$/][amenity=school]["school:FR"="lycée"]
+    # *[name][name=~/^(?i)(Аптека|farmacia|pharmacy|pharmacie)$/][amenity=pharmacy]
+    # *[name][name=~/^(?i)(hydrant)$/][emergency=fire_hydrant]
+    # *[name][name=~/^(?i)(АГЗС|АЗС)$/][amenity=fuel]
+    def _way_rule_6(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'name' in keys) or ('amenity' in keys and 'name' in keys and 'religion' in keys) or ('amenity' in keys and 'name' in keys and 'school:FR' in keys) or ('building' in keys and 'name' in keys) or ('emergency' in keys and 'name' in keys) or ('highway' in keys and 'name' in keys) or ('historic' in keys and 'memorial' in keys and 'name' in keys) or ('landuse' in keys and 'name' in keys) or ('leisure' in keys and 'name' in keys) or ('man_made' in keys and 'name' in keys) or ('name' in keys and 'shop' in keys) or ('name' in keys and 'water' in keys):
             match = False
             if not match:
@@ -804,11 +824,12 @@ class Josm_unnecessary(PluginMapCSS):
                     'name'])
                 }})
 
-        # *[name][name=~/^(?i)(chapel|chapelle|kapelle)$/][tag("building")=="chapel"||tag("amenity")=="place_of_worship"]
-        # *[name][name=~/^(?i)(silo)$/][man_made!=silo]
-        # *[name][name=~/^(?i)(school|école|Школа)$/][amenity!=school]
-        # *[name][name=~/^(?i)(house|rumah|vivienda)$/][building][building!=house][building!=no]
-        # *[name][name=~/^(?i)(casa)$/][building][building!=house][building!=no][outside("FR")]
+    # *[name][name=~/^(?i)(chapel|chapelle|kapelle)$/][tag("building")=="chapel"||tag("amenity")=="place_of_worship"]
+    # *[name][name=~/^(?i)(silo)$/][man_made!=silo]
+    # *[name][name=~/^(?i)(school|école|Школа)$/][amenity!=school]
+    # *[name][name=~/^(?i)(house|rumah|vivienda)$/][building][building!=house][building!=no]
+    # *[name][name=~/^(?i)(casa)$/][building][building!=house][building!=no][outside("FR")]
+    def _way_rule_7(self, data, tags, nds, keys, err, sets):
         if ('building' in keys and 'name' in keys) or ('name' in keys):
             match = False
             if not match:
@@ -843,9 +864,10 @@ class Josm_unnecessary(PluginMapCSS):
                 # assertMatch:"way name=house building=yes"
                 err.append({'class': 9010003, 'subclass': 2140357823, 'text': mapcss.tr('{0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[/^gpx:/]
-        # *[/^gpxx:/]
-        # *[/^gpxd:/]
+    # *[/^gpx:/]
+    # *[/^gpxx:/]
+    # *[/^gpxd:/]
+    def _way_rule_8(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -869,19 +891,32 @@ class Josm_unnecessary(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['access', 'bridge', 'building', 'elevation', 'layer']),
+        (_way_rule_1, ['amenity', 'area']),
+        (_way_rule_2, ['aeroway', 'area']),
+        (_way_rule_3, ['gnis:Class']),
+        (_way_rule_4, ['emergency']),
+        (_way_rule_5, ['payment:cash']),
+        (_way_rule_6, ['amenity', 'building', 'emergency', 'highway', 'historic', 'landuse', 'leisure', 'man_made', 'name']),
+        (_way_rule_7, ['building', 'name']),
+        (_way_rule_8, None),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # *[access][highway=proposed]
-        # *[bridge=no]
-        # *[building=no]
-        # *[elevation="0"]
-        # *[layer="0"]
+    # *[access][highway=proposed]
+    # *[bridge=no]
+    # *[building=no]
+    # *[elevation="0"]
+    # *[layer="0"]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('access' in keys and 'highway' in keys) or ('bridge' in keys) or ('building' in keys) or ('elevation' in keys) or ('layer' in keys):
             match = False
             if not match:
@@ -913,11 +948,12 @@ class Josm_unnecessary(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[gnis:Class="Populated Place"][place=city]
-        # *[gnis:Class="Populated Place"][place=town]
-        # *[gnis:Class="Populated Place"][place=village]
-        # *[gnis:Class="Populated Place"][place=hamlet]
-        # *[gnis:Class=Summit][natural=peak]
+    # *[gnis:Class="Populated Place"][place=city]
+    # *[gnis:Class="Populated Place"][place=town]
+    # *[gnis:Class="Populated Place"][place=village]
+    # *[gnis:Class="Populated Place"][place=hamlet]
+    # *[gnis:Class=Summit][natural=peak]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('gnis:Class' in keys and 'natural' in keys) or ('gnis:Class' in keys and 'place' in keys):
             match = False
             if not match:
@@ -949,7 +985,8 @@ class Josm_unnecessary(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # *[emergency=permissive]
+    # *[emergency=permissive]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('emergency' in keys):
             match = False
             if not match:
@@ -964,7 +1001,8 @@ class Josm_unnecessary(PluginMapCSS):
                     ['emergency','yes']])
                 }})
 
-        # *[payment:cash][payment:coins][payment:notes]
+    # *[payment:cash][payment:coins][payment:notes]
+    def _relation_rule_3(self, data, tags, members, keys, err, sets):
         if ('payment:cash' in keys and 'payment:coins' in keys and 'payment:notes' in keys):
             match = False
             if not match:
@@ -980,36 +1018,37 @@ class Josm_unnecessary(PluginMapCSS):
                     'payment:cash'])
                 }})
 
-        # *[name][name=~/^(?i)(library|biblioteca|biblioteka|bibliothek|bibliotheek)$/][amenity=library]
-        # *[name][name=~/^(?i)(parc|park)$/][leisure=park]
-        # *[name][name=~/^(?i)(pond)$/][water=pond]
-        # *[name][name=~/^(?i)(church|église|biserica)$/][amenity=place_of_worship][religion=christian]
-        # *[name][name=~/^(?i)(mosque|cami|masjid|مسجد)$/][amenity=place_of_worship][religion=muslim]
-        # *[name][name=~/^(?i)(parking|parkplatz)$/][amenity=parking]
-        # *[name][name=~/^(?i)(post office)$/][amenity=post_office]
-        # *[name][name=~/^(?i)(restaurant)$/][amenity=restaurant]
-        # *[name][name=~/^(?i)(toilets?)$/][amenity=toilets]
-        # *[name][name=~/^(?i)(playground|spielplatz)$/][leisure=playground]
-        # *[name][name=~/^(?i)(shop|boutique)$/][shop][shop!=no]
-        # *[name][name=~/^(?i)(building|bangunan|bâtiment|batiment)$/][building][building!=no]
-        # *[name][name=~/^(?i)(house|maison|rumah|vivienda)$/][building=house]
-        # *[name][name=~/^(?i)(casa)$/][building=house][outside("FR")]
-        # *[name][name=~/^(?i)(kiosk)$/][shop=kiosk][outside("NL")]
-        # *[name][name=~/^(?i)(path)$/][highway=path]
-        # *[name][name=~/^(?i)(jalan)$/][highway]
-        # *[name][name=~/^(?i)(silo)$/][man_made=silo]
-        # *[name][name=~/^(?i)(cemetery|cementerio|cimetière|cmentarz|friedhof)$/][amenity=grave_yard]
-        # *[name][name=~/^(?i)(cemetery|cementerio|cimetière|cmentarz|friedhof)$/][landuse=cemetery]
-        # *[name][name=~/^(?i)(monument aux morts|war memorial)$/][historic=memorial][memorial=war_memorial]
-        # *[name][name=~/^(?i)(school|école|Школа)$/][amenity=school]
-        # *[name][name=~/^(?i)(école élémentaire)$/][amenity=school]["school:FR"="élémentaire"]
-        # *[name][name=~/^(?i)(école maternelle)$/][amenity=school]["school:FR"="maternelle"]
-        # *[name][name=~/^(?i)(école primaire)$/][amenity=school]["school:FR"="primaire"]
-        # *[name][name=~/^(?i)(collège)$/][amenity=school]["school:FR"="collège"]
-        # *[name][name=~/^(?i)(lycée)$/][amenity=school]["school:FR"="lycée"]
-        # *[name][name=~/^(?i)(Аптека|farmacia|pharmacy|pharmacie)$/][amenity=pharmacy]
-        # *[name][name=~/^(?i)(hydrant)$/][emergency=fire_hydrant]
-        # *[name][name=~/^(?i)(АГЗС|АЗС)$/][amenity=fuel]
+    # *[name][name=~/^(?i)(library|biblioteca|biblioteka|bibliothek|bibliotheek)$/][amenity=library]
+    # *[name][name=~/^(?i)(parc|park)$/][leisure=park]
+    # *[name][name=~/^(?i)(pond)$/][water=pond]
+    # *[name][name=~/^(?i)(church|église|biserica)$/][amenity=place_of_worship][religion=christian]
+    # *[name][name=~/^(?i)(mosque|cami|masjid|مسجد)$/][amenity=place_of_worship][religion=muslim]
+    # *[name][name=~/^(?i)(parking|parkplatz)$/][amenity=parking]
+    # *[name][name=~/^(?i)(post office)$/][amenity=post_office]
+    # *[name][name=~/^(?i)(restaurant)$/][amenity=restaurant]
+    # *[name][name=~/^(?i)(toilets?)$/][amenity=toilets]
+    # *[name][name=~/^(?i)(playground|spielplatz)$/][leisure=playground]
+    # *[name][name=~/^(?i)(shop|boutique)$/][shop][shop!=no]
+    # *[name][name=~/^(?i)(building|bangunan|bâtiment|batiment)$/][building][building!=no]
+    # *[name][name=~/^(?i)(house|maison|rumah|vivienda)$/][building=house]
+    # *[name][name=~/^(?i)(casa)$/][building=house][outside("FR")]
+    # *[name][name=~/^(?i)(kiosk)$/][shop=kiosk][outside("NL")]
+    # *[name][name=~/^(?i)(path)$/][highway=path]
+    # *[name][name=~/^(?i)(jalan)$/][highway]
+    # *[name][name=~/^(?i)(silo)$/][man_made=silo]
+    # *[name][name=~/^(?i)(cemetery|cementerio|cimetière|cmentarz|friedhof)$/][amenity=grave_yard]
+    # *[name][name=~/^(?i)(cemetery|cementerio|cimetière|cmentarz|friedhof)$/][landuse=cemetery]
+    # *[name][name=~/^(?i)(monument aux morts|war memorial)$/][historic=memorial][memorial=war_memorial]
+    # *[name][name=~/^(?i)(school|école|Школа)$/][amenity=school]
+    # *[name][name=~/^(?i)(école élémentaire)$/][amenity=school]["school:FR"="élémentaire"]
+    # *[name][name=~/^(?i)(école maternelle)$/][amenity=school]["school:FR"="maternelle"]
+    # *[name][name=~/^(?i)(école primaire)$/][amenity=school]["school:FR"="primaire"]
+    # *[name][name=~/^(?i)(collège)$/][amenity=school]["school:FR"="collège"]
+    # *[name][name=~/^(?i)(lycée)$/][amenity=school]["school:FR"="lycée"]
+    # *[name][name=~/^(?i)(Аптека|farmacia|pharmacy|pharmacie)$/][amenity=pharmacy]
+    # *[name][name=~/^(?i)(hydrant)$/][emergency=fire_hydrant]
+    # *[name][name=~/^(?i)(АГЗС|АЗС)$/][amenity=fuel]
+    def _relation_rule_4(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'name' in keys) or ('amenity' in keys and 'name' in keys and 'religion' in keys) or ('amenity' in keys and 'name' in keys and 'school:FR' in keys) or ('building' in keys and 'name' in keys) or ('emergency' in keys and 'name' in keys) or ('highway' in keys and 'name' in keys) or ('historic' in keys and 'memorial' in keys and 'name' in keys) or ('landuse' in keys and 'name' in keys) or ('leisure' in keys and 'name' in keys) or ('man_made' in keys and 'name' in keys) or ('name' in keys and 'shop' in keys) or ('name' in keys and 'water' in keys):
             match = False
             if not match:
@@ -1144,11 +1183,12 @@ class Josm_unnecessary(PluginMapCSS):
                     'name'])
                 }})
 
-        # *[name][name=~/^(?i)(chapel|chapelle|kapelle)$/][tag("building")=="chapel"||tag("amenity")=="place_of_worship"]
-        # *[name][name=~/^(?i)(silo)$/][man_made!=silo]
-        # *[name][name=~/^(?i)(school|école|Школа)$/][amenity!=school]
-        # *[name][name=~/^(?i)(house|rumah|vivienda)$/][building][building!=house][building!=no]
-        # *[name][name=~/^(?i)(casa)$/][building][building!=house][building!=no][outside("FR")]
+    # *[name][name=~/^(?i)(chapel|chapelle|kapelle)$/][tag("building")=="chapel"||tag("amenity")=="place_of_worship"]
+    # *[name][name=~/^(?i)(silo)$/][man_made!=silo]
+    # *[name][name=~/^(?i)(school|école|Школа)$/][amenity!=school]
+    # *[name][name=~/^(?i)(house|rumah|vivienda)$/][building][building!=house][building!=no]
+    # *[name][name=~/^(?i)(casa)$/][building][building!=house][building!=no][outside("FR")]
+    def _relation_rule_5(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'name' in keys) or ('name' in keys):
             match = False
             if not match:
@@ -1176,9 +1216,10 @@ class Josm_unnecessary(PluginMapCSS):
                 # throwWarning:tr("{0}","{0.tag}")
                 err.append({'class': 9010003, 'subclass': 2140357823, 'text': mapcss.tr('{0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # *[/^gpx:/]
-        # *[/^gpxx:/]
-        # *[/^gpxd:/]
+    # *[/^gpx:/]
+    # *[/^gpxx:/]
+    # *[/^gpxd:/]
+    def _relation_rule_6(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -1202,6 +1243,22 @@ class Josm_unnecessary(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['access', 'bridge', 'building', 'elevation', 'layer']),
+        (_relation_rule_1, ['gnis:Class']),
+        (_relation_rule_2, ['emergency']),
+        (_relation_rule_3, ['payment:cash']),
+        (_relation_rule_4, ['amenity', 'building', 'emergency', 'highway', 'historic', 'landuse', 'leisure', 'man_made', 'name']),
+        (_relation_rule_5, ['building', 'name']),
+        (_relation_rule_6, None),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
@@ -63,13 +63,8 @@ class Josm_wikipedia(PluginMapCSS):
         self.re_79a96753 = re.compile(r'^wikipedia:[-a-z]{2,12}$')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # *[wikipedia][wikipedia!~/(?i)^[-a-z]{2,12}:/]
+    # *[wikipedia][wikipedia!~/(?i)^[-a-z]{2,12}:/]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -83,7 +78,8 @@ class Josm_wikipedia(PluginMapCSS):
                 # assertNoMatch:"node wikipedia=en:Foobar"
                 err.append({'class': 9011001, 'subclass': 1517450396, 'text': mapcss.tr('wikipedia tag has no language given, use \'\'wikipedia\'\'=\'\'language:page title\'\'')})
 
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}:/][wikipedia!~/^https?:\/\//][wikipedia!~/^(aa|ab|ace|ady|af|ak|als|alt|am|ami|an|ang|ar|arc|ary|arz|as|ast|atj|av|avk|awa|ay|az|azb|ba|ban|bar|bat-smg|bcl|be|be-tarask|be-x-old|bg|bh|bi|bjn|bm|bn|bo|bpy|br|bs|bug|bxr|ca|cbk-zam|cdo|ce|ceb|ch|cho|chr|chy|ckb|co|cr|crh|cs|csb|cu|cv|cy|da|dag|de|din|diq|dsb|dty|dv|dz|ee|el|eml|en|eo|es|et|eu|ext|fa|ff|fi|fiu-vro|fj|fo|fr|frp|frr|fur|fy|ga|gag|gan|gcr|gd|gl|glk|gn|gom|gor|got|gu|guw|gv|ha|hak|haw|he|hi|hif|ho|hr|hsb|ht|hu|hy|hyw|hz|ia|id|ie|ig|ii|ik|ilo|inh|io|is|it|iu|ja|jam|jbo|jv|ka|kaa|kab|kbd|kbp|kcg|kg|ki|kj|kk|kl|km|kn|ko|koi|kr|krc|ks|ksh|ku|kv|kw|ky|la|lad|lb|lbe|lez|lfn|lg|li|lij|lld|lmo|ln|lo|lrc|lt|ltg|lv|mad|mai|map-bms|mdf|mg|mh|mhr|mi|min|mk|ml|mn|mni|mnw|mo|mr|mrj|ms|mt|mus|mwl|my|myv|mzn|na|nah|nap|nds|nds-nl|ne|new|ng|nia|nl|nn|no|nov|nqo|nrm|nso|nv|ny|oc|olo|om|or|os|pa|pag|pam|pap|pcd|pdc|pfl|pi|pih|pl|pms|pnb|pnt|ps|pt|pwn|qu|rm|rmy|rn|ro|roa-rup|roa-tara|ru|rue|rw|sa|sah|sat|sc|scn|sco|sd|se|sg|sh|shi|shn|shy|si|simple|sk|skr|sl|sm|smn|sn|so|sq|sr|srn|ss|st|stq|su|sv|sw|szl|szy|ta|tay|tcy|te|tet|tg|th|ti|tk|tl|tn|to|tpi|tr|trv|ts|tt|tum|tw|ty|tyv|udm|ug|uk|ur|uz|ve|vec|vep|vi|vls|vo|wa|war|wo|wuu|xal|xh|xmf|yi|yo|yue|za|zea|zh|zh-classical|zh-min-nan|zh-yue|zu):/]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}:/][wikipedia!~/^https?:\/\//][wikipedia!~/^(aa|ab|ace|ady|af|ak|als|alt|am|ami|an|ang|ar|arc|ary|arz|as|ast|atj|av|avk|awa|ay|az|azb|ba|ban|bar|bat-smg|bcl|be|be-tarask|be-x-old|bg|bh|bi|bjn|bm|bn|bo|bpy|br|bs|bug|bxr|ca|cbk-zam|cdo|ce|ceb|ch|cho|chr|chy|ckb|co|cr|crh|cs|csb|cu|cv|cy|da|dag|de|din|diq|dsb|dty|dv|dz|ee|el|eml|en|eo|es|et|eu|ext|fa|ff|fi|fiu-vro|fj|fo|fr|frp|frr|fur|fy|ga|gag|gan|gcr|gd|gl|glk|gn|gom|gor|got|gu|guw|gv|ha|hak|haw|he|hi|hif|ho|hr|hsb|ht|hu|hy|hyw|hz|ia|id|ie|ig|ii|ik|ilo|inh|io|is|it|iu|ja|jam|jbo|jv|ka|kaa|kab|kbd|kbp|kcg|kg|ki|kj|kk|kl|km|kn|ko|koi|kr|krc|ks|ksh|ku|kv|kw|ky|la|lad|lb|lbe|lez|lfn|lg|li|lij|lld|lmo|ln|lo|lrc|lt|ltg|lv|mad|mai|map-bms|mdf|mg|mh|mhr|mi|min|mk|ml|mn|mni|mnw|mo|mr|mrj|ms|mt|mus|mwl|my|myv|mzn|na|nah|nap|nds|nds-nl|ne|new|ng|nia|nl|nn|no|nov|nqo|nrm|nso|nv|ny|oc|olo|om|or|os|pa|pag|pam|pap|pcd|pdc|pfl|pi|pih|pl|pms|pnb|pnt|ps|pt|pwn|qu|rm|rmy|rn|ro|roa-rup|roa-tara|ru|rue|rw|sa|sah|sat|sc|scn|sco|sd|se|sg|sh|shi|shn|shy|si|simple|sk|skr|sl|sm|smn|sn|so|sq|sr|srn|ss|st|stq|su|sv|sw|szl|szy|ta|tay|tcy|te|tet|tg|th|ti|tk|tl|tn|to|tpi|tr|trv|ts|tt|tum|tw|ty|tyv|udm|ug|uk|ur|uz|ve|vec|vep|vi|vls|vo|wa|war|wo|wuu|xal|xh|xmf|yi|yo|yue|za|zea|zh|zh-classical|zh-min-nan|zh-yue|zu):/]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -96,8 +92,9 @@ class Josm_wikipedia(PluginMapCSS):
                 # assertNoMatch:"node wikipedia=en:Foobar"
                 err.append({'class': 9011002, 'subclass': 1826918481, 'text': mapcss.tr('wikipedia tag has an unknown language prefix')})
 
-        # *[wikipedia=~/^https?:\/\//]
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}:https?:\/\//]
+    # *[wikipedia=~/^https?:\/\//]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}:https?:\/\//]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -116,7 +113,8 @@ class Josm_wikipedia(PluginMapCSS):
                 # assertMatch:"node wikipedia=http://en.wikipedia.org/wiki/OpenStreetMap"
                 err.append({'class': 9011003, 'subclass': 75691825, 'text': mapcss.tr('wikipedia tag format is deprecated')})
 
-        # *[wikipedia=~/^be-x-old:/]
+    # *[wikipedia=~/^be-x-old:/]
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -133,7 +131,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=be-tarask:', mapcss.get(mapcss.regexp_match(self.re_6a4abd53, mapcss.tag(tags, 'wikipedia')), 1))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/^cz:/]
+    # *[wikipedia=~/^cz:/]
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -150,7 +149,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=cs:', mapcss.get(mapcss.regexp_match(self.re_577ca7fb, mapcss.tag(tags, 'wikipedia')), 1))).split('=', 1)])
                 }})
 
-        # *[wikimedia_commons=~/%[0-9A-F][0-9A-F]/]
+    # *[wikimedia_commons=~/%[0-9A-F][0-9A-F]/]
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('wikimedia_commons' in keys):
             match = False
             if not match:
@@ -167,7 +167,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikimedia_commons=', mapcss.trim(mapcss.replace(mapcss.URL_decode(mapcss.tag(tags, 'wikimedia_commons')), '_', ' ')))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}:.*%[0-9A-F][0-9A-F]/]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}:.*%[0-9A-F][0-9A-F]/]
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -184,7 +185,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_676bdf5d, mapcss.tag(tags, 'wikipedia')), 1), mapcss.trim(mapcss.replace(mapcss.URL_decode(mapcss.get(mapcss.regexp_match(self.re_1559839b, mapcss.tag(tags, 'wikipedia')), 2)), '_', ' ')))).split('=', 1)])
                 }})
 
-        # *[/^wikipedia:[-a-z]{2,12}$/][/^wikipedia:[-a-z]{2,12}$/=~/(?i).*%[0-9A-F][0-9A-F]/]
+    # *[/^wikipedia:[-a-z]{2,12}$/][/^wikipedia:[-a-z]{2,12}$/=~/(?i).*%[0-9A-F][0-9A-F]/]
+    def _node_rule_7(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -201,7 +203,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}'), '=', mapcss.get(mapcss.regexp_match(self.re_09a81144, mapcss.tag(tags, mapcss._tag_uncapture(capture_tags, '{0.key}'))), 1), mapcss.trim(mapcss.replace(mapcss.URL_decode(mapcss.get(mapcss.println(mapcss.regexp_match(self.re_644be9e0, mapcss.tag(tags, mapcss._tag_uncapture(capture_tags, '{0.key}')))), 2)), '_', ' ')))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}: /]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}: /]
+    def _node_rule_8(self, data, tags, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -218,7 +221,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_676bdf5d, mapcss.tag(tags, 'wikipedia')), 1), mapcss.trim(mapcss.get(mapcss.regexp_match(self.re_676bdf5d, mapcss.tag(tags, 'wikipedia')), 2)))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}:wiki\//]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}:wiki\//]
+    def _node_rule_9(self, data, tags, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -235,7 +239,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_2a71e33b, mapcss.tag(tags, 'wikipedia')), 1), mapcss.trim(mapcss.get(mapcss.regexp_match(self.re_2a71e33b, mapcss.tag(tags, 'wikipedia')), 2)))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/^[-a-zA-Z]{2,12}:(?!\p{sc=Georgian})\p{Ll}/][wikipedia!~/^jbo:/][wikipedia!~/(?i)^[-a-z]{2,12}:https?:/]
+    # *[wikipedia=~/^[-a-zA-Z]{2,12}:(?!\p{sc=Georgian})\p{Ll}/][wikipedia!~/^jbo:/][wikipedia!~/(?i)^[-a-z]{2,12}:https?:/]
+    def _node_rule_10(self, data, tags, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -254,7 +259,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_6a7e1973, mapcss.tag(tags, 'wikipedia')), 1), mapcss.upper(mapcss.get(mapcss.regexp_match(self.re_6a7e1973, mapcss.tag(tags, 'wikipedia')), 2)), mapcss.get(mapcss.regexp_match(self.re_6a7e1973, mapcss.tag(tags, 'wikipedia')), 3))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}:.*_/][wikipedia!~/(?i)^[-a-z]{2,12}:https?:/]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}:.*_/][wikipedia!~/(?i)^[-a-z]{2,12}:https?:/]
+    def _node_rule_11(self, data, tags, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -271,29 +277,30 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_1559839b, mapcss.tag(tags, 'wikipedia')), 1), mapcss.trim(mapcss.replace(mapcss.get(mapcss.regexp_match(self.re_1559839b, mapcss.tag(tags, 'wikipedia')), 2), '_', ' ')))).split('=', 1)])
                 }})
 
-        # *[wikipedia^="da:da:"]
-        # *[wikipedia^="da:dk:"]
-        # *[wikipedia^="de:de:"]
-        # *[wikipedia^="dk:dk:"]
-        # *[wikipedia^="en:de:"]
-        # *[wikipedia^="en:en:"]
-        # *[wikipedia^="en:es:"]
-        # *[wikipedia^="en:eu:"]
-        # *[wikipedia^="en:fr:"]
-        # *[wikipedia^="en:ja:"]
-        # *[wikipedia^="en:pl:"]
-        # *[wikipedia^="en:pt:"]
-        # *[wikipedia^="en:zh:"]
-        # *[wikipedia^="es:es:"]
-        # *[wikipedia^="eu:eu:"]
-        # *[wikipedia^="fr:fr:"]
-        # *[wikipedia^="ja:ja:"]
-        # *[wikipedia^="pl:en:"]
-        # *[wikipedia^="pl:pl:"]
-        # *[wikipedia^="pt:pt:"]
-        # *[wikipedia^="ru:fr:"]
-        # *[wikipedia^="ru:ru:"]
-        # *[wikipedia^="zh:zh:"]
+    # *[wikipedia^="da:da:"]
+    # *[wikipedia^="da:dk:"]
+    # *[wikipedia^="de:de:"]
+    # *[wikipedia^="dk:dk:"]
+    # *[wikipedia^="en:de:"]
+    # *[wikipedia^="en:en:"]
+    # *[wikipedia^="en:es:"]
+    # *[wikipedia^="en:eu:"]
+    # *[wikipedia^="en:fr:"]
+    # *[wikipedia^="en:ja:"]
+    # *[wikipedia^="en:pl:"]
+    # *[wikipedia^="en:pt:"]
+    # *[wikipedia^="en:zh:"]
+    # *[wikipedia^="es:es:"]
+    # *[wikipedia^="eu:eu:"]
+    # *[wikipedia^="fr:fr:"]
+    # *[wikipedia^="ja:ja:"]
+    # *[wikipedia^="pl:en:"]
+    # *[wikipedia^="pl:pl:"]
+    # *[wikipedia^="pt:pt:"]
+    # *[wikipedia^="ru:fr:"]
+    # *[wikipedia^="ru:ru:"]
+    # *[wikipedia^="zh:zh:"]
+    def _node_rule_12(self, data, tags, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -399,7 +406,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_62d51e93, mapcss.tag(tags, 'wikipedia')), 2), mapcss.trim(mapcss.get(mapcss.regexp_match(self.re_62d51e93, mapcss.tag(tags, 'wikipedia')), 3)))).split('=', 1)])
                 }})
 
-        # *[wikidata][wikidata!~/^Q[1-9][0-9]{0,8}$/]
+    # *[wikidata][wikidata!~/^Q[1-9][0-9]{0,8}$/]
+    def _node_rule_13(self, data, tags, keys, err, sets):
         if ('wikidata' in keys):
             match = False
             if not match:
@@ -416,7 +424,8 @@ class Josm_wikipedia(PluginMapCSS):
                 # assertMatch:"node wikidata=a"
                 err.append({'class': 9011012, 'subclass': 1398622919, 'text': mapcss.tr('wikidata tag must be in Qnnnn format, where n is a digit')})
 
-        # *[wikipedia][wikipedia=~/^[-a-zA-Z]{2,12}:Q[1-9][0-9]{0,8}$/]
+    # *[wikipedia][wikipedia=~/^[-a-zA-Z]{2,12}:Q[1-9][0-9]{0,8}$/]
+    def _node_rule_14(self, data, tags, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -437,7 +446,8 @@ class Josm_wikipedia(PluginMapCSS):
                 # assertMatch:"node wikipedia=en-GB:Q123"
                 err.append({'class': 9011016, 'subclass': 346570414, 'text': mapcss.tr('{0} value looks like a {1} value', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'wikidata')})
 
-        # *[!wikipedia][/^wikipedia:/]
+    # *[!wikipedia][/^wikipedia:/]
+    def _node_rule_15(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -451,15 +461,35 @@ class Josm_wikipedia(PluginMapCSS):
                 # assertNoMatch:"node wikipedia=a wikipedia:en=b"
                 err.append({'class': 9011015, 'subclass': 153018468, 'text': mapcss.tr('\'\'{0}\'\' tag is set, but no \'\'{1}\'\' tag. Make sure to set \'\'wikipedia=language:value\'\' for the main article and optional \'\'wikipedia:language=value\'\' only for additional articles that are not just other language variants of the main article.', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['wikipedia']),
+        (_node_rule_1, ['wikipedia']),
+        (_node_rule_2, ['wikipedia']),
+        (_node_rule_3, ['wikipedia']),
+        (_node_rule_4, ['wikipedia']),
+        (_node_rule_5, ['wikimedia_commons']),
+        (_node_rule_6, ['wikipedia']),
+        (_node_rule_7, None),
+        (_node_rule_8, ['wikipedia']),
+        (_node_rule_9, ['wikipedia']),
+        (_node_rule_10, ['wikipedia']),
+        (_node_rule_11, ['wikipedia']),
+        (_node_rule_12, ['wikipedia']),
+        (_node_rule_13, ['wikidata']),
+        (_node_rule_14, ['wikipedia']),
+        (_node_rule_15, None),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # *[wikipedia][wikipedia!~/(?i)^[-a-z]{2,12}:/]
+    # *[wikipedia][wikipedia!~/(?i)^[-a-z]{2,12}:/]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -470,7 +500,8 @@ class Josm_wikipedia(PluginMapCSS):
                 # throwError:tr("wikipedia tag has no language given, use ''wikipedia''=''language:page title''")
                 err.append({'class': 9011001, 'subclass': 1517450396, 'text': mapcss.tr('wikipedia tag has no language given, use \'\'wikipedia\'\'=\'\'language:page title\'\'')})
 
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}:/][wikipedia!~/^https?:\/\//][wikipedia!~/^(aa|ab|ace|ady|af|ak|als|alt|am|ami|an|ang|ar|arc|ary|arz|as|ast|atj|av|avk|awa|ay|az|azb|ba|ban|bar|bat-smg|bcl|be|be-tarask|be-x-old|bg|bh|bi|bjn|bm|bn|bo|bpy|br|bs|bug|bxr|ca|cbk-zam|cdo|ce|ceb|ch|cho|chr|chy|ckb|co|cr|crh|cs|csb|cu|cv|cy|da|dag|de|din|diq|dsb|dty|dv|dz|ee|el|eml|en|eo|es|et|eu|ext|fa|ff|fi|fiu-vro|fj|fo|fr|frp|frr|fur|fy|ga|gag|gan|gcr|gd|gl|glk|gn|gom|gor|got|gu|guw|gv|ha|hak|haw|he|hi|hif|ho|hr|hsb|ht|hu|hy|hyw|hz|ia|id|ie|ig|ii|ik|ilo|inh|io|is|it|iu|ja|jam|jbo|jv|ka|kaa|kab|kbd|kbp|kcg|kg|ki|kj|kk|kl|km|kn|ko|koi|kr|krc|ks|ksh|ku|kv|kw|ky|la|lad|lb|lbe|lez|lfn|lg|li|lij|lld|lmo|ln|lo|lrc|lt|ltg|lv|mad|mai|map-bms|mdf|mg|mh|mhr|mi|min|mk|ml|mn|mni|mnw|mo|mr|mrj|ms|mt|mus|mwl|my|myv|mzn|na|nah|nap|nds|nds-nl|ne|new|ng|nia|nl|nn|no|nov|nqo|nrm|nso|nv|ny|oc|olo|om|or|os|pa|pag|pam|pap|pcd|pdc|pfl|pi|pih|pl|pms|pnb|pnt|ps|pt|pwn|qu|rm|rmy|rn|ro|roa-rup|roa-tara|ru|rue|rw|sa|sah|sat|sc|scn|sco|sd|se|sg|sh|shi|shn|shy|si|simple|sk|skr|sl|sm|smn|sn|so|sq|sr|srn|ss|st|stq|su|sv|sw|szl|szy|ta|tay|tcy|te|tet|tg|th|ti|tk|tl|tn|to|tpi|tr|trv|ts|tt|tum|tw|ty|tyv|udm|ug|uk|ur|uz|ve|vec|vep|vi|vls|vo|wa|war|wo|wuu|xal|xh|xmf|yi|yo|yue|za|zea|zh|zh-classical|zh-min-nan|zh-yue|zu):/]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}:/][wikipedia!~/^https?:\/\//][wikipedia!~/^(aa|ab|ace|ady|af|ak|als|alt|am|ami|an|ang|ar|arc|ary|arz|as|ast|atj|av|avk|awa|ay|az|azb|ba|ban|bar|bat-smg|bcl|be|be-tarask|be-x-old|bg|bh|bi|bjn|bm|bn|bo|bpy|br|bs|bug|bxr|ca|cbk-zam|cdo|ce|ceb|ch|cho|chr|chy|ckb|co|cr|crh|cs|csb|cu|cv|cy|da|dag|de|din|diq|dsb|dty|dv|dz|ee|el|eml|en|eo|es|et|eu|ext|fa|ff|fi|fiu-vro|fj|fo|fr|frp|frr|fur|fy|ga|gag|gan|gcr|gd|gl|glk|gn|gom|gor|got|gu|guw|gv|ha|hak|haw|he|hi|hif|ho|hr|hsb|ht|hu|hy|hyw|hz|ia|id|ie|ig|ii|ik|ilo|inh|io|is|it|iu|ja|jam|jbo|jv|ka|kaa|kab|kbd|kbp|kcg|kg|ki|kj|kk|kl|km|kn|ko|koi|kr|krc|ks|ksh|ku|kv|kw|ky|la|lad|lb|lbe|lez|lfn|lg|li|lij|lld|lmo|ln|lo|lrc|lt|ltg|lv|mad|mai|map-bms|mdf|mg|mh|mhr|mi|min|mk|ml|mn|mni|mnw|mo|mr|mrj|ms|mt|mus|mwl|my|myv|mzn|na|nah|nap|nds|nds-nl|ne|new|ng|nia|nl|nn|no|nov|nqo|nrm|nso|nv|ny|oc|olo|om|or|os|pa|pag|pam|pap|pcd|pdc|pfl|pi|pih|pl|pms|pnb|pnt|ps|pt|pwn|qu|rm|rmy|rn|ro|roa-rup|roa-tara|ru|rue|rw|sa|sah|sat|sc|scn|sco|sd|se|sg|sh|shi|shn|shy|si|simple|sk|skr|sl|sm|smn|sn|so|sq|sr|srn|ss|st|stq|su|sv|sw|szl|szy|ta|tay|tcy|te|tet|tg|th|ti|tk|tl|tn|to|tpi|tr|trv|ts|tt|tum|tw|ty|tyv|udm|ug|uk|ur|uz|ve|vec|vep|vi|vls|vo|wa|war|wo|wuu|xal|xh|xmf|yi|yo|yue|za|zea|zh|zh-classical|zh-min-nan|zh-yue|zu):/]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -481,8 +512,9 @@ class Josm_wikipedia(PluginMapCSS):
                 # throwWarning:tr("wikipedia tag has an unknown language prefix")
                 err.append({'class': 9011002, 'subclass': 1826918481, 'text': mapcss.tr('wikipedia tag has an unknown language prefix')})
 
-        # *[wikipedia=~/^https?:\/\//]
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}:https?:\/\//]
+    # *[wikipedia=~/^https?:\/\//]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}:https?:\/\//]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -499,7 +531,8 @@ class Josm_wikipedia(PluginMapCSS):
                 # throwWarning:tr("wikipedia tag format is deprecated")
                 err.append({'class': 9011003, 'subclass': 75691825, 'text': mapcss.tr('wikipedia tag format is deprecated')})
 
-        # *[wikipedia=~/^be-x-old:/]
+    # *[wikipedia=~/^be-x-old:/]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -514,7 +547,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=be-tarask:', mapcss.get(mapcss.regexp_match(self.re_6a4abd53, mapcss.tag(tags, 'wikipedia')), 1))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/^cz:/]
+    # *[wikipedia=~/^cz:/]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -529,7 +563,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=cs:', mapcss.get(mapcss.regexp_match(self.re_577ca7fb, mapcss.tag(tags, 'wikipedia')), 1))).split('=', 1)])
                 }})
 
-        # *[wikimedia_commons=~/%[0-9A-F][0-9A-F]/]
+    # *[wikimedia_commons=~/%[0-9A-F][0-9A-F]/]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('wikimedia_commons' in keys):
             match = False
             if not match:
@@ -544,7 +579,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikimedia_commons=', mapcss.trim(mapcss.replace(mapcss.URL_decode(mapcss.tag(tags, 'wikimedia_commons')), '_', ' ')))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}:.*%[0-9A-F][0-9A-F]/]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}:.*%[0-9A-F][0-9A-F]/]
+    def _way_rule_6(self, data, tags, nds, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -559,7 +595,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_676bdf5d, mapcss.tag(tags, 'wikipedia')), 1), mapcss.trim(mapcss.replace(mapcss.URL_decode(mapcss.get(mapcss.regexp_match(self.re_1559839b, mapcss.tag(tags, 'wikipedia')), 2)), '_', ' ')))).split('=', 1)])
                 }})
 
-        # *[/^wikipedia:[-a-z]{2,12}$/][/^wikipedia:[-a-z]{2,12}$/=~/(?i).*%[0-9A-F][0-9A-F]/]
+    # *[/^wikipedia:[-a-z]{2,12}$/][/^wikipedia:[-a-z]{2,12}$/=~/(?i).*%[0-9A-F][0-9A-F]/]
+    def _way_rule_7(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -574,7 +611,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}'), '=', mapcss.get(mapcss.regexp_match(self.re_09a81144, mapcss.tag(tags, mapcss._tag_uncapture(capture_tags, '{0.key}'))), 1), mapcss.trim(mapcss.replace(mapcss.URL_decode(mapcss.get(mapcss.println(mapcss.regexp_match(self.re_644be9e0, mapcss.tag(tags, mapcss._tag_uncapture(capture_tags, '{0.key}')))), 2)), '_', ' ')))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}: /]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}: /]
+    def _way_rule_8(self, data, tags, nds, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -589,7 +627,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_676bdf5d, mapcss.tag(tags, 'wikipedia')), 1), mapcss.trim(mapcss.get(mapcss.regexp_match(self.re_676bdf5d, mapcss.tag(tags, 'wikipedia')), 2)))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}:wiki\//]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}:wiki\//]
+    def _way_rule_9(self, data, tags, nds, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -604,7 +643,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_2a71e33b, mapcss.tag(tags, 'wikipedia')), 1), mapcss.trim(mapcss.get(mapcss.regexp_match(self.re_2a71e33b, mapcss.tag(tags, 'wikipedia')), 2)))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/^[-a-zA-Z]{2,12}:(?!\p{sc=Georgian})\p{Ll}/][wikipedia!~/^jbo:/][wikipedia!~/(?i)^[-a-z]{2,12}:https?:/]
+    # *[wikipedia=~/^[-a-zA-Z]{2,12}:(?!\p{sc=Georgian})\p{Ll}/][wikipedia!~/^jbo:/][wikipedia!~/(?i)^[-a-z]{2,12}:https?:/]
+    def _way_rule_10(self, data, tags, nds, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -619,7 +659,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_6a7e1973, mapcss.tag(tags, 'wikipedia')), 1), mapcss.upper(mapcss.get(mapcss.regexp_match(self.re_6a7e1973, mapcss.tag(tags, 'wikipedia')), 2)), mapcss.get(mapcss.regexp_match(self.re_6a7e1973, mapcss.tag(tags, 'wikipedia')), 3))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}:.*_/][wikipedia!~/(?i)^[-a-z]{2,12}:https?:/]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}:.*_/][wikipedia!~/(?i)^[-a-z]{2,12}:https?:/]
+    def _way_rule_11(self, data, tags, nds, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -634,29 +675,30 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_1559839b, mapcss.tag(tags, 'wikipedia')), 1), mapcss.trim(mapcss.replace(mapcss.get(mapcss.regexp_match(self.re_1559839b, mapcss.tag(tags, 'wikipedia')), 2), '_', ' ')))).split('=', 1)])
                 }})
 
-        # *[wikipedia^="da:da:"]
-        # *[wikipedia^="da:dk:"]
-        # *[wikipedia^="de:de:"]
-        # *[wikipedia^="dk:dk:"]
-        # *[wikipedia^="en:de:"]
-        # *[wikipedia^="en:en:"]
-        # *[wikipedia^="en:es:"]
-        # *[wikipedia^="en:eu:"]
-        # *[wikipedia^="en:fr:"]
-        # *[wikipedia^="en:ja:"]
-        # *[wikipedia^="en:pl:"]
-        # *[wikipedia^="en:pt:"]
-        # *[wikipedia^="en:zh:"]
-        # *[wikipedia^="es:es:"]
-        # *[wikipedia^="eu:eu:"]
-        # *[wikipedia^="fr:fr:"]
-        # *[wikipedia^="ja:ja:"]
-        # *[wikipedia^="pl:en:"]
-        # *[wikipedia^="pl:pl:"]
-        # *[wikipedia^="pt:pt:"]
-        # *[wikipedia^="ru:fr:"]
-        # *[wikipedia^="ru:ru:"]
-        # *[wikipedia^="zh:zh:"]
+    # *[wikipedia^="da:da:"]
+    # *[wikipedia^="da:dk:"]
+    # *[wikipedia^="de:de:"]
+    # *[wikipedia^="dk:dk:"]
+    # *[wikipedia^="en:de:"]
+    # *[wikipedia^="en:en:"]
+    # *[wikipedia^="en:es:"]
+    # *[wikipedia^="en:eu:"]
+    # *[wikipedia^="en:fr:"]
+    # *[wikipedia^="en:ja:"]
+    # *[wikipedia^="en:pl:"]
+    # *[wikipedia^="en:pt:"]
+    # *[wikipedia^="en:zh:"]
+    # *[wikipedia^="es:es:"]
+    # *[wikipedia^="eu:eu:"]
+    # *[wikipedia^="fr:fr:"]
+    # *[wikipedia^="ja:ja:"]
+    # *[wikipedia^="pl:en:"]
+    # *[wikipedia^="pl:pl:"]
+    # *[wikipedia^="pt:pt:"]
+    # *[wikipedia^="ru:fr:"]
+    # *[wikipedia^="ru:ru:"]
+    # *[wikipedia^="zh:zh:"]
+    def _way_rule_12(self, data, tags, nds, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -759,7 +801,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_62d51e93, mapcss.tag(tags, 'wikipedia')), 2), mapcss.trim(mapcss.get(mapcss.regexp_match(self.re_62d51e93, mapcss.tag(tags, 'wikipedia')), 3)))).split('=', 1)])
                 }})
 
-        # *[wikidata][wikidata!~/^Q[1-9][0-9]{0,8}$/]
+    # *[wikidata][wikidata!~/^Q[1-9][0-9]{0,8}$/]
+    def _way_rule_13(self, data, tags, nds, keys, err, sets):
         if ('wikidata' in keys):
             match = False
             if not match:
@@ -770,7 +813,8 @@ class Josm_wikipedia(PluginMapCSS):
                 # throwError:tr("wikidata tag must be in Qnnnn format, where n is a digit")
                 err.append({'class': 9011012, 'subclass': 1398622919, 'text': mapcss.tr('wikidata tag must be in Qnnnn format, where n is a digit')})
 
-        # *[wikipedia][wikipedia=~/^[-a-zA-Z]{2,12}:Q[1-9][0-9]{0,8}$/]
+    # *[wikipedia][wikipedia=~/^[-a-zA-Z]{2,12}:Q[1-9][0-9]{0,8}$/]
+    def _way_rule_14(self, data, tags, nds, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -781,7 +825,8 @@ class Josm_wikipedia(PluginMapCSS):
                 # throwWarning:tr("{0} value looks like a {1} value","{0.key}","wikidata")
                 err.append({'class': 9011016, 'subclass': 346570414, 'text': mapcss.tr('{0} value looks like a {1} value', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'wikidata')})
 
-        # *[!wikipedia][/^wikipedia:/]
+    # *[!wikipedia][/^wikipedia:/]
+    def _way_rule_15(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -792,15 +837,35 @@ class Josm_wikipedia(PluginMapCSS):
                 # throwWarning:tr("''{0}'' tag is set, but no ''{1}'' tag. Make sure to set ''wikipedia=language:value'' for the main article and optional ''wikipedia:language=value'' only for additional articles that are not just other language variants of the main article.","{1.key}","{0.key}")
                 err.append({'class': 9011015, 'subclass': 153018468, 'text': mapcss.tr('\'\'{0}\'\' tag is set, but no \'\'{1}\'\' tag. Make sure to set \'\'wikipedia=language:value\'\' for the main article and optional \'\'wikipedia:language=value\'\' only for additional articles that are not just other language variants of the main article.', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['wikipedia']),
+        (_way_rule_1, ['wikipedia']),
+        (_way_rule_2, ['wikipedia']),
+        (_way_rule_3, ['wikipedia']),
+        (_way_rule_4, ['wikipedia']),
+        (_way_rule_5, ['wikimedia_commons']),
+        (_way_rule_6, ['wikipedia']),
+        (_way_rule_7, None),
+        (_way_rule_8, ['wikipedia']),
+        (_way_rule_9, ['wikipedia']),
+        (_way_rule_10, ['wikipedia']),
+        (_way_rule_11, ['wikipedia']),
+        (_way_rule_12, ['wikipedia']),
+        (_way_rule_13, ['wikidata']),
+        (_way_rule_14, ['wikipedia']),
+        (_way_rule_15, None),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # *[wikipedia][wikipedia!~/(?i)^[-a-z]{2,12}:/]
+    # *[wikipedia][wikipedia!~/(?i)^[-a-z]{2,12}:/]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -811,7 +876,8 @@ class Josm_wikipedia(PluginMapCSS):
                 # throwError:tr("wikipedia tag has no language given, use ''wikipedia''=''language:page title''")
                 err.append({'class': 9011001, 'subclass': 1517450396, 'text': mapcss.tr('wikipedia tag has no language given, use \'\'wikipedia\'\'=\'\'language:page title\'\'')})
 
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}:/][wikipedia!~/^https?:\/\//][wikipedia!~/^(aa|ab|ace|ady|af|ak|als|alt|am|ami|an|ang|ar|arc|ary|arz|as|ast|atj|av|avk|awa|ay|az|azb|ba|ban|bar|bat-smg|bcl|be|be-tarask|be-x-old|bg|bh|bi|bjn|bm|bn|bo|bpy|br|bs|bug|bxr|ca|cbk-zam|cdo|ce|ceb|ch|cho|chr|chy|ckb|co|cr|crh|cs|csb|cu|cv|cy|da|dag|de|din|diq|dsb|dty|dv|dz|ee|el|eml|en|eo|es|et|eu|ext|fa|ff|fi|fiu-vro|fj|fo|fr|frp|frr|fur|fy|ga|gag|gan|gcr|gd|gl|glk|gn|gom|gor|got|gu|guw|gv|ha|hak|haw|he|hi|hif|ho|hr|hsb|ht|hu|hy|hyw|hz|ia|id|ie|ig|ii|ik|ilo|inh|io|is|it|iu|ja|jam|jbo|jv|ka|kaa|kab|kbd|kbp|kcg|kg|ki|kj|kk|kl|km|kn|ko|koi|kr|krc|ks|ksh|ku|kv|kw|ky|la|lad|lb|lbe|lez|lfn|lg|li|lij|lld|lmo|ln|lo|lrc|lt|ltg|lv|mad|mai|map-bms|mdf|mg|mh|mhr|mi|min|mk|ml|mn|mni|mnw|mo|mr|mrj|ms|mt|mus|mwl|my|myv|mzn|na|nah|nap|nds|nds-nl|ne|new|ng|nia|nl|nn|no|nov|nqo|nrm|nso|nv|ny|oc|olo|om|or|os|pa|pag|pam|pap|pcd|pdc|pfl|pi|pih|pl|pms|pnb|pnt|ps|pt|pwn|qu|rm|rmy|rn|ro|roa-rup|roa-tara|ru|rue|rw|sa|sah|sat|sc|scn|sco|sd|se|sg|sh|shi|shn|shy|si|simple|sk|skr|sl|sm|smn|sn|so|sq|sr|srn|ss|st|stq|su|sv|sw|szl|szy|ta|tay|tcy|te|tet|tg|th|ti|tk|tl|tn|to|tpi|tr|trv|ts|tt|tum|tw|ty|tyv|udm|ug|uk|ur|uz|ve|vec|vep|vi|vls|vo|wa|war|wo|wuu|xal|xh|xmf|yi|yo|yue|za|zea|zh|zh-classical|zh-min-nan|zh-yue|zu):/]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}:/][wikipedia!~/^https?:\/\//][wikipedia!~/^(aa|ab|ace|ady|af|ak|als|alt|am|ami|an|ang|ar|arc|ary|arz|as|ast|atj|av|avk|awa|ay|az|azb|ba|ban|bar|bat-smg|bcl|be|be-tarask|be-x-old|bg|bh|bi|bjn|bm|bn|bo|bpy|br|bs|bug|bxr|ca|cbk-zam|cdo|ce|ceb|ch|cho|chr|chy|ckb|co|cr|crh|cs|csb|cu|cv|cy|da|dag|de|din|diq|dsb|dty|dv|dz|ee|el|eml|en|eo|es|et|eu|ext|fa|ff|fi|fiu-vro|fj|fo|fr|frp|frr|fur|fy|ga|gag|gan|gcr|gd|gl|glk|gn|gom|gor|got|gu|guw|gv|ha|hak|haw|he|hi|hif|ho|hr|hsb|ht|hu|hy|hyw|hz|ia|id|ie|ig|ii|ik|ilo|inh|io|is|it|iu|ja|jam|jbo|jv|ka|kaa|kab|kbd|kbp|kcg|kg|ki|kj|kk|kl|km|kn|ko|koi|kr|krc|ks|ksh|ku|kv|kw|ky|la|lad|lb|lbe|lez|lfn|lg|li|lij|lld|lmo|ln|lo|lrc|lt|ltg|lv|mad|mai|map-bms|mdf|mg|mh|mhr|mi|min|mk|ml|mn|mni|mnw|mo|mr|mrj|ms|mt|mus|mwl|my|myv|mzn|na|nah|nap|nds|nds-nl|ne|new|ng|nia|nl|nn|no|nov|nqo|nrm|nso|nv|ny|oc|olo|om|or|os|pa|pag|pam|pap|pcd|pdc|pfl|pi|pih|pl|pms|pnb|pnt|ps|pt|pwn|qu|rm|rmy|rn|ro|roa-rup|roa-tara|ru|rue|rw|sa|sah|sat|sc|scn|sco|sd|se|sg|sh|shi|shn|shy|si|simple|sk|skr|sl|sm|smn|sn|so|sq|sr|srn|ss|st|stq|su|sv|sw|szl|szy|ta|tay|tcy|te|tet|tg|th|ti|tk|tl|tn|to|tpi|tr|trv|ts|tt|tum|tw|ty|tyv|udm|ug|uk|ur|uz|ve|vec|vep|vi|vls|vo|wa|war|wo|wuu|xal|xh|xmf|yi|yo|yue|za|zea|zh|zh-classical|zh-min-nan|zh-yue|zu):/]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -822,8 +888,9 @@ class Josm_wikipedia(PluginMapCSS):
                 # throwWarning:tr("wikipedia tag has an unknown language prefix")
                 err.append({'class': 9011002, 'subclass': 1826918481, 'text': mapcss.tr('wikipedia tag has an unknown language prefix')})
 
-        # *[wikipedia=~/^https?:\/\//]
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}:https?:\/\//]
+    # *[wikipedia=~/^https?:\/\//]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}:https?:\/\//]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -840,7 +907,8 @@ class Josm_wikipedia(PluginMapCSS):
                 # throwWarning:tr("wikipedia tag format is deprecated")
                 err.append({'class': 9011003, 'subclass': 75691825, 'text': mapcss.tr('wikipedia tag format is deprecated')})
 
-        # *[wikipedia=~/^be-x-old:/]
+    # *[wikipedia=~/^be-x-old:/]
+    def _relation_rule_3(self, data, tags, members, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -855,7 +923,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=be-tarask:', mapcss.get(mapcss.regexp_match(self.re_6a4abd53, mapcss.tag(tags, 'wikipedia')), 1))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/^cz:/]
+    # *[wikipedia=~/^cz:/]
+    def _relation_rule_4(self, data, tags, members, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -870,7 +939,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=cs:', mapcss.get(mapcss.regexp_match(self.re_577ca7fb, mapcss.tag(tags, 'wikipedia')), 1))).split('=', 1)])
                 }})
 
-        # *[wikimedia_commons=~/%[0-9A-F][0-9A-F]/]
+    # *[wikimedia_commons=~/%[0-9A-F][0-9A-F]/]
+    def _relation_rule_5(self, data, tags, members, keys, err, sets):
         if ('wikimedia_commons' in keys):
             match = False
             if not match:
@@ -885,7 +955,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikimedia_commons=', mapcss.trim(mapcss.replace(mapcss.URL_decode(mapcss.tag(tags, 'wikimedia_commons')), '_', ' ')))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}:.*%[0-9A-F][0-9A-F]/]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}:.*%[0-9A-F][0-9A-F]/]
+    def _relation_rule_6(self, data, tags, members, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -900,7 +971,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_676bdf5d, mapcss.tag(tags, 'wikipedia')), 1), mapcss.trim(mapcss.replace(mapcss.URL_decode(mapcss.get(mapcss.regexp_match(self.re_1559839b, mapcss.tag(tags, 'wikipedia')), 2)), '_', ' ')))).split('=', 1)])
                 }})
 
-        # *[/^wikipedia:[-a-z]{2,12}$/][/^wikipedia:[-a-z]{2,12}$/=~/(?i).*%[0-9A-F][0-9A-F]/]
+    # *[/^wikipedia:[-a-z]{2,12}$/][/^wikipedia:[-a-z]{2,12}$/=~/(?i).*%[0-9A-F][0-9A-F]/]
+    def _relation_rule_7(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -915,7 +987,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}'), '=', mapcss.get(mapcss.regexp_match(self.re_09a81144, mapcss.tag(tags, mapcss._tag_uncapture(capture_tags, '{0.key}'))), 1), mapcss.trim(mapcss.replace(mapcss.URL_decode(mapcss.get(mapcss.println(mapcss.regexp_match(self.re_644be9e0, mapcss.tag(tags, mapcss._tag_uncapture(capture_tags, '{0.key}')))), 2)), '_', ' ')))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}: /]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}: /]
+    def _relation_rule_8(self, data, tags, members, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -930,7 +1003,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_676bdf5d, mapcss.tag(tags, 'wikipedia')), 1), mapcss.trim(mapcss.get(mapcss.regexp_match(self.re_676bdf5d, mapcss.tag(tags, 'wikipedia')), 2)))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}:wiki\//]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}:wiki\//]
+    def _relation_rule_9(self, data, tags, members, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -945,7 +1019,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_2a71e33b, mapcss.tag(tags, 'wikipedia')), 1), mapcss.trim(mapcss.get(mapcss.regexp_match(self.re_2a71e33b, mapcss.tag(tags, 'wikipedia')), 2)))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/^[-a-zA-Z]{2,12}:(?!\p{sc=Georgian})\p{Ll}/][wikipedia!~/^jbo:/][wikipedia!~/(?i)^[-a-z]{2,12}:https?:/]
+    # *[wikipedia=~/^[-a-zA-Z]{2,12}:(?!\p{sc=Georgian})\p{Ll}/][wikipedia!~/^jbo:/][wikipedia!~/(?i)^[-a-z]{2,12}:https?:/]
+    def _relation_rule_10(self, data, tags, members, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -960,7 +1035,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_6a7e1973, mapcss.tag(tags, 'wikipedia')), 1), mapcss.upper(mapcss.get(mapcss.regexp_match(self.re_6a7e1973, mapcss.tag(tags, 'wikipedia')), 2)), mapcss.get(mapcss.regexp_match(self.re_6a7e1973, mapcss.tag(tags, 'wikipedia')), 3))).split('=', 1)])
                 }})
 
-        # *[wikipedia=~/(?i)^[-a-z]{2,12}:.*_/][wikipedia!~/(?i)^[-a-z]{2,12}:https?:/]
+    # *[wikipedia=~/(?i)^[-a-z]{2,12}:.*_/][wikipedia!~/(?i)^[-a-z]{2,12}:https?:/]
+    def _relation_rule_11(self, data, tags, members, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -975,29 +1051,30 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_1559839b, mapcss.tag(tags, 'wikipedia')), 1), mapcss.trim(mapcss.replace(mapcss.get(mapcss.regexp_match(self.re_1559839b, mapcss.tag(tags, 'wikipedia')), 2), '_', ' ')))).split('=', 1)])
                 }})
 
-        # *[wikipedia^="da:da:"]
-        # *[wikipedia^="da:dk:"]
-        # *[wikipedia^="de:de:"]
-        # *[wikipedia^="dk:dk:"]
-        # *[wikipedia^="en:de:"]
-        # *[wikipedia^="en:en:"]
-        # *[wikipedia^="en:es:"]
-        # *[wikipedia^="en:eu:"]
-        # *[wikipedia^="en:fr:"]
-        # *[wikipedia^="en:ja:"]
-        # *[wikipedia^="en:pl:"]
-        # *[wikipedia^="en:pt:"]
-        # *[wikipedia^="en:zh:"]
-        # *[wikipedia^="es:es:"]
-        # *[wikipedia^="eu:eu:"]
-        # *[wikipedia^="fr:fr:"]
-        # *[wikipedia^="ja:ja:"]
-        # *[wikipedia^="pl:en:"]
-        # *[wikipedia^="pl:pl:"]
-        # *[wikipedia^="pt:pt:"]
-        # *[wikipedia^="ru:fr:"]
-        # *[wikipedia^="ru:ru:"]
-        # *[wikipedia^="zh:zh:"]
+    # *[wikipedia^="da:da:"]
+    # *[wikipedia^="da:dk:"]
+    # *[wikipedia^="de:de:"]
+    # *[wikipedia^="dk:dk:"]
+    # *[wikipedia^="en:de:"]
+    # *[wikipedia^="en:en:"]
+    # *[wikipedia^="en:es:"]
+    # *[wikipedia^="en:eu:"]
+    # *[wikipedia^="en:fr:"]
+    # *[wikipedia^="en:ja:"]
+    # *[wikipedia^="en:pl:"]
+    # *[wikipedia^="en:pt:"]
+    # *[wikipedia^="en:zh:"]
+    # *[wikipedia^="es:es:"]
+    # *[wikipedia^="eu:eu:"]
+    # *[wikipedia^="fr:fr:"]
+    # *[wikipedia^="ja:ja:"]
+    # *[wikipedia^="pl:en:"]
+    # *[wikipedia^="pl:pl:"]
+    # *[wikipedia^="pt:pt:"]
+    # *[wikipedia^="ru:fr:"]
+    # *[wikipedia^="ru:ru:"]
+    # *[wikipedia^="zh:zh:"]
+    def _relation_rule_12(self, data, tags, members, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -1100,7 +1177,8 @@ class Josm_wikipedia(PluginMapCSS):
                     (mapcss.concat('wikipedia=', mapcss.get(mapcss.regexp_match(self.re_62d51e93, mapcss.tag(tags, 'wikipedia')), 2), mapcss.trim(mapcss.get(mapcss.regexp_match(self.re_62d51e93, mapcss.tag(tags, 'wikipedia')), 3)))).split('=', 1)])
                 }})
 
-        # *[wikidata][wikidata!~/^Q[1-9][0-9]{0,8}$/]
+    # *[wikidata][wikidata!~/^Q[1-9][0-9]{0,8}$/]
+    def _relation_rule_13(self, data, tags, members, keys, err, sets):
         if ('wikidata' in keys):
             match = False
             if not match:
@@ -1111,7 +1189,8 @@ class Josm_wikipedia(PluginMapCSS):
                 # throwError:tr("wikidata tag must be in Qnnnn format, where n is a digit")
                 err.append({'class': 9011012, 'subclass': 1398622919, 'text': mapcss.tr('wikidata tag must be in Qnnnn format, where n is a digit')})
 
-        # *[wikipedia][wikipedia=~/^[-a-zA-Z]{2,12}:Q[1-9][0-9]{0,8}$/]
+    # *[wikipedia][wikipedia=~/^[-a-zA-Z]{2,12}:Q[1-9][0-9]{0,8}$/]
+    def _relation_rule_14(self, data, tags, members, keys, err, sets):
         if ('wikipedia' in keys):
             match = False
             if not match:
@@ -1122,7 +1201,8 @@ class Josm_wikipedia(PluginMapCSS):
                 # throwWarning:tr("{0} value looks like a {1} value","{0.key}","wikidata")
                 err.append({'class': 9011016, 'subclass': 346570414, 'text': mapcss.tr('{0} value looks like a {1} value', mapcss._tag_uncapture(capture_tags, '{0.key}'), 'wikidata')})
 
-        # *[!wikipedia][/^wikipedia:/]
+    # *[!wikipedia][/^wikipedia:/]
+    def _relation_rule_15(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -1133,6 +1213,31 @@ class Josm_wikipedia(PluginMapCSS):
                 # throwWarning:tr("''{0}'' tag is set, but no ''{1}'' tag. Make sure to set ''wikipedia=language:value'' for the main article and optional ''wikipedia:language=value'' only for additional articles that are not just other language variants of the main article.","{1.key}","{0.key}")
                 err.append({'class': 9011015, 'subclass': 153018468, 'text': mapcss.tr('\'\'{0}\'\' tag is set, but no \'\'{1}\'\' tag. Make sure to set \'\'wikipedia=language:value\'\' for the main article and optional \'\'wikipedia:language=value\'\' only for additional articles that are not just other language variants of the main article.', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['wikipedia']),
+        (_relation_rule_1, ['wikipedia']),
+        (_relation_rule_2, ['wikipedia']),
+        (_relation_rule_3, ['wikipedia']),
+        (_relation_rule_4, ['wikipedia']),
+        (_relation_rule_5, ['wikimedia_commons']),
+        (_relation_rule_6, ['wikipedia']),
+        (_relation_rule_7, None),
+        (_relation_rule_8, ['wikipedia']),
+        (_relation_rule_9, ['wikipedia']),
+        (_relation_rule_10, ['wikipedia']),
+        (_relation_rule_11, ['wikipedia']),
+        (_relation_rule_12, ['wikipedia']),
+        (_relation_rule_13, ['wikidata']),
+        (_relation_rule_14, ['wikipedia']),
+        (_relation_rule_15, None),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
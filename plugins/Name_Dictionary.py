@@ -27,6 +27,8 @@ import re
 
 class P_Name_Dictionary(Plugin):
 
+    interesting_keys = {'name', 'name_1', 'name_2', 'alt_name', 'loc_name', 'old_name', 'official_name', 'short_name', 'addr:street:name'}
+
     def init(self, logger):
         Plugin.init(self, logger)
         self.errors[703] = self.def_class(item = 5010, level = 2, tags = ['name', 'fix:chair'],
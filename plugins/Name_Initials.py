@@ -27,6 +27,8 @@ import re
 
 class Name_Initials(Plugin):
 
+    interesting_keys = {'name'}
+
     def init(self, logger):
         Plugin.init(self, logger)
         self.errors[902] = self.def_class(item = 5010, level = 3, tags = ['name', 'fix:chair'],
@@ -26,6 +26,9 @@ import re
 
 class Name_Local(Plugin):
 
+    interesting_keys = {'name'}
+    interesting_key_prefixes = ('name:', )
+
     not_for = ["JP", "US"]
 
     def init(self, logger):
@@ -23,13 +23,8 @@ class Name_MisspelledWordByRegex_Lang_fa(PluginMapCSS):
         self.re_5eeade1c = re.compile(r'ي')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # *[name=~/ي/][language("fa")]
+    # *[name=~/ي/][language("fa")]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -48,7 +43,8 @@ class Name_MisspelledWordByRegex_Lang_fa(PluginMapCSS):
                     (mapcss.concat('name=', mapcss.replace(mapcss.tag(tags, 'name'), 'ي', 'ی'))).split('=', 1)])
                 }})
 
-        # *[name:fa=~/ي/]
+    # *[name:fa=~/ي/]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('name:fa' in keys):
             match = False
             if not match:
@@ -66,7 +62,8 @@ class Name_MisspelledWordByRegex_Lang_fa(PluginMapCSS):
                     (mapcss.concat('name:fa=', mapcss.replace(mapcss.tag(tags, 'name:fa'), 'ي', 'ی'))).split('=', 1)])
                 }})
 
-        # *[name=~/ك/][language("fa")]
+    # *[name=~/ك/][language("fa")]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -85,7 +82,8 @@ class Name_MisspelledWordByRegex_Lang_fa(PluginMapCSS):
                     (mapcss.concat('name=', mapcss.replace(mapcss.tag(tags, 'name'), 'ك', 'ک'))).split('=', 1)])
                 }})
 
-        # *[name:fa=~/ك/]
+    # *[name:fa=~/ك/]
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('name:fa' in keys):
             match = False
             if not match:
@@ -103,15 +101,23 @@ class Name_MisspelledWordByRegex_Lang_fa(PluginMapCSS):
                     (mapcss.concat('name:fa=', mapcss.replace(mapcss.tag(tags, 'name:fa'), 'ك', 'ک'))).split('=', 1)])
                 }})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['name']),
+        (_node_rule_1, ['name:fa']),
+        (_node_rule_2, ['name']),
+        (_node_rule_3, ['name:fa']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # *[name=~/ي/][language("fa")]
+    # *[name=~/ي/][language("fa")]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -128,7 +134,8 @@ class Name_MisspelledWordByRegex_Lang_fa(PluginMapCSS):
                     (mapcss.concat('name=', mapcss.replace(mapcss.tag(tags, 'name'), 'ي', 'ی'))).split('=', 1)])
                 }})
 
-        # *[name:fa=~/ي/]
+    # *[name:fa=~/ي/]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('name:fa' in keys):
             match = False
             if not match:
@@ -145,7 +152,8 @@ class Name_MisspelledWordByRegex_Lang_fa(PluginMapCSS):
                     (mapcss.concat('name:fa=', mapcss.replace(mapcss.tag(tags, 'name:fa'), 'ي', 'ی'))).split('=', 1)])
                 }})
 
-        # *[name=~/ك/][language("fa")]
+    # *[name=~/ك/][language("fa")]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -162,7 +170,8 @@ class Name_MisspelledWordByRegex_Lang_fa(PluginMapCSS):
                     (mapcss.concat('name=', mapcss.replace(mapcss.tag(tags, 'name'), 'ك', 'ک'))).split('=', 1)])
                 }})
 
-        # *[name:fa=~/ك/]
+    # *[name:fa=~/ك/]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('name:fa' in keys):
             match = False
             if not match:
@@ -179,15 +188,23 @@ class Name_MisspelledWordByRegex_Lang_fa(PluginMapCSS):
                     (mapcss.concat('name:fa=', mapcss.replace(mapcss.tag(tags, 'name:fa'), 'ك', 'ک'))).split('=', 1)])
                 }})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['name']),
+        (_way_rule_1, ['name:fa']),
+        (_way_rule_2, ['name']),
+        (_way_rule_3, ['name:fa']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # *[name=~/ي/][language("fa")]
+    # *[name=~/ي/][language("fa")]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -204,7 +221,8 @@ class Name_MisspelledWordByRegex_Lang_fa(PluginMapCSS):
                     (mapcss.concat('name=', mapcss.replace(mapcss.tag(tags, 'name'), 'ي', 'ی'))).split('=', 1)])
                 }})
 
-        # *[name:fa=~/ي/]
+    # *[name:fa=~/ي/]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('name:fa' in keys):
             match = False
             if not match:
@@ -221,7 +239,8 @@ class Name_MisspelledWordByRegex_Lang_fa(PluginMapCSS):
                     (mapcss.concat('name:fa=', mapcss.replace(mapcss.tag(tags, 'name:fa'), 'ي', 'ی'))).split('=', 1)])
                 }})
 
-        # *[name=~/ك/][language("fa")]
+    # *[name=~/ك/][language("fa")]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('name' in keys):
             match = False
             if not match:
@@ -238,7 +257,8 @@ class Name_MisspelledWordByRegex_Lang_fa(PluginMapCSS):
                     (mapcss.concat('name=', mapcss.replace(mapcss.tag(tags, 'name'), 'ك', 'ک'))).split('=', 1)])
                 }})
 
-        # *[name:fa=~/ك/]
+    # *[name:fa=~/ك/]
+    def _relation_rule_3(self, data, tags, members, keys, err, sets):
         if ('name:fa' in keys):
             match = False
             if not match:
@@ -255,6 +275,19 @@ class Name_MisspelledWordByRegex_Lang_fa(PluginMapCSS):
                     (mapcss.concat('name:fa=', mapcss.replace(mapcss.tag(tags, 'name:fa'), 'ك', 'ک'))).split('=', 1)])
                 }})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['name']),
+        (_relation_rule_1, ['name:fa']),
+        (_relation_rule_2, ['name']),
+        (_relation_rule_3, ['name:fa']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
@@ -28,6 +28,9 @@ from modules.py3 import ilen
 
 class Name_Multilingual(Plugin):
 
+    interesting_keys = {'name'}
+    interesting_key_prefixes = ('name:', )
+
     def init(self, logger):
         Plugin.init(self, logger)
         language = self.father.config.options.get("language")
@@ -27,6 +27,8 @@ import re
 
 class P_Name_PoorlyWrittenWayType(Plugin):
 
+    interesting_keys = {'name'}
+
     def generator(self, p):
         (p1, p2) = p.split("|")
         r = u"^(("
@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 class Name_Quotation(Plugin):
 
+    interesting_keys = {'name'}
+
     def init(self, logger):
         Plugin.init(self, logger)
         self.errors[50704] = self.def_class(item = 5070, level = 2, tags = ['name', 'fix:chair'],
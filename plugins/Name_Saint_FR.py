@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 class Name_Saint_FR(Plugin):
 
+    interesting_keys = {'name'}
+
     only_for = ["FR", "NC"]
 
     def init(self, logger):
@@ -25,6 +25,8 @@ import regex as re
 
 class Name_ShouldBeHousenumber(Plugin):
 
+    interesting_keys = {'building'}
+
     def init(self, logger):
         Plugin.init(self, logger)
         self.errors[50101] = self.def_class(item = 5010, level = 2, tags = ['name', 'fix:chair'],
@@ -26,6 +26,8 @@ import re
 
 class Name_Spaces(Plugin):
 
+    interesting_keys = {'name'}
+
     def init(self, logger):
         Plugin.init(self, logger)
         self.errors[903] = self.def_class(item = 5010, level = 2, tags = ['name', 'fix:chair'],
@@ -26,6 +26,8 @@ from plugins.Plugin import Plugin
 
 class Name_Toponymy_FR(Plugin):
 
+    interesting_keys = {'name'}
+
     only_for = ["FR", "NC"]
     not_for = ["FR-PF"]
 
@@ -31,6 +31,8 @@ UpperCase_WhiteList = {
 
 class Name_UpperCase(Plugin):
 
+    interesting_keys = {'name'}
+
     not_for = ["CU", "JP"]
 
     def init(self, logger):
@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 class Name_UpperCaseNumber(Plugin):
 
+    interesting_keys = {'name'}
+
     only_for = ["fr", "ES", "it", "pt"] # languages fr, it, pt worldwide, Spanish (es) only for Iberian Spain (ES), hence country code
 
     def init(self, logger):
@@ -83,6 +83,7 @@ be used if the value is valid.''')
                 self.tag_number.extend(list(map(lambda t: (t[0] + v + i, t[1]), tag_number_directional)))
                 self.tag_number.extend(list(map(lambda t: (t[0] + v + i + ":conditional", t[1]), tag_number_directional)))
         self.tag_number.extend(list(map(lambda t: (t, None), self.tag_number_integer)))
+        self.interesting_keys = set(map(lambda t: t[0], self.tag_number))
 
         self.MaxspeedExtraValue = ["none", "default", "signals", "national", "no", "unposted", "walk", "urban", "variable"]
         self.MaxspeedClassValue = re.compile(u'^[A-Z]*:')
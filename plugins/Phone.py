@@ -28,6 +28,7 @@ import re
 class Phone(Plugin):
 
     PHONE_TAGS = set((u"contact:fax", u"contact:phone", u"fax", u"phone"))
+    interesting_keys = PHONE_TAGS
 
     def init(self, logger):
         Plugin.init(self, logger)
@@ -21,19 +21,14 @@ class Phone2(PluginMapCSS):
 
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # *[phone][contact:phone][replace(replace(tag("contact:phone"),"-","")," ","")!=replace(replace(tag("phone"),"-","")," ","")]
-        # *[fax][contact:fax][replace(replace(tag("contact:fax"),"-","")," ","")!=replace(replace(tag("fax"),"-","")," ","")]
-        # *[mobile][contact:mobile][replace(replace(tag("contact:mobile"),"-","")," ","")!=replace(replace(tag("mobile"),"-","")," ","")]
-        # *[instagram][contact:instagram][contact:instagram!=*instagram]
-        # *[facebook][contact:facebook][contact:facebook!=*facebook]
-        # *[email][contact:email][contact:email!=*email]
-        # *[website][contact:website][contact:website!=*website]
+    # *[phone][contact:phone][replace(replace(tag("contact:phone"),"-","")," ","")!=replace(replace(tag("phone"),"-","")," ","")]
+    # *[fax][contact:fax][replace(replace(tag("contact:fax"),"-","")," ","")!=replace(replace(tag("fax"),"-","")," ","")]
+    # *[mobile][contact:mobile][replace(replace(tag("contact:mobile"),"-","")," ","")!=replace(replace(tag("mobile"),"-","")," ","")]
+    # *[instagram][contact:instagram][contact:instagram!=*instagram]
+    # *[facebook][contact:facebook][contact:facebook!=*facebook]
+    # *[email][contact:email][contact:email!=*email]
+    # *[website][contact:website][contact:website!=*website]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('contact:email' in keys and 'email' in keys) or ('contact:facebook' in keys and 'facebook' in keys) or ('contact:fax' in keys and 'fax' in keys) or ('contact:instagram' in keys and 'instagram' in keys) or ('contact:mobile' in keys and 'mobile' in keys) or ('contact:phone' in keys and 'phone' in keys) or ('contact:website' in keys and 'website' in keys):
             match = False
             if not match:
@@ -73,21 +68,26 @@ class Phone2(PluginMapCSS):
                 # assertNoMatch:"node website=1 contact:website=1"
                 err.append({'class': 3097, 'subclass': 0, 'text': mapcss.tr('Different values of {0} and of {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['contact:email', 'contact:facebook', 'contact:fax', 'contact:instagram', 'contact:mobile', 'contact:phone', 'contact:website']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # *[phone][contact:phone][replace(replace(tag("contact:phone"),"-","")," ","")!=replace(replace(tag("phone"),"-","")," ","")]
-        # *[fax][contact:fax][replace(replace(tag("contact:fax"),"-","")," ","")!=replace(replace(tag("fax"),"-","")," ","")]
-        # *[mobile][contact:mobile][replace(replace(tag("contact:mobile"),"-","")," ","")!=replace(replace(tag("mobile"),"-","")," ","")]
-        # *[instagram][contact:instagram][contact:instagram!=*instagram]
-        # *[facebook][contact:facebook][contact:facebook!=*facebook]
-        # *[email][contact:email][contact:email!=*email]
-        # *[website][contact:website][contact:website!=*website]
+    # *[phone][contact:phone][replace(replace(tag("contact:phone"),"-","")," ","")!=replace(replace(tag("phone"),"-","")," ","")]
+    # *[fax][contact:fax][replace(replace(tag("contact:fax"),"-","")," ","")!=replace(replace(tag("fax"),"-","")," ","")]
+    # *[mobile][contact:mobile][replace(replace(tag("contact:mobile"),"-","")," ","")!=replace(replace(tag("mobile"),"-","")," ","")]
+    # *[instagram][contact:instagram][contact:instagram!=*instagram]
+    # *[facebook][contact:facebook][contact:facebook!=*facebook]
+    # *[email][contact:email][contact:email!=*email]
+    # *[website][contact:website][contact:website!=*website]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('contact:email' in keys and 'email' in keys) or ('contact:facebook' in keys and 'facebook' in keys) or ('contact:fax' in keys and 'fax' in keys) or ('contact:instagram' in keys and 'instagram' in keys) or ('contact:mobile' in keys and 'mobile' in keys) or ('contact:phone' in keys and 'phone' in keys) or ('contact:website' in keys and 'website' in keys):
             match = False
             if not match:
@@ -124,21 +124,26 @@ class Phone2(PluginMapCSS):
                 # throwWarning:tr("Different values of {0} and of {1}","{0.key}","{1.key}")
                 err.append({'class': 3097, 'subclass': 0, 'text': mapcss.tr('Different values of {0} and of {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['contact:email', 'contact:facebook', 'contact:fax', 'contact:instagram', 'contact:mobile', 'contact:phone', 'contact:website']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # *[phone][contact:phone][replace(replace(tag("contact:phone"),"-","")," ","")!=replace(replace(tag("phone"),"-","")," ","")]
-        # *[fax][contact:fax][replace(replace(tag("contact:fax"),"-","")," ","")!=replace(replace(tag("fax"),"-","")," ","")]
-        # *[mobile][contact:mobile][replace(replace(tag("contact:mobile"),"-","")," ","")!=replace(replace(tag("mobile"),"-","")," ","")]
-        # *[instagram][contact:instagram][contact:instagram!=*instagram]
-        # *[facebook][contact:facebook][contact:facebook!=*facebook]
-        # *[email][contact:email][contact:email!=*email]
-        # *[website][contact:website][contact:website!=*website]
+    # *[phone][contact:phone][replace(replace(tag("contact:phone"),"-","")," ","")!=replace(replace(tag("phone"),"-","")," ","")]
+    # *[fax][contact:fax][replace(replace(tag("contact:fax"),"-","")," ","")!=replace(replace(tag("fax"),"-","")," ","")]
+    # *[mobile][contact:mobile][replace(replace(tag("contact:mobile"),"-","")," ","")!=replace(replace(tag("mobile"),"-","")," ","")]
+    # *[instagram][contact:instagram][contact:instagram!=*instagram]
+    # *[facebook][contact:facebook][contact:facebook!=*facebook]
+    # *[email][contact:email][contact:email!=*email]
+    # *[website][contact:website][contact:website!=*website]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('contact:email' in keys and 'email' in keys) or ('contact:facebook' in keys and 'facebook' in keys) or ('contact:fax' in keys and 'fax' in keys) or ('contact:instagram' in keys and 'instagram' in keys) or ('contact:mobile' in keys and 'mobile' in keys) or ('contact:phone' in keys and 'phone' in keys) or ('contact:website' in keys and 'website' in keys):
             match = False
             if not match:
@@ -175,6 +180,16 @@ class Phone2(PluginMapCSS):
                 # throwWarning:tr("Different values of {0} and of {1}","{0.key}","{1.key}")
                 err.append({'class': 3097, 'subclass': 0, 'text': mapcss.tr('Different values of {0} and of {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['contact:email', 'contact:facebook', 'contact:fax', 'contact:instagram', 'contact:mobile', 'contact:phone', 'contact:website']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
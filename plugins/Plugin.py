@@ -23,12 +23,18 @@ from modules.Stablehash import stablehash
 from analysers.Analyser import Analyser
 
 import os
-from inspect import getframeinfo, stack
-from typing import Dict, List, Union
+import sys
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 
 class Plugin(object):
 
+    # Tag keys node(), way() and relation() need to report an issue. When set,
+    # the methods are only called on objects with one of the keys, or a key
+    # starting with one of the prefixes. By default, always called.
+    interesting_keys: Optional[Set[str]] = None
+    interesting_key_prefixes: Optional[Tuple[str, ...]] = None
+
     def __init__(self, father):
         self.father = father
 
@@ -94,11 +100,44 @@ class Plugin(object):
         """
         pass
 
+    def shard_state(self):
+        """
+        Called at the end of the analyse of a shard, in the worker process,
+        when the analyser runs with several workers.
+        @return: picklable state kept across objects, given to merge_shard_states().
+        """
+        return None
+
+    def merge_shard_states(self, states):
+        """
+        Called in the main process, before end(), with the shard_state() of
+        each worker, in data order.
+        @param states: list of states.
+        """
+        pass
+
+    def interestingKeys(self):
+        """
+        Get the tag keys and key prefixes the plugin is interested in, or None
+        when the plugin methods must be called on every object.
+        """
+        if self.interesting_keys is None and self.interesting_key_prefixes is None:
+            return None
+        return (set(self.interesting_keys or []), tuple(self.interesting_key_prefixes or ()))
+
+    def shardable(self):
+        """
+        Plugins keeping state across objects until end() can only run on
+        shards of the data if they merge the states of the workers.
+        """
+        currentClass = self.__class__
+        return currentClass.end == Plugin.end or currentClass.merge_shard_states != Plugin.merge_shard_states
+
     def def_class(self, **kwargs):
         if 'source' not in kwargs and self.father and self.father.config:
             config = self.father.config
-            caller = getframeinfo(stack()[1][0])
-            kwargs['source'] = '{0}/plugins/{1}#L{2}'.format(config and hasattr(config, 'source_url') and config.source_url or None, os.path.basename(caller.filename), caller.lineno)
+            caller = sys._getframe(1)
+            kwargs['source'] = '{0}/plugins/{1}#L{2}'.format(config and hasattr(config, 'source_url') and config.source_url or None, os.path.basename(caller.f_code.co_filename), caller.f_lineno)
 
         return Analyser.def_class_(self.father and self.father.config or None, **kwargs)
 
@@ -241,6 +280,9 @@ class Test(TestPluginCommon):
         self.assertEqual(a.way(None, None, None), None)
         self.assertEqual(a.relation(None, None, None), None)
         self.assertEqual(a.end(None), None)
+        self.assertEqual(a.shard_state(), None)
+        self.assertEqual(a.merge_shard_states([None, None]), None)
+        self.assertTrue(a.shardable())
         for n in [(u"bpoue", u"bpoue"),
                   (u"bpoué", u"bpoue"),
                   (u"bpoùé", u"bpoue"),
@@ -310,3 +352,27 @@ class Test(TestPluginCommon):
             pass
         a = Plugin_with_all(None)
         self.assertEqual(a.availableMethodes(), ["node", "way", "relation"])
+
+    def test_interestingKeys(self):
+        self.assertIsNone(Plugin(None).interestingKeys())
+
+        class Plugin_with_keys(Plugin):
+            interesting_keys = {"name"}
+        self.assertEqual(Plugin_with_keys(None).interestingKeys(), ({"name"}, ()))
+
+        class Plugin_with_prefixes(Plugin):
+            interesting_key_prefixes = ("name:", )
+        self.assertEqual(Plugin_with_prefixes(None).interestingKeys(), (set(), ("name:", )))
+
+    def test_shardable(self):
+        class Plugin_with_end(Plugin):
+            def end(self, logger):
+                pass # pragma: no cover
+        a = Plugin_with_end(None)
+        self.assertFalse(a.shardable())
+
+        class Plugin_with_merge(Plugin_with_end):
+            def merge_shard_states(self, states):
+                pass # pragma: no cover
+        a = Plugin_with_merge(None)
+        self.assertTrue(a.shardable())
@@ -22,12 +22,25 @@
 from plugins.Plugin import Plugin
 
 import os
-from inspect import getframeinfo, stack
+import sys
 
 
 class PluginMapCSS(Plugin):
     mapcss_lineno = None
 
+    def init(self, logger):
+        super().init(logger)
+
+        # Declare the keys of the generated rule indexes
+        keys = set()
+        for method in self.availableMethodes():
+            rules = getattr(self, '_' + method + '_rules', None)
+            rules_keys = rules.interesting_keys() if rules is not None else None
+            if rules_keys is None:
+                return
+            keys |= rules_keys
+        self.interesting_keys = keys
+
     def def_class(self, **kwargs):
         if 'source' not in kwargs:
             lineno = '#L{0}'.format(self.mapcss_lineno) if self.mapcss_lineno else ''
@@ -35,7 +48,7 @@ class PluginMapCSS(Plugin):
                 kwargs['source'] = '{0}{1}'.format(self.MAPCSS_URL, lineno)
             elif self.father and self.father.config:
                 config = self.father.config
-                caller = getframeinfo(stack()[1][0]).filename.replace('.py', '.validator.mapcss')
+                caller = sys._getframe(1).f_code.co_filename.replace('.py', '.validator.mapcss')
                 kwargs['source'] = '{0}/plugins/{1}{2}'.format(config and hasattr(config, 'source_url') and config.source_url or None, os.path.basename(caller), lineno)
 
         return super().def_class(**kwargs)
@@ -22,13 +22,8 @@ class Power(PluginMapCSS):
 
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # node[power=transformer][voltage]
+    # node[power=transformer][voltage]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('power' in keys and 'voltage' in keys):
             match = False
             if not match:
@@ -41,15 +36,20 @@ class Power(PluginMapCSS):
                 # throwWarning:tr("On Power Transformers use voltage:primary=* and voltage:secondary=* in place of voltage")
                 err.append({'class': 91002, 'subclass': 0, 'text': mapcss.tr('On Power Transformers use voltage:primary=* and voltage:secondary=* in place of voltage')})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['power']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # relation[power=transformer]
+    # relation[power=transformer]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('power' in keys):
             match = False
             if not match:
@@ -62,4 +62,14 @@ class Power(PluginMapCSS):
                 # throwWarning:tr("Power Transformers should always be on a node")
                 err.append({'class': 91001, 'subclass': 0, 'text': mapcss.tr('Power Transformers should always be on a node')})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['power']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
@@ -26,6 +26,8 @@ from plugins.Plugin import Plugin
 
 class Source(Plugin):
 
+    interesting_keys = {'source', 'ref'}
+
     not_for = ["HT"] # Google made drone imagery for after-earthquake in Haiti
 
     def init(self, logger):
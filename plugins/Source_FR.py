@@ -27,6 +27,8 @@ import re
 
 class Source_FR(Plugin):
 
+    interesting_keys = {'source', 'boundary'}
+
     only_for = ["FR"]
 
     def init(self, logger):
@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 class Structural_Multipolygon(Plugin):
 
+    interesting_keys = {'type'}
+
     def init(self, logger):
         Plugin.init(self, logger)
         self.errors[11701] = self.def_class(item = 1170, level = 2, tags = ['relation', 'multipolygon', 'fix:chair'],
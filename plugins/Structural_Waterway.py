@@ -24,6 +24,8 @@ from plugins.Plugin import Plugin
 
 class Structural_Waterway(Plugin):
 
+    interesting_keys = {'waterway'}
+
     def init(self, logger):
         Plugin.init(self, logger)
         self.errors[12200] = self.def_class(item = 1220, level = 2, tags = ['geom', 'waterway', 'fix:imagery'],
@@ -26,6 +26,8 @@ from plugins.modules.name_suggestion_index import download_nsi, nsi_rule_applies
 
 class TagFix_Brand(Plugin):
 
+    interesting_keys = {'name', 'operator'}
+
     def init(self, logger):
         Plugin.init(self, logger)
         self.errors[31301] = self.def_class(item=3130, level=3, tags=['brand'],
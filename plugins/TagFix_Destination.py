@@ -25,16 +25,11 @@ class TagFix_Destination(PluginMapCSS):
         self.re_60b51c01 = re.compile(r'^destination:.*:lanes')
 
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # way[highway][destination][destination*="|"]
-        # way[highway][/^destination:/][!/^destination:lanes/][!/^destination:.*:lanes/][/^destination:/=~/\|/]
-        # way[waterway][destination][destination*="|"]
-        # way[waterway][/^destination:/][!/^destination:lanes/][!/^destination:.*:lanes/][/^destination:/=~/\|/]
+    # way[highway][destination][destination*="|"]
+    # way[highway][/^destination:/][!/^destination:lanes/][!/^destination:.*:lanes/][/^destination:/=~/\|/]
+    # way[waterway][destination][destination*="|"]
+    # way[waterway][/^destination:/][!/^destination:lanes/][!/^destination:.*:lanes/][/^destination:/=~/\|/]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('destination' in keys and 'highway' in keys) or ('destination' in keys and 'waterway' in keys) or ('highway' in keys) or ('waterway' in keys):
             match = False
             if not match:
@@ -75,6 +70,16 @@ class TagFix_Destination(PluginMapCSS):
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{1.key}='), mapcss.replace(mapcss._tag_uncapture(capture_tags, '{1.value}'), '|', ';'))).split('=', 1)])
                 }})
 
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['destination', 'highway', 'waterway']),
+    ])
+
+    def way(self, data, tags, nds):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
         return err
 
 
@@ -26,6 +26,8 @@ from plugins.Plugin import Plugin
 
 class TagFix_Housenumber(Plugin):
 
+    interesting_keys = {'addr:housenumber', 'addr:interpolation', 'addr:inclusion'}
+
     not_for = ("RU", "BG")
 
     def init(self, logger):
@@ -27,6 +27,8 @@ from modules.Stablehash import stablehash64
 
 class TagFix_Maxspeed(Plugin):
 
+    interesting_key_prefixes = ('maxspeed', )
+
     maxspeed_table_default = {
         'urban': ['50'],
         'rural': ['90'],
@@ -24,6 +24,9 @@ from plugins.Plugin import Plugin
 
 
 class TagFix_Maxspeed_AT(Plugin):
+
+    interesting_keys = {'highway'}
+
     """
     Checks for Austrian highway maxspeed tagging.
     """
@@ -41,13 +41,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
         self.re_5955bda1 = re.compile(r'^(no|informal)$')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # *[building=roof][amenity][amenity!=shelter][parking!=rooftop]
+    # *[building=roof][amenity][amenity!=shelter][parking!=rooftop]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'building' in keys):
             match = False
             if not match:
@@ -59,7 +54,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}, usually {1} is located underneath the {2}. Tag the {3} as a separate object.","{0.tag}","{1.tag}","{0.value}","{1.key}")
                 err.append({'class': 30322, 'subclass': 0, 'text': mapcss.tr('{0} together with {1}, usually {1} is located underneath the {2}. Tag the {3} as a separate object.', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{0.value}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[highway=emergency_access_point][!ref]
+    # *[highway=emergency_access_point][!ref]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -72,7 +68,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("Missing tag ref for emergency access point")
                 err.append({'class': 20802, 'subclass': 1, 'text': mapcss.tr('Missing tag ref for emergency access point')})
 
-        # *[amenity=recycling][recycling_type!=centre][recycling:glass=yes][outside("CZ")]
+    # *[amenity=recycling][recycling_type!=centre][recycling:glass=yes][outside("CZ")]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'recycling:glass' in keys):
             match = False
             if not match:
@@ -96,7 +93,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                     'recycling:glass'])
                 }})
 
-        # *[amenity=recycling][recycling_type!=centre][name]
+    # *[amenity=recycling][recycling_type!=centre][name]
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -110,7 +108,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # assertMatch:"node amenity=recycling recycling_type=container name=\"My nice awesome container\""
                 err.append({'class': 32302, 'subclass': 0, 'text': mapcss.tr('Suspicious name for a container')})
 
-        # node[natural=tree][type][type!=palm]
+    # node[natural=tree][type][type!=palm]
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if ('natural' in keys and 'type' in keys):
             match = False
             if not match:
@@ -124,7 +123,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("The tag `{0}` is deprecated in favour of {1}","{1.key}","`leaf_type`")
                 err.append({'class': 40106, 'subclass': 0, 'text': mapcss.tr('The tag `{0}` is deprecated in favour of {1}', mapcss._tag_uncapture(capture_tags, '{1.key}'), '`leaf_type`')})
 
-        # *[bridge][tunnel][bridge!=no][tunnel!=no]
+    # *[bridge][tunnel][bridge!=no][tunnel!=no]
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('bridge' in keys and 'tunnel' in keys):
             match = False
             if not match:
@@ -140,7 +140,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("Conflict between tags: `{0}` and `{1}`","{0.tag}","{1.tag}")
                 err.append({'class': 40303, 'subclass': 0, 'text': mapcss.tr('Conflict between tags: `{0}` and `{1}`', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # node[highway=crossing][crossing][crossing=~/^(no|informal)$/]
+    # node[highway=crossing][crossing][crossing=~/^(no|informal)$/]
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if ('crossing' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -162,7 +163,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                     mapcss._tag_uncapture(capture_tags, '{0.key}')])
                 }})
 
-        # node[leisure=picnic_table][tourism=picnic_site]
+    # node[leisure=picnic_table][tourism=picnic_site]
+    def _node_rule_7(self, data, tags, keys, err, sets):
         if ('leisure' in keys and 'tourism' in keys):
             match = False
             if not match:
@@ -178,7 +180,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}. A picnic site rarely consists of only one single picnic table","{0.tag}","{1.tag}")
                 err.append({'class': 40303, 'subclass': 2, 'text': mapcss.tr('{0} together with {1}. A picnic site rarely consists of only one single picnic table', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[barrier=fence][material][!fence_type]
+    # *[barrier=fence][material][!fence_type]
+    def _node_rule_8(self, data, tags, keys, err, sets):
         if ('barrier' in keys and 'material' in keys):
             match = False
             if not match:
@@ -192,8 +195,9 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # assertMatch:"node barrier=fence material=wood"
                 err.append({'class': 303210, 'subclass': 0, 'text': mapcss.tr('Fence with {0} tag, also add {1}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # node[tourism=camp_site][name][name=~/^[0-9]+$/][!ref][!building]
-        # node[tourism=caravan_site][name][name=~/^[0-9]+$/][!ref][!building]
+    # node[tourism=camp_site][name][name=~/^[0-9]+$/][!ref][!building]
+    # node[tourism=caravan_site][name][name=~/^[0-9]+$/][!ref][!building]
+    def _node_rule_9(self, data, tags, keys, err, sets):
         if ('name' in keys and 'tourism' in keys):
             match = False
             if not match:
@@ -221,7 +225,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                     'name'])
                 }})
 
-        # *[alt_name][name][alt_name~=*name][alt_name!=*name]
+    # *[alt_name][name][alt_name~=*name][alt_name!=*name]
+    def _node_rule_10(self, data, tags, keys, err, sets):
         if ('alt_name' in keys and 'name' in keys):
             match = False
             if not match:
@@ -243,7 +248,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}='), mapcss.join_list(';', mapcss.trim_list(mapcss.split(';', mapcss.replace(mapcss.concat(';', mapcss.join_list(';', mapcss.trim_list(mapcss.split(';', mapcss.tag(tags, 'alt_name')))), ';'), mapcss.concat(';', mapcss.tag(tags, 'name'), ';'), ';')))))).split('=', 1)])
                 }})
 
-        # node[amenity=parking][!parking]
+    # node[amenity=parking][!parking]
+    def _node_rule_11(self, data, tags, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -258,7 +264,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.tag}","{1.key}=*")
                 err.append({'class': 316150, 'subclass': 0, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}=*'))})
 
-        # node[tunnel][!highway][!area:highway][!railway][!waterway][!piste:type][type!=tunnel][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=tunnel][power!=cable]
+    # node[tunnel][!highway][!area:highway][!railway][!waterway][!piste:type][type!=tunnel][public_transport!=platform][route!=ferry][man_made!=pipeline][man_made!=goods_conveyor][man_made!=wildlife_crossing][man_made!=tunnel][power!=cable]
+    def _node_rule_12(self, data, tags, keys, err, sets):
         if ('tunnel' in keys):
             match = False
             if not match:
@@ -271,15 +278,32 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("{0} on suspicious object","{0.key}")
                 err.append({'class': 303211, 'subclass': 0, 'text': mapcss.tr('{0} on suspicious object', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['amenity']),
+        (_node_rule_1, ['highway']),
+        (_node_rule_2, ['amenity']),
+        (_node_rule_3, ['amenity']),
+        (_node_rule_4, ['natural']),
+        (_node_rule_5, ['bridge']),
+        (_node_rule_6, ['crossing']),
+        (_node_rule_7, ['leisure']),
+        (_node_rule_8, ['barrier']),
+        (_node_rule_9, ['name']),
+        (_node_rule_10, ['alt_name']),
+        (_node_rule_11, ['amenity']),
+        (_node_rule_12, ['tunnel']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # *[building=roof][amenity][amenity!=shelter][parking!=rooftop]
+    # *[building=roof][amenity][amenity!=shelter][parking!=rooftop]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'building' in keys):
             match = False
             if not match:
@@ -293,7 +317,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # assertNoMatch:"way building=roof amenity=parking parking=rooftop"
                 err.append({'class': 30322, 'subclass': 0, 'text': mapcss.tr('{0} together with {1}, usually {1} is located underneath the {2}. Tag the {3} as a separate object.', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{0.value}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[highway=emergency_access_point][!ref]
+    # *[highway=emergency_access_point][!ref]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -306,7 +331,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("Missing tag ref for emergency access point")
                 err.append({'class': 20802, 'subclass': 1, 'text': mapcss.tr('Missing tag ref for emergency access point')})
 
-        # *[amenity=recycling][recycling_type!=centre][recycling:glass=yes][outside("CZ")]
+    # *[amenity=recycling][recycling_type!=centre][recycling:glass=yes][outside("CZ")]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'recycling:glass' in keys):
             match = False
             if not match:
@@ -328,7 +354,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                     'recycling:glass'])
                 }})
 
-        # *[amenity=recycling][recycling_type!=centre][name]
+    # *[amenity=recycling][recycling_type!=centre][name]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -341,7 +368,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("Suspicious name for a container")
                 err.append({'class': 32302, 'subclass': 0, 'text': mapcss.tr('Suspicious name for a container')})
 
-        # way[highway][fee][!amenity][!leisure][highway!=trailhead]
+    # way[highway][fee][!amenity][!leisure][highway!=trailhead]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('fee' in keys and 'highway' in keys):
             match = False
             if not match:
@@ -363,7 +391,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                     'fee'])
                 }})
 
-        # way[highway][junction=roundabout][area][area!=no]
+    # way[highway][junction=roundabout][area][area!=no]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('area' in keys and 'highway' in keys and 'junction' in keys):
             match = False
             if not match:
@@ -381,7 +410,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                     'area'])
                 }})
 
-        # way[junction][junction!=yes][!highway][!area:highway]
+    # way[junction][junction!=yes][!highway][!area:highway]
+    def _way_rule_6(self, data, tags, nds, keys, err, sets):
         if ('junction' in keys):
             match = False
             if not match:
@@ -399,7 +429,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # assertNoMatch:"way junction=yes"
                 err.append({'class': 20800, 'subclass': 0, 'text': mapcss.tr('Tag highway missing on junction')})
 
-        # way[oneway][!highway][!railway][!aerialway][!waterway][!aeroway][!piste:type][!area:highway][attraction!=summer_toboggan][leisure!=track]
+    # way[oneway][!highway][!railway][!aerialway][!waterway][!aeroway][!piste:type][!area:highway][attraction!=summer_toboggan][leisure!=track]
+    def _way_rule_7(self, data, tags, nds, keys, err, sets):
         if ('oneway' in keys):
             match = False
             if not match:
@@ -416,7 +447,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # assertMatch:"way oneway=yes building=yes"
                 err.append({'class': 20801, 'subclass': 0, 'text': mapcss.tr('Tag highway missing on oneway')})
 
-        # way[waterway][level]
+    # way[waterway][level]
+    def _way_rule_8(self, data, tags, nds, keys, err, sets):
         if ('level' in keys and 'waterway' in keys):
             match = False
             if not match:
@@ -438,8 +470,9 @@ class TagFix_MultipleTag2(PluginMapCSS):
                     'level'])
                 }})
 
-        # way[tunnel][highway=~/^(motorway_link|trunk_link|primary|primary_link|secondary|secondary_link)$/][!maxheight][!maxheight:physical][tunnel!=no]
-        # way[covered][highway=~/^(motorway_link|trunk_link|primary|primary_link|secondary|secondary_link)$/][!maxheight][!maxheight:physical][covered!=no]
+    # way[tunnel][highway=~/^(motorway_link|trunk_link|primary|primary_link|secondary|secondary_link)$/][!maxheight][!maxheight:physical][tunnel!=no]
+    # way[covered][highway=~/^(motorway_link|trunk_link|primary|primary_link|secondary|secondary_link)$/][!maxheight][!maxheight:physical][covered!=no]
+    def _way_rule_9(self, data, tags, nds, keys, err, sets):
         if ('covered' in keys and 'highway' in keys) or ('highway' in keys and 'tunnel' in keys):
             match = False
             if not match:
@@ -461,7 +494,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # assertMatch:"way highway=primary tunnel=yes"
                 err.append({'class': 71301, 'subclass': 0, 'text': mapcss.tr('Missing maxheight tag')})
 
-        # *[bridge][tunnel][bridge!=no][tunnel!=no]
+    # *[bridge][tunnel][bridge!=no][tunnel!=no]
+    def _way_rule_10(self, data, tags, nds, keys, err, sets):
         if ('bridge' in keys and 'tunnel' in keys):
             match = False
             if not match:
@@ -479,7 +513,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # assertMatch:"way bridge=yes tunnel=yes"
                 err.append({'class': 40303, 'subclass': 0, 'text': mapcss.tr('Conflict between tags: `{0}` and `{1}`', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # area[leisure=picnic_table][tourism=picnic_site]
+    # area[leisure=picnic_table][tourism=picnic_site]
+    def _way_rule_11(self, data, tags, nds, keys, err, sets):
         if ('leisure' in keys and 'tourism' in keys):
             match = False
             if not match:
@@ -495,7 +530,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}. A picnic site rarely consists of only one single picnic table","{0.tag}","{1.tag}")
                 err.append({'class': 40303, 'subclass': 2, 'text': mapcss.tr('{0} together with {1}. A picnic site rarely consists of only one single picnic table', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # way[attraction=roller_coaster][roller_coaster=track]
+    # way[attraction=roller_coaster][roller_coaster=track]
+    def _way_rule_12(self, data, tags, nds, keys, err, sets):
         if ('attraction' in keys and 'roller_coaster' in keys):
             match = False
             if not match:
@@ -511,7 +547,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}. {0} should be used for the area containing the attraction, {1} for the actual tracks","{0.tag}","{1.tag}")
                 err.append({'class': 40303, 'subclass': 3, 'text': mapcss.tr('{0} together with {1}. {0} should be used for the area containing the attraction, {1} for the actual tracks', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[barrier=fence][material][!fence_type]
+    # *[barrier=fence][material][!fence_type]
+    def _way_rule_13(self, data, tags, nds, keys, err, sets):
         if ('barrier' in keys and 'material' in keys):
             match = False
             if not match:
@@ -523,8 +560,9 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("Fence with {0} tag, also add {1}","{1.key}","{2.key}")
                 err.append({'class': 303210, 'subclass': 0, 'text': mapcss.tr('Fence with {0} tag, also add {1}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # area[tourism=camp_site][name][name=~/^[0-9]+$/][!ref][!building]
-        # area[tourism=caravan_site][name][name=~/^[0-9]+$/][!ref][!building]
+    # area[tourism=camp_site][name][name=~/^[0-9]+$/][!ref][!building]
+    # area[tourism=caravan_site][name][name=~/^[0-9]+$/][!ref][!building]
+    def _way_rule_14(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'tourism' in keys):
             match = False
             if not match:
@@ -550,7 +588,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                     'name'])
                 }})
 
-        # *[alt_name][name][alt_name~=*name][alt_name!=*name]
+    # *[alt_name][name][alt_name~=*name][alt_name!=*name]
+    def _way_rule_15(self, data, tags, nds, keys, err, sets):
         if ('alt_name' in keys and 'name' in keys):
             match = False
             if not match:
@@ -568,7 +607,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}='), mapcss.join_list(';', mapcss.trim_list(mapcss.split(';', mapcss.replace(mapcss.concat(';', mapcss.join_list(';', mapcss.trim_list(mapcss.split(';', mapcss.tag(tags, 'alt_name')))), ';'), mapcss.concat(';', mapcss.tag(tags, 'name'), ';'), ';')))))).split('=', 1)])
                 }})
 
-        # area[amenity=parking][!parking]
+    # area[amenity=parking][!parking]
+    def _way_rule_16(self, data, tags, nds, keys, err, sets):
         if ('amenity' in keys):
             match = False
             if not match:
@@ -583,15 +623,36 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("{0} without {1}","{0.tag}","{1.key}=*")
                 err.append({'class': 316150, 'subclass': 0, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}=*'))})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['amenity']),
+        (_way_rule_1, ['highway']),
+        (_way_rule_2, ['amenity']),
+        (_way_rule_3, ['amenity']),
+        (_way_rule_4, ['fee']),
+        (_way_rule_5, ['area']),
+        (_way_rule_6, ['junction']),
+        (_way_rule_7, ['oneway']),
+        (_way_rule_8, ['level']),
+        (_way_rule_9, ['covered', 'highway']),
+        (_way_rule_10, ['bridge']),
+        (_way_rule_11, ['leisure']),
+        (_way_rule_12, ['attraction']),
+        (_way_rule_13, ['barrier']),
+        (_way_rule_14, ['name']),
+        (_way_rule_15, ['alt_name']),
+        (_way_rule_16, ['amenity']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # *[building=roof][amenity][amenity!=shelter][parking!=rooftop]
+    # *[building=roof][amenity][amenity!=shelter][parking!=rooftop]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'building' in keys):
             match = False
             if not match:
@@ -603,7 +664,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}, usually {1} is located underneath the {2}. Tag the {3} as a separate object.","{0.tag}","{1.tag}","{0.value}","{1.key}")
                 err.append({'class': 30322, 'subclass': 0, 'text': mapcss.tr('{0} together with {1}, usually {1} is located underneath the {2}. Tag the {3} as a separate object.', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{0.value}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[highway=emergency_access_point][!ref]
+    # *[highway=emergency_access_point][!ref]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('highway' in keys):
             match = False
             if not match:
@@ -616,7 +678,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("Missing tag ref for emergency access point")
                 err.append({'class': 20802, 'subclass': 1, 'text': mapcss.tr('Missing tag ref for emergency access point')})
 
-        # *[amenity=recycling][recycling_type!=centre][recycling:glass=yes][outside("CZ")]
+    # *[amenity=recycling][recycling_type!=centre][recycling:glass=yes][outside("CZ")]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'recycling:glass' in keys):
             match = False
             if not match:
@@ -638,7 +701,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                     'recycling:glass'])
                 }})
 
-        # *[amenity=recycling][recycling_type!=centre][name]
+    # *[amenity=recycling][recycling_type!=centre][name]
+    def _relation_rule_3(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'name' in keys):
             match = False
             if not match:
@@ -651,7 +715,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("Suspicious name for a container")
                 err.append({'class': 32302, 'subclass': 0, 'text': mapcss.tr('Suspicious name for a container')})
 
-        # relation[!type]
+    # relation[!type]
+    def _relation_rule_4(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -665,7 +730,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # assertMatch:"relation"
                 err.append({'class': 21102, 'subclass': 0, 'text': mapcss.tr('Missing relation type')})
 
-        # *[bridge][tunnel][bridge!=no][tunnel!=no]
+    # *[bridge][tunnel][bridge!=no][tunnel!=no]
+    def _relation_rule_5(self, data, tags, members, keys, err, sets):
         if ('bridge' in keys and 'tunnel' in keys):
             match = False
             if not match:
@@ -681,7 +747,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("Conflict between tags: `{0}` and `{1}`","{0.tag}","{1.tag}")
                 err.append({'class': 40303, 'subclass': 0, 'text': mapcss.tr('Conflict between tags: `{0}` and `{1}`', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # area[leisure=picnic_table][tourism=picnic_site]
+    # area[leisure=picnic_table][tourism=picnic_site]
+    def _relation_rule_6(self, data, tags, members, keys, err, sets):
         if ('leisure' in keys and 'tourism' in keys and 'type' in keys):
             match = False
             if not match:
@@ -697,7 +764,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("{0} together with {1}. A picnic site rarely consists of only one single picnic table","{0.tag}","{1.tag}")
                 err.append({'class': 40303, 'subclass': 2, 'text': mapcss.tr('{0} together with {1}. A picnic site rarely consists of only one single picnic table', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[barrier=fence][material][!fence_type]
+    # *[barrier=fence][material][!fence_type]
+    def _relation_rule_7(self, data, tags, members, keys, err, sets):
         if ('barrier' in keys and 'material' in keys):
             match = False
             if not match:
@@ -709,8 +777,9 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # throwWarning:tr("Fence with {0} tag, also add {1}","{1.key}","{2.key}")
                 err.append({'class': 303210, 'subclass': 0, 'text': mapcss.tr('Fence with {0} tag, also add {1}', mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # area[tourism=camp_site][name][name=~/^[0-9]+$/][!ref][!building]
-        # area[tourism=caravan_site][name][name=~/^[0-9]+$/][!ref][!building]
+    # area[tourism=camp_site][name][name=~/^[0-9]+$/][!ref][!building]
+    # area[tourism=caravan_site][name][name=~/^[0-9]+$/][!ref][!building]
+    def _relation_rule_8(self, data, tags, members, keys, err, sets):
         if ('name' in keys and 'tourism' in keys and 'type' in keys):
             match = False
             if not match:
@@ -736,7 +805,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                     'name'])
                 }})
 
-        # *[alt_name][name][alt_name~=*name][alt_name!=*name]
+    # *[alt_name][name][alt_name~=*name][alt_name!=*name]
+    def _relation_rule_9(self, data, tags, members, keys, err, sets):
         if ('alt_name' in keys and 'name' in keys):
             match = False
             if not match:
@@ -754,7 +824,8 @@ class TagFix_MultipleTag2(PluginMapCSS):
                     (mapcss.concat(mapcss._tag_uncapture(capture_tags, '{0.key}='), mapcss.join_list(';', mapcss.trim_list(mapcss.split(';', mapcss.replace(mapcss.concat(';', mapcss.join_list(';', mapcss.trim_list(mapcss.split(';', mapcss.tag(tags, 'alt_name')))), ';'), mapcss.concat(';', mapcss.tag(tags, 'name'), ';'), ';')))))).split('=', 1)])
                 }})
 
-        # area[amenity=parking][!parking]
+    # area[amenity=parking][!parking]
+    def _relation_rule_10(self, data, tags, members, keys, err, sets):
         if ('amenity' in keys and 'type' in keys):
             match = False
             if not match:
@@ -771,6 +842,26 @@ class TagFix_MultipleTag2(PluginMapCSS):
                 # assertMatch:"relation type=multipolygon amenity=parking"
                 err.append({'class': 316150, 'subclass': 0, 'text': mapcss.tr('{0} without {1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}=*'))})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['amenity']),
+        (_relation_rule_1, ['highway']),
+        (_relation_rule_2, ['amenity']),
+        (_relation_rule_3, ['amenity']),
+        (_relation_rule_4, None),
+        (_relation_rule_5, ['bridge']),
+        (_relation_rule_6, ['leisure']),
+        (_relation_rule_7, ['barrier']),
+        (_relation_rule_8, ['name']),
+        (_relation_rule_9, ['alt_name']),
+        (_relation_rule_10, ['amenity']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
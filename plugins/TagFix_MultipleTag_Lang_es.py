@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 class TagFix_MultipleTag_Lang_es(Plugin):
 
+    interesting_keys = {'name'}
+
     only_for = ["es"]
 
     def init(self, logger):
@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 class TagFix_MultipleTag_Lang_fr(Plugin):
 
+    interesting_keys = {'name'}
+
     only_for = ["fr"]
 
     def init(self, logger):
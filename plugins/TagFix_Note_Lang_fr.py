@@ -27,6 +27,8 @@ import unicodedata
 
 class TagFix_Note_Lang_fr(Plugin):
 
+    interesting_keys = {'note', 'comment'}
+
     only_for = ["fr"]
 
     def normalize(self, s):
@@ -32,6 +32,8 @@ except ImportError as e:
 
 class TagFix_Opening_Hours(Plugin):
 
+    interesting_keys = {'opening_hours', 'opening_hours:kitchen', 'opening_hours:drive_through'}
+
     def init(self, logger):
         if not module_PyKOpeningHours:
             return False
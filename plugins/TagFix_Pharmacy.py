@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 class TagFix_Pharmacy(Plugin):
 
+    interesting_keys = {'amenity'}
+
     only_for = ["FR", "NC", "BE"]
 
     def init(self, logger):
@@ -28,6 +28,8 @@ import re
 
 class TagFix_Postcode(Plugin):
 
+    interesting_keys = {'postal_code', 'addr:postcode'}
+
     not_for = ("EG") # Egypt is transitioning to a new format. At 2024-04-15 there were still 2.4M entries in OSM in the old format
 
     def parse_format(self, reline, format):
@@ -27,6 +27,8 @@ from plugins.modules.wikiReader import read_wiki_table
 
 class TagFix_Tree(Plugin):
 
+    interesting_keys = {'natural'}
+
     def _read_leaf_properties_table(self):
         # The documented values, excluding:
         # - mixed leaf types/cycles: not compatible with `species`
@@ -28,6 +28,8 @@ import unicodedata
 
 class TagFix_Tree_Lang_fr(Plugin):
 
+    interesting_keys = {'natural'}
+
     only_for = ["fr"]
 
     def strip_accents(self, s):
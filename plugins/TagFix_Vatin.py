@@ -23,6 +23,8 @@ from plugins.Plugin import Plugin
 
 class TagFix_Vatin(Plugin):
 
+    interesting_keys = {'ref:vatin'}
+
     # ref:vatin is a tag to add the VAT identification number.
     # The usual syntax is <country-code><VAT-number>
     # Examples:
@@ -27,6 +27,8 @@ import json
 
 class TagFix_Wikidata(Plugin):
 
+    interesting_keys = {'wikidata'}
+
     def init(self, logger):
         Plugin.init(self, logger)
         self.errors[30318] = self.def_class(item = 3031, level = 2, tags = ['value', 'wikidata', 'fix:chair'],
@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 class TagRemove_FR(Plugin):
 
+    interesting_keys = {'designation'}
+
     only_for = ["FR", "NC"]
 
     def init(self, logger):
@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 class TagRemove_Layer(Plugin):
 
+    interesting_keys = {'layer'}
+
     def init(self, logger):
         Plugin.init(self, logger)
         self.errors[41101] = self.def_class(item = 4110, level = 3, tags = ['landuse', 'fix:chair'],
@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 class TagRemove_Naptan(Plugin):
 
+    interesting_keys = {'naptan:verified'}
+
     only_for = ["GB"]
 
     def init(self, logger):
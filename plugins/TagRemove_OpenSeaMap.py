@@ -25,6 +25,8 @@ from plugins.Plugin import Plugin
 
 class TagRemove_OpenSeaMap(Plugin):
 
+    interesting_keys = {'seamark:fixme'}
+
     def init(self, logger):
         Plugin.init(self, logger)
         if self.father.config.options.get("project") != 'openstreetmap':
@@ -27,14 +27,9 @@ class indoor(PluginMapCSS):
         self.re_2a047336 = re.compile(r'room|corridor|area|level')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # node[indoor=~/room|corridor|area|level/][inside("DE,CH,FR")]
-        # node[room][inside("DE,CH,FR")]
+    # node[indoor=~/room|corridor|area|level/][inside("DE,CH,FR")]
+    # node[room][inside("DE,CH,FR")]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('indoor' in keys) or ('room' in keys):
             match = False
             if not match:
@@ -53,7 +48,8 @@ class indoor(PluginMapCSS):
                 # -osmoseAssertMatchWithContext:list("node room=shop","inside=DE")
                 err.append({'class': 50, 'subclass': 0, 'text': mapcss.tr('This indoor feature should be a closed and valid polygon')})
 
-        # *[indoor][!level][!repeat_on][indoor!=yes][indoor!=no]
+    # *[indoor][!level][!repeat_on][indoor!=yes][indoor!=no]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if ('indoor' in keys):
             match = False
             if not match:
@@ -66,7 +62,8 @@ class indoor(PluginMapCSS):
                 # assertMatch:"node indoor=room"
                 err.append({'class': 21201, 'subclass': 1, 'text': mapcss.tr('`{0}` without `{1}` or `{2}`', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[room][!indoor][!buildingpart]
+    # *[room][!indoor][!buildingpart]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('room' in keys):
             match = False
             if not match:
@@ -84,16 +81,23 @@ class indoor(PluginMapCSS):
                     ['indoor','room']])
                 }})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['indoor', 'room']),
+        (_node_rule_1, ['indoor']),
+        (_node_rule_2, ['room']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # way!:closed[indoor=~/room|corridor|area|level/][inside("DE,CH,FR")]
-        # way!:closed[room][inside("DE,CH,FR")]
+    # way!:closed[indoor=~/room|corridor|area|level/][inside("DE,CH,FR")]
+    # way!:closed[room][inside("DE,CH,FR")]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('indoor' in keys) or ('room' in keys):
             match = False
             if not match:
@@ -110,7 +114,8 @@ class indoor(PluginMapCSS):
                 # throwError:tr("This indoor feature should be a closed and valid polygon")
                 err.append({'class': 50, 'subclass': 0, 'text': mapcss.tr('This indoor feature should be a closed and valid polygon')})
 
-        # area[indoor=room][access!~/no|private/]!.room_with_door
+    # area[indoor=room][access!~/no|private/]!.room_with_door
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('indoor' in keys):
             match = False
             # Skip selector using undeclared class room_with_door
@@ -119,7 +124,8 @@ class indoor(PluginMapCSS):
                 # throwError:tr("This indoor room should have a door")
                 err.append({'class': 53, 'subclass': 0, 'text': mapcss.tr('This indoor room should have a door')})
 
-        # way:closed[indoor=~/room|corridor|area|level/][!level][inside("DE,CH,FR")]
+    # way:closed[indoor=~/room|corridor|area|level/][!level][inside("DE,CH,FR")]
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('indoor' in keys):
             match = False
             if not match:
@@ -134,8 +140,9 @@ class indoor(PluginMapCSS):
                 # -osmoseAssertMatchWithContext:list("way indoor=room room=shop","inside=FR")
                 err.append({'class': 51, 'subclass': 0, 'text': mapcss.tr('This indoor feature should have a level')})
 
-        # way:closed[indoor=area][shop][inside("DE,CH,FR")]
-        # way:closed[indoor=corridor][shop][inside("DE,CH,FR")]
+    # way:closed[indoor=area][shop][inside("DE,CH,FR")]
+    # way:closed[indoor=corridor][shop][inside("DE,CH,FR")]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('indoor' in keys and 'shop' in keys):
             match = False
             if not match:
@@ -159,7 +166,8 @@ class indoor(PluginMapCSS):
                     ['indoor','room']])
                 }})
 
-        # *[indoor][!level][!repeat_on][indoor!=yes][indoor!=no]
+    # *[indoor][!level][!repeat_on][indoor!=yes][indoor!=no]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('indoor' in keys):
             match = False
             if not match:
@@ -171,7 +179,8 @@ class indoor(PluginMapCSS):
                 # throwWarning:tr("`{0}` without `{1}` or `{2}`","{0.tag}","{1.key}","{2.key}")
                 err.append({'class': 21201, 'subclass': 1, 'text': mapcss.tr('`{0}` without `{1}` or `{2}`', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[room][!indoor][!buildingpart]
+    # *[room][!indoor][!buildingpart]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if ('room' in keys):
             match = False
             if not match:
@@ -188,15 +197,25 @@ class indoor(PluginMapCSS):
                     ['indoor','room']])
                 }})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['indoor', 'room']),
+        (_way_rule_1, ['indoor']),
+        (_way_rule_2, ['indoor']),
+        (_way_rule_3, ['indoor']),
+        (_way_rule_4, ['indoor']),
+        (_way_rule_5, ['room']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # area[indoor=room][access!~/no|private/]!.room_with_door
+    # area[indoor=room][access!~/no|private/]!.room_with_door
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('indoor' in keys and 'type' in keys):
             match = False
             # Skip selector using undeclared class room_with_door
@@ -205,7 +224,8 @@ class indoor(PluginMapCSS):
                 # throwError:tr("This indoor room should have a door")
                 err.append({'class': 53, 'subclass': 0, 'text': mapcss.tr('This indoor room should have a door')})
 
-        # *[indoor][!level][!repeat_on][indoor!=yes][indoor!=no]
+    # *[indoor][!level][!repeat_on][indoor!=yes][indoor!=no]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('indoor' in keys):
             match = False
             if not match:
@@ -217,7 +237,8 @@ class indoor(PluginMapCSS):
                 # throwWarning:tr("`{0}` without `{1}` or `{2}`","{0.tag}","{1.key}","{2.key}")
                 err.append({'class': 21201, 'subclass': 1, 'text': mapcss.tr('`{0}` without `{1}` or `{2}`', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.key}'), mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # *[room][!indoor][!buildingpart]
+    # *[room][!indoor][!buildingpart]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if ('room' in keys):
             match = False
             if not match:
@@ -234,6 +255,18 @@ class indoor(PluginMapCSS):
                     ['indoor','room']])
                 }})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['indoor']),
+        (_relation_rule_1, ['indoor']),
+        (_relation_rule_2, ['room']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
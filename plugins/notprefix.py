@@ -21,20 +21,15 @@ class notprefix(PluginMapCSS):
 
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-
-
-        # *[not:name][name]["not:name"=*"name"]
-        # *[not:addr:postcode][addr:postcode]["not:addr:postcode"=*"addr:postcode"]
-        # *[not:network][network]["not:network"=*"network"]
-        # *[not:designation][designation]["not:designation"=*"designation"]
-        # *[not:brand:wikidata][brand:wikidata]["not:brand:wikidata"=*"brand:wikidata"]
-        # *[not:network:wikidata][network:wikidata]["not:network:wikidata"=*"network:wikidata"]
-        # *[not:operator:wikidata][operator:wikidata]["not:operator:wikidata"=*"operator:wikidata"]
-        # *[not:highway][highway]["not:highway"=*"highway"]
+    # *[not:name][name]["not:name"=*"name"]
+    # *[not:addr:postcode][addr:postcode]["not:addr:postcode"=*"addr:postcode"]
+    # *[not:network][network]["not:network"=*"network"]
+    # *[not:designation][designation]["not:designation"=*"designation"]
+    # *[not:brand:wikidata][brand:wikidata]["not:brand:wikidata"=*"brand:wikidata"]
+    # *[not:network:wikidata][network:wikidata]["not:network:wikidata"=*"network:wikidata"]
+    # *[not:operator:wikidata][operator:wikidata]["not:operator:wikidata"=*"operator:wikidata"]
+    # *[not:highway][highway]["not:highway"=*"highway"]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('addr:postcode' in keys and 'not:addr:postcode' in keys) or ('brand:wikidata' in keys and 'not:brand:wikidata' in keys) or ('designation' in keys and 'not:designation' in keys) or ('highway' in keys and 'not:highway' in keys) or ('name' in keys and 'not:name' in keys) or ('network' in keys and 'not:network' in keys) or ('network:wikidata' in keys and 'not:network:wikidata' in keys) or ('not:operator:wikidata' in keys and 'operator:wikidata' in keys):
             match = False
             if not match:
@@ -74,22 +69,27 @@ class notprefix(PluginMapCSS):
                 # throwWarning:tr("`{0}` together with `{1}` and equal values","{0.key}","{1.key}")
                 err.append({'class': 40302, 'subclass': 0, 'text': mapcss.tr('`{0}` together with `{1}` and equal values', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['addr:postcode', 'brand:wikidata', 'designation', 'highway', 'name', 'network', 'network:wikidata', 'not:operator:wikidata']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-
-        # *[not:name][name]["not:name"=*"name"]
-        # *[not:addr:postcode][addr:postcode]["not:addr:postcode"=*"addr:postcode"]
-        # *[not:network][network]["not:network"=*"network"]
-        # *[not:designation][designation]["not:designation"=*"designation"]
-        # *[not:brand:wikidata][brand:wikidata]["not:brand:wikidata"=*"brand:wikidata"]
-        # *[not:network:wikidata][network:wikidata]["not:network:wikidata"=*"network:wikidata"]
-        # *[not:operator:wikidata][operator:wikidata]["not:operator:wikidata"=*"operator:wikidata"]
-        # *[not:highway][highway]["not:highway"=*"highway"]
+    # *[not:name][name]["not:name"=*"name"]
+    # *[not:addr:postcode][addr:postcode]["not:addr:postcode"=*"addr:postcode"]
+    # *[not:network][network]["not:network"=*"network"]
+    # *[not:designation][designation]["not:designation"=*"designation"]
+    # *[not:brand:wikidata][brand:wikidata]["not:brand:wikidata"=*"brand:wikidata"]
+    # *[not:network:wikidata][network:wikidata]["not:network:wikidata"=*"network:wikidata"]
+    # *[not:operator:wikidata][operator:wikidata]["not:operator:wikidata"=*"operator:wikidata"]
+    # *[not:highway][highway]["not:highway"=*"highway"]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('addr:postcode' in keys and 'not:addr:postcode' in keys) or ('brand:wikidata' in keys and 'not:brand:wikidata' in keys) or ('designation' in keys and 'not:designation' in keys) or ('highway' in keys and 'not:highway' in keys) or ('name' in keys and 'not:name' in keys) or ('network' in keys and 'not:network' in keys) or ('network:wikidata' in keys and 'not:network:wikidata' in keys) or ('not:operator:wikidata' in keys and 'operator:wikidata' in keys):
             match = False
             if not match:
@@ -131,22 +131,27 @@ class notprefix(PluginMapCSS):
                 # assertNoMatch:"way name=Osmosestreet not:name=Osmoseroad"
                 err.append({'class': 40302, 'subclass': 0, 'text': mapcss.tr('`{0}` together with `{1}` and equal values', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['addr:postcode', 'brand:wikidata', 'designation', 'highway', 'name', 'network', 'network:wikidata', 'not:operator:wikidata']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-
-        # *[not:name][name]["not:name"=*"name"]
-        # *[not:addr:postcode][addr:postcode]["not:addr:postcode"=*"addr:postcode"]
-        # *[not:network][network]["not:network"=*"network"]
-        # *[not:designation][designation]["not:designation"=*"designation"]
-        # *[not:brand:wikidata][brand:wikidata]["not:brand:wikidata"=*"brand:wikidata"]
-        # *[not:network:wikidata][network:wikidata]["not:network:wikidata"=*"network:wikidata"]
-        # *[not:operator:wikidata][operator:wikidata]["not:operator:wikidata"=*"operator:wikidata"]
-        # *[not:highway][highway]["not:highway"=*"highway"]
+    # *[not:name][name]["not:name"=*"name"]
+    # *[not:addr:postcode][addr:postcode]["not:addr:postcode"=*"addr:postcode"]
+    # *[not:network][network]["not:network"=*"network"]
+    # *[not:designation][designation]["not:designation"=*"designation"]
+    # *[not:brand:wikidata][brand:wikidata]["not:brand:wikidata"=*"brand:wikidata"]
+    # *[not:network:wikidata][network:wikidata]["not:network:wikidata"=*"network:wikidata"]
+    # *[not:operator:wikidata][operator:wikidata]["not:operator:wikidata"=*"operator:wikidata"]
+    # *[not:highway][highway]["not:highway"=*"highway"]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('addr:postcode' in keys and 'not:addr:postcode' in keys) or ('brand:wikidata' in keys and 'not:brand:wikidata' in keys) or ('designation' in keys and 'not:designation' in keys) or ('highway' in keys and 'not:highway' in keys) or ('name' in keys and 'not:name' in keys) or ('network' in keys and 'not:network' in keys) or ('network:wikidata' in keys and 'not:network:wikidata' in keys) or ('not:operator:wikidata' in keys and 'operator:wikidata' in keys):
             match = False
             if not match:
@@ -186,6 +191,16 @@ class notprefix(PluginMapCSS):
                 # throwWarning:tr("`{0}` together with `{1}` and equal values","{0.key}","{1.key}")
                 err.append({'class': 40302, 'subclass': 0, 'text': mapcss.tr('`{0}` together with `{1}` and equal values', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['addr:postcode', 'brand:wikidata', 'designation', 'highway', 'name', 'network', 'network:wikidata', 'not:operator:wikidata']),
+    ])
+
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
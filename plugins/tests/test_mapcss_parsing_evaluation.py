@@ -64,13 +64,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
         self.re_7f42aaa6 = re.compile(r'def')
 
 
-    def node(self, data, tags):
-        capture_tags = {}
-        keys = tags.keys()
-        err = []
-        set_a = set_b = set_supportsSet = False
-
-        # node[x=0]
+    # node[x=0]
+    def _node_rule_0(self, data, tags, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -87,7 +82,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node x=Osmose"
                 err.append({'class': 98, 'subclass': 0, 'text': {'en': 'test #1740'}})
 
-        # node[x!=0]
+    # node[x!=0]
+    def _node_rule_1(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -102,7 +98,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=Osmose"
                 err.append({'class': 1, 'subclass': 659546685, 'text': {'en': 'test #1740'}})
 
-        # *[parking][amenity!~/^(parking|motorcycle_parking)$/]
+    # *[parking][amenity!~/^(parking|motorcycle_parking)$/]
+    def _node_rule_2(self, data, tags, keys, err, sets):
         if ('parking' in keys):
             match = False
             if not match:
@@ -115,8 +112,9 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node parking=yes amenity=parking"
                 err.append({'class': 2, 'subclass': 650362898, 'text': mapcss.tr('test #994 - {0}{1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[a][!c]
-        # *[b][!/d/]
+    # *[a][!c]
+    # *[b][!/d/]
+    def _node_rule_3(self, data, tags, keys, err, sets):
         if ('a' in keys) or ('b' in keys):
             match = False
             if not match:
@@ -131,7 +129,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # throwWarning:tr("test #328 - {0}{1}","{0.key}","{1.key}")
                 err.append({'class': 3, 'subclass': 1004069731, 'text': mapcss.tr('test #328 - {0}{1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[/abc/=~/def/]
+    # *[/abc/=~/def/]
+    def _node_rule_4(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -142,7 +141,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # throwWarning:"test commit 373d1ff9bacf8126508bbf3e37467df2bdf17fbd"
                 err.append({'class': 4, 'subclass': 1371556921, 'text': {'en': 'test commit 373d1ff9bacf8126508bbf3e37467df2bdf17fbd'}})
 
-        # *[addr:street=~/(?i).*Straße.*/][inside("LI,CH")]
+    # *[addr:street=~/(?i).*Straße.*/][inside("LI,CH")]
+    def _node_rule_5(self, data, tags, keys, err, sets):
         if ('addr:street' in keys):
             match = False
             if not match:
@@ -155,7 +155,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # -osmoseAssertMatchWithContext:list("node addr:street=Neuestraßebahn","inside=LI")
                 err.append({'class': 5, 'subclass': 43561107, 'text': mapcss.tr('test #327')})
 
-        # *[a][a=*b]
+    # *[a][a=*b]
+    def _node_rule_6(self, data, tags, keys, err, sets):
         if ('a' in keys):
             match = False
             if not match:
@@ -169,7 +170,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node a=x"
                 err.append({'class': 6, 'subclass': 1343056298, 'text': {'en': 'test'}})
 
-        # node[lit][eval(number_of_tags())=1]
+    # node[lit][eval(number_of_tags())=1]
+    def _node_rule_7(self, data, tags, keys, err, sets):
         if ('lit' in keys):
             match = False
             if not match:
@@ -182,7 +184,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node lit=yes"
                 err.append({'class': 6, 'subclass': 130427469, 'text': {'en': 'test'}})
 
-        # node[lit][number_of_tags()==1]
+    # node[lit][number_of_tags()==1]
+    def _node_rule_8(self, data, tags, keys, err, sets):
         if ('lit' in keys):
             match = False
             if not match:
@@ -195,7 +198,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node lit=yes"
                 err.append({'class': 6, 'subclass': 612979508, 'text': {'en': 'test'}})
 
-        # node[a][b][tag("a")>tag("b")]
+    # node[a][b][tag("a")>tag("b")]
+    def _node_rule_9(self, data, tags, keys, err, sets):
         if ('a' in keys and 'b' in keys):
             match = False
             if not match:
@@ -222,7 +226,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node b=X  a=Y"
                 err.append({'class': 7, 'subclass': 766520351, 'text': mapcss.tr('test #1882 - {0}-{1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # node[a][b][tag("a")>=tag("b")]
+    # node[a][b][tag("a")>=tag("b")]
+    def _node_rule_10(self, data, tags, keys, err, sets):
         if ('a' in keys and 'b' in keys):
             match = False
             if not match:
@@ -249,7 +254,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node b=X  a=Y"
                 err.append({'class': 7, 'subclass': 1296744085, 'text': mapcss.tr('test #1882 - {0}-{1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # node[a][b][tag("b")<tag("a")]
+    # node[a][b][tag("b")<tag("a")]
+    def _node_rule_11(self, data, tags, keys, err, sets):
         if ('a' in keys and 'b' in keys):
             match = False
             if not match:
@@ -276,7 +282,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node b=X  a=Y"
                 err.append({'class': 7, 'subclass': 660577118, 'text': mapcss.tr('test #1882 - {0}-{1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # node[a][b][tag("b")<=tag("a")]
+    # node[a][b][tag("b")<=tag("a")]
+    def _node_rule_12(self, data, tags, keys, err, sets):
         if ('a' in keys and 'b' in keys):
             match = False
             if not match:
@@ -303,7 +310,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node b=X  a=Y"
                 err.append({'class': 7, 'subclass': 1302849761, 'text': mapcss.tr('test #1882 - {0}-{1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # node[a>2]
+    # node[a>2]
+    def _node_rule_13(self, data, tags, keys, err, sets):
         if ('a' in keys):
             match = False
             if not match:
@@ -320,7 +328,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node a=X"
                 err.append({'class': 8, 'subclass': 1910232765, 'text': mapcss.tr('test #1882 - {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[a>2.0]
+    # node[a>2.0]
+    def _node_rule_14(self, data, tags, keys, err, sets):
         if ('a' in keys):
             match = False
             if not match:
@@ -337,7 +346,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node a=X"
                 err.append({'class': 8, 'subclass': 1369591651, 'text': mapcss.tr('test #1882 - {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[a][count(split("n",tag("a")))>2]
+    # node[a][count(split("n",tag("a")))>2]
+    def _node_rule_15(self, data, tags, keys, err, sets):
         if ('a' in keys):
             match = False
             if not match:
@@ -350,7 +360,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node a=ananas"
                 err.append({'class': 8, 'subclass': 130115842, 'text': mapcss.tr('test #1882 - {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[a][count(split("n",tag("a")))>2.0]
+    # node[a][count(split("n",tag("a")))>2.0]
+    def _node_rule_16(self, data, tags, keys, err, sets):
         if ('a' in keys):
             match = False
             if not match:
@@ -363,7 +374,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node a=ananas"
                 err.append({'class': 8, 'subclass': 935120167, 'text': mapcss.tr('test #1882 - {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[a][b][count(split("n",tag("a")))>tag(b)]
+    # node[a][b][count(split("n",tag("a")))>tag(b)]
+    def _node_rule_17(self, data, tags, keys, err, sets):
         if ('a' in keys and 'b' in keys):
             match = False
             if not match:
@@ -378,7 +390,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node a=ananas b=2.0"
                 err.append({'class': 7, 'subclass': 1734018842, 'text': mapcss.tr('test #1882 - {0}-{1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # node[x]
+    # node[x]
+    def _node_rule_18(self, data, tags, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -391,7 +404,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=z"
                 err.append({'class': 9, 'subclass': 555657026, 'text': mapcss.tr('test area rule {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[x]!:closed
+    # node[x]!:closed
+    def _node_rule_19(self, data, tags, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -403,8 +417,9 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=yes"
                 err.append({'class': 10, 'subclass': 2047373107, 'text': mapcss.tr('test closed rewrite {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[any(tag("x"),"")==any(tag("y"),"hello")]
-        # node[a]
+    # node[any(tag("x"),"")==any(tag("y"),"hello")]
+    # node[a]
+    def _node_rule_20(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -428,7 +443,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node y=world"
                 err.append({'class': 11, 'subclass': 1778220616, 'text': mapcss.tr('test any {0} {1}', mapcss.any_(mapcss.tag(tags, 'b'), ''), mapcss.any_(mapcss.tag(tags, 'c'), mapcss.tag(tags, 'd'), ''))})
 
-        # node[any(tag("x"),tag("y"))]
+    # node[any(tag("x"),tag("y"))]
+    def _node_rule_21(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -442,7 +458,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node z=yes"
                 err.append({'class': 6, 'subclass': 519126950, 'text': {'en': 'test'}})
 
-        # node[x][substring(tag(x),1)=="bcde"][substring(tag(x),1,3)="bc"]
+    # node[x][substring(tag(x),1)=="bcde"][substring(tag(x),1,3)="bc"]
+    def _node_rule_22(self, data, tags, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -454,7 +471,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=abcde"
                 err.append({'class': 6, 'subclass': 770828321, 'text': {'en': 'test'}})
 
-        # node[a][concat(tag("a"),"bc",tag("d"))=="1bc"]
+    # node[a][concat(tag("a"),"bc",tag("d"))=="1bc"]
+    def _node_rule_23(self, data, tags, keys, err, sets):
         if ('a' in keys):
             match = False
             if not match:
@@ -469,7 +487,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node a=1"
                 err.append({'class': 12, 'subclass': 2101484523, 'text': mapcss.tr('test concat {0}', mapcss.concat(mapcss.tag(tags, 'b'), mapcss.tag(tags, 'c')))})
 
-        # node[x]
+    # node[x]
+    def _node_rule_24(self, data, tags, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -482,7 +501,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=2"
                 err.append({'class': 96, 'subclass': 0, 'text': mapcss.tr('I support supports {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[x]
+    # node[x]
+    def _node_rule_25(self, data, tags, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -494,10 +514,11 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # -osmoseItemClassLevel:"4/96:1/3"
                 # throwWarning:tr("I support supports {0}","{0.tag}")
                 # assertMatch:"node x=2"
-                set_supportsSet = True
+                sets.add('supportsSet')
                 err.append({'class': 96, 'subclass': 1, 'text': mapcss.tr('I support supports {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # node[URL_decode("M%C3%A1rio Leopoldo Pereira da C%C3%A2mara")=="Mário Leopoldo Pereira da Câmara"]
+    # node[URL_decode("M%C3%A1rio Leopoldo Pereira da C%C3%A2mara")=="Mário Leopoldo Pereira da Câmara"]
+    def _node_rule_26(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -509,7 +530,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=abcde"
                 err.append({'class': 6, 'subclass': 1303771934, 'text': {'en': 'test'}})
 
-        # node[get(regexp_match("^a(b(c))?d",tag("x")),1)="bc"]
+    # node[get(regexp_match("^a(b(c))?d",tag("x")),1)="bc"]
+    def _node_rule_27(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -522,7 +544,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node x=ad"
                 err.append({'class': 13, 'subclass': 815754511, 'text': {'en': 'test regexp_match'}})
 
-        # node[get(regexp_match("^a(b(c))?d",tag("x")),1+1)="c"]
+    # node[get(regexp_match("^a(b(c))?d",tag("x")),1+1)="c"]
+    def _node_rule_28(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -535,7 +558,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node x=ad"
                 err.append({'class': 13, 'subclass': 1128311206, 'text': {'en': 'test regexp_match'}})
 
-        # node[get(regexp_match("^a(b(c))?(d)",tag("x")),1+1+1)="d"]
+    # node[get(regexp_match("^a(b(c))?(d)",tag("x")),1+1+1)="d"]
+    def _node_rule_29(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -549,7 +573,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=ad"
                 err.append({'class': 13, 'subclass': 715183081, 'text': {'en': 'test regexp_match'}})
 
-        # node[get(regexp_match("^a(b(c)?)(d+)",tag("x")),2*1+1)="dd"]
+    # node[get(regexp_match("^a(b(c)?)(d+)",tag("x")),2*1+1)="dd"]
+    def _node_rule_30(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -564,7 +589,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node x=add"
                 err.append({'class': 13, 'subclass': 9040932, 'text': {'en': 'test regexp_match'}})
 
-        # node[get(regexp_match("^a(bc)?d",tag("x")),5-4)="bc"]
+    # node[get(regexp_match("^a(bc)?d",tag("x")),5-4)="bc"]
+    def _node_rule_31(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -579,7 +605,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node y=z"
                 err.append({'class': 13, 'subclass': 1236742709, 'text': {'en': 'test regexp_match'}})
 
-        # node[get(regexp_match("^a(bc)?d",tag("x")),0)=tag("x")]
+    # node[get(regexp_match("^a(bc)?d",tag("x")),0)=tag("x")]
+    def _node_rule_32(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -593,7 +620,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=ad"
                 err.append({'class': 13, 'subclass': 1309955623, 'text': {'en': 'test regexp_match'}})
 
-        # node[get(regexp_match("^a(bc)+(d)",tag("x")),2)="d"]
+    # node[get(regexp_match("^a(bc)+(d)",tag("x")),2)="d"]
+    def _node_rule_33(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -606,7 +634,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=abcd"
                 err.append({'class': 13, 'subclass': 1771087889, 'text': {'en': 'test regexp_match'}})
 
-        # node[get(regexp_match("^a(b.)+(d)",tag("x")),1)="be"]
+    # node[get(regexp_match("^a(b.)+(d)",tag("x")),1)="be"]
+    def _node_rule_34(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -618,7 +647,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=abcbdbed"
                 err.append({'class': 13, 'subclass': 115943260, 'text': {'en': 'test regexp_match'}})
 
-        # node[get(regexp_match("^abcd",tag("x")),0)="abcd"]
+    # node[get(regexp_match("^abcd",tag("x")),0)="abcd"]
+    def _node_rule_35(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -630,7 +660,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=abcd"
                 err.append({'class': 13, 'subclass': 279180352, 'text': {'en': 'test regexp_match'}})
 
-        # node[get(regexp_match("^a(b(c+)?)(d)",tag("x")),0)="abccd"][get(regexp_match("^a(b(c+)?)(d)",tag("x")),1)="bcc"][get(regexp_match("^a(b(c+)?)(d)",tag("x")),2)="cc"][get(regexp_match("^a(b(c+)?)(d)",tag("x")),3)="d"]
+    # node[get(regexp_match("^a(b(c+)?)(d)",tag("x")),0)="abccd"][get(regexp_match("^a(b(c+)?)(d)",tag("x")),1)="bcc"][get(regexp_match("^a(b(c+)?)(d)",tag("x")),2)="cc"][get(regexp_match("^a(b(c+)?)(d)",tag("x")),3)="d"]
+    def _node_rule_36(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -642,7 +673,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=abccd"
                 err.append({'class': 13, 'subclass': 1420114028, 'text': {'en': 'test regexp_match'}})
 
-        # node[any(regexp_match("abcd",tag("x")),"no match")!="no match"]
+    # node[any(regexp_match("abcd",tag("x")),"no match")!="no match"]
+    def _node_rule_37(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -655,7 +687,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node x=abcdabcd"
                 err.append({'class': 13, 'subclass': 438256796, 'text': {'en': 'test regexp_match'}})
 
-        # node[x!="a\\b"]
+    # node[x!="a\\b"]
+    def _node_rule_38(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -667,7 +700,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=25"
                 err.append({'class': 14, 'subclass': 862284822, 'text': mapcss.tr('test #2236 - {0} {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # node[x="a\\b"]
+    # node[x="a\\b"]
+    def _node_rule_39(self, data, tags, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -680,7 +714,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node x=a\\x08"
                 err.append({'class': 14, 'subclass': 1745755712, 'text': mapcss.tr('test #2236 - {0} {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # node[/\d/]
+    # node[/\d/]
+    def _node_rule_40(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -693,7 +728,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x2=25"
                 err.append({'class': 14, 'subclass': 1947789792, 'text': mapcss.tr('test #2236 - {0} {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # node[x=~/\d/]
+    # node[x=~/\d/]
+    def _node_rule_41(self, data, tags, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -706,7 +742,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"node x=d"
                 err.append({'class': 14, 'subclass': 2053382697, 'text': mapcss.tr('test #2236 - {0} {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # node[x!~/\d/]
+    # node[x!~/\d/]
+    def _node_rule_42(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -719,7 +756,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=d"
                 err.append({'class': 14, 'subclass': 877576641, 'text': mapcss.tr('test #2236 - {0} {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # node[x!~/It's\sworking/]
+    # node[x!~/It's\sworking/]
+    def _node_rule_43(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -732,7 +770,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=\"It\\\\'s working\""
                 err.append({'class': 14, 'subclass': 1474979323, 'text': mapcss.tr('test #2236 - {0} {1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{0.value}'))})
 
-        # node[to_int("-3")+to_short("4")*to_long("2")=5]
+    # node[to_int("-3")+to_short("4")*to_long("2")=5]
+    def _node_rule_44(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -744,7 +783,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=y"
                 err.append({'class': 6, 'subclass': 560627145, 'text': {'en': 'test'}})
 
-        # node[to_float("3.14e1")=31.4][to_double("3.1415e1")=31.415]
+    # node[to_float("3.14e1")=31.4][to_double("3.1415e1")=31.415]
+    def _node_rule_45(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -756,7 +796,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=y"
                 err.append({'class': 6, 'subclass': 931844076, 'text': {'en': 'test'}})
 
-        # node[tag_length][siunit_length(tag(tag_length))=="1.2"]
+    # node[tag_length][siunit_length(tag(tag_length))=="1.2"]
+    def _node_rule_46(self, data, tags, keys, err, sets):
         if ('tag_length' in keys):
             match = False
             if not match:
@@ -768,7 +809,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node tag_length=1.2"
                 err.append({'class': 15, 'subclass': 1907035839, 'text': mapcss.tr('test unit conversion {0} -> {1}', mapcss._tag_uncapture(capture_tags, '{0.value}'), mapcss.siunit_length(mapcss.tag(tags, 'tag_length')))})
 
-        # node[tag_length][siunit_length(tag(tag_length))==tag(b)]
+    # node[tag_length][siunit_length(tag(tag_length))==tag(b)]
+    def _node_rule_47(self, data, tags, keys, err, sets):
         if ('tag_length' in keys):
             match = False
             if not match:
@@ -797,7 +839,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node tag_length=20'2\"       b=6.1468"
                 err.append({'class': 15, 'subclass': 208420761, 'text': mapcss.tr('test unit conversion {0} -> {1}', mapcss._tag_uncapture(capture_tags, '{0.value}'), mapcss.siunit_length(mapcss.tag(tags, 'tag_length')))})
 
-        # node[any(siunit_length(tag(x)),"no result")=="no result"]
+    # node[any(siunit_length(tag(x)),"no result")=="no result"]
+    def _node_rule_48(self, data, tags, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -813,7 +856,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=Hello"
                 err.append({'class': 6, 'subclass': 72306003, 'text': {'en': 'test'}})
 
-        # node[x][inside("FX,NL")]
+    # node[x][inside("FX,NL")]
+    def _node_rule_49(self, data, tags, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -829,7 +873,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # -osmoseAssertMatchWithContext:list("node x=1","inside=NL")
                 err.append({'class': 6, 'subclass': 759484915, 'text': {'en': 'test'}})
 
-        # node[x][inside("FX,NL,FR-GF")]
+    # node[x][inside("FX,NL,FR-GF")]
+    def _node_rule_50(self, data, tags, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -846,7 +891,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # -osmoseAssertMatchWithContext:list("node x=1","inside=NL")
                 err.append({'class': 6, 'subclass': 336478965, 'text': {'en': 'test'}})
 
-        # node[x][inside("FX,NL,FR")]
+    # node[x][inside("FX,NL,FR")]
+    def _node_rule_51(self, data, tags, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -863,7 +909,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # -osmoseAssertMatchWithContext:list("node x=1","inside=NL")
                 err.append({'class': 6, 'subclass': 1675393091, 'text': {'en': 'test'}})
 
-        # node[x][inside("NL,FX,DE")][outside("FR-02")]
+    # node[x][inside("NL,FX,DE")][outside("FR-02")]
+    def _node_rule_52(self, data, tags, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -881,7 +928,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # -osmoseAssertMatchWithContext:list("node x=1","inside=NL")
                 err.append({'class': 6, 'subclass': 658590773, 'text': {'en': 'test'}})
 
-        # node[x][inside("FR")][outside("FX")]
+    # node[x][inside("FR")][outside("FX")]
+    def _node_rule_53(self, data, tags, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -894,7 +942,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # -osmoseAssertMatchWithContext:list("node x=1","inside=FR-GF")
                 err.append({'class': 6, 'subclass': 170749071, 'text': {'en': 'test'}})
 
-        # node[x][join_list("-",trim_list(split(";",tag("x"))))="a-b-c"]
+    # node[x][join_list("-",trim_list(split(";",tag("x"))))="a-b-c"]
+    def _node_rule_54(self, data, tags, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -909,15 +958,74 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"node x=a;b;c"
                 err.append({'class': 6, 'subclass': 1298575189, 'text': {'en': 'test'}})
 
-        return err
+    _node_rules = mapcss.KeyIndex([
+        (_node_rule_0, ['x']),
+        (_node_rule_1, None),
+        (_node_rule_2, ['parking']),
+        (_node_rule_3, ['a', 'b']),
+        (_node_rule_4, None),
+        (_node_rule_5, ['addr:street']),
+        (_node_rule_6, ['a']),
+        (_node_rule_7, ['lit']),
+        (_node_rule_8, ['lit']),
+        (_node_rule_9, ['a']),
+        (_node_rule_10, ['a']),
+        (_node_rule_11, ['a']),
+        (_node_rule_12, ['a']),
+        (_node_rule_13, ['a']),
+        (_node_rule_14, ['a']),
+        (_node_rule_15, ['a']),
+        (_node_rule_16, ['a']),
+        (_node_rule_17, ['a']),
+        (_node_rule_18, ['x']),
+        (_node_rule_19, ['x']),
+        (_node_rule_20, None),
+        (_node_rule_21, None),
+        (_node_rule_22, ['x']),
+        (_node_rule_23, ['a']),
+        (_node_rule_24, ['x']),
+        (_node_rule_25, ['x']),
+        (_node_rule_26, None),
+        (_node_rule_27, None),
+        (_node_rule_28, None),
+        (_node_rule_29, None),
+        (_node_rule_30, None),
+        (_node_rule_31, None),
+        (_node_rule_32, None),
+        (_node_rule_33, None),
+        (_node_rule_34, None),
+        (_node_rule_35, None),
+        (_node_rule_36, None),
+        (_node_rule_37, None),
+        (_node_rule_38, None),
+        (_node_rule_39, ['x']),
+        (_node_rule_40, None),
+        (_node_rule_41, ['x']),
+        (_node_rule_42, None),
+        (_node_rule_43, None),
+        (_node_rule_44, None),
+        (_node_rule_45, None),
+        (_node_rule_46, ['tag_length']),
+        (_node_rule_47, ['tag_length']),
+        (_node_rule_48, None),
+        (_node_rule_49, ['x']),
+        (_node_rule_50, ['x']),
+        (_node_rule_51, ['x']),
+        (_node_rule_52, ['x']),
+        (_node_rule_53, ['x']),
+        (_node_rule_54, ['x']),
+    ])
 
-    def way(self, data, tags, nds):
-        capture_tags = {}
+    def node(self, data, tags):
         keys = tags.keys()
         err = []
-        set_a = set_b = set_supportsSet = False
+        sets = set()
+        for rule in self._node_rules.select(keys):
+            rule(self, data, tags, keys, err, sets)
+        return err
 
-        # way[x~=C1]
+    # way[x~=C1]
+    def _way_rule_0(self, data, tags, nds, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -932,7 +1040,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"way x=C12"
                 err.append({'class': 16, 'subclass': 1785050832, 'text': {'en': 'test #1610'}})
 
-        # way:righthandtraffic[x=y][z?]
+    # way:righthandtraffic[x=y][z?]
+    def _way_rule_1(self, data, tags, nds, keys, err, sets):
         if ('x' in keys and 'z' in keys):
             match = False
             if not match:
@@ -944,7 +1053,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # -osmoseAssertMatchWithContext:list("way x=y z=yes","inside=NL")
                 err.append({'class': 17, 'subclass': 169712264, 'text': mapcss.tr('test #1603 - {0}{1}', mapcss._tag_uncapture(capture_tags, '{1.tag}'), mapcss._tag_uncapture(capture_tags, '{2.tag}'))})
 
-        # way[x=y][z?]:righthandtraffic
+    # way[x=y][z?]:righthandtraffic
+    def _way_rule_2(self, data, tags, nds, keys, err, sets):
         if ('x' in keys and 'z' in keys):
             match = False
             if not match:
@@ -956,7 +1066,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # -osmoseAssertMatchWithContext:list("way x=y z=yes","inside=NL")
                 err.append({'class': 17, 'subclass': 2074848923, 'text': mapcss.tr('test #1603 - {0}{1}', mapcss._tag_uncapture(capture_tags, '{0.tag}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[parking][amenity!~/^(parking|motorcycle_parking)$/]
+    # *[parking][amenity!~/^(parking|motorcycle_parking)$/]
+    def _way_rule_3(self, data, tags, nds, keys, err, sets):
         if ('parking' in keys):
             match = False
             if not match:
@@ -967,8 +1078,9 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # throwWarning:tr("test #994 - {0}{1}","{0.key}","{1.tag}")
                 err.append({'class': 2, 'subclass': 650362898, 'text': mapcss.tr('test #994 - {0}{1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[a][!c]
-        # *[b][!/d/]
+    # *[a][!c]
+    # *[b][!/d/]
+    def _way_rule_4(self, data, tags, nds, keys, err, sets):
         if ('a' in keys) or ('b' in keys):
             match = False
             if not match:
@@ -987,7 +1099,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"way b=c"
                 err.append({'class': 3, 'subclass': 1004069731, 'text': mapcss.tr('test #328 - {0}{1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[/abc/=~/def/]
+    # *[/abc/=~/def/]
+    def _way_rule_5(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -998,7 +1111,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # throwWarning:"test commit 373d1ff9bacf8126508bbf3e37467df2bdf17fbd"
                 err.append({'class': 4, 'subclass': 1371556921, 'text': {'en': 'test commit 373d1ff9bacf8126508bbf3e37467df2bdf17fbd'}})
 
-        # *[addr:street=~/(?i).*Straße.*/][inside("LI,CH")]
+    # *[addr:street=~/(?i).*Straße.*/][inside("LI,CH")]
+    def _way_rule_6(self, data, tags, nds, keys, err, sets):
         if ('addr:street' in keys):
             match = False
             if not match:
@@ -1009,7 +1123,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # throwWarning:tr("test #327")
                 err.append({'class': 5, 'subclass': 43561107, 'text': mapcss.tr('test #327')})
 
-        # way:righthandtraffic
+    # way:righthandtraffic
+    def _way_rule_7(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -1022,7 +1137,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # -osmoseAssertMatchWithContext:list("way","driving_side=right")
                 err.append({'class': 18, 'subclass': 529680562, 'text': mapcss.tr('test righthandtraffic')})
 
-        # way!:righthandtraffic
+    # way!:righthandtraffic
+    def _way_rule_8(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -1035,7 +1151,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # -osmoseAssertNoMatchWithContext:list("way","driving_side=right")
                 err.append({'class': 19, 'subclass': 877255184, 'text': mapcss.tr('test lefthandtraffic')})
 
-        # way[count(uniq_list(tag_regex("abc")))==2]
+    # way[count(uniq_list(tag_regex("abc")))==2]
+    def _way_rule_9(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -1050,7 +1167,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"way abc=def def=def"
                 err.append({'class': 6, 'subclass': 346020981, 'text': {'en': 'test'}})
 
-        # way[count(uniq_list(tag_regex("abc")))==2.0]
+    # way[count(uniq_list(tag_regex("abc")))==2.0]
+    def _way_rule_10(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -1065,7 +1183,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"way abc=def def=def"
                 err.append({'class': 6, 'subclass': 57938147, 'text': {'en': 'test'}})
 
-        # way[oneway?]
+    # way[oneway?]
+    def _way_rule_11(self, data, tags, nds, keys, err, sets):
         if ('oneway' in keys):
             match = False
             if not match:
@@ -1081,7 +1200,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"way x=y"
                 err.append({'class': 20, 'subclass': 1489464739, 'text': mapcss.tr('test {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[oneway?!]
+    # way[oneway?!]
+    def _way_rule_12(self, data, tags, nds, keys, err, sets):
         if ('oneway' in keys):
             match = False
             if not match:
@@ -1096,7 +1216,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"way x=y"
                 err.append({'class': 20, 'subclass': 722694187, 'text': mapcss.tr('test {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[name*=Trigger][tag("building")=="chapel"||tag("amenity")=="place_of_worship"][x]
+    # way[name*=Trigger][tag("building")=="chapel"||tag("amenity")=="place_of_worship"][x]
+    def _way_rule_13(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'x' in keys):
             match = False
             if not match:
@@ -1111,7 +1232,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"way building=chapel name=OsmoseRuleTrigger x=yes"
                 err.append({'class': 21, 'subclass': 1095325051, 'text': mapcss.tr('test #1303, #1742 {0}', mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # way[name*=Trigger][tag("building")=="chapel"&&tag("amenity")=="place_of_worship"][x]
+    # way[name*=Trigger][tag("building")=="chapel"&&tag("amenity")=="place_of_worship"][x]
+    def _way_rule_14(self, data, tags, nds, keys, err, sets):
         if ('name' in keys and 'x' in keys):
             match = False
             if not match:
@@ -1126,7 +1248,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"way building=chapel name=OsmoseRuleTrigger x=yes"
                 err.append({'class': 22, 'subclass': 1140742172, 'text': mapcss.tr('test #1303 {0}', mapcss._tag_uncapture(capture_tags, '{2.key}'))})
 
-        # way[inside(FR)][x]
+    # way[inside(FR)][x]
+    def _way_rule_15(self, data, tags, nds, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -1138,7 +1261,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # -osmoseAssertMatchWithContext:list("way x=y","inside=FR")
                 err.append({'class': 23, 'subclass': 1132689531, 'text': mapcss.tr('test #1742 - {0}', mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[a][a=*b]
+    # *[a][a=*b]
+    def _way_rule_16(self, data, tags, nds, keys, err, sets):
         if ('a' in keys):
             match = False
             if not match:
@@ -1149,7 +1273,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # throwError:"test"
                 err.append({'class': 6, 'subclass': 1343056298, 'text': {'en': 'test'}})
 
-        # way[x]
+    # way[x]
+    def _way_rule_17(self, data, tags, nds, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -1177,7 +1302,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                     'x'])
                 }})
 
-        # way[x]
+    # way[x]
+    def _way_rule_18(self, data, tags, nds, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -1205,7 +1331,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                     'x'])
                 }})
 
-        # way[maxspeed>5000]
+    # way[maxspeed>5000]
+    def _way_rule_19(self, data, tags, nds, keys, err, sets):
         if ('maxspeed' in keys):
             match = False
             if not match:
@@ -1220,7 +1347,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"way"
                 err.append({'class': 24, 'subclass': 2063115534, 'text': mapcss.tr('test {0}{1}', 'text', mapcss._tag_uncapture(capture_tags, '{0.key}'))})
 
-        # way[tag(a)>tag(b)]
+    # way[tag(a)>tag(b)]
+    def _way_rule_20(self, data, tags, nds, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -1234,7 +1362,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"way a=1 b=0"
                 err.append({'class': 6, 'subclass': 384294833, 'text': {'en': 'test'}})
 
-        # way[x]
+    # way[x]
+    def _way_rule_21(self, data, tags, nds, keys, err, sets):
         if ('x' in keys):
             match = False
             if not match:
@@ -1246,11 +1375,12 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # set b
                 # throwWarning:"test"
                 # assertMatch:"way x=y"
-                set_a = True
-                set_b = True
+                sets.add('a')
+                sets.add('b')
                 err.append({'class': 6, 'subclass': 1961315435, 'text': {'en': 'test'}})
 
-        # area[building]
+    # area[building]
+    def _way_rule_22(self, data, tags, nds, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -1265,8 +1395,9 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"way x=yes"
                 err.append({'class': 9, 'subclass': 1099901647, 'text': mapcss.tr('test area rule {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # area[building]:closed:closed2
-        # area[landuse]:closed2
+    # area[building]:closed:closed2
+    # area[landuse]:closed2
+    def _way_rule_23(self, data, tags, nds, keys, err, sets):
         if ('building' in keys) or ('landuse' in keys):
             match = False
             if not match:
@@ -1283,7 +1414,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"way area=no landuse=yes"
                 err.append({'class': 9, 'subclass': 2006953473, 'text': mapcss.tr('test area rule {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # area[building]!:closed
+    # area[building]!:closed
+    def _way_rule_24(self, data, tags, nds, keys, err, sets):
         if ('building' in keys):
             match = False
             if not match:
@@ -1294,8 +1426,9 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # throwWarning:tr("test area rule {0}","{0.tag}")
                 err.append({'class': 9, 'subclass': 1591435356, 'text': mapcss.tr('test area rule {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # way[y]
-        # area[building=yes]
+    # way[y]
+    # area[building=yes]
+    def _way_rule_25(self, data, tags, nds, keys, err, sets):
         if ('building' in keys) or ('y' in keys):
             match = False
             if not match:
@@ -1313,15 +1446,45 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"way y=z"
                 err.append({'class': 9, 'subclass': 2128563767, 'text': mapcss.tr('test area rule {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        return err
+    _way_rules = mapcss.KeyIndex([
+        (_way_rule_0, ['x']),
+        (_way_rule_1, ['x']),
+        (_way_rule_2, ['x']),
+        (_way_rule_3, ['parking']),
+        (_way_rule_4, ['a', 'b']),
+        (_way_rule_5, None),
+        (_way_rule_6, ['addr:street']),
+        (_way_rule_7, None),
+        (_way_rule_8, None),
+        (_way_rule_9, None),
+        (_way_rule_10, None),
+        (_way_rule_11, ['oneway']),
+        (_way_rule_12, ['oneway']),
+        (_way_rule_13, ['name']),
+        (_way_rule_14, ['name']),
+        (_way_rule_15, ['x']),
+        (_way_rule_16, ['a']),
+        (_way_rule_17, ['x']),
+        (_way_rule_18, ['x']),
+        (_way_rule_19, ['maxspeed']),
+        (_way_rule_20, None),
+        (_way_rule_21, ['x']),
+        (_way_rule_22, ['building']),
+        (_way_rule_23, ['building', 'landuse']),
+        (_way_rule_24, ['building']),
+        (_way_rule_25, ['building', 'y']),
+    ])
 
-    def relation(self, data, tags, members):
-        capture_tags = {}
+    def way(self, data, tags, nds):
         keys = tags.keys()
         err = []
-        set_a = set_b = set_supportsSet = False
+        sets = set()
+        for rule in self._way_rules.select(keys):
+            rule(self, data, tags, nds, keys, err, sets)
+        return err
 
-        # *[parking][amenity!~/^(parking|motorcycle_parking)$/]
+    # *[parking][amenity!~/^(parking|motorcycle_parking)$/]
+    def _relation_rule_0(self, data, tags, members, keys, err, sets):
         if ('parking' in keys):
             match = False
             if not match:
@@ -1332,8 +1495,9 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # throwWarning:tr("test #994 - {0}{1}","{0.key}","{1.tag}")
                 err.append({'class': 2, 'subclass': 650362898, 'text': mapcss.tr('test #994 - {0}{1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.tag}'))})
 
-        # *[a][!c]
-        # *[b][!/d/]
+    # *[a][!c]
+    # *[b][!/d/]
+    def _relation_rule_1(self, data, tags, members, keys, err, sets):
         if ('a' in keys) or ('b' in keys):
             match = False
             if not match:
@@ -1348,7 +1512,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # throwWarning:tr("test #328 - {0}{1}","{0.key}","{1.key}")
                 err.append({'class': 3, 'subclass': 1004069731, 'text': mapcss.tr('test #328 - {0}{1}', mapcss._tag_uncapture(capture_tags, '{0.key}'), mapcss._tag_uncapture(capture_tags, '{1.key}'))})
 
-        # *[/abc/=~/def/]
+    # *[/abc/=~/def/]
+    def _relation_rule_2(self, data, tags, members, keys, err, sets):
         if True:
             match = False
             if not match:
@@ -1363,7 +1528,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"relation xabcx=xdefx"
                 err.append({'class': 4, 'subclass': 1371556921, 'text': {'en': 'test commit 373d1ff9bacf8126508bbf3e37467df2bdf17fbd'}})
 
-        # *[addr:street=~/(?i).*Straße.*/][inside("LI,CH")]
+    # *[addr:street=~/(?i).*Straße.*/][inside("LI,CH")]
+    def _relation_rule_3(self, data, tags, members, keys, err, sets):
         if ('addr:street' in keys):
             match = False
             if not match:
@@ -1374,7 +1540,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # throwWarning:tr("test #327")
                 err.append({'class': 5, 'subclass': 43561107, 'text': mapcss.tr('test #327')})
 
-        # *[a][a=*b]
+    # *[a][a=*b]
+    def _relation_rule_4(self, data, tags, members, keys, err, sets):
         if ('a' in keys):
             match = False
             if not match:
@@ -1385,7 +1552,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # throwError:"test"
                 err.append({'class': 6, 'subclass': 1343056298, 'text': {'en': 'test'}})
 
-        # area[building]
+    # area[building]
+    def _relation_rule_5(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'type' in keys):
             match = False
             if not match:
@@ -1399,8 +1567,9 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"relation type=multipolygon x=yes"
                 err.append({'class': 9, 'subclass': 1099901647, 'text': mapcss.tr('test area rule {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # area[building]:closed:closed2
-        # area[landuse]:closed2
+    # area[building]:closed:closed2
+    # area[landuse]:closed2
+    def _relation_rule_6(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'type' in keys) or ('landuse' in keys and 'type' in keys):
             match = False
             if not match:
@@ -1420,7 +1589,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"relation type=multipolygon x=yes"
                 err.append({'class': 9, 'subclass': 2006953473, 'text': mapcss.tr('test area rule {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # area[building]!:closed
+    # area[building]!:closed
+    def _relation_rule_7(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'type' in keys):
             match = False
             if not match:
@@ -1433,7 +1603,8 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"relation type=other building=yes"
                 err.append({'class': 9, 'subclass': 1591435356, 'text': mapcss.tr('test area rule {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # area[building=yes]
+    # area[building=yes]
+    def _relation_rule_8(self, data, tags, members, keys, err, sets):
         if ('building' in keys and 'type' in keys):
             match = False
             if not match:
@@ -1447,8 +1618,9 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertNoMatch:"relation x=z y=z"
                 err.append({'class': 9, 'subclass': 434545653, 'text': mapcss.tr('test area rule {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # relation[y]:closed
-        # relation[z]!:closed2
+    # relation[y]:closed
+    # relation[z]!:closed2
+    def _relation_rule_9(self, data, tags, members, keys, err, sets):
         if ('type' in keys and 'y' in keys) or ('z' in keys):
             match = False
             if not match:
@@ -1467,9 +1639,28 @@ class test_mapcss_parsing_evaluation(PluginMapCSS):
                 # assertMatch:"relation type=other z=yes"
                 err.append({'class': 10, 'subclass': 758090756, 'text': mapcss.tr('test closed rewrite {0}', mapcss._tag_uncapture(capture_tags, '{0.tag}'))})
 
-        # relation[tag(x)==parent_tag(x)]
-        # Part of rule not implemented
+    # relation[tag(x)==parent_tag(x)]
+    # Part of rule not implemented
+
+    _relation_rules = mapcss.KeyIndex([
+        (_relation_rule_0, ['parking']),
+        (_relation_rule_1, ['a', 'b']),
+        (_relation_rule_2, None),
+        (_relation_rule_3, ['addr:street']),
+        (_relation_rule_4, ['a']),
+        (_relation_rule_5, ['building']),
+        (_relation_rule_6, ['building', 'landuse']),
+        (_relation_rule_7, ['building']),
+        (_relation_rule_8, ['building']),
+        (_relation_rule_9, ['type', 'z']),
+    ])
 
+    def relation(self, data, tags, members):
+        keys = tags.keys()
+        err = []
+        sets = set()
+        for rule in self._relation_rules.select(keys):
+            rule(self, data, tags, members, keys, err, sets)
         return err
 
 
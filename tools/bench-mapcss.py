@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+#-*- coding: utf-8 -*-
+
+###########################################################################
+##                                                                       ##
+## Copyrights Osmose project 2026                                        ##
+##                                                                       ##
+## This program is free software: you can redistribute it and/or modify  ##
+## it under the terms of the GNU General Public License as published by  ##
+## the Free Software Foundation, either version 3 of the License, or     ##
+## (at your option) any later version.                                   ##
+##                                                                       ##
+## This program is distributed in the hope that it will be useful,       ##
+## but WITHOUT ANY WARRANTY; without even the implied warranty of        ##
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         ##
+## GNU General Public License for more details.                          ##
+##                                                                       ##
+## You should have received a copy of the GNU General Public License     ##
+## along with this program.  If not, see <http://www.gnu.org/licenses/>. ##
+##                                                                       ##
+###########################################################################
+
+# Replay the objects of an osmChange file through the generated MapCSS plugins
+# and report the time spent in node/way/relation of each plugin.
+#
+# From the root directory:
+#   python tools/bench-mapcss.py [--repeat N] [--file tests/saint_barthelemy.osc.gz] [Josm_highway ...]
+#
+# Every object of the file is replayed, whatever its action in the osmChange.
+# Untagged nodes are skipped, as in Analyser_Sax. A full extract like
+# tests/saint_barthelemy.osm.gz gives more stable timings.
+#
+# The digest column hashes the issues returned, to check that two runs give
+# the same results.
+
+import argparse
+import glob
+import hashlib
+import importlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from modules import OsmReader
+from plugins.PluginMapCSS import PluginMapCSS
+
+
+class Collect:
+    def __init__(self):
+        self.node = []
+        self.way = []
+        self.relation = []
+
+    def NodeCreate(self, data):
+        if data['tag']:
+            self.node.append((data, data['tag']))
+
+    def WayCreate(self, data):
+        self.way.append((data, data['tag'], data['nd']))
+
+    def RelationCreate(self, data):
+        self.relation.append((data, data['tag'], data['member']))
+
+    NodeUpdate = NodeDelete = NodeCreate
+    WayUpdate = WayDelete = WayCreate
+    RelationUpdate = RelationDelete = RelationCreate
+
+
+class _config:
+    options = {"country": None, "language": None}
+
+class father:
+    config = _config()
+
+
+def plugin_classes(names):
+    if not names:
+        names = sorted(os.path.basename(f)[:-3] for f in glob.glob('plugins/Josm_*.py'))
+    for name in names:
+        module = importlib.import_module('plugins.' + name)
+        yield getattr(module, name)
+
+
+def bench(plugin, objects, repeat):
+    best = None
+    digest = hashlib.md5()
+    for r in range(repeat):
+        start = time.perf_counter()
+        results = []
+        for method in ('node', 'way', 'relation'):
+            if method not in plugin.availableMethodes():
+                continue
+            f = getattr(plugin, method)
+            for args in getattr(objects, method):
+                results.append(f(*args))
+        duration = time.perf_counter() - start
+        best = duration if best is None else min(best, duration)
+        if r == 0:
+            digest.update(repr(results).encode('utf-8'))
+    return best, sum(map(lambda e: len(e or []), results)), digest.hexdigest()[0:8]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark generated MapCSS plugins')
+    parser.add_argument('--file', default='tests/saint_barthelemy.osc.gz', help='osmChange or OSM file to replay')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('plugins', nargs='*')
+    args = parser.parse_args()
+
+    objects = Collect()
+    OsmReader.open(args.file).CopyTo(objects)
+    print('{0} nodes, {1} ways, {2} relations'.format(len(objects.node), len(objects.way), len(objects.relation)))
+
+    total = 0
+    for clazz in plugin_classes(args.plugins):
+        if not issubclass(clazz, PluginMapCSS):
+            continue
+        plugin = clazz(None)
+        plugin.father = father()
+        plugin.init(None)
+        duration, errors, digest = bench(plugin, objects, args.repeat)
+        total += duration
+        print('{0:40} {1:9.2f} ms {2:6d} issues  {3}'.format(clazz.__name__, duration * 1000, errors, digest))
+    print('{0:40} {1:9.2f} ms'.format('total', total * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+#-*- coding: utf-8 -*-
+
+###########################################################################
+##                                                                       ##
+## Copyrights Osmose project 2026                                        ##
+##                                                                       ##
+## This program is free software: you can redistribute it and/or modify  ##
+## it under the terms of the GNU General Public License as published by  ##
+## the Free Software Foundation, either version 3 of the License, or     ##
+## (at your option) any later version.                                   ##
+##                                                                       ##
+## This program is distributed in the hope that it will be useful,       ##
+## but WITHOUT ANY WARRANTY; without even the implied warranty of        ##
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         ##
+## GNU General Public License for more details.                          ##
+##                                                                       ##
+## You should have received a copy of the GNU General Public License     ##
+## along with this program.  If not, see <http://www.gnu.org/licenses/>. ##
+##                                                                       ##
+###########################################################################
+
+# Measure the startup cost of the analysers and plugins: import of the
+# modules, creation and init of the objects, and analysers versions.
+#
+# From the root directory:
+#   python tools/bench-startup.py [--country FR] [--language fr] [--no-merge]
+#
+# Merge analysers may download their sources while created, --no-merge skips
+# them to get timings without the network.
+
+import argparse
+import glob
+import importlib
+import inspect
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from analysers.Analyser import Analyser
+from analysers.Analyser_Merge import Analyser_Merge
+from analysers.Analyser_Merge_Dynamic import Analyser_Merge_Dynamic
+from modules import SourceVersion
+from plugins.Plugin import Plugin
+
+
+class _config:
+    def __init__(self, country, language):
+        self.options = {"country": country, "language": language, "proj": 2154}
+        self.error_file = None
+        self.polygon_id = None
+        self.db_schema = "bench"
+        self.db_schema_path = None
+        self.db_user = "osmose"
+        self.source_url = None
+        self.verbose = False
+        self.plugins = None
+
+class father:
+    def __init__(self, config):
+        self.config = config
+
+
+class Timer:
+    def __init__(self):
+        self.phases = []
+
+    def __call__(self, name, f):
+        start = time.perf_counter()
+        (count, failed) = f()
+        self.phases.append((name, time.perf_counter() - start, count, failed))
+        print('{0:30} {1:9.2f} ms {2:6d} objects {3:4d} failed'.format(name, self.phases[-1][1] * 1000, count, failed))
+
+
+def modules(pattern):
+    loaded = []
+    failed = 0
+    for fn in sorted(glob.glob(pattern)):
+        try:
+            loaded.append(importlib.import_module(os.path.dirname(fn) + '.' + os.path.basename(fn)[:-3]))
+        except Exception:
+            failed += 1
+    return loaded, failed
+
+
+def classes(modules, base):
+    return [obj for m in modules for (name, obj) in inspect.getmembers(m)
+        if inspect.isclass(obj) and obj.__module__ == m.__name__ and issubclass(obj, base)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the startup of the analysers and plugins')
+    parser.add_argument('--country', default='FR')
+    parser.add_argument('--language', default='fr')
+    parser.add_argument('--no-merge', action='store_true', help='Skip the merge analysers')
+    args = parser.parse_args()
+
+    config = _config(args.country, args.language)
+    timer = Timer()
+    state = {}
+
+    def import_analysers():
+        (state['analysers'], failed) = modules('analysers/analyser_*.py')
+        return len(state['analysers']), failed
+    timer('import analysers', import_analysers)
+
+    def import_plugins():
+        (state['plugins'], failed) = modules('plugins/*.py')
+        return len(state['plugins']), failed
+    timer('import plugins', import_plugins)
+
+    def init_analysers():
+        count = failed = 0
+        for clazz in classes(state['analysers'], Analyser):
+            if args.no_merge and issubclass(clazz, (Analyser_Merge, Analyser_Merge_Dynamic)):
+                continue
+            try:
+                clazz(config, None)
+                count += 1
+            except Exception:
+                failed += 1
+        return count, failed
+    timer('init analysers', init_analysers)
+
+    def init_plugins():
+        count = failed = 0
+        for clazz in classes(state['plugins'], Plugin):
+            try:
+                plugin = clazz(None)
+                plugin.father = father(config)
+                plugin.init(None)
+                count += 1
+            except Exception:
+                failed += 1
+        return count, failed
+    timer('init plugins', init_plugins)
+
+    def versions():
+        analysers = classes(state['analysers'], Analyser)
+        for clazz in analysers:
+            SourceVersion.version(clazz)
+        return len(analysers), 0
+    timer('analysers versions', versions)
+    timer('analysers versions, again', versions)
+
+    print('{0:30} {1:9.2f} ms'.format('total', sum(map(lambda p: p[1], timer.phases)) * 1000))
+
+
+if __name__ == '__main__':
+    main()